@@ -0,0 +1,78 @@
+"""Cold import benchmark of the bpy package.
+
+Every scenario runs in a fresh interpreter and reports the wall time of its statements and the peak resident set size
+of the process. By default bytecode is compiled into a throwaway cache for each run, so the timings include parsing the
+package sources as a first import after install would; the standard library is compiled by a priming run first, as an
+installed Python ships its bytecode. Use --warm to time imports from the regular __pycache__ instead.
+
+Usage: python benchmarks/import_bpy.py [--runs N] [--warm] [--json FILE]"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+	("import bpy", "import bpy"),
+	("bpy.types.Object", "import bpy\nbpy.types.Object"),
+	("typical bpy.types", "import bpy\nbpy.types.Object, bpy.types.Mesh, bpy.types.Scene, bpy.types.Operator"),
+	("all bpy.types", "import bpy\nfor name in dir(bpy.types):\n\tgetattr(bpy.types, name)"),
+	("bpy.ops.mesh", "import bpy\nbpy.ops.mesh.primitive_cube_add"),
+	("all bpy.ops", "import bpy\nfor name in dir(bpy.ops):\n\tgetattr(bpy.ops, name)"),
+	("import mathutils", "import mathutils"),
+]
+
+CHILD = """
+import resource, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss * (1 if sys.platform == "darwin" else 1024))
+"""
+
+def runScenario(code, warm):
+	env = dict(os.environ, PYTHONPATH=ROOT)
+	
+	with tempfile.TemporaryDirectory() as cache:
+		if not warm:
+			env["PYTHONPYCACHEPREFIX"] = cache
+			subprocess.check_call([sys.executable, "-c", CHILD, code], env=env, cwd=ROOT, stdout=subprocess.DEVNULL)
+			shutil.rmtree(os.path.join(cache, ROOT.lstrip(os.sep)), ignore_errors=True)
+		
+		output = subprocess.check_output([sys.executable, "-c", CHILD, code], env=env, cwd=ROOT)
+	
+	elapsed, rss = output.split()
+	return float(elapsed), int(rss)
+	
+def main():
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--runs", type=int, default=5, help="runs per scenario, the median is reported")
+	parser.add_argument("--warm", action="store_true", help="use the regular bytecode cache")
+	parser.add_argument("--json", help="also write the results to this file")
+	args = parser.parse_args()
+	
+	# The empty interpreter is the RSS baseline
+	base = min(runScenario("pass", args.warm)[1] for _ in range(args.runs))
+	results = []
+	print("%-20s %12s %12s %12s" % ("scenario", "time (ms)", "RSS (MiB)", "+RSS (MiB)"))
+	
+	for name, code in SCENARIOS:
+		samples = [runScenario(code, args.warm) for _ in range(args.runs)]
+		elapsed = statistics.median(s[0] for s in samples)
+		rss = statistics.median(s[1] for s in samples)
+		results.append({"scenario": name, "seconds": elapsed, "rss": rss, "rss_delta": rss - base})
+		print("%-20s %12.1f %12.1f %12.1f" % (name, elapsed * 1000.0, rss / 1048576.0, (rss - base) / 1048576.0))
+	
+	if args.json:
+		with open(args.json, "w") as file:
+			json.dump({"python": sys.version, "warm": args.warm, "runs": args.runs, "results": results}, file, indent=1)
+
+if __name__ == "__main__":
+	main()
@@ -1,6 +1,9 @@
 """Module to create and control physics constraints."""
 
+from mathutils import Vector as _Vector
+
 from .. import types as _types
+from ..types import _physics, _solver, _vehicle as _vehicles
 
 
 # Constants
@@ -70,6 +73,74 @@ GENERIC_6DOF_CONSTRAINT = 12  # type: int
 """Constraint type to be used with bge.constraints.createConstraint()."""
 
 
+def _scenes():
+    # type: () -> list[_types.KX_Scene]
+    """The scenes of the game and the ones about to be added, the current one first."""
+
+    from .. import logic
+
+    engine = logic._engine
+    scenes = [] if engine.currentScene is None else [engine.currentScene]
+    scenes.extend(scene for scene in engine.scenes if scene is not engine.currentScene)
+    scenes.extend(scene for scene, _ in engine.pendingScenes)
+    return scenes
+
+
+def _configure(name, value):
+    # type: (str, object) -> None
+    """Change a setting of the physics of the current scene, or of all the scenes and the next ones outside of the game
+    loop, like the BGE changes the physics environment of the active scene."""
+
+    from .. import logic
+
+    if logic._engine.currentScene is not None:
+        scenes = [logic._engine.currentScene]
+
+    else:
+        _physics.DEFAULTS[name] = value
+        scenes = _scenes()
+
+    for scene in scenes:
+        if name == "gravity":
+            scene.gravity = _Vector(value)
+
+        else:
+            setattr(scene._physics, name, value)
+
+
+def _physicsObject(physicsid):
+    # type: (int) -> tuple[_physics.PhysicsWorld, _types.KX_GameObject] | tuple[None, None]
+    for scene in _scenes():
+        object = scene._physics.ids.get(physicsid)
+
+        if object is not None:
+            return scene._physics, object
+
+    return None, None
+
+
+def _constraint(constraintId):
+    # type: (int) -> _solver.Constraint | None
+    for scene in _scenes():
+        constraint = scene._physics.constraints.get(constraintId)
+
+        if constraint is not None:
+            return constraint
+
+    return None
+
+
+def _vehicle(constraintId):
+    # type: (int) -> _vehicles.Vehicle | None
+    for scene in _scenes():
+        vehicle = scene._physics.vehicles.get(constraintId)
+
+        if vehicle is not None:
+            return vehicle
+
+    return None
+
+
 # Functions
 def createConstraint(physicsid_1, physicsid_2, constraint_type, pivot_x=0.0, pivot_y=0.0, pivot_z=0.0, axis_x=0.0, axis_y=0.0, axis_z=0.0, flag=0):
     # type: (int, int, int, float, float, float, float, float, float, int) -> _types.KX_ConstraintWrapper
@@ -90,7 +161,22 @@ def createConstraint(physicsid_1, physicsid_2, constraint_type, pivot_x=0.0, piv
     Returns:
         KX_ConstraintWrapper: A constraint wrapper."""
 
-    pass
+    world, objectA = _physicsObject(physicsid_1)
+    objectB = None
+
+    if physicsid_2:
+        other, objectB = _physicsObject(physicsid_2)
+
+        if other is not world:
+            objectA = None
+
+    if objectA is None or constraint_type not in _solver.TYPES:
+        return None
+
+    constraint = _solver.Constraint(world, constraint_type, objectA, objectB, (pivot_x, pivot_y, pivot_z),
+                                    (axis_x, axis_y, axis_z), flag)
+    world.addConstraint(constraint)
+    return _types.KX_ConstraintWrapper(constraint)
 
 
 def createVehicle(physicsid):
@@ -103,7 +189,14 @@ def createVehicle(physicsid):
     Returns:
         KX_VehicleWrapper: A vehicle constraint wrapper."""
 
-    pass
+    world, chassis = _physicsObject(physicsid)
+
+    if chassis is None or chassis._body is None:
+        return None
+
+    vehicle = _vehicles.Vehicle(world, chassis)
+    world.addVehicle(vehicle)
+    return _types.KX_VehicleWrapper(vehicle)
 
 
 def exportBulletFile(filename):
@@ -125,7 +218,8 @@ def getAppliedImpulse(constraintId):
     Returns:
         float: The most recent applied impulse."""
 
-    pass
+    constraint = _constraint(constraintId)
+    return 0.0 if constraint is None else constraint.applied
 
 
 def getVehicleConstraint(constraintId):
@@ -136,7 +230,8 @@ def getVehicleConstraint(constraintId):
     Returns:
         KX_VehicleWrapper: A vehicle constraint object."""
 
-    pass
+    vehicle = _vehicle(constraintId)
+    return None if vehicle is None else _types.KX_VehicleWrapper(vehicle)
 
 
 def getCharacter(gameobj):
@@ -145,9 +240,21 @@ def getCharacter(gameobj):
         gameobj (KX_GameObject): The game object with the character physics.
 
     Returns:
-        KX_CharacterWrapper: Character wrapper."""
+        KX_CharacterWrapper: Character wrapper.
 
-    pass
+    Note:
+        An object without dynamics becomes a character the first time, as if its physics type was Character. Its
+        capsule has the physics radius of the object and the height of its meshes. Returns None for the dynamic
+        objects and the objects out of a scene."""
+
+    scene = gameobj.scene if isinstance(gameobj, _types.KX_GameObject) and not gameobj.invalid else None
+
+    if scene is None or gameobj._body is not None or gameobj._position is None:
+        return None
+
+    world = scene._physics
+    character = world.characters.get(gameobj) or world.addCharacter(gameobj)
+    return _types.KX_CharacterWrapper(character)
 
 
 def removeConstraint(constraintId):
@@ -157,7 +264,15 @@ def removeConstraint(constraintId):
     Args:
         constraintId (int): The id of the constraint to be removed."""
 
-    pass
+    constraint = _constraint(constraintId)
+
+    if constraint is not None:
+        constraint.world.removeConstraint(constraint)
+
+    vehicle = _vehicle(constraintId)
+
+    if vehicle is not None:
+        vehicle.world.removeVehicle(vehicle)
 
 
 def setCcdMode(ccdMode):
@@ -170,7 +285,7 @@ def setCcdMode(ccdMode):
     Note:
         Very experimental, not recommended."""
 
-    pass
+    _configure("ccdMode", int(ccdMode))
 
 
 def setContactBreakingTreshold(breakingTreshold):
@@ -183,7 +298,7 @@ def setContactBreakingTreshold(breakingTreshold):
     Note:
         Reasonable default is 0.02 (if units are meters)."""
 
-    pass
+    _configure("contactThreshold", float(breakingTreshold))
 
 
 def setDeactivationAngularTreshold(angularTreshold):
@@ -193,7 +308,7 @@ def setDeactivationAngularTreshold(angularTreshold):
     Args:
         angularTreshold (float): New deactivation angular threshold."""
 
-    pass
+    _configure("angularThreshold", float(angularTreshold))
 
 
 def setDeactivationLinearTreshold(linearTreshold):
@@ -203,7 +318,7 @@ def setDeactivationLinearTreshold(linearTreshold):
     Args:
         linearTreshold (float): New deactivation linear threshold."""
 
-    pass
+    _configure("linearThreshold", float(linearTreshold))
 
 
 def setDeactivationTime(time):
@@ -213,7 +328,7 @@ def setDeactivationTime(time):
     Args:
         time (float): The deactivation time."""
 
-    pass
+    _configure("deactivationTime", float(time))
 
 
 def setDebugMode(mode):
@@ -235,17 +350,17 @@ def setGravity(x, y, z):
         y (float): Gravity Y force.
         z (float): Gravity Z force."""
 
-    pass
+    _configure("gravity", (float(x), float(y), float(z)))
 
 
 def setLinearAirDamping(damping):
     # type: (float) -> None
     """Sets the linear air damping for rigid bodies.
 
-    Note:
-        Not implemented."""
+    Args:
+        damping (float): Damping added to the linear damping of all the rigid bodies, between 0 and 1."""
 
-    pass
+    _configure("airDamping", min(max(float(damping), 0.0), 1.0))
 
 
 def setNumIterations(numiter):
@@ -255,7 +370,7 @@ def setNumIterations(numiter):
     Args:
         numiter (int): New number of iterations."""
 
-    pass
+    _configure("iterations", max(1, int(numiter)))
 
 
 def setNumTimeSubSteps(numsubstep):
@@ -265,7 +380,7 @@ def setNumTimeSubSteps(numsubstep):
     Args:
         numsubstep (int): New number of sub-steps."""
 
-    pass
+    _configure("substeps", max(1, int(numsubstep)))
 
 
 def setSolverDamping(damping):
@@ -278,7 +393,7 @@ def setSolverDamping(damping):
     Note:
         Very experimental, not recommended."""
 
-    pass
+    _configure("solverDamping", float(damping))
 
 
 def setSolverTau(tau):
@@ -291,7 +406,7 @@ def setSolverTau(tau):
     Note:
         Very experimental, not recommended."""
 
-    pass
+    _configure("solverTau", float(tau))
 
 
 def setSolverType(solverType):
@@ -304,7 +419,7 @@ def setSolverType(solverType):
     Note:
         Very experimental, not recommended."""
 
-    pass
+    _configure("solverType", int(solverType))
 
 
 def setSorConstant(sor):
@@ -317,7 +432,7 @@ def setSorConstant(sor):
     Note:
         Very experimental, not recommended."""
 
-    pass
+    _configure("sor", float(sor))
 
 
 def setUseEpa(epa):
@@ -1,7 +1,8 @@
 """Module to access logic functions, imported automatically into the python controllers namespace."""
 
 from .. import types as _types
-from ...mathutils import Vector as _Vector
+from . import _instances, _persist, _runtime
+from mathutils import Vector as _Vector
 
 # Constants
 KX_TRUE = 1  # type: int
@@ -753,21 +754,56 @@ KX_STATE_OP_SET = 1  # type: int
 
 
 # Variables
-globalDict = {} # type: dict
+globalDict = _persist.GlobalDict() # type: dict
 """A dictionary that is saved between loading blend files so you can use it to store inventory and other variables you want to store between scenes and blend files. It can also be written to a file and loaded later on with the game load/save actuators.
 
 Note:
     Only python built in types such as int/string/bool/float/tuples/lists can be saved, GameObjects, Actuators etc will not work as expected."""
 
-keyboard = None  # type: _types.SCA_PythonKeyboard
+_globalDict = globalDict  # type: dict
+"""The dictionary filled by loadGlobalDict, globalDict is unbound while a load runs in the background."""
+
+keyboard = _types._keyboard  # type: _types.SCA_PythonKeyboard
 """The current keyboard wrapped in an SCA_PythonKeyboard object."""
 
-mouse = None  # type: _types.SCA_PythonMouse
+mouse = _types._mouse  # type: _types.SCA_PythonMouse
 """The current mouse wrapped in an SCA_PythonMouse object."""
 
 joysticks = None  # type: _types.SCA_PythonJoystick
 """A list of attached SCA_PythonJoystick. The list size is the maximum number of supported joysticks. If no joystick is available for a given slot, the slot is set to None."""
 
+_engine = _runtime.Engine()
+_store = _persist.Store()
+
+
+def __getattr__(name):
+    # Only called while globalDict is unbound by loadGlobalDict
+    if name == "globalDict":
+        return _loadedGlobalDict()
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def _loadedGlobalDict():
+    # type: () -> dict
+    """globalDict, filled with the result of the running load first if there is one."""
+
+    global _globalDict
+
+    if "globalDict" in globals():
+        # Scripts may bind a new dictionary
+        _globalDict = globals()["globalDict"]
+
+    loaded = _store.collect()
+
+    if loaded is not None:
+        _globalDict.clear()
+        _globalDict.update(loaded)
+        _store.track(_globalDict)
+
+    globals()["globalDict"] = _globalDict
+    return _globalDict
+
 
 # Functions
 # General Functions
@@ -778,7 +814,7 @@ def getCurrentController():
     Returns:
         SCA_PythonController: python controller"""
 
-    pass
+    return _engine.currentController
 
 def getCurrentScene():
     # type: () -> _types.KX_Scene
@@ -787,7 +823,7 @@ def getCurrentScene():
     Returns:
         KX_Scene: current scene"""
 
-    pass
+    return _engine.currentScene
 
 def getSceneList():
     # type: () -> list[_types.KX_Scene]
@@ -799,19 +835,34 @@ def getSceneList():
     Note:
         Scenes in your blend file that have not been converted wont be in this list. This list will only contain scenes such as overlays scenes."""
 
-    pass
+    return _engine.scenes
 
-def loadGlobalDict():
-    # type: () -> None
-    """Loads bge.logic.globalDict from a file."""
+def loadGlobalDict(path=None):
+    # type: (str) -> None
+    """Loads bge.logic.globalDict from a file.
 
-    pass
+    Note:
+        The file is decoded in a background thread, globalDict is filled when it is next accessed. If the file can't be read, an error is printed and globalDict is left unchanged.
 
-def saveGlobalDict():
-    # type: () -> None
-    """Saves bge.logic.globalDict to a file."""
+    Args:
+        path (str): The file to load, by default the .bgeconf file named after the main script (optional)"""
 
-    pass
+    _loadedGlobalDict()
+    _store.load(path or _persist.defaultPath())
+    # Unbound so that the next access goes through __getattr__ and waits for the load
+    del globals()["globalDict"]
+
+def saveGlobalDict(path=None):
+    # type: (str) -> None
+    """Saves bge.logic.globalDict to a file.
+
+    Note:
+        Only the keys set or deleted since the last save or load and the keys whose value is a container (list, dict, set...) are encoded again, the file is written in a background thread to a temporary file renamed over the previous one. Keys whose value can't be marshalled are skipped with an error.
+
+    Args:
+        path (str): The file to write, by default the .bgeconf file named after the main script (optional)"""
+
+    _store.save(_loadedGlobalDict(), path or _persist.defaultPath())
 
 def startGame(blend):
     # type: (str) -> None
@@ -826,7 +877,7 @@ def endGame():
     # type: () -> None
     """Ends the current game."""
 
-    pass
+    _engine.quit = True
 
 def restartGame():
     # type: () -> None
@@ -886,17 +937,18 @@ def LibList():
     pass
 
 def addScene(name, overlay=1):
-    # type: (str, int) -> _types.KX_Scene
+    # type: (str | _types.KX_Scene, int) -> None
     """Loads a scene into the game engine.
 
     Note:
-        This function is not effective immediately, the scene is queued and added on the next logic cycle where it will be available from getSceneList
+        - This function is not effective immediately, the scene is queued and added on the next logic cycle where it will be available from getSceneList
+        - Without a blend file, a KX_Scene built in Python can be given instead of a name. A name adds an empty scene.
 
     Args:
-        name (string): The name of the scene
+        name (string or KX_Scene): The name of the scene
         overlay (integer): Overlay or underlay (optional)"""
 
-    pass
+    _engine.addScene(name, overlay)
 
 def sendMessage(subject, body="", to="", message_from=""):
     # type: (str, str, str, str) -> None
@@ -917,7 +969,8 @@ def setGravity(gravity):
     Args:
         gravity (Vector): gravity vector"""
 
-    pass
+    for scene in _engine.scenes:
+        scene.gravity = _Vector(gravity)
 
 def getSpectrum():
     # type: () -> list[float]
@@ -935,7 +988,7 @@ def getMaxLogicFrame():
     Returns:
         int: The maximum number of logic frames per render frame"""
 
-    pass
+    return _engine.maxLogicFrame
 
 def setMaxLogicFrame(maxlogic):
     # type: (int) -> None
@@ -944,7 +997,7 @@ def setMaxLogicFrame(maxlogic):
     Args:
         maxlogic (integer): The new maximum number of logic frames per render frame. Valid values: 1..5"""
 
-    pass
+    _engine.maxLogicFrame = max(1, min(int(maxlogic), 5))
 
 def getMaxPhysicsFrame():
     # type: () -> int
@@ -953,7 +1006,7 @@ def getMaxPhysicsFrame():
     Returns:
         int: The maximum number of physics frames per render frame"""
 
-    pass
+    return _engine.maxPhysicsFrame
 
 def setMaxPhysicsFrame(maxphysics):
     # type: (int) -> None
@@ -962,7 +1015,7 @@ def setMaxPhysicsFrame(maxphysics):
     Args:
         maxphysics (integer): The new maximum number of physics timestep per render frame. Valid values: 1..5."""
 
-    pass
+    _engine.maxPhysicsFrame = max(1, min(int(maxphysics), 5))
 
 def getLogicTicRate():
     # type: () -> float
@@ -971,7 +1024,7 @@ def getLogicTicRate():
     Returns:
         float: The logic frequency in Hz"""
 
-    pass
+    return _engine.logicTicRate
 
 def setLogicTicRate(ticrate):
     # type: (float) -> None
@@ -982,7 +1035,10 @@ def setLogicTicRate(ticrate):
     Args:
         ticrate (float): The new logic update frequency (in Hz)."""
 
-    pass
+    if ticrate <= 0.0:
+        raise ValueError("setLogicTicRate(ticrate): ticrate must be positive")
+
+    _engine.logicTicRate = float(ticrate)
 
 def getPhysicsTicRate():
     # type: () -> float
@@ -991,7 +1047,7 @@ def getPhysicsTicRate():
     Returns:
         float: The physics update frequency in Hz"""
 
-    pass
+    return _engine.physicsTicRate
 
 def setPhysicsTicRate(ticrate):
     # type: (float) -> None
@@ -1002,7 +1058,10 @@ def setPhysicsTicRate(ticrate):
     Args:
         ticrate (float): The new update frequency (in Hz)."""
 
-    pass
+    if ticrate <= 0.0:
+        raise ValueError("setPhysicsTicRate(ticrate): ticrate must be positive")
+
+    _engine.physicsTicRate = float(ticrate)
 
 def getAnimRecordFrame():
     # type: () -> int
@@ -1044,9 +1103,11 @@ def setExitKey(key):
 
 def NextFrame():
     # type: () -> None
-    """Render next frame (if Python has control)"""
+    """Render next frame (if Python has control)
 
-    pass
+    The clock is advanced and the logic frames due are run, no more than getMaxLogicFrame"""
+
+    _engine.nextFrame()
 
 def setRender(render):
     # type: (bool) -> None
@@ -1055,7 +1116,7 @@ def setRender(render):
     Args:
         render (bool): the render flag"""
 
-    pass
+    _engine.render = bool(render)
 
 def getRender():
     # type: () -> bool
@@ -1064,7 +1125,7 @@ def getRender():
     Returns:
         bool: The flag value"""
 
-    pass
+    return _engine.render
 
 # Time related functions
 def getClockTime():
@@ -1074,7 +1135,7 @@ def getClockTime():
     Returns:
         float"""
 
-    pass
+    return _engine.clockTime
 
 def getFrameTime():
     # type: () -> float
@@ -1083,13 +1144,13 @@ def getFrameTime():
     Returns:
         double"""
 
-    pass
+    return _engine.frameTime
 
 def getRealTime():
     # type: () -> float
     """Get the number of real (system-clock) seconds elapsed since the beginning of the simulation."""
 
-    pass
+    return _engine.realTime()
 
 def getTimeScale():
     # type: () -> float
@@ -1098,7 +1159,7 @@ def getTimeScale():
     Returns:
         float"""
 
-    pass
+    return _engine.timeScale
 
 def setTimeScale(time_scale):
     # type: (float) -> None
@@ -1107,7 +1168,10 @@ def setTimeScale(time_scale):
     Args:
         time_scale: The new time multiplier."""
 
-    pass
+    if time_scale <= 0.0:
+        raise ValueError("setTimeScale(time_scale): time_scale must be positive")
+
+    _engine.timeScale = float(time_scale)
 
 def getUseExternalClock():
     # type: () -> bool
@@ -1116,7 +1180,7 @@ def getUseExternalClock():
     Returns:
         bool"""
 
-    pass
+    return _engine.useExternalClock
 
 def setUseExternalClock(use_external_clock):
     # type: (bool) -> None
@@ -1125,7 +1189,7 @@ def setUseExternalClock(use_external_clock):
     Args:
         use_external_clock (bool): the new setting"""
 
-    pass
+    _engine.useExternalClock = bool(use_external_clock)
 
 def setClockTime(new_time):
     # type: (float) -> None
@@ -1134,7 +1198,112 @@ def setClockTime(new_time):
     Args:
         new_time: the next value of the BGE clock (in second)."""
 
-    pass
+    _engine.clockTime = float(new_time)
+
+def getObjectPoolInfo():
+    # type: () -> dict[str, dict[str, dict[str, object]]]
+    """Returns the recycling statistics of the objects added with KX_Scene.addObject.
+
+    Ended added objects are kept in a free list per added object (template) and recycled by the next additions instead of copying the template again.
+
+    Returns:
+        dict: For each scene name, a dictionary with the template names as keys and dictionaries as values: "free" the number of objects ready to be recycled, "hits" and "misses" the number of additions that recycled an object or copied the template and "hitRate" the ratio of hits."""
+
+    info = {}
+
+    for scene in _engine.scenes:
+        pools = info.setdefault(scene.name, {})
+
+        for pool in scene._pools.values():
+            pools[pool.template.name] = pool.info()
+
+    return info
+
+def getObjectPoolLimit():
+    # type: () -> int
+    """Gets the maximum number of ended objects kept for recycling per added object.
+
+    Returns:
+        int"""
+
+    return _types._pool.ObjectPool.limit
+
+def setObjectPoolLimit(limit):
+    # type: (int) -> None
+    """Sets the maximum number of ended objects kept for recycling per added object. The default is 1024.
+
+    Args:
+        limit (int): The new limit, 0 disables the recycling"""
+
+    _types._pool.ObjectPool.limit = max(0, int(limit))
+
+def getLogicInfo():
+    # type: () -> dict[str, dict[str, int]]
+    """Returns the logic counters of the last logic frame of each scene, used to size the activity culling radius (see KX_Scene.activity_culling).
+
+    Returns:
+        dict: For each scene name, a dictionary of counters: "culledObjects" the number of objects outside of the activity culling radius, "components", "sensors" and "controllers" the number of components updated, sensors evaluated and controllers executed, "skippedComponents", "skippedSensors" and "skippedControllers" the number of components, sensors and controllers of the culled objects."""
+
+    return {scene.name: _runtime.logicInfo(scene) for scene in _engine.scenes}
+
+def getFastForward():
+    # type: () -> bool
+    """Get if the game runs in fast-forward mode.
+
+    Returns:
+        bool"""
+
+    return _engine.fastForward
+
+def setFastForward(fast_forward):
+    # type: (bool) -> None
+    """Set the fast-forward mode. In fast-forward mode every call to NextFrame runs exactly one logic frame and advances the clock by one logic tic, without following the real time nor waiting. Games can be run for hours of game time in minutes.
+
+    Args:
+        fast_forward (bool): the new setting"""
+
+    _engine.fastForward = bool(fast_forward)
+
+def step(frames=1):
+    # type: (int) -> int
+    """Run a batch of logic frames back to back, each advancing the clock by one logic tic, then call the draw callbacks once. The real time, fast-forward and external clock settings are ignored: the game is stepped as fast as possible.
+
+    Args:
+        frames (int): The number of logic frames to run
+
+    Returns:
+        int: The number of logic frames run, fewer if the game ended"""
+
+    return _engine.step(frames)
+
+def startInstances(setup, count, seed=0):
+    # type: (object, int, int) -> _instances.InstancePool
+    """Starts independent game instances in worker processes, to step many games in parallel (for example headless matches for AI training).
+
+    Each instance has its own engine, scenes, globalDict and random generator, nothing is shared. The workers are spawned: setup and the functions given to the pool must be picklable (defined at module level) and the main script must be guarded by if __name__ == "__main__".
+
+    Args:
+        setup (callable): Called as setup(index) in each worker to build its game, usually with addScene
+        count (int): The number of instances
+        seed (int): Seed of the instances, each instance seeds getRandomFloat from (seed, index) (optional)
+
+    Returns:
+        InstancePool: The running instances, step(frames, collect) runs a batch of logic frames in all of them at once, call(function, *args) runs function(index, *args) in all of them, close() stops them"""
+
+    return _instances.InstancePool(setup, count, seed)
+
+def run(frames=0, duration=0.0):
+    # type: (int, float) -> int
+    """Run the game loop until endGame is called or no scene is left. Outside of fast-forward mode, the loop sleeps until the next logic frame is due.
+
+    Args:
+        frames (int): Stop after this number of logic frames (optional, 0 for no limit)
+        duration (float): Stop after this duration of game time in seconds (optional, 0.0 for no limit)
+
+    Returns:
+        int: The number of logic frames run"""
+
+    return _engine.run(frames, duration)
 
 # Utility Functions
 def expandPath(path):
@@ -1155,10 +1324,13 @@ def getAverageFrameRate():
     # type: () -> float
     """Gets the estimated/average framerate for all the active scenes, not only the current scene.
 
+    Note:
+        Measured over the logic frames of the last second of game time, in real time: in fast-forward mode it is the simulation throughput.
+
     Returns:
         float: The estimated average framerate in frames per second"""
 
-    pass
+    return _engine.profiler.frameRate(max(1, int(_engine.logicTicRate)))
 
 def getBlendFileList(path = "//"):
     # type: (str) -> list[str]
@@ -1176,7 +1348,17 @@ def getRandomFloat():
     # type: () -> float
     """Returns a random floating point value in the range [0 - 1)"""
 
-    pass
+    return _engine.random.random()
+
+def setRandomSeed(seed):
+    # type: (int | str | None) -> None
+    """Seeds the random generator of getRandomFloat, for runs giving the same values every time. The generator is seeded again with the same seed when the game restarts.
+
+    Args:
+        seed (int, string or None): The seed, None to seed from the system"""
+
+    _engine.seed = seed
+    _engine.random.seed(seed)
 
 def PrintGLInfo():
     # type: () -> None
@@ -1192,6 +1374,33 @@ def PrintMemInfo():
 
 def getProfileInfo():
     # type: () -> dict[str, tuple[float, float]]
-    """Returns a Python dictionary that contains the same information as the on screen profiler. The keys are the profiler categories and the values are tuples with the first element being time taken (in ms) and the second element being the percentage of total time."""
+    """Returns a Python dictionary that contains the same information as the on screen profiler. The keys are the profiler categories and the values are tuples with the first element being time taken (in ms) and the second element being the percentage of total time.
 
-    pass
+    Note:
+        The times are averaged over the logic frames of the last second of game time. Components and controllers count as Logic, the draw callbacks as Rasterizer and the time spent out of the engine (between calls to NextFrame) as Outside."""
+
+    return _engine.profiler.info(max(1, int(_engine.logicTicRate)))
+
+def getProfileHotSpots(count=10, by_object=True):
+    # type: (int, bool) -> list[dict[str, object]]
+    """Returns the most time consuming Python controllers, components and draw callbacks recorded while the profile is shown, see bge.render.showProfile.
+
+    The last 65536 calls are kept, the oldest ones are dropped as new ones are recorded.
+
+    Args:
+        count (int): The number of hot spots to return, 0 for all of them (optional)
+        by_object (bool): Whether to report each object/controller pair separately or to group the calls by script, module function or component class (optional)
+
+    Returns:
+        list: Dictionaries with the keys "name" (script, module function or component class), "object" (object name for components, object.controller for controllers), "category", "calls", "time" (total in ms), "average" and "max" (in ms), the most time consuming first"""
+
+    return _engine.profiler.hotSpots(count, by_object)
+
+def saveProfileTrace(path):
+    # type: (str) -> None
+    """Writes the recorded frames and calls as a Chrome trace JSON file, to open in chrome://tracing or Perfetto. The calls are only recorded while the profile is shown, see bge.render.showProfile.
+
+    Args:
+        path (str): The path of the JSON file"""
+
+    _engine.profiler.saveTrace(path)
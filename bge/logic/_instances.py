@@ -0,0 +1,176 @@
+"""Independent game instances stepped in parallel worker processes, see bge.logic.startInstances().
+
+Each instance is a whole game (engine, scenes, globalDict, keyboard and mouse) living in its own spawned process, nothing
+is shared between the instances. The parent only sends the orders and receives the results: stepping a batch of logic
+frames costs one round trip per instance whatever the number of frames, so the throughput scales with the cores."""
+
+import multiprocessing as _multiprocessing
+import traceback as _traceback
+
+
+class InstanceError(RuntimeError):
+    """An exception raised in the process of a game instance, its message holds the traceback of the worker."""
+
+    pass
+
+
+def _serve(connection, setup, index, seed):
+    # type: (object, object, int, object) -> None
+    """Main loop of a worker process: build the game with setup(index) and run the orders of the parent."""
+
+    from .. import logic
+
+    logic.setRandomSeed(seed)
+    logic.setFastForward(True)
+
+    try:
+        setup(index)
+        connection.send((True, None))
+
+    except Exception:
+        connection.send((False, _traceback.format_exc()))
+        return
+
+    while True:
+        try:
+            order, args = connection.recv()
+
+        except EOFError:
+            # The parent went away
+            return
+
+        if order == "close":
+            connection.send((True, None))
+            return
+
+        try:
+            if order == "step":
+                frames, collect = args
+                done = logic.step(frames)
+                result = collect(index) if collect is not None else done
+
+            else:
+                function, args, kwargs = args
+                result = function(index, *args, **kwargs)
+
+            connection.send((True, result))
+
+        except Exception:
+            connection.send((False, _traceback.format_exc()))
+
+
+class InstancePool:
+    """Game instances running in worker processes, one process per instance.
+
+    Args:
+        setup (callable): Called as setup(index) in each worker to build its game, for example with bge.logic.addScene.
+        count (int): Number of instances.
+        seed (int): Seed of the instances, instance i is seeded with (seed, i) so that bge.logic.getRandomFloat gives
+            the same values from run to run whatever the number of cores."""
+
+    def __init__(self, setup, count, seed=0):
+        # type: (object, int, int) -> None
+        if count < 1:
+            raise ValueError("startInstances(setup, count, seed): count must be positive")
+
+        context = _multiprocessing.get_context("spawn")
+        self._connections = []  # type: list
+        self._processes = []  # type: list
+
+        for index in range(count):
+            parent, child = context.Pipe()
+            process = context.Process(target=_serve, args=(child, setup, index, "%d:%d" % (seed, index)), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        try:
+            self._gather()
+
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._connections)
+
+    def __enter__(self):
+        # type: () -> InstancePool
+        return self
+
+    def __exit__(self, *exception):
+        # type: (object) -> None
+        self.close()
+
+    def _gather(self):
+        # type: () -> list
+        """Results of the last order, in instance order. The failures are raised once all the workers answered."""
+
+        replies = [connection.recv() for connection in self._connections]
+
+        for index, (success, value) in enumerate(replies):
+            if not success:
+                raise InstanceError("instance %d failed:\n%s" % (index, value))
+
+        return [value for _, value in replies]
+
+    def _broadcast(self, order, args):
+        # type: (str, tuple) -> list
+        if not self._connections:
+            raise RuntimeError("InstancePool: the pool is closed")
+
+        for connection in self._connections:
+            connection.send((order, args))
+
+        return self._gather()
+
+    def step(self, frames=1, collect=None):
+        # type: (int, object) -> list
+        """Run a batch of logic frames in all the instances at once, see bge.logic.step.
+
+        Args:
+            frames (int): The number of logic frames to run.
+            collect (callable): Called as collect(index) in each worker after the frames, its picklable result is
+                returned instead of the number of frames run (optional).
+
+        Returns:
+            list: The number of frames run or the collected value of each instance."""
+
+        return self._broadcast("step", (int(frames), collect))
+
+    def call(self, function, *args, **kwargs):
+        # type: (object, object, object) -> list
+        """Call a picklable function as function(index, *args, **kwargs) in all the instances, for example to feed inputs
+        or read observations.
+
+        Returns:
+            list: The result of each instance."""
+
+        return self._broadcast("call", (function, args, kwargs))
+
+    def close(self):
+        # type: () -> None
+        """Stop the worker processes."""
+
+        connections, self._connections = self._connections, []
+
+        for connection in connections:
+            try:
+                connection.send(("close", None))
+                connection.recv()
+
+            except (EOFError, OSError):
+                pass
+
+            connection.close()
+
+        for process in self._processes:
+            process.join(1.0)
+
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._processes = []
@@ -0,0 +1,367 @@
+"""Persistence of bge.logic.globalDict, see bge.logic.saveGlobalDict() and bge.logic.loadGlobalDict().
+
+The file is a sequence of records, one per key of the dictionary: the marshal encoding of the key and of its value, each
+preceded by its length. The encoded record of each key is kept with the value it encodes. globalDict is a GlobalDict
+remembering the keys set or deleted since the last save, saving again encodes those and the keys whose value is a
+container, which can be changed in place. A plain dictionary bound by a script is compared with the records instead:
+the keys whose value is a new object or a container are encoded again. The records are written by a background thread to a
+temporary file renamed over the previous one, a crash never leaves a truncated file. Loading decodes the records in a
+background thread, globalDict is filled when it is next accessed.
+
+Files written by marshal.dump(globalDict), like the .bgeconf files of the BGE, are loaded too."""
+
+import atexit as _atexit
+import marshal as _marshal
+import os as _os
+import queue as _queue
+import struct as _struct
+import sys as _sys
+import tempfile as _tempfile
+import threading as _threading
+
+MAGIC = b"BGD\x01"  # type: bytes
+_LENGTH = _struct.Struct("<I")
+_VERSION = 4
+"""Marshal format version, version 4 shares the repeated objects (interned strings...)."""
+
+_IMMUTABLE = (int, float, complex, str, bytes, bool, type(None))
+
+
+def defaultPath():
+    # type: () -> str
+    """The .bgeconf file next to the main script, like the BGE saves next to the blend file."""
+
+    main = _sys.argv[0] if _sys.argv and _sys.argv[0] else "game"
+    return _os.path.splitext(_os.path.abspath(main))[0] + ".bgeconf"
+
+
+def _immutable(value):
+    # type: (object) -> bool
+    """True if the value can't change without a new object being stored in the dictionary."""
+
+    if isinstance(value, _IMMUTABLE):
+        return True
+
+    if isinstance(value, (tuple, frozenset)):
+        return all(_immutable(item) for item in value)
+
+    return False
+
+
+class GlobalDict(dict):
+    """Dictionary remembering the keys set or deleted since it was last saved or loaded, see Store.encode()."""
+
+    __slots__ = ("changed",)
+
+    def __init__(self, *args, **kwargs):
+        # type: (object, object) -> None
+        super().__init__(*args, **kwargs)
+        self.changed = set(self)  # type: set
+        """Keys to encode again at the next save."""
+
+    def __setitem__(self, key, value):
+        # type: (object, object) -> None
+        super().__setitem__(key, value)
+        self.changed.add(key)
+
+    def __delitem__(self, key):
+        # type: (object) -> None
+        super().__delitem__(key)
+        self.changed.add(key)
+
+    def __ior__(self, other):
+        # type: (object) -> GlobalDict
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        # type: (object, object) -> object
+        self.changed.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        # type: () -> tuple[object, object]
+        item = super().popitem()
+        self.changed.add(item[0])
+        return item
+
+    def setdefault(self, key, default=None):
+        # type: (object, object) -> object
+        # The value given back is often changed in place
+        self.changed.add(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        # type: (object, object) -> None
+        items = dict(*args, **kwargs)
+        super().update(items)
+        self.changed.update(items)
+
+    def clear(self):
+        # type: () -> None
+        self.changed.update(self)
+        super().clear()
+
+
+class Store:
+    """Encoded records of the last saved or loaded globalDict, and the background writer and loader."""
+
+    def __init__(self):
+        # type: () -> None
+        self.records = {}  # type: dict[object, tuple[object, bytes]]
+        """(value, record) by key, the record is reused while the same immutable value is stored under the key."""
+
+        self.source = None  # type: GlobalDict | None
+        """Dictionary the records are up to date with but for its changed keys, None to compare all of them."""
+
+        self.mutable = set()  # type: set
+        """Keys whose recorded value is a container, encoded again at every save."""
+
+        self.encoded = 0  # type: int
+        """Number of records encoded by the last save."""
+
+        self.writes = _queue.Queue()  # type: _queue.Queue
+        self.writer = None  # type: _threading.Thread
+        self.loader = None  # type: _threading.Thread
+        self.loaded = None  # type: dict
+        self.error = None  # type: str
+        self.lock = _threading.Lock()
+        # The writer is a daemon thread, the queued writes are finished before the interpreter exits
+        _atexit.register(self.flush)
+
+    def encode(self, dictionary):
+        # type: (dict) -> list[bytes]
+        """Records of a dictionary, only the changed keys are encoded again."""
+
+        if dictionary is self.source:
+            records = self.records
+            mutable = self.mutable
+            encoded = 0
+
+            # The containers may have been changed in place
+            for key in dictionary.changed | mutable:
+                if key in dictionary and _encodeRecord(records, key, dictionary[key]):
+                    encoded += 1
+
+                    if _immutable(records[key][0]):
+                        mutable.discard(key)
+
+                    else:
+                        mutable.add(key)
+
+                else:
+                    records.pop(key, None)
+                    mutable.discard(key)
+
+        else:
+            previous = self.records
+            records = {}
+            mutable = set()
+            encoded = 0
+
+            for key, value in dictionary.items():
+                cached = previous.get(key)
+
+                if cached is not None and cached[0] is value and _immutable(value):
+                    records[key] = cached
+
+                elif _encodeRecord(records, key, value):
+                    encoded += 1
+
+                    if not _immutable(value):
+                        mutable.add(key)
+
+            self.records = records
+            self.mutable = mutable
+
+        if isinstance(dictionary, GlobalDict):
+            dictionary.changed.clear()
+            self.source = dictionary
+
+        self.encoded = encoded
+        return [record for _, record in records.values()]
+
+    def track(self, dictionary):
+        # type: (dict) -> None
+        """Take the records of the last load as those of a dictionary just filled with its content."""
+
+        if isinstance(dictionary, GlobalDict) and self.records.keys() == dictionary.keys():
+            dictionary.changed.clear()
+            self.source = dictionary
+            self.mutable = {key for key, (value, _) in self.records.items() if not _immutable(value)}
+
+    def save(self, dictionary, path):
+        # type: (dict, str) -> None
+        """Encode the dictionary now and queue the write of the file."""
+
+        self.writes.put((path, self.encode(dictionary)))
+
+        with self.lock:
+            if self.writer is None or not self.writer.is_alive():
+                self.writer = _threading.Thread(target=self._write, name="globalDict writer", daemon=True)
+                self.writer.start()
+
+    def _write(self):
+        # type: () -> None
+        while True:
+            try:
+                path, records = self.writes.get(timeout=1.0)
+
+            except _queue.Empty:
+                with self.lock:
+                    if self.writes.empty():
+                        self.writer = None
+                        return
+
+                continue
+
+            try:
+                # Only the last queued content of a file is written, the older ones are outdated
+                latest = {path: records}
+
+                while True:
+                    try:
+                        path, records = self.writes.get_nowait()
+
+                    except _queue.Empty:
+                        break
+
+                    latest[path] = records
+                    self.writes.task_done()
+
+                for path, records in latest.items():
+                    _writeFile(path, records)
+
+            except OSError as error:
+                print("Error, bge.logic.globalDict could not be saved: %s" % error)
+
+            finally:
+                self.writes.task_done()
+
+    def flush(self):
+        # type: () -> None
+        """Wait until the queued writes are done."""
+
+        self.writes.join()
+
+    def load(self, path):
+        # type: (str) -> None
+        """Start decoding a file in the background, see collect()."""
+
+        self.flush()
+        self.collect()
+        self.loaded = self.error = None
+        self.loader = _threading.Thread(target=self._read, args=(path,), name="globalDict loader", daemon=True)
+        self.loader.start()
+
+    def _read(self, path):
+        # type: (str) -> None
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+        except OSError as error:
+            self.error = "Error, bge.logic.globalDict could not be loaded: %s" % error
+            return
+
+        try:
+            self.loaded = _decode(data, self)
+
+        except (EOFError, ValueError, TypeError, _struct.error):
+            self.error = "Error, bge.logic.globalDict could not be loaded: %s is corrupt" % path
+
+    def collect(self):
+        # type: () -> dict | None
+        """Wait for the running load and return the decoded dictionary, None if there is none or it failed."""
+
+        loader, self.loader = self.loader, None
+
+        if loader is None:
+            return None
+
+        loader.join()
+
+        if self.error is not None:
+            print(self.error)
+            return None
+
+        loaded, self.loaded = self.loaded, None
+        return loaded
+
+
+def _encodeRecord(records, key, value):
+    # type: (dict[object, tuple[object, bytes]], object, object) -> bool
+    """Encode the record of a key, False if its value can't be marshalled."""
+
+    try:
+        keyData = _marshal.dumps(key, _VERSION)
+        valueData = _marshal.dumps(value, _VERSION)
+
+    except ValueError:
+        print("Error, bge.logic.globalDict[%r] could not be marshal'd" % (key,))
+        return False
+
+    records[key] = (value, b"".join((_LENGTH.pack(len(keyData)), keyData, _LENGTH.pack(len(valueData)), valueData)))
+    return True
+
+
+def _decode(data, store):
+    # type: (bytes, Store) -> dict
+    if not data.startswith(MAGIC):
+        # A whole dictionary marshalled at once, by the BGE
+        loaded = _marshal.loads(data)
+
+        if not isinstance(loaded, dict):
+            raise TypeError("not a dictionary")
+
+        store.records = {}
+        store.source = None
+        return loaded
+
+    view = memoryview(data)
+    size = _LENGTH.size
+    offset = len(MAGIC)
+    loaded = {}
+    records = {}
+
+    while offset < len(data):
+        start = offset
+        length, = _LENGTH.unpack_from(data, offset)
+        key = _marshal.loads(view[offset + size:offset + size + length])
+        offset += size + length
+        length, = _LENGTH.unpack_from(data, offset)
+        value = _marshal.loads(view[offset + size:offset + size + length])
+        offset += size + length
+        loaded[key] = value
+        # Reused by the next save while the value isn't replaced
+        records[key] = (value, data[start:offset])
+
+    store.records = records
+    store.source = None
+    return loaded
+
+
+def _writeFile(path, records):
+    # type: (str, list[bytes]) -> None
+    """Write the records to a temporary file of the same directory and rename it over the file."""
+
+    directory = _os.path.dirname(_os.path.abspath(path))
+    descriptor, temporary = _tempfile.mkstemp(prefix=".globalDict-", dir=directory)
+
+    try:
+        with _os.fdopen(descriptor, "wb") as file:
+            file.write(MAGIC)
+            file.writelines(records)
+            file.flush()
+            _os.fsync(file.fileno())
+
+        _os.replace(temporary, path)
+
+    except BaseException:
+        try:
+            _os.remove(temporary)
+
+        except OSError:
+            pass
+
+        raise
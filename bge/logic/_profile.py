@@ -0,0 +1,164 @@
+"""Frame time profiler of the headless runtime, see bge.logic.getProfileInfo() and bge.render.showProfile().
+
+The time of each logic frame is split in the categories of the BGE profiler, kept for the last frames in ring buffers.
+When the profile is shown the time of every Python controller, component and draw callback is also recorded as an
+event (name, category, start, duration) in a fixed size ring buffer: the oldest events are overwritten, so a profiled
+game can run for hours without growing. The events give the hot spots and are exported as a Chrome trace."""
+
+import json as _json
+import time as _time
+
+CATEGORIES = ("Physics", "Logic", "Animations", "Network", "Scenegraph", "Rasterizer", "Services", "Overhead",
+              "Outside", "GPU Latency")
+"""Categories of the profile, in the order of the BGE on screen profiler."""
+
+_INDICES = {name: index for index, name in enumerate(CATEGORIES)}
+_OUTSIDE = _INDICES["Outside"]
+
+
+class Profiler:
+    """Ring buffers of the category times of the last frames and of the detailed events."""
+
+    def __init__(self, frames=256, events=65536):
+        # type: (int, int) -> None
+        self.detailed = False  # type: bool
+        """Record the events of the Python controllers, components and callbacks, see bge.render.showProfile()."""
+
+        self.origin = _time.perf_counter()  # type: float
+        self.frames = [None] * frames  # type: list[tuple[float, float, list[float]] | None]
+        """(start, duration, category times) of the last frames, written at index frameCount % len(frames)."""
+
+        self.frameCount = 0  # type: int
+        self.events = [None] * events  # type: list[tuple[str, str, float, float, str] | None]
+        """(name, category, start, duration, object) of the last events, written at index eventCount % len(events)."""
+
+        self.eventCount = 0  # type: int
+        self.current = [0.0] * len(CATEGORIES)  # type: list[float]
+        """Category times of the running frame."""
+
+        self.start = None  # type: float | None
+        """Start of the running frame, None before the first one."""
+
+    def beginFrame(self, now):
+        # type: (float) -> None
+        """Close the running frame and start a new one, the time of the last frame not spent in a category is Outside."""
+
+        start = self.start
+
+        if start is not None:
+            times = self.current
+            duration = now - start
+            times[_OUTSIDE] = max(0.0, duration - sum(times))
+            self.frames[self.frameCount % len(self.frames)] = (start, duration, times)
+            self.frameCount += 1
+            self.current = [0.0] * len(CATEGORIES)
+
+        self.start = now
+
+    def add(self, category, duration):
+        # type: (str, float) -> None
+        self.current[_INDICES[category]] += duration
+
+    def record(self, name, category, start, duration, object=""):
+        # type: (str, str, float, float, str) -> None
+        """Store a detailed event, overwriting the oldest one when the buffer is full."""
+
+        self.events[self.eventCount % len(self.events)] = (name, category, start, duration, object)
+        self.eventCount += 1
+
+    def lastFrames(self, count):
+        # type: (int) -> list[tuple[float, float, list[float]]]
+        """The last recorded frames, at most count of them, oldest first."""
+
+        size = len(self.frames)
+        count = min(count, self.frameCount, size)
+        return [self.frames[index % size] for index in range(self.frameCount - count, self.frameCount)]
+
+    def lastEvents(self):
+        # type: () -> list[tuple[str, str, float, float, str]]
+        size = len(self.events)
+        return [self.events[index % size] for index in range(max(0, self.eventCount - size), self.eventCount)]
+
+    def info(self, count):
+        # type: (int) -> dict[str, tuple[float, float]]
+        """Average time in ms and percentage of the frame time of each category over the last frames."""
+
+        frames = self.lastFrames(count)
+        totals = [0.0] * len(CATEGORIES)
+        elapsed = 0.0
+
+        for _, duration, times in frames:
+            elapsed += duration
+
+            for index, value in enumerate(times):
+                totals[index] += value
+
+        frames = len(frames) or 1
+        return {name: (total / frames * 1000.0, total / elapsed * 100.0 if elapsed else 0.0)
+                for name, total in zip(CATEGORIES, totals)}
+
+    def frameRate(self, count):
+        # type: (int) -> float
+        frames = self.lastFrames(count)
+        elapsed = sum(duration for _, duration, _ in frames)
+        return len(frames) / elapsed if elapsed else 0.0
+
+    def hotSpots(self, count, byObject=True):
+        # type: (int, bool) -> list[dict[str, object]]
+        """The events of the buffer grouped by name (and object), the most time consuming first."""
+
+        groups = {}
+
+        for name, category, _, duration, object in self.lastEvents():
+            if not byObject:
+                object = ""
+
+            group = groups.get((name, object))
+
+            if group is None:
+                groups[name, object] = [category, 1, duration, duration]
+
+            else:
+                group[1] += 1
+                group[2] += duration
+
+                if duration > group[3]:
+                    group[3] = duration
+
+        spots = [{"name": name, "object": object, "category": category, "calls": calls, "time": total * 1000.0,
+                  "average": total / calls * 1000.0, "max": peak * 1000.0}
+                 for (name, object), (category, calls, total, peak) in groups.items()]
+        spots.sort(key=_byTime, reverse=True)
+        return spots[:count] if count else spots
+
+    def trace(self):
+        # type: () -> dict[str, list]
+        """Chrome trace (chrome://tracing, Perfetto) of the recorded frames and events, times in microseconds."""
+
+        origin = self.origin
+        events = []
+
+        for start, duration, _ in self.lastFrames(len(self.frames)):
+            events.append({"name": "Frame", "cat": "Frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (start - origin) * 1e6, "dur": duration * 1e6})
+
+        for name, category, start, duration, object in self.lastEvents():
+            event = {"name": name, "cat": category, "ph": "X", "pid": 0, "tid": 1, "ts": (start - origin) * 1e6,
+                     "dur": duration * 1e6}
+
+            if object:
+                event["args"] = {"object": object}
+
+            events.append(event)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def saveTrace(self, path):
+        # type: (str) -> None
+        with open(path, "w") as file:
+            _json.dump(self.trace(), file)
+
+
+def _byTime(spot):
+    # type: (dict) -> float
+    return spot["time"]
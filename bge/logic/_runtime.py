@@ -0,0 +1,527 @@
+"""Headless game engine runtime driving the logic of the scenes at a fixed tic rate, see bge.logic.NextFrame().
+
+The scenes are stepped in the order of KX_KetsjiEngine: for each logic frame the components of the objects are updated,
+then the sensors are evaluated, the triggered controllers executed, the active actuators updated, the physics stepped and
+finally the objects ended during the frame removed. There is no rendering, the draw callbacks of the scenes are called once per frame."""
+
+import random as _random
+import time as _time
+import traceback as _traceback
+
+from .. import types as _types
+from ..types._action import updateActions as _updateActions
+from . import _profile
+
+
+
+class Engine:
+    """Clock and scene list of the game, one instance is created by bge.logic."""
+
+    def __init__(self):
+        # type: () -> None
+        self.logicTicRate = 60.0  # type: float
+        self.physicsTicRate = 60.0  # type: float
+        self.maxLogicFrame = 5  # type: int
+        self.maxPhysicsFrame = 5  # type: int
+        self.timeScale = 1.0  # type: float
+        self.useExternalClock = False  # type: bool
+        self.fastForward = False  # type: bool
+        """Run exactly one logic frame per call to nextFrame(), without following the real time."""
+
+        self.render = True  # type: bool
+        self.scenes = _types.CListValue()  # type: _types.CListValue[_types.KX_Scene]
+        self.currentScene = None  # type: _types.KX_Scene
+        self.currentController = None  # type: _types.SCA_PythonController
+        self.seed = None  # type: int | str | None
+        """Seed of the random generator of bge.logic.getRandomFloat(), None to seed it from the system."""
+
+        self.profiler = _profile.Profiler()  # type: _profile.Profiler
+
+        self.reset()
+
+    def reset(self):
+        # type: () -> None
+        """Put the clock back to zero and drop the scenes, used when the game ends."""
+
+        for scene in self.scenes:
+            scene.invalid = True
+
+        self.scenes = _types.CListValue()
+        self.pendingScenes = []  # type: list[tuple[_types.KX_Scene, int]]
+        self.currentScene = None
+        self.currentController = None
+        self.clockTime = 0.0  # type: float
+        self.frameTime = 0.0  # type: float
+        self.frame = 0  # type: int
+        """Number of logic frames run since the start of the game."""
+
+        self.realStart = _time.perf_counter()  # type: float
+        self.realLast = self.realStart  # type: float
+        self.quit = False  # type: bool
+        self.random = _random.Random(self.seed)  # type: _random.Random
+
+    def realTime(self):
+        # type: () -> float
+        return _time.perf_counter() - self.realStart
+
+    def addScene(self, scene, overlay=1):
+        # type: (str | _types.KX_Scene, int) -> None
+        """Queue a scene, it is added at the start of the next logic frame."""
+
+        if isinstance(scene, str):
+            scene = _types.KX_Scene(scene)
+
+        self.pendingScenes.append((scene, overlay))
+
+    def nextFrame(self):
+        # type: () -> int
+        """Advance the clock and run the logic frames due, at most maxLogicFrame of them.
+
+        Returns:
+            int: The number of logic frames run."""
+
+        timestep = 1.0 / self.logicTicRate
+        now = _time.perf_counter()
+
+        if self.fastForward:
+            self.clockTime = self.frameTime + timestep
+
+        elif not self.useExternalClock:
+            self.clockTime += (now - self.realLast) * self.timeScale
+
+        self.realLast = now
+        frames = int((self.clockTime - self.frameTime) * self.logicTicRate + 1e-9)
+
+        if frames > self.maxLogicFrame:
+            # The logic can't keep up, drop the frames that are too late
+            self.frameTime += (frames - self.maxLogicFrame) * timestep
+            frames = self.maxLogicFrame
+
+        for _ in range(frames):
+            self.frameTime += timestep
+            self.logicFrame(timestep)
+
+            if self.quit:
+                self.reset()
+                return frames
+
+        self.draw()
+        return frames
+
+    def step(self, frames=1):
+        # type: (int) -> int
+        """Run a batch of logic frames back to back, one logic tic of game time each, then draw once.
+
+        The clock is set to the frame time whatever the real time, fast-forward and external clock settings.
+
+        Returns:
+            int: The number of logic frames run, fewer if the game ended."""
+
+        timestep = 1.0 / self.logicTicRate
+
+        for done in range(frames):
+            if not self.scenes and not self.pendingScenes:
+                return done
+
+            self.frameTime += timestep
+            self.clockTime = self.frameTime
+            self.logicFrame(timestep)
+
+            if self.quit:
+                self.reset()
+                return done + 1
+
+        self.realLast = _time.perf_counter()
+        self.draw()
+        return frames
+
+    def draw(self):
+        # type: () -> None
+        """Call the draw callbacks of the scenes that aren't suspended, when rendering is enabled."""
+
+        if self.render:
+            profiler = self.profiler
+            start = _time.perf_counter()
+
+            for scene in self.scenes:
+                if not scene.suspended:
+                    _callAll(scene.pre_draw_setup, profiler)
+                    _callAll(scene.pre_draw, profiler)
+                    _callAll(scene.post_draw, profiler)
+
+            profiler.add("Rasterizer", _time.perf_counter() - start)
+
+    def run(self, frames=0, duration=0.0):
+        # type: (int, float) -> int
+        """Run the game until it ends, for a number of logic frames or a duration of game time.
+
+        Returns:
+            int: The number of logic frames run."""
+
+        done = 0
+        end = self.frameTime + duration
+
+        while not self.quit and (self.scenes or self.pendingScenes):
+            if frames and done >= frames or duration and self.frameTime >= end - 1e-9:
+                break
+
+            if not self.fastForward and not self.useExternalClock:
+                # Sleep until the next logic frame is due instead of spinning
+                wait = (self.frameTime + 1.0 / self.logicTicRate - self.clockTime) / self.timeScale
+                wait -= _time.perf_counter() - self.realLast
+
+                if wait > 0.0:
+                    _time.sleep(wait)
+
+            done += self.nextFrame()
+
+        return done
+
+    def logicFrame(self, timestep):
+        # type: (float) -> None
+        """Run one logic frame on all the scenes."""
+
+        self.frame += 1
+        self.profiler.beginFrame(_time.perf_counter())
+
+        if self.pendingScenes:
+            pending, self.pendingScenes = self.pendingScenes, []
+
+            for scene, overlay in pending:
+                scene.invalid = False
+
+                if overlay:
+                    self.scenes.append(scene)
+
+                else:
+                    self.scenes._insert(0, scene)
+
+        for scene in list(self.scenes):
+            if not scene.suspended and not scene._ended:
+                stepScene(self, scene, timestep)
+
+        # The just activated and just released statuses last one logic frame
+        _types._keyboard._nextFrame()
+        _types._mouse._nextFrame()
+
+        for scene in list(self.scenes):
+            if scene._ended:
+                self.scenes._remove(scene)
+                scene.invalid = True
+
+                if scene._replacement is not None:
+                    self.addScene(scene._replacement)
+
+        self.currentScene = self.scenes[0] if len(self.scenes) else None
+        self.currentController = None
+
+
+def _callAll(callbacks, profiler):
+    # type: (list, _profile.Profiler) -> None
+    if not profiler.detailed:
+        for callback in list(callbacks):
+            callback()
+
+        return
+
+    for callback in list(callbacks):
+        start = _time.perf_counter()
+        callback()
+        profiler.record(getattr(callback, "__qualname__", type(callback).__name__), "Rasterizer", start,
+                        _time.perf_counter() - start)
+
+
+def registerObject(scene, object):
+    # type: (_types.KX_Scene, _types.KX_GameObject) -> None
+    """Bind an object added to a scene and its logic bricks and components to their owners."""
+
+    object.scene = scene
+    object.invalid = False
+    scene._spatial.add(object)
+
+    if scene._active is not None:
+        # Counted as leaving the culling box at the next frame if it isn't inside
+        scene._active.add(object)
+
+    if object._actions:
+        scene._animated[object] = None
+
+    scene._physics.register(object)
+
+    for bricks in (object.sensors, object.controllers, object.actuators):
+        for brick in bricks:
+            brick.owner = object
+
+    for component in object.components:
+        component.object = object
+
+    object._linkSensors()
+
+
+def removeObjects(scene, objects):
+    # type: (_types.KX_Scene, list[_types.KX_GameObject]) -> None
+    """Remove the objects ended during a logic frame from their scene and invalidate them."""
+
+    removed = []
+
+    for object in objects:
+        if not object.invalid:
+            object.invalid = True
+            removed.append(object)
+
+    scene.objects._removeAll(removed)
+    pools = scene._pools
+    active = scene._active
+
+    for object in removed:
+        scene._spatial.discard(object)
+        scene._culled.discard(object)
+        scene._animated.pop(object, None)
+
+        if active is not None:
+            active.discard(object)
+
+        scene._physics.unregister(object)
+        object._unlinkSensors()
+
+        for actuator in object.actuators:
+            scene._activeActuators.pop(actuator, None)
+            del actuator._events[:]
+
+        pool = pools.get(object._template)
+
+        if pool is not None:
+            pool.release(object)
+
+
+def stepScene(engine, scene, timestep):
+    # type: (Engine, _types.KX_Scene, float) -> None
+    """Run one logic frame of a scene."""
+
+    engine.currentScene = scene
+    frame = engine.frame
+    scene._frame += 1
+    profiler = engine.profiler
+    detailed = profiler.detailed
+    perf = _time.perf_counter
+    start = perf()
+
+    if scene._timers.count:
+        scene._expireObjects()
+
+    # The lists are read directly, the CListValue iterators are too slow for scenes of thousands of objects
+    objects = list(scene.objects._items)
+
+    for object in objects:
+        if object.scene is not scene:
+            registerObject(scene, object)
+
+    # The culled objects aren't gone through, logicInfo() counts their bricks when asked
+    culled = updateCulled(scene, objects)
+    components = 0
+
+    if culled:
+        objects = [object for object in objects if object not in culled]
+
+    logic = perf()
+    profiler.add("Scenegraph", logic - start)
+
+    # Components are updated before the logic bricks
+    for object in objects:
+        components += len(object.components._items)
+
+        for component in object.components._items:
+            if detailed:
+                start = perf()
+
+            try:
+                if not component._started:
+                    component._started = True
+                    component.start(component.args)
+
+                component.update()
+
+            except Exception:
+                _traceback.print_exc()
+
+            if detailed:
+                profiler.record(_componentLabel(component), "Logic", start, perf() - start, object.name)
+
+    # Only the polled sensors and the ones woken by a change of their inputs are evaluated, idle sensors cost nothing
+    woken, scene._wokenSensors = scene._wokenSensors, {}
+
+    if scene._sensorTimers.count:
+        woken.update(dict.fromkeys(scene._sensorTimers.advance(scene._frame)))
+
+    triggered = {}
+    sensors = 0
+
+    for sensor in ({**scene._polledSensors, **woken} if woken else scene._polledSensors):
+        owner = sensor.owner
+
+        if owner.invalid:
+            continue
+
+        if culled and owner in culled:
+            if not sensor._polled:
+                # Evaluated once its owner is active again
+                scene._wokenSensors[sensor] = None
+
+            continue
+
+        controllers = None
+
+        for controller in sensor._controllers:
+            object = controller.owner
+
+            if controller.state & object._state and not object.invalid and not (culled and object in culled):
+                if controllers is None:
+                    controllers = [controller]
+
+                else:
+                    controllers.append(controller)
+
+        if controllers is None:
+            # Sensors only linked to inactive controllers are evaluated when the state of their controllers changes
+            continue
+
+        if sensor._frame != frame:
+            sensor._frame = frame
+            sensor._activate()
+            sensors += 1
+
+        if sensor.triggered:
+            for controller in controllers:
+                triggered[controller] = None
+
+        if not sensor._polled and sensor._pending():
+            scene._wokenSensors[sensor] = None
+
+    scene._logicInfo = {"components": components, "sensors": sensors, "controllers": len(triggered)}
+    triggered = sorted(triggered, key=_controllerOrder)
+
+    for controller in triggered:
+        engine.currentController = controller
+
+        if detailed:
+            start = perf()
+            controller._trigger()
+            profiler.record(_controllerLabel(controller), "Logic", start, perf() - start,
+                            "%s.%s" % (controller.owner.name, controller.name))
+
+        else:
+            controller._trigger()
+
+    engine.currentController = None
+    actuators = scene._activeActuators
+
+    if actuators:
+        active = list(actuators)
+        actuators.clear()
+
+        for actuator in active:
+            if actuator._update():
+                actuators[actuator] = None
+
+    start = perf()
+    profiler.add("Logic", start - logic)
+
+    if scene._animated:
+        _updateActions(scene, timestep)
+        now = perf()
+        profiler.add("Animations", now - start)
+        start = now
+
+    if scene._physics.objects or scene._physics.characters:
+        scene._physics.step(timestep)
+        now = perf()
+        profiler.add("Physics", now - start)
+        start = now
+
+    if scene._endedObjects:
+        ended, scene._endedObjects = scene._endedObjects, []
+        removeObjects(scene, ended)
+        profiler.add("Scenegraph", perf() - start)
+
+
+def updateCulled(scene, objects):
+    # type: (_types.KX_Scene, list[_types.KX_GameObject]) -> set[_types.KX_GameObject]
+    """Update the objects of a scene outside of the activity culling box of its active camera.
+
+    As in KX_Scene::UpdateObjectActivity the box spans activity_culling_radius on each axis around the camera. The
+    broadphase gives the objects near the box, only the ones which entered or left the box since the last frame change
+    the culled set. It is built from all the objects when the culling starts or the active camera gets a position.
+
+    Returns:
+        set[KX_GameObject]: The culled objects, scene._culled."""
+
+    culled = scene._culled
+    camera = scene.active_camera
+
+    if not scene.activity_culling or camera is None or camera._position is None:
+        scene._active = None
+        culled.clear()
+        return culled
+
+    radius = scene.activity_culling_radius
+    cx, cy, cz = camera._position._data[:3]
+    spheres = scene._spatial.spheres
+    active = {camera}
+
+    for object in scene._spatial.queryBox((cx - radius, cy - radius, cz - radius), (cx + radius, cy + radius, cz + radius)):
+        x, y, z, _ = spheres[object]
+
+        if abs(x - cx) <= radius and abs(y - cy) <= radius and abs(z - cz) <= radius:
+            active.add(object)
+
+    previous = scene._active
+    scene._active = active
+
+    # Objects without a position aren't in the broadphase and never culled
+    if previous is None:
+        culled.clear()
+        culled.update(object for object in objects if object not in active and object._position is not None)
+
+    else:
+        culled.difference_update(active.difference(previous))
+        culled.update(object for object in previous.difference(active)
+                      if object._position is not None and not object.invalid)
+
+    return culled
+
+
+def logicInfo(scene):
+    # type: (_types.KX_Scene) -> dict[str, int]
+    """Counters of the last logic frame of a scene, see bge.logic.getLogicInfo()."""
+
+    info = {"culledObjects": len(scene._culled), "components": 0, "skippedComponents": 0, "sensors": 0,
+            "skippedSensors": 0, "controllers": 0, "skippedControllers": 0}
+    info.update(scene._logicInfo)
+
+    for object in scene._culled:
+        info["skippedComponents"] += len(object.components._items)
+        info["skippedSensors"] += len(object.sensors._items)
+        info["skippedControllers"] += len(object.controllers._items)
+
+    return info
+
+
+def _componentLabel(component):
+    # type: (_types.KX_PythonComponent) -> str
+    cls = type(component)
+    return "%s.%s" % (cls.__module__, cls.__qualname__)
+
+
+def _controllerLabel(controller):
+    # type: (_types.SCA_IController) -> str
+    """Name of the code run by a controller: the function of module controllers, the controller name for the others."""
+
+    if isinstance(controller, _types.SCA_PythonController) and controller.mode == 1:
+        return controller.script
+
+    return controller.name or type(controller).__name__
+
+
+def _controllerOrder(controller):
+    # type: (_types.SCA_IController) -> tuple[bool, int]
+    return not controller.useHighPriority, controller.executePriority
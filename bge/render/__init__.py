@@ -377,10 +377,14 @@ def showProfile(enable):
     # type: (bool) -> None
     """Show or hide the profile.
 
+    Note:
+        Without a renderer showing the profile records the time of each Python controller, component and draw callback, see bge.logic.getProfileHotSpots and bge.logic.saveProfileTrace.
+
     Args:
         enable: If show or hide the profile."""
 
-    pass
+    from .. import logic
+    logic._engine.profiler.detailed = bool(enable)
 
 
 def showProperties(enable):
@@ -8,7 +8,7 @@ In addition, you can apply filters on the images before sending them to the GPU,
 
 from .. import render as _render
 from .. import types as _types
-from ... import bgl as _bgl
+import bgl as _bgl
 
 
 # Constants
@@ -1,8 +1,207 @@
 """This module contains the classes that appear as instances in the Game Engine. A script must interact with these classes if it is to affect the behaviour of objects in a game."""
 
-from ...mathutils import Vector as _Vector, Matrix as _Matrix, Color as _Color
+import builtins as _builtins
+import copy as _copy
+import inspect as _inspect
+import sys as _sys
+import traceback as _traceback
+from array import array as _array
+from importlib import import_module as _import_module
+from math import cos as _cos, radians as _radians, sqrt as _sqrt, tan as _tan
+from mathutils import Vector as _Vector, Matrix as _Matrix, Color as _Color
 from typing import Callable as _Callable, Any as _Any
 
+from . import _character as _characters
+from ._action import ActionLayer as _ActionLayer
+from ._mesh import VertexArray as _VertexArray
+from ._physics import DEFAULTS as _PHYSICS_DEFAULTS, PhysicsWorld as _PhysicsWorld, isStatic as _isStatic
+from ._pool import ObjectPool as _ObjectPool, TimerWheel as _TimerWheel
+from ._snapshot import SnapshotRing as _SnapshotRing
+from ._spatial import SpatialHash as _SpatialHash, TrackedVector as _TrackedVector, tracked as _tracked
+
+_scripts = {}  # type: dict[tuple[str, str], object]
+"""Compiled scripts of the Python controllers by controller name and script text."""
+
+_INPUT_NONE, _INPUT_JUST_ACTIVATED, _INPUT_ACTIVE, _INPUT_JUST_RELEASED = 0, 1, 2, 3
+"""Input statuses, bge.logic.KX_INPUT_NONE to KX_INPUT_JUST_RELEASED."""
+
+_LEFTMOUSE, _MIDDLEMOUSE, _RIGHTMOUSE, _WHEELUPMOUSE, _WHEELDOWNMOUSE, _MOUSEX, _MOUSEY = 116, 117, 118, 120, 121, 122, 123
+"""Mouse event codes, see bge.events."""
+
+_arguments = {}  # type: dict[_Callable, int]
+"""Number of fixed arguments of the collision callbacks, by function."""
+
+_BRICK_LISTS = ("sensors", "controllers", "actuators", "components")
+
+_MAX_ACTION_LAYERS = 8
+"""Number of action layers of a game object, as MAX_ACTION_LAYERS in BL_ActionManager."""
+
+_IDENTITY_ROWS = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+_TRANSFORM_ATTRIBUTES = (("worldPosition", "_position"), ("worldOrientation", "_orientation"), ("worldScale", "_scale"),
+                         ("localInertia", "localInertia"))
+"""Vector and matrix attributes of the game objects with the attribute storing them, copied for each replica."""
+
+
+def _location(value):
+    # type: (KX_GameObject | _Vector) -> list[float]
+    """World position of a game object, or the [x, y, z] point given."""
+
+    if isinstance(value, KX_GameObject):
+        return value._position._data[:3]
+
+    return [float(v) for v in value[:3]]
+
+
+def _orientationMatrix(value):
+    # type: (object) -> _Matrix | None
+    """3x3 copy of an orientation given as a Matrix, Quaternion, Euler or sequence of rows, None stays the identity."""
+
+    if value is None:
+        return None
+
+    if isinstance(value, _Matrix):
+        return value.to_3x3()
+
+    if hasattr(value, "to_matrix"):
+        return value.to_matrix()
+
+    return _Matrix(value).to_3x3()
+
+
+def _worldAxis(object, axis):
+    # type: (KX_GameObject, int) -> list[float]
+    """World direction of a local axis of an object, 0 to 2 for X to Z and 3 to 5 for -X to -Z."""
+
+    index = axis % 3
+    sign = -1.0 if axis > 2 else 1.0
+    orientation = object._orientation
+
+    if orientation is None:
+        direction = [0.0, 0.0, 0.0]
+        direction[index] = sign
+        return direction
+
+    direction = [orientation[row][index] * sign for row in range(3)]
+    length = _sqrt(direction[0] ** 2 + direction[1] ** 2 + direction[2] ** 2) or 1.0
+    return [v / length for v in direction]
+
+
+def _propertyEquals(value, text):
+    # type: (_Any, str) -> bool
+    """Compare a property to the text value of a property sensor like CValue::IsEqual, by type of the property."""
+
+    if isinstance(value, bool):
+        return text.strip().upper() in (("TRUE", "1") if value else ("FALSE", "0"))
+
+    if isinstance(value, (int, float)):
+        try:
+            return float(text) == value
+
+        except ValueError:
+            return False
+
+    return str(value) == text
+
+
+def _fixedArguments(callback):
+    # type: (_Callable) -> int
+    """Number of positional arguments without default of a callback, not counting self."""
+
+    function = getattr(callback, "__func__", callback)
+    count = _arguments.get(function)
+
+    if count is None:
+        try:
+            parameters = _inspect.signature(callback).parameters.values()
+
+        except (TypeError, ValueError):
+            parameters = ()
+
+        count = _arguments[function] = sum(1 for parameter in parameters if parameter.default is parameter.empty and
+                                          parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD))
+
+    return count
+
+
+def _vertexComponent(buffer, size, offset, doc, layer=None):
+    # type: (str, int, int, str, int) -> property
+    """Property of KX_VertexProxy reading and writing one float of a vertex array buffer, or of one of its layers."""
+
+    def data(proxy):
+        values = getattr(proxy._array, buffer)
+        return values if layer is None else values[layer]
+
+    def getter(self):
+        # type: () -> float
+        return data(self)[self._index * size + offset]
+
+    def setter(self, value):
+        # type: (float) -> None
+        data(self)[self._index * size + offset] = value
+
+    return property(getter, setter, doc=doc)
+
+
+def _velocityAttribute(angular, local, doc):
+    # type: (bool, bool, str) -> property
+    """Property of KX_GameObject reading and writing its linear or angular velocity, in world or local axes."""
+
+    def getter(self):
+        # type: () -> _Vector
+        return self.getAngularVelocity(local) if angular else self.getLinearVelocity(local)
+
+    def setter(self, value):
+        # type: (_Vector) -> None
+        if angular:
+            self.setAngularVelocity(value, local)
+
+        else:
+            self.setLinearVelocity(value, local)
+
+    return property(getter, setter, doc=doc)
+
+
+def _velocityLimit(index, doc):
+    # type: (int, str) -> property
+    """Property of KX_GameObject reading and writing one of its velocity limits, linear min, max, angular min, max."""
+
+    def getter(self):
+        # type: () -> float
+        return self._limits[index]
+
+    def setter(self, value):
+        # type: (float) -> None
+        self._limits[index] = float(value)
+
+        if self._body is not None:
+            self.scene._physics.setLimits(self)
+
+    return property(getter, setter, doc=doc)
+
+
+def _rotate(orientation, vector, inverse=False):
+    # type: (_Matrix, _Vector, bool) -> list[float]
+    """Local vector in world axes with an orientation matrix, world vector in local axes with its transpose if inverse."""
+
+    vector = [float(value) for value in vector[:3]]
+
+    if orientation is None:
+        return vector
+
+    if inverse:
+        return [sum(orientation[row][column] * vector[row] for row in range(3)) for column in range(3)]
+
+    return [sum(orientation[row][column] * vector[column] for column in range(3)) for row in range(3)]
+
+
+def _ownAttributes(copy, brick):
+    """Give a replicated logic brick its own properties, the shallow copy of the template brick shares them."""
+
+    if isinstance(brick, PyObjectPlus):
+        copy._customAttributes = dict(brick._customAttributes)
+        copy._watchers = {}
+
 
 class PyObjectPlus:
     """Base class of most other types in the Game Engine."""
@@ -17,25 +216,52 @@ class PyObjectPlus:
 
         The invalid attribute allows testing for this case without exception handling."""
 
-        self.__customAttributes = {}  # type: dict[str, _Any]
+        self._customAttributes = {}  # type: dict[str, _Any]
+        self._watchers = {}  # type: dict[str, dict[SCA_ISensor, None]]
+        """Property sensors by property name, woken when the property is set."""
 
     def __setitem__(self, key: str, value: _Any) -> None:
-        self.__customAttributes[key] = value
+        self._customAttributes[key] = value
+        watchers = self._watchers.get(key)
+
+        if watchers:
+            for sensor in list(watchers):
+                sensor._wake()
 
     def __getitem__(self, key: str) -> _Any:
-        return self.__customAttributes.get(key)
+        return self._customAttributes.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._customAttributes
 
 
 class CValue(PyObjectPlus):
     """This class is a basis for other classes."""
 
+    _renameCount = 0  # type: int
+    """Number of values renamed, the name indexes of the CListValue built before a rename are stale."""
+
     def __init__(self):
         # type: () -> None
         super().__init__()
 
         self.name = ""  # type: str
+
+    @property
+    def name(self):
+        # type: () -> str
         """The name of this CValue derived object (read-only)."""
 
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        # type: (str) -> None
+        if getattr(self, "_name", value) != value:
+            CValue._renameCount += 1
+
+        self._name = value
+
 
 class CPropValue(CValue):
     """This class has no python functions."""
@@ -48,26 +274,164 @@ class CListValue(CPropValue):
 
     As well as the normal index lookup (val= clist[i]), CListValue supports string lookups (val= scene.objects["Cube"])
 
-    Other operations such as len(clist), list(clist), clist[0:10] are also supported."""
+    Other operations such as len(clist), list(clist), clist[0:10] are also supported.
 
-    def __init__(self):
-        # type: () -> None
+    Note:
+        Name lookups, from_id and the in operator are constant-time: the list keeps a name index and an id index up to date as items are added and removed. Renaming a value rebuilds the name index at the next name lookup."""
+
+    def __init__(self, items=()):
+        # type: (object) -> None
         super().__init__()
 
+        self._items = []  # type: list
+        self._names = {}  # type: dict[str, dict[int, object]]
+        """Items by name then id, in list order, the first one is returned by string lookups."""
+
+        self._namesVersion = CValue._renameCount  # type: int
+        """CValue._renameCount when the name index was built."""
+
+        self._ids = {}  # type: dict[int, list]
+        """[item, number of occurrences] by item id."""
+
+        for item in items:
+            self.append(item)
+
+    def __repr__(self):
+        # type: () -> str
+        return repr(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item):
+        # type: (object) -> bool
+        if isinstance(item, str):
+            return item in self._named()
+
+        if id(item) in self._ids:
+            return True
+
+        # Other values than game engine objects may compare equal without being the same
+        return not isinstance(item, PyObjectPlus) and item in self._items
+
+    def _named(self):
+        # type: () -> dict[str, dict[int, object]]
+        """Name index of the items, rebuilt from the list when a value was renamed since it was built."""
+
+        if self._namesVersion != CValue._renameCount:
+            self._namesVersion = CValue._renameCount
+            names = {}
+
+            for item in self._items:
+                name = getattr(item, "name", None)
+
+                if isinstance(name, str):
+                    names.setdefault(name, {})[id(item)] = item
+
+            self._names = names
+
+        return self._names
+
+    def _index(self, item):
+        # type: (object) -> None
+        """Add an item to the indexes, it must already be at the end of the list."""
+
+        key = id(item)
+        entry = self._ids.get(key)
+
+        if entry is not None:
+            entry[1] += 1
+            return
+
+        self._ids[key] = [item, 1]
+        name = getattr(item, "name", None)
+
+        if isinstance(name, str):
+            names = self._named()
+            named = names.get(name)
+
+            if named is None:
+                names[name] = {key: item}
+
+            else:
+                named[key] = item
+
+    def _unindex(self, item):
+        # type: (object) -> None
+        """Remove one occurrence of an item from the indexes."""
+
+        key = id(item)
+        entry = self._ids[key]
+        entry[1] -= 1
+
+        if entry[1]:
+            return
+
+        del self._ids[key]
+        name = getattr(item, "name", None)
+
+        if isinstance(name, str):
+            names = self._named()
+            # Already left out when the index was rebuilt after the item left the list
+            named = names.get(name, {})
+            named.pop(key, None)
+
+            if not named:
+                names.pop(name, None)
+
+    def _reindex(self, name):
+        # type: (str) -> None
+        """Rebuild the list order of the items with a name, after an item was put before the end of the list."""
+
+        names = self._named()
+
+        if not isinstance(name, str) or name not in names:
+            return
+
+        names[name] = {id(item): item for item in self._items if getattr(item, "name", None) == name}
+
     def __setitem__(self, key, value):
         # type: (str | int, object | CValue) -> None
 
-        pass
+        if isinstance(key, str):
+            named = self._named().get(key)
+
+            if named is None:
+                raise KeyError('CList[key]: "%s" key not in list' % key)
+
+            key = self.index(next(iter(named.values())))
+
+        previous = self._items[key]
+        self._unindex(previous)
+        self._items[key] = value
+        self._index(value)
+        self._reindex(getattr(previous, "name", None))
+        self._reindex(getattr(value, "name", None))
 
     def __getitem__(self, item):
         # type: (str | int) -> object
 
-        pass
+        if isinstance(item, str):
+            named = self._named().get(item)
+
+            if named is None:
+                raise KeyError('CList[key]: "%s" key not in list' % item)
+
+            return next(iter(named.values()))
+
+        if isinstance(item, slice):
+            return self._items[item]
+
+        try:
+            return self._items[item]
+
+        except IndexError:
+            raise IndexError("CList[i]: index out of range") from None
 
     def __len__(self):
         # type: () -> int
 
-        pass
+        return len(self._items)
 
     def append(self, val):
         # type: (object | CValue) -> None
@@ -79,7 +443,8 @@ class CListValue(CPropValue):
         Warning:
             Appending values to the list can cause crashes when the list is used internally by the game engine."""
 
-        pass
+        self._items.append(val)
+        self._index(val)
 
     def count(self, val):
         # type: (object | CValue) -> int
@@ -91,7 +456,11 @@ class CListValue(CPropValue):
         Returns:
             int: number of instances"""
 
-        pass
+        if isinstance(val, PyObjectPlus):
+            entry = self._ids.get(id(val))
+            return entry[1] if entry is not None else 0
+
+        return self._items.count(val)
 
     def index(self, val):
         # type: (object | CValue) -> int
@@ -103,12 +472,24 @@ class CListValue(CPropValue):
         Returns:
             int: The index of the value in the list."""
 
-        pass
+        if isinstance(val, PyObjectPlus) and id(val) not in self._ids:
+            raise ValueError("CList.index(x): x not in CListValue")
+
+        try:
+            return self._items.index(val)
+
+        except ValueError:
+            raise ValueError("CList.index(x): x not in CListValue") from None
 
     def reverse(self):
         """Reverse the order of the list."""
 
-        pass
+        names = self._named()
+        self._items.reverse()
+
+        for name, named in names.items():
+            if len(named) > 1:
+                names[name] = dict(reversed(list(named.items())))
 
     def get(self, key, default=None):
         # type: (str, object) -> object | CValue
@@ -121,7 +502,8 @@ class CListValue(CPropValue):
         Returns:
             The key value or a default."""
 
-        pass
+        named = self._named().get(key)
+        return default if named is None else next(iter(named.values()))
 
     def from_id(self, id):
         # type: (int) -> object | CValue
@@ -136,7 +518,50 @@ class CListValue(CPropValue):
             - The id is derived from a memory location and will be different each time the game engine starts.
             - The id can't be stored as an integer in game object properties, as those only have a limited range that the id may not be contained in. Instead an id can be stored as a string game property and converted back to an integer for use in from_id lookups."""
 
-        pass
+        entry = self._ids.get(id)
+
+        if entry is None:
+            raise IndexError("from_id(#): id not found in CValueList")
+
+        return entry[0]
+
+    def _insert(self, index, item):
+        # type: (int, object) -> None
+        """Insert an item before an index, used by the engine for underlay scenes."""
+
+        self._items.insert(index, item)
+        self._index(item)
+        self._reindex(getattr(item, "name", None))
+
+    def _remove(self, item):
+        # type: (object) -> None
+        """Remove an item, used by the engine when objects or scenes are freed."""
+
+        if id(item) in self._ids:
+            for index, value in enumerate(self._items):
+                if value is item:
+                    del self._items[index]
+                    self._unindex(item)
+                    return
+
+    def _removeAll(self, items):
+        # type: (list) -> None
+        """Remove many items with a single pass over the list, used for the objects ended during a logic frame."""
+
+        removed = {}
+
+        for item in items:
+            if id(item) in self._ids:
+                removed[id(item)] = item
+
+        if not removed:
+            return
+
+        self._items = [item for item in self._items if id(item) not in removed]
+
+        for key, item in removed.items():
+            for _ in range(self._ids[key][1]):
+                self._unindex(item)
 
 
 class SCA_IObject(CValue):
@@ -154,8 +579,8 @@ class KX_GameObject(SCA_IObject):
         - Calling ANY method or attribute on an object that has been removed from a scene will raise a SystemError, if an object may have been removed since last accessing it use the invalid attribute to check.
         - KX_GameObject can be subclassed to extend functionality."""
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, name=""):
+        # type: (str) -> None
         super().__init__()
 
         self.parent = None # type: KX_GameObject
@@ -176,50 +601,32 @@ class KX_GameObject(SCA_IObject):
         self.scene = None  # type: KX_Scene
         """The object's scene. (read-only)."""
 
-        self.name = ""  # type: str
+        self.name = name  # type: str
         """The object's name. (read-only)."""
 
-        self.mass = 0.0  # type: float
-        """The object's mass"""
-
-        self.isSuspendedDynamics = True  # type: bool
-        """The object's dynamic state (read-only)."""
-
-        self.linearDamping = 0.0  # type: float
-        """The object's linear damping, also known as translational damping. Can be set simultaneously with angular damping using the setDamping() method."""
-
-        self.angularDamping = 0.0  # type: float
-        """The object's angular damping, also known as rotationation damping. Can be set simultaneously with linear damping using the setDamping() method."""
-
-        self.linVelocityMin = 0.0  # type: float
-        """Enforces the object keeps moving at a minimum velocity."""
-
-        self.linVelocityMax = 0.0  # type: float
-        """Clamp the maximum linear velocity to prevent objects moving beyond a set speed.
-
-        Notes:
-            - Applies to dynamic and rigid body objects only.
-            - A value of 0.0 disables this option (rather than setting it stationary)."""
-
-        self.angularVelocityMin = 0.0  # type: float
-        """Enforces the object keeps rotating at a minimum velocity. A value of 0.0 disables this.
-
-        Note:
-            Applies to dynamic and rigid body objects only. While objects are stationary the minimum velocity will not be applied."""
+        self._mass = 0.0  # type: float
+        self._suspended = True  # type: bool
+        self._ghost = False  # type: bool
+        self._rigidBody = False  # type: bool
+        self._linearDamping = 0.0  # type: float
+        self._angularDamping = 0.0  # type: float
+        self._limits = [0.0, 0.0, 0.0, 0.0]  # type: list[float]
+        """linVelocityMin, linVelocityMax, angularVelocityMin and angularVelocityMax."""
 
-        self.angularVelocityMax = 0.0  # type: float
-        """Clamp the maximum angular velocity to prevent objects rotating beyond a set speed. A value of 0.0 disables clamping; it does not stop rotation.
+        self._linearVelocity = [0.0, 0.0, 0.0]  # type: list[float]
+        self._angularVelocity = [0.0, 0.0, 0.0]  # type: list[float]
+        """World velocities of the object while it has no body, given to its body when its dynamics are restored."""
 
-        Note:
-            Applies to dynamic and rigid body objects only."""
+        self._body = None  # type: int | None
+        """Index of the body of the object in the physics of its scene, None without dynamics."""
 
         self.localInertia = None  # type: _Vector
         """The object's inertia vector in local coordinates. Read only."""
 
-        self.collisionGroup = 0  # type: int
+        self.collisionGroup = 0x0001  # type: int
         """The object's collision group."""
 
-        self.collisionMask = 0  # type: int
+        self.collisionMask = 0xFFFF  # type: int
         """The object's collision mask."""
 
         self.collisionCallbacks = []  # type: list[_Callable]
@@ -245,89 +652,537 @@ class KX_GameObject(SCA_IObject):
         self.occlusion = True  # type: bool
         """Ccclusion capability flag."""
 
-        self.position = None  # type: _Vector
+        self._position = _tracked((0.0, 0.0, 0.0), self)  # type: _TrackedVector
+
+        self._radius = 1.0  # type: float
+        """Radius of the bounding sphere of the object, the physics radius in Blender, used by the spatial queries."""
+
+        self._orientation = None  # type: _Matrix | None
+        """World orientation, None for the identity. The position, orientation and scale are the one stored transform
+        of the object, the orientation, scale and transform attributes are derived from them."""
+
+        self._scale = None  # type: _TrackedVector | None
+        """World scale, None for (1, 1, 1)."""
+
+        self.timeOffset = 0.0  # type: float
+        """Adjust the slowparent delay at runtime."""
+
+        self._state = 1  # type: int
+        self.meshes = []  # type: list[KX_MeshProxy]
+        """A list meshes for this object."""
+
+        self.sensors = CListValue()  # type: CListValue[SCA_ISensor]
+        """A sequence of SCA_ISensor objects with string/index lookups and iterator support."""
+
+        self.controllers = CListValue()  # type: CListValue[SCA_IController]
+        """A sequence of SCA_IController objects with string/index lookups and iterator support."""
+
+        self.actuators = CListValue()  # type: CListValue[SCA_IActuator]
+        """A list of SCA_IActuator with string/index lookups and iterator support."""
+
+        self.components = CListValue()  # type: CListValue[KX_PythonComponent]
+        """All python components of this object, with string/index lookups and iterator support."""
+
+        self.attrDict = {}  # type: dict[str, object]
+        """Get the objects internal python attribute dictionary for direct (faster) access."""
+
+        self.debug = True  # type: bool
+        """If true, the object's debug properties will be displayed on screen."""
+
+        self.debugRecursive = True  # type: bool
+        """If true, the object's and children's debug properties will be displayed on screen."""
+
+        self.currentLodLevel = 0  # type: int
+        """The index of the level of detail (LOD) currently used by this object (read-only)."""
+
+        self._template = None  # type: KX_GameObject
+        self._spawn = 0  # type: int
+        self._expiry = 0  # type: int
+        self._contacts = {}  # type: dict[KX_GameObject, tuple[int, _Vector, _Vector]]
+        """(scene frame, point, normal) of the collisions reported by the physics, by colliding object."""
+
+        self._actions = {}  # type: dict[int, _ActionLayer]
+        """Action playing on each layer."""
+
+    @property
+    def state(self):
+        # type: () -> int
+        """The game object's state bitmask, using the first 30 bits, one bit must always be set."""
+
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        # type: (int) -> None
+        if value != self._state:
+            self._state = value
+
+            # The sensors of the controllers entering or leaving the active states are evaluated again
+            for controller in self.controllers._items:
+                for sensor in controller.sensors._items:
+                    sensor._wake()
+
+    @property
+    def mass(self):
+        # type: () -> float
+        """The object's mass"""
+
+        return self._mass
+
+    @mass.setter
+    def mass(self, value):
+        # type: (float) -> None
+        self._mass = max(0.0, float(value))
+        self._updateBody()
+
+    @property
+    def isSuspendedDynamics(self):
+        # type: () -> bool
+        """The object's dynamic state (read-only)."""
+
+        return self._suspended
+
+    @property
+    def linearDamping(self):
+        # type: () -> float
+        """The object's linear damping, also known as translational damping. Can be set simultaneously with angular damping using the setDamping() method."""
+
+        return self._linearDamping
+
+    @linearDamping.setter
+    def linearDamping(self, value):
+        # type: (float) -> None
+        self.setDamping(value, self._angularDamping)
+
+    @property
+    def angularDamping(self):
+        # type: () -> float
+        """The object's angular damping, also known as rotationation damping. Can be set simultaneously with linear damping using the setDamping() method."""
+
+        return self._angularDamping
+
+    @angularDamping.setter
+    def angularDamping(self, value):
+        # type: (float) -> None
+        self.setDamping(self._linearDamping, value)
+
+    linVelocityMin = _velocityLimit(0, """Enforces the object keeps moving at a minimum velocity.""")
+
+    linVelocityMax = _velocityLimit(1, """Clamp the maximum linear velocity to prevent objects moving beyond a set speed.
+
+        Notes:
+            - Applies to dynamic and rigid body objects only.
+            - A value of 0.0 disables this option (rather than setting it stationary).""")
+
+    angularVelocityMin = _velocityLimit(2, """Enforces the object keeps rotating at a minimum velocity. A value of 0.0 disables this.
+
+        Note:
+            Applies to dynamic and rigid body objects only. While objects are stationary the minimum velocity will not be applied.""")
+
+    angularVelocityMax = _velocityLimit(3, """Clamp the maximum angular velocity to prevent objects rotating beyond a set speed. A value of 0.0 disables clamping; it does not stop rotation.
+
+        Note:
+            Applies to dynamic and rigid body objects only.""")
+
+    localLinearVelocity = _velocityAttribute(False, True, """The object's local linear velocity. [x, y, z]""")
+
+    worldLinearVelocity = _velocityAttribute(False, False, """The object's world linear velocity. [x, y, z]""")
+
+    localAngularVelocity = _velocityAttribute(True, True, """The object's local angular velocity. [x, y, z]""")
+
+    worldAngularVelocity = _velocityAttribute(True, False, """The object's world angular velocity. [x, y, z]""")
+
+    def _updateBody(self):
+        # type: () -> None
+        """Create, update or delete the body of the object after a change of its mass or dynamics state."""
+
+        scene = self.scene
+
+        if scene is None or self.invalid:
+            return
+
+        world = scene._physics
+        dynamic = self._mass > 0.0 and not self._suspended
+
+        if self._body is None:
+            if dynamic:
+                world.add(self)
+
+            elif self.meshes:
+                # It may have joined or left the level
+                world.staticDirty = True
+
+        elif not dynamic:
+            world.remove(self)
+
+        else:
+            world.setMass(self)
+
+    @property
+    def worldPosition(self):
+        # type: () -> _Vector
+        """The object's world position. [x, y, z]"""
+
+        return self._position
+
+    @worldPosition.setter
+    def worldPosition(self, value):
+        # type: (_Vector) -> None
+        if value is not self._position:
+            # In place operators give back the position itself
+            self._position = None if value is None else _tracked(value, self)
+
+        self._moved()
+
+    @property
+    def localPosition(self):
+        # type: () -> _Vector
+        """The object's local position. [x, y, z]"""
+
+        return self._position
+
+    @localPosition.setter
+    def localPosition(self, value):
+        # type: (_Vector) -> None
+        self.worldPosition = value
+
+    @property
+    def position(self):
+        # type: () -> _Vector
         """The object's position. [x, y, z] On write: local position, on read: world position."""
 
-        self.orientation = None  # type: _Matrix
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        # type: (_Vector) -> None
+        self.worldPosition = value
+
+    @property
+    def worldOrientation(self):
+        # type: () -> _Matrix
+        """The object's world orientation. 3x3 Matrix.
+
+        Note:
+            A copy of the orientation, assign it back to apply the changes made to it."""
+
+        return _Matrix.Identity(3) if self._orientation is None else self._orientation.copy()
+
+    @worldOrientation.setter
+    def worldOrientation(self, value):
+        # type: (_Matrix) -> None
+        self._orientation = _orientationMatrix(value)
+        scene = self.scene
+
+        if self._body is not None and scene is not None and not self.invalid:
+            scene._physics.setOrientation(self)
+
+        self._moved()
+
+    @property
+    def localOrientation(self):
+        # type: () -> _Matrix
+        """The object's local orientation. 3x3 Matrix. You can also write a Quaternion or Euler vector."""
+
+        return self.worldOrientation
+
+    @localOrientation.setter
+    def localOrientation(self, value):
+        # type: (_Matrix) -> None
+        self.worldOrientation = value
+
+    @property
+    def orientation(self):
+        # type: () -> _Matrix
         """The object's orientation. 3x3 Matrix. You can also write a Quaternion or Euler vector. On write: local orientation, on read: world orientation
 
         Warning:
             Deprecated. Use: localOrientation and worldOrientation."""
 
-        self.scaling = None  # type: _Vector
+        return self.worldOrientation
+
+    @orientation.setter
+    def orientation(self, value):
+        # type: (_Matrix) -> None
+        self.worldOrientation = value
+
+    @property
+    def worldScale(self):
+        # type: () -> _Vector
+        """The object's world scaling factor. [sx, sy, sz]"""
+
+        if self._scale is None:
+            # Stored once read so that the changes made in place to it are tracked
+            self._scale = _tracked((1.0, 1.0, 1.0), self)
+
+        return self._scale
+
+    @worldScale.setter
+    def worldScale(self, value):
+        # type: (_Vector) -> None
+        if value is not self._scale:
+            # In place operators give back the scale itself
+            self._scale = None if value is None else _tracked(value, self)
+
+        self._moved()
+
+    @property
+    def localScale(self):
+        # type: () -> _Vector
+        """The object's local scaling factor. [sx, sy, sz]"""
+
+        return self.worldScale
+
+    @localScale.setter
+    def localScale(self, value):
+        # type: (_Vector) -> None
+        self.worldScale = value
+
+    @property
+    def scaling(self):
+        # type: () -> _Vector
         """The object's scaling factor. [sx, sy, sz] On write: local scaling, on read: world scaling.
 
         Warning:
             Deprecated. Use: localScale and worldScale."""
 
-        self.localOrientation = None  # type: _Matrix
-        """The object's local orientation. 3x3 Matrix. You can also write a Quaternion or Euler vector."""
+        return self.worldScale
 
-        self.worldOrientation = None  # type: _Matrix
-        """The object's world orientation. 3x3 Matrix."""
+    @scaling.setter
+    def scaling(self, value):
+        # type: (_Vector) -> None
+        self.worldScale = value
 
-        self.localScale = None  # type: _Vector
-        """The object's local scaling factor. [sx, sy, sz]"""
+    @property
+    def worldTransform(self):
+        # type: () -> _Matrix
+        """The object's world space transform matrix. 4x4 Matrix."""
 
-        self.worldScale = None  # type: _Vector
-        """The object's world scaling factor. [sx, sy, sz]"""
+        orientation = self._orientation
+        rows = _IDENTITY_ROWS if orientation is None else orientation
+        sx, sy, sz = (1.0, 1.0, 1.0) if self._scale is None else self._scale._data[:3]
+        translation = (0.0, 0.0, 0.0) if self._position is None else self._position._data[:3]
+        return _Matrix([[row[0] * sx, row[1] * sy, row[2] * sz, t] for row, t in zip(rows, translation)] +
+                       [[0.0, 0.0, 0.0, 1.0]])
+
+    @worldTransform.setter
+    def worldTransform(self, value):
+        # type: (_Matrix) -> None
+        translation, rotation, scale = _Matrix(value).decompose()
+        self._scale = _tracked(scale, self)
+        self.worldOrientation = rotation
+        self.worldPosition = translation
+
+    @property
+    def localTransform(self):
+        # type: () -> _Matrix
+        """The object's local space transform matrix. 4x4 Matrix."""
 
-        self.localPosition = None  # type: _Vector
-        """The object's local position. [x, y, z]"""
+        return self.worldTransform
 
-        self.worldPosition = None  # type: _Vector
-        """The object's world position. [x, y, z]"""
+    @localTransform.setter
+    def localTransform(self, value):
+        # type: (_Matrix) -> None
+        self.worldTransform = value
 
-        self.localTransform = None  # type: _Matrix
-        """The object's local space transform matrix. 4x4 Matrix."""
+    def _moved(self):
+        # type: () -> None
+        """Mark the object as moved in the broadphase of its scene."""
 
-        self.worldTransform = None  # type: _Matrix
-        """The object's world space transform matrix. 4x4 Matrix."""
+        scene = self.scene
 
-        self.localLinearVelocity = None  # type: _Vector
-        """The object's local linear velocity. [x, y, z]"""
+        if scene is not None and not self.invalid:
+            scene._spatial.dirty[self] = None
 
-        self.worldLinearVelocity = None  # type: _Vector
-        """"The object's world linear velocity. [x, y, z]"""
+            if self._body is not None:
+                # The body reads its position again at the next physics step, once the change is done
+                scene._physics.moved[self] = None
 
-        self.localAngularVelocity = None  # type: _Vector
-        """The object's local angular velocity. [x, y, z]"""
+            elif _isStatic(self) and self not in scene._physics.attached:
+                scene._physics.staticDirty = True
 
-        self.worldAngularVelocity = None  # type: _Vector
-        """The object's world angular velocity. [x, y, z]"""
+    def _boundingSphere(self):
+        # type: () -> tuple[float, float, float, float] | None
+        """World bounding sphere (x, y, z, radius) used by the broadphase, None without a position."""
 
-        self.timeOffset = 0.0  # type: float
-        """Adjust the slowparent delay at runtime."""
+        position = self._position
 
-        self.state = 0  # type: int
-        """The game object's state bitmask, using the first 30 bits, one bit must always be set."""
+        if position is None:
+            return None
 
-        self.meshes = []  # type: list[KX_MeshProxy]
-        """A list meshes for this object."""
+        radius = self._radius
+        scale = self._scale
 
-        self.sensors = {}  # type: dict[str, SCA_ISensor]
-        """A sequence of SCA_ISensor objects with string/index lookups and iterator support."""
+        if scale is not None:
+            radius *= max(abs(scale[0]), abs(scale[1]), abs(scale[2]))
 
-        self.controllers = {}  # type: dict[str, SCA_IController]
-        """A sequence of SCA_IController objects with string/index lookups and iterator support."""
+        x, y, z = position._data[:3]
+        return x, y, z, radius
 
-        self.actuators = {}  # type: dict[str, SCA_IActuator]
-        """A list of SCA_IActuator with string/index lookups and iterator support."""
+    def _collide(self, other, point, normal):
+        # type: (KX_GameObject, _Vector, _Vector) -> None
+        """Report a collision with another object found by the physics: call the collision callbacks and wake the touch sensors."""
 
-        self.attrDict = {}  # type: dict[str, object]
-        """Get the objects internal python attribute dictionary for direct (faster) access."""
+        scene = self.scene
+        self._contacts[other] = (scene._frame if scene is not None else 0, point, normal)
 
-        self.life = 0.0  # type: float
+        for callback in list(self.collisionCallbacks):
+            if _fixedArguments(callback) > 1:
+                callback(other, point, normal)
+
+            else:
+                callback(other)
+
+        for sensor in self.sensors._items:
+            if isinstance(sensor, KX_TouchSensor):
+                sensor._wake()
+
+    def _linkSensors(self):
+        # type: () -> None
+        """Register the sensors of the object to their change sources and its controllers to the sensors triggering them, once added to its scene."""
+
+        for controller in self.controllers._items:
+            for sensor in controller.sensors._items:
+                if controller not in sensor._controllers:
+                    sensor._controllers.append(controller)
+
+        for sensor in self.sensors._items:
+            sensor._subscribe()
+            sensor._schedule()
+
+    def _unlinkSensors(self):
+        # type: () -> None
+        """Undo _linkSensors() when the object is removed from its scene."""
+
+        scene = self.scene
+
+        for controller in self.controllers._items:
+            for sensor in controller.sensors._items:
+                if controller in sensor._controllers:
+                    sensor._controllers.remove(controller)
+
+        for sensor in self.sensors._items:
+            sensor._unsubscribe()
+
+            if scene is not None:
+                scene._polledSensors.pop(sensor, None)
+                scene._wokenSensors.pop(sensor, None)
+
+    @property
+    def life(self):
+        # type: () -> float
         """The number of seconds until the object ends, assumes 50fps. (when added with an add object actuator), (read-only)."""
 
-        self.debug = True  # type: bool
-        """If true, the object's debug properties will be displayed on screen."""
+        if not self._expiry or self.scene is None:
+            return 0.0
 
-        self.debugRecursive = True  # type: bool
-        """If true, the object's and children's debug properties will be displayed on screen."""
+        return (self._expiry - self.scene._frame) / 50.0
 
-        self.currentLodLevel = 0  # type: int
-        """The index of the level of detail (LOD) currently used by this object (read-only)."""
+    def _replicate(self, replica=None):
+        # type: (KX_GameObject) -> KX_GameObject
+        """Copy of this object with its own properties, transform, logic bricks and components, like KX_Scene::AddReplicaObject.
+
+        Args:
+            replica (KX_GameObject): An ended replica of this object to recycle instead of creating a new one (optional)."""
+
+        if replica is not None and self._sameBricks(replica):
+            # Reuse the bricks of the recycled replica, their links already point to each other
+            bricks = (replica.sensors, replica.controllers, replica.actuators, replica.components)
+            properties = replica._customAttributes
+            spawn = replica._spawn
+            vars(replica).update(vars(self))
+            properties.clear()
+            properties.update(self._customAttributes)
+            replica._customAttributes = properties
+            replica._spawn = spawn
+            replica.sensors, replica.controllers, replica.actuators, replica.components = bricks
+
+            for recycled, brick in zip(bricks[1]._items, self.controllers._items):
+                links = recycled.sensors, recycled.actuators
+                vars(recycled).update(vars(brick))
+                recycled.sensors, recycled.actuators = links
+                _ownAttributes(recycled, brick)
+
+            for index in (0, 2, 3):
+                for recycled, brick in zip(bricks[index]._items, getattr(self, _BRICK_LISTS[index])._items):
+                    vars(recycled).update(vars(brick))
+                    _ownAttributes(recycled, brick)
+
+        else:
+            replica = _copy.copy(self)
+            replica._customAttributes = dict(self._customAttributes)
+            copies = {}
+
+            for name in _BRICK_LISTS:
+                bricks = CListValue()
+
+                for brick in getattr(self, name)._items:
+                    copy = copies[id(brick)] = _copy.copy(brick)
+                    _ownAttributes(copy, brick)
+                    bricks.append(copy)
+
+                setattr(replica, name, bricks)
+
+            for controller in replica.controllers._items:
+                controller.sensors = CListValue([copies.get(id(sensor), sensor) for sensor in controller.sensors._items])
+                controller.actuators = CListValue([copies.get(id(actuator), actuator) for actuator in controller.actuators._items])
+
+        replica.scene = None
+        replica.invalid = False
+
+        for name, stored in _TRANSFORM_ATTRIBUTES:
+            value = getattr(self, stored)
+
+            if value is not None:
+                setattr(replica, name, value.copy())
+
+        replica._body = None
+        replica._limits = list(self._limits)
+        replica._linearVelocity = list(self.getLinearVelocity())
+        replica._angularVelocity = list(self.getAngularVelocity())
+        replica.color = list(self.color)
+        replica.meshes = list(self.meshes)
+        replica.collisionCallbacks = []
+        replica.parent = None
+        replica._watchers = {}
+        replica._contacts = {}
+        replica._actions = {}
+
+        for controller in replica.controllers._items:
+            controller.owner = replica
+
+        for sensor in replica.sensors._items:
+            sensor.owner = replica
+            sensor._controllers = []
+            sensor.reset()
+
+        for actuator in replica.actuators._items:
+            actuator.owner = replica
+            actuator._events = []
+
+        for component in replica.components._items:
+            component.object = replica
+            component.args = dict(component.args)
+            component._started = False
+
+        return replica
+
+    def _sameBricks(self, other):
+        # type: (KX_GameObject) -> bool
+        """True if the other object has logic bricks and components of the same types, in the same order."""
+
+        for name in _BRICK_LISTS:
+            mine = getattr(self, name)._items
+            theirs = getattr(other, name)._items
+
+            if len(mine) != len(theirs):
+                return False
+
+            for brick, recycled in zip(mine, theirs):
+                if type(brick) is not type(recycled):
+                    return False
+
+        return True
 
     def endObject(self):
         # type: () -> None
@@ -335,7 +1190,8 @@ class KX_GameObject(SCA_IObject):
 
         The actual removal of the object from the scene is delayed."""
 
-        pass
+        if self.scene is not None:
+            self.scene._endObject(self)
 
     def replaceMesh(self, mesh, useDisplayMesh=True, usePhysicsMesh=False):
         # type: (KX_MeshProxy | str, bool, bool) -> None
@@ -420,7 +1276,8 @@ class KX_GameObject(SCA_IObject):
             force (3D Vector): force vector.
             local (boolean): if False you get the "global" force (relative to world orientation), if True you get the "local" force (relative to object orientation)."""
 
-        pass
+        if self._body is not None:
+            self.scene._physics.applyForce(self, _rotate(self._orientation, force) if local else force)
 
     def applyTorque(self, torque, local=False):
         # type: (_Vector, bool) -> None
@@ -432,7 +1289,8 @@ class KX_GameObject(SCA_IObject):
             torque (3D Vector): torque vector.
             local (boolean): if False you get the "global" torque (relative to world orientation), if True you get the "local" torque (relative to object orientation)."""
 
-        pass
+        if self._body is not None:
+            self.scene._physics.applyForce(self, _rotate(self._orientation, torque) if local else torque, True)
 
     def getLinearVelocity(self, local=False):
         # type: (bool) -> _Vector
@@ -446,7 +1304,8 @@ class KX_GameObject(SCA_IObject):
         Returns:
             Vector: The object's linear velocity."""
 
-        pass
+        velocity = self._linearVelocity if self._body is None else self.scene._physics.velocity(self)
+        return _Vector(_rotate(self._orientation, velocity, True) if local else velocity)
 
     def setLinearVelocity(self, velocity, local=False):
         # type: (_Vector, bool) -> None
@@ -460,7 +1319,13 @@ class KX_GameObject(SCA_IObject):
             velocity (3D Vector): linear velocity vector.
             local (boolean): if False you get the "global" velocity (relative to world orientation), if True you get the "local" velocity (relative to object orientation)."""
 
-        pass
+        velocity = _rotate(self._orientation, velocity) if local else [float(value) for value in velocity[:3]]
+
+        if self._body is None:
+            self._linearVelocity = velocity
+
+        else:
+            self.scene._physics.setVelocity(self, velocity)
 
     def getAngularVelocity(self, local=False):
         # type: (bool) -> _Vector
@@ -472,7 +1337,8 @@ class KX_GameObject(SCA_IObject):
         Returns:
             Vector: The object's angular velocity."""
 
-        pass
+        velocity = self._angularVelocity if self._body is None else self.scene._physics.velocity(self, True)
+        return _Vector(_rotate(self._orientation, velocity, True) if local else velocity)
 
     def setAngularVelocity(self, velocity, local=False):
         # type: (_Vector, bool) -> None
@@ -484,7 +1350,13 @@ class KX_GameObject(SCA_IObject):
             velocity (boolean): angular velocity vector.
             local (boolean): if False you get the "global" velocity (relative to world orientation), if True you get the "local" velocity (relative to object orientation)."""
 
-        pass
+        velocity = _rotate(self._orientation, velocity) if local else [float(value) for value in velocity[:3]]
+
+        if self._body is None:
+            self._angularVelocity = velocity
+
+        else:
+            self.scene._physics.setVelocity(self, velocity, True)
 
     def getVelocity(self, point=(0,0,0)):
         # type: (_Vector) -> _Vector
@@ -498,7 +1370,10 @@ class KX_GameObject(SCA_IObject):
         Returns:
             Vector: The velocity at the specified point."""
 
-        pass
+        vx, vy, vz = self.getLinearVelocity()
+        wx, wy, wz = self.getAngularVelocity()
+        rx, ry, rz = _rotate(self._orientation, point)
+        return _Vector((vx + wy * rz - wz * ry, vy + wz * rx - wx * rz, vz + wx * ry - wy * rx))
 
     def getReactionForce(self):
         # type: () -> _Vector
@@ -512,7 +1387,7 @@ class KX_GameObject(SCA_IObject):
         Note:
             This is not implimented at the moment."""
 
-        pass
+        return _Vector((0.0, 0.0, 0.0))
 
     def applyImpulse(self, point, impulse, local=False):
         # type: (_Vector, _Vector, bool) -> None
@@ -525,7 +1400,18 @@ class KX_GameObject(SCA_IObject):
             impulse (3D Vector): impulse vector.
             local (boolean): if False you get the "global" impulse (relative to world coordinates with world orientation), if True you get the "local" impulse (relative to local coordinates with object orientation)."""
 
-        pass
+        if self._body is None:
+            return
+
+        if local:
+            orientation = self._orientation
+            offset = _rotate(orientation, point)
+            point = [p + o for p, o in zip(self._position._data, offset)]
+            impulse = _rotate(orientation, impulse)
+
+        point = [float(value) for value in point[:3]]
+        impulse = [float(value) for value in impulse[:3]]
+        self.scene._physics.applyImpulse(self, point, impulse)
 
     def setDamping(self, linear_damping, angular_damping):
         # type: (float, float) -> None
@@ -535,7 +1421,11 @@ class KX_GameObject(SCA_IObject):
             linear_damping (float ? [0, 1]): Linear ("translational") damping factor.
             angular_damping (float ? [0, 1]): Angular ("rotational") damping factor."""
 
-        pass
+        self._linearDamping = min(max(float(linear_damping), 0.0), 1.0)
+        self._angularDamping = min(max(float(angular_damping), 0.0), 1.0)
+
+        if self._body is not None:
+            self.scene._physics.setDamping(self)
 
     def suspendPhysics(self, freeConstraints=False):
         # type: (bool) -> None
@@ -561,7 +1451,10 @@ class KX_GameObject(SCA_IObject):
 
         Note:
             See also isSuspendDynamics allows you to inspect whether the object is in a suspended state."""
-        pass
+
+        self._suspended = True
+        self._ghost = bool(ghost)
+        self._updateBody()
 
     def restoreDynamics(self):
         # type: () -> None
@@ -570,7 +1463,9 @@ class KX_GameObject(SCA_IObject):
         Note:
             The objects linear velocity will be applied from when the dynamics were suspended."""
 
-        pass
+        self._suspended = False
+        self._ghost = False
+        self._updateBody()
 
     def enableRigidBody(self):
         # type: () -> None
@@ -578,13 +1473,13 @@ class KX_GameObject(SCA_IObject):
 
         Rigid body physics allows the object to roll on collisions."""
 
-        pass
+        self._rigidBody = True
 
     def disableRigidBody(self):
         # type: () -> None
         """Disables rigid body physics for this object."""
 
-        pass
+        self._rigidBody = False
 
     def setParent(self, parent, compound=True, ghost=True):
         # type: (KX_GameObject, bool, bool) -> None
@@ -612,7 +1507,12 @@ class KX_GameObject(SCA_IObject):
         # type: () -> int
         """Returns the user data object associated with this game object's physics controller."""
 
-        pass
+        scene = self.scene
+
+        if scene is None or self.invalid:
+            return 0
+
+        return scene._physics.physicsId(self)
 
     def getPropertyNames(self):
         # type: () -> list[str]
@@ -621,7 +1521,7 @@ class KX_GameObject(SCA_IObject):
         Returns:
             list: All property names for this object."""
 
-        pass
+        return list(self._customAttributes)
 
     def getDistanceTo(self, other):
         # type: (KX_GameObject | _Vector) -> float
@@ -633,7 +1533,9 @@ class KX_GameObject(SCA_IObject):
         Returns:
             float: distance to another object or point."""
 
-        pass
+        x, y, z = self._position._data[:3]
+        ox, oy, oz = _location(other)
+        return _sqrt((ox - x) ** 2 + (oy - y) ** 2 + (oz - z) ** 2)
 
     def getVectTo(self, other):
         # type: (KX_GameObject | _Vector) -> tuple[float, _Vector, _Vector]
@@ -645,7 +1547,24 @@ class KX_GameObject(SCA_IObject):
         Returns:
             tuple: (distance, globalVector(3), localVector(3)) as 3-tuple (float, 3-tuple (x, y, z), 3-tuple (x, y, z))"""
 
-        pass
+        x, y, z = self._position._data[:3]
+        ox, oy, oz = _location(other)
+        vector = [ox - x, oy - y, oz - z]
+        distance = _sqrt(vector[0] ** 2 + vector[1] ** 2 + vector[2] ** 2)
+
+        if distance:
+            vector = [v / distance for v in vector]
+
+        orientation = self._orientation
+
+        if orientation is None:
+            local = list(vector)
+
+        else:
+            # The transpose of the orientation brings world vectors in local space
+            local = [sum(orientation[row][column] * vector[row] for row in range(3)) for column in range(3)]
+
+        return distance, _Vector(vector), _Vector(local)
 
     def rayCastTo(self, other, dist=0.0, prop=""):
         # type: (KX_GameObject | _Vector, float, str) -> KX_GameObject
@@ -661,7 +1580,7 @@ class KX_GameObject(SCA_IObject):
         Returns:
             KX_GameObject: the first object hit or None if no object or object does not match prop"""
 
-        pass
+        return self.rayCast(other, None, dist, prop)[0]
 
     def rayCast(self, objto, objfrom=None, dist=0, prop="", face=False, xray=False, poly=0, mask=0xFFFF):
         # type: (KX_GameObject | _Vector, _Vector, float, str, bool, bool, int, int) -> tuple[KX_GameObject, _Vector, _Vector, KX_PolyProxy, _Vector]
@@ -685,7 +1604,42 @@ class KX_GameObject(SCA_IObject):
         Note:
             The ray ignores the object on which the method is called. It is casted from/to object center or explicit [x, y, z] points."""
 
-        pass
+        miss = (None, None, None, None, None)[:3 + (poly if poly in (1, 2) else 0)]
+        scene = self.scene
+
+        if scene is None or self.invalid:
+            return miss
+
+        origin = self._position._data[:3] if objfrom is None else _location(objfrom)
+        target = _location(objto)
+        direction = [target[0] - origin[0], target[1] - origin[1], target[2] - origin[2]]
+        length = _sqrt(direction[0] ** 2 + direction[1] ** 2 + direction[2] ** 2)
+
+        if not length:
+            return miss
+
+        direction = [v / length for v in direction]
+
+        if dist < 0.0:
+            direction = [-v for v in direction]
+            length = -dist
+
+        elif dist > 0.0:
+            length = dist
+
+        def accept(object):
+            return object is not self and object.collisionGroup & mask and (not xray or not prop or prop in object)
+
+        hit, distance = scene._spatial.rayCast(origin, direction, length, accept)
+
+        if hit is None or prop and prop not in hit:
+            return miss
+
+        point = [o + d * distance for o, d in zip(origin, direction)]
+        x, y, z, radius = scene._spatial.spheres[hit]
+        normal = _Vector((point[0] - x, point[1] - y, point[2] - z))
+        normal.normalize()
+        return (hit, _Vector(point), normal, None, None)[:len(miss)]
 
     def setCollisionMargin(self, margin):
         # type: (float) -> None
@@ -750,9 +1704,9 @@ class KX_GameObject(SCA_IObject):
         Returns:
             The key value or a default."""
 
-        pass
+        return self._customAttributes.get(key, default)
 
-    def playAction(self, name, start_frame, end_frame, layer=0, priority=0, blendin=0, play_mode=1, layer_weight=0.0, ipo_flags=0, speed=1.0, blend_mode=1):
+    def playAction(self, name, start_frame, end_frame, layer=0, priority=0, blendin=0, play_mode=0, layer_weight=0.0, ipo_flags=0, speed=1.0, blend_mode=1):
         # type: (str, float, float, int, int, float, int, float, int, float, int) -> None
         """Plays an action.
 
@@ -769,7 +1723,16 @@ class KX_GameObject(SCA_IObject):
             speed (float): the playback speed of the action as a factor (1.0 = normal speed, 2.0 = 2x speed, etc)
             blend_mode (one of these constants): how to blend this layer with previous layers"""
 
-        pass
+        layer = self._actionLayer(layer, "playAction")
+        playing = self._actions.get(layer)
+
+        if playing is not None and playing.priority < priority:
+            return
+
+        self._actions[layer] = _ActionLayer(name, start_frame, end_frame, play_mode, speed, priority)
+
+        if self.scene is not None:
+            self.scene._animated[self] = None
 
     def stopAction(self, layer=0):
         # type: (int) -> None
@@ -778,7 +1741,7 @@ class KX_GameObject(SCA_IObject):
         Args:
             layer (integer): The layer to stop playing."""
 
-        pass
+        self._actions.pop(self._actionLayer(layer, "stopAction"), None)
 
     def getActionFrame(self, layer=0):
         # type: (int) -> float
@@ -790,7 +1753,8 @@ class KX_GameObject(SCA_IObject):
         Returns:
             float: The current frame of the action"""
 
-        pass
+        action = self._actions.get(self._actionLayer(layer, "getActionFrame"))
+        return action.frame if action is not None else 0.0
 
     def getActionName(self, layer=0):
         # type: (int) -> str
@@ -802,7 +1766,8 @@ class KX_GameObject(SCA_IObject):
         Returns:
             str: The name of the current action"""
 
-        pass
+        action = self._actions.get(self._actionLayer(layer, "getActionName"))
+        return action.name if action is not None else ""
 
     def setActionFrame(self, frame, layer=0):
         # type: (float, int) -> None
@@ -812,7 +1777,10 @@ class KX_GameObject(SCA_IObject):
             layer (integer): The layer where you want to set the frame
             frame (float): The frame to set the action to"""
 
-        pass
+        action = self._actions.get(self._actionLayer(layer, "setActionFrame"))
+
+        if action is not None:
+            action.frame = float(frame)
 
     def isPlayingAction(self, layer=0):
         # type: (int) -> bool
@@ -824,7 +1792,16 @@ class KX_GameObject(SCA_IObject):
         Returns:
             bool: Whether or not the action is playing"""
 
-        pass
+        return self._actionLayer(layer, "isPlayingAction") in self._actions
+
+    @staticmethod
+    def _actionLayer(layer, name):
+        # type: (int, str) -> int
+        if not 0 <= layer < _MAX_ACTION_LAYERS:
+            raise ValueError("KX_GameObject.%s(): given layer (%d) is out of range (0 - %d)" % (name, layer,
+                             _MAX_ACTION_LAYERS - 1))
+
+        return layer
 
     def addDebugProperty(self, name, debug=True):
         # type: (str, bool) -> None
@@ -857,15 +1834,15 @@ class SCA_ILogicBrick(CValue):
 class SCA_ISensor(SCA_ILogicBrick):
     """Base class for all sensor logic bricks."""
 
+    _polled = True  # type: bool
+    """Evaluated at every logic frame. The sensors with change sources are only evaluated when woken by them, see _wake()."""
+
     def __init__(self):
         # type: () -> None
         super().__init__()
 
-        self.usePosPulseMode = True  # type: bool
-        """Flag to turn positive pulse mode on and off."""
-
-        self.useNegPulseMode = True  # type: bool
-        """Flag to turn negative pulse mode on and off."""
+        self._posPulse = False  # type: bool
+        self._negPulse = False  # type: bool
 
         self.frequency = 0  # type: int
         """The frequency for pulse mode sensors.
@@ -876,25 +1853,25 @@ class SCA_ISensor(SCA_ILogicBrick):
         self.skippedTicks = 0  # type: int
         """Number of logic ticks skipped between 2 active pulses."""
 
-        self.level = True  # type: bool
+        self.level = False  # type: bool
         """Whether to detect level or edge transition when entering a state. It makes a difference only in case of logic state transition (state actuator). A level detector will immediately generate a pulse, negative or positive depending on the sensor condition, as soon as the state is activated. A edge detector will wait for a state change before generating a pulse.
 
         Note:
             Mutually exclusive with tap, enabling will disable tap."""
 
-        self.tap = True  # type: bool
+        self.tap = False  # type: bool
         """When enabled only sensors that are just activated will send a positive event, after this they will be detected as negative by the controllers. This will make a key thats held act as if its only tapped for an instant.
 
         Note:
             Mutually exclusive with level, enabling will disable level."""
 
-        self.invert = True  # type: bool
+        self.invert = False  # type: bool
         """Flag to set if this sensor activates on positive or negative events."""
 
-        self.triggered = True  # type: bool
+        self.triggered = False  # type: bool
         """True if this sensor brick is in a positive state. (read-only)."""
 
-        self.positive = True  # type: bool
+        self.positive = False  # type: bool
         """True if this sensor brick is in a positive state. (read-only)."""
 
         self.pos_ticks = 0  # type: int
@@ -906,19 +1883,190 @@ class SCA_ISensor(SCA_ILogicBrick):
         self.status = 0  # type: int
         """The status of the sensor (read-only)."""
 
+        self._frame = -1  # type: int
+        self._controllers = []  # type: list[SCA_IController]
+        """Controllers linked to this sensor, kept up to date by the runtime as objects are added and removed."""
+
+    @property
+    def usePosPulseMode(self):
+        # type: () -> bool
+        """Flag to turn positive pulse mode on and off."""
+
+        return self._posPulse
+
+    @usePosPulseMode.setter
+    def usePosPulseMode(self, value):
+        # type: (bool) -> None
+        self._posPulse = bool(value)
+        self._schedule()
+
+    @property
+    def useNegPulseMode(self):
+        # type: () -> bool
+        """Flag to turn negative pulse mode on and off."""
+
+        return self._negPulse
+
+    @useNegPulseMode.setter
+    def useNegPulseMode(self, value):
+        # type: (bool) -> None
+        self._negPulse = bool(value)
+        self._schedule()
+
     def reset(self):
         # type: () -> None
         """Reset sensor internal state, effect depends on the type of sensor and settings.
 
         The sensor is put in its initial state as if it was just activated."""
 
+        self.triggered = self.positive = False
+        self.pos_ticks = self.neg_ticks = 0
+        self.status = 0
+        self._frame = -1
+        self._wake()
+
+    def _scene(self):
+        # type: () -> KX_Scene | None
+        """Scene running the sensor, None if its owner is not in a running scene."""
+
+        owner = self.owner
+        scene = owner.scene if owner is not None else None
+
+        if scene is None or scene.invalid or owner.invalid:
+            return None
+
+        return scene
+
+    def _wake(self):
+        # type: () -> None
+        """Evaluate the sensor in the next sensor pass of its scene, called by its change sources."""
+
+        scene = self._scene()
+
+        if scene is not None:
+            scene._wokenSensors[self] = None
+
+    def _schedule(self):
+        # type: () -> None
+        """Evaluate the sensor at every logic frame or only when woken, depending on its type and pulse modes."""
+
+        scene = self._scene()
+
+        if scene is None:
+            return
+
+        if self._polled or self._posPulse or self._negPulse:
+            scene._polledSensors[self] = None
+
+        else:
+            scene._polledSensors.pop(self, None)
+            scene._wokenSensors[self] = None
+
+    def _subscribe(self):
+        # type: () -> None
+        """Register the sensor to its change sources, called when its owner is added to a scene."""
+
+        pass
+
+    def _unsubscribe(self):
+        # type: () -> None
+        """Unregister the sensor from its change sources, called when its owner is removed from its scene."""
+
         pass
 
+    def _pending(self):
+        # type: () -> bool
+        """True if the sensor must be evaluated again at the next logic frame even if its inputs don't change.
+
+        A sensor that triggered is evaluated once more to send the negative pulse of tap mode and update its status."""
+
+        return self.triggered
+
+    def _evaluate(self):
+        # type: () -> bool
+        """Update the sensor condition for this logic frame, True if it changed and an event must be sent."""
+
+        return False
+
+    def _condition(self):
+        # type: () -> bool
+        """Current sensor condition, before inversion."""
+
+        return False
+
+    def _activate(self):
+        # type: () -> bool
+        """Evaluate the sensor and apply the pulse, tap and invert settings like SCA_ISensor::Activate.
+
+        Returns:
+            bool: True if the linked controllers must be triggered."""
+
+        result = self._evaluate()
+        previous = self.positive
+        positive = self._condition() != self.invert
+
+        if result:
+            if positive or not self.tap:
+                # Pulses are synchronized with the transitions
+                self.pos_ticks = self.neg_ticks = 0
+
+            else:
+                result = False
+
+        else:
+            if self._posPulse:
+                self.pos_ticks += 1
+
+                if self.pos_ticks > self.skippedTicks:
+                    result = result or positive
+                    self.pos_ticks = 0
+
+            if self._negPulse and not self.tap:
+                self.neg_ticks += 1
+
+                if self.neg_ticks > self.skippedTicks:
+                    result = result or not positive
+                    self.neg_ticks = 0
+
+        if self.tap and not result:
+            # A positive pulse is always followed by a negative one in tap mode
+            result = previous
+            positive = False
+
+        self.positive = positive
+        self.triggered = result
+        self.status = (2 if previous else 1) if positive else (3 if previous else 0)
+        return result
+
 
 class SCA_IActuator(SCA_ILogicBrick):
     """Base class for all actuator logic bricks."""
 
-    pass
+    def __init__(self):
+        # type: () -> None
+        super().__init__()
+
+        self._events = []  # type: list[bool]
+
+    def _event(self, positive):
+        # type: (bool) -> None
+        """Queue a positive or negative event sent by a controller, the actuator is updated in this logic frame."""
+
+        self._events.append(positive)
+        scene = self.owner.scene if self.owner is not None else None
+
+        if scene is not None:
+            scene._activeActuators[self] = None
+
+    def _update(self):
+        # type: () -> bool
+        """Process the queued events.
+
+        Returns:
+            bool: True if the actuator stays active and must be updated again in the next logic frame."""
+
+        del self._events[:]
+        return False
 
 
 class SCA_IController(SCA_ILogicBrick):
@@ -929,28 +2077,46 @@ class SCA_IController(SCA_ILogicBrick):
         # type: () -> None
         super().__init__()
 
-        self.state = 0  # type: int
+        self.state = 1  # type: int
         """The controllers state bitmask. This can be used with the GameObject's state to test if the controller is active."""
 
-        self.sensors = {}  # type: dict[str, SCA_ISensor]
+        self.sensors = CListValue()  # type: CListValue[SCA_ISensor]
         """A list of sensors linked to this controller.
 
         Notes:
             - The sensors are not necessarily owned by the same object.
             - When objects are instanced in dupligroups links may be lost from objects outside the dupligroup."""
 
-        self.actuators = {}  # type: dict[str, SCA_IActuator]
+        self.actuators = CListValue()  # type: CListValue[SCA_IActuator]
         """A list of actuators linked to this controller.
 
         Notes:
             - The sensors are not necessarily owned by the same object.
             - When objects are instanced in dupligroups links may be lost from objects outside the dupligroup."""
 
-        self.useHighPriority = True  # type: bool
-        """When set the controller executes always before all other controllers that dont have this set.
+        self.useHighPriority = False  # type: bool
+        """When set the controller executes always before all other controllers that dont have this set.
+
+        Note:
+            Order of execution between high priority controllers is not guaranteed."""
+
+    def _trigger(self):
+        # type: () -> None
+        """Execute the controller, called when one of its linked sensors triggered."""
+
+        if self._combine([sensor.positive for sensor in self.sensors]):
+            for actuator in self.actuators:
+                actuator._event(True)
+
+        else:
+            for actuator in self.actuators:
+                actuator._event(False)
 
-        Note:
-            Order of execution between high priority controllers is not guaranteed."""
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        """Output of a logic gate controller for the sensor states."""
+
+        return False
 
 
 class SCA_2DFilterActuator(SCA_IActuator):
@@ -985,7 +2151,9 @@ class SCA_ANDController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return all(inputs)
 
 
 class SCA_ActuatorSensor(SCA_ISensor):
@@ -1002,7 +2170,30 @@ class SCA_ActuatorSensor(SCA_ISensor):
 class SCA_AlwaysSensor(SCA_ISensor):
     """This sensor is always activated."""
 
-    pass
+    _polled = False
+
+    def __init__(self):
+        # type: () -> None
+        super().__init__()
+
+        self._alwaysResult = True  # type: bool
+
+    def reset(self):
+        # type: () -> None
+        super().reset()
+
+        self._alwaysResult = True
+
+    def _evaluate(self):
+        # type: () -> bool
+        # Only the first evaluation sends an event, pulse mode repeats it
+        result = self._alwaysResult
+        self._alwaysResult = False
+        return result
+
+    def _condition(self):
+        # type: () -> bool
+        return True
 
 
 class SCA_DelaySensor(SCA_ISensor):
@@ -1014,6 +2205,8 @@ class SCA_DelaySensor(SCA_ISensor):
 
     Use SCA_ISensor.reset at any time to restart sensor."""
 
+    _polled = False
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -1029,6 +2222,52 @@ class SCA_DelaySensor(SCA_ISensor):
         self.repeat = 0  # type: int
         """1 if the OFF-ON cycle should be repeated indefinately, 0 if it should run once."""
 
+        self._start = -1  # type: int
+        """Scene frame of the first evaluation since the last reset."""
+
+        self._lastResult = False  # type: bool
+
+    def reset(self):
+        # type: () -> None
+        self._start = -1
+        self._lastResult = False
+        super().reset()
+
+    def _evaluate(self):
+        # type: () -> bool
+        # The OFF-ON cycle is computed from the frame number, the sensor is only woken at its ends
+        scene = self.owner.scene
+        frame = scene._frame
+
+        if self._start == -1:
+            self._start = frame
+
+        elapsed = frame - self._start
+        delay, duration = self.delay, self.duration
+
+        if self.repeat:
+            period = delay + duration + 1 if duration > 0 else delay + 1
+            elapsed %= period
+            result = delay <= elapsed < delay + duration if duration > 0 else elapsed == delay
+            ends = (delay, delay + duration, period)
+
+        else:
+            result = delay <= elapsed < delay + duration if duration > 0 else elapsed >= delay
+            ends = (delay, delay + duration)
+
+        later = [end for end in ends if end > elapsed]
+
+        if later:
+            scene._sensorTimers.schedule(frame + min(later) - elapsed, self)
+
+        changed = result != self._lastResult
+        self._lastResult = result
+        return changed
+
+    def _condition(self):
+        # type: () -> bool
+        return self._lastResult
+
 
 class SCA_InputEvent(PyObjectPlus):
     """Events for a keyboard or mouse input."""
@@ -1181,6 +2420,8 @@ class SCA_KeyboardSensor(SCA_ISensor):
 
     See module bge.events for keycode values."""
 
+    _polled = False
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -1212,6 +2453,44 @@ class SCA_KeyboardSensor(SCA_ISensor):
         Note:
             Deprecated since version use: inputs"""
 
+        self._lastResult = False  # type: bool
+
+    def reset(self):
+        # type: () -> None
+        self._lastResult = False
+        super().reset()
+
+    def _subscribe(self):
+        # type: () -> None
+        _keyboard._sensors[self] = None
+
+    def _unsubscribe(self):
+        # type: () -> None
+        _keyboard._sensors.pop(self, None)
+
+    def _evaluate(self):
+        # type: () -> bool
+        events = _keyboard.active_events
+        self.events = events
+
+        if self.useAllKeys:
+            result = bool(events)
+            # Any other key pressed while keys are held sends a new event
+            changed = result != self._lastResult or _INPUT_JUST_ACTIVATED in events.values()
+
+        else:
+            result = all(events.get(key, _INPUT_NONE) in (_INPUT_JUST_ACTIVATED, _INPUT_ACTIVE)
+                         for key in (self.key, self.hold1, self.hold2) if key)
+            result = result and bool(self.key)
+            changed = result != self._lastResult
+
+        self._lastResult = result
+        return changed
+
+    def _condition(self):
+        # type: () -> bool
+        return self._lastResult
+
     def getKeyStatus(self, keycode):
         # type: (int) -> int
         """Get the status of a key.
@@ -1222,12 +2501,14 @@ class SCA_KeyboardSensor(SCA_ISensor):
         Returns:
             int: The state of the given key, can be one of these constants: bge.logic.KX_INPUT_NONE, bge.logic.KX_INPUT_JUST_ACTIVATED, bge.logic.KX_INPUT_ACTIVE, bge.logic.KX_INPUT_JUST_RELEASED."""
 
-        pass
+        return _keyboard.events.get(keycode, _INPUT_NONE)
 
 
 class SCA_MouseSensor(SCA_ISensor):
     """Mouse Sensor logic brick."""
 
+    _polled = False
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -1245,6 +2526,46 @@ class SCA_MouseSensor(SCA_ISensor):
         - KX_MOUSESENSORMODE_WHEELDOWN = 5
         - KX_MOUSESENSORMODE_MOVEMENT = 6"""
 
+        self._lastResult = False  # type: bool
+
+    def reset(self):
+        # type: () -> None
+        self._lastResult = False
+        super().reset()
+
+    def _subscribe(self):
+        # type: () -> None
+        _mouse._sensors[self] = None
+
+    def _unsubscribe(self):
+        # type: () -> None
+        _mouse._sensors.pop(self, None)
+
+    def _evaluate(self):
+        # type: () -> bool
+        events = _mouse.events
+        mode = self.mode
+
+        if 1 <= mode <= 3:
+            result = events.get((_LEFTMOUSE, _MIDDLEMOUSE, _RIGHTMOUSE)[mode - 1]) in (_INPUT_JUST_ACTIVATED, _INPUT_ACTIVE)
+
+        elif mode == 4 or mode == 5:
+            result = events.get(_WHEELUPMOUSE if mode == 4 else _WHEELDOWNMOUSE) == _INPUT_JUST_ACTIVATED
+
+        elif mode == 6:
+            result = _INPUT_JUST_ACTIVATED in (events.get(_MOUSEX), events.get(_MOUSEY))
+
+        else:
+            result = False
+
+        changed = result != self._lastResult
+        self._lastResult = result
+        return changed
+
+    def _condition(self):
+        # type: () -> bool
+        return self._lastResult
+
     def getButtonStatus(self, button):
         # type: (int) -> int
         """Get the mouse button status.
@@ -1255,7 +2576,7 @@ class SCA_MouseSensor(SCA_ISensor):
         Returns:
             int: The state of the given key, can be one of these constants: bge.logic.KX_INPUT_NONE, bge.logic.KX_INPUT_JUST_ACTIVATED, bge.logic.KX_INPUT_ACTIVE, bge.logic.KX_INPUT_JUST_RELEASED."""
 
-        pass
+        return _mouse.events.get(button, _INPUT_NONE)
 
 
 class SCA_NANDController(SCA_IController):
@@ -1263,7 +2584,9 @@ class SCA_NANDController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return not all(inputs)
 
 
 class SCA_NORController(SCA_IController):
@@ -1271,7 +2594,9 @@ class SCA_NORController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return not any(inputs)
 
 
 class SCA_ORController(SCA_IController):
@@ -1279,7 +2604,9 @@ class SCA_ORController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return any(inputs)
 
 
 class SCA_PropertyActuator(SCA_IActuator):
@@ -1301,6 +2628,8 @@ class SCA_PropertyActuator(SCA_IActuator):
 class SCA_PropertySensor(SCA_ISensor):
     """Activates when the game object property matches."""
 
+    _polled = False
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -1308,8 +2637,7 @@ class SCA_PropertySensor(SCA_ISensor):
         self.mode = 0  # type: int
         """Type of check on the property."""
 
-        self.propName = ""  # type: str
-        """The property the sensor operates."""
+        self._propName = ""  # type: str
 
         self.value = ""  # type: str
         """The value with which the sensor compares to the value of the property."""
@@ -1320,6 +2648,87 @@ class SCA_PropertySensor(SCA_ISensor):
         self.max = ""  # type: str
         """The maximum value of the range used to evaluate the property when in interval mode."""
 
+        self._lastResult = False  # type: bool
+        self._previous = None  # type: str
+        """Text of the property at the last evaluation, for the changed mode."""
+
+    @property
+    def propName(self):
+        # type: () -> str
+        """The property the sensor operates."""
+
+        return self._propName
+
+    @propName.setter
+    def propName(self, value):
+        # type: (str) -> None
+        self._unsubscribe()
+        self._propName = value
+        self._subscribe()
+        self._wake()
+
+    def reset(self):
+        # type: () -> None
+        self._lastResult = False
+        self._previous = None
+        super().reset()
+
+    def _subscribe(self):
+        # type: () -> None
+        if self._scene() is not None:
+            self.owner._watchers.setdefault(self._propName, {})[self] = None
+
+    def _unsubscribe(self):
+        # type: () -> None
+        watchers = self.owner._watchers.get(self._propName) if self.owner is not None else None
+
+        if watchers:
+            watchers.pop(self, None)
+
+    def _evaluate(self):
+        # type: () -> bool
+        owner = self.owner
+        name = self._propName
+        mode = self.mode
+
+        if name not in owner:
+            result = False
+
+        elif mode == 1 or mode == 2:
+            result = _propertyEquals(owner[name], self.value) == (mode == 1)
+
+        elif mode == 3:
+            try:
+                result = float(self.min) <= float(owner[name]) <= float(self.max)
+
+            except (TypeError, ValueError):
+                result = False
+
+        elif mode == 4:
+            text = str(owner[name])
+            result = self._previous is not None and text != self._previous
+            self._previous = text
+
+        elif mode == 6 or mode == 7:
+            try:
+                value, reference = float(owner[name]), float(self.value)
+                result = value < reference if mode == 6 else value > reference
+
+            except (TypeError, ValueError):
+                result = False
+
+        else:
+            # The expression mode is not supported
+            result = False
+
+        changed = result != self._lastResult or mode == 4 and result
+        self._lastResult = result
+        return changed
+
+    def _condition(self):
+        # type: () -> bool
+        return self._lastResult
+
 
 class SCA_PythonController(SCA_IController):
     """A Python controller uses a Python script to activate it's actuators, based on it's sensors."""
@@ -1346,13 +2755,74 @@ class SCA_PythonController(SCA_IController):
         - Script: 0, Execute the script as a python code.
         - Module: 1, Execute the script as a module and function."""
 
+        self._source = None  # type: str
+        self._code = None  # type: object
+
+    def _trigger(self):
+        # type: () -> None
+        """Run the script or module function, errors are printed and the game goes on like in the BGE."""
+
+        try:
+            if self._source != self.script:
+                self._code = self._compile()
+                self._source = self.script
+
+            if self.mode == 0:
+                exec(self._code, {"__name__": "__main__", "__builtins__": _builtins})
+
+            elif getattr(getattr(self._code, "__code__", None), "co_argcount", 0):
+                self._code(self)
+
+            else:
+                self._code()
+
+        except Exception:
+            _traceback.print_exc()
+
+    def _compile(self):
+        # type: () -> object
+        """Code object of the script, or the function named by a "module.func" script in module mode."""
+
+        if self.mode == 0:
+            key = (self.name, self.script)
+            code = _scripts.get(key)
+
+            if code is None:
+                # Replicas of an added object share the code of their script
+                code = _scripts[key] = compile(self.script, self.name or "<controller>", "exec")
+
+            return code
+
+        module, _, function = self.script.rpartition(".")
+
+        if not module:
+            raise ValueError('Python module name formatting error in object "%s", controller "%s": expected "SomeModule.Func", got "%s"' % (getattr(self.owner, "name", ""), self.name, self.script))
+
+        return getattr(_import_module(module), function)
+
+    def _actuator(self, actuator):
+        # type: (SCA_IActuator | str) -> SCA_IActuator
+        if isinstance(actuator, str):
+            found = self.actuators.get(actuator)
+
+            if found is None:
+                raise ValueError("string does not correspond to an actuator")
+
+            return found
+
+        if actuator not in self.actuators:
+            raise ValueError("actuator does not belong to this controller")
+
+        return actuator
+
     def activate(self, actuator):
         # type: (SCA_IActuator | str) -> None
         """Activates an actuator attached to this controller.
 
         Args:
             actuator (actuator or the actuator name as a string): The actuator to operate on."""
-        pass
+
+        self._actuator(actuator)._event(True)
 
     def deactivate(self, actuator):
         # type: (SCA_IActuator | str) -> None
@@ -1361,7 +2831,7 @@ class SCA_PythonController(SCA_IController):
         Args:
             actuator (actuator or the actuator name as a string): The actuator to operate on."""
 
-        pass
+        self._actuator(actuator)._event(False)
 
 
 class SCA_PythonJoystick(PyObjectPlus):
@@ -1417,19 +2887,95 @@ class SCA_PythonJoystick(PyObjectPlus):
             Deprecated. Use numButtons instead."""
 
 
-class SCA_PythonKeyboard(PyObjectPlus):
+class _InputEvents(dict):
+    """Status of the inputs of a device by event code. Setting a status wakes the sensors reading the device.
+
+    In the headless runtime the inputs are fed by setting the statuses, for example
+    keyboard.events[bge.events.AKEY] = bge.logic.KX_INPUT_JUST_ACTIVATED. The just activated and just released statuses
+    become active and none after the next logic frame."""
+
+    __slots__ = ("_device", "_transient")
+
+    def __init__(self, device):
+        # type: (SCA_PythonKeyboard | SCA_PythonMouse) -> None
+        super().__init__()
+        self._device = device
+        self._transient = {}  # type: dict[int, None]
+
+    def __setitem__(self, key, value):
+        # type: (int, int) -> None
+        if self.get(key, _INPUT_NONE) == value:
+            return
+
+        dict.__setitem__(self, key, value)
+
+        if value == _INPUT_JUST_ACTIVATED or value == _INPUT_JUST_RELEASED:
+            self._transient[key] = None
+
+        self._device._wakeSensors()
+
+    def _nextFrame(self):
+        # type: () -> None
+        """Age the just activated and just released statuses, called after each logic frame."""
+
+        if not self._transient:
+            return
+
+        transient, self._transient = self._transient, {}
+
+        for key in transient:
+            status = self.get(key)
+
+            if status == _INPUT_JUST_ACTIVATED:
+                dict.__setitem__(self, key, _INPUT_ACTIVE)
+
+            elif status == _INPUT_JUST_RELEASED:
+                dict.__setitem__(self, key, _INPUT_NONE)
+
+        self._device._wakeSensors()
+
+
+class _InputDevice(PyObjectPlus):
+    """Keyboard or mouse of the headless runtime, the sensors reading it subscribe to its changes."""
+
+    def __init__(self):
+        # type: () -> None
+        super().__init__()
+
+        self._sensors = {}  # type: dict[SCA_ISensor, None]
+
+    def _wakeSensors(self):
+        # type: () -> None
+        for sensor in list(self._sensors):
+            if sensor._scene() is None:
+                # Left over by a scene that ended
+                del self._sensors[sensor]
+
+            else:
+                sensor._wake()
+
+    def _nextFrame(self):
+        # type: () -> None
+        self.events._nextFrame()
+
+
+class SCA_PythonKeyboard(_InputDevice):
     """The current keyboard."""
 
     def __init__(self):
         # type: () -> None
         super().__init__()
 
-        self.events = {}  # type: dict[int, int]
+        self.events = _InputEvents(self)  # type: dict[int, int]
         """A dictionary containing the status of each keyboard event or key. (read-only)."""
 
-        self.active_events = {}  # type: dict[int, int]
+    @property
+    def active_events(self):
+        # type: () -> dict[int, int]
         """A dictionary containing the status of only the active keyboard events or keys. (read-only)."""
 
+        return {key: status for key, status in self.events.items() if status != _INPUT_NONE}
+
     def getClipboard(self):
         # type: () -> str
         """Gets the clipboard text.
@@ -1449,24 +2995,55 @@ class SCA_PythonKeyboard(PyObjectPlus):
         pass
 
 
-class SCA_PythonMouse(PyObjectPlus):
+class SCA_PythonMouse(_InputDevice):
     """The current mouse."""
 
     def __init__(self):
         # type: () -> None
         super().__init__()
 
-        self.events = {}  # type: dict[int, int]
+        self.events = _InputEvents(self)  # type: dict[int, int]
         """A dictionary containing the status of each mouse event. (read-only)."""
 
-        self.active_events = {}  # type: dict[int, int]
+        self._position = (0.5, 0.5)  # type: tuple[float, float]
+
+        self.visible = True  # type: bool
+        """The visibility of the mouse cursor."""
+
+    @property
+    def active_events(self):
+        # type: () -> dict[int, int]
         """A dictionary containing the status of only the active mouse events. (read-only)."""
 
-        self.position = tuple()  # type: tuple[int, int]
+        return {key: status for key, status in self.events.items() if status != _INPUT_NONE}
+
+    @property
+    def position(self):
+        # type: () -> tuple[float, float]
         """The normalized x and y position of the mouse cursor."""
 
-        self.visible = True  # type: bool
-        """The visibility of the mouse cursor."""
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        # type: (tuple[float, float]) -> None
+        x, y = value
+        previous = self._position
+        self._position = (float(x), float(y))
+
+        # Moving the cursor sends the movement events read by the mouse sensors
+        if self._position[0] != previous[0]:
+            self.events[_MOUSEX] = _INPUT_JUST_ACTIVATED
+
+        if self._position[1] != previous[1]:
+            self.events[_MOUSEY] = _INPUT_JUST_ACTIVATED
+
+
+_keyboard = SCA_PythonKeyboard()  # type: SCA_PythonKeyboard
+"""Keyboard of the runtime, bge.logic.keyboard."""
+
+_mouse = SCA_PythonMouse()  # type: SCA_PythonMouse
+"""Mouse of the runtime, bge.logic.mouse."""
 
 
 class SCA_RandomActuator(SCA_IActuator):
@@ -1599,7 +3176,9 @@ class SCA_XNORController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return inputs.count(True) != 1
 
 
 class SCA_XORController(SCA_IController):
@@ -1607,7 +3186,9 @@ class SCA_XORController(SCA_IController):
 
     There are no special Python methods for this controller."""
 
-    pass
+    def _combine(self, inputs):
+        # type: (list[bool]) -> bool
+        return inputs.count(True) == 1
 
 
 class BL_ActionActuator(SCA_IActuator):
@@ -2235,6 +3816,8 @@ class BL_ShapeActionActuator(SCA_IActuator):
 class KX_TouchSensor(SCA_ISensor):
     """Touch sensor detects collisions between objects."""
 
+    _polled = False
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -2251,12 +3834,51 @@ class KX_TouchSensor(SCA_ISensor):
         self.hitObject = None  # type: KX_GameObject
         """The last collided object. (read-only)."""
 
-        self.hitObjectList = []  # type: list[KX_GameObject]
+        self.hitObjectList = CListValue()  # type: CListValue[KX_GameObject]
         """A list of colliding objects. (read-only)."""
 
         self.hitMaterial = ""  # type: str
         """The material of the object in the face hit by the ray. (read-only)."""
 
+    def _accepts(self, object):
+        # type: (KX_GameObject) -> bool
+        """True if a colliding object matches the property or material filter of the sensor."""
+
+        name = self.propName
+
+        if not name:
+            return True
+
+        if self.useMaterial:
+            return any(array.material == name for mesh in object.meshes for array in mesh._arrays)
+
+        return name in object
+
+    def _evaluate(self):
+        # type: () -> bool
+        owner = self.owner
+        contacts = owner._contacts
+        previous = self.hitObjectList._items
+        # Contacts are reported by the physics at each step, the ones not reported since the last frame are over
+        oldest = owner.scene._frame - 1
+
+        for object in [object for object, contact in contacts.items() if contact[0] < oldest or object.invalid]:
+            del contacts[object]
+
+        hits = [object for object in contacts if self._accepts(object)]
+        self.hitObjectList = CListValue(hits)
+        self.hitObject = hits[-1] if hits else None
+        return bool(hits) != bool(previous) or self.usePulseCollision and hits != previous
+
+    def _condition(self):
+        # type: () -> bool
+        return bool(self.hitObjectList._items)
+
+    def _pending(self):
+        # type: () -> bool
+        # Contacts expire without any notification, evaluate again until they are all gone
+        return self.triggered or bool(self.hitObjectList._items)
+
 
 KX_CollisionSensor = KX_TouchSensor
 
@@ -2516,6 +4138,9 @@ class KX_Camera(KX_GameObject):
     OUTSIDE = 3
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.lens = 0.0
         self.lodDistanceFactor = 0.0
         self.fov = 0.0
@@ -2676,6 +4301,9 @@ class KX_CameraActuator(SCA_IActuator):
     Applies changes to a camera."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.damping = 0
         self.axis = 0
         self.min = 0
@@ -2688,20 +4316,117 @@ class KX_CharacterWrapper(PyObjectPlus):
 
     class bge.KX_CharacterWrapper(PyObjectPlus)
 
-    A wrapper to expose character physics options."""
+    A wrapper to expose character physics options: a kinematic capsule walking on the level, see
+    bge.constraints.getCharacter()."""
 
-    def __init__(self):
-        self.onGround = 0
-        self.gravity = 0
-        self.maxJumps = 0
-        self.jumpCount = 0
-        self.walkDirection = 0
+    def __init__(self, character=None):
+        # type: (_Any) -> None
+        super().__init__()
+
+        self._character = character  # type: _Any
+        """Character of the physics world of the scene of the object."""
+
+    @property
+    def onGround(self):
+        # type: () -> bool
+        """Whether or not the character is on the ground. (read-only)"""
+
+        return self._character is not None and self._character.onGround
+
+    @property
+    def gravity(self):
+        # type: () -> float
+        """The gravity value used for the character."""
+
+        return self._character.gravity if self._character is not None else _characters.GRAVITY
+
+    @gravity.setter
+    def gravity(self, value):
+        # type: (float) -> None
+        if self._character is not None:
+            self._character.gravity = float(value)
+
+    @property
+    def maxJumps(self):
+        # type: () -> int
+        """The maximum number of jumps a character can perform before having to touch the ground. By default this is
+        set to 1. 2 allows for a double jump, etc."""
+
+        return self._character.maxJumps if self._character is not None else 1
+
+    @maxJumps.setter
+    def maxJumps(self, value):
+        # type: (int) -> None
+        if self._character is not None:
+            # An unsigned char in the BGE
+            self._character.maxJumps = min(max(int(value), 0), 255)
+
+    @property
+    def jumpCount(self):
+        # type: () -> int
+        """The current jump count. This can be used to have different logic for a single jump versus a double jump. For
+        example, a different animation for the second jump. (read-only)"""
+
+        return self._character.jumps if self._character is not None else 0
+
+    @property
+    def walkDirection(self):
+        # type: () -> _Vector
+        """The speed and direction the character is traveling in using world coordinates. This should be used instead
+        of applyMovement() to properly move the character."""
+
+        return _Vector(self._character.walkDirection if self._character is not None else (0.0, 0.0, 0.0))
+
+    @walkDirection.setter
+    def walkDirection(self, value):
+        # type: (_Vector) -> None
+        if self._character is not None:
+            self._character.walkDirection = [float(value[axis]) for axis in range(3)]
+
+    @property
+    def jumpSpeed(self):
+        # type: () -> float
+        """The speed the character starts a jump at."""
+
+        return self._character.jumpSpeed if self._character is not None else _characters.JUMP_SPEED
+
+    @jumpSpeed.setter
+    def jumpSpeed(self, value):
+        # type: (float) -> None
+        if self._character is not None:
+            self._character.jumpSpeed = float(value)
+
+    @property
+    def fallSpeed(self):
+        # type: () -> float
+        """The maximum speed the character falls at."""
+
+        return self._character.fallSpeed if self._character is not None else _characters.FALL_SPEED
+
+    @fallSpeed.setter
+    def fallSpeed(self, value):
+        # type: (float) -> None
+        if self._character is not None:
+            self._character.fallSpeed = float(value)
+
+    @property
+    def maxSlope(self):
+        # type: () -> float
+        """The steepest slope the character can stand on and walk up, in radians."""
+
+        return self._character.maxSlope if self._character is not None else _characters.MAX_SLOPE
+
+    @maxSlope.setter
+    def maxSlope(self, value):
+        # type: (float) -> None
+        if self._character is not None:
+            self._character.maxSlope = float(value)
 
     def jump(self):
         """The character jumps based on it's jump speed."""
-        pass
 
-    pass
+        if self._character is not None:
+            self._character.jump()
 
 class KX_ConstraintActuator(SCA_IActuator):
     """base class - SCA_IActuator
@@ -2711,6 +4436,9 @@ class KX_ConstraintActuator(SCA_IActuator):
     A constraint actuator limits the position, rotation, distance or orientation of an object."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.damp = 0
         self.rotDamp = 0
         self.direction = 0
@@ -2727,14 +4455,23 @@ class KX_ConstraintActuator(SCA_IActuator):
 class KX_ConstraintWrapper(PyObjectPlus):
     """KX_ConstraintWrapper"""
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, constraint=None):
+        # type: (_Any) -> None
         super().__init__()
 
-        self.constraint_id = 0  # type: int
+        self._constraint = constraint  # type: _Any
+        """Constraint of the physics world of the scene, see bge.constraints.createConstraint()."""
+
+    @property
+    def constraint_id(self):
+        # type: () -> int
         """Returns the contraint ID (read only)"""
 
-        self.constraint_type = 0  # type: int
+        return self._constraint.id if self._constraint is not None else 0
+
+    @property
+    def constraint_type(self):
+        # type: () -> int
         """Returns the contraint type (read only).
 
         Can be one of the following constants:
@@ -2746,11 +4483,38 @@ class KX_ConstraintWrapper(PyObjectPlus):
         - bge.constraints.VEHICLE_CONSTRAINT = 11
         - bge.constraints.GENERIC_6DOF_CONSTRAINT = 12"""
 
-        self.breakingThreshold = 0.0  # type: float
-        """The impulse threshold breaking the constraint, if the constraint is broken enabled is set to False."""
+        return self._constraint.type if self._constraint is not None else 0
+
+    @property
+    def breakingThreshold(self):
+        # type: () -> float
+        """The impulse threshold breaking the constraint, if the constraint is broken enabled is set to False."""
+
+        return self._constraint.breakingThreshold if self._constraint is not None else 0.0
+
+    @breakingThreshold.setter
+    def breakingThreshold(self, value):
+        # type: (float) -> None
+        if self._constraint is not None:
+            self._constraint.breakingThreshold = float(value)
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        """The status of the constraint. Set to True to restore a constraint after breaking."""
+
+        return self._constraint is not None and self._constraint.enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        # type: (bool) -> None
+        constraint = self._constraint
 
-        self.enabled = False  # type: bool
-        """The status of the constraint. Set to True to restore a constraint after breaking."""
+        if constraint is not None and constraint.enabled != bool(value):
+            constraint.enabled = bool(value)
+            constraint.impulses.clear()
+            constraint.world.islandsDirty = True
+            constraint.world.wakeConstraint(constraint)
 
     def getConstraintId(self):
         # type: () -> int
@@ -2758,7 +4522,8 @@ class KX_ConstraintWrapper(PyObjectPlus):
 
         Returns:
             int: the constraint ID"""
-        pass
+
+        return self.constraint_id
 
     def setParam(self, axis, value0, value1):
         # type: (int, float, float) -> None
@@ -2768,7 +4533,9 @@ class KX_ConstraintWrapper(PyObjectPlus):
             axis (integer)
             value0: Set the minimum limit of the axis
             value1: Set the maximum limit of the axis"""
-        pass
+
+        if self._constraint is not None:
+            self._constraint.setParam(axis, value0, value1)
 
     def getParam(self, axis):
         # type: (int) -> float
@@ -2779,7 +4546,8 @@ class KX_ConstraintWrapper(PyObjectPlus):
 
         Returns:
             float: position or angle"""
-        pass
+
+        return self._constraint.getParam(axis) if self._constraint is not None else 0.0
 
 
 class KX_FontObject(KX_GameObject):
@@ -2993,12 +4761,51 @@ class KX_MeshProxy(SCA_IObject):
 
     Vertices will be split by face if necessary. Vertices can only be shared between faces if: They are at the same position, UV coordinates are the same, their normals are the same (both polygons are "Set Smooth"), they are the same color, for example: a cube has 24 vertices: 6 faces with 4 vertices per face"""
 
-    def __init__(self):
-        self.materials = 0
+    def __init__(self, name=""):
+        # type: (str) -> None
+        super().__init__()
+
+        self.name = name
+        self.materials = []  # type: list[KX_BlenderMaterial]
         self.numPolygons = 0
-        self.numMaterials = 0
+        self._arrays = []  # type: list[_VertexArray]
+        """Vertex array of each material."""
 
-    def getMaterialName(self):
+    @property
+    def numMaterials(self):
+        # type: () -> int
+        return len(self._arrays)
+
+    def _addVertexArray(self, material, count, uvLayers=2, colorLayers=1):
+        # type: (str, int, int, int) -> int
+        """Add the vertex array of a material with count vertices, as done by the converter at scene load.
+
+        Returns:
+            int: The material index of the new array."""
+
+        self._arrays.append(_VertexArray(material, count, uvLayers, colorLayers))
+        return len(self._arrays) - 1
+
+    def _vertexArrays(self, matid, name):
+        # type: (int, str) -> list[_VertexArray]
+        """The vertex array of a material, or all of them for -1."""
+
+        if matid == -1:
+            return self._arrays
+
+        return [self._vertexArray(matid, name)]
+
+    def _vertexArray(self, matid, name):
+        # type: (int, str) -> _VertexArray
+        """The vertex array of a single material, -1 is not accepted."""
+
+        if not 0 <= matid < len(self._arrays):
+            raise ValueError("mesh.%s(): invalid material index %d" % (name, matid))
+
+        return self._arrays[matid]
+
+    def getMaterialName(self, matid):
+        # type: (int) -> str
         """Gets the name of the specified material.
 
         Args:
@@ -3009,7 +4816,7 @@ class KX_MeshProxy(SCA_IObject):
 
         Return type:
         string"""
-        return "str"
+        return self._vertexArray(matid, "getMaterialName").material
 
     def getTextureName(self):
         """Gets the name of the specified material's texture.
@@ -3024,7 +4831,8 @@ class KX_MeshProxy(SCA_IObject):
         string"""
         return "str"
 
-    def getVertexArray(self):
+    def getVertexArray(self, matid):
+        # type: (int) -> int
         """Gets the length of the vertex array associated with the specified material.
 
         There is one vertex array for each material.
@@ -3037,9 +4845,43 @@ class KX_MeshProxy(SCA_IObject):
 
         Return type:
         integer"""
-        return 0
+        return self._vertexArray(matid, "getVertexArray").count
+
+    def getVertexArrays(self, matid):
+        # type: (int) -> dict[str, memoryview | list[memoryview]]
+        """Gets the vertex data of the specified material as contiguous float32 buffers, without copying it.
 
-    def getVertex(self):
+        The buffers are shared with the mesh: writing into them changes the vertices, and numpy.asarray() wraps them
+        without a copy. Prefer them to one KX_VertexProxy per vertex when changing many vertices.
+
+        Args:
+        matid (integer): the specified material, not -1: there is one set of buffers per material
+
+        Returns:
+        a dictionary of writable memoryviews: "positions" and "normals" shaped (count, 3), "uvs" a list of one
+        (count, 2) view per UV layer and "colors" a list of one (count, 4) view per color layer.
+
+        Return type:
+        dict"""
+        return self._vertexArray(matid, "getVertexArrays").views()
+
+    def setVertexArrays(self, matid, positions=None, normals=None, uvs=None, colors=None):
+        # type: (int, object, object, list, list) -> None
+        """Sets the vertex data of the specified material in bulk.
+
+        Each value is a buffer (array, memoryview, NumPy array of float32 or float64), a flat sequence of numbers or a
+        sequence of vectors, with the number of values of the whole vertex array. The values left to None are kept.
+
+        Args:
+        matid (integer): the specified material, not -1: there is one set of buffers per material
+        positions: the x, y, z of each vertex.
+        normals: the x, y, z of the normal of each vertex.
+        uvs (list): the u, v of each vertex for each UV layer, a layer can be None.
+        colors (list): the r, g, b, a of each vertex for each color layer, a layer can be None."""
+        self._vertexArray(matid, "setVertexArrays").assign(positions, normals, uvs, colors)
+
+    def getVertex(self, matid, index):
+        # type: (int, int) -> KX_VertexProxy
         """Gets the specified vertex from the mesh object.
 
         Args:
@@ -3051,8 +4893,13 @@ class KX_MeshProxy(SCA_IObject):
 
         Return type:
         KX_VertexProxy"""
-        value = KX_PolyProxy
-        return value
+        array = self._vertexArray(matid, "getVertex")
+
+        if not 0 <= index < array.count:
+            raise ValueError("mesh.getVertex(mat_idx, vert_idx): KX_MeshProxy, could not get a vertex at the given "
+                             "indices")
+
+        return KX_VertexProxy(array, index)
 
     def getPolygon(self):
         """Gets the specified polygon from the mesh.
@@ -3068,15 +4915,21 @@ class KX_MeshProxy(SCA_IObject):
         value = KX_PolyProxy
         return value
 
-    def transform(self):
+    def transform(self, matid, matrix):
+        # type: (int, _Matrix) -> None
         """Transforms the vertices of a mesh.
 
+        The normals are transformed by the inverse transpose of the matrix and normalized. All the vertices of a
+        material are transformed at once.
+
         Args:
         matid (integer): material index, -1 transforms all.
         matrix (4x4 matrix [[float]]): transformation matrix."""
-        pass
+        for array in self._vertexArrays(matid, "transform"):
+            array.transform(matrix)
 
-    def transformUV(self):
+    def transformUV(self, matid, matrix, uv_index=-1, uv_index_from=-1):
+        # type: (int, _Matrix, int, int) -> None
         """Transforms the vertices UV's of a mesh.
 
         Args:
@@ -3084,9 +4937,9 @@ class KX_MeshProxy(SCA_IObject):
         matrix (4x4 matrix [[float]]): transformation matrix.
         uv_index (integer): optional uv index, -1 for all, otherwise 0 or 1.
         uv_index_from (integer): optional uv index to copy from, -1 to transform the current uv."""
-        pass
+        for array in self._vertexArrays(matid, "transformUV"):
+            array.transformUV(matrix, uv_index, uv_index_from)
 
-    pass
 
 class KX_MouseActuator(SCA_IActuator):
     """base class - SCA_IActuator
@@ -3096,6 +4949,9 @@ class KX_MouseActuator(SCA_IActuator):
     The mouse actuator gives control over the visibility of the mouse cursor and rotates the parent object according to mouse movement."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.visible = 0
         self.use_axis_x = 0
         self.use_axis_y = 0
@@ -3126,6 +4982,9 @@ class KX_MouseFocusSensor(SCA_MouseSensor):
     The mouse focus sensor works by transforming the mouse coordinates from 2d device space to 3d space then raycasting away from the camera."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.raySource = 0
         self.rayTarget = 0
         self.rayDirection = 0
@@ -3138,6 +4997,15 @@ class KX_MouseFocusSensor(SCA_MouseSensor):
         self.propName = 0
         self.useMaterial = 0
 
+    def _evaluate(self):
+        # type: () -> bool
+        # Nothing is under the cursor without a renderer
+        return False
+
+    def _condition(self):
+        # type: () -> bool
+        return False
+
 class KX_NavMeshObject(KX_GameObject):
     """Python interface for using and controlling navigation meshes."""
 
@@ -3186,6 +5054,8 @@ class KX_NavMeshObject(KX_GameObject):
 class KX_NearSensor(KX_TouchSensor):
     """A near sensor is a specialised form of touch sensor."""
 
+    _polled = True
+
     def __init__(self):
         # type: () -> None
         super().__init__()
@@ -3196,6 +5066,34 @@ class KX_NearSensor(KX_TouchSensor):
         self.resetDistance = 0.0  # type: float
         """The near sensor deactivates when the object exceeds this distance."""
 
+    def _detect(self, owner, radius):
+        # type: (KX_GameObject, float) -> list[tuple[float, KX_GameObject]]
+        """(distance, object) of the objects in range, nearest first."""
+
+        return owner.scene._spatial.querySphere(owner._position._data[:3], radius)
+
+    def _evaluate(self):
+        # type: () -> bool
+        owner = self.owner
+        previous = self.hitObjectList._items
+        radius = self.distance
+
+        if previous and self.resetDistance > radius:
+            # Detected objects stay detected up to the reset distance
+            radius = self.resetDistance
+
+        prop = self.propName
+        hits = [object for _, object in self._detect(owner, radius)
+                if object is not owner and (not prop or prop in object)]
+
+        self.hitObjectList = CListValue(hits)
+        self.hitObject = hits[0] if hits else None
+        return bool(hits) != bool(previous) or self.usePulseCollision and hits != previous
+
+    def _condition(self):
+        # type: () -> bool
+        return bool(self.hitObjectList._items)
+
 
 class KX_NetworkMessageActuator(SCA_IActuator):
     """Message Actuator"""
@@ -3246,6 +5144,9 @@ class KX_ObjectActuator(SCA_IActuator):
     The object actuator ("Motion Actuator") applies force, torque, displacement, angular displacement, velocity, or angular velocity to an object. Servo control allows to regulate force to achieve a certain speed target."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.force = 0
         self.useLocalForce = 0
         self.torque = 0
@@ -3428,6 +5329,28 @@ class KX_RadarSensor(KX_NearSensor):
         self.axis = 0  # type: int
         """The axis on which the radar cone is cast. Can be one of these constants."""
 
+    def _detect(self, owner, radius):
+        # type: (KX_GameObject, float) -> list[tuple[float, KX_GameObject]]
+        origin = owner._position._data[:3]
+        axis = _worldAxis(owner, self.axis)
+        height = self.distance
+        slope = _tan(_radians(min(self.angle, 179.0)) / 2.0)
+        self.coneOrigin = [o + a * height / 2.0 for o, a in zip(origin, axis)]
+        self.coneTarget = [o + a * height for o, a in zip(origin, axis)]
+        spheres = owner.scene._spatial.spheres
+        hits = []
+
+        # The sphere around the apex reaching the rim of the cone base holds the whole cone
+        for distance, object in owner.scene._spatial.querySphere(origin, height / _cos(_radians(min(self.angle, 179.0)) / 2.0)):
+            x, y, z, r = spheres[object]
+            offset = (x - origin[0], y - origin[1], z - origin[2])
+            along = offset[0] * axis[0] + offset[1] * axis[1] + offset[2] * axis[2]
+
+            if 0.0 < along <= height and _sqrt(max(distance * distance - along * along, 0.0)) <= along * slope + r:
+                hits.append((distance, object))
+
+        return hits
+
 
 class KX_RaySensor(SCA_ISensor):
     """A ray sensor detects the first object in a given direction."""
@@ -3448,7 +5371,7 @@ class KX_RaySensor(SCA_ISensor):
         self.useXRay = False  # type: bool
         """Whether or not to use XRay."""
 
-        self.mask = 0  # type: int
+        self.mask = 0xFFFF  # type: int
         """The collision mask (16 layers mapped to a 16-bit integer) combined with each
         object's collision group, to hit only a subset of the objects in the scene.
         Only those objects for which collisionGroup & mask is true can be hit."""
@@ -3471,6 +5394,45 @@ class KX_RaySensor(SCA_ISensor):
         self.axis = 0  # type: int
         """The axis the ray is pointing on. Can be one of these constants."""
 
+    def _evaluate(self):
+        # type: () -> bool
+        owner = self.owner
+        prop = self.propName
+        xray = self.useXRay
+        mask = self.mask
+        # KX_RAY_AXIS_POS_Y is 0 and KX_RAY_AXIS_POS_X is 1
+        direction = _worldAxis(owner, (1, 0, 2, 3, 4, 5)[self.axis])
+        origin = owner._position._data[:3]
+
+        def accept(object):
+            return object is not owner and object.collisionGroup & mask and (not xray or not prop or prop in object)
+
+        spatial = owner.scene._spatial
+        hit, distance = spatial.rayCast(origin, direction, self.range, accept)
+
+        if hit is not None and prop and prop not in hit:
+            hit = None
+
+        previous = self.hitObject
+        self.hitObject = hit
+        self.rayDirection = _Vector(direction)
+
+        if hit is None:
+            self.hitPosition = self.hitNormal = None
+
+        else:
+            point = [o + d * distance for o, d in zip(origin, direction)]
+            x, y, z, radius = spatial.spheres[hit]
+            self.hitPosition = _Vector(point)
+            self.hitNormal = _Vector((point[0] - x, point[1] - y, point[2] - z))
+            self.hitNormal.normalize()
+
+        return hit is not previous
+
+    def _condition(self):
+        # type: () -> bool
+        return self.hitObject is not None
+
 
 class KX_SCA_AddObjectActuator(SCA_IActuator):
     """Edit Object Actuator (in Add Object Mode)
@@ -3563,23 +5525,23 @@ class KX_Scene(PyObjectPlus):
 
     The activity culling stuff is supposed to disable logic bricks when their owner gets too far from the active camera. It was taken from some code lurking at the back of KX_Scene - who knows what it does!"""
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, name=""):
+        # type: (str) -> None
         super().__init__()
 
-        self.name = ""  # type: str
+        self.name = name  # type: str
         """The scene's name (read-only)."""
 
-        self.objects = None # type: dict[str, KX_GameObject]
+        self.objects = CListValue() # type: CListValue[KX_GameObject]
         """A list of objects in the scene, (read-only)."""
 
-        self.objectsInactive = None # type: dict[str, KX_GameObject]
+        self.objectsInactive = CListValue() # type: CListValue[KX_GameObject]
         """A list of objects on background layers (used for the addObject actuator), (read-only)."""
 
-        self.lights = None # type: dict[str, KX_LightObject]
+        self.lights = CListValue() # type: CListValue[KX_LightObject]
         """A list of lights in the scene, (read-only)."""
 
-        self.cameras = None # type: dict[str, KX_Camera]
+        self.cameras = CListValue() # type: CListValue[KX_Camera]
         """A list of cameras in the scene, (read-only)."""
 
         self.active_camera = None  # type: KX_Camera
@@ -3591,14 +5553,17 @@ class KX_Scene(PyObjectPlus):
         self.world = None  # type: KX_WorldInfo
         """The current active world, (read-only)."""
 
-        self.suspended = True  # type: bool
+        self.suspended = False  # type: bool
         """True if the scene is suspended (read-only)."""
 
-        self.activity_culling = True  # type: bool
+        self.activity_culling = False  # type: bool
         """True if the scene is activity culling."""
 
         self.activity_culling_radius = 0.0  # type: float
-        """The distance outside which to do activity culling. Measured in manhattan distance."""
+        """The distance outside which to do activity culling. Measured in manhattan distance.
+
+        Note:
+            The objects further than this distance from the active camera along any axis have their components, sensors and controllers skipped."""
 
         self.dbvt_culling = True  # type: bool
         """True when Dynamic Bounding box Volume Tree is set (read-only)."""
@@ -3612,9 +5577,42 @@ class KX_Scene(PyObjectPlus):
         self.pre_draw_setup = []  # type: list[_Callable]
         """A list of callables to be run before the drawing setup (i.e., before the model view and projection matrices are computed)."""
 
-        self.gravity = None  # type: _Vector
+        self.gravity = _Vector(_PHYSICS_DEFAULTS["gravity"])  # type: _Vector
         """The scene gravity using the world x, y and z axis."""
 
+        self._activeActuators = {}  # type: dict[SCA_IActuator, None]
+        self._endedObjects = []  # type: list[KX_GameObject]
+        self._pools = {}  # type: dict[KX_GameObject, _ObjectPool]
+        self._timers = _TimerWheel()  # type: _TimerWheel
+        self._polledSensors = {}  # type: dict[SCA_ISensor, None]
+        """Sensors evaluated at every logic frame."""
+
+        self._wokenSensors = {}  # type: dict[SCA_ISensor, None]
+        """Sensors whose inputs changed since the last sensor pass, evaluated in the next one."""
+
+        self._sensorTimers = _TimerWheel()  # type: _TimerWheel
+        """Sensors waking up at a later frame, like the delay sensors."""
+
+        self._spatial = _SpatialHash()  # type: _SpatialHash
+        self._physics = _PhysicsWorld(self)  # type: _PhysicsWorld
+        self._logicInfo = {}  # type: dict[str, int]
+        """Counters of the last logic frame, see bge.logic.getLogicInfo()."""
+
+        self._culled = set()  # type: set[KX_GameObject]
+        """Objects outside of the activity culling radius at the last logic frame."""
+
+        self._active = None  # type: set[KX_GameObject] | None
+        """Objects inside the activity culling radius at the last logic frame, None when the culling is off."""
+
+        self._animated = {}  # type: dict[KX_GameObject, None]
+        """Objects playing an action, advanced at every logic frame."""
+
+        self._frame = 0  # type: int
+        """Number of logic frames run by this scene, the lifetimes of the added objects are counted in these frames."""
+
+        self._ended = False  # type: bool
+        self._replacement = None  # type: str | KX_Scene
+
     def addObject(self, object, reference=None, time=0):
         # type: (str | KX_GameObject, str | KX_GameObject, int) -> KX_GameObject
         """Adds an object to the scene like the Add Object Actuator would.
@@ -3625,15 +5623,67 @@ class KX_Scene(PyObjectPlus):
             time (integer): The lifetime of the added object, in frames. A time of 0 means the object will last forever (optional).
 
         Returns:
-            KX_GameObject: The newly added object."""
+            KX_GameObject: The newly added object.
+
+        Note:
+            Ended objects that were added are recycled by the next calls adding the same object, see bge.logic.getObjectPoolInfo. References kept on an ended object may become valid again when it is recycled."""
+
+        if isinstance(object, str):
+            template = self.objectsInactive.get(object)
+
+            if template is None:
+                template = self.objects.get(object)
+
+            if template is None:
+                raise ValueError('scene.addObject(object, reference, time): KX_Scene (first argument): object "%s" not found' % object)
+
+        else:
+            template = object
+
+        if isinstance(reference, str):
+            name = reference
+            reference = self.objects.get(name)
+
+            if reference is None:
+                raise ValueError('scene.addObject(object, reference, time): KX_Scene (second argument): object "%s" not found' % name)
 
-        return
+        pool = self._pools.get(template)
+
+        if pool is None:
+            pool = self._pools[template] = _ObjectPool(template)
+
+        replica = pool.acquire()
+        replica._template = template
+        replica._spawn += 1
+        replica._expiry = 0
+
+        if reference is not None:
+            for name, stored in _TRANSFORM_ATTRIBUTES[:3]:
+                value = getattr(reference, stored)
+                setattr(replica, name, None if value is None else value.copy())
+
+        replica.scene = self
+        self.objects.append(replica)
+        self._spatial.add(replica)
+
+        if self._active is not None:
+            # Counted as leaving the culling box at the next frame if it isn't inside
+            self._active.add(replica)
+
+        self._physics.register(replica)
+        replica._linkSensors()
+
+        if time > 0:
+            replica._expiry = self._frame + int(time)
+            self._timers.schedule(replica._expiry, (replica, replica._spawn))
+
+        return replica
 
     def end(self):
         # type: () -> None
         """Removes the scene from the game."""
 
-        pass
+        self._ended = True
 
     def restart(self):
         # type: () -> None
@@ -3651,19 +5701,21 @@ class KX_Scene(PyObjectPlus):
         Returns:
             bool: True if the scene exists and was scheduled for addition, False otherwise."""
 
-        pass
+        self._replacement = scene
+        self._ended = True
+        return True
 
     def suspend(self):
         # type: () -> None
         """Suspends this scene."""
 
-        pass
+        self.suspended = True
 
     def resume(self):
         # type: () -> None
         """Resume this scene."""
 
-        pass
+        self.suspended = False
 
     def get(self, key, default=None):
         # type: (str, object) -> object
@@ -3672,7 +5724,58 @@ class KX_Scene(PyObjectPlus):
         Returns:
             The key value or a default."""
 
-        pass
+        return self._customAttributes.get(key, default)
+
+    def snapshotPhysics(self):
+        # type: () -> int
+        """Save the physics state of the scene: the transforms, velocities and sleep states of the dynamic objects, the
+        impulses of the constraints, the wheels of the vehicles and the characters.
+
+        Returns:
+            int: The id of the snapshot, see restorePhysics().
+
+        Note:
+            A snapshot only copies the state of the objects that moved since the previous one. The scene keeps the last
+            64 snapshots, the oldest is dropped by a new one."""
+
+        world = self._physics
+
+        if world.snapshots is None:
+            world.snapshots = _SnapshotRing(world)
+
+        return world.snapshots.take()
+
+    def restorePhysics(self, snapshot):
+        # type: (int) -> None
+        """Restore the physics state saved by snapshotPhysics(), the objects that became dynamic since keep their state.
+
+        Args:
+            snapshot (int): The id of the snapshot.
+
+        Raises:
+            ValueError: If the snapshot is not one of the last 64 snapshots of the scene."""
+
+        world = self._physics
+
+        if world.snapshots is None:
+            raise ValueError("scene.restorePhysics(snapshot): KX_Scene, no snapshot was taken")
+
+        world.snapshots.restore(snapshot)
+
+    def _endObject(self, object):
+        # type: (KX_GameObject) -> None
+        """Queue an object for removal at the end of the logic frame."""
+
+        self._endedObjects.append(object)
+
+    def _expireObjects(self):
+        # type: () -> None
+        """End the added objects whose lifetime is over at the current frame."""
+
+        for object, spawn in self._timers.advance(self._frame):
+            # Objects ended earlier, and maybe recycled since, have another spawn count
+            if object._spawn == spawn and not object.invalid:
+                self._endedObjects.append(object)
 
     def drawObstacleSimulation(self):
         # type: () -> None
@@ -3716,6 +5819,9 @@ class KX_SoundActuator(SCA_IActuator):
     The startSound, pauseSound and stopSound do not require the actuator to be activated - they act instantly provided that the actuator has been activated once at least."""
 
     def __init__(self):
+        # type: () -> None
+        super().__init__()
+
         self.volume = 0
         self.time = 0
         self.pitch = 0
@@ -3844,217 +5950,322 @@ class KX_VehicleWrapper(PyObjectPlus):
 
     KX_VehicleWrapper
 
-    TODO - description"""
+    A ray cast vehicle: a dynamic chassis held above the level by wheels casting rays down, see
+    bge.constraints.createVehicle()."""
+
+    def __init__(self, vehicle=None):
+        # type: (_Any) -> None
+        super().__init__()
+
+        self._vehicle = vehicle  # type: _Any
+        """Vehicle of the physics world of the scene of the chassis."""
+
+    @property
+    def rayMask(self):
+        # type: () -> int
+        """Set ray cast mask."""
+
+        return self._vehicle.rayMask if self._vehicle is not None else 0xFFFF
+
+    @rayMask.setter
+    def rayMask(self, value):
+        # type: (int) -> None
+        if self._vehicle is not None:
+            self._vehicle.rayMask = int(value)
+
+    def _wheel(self, wheelIndex, method):
+        # type: (int, str) -> _Any
+        """The vehicle, after checking a wheel index like WHEEL_INDEX_CHECK_OR_RETURN in the BGE."""
 
-    def addWheel(self):
+        count = self.getNumWheels()
+
+        if not 0 <= wheelIndex < count:
+            raise ValueError("%s(...): wheel index %d out of range (0 to %d)." % (method, wheelIndex, count - 1))
+
+        return self._vehicle
+
+    def addWheel(self, wheel, attachPos, downDir, axleDir, suspensionRestLength, wheelRadius, hasSteering):
+        # type: (KX_GameObject | str, _Vector, _Vector, _Vector, float, float, bool) -> None
         """Add a wheel to the vehicle
 
         Args:
-        wheel (KX_GameObject or a KX_GameObject name): The object to use as a wheel.
-        attachPos (vector of 3 floats): The position to attach the wheel, relative to the chassis object center.
-        downDir (vector of 3 floats): The direction vector pointing down to where the vehicle should collide with the floor.
-        axleDir (vector of 3 floats): The axis the wheel rotates around, relative to the chassis.
-        suspensionRestLength (float): The length of the suspension when no forces are being applied.
-        wheelRadius (float): The radius of the wheel (half the diameter).
-        hasSteering (boolean): True if the wheel should turn with steering, typically used in front wheels."""
-        pass
+            wheel (KX_GameObject or a KX_GameObject name): The object to use as a wheel.
+            attachPos (vector of 3 floats): The position to attach the wheel, relative to the chassis object center.
+            downDir (vector of 3 floats): The direction vector pointing down to where the vehicle should collide with the floor.
+            axleDir (vector of 3 floats): The axis the wheel rotates around, relative to the chassis.
+            suspensionRestLength (float): The length of the suspension when no forces are being applied.
+            wheelRadius (float): The radius of the wheel (half the diameter).
+            hasSteering (boolean): True if the wheel should turn with steering, typically used in front wheels."""
+
+        if self._vehicle is None:
+            return
+
+        if wheelRadius <= 0.0:
+            raise AttributeError("Wheel radius must be positive")
+
+        vehicle = self._vehicle
+
+        if isinstance(wheel, str):
+            wheel = vehicle.chassis.scene.objects.get(wheel) if vehicle.chassis.scene is not None else None
 
-    def applyBraking(self):
+        if not isinstance(wheel, KX_GameObject) or wheel.invalid:
+            raise ValueError("vehicle.addWheel(...): KX_VehicleWrapper, expected a KX_GameObject or a KX_GameObject "
+                             "name")
+
+        vehicle.addWheel(wheel, [float(value) for value in attachPos[:3]], [float(value) for value in downDir[:3]],
+                         [float(value) for value in axleDir[:3]], float(suspensionRestLength), float(wheelRadius),
+                         bool(hasSteering))
+
+        vehicle.world.attached[wheel] = None
+
+        if _isStatic(wheel):
+            # The wheel leaves the level
+            vehicle.world.staticDirty = True
+
+        vehicle.wake()
+
+    def applyBraking(self, force, wheelIndex):
+        # type: (float, int) -> None
         """Apply a braking force to the specified wheel
 
         Args:
-        force (float): the brake force
-        wheelIndex (integer): index of the wheel where the force needs to be applied"""
-        pass
+            force (float): the brake force
+            wheelIndex (integer): index of the wheel where the force needs to be applied"""
+
+        self._wheel(wheelIndex, "applyBraking").set("brake", wheelIndex, float(force))
 
-    def applyEngineForce(self):
+    def applyEngineForce(self, force, wheelIndex):
+        # type: (float, int) -> None
         """Apply an engine force to the specified wheel
 
         Args:
-        force (float): the engine force
-        wheelIndex (integer): index of the wheel where the force needs to be applied"""
-        pass
+            force (float): the engine force
+            wheelIndex (integer): index of the wheel where the force needs to be applied"""
+
+        self._wheel(wheelIndex, "applyEngineForce").set("engine", wheelIndex, float(force))
 
     def getConstraintId(self):
+        # type: () -> int
         """Get the constraint ID
 
         Returns:
-        the constraint id
+            int: the constraint id"""
 
-        Return type:
-        integer"""
-        return 0
+        return self._vehicle.id if self._vehicle is not None else 0
 
     def getConstraintType(self):
+        # type: () -> int
         """Returns the constraint type.
 
         Returns:
-        constraint type
+            int: constraint type"""
 
-        Return type:
-        integer"""
-        return 0
+        return self._vehicle.type if self._vehicle is not None else 0
 
     def getNumWheels(self):
+        # type: () -> int
         """Returns the number of wheels.
 
         Returns:
-        the number of wheels for this vehicle
+            int: the number of wheels for this vehicle"""
 
-        Return type:
-        integer"""
-        return 0
+        return len(self._vehicle.objects) if self._vehicle is not None else 0
 
-    def getWheelOrientationQuaternion(self):
+    def getWheelOrientationQuaternion(self, wheelIndex):
+        # type: (int) -> _Matrix
         """Returns the wheel orientation as a quaternion.
 
         Args:
-        wheelIndex (integer): the wheel index
+            wheelIndex (integer): the wheel index
 
         Returns:
-        TODO Description
+            Matrix: the world orientation of the wheel, a matrix like in the BGE despite the name of the method"""
 
-        Return type:
-        TODO - type should be quat as per method name but from the code it looks like a matrix"""
-        return [(0.0,0.0,0.0),(0.0,0.0,0.0),(0.0,0.0,0.0)]
+        return _Matrix(self._wheel(wheelIndex, "getWheelOrientationQuaternion").transform(wheelIndex)[1])
 
-    def getWheelPosition(self):
+    def getWheelPosition(self, wheelIndex):
+        # type: (int) -> _Vector
         """Returns the position of the specified wheel
 
         Args:
-        wheelIndex (integer): the wheel index
+            wheelIndex (integer): the wheel index
 
         Returns:
-        position vector
+            Vector: position vector"""
 
-        Return type:
-        list[x, y, z]"""
-        return [0.0,0.0,0.0]
+        return _Vector(self._wheel(wheelIndex, "getWheelPosition").transform(wheelIndex)[0])
 
-    def getWheelRotation(self):
+    def getWheelRotation(self, wheelIndex):
+        # type: (int) -> float
         """Returns the rotation of the specified wheel
 
         Args:
-        wheelIndex (integer): the wheel index
+            wheelIndex (integer): the wheel index
 
         Returns:
-        the wheel rotation
+            float: the wheel rotation"""
 
-        Return type:
-        float"""
-        return 0.0
+        return self._wheel(wheelIndex, "getWheelRotation").rotation[wheelIndex]
 
-    def setRollInfluence(self):
+    def setRollInfluence(self, rollInfluece, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's roll influence. The higher the roll influence the more the vehicle will tend to roll over in corners.
 
         Args:
-        rollInfluece (float): the wheel roll influence
-        wheelIndex (integer): the wheel index"""
-        pass
+            rollInfluece (float): the wheel roll influence
+            wheelIndex (integer): the wheel index"""
+
+        self._wheel(wheelIndex, "setRollInfluence").set("roll", wheelIndex, float(rollInfluece))
 
-    def setSteeringValue(self):
+    def setSteeringValue(self, steering, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's steering
 
         Args:
-        steering (float): the wheel steering
-        wheelIndex (integer): the wheel index"""
-        pass
+            steering (float): the wheel steering
+            wheelIndex (integer): the wheel index"""
 
-    def setSuspensionCompression(self):
+        self._wheel(wheelIndex, "setSteeringValue").set("steering", wheelIndex, float(steering))
+
+    def setSuspensionCompression(self, compression, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's compression
 
         Args:
-        compression (float): the wheel compression
-        wheelIndex (integer): the wheel index"""
-        pass
+            compression (float): the wheel compression
+            wheelIndex (integer): the wheel index"""
+
+        self._wheel(wheelIndex, "setSuspensionCompression").set("compression", wheelIndex, float(compression))
 
-    def setSuspensionDamping(self):
+    def setSuspensionDamping(self, damping, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's damping
 
         Args:
-        damping (float): the wheel damping
-        wheelIndex (integer): the wheel index"""
-        pass
+            damping (float): the wheel damping
+            wheelIndex (integer): the wheel index"""
 
-    def setSuspensionStiffness(self):
+        self._wheel(wheelIndex, "setSuspensionDamping").set("damping", wheelIndex, float(damping))
+
+    def setSuspensionStiffness(self, stiffness, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's stiffness
 
         Args:
-        stiffness (float): the wheel stiffness
-        wheelIndex (integer): the wheel index"""
-        pass
+            stiffness (float): the wheel stiffness
+            wheelIndex (integer): the wheel index"""
+
+        self._wheel(wheelIndex, "setSuspensionStiffness").set("stiffness", wheelIndex, float(stiffness))
 
-    def setTyreFriction(self):
+    def setTyreFriction(self, friction, wheelIndex):
+        # type: (float, int) -> None
         """Set the specified wheel's tyre friction
 
         Args:
-        friction (float): the tyre friction
-        wheelIndex (integer): the wheel index"""
-        pass
+            friction (float): the tyre friction
+            wheelIndex (integer): the wheel index"""
 
-    pass
+        self._wheel(wheelIndex, "setTyreFriction").set("friction", wheelIndex, float(friction))
 
 
 class KX_VertexProxy(SCA_IObject):
     """A vertex holds position, UV, color and normal information.
 
+    The attributes read and write the vertex arrays of the mesh directly, see KX_MeshProxy.getVertexArrays() to change
+    many vertices at once.
+
     Note:
         The physics simulation is NOT currently updated - physics will not respond to changes in the vertex position."""
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, array=None, index=0):
+        # type: (_VertexArray, int) -> None
         super().__init__()
 
-        self.XYZ = None  # type: _Vector
-        """The position of the vertex."""
-
-        self.UV = None  # type: _Vector
-        """The texture coordinates of the vertex."""
-
-        self.uvs = []  # type: list[_Vector]
-        """The texture coordinates list of the vertex."""
+        self._array = array if array is not None else _VertexArray(count=1)  # type: _VertexArray
+        self._index = index  # type: int
 
-        self.normal = None  # type: _Vector
-        """The normal of the vertex."""
+    def _get(self, data, size):
+        # type: (_array, int) -> _Vector
+        start = self._index * size
+        return _Vector(data[start:start + size])
 
-        self.color = None  # type: _Vector
-        """The color of the vertex."""
+    def _set(self, data, size, value):
+        # type: (_array, int, _Any) -> None
+        values = [float(v) for v in value]
 
-        self.colors = []  # type: list[_Vector]
-        """The color list of the vertex."""
+        if len(values) != size:
+            raise ValueError("KX_VertexProxy: expected a sequence of %d floats" % size)
 
-        self.x = 0.0  # type: float
-        """The x coordinate of the vertex."""
+        start = self._index * size
+        data[start:start + size] = _array("f", values)
 
-        self.y = 0.0  # type: float
-        """The y coordinate of the vertex."""
+    @property
+    def XYZ(self):
+        # type: () -> _Vector
+        """The position of the vertex."""
+        return self._get(self._array.positions, 3)
 
-        self.z = 0.0  # type: float
-        """The z coordinate of the vertex."""
+    @XYZ.setter
+    def XYZ(self, value):
+        # type: (_Vector) -> None
+        self._set(self._array.positions, 3, value)
 
-        self.u = 0.0  # type: float
-        """The u texture coordinate of the vertex."""
+    @property
+    def UV(self):
+        # type: () -> _Vector
+        """The texture coordinates of the vertex."""
+        return self._get(self._array.uvs[0], 2)
 
-        self.v = 0.0  # type: float
-        """The v texture coordinate of the vertex."""
+    @UV.setter
+    def UV(self, value):
+        # type: (_Vector) -> None
+        self._set(self._array.uvs[0], 2, value)
 
-        self.u2 = 0.0  # type: float
-        """The second u texture coordinate of the vertex."""
+    @property
+    def uvs(self):
+        # type: () -> list[_Vector]
+        """The texture coordinates list of the vertex."""
+        return [self._get(layer, 2) for layer in self._array.uvs]
 
-        self.v2 = 0.0  # type: float
-        """The second v texture coordinate of the vertex."""
+    @property
+    def normal(self):
+        # type: () -> _Vector
+        """The normal of the vertex."""
+        return self._get(self._array.normals, 3)
 
-        self.r = 0.0  # type: float
-        """The red component of the vertex color. 0.0 <= r <= 1.0."""
+    @normal.setter
+    def normal(self, value):
+        # type: (_Vector) -> None
+        self._set(self._array.normals, 3, value)
 
-        self.g = 0.0  # type: float
-        """The green component of the vertex color. 0.0 <= g <= 1.0."""
+    @property
+    def color(self):
+        # type: () -> _Vector
+        """The color of the vertex."""
+        return self._get(self._array.colors[0], 4)
 
-        self.b = 0.0  # type: float
-        """The blue component of the vertex color. 0.0 <= b <= 1.0."""
+    @color.setter
+    def color(self, value):
+        # type: (_Vector) -> None
+        self._set(self._array.colors[0], 4, value)
 
-        self.a = 0.0  # type: float
-        """The alpha component of the vertex color. 0.0 <= a <= 1.0."""
+    @property
+    def colors(self):
+        # type: () -> list[_Vector]
+        """The color list of the vertex."""
+        return [self._get(layer, 4) for layer in self._array.colors]
+
+    x = _vertexComponent("positions", 3, 0, "The x coordinate of the vertex.")
+    y = _vertexComponent("positions", 3, 1, "The y coordinate of the vertex.")
+    z = _vertexComponent("positions", 3, 2, "The z coordinate of the vertex.")
+    u = _vertexComponent("uvs", 2, 0, "The u texture coordinate of the vertex.", 0)
+    v = _vertexComponent("uvs", 2, 1, "The v texture coordinate of the vertex.", 0)
+    u2 = _vertexComponent("uvs", 2, 0, "The second u texture coordinate of the vertex.", 1)
+    v2 = _vertexComponent("uvs", 2, 1, "The second v texture coordinate of the vertex.", 1)
+    r = _vertexComponent("colors", 4, 0, "The red component of the vertex color. 0.0 <= r <= 1.0.", 0)
+    g = _vertexComponent("colors", 4, 1, "The green component of the vertex color. 0.0 <= g <= 1.0.", 0)
+    b = _vertexComponent("colors", 4, 2, "The blue component of the vertex color. 0.0 <= b <= 1.0.", 0)
+    a = _vertexComponent("colors", 4, 3, "The alpha component of the vertex color. 0.0 <= a <= 1.0.", 0)
 
     def getXYZ(self):
         # type: () -> _Vector
@@ -4062,7 +6273,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Returns:
             Vector: this vertexes position in local coordinates."""
-        pass
+        return self.XYZ
 
     def setXYZ(self, pos):
         # type: (_Vector) -> None
@@ -4070,7 +6281,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Args:
             pos (Vector): the new position for this vertex in local coordinates."""
-        pass
+        self.XYZ = pos
 
     def getUV(self):
         # type: () -> _Vector
@@ -4078,7 +6289,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Returns:
             Vector: this vertexes UV (texture) coordinates."""
-        pass
+        return self.UV
 
     def setUV(self, uv):
         # type: (_Vector) -> None
@@ -4086,7 +6297,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Args:
             uv (Vector): the new uv for this vertex."""
-        pass
+        self.UV = uv
 
     def getUV2(self):
         # type: () -> _Vector
@@ -4094,16 +6305,16 @@ class KX_VertexProxy(SCA_IObject):
 
         Returns:
             Vector: this vertexes UV (texture) coordinates."""
-        pass
+        return self._get(self._array.uvs[1], 2)
 
-    def setUV2(self, uv, unit):
+    def setUV2(self, uv, unit=2):
         # type: (_Vector, int) -> None
         """Sets the 2nd UV (texture) coordinates of this vertex.
 
         Args:
             uv (Vector): the new uv for this vertex.
             unit (Vector): optional argument, FLAT==1, SECOND_UV==2, defaults to SECOND_UV"""
-        pass
+        self._set(self._array.uvs[1], 2, uv)
 
     def getRGBA(self):
         # type: () -> int
@@ -4118,7 +6329,8 @@ class KX_VertexProxy(SCA_IObject):
 
         Returns:
             int: 4 byte integer with one byte per color channel in RGBA format."""
-        pass
+        channels = bytes(min(max(int(round(value * 255.0)), 0), 255) for value in self.color)
+        return int.from_bytes(channels, _sys.byteorder)
 
     def setRGBA(self, col):
         # type: (int | _Vector) -> None
@@ -4132,7 +6344,10 @@ class KX_VertexProxy(SCA_IObject):
 
         Args:
             col (integer or list [r, g, b, a]): the new color of this vertex in packed RGBA format."""
-        pass
+        if isinstance(col, int):
+            col = [channel / 255.0 for channel in (col & 0xFFFFFFFF).to_bytes(4, _sys.byteorder)]
+
+        self.color = col
 
     def getNormal(self):
         # type: () -> _Vector
@@ -4140,7 +6355,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Returns:
             Vector: normalized normal vector."""
-        pass
+        return self.normal
 
     def setNormal(self, normal):
         # type: (_Vector) -> None
@@ -4148,7 +6363,7 @@ class KX_VertexProxy(SCA_IObject):
 
         Args:
             normal (Vector): the new normal of this vertex."""
-        pass
+        self.normal = normal
 
 
 class KX_VisibilityActuator(SCA_IActuator):
@@ -4245,16 +6460,23 @@ class KX_PythonComponent(CValue):
 
     The property types supported are float, integer, boolean, string, set (for enumeration) and Vector 2D, 3D and 4D."""
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, object=None):
+        # type: (KX_GameObject) -> None
         super().__init__()
 
-        self.object = None  # type: KX_GameObject
+        self.name = type(self).__name__  # type: str
+
+        self.object = object  # type: KX_GameObject
         """The object owner of the component."""
 
-        self.args = {}  # type: dict[str, object]
+        self.args = dict(getattr(type(self), "args", {}))  # type: dict[str, object]
         """Dictionary of the component properties, the keys are string and the value can be: float, integer, Vector(2D/3D/4D), set, string."""
 
+        self._started = False  # type: bool
+
+        if object is not None:
+            object.components.append(self)
+
     def start(self, args):
         # type: (dict[str, object]) -> None
         """Initialize the component.
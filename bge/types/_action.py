@@ -0,0 +1,77 @@
+"""Action layers of the game objects: the current frame of the action played on each layer, advanced every logic frame.
+
+The runtime has no animation data, an action is only its frame range. The frames advance at FRAME_RATE times the speed
+of the layer and follow its play mode like BL_Action::Update, so the scripts waiting on getActionFrame() or
+isPlayingAction() behave as in the engine. The scenes only go through the objects playing an action."""
+
+PLAY, LOOP, PING_PONG = 0, 1, 2
+"""Play modes, bge.logic.KX_ACTION_MODE_PLAY to KX_ACTION_MODE_PING_PONG."""
+
+FRAME_RATE = 24.0  # type: float
+"""Action frames per second of game time, the default frame rate of the scene render settings."""
+
+
+class ActionLayer:
+    """Action played on one layer of a game object."""
+
+    __slots__ = ("name", "start", "end", "frame", "speed", "mode", "priority")
+
+    def __init__(self, name, start, end, mode=PLAY, speed=1.0, priority=0):
+        # type: (str, float, float, int, float, int) -> None
+        self.name = name  # type: str
+        self.start = float(start)  # type: float
+        self.end = float(end)  # type: float
+        """Frame the action goes towards, before start to play it backwards. Swapped with start by the ping pong."""
+
+        self.frame = float(start)  # type: float
+        self.speed = float(speed)  # type: float
+        self.mode = mode  # type: int
+        self.priority = priority  # type: int
+
+    def advance(self, frames):
+        # type: (float) -> bool
+        """Move the frame by a number of frames at speed 1, False once an action played once has reached its end."""
+
+        span = self.end - self.start
+
+        if not span:
+            return self.mode != PLAY
+
+        direction = 1.0 if span > 0.0 else -1.0
+        frame = self.frame + direction * frames * self.speed
+        past = (frame - self.end) * direction
+
+        if past < 0.0:
+            self.frame = frame
+            return True
+
+        if self.mode == LOOP:
+            self.frame = self.start + direction * (past % abs(span))
+
+        elif self.mode == PING_PONG:
+            self.start, self.end = self.end, self.start
+            self.frame = self.start - direction * (past % abs(span))
+
+        else:
+            self.frame = self.end
+            return False
+
+        return True
+
+
+def updateActions(scene, timestep):
+    # type: (object, float) -> None
+    """Advance the actions of the objects of a scene, the layers played once are removed at their end."""
+
+    animated = scene._animated
+    frames = timestep * FRAME_RATE
+
+    for object in list(animated):
+        layers = object._actions
+
+        for layer, action in list(layers.items()):
+            if not action.advance(frames):
+                del layers[layer]
+
+        if not layers:
+            del animated[object]
@@ -0,0 +1,448 @@
+"""Kinematic characters of the physics worlds, see bge.constraints.getCharacter().
+
+A character is an upright capsule moved by its walk direction and its vertical speed, like btKinematicCharacterController:
+each substep it gets out of the level it overlaps, rises by its step height, walks sliding along what it hits, then goes
+down by its step height and its fall. It lands on the surfaces flatter than its maximum slope, it can't walk up the
+steeper ones and slides down them. The characters aren't bodies, they only collide with the level.
+
+The level of the characters is the oriented bounding boxes of the meshes of the static objects, the boxes of the objects
+turned are the slopes, in a bounding volume hierarchy built when the level changes. A capsule is swept against a box by
+Newton steps on their distance: the distance between convex shapes is convex along a translation, so the steps stop
+short of the contact, never past it. The characters of a world are stepped together: a substep takes the boxes near all
+the characters that left the box they were last looked up in, grown to be kept for a while, in one pass down the
+hierarchy. The characters standing still on the ground aren't stepped."""
+
+from math import cos as _cos, radians as _radians, sqrt as _sqrt
+
+GRAVITY = 29.4  # type: float
+"""Default gravity of the characters, three times the earth gravity like btKinematicCharacterController."""
+
+JUMP_SPEED = 10.0
+FALL_SPEED = 55.0
+STEP_HEIGHT = 0.15
+MAX_SLOPE = _radians(45.0)
+"""Default tuning of the characters, like the BGE and btKinematicCharacterController."""
+
+_MARGIN = 0.01
+"""Distance kept between the capsules and the level."""
+
+_TOLERANCE = 1e-4
+_SWEEP_STEPS = 8
+"""A sweep stops when the capsule is this close to the distance kept, or after this many steps, short of the contact."""
+
+_CLOSEST_STEPS = 3
+"""Alternate projections between a capsule and a turned box to find their closest points."""
+
+_RECOVERIES = 4
+_SLIDES = 4
+"""Pushes out of the level and sweeps of the walk of a character per substep, like the iterations of
+btKinematicCharacterController."""
+
+_LEAF = 4
+"""Maximum number of shapes of a leaf of the level hierarchy."""
+
+_SLACK = 1.0
+"""Growth of the boxes the characters look up the level in, they are looked up again when they leave their box."""
+
+
+class Character:
+    """Capsule moved on the level, centered on its object and upright whatever its orientation."""
+
+    def __init__(self, world, object, radius, half):
+        # type: (object, object, float, float) -> None
+        self.world = world
+        self.object = object
+        self.radius = radius  # type: float
+        self.half = half  # type: float
+        """Half the distance between the centers of the caps of the capsule, 0 for a sphere."""
+
+        self.gravity = GRAVITY  # type: float
+        self.jumpSpeed = JUMP_SPEED  # type: float
+        self.fallSpeed = FALL_SPEED  # type: float
+        self.stepHeight = STEP_HEIGHT  # type: float
+        self.maxSlope = MAX_SLOPE  # type: float
+        """Steepest slope the character stands on, in radians."""
+
+        self.maxJumps = 1  # type: int
+        self.jumps = 0  # type: int
+        self.walkDirection = [0.0, 0.0, 0.0]  # type: list[float]
+        """World velocity the character walks at, in units per second."""
+
+        self.verticalVelocity = 0.0  # type: float
+        self.onGround = False  # type: bool
+        self.level = None  # type: LevelTree | None
+        """Level of the last step of the character, it is stepped again when the level changes."""
+
+        self.position = None  # type: list[float] | None
+        """Position the last step left the character at, it is stepped again when its object is moved."""
+
+        self.box = None  # type: tuple | None
+        self.shapes = []  # type: list[tuple]
+        """Box of the level the character was last looked up in and the shapes overlapping it, kept until the character
+        leaves it."""
+
+    def canJump(self):
+        # type: () -> bool
+        return self.onGround or self.jumps < self.maxJumps
+
+    def jump(self):
+        # type: () -> None
+        """Jump at the jump speed, like CcdCharacter::jump(): from the ground or while jumps remain."""
+
+        if self.canJump():
+            self.verticalVelocity = self.jumpSpeed
+            self.jumps += 1
+            self.onGround = False
+
+
+class LevelTree:
+    """Bounding volume hierarchy of the shapes of the level, each node splits its shapes in two halves along its longest
+    axis."""
+
+    def __init__(self, shapes):
+        # type: (list[tuple]) -> None
+        self.nodes = []  # type: list[tuple]
+        """(low x, y, z, high x, y, z, first child, second child, shapes) of each node, the root first. The shapes of
+        the nodes that aren't leaves are None."""
+
+        if shapes:
+            self._build(list(shapes))
+
+    def _build(self, shapes):
+        # type: (list[tuple]) -> int
+        index = len(self.nodes)
+        self.nodes.append(None)
+        bounds = (tuple(min(shape[axis] for shape in shapes) for axis in (1, 2, 3)) +
+                  tuple(max(shape[axis] for shape in shapes) for axis in (4, 5, 6)))
+
+        if len(shapes) <= _LEAF:
+            self.nodes[index] = bounds + (0, 0, shapes)
+            return index
+
+        spans = [bounds[axis + 3] - bounds[axis] for axis in range(3)]
+        axis = spans.index(max(spans)) + 1
+        shapes.sort(key=lambda shape: shape[axis] + shape[axis + 3])
+        middle = len(shapes) // 2
+        first = self._build(shapes[:middle])
+        second = self._build(shapes[middle:])
+        self.nodes[index] = bounds + (first, second, None)
+        return index
+
+    def query(self, boxes):
+        # type: (list[tuple]) -> list[list[tuple]]
+        """Shapes overlapping each box (low x, y, z, high x, y, z), the boxes go down the hierarchy together."""
+
+        found = [[] for _ in boxes]
+
+        if not self.nodes:
+            return found
+
+        nodes = self.nodes
+        stack = [(0, [box + (index,) for index, box in enumerate(boxes)])]
+
+        while stack:
+            index, boxes = stack.pop()
+            x0, y0, z0, x1, y1, z1, first, second, shapes = nodes[index]
+            boxes = [box for box in boxes
+                     if box[0] <= x1 and box[3] >= x0 and box[1] <= y1 and box[4] >= y0 and box[2] <= z1 and box[5] >= z0]
+
+            if not boxes:
+                continue
+
+            if shapes is None:
+                stack.append((first, boxes))
+                stack.append((second, boxes))
+                continue
+
+            for shape in shapes:
+                _, x0, y0, z0, x1, y1, z1 = shape[:7]
+
+                for box in boxes:
+                    if box[0] <= x1 and box[3] >= x0 and box[1] <= y1 and box[4] >= y0 and box[2] <= z1 and box[5] >= z0:
+                        found[box[6]].append(shape)
+
+        return found
+
+
+def update(world, dt):
+    # type: (object, float) -> None
+    """Step the characters of a world by a substep."""
+
+    level = world.level
+
+    if level is None:
+        level = world.level = LevelTree(world.shapes)
+
+    moving = []
+    boxes = []
+    queried = []
+
+    for character in world.characters.values():
+        position = character.object._position
+
+        if position is None:
+            continue
+
+        data = position._data
+        vx, vy, vz = character.walkDirection
+
+        if character.onGround and not (vx or vy or vz) and character.level is level and data[:3] == character.position:
+            continue
+
+        velocity = character.verticalVelocity - character.gravity * dt
+
+        if velocity > character.jumpSpeed > 0.0:
+            velocity = character.jumpSpeed
+
+        elif velocity < -character.fallSpeed:
+            velocity = -character.fallSpeed
+
+        character.verticalVelocity = velocity
+        moving.append(character)
+        # The sweeps of the substep stay in this box, the slides are never longer than the walk
+        x, y, z = data[:3]
+        walk = _sqrt(vx * vx + vy * vy + vz * vz) * dt
+        reach = character.radius + _MARGIN + walk
+        height = character.half + reach + character.stepHeight
+        low, high = z - height + min(velocity, 0.0) * dt, z + height + max(velocity, 0.0) * dt
+        box = character.box
+
+        if (character.level is not level or box is None or x - reach < box[0] or y - reach < box[1] or low < box[2] or
+                x + reach > box[3] or y + reach > box[4] or high > box[5]):
+            reach += _SLACK
+            character.box = (x - reach, y - reach, low - _SLACK, x + reach, y + reach, high + _SLACK)
+            boxes.append(character.box)
+            queried.append(character)
+
+    for character, shapes in zip(queried, level.query(boxes)):
+        character.shapes = shapes
+        character.level = level
+
+    dirty = world.scene._spatial.dirty
+
+    for character in moving:
+        _move(character, character.shapes, dt)
+        dirty[character.object] = None
+
+
+def _move(character, shapes, dt):
+    # type: (Character, list[tuple], float) -> None
+    """Move a character by a substep, like btKinematicCharacterController::playerStep()."""
+
+    data = character.object._position._data
+    x, y, z = data[:3]
+    radius, half = character.radius, character.half
+
+    for _ in range(_RECOVERIES if shapes else 0):
+        pushed = False
+
+        for shape in shapes:
+            distance, nx, ny, nz = _distance(shape, x, y, z, half)
+
+            if distance < radius:
+                depth = radius - distance
+                x += nx * depth
+                y += ny * depth
+                z += nz * depth
+                pushed = True
+
+        if not pushed:
+            break
+
+    walked = _walk(character, shapes, x, y, z, character.stepHeight, dt)
+
+    if walked[5] and character.stepHeight:
+        # Rising by the step height would climb the steep slopes a bit at each substep
+        walked = _walk(character, shapes, x, y, z, 0.0, dt)
+
+    x, y, z, velocity, landed, _ = walked
+
+    if landed:
+        character.jumps = 0
+
+    character.verticalVelocity = velocity
+    character.onGround = landed
+    data[0] = x
+    data[1] = y
+    data[2] = z
+    character.position = [x, y, z]
+
+
+def _walk(character, shapes, x, y, z, step, dt):
+    # type: (Character, list[tuple], float, float, float, float, float) -> tuple
+    """(x, y, z, vertical velocity, landed, steep) of a character risen by a step height, walked and gone down,
+    steep if it is left on a slope too steep to stand on."""
+
+    half = character.half
+    reach = character.radius + _MARGIN
+    slope = _cos(character.maxSlope)
+    # Rise by the step height, to walk over the steps
+    velocity = character.verticalVelocity
+    lift = step + (velocity * dt if velocity > 0.0 else 0.0)
+    fraction, normal = _sweep(shapes, x, y, z, 0.0, 0.0, lift, reach, half)
+    z += lift * fraction
+    offset = min(step, lift * fraction)
+
+    if normal is not None and velocity > 0.0:
+        # The head hit a ceiling
+        velocity = 0.0
+
+    wx, wy, wz = [value * dt for value in character.walkDirection]
+    mx, my, mz = wx, wy, wz
+
+    for _ in range(_SLIDES):
+        if not (mx or my or mz):
+            break
+
+        fraction, normal = _sweep(shapes, x, y, z, mx, my, mz, reach, half)
+        x += mx * fraction
+        y += my * fraction
+        z += mz * fraction
+
+        if normal is None:
+            break
+
+        nx, ny, nz = normal
+
+        if 0.0 < nz < slope:
+            # A slope too steep to walk up is a wall
+            length = _sqrt(nx * nx + ny * ny)
+            nx, ny, nz = nx / length, ny / length, 0.0
+
+        rest = 1.0 - fraction
+        mx, my, mz = mx * rest, my * rest, mz * rest
+        dot = mx * nx + my * ny + mz * nz
+
+        if dot < 0.0:
+            mx, my, mz = mx - nx * dot, my - ny * dot, mz - nz * dot
+
+        if mx * wx + my * wy + mz * wz <= 0.0:
+            # Sliding back would jitter in the corners
+            break
+
+    # Go down by the step height and the fall, the character lands on the walkable surfaces
+    drop = offset + (-velocity * dt if velocity < 0.0 else 0.0)
+    landed = steep = False
+
+    if drop > 0.0:
+        fraction, normal = _sweep(shapes, x, y, z, 0.0, 0.0, -drop, reach, half)
+        z -= drop * fraction
+
+        if normal is not None:
+            nx, ny, nz = normal
+            landed = nz >= slope
+            steep = not landed
+
+            if steep:
+                # Slide down the steep slope for the rest of the drop
+                rest = drop * (1.0 - fraction)
+                mx, my, mz = nx * nz * rest, ny * nz * rest, (nz * nz - 1.0) * rest
+                fraction, normal = _sweep(shapes, x, y, z, mx, my, mz, reach, half)
+                x += mx * fraction
+                y += my * fraction
+                z += mz * fraction
+                # At the foot of the slope
+                landed = normal is not None and normal[2] >= slope
+
+    if landed:
+        velocity = 0.0
+
+    return x, y, z, velocity, landed, steep and not landed
+
+
+def _sweep(shapes, x, y, z, mx, my, mz, reach, half):
+    # type: (list[tuple], float, float, float, float, float, float, float, float) -> tuple[float, tuple | None]
+    """(fraction, normal) of the first contact of a capsule moved by (mx, my, mz), (1.0, None) without contact.
+
+    Args:
+        reach (float): The radius of the capsule and the distance it keeps from the level.
+        half (float): Half the distance between the centers of the caps."""
+
+    best, normal = 1.0, None
+
+    for shape in shapes:
+        time = 0.0
+
+        for _ in range(_SWEEP_STEPS):
+            distance, nx, ny, nz = _distance(shape, x + mx * time, y + my * time, z + mz * time, half)
+            approach = -(mx * nx + my * ny + mz * nz)
+            gap = distance - reach
+
+            if gap <= _TOLERANCE:
+                if approach > 0.0:
+                    best, normal = time, (nx, ny, nz)
+
+                break
+
+            if approach <= 0.0:
+                # Moving away from the box or along it, the distance won't decrease
+                break
+
+            time += gap / approach
+
+            if time >= best:
+                break
+
+        else:
+            best, normal = time, (nx, ny, nz)
+
+    return best, normal
+
+
+def _distance(shape, x, y, z, half):
+    # type: (tuple, float, float, float, float) -> tuple[float, float, float, float]
+    """(distance, normal x, y, z) between the segment of an upright capsule and a shape of the level, the normal points
+    from the shape to the capsule. The distance is the opposite of the depth when the segment is in the shape."""
+
+    _, x0, y0, z0, x1, y1, z1, rows, cx, cy, cz, ex, ey, ez = shape
+    bottom, top = z - half, z + half
+
+    if rows is None:
+        dx = x - x0 if x < x0 else x - x1 if x > x1 else 0.0
+        dy = y - y0 if y < y0 else y - y1 if y > y1 else 0.0
+        dz = top - z0 if top < z0 else bottom - z1 if bottom > z1 else 0.0
+        squared = dx * dx + dy * dy + dz * dz
+
+        if squared > 1e-18:
+            distance = _sqrt(squared)
+            return distance, dx / distance, dy / distance, dz / distance
+
+        # The segment leaves the box by its nearest face
+        return max((x0 - x, -1.0, 0.0, 0.0), (x - x1, 1.0, 0.0, 0.0), (y0 - y, 0.0, -1.0, 0.0), (y - y1, 0.0, 1.0, 0.0),
+                   (z0 - top, 0.0, 0.0, -1.0), (bottom - z1, 0.0, 0.0, 1.0))
+
+    # In the space of the box, the segment goes from the center minus the axis to the center plus the axis
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = rows
+    ox, oy, oz = x - cx, y - cy, z - cz
+    lx = r00 * ox + r10 * oy + r20 * oz
+    ly = r01 * ox + r11 * oy + r21 * oz
+    lz = r02 * ox + r12 * oy + r22 * oz
+    ax, ay, az = r20 * half, r21 * half, r22 * half
+    px, py, pz = lx, ly, lz
+    qx = -ex if px < -ex else ex if px > ex else px
+    qy = -ey if py < -ey else ey if py > ey else py
+    qz = -ez if pz < -ez else ez if pz > ez else pz
+
+    for _ in range(_CLOSEST_STEPS if half else 0):
+        # Closest point of the segment to the point of the box, then of the box to the point of the segment
+        s = ((qx - lx) * ax + (qy - ly) * ay + (qz - lz) * az) / (half * half)
+        s = -1.0 if s < -1.0 else 1.0 if s > 1.0 else s
+        px, py, pz = lx + ax * s, ly + ay * s, lz + az * s
+        qx = -ex if px < -ex else ex if px > ex else px
+        qy = -ey if py < -ey else ey if py > ey else py
+        qz = -ez if pz < -ez else ez if pz > ez else pz
+
+    dx, dy, dz = px - qx, py - qy, pz - qz
+    squared = dx * dx + dy * dy + dz * dz
+
+    if squared > 1e-18:
+        distance = _sqrt(squared)
+        dx, dy, dz = dx / distance, dy / distance, dz / distance
+
+    else:
+        distance, dx, dy, dz = max((abs(px) - ex, 1.0 if px >= 0.0 else -1.0, 0.0, 0.0),
+                                   (abs(py) - ey, 0.0, 1.0 if py >= 0.0 else -1.0, 0.0),
+                                   (abs(pz) - ez, 0.0, 0.0, 1.0 if pz >= 0.0 else -1.0))
+
+    return (distance, r00 * dx + r01 * dy + r02 * dz, r10 * dx + r11 * dy + r12 * dz,
+            r20 * dx + r21 * dy + r22 * dz)
@@ -0,0 +1,193 @@
+"""Vertex storage of the meshes: one VertexArray per material, each vertex attribute a contiguous float32 buffer.
+
+The buffers are laid out like the vertex buffers of the renderer (x, y, z, x, y, z, ...), so they can be handed out as
+memoryviews and wrapped by NumPy without copying. Bulk operations work on whole components at once (all the x values,
+then all the y values...) instead of one vertex at a time."""
+
+from array import array as _array, typecodes as _typecodes
+from itertools import chain as _chain, repeat as _repeat
+from math import sqrt as _sqrt
+from operator import add as _add, mul as _mul, truediv as _truediv
+
+from mathutils import Matrix as _Matrix
+
+
+class VertexArray:
+    """Vertices of the polygons of a mesh sharing one material."""
+
+    __slots__ = ("material", "count", "positions", "normals", "uvs", "colors")
+
+    def __init__(self, material="", count=0, uvLayers=2, colorLayers=1):
+        # type: (str, int, int, int) -> None
+        self.material = material  # type: str
+        self.count = count  # type: int
+        self.positions = _array("f", bytes(12 * count))  # type: _array
+        """x, y, z of each vertex."""
+
+        self.normals = _array("f", (0.0, 0.0, 1.0)) * count  # type: _array
+        """Normalized x, y, z of each vertex."""
+
+        self.uvs = [_array("f", bytes(8 * count)) for _ in range(uvLayers)]  # type: list[_array]
+        """u, v of each vertex, one array per UV layer."""
+
+        self.colors = [_array("f", (1.0, 1.0, 1.0, 1.0)) * count for _ in range(colorLayers)]  # type: list[_array]
+        """r, g, b, a of each vertex, one array per color layer."""
+
+    def views(self):
+        # type: () -> dict[str, object]
+        """Writable memoryviews of the buffers, shaped (count, components)."""
+
+        return {
+            "positions": _view(self.positions, 3),
+            "normals": _view(self.normals, 3),
+            "uvs": [_view(layer, 2) for layer in self.uvs],
+            "colors": [_view(layer, 4) for layer in self.colors],
+        }
+
+    def assign(self, positions=None, normals=None, uvs=None, colors=None):
+        # type: (object, object, list, list) -> None
+        """Copy new values into the buffers, the ones left to None are kept. See KX_MeshProxy.setVertexArrays()."""
+
+        # Everything is converted first, so that a wrong size leaves the buffers untouched
+        updates = []
+
+        if positions is not None:
+            updates.append((self.positions, _floats(positions, 3 * self.count, "positions")))
+
+        if normals is not None:
+            updates.append((self.normals, _floats(normals, 3 * self.count, "normals")))
+
+        for name, layers, values, size in (("uvs", self.uvs, uvs, 2), ("colors", self.colors, colors, 4)):
+            if values is None:
+                continue
+
+            if len(values) > len(layers):
+                raise ValueError("setVertexArrays(): %d %s layers given, the mesh has %d" % (len(values), name,
+                                                                                           len(layers)))
+
+            for layer, value in zip(layers, values):
+                if value is not None:
+                    updates.append((layer, _floats(value, size * self.count, name)))
+
+        for target, data in updates:
+            # Same length slice assignment, the buffers may be exported
+            target[:] = data
+
+    def transform(self, matrix):
+        # type: (object) -> None
+        """Transform the positions by a 4x4 matrix and the normals by its inverse transpose."""
+
+        rows = [[float(value) for value in row] for row in matrix]
+
+        if len(rows) != 4 or any(len(row) != 4 for row in rows):
+            raise ValueError("mesh.transform(): expected a 4x4 matrix")
+
+        positions = self.positions
+        columns = [positions[0::3], positions[1::3], positions[2::3]]
+
+        for axis, row in enumerate(rows[:3]):
+            positions[axis::3] = _array("f", _combine(row[:3], columns, row[3], self.count))
+
+        normalRows = _Matrix([row[:3] for row in rows[:3]]).inverted_safe().transposed()
+        normals = self.normals
+        columns = [normals[0::3], normals[1::3], normals[2::3]]
+        columns = [_combine(list(row), columns, 0.0, self.count) for row in normalRows]
+
+        if not normalRows.is_orthogonal:
+            # Rotations keep the normals normalized, scales don't
+            squares = [list(map(_mul, column, column)) for column in columns]
+            lengths = [length or 1.0 for length in map(_sqrt, _combine([1.0, 1.0, 1.0], squares, 0.0, self.count))]
+            columns = [list(map(_truediv, column, lengths)) for column in columns]
+
+        for axis, column in enumerate(columns):
+            normals[axis::3] = _array("f", column)
+
+    def transformUV(self, matrix, index=-1, source=-1):
+        # type: (object, int, int) -> None
+        """Transform UV layers by the upper left 2x2 and the translation of a 4x4 matrix.
+
+        Args:
+            matrix: The 4x4 transformation.
+            index (int): The layer to transform, -1 for all of them.
+            source (int): The layer to read the UVs from, -1 to transform the current UVs of each layer."""
+
+        rows = [[float(value) for value in row] for row in matrix]
+
+        if len(rows) != 4 or any(len(row) != 4 for row in rows):
+            raise ValueError("mesh.transformUV(): expected a 4x4 matrix")
+
+        layers = self.uvs
+
+        for value, name in ((index, "uv_index"), (source, "uv_index_from")):
+            if not -1 <= value < len(layers):
+                raise ValueError("mesh.transformUV(): %s must be -1 or a layer index below %d" % (name, len(layers)))
+
+        for layer in (layers if index == -1 else [layers[index]]):
+            uvs = layer if source == -1 else layers[source]
+            columns = [uvs[0::2], uvs[1::2]]
+            layer[0::2] = _array("f", _combine(rows[0][:2], columns, rows[0][3], self.count))
+            layer[1::2] = _array("f", _combine(rows[1][:2], columns, rows[1][3], self.count))
+
+
+def _combine(coefficients, columns, constant, count):
+    # type: (list[float], list, float, int) -> list
+    """sum(coefficient * column) + constant for each item of the columns, the zero coefficients are skipped."""
+
+    total = None
+
+    for coefficient, column in zip(coefficients, columns):
+        if coefficient == 0.0:
+            continue
+
+        term = column if coefficient == 1.0 else list(map(_mul, _repeat(coefficient, count), column))
+        total = term if total is None else list(map(_add, total, term))
+
+    if total is None:
+        return [constant] * count
+
+    return list(map(_add, total, _repeat(constant, count))) if constant else total
+
+
+def _view(data, size):
+    # type: (_array, int) -> memoryview
+    if not data:
+        # memoryview can't have a zero length dimension
+        return memoryview(data)
+
+    return memoryview(data).cast("B").cast("f", [len(data) // size, size])
+
+
+def _floats(value, length, name):
+    # type: (object, int, str) -> _array
+    """A float32 array from a buffer (array, memoryview, NumPy array...) or a sequence of numbers or of vectors."""
+
+    try:
+        view = memoryview(value)
+
+    except TypeError:
+        view = None
+
+    if view is not None:
+        typecode = view.format.lstrip("@=<")
+
+        if typecode not in _typecodes:
+            raise TypeError("setVertexArrays(): unsupported buffer format %r for %s" % (view.format, name))
+
+        data = _array(typecode)
+        data.frombytes(view.cast("B") if view.c_contiguous else view.tobytes())
+
+        if typecode != "f":
+            data = _array("f", data)
+
+    else:
+        values = list(value)
+
+        if values and not isinstance(values[0], (int, float)):
+            values = _chain.from_iterable(values)
+
+        data = _array("f", values)
+
+    if len(data) != length:
+        raise ValueError("setVertexArrays(): expected %d values for %s, got %d" % (length, name, len(data)))
+
+    return data
@@ -0,0 +1,1247 @@
+"""Rigid body physics of the scenes, tuned by bge.constraints and driven by the dynamics methods of KX_GameObject.
+
+The state of the dynamic objects is stored as a structure of arrays: one list per component (x positions, y positions,
+..., x velocities, ...) indexed by body. Each substep updates a whole component at once with map() over the lists instead
+of going through the bodies one at a time. The moving bodies are kept first in the lists, then the bodies resting on the
+level and the sleeping ones last, the passes only go through the moving prefix. A body stopped on the level by its
+contact is at a fixed point of the integration: it stays there, resting, without being integrated until something wakes
+it, and sleeps after the deactivation time. Resting and sleeping bodies cost nothing but the report of their contacts.
+
+The bodies are spheres of the physics radius of their object. They collide with the static level geometry, the bounding
+boxes of the meshes of the objects without dynamics, filed in a uniform grid rebuilt when the level changes. The bodies
+don't collide with each other. The constraints between the bodies are solved by the _solver module, the vehicles by the
+_vehicle module and the characters by the _character module."""
+
+from itertools import compress as _compress, islice as _islice, repeat as _repeat
+from math import floor as _floor, sqrt as _sqrt
+from operator import add as _add, gt as _gt, le as _le, mul as _mul, sub as _sub
+
+from mathutils import Matrix as _Matrix, Vector as _Vector
+
+from . import _character, _solver, _vehicle
+
+DEFAULTS = {
+    "iterations": 10,
+    "substeps": 1,
+    "solverType": 1,
+    "solverDamping": 1.0,
+    "solverTau": 0.6,
+    "sor": 1.0,
+    "airDamping": 0.0,
+    "deactivationTime": 2.0,
+    "linearThreshold": 0.8,
+    "angularThreshold": 1.0,
+    "contactThreshold": 0.02,
+    "ccdMode": 0,
+    "gravity": (0.0, 0.0, -9.8),
+}  # type: dict[str, object]
+"""Settings of the worlds of the scenes created from now on, see the setters of bge.constraints."""
+
+FRICTION = 0.5  # type: float
+"""Friction of the contacts with the level, the default friction of the Blender materials."""
+
+_COLUMNS = ("px", "py", "pz", "vx", "vy", "vz", "wx", "wy", "wz", "qw", "qx", "qy", "qz", "invMass", "invInertia",
+            "radius", "linearDamping", "angularDamping", "idle")
+_IDENTITY = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+_MAX_CELLS = 64
+"""Static boxes overlapping more grid cells are tested against every body near the level instead."""
+
+
+class PhysicsWorld:
+    """Dynamic objects of a scene, the static level geometry they collide with and the settings of the simulation."""
+
+    def __init__(self, scene):
+        # type: (object) -> None
+        self.scene = scene
+        self.iterations = DEFAULTS["iterations"]  # type: int
+        """Iterations of the constraint solver."""
+
+        self.substeps = DEFAULTS["substeps"]  # type: int
+        self.solverType = DEFAULTS["solverType"]  # type: int
+        self.solverDamping = DEFAULTS["solverDamping"]  # type: float
+        self.solverTau = DEFAULTS["solverTau"]  # type: float
+        self.sor = DEFAULTS["sor"]  # type: float
+        self.airDamping = DEFAULTS["airDamping"]  # type: float
+        """Linear damping added to the damping of every body."""
+
+        self.deactivationTime = DEFAULTS["deactivationTime"]  # type: float
+        """Seconds a body must rest below the thresholds before sleeping, 0 to never sleep."""
+
+        self.linearThreshold = DEFAULTS["linearThreshold"]  # type: float
+        self.angularThreshold = DEFAULTS["angularThreshold"]  # type: float
+        self.contactThreshold = DEFAULTS["contactThreshold"]  # type: float
+        """Distance under which a body is reported touching the level."""
+
+        self.ccdMode = DEFAULTS["ccdMode"]  # type: int
+        """Sweep the bodies moving more than their radius in a substep, so that they don't go through thin walls."""
+
+        self.objects = []  # type: list
+        """Object of each body, body i is object._body == i."""
+
+        self.moving = 0  # type: int
+        """Number of moving bodies, the bodies [0, moving) are integrated."""
+
+        self.awake = 0  # type: int
+        """Number of awake bodies, the bodies [moving, awake) are resting and the others sleeping."""
+
+        self.time = 0.0  # type: float
+        """Simulated time, the idle column of the resting bodies is the time they sleep at."""
+
+        self.gravity = DEFAULTS["gravity"]  # type: tuple[float, float, float]
+        """Gravity of the last step, the resting bodies are woken when it changes."""
+
+        for name in _COLUMNS:
+            setattr(self, name, [])
+
+        self.datas = []  # type: list[list[float]]
+        """Position list of the vector of each object, the positions are written back there after a step."""
+
+        self._columns = tuple(getattr(self, name) for name in _COLUMNS) + (self.objects, self.datas)
+        self.forces = {}  # type: dict[object, list[float]]
+        """Force and torque x, y, z applied to objects until the next step."""
+
+        self.moved = {}  # type: dict[object, None]
+        """Bodies whose object was moved since the last step, their position is read again."""
+
+        self.limited = {}  # type: dict[object, None]
+        """Bodies with minimum or maximum velocities."""
+
+        self.resting = {}  # type: dict[object, tuple]
+        """Last contact (level object, point, normal) of the moving bodies pushed by the level during the last step."""
+
+        self.standing = {}  # type: dict[object, tuple]
+        """Contact of the resting and sleeping bodies reported every step, only kept if its objects listen to it."""
+
+        self.spinning = False  # type: bool
+        """True if an awake body had an angular velocity in the last substep."""
+
+        self.touching = {}  # type: dict[tuple[object, object], tuple]
+        """(level object, point, normal) of the contacts of the last step by (body, level object)."""
+
+        self.constraints = {}  # type: dict[int, _solver.Constraint]
+        """Constraints by id, see bge.constraints.createConstraint()."""
+
+        self.islands = []  # type: list[_solver.Island]
+        self.islandOf = {}  # type: dict[object, _solver.Island]
+        self.islandsDirty = False  # type: bool
+        self.ids = {}  # type: dict[int, object]
+        """Objects by physics id, see KX_GameObject.getPhysicsId()."""
+
+        self.vehicles = {}  # type: dict[int, _vehicle.Vehicle]
+        """Vehicles by constraint id, see bge.constraints.createVehicle(). Their chassis never sleep, like in the BGE."""
+
+        self.characters = {}  # type: dict[object, _character.Character]
+        """Characters by object, see bge.constraints.getCharacter()."""
+
+        self.attached = {}  # type: dict[object, None]
+        """Objects moved by the physics without a body, the wheels of the vehicles and the characters. They stand on the
+        level, they aren't a part of it."""
+
+        self.snapshots = None  # type: object
+        """Ring buffer of the snapshots of the world, created by the first KX_Scene.snapshotPhysics()."""
+
+        self.touched = {}  # type: dict[object, None]
+        """Bodies whose state may have changed since the last snapshot, only recorded once snapshots are taken."""
+
+        self.staticDirty = True  # type: bool
+        self.boxes = []  # type: list[tuple]
+        """(object, low x, y, z, high x, y, z) of the level."""
+
+        self.shapes = []  # type: list[tuple]
+        """(object, low x, y, z, high x, y, z, orientation rows or None if not turned, center x, y, z, half extent x, y, z)
+        of the level, the oriented boxes the characters collide with."""
+
+        self.level = None  # type: _character.LevelTree | None
+        """Bounding volume hierarchy of the shapes, built by the first step of the characters after the level changes."""
+
+        self.cells = {}  # type: dict[tuple[int, int, int], list[tuple]]
+        self.large = []  # type: list[tuple]
+        self.bounds = None  # type: tuple | None
+        """Bounding box of the level grown by the reach of the largest body."""
+
+        self.cellSize = 4.0  # type: float
+        self.margin = 0.0  # type: float
+        """Largest body radius when the grid was built, each box is filed in the cells a body could touch it from."""
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.objects)
+
+    def register(self, object):
+        # type: (object) -> None
+        """Add an object entering the scene: a body if it has dynamics, else maybe a part of the level."""
+
+        if object._mass > 0.0 and not object._suspended:
+            self.add(object)
+
+        elif isStatic(object):
+            self.staticDirty = True
+
+    def unregister(self, object):
+        # type: (object) -> None
+        if object._body is not None:
+            self.remove(object)
+
+        elif isStatic(object):
+            self.staticDirty = True
+
+        # The constraints of an object are deleted with it, like KX_GameObject::RemoveConstraints()
+        self.ids.pop(id(object), None)
+
+        for constraint in [constraint for constraint in self.constraints.values()
+                           if object is constraint.objectA or object is constraint.objectB]:
+            self.removeConstraint(constraint)
+
+        for vehicle in [vehicle for vehicle in self.vehicles.values() if object is vehicle.chassis]:
+            self.removeVehicle(vehicle)
+
+        self.removeCharacter(object)
+
+    def physicsId(self, object):
+        # type: (object) -> int
+        self.ids[id(object)] = object
+        return id(object)
+
+    def addConstraint(self, constraint):
+        # type: (_solver.Constraint) -> None
+        self.constraints[constraint.id] = constraint
+        self.islandsDirty = True
+        self.wakeConstraint(constraint)
+
+    def removeConstraint(self, constraint):
+        # type: (_solver.Constraint) -> None
+        if self.constraints.pop(constraint.id, None) is not None:
+            self.islandsDirty = True
+            self.wakeConstraint(constraint)
+
+    def addVehicle(self, vehicle):
+        # type: (_vehicle.Vehicle) -> None
+        self.vehicles[vehicle.id] = vehicle
+        self.wake(vehicle.chassis)
+
+    def removeVehicle(self, vehicle):
+        # type: (_vehicle.Vehicle) -> None
+        if self.vehicles.pop(vehicle.id, None) is not None:
+            # The objects of its wheels may be part of the level again
+            for object in vehicle.objects:
+                self.attached.pop(object, None)
+
+            self.staticDirty = True
+
+    def addCharacter(self, object):
+        # type: (object) -> _character.Character
+        """Make an object without a body a character, its capsule has the physics radius of the object and the height
+        of its meshes."""
+
+        radius = _bodyRadius(object)
+        box = _meshBox(object) if object.meshes else None
+        half = max(0.0, (box[1][2] - box[0][2]) * 0.5 - radius) if box is not None else 0.0
+        character = self.characters[object] = _character.Character(self, object, radius, half)
+        self.attached[object] = None
+
+        if isStatic(object):
+            self.staticDirty = True
+
+        return character
+
+    def removeCharacter(self, object):
+        # type: (object) -> None
+        if self.characters.pop(object, None) is not None:
+            self.attached.pop(object, None)
+
+    def wakeConstraint(self, constraint):
+        # type: (_solver.Constraint) -> None
+        for object in constraint.bodies:
+            self.wake(object)
+
+    def transform(self, object):
+        # type: (object) -> tuple[tuple, tuple]
+        """(position, rotation rows) of a body from its state, of other objects from the object."""
+
+        index = object._body if object is not None else None
+
+        if index is None:
+            return _solver._transform(object)
+
+        return ((self.px[index], self.py[index], self.pz[index]),
+                _rows(self.qw[index], self.qx[index], self.qy[index], self.qz[index]))
+
+    def add(self, object):
+        # type: (object) -> None
+        """Create the body of an object, awake, with the velocities stored on the object."""
+
+        position = object._position
+
+        if position is None or object._body is not None:
+            return
+
+        data = position._data
+        x, y, z = data[:3]
+        vx, vy, vz = object._linearVelocity
+        wx, wy, wz = object._angularVelocity
+        qw, qx, qy, qz = _quaternion(object._orientation)
+        radius = _bodyRadius(object)
+        inverse = 1.0 / object._mass
+        values = (x, y, z, vx, vy, vz, wx, wy, wz, qw, qx, qy, qz, inverse, inverse / (0.4 * radius * radius),
+                  radius, object._linearDamping, object._angularDamping, 0.0, object, data)
+
+        for column, value in zip(self._columns, values):
+            column.append(value)
+
+        object._body = len(self.objects) - 1
+        self.wake(object)
+
+        if self.constraints:
+            self.islandsDirty = True
+
+        if any(object._limits):
+            self.limited[object] = None
+
+        if radius > self.margin or isStatic(object):
+            self.staticDirty = True
+
+    def remove(self, object):
+        # type: (object) -> None
+        """Delete the body of an object, its velocities are stored back on the object."""
+
+        index = object._body
+        object._linearVelocity = [self.vx[index], self.vy[index], self.vz[index]]
+        object._angularVelocity = [self.wx[index], self.wy[index], self.wz[index]]
+
+        index = self._retire(index)
+        self._swap(index, len(self.objects) - 1)
+
+        for column in self._columns:
+            column.pop()
+
+        object._body = None
+
+        if self.snapshots is not None:
+            self.touched[object] = None
+
+        if self.constraints:
+            self.islandsDirty = True
+
+        for bodies in (self.forces, self.moved, self.limited, self.resting, self.standing):
+            bodies.pop(object, None)
+
+        if isStatic(object):
+            self.staticDirty = True
+
+    def setMass(self, object):
+        # type: (object) -> None
+        index = object._body
+        radius = self.radius[index]
+        self.invMass[index] = inverse = 1.0 / object._mass
+        self.invInertia[index] = inverse / (0.4 * radius * radius)
+
+    def setOrientation(self, object):
+        # type: (object) -> None
+        """Turn a body to the orientation written on its object."""
+
+        index = object._body
+        self.qw[index], self.qx[index], self.qy[index], self.qz[index] = _quaternion(object._orientation)
+        self.wake(object)
+
+    def setDamping(self, object):
+        # type: (object) -> None
+        index = object._body
+        self.linearDamping[index] = object._linearDamping
+        self.angularDamping[index] = object._angularDamping
+
+    def setLimits(self, object):
+        # type: (object) -> None
+        if any(object._limits):
+            self.limited[object] = None
+
+        else:
+            self.limited.pop(object, None)
+
+    def _swap(self, i, j):
+        # type: (int, int) -> None
+        if i == j:
+            return
+
+        for column in self._columns:
+            column[i], column[j] = column[j], column[i]
+
+        objects = self.objects
+        objects[i]._body = i
+        objects[j]._body = j
+
+    def _retire(self, index):
+        # type: (int) -> int
+        """Move a body out of the moving and resting bodies, return its new index."""
+
+        if index < self.moving:
+            self.moving -= 1
+            self._swap(index, self.moving)
+            index = self.moving
+
+        if index < self.awake:
+            self.awake -= 1
+            self._swap(index, self.awake)
+            index = self.awake
+
+        return index
+
+    def wake(self, object):
+        # type: (object) -> None
+        index = object._body
+        self.idle[index] = 0.0
+        self.standing.pop(object, None)
+
+        if index >= self.awake:
+            self._swap(index, self.awake)
+            index = self.awake
+            self.awake += 1
+
+        if index >= self.moving:
+            self._swap(index, self.moving)
+            self.moving += 1
+
+    def rest(self, object, contact):
+        # type: (object, tuple) -> None
+        """Stop integrating a moving body stopped by the level, it sleeps after the rest of its deactivation time."""
+
+        index = object._body
+        remaining = self.deactivationTime - self.idle[index]
+        self.moving -= 1
+        self._swap(index, self.moving)
+        self.idle[self.moving] = self.time + max(0.0, remaining) if self.deactivationTime else float("inf")
+
+        if contact is not None:
+            self._stand(object, contact)
+
+    def sleep(self, object):
+        # type: (object) -> None
+        index = object._body
+
+        for column in (self.vx, self.vy, self.vz, self.wx, self.wy, self.wz):
+            column[index] = 0.0
+
+        contact = self.resting.get(object)
+        self._retire(index)
+
+        if contact is not None:
+            self._stand(object, contact)
+
+    def _stand(self, object, contact):
+        # type: (object, tuple) -> None
+        other = contact[0]
+
+        if object.collisionCallbacks or object.sensors._items or other.collisionCallbacks or other.sensors._items:
+            self.standing[object] = contact
+
+    def velocity(self, object, angular=False):
+        # type: (object, bool) -> list[float]
+        """World linear or angular velocity of a body."""
+
+        index = object._body
+
+        if angular:
+            return [self.wx[index], self.wy[index], self.wz[index]]
+
+        return [self.vx[index], self.vy[index], self.vz[index]]
+
+    def setVelocity(self, object, velocity, angular=False):
+        # type: (object, list[float], bool) -> None
+        self.wake(object)
+        index = object._body
+        columns = (self.wx, self.wy, self.wz) if angular else (self.vx, self.vy, self.vz)
+
+        for column, value in zip(columns, velocity):
+            column[index] = value
+
+    def applyForce(self, object, force, torque=False):
+        # type: (object, list[float], bool) -> None
+        """Accumulate a world force or torque on a body for the next step."""
+
+        self.wake(object)
+        forces = self.forces.get(object)
+
+        if forces is None:
+            forces = self.forces[object] = [0.0] * 6
+
+        offset = 3 if torque else 0
+
+        for axis in range(3):
+            forces[offset + axis] += force[axis]
+
+    def applyImpulse(self, object, point, impulse):
+        # type: (object, list[float], list[float]) -> None
+        """Change the velocities of a body by a world impulse at a world point, the rotation only for rigid bodies."""
+
+        self.wake(object)
+        index = object._body
+        inverse = self.invMass[index]
+        jx, jy, jz = impulse
+        self.vx[index] += jx * inverse
+        self.vy[index] += jy * inverse
+        self.vz[index] += jz * inverse
+
+        if object._rigidBody:
+            rx, ry, rz = point[0] - self.px[index], point[1] - self.py[index], point[2] - self.pz[index]
+            inverse = self.invInertia[index]
+            self.wx[index] += (ry * jz - rz * jy) * inverse
+            self.wy[index] += (rz * jx - rx * jz) * inverse
+            self.wz[index] += (rx * jy - ry * jx) * inverse
+
+    def step(self, timestep):
+        # type: (float) -> None
+        """Advance the simulation by a logic frame, in substeps, and write the new positions to the objects."""
+
+        if self.moved:
+            self._teleport()
+
+        if self.staticDirty:
+            self._buildStatics()
+
+        gravity = tuple(self.scene.gravity)
+
+        if gravity != self.gravity:
+            # The resting bodies were only held by the previous gravity
+            self.gravity = gravity
+
+            while self.moving < self.awake:
+                self.wake(self.objects[self.moving])
+
+        if self.islandsDirty:
+            self.islandsDirty = False
+            self.islands = _solver.buildIslands(list(self.constraints.values()))
+            self.islandOf = {object: island for island in self.islands for object in island.bodies}
+
+        for island in self.islands:
+            # An island moves as a whole
+            moving = self.moving
+
+            if any(object._body < moving for object in island.bodies):
+                for object in island.bodies:
+                    if object._body >= self.moving:
+                        self.wake(object)
+
+        if self.snapshots is not None:
+            # Only the moving bodies change during the step
+            self.touched.update(dict.fromkeys(self.objects[:self.moving]))
+
+        self.touching = {}
+        self.time += timestep
+        resting = {}
+
+        substeps = max(1, int(self.substeps))
+        dt = timestep / substeps
+
+        if self.moving:
+            for _ in range(substeps):
+                self._integrate(dt)
+                self._collide(dt, resting)
+
+            self._sync()
+
+        if self.characters:
+            # The characters only collide with the level, they don't need to be stepped between the bodies
+            for _ in range(substeps):
+                _character.update(self, dt)
+
+        self.forces.clear()
+        self._sleep(timestep, resting)
+        self._report()
+
+    def _teleport(self):
+        # type: () -> None
+        """Read the positions of the bodies moved from outside, the objects are marked before the change is done."""
+
+        moved, self.moved = self.moved, {}
+
+        for object in moved:
+            index = object._body
+
+            if index is None or object._position is None:
+                continue
+
+            data = object._position._data
+            self.datas[index] = data
+            self.px[index], self.py[index], self.pz[index] = data[:3]
+            self.wake(object)
+
+    def _integrate(self, dt):
+        # type: (float) -> None
+        count = self.moving
+        vx, vy, vz, wx, wy, wz = self.vx, self.vy, self.vz, self.wx, self.wy, self.wz
+
+        if self.vehicles:
+            # The wheels push the chassis from the velocities of the end of the last substep, like the actions of
+            # btDiscreteDynamicsWorld, the suspensions don't see the gravity of this one
+            _vehicle.update(self, dt)
+
+        for object, (fx, fy, fz, tx, ty, tz) in self.forces.items():
+            index = object._body
+            scale = self.invMass[index] * dt
+            vx[index] += fx * scale
+            vy[index] += fy * scale
+            vz[index] += fz * scale
+
+            if tx or ty or tz:
+                scale = self.invInertia[index] * dt
+                wx[index] += tx * scale
+                wy[index] += ty * scale
+                wz[index] += tz * scale
+
+        for column, gravity in zip((vx, vy, vz), self.scene.gravity):
+            if gravity:
+                column[:count] = map(_add, _islice(column, count), _repeat(gravity * dt))
+
+        # v *= (1 - damping) ^ dt like btRigidBody::applyDamping, skipped while nothing is damped
+        air = self.airDamping
+
+        if air or any(_islice(self.linearDamping, count)):
+            factors = list(map(pow, map(_sub, _repeat(1.0), _islice(self.linearDamping, count)), _repeat(dt)))
+
+            if air:
+                factors = list(map(_mul, factors, _repeat((1.0 - air) ** dt)))
+
+            for column in (vx, vy, vz):
+                column[:count] = map(_mul, _islice(column, count), factors)
+
+        spinning = self.spinning = any(_islice(wx, count)) or any(_islice(wy, count)) or any(_islice(wz, count))
+
+        if spinning and any(_islice(self.angularDamping, count)):
+            factors = list(map(pow, map(_sub, _repeat(1.0), _islice(self.angularDamping, count)), _repeat(dt)))
+
+            for column in (wx, wy, wz):
+                column[:count] = map(_mul, _islice(column, count), factors)
+
+        if self.limited:
+            self._limit()
+
+        if self.islands:
+            _solver.solve(self, dt)
+            spinning = self.spinning = (any(_islice(wx, count)) or any(_islice(wy, count)) or
+                                        any(_islice(wz, count)))
+
+        for position, velocity in ((self.px, vx), (self.py, vy), (self.pz, vz)):
+            if any(_islice(velocity, count)):
+                position[:count] = map(_add, _islice(position, count), map(_mul, _islice(velocity, count), _repeat(dt)))
+
+        if spinning:
+            self._spin(dt)
+
+    def _limit(self):
+        # type: () -> None
+        """Clamp the velocities of the bodies with limits, like KX_BulletPhysicsController."""
+
+        count = self.moving
+
+        for object in self.limited:
+            index = object._body
+
+            if index >= count:
+                continue
+
+            linearMin, linearMax, angularMin, angularMax = object._limits
+
+            for columns, low, high in (((self.vx, self.vy, self.vz), linearMin, linearMax),
+                                       ((self.wx, self.wy, self.wz), angularMin, angularMax)):
+                x, y, z = columns[0][index], columns[1][index], columns[2][index]
+                speed = _sqrt(x * x + y * y + z * z)
+
+                if high and speed > high:
+                    scale = high / speed
+
+                elif low and 0.0 < speed < low:
+                    scale = low / speed
+
+                else:
+                    continue
+
+                columns[0][index], columns[1][index], columns[2][index] = x * scale, y * scale, z * scale
+
+    def _spin(self, dt):
+        # type: (float) -> None
+        """Integrate the orientations of the spinning bodies, q += dt / 2 * w * q."""
+
+        wx, wy, wz, qw, qx, qy, qz = self.wx, self.wy, self.wz, self.qw, self.qx, self.qy, self.qz
+        count = self.moving
+        half = dt * 0.5
+
+        for index in _compress(range(count), map(any, zip(wx, wy, wz))):
+            x, y, z = wx[index] * half, wy[index] * half, wz[index] * half
+            w0, x0, y0, z0 = qw[index], qx[index], qy[index], qz[index]
+            w1 = w0 - x * x0 - y * y0 - z * z0
+            x1 = x0 + x * w0 + y * z0 - z * y0
+            y1 = y0 + y * w0 + z * x0 - x * z0
+            z1 = z0 + z * w0 + x * y0 - y * x0
+            length = _sqrt(w1 * w1 + x1 * x1 + y1 * y1 + z1 * z1)
+            qw[index], qx[index], qy[index], qz[index] = w1 / length, x1 / length, y1 / length, z1 / length
+
+    def _collide(self, dt, resting):
+        # type: (float, dict) -> None
+        """Push the awake bodies out of the level and remove their velocity into it, with friction."""
+
+        if self.staticDirty:
+            self._buildStatics()
+
+        if not self.boxes:
+            return
+
+        count = self.moving
+        px, py, pz, vx, vy, vz = self.px, self.py, self.pz, self.vx, self.vy, self.vz
+        radius = self.radius
+        objects = self.objects
+        low, high = self.bounds
+        # Most bodies are far above or below the level, they are filtered out a whole component at once
+        candidates = _compress(range(count), map(_le, _islice(pz, count), _repeat(high[2])))
+        candidates = [index for index in candidates if pz[index] >= low[2]]
+
+        if self.ccdMode:
+            self._sweep(dt, candidates)
+
+        cells = self.cells
+        large = self.large
+        size = 1.0 / self.cellSize
+        reach = self.contactThreshold
+        touching = self.touching
+        lowX, lowY, _ = low
+        highX, highY, _ = high
+
+        for index in candidates:
+            x, y, z = px[index], py[index], pz[index]
+
+            if x < lowX or x > highX or y < lowY or y > highY:
+                continue
+
+            r = radius[index]
+            limit = r + reach
+            limit *= limit
+            boxes = large
+
+            if cells:
+                cell = cells.get((_floor(x * size), _floor(y * size), _floor(z * size)))
+
+                if cell:
+                    boxes = large + cell
+
+            for box in boxes:
+                object, x0, y0, z0, x1, y1, z1 = box
+                cx = x0 if x < x0 else (x1 if x > x1 else x)
+                cy = y0 if y < y0 else (y1 if y > y1 else y)
+                cz = z0 if z < z0 else (z1 if z > z1 else z)
+                dx, dy, dz = x - cx, y - cy, z - cz
+                distance = dx * dx + dy * dy + dz * dz
+
+                if distance >= limit:
+                    continue
+
+                if distance > 1e-18:
+                    distance = _sqrt(distance)
+                    nx, ny, nz = dx / distance, dy / distance, dz / distance
+                    depth = r - distance
+
+                else:
+                    # The center is inside the box, it leaves by the nearest face
+                    nx, ny, nz, depth = _nearestFace(x, y, z, box)
+                    depth += r
+
+                contact = (object, (cx, cy, cz), (nx, ny, nz))
+                touching[objects[index], object] = contact
+
+                if depth <= 0.0:
+                    continue
+
+                x += nx * depth
+                y += ny * depth
+                z += nz * depth
+                speed = vx[index] * nx + vy[index] * ny + vz[index] * nz
+
+                if speed < 0.0:
+                    # No restitution, the tangential velocity loses friction * the normal velocity removed
+                    ux = vx[index] - speed * nx
+                    uy = vy[index] - speed * ny
+                    uz = vz[index] - speed * nz
+                    tangent = _sqrt(ux * ux + uy * uy + uz * uz)
+                    scale = max(0.0, 1.0 - FRICTION * -speed / tangent) if tangent else 0.0
+                    vx[index], vy[index], vz[index] = ux * scale, uy * scale, uz * scale
+
+                resting[objects[index]] = contact
+
+            px[index], py[index], pz[index] = x, y, z
+
+    def _sweep(self, dt, candidates):
+        # type: (float, list[int]) -> None
+        """Move back the bodies that went through a box in this substep to where they hit it."""
+
+        count = self.moving
+        px, py, pz, vx, vy, vz = self.px, self.py, self.pz, self.vx, self.vy, self.vz
+        # Only the bodies faster than the smallest radius per substep can skip a box
+        limit = min(_islice(self.radius, count)) / dt
+        fast = set()
+
+        for column in (vx, vy, vz):
+            fast.update(_compress(range(count), map(_gt, map(abs, _islice(column, count)), _repeat(limit))))
+
+        listed = set(candidates)
+
+        for index in sorted(fast):
+            r = self.radius[index]
+            x1, y1, z1 = px[index], py[index], pz[index]
+            x0, y0, z0 = x1 - vx[index] * dt, y1 - vy[index] * dt, z1 - vz[index] * dt
+            start, end = (x0, y0, z0), (x1, y1, z1)
+            hit = 1.0
+
+            for box in self._boxesAlong(start, end, r):
+                hit = min(hit, _segmentBox(start, end, box, r))
+
+            if hit < 1.0:
+                px[index], py[index], pz[index] = x0 + (x1 - x0) * hit, y0 + (y1 - y0) * hit, z0 + (z1 - z0) * hit
+
+                if index not in listed:
+                    candidates.append(index)
+
+    def castRays(self, starts, ends, masks):
+        # type: (list[tuple], list[tuple], list[int]) -> list[tuple | None]
+        """First box of the level hit by each segment, whose object has a collision group in the mask of the segment:
+        (fraction, object, normal x, y, z), None if it hits nothing.
+
+        The segments are resolved together, the boxes of the cells a segment crosses are gathered once for all the
+        segments crossing the same cells. A segment starting inside a box hits it at once, by its nearest face."""
+
+        if self.staticDirty:
+            self._buildStatics()
+
+        hits = [None] * len(starts)
+
+        if not self.boxes:
+            return hits
+
+        (lowX, lowY, lowZ), (highX, highY, highZ) = self.bounds
+        size = 1.0 / self.cellSize
+        gathered = {}
+
+        for ray, (x0, y0, z0), (x1, y1, z1), mask in zip(range(len(hits)), starts, ends, masks):
+            if x0 < x1:
+                left, right = x0, x1
+
+            else:
+                left, right = x1, x0
+
+            if y0 < y1:
+                back, front = y0, y1
+
+            else:
+                back, front = y1, y0
+
+            if z0 < z1:
+                bottom, top = z0, z1
+
+            else:
+                bottom, top = z1, z0
+
+            if right < lowX or left > highX or front < lowY or back > highY or top < lowZ or bottom > highZ:
+                continue
+
+            key = (_floor(left * size), _floor(back * size), _floor(bottom * size), _floor(right * size),
+                   _floor(front * size), _floor(top * size))
+            boxes = gathered.get(key)
+
+            if boxes is None:
+                boxes = gathered[key] = self._boxesIn(key[:3], key[3:])
+
+            dx, dy, dz = x1 - x0, y1 - y0, z1 - z0
+            nearest = 1.0
+            hit = None
+
+            for box in boxes:
+                object, bx0, by0, bz0, bx1, by1, bz1 = box
+
+                if not object.collisionGroup & mask:
+                    continue
+
+                # Slab test, the segment enters the box by the face of the last slab it enters
+                enter, leave = 0.0, nearest
+                normal = None
+
+                for origin, delta, low, high, axis in ((x0, dx, bx0, bx1, 0), (y0, dy, by0, by1, 1),
+                                                       (z0, dz, bz0, bz1, 2)):
+                    if not delta:
+                        if origin < low or origin > high:
+                            break
+
+                        continue
+
+                    t0, t1 = (low - origin) / delta, (high - origin) / delta
+                    side = -1.0
+
+                    if t0 > t1:
+                        t0, t1 = t1, t0
+                        side = 1.0
+
+                    if t0 > enter:
+                        enter, normal = t0, (axis, side)
+
+                    if t1 < leave:
+                        leave = t1
+
+                    if enter > leave:
+                        break
+
+                else:
+                    if normal is None:
+                        nx, ny, nz, _ = _nearestFace(x0, y0, z0, box)
+
+                    else:
+                        axis, side = normal
+                        nx, ny, nz = (side if axis == 0 else 0.0, side if axis == 1 else 0.0,
+                                      side if axis == 2 else 0.0)
+
+                    nearest = enter
+                    hit = (enter, object, nx, ny, nz)
+
+            hits[ray] = hit
+
+        return hits
+
+    def _boxesAlong(self, start, end, radius):
+        # type: (tuple, tuple, float) -> list[tuple]
+        size = 1.0 / self.cellSize
+        low = [_floor((min(a, b) - radius) * size) for a, b in zip(start, end)]
+        high = [_floor((max(a, b) + radius) * size) for a, b in zip(start, end)]
+        return self._boxesIn(low, high)
+
+    def _boxesIn(self, low, high):
+        # type: (tuple, tuple) -> list[tuple]
+        """Boxes of the grid cells from low to high, inclusive."""
+
+        found = dict.fromkeys(self.large)
+
+        if (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1) > len(self.cells):
+            for boxes in self.cells.values():
+                found.update(dict.fromkeys(boxes))
+
+            return list(found)
+
+        for i in range(low[0], high[0] + 1):
+            for j in range(low[1], high[1] + 1):
+                for k in range(low[2], high[2] + 1):
+                    found.update(dict.fromkeys(self.cells.get((i, j, k), ())))
+
+        return list(found)
+
+    def _buildStatics(self):
+        # type: () -> None
+        """File the boxes of the level in the grid, the resting and sleeping bodies are woken as they may have lost their
+        support."""
+
+        self.staticDirty = False
+        count = len(self.objects)
+        margin = self.margin = max(self.radius) if count else 0.0
+        size = self.cellSize = max(4.0, 4.0 * margin)
+        # A body can touch the boxes of the cell of its center
+        reach = margin + self.contactThreshold
+        boxes = []
+        shapes = []
+        attached = self.attached
+
+        for object in self.scene.objects._items:
+            if object._body is None and not object.invalid and isStatic(object) and object not in attached:
+                bounds = _meshBounds(object)
+
+                if bounds is not None:
+                    middle, extent, rows = bounds
+                    rows = tuple(tuple(map(float, row)) for row in rows)
+                    half = [sum(abs(rows[axis][column]) * extent[column] for column in range(3)) for axis in range(3)]
+                    box = tuple(m - h for m, h in zip(middle, half)) + tuple(m + h for m, h in zip(middle, half))
+                    boxes.append((object,) + box)
+                    # The boxes of the objects turned are ramps and slopes for the characters
+                    turned = rows if rows != _IDENTITY else None
+                    shapes.append((object,) + box + (turned,) + tuple(middle) + tuple(extent))
+
+        cells = {}
+        large = []
+
+        for box in boxes:
+            i0, j0, k0 = [_floor((value - reach) / size) for value in box[1:4]]
+            i1, j1, k1 = [_floor((value + reach) / size) for value in box[4:7]]
+
+            if (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1) > _MAX_CELLS:
+                large.append(box)
+                continue
+
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    for k in range(k0, k1 + 1):
+                        cells.setdefault((i, j, k), []).append(box)
+
+        self.boxes = boxes
+        self.shapes = shapes
+        self.level = None
+        self.cells = cells
+        self.large = large
+        self.bounds = None
+
+        if boxes:
+            self.bounds = (tuple(min(box[axis] for box in boxes) - reach for axis in (1, 2, 3)),
+                           tuple(max(box[axis] for box in boxes) + reach for axis in (4, 5, 6)))
+
+        while self.moving < count:
+            self.wake(self.objects[self.moving])
+
+    def _sync(self):
+        # type: () -> None
+        """Write the positions and orientations of the moving bodies to their objects."""
+
+        count = self.moving
+        objects = self.objects[:count]
+
+        # The position lists are written directly, the objects are marked moved in the broadphase all at once
+        for data, x, y, z in zip(self.datas, self.px, self.py, _islice(self.pz, count)):
+            data[0] = x
+            data[1] = y
+            data[2] = z
+
+        self.scene._spatial.dirty.update(dict.fromkeys(objects))
+
+        if self.spinning:
+            qw, qx, qy, qz = self.qw, self.qx, self.qy, self.qz
+
+            for index in _compress(range(count), map(any, zip(self.wx, self.wy, self.wz))):
+                objects[index]._orientation = _Matrix(_rows(qw[index], qx[index], qy[index], qz[index]))
+
+        if self.vehicles:
+            _vehicle.place(self)
+
+    def _report(self):
+        # type: () -> None
+        """Report the contacts of the step and of the resting and sleeping bodies to the objects listening to them."""
+
+        contacts = [(object, contact) for (object, _), contact in self.touching.items()]
+        contacts.extend(self.standing.items())
+
+        for object, (other, point, normal) in contacts:
+            if object.collisionCallbacks or object.sensors._items:
+                object._collide(other, _Vector(point), _Vector(normal))
+
+            if other.collisionCallbacks or other.sensors._items:
+                other._collide(object, _Vector(point), _Vector([-value for value in normal]))
+
+    def _sleep(self, timestep, resting):
+        # type: (float, dict) -> None
+        """Rest the moving bodies stopped by the level and deactivate the bodies slower than the thresholds for the
+        deactivation time, like btRigidBody::updateDeactivation.
+
+        Under gravity only the bodies pushed by the level can stay slow, the others aren't gone through."""
+
+        previous, self.resting = self.resting, resting
+        idle = self.idle
+        moving = self.moving
+
+        for object in previous.keys() - resting.keys():
+            index = object._body
+
+            if index is not None and index < moving:
+                idle[index] = 0.0
+
+        vx, vy, vz, wx, wy, wz = self.vx, self.vy, self.vz, self.wx, self.wy, self.wz
+        bodies = resting
+
+        if not any(self.gravity):
+            # Without gravity every stopped body stays where it is
+            bodies = dict.fromkeys(self.objects[:moving])
+            bodies.update(resting)
+
+        elif self.islandOf:
+            # The constraints can hold bodies away from the level
+            bodies = dict(resting)
+            bodies.update((object, None) for object in self.islandOf if object._body < moving)
+
+        if self.vehicles:
+            bodies = dict(bodies)
+
+            for vehicle in self.vehicles.values():
+                bodies.pop(vehicle.chassis, None)
+
+        linear = self.linearThreshold * self.linearThreshold
+        angular = self.angularThreshold * self.angularThreshold
+        deactivation = self.deactivationTime
+        stopped = []
+        asleep = []
+
+        islandOf = self.islandOf
+
+        for object in bodies:
+            index = object._body
+            x, y, z, u, v, w = vx[index], vy[index], vz[index], wx[index], wy[index], wz[index]
+
+            if not (x or y or z or u or v or w) and object not in islandOf:
+                stopped.append(object)
+
+            elif x * x + y * y + z * z < linear and u * u + v * v + w * w < angular:
+                idle[index] += timestep
+
+                if deactivation and idle[index] >= deactivation:
+                    asleep.append(object)
+
+            else:
+                idle[index] = 0.0
+
+        for object in stopped:
+            self.rest(object, resting.get(object))
+
+        for object in asleep:
+            island = islandOf.get(object)
+
+            if island is None:
+                self.sleep(object)
+
+            elif all(idle[body._body] >= deactivation for body in island.bodies if body._body < self.awake):
+                # An island sleeps as a whole, once all its bodies are slow enough
+                for body in island.bodies:
+                    if body._body < self.awake:
+                        self.sleep(body)
+
+        # The idle column of the resting bodies is the time they sleep at
+        objects = self.objects
+        due = _compress(range(self.moving, self.awake), map(_le, _islice(idle, self.moving, self.awake),
+                                                            _repeat(self.time)))
+
+        for object in [objects[index] for index in due]:
+            self.sleep(object)
+
+
+def isStatic(object):
+    # type: (object) -> bool
+    """True if the object is part of the level when it has no body: it has a mesh and collisions."""
+
+    return bool(object.meshes) and not object._ghost
+
+
+def _bodyRadius(object):
+    # type: (object) -> float
+    radius = object._radius
+    scale = object._scale
+
+    if scale is not None:
+        radius *= max(abs(scale[0]), abs(scale[1]), abs(scale[2]))
+
+    return radius or 1.0
+
+
+def _meshBox(object):
+    # type: (object) -> tuple[list[float], list[float]] | None
+    """World bounding box (low, high) of the meshes of an object, None if they have no vertices."""
+
+    bounds = _meshBounds(object)
+
+    if bounds is None:
+        return None
+
+    middle, extent, rows = bounds
+    half = [sum(abs(rows[axis][column]) * extent[column] for column in range(3)) for axis in range(3)]
+    return [m - h for m, h in zip(middle, half)], [m + h for m, h in zip(middle, half)]
+
+
+def _meshBounds(object):
+    # type: (object) -> tuple[list[float], list[float], tuple] | None
+    """(world center, half extents, orientation rows) of the oriented bounding box of the meshes of an object, None if
+    they have no vertices."""
+
+    low = [float("inf")] * 3
+    high = [float("-inf")] * 3
+
+    for mesh in object.meshes:
+        for array in getattr(mesh, "_arrays", ()):
+            if array.count:
+                for axis in range(3):
+                    values = array.positions[axis::3]
+                    low[axis] = min(low[axis], min(values))
+                    high[axis] = max(high[axis], max(values))
+
+    if low[0] > high[0] or object._position is None:
+        return None
+
+    scale = object._scale or (1.0, 1.0, 1.0)
+    center = [(l + h) * 0.5 * s for l, h, s in zip(low, high, scale)]
+    extent = [(h - l) * 0.5 * abs(s) for l, h, s in zip(low, high, scale)]
+    rows = object._orientation or ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+    position = object._position._data
+    middle = [position[axis] + sum(rows[axis][column] * center[column] for column in range(3)) for axis in range(3)]
+    return middle, extent, rows
+
+
+def _nearestFace(x, y, z, box):
+    # type: (float, float, float, tuple) -> tuple[float, float, float, float]
+    """(normal x, y, z, distance) of the face of a box nearest to a point inside it."""
+
+    _, x0, y0, z0, x1, y1, z1 = box
+    faces = ((x - x0, -1.0, 0.0, 0.0), (x1 - x, 1.0, 0.0, 0.0), (y - y0, 0.0, -1.0, 0.0), (y1 - y, 0.0, 1.0, 0.0),
+             (z - z0, 0.0, 0.0, -1.0), (z1 - z, 0.0, 0.0, 1.0))
+    distance, nx, ny, nz = min(faces)
+    return nx, ny, nz, distance
+
+
+def _segmentBox(start, end, box, grow):
+    # type: (tuple, tuple, tuple, float) -> float
+    """Fraction of a segment where it enters a box grown on all sides, 1.0 if it doesn't enter it (slab test)."""
+
+    enter, leave = 0.0, 1.0
+
+    for axis in range(3):
+        origin = start[axis]
+        delta = end[axis] - origin
+        low, high = box[1 + axis] - grow, box[4 + axis] + grow
+
+        if not delta:
+            if not low <= origin <= high:
+                return 1.0
+
+            continue
+
+        t0, t1 = (low - origin) / delta, (high - origin) / delta
+
+        if t0 > t1:
+            t0, t1 = t1, t0
+
+        enter, leave = max(enter, t0), min(leave, t1)
+
+        if enter > leave:
+            return 1.0
+
+    return enter if enter > 0.0 else 1.0
+
+
+def _quaternion(orientation):
+    # type: (object) -> tuple[float, float, float, float]
+    """(w, x, y, z) of a rotation matrix, identity for None."""
+
+    if orientation is None:
+        return 1.0, 0.0, 0.0, 0.0
+
+    m = [[float(value) for value in orientation[row]] for row in range(3)]
+    trace = m[0][0] + m[1][1] + m[2][2]
+
+    if trace > 0.0:
+        s = _sqrt(trace + 1.0) * 2.0
+        q = (0.25 * s, (m[2][1] - m[1][2]) / s, (m[0][2] - m[2][0]) / s, (m[1][0] - m[0][1]) / s)
+
+    elif m[0][0] > m[1][1] and m[0][0] > m[2][2]:
+        s = _sqrt(1.0 + m[0][0] - m[1][1] - m[2][2]) * 2.0
+        q = ((m[2][1] - m[1][2]) / s, 0.25 * s, (m[0][1] + m[1][0]) / s, (m[0][2] + m[2][0]) / s)
+
+    elif m[1][1] > m[2][2]:
+        s = _sqrt(1.0 + m[1][1] - m[0][0] - m[2][2]) * 2.0
+        q = ((m[0][2] - m[2][0]) / s, (m[0][1] + m[1][0]) / s, 0.25 * s, (m[1][2] + m[2][1]) / s)
+
+    else:
+        s = _sqrt(1.0 + m[2][2] - m[0][0] - m[1][1]) * 2.0
+        q = ((m[1][0] - m[0][1]) / s, (m[0][2] + m[2][0]) / s, (m[1][2] + m[2][1]) / s, 0.25 * s)
+
+    length = _sqrt(sum(value * value for value in q)) or 1.0
+    return tuple(value / length for value in q)
+
+
+def _rows(w, x, y, z):
+    # type: (float, float, float, float) -> list[list[float]]
+    """Rotation matrix rows of a unit quaternion."""
+
+    return [[1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y)],
+            [2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)],
+            [2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)]]
@@ -0,0 +1,85 @@
+"""Free lists of the objects spawned by KX_Scene.addObject() and the frame timers of the scenes."""
+
+
+class ObjectPool:
+    """Ended replicas of one template, recycled by the next addObject() calls instead of copying the template again."""
+
+    __slots__ = ("template", "free", "hits", "misses")
+
+    limit = 1024  # type: int
+    """Maximum number of free objects kept per template, 0 disables the recycling. See bge.logic.setObjectPoolLimit()."""
+
+    def __init__(self, template):
+        # type: (object) -> None
+        self.template = template
+        self.free = []  # type: list
+        self.hits = 0  # type: int
+        self.misses = 0  # type: int
+
+    def acquire(self):
+        # type: () -> object
+        """A replica of the template, recycled when one is free."""
+
+        if self.free:
+            self.hits += 1
+            return self.template._replicate(self.free.pop())
+
+        self.misses += 1
+        return self.template._replicate()
+
+    def release(self, object):
+        # type: (object) -> None
+        """Keep an ended replica for a later acquire()."""
+
+        if len(self.free) < self.limit:
+            self.free.append(object)
+
+    def info(self):
+        # type: () -> dict[str, object]
+        spawned = self.hits + self.misses
+        return {"free": len(self.free), "hits": self.hits, "misses": self.misses,
+                "hitRate": self.hits / spawned if spawned else 0.0}
+
+
+class TimerWheel:
+    """Hashed timing wheel of the items due at a given scene frame: the timed objects to end, the sensors to wake...
+
+    A timer is filed in the slot of its frame modulo the wheel size, advancing one frame only looks at one slot, so the
+    cost doesn't depend on the number of living timed objects."""
+
+    __slots__ = ("slots", "mask", "count")
+
+    def __init__(self, size=256):
+        # type: (int) -> None
+        if size & (size - 1):
+            raise ValueError("TimerWheel: size must be a power of 2")
+
+        self.slots = [[] for _ in range(size)]  # type: list[list[tuple[int, object]]]
+        self.mask = size - 1  # type: int
+        self.count = 0  # type: int
+
+    def schedule(self, frame, item):
+        # type: (int, object) -> None
+        self.slots[frame & self.mask].append((frame, item))
+        self.count += 1
+
+    def advance(self, frame):
+        # type: (int) -> list
+        """Remove and return the items due at this frame, the wheel must be advanced through every frame."""
+
+        slot = self.slots[frame & self.mask]
+
+        if not slot:
+            return []
+
+        due = [item for when, item in slot if when <= frame]
+
+        if len(due) == len(slot):
+            del slot[:]
+
+        elif due:
+            # Timers more than one turn away stay in the slot
+            slot[:] = [entry for entry in slot if entry[0] > frame]
+
+        self.count -= len(due)
+        return due
@@ -0,0 +1,210 @@
+"""Snapshots of the physics state of a scene, see KX_Scene.snapshotPhysics() and KX_Scene.restorePhysics().
+
+The state of a body is a tuple: its components in the order of the columns of the world followed by its region (0
+moving, 1 resting, 2 sleeping). The tuples are immutable and shared, copy on write: a snapshot starts from a copy of the
+dictionary of the previous one and only builds the tuples of the bodies that changed since, the ones moving during a
+step or woken. Resting and sleeping bodies cost a dictionary entry per snapshot. The snapshots are kept in a ring buffer
+of fixed size, a new snapshot overwrites the oldest one."""
+
+from mathutils import Matrix as _Matrix, Vector as _Vector
+
+from ._physics import _COLUMNS, _rows
+
+CAPACITY = 64  # type: int
+"""Number of snapshots kept by a scene."""
+
+_ORIENTATION = slice(_COLUMNS.index("qw"), _COLUMNS.index("qz") + 1)
+
+
+class Snapshot:
+    """Physics state of a scene at a frame."""
+
+    __slots__ = ("id", "rows", "constraints", "vehicles", "characters", "forces", "resting", "standing", "time",
+                 "gravity")
+
+    def __init__(self, id, rows):
+        # type: (int, dict) -> None
+        self.id = id  # type: int
+        self.rows = rows  # type: dict[object, tuple]
+        """State of each body by object."""
+
+        self.constraints = {}  # type: dict[object, tuple[bool, float, dict]]
+        """(enabled, applied impulse, row impulses) of each constraint."""
+
+        self.vehicles = {}  # type: dict[object, tuple[tuple, tuple, tuple]]
+        """(suspension lengths, rotations, rotation speeds) of the wheels of each vehicle."""
+
+        self.characters = {}  # type: dict[object, tuple[tuple, float, int, bool]]
+        """(position, vertical velocity, jump count, on ground) of each character."""
+
+        self.forces = {}  # type: dict[object, tuple]
+        self.resting = {}  # type: dict[object, tuple]
+        self.standing = {}  # type: dict[object, tuple]
+        self.time = 0.0  # type: float
+        self.gravity = (0.0, 0.0, 0.0)  # type: tuple[float, float, float]
+
+
+class SnapshotRing:
+    """Ring buffer of the last snapshots of a physics world."""
+
+    def __init__(self, world, capacity=CAPACITY):
+        # type: (object, int) -> None
+        self.world = world
+        self.slots = [None] * capacity  # type: list[Snapshot | None]
+        self.count = 0  # type: int
+        """Number of snapshots taken, the id of the next one."""
+
+        self.baseline = None  # type: Snapshot | None
+        """Snapshot the state of the world differs from by the bodies of world.touched, the last taken or restored."""
+
+    def take(self):
+        # type: () -> int
+        world = self.world
+        objects = world.objects
+        baseline = self.baseline
+        touched, world.touched = world.touched, {}
+
+        if baseline is None:
+            rows = {}
+            changed = objects
+
+        else:
+            rows = dict(baseline.rows)
+            # The moving bodies change during the steps, the bodies woken since the last step too
+            touched.update(dict.fromkeys(objects[:world.moving]))
+            changed = []
+
+            for object in touched:
+                index = object._body
+
+                if index is not None and index < len(objects) and objects[index] is object:
+                    changed.append(object)
+
+                else:
+                    rows.pop(object, None)
+
+        indices = [object._body for object in changed]
+        moving, awake = world.moving, world.awake
+        regions = [(index >= moving) + (index >= awake) for index in indices]
+        values = [list(map(column.__getitem__, indices)) for column in world._columns[:len(_COLUMNS)]]
+        rows.update(zip(changed, zip(*values, regions)))
+
+        snapshot = Snapshot(self.count, rows)
+        snapshot.constraints = {constraint: (constraint.enabled, constraint.applied, dict(constraint.impulses))
+                                for constraint in world.constraints.values()}
+        snapshot.vehicles = {vehicle: (tuple(vehicle.length), tuple(vehicle.rotation), tuple(vehicle.spin))
+                             for vehicle in world.vehicles.values()}
+        snapshot.characters = {character: (tuple(character.object._position._data[:3]), character.verticalVelocity,
+                                           character.jumps, character.onGround)
+                               for character in world.characters.values() if character.object._position is not None}
+        snapshot.forces = {object: tuple(forces) for object, forces in world.forces.items()}
+        snapshot.resting = dict(world.resting)
+        snapshot.standing = dict(world.standing)
+        snapshot.time = world.time
+        snapshot.gravity = tuple(world.scene.gravity)
+        self.slots[self.count % len(self.slots)] = snapshot
+        self.count += 1
+        self.baseline = snapshot
+        return snapshot.id
+
+    def get(self, id):
+        # type: (int) -> Snapshot
+        snapshot = self.slots[id % len(self.slots)] if isinstance(id, int) and id >= 0 else None
+
+        if snapshot is None or snapshot.id != id:
+            raise ValueError("scene.restorePhysics(snapshot): KX_Scene, snapshot %r is not in the last %d snapshots" %
+                             (id, len(self.slots)))
+
+        return snapshot
+
+    def restore(self, id):
+        # type: (int) -> None
+        """Put the bodies back in the state and region of a snapshot, the bodies added since keep their state."""
+
+        snapshot = self.get(id)
+        world = self.world
+        objects = world.objects
+        rows = snapshot.rows
+        columns = world._columns[:len(_COLUMNS)]
+        moving, awake = world.moving, world.awake
+        qw, qx, qy, qz = world.qw, world.qx, world.qy, world.qz
+        regions = ([], [], [])
+        turned = []
+        added = {}
+
+        for index, object in enumerate(objects):
+            row = rows.get(object)
+
+            if row is None:
+                row = tuple(column[index] for column in columns) + ((index >= moving) + (index >= awake),)
+                added[object] = None
+
+            elif row[_ORIENTATION] != (qw[index], qx[index], qy[index], qz[index]):
+                turned.append(object)
+
+            regions[row[-1]].append((object, row))
+
+        ordered = regions[0] + regions[1] + regions[2]
+        world.moving = len(regions[0])
+        world.awake = world.moving + len(regions[1])
+
+        if ordered:
+            bodies, states = zip(*ordered)
+
+            for column, values in zip(columns, zip(*states)):
+                column[:] = values
+
+            objects[:] = bodies
+            world.datas[:] = [object._position._data for object in bodies]
+
+            for index, object in enumerate(bodies):
+                object._body = index
+
+            for data, x, y, z in zip(world.datas, world.px, world.py, world.pz):
+                data[0] = x
+                data[1] = y
+                data[2] = z
+
+            world.scene._spatial.dirty.update(dict.fromkeys(bodies))
+
+            for object in turned:
+                index = object._body
+                object._orientation = _Matrix(_rows(qw[index], qx[index], qy[index], qz[index]))
+
+        world.forces = {object: list(forces) for object, forces in snapshot.forces.items() if object._body is not None}
+        world.resting = dict(snapshot.resting)
+        world.standing = {object: contact for object, contact in snapshot.standing.items() if object._body is not None}
+        world.time = snapshot.time
+        world.gravity = snapshot.gravity
+        world.scene.gravity = _Vector(snapshot.gravity)
+        world.moved = {}
+
+        for constraint, (enabled, applied, impulses) in snapshot.constraints.items():
+            if world.constraints.get(constraint.id) is constraint:
+                constraint.enabled = enabled
+                constraint.applied = applied
+                constraint.impulses = dict(impulses)
+
+        for vehicle, (length, rotation, spin) in snapshot.vehicles.items():
+            # The wheels added since keep their state
+            if world.vehicles.get(vehicle.id) is vehicle:
+                vehicle.length[:len(length)] = length
+                vehicle.rotation[:len(rotation)] = rotation
+                vehicle.spin[:len(spin)] = spin
+
+        for character, (position, velocity, jumps, onGround) in snapshot.characters.items():
+            if world.characters.get(character.object) is character and character.object._position is not None:
+                character.object._position._data[:3] = position
+                character.verticalVelocity = velocity
+                character.jumps = jumps
+                character.onGround = onGround
+                world.scene._spatial.dirty[character.object] = None
+
+        world.islandsDirty = True
+
+        if len(rows) + len(added) != len(objects):
+            # The bodies removed since the snapshot are dropped by the next one
+            added.update((object, None) for object in rows if object._body is None)
+
+        world.touched = added
+        self.baseline = snapshot
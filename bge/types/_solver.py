@@ -0,0 +1,585 @@
+"""Constraint solver of the physics worlds, see bge.constraints.createConstraint().
+
+The constraints are split in islands, the groups of bodies linked by constraints, with their constraints. An island is
+moving, resting or sleeping as a whole and only the islands with moving bodies are solved. Each constraint is a set of
+rows, one per degree of freedom it removes: a jacobian row J giving the speed of the constrained coordinate from the
+velocities of the two bodies, so that J v = -tau * error / dt keeps the coordinate at its target. The rows of an island
+are solved by sequential impulses: each iteration goes through the rows one at a time and applies the impulse correcting
+the speed of its coordinate, clamped to the limits of the row. The impulses of a step start from the ones of the
+previous step (warm starting), the iterations only have to correct what changed.
+
+The velocities of the bodies of an island are copied in a flat list for the iterations: 6 slots per body, the last 6
+slots are the zero velocities of the static objects and of the world, which the rows never change."""
+
+from itertools import count as _count
+from math import acos as _acos, asin as _asin, atan2 as _atan2, radians as _radians, sqrt as _sqrt
+
+from mathutils import Euler as _Euler
+
+_INFINITY = float("inf")
+_WARM_STARTING = 0.85
+"""Part of the impulses of the last step applied at the start of a step, like btContactSolverInfo."""
+
+_RESIDUAL = 1e-6
+"""The iterations stop once no row changed by a larger impulse, like btContactSolverInfo::m_leastSquaresResidualThreshold."""
+
+_IDENTITY = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+_ZERO = (0.0, 0.0, 0.0)
+_ids = _count(1)
+
+POINTTOPOINT = 1
+LINEHINGE = 2
+ANGULAR = 3
+CONETWIST = 4
+GENERIC_6DOF = 12
+TYPES = (POINTTOPOINT, LINEHINGE, ANGULAR, CONETWIST, GENERIC_6DOF)
+
+
+class Constraint:
+    """Constraint between two objects, the pivot and the axes of its frame are stored in the space of each object."""
+
+    def __init__(self, world, type, objectA, objectB, pivot, angles, flag=0):
+        # type: (object, int, object, object | None, tuple, tuple, int) -> None
+        self.world = world
+        self.id = next(_ids)  # type: int
+        self.type = type  # type: int
+        self.objectA = objectA
+        self.objectB = objectB  # type: object | None
+        """Second object, None for a constraint to the world."""
+
+        self.flag = flag  # type: int
+        self.enabled = True  # type: bool
+        self.breakingThreshold = _INFINITY  # type: float
+        self.applied = 0.0  # type: float
+        """Total impulse applied in the last step."""
+
+        self.impulses = {}  # type: dict[object, float]
+        """Impulse of each row in the last step, by row key, for the warm starting."""
+
+        # Frame in A given by the euler angles, B gets the frame and pivot coinciding with the ones of A at creation
+        frame = _Euler([_radians(angle) for angle in angles]).to_matrix()
+        axes = [[frame[row][column] for row in range(3)] for column in range(3)]
+        positionA, rowsA = _transform(objectA)
+        positionB, rowsB = _transform(objectB)
+        self.pivotA = tuple(pivot)  # type: tuple[float, float, float]
+        self.axesA = axes  # type: list[list[float]]
+        pivotWorld = _add(positionA, _apply(rowsA, pivot))
+        self.pivotB = _applyInverse(rowsB, _sub(pivotWorld, positionB))  # type: list[float]
+        self.axesB = [_applyInverse(rowsB, _apply(rowsA, axis)) for axis in axes]  # type: list[list[float]]
+
+        free = type in (LINEHINGE, CONETWIST)
+        self.limits = [[0.0, 0.0] for _ in range(6)]  # type: list[list[float]]
+        """(low, high) of the translations and rotations of a generic 6DOF constraint, free if low > high, also the
+        twist (3) and swing (4, 5) spans of a cone twist and the rotation (3) of a hinge."""
+
+        for axis in range(6):
+            if free or (type == ANGULAR and axis < 3):
+                self.limits[axis] = [1.0, -1.0]
+
+        if type == CONETWIST:
+            for axis in range(3, 6):
+                self.limits[axis] = [_INFINITY, 0.0]
+
+        self.motors = [None] * 6  # type: list[tuple[float, float] | None]
+        """(target velocity, maximum force) of the enabled motors of a generic 6DOF constraint."""
+
+        self.springs = [None] * 6  # type: list[tuple[float, float, float] | None]
+        """(stiffness, damping, equilibrium) of the enabled springs of a generic 6DOF constraint."""
+
+    @property
+    def bodies(self):
+        # type: () -> list
+        return [object for object in (self.objectA, self.objectB) if object is not None and object._body is not None]
+
+    def setParam(self, axis, value0, value1):
+        # type: (int, float, float) -> None
+        """Limits, motors and springs of the axes like KX_ConstraintWrapper.setParam() in the BGE."""
+
+        type = self.type
+
+        if type == LINEHINGE and axis == 3:
+            self.limits[3] = [value0, value1]
+
+        elif type == CONETWIST and 3 <= axis <= 5:
+            self.limits[axis] = [value0, 0.0]
+
+        elif type in (GENERIC_6DOF, ANGULAR):
+            if 0 <= axis <= 5:
+                self.limits[axis] = [value0, value1]
+
+            elif 6 <= axis <= 11:
+                self.motors[axis - 6] = (value0, value1) if value1 > 0.0 else None
+
+            elif 12 <= axis <= 17:
+                # The equilibrium is the current position, like btGeneric6DofSpringConstraint::setEquilibriumPoint
+                self.springs[axis - 12] = ((value0, value1, self.coordinates()[axis - 12]) if value0 or value1
+                                           else None)
+
+        self.impulses.clear()
+        self.world.wakeConstraint(self)
+
+    def getParam(self, axis):
+        # type: (int) -> float
+        if self.type in (GENERIC_6DOF, ANGULAR) and 0 <= axis <= 5:
+            return self.coordinates()[axis]
+
+        return 0.0
+
+    def coordinates(self):
+        # type: () -> list[float]
+        """Translations and euler angles of the frame of B in the frame of A."""
+
+        frame = self._frame(*self._state())
+        pivotA, pivotB, axesA, axesB = frame
+        delta = _sub(pivotB, pivotA)
+        translations = [_dot(delta, axis) for axis in axesA]
+        # Rotation of B in A, relative[i][j] = axesA[i] . axesB[j]
+        relative = [[_dot(axesA[i], axesB[j]) for j in range(3)] for i in range(3)]
+        return translations + _euler(relative)
+
+    def _state(self, transforms=None):
+        # type: (dict | None) -> tuple
+        """(position, rotation rows) of A and of B, from the transforms of the bodies computed for a step if given."""
+
+        world = self.world
+        state = ()
+
+        for object in (self.objectA, self.objectB):
+            transform = transforms.get(object) if transforms is not None else None
+            state += transform or world.transform(object)
+
+        return state
+
+    def _frame(self, positionA, rowsA, positionB, rowsB, axes=True):
+        # type: (tuple, tuple, tuple, tuple, bool) -> tuple
+        """World pivots and axes of the frame of each object, no axes if not needed."""
+
+        return (_add(positionA, _apply(rowsA, self.pivotA)), _add(positionB, _apply(rowsB, self.pivotB)),
+                [_apply(rowsA, axis) for axis in self.axesA] if axes else None,
+                [_apply(rowsB, axis) for axis in self.axesB] if axes else None)
+
+    def rows(self, slotA, slotB, dt, tau, transforms=None):
+        # type: (int, int, float, float, dict | None) -> list[tuple]
+        """Rows of the constraint for the current transforms: (key, slot A, slot B, jacobian, bias, low, high, damping).
+
+        A row of key None is a spring: an impulse computed once per step from the bias and the damping, not solved."""
+
+        positionA, rowsA, positionB, rowsB = self._state(transforms)
+        pivotA, pivotB, axesA, axesB = self._frame(positionA, rowsA, positionB, rowsB, self.type != POINTTOPOINT)
+        armA, armB = _sub(pivotA, positionA), _sub(pivotB, positionB)
+        delta = _sub(pivotB, pivotA)
+        correction = -tau / dt
+        rows = []
+        type = self.type
+
+        def linear(key, axis, error, low=-_INFINITY, high=_INFINITY, bias=None, damping=0.0):
+            # Speed of (pivot B - pivot A) . axis
+            jacobian = (-axis[0], -axis[1], -axis[2]) + _negate(_cross(armA, axis)) + tuple(axis) + _cross(armB, axis)
+            rows.append((key, slotA, slotB, jacobian, correction * error if bias is None else bias, low, high, damping))
+
+        def angular(key, axis, error, low=-_INFINITY, high=_INFINITY, bias=None, damping=0.0):
+            # Speed of the rotation of B relative to A around axis
+            jacobian = _ZERO + _negate(axis) + _ZERO + tuple(axis)
+            rows.append((key, slotA, slotB, jacobian, correction * error if bias is None else bias, low, high, damping))
+
+        def limited(row, key, axis, value, low, high):
+            if low > high:
+                return
+
+            if low == high:
+                row(key, axis, value - low)
+
+            elif value < low:
+                row(key, axis, value - low, 0.0)
+
+            elif value > high:
+                row(key, axis, value - high, -_INFINITY, 0.0)
+
+            # Speculative row of the nearest limit: the coordinate can reach it during the step, not go through it
+            elif value - low < high - value:
+                row(key, axis, 0.0, 0.0, bias=(low - value) / dt)
+
+            else:
+                row(key, axis, 0.0, -_INFINITY, 0.0, bias=(high - value) / dt)
+
+        if type in (POINTTOPOINT, LINEHINGE, CONETWIST):
+            for index, axis in enumerate(_IDENTITY):
+                linear(index, axis, delta[index])
+
+        if type == LINEHINGE:
+            # B's hinge axis is kept along A's, the rotation taking one to the other is about their cross product
+            hingeA, hingeB = axesA[0], axesB[0]
+            misalignment = _cross(hingeA, hingeB)
+            angular(3, axesA[1], _dot(misalignment, axesA[1]))
+            angular(4, axesA[2], _dot(misalignment, axesA[2]))
+            low, high = self.limits[3]
+
+            if low <= high:
+                limited(angular, 5, hingeA, _angleAbout(hingeA, axesA[1], axesB[1]), low, high)
+
+        elif type == CONETWIST:
+            twistA, twistB = axesA[0], axesB[0]
+            swingSpan = min(self.limits[4][0], self.limits[5][0])
+            swing = _acos(max(-1.0, min(1.0, _dot(twistA, twistB))))
+
+            axis = _normalized(_cross(twistA, twistB)) if swingSpan < _INFINITY else None
+
+            if axis is not None:
+                # The swing only has an upper limit, in the direction the twist axis of B leans to
+                if swing > swingSpan:
+                    angular(4, axis, swing - swingSpan, -_INFINITY, 0.0)
+
+                else:
+                    angular(4, axis, 0.0, -_INFINITY, 0.0, bias=(swingSpan - swing) / dt)
+
+            twistSpan = self.limits[3][0]
+
+            if twistSpan < _INFINITY:
+                limited(angular, 3, twistA, _angleAbout(twistA, axesA[1], axesB[1]), -twistSpan, twistSpan)
+
+        elif type in (GENERIC_6DOF, ANGULAR):
+            relative = [[_dot(axesA[i], axesB[j]) for j in range(3)] for i in range(3)]
+            values = [_dot(delta, axis) for axis in axesA] + _euler(relative)
+
+            for index in range(6):
+                row = linear if index < 3 else angular
+                axis = axesA[index % 3]
+                low, high = self.limits[index]
+                limited(row, index, axis, values[index], low, high)
+                motor = self.motors[index]
+
+                if motor is not None:
+                    impulse = motor[1] * dt
+                    row(("motor", index), axis, 0.0, -impulse, impulse, motor[0])
+
+                spring = self.springs[index]
+
+                if spring is not None:
+                    stiffness, damping, equilibrium = spring
+                    row(None, axis, 0.0, bias=-stiffness * (values[index] - equilibrium) * dt, damping=damping * dt)
+
+        return rows
+
+
+class Island:
+    """Bodies linked by constraints and their constraints, the slot of each body in the flat velocity list."""
+
+    def __init__(self, bodies, constraints):
+        # type: (list, list[Constraint]) -> None
+        self.bodies = bodies
+        self.constraints = constraints
+        self.slots = {object: index * 6 for index, object in enumerate(bodies)}  # type: dict[object, int]
+
+
+def buildIslands(constraints):
+    # type: (list[Constraint]) -> list[Island]
+    """Group the enabled constraints by the bodies they link (union find)."""
+
+    parents = {}
+
+    def find(object):
+        root = object
+
+        while parents[root] is not root:
+            root = parents[root]
+
+        while parents[object] is not root:
+            parents[object], object = root, parents[object]
+
+        return root
+
+    linked = [constraint for constraint in constraints if constraint.enabled and constraint.bodies]
+
+    for constraint in linked:
+        bodies = constraint.bodies
+
+        for object in bodies:
+            parents.setdefault(object, object)
+
+        if len(bodies) == 2:
+            rootA, rootB = find(bodies[0]), find(bodies[1])
+
+            if rootA is not rootB:
+                parents[rootB] = rootA
+
+    groups = {}
+
+    for object in parents:
+        groups.setdefault(find(object), ([], []))[0].append(object)
+
+    for constraint in linked:
+        groups[find(constraint.bodies[0])][1].append(constraint)
+
+    return [Island(bodies, members) for bodies, members in groups.values()]
+
+
+def solve(world, dt):
+    # type: (object, float) -> None
+    """Apply the impulses of the constraints of the moving islands to the velocities of their bodies."""
+
+    moving = world.moving
+    columns = (world.vx, world.vy, world.vz, world.wx, world.wy, world.wz)
+    iterations = max(1, int(world.iterations))
+    relaxation = world.sor * world.solverDamping
+    broken = []
+
+    for island in world.islands:
+        bodies = island.bodies
+
+        if bodies[0]._body >= moving:
+            continue
+
+        # Flat velocities and inverse masses of the bodies, the statics get the zero slots at the end
+        velocities = []
+        inverses = []
+
+        for object in bodies:
+            index = object._body
+            velocities.extend([column[index] for column in columns])
+            inverse = world.invMass[index]
+            rotation = world.invInertia[index] if object._rigidBody else 0.0
+            inverses.extend((inverse, inverse, inverse, rotation, rotation, rotation))
+
+        static = len(velocities)
+        velocities.extend(_ZERO * 2)
+        inverses.extend(_ZERO * 2)
+        slots = island.slots
+        transforms = {object: world.transform(object) for object in bodies}
+        rows = []
+        owners = []
+
+        for constraint in island.constraints:
+            slotA = slots.get(constraint.objectA, static)
+            slotB = slots.get(constraint.objectB, static)
+
+            for row in constraint.rows(slotA, slotB, dt, world.solverTau, transforms):
+                rows.append(row)
+                owners.append(constraint)
+
+        solved = _prepare(rows, owners, velocities, inverses)
+        _iterate(solved, velocities, iterations, relaxation)
+
+        for object in bodies:
+            index = object._body
+            slot = slots[object]
+
+            for offset, column in enumerate(columns):
+                column[index] = velocities[slot + offset]
+
+        totals = {}
+
+        for (key, constraint, impulse) in ((row[0], row[1], row[10]) for row in solved):
+            constraint.impulses[key] = impulse
+            totals[constraint] = totals.get(constraint, 0.0) + impulse * impulse
+
+        for constraint in island.constraints:
+            constraint.applied = _sqrt(totals.get(constraint, 0.0))
+
+            if constraint.applied > constraint.breakingThreshold:
+                broken.append(constraint)
+
+    for constraint in broken:
+        constraint.enabled = False
+        constraint.impulses.clear()
+        world.islandsDirty = True
+
+
+def _prepare(rows, owners, velocities, inverses):
+    # type: (list[tuple], list[Constraint], list[float], list[float]) -> list[list]
+    """Effective masses and velocity changes per unit impulse of the rows, apply the springs and the warm starting.
+
+    Returns:
+        list: [key, constraint, slot A, slot B, jacobian, changes, mass, bias, low, high, impulse, linear] of the
+            solved rows, the rows not linear only act on the angular velocities."""
+
+    solved = []
+
+    for row, constraint in zip(rows, owners):
+        key, slotA, slotB, jacobian, bias, low, high, damping = row
+        j = jacobian
+        massA, rotationA, massB, rotationB = inverses[slotA], inverses[slotA + 3], inverses[slotB], inverses[slotB + 3]
+        changes = (j[0] * massA, j[1] * massA, j[2] * massA, j[3] * rotationA, j[4] * rotationA, j[5] * rotationA,
+                   j[6] * massB, j[7] * massB, j[8] * massB, j[9] * rotationB, j[10] * rotationB, j[11] * rotationB)
+        stiffness = (massA * (j[0] * j[0] + j[1] * j[1] + j[2] * j[2]) +
+                     rotationA * (j[3] * j[3] + j[4] * j[4] + j[5] * j[5]) +
+                     massB * (j[6] * j[6] + j[7] * j[7] + j[8] * j[8]) +
+                     rotationB * (j[9] * j[9] + j[10] * j[10] + j[11] * j[11]))
+
+        if stiffness <= 1e-12:
+            continue
+
+        if key is None:
+            # Spring: the stiffness impulse minus the damping of the speed of the coordinate
+            speed = _speed(jacobian, velocities, slotA, slotB)
+            _applyImpulse(changes, velocities, slotA, slotB, bias - damping * speed)
+            continue
+
+        impulse = max(low, min(high, constraint.impulses.get(key, 0.0) * _WARM_STARTING))
+
+        if impulse:
+            _applyImpulse(changes, velocities, slotA, slotB, impulse)
+
+        linear = any(jacobian[:3]) or any(jacobian[6:9])
+        solved.append([key, constraint, slotA, slotB, jacobian, changes, 1.0 / stiffness, bias, low, high, impulse,
+                       linear])
+
+    return solved
+
+
+def _iterate(solved, v, iterations, relaxation):
+    # type: (list[list], list[float], int, float) -> None
+    """Sequential impulses, the body velocities are in the flat list v."""
+
+    for _ in range(iterations):
+        residual = 0.0
+
+        for row in solved:
+            _, _, a, b, j, d, mass, bias, low, high, impulse, linear = row
+
+            if linear:
+                speed = (j[0] * v[a] + j[1] * v[a + 1] + j[2] * v[a + 2] + j[3] * v[a + 3] + j[4] * v[a + 4] +
+                         j[5] * v[a + 5] + j[6] * v[b] + j[7] * v[b + 1] + j[8] * v[b + 2] + j[9] * v[b + 3] +
+                         j[10] * v[b + 4] + j[11] * v[b + 5])
+
+            else:
+                # Half the work, the jacobian is (0, -axis, 0, axis)
+                a += 3
+                b += 3
+                speed = j[9] * (v[b] - v[a]) + j[10] * (v[b + 1] - v[a + 1]) + j[11] * (v[b + 2] - v[a + 2])
+
+            total = impulse + (bias - speed) * mass * relaxation
+
+            if total < low:
+                total = low
+
+            elif total > high:
+                total = high
+
+            delta = total - impulse
+
+            if not delta:
+                continue
+
+            if delta > residual:
+                residual = delta
+
+            elif -delta > residual:
+                residual = -delta
+
+            row[10] = total
+
+            if linear:
+                v[a] += d[0] * delta
+                v[a + 1] += d[1] * delta
+                v[a + 2] += d[2] * delta
+                v[a + 3] += d[3] * delta
+                v[a + 4] += d[4] * delta
+                v[a + 5] += d[5] * delta
+                v[b] += d[6] * delta
+                v[b + 1] += d[7] * delta
+                v[b + 2] += d[8] * delta
+                v[b + 3] += d[9] * delta
+                v[b + 4] += d[10] * delta
+                v[b + 5] += d[11] * delta
+
+            else:
+                v[a] += d[3] * delta
+                v[a + 1] += d[4] * delta
+                v[a + 2] += d[5] * delta
+                v[b] += d[9] * delta
+                v[b + 1] += d[10] * delta
+                v[b + 2] += d[11] * delta
+
+        if residual < _RESIDUAL:
+            break
+
+
+def _speed(jacobian, velocities, slotA, slotB):
+    # type: (tuple, list[float], int, int) -> float
+    return sum(value * velocity for value, velocity in
+               zip(jacobian, velocities[slotA:slotA + 6] + velocities[slotB:slotB + 6]))
+
+
+def _applyImpulse(changes, velocities, slotA, slotB, impulse):
+    # type: (tuple, list[float], int, int, float) -> None
+    for offset in range(6):
+        velocities[slotA + offset] += changes[offset] * impulse
+        velocities[slotB + offset] += changes[offset + 6] * impulse
+
+
+def _transform(object):
+    # type: (object) -> tuple[tuple, tuple]
+    """(position, rotation rows) of an object, the origin of the world for None."""
+
+    if object is None or object._position is None:
+        return _ZERO, _IDENTITY
+
+    orientation = object._orientation
+    rows = _IDENTITY if orientation is None else tuple(tuple(orientation[row]) for row in range(3))
+    return tuple(object._position._data[:3]), rows
+
+
+def _euler(rows):
+    # type: (list[list[float]]) -> list[float]
+    """XYZ euler angles of a rotation matrix, like btGeneric6DofConstraint::calculateAngleInfo."""
+
+    sine = max(-1.0, min(1.0, rows[0][2]))
+
+    if sine < 1.0 - 1e-9 and sine > -1.0 + 1e-9:
+        return [_atan2(-rows[1][2], rows[2][2]), _asin(sine), _atan2(-rows[0][1], rows[0][0])]
+
+    # Gimbal lock, the x and z rotations are about the same axis
+    return [_atan2(rows[2][1], rows[1][1]), 1.5707963267948966 * (1.0 if sine > 0.0 else -1.0), 0.0]
+
+
+def _angleAbout(axis, referenceA, referenceB):
+    # type: (list[float], list[float], list[float]) -> float
+    """Angle from referenceA to referenceB around axis, referenceB projected on the plane of referenceA."""
+
+    projected = _sub(referenceB, [value * _dot(referenceB, axis) for value in axis])
+    return _atan2(_dot(_cross(referenceA, projected), axis), _dot(referenceA, projected))
+
+
+def _apply(rows, vector):
+    # type: (tuple, tuple) -> list[float]
+    return [rows[0][0] * vector[0] + rows[0][1] * vector[1] + rows[0][2] * vector[2],
+            rows[1][0] * vector[0] + rows[1][1] * vector[1] + rows[1][2] * vector[2],
+            rows[2][0] * vector[0] + rows[2][1] * vector[1] + rows[2][2] * vector[2]]
+
+
+def _applyInverse(rows, vector):
+    # type: (tuple, tuple) -> list[float]
+    return [rows[0][0] * vector[0] + rows[1][0] * vector[1] + rows[2][0] * vector[2],
+            rows[0][1] * vector[0] + rows[1][1] * vector[1] + rows[2][1] * vector[2],
+            rows[0][2] * vector[0] + rows[1][2] * vector[1] + rows[2][2] * vector[2]]
+
+
+def _add(a, b):
+    # type: (tuple, tuple) -> list[float]
+    return [a[0] + b[0], a[1] + b[1], a[2] + b[2]]
+
+
+def _sub(a, b):
+    # type: (tuple, tuple) -> list[float]
+    return [a[0] - b[0], a[1] - b[1], a[2] - b[2]]
+
+
+def _dot(a, b):
+    # type: (tuple, tuple) -> float
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    # type: (tuple, tuple) -> tuple[float, float, float]
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+def _negate(a):
+    # type: (tuple) -> tuple[float, float, float]
+    return -a[0], -a[1], -a[2]
+
+
+def _normalized(a):
+    # type: (tuple) -> tuple[float, float, float] | None
+    length = _sqrt(_dot(a, a))
+    return (a[0] / length, a[1] / length, a[2] / length) if length > 1e-12 else None
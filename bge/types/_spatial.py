@@ -0,0 +1,289 @@
+"""Broadphase of the scenes: a uniform spatial hash of the game objects bounding spheres.
+
+Each object is filed in every cell its bounding box overlaps, so box queries only read the cells they overlap and rays
+walk the cells they cross (Amanatides & Woo traversal), nearest first. The positions of the objects are TrackedVector
+instances: any change marks the object as moved and the hash is updated lazily, before the next query."""
+
+from math import floor as _floor, sqrt as _sqrt
+
+from mathutils import Vector as _Vector
+
+
+class TrackedVector(_Vector):
+    """Position or scale of a game object, changing it in place marks the object as moved in the broadphase of its scene."""
+
+    __slots__ = ("_object",)
+
+    def _changed(self):
+        # type: () -> None
+        owner = self._object
+
+        if owner is not None:
+            owner._moved()
+
+
+def tracked(value, owner):
+    # type: (object, object) -> TrackedVector
+    vector = TrackedVector(value)
+    vector._object = owner
+    return vector
+
+
+class SpatialHash:
+    """Uniform grid of the bounding spheres of the objects of a scene, only the occupied cells are stored."""
+
+    __slots__ = ("cellSize", "cells", "ranges", "spheres", "dirty", "extent")
+
+    def __init__(self, cellSize=4.0):
+        # type: (float) -> None
+        self.cellSize = cellSize  # type: float
+        self.cells = {}  # type: dict[tuple[int, int, int], dict[object, None]]
+        """Objects by cell, in insertion order so that the queries are deterministic."""
+
+        self.ranges = {}  # type: dict[object, tuple[int, int, int, int, int, int]]
+        """Range of cells of each filed object."""
+
+        self.spheres = {}  # type: dict[object, tuple[float, float, float, float]]
+        """Bounding sphere (x, y, z, radius) of each filed object."""
+
+        self.dirty = {}  # type: dict[object, None]
+        """Objects added or moved since the last update."""
+
+        self.extent = [0, 0, 0, -1, -1, -1]  # type: list[int]
+        """Range of cells that ever held an object, the queries are clipped to it (flat scenes use a single layer)."""
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.ranges)
+
+    def add(self, object):
+        # type: (object) -> None
+        self.dirty[object] = None
+
+    def discard(self, object):
+        # type: (object) -> None
+        self.dirty.pop(object, None)
+        self.spheres.pop(object, None)
+        bounds = self.ranges.pop(object, None)
+
+        if bounds is not None:
+            self._unfile(object, bounds)
+
+    def _unfile(self, object, bounds):
+        # type: (object, tuple) -> None
+        cells = self.cells
+        i0, j0, k0, i1, j1, k1 = bounds
+
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    cell = cells[i, j, k]
+                    del cell[object]
+
+                    if not cell:
+                        del cells[i, j, k]
+
+    def update(self):
+        # type: () -> None
+        """File the objects that moved since the last update in their new cells."""
+
+        if not self.dirty:
+            return
+
+        dirty, self.dirty = self.dirty, {}
+        cells = self.cells
+        size = self.cellSize
+
+        for object in dirty:
+            sphere = object._boundingSphere()
+            old = self.ranges.get(object)
+
+            if sphere is None:
+                if old is not None:
+                    self.discard(object)
+
+                continue
+
+            x, y, z, radius = sphere
+            self.spheres[object] = sphere
+            bounds = (_floor((x - radius) / size), _floor((y - radius) / size), _floor((z - radius) / size),
+                      _floor((x + radius) / size), _floor((y + radius) / size), _floor((z + radius) / size))
+
+            if bounds == old:
+                continue
+
+            if old is not None:
+                self._unfile(object, old)
+
+            self.ranges[object] = bounds
+            i0, j0, k0, i1, j1, k1 = bounds
+            extent = self.extent
+
+            if extent[0] > extent[3]:
+                extent[:] = bounds
+
+            else:
+                extent[:] = (min(i0, extent[0]), min(j0, extent[1]), min(k0, extent[2]),
+                             max(i1, extent[3]), max(j1, extent[4]), max(k1, extent[5]))
+
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    for k in range(k0, k1 + 1):
+                        cell = cells.get((i, j, k))
+
+                        if cell is None:
+                            cells[i, j, k] = {object: None}
+
+                        else:
+                            cell[object] = None
+
+    def queryBox(self, low, high):
+        # type: (tuple, tuple) -> dict[object, None]
+        """Objects whose cells overlap the box between the low and high corners, a superset of the overlapping ones."""
+
+        self.update()
+        size = self.cellSize
+        extent = self.extent
+        i0, j0, k0 = [max(_floor(v / size), e) for v, e in zip(low, extent)]
+        i1, j1, k1 = [min(_floor(v / size), e) for v, e in zip(high, extent[3:])]
+        found = {}
+
+        if i0 > i1 or j0 > j1 or k0 > k1:
+            return found
+
+        if (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1) > len(self.cells):
+            # Fewer occupied cells than cells in the box
+            for (i, j, k), cell in self.cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1 and k0 <= k <= k1:
+                    found.update(cell)
+
+            return found
+
+        cells = self.cells
+
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    cell = cells.get((i, j, k))
+
+                    if cell is not None:
+                        found.update(cell)
+
+        return found
+
+    def querySphere(self, center, radius):
+        # type: (tuple, float) -> list[tuple[float, object]]
+        """(distance between centers, object) of the objects whose bounding sphere overlaps the sphere, nearest first."""
+
+        x, y, z = center
+        spheres = self.spheres
+        found = []
+
+        for object in self.queryBox((x - radius, y - radius, z - radius), (x + radius, y + radius, z + radius)):
+            ox, oy, oz, r = spheres[object]
+            distance = _sqrt((ox - x) ** 2 + (oy - y) ** 2 + (oz - z) ** 2)
+
+            if distance <= radius + r:
+                found.append((distance, object))
+
+        found.sort(key=_first)
+        return found
+
+    def _cellsAlong(self, origin, direction, length):
+        """Yield (entry distance, cell) for the occupied cells crossed by a ray, in order."""
+
+        size = self.cellSize
+        cells = self.cells
+        position = [origin[0] / size, origin[1] / size, origin[2] / size]
+        cell = [_floor(v) for v in position]
+        steps = [0, 0, 0]
+        nexts = [float("inf")] * 3
+        deltas = [float("inf")] * 3
+
+        for axis in range(3):
+            d = direction[axis]
+
+            if d > 0.0:
+                steps[axis] = 1
+                deltas[axis] = size / d
+                nexts[axis] = (cell[axis] + 1 - position[axis]) * size / d
+
+            elif d < 0.0:
+                steps[axis] = -1
+                deltas[axis] = -size / d
+                nexts[axis] = (position[axis] - cell[axis]) * size / -d
+
+        entry = 0.0
+
+        while entry <= length:
+            found = cells.get((cell[0], cell[1], cell[2]))
+
+            if found is not None:
+                yield entry, found
+
+            axis = 0 if nexts[0] <= nexts[1] and nexts[0] <= nexts[2] else (1 if nexts[1] <= nexts[2] else 2)
+            entry = nexts[axis]
+            nexts[axis] += deltas[axis]
+            cell[axis] += steps[axis]
+
+    def rayCast(self, origin, direction, length, accept):
+        # type: (tuple, tuple, float, object) -> tuple[object, float]
+        """Nearest object hit by a ray, among the ones accept(object) is True for.
+
+        Args:
+            origin (tuple): Start of the ray.
+            direction (tuple): Normalized direction of the ray.
+            length (float): Length of the ray.
+            accept (callable): Filter of the objects that can be hit.
+
+        Returns:
+            tuple: (object, distance) or (None, length) if nothing is hit. Objects containing the origin are not hit."""
+
+        self.update()
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        spheres = self.spheres
+        best = None
+        bestDistance = length
+        tested = set()
+
+        if length / self.cellSize * 3.0 > len(self.cells) * 4:
+            # Walking the empty cells of a long ray costs more than testing all the objects
+            candidates = [(0.0, spheres)]
+
+        else:
+            candidates = self._cellsAlong(origin, direction, length)
+
+        for entry, cell in candidates:
+            if entry > bestDistance:
+                break
+
+            for object in cell:
+                if object in tested:
+                    continue
+
+                tested.add(object)
+                cx, cy, cz, radius = spheres[object]
+                mx, my, mz = ox - cx, oy - cy, oz - cz
+                c = mx * mx + my * my + mz * mz - radius * radius
+
+                if c <= 0.0:
+                    continue
+
+                b = mx * dx + my * dy + mz * dz
+                discriminant = b * b - c
+
+                if b > 0.0 or discriminant < 0.0:
+                    continue
+
+                distance = -b - _sqrt(discriminant)
+
+                if distance <= bestDistance and accept(object):
+                    best = object
+                    bestDistance = distance
+
+        return best, bestDistance
+
+
+def _first(item):
+    return item[0]
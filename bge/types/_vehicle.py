@@ -0,0 +1,409 @@
+"""Ray cast vehicles of the physics worlds, see bge.constraints.createVehicle().
+
+A vehicle is a dynamic chassis held above the level by its wheels, like btRaycastVehicle: each wheel casts a ray along
+its suspension from its attachment point, the suspension pushes the chassis along the contact normal by a spring and a
+damper and the tyre pushes it along the ground, within the friction of the contact. The wheels are not bodies, the
+objects of the wheels are only placed where the wheels are after each step.
+
+The wheels of all the vehicles of a world are stepped together. Each vehicle stores its wheels as a list per quantity,
+a substep joins the lists of the moving vehicles into flat lists over all their wheels, casts all the rays in one query
+of the world and evaluates the suspensions and the tyres a pass over the flat lists at a time, the impulses summed by
+chassis before they change the velocities."""
+
+from itertools import chain as _chain
+from math import cos as _cos, sin as _sin, sqrt as _sqrt
+
+from mathutils import Matrix as _Matrix
+
+from . import _solver
+
+VEHICLE = 11
+
+_STIFFNESS = 5.88
+_COMPRESSION = 0.83
+_DAMPING = 0.88
+_FRICTION = 10.5
+_ROLL_INFLUENCE = 0.1
+"""Default tuning of the wheels, like btRaycastVehicle::btVehicleTuning and btWheelInfoConstructionInfo."""
+
+_MAX_TRAVEL = 5.0
+_MAX_FORCE = 6000.0
+"""Maximum suspension travel from the rest length and maximum suspension force of the default tuning."""
+
+_SIDE_DAMPING = 0.2
+"""Part of the sideways speed of a tyre removed per substep, the contact damping of resolveSingleBilateral()."""
+
+_FORWARD_FACTOR = 0.5
+_SPIN_DAMPING = 0.99
+"""Weight of the forward impulse against the side one for the skidding, and slowdown of the free wheels per substep."""
+
+
+class Vehicle:
+    """Wheels of a chassis, the vectors of the wheels are in the space of the chassis."""
+
+    def __init__(self, world, chassis):
+        # type: (object, object) -> None
+        self.world = world
+        self.id = next(_solver._ids)  # type: int
+        self.type = VEHICLE  # type: int
+        self.chassis = chassis
+        self.rayMask = 0xFFFF  # type: int
+        """Collision groups of the level objects the wheels stand on."""
+
+        self.objects = []  # type: list
+        """Object of each wheel, placed where the wheel is after each step."""
+
+        self.attach = []  # type: list[tuple[float, float, float]]
+        self.down = []  # type: list[tuple[float, float, float]]
+        self.axle = []  # type: list[tuple[float, float, float]]
+        self.rest = []  # type: list[float]
+        self.radius = []  # type: list[float]
+        self.steers = []  # type: list[bool]
+        """Front wheel flag of each wheel, only informative like btWheelInfo::m_bIsFrontWheel: any wheel steers."""
+
+        self.steering = []  # type: list[float]
+        self.engine = []  # type: list[float]
+        self.brake = []  # type: list[float]
+        self.stiffness = []  # type: list[float]
+        self.compression = []  # type: list[float]
+        self.damping = []  # type: list[float]
+        self.friction = []  # type: list[float]
+        self.roll = []  # type: list[float]
+        self.length = []  # type: list[float]
+        """Suspension length of each wheel in the last substep, the rest length without contact."""
+
+        self.rotation = []  # type: list[float]
+        self.spin = []  # type: list[float]
+        """Rotation of each wheel in the last substep, kept by the wheels without contact."""
+
+    def addWheel(self, object, attach, down, axle, rest, radius, steers):
+        # type: (object, tuple, tuple, tuple, float, float, bool) -> None
+        self.objects.append(object)
+        self.attach.append(tuple(attach))
+        self.down.append(_solver._normalized(down) or (0.0, 0.0, -1.0))
+        self.axle.append(_solver._normalized(axle) or (-1.0, 0.0, 0.0))
+        self.rest.append(rest)
+        self.radius.append(radius)
+        self.steers.append(steers)
+
+        for column in (self.steering, self.engine, self.brake, self.rotation, self.spin):
+            column.append(0.0)
+
+        self.stiffness.append(_STIFFNESS)
+        self.compression.append(_COMPRESSION)
+        self.damping.append(_DAMPING)
+        self.friction.append(_FRICTION)
+        self.roll.append(_ROLL_INFLUENCE)
+        self.length.append(rest)
+
+    def set(self, name, index, value):
+        # type: (str, int, float) -> None
+        """Change a setting of a wheel, the chassis is woken by it."""
+
+        getattr(self, name)[index] = value
+        self.wake()
+
+    def wake(self):
+        # type: () -> None
+        if self.chassis._body is not None:
+            self.world.wake(self.chassis)
+
+    def transform(self, index, chassis=None):
+        # type: (int, tuple | None) -> tuple[list[float], list[list[float]]]
+        """World (position, rotation rows) of a wheel, like btRaycastVehicle::updateWheelTransform.
+
+        Args:
+            index (int): The index of the wheel.
+            chassis (tuple | None): The transform of the chassis, read from the world if None."""
+
+        position, rows = chassis or self.world.transform(self.chassis)
+        down = _solver._apply(rows, self.down[index])
+        hard = _solver._add(position, _solver._apply(rows, self.attach[index]))
+        length = self.length[index]
+        return ([hard[0] + down[0] * length, hard[1] + down[1] * length, hard[2] + down[2] * length],
+                _wheelRows(rows, down, self.axle[index], self.steering[index], self.rotation[index]))
+
+
+def update(world, dt):
+    # type: (object, float) -> None
+    """Push the chassis of the moving vehicles by their suspensions and tyres for a substep, like
+    btRaycastVehicle::updateVehicle."""
+
+    moving = world.moving
+    vehicles = [vehicle for vehicle in world.vehicles.values()
+                if vehicle.objects and vehicle.chassis._body is not None and vehicle.chassis._body < moving]
+
+    if not vehicles:
+        return
+
+    # The chassis, by vehicle
+    bodies = [vehicle.chassis._body for vehicle in vehicles]
+    positions, bases = zip(*[world.transform(vehicle.chassis) for vehicle in vehicles])
+    inverses = [world.invMass[index] for index in bodies]
+    rotating = [world.invInertia[index] if vehicle.chassis._rigidBody else 0.0
+                for vehicle, index in zip(vehicles, bodies)]
+
+    # The wheels of all the vehicles, by wheel
+    owners = list(_chain.from_iterable([slot] * len(vehicle.objects) for slot, vehicle in enumerate(vehicles)))
+
+    def gather(name):
+        return list(_chain.from_iterable(getattr(vehicle, name) for vehicle in vehicles))
+
+    rest, radius = gather("rest"), gather("radius")
+    starts, downs, axles, ends = [], [], [], []
+
+    for slot, attach, down, axle, steering, reach in zip(owners, gather("attach"), gather("down"), gather("axle"),
+                                                          gather("steering"), map(float.__add__, rest, radius)):
+        (r0, r1, r2) = bases[slot]
+        x, y, z = positions[slot]
+        ax, ay, az = attach
+        hard = (x + r0[0] * ax + r0[1] * ay + r0[2] * az, y + r1[0] * ax + r1[1] * ay + r1[2] * az,
+                z + r2[0] * ax + r2[1] * ay + r2[2] * az)
+        dx, dy, dz = down
+        down = (r0[0] * dx + r0[1] * dy + r0[2] * dz, r1[0] * dx + r1[1] * dy + r1[2] * dz,
+                r2[0] * dx + r2[1] * dy + r2[2] * dz)
+        ex, ey, ez = axle
+        axle = (r0[0] * ex + r0[1] * ey + r0[2] * ez, r1[0] * ex + r1[1] * ey + r1[2] * ez,
+                r2[0] * ex + r2[1] * ey + r2[2] * ez)
+
+        if steering:
+            axle = _turn(axle, (-down[0], -down[1], -down[2]), steering)
+
+        starts.append(hard)
+        downs.append(down)
+        axles.append(axle)
+        ends.append((hard[0] + down[0] * reach, hard[1] + down[1] * reach, hard[2] + down[2] * reach))
+
+    masks = list(_chain.from_iterable([vehicle.rayMask] * len(vehicle.objects) for vehicle in vehicles))
+    hits = world.castRays(starts, ends, masks)
+
+    # Suspensions, the spring pushes back the compression from the rest length, the damper the speed along the ray
+    lengths = list(rest)
+    forces = [0.0] * len(owners)
+    # (wheel, chassis slot, contact point x, y, z relative to the chassis, normal x, y, z) of the wheels on the ground
+    contacts = []
+
+    velocities = _velocities(world, bodies)
+    impulses = [[0.0] * 6 for _ in vehicles]
+
+    for wheel, slot, hit, hard, down, restLength, wheelRadius, stiffness, compression, damping in zip(
+            range(len(owners)), owners, hits, starts, downs, rest, radius, gather("stiffness"), gather("compression"),
+            gather("damping")):
+        if hit is None:
+            continue
+
+        fraction, _, nx, ny, nz = hit
+        length = fraction * (restLength + wheelRadius) - wheelRadius
+        length = lengths[wheel] = min(max(length, restLength - _MAX_TRAVEL), restLength + _MAX_TRAVEL)
+        reach = length + wheelRadius
+        x, y, z = positions[slot]
+        rx, ry, rz = hard[0] + down[0] * reach - x, hard[1] + down[1] * reach - y, hard[2] + down[2] * reach - z
+        contacts.append((wheel, slot, rx, ry, rz, nx, ny, nz))
+        denominator = nx * down[0] + ny * down[1] + nz * down[2]
+
+        if denominator >= -0.1:
+            # The ray is nearly along the ground, the speed along it means nothing
+            speed = 0.0
+            clipped = 10.0
+
+        else:
+            clipped = -1.0 / denominator
+            vx, vy, vz, wx, wy, wz = velocities[slot]
+            speed = (nx * (vx + wy * rz - wz * ry) + ny * (vy + wz * rx - wx * rz) +
+                     nz * (vz + wx * ry - wy * rx)) * clipped
+
+        force = stiffness * (restLength - length) * clipped - (compression if speed < 0.0 else damping) * speed
+        force = forces[wheel] = min(max(0.0, force / inverses[slot]), _MAX_FORCE)
+
+        if force:
+            _accumulate(impulses[slot], rx, ry, rz, nx * force * dt, ny * force * dt, nz * force * dt)
+
+    _applyImpulses(world, bodies, impulses, inverses, rotating)
+
+    # Tyres, the side impulse removes part of the sideways speed, the forward one is the engine, or the brake stopping
+    # the rolling, both within the grip given by the suspension force
+    grounded = [0] * len(vehicles)
+
+    for contact in contacts:
+        grounded[contact[1]] += 1
+
+    engines, brakes, frictions, rolls = gather("engine"), gather("brake"), gather("friction"), gather("roll")
+    velocities = _velocities(world, bodies)
+    impulses = [[0.0] * 6 for _ in vehicles]
+
+    for wheel, slot, rx, ry, rz, nx, ny, nz in contacts:
+        # The axle in the plane of the ground, the tyre rolls along normal x axle
+        ax, ay, az = axles[wheel]
+        projection = ax * nx + ay * ny + az * nz
+        sx, sy, sz = ax - nx * projection, ay - ny * projection, az - nz * projection
+        size = _sqrt(sx * sx + sy * sy + sz * sz)
+
+        if size < 1e-9:
+            continue
+
+        sx, sy, sz = sx / size, sy / size, sz / size
+        fx, fy, fz = ny * sz - nz * sy, nz * sx - nx * sz, nx * sy - ny * sx
+        vx, vy, vz, wx, wy, wz = velocities[slot]
+        px, py, pz = vx + wy * rz - wz * ry, vy + wz * rx - wx * rz, vz + wx * ry - wy * rx
+        inverse, angular = inverses[slot], rotating[slot]
+        cx, cy, cz = ry * sz - rz * sy, rz * sx - rx * sz, rx * sy - ry * sx
+        sideImpulse = -_SIDE_DAMPING * (px * sx + py * sy + pz * sz) / (inverse + angular * (cx * cx + cy * cy +
+                                                                                            cz * cz))
+        engine = engines[wheel]
+        brake = brakes[wheel]
+
+        if engine:
+            forwardImpulse = engine * dt
+
+        elif brake:
+            # The wheels on the ground share the impulse stopping the chassis
+            cx, cy, cz = ry * fz - rz * fy, rz * fx - rx * fz, rx * fy - ry * fx
+            forwardImpulse = -(px * fx + py * fy + pz * fz) / (inverse + angular * (cx * cx + cy * cy + cz * cz))
+            forwardImpulse = min(max(forwardImpulse / grounded[slot], -brake), brake)
+
+        else:
+            forwardImpulse = 0.0
+
+        grip = forces[wheel] * dt * frictions[wheel]
+        x = forwardImpulse * _FORWARD_FACTOR
+        squared = x * x + sideImpulse * sideImpulse
+
+        if squared > grip * grip:
+            # The tyre skids
+            skid = grip / _sqrt(squared)
+            forwardImpulse *= skid
+            sideImpulse *= skid
+
+        impulse = impulses[slot]
+
+        if forwardImpulse:
+            _accumulate(impulse, rx, ry, rz, fx * forwardImpulse, fy * forwardImpulse, fz * forwardImpulse)
+
+        if sideImpulse:
+            # The roll influence moves the point of the side impulse towards the height of the center of mass
+            dx, dy, dz = downs[wheel]
+            height = (dx * rx + dy * ry + dz * rz) * (1.0 - rolls[wheel])
+            _accumulate(impulse, rx - dx * height, ry - dy * height, rz - dz * height, sx * sideImpulse,
+                        sy * sideImpulse, sz * sideImpulse)
+
+    _applyImpulses(world, bodies, impulses, inverses, rotating)
+
+    # Rotations, the wheels on the ground roll at the speed of the chassis at their attachment along the forward axis
+    # of the chassis on the ground, the others keep turning
+    velocities = _velocities(world, bodies)
+    spins = gather("spin")
+
+    for wheel, slot, _, _, _, nx, ny, nz in contacts:
+        r0, r1, r2 = bases[slot]
+        fx, fy, fz = r0[1], r1[1], r2[1]
+        projection = fx * nx + fy * ny + fz * nz
+        fx, fy, fz = fx - nx * projection, fy - ny * projection, fz - nz * projection
+        x, y, z = positions[slot]
+        hard = starts[wheel]
+        rx, ry, rz = hard[0] - x, hard[1] - y, hard[2] - z
+        vx, vy, vz, wx, wy, wz = velocities[slot]
+        spins[wheel] = ((vx + wy * rz - wz * ry) * fx + (vy + wz * rx - wx * rz) * fy +
+                        (vz + wx * ry - wy * rx) * fz) * dt / radius[wheel]
+
+    rotations = list(map(float.__add__, gather("rotation"), spins))
+    offset = 0
+
+    for vehicle in vehicles:
+        end = offset + len(vehicle.objects)
+        vehicle.length[:] = lengths[offset:end]
+        vehicle.rotation[:] = rotations[offset:end]
+        vehicle.spin[:] = [spin * _SPIN_DAMPING for spin in spins[offset:end]]
+        offset = end
+
+
+def place(world):
+    # type: (object) -> None
+    """Move the objects of the wheels of the moving vehicles where their wheels are."""
+
+    moving = world.moving
+    dirty = world.scene._spatial.dirty
+
+    for vehicle in world.vehicles.values():
+        index = vehicle.chassis._body
+
+        if index is None or index >= moving:
+            continue
+
+        chassis = world.transform(vehicle.chassis)
+
+        for wheel, object in enumerate(vehicle.objects):
+            if object.invalid or object._position is None:
+                continue
+
+            position, rows = vehicle.transform(wheel, chassis)
+            data = object._position._data
+            data[0], data[1], data[2] = position
+            object._orientation = _Matrix(rows)
+            dirty[object] = None
+
+
+def _velocities(world, bodies):
+    # type: (object, list[int]) -> list[tuple]
+    """(linear x, y, z, angular x, y, z) velocities of bodies."""
+
+    return list(zip(*[[column[index] for index in bodies] for column in (world.vx, world.vy, world.vz, world.wx,
+                                                                          world.wy, world.wz)]))
+
+
+def _wheelRows(rows, down, axle, steering, rotation):
+    # type: (list, list, tuple, float, float) -> list[list[float]]
+    """Rotation of a wheel: X along the axle and Z up, rolled about the axle and turned about up by the steering."""
+
+    ux, uy, uz = -down[0], -down[1], -down[2]
+    right = _solver._apply(rows, axle)
+    rx, ry, rz = right
+    fx, fy, fz = uy * rz - uz * ry, uz * rx - ux * rz, ux * ry - uy * rx
+    size = _sqrt(fx * fx + fy * fy + fz * fz) or 1.0
+    fx, fy, fz = fx / size, fy / size, fz / size
+    # Rolled by -rotation about right, right x forward is up
+    cosine, sine = _cos(rotation), _sin(rotation)
+    columns = [right, (fx * cosine - ux * sine, fy * cosine - uy * sine, fz * cosine - uz * sine),
+               (ux * cosine + fx * sine, uy * cosine + fy * sine, uz * cosine + fz * sine)]
+
+    if steering:
+        columns = [_turn(column, (ux, uy, uz), steering) for column in columns]
+
+    return [[columns[0][row], columns[1][row], columns[2][row]] for row in range(3)]
+
+
+def _turn(vector, axis, angle):
+    # type: (tuple, tuple, float) -> tuple[float, float, float]
+    """Vector rotated by an angle about a unit axis (Rodrigues)."""
+
+    cosine, sine = _cos(angle), _sin(angle)
+    dot = _solver._dot(axis, vector) * (1.0 - cosine)
+    cx, cy, cz = _solver._cross(axis, vector)
+    return (vector[0] * cosine + cx * sine + axis[0] * dot, vector[1] * cosine + cy * sine + axis[1] * dot,
+            vector[2] * cosine + cz * sine + axis[2] * dot)
+
+
+def _accumulate(impulse, rx, ry, rz, jx, jy, jz):
+    # type: (list[float], float, float, float, float, float, float) -> None
+    """Add an impulse at a point relative to a chassis to its (linear, angular) impulse."""
+
+    impulse[0] += jx
+    impulse[1] += jy
+    impulse[2] += jz
+    impulse[3] += ry * jz - rz * jy
+    impulse[4] += rz * jx - rx * jz
+    impulse[5] += rx * jy - ry * jx
+
+
+def _applyImpulses(world, bodies, impulses, inverses, rotating):
+    # type: (object, list[int], list[list[float]], list[float], list[float]) -> None
+    vx, vy, vz, wx, wy, wz = world.vx, world.vy, world.vz, world.wx, world.wy, world.wz
+
+    for index, (jx, jy, jz, tx, ty, tz), inverse, angular in zip(bodies, impulses, inverses, rotating):
+        vx[index] += jx * inverse
+        vy[index] += jy * inverse
+        vz[index] += jz * inverse
+
+        if angular:
+            wx[index] += tx * angular
+            wy[index] += ty * angular
+            wz[index] += tz * angular
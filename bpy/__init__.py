@@ -1,12 +1,35 @@
 import sys
-import typing
-from . import types
-from . import ops
-from . import utils
-from . import app
-from . import props
-from . import path
-from . import context
+from importlib import import_module as _import_module
+
+TYPE_CHECKING = False
+'''True only for static analysers, typing is not imported at runtime just for its flag '''
+
+if TYPE_CHECKING:
+    from . import types
+    from . import ops
+    from . import utils
+    from . import app
+    from . import props
+    from . import path
+
+_SUBMODULES = frozenset(("types", "ops", "utils", "app", "props", "path"))
+'''Submodules imported on first access, importing bpy stays cheap for scripts that only touch a few of them '''
+
+
+def __getattr__(name):
+    '''Import a submodule on first access, the import binds it on the package so this runs once per submodule 
+
+    '''
+
+    if name in _SUBMODULES:
+        return _import_module("." + name, __name__)
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
+
 
 context: 'types.Context' = None
 
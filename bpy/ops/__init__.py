@@ -1,73 +1,104 @@
 import sys
-import typing
-from . import text
-from . import poselib
-from . import lattice
-from . import export_mesh
-from . import mball
-from . import group
-from . import lamp
-from . import action
-from . import cloth
-from . import camera
-from . import import_scene
-from . import console
-from . import view3d
-from . import file
-from . import transform
-from . import screen
-from . import script
-from . import marker
-from . import sketch
-from . import pose
-from . import image
-from . import gpencil
-from . import curve
-from . import scene
-from . import brush
-from . import outliner
-from . import cachefile
-from . import import_mesh
-from . import render
-from . import ed
-from . import sound
-from . import import_curve
-from . import ptcache
-from . import node
-from . import mesh
-from . import buttons
-from . import logic
-from . import cycles
-from . import surface
-from . import info
-from . import constraint
-from . import boid
-from . import export_scene
-from . import mask
-from . import texture
-from . import import_anim
-from . import graph
-from . import sculpt
-from . import object
-from . import safe_areas
-from . import paint
-from . import anim
-from . import armature
-from . import view2d
-from . import fluid
-from . import paintcurve
-from . import rigidbody
-from . import export_anim
-from . import time
-from . import uv
-from . import ui
-from . import sequencer
-from . import particle
-from . import dpaint
-from . import font
-from . import palette
-from . import nla
-from . import clip
-from . import material
-from . import wm
-from . import world
+from importlib import import_module as _import_module
+
+TYPE_CHECKING = False
+'''True only for static analysers, typing is not imported at runtime just for its flag '''
+
+if TYPE_CHECKING:
+    from . import text
+    from . import poselib
+    from . import lattice
+    from . import export_mesh
+    from . import mball
+    from . import group
+    from . import lamp
+    from . import action
+    from . import cloth
+    from . import camera
+    from . import import_scene
+    from . import console
+    from . import view3d
+    from . import file
+    from . import transform
+    from . import screen
+    from . import script
+    from . import marker
+    from . import sketch
+    from . import pose
+    from . import image
+    from . import gpencil
+    from . import curve
+    from . import scene
+    from . import brush
+    from . import outliner
+    from . import cachefile
+    from . import import_mesh
+    from . import render
+    from . import ed
+    from . import sound
+    from . import import_curve
+    from . import ptcache
+    from . import node
+    from . import mesh
+    from . import buttons
+    from . import logic
+    from . import cycles
+    from . import surface
+    from . import info
+    from . import constraint
+    from . import boid
+    from . import export_scene
+    from . import mask
+    from . import texture
+    from . import import_anim
+    from . import graph
+    from . import sculpt
+    from . import object
+    from . import safe_areas
+    from . import paint
+    from . import anim
+    from . import armature
+    from . import view2d
+    from . import fluid
+    from . import paintcurve
+    from . import rigidbody
+    from . import export_anim
+    from . import time
+    from . import uv
+    from . import ui
+    from . import sequencer
+    from . import particle
+    from . import dpaint
+    from . import font
+    from . import palette
+    from . import nla
+    from . import clip
+    from . import material
+    from . import wm
+    from . import world
+
+_CATEGORIES = frozenset((
+    "text", "poselib", "lattice", "export_mesh", "mball", "group", "lamp", "action", "cloth",
+    "camera", "import_scene", "console", "view3d", "file", "transform", "screen", "script",
+    "marker", "sketch", "pose", "image", "gpencil", "curve", "scene", "brush", "outliner",
+    "cachefile", "import_mesh", "render", "ed", "sound", "import_curve", "ptcache", "node", "mesh",
+    "buttons", "logic", "cycles", "surface", "info", "constraint", "boid", "export_scene", "mask",
+    "texture", "import_anim", "graph", "sculpt", "object", "safe_areas", "paint", "anim",
+    "armature", "view2d", "fluid", "paintcurve", "rigidbody", "export_anim", "time", "uv", "ui",
+    "sequencer", "particle", "dpaint", "font", "palette", "nla", "clip", "material", "wm", "world"))
+'''Operator categories, each imported on first access '''
+
+
+def __getattr__(name):
+    '''Import an operator category on first access, the import binds it on the package so this runs once per category 
+
+    '''
+
+    if name in _CATEGORIES:
+        return _import_module("." + name, __name__)
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _CATEGORIES)
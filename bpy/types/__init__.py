@@ -0,0 +1,2986 @@
+'''Blender data types (bpy.types)
+
+Generated by split_bpy_types.py, do not edit. The classes are defined in the 176 _sNNN shard modules, a shard is
+only imported when one of its classes is first accessed. '''
+
+import sys
+from importlib import import_module as _import_module
+
+TYPE_CHECKING = False
+'''True only for static analysers, typing is not imported at runtime just for its flag '''
+
+if TYPE_CHECKING:
+    from ._s000 import (
+        Action, ActionActuator, ActionConstraint, ActionFCurves, ActionGroup, ActionGroups, ActionPoseMarkers,
+        Actuator, ActuatorSensor)
+    from ._s001 import (
+        AddSequence, Addon, AddonPreferences, Addons, AdjustmentSequence, AlembicObjectPath, AlembicObjectPaths,
+        AlphaOverSequence, AlphaUnderSequence, AlwaysSensor, AndController, AnimData, AnimDataDrivers, AnimViz,
+        AnimVizMotionPaths, AnimVizOnionSkinning, AnyType)
+    from ._s002 import (
+        Area, AreaLamp, AreaSpaces)
+    from ._s003 import (
+        Armature, ArmatureActuator, ArmatureBones, ArmatureEditBones, ArmatureModifier, ArmatureSensor,
+        ArrayModifier, Available)
+    from ._s004 import (
+        BackgroundImage, BackgroundImages, BakePixel, BakeSettings)
+    from ._s005 import (
+        BevelModifier, BezierSplinePoint, BlendData)
+    from ._s006 import (
+        BlendDataActions, BlendDataArmatures, BlendDataBrushes, BlendDataCacheFiles, BlendDataCameras,
+        BlendDataCurves, BlendDataFonts, BlendDataGreasePencils, BlendDataGroups)
+    from ._s007 import (
+        BlendDataImages, BlendDataLamps, BlendDataLattices, BlendDataLibraries, BlendDataLineStyles,
+        BlendDataMasks, BlendDataMaterials)
+    from ._s008 import (
+        BlendDataMeshes, BlendDataMetaBalls, BlendDataMovieClips, BlendDataNodeTrees, BlendDataObjects,
+        BlendDataPaintCurves, BlendDataPalettes, BlendDataParticles)
+    from ._s009 import (
+        BlendDataScenes, BlendDataScreens, BlendDataSounds, BlendDataSpeakers, BlendDataTexts,
+        BlendDataTextures, BlendDataWindowManagers, BlendDataWorlds, BlendTexture, BlenderRNA, BoidRule,
+        BoidRuleAverageSpeed)
+    from ._s010 import (
+        BoidRuleAvoid, BoidRuleAvoidCollision, BoidRuleFight, BoidRuleFollowLeader, BoidRuleGoal, BoidSettings,
+        BoidState)
+    from ._s011 import (
+        Bone, BoneGroup, BoneGroups, BoolProperty)
+    from ._s012 import (
+        BooleanModifier, BrightContrastModifier)
+    from ._s013 import (
+        Brush)
+    from ._s014 import (
+        BrushCapabilities, BrushTextureSlot, BuildModifier, CLIP_UL_tracking_objects, CYCLES, CacheFile)
+    from ._s015 import (
+        Camera, CameraActuator, CameraSolverConstraint, CameraStereoData, CastModifier, ChannelDriverVariables)
+    from ._s016 import (
+        ChildOfConstraint, ChildParticle, ClampToConstraint, ClothCollisionSettings, ClothModifier)
+    from ._s017 import (
+        ClothSettings, ClothSolverResult, CloudsTexture, CollectionProperty, CollisionModifier, CollisionSensor)
+    from ._s018 import (
+        CollisionSettings, ColorBalanceModifier, ColorManagedDisplaySettings,
+        ColorManagedInputColorspaceSettings, ColorManagedSequencerColorspaceSettings, ColorManagedViewSettings,
+        ColorMapping, ColorRamp, ColorRampElement, ColorRampElements, ColorSequence, CompositorNode,
+        CompositorNodeAlphaOver, CompositorNodeBilateralblur)
+    from ._s019 import (
+        CompositorNodeBlur, CompositorNodeBokehBlur, CompositorNodeBokehImage, CompositorNodeBoxMask,
+        CompositorNodeBrightContrast, CompositorNodeChannelMatte, CompositorNodeChromaMatte,
+        CompositorNodeColorBalance)
+    from ._s020 import (
+        CompositorNodeColorCorrection, CompositorNodeColorMatte, CompositorNodeColorSpill,
+        CompositorNodeCombHSVA, CompositorNodeCombRGBA, CompositorNodeCombYCCA, CompositorNodeCombYUVA,
+        CompositorNodeComposite, CompositorNodeCornerPin, CompositorNodeCrop, CompositorNodeCurveRGB,
+        CompositorNodeCurveVec)
+    from ._s021 import (
+        CompositorNodeDBlur, CompositorNodeDefocus, CompositorNodeDespeckle, CompositorNodeDiffMatte,
+        CompositorNodeDilateErode, CompositorNodeDisplace, CompositorNodeDistanceMatte,
+        CompositorNodeDoubleEdgeMask, CompositorNodeEllipseMask, CompositorNodeFilter, CompositorNodeFlip,
+        CompositorNodeGamma)
+    from ._s022 import (
+        CompositorNodeGlare, CompositorNodeGroup, CompositorNodeHueCorrect, CompositorNodeHueSat,
+        CompositorNodeIDMask, CompositorNodeImage, CompositorNodeInpaint, CompositorNodeInvert,
+        CompositorNodeKeying, CompositorNodeKeyingScreen, CompositorNodeLensdist, CompositorNodeLevels)
+    from ._s023 import (
+        CompositorNodeLumaMatte, CompositorNodeMapRange, CompositorNodeMapUV, CompositorNodeMapValue,
+        CompositorNodeMask, CompositorNodeMath, CompositorNodeMixRGB, CompositorNodeMovieClip,
+        CompositorNodeMovieDistortion, CompositorNodeNormal, CompositorNodeNormalize, CompositorNodeOutputFile,
+        CompositorNodeOutputFileFileSlots, CompositorNodeOutputFileLayerSlots, CompositorNodePixelate)
+    from ._s024 import (
+        CompositorNodePlaneTrackDeform, CompositorNodePremulKey, CompositorNodeRGB, CompositorNodeRGBToBW,
+        CompositorNodeRLayers, CompositorNodeRotate, CompositorNodeScale, CompositorNodeSepHSVA,
+        CompositorNodeSepRGBA, CompositorNodeSepYCCA, CompositorNodeSepYUVA, CompositorNodeSetAlpha,
+        CompositorNodeSplitViewer, CompositorNodeStabilize, CompositorNodeSunBeams, CompositorNodeSwitch,
+        CompositorNodeSwitchView, CompositorNodeTexture, CompositorNodeTime, CompositorNodeTonemap)
+    from ._s025 import (
+        CompositorNodeTrackPos, CompositorNodeTransform, CompositorNodeTranslate, CompositorNodeTree,
+        CompositorNodeValToRGB, CompositorNodeValue, CompositorNodeVecBlur, CompositorNodeViewer,
+        CompositorNodeZcombine, ConsoleLine, Constraint)
+    from ._s026 import (
+        ConstraintActuator, ConstraintTarget)
+    from ._s027 import (
+        Context)
+    from ._s028 import (
+        ControlFluidSettings, Controller, CopyLocationConstraint, CopyRotationConstraint, CopyScaleConstraint,
+        CopyTransformsConstraint, CorrectiveSmoothModifier, CrossSequence)
+    from ._s029 import (
+        Curve, CurveMap, CurveMapPoint, CurveMapPoints, CurveMapping)
+    from ._s030 import (
+        CurveModifier, CurvePaintSettings, CurveSplines, CurvesModifier, CyclesCameraSettings,
+        CyclesCurveRenderSettings, CyclesCurveSettings, CyclesDeviceSettings, CyclesLampSettings)
+    from ._s031 import (
+        CyclesMaterialSettings, CyclesMeshSettings, CyclesObjectSettings, CyclesPreferences,
+        CyclesRenderLayerSettings)
+    from ._s032 import (
+        CyclesRenderSettings)
+    from ._s033 import (
+        CyclesVisibilitySettings, CyclesWorldSettings, DampedTrackConstraint, DataTransferModifier,
+        DecimateModifier, DelaySensor)
+    from ._s034 import (
+        Depsgraph, DisplaceModifier, DisplaySafeAreas, DistortedNoiseTexture, DomainFluidSettings)
+    from ._s035 import (
+        DopeSheet, Driver, DriverTarget, DriverVariable, DupliObject)
+    from ._s036 import (
+        DynamicPaintBrushSettings, DynamicPaintCanvasSettings, DynamicPaintModifier)
+    from ._s037 import (
+        DynamicPaintSurface, DynamicPaintSurfaces, EdgeSplitModifier)
+    from ._s038 import (
+        EditBone)
+    from ._s039 import (
+        EditObjectActuator, EffectSequence, EffectorWeights, EnumProperty, EnumPropertyItem)
+    from ._s040 import (
+        EnvironmentMap, EnvironmentMapTexture, Event, ExplodeModifier, ExpressionController)
+    from ._s041 import (
+        FCurve, FCurveKeyframePoints, FCurveModifiers, FCurveSample, FFmpegSettings, FILEBROWSER_UL_dir)
+    from ._s042 import (
+        FModifier, FModifierCycles, FModifierEnvelope, FModifierEnvelopeControlPoint,
+        FModifierEnvelopeControlPoints, FModifierFunctionGenerator, FModifierGenerator, FModifierLimits,
+        FModifierNoise, FModifierPython, FModifierStepped)
+    from ._s043 import (
+        FieldSettings, FileBrowserFSMenuEntry)
+    from ._s044 import (
+        FileSelectParams, Filter2DActuator, FloatProperty, FloorConstraint, FluidFluidSettings, FluidSettings,
+        FluidSimulationModifier, FluidVertexVelocity, FollowPathConstraint)
+    from ._s045 import (
+        FollowTrackConstraint, FreestyleLineSet)
+    from ._s046 import (
+        FreestyleLineStyle, FreestyleModuleSettings, FreestyleModules)
+    from ._s047 import (
+        FreestyleSettings, Function, GPENCIL_PIE_sculpt, GPENCIL_PIE_settings_palette, GPENCIL_PIE_tool_palette,
+        GPENCIL_PIE_tools_more, GPENCIL_UL_brush, GPENCIL_UL_layer, GPENCIL_UL_palettecolor, GPUDOFSettings,
+        GPUFXSettings)
+    from ._s048 import (
+        GPUSSAOSettings, GPencilBrush, GPencilFrame, GPencilFrames, GPencilInterpolateSettings)
+    from ._s049 import (
+        GPencilLayer, GPencilPalette, GPencilPaletteColor, GPencilPaletteColors, GPencilSculptBrush,
+        GPencilSculptSettings)
+    from ._s050 import (
+        GPencilStroke, GPencilStrokePoint, GPencilStrokePoints, GPencilStrokes, GPencilTriangle, GameActuator,
+        GameBooleanProperty, GameFloatProperty, GameIntProperty)
+    from ._s051 import (
+        GameObjectSettings, GameProperty)
+    from ._s052 import (
+        GameSoftBodySettings, GameStringProperty, GameTimerProperty, GammaCrossSequence, GaussianBlurSequence,
+        GlowSequence, GreasePencil, GreasePencilBrushes, GreasePencilLayers, GreasePencilPalettes, Group,
+        GroupObjects)
+    from ._s053 import (
+        Header, HemiLamp, Histogram, HookModifier, HueCorrectModifier, ID, IDMaterials, IKParam,
+        IMAGE_UV_sculpt, IMAGE_UV_sculpt_curve)
+    from ._s054 import (
+        Image)
+    from ._s055 import (
+        ImageFormatSettings, ImagePackedFile, ImagePaint, ImagePreview)
+    from ._s056 import (
+        ImageSequence, ImageTexture, ImageUser)
+    from ._s057 import (
+        ImapaintToolCapabilities, InflowFluidSettings, IntProperty, Itasc, JoystickSensor, Key, KeyConfig,
+        KeyConfigurations)
+    from ._s058 import (
+        KeyMap, KeyMapItem, KeyMapItems, KeyMaps, KeyboardSensor)
+    from ._s059 import (
+        Keyframe, KeyingSet, KeyingSetInfo, KeyingSetPath, KeyingSetPaths, KeyingSets, KeyingSetsAll)
+    from ._s060 import (
+        KinematicConstraint, Lamp, LampSkySettings, LampTextureSlot, LampTextureSlots)
+    from ._s061 import (
+        LaplacianDeformModifier, LaplacianSmoothModifier, Lattice, LatticeModifier, LatticePoint, Library,
+        LimitDistanceConstraint, LimitLocationConstraint)
+    from ._s062 import (
+        LimitRotationConstraint, LimitScaleConstraint, LineStyleAlphaModifier,
+        LineStyleAlphaModifier_AlongStroke, LineStyleAlphaModifier_CreaseAngle,
+        LineStyleAlphaModifier_Curvature_3D)
+    from ._s063 import (
+        LineStyleAlphaModifier_DistanceFromCamera, LineStyleAlphaModifier_DistanceFromObject,
+        LineStyleAlphaModifier_Material, LineStyleAlphaModifier_Noise, LineStyleAlphaModifier_Tangent,
+        LineStyleAlphaModifiers, LineStyleColorModifier)
+    from ._s064 import (
+        LineStyleColorModifier_AlongStroke, LineStyleColorModifier_CreaseAngle,
+        LineStyleColorModifier_Curvature_3D, LineStyleColorModifier_DistanceFromCamera,
+        LineStyleColorModifier_DistanceFromObject, LineStyleColorModifier_Material)
+    from ._s065 import (
+        LineStyleColorModifier_Noise, LineStyleColorModifier_Tangent, LineStyleColorModifiers,
+        LineStyleGeometryModifier, LineStyleGeometryModifier_2DOffset, LineStyleGeometryModifier_2DTransform,
+        LineStyleGeometryModifier_BackboneStretcher, LineStyleGeometryModifier_BezierCurve,
+        LineStyleGeometryModifier_Blueprint)
+    from ._s066 import (
+        LineStyleGeometryModifier_GuidingLines, LineStyleGeometryModifier_PerlinNoise1D,
+        LineStyleGeometryModifier_PerlinNoise2D, LineStyleGeometryModifier_Polygonalization,
+        LineStyleGeometryModifier_Sampling, LineStyleGeometryModifier_Simplification,
+        LineStyleGeometryModifier_SinusDisplacement, LineStyleGeometryModifier_SpatialNoise,
+        LineStyleGeometryModifier_TipRemover)
+    from ._s067 import (
+        LineStyleGeometryModifiers, LineStyleModifier, LineStyleTextureSlot, LineStyleTextureSlots,
+        LineStyleThicknessModifier, LineStyleThicknessModifier_AlongStroke,
+        LineStyleThicknessModifier_Calligraphy, LineStyleThicknessModifier_CreaseAngle,
+        LineStyleThicknessModifier_Curvature_3D)
+    from ._s068 import (
+        LineStyleThicknessModifier_DistanceFromCamera, LineStyleThicknessModifier_DistanceFromObject,
+        LineStyleThicknessModifier_Material, LineStyleThicknessModifier_Noise,
+        LineStyleThicknessModifier_Tangent)
+    from ._s069 import (
+        LineStyleThicknessModifiers, Linesets, LocRotScale, Location, LockedTrackConstraint, LodLevel,
+        LoopColors, MASK_UL_layers, MATERIAL_UL_matslots, MESH_UL_shape_keys, MESH_UL_uvmaps_vcols,
+        MESH_UL_vgroups, Macro, MagicTexture, MaintainVolumeConstraint, MarbleTexture)
+    from ._s070 import (
+        Mask, MaskLayer, MaskLayers, MaskModifier, MaskParent, MaskSequence, MaskSpline)
+    from ._s071 import (
+        MaskSplinePoint, MaskSplinePointUW, MaskSplinePoints, MaskSplines)
+    from ._s072 import (
+        Material)
+    from ._s073 import (
+        MaterialGameSettings, MaterialHalo, MaterialPhysics, MaterialRaytraceMirror,
+        MaterialRaytraceTransparency, MaterialSlot)
+    from ._s074 import (
+        MaterialStrand, MaterialSubsurfaceScattering)
+    from ._s075 import (
+        MaterialTextureSlot, MaterialTextureSlots)
+    from ._s076 import (
+        MaterialVolume, Menu)
+    from ._s077 import (
+        Mesh)
+    from ._s078 import (
+        MeshCacheModifier, MeshColor, MeshColorLayer, MeshDeformModifier, MeshEdge, MeshEdges, MeshLoop,
+        MeshLoopColor, MeshLoopColorLayer, MeshLoops, MeshPaintMaskLayer, MeshPaintMaskProperty)
+    from ._s079 import (
+        MeshPolygon, MeshPolygonFloatProperty, MeshPolygonFloatPropertyLayer, MeshPolygonIntProperty,
+        MeshPolygonIntPropertyLayer, MeshPolygonStringProperty, MeshPolygonStringPropertyLayer, MeshPolygons,
+        MeshSequenceCacheModifier, MeshSkinVertex, MeshSkinVertexLayer, MeshStatVis, MeshTessFace, MeshTessFaces)
+    from ._s080 import (
+        MeshTextureFace, MeshTextureFaceLayer, MeshTexturePoly, MeshTexturePolyLayer, MeshUVLoop,
+        MeshUVLoopLayer, MeshVertex, MeshVertexFloatProperty, MeshVertexFloatPropertyLayer,
+        MeshVertexIntProperty, MeshVertexIntPropertyLayer, MeshVertexStringProperty,
+        MeshVertexStringPropertyLayer, MeshVertices, MessageActuator, MessageSensor)
+    from ._s081 import (
+        MetaBall, MetaBallElements, MetaElement, MetaSequence, MirrorModifier)
+    from ._s082 import (
+        Modifier, MotionPath, MotionPathVert, MouseActuator, MouseSensor, MovieClip)
+    from ._s083 import (
+        MovieClipProxy, MovieClipScopes, MovieClipSequence, MovieClipUser, MovieReconstructedCamera,
+        MovieSequence)
+    from ._s084 import (
+        MovieTracking, MovieTrackingCamera, MovieTrackingDopesheet, MovieTrackingMarker, MovieTrackingMarkers,
+        MovieTrackingObject, MovieTrackingObjectPlaneTracks, MovieTrackingObjectTracks, MovieTrackingObjects,
+        MovieTrackingPlaneMarker)
+    from ._s085 import (
+        MovieTrackingPlaneMarkers, MovieTrackingPlaneTrack, MovieTrackingPlaneTracks,
+        MovieTrackingReconstructedCameras, MovieTrackingReconstruction, MovieTrackingSettings,
+        MovieTrackingStabilization)
+    from ._s086 import (
+        MovieTrackingTrack, MovieTrackingTracks, MulticamSequence, MultiplySequence, MultiresModifier,
+        MusgraveTexture, NODE_MT_add, NODE_PT_quality)
+    from ._s087 import (
+        NODE_UL_interface_sockets, NandController, NearSensor, NlaStrip, NlaStripFCurves, NlaStrips, NlaTrack,
+        NlaTracks)
+    from ._s088 import (
+        Node, NodeCustomGroup, NodeFrame, NodeGroup, NodeGroupInput, NodeGroupOutput, NodeInputs,
+        NodeInstanceHash)
+    from ._s089 import (
+        NodeInternal, NodeInternalSocketTemplate, NodeLink, NodeLinks, NodeOutputFileSlotFile,
+        NodeOutputFileSlotLayer, NodeOutputs, NodeReroute, NodeSetting, NodeSocket, NodeSocketBool,
+        NodeSocketColor, NodeSocketFloat, NodeSocketFloatAngle, NodeSocketFloatFactor, NodeSocketFloatPercentage)
+    from ._s090 import (
+        NodeSocketFloatTime, NodeSocketFloatUnsigned, NodeSocketInt, NodeSocketIntFactor,
+        NodeSocketIntPercentage, NodeSocketIntUnsigned, NodeSocketInterface, NodeSocketInterfaceBool,
+        NodeSocketInterfaceColor, NodeSocketInterfaceFloat, NodeSocketInterfaceFloatAngle,
+        NodeSocketInterfaceFloatFactor, NodeSocketInterfaceFloatPercentage, NodeSocketInterfaceFloatTime,
+        NodeSocketInterfaceFloatUnsigned, NodeSocketInterfaceInt, NodeSocketInterfaceIntFactor,
+        NodeSocketInterfaceIntPercentage, NodeSocketInterfaceIntUnsigned, NodeSocketInterfaceShader)
+    from ._s091 import (
+        NodeSocketInterfaceStandard, NodeSocketInterfaceString, NodeSocketInterfaceVector,
+        NodeSocketInterfaceVectorAcceleration, NodeSocketInterfaceVectorDirection,
+        NodeSocketInterfaceVectorEuler, NodeSocketInterfaceVectorTranslation, NodeSocketInterfaceVectorVelocity,
+        NodeSocketInterfaceVectorXYZ, NodeSocketShader, NodeSocketStandard, NodeSocketString, NodeSocketVector,
+        NodeSocketVectorAcceleration, NodeSocketVectorDirection, NodeSocketVectorEuler,
+        NodeSocketVectorTranslation, NodeSocketVectorVelocity, NodeSocketVectorXYZ, NodeSocketVirtual)
+    from ._s092 import (
+        NodeTree, NodeTreeInputs, NodeTreeOutputs, NodeTreePath, Nodes, NoiseTexture, NorController,
+        NormalEditModifier)
+    from ._s093 import (
+        Object)
+    from ._s094 import (
+        ObjectActuator, ObjectBase, ObjectConstraints, ObjectModifiers, ObjectSolverConstraint,
+        ObstacleFluidSettings)
+    from ._s095 import (
+        OceanModifier, OceanTexData, OceanTexture, Operator, OperatorFileListElement, OperatorMacro,
+        OperatorMousePath, OperatorOptions, OperatorProperties)
+    from ._s096 import (
+        OperatorStrokeElement, OrController, OutflowFluidSettings, OverDropSequence,
+        PARTICLE_UL_particle_systems, PHYSICS_UL_dynapaint_surfaces, PackedFile, Paint, PaintCurve, Palette,
+        PaletteColor, PaletteColors, Panel, ParentActuator)
+    from ._s097 import (
+        Particle, ParticleBrush, ParticleDupliWeight, ParticleEdit, ParticleFluidSettings, ParticleHairKey)
+    from ._s098 import (
+        ParticleInstanceModifier, ParticleKey)
+    from ._s099 import (
+        ParticleSettings)
+    from ._s100 import (
+        ParticleSettingsTextureSlot, ParticleSettingsTextureSlots)
+    from ._s101 import (
+        ParticleSystem, ParticleSystemModifier, ParticleSystems)
+    from ._s102 import (
+        ParticleTarget, PathCompare, PathCompareCollection, PivotConstraint, PointCache, PointCaches,
+        PointDensity, PointDensityTexture)
+    from ._s103 import (
+        PointLamp, PointerProperty, PolygonFloatProperties, PolygonIntProperties, PolygonStringProperties, Pose)
+    from ._s104 import (
+        PoseBone)
+    from ._s105 import (
+        PoseBoneConstraints, Property, PropertyActuator, PropertyGroup, PropertyGroupItem, PropertySensor,
+        PythonConstraint, PythonController, RENDERLAYER_UL_linesets, RENDERLAYER_UL_renderlayers)
+    from ._s106 import (
+        RENDERLAYER_UL_renderviews, RadarSensor, RandomActuator, RandomSensor, RaySensor, Region, RegionView3D,
+        RemeshModifier)
+    from ._s107 import (
+        RenderEngine)
+    from ._s108 import (
+        RenderLayer, RenderLayers)
+    from ._s109 import (
+        RenderPass, RenderPasses, RenderResult)
+    from ._s110 import (
+        RenderSettings)
+    from ._s111 import (
+        RenderSlot, RenderSlots, RenderView, RenderViews, RigidBodyConstraint)
+    from ._s112 import (
+        RigidBodyJointConstraint, RigidBodyObject, RigidBodyWorld, Rotation, SCENE_UL_keying_set_paths)
+    from ._s113 import (
+        SPHFluidSettings, Scaling)
+    from ._s114 import (
+        Scene)
+    from ._s115 import (
+        SceneActuator, SceneBases, SceneGameData)
+    from ._s116 import (
+        SceneGameRecastData, SceneObjects)
+    from ._s117 import (
+        SceneRenderLayer, SceneRenderView)
+    from ._s118 import (
+        SceneSequence, Scopes, Screen, ScrewModifier)
+    from ._s119 import (
+        Sculpt, SculptToolCapabilities, SelectedUvElement, Sensor)
+    from ._s120 import (
+        Sequence, SequenceColorBalance, SequenceColorBalanceData, SequenceCrop, SequenceEditor, SequenceElement,
+        SequenceElements)
+    from ._s121 import (
+        SequenceModifier, SequenceModifiers, SequenceProxy, SequenceTransform, SequencerTonemapModifierData,
+        Sequences, ShaderNode, ShaderNodeAddShader, ShaderNodeAmbientOcclusion)
+    from ._s122 import (
+        ShaderNodeAttribute, ShaderNodeBackground, ShaderNodeBlackbody, ShaderNodeBrightContrast,
+        ShaderNodeBsdfAnisotropic, ShaderNodeBsdfDiffuse, ShaderNodeBsdfGlass, ShaderNodeBsdfGlossy,
+        ShaderNodeBsdfHair, ShaderNodeBsdfPrincipled, ShaderNodeBsdfRefraction, ShaderNodeBsdfToon,
+        ShaderNodeBsdfTranslucent, ShaderNodeBsdfTransparent, ShaderNodeBsdfVelvet, ShaderNodeBump,
+        ShaderNodeCameraData, ShaderNodeCombineHSV, ShaderNodeCombineRGB, ShaderNodeCombineXYZ,
+        ShaderNodeEmission, ShaderNodeExtendedMaterial, ShaderNodeFresnel, ShaderNodeGamma, ShaderNodeGeometry,
+        ShaderNodeGroup, ShaderNodeHairInfo, ShaderNodeHoldout, ShaderNodeHueSaturation, ShaderNodeInvert,
+        ShaderNodeLampData, ShaderNodeLayerWeight, ShaderNodeLightFalloff, ShaderNodeLightPath,
+        ShaderNodeMapping, ShaderNodeMaterial, ShaderNodeMath, ShaderNodeMixRGB, ShaderNodeMixShader,
+        ShaderNodeNewGeometry, ShaderNodeNormal, ShaderNodeNormalMap, ShaderNodeObjectInfo, ShaderNodeOutput,
+        ShaderNodeOutputLamp, ShaderNodeOutputLineStyle)
+    from ._s123 import (
+        ShaderNodeOutputMaterial, ShaderNodeOutputWorld, ShaderNodeParticleInfo, ShaderNodeRGB,
+        ShaderNodeRGBCurve, ShaderNodeRGBToBW, ShaderNodeScript, ShaderNodeSeparateHSV, ShaderNodeSeparateRGB,
+        ShaderNodeSeparateXYZ, ShaderNodeSqueeze, ShaderNodeSubsurfaceScattering, ShaderNodeTangent,
+        ShaderNodeTexBrick, ShaderNodeTexChecker, ShaderNodeTexCoord, ShaderNodeTexEnvironment,
+        ShaderNodeTexGradient, ShaderNodeTexImage, ShaderNodeTexMagic, ShaderNodeTexMusgrave, ShaderNodeTexNoise)
+    from ._s124 import (
+        ShaderNodeTexPointDensity, ShaderNodeTexSky, ShaderNodeTexVoronoi, ShaderNodeTexWave, ShaderNodeTexture,
+        ShaderNodeTree, ShaderNodeUVAlongStroke, ShaderNodeUVMap, ShaderNodeValToRGB, ShaderNodeValue,
+        ShaderNodeVectorCurve, ShaderNodeVectorMath, ShaderNodeVectorTransform, ShaderNodeVolumeAbsorption,
+        ShaderNodeVolumeScatter, ShaderNodeWavelength, ShaderNodeWireframe, ShapeKey, ShapeKeyBezierPoint)
+    from ._s125 import (
+        ShapeKeyCurvePoint, ShapeKeyPoint, ShrinkwrapConstraint, ShrinkwrapModifier, SimpleDeformModifier,
+        SkinModifier, SmokeCollSettings)
+    from ._s126 import (
+        SmokeDomainSettings)
+    from ._s127 import (
+        SmokeFlowSettings, SmokeModifier, SmoothModifier, SoftBodyModifier)
+    from ._s128 import (
+        SoftBodySettings, SolidifyModifier)
+    from ._s129 import (
+        Sound, SoundActuator, SoundSequence, Space)
+    from ._s130 import (
+        SpaceClipEditor, SpaceConsole, SpaceDopeSheetEditor)
+    from ._s131 import (
+        SpaceFileBrowser, SpaceGraphEditor, SpaceImageEditor)
+    from ._s132 import (
+        SpaceInfo, SpaceLogicEditor, SpaceNLA, SpaceNodeEditor, SpaceNodeEditorPath)
+    from ._s133 import (
+        SpaceOutliner, SpaceProperties, SpaceSequenceEditor, SpaceTextEditor)
+    from ._s134 import (
+        SpaceTimeline, SpaceUVEditor, SpaceUserPreferences)
+    from ._s135 import (
+        SpaceView3D)
+    from ._s136 import (
+        Speaker, SpeedControlSequence, Spline, SplineBezierPoints, SplineIKConstraint, SplinePoint)
+    from ._s137 import (
+        SplinePoints, SpotLamp, StateActuator, SteeringActuator, Stereo3dDisplay)
+    from ._s138 import (
+        Stereo3dFormat, StretchToConstraint, StringProperty, Struct, StucciTexture, SubsurfModifier,
+        SubtractSequence)
+    from ._s139 import (
+        SunLamp, SurfaceCurve, SurfaceDeformModifier, SurfaceModifier, TEXTURE_UL_texpaintslots,
+        TEXTURE_UL_texslots, TessfaceUVTextures, TexMapping, TexPaintSlot)
+    from ._s140 import (
+        Text, TextBox, TextCharacterFormat, TextCurve, TextLine, TextSequence)
+    from ._s141 import (
+        Texture, TextureNode, TextureNodeAt, TextureNodeBricks, TextureNodeChecker, TextureNodeCompose,
+        TextureNodeCoordinates, TextureNodeCurveRGB, TextureNodeCurveTime, TextureNodeDecompose,
+        TextureNodeDistance, TextureNodeGroup, TextureNodeHueSaturation, TextureNodeImage, TextureNodeInvert,
+        TextureNodeMath, TextureNodeMixRGB, TextureNodeOutput, TextureNodeRGBToBW, TextureNodeRotate,
+        TextureNodeScale, TextureNodeTexBlend, TextureNodeTexClouds, TextureNodeTexDistNoise,
+        TextureNodeTexMagic, TextureNodeTexMarble, TextureNodeTexMusgrave, TextureNodeTexNoise,
+        TextureNodeTexStucci, TextureNodeTexVoronoi, TextureNodeTexWood, TextureNodeTexture,
+        TextureNodeTranslate, TextureNodeTree, TextureNodeValToNor, TextureNodeValToRGB, TextureNodeViewer)
+    from ._s142 import (
+        TextureSlot, Theme, ThemeBoneColorSet, ThemeClipEditor)
+    from ._s143 import (
+        ThemeConsole, ThemeDopeSheet, ThemeFileBrowser, ThemeFontStyle, ThemeGradientColors)
+    from ._s144 import (
+        ThemeGraphEditor)
+    from ._s145 import (
+        ThemeImageEditor, ThemeInfo, ThemeLogicEditor)
+    from ._s146 import (
+        ThemeNLAEditor, ThemeNodeEditor, ThemeOutliner, ThemePanelColors, ThemeProperties)
+    from ._s147 import (
+        ThemeSequenceEditor, ThemeSpaceGeneric, ThemeSpaceGradient, ThemeSpaceListGeneric, ThemeStyle)
+    from ._s148 import (
+        ThemeTextEditor, ThemeTimeline, ThemeUserInterface, ThemeUserPreferences)
+    from ._s149 import (
+        ThemeView3D)
+    from ._s150 import (
+        ThemeWidgetColors, ThemeWidgetStateColors, TimelineMarker, TimelineMarkers, Timer)
+    from ._s151 import (
+        ToolSettings)
+    from ._s152 import (
+        TrackToConstraint, TransformCacheConstraint, TransformConstraint, TransformOrientation)
+    from ._s153 import (
+        TransformSequence, TriangulateModifier)
+    from ._s154 import (
+        UILayout)
+    from ._s155 import (
+        UIList, UIPieMenu, UIPopupMenu, UI_UL_list, UVLoopLayers, UVProjectModifier, UVProjector, UVTextures,
+        UVWarpModifier, UnifiedPaintSettings)
+    from ._s156 import (
+        UnitSettings, UnknownType, UserPreferences, UserPreferencesEdit)
+    from ._s157 import (
+        UserPreferencesFilePaths, UserPreferencesInput)
+    from ._s158 import (
+        UserPreferencesSystem)
+    from ._s159 import (
+        UserPreferencesView, UserSolidLight, UvSculpt, VIEW3D_MT_transform, VIEW3D_MT_transform_armature,
+        VIEW3D_MT_transform_object, VectorFont, VertexColors, VertexFloatProperties)
+    from ._s160 import (
+        VertexGroup, VertexGroupElement, VertexGroups, VertexIntProperties, VertexPaint, VertexStringProperties,
+        VertexWeightEditModifier, VertexWeightMixModifier)
+    from ._s161 import (
+        VertexWeightProximityModifier, View2D, VisibilityActuator, VoronoiTexture, VoxelData, VoxelDataTexture,
+        WalkNavigation)
+    from ._s162 import (
+        WarpModifier, WaveModifier, WhiteBalanceModifier, WholeCharacter, WholeCharacterSelected, Window)
+    from ._s163 import (
+        WindowManager, WipeSequence, WireframeModifier, WoodTexture, World)
+    from ._s164 import (
+        WorldLighting, WorldMistSettings, WorldTextureSlot, WorldTextureSlots, XnorController, XorController,
+        bpy_prop_collection)
+    from ._s165 import (
+        bpy_struct, BONE_PT_constraints, BONE_PT_context_bone, BONE_PT_curved, BONE_PT_custom_props,
+        BONE_PT_deform, BONE_PT_display, BONE_PT_inverse_kinematics, BONE_PT_relations, BONE_PT_transform,
+        CAMERA_PT_presets, CLIP_HT_header, CLIP_MT_clip, CLIP_MT_marker_pie, CLIP_MT_mask_handle_type_menu,
+        CLIP_MT_masking_editor_menus, CLIP_MT_pivot_pie, CLIP_MT_proxy, CLIP_MT_reconstruction,
+        CLIP_MT_reconstruction_pie, CLIP_MT_select, CLIP_MT_select_grouped, CLIP_MT_solving_pie,
+        CLIP_MT_stabilize_2d_context_menu, CLIP_MT_stabilize_2d_rotation_context_menu, CLIP_MT_track,
+        CLIP_MT_track_transform, CLIP_MT_track_visibility, CLIP_MT_tracking_context_menu,
+        CLIP_MT_tracking_editor_menus, CLIP_MT_tracking_pie, CLIP_MT_view, CLIP_PT_active_mask_point,
+        CLIP_PT_active_mask_spline, CLIP_PT_camera_presets, CLIP_PT_clip_display, CLIP_PT_display,
+        CLIP_PT_footage, CLIP_PT_grease_pencil, CLIP_PT_marker, CLIP_PT_marker_display, CLIP_PT_mask,
+        CLIP_PT_mask_display, CLIP_PT_mask_layers, CLIP_PT_objects, CLIP_PT_plane_track, CLIP_PT_proxy,
+        CLIP_PT_stabilization, CLIP_PT_tools_cleanup, CLIP_PT_tools_clip, CLIP_PT_tools_geometry,
+        CLIP_PT_tools_grease_pencil_draw, CLIP_PT_tools_marker, CLIP_PT_tools_mask_tools,
+        CLIP_PT_tools_mask_transforms, CLIP_PT_tools_object, CLIP_PT_tools_orientation)
+    from ._s166 import (
+        CLIP_PT_tools_plane_tracking, CLIP_PT_tools_scenesetup, CLIP_PT_tools_solve, CLIP_PT_tools_tracking,
+        CLIP_PT_track, CLIP_PT_track_color_presets, CLIP_PT_track_settings, CLIP_PT_track_settings_extras,
+        CLIP_PT_tracking_camera, CLIP_PT_tracking_lens, CLIP_PT_tracking_settings,
+        CLIP_PT_tracking_settings_extras, CLIP_PT_tracking_settings_presets, CLOTH_PT_presets,
+        COLLECTION_MT_context_menu, CONSOLE_HT_header, CONSOLE_MT_console, CONSOLE_MT_editor_menus,
+        CONSOLE_MT_language, DATA_MT_bone_group_context_menu, DATA_PT_EEVEE_light, DATA_PT_EEVEE_light_distance,
+        DATA_PT_EEVEE_shadow, DATA_PT_EEVEE_shadow_cascaded_shadow_map, DATA_PT_EEVEE_shadow_contact,
+        DATA_PT_active_spline, DATA_PT_area, DATA_PT_bone_groups, DATA_PT_camera,
+        DATA_PT_camera_background_image, DATA_PT_camera_display, DATA_PT_camera_display_composition_guides,
+        DATA_PT_camera_display_passepartout, DATA_PT_camera_dof, DATA_PT_camera_dof_aperture,
+        DATA_PT_camera_safe_areas, DATA_PT_camera_safe_areas_center_cut, DATA_PT_camera_stereoscopy,
+        DATA_PT_cone, DATA_PT_context_arm, DATA_PT_context_camera, DATA_PT_context_curve,
+        DATA_PT_context_gpencil, DATA_PT_context_lattice, DATA_PT_context_light, DATA_PT_context_lightprobe,
+        DATA_PT_context_mesh, DATA_PT_context_metaball, DATA_PT_context_speaker, DATA_PT_curve_texture_space,
+        DATA_PT_custom_props_arm, DATA_PT_custom_props_camera, DATA_PT_custom_props_curve,
+        DATA_PT_custom_props_gpencil, DATA_PT_custom_props_lattice, DATA_PT_custom_props_light,
+        DATA_PT_custom_props_mesh, DATA_PT_custom_props_metaball, DATA_PT_custom_props_speaker,
+        DATA_PT_customdata, DATA_PT_display, DATA_PT_distance, DATA_PT_empty, DATA_PT_empty_image,
+        DATA_PT_face_maps, DATA_PT_falloff_curve, DATA_PT_font, DATA_PT_font_transform, DATA_PT_geometry_curve,
+        DATA_PT_geometry_curve_bevel, DATA_PT_gpencil_canvas, DATA_PT_gpencil_display,
+        DATA_PT_gpencil_layer_adjustments, DATA_PT_gpencil_layer_display, DATA_PT_gpencil_layer_relations,
+        DATA_PT_gpencil_layers, DATA_PT_gpencil_modifiers, DATA_PT_gpencil_onion_skinning,
+        DATA_PT_gpencil_onion_skinning_custom_colors, DATA_PT_gpencil_onion_skinning_display,
+        DATA_PT_gpencil_strokes, DATA_PT_gpencil_vertex_groups, DATA_PT_iksolver_itasc, DATA_PT_lattice,
+        DATA_PT_lens, DATA_PT_light, DATA_PT_lightprobe, DATA_PT_lightprobe_display,
+        DATA_PT_lightprobe_parallax, DATA_PT_lightprobe_visibility, DATA_PT_mball_texture_space,
+        DATA_PT_metaball, DATA_PT_metaball_element, DATA_PT_modifiers, DATA_PT_motion_paths,
+        DATA_PT_motion_paths_display, DATA_PT_normals, DATA_PT_normals_auto_smooth, DATA_PT_paragraph,
+        DATA_PT_paragraph_alignment)
+    from ._s167 import (
+        DATA_PT_paragraph_spacing, DATA_PT_pathanim, DATA_PT_pose_library, DATA_PT_preview, DATA_PT_shader_fx,
+        DATA_PT_shape_curve, DATA_PT_shape_keys, DATA_PT_skeleton, DATA_PT_speaker, DATA_PT_spot,
+        DATA_PT_text_boxes, DATA_PT_texture_space, DATA_PT_uv_texture, DATA_PT_vertex_colors,
+        DATA_PT_vertex_groups, DOPESHEET_HT_editor_buttons, DOPESHEET_HT_header, DOPESHEET_MT_channel,
+        DOPESHEET_MT_channel_context_menu, DOPESHEET_MT_context_menu, DOPESHEET_MT_delete,
+        DOPESHEET_MT_editor_menus, DOPESHEET_MT_gpencil_channel, DOPESHEET_MT_gpencil_frame, DOPESHEET_MT_key,
+        DOPESHEET_MT_key_transform, DOPESHEET_MT_marker, DOPESHEET_MT_select, DOPESHEET_MT_snap_pie,
+        DOPESHEET_MT_view, DOPESHEET_PT_filters, EEVEE_MATERIAL_PT_context_material, EEVEE_MATERIAL_PT_settings,
+        EEVEE_MATERIAL_PT_surface, EEVEE_MATERIAL_PT_volume, EEVEE_WORLD_PT_mist, EEVEE_WORLD_PT_surface,
+        EEVEE_WORLD_PT_volume, FILEBROWSER_HT_header, FILEBROWSER_MT_bookmarks_context_menu,
+        FILEBROWSER_MT_view, FILEBROWSER_PT_advanced_filter, FILEBROWSER_PT_bookmarks_favorites,
+        FILEBROWSER_PT_bookmarks_recents, FILEBROWSER_PT_bookmarks_system, FILEBROWSER_PT_bookmarks_volumes,
+        FLUID_PT_presets, GPENCIL_MT_cleanup, GPENCIL_MT_color_context_menu, GPENCIL_MT_gpencil_draw_delete,
+        GPENCIL_MT_gpencil_vertex_group, GPENCIL_MT_layer_context_menu, GPENCIL_MT_pie_sculpt,
+        GPENCIL_MT_pie_settings_palette, GPENCIL_MT_pie_tool_palette, GPENCIL_MT_pie_tools_more,
+        GPENCIL_MT_separate, GPENCIL_MT_snap, GPENCIL_UL_annotation_layer, GPENCIL_UL_matslots,
+        GPENCIL_UL_vgroups, GRAPH_HT_header, GRAPH_MT_channel, GRAPH_MT_channel_context_menu,
+        GRAPH_MT_context_menu, GRAPH_MT_delete, GRAPH_MT_editor_menus, GRAPH_MT_key, GRAPH_MT_key_transform,
+        GRAPH_MT_marker, GRAPH_MT_pivot_pie, GRAPH_MT_select, GRAPH_MT_snap_pie, GRAPH_MT_view,
+        GRAPH_PT_filters, IMAGE_HT_header, IMAGE_HT_tool_header, IMAGE_MT_brush, IMAGE_MT_image,
+        IMAGE_MT_image_invert, IMAGE_MT_mask_context_menu, IMAGE_MT_pivot_pie, IMAGE_MT_select, IMAGE_MT_uvs,
+        IMAGE_MT_uvs_context_menu, IMAGE_MT_uvs_mirror, IMAGE_MT_uvs_select_mode, IMAGE_MT_uvs_showhide,
+        IMAGE_MT_uvs_snap, IMAGE_MT_uvs_snap_pie, IMAGE_MT_uvs_transform, IMAGE_MT_uvs_weldalign, IMAGE_MT_view,
+        IMAGE_MT_view_zoom, IMAGE_PT_active_mask_point, IMAGE_PT_active_mask_spline, IMAGE_PT_active_tool,
+        IMAGE_PT_grease_pencil, IMAGE_PT_image_properties, IMAGE_PT_mask)
+    from ._s168 import (
+        IMAGE_PT_mask_layers, IMAGE_PT_paint, IMAGE_PT_paint_clone, IMAGE_PT_paint_color, IMAGE_PT_paint_curve,
+        IMAGE_PT_paint_gradient, IMAGE_PT_paint_options, IMAGE_PT_paint_stroke,
+        IMAGE_PT_paint_stroke_smooth_stroke, IMAGE_PT_paint_swatches, IMAGE_PT_render_slots,
+        IMAGE_PT_sample_line, IMAGE_PT_scope_sample, IMAGE_PT_snapping, IMAGE_PT_tools_active,
+        IMAGE_PT_tools_brush_display, IMAGE_PT_tools_brush_display_custom_icon,
+        IMAGE_PT_tools_brush_display_show_brush, IMAGE_PT_tools_brush_texture,
+        IMAGE_PT_tools_imagepaint_symmetry, IMAGE_PT_tools_mask_texture, IMAGE_PT_uv_cursor,
+        IMAGE_PT_uv_sculpt_brush, IMAGE_PT_uv_sculpt_curve, IMAGE_PT_view_display,
+        IMAGE_PT_view_display_uv_edit_overlays, IMAGE_PT_view_display_uv_edit_overlays_stretch,
+        IMAGE_PT_view_histogram, IMAGE_PT_view_vectorscope, IMAGE_PT_view_waveform, IMAGE_UL_render_slots,
+        INFO_HT_header, INFO_MT_area, MASK_MT_animation, MASK_MT_editor_menus, MASK_MT_mask, MASK_MT_select,
+        MASK_MT_transform, MASK_MT_visibility, MATERIAL_MT_context_menu, MATERIAL_PT_custom_props,
+        MATERIAL_PT_freestyle_line, MATERIAL_PT_gpencil_custom_props, MATERIAL_PT_gpencil_fillcolor,
+        MATERIAL_PT_gpencil_material_presets, MATERIAL_PT_gpencil_options, MATERIAL_PT_gpencil_preview,
+        MATERIAL_PT_gpencil_slots, MATERIAL_PT_gpencil_strokecolor, MATERIAL_PT_gpencil_surface,
+        MATERIAL_PT_preview, MATERIAL_PT_viewport, MESH_MT_shape_key_context_menu,
+        MESH_MT_vertex_group_context_menu, MESH_UL_fmaps, MESH_UL_uvmaps, MESH_UL_vcols, NLA_HT_header,
+        NLA_MT_add, NLA_MT_channel_context_menu, NLA_MT_context_menu, NLA_MT_edit, NLA_MT_edit_transform,
+        NLA_MT_editor_menus, NLA_MT_marker, NLA_MT_select, NLA_MT_snap_pie, NLA_MT_view, NLA_PT_filters,
+        NODE_HT_header, NODE_MT_context_menu, NODE_MT_editor_menus, NODE_MT_node,
+        NODE_MT_node_color_context_menu, NODE_MT_select, NODE_MT_view, NODE_PT_active_node_color,
+        NODE_PT_active_node_generic, NODE_PT_active_node_properties, NODE_PT_active_tool, NODE_PT_backdrop,
+        NODE_PT_grease_pencil, NODE_PT_grease_pencil_tools, NODE_PT_material_slots, NODE_PT_node_color_presets,
+        NODE_PT_texture_mapping, NODE_PT_tools_active, OBJECT_PT_collections, OBJECT_PT_constraints,
+        OBJECT_PT_context_object, OBJECT_PT_custom_props, OBJECT_PT_delta_transform, OBJECT_PT_display,
+        OBJECT_PT_display_bounds, OBJECT_PT_instancing, OBJECT_PT_instancing_size, OBJECT_PT_motion_paths,
+        OBJECT_PT_motion_paths_display, OBJECT_PT_relations, OBJECT_PT_transform)
+    from ._s169 import (
+        OBJECT_PT_visibility, OUTLINER_HT_header, OUTLINER_MT_collection, OUTLINER_MT_collection_new,
+        OUTLINER_MT_collection_view_layer, OUTLINER_MT_collection_visibility, OUTLINER_MT_context,
+        OUTLINER_MT_context_view, OUTLINER_MT_edit_datablocks, OUTLINER_MT_editor_menus, OUTLINER_MT_object,
+        OUTLINER_PT_filter, PARTICLE_MT_context_menu, PARTICLE_PT_boidbrain, PARTICLE_PT_cache,
+        PARTICLE_PT_children, PARTICLE_PT_children_clumping, PARTICLE_PT_children_clumping_noise,
+        PARTICLE_PT_children_kink, PARTICLE_PT_children_parting, PARTICLE_PT_children_roughness,
+        PARTICLE_PT_context_particles, PARTICLE_PT_custom_props, PARTICLE_PT_draw, PARTICLE_PT_emission,
+        PARTICLE_PT_emission_source, PARTICLE_PT_field_weights, PARTICLE_PT_force_fields,
+        PARTICLE_PT_force_fields_type1, PARTICLE_PT_force_fields_type1_falloff, PARTICLE_PT_force_fields_type2,
+        PARTICLE_PT_force_fields_type2_falloff, PARTICLE_PT_hair_dynamics, PARTICLE_PT_hair_dynamics_presets,
+        PARTICLE_PT_hair_dynamics_structure, PARTICLE_PT_hair_dynamics_volume, PARTICLE_PT_hair_shape,
+        PARTICLE_PT_physics, PARTICLE_PT_physics_boids_battle, PARTICLE_PT_physics_boids_misc,
+        PARTICLE_PT_physics_boids_movement, PARTICLE_PT_physics_deflection, PARTICLE_PT_physics_fluid_advanced,
+        PARTICLE_PT_physics_fluid_interaction, PARTICLE_PT_physics_fluid_springs,
+        PARTICLE_PT_physics_fluid_springs_advanced, PARTICLE_PT_physics_fluid_springs_viscoelastic,
+        PARTICLE_PT_physics_forces, PARTICLE_PT_physics_integration, PARTICLE_PT_physics_relations,
+        PARTICLE_PT_render, PARTICLE_PT_render_collection, PARTICLE_PT_render_collection_use_count,
+        PARTICLE_PT_render_extra, PARTICLE_PT_render_object, PARTICLE_PT_render_path,
+        PARTICLE_PT_render_path_timing, PARTICLE_PT_rotation, PARTICLE_PT_rotation_angular_velocity,
+        PARTICLE_PT_textures, PARTICLE_PT_velocity, PARTICLE_PT_vertexgroups, PHYSICS_PT_add, PHYSICS_PT_cloth,
+        PHYSICS_PT_cloth_cache, PHYSICS_PT_cloth_collision, PHYSICS_PT_cloth_damping,
+        PHYSICS_PT_cloth_field_weights, PHYSICS_PT_cloth_object_collision, PHYSICS_PT_cloth_physical_properties,
+        PHYSICS_PT_cloth_property_weights, PHYSICS_PT_cloth_self_collision, PHYSICS_PT_cloth_shape,
+        PHYSICS_PT_cloth_stiffness, PHYSICS_PT_collision, PHYSICS_PT_collision_particle,
+        PHYSICS_PT_collision_softbody, PHYSICS_PT_domain_bake, PHYSICS_PT_domain_boundary,
+        PHYSICS_PT_domain_gravity, PHYSICS_PT_domain_particles, PHYSICS_PT_domain_viscosity,
+        PHYSICS_PT_dp_brush_source, PHYSICS_PT_dp_brush_source_color_ramp, PHYSICS_PT_dp_brush_velocity,
+        PHYSICS_PT_dp_brush_velocity_color_ramp, PHYSICS_PT_dp_brush_velocity_smudge, PHYSICS_PT_dp_brush_wave,
+        PHYSICS_PT_dp_cache, PHYSICS_PT_dp_canvas_initial_color, PHYSICS_PT_dp_canvas_output,
+        PHYSICS_PT_dp_canvas_output_paintmaps, PHYSICS_PT_dp_canvas_output_wetmaps, PHYSICS_PT_dp_effects,
+        PHYSICS_PT_dp_effects_drip, PHYSICS_PT_dp_effects_drip_weights, PHYSICS_PT_dp_effects_shrink,
+        PHYSICS_PT_dp_effects_spread, PHYSICS_PT_dp_surface_canvas, PHYSICS_PT_dp_surface_canvas_paint_dissolve)
+    from ._s170 import (
+        PHYSICS_PT_dp_surface_canvas_paint_dry, PHYSICS_PT_dynamic_paint, PHYSICS_PT_dynamic_paint_settings,
+        PHYSICS_PT_field, PHYSICS_PT_field_falloff, PHYSICS_PT_field_falloff_angular,
+        PHYSICS_PT_field_falloff_radial, PHYSICS_PT_field_settings, PHYSICS_PT_field_settings_kink,
+        PHYSICS_PT_field_settings_texture_select, PHYSICS_PT_fluid, PHYSICS_PT_fluid_flow,
+        PHYSICS_PT_fluid_particle_cache, PHYSICS_PT_fluid_settings, PHYSICS_PT_rigid_body,
+        PHYSICS_PT_rigid_body_collisions, PHYSICS_PT_rigid_body_collisions_collections,
+        PHYSICS_PT_rigid_body_collisions_sensitivity, PHYSICS_PT_rigid_body_collisions_surface,
+        PHYSICS_PT_rigid_body_constraint, PHYSICS_PT_rigid_body_constraint_limits,
+        PHYSICS_PT_rigid_body_constraint_limits_angular, PHYSICS_PT_rigid_body_constraint_limits_linear,
+        PHYSICS_PT_rigid_body_constraint_motor, PHYSICS_PT_rigid_body_constraint_motor_angular,
+        PHYSICS_PT_rigid_body_constraint_motor_linear, PHYSICS_PT_rigid_body_constraint_objects,
+        PHYSICS_PT_rigid_body_constraint_override_iterations, PHYSICS_PT_rigid_body_constraint_settings,
+        PHYSICS_PT_rigid_body_constraint_springs, PHYSICS_PT_rigid_body_constraint_springs_angular,
+        PHYSICS_PT_rigid_body_constraint_springs_linear, PHYSICS_PT_rigid_body_dynamics,
+        PHYSICS_PT_rigid_body_dynamics_deactivation, PHYSICS_PT_rigid_body_settings, PHYSICS_PT_smoke,
+        PHYSICS_PT_smoke_adaptive_domain, PHYSICS_PT_smoke_behavior, PHYSICS_PT_smoke_behavior_dissolve,
+        PHYSICS_PT_smoke_cache, PHYSICS_PT_smoke_collections, PHYSICS_PT_smoke_field_weights,
+        PHYSICS_PT_smoke_fire, PHYSICS_PT_smoke_flow_texture, PHYSICS_PT_smoke_highres,
+        PHYSICS_PT_smoke_settings, PHYSICS_PT_smoke_settings_initial_velocity,
+        PHYSICS_PT_smoke_settings_particle_size, PHYSICS_PT_smoke_viewport_display,
+        PHYSICS_PT_smoke_viewport_display_color, PHYSICS_PT_smoke_viewport_display_debug, PHYSICS_PT_softbody,
+        PHYSICS_PT_softbody_cache, PHYSICS_PT_softbody_collision, PHYSICS_PT_softbody_edge,
+        PHYSICS_PT_softbody_edge_aerodynamics, PHYSICS_PT_softbody_edge_stiffness,
+        PHYSICS_PT_softbody_field_weights, PHYSICS_PT_softbody_goal, PHYSICS_PT_softbody_goal_settings,
+        PHYSICS_PT_softbody_goal_strengths, PHYSICS_PT_softbody_object, PHYSICS_PT_softbody_simulation,
+        PHYSICS_PT_softbody_solver, PHYSICS_PT_softbody_solver_diagnostics, PHYSICS_PT_softbody_solver_helpers,
+        PROPERTIES_HT_header, PROPERTIES_PT_navigation_bar, RENDER_MT_framerate_presets,
+        RENDER_MT_lineset_context_menu, RENDER_PT_color_management, RENDER_PT_color_management_curves,
+        RENDER_PT_context, RENDER_PT_dimensions, RENDER_PT_eevee_ambient_occlusion, RENDER_PT_eevee_bloom,
+        RENDER_PT_eevee_depth_of_field, RENDER_PT_eevee_film, RENDER_PT_eevee_film_overscan,
+        RENDER_PT_eevee_hair, RENDER_PT_eevee_indirect_lighting, RENDER_PT_eevee_indirect_lighting_display,
+        RENDER_PT_eevee_motion_blur, RENDER_PT_eevee_sampling, RENDER_PT_eevee_screen_space_reflections,
+        RENDER_PT_eevee_shadows, RENDER_PT_eevee_subsurface_scattering, RENDER_PT_eevee_volumetric,
+        RENDER_PT_eevee_volumetric_lighting, RENDER_PT_eevee_volumetric_shadows, RENDER_PT_encoding,
+        RENDER_PT_encoding_audio, RENDER_PT_encoding_video, RENDER_PT_ffmpeg_presets, RENDER_PT_frame_remapping,
+        RENDER_PT_freestyle, RENDER_PT_opengl_color, RENDER_PT_opengl_film, RENDER_PT_opengl_lighting,
+        RENDER_PT_opengl_options)
+    from ._s171 import (
+        RENDER_PT_opengl_sampling, RENDER_PT_output, RENDER_PT_output_views, RENDER_PT_post_processing,
+        RENDER_PT_presets, RENDER_PT_simplify, RENDER_PT_simplify_greasepencil, RENDER_PT_simplify_render,
+        RENDER_PT_simplify_viewport, RENDER_PT_stamp, RENDER_PT_stamp_burn, RENDER_PT_stamp_note,
+        RENDER_PT_stereoscopy, RENDER_UL_renderviews, SAFE_AREAS_PT_presets, SCENE_PT_audio,
+        SCENE_PT_custom_props, SCENE_PT_keyframing_settings, SCENE_PT_keying_set_paths, SCENE_PT_keying_sets,
+        SCENE_PT_physics, SCENE_PT_rigid_body_cache, SCENE_PT_rigid_body_field_weights,
+        SCENE_PT_rigid_body_world, SCENE_PT_rigid_body_world_settings, SCENE_PT_scene, SCENE_PT_unit,
+        SEQUENCER_HT_header, SEQUENCER_MT_add, SEQUENCER_MT_add_effect, SEQUENCER_MT_add_empty,
+        SEQUENCER_MT_add_transitions, SEQUENCER_MT_change, SEQUENCER_MT_context_menu, SEQUENCER_MT_editor_menus,
+        SEQUENCER_MT_marker, SEQUENCER_MT_navigation, SEQUENCER_MT_range, SEQUENCER_MT_select,
+        SEQUENCER_MT_select_channel, SEQUENCER_MT_select_handle, SEQUENCER_MT_select_linked,
+        SEQUENCER_MT_select_playhead, SEQUENCER_MT_strip, SEQUENCER_MT_strip_effect, SEQUENCER_MT_strip_input,
+        SEQUENCER_MT_strip_lock_mute, SEQUENCER_MT_strip_movie, SEQUENCER_MT_strip_transform, SEQUENCER_MT_view,
+        SEQUENCER_MT_view_cache, SEQUENCER_MT_view_toggle, SEQUENCER_PT_adjust, SEQUENCER_PT_adjust_color,
+        SEQUENCER_PT_adjust_comp, SEQUENCER_PT_adjust_sound, SEQUENCER_PT_adjust_transform,
+        SEQUENCER_PT_adjust_transform_crop, SEQUENCER_PT_adjust_transform_offset, SEQUENCER_PT_adjust_video,
+        SEQUENCER_PT_cache_settings, SEQUENCER_PT_custom_props, SEQUENCER_PT_effect, SEQUENCER_PT_frame_overlay,
+        SEQUENCER_PT_grease_pencil, SEQUENCER_PT_grease_pencil_tools, SEQUENCER_PT_mask, SEQUENCER_PT_modifiers,
+        SEQUENCER_PT_preview, SEQUENCER_PT_proxy_settings, SEQUENCER_PT_scene, SEQUENCER_PT_source,
+        SEQUENCER_PT_strip, SEQUENCER_PT_strip_cache, SEQUENCER_PT_strip_proxy, SEQUENCER_PT_time,
+        SEQUENCER_PT_view, SEQUENCER_PT_view_safe_areas, SEQUENCER_PT_view_safe_areas_center_cut,
+        STATUSBAR_HT_header, TEXTURE_MT_context_menu, TEXTURE_PT_blend, TEXTURE_PT_clouds, TEXTURE_PT_colors,
+        TEXTURE_PT_colors_ramp, TEXTURE_PT_context, TEXTURE_PT_custom_props, TEXTURE_PT_distortednoise,
+        TEXTURE_PT_image, TEXTURE_PT_image_alpha, TEXTURE_PT_image_mapping, TEXTURE_PT_image_mapping_crop,
+        TEXTURE_PT_image_sampling, TEXTURE_PT_image_settings, TEXTURE_PT_influence, TEXTURE_PT_magic,
+        TEXTURE_PT_mapping, TEXTURE_PT_marble, TEXTURE_PT_musgrave, TEXTURE_PT_node)
+    from ._s172 import (
+        TEXTURE_PT_preview, TEXTURE_PT_stucci, TEXTURE_PT_voronoi, TEXTURE_PT_voronoi_feature_weights,
+        TEXTURE_PT_wood, TEXT_HT_footer, TEXT_HT_header, TEXT_MT_edit, TEXT_MT_edit_select, TEXT_MT_edit_to3d,
+        TEXT_MT_editor_menus, TEXT_MT_format, TEXT_MT_templates, TEXT_MT_templates_osl, TEXT_MT_templates_py,
+        TEXT_MT_text, TEXT_MT_toolbox, TEXT_MT_view, TEXT_PT_find, TEXT_PT_properties, TIME_HT_editor_buttons,
+        TIME_MT_cache, TIME_MT_editor_menus, TIME_MT_marker, TIME_MT_view, TIME_PT_keyframing_settings,
+        TIME_PT_playback, TOPBAR_HT_upper_bar, TOPBAR_MT_app, TOPBAR_MT_app_about, TOPBAR_MT_app_support,
+        TOPBAR_MT_edit, TOPBAR_MT_edit_armature_add, TOPBAR_MT_edit_curve_add, TOPBAR_MT_editor_menus,
+        TOPBAR_MT_file, TOPBAR_MT_file_context_menu, TOPBAR_MT_file_defaults, TOPBAR_MT_file_export,
+        TOPBAR_MT_file_external_data, TOPBAR_MT_file_import, TOPBAR_MT_file_new, TOPBAR_MT_file_previews,
+        TOPBAR_MT_file_recover, TOPBAR_MT_help, TOPBAR_MT_render, TOPBAR_MT_templates_more, TOPBAR_MT_window,
+        TOPBAR_MT_workspace_menu, TOPBAR_PT_annotation_layers, TOPBAR_PT_gpencil_fill, TOPBAR_PT_gpencil_layers,
+        TOPBAR_PT_gpencil_materials, TOPBAR_PT_gpencil_primitive, TOPBAR_PT_name, USERPREF_HT_header,
+        USERPREF_MT_interface_theme_presets, USERPREF_MT_keyconfigs, USERPREF_MT_ndof_settings,
+        USERPREF_MT_save_load, USERPREF_PT_addons, USERPREF_PT_animation_autokey, USERPREF_PT_animation_fcurves,
+        USERPREF_PT_animation_keyframes, USERPREF_PT_animation_timeline, USERPREF_PT_edit_annotations,
+        USERPREF_PT_edit_cursor, USERPREF_PT_edit_gpencil, USERPREF_PT_edit_misc, USERPREF_PT_edit_objects,
+        USERPREF_PT_edit_objects_duplicate_data, USERPREF_PT_edit_objects_new, USERPREF_PT_edit_weight_paint,
+        USERPREF_PT_file_paths_applications, USERPREF_PT_file_paths_data, USERPREF_PT_file_paths_development,
+        USERPREF_PT_file_paths_render, USERPREF_PT_input_keyboard, USERPREF_PT_input_mouse,
+        USERPREF_PT_input_ndof, USERPREF_PT_input_tablet, USERPREF_PT_interface_display,
+        USERPREF_PT_interface_editors, USERPREF_PT_interface_menus, USERPREF_PT_interface_menus_mouse_over,
+        USERPREF_PT_interface_menus_pie, USERPREF_PT_interface_text, USERPREF_PT_interface_translation,
+        USERPREF_PT_keymap, USERPREF_PT_navigation_bar, USERPREF_PT_navigation_fly_walk,
+        USERPREF_PT_navigation_fly_walk_gravity, USERPREF_PT_navigation_fly_walk_navigation,
+        USERPREF_PT_navigation_orbit, USERPREF_PT_navigation_zoom, USERPREF_PT_save_preferences,
+        USERPREF_PT_saveload_autorun, USERPREF_PT_saveload_blend, USERPREF_PT_saveload_blend_autosave,
+        USERPREF_PT_saveload_file_browser)
+    from ._s173 import (
+        USERPREF_PT_studiolight_light_editor, USERPREF_PT_studiolight_lights, USERPREF_PT_studiolight_matcaps,
+        USERPREF_PT_studiolight_world, USERPREF_PT_system_cycles_devices, USERPREF_PT_system_memory,
+        USERPREF_PT_system_sound, USERPREF_PT_theme, USERPREF_PT_theme_bone_color_sets,
+        USERPREF_PT_theme_interface_gizmos, USERPREF_PT_theme_interface_icons,
+        USERPREF_PT_theme_interface_state, USERPREF_PT_theme_interface_styles, USERPREF_PT_theme_text_style,
+        USERPREF_PT_theme_user_interface, USERPREF_PT_viewport_display, USERPREF_PT_viewport_quality,
+        USERPREF_PT_viewport_selection, USERPREF_PT_viewport_textures, VIEW3D_HT_header, VIEW3D_HT_tool_header,
+        VIEW3D_MT_add, VIEW3D_MT_angle_control, VIEW3D_MT_armature_add, VIEW3D_MT_armature_context_menu,
+        VIEW3D_MT_assign_material, VIEW3D_MT_bone_options_disable, VIEW3D_MT_bone_options_enable,
+        VIEW3D_MT_bone_options_toggle, VIEW3D_MT_brush, VIEW3D_MT_brush_paint_modes, VIEW3D_MT_camera_add,
+        VIEW3D_MT_curve_add, VIEW3D_MT_edit_armature, VIEW3D_MT_edit_armature_delete,
+        VIEW3D_MT_edit_armature_names, VIEW3D_MT_edit_armature_parent, VIEW3D_MT_edit_armature_roll,
+        VIEW3D_MT_edit_curve, VIEW3D_MT_edit_curve_clean, VIEW3D_MT_edit_curve_context_menu,
+        VIEW3D_MT_edit_curve_ctrlpoints, VIEW3D_MT_edit_curve_delete, VIEW3D_MT_edit_curve_segments,
+        VIEW3D_MT_edit_curve_showhide, VIEW3D_MT_edit_font, VIEW3D_MT_edit_gpencil,
+        VIEW3D_MT_edit_gpencil_delete, VIEW3D_MT_edit_gpencil_interpolate, VIEW3D_MT_edit_gpencil_transform,
+        VIEW3D_MT_edit_lattice, VIEW3D_MT_edit_lattice_context_menu, VIEW3D_MT_edit_mesh,
+        VIEW3D_MT_edit_mesh_clean, VIEW3D_MT_edit_mesh_context_menu, VIEW3D_MT_edit_mesh_delete,
+        VIEW3D_MT_edit_mesh_edges, VIEW3D_MT_edit_mesh_edges_data, VIEW3D_MT_edit_mesh_extrude,
+        VIEW3D_MT_edit_mesh_faces, VIEW3D_MT_edit_mesh_faces_data, VIEW3D_MT_edit_mesh_merge,
+        VIEW3D_MT_edit_mesh_normals, VIEW3D_MT_edit_mesh_normals_average,
+        VIEW3D_MT_edit_mesh_normals_select_strength, VIEW3D_MT_edit_mesh_normals_set_strength,
+        VIEW3D_MT_edit_mesh_select_by_trait, VIEW3D_MT_edit_mesh_select_linked,
+        VIEW3D_MT_edit_mesh_select_loops, VIEW3D_MT_edit_mesh_select_mode, VIEW3D_MT_edit_mesh_select_more_less,
+        VIEW3D_MT_edit_mesh_select_similar, VIEW3D_MT_edit_mesh_shading, VIEW3D_MT_edit_mesh_showhide,
+        VIEW3D_MT_edit_mesh_vertices, VIEW3D_MT_edit_mesh_weights, VIEW3D_MT_edit_meta,
+        VIEW3D_MT_edit_meta_showhide, VIEW3D_MT_edit_metaball_context_menu, VIEW3D_MT_edit_surface,
+        VIEW3D_MT_edit_text_chars, VIEW3D_MT_edit_text_context_menu, VIEW3D_MT_editor_menus,
+        VIEW3D_MT_gpencil_animation, VIEW3D_MT_gpencil_autoweights, VIEW3D_MT_gpencil_copy_layer,
+        VIEW3D_MT_gpencil_edit_context_menu, VIEW3D_MT_gpencil_simplify, VIEW3D_MT_hide_mask, VIEW3D_MT_hook,
+        VIEW3D_MT_image_add, VIEW3D_MT_light_add, VIEW3D_MT_lightprobe_add, VIEW3D_MT_make_links,
+        VIEW3D_MT_make_single_user, VIEW3D_MT_mesh_add, VIEW3D_MT_metaball_add, VIEW3D_MT_mirror,
+        VIEW3D_MT_object, VIEW3D_MT_object_animation)
+    from ._s174 import (
+        VIEW3D_MT_object_apply, VIEW3D_MT_object_clear, VIEW3D_MT_object_collection,
+        VIEW3D_MT_object_constraints, VIEW3D_MT_object_context_menu, VIEW3D_MT_object_mode_pie,
+        VIEW3D_MT_object_parent, VIEW3D_MT_object_quick_effects, VIEW3D_MT_object_relations,
+        VIEW3D_MT_object_rigid_body, VIEW3D_MT_object_shading, VIEW3D_MT_object_showhide,
+        VIEW3D_MT_object_track, VIEW3D_MT_orientations_pie, VIEW3D_MT_paint_gpencil, VIEW3D_MT_paint_vertex,
+        VIEW3D_MT_paint_weight, VIEW3D_MT_particle, VIEW3D_MT_particle_context_menu,
+        VIEW3D_MT_particle_showhide, VIEW3D_MT_pivot_pie, VIEW3D_MT_pose, VIEW3D_MT_pose_apply,
+        VIEW3D_MT_pose_constraints, VIEW3D_MT_pose_context_menu, VIEW3D_MT_pose_group, VIEW3D_MT_pose_ik,
+        VIEW3D_MT_pose_library, VIEW3D_MT_pose_motion, VIEW3D_MT_pose_propagate, VIEW3D_MT_pose_showhide,
+        VIEW3D_MT_pose_slide, VIEW3D_MT_pose_transform, VIEW3D_MT_proportional_editing_falloff_pie,
+        VIEW3D_MT_sculpt, VIEW3D_MT_select_edit_armature, VIEW3D_MT_select_edit_curve,
+        VIEW3D_MT_select_edit_lattice, VIEW3D_MT_select_edit_mesh, VIEW3D_MT_select_edit_metaball,
+        VIEW3D_MT_select_edit_surface, VIEW3D_MT_select_edit_text, VIEW3D_MT_select_gpencil,
+        VIEW3D_MT_select_object, VIEW3D_MT_select_object_more_less, VIEW3D_MT_select_paint_mask,
+        VIEW3D_MT_select_paint_mask_vertex, VIEW3D_MT_select_particle, VIEW3D_MT_select_pose,
+        VIEW3D_MT_select_pose_more_less, VIEW3D_MT_shading_ex_pie, VIEW3D_MT_shading_pie, VIEW3D_MT_snap,
+        VIEW3D_MT_snap_pie, VIEW3D_MT_surface_add, VIEW3D_MT_tools_projectpaint_clone,
+        VIEW3D_MT_tools_projectpaint_stencil, VIEW3D_MT_tools_projectpaint_uvlayer, VIEW3D_MT_transform_base,
+        VIEW3D_MT_transform_gizmo_pie, VIEW3D_MT_uv_map, VIEW3D_MT_vertex_group, VIEW3D_MT_view,
+        VIEW3D_MT_view_align, VIEW3D_MT_view_align_selected, VIEW3D_MT_view_cameras, VIEW3D_MT_view_local,
+        VIEW3D_MT_view_navigation, VIEW3D_MT_view_pie, VIEW3D_MT_view_regions, VIEW3D_MT_view_viewpoint,
+        VIEW3D_MT_weight_gpencil, VIEW3D_PT_active_tool, VIEW3D_PT_active_tool_duplicate,
+        VIEW3D_PT_annotation_onion, VIEW3D_PT_collections, VIEW3D_PT_context_properties,
+        VIEW3D_PT_gizmo_display, VIEW3D_PT_gpencil_brush_presets, VIEW3D_PT_gpencil_draw_context_menu,
+        VIEW3D_PT_gpencil_guide, VIEW3D_PT_gpencil_lock, VIEW3D_PT_gpencil_multi_frame,
+        VIEW3D_PT_gpencil_origin, VIEW3D_PT_gpencil_sculpt_context_menu, VIEW3D_PT_grease_pencil,
+        VIEW3D_PT_object_type_visibility, VIEW3D_PT_overlay, VIEW3D_PT_overlay_edit_curve,
+        VIEW3D_PT_overlay_edit_mesh, VIEW3D_PT_overlay_edit_mesh_freestyle,
+        VIEW3D_PT_overlay_edit_mesh_measurement, VIEW3D_PT_overlay_edit_mesh_normals,
+        VIEW3D_PT_overlay_edit_mesh_shading, VIEW3D_PT_overlay_geometry, VIEW3D_PT_overlay_gpencil_options,
+        VIEW3D_PT_overlay_guides, VIEW3D_PT_overlay_motion_tracking, VIEW3D_PT_overlay_object,
+        VIEW3D_PT_overlay_paint)
+    from ._s175 import (
+        VIEW3D_PT_overlay_pose, VIEW3D_PT_overlay_sculpt, VIEW3D_PT_paint_texture_context_menu,
+        VIEW3D_PT_paint_vertex_context_menu, VIEW3D_PT_paint_weight_context_menu, VIEW3D_PT_pivot_point,
+        VIEW3D_PT_proportional_edit, VIEW3D_PT_quad_view, VIEW3D_PT_sculpt_context_menu,
+        VIEW3D_PT_sculpt_dyntopo, VIEW3D_PT_sculpt_dyntopo_remesh, VIEW3D_PT_sculpt_options,
+        VIEW3D_PT_sculpt_options_gravity, VIEW3D_PT_sculpt_options_unified, VIEW3D_PT_sculpt_symmetry,
+        VIEW3D_PT_sculpt_symmetry_for_topbar, VIEW3D_PT_shading, VIEW3D_PT_shading_color,
+        VIEW3D_PT_shading_lighting, VIEW3D_PT_shading_options, VIEW3D_PT_shading_options_shadow,
+        VIEW3D_PT_shading_options_ssao, VIEW3D_PT_slots_projectpaint, VIEW3D_PT_snapping,
+        VIEW3D_PT_stencil_projectpaint, VIEW3D_PT_tools_active, VIEW3D_PT_tools_armatureedit_options,
+        VIEW3D_PT_tools_brush, VIEW3D_PT_tools_brush_clone, VIEW3D_PT_tools_brush_color,
+        VIEW3D_PT_tools_brush_display, VIEW3D_PT_tools_brush_display_custom_icon,
+        VIEW3D_PT_tools_brush_display_show_brush, VIEW3D_PT_tools_brush_falloff,
+        VIEW3D_PT_tools_brush_falloff_frontface, VIEW3D_PT_tools_brush_falloff_normal,
+        VIEW3D_PT_tools_brush_gradient, VIEW3D_PT_tools_brush_options, VIEW3D_PT_tools_brush_stroke,
+        VIEW3D_PT_tools_brush_stroke_smooth_stroke, VIEW3D_PT_tools_brush_swatches,
+        VIEW3D_PT_tools_brush_texture, VIEW3D_PT_tools_curveedit_options_stroke,
+        VIEW3D_PT_tools_grease_pencil_brush, VIEW3D_PT_tools_grease_pencil_brush_option,
+        VIEW3D_PT_tools_grease_pencil_brush_random, VIEW3D_PT_tools_grease_pencil_brush_settings,
+        VIEW3D_PT_tools_grease_pencil_brush_stabilizer, VIEW3D_PT_tools_grease_pencil_brushcurves,
+        VIEW3D_PT_tools_grease_pencil_brushcurves_jitter, VIEW3D_PT_tools_grease_pencil_brushcurves_sensitivity,
+        VIEW3D_PT_tools_grease_pencil_brushcurves_strength, VIEW3D_PT_tools_grease_pencil_interpolate,
+        VIEW3D_PT_tools_grease_pencil_paint_appearance, VIEW3D_PT_tools_grease_pencil_sculpt,
+        VIEW3D_PT_tools_grease_pencil_sculpt_appearance, VIEW3D_PT_tools_grease_pencil_sculpt_options,
+        VIEW3D_PT_tools_grease_pencil_weight_appearance, VIEW3D_PT_tools_grease_pencil_weight_paint,
+        VIEW3D_PT_tools_imagepaint_options, VIEW3D_PT_tools_imagepaint_options_cavity,
+        VIEW3D_PT_tools_imagepaint_options_external, VIEW3D_PT_tools_imagepaint_options_unified,
+        VIEW3D_PT_tools_imagepaint_symmetry, VIEW3D_PT_tools_mask_texture, VIEW3D_PT_tools_meshedit_options,
+        VIEW3D_PT_tools_meshedit_options_automerge, VIEW3D_PT_tools_particlemode,
+        VIEW3D_PT_tools_particlemode_options, VIEW3D_PT_tools_particlemode_options_display,
+        VIEW3D_PT_tools_particlemode_options_shapecut, VIEW3D_PT_tools_posemode_options,
+        VIEW3D_PT_tools_vertexpaint_options, VIEW3D_PT_tools_vertexpaint_symmetry,
+        VIEW3D_PT_tools_vertexpaint_symmetry_for_topbar, VIEW3D_PT_tools_weightpaint_options,
+        VIEW3D_PT_tools_weightpaint_options_unified, VIEW3D_PT_tools_weightpaint_symmetry,
+        VIEW3D_PT_tools_weightpaint_symmetry_for_topbar, VIEW3D_PT_transform_orientations,
+        VIEW3D_PT_view3d_cursor, VIEW3D_PT_view3d_lock, VIEW3D_PT_view3d_properties, VIEW3D_PT_view3d_stereo,
+        VIEWLAYER_PT_eevee_layer_passes, VIEWLAYER_PT_freestyle, VIEWLAYER_PT_freestyle_lineset,
+        VIEWLAYER_PT_freestyle_linestyle, VIEWLAYER_PT_layer, VIEWLAYER_UL_linesets, WM_MT_toolsystem_submenu,
+        WORKSPACE_PT_addons, WORKSPACE_PT_custom_props, WORKSPACE_PT_main, WORLD_PT_context_world,
+        WORLD_PT_custom_props, WORLD_PT_viewport_display)
+
+_SHARDS = {
+    "Action": "_s000",
+    "ActionActuator": "_s000",
+    "ActionConstraint": "_s000",
+    "ActionFCurves": "_s000",
+    "ActionGroup": "_s000",
+    "ActionGroups": "_s000",
+    "ActionPoseMarkers": "_s000",
+    "Actuator": "_s000",
+    "ActuatorSensor": "_s000",
+    "AddSequence": "_s001",
+    "Addon": "_s001",
+    "AddonPreferences": "_s001",
+    "Addons": "_s001",
+    "AdjustmentSequence": "_s001",
+    "AlembicObjectPath": "_s001",
+    "AlembicObjectPaths": "_s001",
+    "AlphaOverSequence": "_s001",
+    "AlphaUnderSequence": "_s001",
+    "AlwaysSensor": "_s001",
+    "AndController": "_s001",
+    "AnimData": "_s001",
+    "AnimDataDrivers": "_s001",
+    "AnimViz": "_s001",
+    "AnimVizMotionPaths": "_s001",
+    "AnimVizOnionSkinning": "_s001",
+    "AnyType": "_s001",
+    "Area": "_s002",
+    "AreaLamp": "_s002",
+    "AreaSpaces": "_s002",
+    "Armature": "_s003",
+    "ArmatureActuator": "_s003",
+    "ArmatureBones": "_s003",
+    "ArmatureEditBones": "_s003",
+    "ArmatureModifier": "_s003",
+    "ArmatureSensor": "_s003",
+    "ArrayModifier": "_s003",
+    "Available": "_s003",
+    "BackgroundImage": "_s004",
+    "BackgroundImages": "_s004",
+    "BakePixel": "_s004",
+    "BakeSettings": "_s004",
+    "BevelModifier": "_s005",
+    "BezierSplinePoint": "_s005",
+    "BlendData": "_s005",
+    "BlendDataActions": "_s006",
+    "BlendDataArmatures": "_s006",
+    "BlendDataBrushes": "_s006",
+    "BlendDataCacheFiles": "_s006",
+    "BlendDataCameras": "_s006",
+    "BlendDataCurves": "_s006",
+    "BlendDataFonts": "_s006",
+    "BlendDataGreasePencils": "_s006",
+    "BlendDataGroups": "_s006",
+    "BlendDataImages": "_s007",
+    "BlendDataLamps": "_s007",
+    "BlendDataLattices": "_s007",
+    "BlendDataLibraries": "_s007",
+    "BlendDataLineStyles": "_s007",
+    "BlendDataMasks": "_s007",
+    "BlendDataMaterials": "_s007",
+    "BlendDataMeshes": "_s008",
+    "BlendDataMetaBalls": "_s008",
+    "BlendDataMovieClips": "_s008",
+    "BlendDataNodeTrees": "_s008",
+    "BlendDataObjects": "_s008",
+    "BlendDataPaintCurves": "_s008",
+    "BlendDataPalettes": "_s008",
+    "BlendDataParticles": "_s008",
+    "BlendDataScenes": "_s009",
+    "BlendDataScreens": "_s009",
+    "BlendDataSounds": "_s009",
+    "BlendDataSpeakers": "_s009",
+    "BlendDataTexts": "_s009",
+    "BlendDataTextures": "_s009",
+    "BlendDataWindowManagers": "_s009",
+    "BlendDataWorlds": "_s009",
+    "BlendTexture": "_s009",
+    "BlenderRNA": "_s009",
+    "BoidRule": "_s009",
+    "BoidRuleAverageSpeed": "_s009",
+    "BoidRuleAvoid": "_s010",
+    "BoidRuleAvoidCollision": "_s010",
+    "BoidRuleFight": "_s010",
+    "BoidRuleFollowLeader": "_s010",
+    "BoidRuleGoal": "_s010",
+    "BoidSettings": "_s010",
+    "BoidState": "_s010",
+    "Bone": "_s011",
+    "BoneGroup": "_s011",
+    "BoneGroups": "_s011",
+    "BoolProperty": "_s011",
+    "BooleanModifier": "_s012",
+    "BrightContrastModifier": "_s012",
+    "Brush": "_s013",
+    "BrushCapabilities": "_s014",
+    "BrushTextureSlot": "_s014",
+    "BuildModifier": "_s014",
+    "CLIP_UL_tracking_objects": "_s014",
+    "CYCLES": "_s014",
+    "CacheFile": "_s014",
+    "Camera": "_s015",
+    "CameraActuator": "_s015",
+    "CameraSolverConstraint": "_s015",
+    "CameraStereoData": "_s015",
+    "CastModifier": "_s015",
+    "ChannelDriverVariables": "_s015",
+    "ChildOfConstraint": "_s016",
+    "ChildParticle": "_s016",
+    "ClampToConstraint": "_s016",
+    "ClothCollisionSettings": "_s016",
+    "ClothModifier": "_s016",
+    "ClothSettings": "_s017",
+    "ClothSolverResult": "_s017",
+    "CloudsTexture": "_s017",
+    "CollectionProperty": "_s017",
+    "CollisionModifier": "_s017",
+    "CollisionSensor": "_s017",
+    "CollisionSettings": "_s018",
+    "ColorBalanceModifier": "_s018",
+    "ColorManagedDisplaySettings": "_s018",
+    "ColorManagedInputColorspaceSettings": "_s018",
+    "ColorManagedSequencerColorspaceSettings": "_s018",
+    "ColorManagedViewSettings": "_s018",
+    "ColorMapping": "_s018",
+    "ColorRamp": "_s018",
+    "ColorRampElement": "_s018",
+    "ColorRampElements": "_s018",
+    "ColorSequence": "_s018",
+    "CompositorNode": "_s018",
+    "CompositorNodeAlphaOver": "_s018",
+    "CompositorNodeBilateralblur": "_s018",
+    "CompositorNodeBlur": "_s019",
+    "CompositorNodeBokehBlur": "_s019",
+    "CompositorNodeBokehImage": "_s019",
+    "CompositorNodeBoxMask": "_s019",
+    "CompositorNodeBrightContrast": "_s019",
+    "CompositorNodeChannelMatte": "_s019",
+    "CompositorNodeChromaMatte": "_s019",
+    "CompositorNodeColorBalance": "_s019",
+    "CompositorNodeColorCorrection": "_s020",
+    "CompositorNodeColorMatte": "_s020",
+    "CompositorNodeColorSpill": "_s020",
+    "CompositorNodeCombHSVA": "_s020",
+    "CompositorNodeCombRGBA": "_s020",
+    "CompositorNodeCombYCCA": "_s020",
+    "CompositorNodeCombYUVA": "_s020",
+    "CompositorNodeComposite": "_s020",
+    "CompositorNodeCornerPin": "_s020",
+    "CompositorNodeCrop": "_s020",
+    "CompositorNodeCurveRGB": "_s020",
+    "CompositorNodeCurveVec": "_s020",
+    "CompositorNodeDBlur": "_s021",
+    "CompositorNodeDefocus": "_s021",
+    "CompositorNodeDespeckle": "_s021",
+    "CompositorNodeDiffMatte": "_s021",
+    "CompositorNodeDilateErode": "_s021",
+    "CompositorNodeDisplace": "_s021",
+    "CompositorNodeDistanceMatte": "_s021",
+    "CompositorNodeDoubleEdgeMask": "_s021",
+    "CompositorNodeEllipseMask": "_s021",
+    "CompositorNodeFilter": "_s021",
+    "CompositorNodeFlip": "_s021",
+    "CompositorNodeGamma": "_s021",
+    "CompositorNodeGlare": "_s022",
+    "CompositorNodeGroup": "_s022",
+    "CompositorNodeHueCorrect": "_s022",
+    "CompositorNodeHueSat": "_s022",
+    "CompositorNodeIDMask": "_s022",
+    "CompositorNodeImage": "_s022",
+    "CompositorNodeInpaint": "_s022",
+    "CompositorNodeInvert": "_s022",
+    "CompositorNodeKeying": "_s022",
+    "CompositorNodeKeyingScreen": "_s022",
+    "CompositorNodeLensdist": "_s022",
+    "CompositorNodeLevels": "_s022",
+    "CompositorNodeLumaMatte": "_s023",
+    "CompositorNodeMapRange": "_s023",
+    "CompositorNodeMapUV": "_s023",
+    "CompositorNodeMapValue": "_s023",
+    "CompositorNodeMask": "_s023",
+    "CompositorNodeMath": "_s023",
+    "CompositorNodeMixRGB": "_s023",
+    "CompositorNodeMovieClip": "_s023",
+    "CompositorNodeMovieDistortion": "_s023",
+    "CompositorNodeNormal": "_s023",
+    "CompositorNodeNormalize": "_s023",
+    "CompositorNodeOutputFile": "_s023",
+    "CompositorNodeOutputFileFileSlots": "_s023",
+    "CompositorNodeOutputFileLayerSlots": "_s023",
+    "CompositorNodePixelate": "_s023",
+    "CompositorNodePlaneTrackDeform": "_s024",
+    "CompositorNodePremulKey": "_s024",
+    "CompositorNodeRGB": "_s024",
+    "CompositorNodeRGBToBW": "_s024",
+    "CompositorNodeRLayers": "_s024",
+    "CompositorNodeRotate": "_s024",
+    "CompositorNodeScale": "_s024",
+    "CompositorNodeSepHSVA": "_s024",
+    "CompositorNodeSepRGBA": "_s024",
+    "CompositorNodeSepYCCA": "_s024",
+    "CompositorNodeSepYUVA": "_s024",
+    "CompositorNodeSetAlpha": "_s024",
+    "CompositorNodeSplitViewer": "_s024",
+    "CompositorNodeStabilize": "_s024",
+    "CompositorNodeSunBeams": "_s024",
+    "CompositorNodeSwitch": "_s024",
+    "CompositorNodeSwitchView": "_s024",
+    "CompositorNodeTexture": "_s024",
+    "CompositorNodeTime": "_s024",
+    "CompositorNodeTonemap": "_s024",
+    "CompositorNodeTrackPos": "_s025",
+    "CompositorNodeTransform": "_s025",
+    "CompositorNodeTranslate": "_s025",
+    "CompositorNodeTree": "_s025",
+    "CompositorNodeValToRGB": "_s025",
+    "CompositorNodeValue": "_s025",
+    "CompositorNodeVecBlur": "_s025",
+    "CompositorNodeViewer": "_s025",
+    "CompositorNodeZcombine": "_s025",
+    "ConsoleLine": "_s025",
+    "Constraint": "_s025",
+    "ConstraintActuator": "_s026",
+    "ConstraintTarget": "_s026",
+    "Context": "_s027",
+    "ControlFluidSettings": "_s028",
+    "Controller": "_s028",
+    "CopyLocationConstraint": "_s028",
+    "CopyRotationConstraint": "_s028",
+    "CopyScaleConstraint": "_s028",
+    "CopyTransformsConstraint": "_s028",
+    "CorrectiveSmoothModifier": "_s028",
+    "CrossSequence": "_s028",
+    "Curve": "_s029",
+    "CurveMap": "_s029",
+    "CurveMapPoint": "_s029",
+    "CurveMapPoints": "_s029",
+    "CurveMapping": "_s029",
+    "CurveModifier": "_s030",
+    "CurvePaintSettings": "_s030",
+    "CurveSplines": "_s030",
+    "CurvesModifier": "_s030",
+    "CyclesCameraSettings": "_s030",
+    "CyclesCurveRenderSettings": "_s030",
+    "CyclesCurveSettings": "_s030",
+    "CyclesDeviceSettings": "_s030",
+    "CyclesLampSettings": "_s030",
+    "CyclesMaterialSettings": "_s031",
+    "CyclesMeshSettings": "_s031",
+    "CyclesObjectSettings": "_s031",
+    "CyclesPreferences": "_s031",
+    "CyclesRenderLayerSettings": "_s031",
+    "CyclesRenderSettings": "_s032",
+    "CyclesVisibilitySettings": "_s033",
+    "CyclesWorldSettings": "_s033",
+    "DampedTrackConstraint": "_s033",
+    "DataTransferModifier": "_s033",
+    "DecimateModifier": "_s033",
+    "DelaySensor": "_s033",
+    "Depsgraph": "_s034",
+    "DisplaceModifier": "_s034",
+    "DisplaySafeAreas": "_s034",
+    "DistortedNoiseTexture": "_s034",
+    "DomainFluidSettings": "_s034",
+    "DopeSheet": "_s035",
+    "Driver": "_s035",
+    "DriverTarget": "_s035",
+    "DriverVariable": "_s035",
+    "DupliObject": "_s035",
+    "DynamicPaintBrushSettings": "_s036",
+    "DynamicPaintCanvasSettings": "_s036",
+    "DynamicPaintModifier": "_s036",
+    "DynamicPaintSurface": "_s037",
+    "DynamicPaintSurfaces": "_s037",
+    "EdgeSplitModifier": "_s037",
+    "EditBone": "_s038",
+    "EditObjectActuator": "_s039",
+    "EffectSequence": "_s039",
+    "EffectorWeights": "_s039",
+    "EnumProperty": "_s039",
+    "EnumPropertyItem": "_s039",
+    "EnvironmentMap": "_s040",
+    "EnvironmentMapTexture": "_s040",
+    "Event": "_s040",
+    "ExplodeModifier": "_s040",
+    "ExpressionController": "_s040",
+    "FCurve": "_s041",
+    "FCurveKeyframePoints": "_s041",
+    "FCurveModifiers": "_s041",
+    "FCurveSample": "_s041",
+    "FFmpegSettings": "_s041",
+    "FILEBROWSER_UL_dir": "_s041",
+    "FModifier": "_s042",
+    "FModifierCycles": "_s042",
+    "FModifierEnvelope": "_s042",
+    "FModifierEnvelopeControlPoint": "_s042",
+    "FModifierEnvelopeControlPoints": "_s042",
+    "FModifierFunctionGenerator": "_s042",
+    "FModifierGenerator": "_s042",
+    "FModifierLimits": "_s042",
+    "FModifierNoise": "_s042",
+    "FModifierPython": "_s042",
+    "FModifierStepped": "_s042",
+    "FieldSettings": "_s043",
+    "FileBrowserFSMenuEntry": "_s043",
+    "FileSelectParams": "_s044",
+    "Filter2DActuator": "_s044",
+    "FloatProperty": "_s044",
+    "FloorConstraint": "_s044",
+    "FluidFluidSettings": "_s044",
+    "FluidSettings": "_s044",
+    "FluidSimulationModifier": "_s044",
+    "FluidVertexVelocity": "_s044",
+    "FollowPathConstraint": "_s044",
+    "FollowTrackConstraint": "_s045",
+    "FreestyleLineSet": "_s045",
+    "FreestyleLineStyle": "_s046",
+    "FreestyleModuleSettings": "_s046",
+    "FreestyleModules": "_s046",
+    "FreestyleSettings": "_s047",
+    "Function": "_s047",
+    "GPENCIL_PIE_sculpt": "_s047",
+    "GPENCIL_PIE_settings_palette": "_s047",
+    "GPENCIL_PIE_tool_palette": "_s047",
+    "GPENCIL_PIE_tools_more": "_s047",
+    "GPENCIL_UL_brush": "_s047",
+    "GPENCIL_UL_layer": "_s047",
+    "GPENCIL_UL_palettecolor": "_s047",
+    "GPUDOFSettings": "_s047",
+    "GPUFXSettings": "_s047",
+    "GPUSSAOSettings": "_s048",
+    "GPencilBrush": "_s048",
+    "GPencilFrame": "_s048",
+    "GPencilFrames": "_s048",
+    "GPencilInterpolateSettings": "_s048",
+    "GPencilLayer": "_s049",
+    "GPencilPalette": "_s049",
+    "GPencilPaletteColor": "_s049",
+    "GPencilPaletteColors": "_s049",
+    "GPencilSculptBrush": "_s049",
+    "GPencilSculptSettings": "_s049",
+    "GPencilStroke": "_s050",
+    "GPencilStrokePoint": "_s050",
+    "GPencilStrokePoints": "_s050",
+    "GPencilStrokes": "_s050",
+    "GPencilTriangle": "_s050",
+    "GameActuator": "_s050",
+    "GameBooleanProperty": "_s050",
+    "GameFloatProperty": "_s050",
+    "GameIntProperty": "_s050",
+    "GameObjectSettings": "_s051",
+    "GameProperty": "_s051",
+    "GameSoftBodySettings": "_s052",
+    "GameStringProperty": "_s052",
+    "GameTimerProperty": "_s052",
+    "GammaCrossSequence": "_s052",
+    "GaussianBlurSequence": "_s052",
+    "GlowSequence": "_s052",
+    "GreasePencil": "_s052",
+    "GreasePencilBrushes": "_s052",
+    "GreasePencilLayers": "_s052",
+    "GreasePencilPalettes": "_s052",
+    "Group": "_s052",
+    "GroupObjects": "_s052",
+    "Header": "_s053",
+    "HemiLamp": "_s053",
+    "Histogram": "_s053",
+    "HookModifier": "_s053",
+    "HueCorrectModifier": "_s053",
+    "ID": "_s053",
+    "IDMaterials": "_s053",
+    "IKParam": "_s053",
+    "IMAGE_UV_sculpt": "_s053",
+    "IMAGE_UV_sculpt_curve": "_s053",
+    "Image": "_s054",
+    "ImageFormatSettings": "_s055",
+    "ImagePackedFile": "_s055",
+    "ImagePaint": "_s055",
+    "ImagePreview": "_s055",
+    "ImageSequence": "_s056",
+    "ImageTexture": "_s056",
+    "ImageUser": "_s056",
+    "ImapaintToolCapabilities": "_s057",
+    "InflowFluidSettings": "_s057",
+    "IntProperty": "_s057",
+    "Itasc": "_s057",
+    "JoystickSensor": "_s057",
+    "Key": "_s057",
+    "KeyConfig": "_s057",
+    "KeyConfigurations": "_s057",
+    "KeyMap": "_s058",
+    "KeyMapItem": "_s058",
+    "KeyMapItems": "_s058",
+    "KeyMaps": "_s058",
+    "KeyboardSensor": "_s058",
+    "Keyframe": "_s059",
+    "KeyingSet": "_s059",
+    "KeyingSetInfo": "_s059",
+    "KeyingSetPath": "_s059",
+    "KeyingSetPaths": "_s059",
+    "KeyingSets": "_s059",
+    "KeyingSetsAll": "_s059",
+    "KinematicConstraint": "_s060",
+    "Lamp": "_s060",
+    "LampSkySettings": "_s060",
+    "LampTextureSlot": "_s060",
+    "LampTextureSlots": "_s060",
+    "LaplacianDeformModifier": "_s061",
+    "LaplacianSmoothModifier": "_s061",
+    "Lattice": "_s061",
+    "LatticeModifier": "_s061",
+    "LatticePoint": "_s061",
+    "Library": "_s061",
+    "LimitDistanceConstraint": "_s061",
+    "LimitLocationConstraint": "_s061",
+    "LimitRotationConstraint": "_s062",
+    "LimitScaleConstraint": "_s062",
+    "LineStyleAlphaModifier": "_s062",
+    "LineStyleAlphaModifier_AlongStroke": "_s062",
+    "LineStyleAlphaModifier_CreaseAngle": "_s062",
+    "LineStyleAlphaModifier_Curvature_3D": "_s062",
+    "LineStyleAlphaModifier_DistanceFromCamera": "_s063",
+    "LineStyleAlphaModifier_DistanceFromObject": "_s063",
+    "LineStyleAlphaModifier_Material": "_s063",
+    "LineStyleAlphaModifier_Noise": "_s063",
+    "LineStyleAlphaModifier_Tangent": "_s063",
+    "LineStyleAlphaModifiers": "_s063",
+    "LineStyleColorModifier": "_s063",
+    "LineStyleColorModifier_AlongStroke": "_s064",
+    "LineStyleColorModifier_CreaseAngle": "_s064",
+    "LineStyleColorModifier_Curvature_3D": "_s064",
+    "LineStyleColorModifier_DistanceFromCamera": "_s064",
+    "LineStyleColorModifier_DistanceFromObject": "_s064",
+    "LineStyleColorModifier_Material": "_s064",
+    "LineStyleColorModifier_Noise": "_s065",
+    "LineStyleColorModifier_Tangent": "_s065",
+    "LineStyleColorModifiers": "_s065",
+    "LineStyleGeometryModifier": "_s065",
+    "LineStyleGeometryModifier_2DOffset": "_s065",
+    "LineStyleGeometryModifier_2DTransform": "_s065",
+    "LineStyleGeometryModifier_BackboneStretcher": "_s065",
+    "LineStyleGeometryModifier_BezierCurve": "_s065",
+    "LineStyleGeometryModifier_Blueprint": "_s065",
+    "LineStyleGeometryModifier_GuidingLines": "_s066",
+    "LineStyleGeometryModifier_PerlinNoise1D": "_s066",
+    "LineStyleGeometryModifier_PerlinNoise2D": "_s066",
+    "LineStyleGeometryModifier_Polygonalization": "_s066",
+    "LineStyleGeometryModifier_Sampling": "_s066",
+    "LineStyleGeometryModifier_Simplification": "_s066",
+    "LineStyleGeometryModifier_SinusDisplacement": "_s066",
+    "LineStyleGeometryModifier_SpatialNoise": "_s066",
+    "LineStyleGeometryModifier_TipRemover": "_s066",
+    "LineStyleGeometryModifiers": "_s067",
+    "LineStyleModifier": "_s067",
+    "LineStyleTextureSlot": "_s067",
+    "LineStyleTextureSlots": "_s067",
+    "LineStyleThicknessModifier": "_s067",
+    "LineStyleThicknessModifier_AlongStroke": "_s067",
+    "LineStyleThicknessModifier_Calligraphy": "_s067",
+    "LineStyleThicknessModifier_CreaseAngle": "_s067",
+    "LineStyleThicknessModifier_Curvature_3D": "_s067",
+    "LineStyleThicknessModifier_DistanceFromCamera": "_s068",
+    "LineStyleThicknessModifier_DistanceFromObject": "_s068",
+    "LineStyleThicknessModifier_Material": "_s068",
+    "LineStyleThicknessModifier_Noise": "_s068",
+    "LineStyleThicknessModifier_Tangent": "_s068",
+    "LineStyleThicknessModifiers": "_s069",
+    "Linesets": "_s069",
+    "LocRotScale": "_s069",
+    "Location": "_s069",
+    "LockedTrackConstraint": "_s069",
+    "LodLevel": "_s069",
+    "LoopColors": "_s069",
+    "MASK_UL_layers": "_s069",
+    "MATERIAL_UL_matslots": "_s069",
+    "MESH_UL_shape_keys": "_s069",
+    "MESH_UL_uvmaps_vcols": "_s069",
+    "MESH_UL_vgroups": "_s069",
+    "Macro": "_s069",
+    "MagicTexture": "_s069",
+    "MaintainVolumeConstraint": "_s069",
+    "MarbleTexture": "_s069",
+    "Mask": "_s070",
+    "MaskLayer": "_s070",
+    "MaskLayers": "_s070",
+    "MaskModifier": "_s070",
+    "MaskParent": "_s070",
+    "MaskSequence": "_s070",
+    "MaskSpline": "_s070",
+    "MaskSplinePoint": "_s071",
+    "MaskSplinePointUW": "_s071",
+    "MaskSplinePoints": "_s071",
+    "MaskSplines": "_s071",
+    "Material": "_s072",
+    "MaterialGameSettings": "_s073",
+    "MaterialHalo": "_s073",
+    "MaterialPhysics": "_s073",
+    "MaterialRaytraceMirror": "_s073",
+    "MaterialRaytraceTransparency": "_s073",
+    "MaterialSlot": "_s073",
+    "MaterialStrand": "_s074",
+    "MaterialSubsurfaceScattering": "_s074",
+    "MaterialTextureSlot": "_s075",
+    "MaterialTextureSlots": "_s075",
+    "MaterialVolume": "_s076",
+    "Menu": "_s076",
+    "Mesh": "_s077",
+    "MeshCacheModifier": "_s078",
+    "MeshColor": "_s078",
+    "MeshColorLayer": "_s078",
+    "MeshDeformModifier": "_s078",
+    "MeshEdge": "_s078",
+    "MeshEdges": "_s078",
+    "MeshLoop": "_s078",
+    "MeshLoopColor": "_s078",
+    "MeshLoopColorLayer": "_s078",
+    "MeshLoops": "_s078",
+    "MeshPaintMaskLayer": "_s078",
+    "MeshPaintMaskProperty": "_s078",
+    "MeshPolygon": "_s079",
+    "MeshPolygonFloatProperty": "_s079",
+    "MeshPolygonFloatPropertyLayer": "_s079",
+    "MeshPolygonIntProperty": "_s079",
+    "MeshPolygonIntPropertyLayer": "_s079",
+    "MeshPolygonStringProperty": "_s079",
+    "MeshPolygonStringPropertyLayer": "_s079",
+    "MeshPolygons": "_s079",
+    "MeshSequenceCacheModifier": "_s079",
+    "MeshSkinVertex": "_s079",
+    "MeshSkinVertexLayer": "_s079",
+    "MeshStatVis": "_s079",
+    "MeshTessFace": "_s079",
+    "MeshTessFaces": "_s079",
+    "MeshTextureFace": "_s080",
+    "MeshTextureFaceLayer": "_s080",
+    "MeshTexturePoly": "_s080",
+    "MeshTexturePolyLayer": "_s080",
+    "MeshUVLoop": "_s080",
+    "MeshUVLoopLayer": "_s080",
+    "MeshVertex": "_s080",
+    "MeshVertexFloatProperty": "_s080",
+    "MeshVertexFloatPropertyLayer": "_s080",
+    "MeshVertexIntProperty": "_s080",
+    "MeshVertexIntPropertyLayer": "_s080",
+    "MeshVertexStringProperty": "_s080",
+    "MeshVertexStringPropertyLayer": "_s080",
+    "MeshVertices": "_s080",
+    "MessageActuator": "_s080",
+    "MessageSensor": "_s080",
+    "MetaBall": "_s081",
+    "MetaBallElements": "_s081",
+    "MetaElement": "_s081",
+    "MetaSequence": "_s081",
+    "MirrorModifier": "_s081",
+    "Modifier": "_s082",
+    "MotionPath": "_s082",
+    "MotionPathVert": "_s082",
+    "MouseActuator": "_s082",
+    "MouseSensor": "_s082",
+    "MovieClip": "_s082",
+    "MovieClipProxy": "_s083",
+    "MovieClipScopes": "_s083",
+    "MovieClipSequence": "_s083",
+    "MovieClipUser": "_s083",
+    "MovieReconstructedCamera": "_s083",
+    "MovieSequence": "_s083",
+    "MovieTracking": "_s084",
+    "MovieTrackingCamera": "_s084",
+    "MovieTrackingDopesheet": "_s084",
+    "MovieTrackingMarker": "_s084",
+    "MovieTrackingMarkers": "_s084",
+    "MovieTrackingObject": "_s084",
+    "MovieTrackingObjectPlaneTracks": "_s084",
+    "MovieTrackingObjectTracks": "_s084",
+    "MovieTrackingObjects": "_s084",
+    "MovieTrackingPlaneMarker": "_s084",
+    "MovieTrackingPlaneMarkers": "_s085",
+    "MovieTrackingPlaneTrack": "_s085",
+    "MovieTrackingPlaneTracks": "_s085",
+    "MovieTrackingReconstructedCameras": "_s085",
+    "MovieTrackingReconstruction": "_s085",
+    "MovieTrackingSettings": "_s085",
+    "MovieTrackingStabilization": "_s085",
+    "MovieTrackingTrack": "_s086",
+    "MovieTrackingTracks": "_s086",
+    "MulticamSequence": "_s086",
+    "MultiplySequence": "_s086",
+    "MultiresModifier": "_s086",
+    "MusgraveTexture": "_s086",
+    "NODE_MT_add": "_s086",
+    "NODE_PT_quality": "_s086",
+    "NODE_UL_interface_sockets": "_s087",
+    "NandController": "_s087",
+    "NearSensor": "_s087",
+    "NlaStrip": "_s087",
+    "NlaStripFCurves": "_s087",
+    "NlaStrips": "_s087",
+    "NlaTrack": "_s087",
+    "NlaTracks": "_s087",
+    "Node": "_s088",
+    "NodeCustomGroup": "_s088",
+    "NodeFrame": "_s088",
+    "NodeGroup": "_s088",
+    "NodeGroupInput": "_s088",
+    "NodeGroupOutput": "_s088",
+    "NodeInputs": "_s088",
+    "NodeInstanceHash": "_s088",
+    "NodeInternal": "_s089",
+    "NodeInternalSocketTemplate": "_s089",
+    "NodeLink": "_s089",
+    "NodeLinks": "_s089",
+    "NodeOutputFileSlotFile": "_s089",
+    "NodeOutputFileSlotLayer": "_s089",
+    "NodeOutputs": "_s089",
+    "NodeReroute": "_s089",
+    "NodeSetting": "_s089",
+    "NodeSocket": "_s089",
+    "NodeSocketBool": "_s089",
+    "NodeSocketColor": "_s089",
+    "NodeSocketFloat": "_s089",
+    "NodeSocketFloatAngle": "_s089",
+    "NodeSocketFloatFactor": "_s089",
+    "NodeSocketFloatPercentage": "_s089",
+    "NodeSocketFloatTime": "_s090",
+    "NodeSocketFloatUnsigned": "_s090",
+    "NodeSocketInt": "_s090",
+    "NodeSocketIntFactor": "_s090",
+    "NodeSocketIntPercentage": "_s090",
+    "NodeSocketIntUnsigned": "_s090",
+    "NodeSocketInterface": "_s090",
+    "NodeSocketInterfaceBool": "_s090",
+    "NodeSocketInterfaceColor": "_s090",
+    "NodeSocketInterfaceFloat": "_s090",
+    "NodeSocketInterfaceFloatAngle": "_s090",
+    "NodeSocketInterfaceFloatFactor": "_s090",
+    "NodeSocketInterfaceFloatPercentage": "_s090",
+    "NodeSocketInterfaceFloatTime": "_s090",
+    "NodeSocketInterfaceFloatUnsigned": "_s090",
+    "NodeSocketInterfaceInt": "_s090",
+    "NodeSocketInterfaceIntFactor": "_s090",
+    "NodeSocketInterfaceIntPercentage": "_s090",
+    "NodeSocketInterfaceIntUnsigned": "_s090",
+    "NodeSocketInterfaceShader": "_s090",
+    "NodeSocketInterfaceStandard": "_s091",
+    "NodeSocketInterfaceString": "_s091",
+    "NodeSocketInterfaceVector": "_s091",
+    "NodeSocketInterfaceVectorAcceleration": "_s091",
+    "NodeSocketInterfaceVectorDirection": "_s091",
+    "NodeSocketInterfaceVectorEuler": "_s091",
+    "NodeSocketInterfaceVectorTranslation": "_s091",
+    "NodeSocketInterfaceVectorVelocity": "_s091",
+    "NodeSocketInterfaceVectorXYZ": "_s091",
+    "NodeSocketShader": "_s091",
+    "NodeSocketStandard": "_s091",
+    "NodeSocketString": "_s091",
+    "NodeSocketVector": "_s091",
+    "NodeSocketVectorAcceleration": "_s091",
+    "NodeSocketVectorDirection": "_s091",
+    "NodeSocketVectorEuler": "_s091",
+    "NodeSocketVectorTranslation": "_s091",
+    "NodeSocketVectorVelocity": "_s091",
+    "NodeSocketVectorXYZ": "_s091",
+    "NodeSocketVirtual": "_s091",
+    "NodeTree": "_s092",
+    "NodeTreeInputs": "_s092",
+    "NodeTreeOutputs": "_s092",
+    "NodeTreePath": "_s092",
+    "Nodes": "_s092",
+    "NoiseTexture": "_s092",
+    "NorController": "_s092",
+    "NormalEditModifier": "_s092",
+    "Object": "_s093",
+    "ObjectActuator": "_s094",
+    "ObjectBase": "_s094",
+    "ObjectConstraints": "_s094",
+    "ObjectModifiers": "_s094",
+    "ObjectSolverConstraint": "_s094",
+    "ObstacleFluidSettings": "_s094",
+    "OceanModifier": "_s095",
+    "OceanTexData": "_s095",
+    "OceanTexture": "_s095",
+    "Operator": "_s095",
+    "OperatorFileListElement": "_s095",
+    "OperatorMacro": "_s095",
+    "OperatorMousePath": "_s095",
+    "OperatorOptions": "_s095",
+    "OperatorProperties": "_s095",
+    "OperatorStrokeElement": "_s096",
+    "OrController": "_s096",
+    "OutflowFluidSettings": "_s096",
+    "OverDropSequence": "_s096",
+    "PARTICLE_UL_particle_systems": "_s096",
+    "PHYSICS_UL_dynapaint_surfaces": "_s096",
+    "PackedFile": "_s096",
+    "Paint": "_s096",
+    "PaintCurve": "_s096",
+    "Palette": "_s096",
+    "PaletteColor": "_s096",
+    "PaletteColors": "_s096",
+    "Panel": "_s096",
+    "ParentActuator": "_s096",
+    "Particle": "_s097",
+    "ParticleBrush": "_s097",
+    "ParticleDupliWeight": "_s097",
+    "ParticleEdit": "_s097",
+    "ParticleFluidSettings": "_s097",
+    "ParticleHairKey": "_s097",
+    "ParticleInstanceModifier": "_s098",
+    "ParticleKey": "_s098",
+    "ParticleSettings": "_s099",
+    "ParticleSettingsTextureSlot": "_s100",
+    "ParticleSettingsTextureSlots": "_s100",
+    "ParticleSystem": "_s101",
+    "ParticleSystemModifier": "_s101",
+    "ParticleSystems": "_s101",
+    "ParticleTarget": "_s102",
+    "PathCompare": "_s102",
+    "PathCompareCollection": "_s102",
+    "PivotConstraint": "_s102",
+    "PointCache": "_s102",
+    "PointCaches": "_s102",
+    "PointDensity": "_s102",
+    "PointDensityTexture": "_s102",
+    "PointLamp": "_s103",
+    "PointerProperty": "_s103",
+    "PolygonFloatProperties": "_s103",
+    "PolygonIntProperties": "_s103",
+    "PolygonStringProperties": "_s103",
+    "Pose": "_s103",
+    "PoseBone": "_s104",
+    "PoseBoneConstraints": "_s105",
+    "Property": "_s105",
+    "PropertyActuator": "_s105",
+    "PropertyGroup": "_s105",
+    "PropertyGroupItem": "_s105",
+    "PropertySensor": "_s105",
+    "PythonConstraint": "_s105",
+    "PythonController": "_s105",
+    "RENDERLAYER_UL_linesets": "_s105",
+    "RENDERLAYER_UL_renderlayers": "_s105",
+    "RENDERLAYER_UL_renderviews": "_s106",
+    "RadarSensor": "_s106",
+    "RandomActuator": "_s106",
+    "RandomSensor": "_s106",
+    "RaySensor": "_s106",
+    "Region": "_s106",
+    "RegionView3D": "_s106",
+    "RemeshModifier": "_s106",
+    "RenderEngine": "_s107",
+    "RenderLayer": "_s108",
+    "RenderLayers": "_s108",
+    "RenderPass": "_s109",
+    "RenderPasses": "_s109",
+    "RenderResult": "_s109",
+    "RenderSettings": "_s110",
+    "RenderSlot": "_s111",
+    "RenderSlots": "_s111",
+    "RenderView": "_s111",
+    "RenderViews": "_s111",
+    "RigidBodyConstraint": "_s111",
+    "RigidBodyJointConstraint": "_s112",
+    "RigidBodyObject": "_s112",
+    "RigidBodyWorld": "_s112",
+    "Rotation": "_s112",
+    "SCENE_UL_keying_set_paths": "_s112",
+    "SPHFluidSettings": "_s113",
+    "Scaling": "_s113",
+    "Scene": "_s114",
+    "SceneActuator": "_s115",
+    "SceneBases": "_s115",
+    "SceneGameData": "_s115",
+    "SceneGameRecastData": "_s116",
+    "SceneObjects": "_s116",
+    "SceneRenderLayer": "_s117",
+    "SceneRenderView": "_s117",
+    "SceneSequence": "_s118",
+    "Scopes": "_s118",
+    "Screen": "_s118",
+    "ScrewModifier": "_s118",
+    "Sculpt": "_s119",
+    "SculptToolCapabilities": "_s119",
+    "SelectedUvElement": "_s119",
+    "Sensor": "_s119",
+    "Sequence": "_s120",
+    "SequenceColorBalance": "_s120",
+    "SequenceColorBalanceData": "_s120",
+    "SequenceCrop": "_s120",
+    "SequenceEditor": "_s120",
+    "SequenceElement": "_s120",
+    "SequenceElements": "_s120",
+    "SequenceModifier": "_s121",
+    "SequenceModifiers": "_s121",
+    "SequenceProxy": "_s121",
+    "SequenceTransform": "_s121",
+    "SequencerTonemapModifierData": "_s121",
+    "Sequences": "_s121",
+    "ShaderNode": "_s121",
+    "ShaderNodeAddShader": "_s121",
+    "ShaderNodeAmbientOcclusion": "_s121",
+    "ShaderNodeAttribute": "_s122",
+    "ShaderNodeBackground": "_s122",
+    "ShaderNodeBlackbody": "_s122",
+    "ShaderNodeBrightContrast": "_s122",
+    "ShaderNodeBsdfAnisotropic": "_s122",
+    "ShaderNodeBsdfDiffuse": "_s122",
+    "ShaderNodeBsdfGlass": "_s122",
+    "ShaderNodeBsdfGlossy": "_s122",
+    "ShaderNodeBsdfHair": "_s122",
+    "ShaderNodeBsdfPrincipled": "_s122",
+    "ShaderNodeBsdfRefraction": "_s122",
+    "ShaderNodeBsdfToon": "_s122",
+    "ShaderNodeBsdfTranslucent": "_s122",
+    "ShaderNodeBsdfTransparent": "_s122",
+    "ShaderNodeBsdfVelvet": "_s122",
+    "ShaderNodeBump": "_s122",
+    "ShaderNodeCameraData": "_s122",
+    "ShaderNodeCombineHSV": "_s122",
+    "ShaderNodeCombineRGB": "_s122",
+    "ShaderNodeCombineXYZ": "_s122",
+    "ShaderNodeEmission": "_s122",
+    "ShaderNodeExtendedMaterial": "_s122",
+    "ShaderNodeFresnel": "_s122",
+    "ShaderNodeGamma": "_s122",
+    "ShaderNodeGeometry": "_s122",
+    "ShaderNodeGroup": "_s122",
+    "ShaderNodeHairInfo": "_s122",
+    "ShaderNodeHoldout": "_s122",
+    "ShaderNodeHueSaturation": "_s122",
+    "ShaderNodeInvert": "_s122",
+    "ShaderNodeLampData": "_s122",
+    "ShaderNodeLayerWeight": "_s122",
+    "ShaderNodeLightFalloff": "_s122",
+    "ShaderNodeLightPath": "_s122",
+    "ShaderNodeMapping": "_s122",
+    "ShaderNodeMaterial": "_s122",
+    "ShaderNodeMath": "_s122",
+    "ShaderNodeMixRGB": "_s122",
+    "ShaderNodeMixShader": "_s122",
+    "ShaderNodeNewGeometry": "_s122",
+    "ShaderNodeNormal": "_s122",
+    "ShaderNodeNormalMap": "_s122",
+    "ShaderNodeObjectInfo": "_s122",
+    "ShaderNodeOutput": "_s122",
+    "ShaderNodeOutputLamp": "_s122",
+    "ShaderNodeOutputLineStyle": "_s122",
+    "ShaderNodeOutputMaterial": "_s123",
+    "ShaderNodeOutputWorld": "_s123",
+    "ShaderNodeParticleInfo": "_s123",
+    "ShaderNodeRGB": "_s123",
+    "ShaderNodeRGBCurve": "_s123",
+    "ShaderNodeRGBToBW": "_s123",
+    "ShaderNodeScript": "_s123",
+    "ShaderNodeSeparateHSV": "_s123",
+    "ShaderNodeSeparateRGB": "_s123",
+    "ShaderNodeSeparateXYZ": "_s123",
+    "ShaderNodeSqueeze": "_s123",
+    "ShaderNodeSubsurfaceScattering": "_s123",
+    "ShaderNodeTangent": "_s123",
+    "ShaderNodeTexBrick": "_s123",
+    "ShaderNodeTexChecker": "_s123",
+    "ShaderNodeTexCoord": "_s123",
+    "ShaderNodeTexEnvironment": "_s123",
+    "ShaderNodeTexGradient": "_s123",
+    "ShaderNodeTexImage": "_s123",
+    "ShaderNodeTexMagic": "_s123",
+    "ShaderNodeTexMusgrave": "_s123",
+    "ShaderNodeTexNoise": "_s123",
+    "ShaderNodeTexPointDensity": "_s124",
+    "ShaderNodeTexSky": "_s124",
+    "ShaderNodeTexVoronoi": "_s124",
+    "ShaderNodeTexWave": "_s124",
+    "ShaderNodeTexture": "_s124",
+    "ShaderNodeTree": "_s124",
+    "ShaderNodeUVAlongStroke": "_s124",
+    "ShaderNodeUVMap": "_s124",
+    "ShaderNodeValToRGB": "_s124",
+    "ShaderNodeValue": "_s124",
+    "ShaderNodeVectorCurve": "_s124",
+    "ShaderNodeVectorMath": "_s124",
+    "ShaderNodeVectorTransform": "_s124",
+    "ShaderNodeVolumeAbsorption": "_s124",
+    "ShaderNodeVolumeScatter": "_s124",
+    "ShaderNodeWavelength": "_s124",
+    "ShaderNodeWireframe": "_s124",
+    "ShapeKey": "_s124",
+    "ShapeKeyBezierPoint": "_s124",
+    "ShapeKeyCurvePoint": "_s125",
+    "ShapeKeyPoint": "_s125",
+    "ShrinkwrapConstraint": "_s125",
+    "ShrinkwrapModifier": "_s125",
+    "SimpleDeformModifier": "_s125",
+    "SkinModifier": "_s125",
+    "SmokeCollSettings": "_s125",
+    "SmokeDomainSettings": "_s126",
+    "SmokeFlowSettings": "_s127",
+    "SmokeModifier": "_s127",
+    "SmoothModifier": "_s127",
+    "SoftBodyModifier": "_s127",
+    "SoftBodySettings": "_s128",
+    "SolidifyModifier": "_s128",
+    "Sound": "_s129",
+    "SoundActuator": "_s129",
+    "SoundSequence": "_s129",
+    "Space": "_s129",
+    "SpaceClipEditor": "_s130",
+    "SpaceConsole": "_s130",
+    "SpaceDopeSheetEditor": "_s130",
+    "SpaceFileBrowser": "_s131",
+    "SpaceGraphEditor": "_s131",
+    "SpaceImageEditor": "_s131",
+    "SpaceInfo": "_s132",
+    "SpaceLogicEditor": "_s132",
+    "SpaceNLA": "_s132",
+    "SpaceNodeEditor": "_s132",
+    "SpaceNodeEditorPath": "_s132",
+    "SpaceOutliner": "_s133",
+    "SpaceProperties": "_s133",
+    "SpaceSequenceEditor": "_s133",
+    "SpaceTextEditor": "_s133",
+    "SpaceTimeline": "_s134",
+    "SpaceUVEditor": "_s134",
+    "SpaceUserPreferences": "_s134",
+    "SpaceView3D": "_s135",
+    "Speaker": "_s136",
+    "SpeedControlSequence": "_s136",
+    "Spline": "_s136",
+    "SplineBezierPoints": "_s136",
+    "SplineIKConstraint": "_s136",
+    "SplinePoint": "_s136",
+    "SplinePoints": "_s137",
+    "SpotLamp": "_s137",
+    "StateActuator": "_s137",
+    "SteeringActuator": "_s137",
+    "Stereo3dDisplay": "_s137",
+    "Stereo3dFormat": "_s138",
+    "StretchToConstraint": "_s138",
+    "StringProperty": "_s138",
+    "Struct": "_s138",
+    "StucciTexture": "_s138",
+    "SubsurfModifier": "_s138",
+    "SubtractSequence": "_s138",
+    "SunLamp": "_s139",
+    "SurfaceCurve": "_s139",
+    "SurfaceDeformModifier": "_s139",
+    "SurfaceModifier": "_s139",
+    "TEXTURE_UL_texpaintslots": "_s139",
+    "TEXTURE_UL_texslots": "_s139",
+    "TessfaceUVTextures": "_s139",
+    "TexMapping": "_s139",
+    "TexPaintSlot": "_s139",
+    "Text": "_s140",
+    "TextBox": "_s140",
+    "TextCharacterFormat": "_s140",
+    "TextCurve": "_s140",
+    "TextLine": "_s140",
+    "TextSequence": "_s140",
+    "Texture": "_s141",
+    "TextureNode": "_s141",
+    "TextureNodeAt": "_s141",
+    "TextureNodeBricks": "_s141",
+    "TextureNodeChecker": "_s141",
+    "TextureNodeCompose": "_s141",
+    "TextureNodeCoordinates": "_s141",
+    "TextureNodeCurveRGB": "_s141",
+    "TextureNodeCurveTime": "_s141",
+    "TextureNodeDecompose": "_s141",
+    "TextureNodeDistance": "_s141",
+    "TextureNodeGroup": "_s141",
+    "TextureNodeHueSaturation": "_s141",
+    "TextureNodeImage": "_s141",
+    "TextureNodeInvert": "_s141",
+    "TextureNodeMath": "_s141",
+    "TextureNodeMixRGB": "_s141",
+    "TextureNodeOutput": "_s141",
+    "TextureNodeRGBToBW": "_s141",
+    "TextureNodeRotate": "_s141",
+    "TextureNodeScale": "_s141",
+    "TextureNodeTexBlend": "_s141",
+    "TextureNodeTexClouds": "_s141",
+    "TextureNodeTexDistNoise": "_s141",
+    "TextureNodeTexMagic": "_s141",
+    "TextureNodeTexMarble": "_s141",
+    "TextureNodeTexMusgrave": "_s141",
+    "TextureNodeTexNoise": "_s141",
+    "TextureNodeTexStucci": "_s141",
+    "TextureNodeTexVoronoi": "_s141",
+    "TextureNodeTexWood": "_s141",
+    "TextureNodeTexture": "_s141",
+    "TextureNodeTranslate": "_s141",
+    "TextureNodeTree": "_s141",
+    "TextureNodeValToNor": "_s141",
+    "TextureNodeValToRGB": "_s141",
+    "TextureNodeViewer": "_s141",
+    "TextureSlot": "_s142",
+    "Theme": "_s142",
+    "ThemeBoneColorSet": "_s142",
+    "ThemeClipEditor": "_s142",
+    "ThemeConsole": "_s143",
+    "ThemeDopeSheet": "_s143",
+    "ThemeFileBrowser": "_s143",
+    "ThemeFontStyle": "_s143",
+    "ThemeGradientColors": "_s143",
+    "ThemeGraphEditor": "_s144",
+    "ThemeImageEditor": "_s145",
+    "ThemeInfo": "_s145",
+    "ThemeLogicEditor": "_s145",
+    "ThemeNLAEditor": "_s146",
+    "ThemeNodeEditor": "_s146",
+    "ThemeOutliner": "_s146",
+    "ThemePanelColors": "_s146",
+    "ThemeProperties": "_s146",
+    "ThemeSequenceEditor": "_s147",
+    "ThemeSpaceGeneric": "_s147",
+    "ThemeSpaceGradient": "_s147",
+    "ThemeSpaceListGeneric": "_s147",
+    "ThemeStyle": "_s147",
+    "ThemeTextEditor": "_s148",
+    "ThemeTimeline": "_s148",
+    "ThemeUserInterface": "_s148",
+    "ThemeUserPreferences": "_s148",
+    "ThemeView3D": "_s149",
+    "ThemeWidgetColors": "_s150",
+    "ThemeWidgetStateColors": "_s150",
+    "TimelineMarker": "_s150",
+    "TimelineMarkers": "_s150",
+    "Timer": "_s150",
+    "ToolSettings": "_s151",
+    "TrackToConstraint": "_s152",
+    "TransformCacheConstraint": "_s152",
+    "TransformConstraint": "_s152",
+    "TransformOrientation": "_s152",
+    "TransformSequence": "_s153",
+    "TriangulateModifier": "_s153",
+    "UILayout": "_s154",
+    "UIList": "_s155",
+    "UIPieMenu": "_s155",
+    "UIPopupMenu": "_s155",
+    "UI_UL_list": "_s155",
+    "UVLoopLayers": "_s155",
+    "UVProjectModifier": "_s155",
+    "UVProjector": "_s155",
+    "UVTextures": "_s155",
+    "UVWarpModifier": "_s155",
+    "UnifiedPaintSettings": "_s155",
+    "UnitSettings": "_s156",
+    "UnknownType": "_s156",
+    "UserPreferences": "_s156",
+    "UserPreferencesEdit": "_s156",
+    "UserPreferencesFilePaths": "_s157",
+    "UserPreferencesInput": "_s157",
+    "UserPreferencesSystem": "_s158",
+    "UserPreferencesView": "_s159",
+    "UserSolidLight": "_s159",
+    "UvSculpt": "_s159",
+    "VIEW3D_MT_transform": "_s159",
+    "VIEW3D_MT_transform_armature": "_s159",
+    "VIEW3D_MT_transform_object": "_s159",
+    "VectorFont": "_s159",
+    "VertexColors": "_s159",
+    "VertexFloatProperties": "_s159",
+    "VertexGroup": "_s160",
+    "VertexGroupElement": "_s160",
+    "VertexGroups": "_s160",
+    "VertexIntProperties": "_s160",
+    "VertexPaint": "_s160",
+    "VertexStringProperties": "_s160",
+    "VertexWeightEditModifier": "_s160",
+    "VertexWeightMixModifier": "_s160",
+    "VertexWeightProximityModifier": "_s161",
+    "View2D": "_s161",
+    "VisibilityActuator": "_s161",
+    "VoronoiTexture": "_s161",
+    "VoxelData": "_s161",
+    "VoxelDataTexture": "_s161",
+    "WalkNavigation": "_s161",
+    "WarpModifier": "_s162",
+    "WaveModifier": "_s162",
+    "WhiteBalanceModifier": "_s162",
+    "WholeCharacter": "_s162",
+    "WholeCharacterSelected": "_s162",
+    "Window": "_s162",
+    "WindowManager": "_s163",
+    "WipeSequence": "_s163",
+    "WireframeModifier": "_s163",
+    "WoodTexture": "_s163",
+    "World": "_s163",
+    "WorldLighting": "_s164",
+    "WorldMistSettings": "_s164",
+    "WorldTextureSlot": "_s164",
+    "WorldTextureSlots": "_s164",
+    "XnorController": "_s164",
+    "XorController": "_s164",
+    "bpy_prop_collection": "_s164",
+    "bpy_struct": "_s165",
+    "BONE_PT_constraints": "_s165",
+    "BONE_PT_context_bone": "_s165",
+    "BONE_PT_curved": "_s165",
+    "BONE_PT_custom_props": "_s165",
+    "BONE_PT_deform": "_s165",
+    "BONE_PT_display": "_s165",
+    "BONE_PT_inverse_kinematics": "_s165",
+    "BONE_PT_relations": "_s165",
+    "BONE_PT_transform": "_s165",
+    "CAMERA_PT_presets": "_s165",
+    "CLIP_HT_header": "_s165",
+    "CLIP_MT_clip": "_s165",
+    "CLIP_MT_marker_pie": "_s165",
+    "CLIP_MT_mask_handle_type_menu": "_s165",
+    "CLIP_MT_masking_editor_menus": "_s165",
+    "CLIP_MT_pivot_pie": "_s165",
+    "CLIP_MT_proxy": "_s165",
+    "CLIP_MT_reconstruction": "_s165",
+    "CLIP_MT_reconstruction_pie": "_s165",
+    "CLIP_MT_select": "_s165",
+    "CLIP_MT_select_grouped": "_s165",
+    "CLIP_MT_solving_pie": "_s165",
+    "CLIP_MT_stabilize_2d_context_menu": "_s165",
+    "CLIP_MT_stabilize_2d_rotation_context_menu": "_s165",
+    "CLIP_MT_track": "_s165",
+    "CLIP_MT_track_transform": "_s165",
+    "CLIP_MT_track_visibility": "_s165",
+    "CLIP_MT_tracking_context_menu": "_s165",
+    "CLIP_MT_tracking_editor_menus": "_s165",
+    "CLIP_MT_tracking_pie": "_s165",
+    "CLIP_MT_view": "_s165",
+    "CLIP_PT_active_mask_point": "_s165",
+    "CLIP_PT_active_mask_spline": "_s165",
+    "CLIP_PT_camera_presets": "_s165",
+    "CLIP_PT_clip_display": "_s165",
+    "CLIP_PT_display": "_s165",
+    "CLIP_PT_footage": "_s165",
+    "CLIP_PT_grease_pencil": "_s165",
+    "CLIP_PT_marker": "_s165",
+    "CLIP_PT_marker_display": "_s165",
+    "CLIP_PT_mask": "_s165",
+    "CLIP_PT_mask_display": "_s165",
+    "CLIP_PT_mask_layers": "_s165",
+    "CLIP_PT_objects": "_s165",
+    "CLIP_PT_plane_track": "_s165",
+    "CLIP_PT_proxy": "_s165",
+    "CLIP_PT_stabilization": "_s165",
+    "CLIP_PT_tools_cleanup": "_s165",
+    "CLIP_PT_tools_clip": "_s165",
+    "CLIP_PT_tools_geometry": "_s165",
+    "CLIP_PT_tools_grease_pencil_draw": "_s165",
+    "CLIP_PT_tools_marker": "_s165",
+    "CLIP_PT_tools_mask_tools": "_s165",
+    "CLIP_PT_tools_mask_transforms": "_s165",
+    "CLIP_PT_tools_object": "_s165",
+    "CLIP_PT_tools_orientation": "_s165",
+    "CLIP_PT_tools_plane_tracking": "_s166",
+    "CLIP_PT_tools_scenesetup": "_s166",
+    "CLIP_PT_tools_solve": "_s166",
+    "CLIP_PT_tools_tracking": "_s166",
+    "CLIP_PT_track": "_s166",
+    "CLIP_PT_track_color_presets": "_s166",
+    "CLIP_PT_track_settings": "_s166",
+    "CLIP_PT_track_settings_extras": "_s166",
+    "CLIP_PT_tracking_camera": "_s166",
+    "CLIP_PT_tracking_lens": "_s166",
+    "CLIP_PT_tracking_settings": "_s166",
+    "CLIP_PT_tracking_settings_extras": "_s166",
+    "CLIP_PT_tracking_settings_presets": "_s166",
+    "CLOTH_PT_presets": "_s166",
+    "COLLECTION_MT_context_menu": "_s166",
+    "CONSOLE_HT_header": "_s166",
+    "CONSOLE_MT_console": "_s166",
+    "CONSOLE_MT_editor_menus": "_s166",
+    "CONSOLE_MT_language": "_s166",
+    "DATA_MT_bone_group_context_menu": "_s166",
+    "DATA_PT_EEVEE_light": "_s166",
+    "DATA_PT_EEVEE_light_distance": "_s166",
+    "DATA_PT_EEVEE_shadow": "_s166",
+    "DATA_PT_EEVEE_shadow_cascaded_shadow_map": "_s166",
+    "DATA_PT_EEVEE_shadow_contact": "_s166",
+    "DATA_PT_active_spline": "_s166",
+    "DATA_PT_area": "_s166",
+    "DATA_PT_bone_groups": "_s166",
+    "DATA_PT_camera": "_s166",
+    "DATA_PT_camera_background_image": "_s166",
+    "DATA_PT_camera_display": "_s166",
+    "DATA_PT_camera_display_composition_guides": "_s166",
+    "DATA_PT_camera_display_passepartout": "_s166",
+    "DATA_PT_camera_dof": "_s166",
+    "DATA_PT_camera_dof_aperture": "_s166",
+    "DATA_PT_camera_safe_areas": "_s166",
+    "DATA_PT_camera_safe_areas_center_cut": "_s166",
+    "DATA_PT_camera_stereoscopy": "_s166",
+    "DATA_PT_cone": "_s166",
+    "DATA_PT_context_arm": "_s166",
+    "DATA_PT_context_camera": "_s166",
+    "DATA_PT_context_curve": "_s166",
+    "DATA_PT_context_gpencil": "_s166",
+    "DATA_PT_context_lattice": "_s166",
+    "DATA_PT_context_light": "_s166",
+    "DATA_PT_context_lightprobe": "_s166",
+    "DATA_PT_context_mesh": "_s166",
+    "DATA_PT_context_metaball": "_s166",
+    "DATA_PT_context_speaker": "_s166",
+    "DATA_PT_curve_texture_space": "_s166",
+    "DATA_PT_custom_props_arm": "_s166",
+    "DATA_PT_custom_props_camera": "_s166",
+    "DATA_PT_custom_props_curve": "_s166",
+    "DATA_PT_custom_props_gpencil": "_s166",
+    "DATA_PT_custom_props_lattice": "_s166",
+    "DATA_PT_custom_props_light": "_s166",
+    "DATA_PT_custom_props_mesh": "_s166",
+    "DATA_PT_custom_props_metaball": "_s166",
+    "DATA_PT_custom_props_speaker": "_s166",
+    "DATA_PT_customdata": "_s166",
+    "DATA_PT_display": "_s166",
+    "DATA_PT_distance": "_s166",
+    "DATA_PT_empty": "_s166",
+    "DATA_PT_empty_image": "_s166",
+    "DATA_PT_face_maps": "_s166",
+    "DATA_PT_falloff_curve": "_s166",
+    "DATA_PT_font": "_s166",
+    "DATA_PT_font_transform": "_s166",
+    "DATA_PT_geometry_curve": "_s166",
+    "DATA_PT_geometry_curve_bevel": "_s166",
+    "DATA_PT_gpencil_canvas": "_s166",
+    "DATA_PT_gpencil_display": "_s166",
+    "DATA_PT_gpencil_layer_adjustments": "_s166",
+    "DATA_PT_gpencil_layer_display": "_s166",
+    "DATA_PT_gpencil_layer_relations": "_s166",
+    "DATA_PT_gpencil_layers": "_s166",
+    "DATA_PT_gpencil_modifiers": "_s166",
+    "DATA_PT_gpencil_onion_skinning": "_s166",
+    "DATA_PT_gpencil_onion_skinning_custom_colors": "_s166",
+    "DATA_PT_gpencil_onion_skinning_display": "_s166",
+    "DATA_PT_gpencil_strokes": "_s166",
+    "DATA_PT_gpencil_vertex_groups": "_s166",
+    "DATA_PT_iksolver_itasc": "_s166",
+    "DATA_PT_lattice": "_s166",
+    "DATA_PT_lens": "_s166",
+    "DATA_PT_light": "_s166",
+    "DATA_PT_lightprobe": "_s166",
+    "DATA_PT_lightprobe_display": "_s166",
+    "DATA_PT_lightprobe_parallax": "_s166",
+    "DATA_PT_lightprobe_visibility": "_s166",
+    "DATA_PT_mball_texture_space": "_s166",
+    "DATA_PT_metaball": "_s166",
+    "DATA_PT_metaball_element": "_s166",
+    "DATA_PT_modifiers": "_s166",
+    "DATA_PT_motion_paths": "_s166",
+    "DATA_PT_motion_paths_display": "_s166",
+    "DATA_PT_normals": "_s166",
+    "DATA_PT_normals_auto_smooth": "_s166",
+    "DATA_PT_paragraph": "_s166",
+    "DATA_PT_paragraph_alignment": "_s166",
+    "DATA_PT_paragraph_spacing": "_s167",
+    "DATA_PT_pathanim": "_s167",
+    "DATA_PT_pose_library": "_s167",
+    "DATA_PT_preview": "_s167",
+    "DATA_PT_shader_fx": "_s167",
+    "DATA_PT_shape_curve": "_s167",
+    "DATA_PT_shape_keys": "_s167",
+    "DATA_PT_skeleton": "_s167",
+    "DATA_PT_speaker": "_s167",
+    "DATA_PT_spot": "_s167",
+    "DATA_PT_text_boxes": "_s167",
+    "DATA_PT_texture_space": "_s167",
+    "DATA_PT_uv_texture": "_s167",
+    "DATA_PT_vertex_colors": "_s167",
+    "DATA_PT_vertex_groups": "_s167",
+    "DOPESHEET_HT_editor_buttons": "_s167",
+    "DOPESHEET_HT_header": "_s167",
+    "DOPESHEET_MT_channel": "_s167",
+    "DOPESHEET_MT_channel_context_menu": "_s167",
+    "DOPESHEET_MT_context_menu": "_s167",
+    "DOPESHEET_MT_delete": "_s167",
+    "DOPESHEET_MT_editor_menus": "_s167",
+    "DOPESHEET_MT_gpencil_channel": "_s167",
+    "DOPESHEET_MT_gpencil_frame": "_s167",
+    "DOPESHEET_MT_key": "_s167",
+    "DOPESHEET_MT_key_transform": "_s167",
+    "DOPESHEET_MT_marker": "_s167",
+    "DOPESHEET_MT_select": "_s167",
+    "DOPESHEET_MT_snap_pie": "_s167",
+    "DOPESHEET_MT_view": "_s167",
+    "DOPESHEET_PT_filters": "_s167",
+    "EEVEE_MATERIAL_PT_context_material": "_s167",
+    "EEVEE_MATERIAL_PT_settings": "_s167",
+    "EEVEE_MATERIAL_PT_surface": "_s167",
+    "EEVEE_MATERIAL_PT_volume": "_s167",
+    "EEVEE_WORLD_PT_mist": "_s167",
+    "EEVEE_WORLD_PT_surface": "_s167",
+    "EEVEE_WORLD_PT_volume": "_s167",
+    "FILEBROWSER_HT_header": "_s167",
+    "FILEBROWSER_MT_bookmarks_context_menu": "_s167",
+    "FILEBROWSER_MT_view": "_s167",
+    "FILEBROWSER_PT_advanced_filter": "_s167",
+    "FILEBROWSER_PT_bookmarks_favorites": "_s167",
+    "FILEBROWSER_PT_bookmarks_recents": "_s167",
+    "FILEBROWSER_PT_bookmarks_system": "_s167",
+    "FILEBROWSER_PT_bookmarks_volumes": "_s167",
+    "FLUID_PT_presets": "_s167",
+    "GPENCIL_MT_cleanup": "_s167",
+    "GPENCIL_MT_color_context_menu": "_s167",
+    "GPENCIL_MT_gpencil_draw_delete": "_s167",
+    "GPENCIL_MT_gpencil_vertex_group": "_s167",
+    "GPENCIL_MT_layer_context_menu": "_s167",
+    "GPENCIL_MT_pie_sculpt": "_s167",
+    "GPENCIL_MT_pie_settings_palette": "_s167",
+    "GPENCIL_MT_pie_tool_palette": "_s167",
+    "GPENCIL_MT_pie_tools_more": "_s167",
+    "GPENCIL_MT_separate": "_s167",
+    "GPENCIL_MT_snap": "_s167",
+    "GPENCIL_UL_annotation_layer": "_s167",
+    "GPENCIL_UL_matslots": "_s167",
+    "GPENCIL_UL_vgroups": "_s167",
+    "GRAPH_HT_header": "_s167",
+    "GRAPH_MT_channel": "_s167",
+    "GRAPH_MT_channel_context_menu": "_s167",
+    "GRAPH_MT_context_menu": "_s167",
+    "GRAPH_MT_delete": "_s167",
+    "GRAPH_MT_editor_menus": "_s167",
+    "GRAPH_MT_key": "_s167",
+    "GRAPH_MT_key_transform": "_s167",
+    "GRAPH_MT_marker": "_s167",
+    "GRAPH_MT_pivot_pie": "_s167",
+    "GRAPH_MT_select": "_s167",
+    "GRAPH_MT_snap_pie": "_s167",
+    "GRAPH_MT_view": "_s167",
+    "GRAPH_PT_filters": "_s167",
+    "IMAGE_HT_header": "_s167",
+    "IMAGE_HT_tool_header": "_s167",
+    "IMAGE_MT_brush": "_s167",
+    "IMAGE_MT_image": "_s167",
+    "IMAGE_MT_image_invert": "_s167",
+    "IMAGE_MT_mask_context_menu": "_s167",
+    "IMAGE_MT_pivot_pie": "_s167",
+    "IMAGE_MT_select": "_s167",
+    "IMAGE_MT_uvs": "_s167",
+    "IMAGE_MT_uvs_context_menu": "_s167",
+    "IMAGE_MT_uvs_mirror": "_s167",
+    "IMAGE_MT_uvs_select_mode": "_s167",
+    "IMAGE_MT_uvs_showhide": "_s167",
+    "IMAGE_MT_uvs_snap": "_s167",
+    "IMAGE_MT_uvs_snap_pie": "_s167",
+    "IMAGE_MT_uvs_transform": "_s167",
+    "IMAGE_MT_uvs_weldalign": "_s167",
+    "IMAGE_MT_view": "_s167",
+    "IMAGE_MT_view_zoom": "_s167",
+    "IMAGE_PT_active_mask_point": "_s167",
+    "IMAGE_PT_active_mask_spline": "_s167",
+    "IMAGE_PT_active_tool": "_s167",
+    "IMAGE_PT_grease_pencil": "_s167",
+    "IMAGE_PT_image_properties": "_s167",
+    "IMAGE_PT_mask": "_s167",
+    "IMAGE_PT_mask_layers": "_s168",
+    "IMAGE_PT_paint": "_s168",
+    "IMAGE_PT_paint_clone": "_s168",
+    "IMAGE_PT_paint_color": "_s168",
+    "IMAGE_PT_paint_curve": "_s168",
+    "IMAGE_PT_paint_gradient": "_s168",
+    "IMAGE_PT_paint_options": "_s168",
+    "IMAGE_PT_paint_stroke": "_s168",
+    "IMAGE_PT_paint_stroke_smooth_stroke": "_s168",
+    "IMAGE_PT_paint_swatches": "_s168",
+    "IMAGE_PT_render_slots": "_s168",
+    "IMAGE_PT_sample_line": "_s168",
+    "IMAGE_PT_scope_sample": "_s168",
+    "IMAGE_PT_snapping": "_s168",
+    "IMAGE_PT_tools_active": "_s168",
+    "IMAGE_PT_tools_brush_display": "_s168",
+    "IMAGE_PT_tools_brush_display_custom_icon": "_s168",
+    "IMAGE_PT_tools_brush_display_show_brush": "_s168",
+    "IMAGE_PT_tools_brush_texture": "_s168",
+    "IMAGE_PT_tools_imagepaint_symmetry": "_s168",
+    "IMAGE_PT_tools_mask_texture": "_s168",
+    "IMAGE_PT_uv_cursor": "_s168",
+    "IMAGE_PT_uv_sculpt_brush": "_s168",
+    "IMAGE_PT_uv_sculpt_curve": "_s168",
+    "IMAGE_PT_view_display": "_s168",
+    "IMAGE_PT_view_display_uv_edit_overlays": "_s168",
+    "IMAGE_PT_view_display_uv_edit_overlays_stretch": "_s168",
+    "IMAGE_PT_view_histogram": "_s168",
+    "IMAGE_PT_view_vectorscope": "_s168",
+    "IMAGE_PT_view_waveform": "_s168",
+    "IMAGE_UL_render_slots": "_s168",
+    "INFO_HT_header": "_s168",
+    "INFO_MT_area": "_s168",
+    "MASK_MT_animation": "_s168",
+    "MASK_MT_editor_menus": "_s168",
+    "MASK_MT_mask": "_s168",
+    "MASK_MT_select": "_s168",
+    "MASK_MT_transform": "_s168",
+    "MASK_MT_visibility": "_s168",
+    "MATERIAL_MT_context_menu": "_s168",
+    "MATERIAL_PT_custom_props": "_s168",
+    "MATERIAL_PT_freestyle_line": "_s168",
+    "MATERIAL_PT_gpencil_custom_props": "_s168",
+    "MATERIAL_PT_gpencil_fillcolor": "_s168",
+    "MATERIAL_PT_gpencil_material_presets": "_s168",
+    "MATERIAL_PT_gpencil_options": "_s168",
+    "MATERIAL_PT_gpencil_preview": "_s168",
+    "MATERIAL_PT_gpencil_slots": "_s168",
+    "MATERIAL_PT_gpencil_strokecolor": "_s168",
+    "MATERIAL_PT_gpencil_surface": "_s168",
+    "MATERIAL_PT_preview": "_s168",
+    "MATERIAL_PT_viewport": "_s168",
+    "MESH_MT_shape_key_context_menu": "_s168",
+    "MESH_MT_vertex_group_context_menu": "_s168",
+    "MESH_UL_fmaps": "_s168",
+    "MESH_UL_uvmaps": "_s168",
+    "MESH_UL_vcols": "_s168",
+    "NLA_HT_header": "_s168",
+    "NLA_MT_add": "_s168",
+    "NLA_MT_channel_context_menu": "_s168",
+    "NLA_MT_context_menu": "_s168",
+    "NLA_MT_edit": "_s168",
+    "NLA_MT_edit_transform": "_s168",
+    "NLA_MT_editor_menus": "_s168",
+    "NLA_MT_marker": "_s168",
+    "NLA_MT_select": "_s168",
+    "NLA_MT_snap_pie": "_s168",
+    "NLA_MT_view": "_s168",
+    "NLA_PT_filters": "_s168",
+    "NODE_HT_header": "_s168",
+    "NODE_MT_context_menu": "_s168",
+    "NODE_MT_editor_menus": "_s168",
+    "NODE_MT_node": "_s168",
+    "NODE_MT_node_color_context_menu": "_s168",
+    "NODE_MT_select": "_s168",
+    "NODE_MT_view": "_s168",
+    "NODE_PT_active_node_color": "_s168",
+    "NODE_PT_active_node_generic": "_s168",
+    "NODE_PT_active_node_properties": "_s168",
+    "NODE_PT_active_tool": "_s168",
+    "NODE_PT_backdrop": "_s168",
+    "NODE_PT_grease_pencil": "_s168",
+    "NODE_PT_grease_pencil_tools": "_s168",
+    "NODE_PT_material_slots": "_s168",
+    "NODE_PT_node_color_presets": "_s168",
+    "NODE_PT_texture_mapping": "_s168",
+    "NODE_PT_tools_active": "_s168",
+    "OBJECT_PT_collections": "_s168",
+    "OBJECT_PT_constraints": "_s168",
+    "OBJECT_PT_context_object": "_s168",
+    "OBJECT_PT_custom_props": "_s168",
+    "OBJECT_PT_delta_transform": "_s168",
+    "OBJECT_PT_display": "_s168",
+    "OBJECT_PT_display_bounds": "_s168",
+    "OBJECT_PT_instancing": "_s168",
+    "OBJECT_PT_instancing_size": "_s168",
+    "OBJECT_PT_motion_paths": "_s168",
+    "OBJECT_PT_motion_paths_display": "_s168",
+    "OBJECT_PT_relations": "_s168",
+    "OBJECT_PT_transform": "_s168",
+    "OBJECT_PT_visibility": "_s169",
+    "OUTLINER_HT_header": "_s169",
+    "OUTLINER_MT_collection": "_s169",
+    "OUTLINER_MT_collection_new": "_s169",
+    "OUTLINER_MT_collection_view_layer": "_s169",
+    "OUTLINER_MT_collection_visibility": "_s169",
+    "OUTLINER_MT_context": "_s169",
+    "OUTLINER_MT_context_view": "_s169",
+    "OUTLINER_MT_edit_datablocks": "_s169",
+    "OUTLINER_MT_editor_menus": "_s169",
+    "OUTLINER_MT_object": "_s169",
+    "OUTLINER_PT_filter": "_s169",
+    "PARTICLE_MT_context_menu": "_s169",
+    "PARTICLE_PT_boidbrain": "_s169",
+    "PARTICLE_PT_cache": "_s169",
+    "PARTICLE_PT_children": "_s169",
+    "PARTICLE_PT_children_clumping": "_s169",
+    "PARTICLE_PT_children_clumping_noise": "_s169",
+    "PARTICLE_PT_children_kink": "_s169",
+    "PARTICLE_PT_children_parting": "_s169",
+    "PARTICLE_PT_children_roughness": "_s169",
+    "PARTICLE_PT_context_particles": "_s169",
+    "PARTICLE_PT_custom_props": "_s169",
+    "PARTICLE_PT_draw": "_s169",
+    "PARTICLE_PT_emission": "_s169",
+    "PARTICLE_PT_emission_source": "_s169",
+    "PARTICLE_PT_field_weights": "_s169",
+    "PARTICLE_PT_force_fields": "_s169",
+    "PARTICLE_PT_force_fields_type1": "_s169",
+    "PARTICLE_PT_force_fields_type1_falloff": "_s169",
+    "PARTICLE_PT_force_fields_type2": "_s169",
+    "PARTICLE_PT_force_fields_type2_falloff": "_s169",
+    "PARTICLE_PT_hair_dynamics": "_s169",
+    "PARTICLE_PT_hair_dynamics_presets": "_s169",
+    "PARTICLE_PT_hair_dynamics_structure": "_s169",
+    "PARTICLE_PT_hair_dynamics_volume": "_s169",
+    "PARTICLE_PT_hair_shape": "_s169",
+    "PARTICLE_PT_physics": "_s169",
+    "PARTICLE_PT_physics_boids_battle": "_s169",
+    "PARTICLE_PT_physics_boids_misc": "_s169",
+    "PARTICLE_PT_physics_boids_movement": "_s169",
+    "PARTICLE_PT_physics_deflection": "_s169",
+    "PARTICLE_PT_physics_fluid_advanced": "_s169",
+    "PARTICLE_PT_physics_fluid_interaction": "_s169",
+    "PARTICLE_PT_physics_fluid_springs": "_s169",
+    "PARTICLE_PT_physics_fluid_springs_advanced": "_s169",
+    "PARTICLE_PT_physics_fluid_springs_viscoelastic": "_s169",
+    "PARTICLE_PT_physics_forces": "_s169",
+    "PARTICLE_PT_physics_integration": "_s169",
+    "PARTICLE_PT_physics_relations": "_s169",
+    "PARTICLE_PT_render": "_s169",
+    "PARTICLE_PT_render_collection": "_s169",
+    "PARTICLE_PT_render_collection_use_count": "_s169",
+    "PARTICLE_PT_render_extra": "_s169",
+    "PARTICLE_PT_render_object": "_s169",
+    "PARTICLE_PT_render_path": "_s169",
+    "PARTICLE_PT_render_path_timing": "_s169",
+    "PARTICLE_PT_rotation": "_s169",
+    "PARTICLE_PT_rotation_angular_velocity": "_s169",
+    "PARTICLE_PT_textures": "_s169",
+    "PARTICLE_PT_velocity": "_s169",
+    "PARTICLE_PT_vertexgroups": "_s169",
+    "PHYSICS_PT_add": "_s169",
+    "PHYSICS_PT_cloth": "_s169",
+    "PHYSICS_PT_cloth_cache": "_s169",
+    "PHYSICS_PT_cloth_collision": "_s169",
+    "PHYSICS_PT_cloth_damping": "_s169",
+    "PHYSICS_PT_cloth_field_weights": "_s169",
+    "PHYSICS_PT_cloth_object_collision": "_s169",
+    "PHYSICS_PT_cloth_physical_properties": "_s169",
+    "PHYSICS_PT_cloth_property_weights": "_s169",
+    "PHYSICS_PT_cloth_self_collision": "_s169",
+    "PHYSICS_PT_cloth_shape": "_s169",
+    "PHYSICS_PT_cloth_stiffness": "_s169",
+    "PHYSICS_PT_collision": "_s169",
+    "PHYSICS_PT_collision_particle": "_s169",
+    "PHYSICS_PT_collision_softbody": "_s169",
+    "PHYSICS_PT_domain_bake": "_s169",
+    "PHYSICS_PT_domain_boundary": "_s169",
+    "PHYSICS_PT_domain_gravity": "_s169",
+    "PHYSICS_PT_domain_particles": "_s169",
+    "PHYSICS_PT_domain_viscosity": "_s169",
+    "PHYSICS_PT_dp_brush_source": "_s169",
+    "PHYSICS_PT_dp_brush_source_color_ramp": "_s169",
+    "PHYSICS_PT_dp_brush_velocity": "_s169",
+    "PHYSICS_PT_dp_brush_velocity_color_ramp": "_s169",
+    "PHYSICS_PT_dp_brush_velocity_smudge": "_s169",
+    "PHYSICS_PT_dp_brush_wave": "_s169",
+    "PHYSICS_PT_dp_cache": "_s169",
+    "PHYSICS_PT_dp_canvas_initial_color": "_s169",
+    "PHYSICS_PT_dp_canvas_output": "_s169",
+    "PHYSICS_PT_dp_canvas_output_paintmaps": "_s169",
+    "PHYSICS_PT_dp_canvas_output_wetmaps": "_s169",
+    "PHYSICS_PT_dp_effects": "_s169",
+    "PHYSICS_PT_dp_effects_drip": "_s169",
+    "PHYSICS_PT_dp_effects_drip_weights": "_s169",
+    "PHYSICS_PT_dp_effects_shrink": "_s169",
+    "PHYSICS_PT_dp_effects_spread": "_s169",
+    "PHYSICS_PT_dp_surface_canvas": "_s169",
+    "PHYSICS_PT_dp_surface_canvas_paint_dissolve": "_s169",
+    "PHYSICS_PT_dp_surface_canvas_paint_dry": "_s170",
+    "PHYSICS_PT_dynamic_paint": "_s170",
+    "PHYSICS_PT_dynamic_paint_settings": "_s170",
+    "PHYSICS_PT_field": "_s170",
+    "PHYSICS_PT_field_falloff": "_s170",
+    "PHYSICS_PT_field_falloff_angular": "_s170",
+    "PHYSICS_PT_field_falloff_radial": "_s170",
+    "PHYSICS_PT_field_settings": "_s170",
+    "PHYSICS_PT_field_settings_kink": "_s170",
+    "PHYSICS_PT_field_settings_texture_select": "_s170",
+    "PHYSICS_PT_fluid": "_s170",
+    "PHYSICS_PT_fluid_flow": "_s170",
+    "PHYSICS_PT_fluid_particle_cache": "_s170",
+    "PHYSICS_PT_fluid_settings": "_s170",
+    "PHYSICS_PT_rigid_body": "_s170",
+    "PHYSICS_PT_rigid_body_collisions": "_s170",
+    "PHYSICS_PT_rigid_body_collisions_collections": "_s170",
+    "PHYSICS_PT_rigid_body_collisions_sensitivity": "_s170",
+    "PHYSICS_PT_rigid_body_collisions_surface": "_s170",
+    "PHYSICS_PT_rigid_body_constraint": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_limits": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_limits_angular": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_limits_linear": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_motor": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_motor_angular": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_motor_linear": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_objects": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_override_iterations": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_settings": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_springs": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_springs_angular": "_s170",
+    "PHYSICS_PT_rigid_body_constraint_springs_linear": "_s170",
+    "PHYSICS_PT_rigid_body_dynamics": "_s170",
+    "PHYSICS_PT_rigid_body_dynamics_deactivation": "_s170",
+    "PHYSICS_PT_rigid_body_settings": "_s170",
+    "PHYSICS_PT_smoke": "_s170",
+    "PHYSICS_PT_smoke_adaptive_domain": "_s170",
+    "PHYSICS_PT_smoke_behavior": "_s170",
+    "PHYSICS_PT_smoke_behavior_dissolve": "_s170",
+    "PHYSICS_PT_smoke_cache": "_s170",
+    "PHYSICS_PT_smoke_collections": "_s170",
+    "PHYSICS_PT_smoke_field_weights": "_s170",
+    "PHYSICS_PT_smoke_fire": "_s170",
+    "PHYSICS_PT_smoke_flow_texture": "_s170",
+    "PHYSICS_PT_smoke_highres": "_s170",
+    "PHYSICS_PT_smoke_settings": "_s170",
+    "PHYSICS_PT_smoke_settings_initial_velocity": "_s170",
+    "PHYSICS_PT_smoke_settings_particle_size": "_s170",
+    "PHYSICS_PT_smoke_viewport_display": "_s170",
+    "PHYSICS_PT_smoke_viewport_display_color": "_s170",
+    "PHYSICS_PT_smoke_viewport_display_debug": "_s170",
+    "PHYSICS_PT_softbody": "_s170",
+    "PHYSICS_PT_softbody_cache": "_s170",
+    "PHYSICS_PT_softbody_collision": "_s170",
+    "PHYSICS_PT_softbody_edge": "_s170",
+    "PHYSICS_PT_softbody_edge_aerodynamics": "_s170",
+    "PHYSICS_PT_softbody_edge_stiffness": "_s170",
+    "PHYSICS_PT_softbody_field_weights": "_s170",
+    "PHYSICS_PT_softbody_goal": "_s170",
+    "PHYSICS_PT_softbody_goal_settings": "_s170",
+    "PHYSICS_PT_softbody_goal_strengths": "_s170",
+    "PHYSICS_PT_softbody_object": "_s170",
+    "PHYSICS_PT_softbody_simulation": "_s170",
+    "PHYSICS_PT_softbody_solver": "_s170",
+    "PHYSICS_PT_softbody_solver_diagnostics": "_s170",
+    "PHYSICS_PT_softbody_solver_helpers": "_s170",
+    "PROPERTIES_HT_header": "_s170",
+    "PROPERTIES_PT_navigation_bar": "_s170",
+    "RENDER_MT_framerate_presets": "_s170",
+    "RENDER_MT_lineset_context_menu": "_s170",
+    "RENDER_PT_color_management": "_s170",
+    "RENDER_PT_color_management_curves": "_s170",
+    "RENDER_PT_context": "_s170",
+    "RENDER_PT_dimensions": "_s170",
+    "RENDER_PT_eevee_ambient_occlusion": "_s170",
+    "RENDER_PT_eevee_bloom": "_s170",
+    "RENDER_PT_eevee_depth_of_field": "_s170",
+    "RENDER_PT_eevee_film": "_s170",
+    "RENDER_PT_eevee_film_overscan": "_s170",
+    "RENDER_PT_eevee_hair": "_s170",
+    "RENDER_PT_eevee_indirect_lighting": "_s170",
+    "RENDER_PT_eevee_indirect_lighting_display": "_s170",
+    "RENDER_PT_eevee_motion_blur": "_s170",
+    "RENDER_PT_eevee_sampling": "_s170",
+    "RENDER_PT_eevee_screen_space_reflections": "_s170",
+    "RENDER_PT_eevee_shadows": "_s170",
+    "RENDER_PT_eevee_subsurface_scattering": "_s170",
+    "RENDER_PT_eevee_volumetric": "_s170",
+    "RENDER_PT_eevee_volumetric_lighting": "_s170",
+    "RENDER_PT_eevee_volumetric_shadows": "_s170",
+    "RENDER_PT_encoding": "_s170",
+    "RENDER_PT_encoding_audio": "_s170",
+    "RENDER_PT_encoding_video": "_s170",
+    "RENDER_PT_ffmpeg_presets": "_s170",
+    "RENDER_PT_frame_remapping": "_s170",
+    "RENDER_PT_freestyle": "_s170",
+    "RENDER_PT_opengl_color": "_s170",
+    "RENDER_PT_opengl_film": "_s170",
+    "RENDER_PT_opengl_lighting": "_s170",
+    "RENDER_PT_opengl_options": "_s170",
+    "RENDER_PT_opengl_sampling": "_s171",
+    "RENDER_PT_output": "_s171",
+    "RENDER_PT_output_views": "_s171",
+    "RENDER_PT_post_processing": "_s171",
+    "RENDER_PT_presets": "_s171",
+    "RENDER_PT_simplify": "_s171",
+    "RENDER_PT_simplify_greasepencil": "_s171",
+    "RENDER_PT_simplify_render": "_s171",
+    "RENDER_PT_simplify_viewport": "_s171",
+    "RENDER_PT_stamp": "_s171",
+    "RENDER_PT_stamp_burn": "_s171",
+    "RENDER_PT_stamp_note": "_s171",
+    "RENDER_PT_stereoscopy": "_s171",
+    "RENDER_UL_renderviews": "_s171",
+    "SAFE_AREAS_PT_presets": "_s171",
+    "SCENE_PT_audio": "_s171",
+    "SCENE_PT_custom_props": "_s171",
+    "SCENE_PT_keyframing_settings": "_s171",
+    "SCENE_PT_keying_set_paths": "_s171",
+    "SCENE_PT_keying_sets": "_s171",
+    "SCENE_PT_physics": "_s171",
+    "SCENE_PT_rigid_body_cache": "_s171",
+    "SCENE_PT_rigid_body_field_weights": "_s171",
+    "SCENE_PT_rigid_body_world": "_s171",
+    "SCENE_PT_rigid_body_world_settings": "_s171",
+    "SCENE_PT_scene": "_s171",
+    "SCENE_PT_unit": "_s171",
+    "SEQUENCER_HT_header": "_s171",
+    "SEQUENCER_MT_add": "_s171",
+    "SEQUENCER_MT_add_effect": "_s171",
+    "SEQUENCER_MT_add_empty": "_s171",
+    "SEQUENCER_MT_add_transitions": "_s171",
+    "SEQUENCER_MT_change": "_s171",
+    "SEQUENCER_MT_context_menu": "_s171",
+    "SEQUENCER_MT_editor_menus": "_s171",
+    "SEQUENCER_MT_marker": "_s171",
+    "SEQUENCER_MT_navigation": "_s171",
+    "SEQUENCER_MT_range": "_s171",
+    "SEQUENCER_MT_select": "_s171",
+    "SEQUENCER_MT_select_channel": "_s171",
+    "SEQUENCER_MT_select_handle": "_s171",
+    "SEQUENCER_MT_select_linked": "_s171",
+    "SEQUENCER_MT_select_playhead": "_s171",
+    "SEQUENCER_MT_strip": "_s171",
+    "SEQUENCER_MT_strip_effect": "_s171",
+    "SEQUENCER_MT_strip_input": "_s171",
+    "SEQUENCER_MT_strip_lock_mute": "_s171",
+    "SEQUENCER_MT_strip_movie": "_s171",
+    "SEQUENCER_MT_strip_transform": "_s171",
+    "SEQUENCER_MT_view": "_s171",
+    "SEQUENCER_MT_view_cache": "_s171",
+    "SEQUENCER_MT_view_toggle": "_s171",
+    "SEQUENCER_PT_adjust": "_s171",
+    "SEQUENCER_PT_adjust_color": "_s171",
+    "SEQUENCER_PT_adjust_comp": "_s171",
+    "SEQUENCER_PT_adjust_sound": "_s171",
+    "SEQUENCER_PT_adjust_transform": "_s171",
+    "SEQUENCER_PT_adjust_transform_crop": "_s171",
+    "SEQUENCER_PT_adjust_transform_offset": "_s171",
+    "SEQUENCER_PT_adjust_video": "_s171",
+    "SEQUENCER_PT_cache_settings": "_s171",
+    "SEQUENCER_PT_custom_props": "_s171",
+    "SEQUENCER_PT_effect": "_s171",
+    "SEQUENCER_PT_frame_overlay": "_s171",
+    "SEQUENCER_PT_grease_pencil": "_s171",
+    "SEQUENCER_PT_grease_pencil_tools": "_s171",
+    "SEQUENCER_PT_mask": "_s171",
+    "SEQUENCER_PT_modifiers": "_s171",
+    "SEQUENCER_PT_preview": "_s171",
+    "SEQUENCER_PT_proxy_settings": "_s171",
+    "SEQUENCER_PT_scene": "_s171",
+    "SEQUENCER_PT_source": "_s171",
+    "SEQUENCER_PT_strip": "_s171",
+    "SEQUENCER_PT_strip_cache": "_s171",
+    "SEQUENCER_PT_strip_proxy": "_s171",
+    "SEQUENCER_PT_time": "_s171",
+    "SEQUENCER_PT_view": "_s171",
+    "SEQUENCER_PT_view_safe_areas": "_s171",
+    "SEQUENCER_PT_view_safe_areas_center_cut": "_s171",
+    "STATUSBAR_HT_header": "_s171",
+    "TEXTURE_MT_context_menu": "_s171",
+    "TEXTURE_PT_blend": "_s171",
+    "TEXTURE_PT_clouds": "_s171",
+    "TEXTURE_PT_colors": "_s171",
+    "TEXTURE_PT_colors_ramp": "_s171",
+    "TEXTURE_PT_context": "_s171",
+    "TEXTURE_PT_custom_props": "_s171",
+    "TEXTURE_PT_distortednoise": "_s171",
+    "TEXTURE_PT_image": "_s171",
+    "TEXTURE_PT_image_alpha": "_s171",
+    "TEXTURE_PT_image_mapping": "_s171",
+    "TEXTURE_PT_image_mapping_crop": "_s171",
+    "TEXTURE_PT_image_sampling": "_s171",
+    "TEXTURE_PT_image_settings": "_s171",
+    "TEXTURE_PT_influence": "_s171",
+    "TEXTURE_PT_magic": "_s171",
+    "TEXTURE_PT_mapping": "_s171",
+    "TEXTURE_PT_marble": "_s171",
+    "TEXTURE_PT_musgrave": "_s171",
+    "TEXTURE_PT_node": "_s171",
+    "TEXTURE_PT_preview": "_s172",
+    "TEXTURE_PT_stucci": "_s172",
+    "TEXTURE_PT_voronoi": "_s172",
+    "TEXTURE_PT_voronoi_feature_weights": "_s172",
+    "TEXTURE_PT_wood": "_s172",
+    "TEXT_HT_footer": "_s172",
+    "TEXT_HT_header": "_s172",
+    "TEXT_MT_edit": "_s172",
+    "TEXT_MT_edit_select": "_s172",
+    "TEXT_MT_edit_to3d": "_s172",
+    "TEXT_MT_editor_menus": "_s172",
+    "TEXT_MT_format": "_s172",
+    "TEXT_MT_templates": "_s172",
+    "TEXT_MT_templates_osl": "_s172",
+    "TEXT_MT_templates_py": "_s172",
+    "TEXT_MT_text": "_s172",
+    "TEXT_MT_toolbox": "_s172",
+    "TEXT_MT_view": "_s172",
+    "TEXT_PT_find": "_s172",
+    "TEXT_PT_properties": "_s172",
+    "TIME_HT_editor_buttons": "_s172",
+    "TIME_MT_cache": "_s172",
+    "TIME_MT_editor_menus": "_s172",
+    "TIME_MT_marker": "_s172",
+    "TIME_MT_view": "_s172",
+    "TIME_PT_keyframing_settings": "_s172",
+    "TIME_PT_playback": "_s172",
+    "TOPBAR_HT_upper_bar": "_s172",
+    "TOPBAR_MT_app": "_s172",
+    "TOPBAR_MT_app_about": "_s172",
+    "TOPBAR_MT_app_support": "_s172",
+    "TOPBAR_MT_edit": "_s172",
+    "TOPBAR_MT_edit_armature_add": "_s172",
+    "TOPBAR_MT_edit_curve_add": "_s172",
+    "TOPBAR_MT_editor_menus": "_s172",
+    "TOPBAR_MT_file": "_s172",
+    "TOPBAR_MT_file_context_menu": "_s172",
+    "TOPBAR_MT_file_defaults": "_s172",
+    "TOPBAR_MT_file_export": "_s172",
+    "TOPBAR_MT_file_external_data": "_s172",
+    "TOPBAR_MT_file_import": "_s172",
+    "TOPBAR_MT_file_new": "_s172",
+    "TOPBAR_MT_file_previews": "_s172",
+    "TOPBAR_MT_file_recover": "_s172",
+    "TOPBAR_MT_help": "_s172",
+    "TOPBAR_MT_render": "_s172",
+    "TOPBAR_MT_templates_more": "_s172",
+    "TOPBAR_MT_window": "_s172",
+    "TOPBAR_MT_workspace_menu": "_s172",
+    "TOPBAR_PT_annotation_layers": "_s172",
+    "TOPBAR_PT_gpencil_fill": "_s172",
+    "TOPBAR_PT_gpencil_layers": "_s172",
+    "TOPBAR_PT_gpencil_materials": "_s172",
+    "TOPBAR_PT_gpencil_primitive": "_s172",
+    "TOPBAR_PT_name": "_s172",
+    "USERPREF_HT_header": "_s172",
+    "USERPREF_MT_interface_theme_presets": "_s172",
+    "USERPREF_MT_keyconfigs": "_s172",
+    "USERPREF_MT_ndof_settings": "_s172",
+    "USERPREF_MT_save_load": "_s172",
+    "USERPREF_PT_addons": "_s172",
+    "USERPREF_PT_animation_autokey": "_s172",
+    "USERPREF_PT_animation_fcurves": "_s172",
+    "USERPREF_PT_animation_keyframes": "_s172",
+    "USERPREF_PT_animation_timeline": "_s172",
+    "USERPREF_PT_edit_annotations": "_s172",
+    "USERPREF_PT_edit_cursor": "_s172",
+    "USERPREF_PT_edit_gpencil": "_s172",
+    "USERPREF_PT_edit_misc": "_s172",
+    "USERPREF_PT_edit_objects": "_s172",
+    "USERPREF_PT_edit_objects_duplicate_data": "_s172",
+    "USERPREF_PT_edit_objects_new": "_s172",
+    "USERPREF_PT_edit_weight_paint": "_s172",
+    "USERPREF_PT_file_paths_applications": "_s172",
+    "USERPREF_PT_file_paths_data": "_s172",
+    "USERPREF_PT_file_paths_development": "_s172",
+    "USERPREF_PT_file_paths_render": "_s172",
+    "USERPREF_PT_input_keyboard": "_s172",
+    "USERPREF_PT_input_mouse": "_s172",
+    "USERPREF_PT_input_ndof": "_s172",
+    "USERPREF_PT_input_tablet": "_s172",
+    "USERPREF_PT_interface_display": "_s172",
+    "USERPREF_PT_interface_editors": "_s172",
+    "USERPREF_PT_interface_menus": "_s172",
+    "USERPREF_PT_interface_menus_mouse_over": "_s172",
+    "USERPREF_PT_interface_menus_pie": "_s172",
+    "USERPREF_PT_interface_text": "_s172",
+    "USERPREF_PT_interface_translation": "_s172",
+    "USERPREF_PT_keymap": "_s172",
+    "USERPREF_PT_navigation_bar": "_s172",
+    "USERPREF_PT_navigation_fly_walk": "_s172",
+    "USERPREF_PT_navigation_fly_walk_gravity": "_s172",
+    "USERPREF_PT_navigation_fly_walk_navigation": "_s172",
+    "USERPREF_PT_navigation_orbit": "_s172",
+    "USERPREF_PT_navigation_zoom": "_s172",
+    "USERPREF_PT_save_preferences": "_s172",
+    "USERPREF_PT_saveload_autorun": "_s172",
+    "USERPREF_PT_saveload_blend": "_s172",
+    "USERPREF_PT_saveload_blend_autosave": "_s172",
+    "USERPREF_PT_saveload_file_browser": "_s172",
+    "USERPREF_PT_studiolight_light_editor": "_s173",
+    "USERPREF_PT_studiolight_lights": "_s173",
+    "USERPREF_PT_studiolight_matcaps": "_s173",
+    "USERPREF_PT_studiolight_world": "_s173",
+    "USERPREF_PT_system_cycles_devices": "_s173",
+    "USERPREF_PT_system_memory": "_s173",
+    "USERPREF_PT_system_sound": "_s173",
+    "USERPREF_PT_theme": "_s173",
+    "USERPREF_PT_theme_bone_color_sets": "_s173",
+    "USERPREF_PT_theme_interface_gizmos": "_s173",
+    "USERPREF_PT_theme_interface_icons": "_s173",
+    "USERPREF_PT_theme_interface_state": "_s173",
+    "USERPREF_PT_theme_interface_styles": "_s173",
+    "USERPREF_PT_theme_text_style": "_s173",
+    "USERPREF_PT_theme_user_interface": "_s173",
+    "USERPREF_PT_viewport_display": "_s173",
+    "USERPREF_PT_viewport_quality": "_s173",
+    "USERPREF_PT_viewport_selection": "_s173",
+    "USERPREF_PT_viewport_textures": "_s173",
+    "VIEW3D_HT_header": "_s173",
+    "VIEW3D_HT_tool_header": "_s173",
+    "VIEW3D_MT_add": "_s173",
+    "VIEW3D_MT_angle_control": "_s173",
+    "VIEW3D_MT_armature_add": "_s173",
+    "VIEW3D_MT_armature_context_menu": "_s173",
+    "VIEW3D_MT_assign_material": "_s173",
+    "VIEW3D_MT_bone_options_disable": "_s173",
+    "VIEW3D_MT_bone_options_enable": "_s173",
+    "VIEW3D_MT_bone_options_toggle": "_s173",
+    "VIEW3D_MT_brush": "_s173",
+    "VIEW3D_MT_brush_paint_modes": "_s173",
+    "VIEW3D_MT_camera_add": "_s173",
+    "VIEW3D_MT_curve_add": "_s173",
+    "VIEW3D_MT_edit_armature": "_s173",
+    "VIEW3D_MT_edit_armature_delete": "_s173",
+    "VIEW3D_MT_edit_armature_names": "_s173",
+    "VIEW3D_MT_edit_armature_parent": "_s173",
+    "VIEW3D_MT_edit_armature_roll": "_s173",
+    "VIEW3D_MT_edit_curve": "_s173",
+    "VIEW3D_MT_edit_curve_clean": "_s173",
+    "VIEW3D_MT_edit_curve_context_menu": "_s173",
+    "VIEW3D_MT_edit_curve_ctrlpoints": "_s173",
+    "VIEW3D_MT_edit_curve_delete": "_s173",
+    "VIEW3D_MT_edit_curve_segments": "_s173",
+    "VIEW3D_MT_edit_curve_showhide": "_s173",
+    "VIEW3D_MT_edit_font": "_s173",
+    "VIEW3D_MT_edit_gpencil": "_s173",
+    "VIEW3D_MT_edit_gpencil_delete": "_s173",
+    "VIEW3D_MT_edit_gpencil_interpolate": "_s173",
+    "VIEW3D_MT_edit_gpencil_transform": "_s173",
+    "VIEW3D_MT_edit_lattice": "_s173",
+    "VIEW3D_MT_edit_lattice_context_menu": "_s173",
+    "VIEW3D_MT_edit_mesh": "_s173",
+    "VIEW3D_MT_edit_mesh_clean": "_s173",
+    "VIEW3D_MT_edit_mesh_context_menu": "_s173",
+    "VIEW3D_MT_edit_mesh_delete": "_s173",
+    "VIEW3D_MT_edit_mesh_edges": "_s173",
+    "VIEW3D_MT_edit_mesh_edges_data": "_s173",
+    "VIEW3D_MT_edit_mesh_extrude": "_s173",
+    "VIEW3D_MT_edit_mesh_faces": "_s173",
+    "VIEW3D_MT_edit_mesh_faces_data": "_s173",
+    "VIEW3D_MT_edit_mesh_merge": "_s173",
+    "VIEW3D_MT_edit_mesh_normals": "_s173",
+    "VIEW3D_MT_edit_mesh_normals_average": "_s173",
+    "VIEW3D_MT_edit_mesh_normals_select_strength": "_s173",
+    "VIEW3D_MT_edit_mesh_normals_set_strength": "_s173",
+    "VIEW3D_MT_edit_mesh_select_by_trait": "_s173",
+    "VIEW3D_MT_edit_mesh_select_linked": "_s173",
+    "VIEW3D_MT_edit_mesh_select_loops": "_s173",
+    "VIEW3D_MT_edit_mesh_select_mode": "_s173",
+    "VIEW3D_MT_edit_mesh_select_more_less": "_s173",
+    "VIEW3D_MT_edit_mesh_select_similar": "_s173",
+    "VIEW3D_MT_edit_mesh_shading": "_s173",
+    "VIEW3D_MT_edit_mesh_showhide": "_s173",
+    "VIEW3D_MT_edit_mesh_vertices": "_s173",
+    "VIEW3D_MT_edit_mesh_weights": "_s173",
+    "VIEW3D_MT_edit_meta": "_s173",
+    "VIEW3D_MT_edit_meta_showhide": "_s173",
+    "VIEW3D_MT_edit_metaball_context_menu": "_s173",
+    "VIEW3D_MT_edit_surface": "_s173",
+    "VIEW3D_MT_edit_text_chars": "_s173",
+    "VIEW3D_MT_edit_text_context_menu": "_s173",
+    "VIEW3D_MT_editor_menus": "_s173",
+    "VIEW3D_MT_gpencil_animation": "_s173",
+    "VIEW3D_MT_gpencil_autoweights": "_s173",
+    "VIEW3D_MT_gpencil_copy_layer": "_s173",
+    "VIEW3D_MT_gpencil_edit_context_menu": "_s173",
+    "VIEW3D_MT_gpencil_simplify": "_s173",
+    "VIEW3D_MT_hide_mask": "_s173",
+    "VIEW3D_MT_hook": "_s173",
+    "VIEW3D_MT_image_add": "_s173",
+    "VIEW3D_MT_light_add": "_s173",
+    "VIEW3D_MT_lightprobe_add": "_s173",
+    "VIEW3D_MT_make_links": "_s173",
+    "VIEW3D_MT_make_single_user": "_s173",
+    "VIEW3D_MT_mesh_add": "_s173",
+    "VIEW3D_MT_metaball_add": "_s173",
+    "VIEW3D_MT_mirror": "_s173",
+    "VIEW3D_MT_object": "_s173",
+    "VIEW3D_MT_object_animation": "_s173",
+    "VIEW3D_MT_object_apply": "_s174",
+    "VIEW3D_MT_object_clear": "_s174",
+    "VIEW3D_MT_object_collection": "_s174",
+    "VIEW3D_MT_object_constraints": "_s174",
+    "VIEW3D_MT_object_context_menu": "_s174",
+    "VIEW3D_MT_object_mode_pie": "_s174",
+    "VIEW3D_MT_object_parent": "_s174",
+    "VIEW3D_MT_object_quick_effects": "_s174",
+    "VIEW3D_MT_object_relations": "_s174",
+    "VIEW3D_MT_object_rigid_body": "_s174",
+    "VIEW3D_MT_object_shading": "_s174",
+    "VIEW3D_MT_object_showhide": "_s174",
+    "VIEW3D_MT_object_track": "_s174",
+    "VIEW3D_MT_orientations_pie": "_s174",
+    "VIEW3D_MT_paint_gpencil": "_s174",
+    "VIEW3D_MT_paint_vertex": "_s174",
+    "VIEW3D_MT_paint_weight": "_s174",
+    "VIEW3D_MT_particle": "_s174",
+    "VIEW3D_MT_particle_context_menu": "_s174",
+    "VIEW3D_MT_particle_showhide": "_s174",
+    "VIEW3D_MT_pivot_pie": "_s174",
+    "VIEW3D_MT_pose": "_s174",
+    "VIEW3D_MT_pose_apply": "_s174",
+    "VIEW3D_MT_pose_constraints": "_s174",
+    "VIEW3D_MT_pose_context_menu": "_s174",
+    "VIEW3D_MT_pose_group": "_s174",
+    "VIEW3D_MT_pose_ik": "_s174",
+    "VIEW3D_MT_pose_library": "_s174",
+    "VIEW3D_MT_pose_motion": "_s174",
+    "VIEW3D_MT_pose_propagate": "_s174",
+    "VIEW3D_MT_pose_showhide": "_s174",
+    "VIEW3D_MT_pose_slide": "_s174",
+    "VIEW3D_MT_pose_transform": "_s174",
+    "VIEW3D_MT_proportional_editing_falloff_pie": "_s174",
+    "VIEW3D_MT_sculpt": "_s174",
+    "VIEW3D_MT_select_edit_armature": "_s174",
+    "VIEW3D_MT_select_edit_curve": "_s174",
+    "VIEW3D_MT_select_edit_lattice": "_s174",
+    "VIEW3D_MT_select_edit_mesh": "_s174",
+    "VIEW3D_MT_select_edit_metaball": "_s174",
+    "VIEW3D_MT_select_edit_surface": "_s174",
+    "VIEW3D_MT_select_edit_text": "_s174",
+    "VIEW3D_MT_select_gpencil": "_s174",
+    "VIEW3D_MT_select_object": "_s174",
+    "VIEW3D_MT_select_object_more_less": "_s174",
+    "VIEW3D_MT_select_paint_mask": "_s174",
+    "VIEW3D_MT_select_paint_mask_vertex": "_s174",
+    "VIEW3D_MT_select_particle": "_s174",
+    "VIEW3D_MT_select_pose": "_s174",
+    "VIEW3D_MT_select_pose_more_less": "_s174",
+    "VIEW3D_MT_shading_ex_pie": "_s174",
+    "VIEW3D_MT_shading_pie": "_s174",
+    "VIEW3D_MT_snap": "_s174",
+    "VIEW3D_MT_snap_pie": "_s174",
+    "VIEW3D_MT_surface_add": "_s174",
+    "VIEW3D_MT_tools_projectpaint_clone": "_s174",
+    "VIEW3D_MT_tools_projectpaint_stencil": "_s174",
+    "VIEW3D_MT_tools_projectpaint_uvlayer": "_s174",
+    "VIEW3D_MT_transform_base": "_s174",
+    "VIEW3D_MT_transform_gizmo_pie": "_s174",
+    "VIEW3D_MT_uv_map": "_s174",
+    "VIEW3D_MT_vertex_group": "_s174",
+    "VIEW3D_MT_view": "_s174",
+    "VIEW3D_MT_view_align": "_s174",
+    "VIEW3D_MT_view_align_selected": "_s174",
+    "VIEW3D_MT_view_cameras": "_s174",
+    "VIEW3D_MT_view_local": "_s174",
+    "VIEW3D_MT_view_navigation": "_s174",
+    "VIEW3D_MT_view_pie": "_s174",
+    "VIEW3D_MT_view_regions": "_s174",
+    "VIEW3D_MT_view_viewpoint": "_s174",
+    "VIEW3D_MT_weight_gpencil": "_s174",
+    "VIEW3D_PT_active_tool": "_s174",
+    "VIEW3D_PT_active_tool_duplicate": "_s174",
+    "VIEW3D_PT_annotation_onion": "_s174",
+    "VIEW3D_PT_collections": "_s174",
+    "VIEW3D_PT_context_properties": "_s174",
+    "VIEW3D_PT_gizmo_display": "_s174",
+    "VIEW3D_PT_gpencil_brush_presets": "_s174",
+    "VIEW3D_PT_gpencil_draw_context_menu": "_s174",
+    "VIEW3D_PT_gpencil_guide": "_s174",
+    "VIEW3D_PT_gpencil_lock": "_s174",
+    "VIEW3D_PT_gpencil_multi_frame": "_s174",
+    "VIEW3D_PT_gpencil_origin": "_s174",
+    "VIEW3D_PT_gpencil_sculpt_context_menu": "_s174",
+    "VIEW3D_PT_grease_pencil": "_s174",
+    "VIEW3D_PT_object_type_visibility": "_s174",
+    "VIEW3D_PT_overlay": "_s174",
+    "VIEW3D_PT_overlay_edit_curve": "_s174",
+    "VIEW3D_PT_overlay_edit_mesh": "_s174",
+    "VIEW3D_PT_overlay_edit_mesh_freestyle": "_s174",
+    "VIEW3D_PT_overlay_edit_mesh_measurement": "_s174",
+    "VIEW3D_PT_overlay_edit_mesh_normals": "_s174",
+    "VIEW3D_PT_overlay_edit_mesh_shading": "_s174",
+    "VIEW3D_PT_overlay_geometry": "_s174",
+    "VIEW3D_PT_overlay_gpencil_options": "_s174",
+    "VIEW3D_PT_overlay_guides": "_s174",
+    "VIEW3D_PT_overlay_motion_tracking": "_s174",
+    "VIEW3D_PT_overlay_object": "_s174",
+    "VIEW3D_PT_overlay_paint": "_s174",
+    "VIEW3D_PT_overlay_pose": "_s175",
+    "VIEW3D_PT_overlay_sculpt": "_s175",
+    "VIEW3D_PT_paint_texture_context_menu": "_s175",
+    "VIEW3D_PT_paint_vertex_context_menu": "_s175",
+    "VIEW3D_PT_paint_weight_context_menu": "_s175",
+    "VIEW3D_PT_pivot_point": "_s175",
+    "VIEW3D_PT_proportional_edit": "_s175",
+    "VIEW3D_PT_quad_view": "_s175",
+    "VIEW3D_PT_sculpt_context_menu": "_s175",
+    "VIEW3D_PT_sculpt_dyntopo": "_s175",
+    "VIEW3D_PT_sculpt_dyntopo_remesh": "_s175",
+    "VIEW3D_PT_sculpt_options": "_s175",
+    "VIEW3D_PT_sculpt_options_gravity": "_s175",
+    "VIEW3D_PT_sculpt_options_unified": "_s175",
+    "VIEW3D_PT_sculpt_symmetry": "_s175",
+    "VIEW3D_PT_sculpt_symmetry_for_topbar": "_s175",
+    "VIEW3D_PT_shading": "_s175",
+    "VIEW3D_PT_shading_color": "_s175",
+    "VIEW3D_PT_shading_lighting": "_s175",
+    "VIEW3D_PT_shading_options": "_s175",
+    "VIEW3D_PT_shading_options_shadow": "_s175",
+    "VIEW3D_PT_shading_options_ssao": "_s175",
+    "VIEW3D_PT_slots_projectpaint": "_s175",
+    "VIEW3D_PT_snapping": "_s175",
+    "VIEW3D_PT_stencil_projectpaint": "_s175",
+    "VIEW3D_PT_tools_active": "_s175",
+    "VIEW3D_PT_tools_armatureedit_options": "_s175",
+    "VIEW3D_PT_tools_brush": "_s175",
+    "VIEW3D_PT_tools_brush_clone": "_s175",
+    "VIEW3D_PT_tools_brush_color": "_s175",
+    "VIEW3D_PT_tools_brush_display": "_s175",
+    "VIEW3D_PT_tools_brush_display_custom_icon": "_s175",
+    "VIEW3D_PT_tools_brush_display_show_brush": "_s175",
+    "VIEW3D_PT_tools_brush_falloff": "_s175",
+    "VIEW3D_PT_tools_brush_falloff_frontface": "_s175",
+    "VIEW3D_PT_tools_brush_falloff_normal": "_s175",
+    "VIEW3D_PT_tools_brush_gradient": "_s175",
+    "VIEW3D_PT_tools_brush_options": "_s175",
+    "VIEW3D_PT_tools_brush_stroke": "_s175",
+    "VIEW3D_PT_tools_brush_stroke_smooth_stroke": "_s175",
+    "VIEW3D_PT_tools_brush_swatches": "_s175",
+    "VIEW3D_PT_tools_brush_texture": "_s175",
+    "VIEW3D_PT_tools_curveedit_options_stroke": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brush": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brush_option": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brush_random": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brush_settings": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brush_stabilizer": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brushcurves": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brushcurves_jitter": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brushcurves_sensitivity": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_brushcurves_strength": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_interpolate": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_paint_appearance": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_sculpt": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_sculpt_appearance": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_sculpt_options": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_weight_appearance": "_s175",
+    "VIEW3D_PT_tools_grease_pencil_weight_paint": "_s175",
+    "VIEW3D_PT_tools_imagepaint_options": "_s175",
+    "VIEW3D_PT_tools_imagepaint_options_cavity": "_s175",
+    "VIEW3D_PT_tools_imagepaint_options_external": "_s175",
+    "VIEW3D_PT_tools_imagepaint_options_unified": "_s175",
+    "VIEW3D_PT_tools_imagepaint_symmetry": "_s175",
+    "VIEW3D_PT_tools_mask_texture": "_s175",
+    "VIEW3D_PT_tools_meshedit_options": "_s175",
+    "VIEW3D_PT_tools_meshedit_options_automerge": "_s175",
+    "VIEW3D_PT_tools_particlemode": "_s175",
+    "VIEW3D_PT_tools_particlemode_options": "_s175",
+    "VIEW3D_PT_tools_particlemode_options_display": "_s175",
+    "VIEW3D_PT_tools_particlemode_options_shapecut": "_s175",
+    "VIEW3D_PT_tools_posemode_options": "_s175",
+    "VIEW3D_PT_tools_vertexpaint_options": "_s175",
+    "VIEW3D_PT_tools_vertexpaint_symmetry": "_s175",
+    "VIEW3D_PT_tools_vertexpaint_symmetry_for_topbar": "_s175",
+    "VIEW3D_PT_tools_weightpaint_options": "_s175",
+    "VIEW3D_PT_tools_weightpaint_options_unified": "_s175",
+    "VIEW3D_PT_tools_weightpaint_symmetry": "_s175",
+    "VIEW3D_PT_tools_weightpaint_symmetry_for_topbar": "_s175",
+    "VIEW3D_PT_transform_orientations": "_s175",
+    "VIEW3D_PT_view3d_cursor": "_s175",
+    "VIEW3D_PT_view3d_lock": "_s175",
+    "VIEW3D_PT_view3d_properties": "_s175",
+    "VIEW3D_PT_view3d_stereo": "_s175",
+    "VIEWLAYER_PT_eevee_layer_passes": "_s175",
+    "VIEWLAYER_PT_freestyle": "_s175",
+    "VIEWLAYER_PT_freestyle_lineset": "_s175",
+    "VIEWLAYER_PT_freestyle_linestyle": "_s175",
+    "VIEWLAYER_PT_layer": "_s175",
+    "VIEWLAYER_UL_linesets": "_s175",
+    "WM_MT_toolsystem_submenu": "_s175",
+    "WORKSPACE_PT_addons": "_s175",
+    "WORKSPACE_PT_custom_props": "_s175",
+    "WORKSPACE_PT_main": "_s175",
+    "WORLD_PT_context_world": "_s175",
+    "WORLD_PT_custom_props": "_s175",
+    "WORLD_PT_viewport_display": "_s175",
+}
+'''Shard module defining each class '''
+
+
+def __getattr__(name):
+    '''Import the shard defining a class on first access and bind all of its classes on the package
+
+    '''
+
+    shard = _SHARDS.get(name)
+
+    if shard is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    module = _import_module("." + shard, __name__)
+    namespace = globals()
+
+    for key, value in vars(module).items():
+        if _SHARDS.get(key) == shard:
+            value.__module__ = __name__
+            namespace[key] = value
+
+    return namespace[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SHARDS))
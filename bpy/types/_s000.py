@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Action:
+    '''A collection of F-Curves for animation '''
+
+    fcurves: typing.List['FCurve'] = None
+    '''The individual F-Curves that make up the action 
+
+    :type: typing.List['FCurve']
+    '''
+
+    frame_range: float = None
+    '''The final frame range of all F-Curves within this action 
+
+    :type: float
+    '''
+
+    groups: typing.List['ActionGroup'] = None
+    '''Convenient groupings of F-Curves 
+
+    :type: typing.List['ActionGroup']
+    '''
+
+    id_root: typing.Union[int, str] = None
+    '''Type of ID block that action can be used on - DO NOT CHANGE UNLESS YOU KNOW WHAT YOU ARE DOING 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pose_markers: typing.List['ActionPoseMarkers'] = None
+    '''Markers specific to this action, for labeling poses 
+
+    :type: typing.List['ActionPoseMarkers']
+    '''
+
+
+class ActionActuator:
+    '''Actuator to control the object movement '''
+
+    action: 'Action' = None
+    '''
+
+    :type: 'Action'
+    '''
+
+    apply_to_children: bool = None
+    '''Update Action on all children Objects as well 
+
+    :type: bool
+    '''
+
+    blend_mode: typing.Union[int, str] = None
+    '''How this layer is blended with previous layers 
+
+    :type: typing.Union[int, str]
+    '''
+
+    frame_blend_in: int = None
+    '''Number of frames of motion blending 
+
+    :type: int
+    '''
+
+    frame_end: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_property: str = None
+    '''Assign the action’s current frame number to this property 
+
+    :type: str
+    '''
+
+    frame_start: float = None
+    '''
+
+    :type: float
+    '''
+
+    layer: int = None
+    '''The animation layer to play the action on 
+
+    :type: int
+    '''
+
+    layer_weight: float = None
+    '''How much of the previous layer to blend into this one 
+
+    :type: float
+    '''
+
+    play_mode: typing.Union[int, str] = None
+    '''Action playback type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    priority: int = None
+    '''Execution priority - lower numbers will override actions with higher numbers (with 2 or more actions at once, the overriding channels must be lower in the stack) 
+
+    :type: int
+    '''
+
+    property: str = None
+    '''Use this property to define the Action position 
+
+    :type: str
+    '''
+
+    use_additive: bool = None
+    '''Action is added to the current loc/rot/scale in global or local coordinate according to Local flag 
+
+    :type: bool
+    '''
+
+    use_continue_last_frame: bool = None
+    '''Restore last frame when switching on/off, otherwise play from the start each time 
+
+    :type: bool
+    '''
+
+    use_force: bool = None
+    '''Apply Action as a global or local force depending on the local option (dynamic objects only) 
+
+    :type: bool
+    '''
+
+    use_local: bool = None
+    '''Let the Action act in local coordinates, used in Force and Add mode 
+
+    :type: bool
+    '''
+
+
+class ActionConstraint:
+    '''Map an action to the transform axes of a bone '''
+
+    action: 'Action' = None
+    '''The constraining action 
+
+    :type: 'Action'
+    '''
+
+    frame_end: int = None
+    '''Last frame of the Action to use 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''First frame of the Action to use 
+
+    :type: int
+    '''
+
+    max: float = None
+    '''Maximum value for target channel range 
+
+    :type: float
+    '''
+
+    min: float = None
+    '''Minimum value for target channel range 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    transform_channel: typing.Union[int, str] = None
+    '''Transformation channel from the target that is used to key the Action 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_bone_object_action: bool = None
+    '''Bones only: apply the object’s transformation channels of the action to the constrained bone, instead of bone’s channels 
+
+    :type: bool
+    '''
+
+
+class ActionFCurves:
+    '''Collection of action F-Curves '''
+
+    def new(self, data_path: str, index: int = 0,
+            action_group: str = "") -> 'FCurve':
+        '''Add an F-Curve to the action 
+
+        :param data_path: Data Path, F-Curve data path to use 
+        :type data_path: str
+        :param index: Index, Array index 
+        :type index: int
+        :param action_group: Action Group, Acton group to add this F-Curve into 
+        :type action_group: str
+        :rtype: 'FCurve'
+        :return:  Newly created F-Curve 
+        '''
+        pass
+
+    def find(self, data_path: str, index: int = 0) -> 'FCurve':
+        '''Find an F-Curve. Note that this function performs a linear scan of all F-Curves in the action. 
+
+        :param data_path: Data Path, F-Curve data path 
+        :type data_path: str
+        :param index: Index, Array index 
+        :type index: int
+        :rtype: 'FCurve'
+        :return:  The found F-Curve, or None if it doesn’t exist 
+        '''
+        pass
+
+    def remove(self, fcurve: 'FCurve'):
+        '''Remove action group 
+
+        :param fcurve: F-Curve to remove 
+        :type fcurve: 'FCurve'
+        '''
+        pass
+
+
+class ActionGroup:
+    '''Groups of F-Curves '''
+
+    channels: typing.List['FCurve'] = None
+    '''F-Curves in this group 
+
+    :type: typing.List['FCurve']
+    '''
+
+    color_set: typing.Union[int, str] = None
+    '''Custom color set to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    colors: 'ThemeBoneColorSet' = None
+    '''Copy of the colors associated with the group’s color set 
+
+    :type: 'ThemeBoneColorSet'
+    '''
+
+    is_custom_color_set: bool = None
+    '''Color set is user-defined instead of a fixed theme color set 
+
+    :type: bool
+    '''
+
+    lock: bool = None
+    '''Action group is locked 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''Action group is selected 
+
+    :type: bool
+    '''
+
+    show_expanded: bool = None
+    '''Action group is expanded 
+
+    :type: bool
+    '''
+
+
+class ActionGroups:
+    '''Collection of action groups '''
+
+    def new(self, name: str) -> 'ActionGroup':
+        '''Create a new action group and add it to the action 
+
+        :param name: New name for the action group 
+        :type name: str
+        :rtype: 'ActionGroup'
+        :return:  Newly created action group 
+        '''
+        pass
+
+    def remove(self, action_group: 'ActionGroup'):
+        '''Remove action group 
+
+        :param action_group: Action group to remove 
+        :type action_group: 'ActionGroup'
+        '''
+        pass
+
+
+class ActionPoseMarkers:
+    '''Collection of timeline markers '''
+
+    active: 'TimelineMarker' = None
+    '''Active pose marker for this action 
+
+    :type: 'TimelineMarker'
+    '''
+
+    active_index: int = None
+    '''Index of active pose marker 
+
+    :type: int
+    '''
+
+    def new(self, name: str) -> 'TimelineMarker':
+        '''Add a pose marker to the action 
+
+        :param name: New name for the marker (not unique) 
+        :type name: str
+        :rtype: 'TimelineMarker'
+        :return:  Newly created marker 
+        '''
+        pass
+
+    def remove(self, marker: 'TimelineMarker'):
+        '''Remove a timeline marker 
+
+        :param marker: Timeline marker to remove 
+        :type marker: 'TimelineMarker'
+        '''
+        pass
+
+
+class Actuator:
+    '''Actuator to apply actions in the game engine '''
+
+    active: bool = None
+    '''Set the active state of the actuator 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    pin: bool = None
+    '''Display when not linked to a visible states controller 
+
+    :type: bool
+    '''
+
+    show_expanded: bool = None
+    '''Set actuator expanded in the user interface 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def link(self, controller: 'Controller'):
+        '''Link the actuator to a controller 
+
+        :param controller: Controller to link to 
+        :type controller: 'Controller'
+        '''
+        pass
+
+    def unlink(self, controller: 'Controller'):
+        '''Unlink the actuator from a controller 
+
+        :param controller: Controller to unlink from 
+        :type controller: 'Controller'
+        '''
+        pass
+
+
+class ActuatorSensor:
+    '''Sensor to detect state modifications of actuators '''
+
+    actuator: str = None
+    '''Actuator name, actuator active state modifications will be detected 
+
+    :type: str
+    '''
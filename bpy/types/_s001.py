@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class AddSequence:
+    '''Add Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class Addon:
+    '''Python add-ons to be loaded automatically '''
+
+    module: str = None
+    '''Module name 
+
+    :type: str
+    '''
+
+    preferences: 'AddonPreferences' = None
+    '''
+
+    :type: 'AddonPreferences'
+    '''
+
+
+class AddonPreferences:
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class Addons:
+    '''Collection of add-ons '''
+
+    pass
+
+
+class AdjustmentSequence:
+    '''Sequence strip to perform filter adjustments to layers below '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class AlembicObjectPath:
+    '''Path of an object inside of an Alembic archive '''
+
+    path: str = None
+    '''Object path 
+
+    :type: str
+    '''
+
+
+class AlembicObjectPaths:
+    '''Collection of object paths '''
+
+    pass
+
+
+class AlphaOverSequence:
+    '''Alpha Over Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class AlphaUnderSequence:
+    '''Alpha Under Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class AlwaysSensor:
+    '''Sensor to generate continuous pulses '''
+
+    pass
+
+
+class AndController:
+    '''Controller passing on events based on a logical AND operation '''
+
+    pass
+
+
+class AnimData:
+    '''Animation data for data-block '''
+
+    action: 'Action' = None
+    '''Active Action for this data-block 
+
+    :type: 'Action'
+    '''
+
+    action_blend_type: typing.Union[int, str] = None
+    '''Method used for combining Active Action’s result with result of NLA stack 
+
+    :type: typing.Union[int, str]
+    '''
+
+    action_extrapolation: typing.Union[int, str] = None
+    '''Action to take for gaps past the Active Action’s range (when evaluating with NLA) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    action_influence: float = None
+    '''Amount the Active Action contributes to the result of the NLA stack 
+
+    :type: float
+    '''
+
+    drivers: typing.List['FCurve'] = None
+    '''The Drivers/Expressions for this data-block 
+
+    :type: typing.List['FCurve']
+    '''
+
+    nla_tracks: typing.List['NlaTrack'] = None
+    '''NLA Tracks (i.e. Animation Layers) 
+
+    :type: typing.List['NlaTrack']
+    '''
+
+    use_nla: bool = None
+    '''NLA stack is evaluated when evaluating this block 
+
+    :type: bool
+    '''
+
+    use_tweak_mode: bool = None
+    '''Whether to enable or disable tweak mode in NLA 
+
+    :type: bool
+    '''
+
+
+class AnimDataDrivers:
+    '''Collection of Driver F-Curves '''
+
+    def from_existing(self, src_driver: 'FCurve' = None) -> 'FCurve':
+        '''Add a new driver given an existing one 
+
+        :param src_driver: Existing Driver F-Curve to use as template for a new one 
+        :type src_driver: 'FCurve'
+        :rtype: 'FCurve'
+        :return:  New Driver F-Curve 
+        '''
+        pass
+
+    def find(self, data_path: str, index: int = 0) -> 'FCurve':
+        '''Find a driver F-Curve. Note that this function performs a linear scan of all driver F-Curves. 
+
+        :param data_path: Data Path, F-Curve data path 
+        :type data_path: str
+        :param index: Index, Array index 
+        :type index: int
+        :rtype: 'FCurve'
+        :return:  The found F-Curve, or None if it doesn’t exist 
+        '''
+        pass
+
+
+class AnimViz:
+    '''Settings for the visualization of motion '''
+
+    motion_path: 'AnimVizMotionPaths' = None
+    '''Motion Path settings for visualization 
+
+    :type: 'AnimVizMotionPaths'
+    '''
+
+    onion_skin_frames: 'AnimVizOnionSkinning' = None
+    '''Onion Skinning (ghosting) settings for visualization 
+
+    :type: 'AnimVizOnionSkinning'
+    '''
+
+
+class AnimVizMotionPaths:
+    '''Motion Path settings for animation visualization '''
+
+    bake_location: typing.Union[int, str] = None
+    '''When calculating Bone Paths, use Head or Tips 
+
+    :type: typing.Union[int, str]
+    '''
+
+    frame_after: int = None
+    '''Number of frames to show after the current frame (only for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_before: int = None
+    '''Number of frames to show before the current frame (only for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_end: int = None
+    '''End frame of range of paths to display/calculate (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Starting frame of range of paths to display/calculate (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_step: int = None
+    '''Number of frames between paths shown (not for ‘On Keyframes’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    show_frame_numbers: bool = None
+    '''Show frame numbers on Motion Paths 
+
+    :type: bool
+    '''
+
+    show_keyframe_action_all: bool = None
+    '''For bone motion paths, search whole Action for keyframes instead of in group with matching name only (is slower) 
+
+    :type: bool
+    '''
+
+    show_keyframe_highlight: bool = None
+    '''Emphasize position of keyframes on Motion Paths 
+
+    :type: bool
+    '''
+
+    show_keyframe_numbers: bool = None
+    '''Show frame numbers of Keyframes on Motion Paths 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of range to show for Motion Paths 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class AnimVizOnionSkinning:
+    '''Onion Skinning settings for animation visualization '''
+
+    frame_after: int = None
+    '''Number of frames to show after the current frame (only for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_before: int = None
+    '''Number of frames to show before the current frame (only for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_end: int = None
+    '''End frame of range of Ghosts to display (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Starting frame of range of Ghosts to display (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    frame_step: int = None
+    '''Number of frames between ghosts shown (not for ‘On Keyframes’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    show_only_selected: bool = None
+    '''For Pose-Mode drawing, only draw ghosts for selected bones 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Method used for determining what ghosts get drawn 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class AnyType:
+    '''RNA type used for pointers to any possible data '''
+
+    pass
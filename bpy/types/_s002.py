@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Area:
+    '''Area in a subdivided screen, containing an editor '''
+
+    height: int = None
+    '''Area height 
+
+    :type: int
+    '''
+
+    regions: typing.List['Region'] = None
+    '''Regions this area is subdivided in 
+
+    :type: typing.List['Region']
+    '''
+
+    show_menus: bool = None
+    '''Show menus in the header 
+
+    :type: bool
+    '''
+
+    spaces: typing.List['Space'] = None
+    '''Spaces contained in this area, the first being the active space (NOTE: Useful for example to restore a previously used 3D view space in a certain area to get the old view orientation) 
+
+    :type: typing.List['Space']
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Current editor type for this area 
+
+    :type: typing.Union[int, str]
+    '''
+
+    width: int = None
+    '''Area width 
+
+    :type: int
+    '''
+
+    x: int = None
+    '''The window relative vertical location of the area 
+
+    :type: int
+    '''
+
+    y: int = None
+    '''The window relative horizontal location of the area 
+
+    :type: int
+    '''
+
+    def tag_redraw(self, ):
+        '''tag_redraw 
+
+        '''
+        pass
+
+    def header_text_set(self, text: str = ""):
+        '''Set the header text 
+
+        :param text: Text, New string for the header, no argument clears the text 
+        :type text: str
+        '''
+        pass
+
+
+class AreaLamp:
+    '''Directional area lamp '''
+
+    compression_threshold: float = None
+    '''Deep shadow map compression threshold 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''Light gamma correction value 
+
+    :type: float
+    '''
+
+    ge_shadow_buffer_type: typing.Union[int, str] = None
+    '''The shadow mapping algorithm used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_adaptive_threshold: float = None
+    '''Threshold for Adaptive Sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    shadow_buffer_bias: float = None
+    '''Shadow buffer sampling bias 
+
+    :type: float
+    '''
+
+    shadow_buffer_bleed_bias: float = None
+    '''Bias for reducing light-bleed on variance shadow maps 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_end: float = None
+    '''Shadow map clip end, beyond which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_start: float = None
+    '''Shadow map clip start, below which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_samples: int = None
+    '''Number of shadow buffer samples 
+
+    :type: int
+    '''
+
+    shadow_buffer_size: int = None
+    '''Resolution of the shadow buffer, higher values give crisper shadows but use more memory 
+
+    :type: int
+    '''
+
+    shadow_buffer_soft: float = None
+    '''Size of shadow buffer sampling area 
+
+    :type: float
+    '''
+
+    shadow_buffer_type: typing.Union[int, str] = None
+    '''Type of shadow buffer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_color: float = None
+    '''Color of shadows cast by the lamp 
+
+    :type: float
+    '''
+
+    shadow_filter_type: typing.Union[int, str] = None
+    '''Type of shadow filter (Buffer Shadows) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_sample_method: typing.Union[int, str] = None
+    '''Method for generating shadow samples: Adaptive QMC is fastest, Constant QMC is less noisy but slower 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_samples_x: int = None
+    '''Number of samples taken extra (samples x samples) 
+
+    :type: int
+    '''
+
+    shadow_ray_samples_y: int = None
+    '''Number of samples taken extra (samples x samples) 
+
+    :type: int
+    '''
+
+    shadow_sample_buffers: typing.Union[int, str] = None
+    '''Number of shadow buffers to render for better AA, this increases memory usage 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_soft_size: float = None
+    '''Light size for ray shadow sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    shape: typing.Union[int, str] = None
+    '''Shape of the area lamp 
+
+    :type: typing.Union[int, str]
+    '''
+
+    size: float = None
+    '''Size of the area of the area Lamp, X direction size for Rectangle shapes 
+
+    :type: float
+    '''
+
+    size_y: float = None
+    '''Size of the area of the area Lamp in the Y direction for Rectangle shapes 
+
+    :type: float
+    '''
+
+    use_auto_clip_end: bool = None
+    '''Automatic calculation of clipping-end, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_auto_clip_start: bool = None
+    '''Automatic calculation of clipping-start, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_dither: bool = None
+    '''Use 2x2 dithering for sampling (Constant Jittered sampling) 
+
+    :type: bool
+    '''
+
+    use_jitter: bool = None
+    '''Use noise for sampling (Constant Jittered sampling) 
+
+    :type: bool
+    '''
+
+    use_only_shadow: bool = None
+    '''Cast shadows only, without illuminating objects 
+
+    :type: bool
+    '''
+
+    use_shadow: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_shadow_layer: bool = None
+    '''Objects on the same layers only cast shadows 
+
+    :type: bool
+    '''
+
+    use_umbra: bool = None
+    '''Emphasize parts that are fully shadowed (Constant Jittered sampling) 
+
+    :type: bool
+    '''
+
+
+class AreaSpaces:
+    '''Collection of spaces '''
+
+    active: 'Space' = None
+    '''Space currently being displayed in this area 
+
+    :type: 'Space'
+    '''
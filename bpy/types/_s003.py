@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Armature:
+    '''Armature data-block containing a hierarchy of bones, usually used for rigging characters '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    bones: typing.List['Bone'] = None
+    '''
+
+    :type: typing.List['Bone']
+    '''
+
+    deform_method: typing.Union[int, str] = None
+    '''Vertex Deformer Method (Game Engine only) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    draw_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    edit_bones: typing.List['ArmatureEditBones'] = None
+    '''
+
+    :type: typing.List['ArmatureEditBones']
+    '''
+
+    ghost_frame_end: int = None
+    '''End frame of range of Ghosts to display (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    ghost_frame_start: int = None
+    '''Starting frame of range of Ghosts to display (not for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    ghost_size: int = None
+    '''Frame step for Ghosts (not for ‘On Keyframes’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    ghost_step: int = None
+    '''Number of frame steps on either side of current frame to show as ghosts (only for ‘Around Current Frame’ Onion-skinning method) 
+
+    :type: int
+    '''
+
+    ghost_type: typing.Union[int, str] = None
+    '''Method of Onion-skinning for active Action 
+
+    :type: typing.Union[int, str]
+    '''
+
+    is_editmode: bool = None
+    '''True when used in editmode 
+
+    :type: bool
+    '''
+
+    layers: bool = None
+    '''Armature layer visibility 
+
+    :type: bool
+    '''
+
+    layers_protected: bool = None
+    '''Protected layers in Proxy Instances are restored to Proxy settings on file reload and undo 
+
+    :type: bool
+    '''
+
+    pose_position: typing.Union[int, str] = None
+    '''Show armature in binding pose or final posed state 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_axes: bool = None
+    '''Draw bone axes 
+
+    :type: bool
+    '''
+
+    show_bone_custom_shapes: bool = None
+    '''Draw bones with their custom shapes 
+
+    :type: bool
+    '''
+
+    show_group_colors: bool = None
+    '''Draw bone group colors 
+
+    :type: bool
+    '''
+
+    show_names: bool = None
+    '''Draw bone names 
+
+    :type: bool
+    '''
+
+    show_only_ghost_selected: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_auto_ik: bool = None
+    '''Add temporary IK constraints while grabbing bones in Pose Mode 
+
+    :type: bool
+    '''
+
+    use_deform_delay: bool = None
+    '''Don’t deform children when manipulating bones in Pose Mode 
+
+    :type: bool
+    '''
+
+    use_mirror_x: bool = None
+    '''Apply changes to matching bone on opposite side of X-Axis 
+
+    :type: bool
+    '''
+
+    def transform(self, matrix: float):
+        '''Transform armature bones by a matrix 
+
+        :param matrix: Matrix 
+        :type matrix: float
+        '''
+        pass
+
+
+class ArmatureActuator:
+    bone: str = None
+    '''Bone on which the constraint is defined 
+
+    :type: str
+    '''
+
+    constraint: str = None
+    '''Name of the constraint to control 
+
+    :type: str
+    '''
+
+    influence: float = None
+    '''Influence of this constraint 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    secondary_target: 'Object' = None
+    '''Set this object as the secondary target of the constraint (only IK polar target at the moment) 
+
+    :type: 'Object'
+    '''
+
+    target: 'Object' = None
+    '''Set this object as the target of the constraint 
+
+    :type: 'Object'
+    '''
+
+    weight: float = None
+    '''Weight of this constraint 
+
+    :type: float
+    '''
+
+
+class ArmatureBones:
+    '''Collection of armature bones '''
+
+    active: 'Bone' = None
+    '''Armature’s active bone 
+
+    :type: 'Bone'
+    '''
+
+
+class ArmatureEditBones:
+    '''Collection of armature edit bones '''
+
+    active: 'EditBone' = None
+    '''Armatures active edit bone 
+
+    :type: 'EditBone'
+    '''
+
+    def new(self, name: str) -> 'EditBone':
+        '''Add a new bone 
+
+        :param name: New name for the bone 
+        :type name: str
+        :rtype: 'EditBone'
+        :return:  Newly created edit bone 
+        '''
+        pass
+
+    def remove(self, bone: 'EditBone'):
+        '''Remove an existing bone from the armature 
+
+        :param bone: EditBone to remove 
+        :type bone: 'EditBone'
+        '''
+        pass
+
+
+class ArmatureModifier:
+    '''Armature deformation modifier '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    object: 'Object' = None
+    '''Armature object to deform with 
+
+    :type: 'Object'
+    '''
+
+    use_bone_envelopes: bool = None
+    '''Bind Bone envelopes to armature modifier 
+
+    :type: bool
+    '''
+
+    use_deform_preserve_volume: bool = None
+    '''Deform rotation interpolation with quaternions 
+
+    :type: bool
+    '''
+
+    use_multi_modifier: bool = None
+    '''Use same input as previous modifier, and mix results using overall vgroup 
+
+    :type: bool
+    '''
+
+    use_vertex_groups: bool = None
+    '''Bind vertex groups to armature modifier 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class ArmatureSensor:
+    '''Sensor to detect values and changes in values of IK solver '''
+
+    bone: str = None
+    '''Identify the bone to check value from 
+
+    :type: str
+    '''
+
+    constraint: str = None
+    '''Identify the bone constraint to check value from 
+
+    :type: str
+    '''
+
+    test_type: typing.Union[int, str] = None
+    '''Type of value and test 
+
+    :type: typing.Union[int, str]
+    '''
+
+    value: float = None
+    '''Value to be used in comparison 
+
+    :type: float
+    '''
+
+
+class ArrayModifier:
+    '''Array duplication modifier '''
+
+    constant_offset_displace: float = None
+    '''Value for the distance between arrayed items 
+
+    :type: float
+    '''
+
+    count: int = None
+    '''Number of duplicates to make 
+
+    :type: int
+    '''
+
+    curve: 'Object' = None
+    '''Curve object to fit array length to 
+
+    :type: 'Object'
+    '''
+
+    end_cap: 'Object' = None
+    '''Mesh object to use as an end cap 
+
+    :type: 'Object'
+    '''
+
+    fit_length: float = None
+    '''Length to fit array within 
+
+    :type: float
+    '''
+
+    fit_type: typing.Union[int, str] = None
+    '''Array length calculation method 
+
+    :type: typing.Union[int, str]
+    '''
+
+    merge_threshold: float = None
+    '''Limit below which to merge vertices 
+
+    :type: float
+    '''
+
+    offset_object: 'Object' = None
+    '''Use the location and rotation of another object to determine the distance and rotational change between arrayed items 
+
+    :type: 'Object'
+    '''
+
+    relative_offset_displace: float = None
+    '''The size of the geometry will determine the distance between arrayed items 
+
+    :type: float
+    '''
+
+    start_cap: 'Object' = None
+    '''Mesh object to use as a start cap 
+
+    :type: 'Object'
+    '''
+
+    use_constant_offset: bool = None
+    '''Add a constant offset 
+
+    :type: bool
+    '''
+
+    use_merge_vertices: bool = None
+    '''Merge vertices in adjacent duplicates 
+
+    :type: bool
+    '''
+
+    use_merge_vertices_cap: bool = None
+    '''Merge vertices in first and last duplicates 
+
+    :type: bool
+    '''
+
+    use_object_offset: bool = None
+    '''Add another object’s transformation to the total offset 
+
+    :type: bool
+    '''
+
+    use_relative_offset: bool = None
+    '''Add an offset relative to the object’s bounding box 
+
+    :type: bool
+    '''
+
+
+class Available:
+    pass
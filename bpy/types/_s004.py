@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BackgroundImage:
+    '''Image and settings for display in the 3D View background '''
+
+    clip: 'MovieClip' = None
+    '''Movie clip displayed and edited in this space 
+
+    :type: 'MovieClip'
+    '''
+
+    clip_user: 'MovieClipUser' = None
+    '''Parameters defining which frame of the movie clip is displayed 
+
+    :type: 'MovieClipUser'
+    '''
+
+    draw_depth: typing.Union[int, str] = None
+    '''Draw under or over everything 
+
+    :type: typing.Union[int, str]
+    '''
+
+    frame_method: typing.Union[int, str] = None
+    '''How the image fits in the camera frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image: 'Image' = None
+    '''Image displayed and edited in this space 
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    offset_x: float = None
+    '''Offset image horizontally from the world origin 
+
+    :type: float
+    '''
+
+    offset_y: float = None
+    '''Offset image vertically from the world origin 
+
+    :type: float
+    '''
+
+    opacity: float = None
+    '''Image opacity to blend the image against the background color 
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''Rotation for the background image (ortho view only) 
+
+    :type: float
+    '''
+
+    show_background_image: bool = None
+    '''Show this image as background 
+
+    :type: bool
+    '''
+
+    show_expanded: bool = None
+    '''Show the expanded in the user interface 
+
+    :type: bool
+    '''
+
+    show_on_foreground: bool = None
+    '''Show this image in front of objects in viewport 
+
+    :type: bool
+    '''
+
+    size: float = None
+    '''Size of the background image (ortho view only) 
+
+    :type: float
+    '''
+
+    source: typing.Union[int, str] = None
+    '''Data source used for background 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_camera_clip: bool = None
+    '''Use movie clip from active scene camera 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip the background image horizontally 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip the background image vertically 
+
+    :type: bool
+    '''
+
+    view_axis: typing.Union[int, str] = None
+    '''The axis to display the image on 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class BackgroundImages:
+    '''Collection of background images '''
+
+    def new(self, ) -> 'BackgroundImage':
+        '''Add new background image 
+
+        :rtype: 'BackgroundImage'
+        :return:  Image displayed as viewport background 
+        '''
+        pass
+
+    def remove(self, image: 'BackgroundImage'):
+        '''Remove background image 
+
+        :param image: Image displayed as viewport background 
+        :type image: 'BackgroundImage'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all background images 
+
+        '''
+        pass
+
+
+class BakePixel:
+    du_dx: float = None
+    '''
+
+    :type: float
+    '''
+
+    du_dy: float = None
+    '''
+
+    :type: float
+    '''
+
+    dv_dx: float = None
+    '''
+
+    :type: float
+    '''
+
+    dv_dy: float = None
+    '''
+
+    :type: float
+    '''
+
+    next: 'BakePixel' = None
+    '''
+
+    :type: 'BakePixel'
+    '''
+
+    object_id: int = None
+    '''
+
+    :type: int
+    '''
+
+    primitive_id: int = None
+    '''
+
+    :type: int
+    '''
+
+    uv: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class BakeSettings:
+    '''Bake data for a Scene data-block '''
+
+    cage_extrusion: float = None
+    '''Distance to use for the inward ray cast when using selected to active 
+
+    :type: float
+    '''
+
+    cage_object: str = None
+    '''Object to use as cage instead of calculating the cage from the active object with cage extrusion 
+
+    :type: str
+    '''
+
+    filepath: str = None
+    '''Image filepath to use when saving externally 
+
+    :type: str
+    '''
+
+    height: int = None
+    '''Vertical dimension of the baking map 
+
+    :type: int
+    '''
+
+    image_settings: 'ImageFormatSettings' = None
+    '''
+
+    :type: 'ImageFormatSettings'
+    '''
+
+    margin: int = None
+    '''Extends the baked result as a post process filter 
+
+    :type: int
+    '''
+
+    normal_b: typing.Union[int, str] = None
+    '''Axis to bake in blue channel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_g: typing.Union[int, str] = None
+    '''Axis to bake in green channel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_r: typing.Union[int, str] = None
+    '''Axis to bake in red channel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_space: typing.Union[int, str] = None
+    '''Choose normal space for baking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pass_filter: typing.Set[typing.Union[int, str]] = None
+    '''Passes to include in the active baking pass 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    save_mode: typing.Union[int, str] = None
+    '''Choose how to save the baking map 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_automatic_name: bool = None
+    '''Automatically name the output file with the pass type (external only) 
+
+    :type: bool
+    '''
+
+    use_cage: bool = None
+    '''Cast rays to active object from a cage 
+
+    :type: bool
+    '''
+
+    use_clear: bool = None
+    '''Clear Images before baking (internal only) 
+
+    :type: bool
+    '''
+
+    use_pass_ambient_occlusion: bool = None
+    '''Add ambient occlusion contribution 
+
+    :type: bool
+    '''
+
+    use_pass_color: bool = None
+    '''Color the pass 
+
+    :type: bool
+    '''
+
+    use_pass_diffuse: bool = None
+    '''Add diffuse contribution 
+
+    :type: bool
+    '''
+
+    use_pass_direct: bool = None
+    '''Add direct lighting contribution 
+
+    :type: bool
+    '''
+
+    use_pass_emit: bool = None
+    '''Add emission contribution 
+
+    :type: bool
+    '''
+
+    use_pass_glossy: bool = None
+    '''Add glossy contribution 
+
+    :type: bool
+    '''
+
+    use_pass_indirect: bool = None
+    '''Add indirect lighting contribution 
+
+    :type: bool
+    '''
+
+    use_pass_subsurface: bool = None
+    '''Add subsurface contribution 
+
+    :type: bool
+    '''
+
+    use_pass_transmission: bool = None
+    '''Add transmission contribution 
+
+    :type: bool
+    '''
+
+    use_selected_to_active: bool = None
+    '''Bake shading on the surface of selected objects to the active object 
+
+    :type: bool
+    '''
+
+    use_split_materials: bool = None
+    '''Split external images per material (external only) 
+
+    :type: bool
+    '''
+
+    width: int = None
+    '''Horizontal dimension of the baking map 
+
+    :type: int
+    '''
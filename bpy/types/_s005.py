@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+import bpy
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BevelModifier:
+    '''Bevel modifier to make edges and vertices more rounded '''
+
+    angle_limit: float = None
+    '''Angle above which to bevel edges 
+
+    :type: float
+    '''
+
+    edge_weight_method: typing.Union[int, str] = None
+    '''What edge weight to use for weighting a vertex 
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    loop_slide: bool = None
+    '''Prefer sliding along edges to having even widths 
+
+    :type: bool
+    '''
+
+    material: int = None
+    '''Material index of generated faces, -1 for automatic 
+
+    :type: int
+    '''
+
+    offset_type: typing.Union[int, str] = None
+    '''What distance Width measures 
+
+    :type: typing.Union[int, str]
+    '''
+
+    profile: float = None
+    '''The profile shape (0.5 = round) 
+
+    :type: float
+    '''
+
+    segments: int = None
+    '''Number of segments for round edges/verts 
+
+    :type: int
+    '''
+
+    use_clamp_overlap: bool = None
+    '''Clamp the width to avoid overlap 
+
+    :type: bool
+    '''
+
+    use_only_vertices: bool = None
+    '''Bevel verts/corners, not edges 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+    width: float = None
+    '''Bevel value/amount 
+
+    :type: float
+    '''
+
+
+class BezierSplinePoint:
+    '''Bezier curve point with two handles '''
+
+    co: float = None
+    '''Coordinates of the control point 
+
+    :type: float
+    '''
+
+    handle_left: float = None
+    '''Coordinates of the first handle 
+
+    :type: float
+    '''
+
+    handle_left_type: typing.Union[int, str] = None
+    '''Handle types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    handle_right: float = None
+    '''Coordinates of the second handle 
+
+    :type: float
+    '''
+
+    handle_right_type: typing.Union[int, str] = None
+    '''Handle types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    hide: bool = None
+    '''Visibility status 
+
+    :type: bool
+    '''
+
+    radius: float = None
+    '''Radius for beveling 
+
+    :type: float
+    '''
+
+    select_control_point: bool = None
+    '''Control point selection status 
+
+    :type: bool
+    '''
+
+    select_left_handle: bool = None
+    '''Handle 1 selection status 
+
+    :type: bool
+    '''
+
+    select_right_handle: bool = None
+    '''Handle 2 selection status 
+
+    :type: bool
+    '''
+
+    tilt: float = None
+    '''Tilt in 3D View 
+
+    :type: float
+    '''
+
+    weight_softbody: float = None
+    '''Softbody goal weight 
+
+    :type: float
+    '''
+
+
+class BlendData:
+    '''Main data structure representing a .blend file and all its data-blocks '''
+
+    actions: typing.List['Action'] = None
+    '''Action data-blocks 
+
+    :type: typing.List['Action']
+    '''
+
+    armatures: typing.List['BlendDataArmatures'] = None
+    '''Armature data-blocks 
+
+    :type: typing.List['BlendDataArmatures']
+    '''
+
+    brushes: typing.List['BlendDataBrushes'] = None
+    '''Brush data-blocks 
+
+    :type: typing.List['BlendDataBrushes']
+    '''
+
+    cache_files: typing.List['CacheFile'] = None
+    '''Cache Files data-blocks 
+
+    :type: typing.List['CacheFile']
+    '''
+
+    cameras: typing.List['Camera'] = None
+    '''Camera data-blocks 
+
+    :type: typing.List['Camera']
+    '''
+
+    curves: typing.List['Curve'] = None
+    '''Curve data-blocks 
+
+    :type: typing.List['Curve']
+    '''
+
+    filepath: str = None
+    '''Path to the .blend file 
+
+    :type: str
+    '''
+
+    fonts: typing.List['VectorFont'] = None
+    '''Vector font data-blocks 
+
+    :type: typing.List['VectorFont']
+    '''
+
+    grease_pencil: typing.List['BlendDataGreasePencils'] = None
+    '''Grease Pencil data-blocks 
+
+    :type: typing.List['BlendDataGreasePencils']
+    '''
+
+    groups: typing.List['Group'] = None
+    '''Group data-blocks 
+
+    :type: typing.List['Group']
+    '''
+
+    images: typing.List['BlendDataImages'] = None
+    '''Image data-blocks 
+
+    :type: typing.List['BlendDataImages']
+    '''
+
+    is_dirty: bool = None
+    '''Have recent edits been saved to disk 
+
+    :type: bool
+    '''
+
+    is_saved: bool = None
+    '''Has the current session been saved to disk as a .blend file 
+
+    :type: bool
+    '''
+
+    lamps: typing.List['Lamp'] = None
+    '''Lamp data-blocks 
+
+    :type: typing.List['Lamp']
+    '''
+
+    lattices: typing.List['BlendDataLattices'] = None
+    '''Lattice data-blocks 
+
+    :type: typing.List['BlendDataLattices']
+    '''
+
+    libraries: typing.List['BlendDataLibraries'] = None
+    '''Library data-blocks 
+
+    :type: typing.List['BlendDataLibraries']
+    '''
+
+    linestyles: typing.List['BlendDataLineStyles'] = None
+    '''Line Style data-blocks 
+
+    :type: typing.List['BlendDataLineStyles']
+    '''
+
+    masks: typing.List['BlendDataMasks'] = None
+    '''Masks data-blocks 
+
+    :type: typing.List['BlendDataMasks']
+    '''
+
+    materials: typing.List['Material'] = None
+    '''Material data-blocks 
+
+    :type: typing.List['Material']
+    '''
+
+    meshes: typing.List['Mesh'] = None
+    '''Mesh data-blocks 
+
+    :type: typing.List['Mesh']
+    '''
+
+    metaballs: typing.List['BlendDataMetaBalls'] = None
+    '''Metaball data-blocks 
+
+    :type: typing.List['BlendDataMetaBalls']
+    '''
+
+    movieclips: typing.List['MovieClip'] = None
+    '''Movie Clip data-blocks 
+
+    :type: typing.List['MovieClip']
+    '''
+
+    node_groups: typing.List['BlendDataNodeTrees'] = None
+    '''Node group data-blocks 
+
+    :type: typing.List['BlendDataNodeTrees']
+    '''
+
+    objects: typing.List['Object'] = None
+    '''Object data-blocks 
+
+    :type: typing.List['Object']
+    '''
+
+    paint_curves: typing.List['PaintCurve'] = None
+    '''Paint Curves data-blocks 
+
+    :type: typing.List['PaintCurve']
+    '''
+
+    palettes: typing.List['Palette'] = None
+    '''Palette data-blocks 
+
+    :type: typing.List['Palette']
+    '''
+
+    particles: typing.List['BlendDataParticles'] = None
+    '''Particle data-blocks 
+
+    :type: typing.List['BlendDataParticles']
+    '''
+
+    scenes: typing.List['BlendDataScenes'] = None
+    '''Scene data-blocks 
+
+    :type: typing.List['BlendDataScenes']
+    '''
+
+    screens: typing.List['Screen'] = None
+    '''Screen data-blocks 
+
+    :type: typing.List['Screen']
+    '''
+
+    shape_keys: typing.List['Key'] = None
+    '''Shape Key data-blocks 
+
+    :type: typing.List['Key']
+    '''
+
+    sounds: typing.List['Sound'] = None
+    '''Sound data-blocks 
+
+    :type: typing.List['Sound']
+    '''
+
+    speakers: typing.List['BlendDataSpeakers'] = None
+    '''Speaker data-blocks 
+
+    :type: typing.List['BlendDataSpeakers']
+    '''
+
+    texts: typing.List['Text'] = None
+    '''Text data-blocks 
+
+    :type: typing.List['Text']
+    '''
+
+    textures: typing.List['Texture'] = None
+    '''Texture data-blocks 
+
+    :type: typing.List['Texture']
+    '''
+
+    use_autopack: bool = None
+    '''Automatically pack all external data into .blend file 
+
+    :type: bool
+    '''
+
+    version: int = None
+    '''Version of Blender the .blend was saved with 
+
+    :type: int
+    '''
+
+    window_managers: typing.List['WindowManager'] = None
+    '''Window manager data-blocks 
+
+    :type: typing.List['WindowManager']
+    '''
+
+    worlds: typing.List['BlendDataWorlds'] = None
+    '''World data-blocks 
+
+    :type: typing.List['BlendDataWorlds']
+    '''
+
+    def user_map(self, key_types: set, value_types: set) -> dict:
+        '''For list of valid set members for key_types & value_types, see: bpy.types.KeyingSetPath.id_type. 
+
+        :param subset: When passed, only these data-blocks and their users will be included as keys/values in the map. 
+        :type subset: list
+        :param key_types: Filter the keys mapped by ID types. 
+        :type key_types: set
+        :param value_types: Filter the values in the set by ID types. 
+        :type value_types: set
+        :rtype: dict
+        :return:  dictionary of bpy.types.ID instances, with sets of ID’s as their values. 
+        '''
+        pass
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BlendDataActions:
+    '''Collection of actions '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Action':
+        '''Add a new action to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Action'
+        :return:  New action data-block 
+        '''
+        pass
+
+    def remove(self,
+               action: 'Action',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a action from the current blendfile 
+
+        :param action: Action to remove 
+        :type action: 'Action'
+        :param do_unlink: Unlink all usages of this action before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this action 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this action 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataArmatures:
+    '''Collection of armatures '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Armature':
+        '''Add a new armature to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Armature'
+        :return:  New armature data-block 
+        '''
+        pass
+
+    def remove(self,
+               armature: 'Armature',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a armature from the current blendfile 
+
+        :param armature: Armature to remove 
+        :type armature: 'Armature'
+        :param do_unlink: Unlink all usages of this armature before deleting it (WARNING: will also delete objects instancing that armature data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this armature data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this armature data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataBrushes:
+    '''Collection of brushes '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str,
+            mode: typing.Union[int, str] = 'TEXTURE_PAINT') -> 'Brush':
+        '''Add a new brush to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param mode: Paint Mode for the new brushOBJECT Object Mode.EDIT Edit Mode.POSE Pose Mode.SCULPT Sculpt Mode.VERTEX_PAINT Vertex Paint.WEIGHT_PAINT Weight Paint.TEXTURE_PAINT Texture Paint.PARTICLE_EDIT Particle Edit.GPENCIL_EDIT Edit Strokes, Edit Grease Pencil Strokes. 
+        :type mode: typing.Union[int, str]
+        :rtype: 'Brush'
+        :return:  New brush data-block 
+        '''
+        pass
+
+    def remove(self,
+               brush: 'Brush',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a brush from the current blendfile 
+
+        :param brush: Brush to remove 
+        :type brush: 'Brush'
+        :param do_unlink: Unlink all usages of this brush before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this brush 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this brush 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataCacheFiles:
+    '''Collection of cache files '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataCameras:
+    '''Collection of cameras '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Camera':
+        '''Add a new camera to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Camera'
+        :return:  New camera data-block 
+        '''
+        pass
+
+    def remove(self,
+               camera: 'Camera',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a camera from the current blendfile 
+
+        :param camera: Camera to remove 
+        :type camera: 'Camera'
+        :param do_unlink: Unlink all usages of this camera before deleting it (WARNING: will also delete objects instancing that camera data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this camera 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this camera 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataCurves:
+    '''Collection of curves '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str, type: typing.Union[int, str]) -> 'Curve':
+        '''Add a new curve to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param type: Type, The type of curve to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'Curve'
+        :return:  New curve data-block 
+        '''
+        pass
+
+    def remove(self,
+               curve: 'Curve',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a curve from the current blendfile 
+
+        :param curve: Curve to remove 
+        :type curve: 'Curve'
+        :param do_unlink: Unlink all usages of this curve before deleting it (WARNING: will also delete objects instancing that curve data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this curve data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this curve data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataFonts:
+    '''Collection of fonts '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def load(self, filepath: str,
+             check_existing: bool = False) -> 'VectorFont':
+        '''Load a new font into the main database 
+
+        :param filepath: path of the font to load 
+        :type filepath: str
+        :param check_existing: Using existing data-block if this file is already loaded 
+        :type check_existing: bool
+        :rtype: 'VectorFont'
+        :return:  New font data-block 
+        '''
+        pass
+
+    def remove(self,
+               vfont: 'VectorFont',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a font from the current blendfile 
+
+        :param vfont: Font to remove 
+        :type vfont: 'VectorFont'
+        :param do_unlink: Unlink all usages of this font before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this font 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this font 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataGreasePencils:
+    '''Collection of grease pencils '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+    def remove(self,
+               grease_pencil: 'GreasePencil',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a grease pencil instance from the current blendfile 
+
+        :param grease_pencil: Grease Pencil to remove 
+        :type grease_pencil: 'GreasePencil'
+        :param do_unlink: Unlink all usages of this grease pencil before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this grease pencil 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this grease pencil 
+        :type do_ui_user: bool
+        '''
+        pass
+
+
+class BlendDataGroups:
+    '''Collection of groups '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Group':
+        '''Add a new group to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Group'
+        :return:  New group data-block 
+        '''
+        pass
+
+    def remove(self,
+               group: 'Group',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a group from the current blendfile 
+
+        :param group: Group to remove 
+        :type group: 'Group'
+        :param do_unlink: Unlink all usages of this group before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this group 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this group 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
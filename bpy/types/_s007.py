@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import sys
+import bpy
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BlendDataImages:
+    '''Collection of images '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self,
+            name: str,
+            width: int,
+            height: int,
+            alpha: bool = False,
+            float_buffer: bool = False,
+            stereo3d: bool = False) -> 'Image':
+        '''Add a new image to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param width: Width of the image 
+        :type width: int
+        :param height: Height of the image 
+        :type height: int
+        :param alpha: Alpha, Use alpha channel 
+        :type alpha: bool
+        :param float_buffer: Float Buffer, Create an image with floating point color 
+        :type float_buffer: bool
+        :param stereo3d: Stereo 3D, Create left and right views 
+        :type stereo3d: bool
+        :rtype: 'Image'
+        :return:  New image data-block 
+        '''
+        pass
+
+    def load(self, filepath: str, check_existing: bool = False) -> 'Image':
+        '''Load a new image into the main database 
+
+        :param filepath: path of the file to load 
+        :type filepath: str
+        :param check_existing: Using existing data-block if this file is already loaded 
+        :type check_existing: bool
+        :rtype: 'Image'
+        :return:  New image data-block 
+        '''
+        pass
+
+    def remove(self,
+               image: 'Image',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove an image from the current blendfile 
+
+        :param image: Image to remove 
+        :type image: 'Image'
+        :param do_unlink: Unlink all usages of this image before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this image 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this image 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataLamps:
+    '''Collection of lamps '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str, type: typing.Union[int, str]) -> 'Lamp':
+        '''Add a new lamp to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param type: Type, The type of texture to addPOINT Point, Omnidirectional point light source.SUN Sun, Constant direction parallel ray light source.SPOT Spot, Directional cone light source.HEMI Hemi, 180 degree constant light source.AREA Area, Directional area light source. 
+        :type type: typing.Union[int, str]
+        :rtype: 'Lamp'
+        :return:  New lamp data-block 
+        '''
+        pass
+
+    def remove(self,
+               lamp: 'Lamp',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a lamp from the current blendfile 
+
+        :param lamp: Lamp to remove 
+        :type lamp: 'Lamp'
+        :param do_unlink: Unlink all usages of this lamp before deleting it (WARNING: will also delete objects instancing that lamp data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this lamp data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this lamp data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataLattices:
+    '''Collection of lattices '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Lattice':
+        '''Add a new lattice to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Lattice'
+        :return:  New lattices data-block 
+        '''
+        pass
+
+    def remove(self,
+               lattice: 'Lattice',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a lattice from the current blendfile 
+
+        :param lattice: Lattice to remove 
+        :type lattice: 'Lattice'
+        :param do_unlink: Unlink all usages of this lattice before deleting it (WARNING: will also delete objects instancing that lattice data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this lattice data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this lattice data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataLibraries:
+    '''Collection of libraries '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+    def load(self, filepath: str, link: bool = False, relative: bool = False):
+        '''Returns a context manager which exposes 2 library objects on entering. Each object has attributes matching bpy.data which are lists of strings to be linked. 
+
+        :param filepath: The path to a blend file. 
+        :type filepath: str
+        :param link: When False reference to the original file is lost. 
+        :type link: bool
+        :param relative: When True the path is stored relative to the open blend file. 
+        :type relative: bool
+        '''
+        pass
+
+    def write(self,
+              filepath: str,
+              datablocks: set,
+              relative_remap: bool = False,
+              fake_user: bool = False,
+              compress: bool = False):
+        '''Write data-blocks into a blend file. 
+
+        :param filepath: The path to write the blend-file. 
+        :type filepath: str
+        :param datablocks: set of data-blocks (bpy.types.ID instances). 
+        :type datablocks: set
+        :param relative_remap: When True, remap the paths relative to the current blend-file. 
+        :type relative_remap: bool
+        :param fake_user: When True, data-blocks will be written with fake-user flag enabled. 
+        :type fake_user: bool
+        :param compress: When True, write a compressed blend file. 
+        :type compress: bool
+        '''
+        pass
+
+
+class BlendDataLineStyles:
+    '''Collection of line styles '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+    def new(self, name: str) -> 'FreestyleLineStyle':
+        '''Add a new line style instance to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'FreestyleLineStyle'
+        :return:  New line style data-block 
+        '''
+        pass
+
+    def remove(self,
+               linestyle: 'FreestyleLineStyle',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a line style instance from the current blendfile 
+
+        :param linestyle: Line style to remove 
+        :type linestyle: 'FreestyleLineStyle'
+        :param do_unlink: Unlink all usages of this line style before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this line style 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this line style 
+        :type do_ui_user: bool
+        '''
+        pass
+
+
+class BlendDataMasks:
+    '''Collection of masks '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+    def new(self, name: str = "") -> 'Mask':
+        '''Add a new mask with a given name to the main database 
+
+        :param name: Mask, Name of new mask data-block 
+        :type name: str
+        :rtype: 'Mask'
+        :return:  New mask data-block 
+        '''
+        pass
+
+    def remove(self,
+               mask: 'Mask',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a masks from the current blendfile. 
+
+        :param mask: Mask to remove 
+        :type mask: 'Mask'
+        :param do_unlink: Unlink all usages of this mask before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this mask 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this mask 
+        :type do_ui_user: bool
+        '''
+        pass
+
+
+class BlendDataMaterials:
+    '''Collection of materials '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Material':
+        '''Add a new material to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Material'
+        :return:  New material data-block 
+        '''
+        pass
+
+    def remove(self,
+               material: 'Material',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a material from the current blendfile 
+
+        :param material: Material to remove 
+        :type material: 'Material'
+        :param do_unlink: Unlink all usages of this material before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this material 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this material 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
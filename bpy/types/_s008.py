@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BlendDataMeshes:
+    '''Collection of meshes '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Mesh':
+        '''Add a new mesh to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Mesh'
+        :return:  New mesh data-block 
+        '''
+        pass
+
+    def new_from_object(self,
+                        scene: 'Scene',
+                        object: 'Object',
+                        apply_modifiers: bool,
+                        settings: typing.Union[int, str],
+                        calc_tessface: bool = True,
+                        calc_undeformed: bool = False) -> 'Mesh':
+        '''Add a new mesh created from object with modifiers applied 
+
+        :param scene: Scene within which to evaluate modifiers 
+        :type scene: 'Scene'
+        :param object: Object to create mesh from 
+        :type object: 'Object'
+        :param apply_modifiers: Apply modifiers 
+        :type apply_modifiers: bool
+        :param settings: Modifier settings to applyPREVIEW Preview, Apply modifier preview settings.RENDER Render, Apply modifier render settings. 
+        :type settings: typing.Union[int, str]
+        :param calc_tessface: Calculate Tessellation, Calculate tessellation faces 
+        :type calc_tessface: bool
+        :param calc_undeformed: Calculate Undeformed, Calculate undeformed vertex coordinates 
+        :type calc_undeformed: bool
+        :rtype: 'Mesh'
+        :return:  Mesh created from object, remove it if it is only used for export 
+        '''
+        pass
+
+    def remove(self,
+               mesh: 'Mesh',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a mesh from the current blendfile 
+
+        :param mesh: Mesh to remove 
+        :type mesh: 'Mesh'
+        :param do_unlink: Unlink all usages of this mesh before deleting it (WARNING: will also delete objects instancing that mesh data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this mesh data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this mesh data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataMetaBalls:
+    '''Collection of metaballs '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'MetaBall':
+        '''Add a new metaball to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'MetaBall'
+        :return:  New metaball data-block 
+        '''
+        pass
+
+    def remove(self,
+               metaball: 'MetaBall',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a metaball from the current blendfile 
+
+        :param metaball: Metaball to remove 
+        :type metaball: 'MetaBall'
+        :param do_unlink: Unlink all usages of this metaball before deleting it (WARNING: will also delete objects instancing that metaball data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this metaball data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this metaball data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataMovieClips:
+    '''Collection of movie clips '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+    def remove(self,
+               clip: 'MovieClip',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a movie clip from the current blendfile. 
+
+        :param clip: Movie clip to remove 
+        :type clip: 'MovieClip'
+        :param do_unlink: Unlink all usages of this movie clip before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this movie clip 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this movie clip 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def load(self, filepath: str, check_existing: bool = False) -> 'MovieClip':
+        '''Add a new movie clip to the main database from a file (while check_existing is disabled for consistency with other load functions, behavior with multiple movie-clips using the same file may incorrectly generate proxies) 
+
+        :param filepath: path for the data-block 
+        :type filepath: str
+        :param check_existing: Using existing data-block if this file is already loaded 
+        :type check_existing: bool
+        :rtype: 'MovieClip'
+        :return:  New movie clip data-block 
+        '''
+        pass
+
+
+class BlendDataNodeTrees:
+    '''Collection of node trees '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str, type: typing.Union[int, str]) -> 'NodeTree':
+        '''Add a new node tree to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param type: Type, The type of node_group to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'NodeTree'
+        :return:  New node tree data-block 
+        '''
+        pass
+
+    def remove(self,
+               tree: 'NodeTree',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a node tree from the current blendfile 
+
+        :param tree: Node tree to remove 
+        :type tree: 'NodeTree'
+        :param do_unlink: Unlink all usages of this node tree before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this node tree 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this node tree 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataObjects:
+    '''Collection of objects '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str, object_data: 'ID') -> 'Object':
+        '''Add a new object to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param object_data: Object data or None for an empty object 
+        :type object_data: 'ID'
+        :rtype: 'Object'
+        :return:  New object data-block 
+        '''
+        pass
+
+    def remove(self,
+               object: 'Object',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a object from the current blendfile 
+
+        :param object: Object to remove 
+        :type object: 'Object'
+        :param do_unlink: Unlink all usages of this object before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this object 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this object 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataPaintCurves:
+    '''Collection of paint curves '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataPalettes:
+    '''Collection of palettes '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Palette':
+        '''Add a new palette to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Palette'
+        :return:  New palette data-block 
+        '''
+        pass
+
+    def remove(self,
+               palette: 'Palette',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a palette from the current blendfile 
+
+        :param palette: Palette to remove 
+        :type palette: 'Palette'
+        :param do_unlink: Unlink all usages of this palette before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this palette 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this palette 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataParticles:
+    '''Collection of particle settings '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'ParticleSettings':
+        '''Add a new particle settings instance to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'ParticleSettings'
+        :return:  New particle settings data-block 
+        '''
+        pass
+
+    def remove(self,
+               particle: 'ParticleSettings',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a particle settings instance from the current blendfile 
+
+        :param particle: Particle Settings to remove 
+        :type particle: 'ParticleSettings'
+        :param do_unlink: Unlink all usages of those particle settings before deleting them 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this particle settings 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this particle settings 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
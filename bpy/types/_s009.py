@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BlendDataScenes:
+    '''Collection of scenes '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Scene':
+        '''Add a new scene to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Scene'
+        :return:  New scene data-block 
+        '''
+        pass
+
+    def remove(self, scene: 'Scene', do_unlink: bool = True):
+        '''Remove a scene from the current blendfile 
+
+        :param scene: Scene to remove 
+        :type scene: 'Scene'
+        :param do_unlink: Unlink all usages of this scene before deleting it 
+        :type do_unlink: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataScreens:
+    '''Collection of screens '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataSounds:
+    '''Collection of sounds '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def load(self, filepath: str, check_existing: bool = False) -> 'Sound':
+        '''Add a new sound to the main database from a file 
+
+        :param filepath: path for the data-block 
+        :type filepath: str
+        :param check_existing: Using existing data-block if this file is already loaded 
+        :type check_existing: bool
+        :rtype: 'Sound'
+        :return:  New text data-block 
+        '''
+        pass
+
+    def remove(self,
+               sound: 'Sound',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a sound from the current blendfile 
+
+        :param sound: Sound to remove 
+        :type sound: 'Sound'
+        :param do_unlink: Unlink all usages of this sound before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this sound 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this sound 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataSpeakers:
+    '''Collection of speakers '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Speaker':
+        '''Add a new speaker to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Speaker'
+        :return:  New speaker data-block 
+        '''
+        pass
+
+    def remove(self,
+               speaker: 'Speaker',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a speaker from the current blendfile 
+
+        :param speaker: Speaker to remove 
+        :type speaker: 'Speaker'
+        :param do_unlink: Unlink all usages of this speaker before deleting it (WARNING: will also delete objects instancing that speaker data) 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this speaker data 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this speaker data 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataTexts:
+    '''Collection of texts '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'Text':
+        '''Add a new text to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'Text'
+        :return:  New text data-block 
+        '''
+        pass
+
+    def remove(self,
+               text: 'Text',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a text from the current blendfile 
+
+        :param text: Text to remove 
+        :type text: 'Text'
+        :param do_unlink: Unlink all usages of this text before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this text 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this text 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def load(self, filepath: str, internal: bool = False) -> 'Text':
+        '''Add a new text to the main database from a file 
+
+        :param filepath: path for the data-block 
+        :type filepath: str
+        :param internal: Make internal, Make text file internal after loading 
+        :type internal: bool
+        :rtype: 'Text'
+        :return:  New text data-block 
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataTextures:
+    '''Collection of groups '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str, type: typing.Union[int, str]) -> 'Texture':
+        '''Add a new texture to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :param type: Type, The type of texture to addNONE None.BLEND Blend, Procedural - create a ramp texture.CLOUDS Clouds, Procedural - create a cloud-like fractal noise texture.DISTORTED_NOISE Distorted Noise, Procedural - noise texture distorted by two noise algorithms.ENVIRONMENT_MAP Environment Map, Create a render of the environment mapped to a texture.IMAGE Image or Movie, Allow for images or movies to be used as textures.MAGIC Magic, Procedural - color texture based on trigonometric functions.MARBLE Marble, Procedural - marble-like noise texture with wave generated bands.MUSGRAVE Musgrave, Procedural - highly flexible fractal noise texture.NOISE Noise, Procedural - random noise, gives a different result every time, for every frame, for every pixel.OCEAN Ocean, Use a texture generated by an Ocean modifier.POINT_DENSITY Point Density.STUCCI Stucci, Procedural - create a fractal noise texture.VORONOI Voronoi, Procedural - create cell-like patterns based on Worley noise.VOXEL_DATA Voxel Data, Create a 3D texture based on volumetric data.WOOD Wood, Procedural - wave generated bands or rings, with optional noise. 
+        :type type: typing.Union[int, str]
+        :rtype: 'Texture'
+        :return:  New texture data-block 
+        '''
+        pass
+
+    def remove(self,
+               texture: 'Texture',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a texture from the current blendfile 
+
+        :param texture: Texture to remove 
+        :type texture: 'Texture'
+        :param do_unlink: Unlink all usages of this texture before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this texture 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this texture 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataWindowManagers:
+    '''Collection of window managers '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendDataWorlds:
+    '''Collection of worlds '''
+
+    is_updated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def new(self, name: str) -> 'World':
+        '''Add a new world to the main database 
+
+        :param name: New name for the data-block 
+        :type name: str
+        :rtype: 'World'
+        :return:  New world data-block 
+        '''
+        pass
+
+    def remove(self,
+               world: 'World',
+               do_unlink: bool = True,
+               do_id_user: bool = True,
+               do_ui_user: bool = True):
+        '''Remove a world from the current blendfile 
+
+        :param world: World to remove 
+        :type world: 'World'
+        :param do_unlink: Unlink all usages of this world before deleting it 
+        :type do_unlink: bool
+        :param do_id_user: Decrement user counter of all datablocks used by this world 
+        :type do_id_user: bool
+        :param do_ui_user: Make sure interface does not reference this world 
+        :type do_ui_user: bool
+        '''
+        pass
+
+    def tag(self, value: bool):
+        '''tag 
+
+        :param value: Value 
+        :type value: bool
+        '''
+        pass
+
+
+class BlendTexture:
+    '''Procedural color blending texture '''
+
+    progression: typing.Union[int, str] = None
+    '''Style of the color blending 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_flip_axis: typing.Union[int, str] = None
+    '''Flip the texture’s X and Y axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class BlenderRNA:
+    '''Blender RNA structure definitions '''
+
+    structs: typing.List['Struct'] = None
+    '''
+
+    :type: typing.List['Struct']
+    '''
+
+
+class BoidRule:
+    name: str = None
+    '''Boid rule name 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_in_air: bool = None
+    '''Use rule when boid is flying 
+
+    :type: bool
+    '''
+
+    use_on_land: bool = None
+    '''Use rule when boid is on land 
+
+    :type: bool
+    '''
+
+
+class BoidRuleAverageSpeed:
+    level: float = None
+    '''How much velocity’s z-component is kept constant 
+
+    :type: float
+    '''
+
+    speed: float = None
+    '''Percentage of maximum speed 
+
+    :type: float
+    '''
+
+    wander: float = None
+    '''How fast velocity’s direction is randomized 
+
+    :type: float
+    '''
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BoidRuleAvoid:
+    fear_factor: float = None
+    '''Avoid object if danger from it is above this threshold 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object to avoid 
+
+    :type: 'Object'
+    '''
+
+    use_predict: bool = None
+    '''Predict target movement 
+
+    :type: bool
+    '''
+
+
+class BoidRuleAvoidCollision:
+    look_ahead: float = None
+    '''Time to look ahead in seconds 
+
+    :type: float
+    '''
+
+    use_avoid: bool = None
+    '''Avoid collision with other boids 
+
+    :type: bool
+    '''
+
+    use_avoid_collision: bool = None
+    '''Avoid collision with deflector objects 
+
+    :type: bool
+    '''
+
+
+class BoidRuleFight:
+    distance: float = None
+    '''Attack boids at max this distance 
+
+    :type: float
+    '''
+
+    flee_distance: float = None
+    '''Flee to this distance 
+
+    :type: float
+    '''
+
+
+class BoidRuleFollowLeader:
+    distance: float = None
+    '''Distance behind leader to follow 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Follow this object instead of a boid 
+
+    :type: 'Object'
+    '''
+
+    queue_count: int = None
+    '''How many boids in a line 
+
+    :type: int
+    '''
+
+    use_line: bool = None
+    '''Follow leader in a line 
+
+    :type: bool
+    '''
+
+
+class BoidRuleGoal:
+    object: 'Object' = None
+    '''Goal object 
+
+    :type: 'Object'
+    '''
+
+    use_predict: bool = None
+    '''Predict target movement 
+
+    :type: bool
+    '''
+
+
+class BoidSettings:
+    '''Settings for boid physics '''
+
+    accuracy: float = None
+    '''Accuracy of attack 
+
+    :type: float
+    '''
+
+    active_boid_state: 'BoidRule' = None
+    '''
+
+    :type: 'BoidRule'
+    '''
+
+    active_boid_state_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    aggression: float = None
+    '''Boid will fight this times stronger enemy 
+
+    :type: float
+    '''
+
+    air_acc_max: float = None
+    '''Maximum acceleration in air (relative to maximum speed) 
+
+    :type: float
+    '''
+
+    air_ave_max: float = None
+    '''Maximum angular velocity in air (relative to 180 degrees) 
+
+    :type: float
+    '''
+
+    air_personal_space: float = None
+    '''Radius of boids personal space in air (% of particle size) 
+
+    :type: float
+    '''
+
+    air_speed_max: float = None
+    '''Maximum speed in air 
+
+    :type: float
+    '''
+
+    air_speed_min: float = None
+    '''Minimum speed in air (relative to maximum speed) 
+
+    :type: float
+    '''
+
+    bank: float = None
+    '''Amount of rotation around velocity vector on turns 
+
+    :type: float
+    '''
+
+    health: float = None
+    '''Initial boid health when born 
+
+    :type: float
+    '''
+
+    height: float = None
+    '''Boid height relative to particle size 
+
+    :type: float
+    '''
+
+    land_acc_max: float = None
+    '''Maximum acceleration on land (relative to maximum speed) 
+
+    :type: float
+    '''
+
+    land_ave_max: float = None
+    '''Maximum angular velocity on land (relative to 180 degrees) 
+
+    :type: float
+    '''
+
+    land_jump_speed: float = None
+    '''Maximum speed for jumping 
+
+    :type: float
+    '''
+
+    land_personal_space: float = None
+    '''Radius of boids personal space on land (% of particle size) 
+
+    :type: float
+    '''
+
+    land_smooth: float = None
+    '''How smoothly the boids land 
+
+    :type: float
+    '''
+
+    land_speed_max: float = None
+    '''Maximum speed on land 
+
+    :type: float
+    '''
+
+    land_stick_force: float = None
+    '''How strong a force must be to start effecting a boid on land 
+
+    :type: float
+    '''
+
+    pitch: float = None
+    '''Amount of rotation around side vector 
+
+    :type: float
+    '''
+
+    range: float = None
+    '''Maximum distance from which a boid can attack 
+
+    :type: float
+    '''
+
+    states: typing.List['BoidState'] = None
+    '''
+
+    :type: typing.List['BoidState']
+    '''
+
+    strength: float = None
+    '''Maximum caused damage on attack per second 
+
+    :type: float
+    '''
+
+    use_climb: bool = None
+    '''Allow boids to climb goal objects 
+
+    :type: bool
+    '''
+
+    use_flight: bool = None
+    '''Allow boids to move in air 
+
+    :type: bool
+    '''
+
+    use_land: bool = None
+    '''Allow boids to move on land 
+
+    :type: bool
+    '''
+
+
+class BoidState:
+    '''Boid state for boid physics '''
+
+    active_boid_rule: 'BoidRule' = None
+    '''
+
+    :type: 'BoidRule'
+    '''
+
+    active_boid_rule_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    falloff: float = None
+    '''
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Boid state name 
+
+    :type: str
+    '''
+
+    rule_fuzzy: float = None
+    '''
+
+    :type: float
+    '''
+
+    rules: typing.List['BoidRule'] = None
+    '''
+
+    :type: typing.List['BoidRule']
+    '''
+
+    ruleset_type: typing.Union[int, str] = None
+    '''How the rules in the list are evaluated 
+
+    :type: typing.Union[int, str]
+    '''
+
+    volume: float = None
+    '''
+
+    :type: float
+    '''
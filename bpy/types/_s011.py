@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Bone:
+    '''Bone in an Armature data-block '''
+
+    bbone_curveinx: float = None
+    '''X-axis handle offset for start of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveiny: float = None
+    '''Y-axis handle offset for start of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveoutx: float = None
+    '''X-axis handle offset for end of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveouty: float = None
+    '''Y-axis handle offset for end of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_in: float = None
+    '''Length of first Bezier Handle (for B-Bones only) 
+
+    :type: float
+    '''
+
+    bbone_out: float = None
+    '''Length of second Bezier Handle (for B-Bones only) 
+
+    :type: float
+    '''
+
+    bbone_rollin: float = None
+    '''Roll offset for the start of the B-Bone, adjusts twist 
+
+    :type: float
+    '''
+
+    bbone_rollout: float = None
+    '''Roll offset for the end of the B-Bone, adjusts twist 
+
+    :type: float
+    '''
+
+    bbone_scalein: float = None
+    '''Scale factor for start of the B-Bone, adjusts thickness (for tapering effects) 
+
+    :type: float
+    '''
+
+    bbone_scaleout: float = None
+    '''Scale factor for end of the B-Bone, adjusts thickness (for tapering effects) 
+
+    :type: float
+    '''
+
+    bbone_segments: int = None
+    '''Number of subdivisions of bone (for B-Bones only) 
+
+    :type: int
+    '''
+
+    bbone_x: float = None
+    '''B-Bone X size 
+
+    :type: float
+    '''
+
+    bbone_z: float = None
+    '''B-Bone Z size 
+
+    :type: float
+    '''
+
+    children: typing.List['Bone'] = None
+    '''Bones which are children of this bone 
+
+    :type: typing.List['Bone']
+    '''
+
+    envelope_distance: float = None
+    '''Bone deformation distance (for Envelope deform only) 
+
+    :type: float
+    '''
+
+    envelope_weight: float = None
+    '''Bone deformation weight (for Envelope deform only) 
+
+    :type: float
+    '''
+
+    head: float = None
+    '''Location of head end of the bone relative to its parent 
+
+    :type: float
+    '''
+
+    head_local: float = None
+    '''Location of head end of the bone relative to armature 
+
+    :type: float
+    '''
+
+    head_radius: float = None
+    '''Radius of head of bone (for Envelope deform only) 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''Bone is not visible when it is not in Edit Mode (i.e. in Object or Pose Modes) 
+
+    :type: bool
+    '''
+
+    hide_select: bool = None
+    '''Bone is able to be selected 
+
+    :type: bool
+    '''
+
+    layers: bool = None
+    '''Layers bone exists in 
+
+    :type: bool
+    '''
+
+    matrix: float = None
+    '''3x3 bone matrix 
+
+    :type: float
+    '''
+
+    matrix_local: float = None
+    '''4x4 bone matrix relative to armature 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    parent: 'Bone' = None
+    '''Parent bone (in same Armature) 
+
+    :type: 'Bone'
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select_head: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select_tail: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_wire: bool = None
+    '''Bone is always drawn as Wireframe regardless of viewport draw mode (useful for non-obstructive custom bone shapes) 
+
+    :type: bool
+    '''
+
+    tail: float = None
+    '''Location of tail end of the bone 
+
+    :type: float
+    '''
+
+    tail_local: float = None
+    '''Location of tail end of the bone relative to armature 
+
+    :type: float
+    '''
+
+    tail_radius: float = None
+    '''Radius of tail of bone (for Envelope deform only) 
+
+    :type: float
+    '''
+
+    use_connect: bool = None
+    '''When bone has a parent, bone’s head is stuck to the parent’s tail 
+
+    :type: bool
+    '''
+
+    use_cyclic_offset: bool = None
+    '''When bone doesn’t have a parent, it receives cyclic offset effects (Deprecated) 
+
+    :type: bool
+    '''
+
+    use_deform: bool = None
+    '''Enable Bone to deform geometry 
+
+    :type: bool
+    '''
+
+    use_endroll_as_inroll: bool = None
+    '''Use Roll Out of parent bone as Roll In of its children 
+
+    :type: bool
+    '''
+
+    use_envelope_multiply: bool = None
+    '''When deforming bone, multiply effects of Vertex Group weights with Envelope influence 
+
+    :type: bool
+    '''
+
+    use_inherit_rotation: bool = None
+    '''Bone inherits rotation or scale from parent bone 
+
+    :type: bool
+    '''
+
+    use_inherit_scale: bool = None
+    '''Bone inherits scaling from parent bone 
+
+    :type: bool
+    '''
+
+    use_local_location: bool = None
+    '''Bone location is set in local space 
+
+    :type: bool
+    '''
+
+    use_relative_parent: bool = None
+    '''Object children will use relative transform, like deform 
+
+    :type: bool
+    '''
+
+    basename = None
+    '''The name of this bone before any ‘.’ character (readonly) '''
+
+    center = None
+    '''The midpoint between the head and the tail. (readonly) '''
+
+    children_recursive = None
+    '''A list of all children from this bone. (readonly) '''
+
+    children_recursive_basename = None
+    '''Returns a chain of children with the same base name as this bone. Only direct chains are supported, forks caused by multiple children with matching base names will terminate the function and not be returned. (readonly) '''
+
+    length = None
+    '''The distance from head to tail, when set the head is moved to fit the length. '''
+
+    parent_recursive = None
+    '''A list of parents, starting with the immediate parent (readonly) '''
+
+    vector = None
+    '''The direction this bone is pointing. Utility function for (tail - head) (readonly) '''
+
+    x_axis = None
+    '''Vector pointing down the x-axis of the bone. (readonly) '''
+
+    y_axis = None
+    '''Vector pointing down the y-axis of the bone. (readonly) '''
+
+    z_axis = None
+    '''Vector pointing down the z-axis of the bone. (readonly) '''
+
+    def evaluate_envelope(self, point: float) -> float:
+        '''Calculate bone envelope at given point 
+
+        :param point: Point, Position in 3d space to evaluate 
+        :type point: float
+        :rtype: float
+        :return:  Factor, Envelope factor 
+        '''
+        pass
+
+    def parent_index(self, parent_test):
+        '''The same as ‘bone in other_bone.parent_recursive’ but saved generating a list. 
+
+        '''
+        pass
+
+    def translate(self, vec):
+        '''Utility function to add vec to the head and tail of this bone 
+
+        '''
+        pass
+
+
+class BoneGroup:
+    '''Groups of Pose Channels (Bones) '''
+
+    color_set: typing.Union[int, str] = None
+    '''Custom color set to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    colors: 'ThemeBoneColorSet' = None
+    '''Copy of the colors associated with the group’s color set 
+
+    :type: 'ThemeBoneColorSet'
+    '''
+
+    is_custom_color_set: bool = None
+    '''Color set is user-defined instead of a fixed theme color set 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class BoneGroups:
+    '''Collection of bone groups '''
+
+    active: 'BoneGroup' = None
+    '''Active bone group for this pose 
+
+    :type: 'BoneGroup'
+    '''
+
+    active_index: int = None
+    '''Active index in bone groups array 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "Group") -> 'BoneGroup':
+        '''Add a new bone group to the object 
+
+        :param name: Name of the new group 
+        :type name: str
+        :rtype: 'BoneGroup'
+        :return:  New bone group 
+        '''
+        pass
+
+    def remove(self, group: 'BoneGroup'):
+        '''Remove a bone group from this object 
+
+        :param group: Removed bone group 
+        :type group: 'BoneGroup'
+        '''
+        pass
+
+
+class BoolProperty:
+    '''RNA boolean property definition '''
+
+    array_length: int = None
+    '''Maximum length of the array, 0 means unlimited 
+
+    :type: int
+    '''
+
+    default: bool = None
+    '''Default value for this number 
+
+    :type: bool
+    '''
+
+    default_array: bool = None
+    '''Default value for this array 
+
+    :type: bool
+    '''
+
+    is_array: bool = None
+    '''
+
+    :type: bool
+    '''
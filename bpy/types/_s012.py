@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BooleanModifier:
+    '''Boolean operations modifier '''
+
+    debug_options: typing.Set[typing.Union[int, str]] = None
+    '''Debugging options, only when started with ‘-d’ 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    double_threshold: float = None
+    '''Threshold for checking overlapping geometry 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Mesh object to use for Boolean operation 
+
+    :type: 'Object'
+    '''
+
+    operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    solver: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class BrightContrastModifier:
+    '''Bright/contrast modifier data for sequence strip '''
+
+    bright: float = None
+    '''Adjust the luminosity of the colors 
+
+    :type: float
+    '''
+
+    contrast: float = None
+    '''Adjust the difference in luminosity between pixels 
+
+    :type: float
+    '''
@@ -0,0 +1,582 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Brush:
+    '''Brush data-block for storing brush settings for painting and sculpting '''
+
+    auto_smooth_factor: float = None
+    '''Amount of smoothing to automatically apply to each stroke 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Brush blending mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    blur_kernel_radius: int = None
+    '''Radius of kernel used for soften and sharpen in pixels 
+
+    :type: int
+    '''
+
+    blur_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    brush_capabilities: 'BrushCapabilities' = None
+    '''Brush’s capabilities 
+
+    :type: 'BrushCapabilities'
+    '''
+
+    clone_alpha: float = None
+    '''Opacity of clone image display 
+
+    :type: float
+    '''
+
+    clone_image: 'Image' = None
+    '''Image for clone tool 
+
+    :type: 'Image'
+    '''
+
+    clone_offset: float = None
+    '''
+
+    :type: float
+    '''
+
+    color: float = None
+    '''
+
+    :type: float
+    '''
+
+    crease_pinch_factor: float = None
+    '''How much the crease brush pinches 
+
+    :type: float
+    '''
+
+    cursor_color_add: float = None
+    '''Color of cursor when adding 
+
+    :type: float
+    '''
+
+    cursor_color_subtract: float = None
+    '''Color of cursor when subtracting 
+
+    :type: float
+    '''
+
+    cursor_overlay_alpha: int = None
+    '''
+
+    :type: int
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Editable falloff curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    direction: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    fill_threshold: float = None
+    '''Threshold above which filling is not propagated 
+
+    :type: float
+    '''
+
+    grad_spacing: int = None
+    '''Spacing before brush gradient goes full circle 
+
+    :type: int
+    '''
+
+    gradient: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    gradient_fill_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    gradient_stroke_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    height: float = None
+    '''Affectable height of brush (layer height for layer tool, i.e.) 
+
+    :type: float
+    '''
+
+    icon_filepath: str = None
+    '''File path to brush icon 
+
+    :type: str
+    '''
+
+    image_paint_capabilities: 'ImapaintToolCapabilities' = None
+    '''Brush’s capabilities in image paint mode 
+
+    :type: 'ImapaintToolCapabilities'
+    '''
+
+    image_tool: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    jitter: float = None
+    '''Jitter the position of the brush while painting 
+
+    :type: float
+    '''
+
+    jitter_absolute: int = None
+    '''Jitter the position of the brush in pixels while painting 
+
+    :type: int
+    '''
+
+    mask_overlay_alpha: int = None
+    '''
+
+    :type: int
+    '''
+
+    mask_stencil_dimension: float = None
+    '''Dimensions of mask stencil in viewport 
+
+    :type: float
+    '''
+
+    mask_stencil_pos: float = None
+    '''Position of mask stencil in viewport 
+
+    :type: float
+    '''
+
+    mask_texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    mask_texture_slot: 'BrushTextureSlot' = None
+    '''
+
+    :type: 'BrushTextureSlot'
+    '''
+
+    mask_tool: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_weight: float = None
+    '''How much grab will pull vertexes out of surface during a grab 
+
+    :type: float
+    '''
+
+    paint_curve: 'PaintCurve' = None
+    '''Active Paint Curve 
+
+    :type: 'PaintCurve'
+    '''
+
+    plane_offset: float = None
+    '''Adjust plane on which the brush acts towards or away from the object surface 
+
+    :type: float
+    '''
+
+    plane_trim: float = None
+    '''If a vertex is further away from offset plane than this, then it is not affected 
+
+    :type: float
+    '''
+
+    rake_factor: float = None
+    '''How much grab will follow cursor rotation 
+
+    :type: float
+    '''
+
+    rate: float = None
+    '''Interval between paints for Airbrush 
+
+    :type: float
+    '''
+
+    sculpt_capabilities: 'SculptToolCapabilities' = None
+    '''Brush’s capabilities in sculpt mode 
+
+    :type: 'SculptToolCapabilities'
+    '''
+
+    sculpt_plane: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    sculpt_tool: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    secondary_color: float = None
+    '''
+
+    :type: float
+    '''
+
+    sharp_threshold: float = None
+    '''Threshold below which, no sharpening is done 
+
+    :type: float
+    '''
+
+    size: int = None
+    '''Radius of the brush in pixels 
+
+    :type: int
+    '''
+
+    smooth_stroke_factor: float = None
+    '''Higher values give a smoother stroke 
+
+    :type: float
+    '''
+
+    smooth_stroke_radius: int = None
+    '''Minimum distance from last point before stroke continues 
+
+    :type: int
+    '''
+
+    spacing: int = None
+    '''Spacing between brush daubs as a percentage of brush diameter 
+
+    :type: int
+    '''
+
+    stencil_dimension: float = None
+    '''Dimensions of stencil in viewport 
+
+    :type: float
+    '''
+
+    stencil_pos: float = None
+    '''Position of stencil in viewport 
+
+    :type: float
+    '''
+
+    strength: float = None
+    '''How powerful the effect of the brush is when applied 
+
+    :type: float
+    '''
+
+    stroke_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    texture_overlay_alpha: int = None
+    '''
+
+    :type: int
+    '''
+
+    texture_sample_bias: float = None
+    '''Value added to texture samples 
+
+    :type: float
+    '''
+
+    texture_slot: 'BrushTextureSlot' = None
+    '''
+
+    :type: 'BrushTextureSlot'
+    '''
+
+    unprojected_radius: float = None
+    '''Radius of brush in Blender units 
+
+    :type: float
+    '''
+
+    use_accumulate: bool = None
+    '''Accumulate stroke daubs on top of each other 
+
+    :type: bool
+    '''
+
+    use_adaptive_space: bool = None
+    '''Space daubs according to surface orientation instead of screen space 
+
+    :type: bool
+    '''
+
+    use_airbrush: bool = None
+    '''Keep applying paint effect while holding mouse (spray) 
+
+    :type: bool
+    '''
+
+    use_alpha: bool = None
+    '''When this is disabled, lock alpha while painting 
+
+    :type: bool
+    '''
+
+    use_anchor: bool = None
+    '''Keep the brush anchored to the initial location 
+
+    :type: bool
+    '''
+
+    use_cursor_overlay: bool = None
+    '''Show cursor in viewport 
+
+    :type: bool
+    '''
+
+    use_cursor_overlay_override: bool = None
+    '''Don’t show overlay during a stroke 
+
+    :type: bool
+    '''
+
+    use_curve: bool = None
+    '''Define the stroke curve with a bezier curve. Dabs are separated according to spacing 
+
+    :type: bool
+    '''
+
+    use_custom_icon: bool = None
+    '''Set the brush icon from an image file 
+
+    :type: bool
+    '''
+
+    use_edge_to_edge: bool = None
+    '''Drag anchor brush from edge-to-edge 
+
+    :type: bool
+    '''
+
+    use_frontface: bool = None
+    '''Brush only affects vertexes that face the viewer 
+
+    :type: bool
+    '''
+
+    use_gradient: bool = None
+    '''Use Gradient by utilizing a sampling method 
+
+    :type: bool
+    '''
+
+    use_inverse_smooth_pressure: bool = None
+    '''Lighter pressure causes more smoothing to be applied 
+
+    :type: bool
+    '''
+
+    use_line: bool = None
+    '''Draw a line with dabs separated according to spacing 
+
+    :type: bool
+    '''
+
+    use_locked_size: bool = None
+    '''When locked brush stays same size relative to object; when unlocked brush size is given in pixels 
+
+    :type: bool
+    '''
+
+    use_offset_pressure: bool = None
+    '''Enable tablet pressure sensitivity for offset 
+
+    :type: bool
+    '''
+
+    use_original_normal: bool = None
+    '''When locked keep using normal of surface where stroke was initiated 
+
+    :type: bool
+    '''
+
+    use_paint_image: bool = None
+    '''Use this brush in texture paint mode 
+
+    :type: bool
+    '''
+
+    use_paint_sculpt: bool = None
+    '''Use this brush in sculpt mode 
+
+    :type: bool
+    '''
+
+    use_paint_vertex: bool = None
+    '''Use this brush in vertex paint mode 
+
+    :type: bool
+    '''
+
+    use_paint_weight: bool = None
+    '''Use this brush in weight paint mode 
+
+    :type: bool
+    '''
+
+    use_persistent: bool = None
+    '''Sculpt on a persistent layer of the mesh 
+
+    :type: bool
+    '''
+
+    use_plane_trim: bool = None
+    '''Enable Plane Trim 
+
+    :type: bool
+    '''
+
+    use_pressure_jitter: bool = None
+    '''Enable tablet pressure sensitivity for jitter 
+
+    :type: bool
+    '''
+
+    use_pressure_masking: typing.Union[int, str] = None
+    '''Pen pressure makes texture influence smaller 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_pressure_size: bool = None
+    '''Enable tablet pressure sensitivity for size 
+
+    :type: bool
+    '''
+
+    use_pressure_spacing: bool = None
+    '''Enable tablet pressure sensitivity for spacing 
+
+    :type: bool
+    '''
+
+    use_pressure_strength: bool = None
+    '''Enable tablet pressure sensitivity for strength 
+
+    :type: bool
+    '''
+
+    use_primary_overlay: bool = None
+    '''Show texture in viewport 
+
+    :type: bool
+    '''
+
+    use_primary_overlay_override: bool = None
+    '''Don’t show overlay during a stroke 
+
+    :type: bool
+    '''
+
+    use_relative_jitter: bool = None
+    '''Jittering happens in screen space, not relative to brush size 
+
+    :type: bool
+    '''
+
+    use_restore_mesh: bool = None
+    '''Allow a single dot to be carefully positioned 
+
+    :type: bool
+    '''
+
+    use_secondary_overlay: bool = None
+    '''Show texture in viewport 
+
+    :type: bool
+    '''
+
+    use_secondary_overlay_override: bool = None
+    '''Don’t show overlay during a stroke 
+
+    :type: bool
+    '''
+
+    use_smooth_stroke: bool = None
+    '''Brush lags behind mouse and follows a smoother path 
+
+    :type: bool
+    '''
+
+    use_space: bool = None
+    '''Limit brush application to the distance specified by spacing 
+
+    :type: bool
+    '''
+
+    use_space_attenuation: bool = None
+    '''Automatically adjust strength to give consistent results for different spacings 
+
+    :type: bool
+    '''
+
+    vertex_tool: typing.Union[int, str] = None
+    '''Brush blending mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    weight: float = None
+    '''Vertex weight when brush is applied 
+
+    :type: float
+    '''
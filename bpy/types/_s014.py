@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class BrushCapabilities:
+    '''Read-only indications of which brush operations are supported by the current brush '''
+
+    has_overlay: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_random_texture_angle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_smooth_stroke: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_spacing: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class BrushTextureSlot:
+    '''Texture slot for textures in a Brush data-block '''
+
+    angle: float = None
+    '''Brush texture rotation 
+
+    :type: float
+    '''
+
+    has_random_texture_angle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_texture_angle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_texture_angle_source: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    map_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_map_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    random_angle: float = None
+    '''Brush texture random angle 
+
+    :type: float
+    '''
+
+    tex_paint_map_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_rake: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_random: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class BuildModifier:
+    '''Build effect modifier '''
+
+    frame_duration: float = None
+    '''Total time the build effect requires 
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''Start frame of the effect 
+
+    :type: float
+    '''
+
+    seed: int = None
+    '''Seed for random if used 
+
+    :type: int
+    '''
+
+    use_random_order: bool = None
+    '''Randomize the faces or edges during build 
+
+    :type: bool
+    '''
+
+    use_reverse: bool = None
+    '''Deconstruct the mesh instead of building it 
+
+    :type: bool
+    '''
+
+
+class CLIP_UL_tracking_objects:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class CYCLES:
+    def bake(self, scene, obj, pass_type, pass_filter, object_id, pixel_array,
+             num_pixels, depth, result):
+        '''
+
+        '''
+        pass
+
+    def render(self, scene):
+        '''
+
+        '''
+        pass
+
+    def update(self, data, scene):
+        '''
+
+        '''
+        pass
+
+    def update_render_passes(self, scene, srl):
+        '''
+
+        '''
+        pass
+
+    def update_script_node(self, node):
+        '''
+
+        '''
+        pass
+
+    def view_draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def view_update(self, context):
+        '''
+
+        '''
+        pass
+
+
+class CacheFile:
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    filepath: str = None
+    '''Path to external displacements file 
+
+    :type: str
+    '''
+
+    forward_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    frame: float = None
+    '''The time to use for looking up the data in the cache file, or to determine which file to use in a file sequence 
+
+    :type: float
+    '''
+
+    is_sequence: bool = None
+    '''Whether the cache is separated in a series of files 
+
+    :type: bool
+    '''
+
+    object_paths: typing.List['AlembicObjectPath'] = None
+    '''Paths of the objects inside the Alembic archive 
+
+    :type: typing.List['AlembicObjectPath']
+    '''
+
+    override_frame: bool = None
+    '''Whether to use a custom frame for looking up data in the cache file, instead of using the current scene frame 
+
+    :type: bool
+    '''
+
+    scale: float = None
+    '''Value by which to enlarge or shrink the object with respect to the world’s origin (only applicable through a Transform Cache constraint) 
+
+    :type: float
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
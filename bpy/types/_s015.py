@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Camera:
+    '''Camera data-block for storing camera settings '''
+
+    angle: float = None
+    '''Camera lens field of view 
+
+    :type: float
+    '''
+
+    angle_x: float = None
+    '''Camera lens horizontal field of view 
+
+    :type: float
+    '''
+
+    angle_y: float = None
+    '''Camera lens vertical field of view 
+
+    :type: float
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    clip_end: float = None
+    '''Camera far clipping distance 
+
+    :type: float
+    '''
+
+    clip_start: float = None
+    '''Camera near clipping distance 
+
+    :type: float
+    '''
+
+    cycles: 'CyclesCameraSettings' = None
+    '''Cycles camera settings 
+
+    :type: 'CyclesCameraSettings'
+    '''
+
+    dof_distance: float = None
+    '''Distance to the focus point for depth of field 
+
+    :type: float
+    '''
+
+    dof_object: 'Object' = None
+    '''Use this object to define the depth of field focal point 
+
+    :type: 'Object'
+    '''
+
+    draw_size: float = None
+    '''Apparent size of the Camera object in the 3D View 
+
+    :type: float
+    '''
+
+    gpu_dof: 'GPUDOFSettings' = None
+    '''
+
+    :type: 'GPUDOFSettings'
+    '''
+
+    lens: float = None
+    '''Perspective Camera lens value in millimeters 
+
+    :type: float
+    '''
+
+    lens_unit: typing.Union[int, str] = None
+    '''Unit to edit lens in for the user interface 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ortho_scale: float = None
+    '''Orthographic Camera scale (similar to zoom) 
+
+    :type: float
+    '''
+
+    passepartout_alpha: float = None
+    '''Opacity (alpha) of the darkened overlay in Camera view 
+
+    :type: float
+    '''
+
+    sensor_fit: typing.Union[int, str] = None
+    '''Method to fit image and field of view angle inside the sensor 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sensor_height: float = None
+    '''Vertical size of the image sensor area in millimeters 
+
+    :type: float
+    '''
+
+    sensor_width: float = None
+    '''Horizontal size of the image sensor area in millimeters 
+
+    :type: float
+    '''
+
+    shift_x: float = None
+    '''Camera horizontal shift 
+
+    :type: float
+    '''
+
+    shift_y: float = None
+    '''Camera vertical shift 
+
+    :type: float
+    '''
+
+    show_guide: typing.Set[typing.Union[int, str]] = None
+    '''Draw overlay 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    show_limits: bool = None
+    '''Draw the clipping range and focus point on the camera 
+
+    :type: bool
+    '''
+
+    show_mist: bool = None
+    '''Draw a line from the Camera to indicate the mist area 
+
+    :type: bool
+    '''
+
+    show_name: bool = None
+    '''Show the active Camera’s name in Camera view 
+
+    :type: bool
+    '''
+
+    show_passepartout: bool = None
+    '''Show a darkened overlay outside the image area in Camera view 
+
+    :type: bool
+    '''
+
+    show_safe_areas: bool = None
+    '''Show TV title safe and action safe areas in Camera view 
+
+    :type: bool
+    '''
+
+    show_safe_center: bool = None
+    '''Show safe areas to fit content in a different aspect ratio 
+
+    :type: bool
+    '''
+
+    show_sensor: bool = None
+    '''Show sensor size (film gate) in Camera view 
+
+    :type: bool
+    '''
+
+    stereo: 'CameraStereoData' = None
+    '''
+
+    :type: 'CameraStereoData'
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Camera types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def view_frame(self, scene: 'Scene' = None):
+        '''Return 4 points for the cameras frame (before object transformation) 
+
+        :param scene: Scene to use for aspect calculation, when omitted 1:1 aspect is used 
+        :type scene: 'Scene'
+        '''
+        pass
+
+
+class CameraActuator:
+    axis: typing.Union[int, str] = None
+    '''Axis the Camera will try to get behind 
+
+    :type: typing.Union[int, str]
+    '''
+
+    damping: float = None
+    '''Strength of the constraint that drives the camera behind the target 
+
+    :type: float
+    '''
+
+    height: float = None
+    '''
+
+    :type: float
+    '''
+
+    max: float = None
+    '''
+
+    :type: float
+    '''
+
+    min: float = None
+    '''
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Look at this Object 
+
+    :type: 'Object'
+    '''
+
+
+class CameraSolverConstraint:
+    '''Lock motion to the reconstructed camera movement '''
+
+    clip: 'MovieClip' = None
+    '''Movie Clip to get tracking data from 
+
+    :type: 'MovieClip'
+    '''
+
+    use_active_clip: bool = None
+    '''Use active clip defined in scene 
+
+    :type: bool
+    '''
+
+
+class CameraStereoData:
+    '''Stereoscopy settings for a Camera data-block '''
+
+    convergence_distance: float = None
+    '''The converge point for the stereo cameras (often the distance between a projector and the projection screen) 
+
+    :type: float
+    '''
+
+    convergence_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    interocular_distance: float = None
+    '''Set the distance between the eyes - the stereo plane distance / 30 should be fine 
+
+    :type: float
+    '''
+
+    pivot: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    pole_merge_angle_from: float = None
+    '''Angle at which interocular distance starts to fade to 0 
+
+    :type: float
+    '''
+
+    pole_merge_angle_to: float = None
+    '''Angle at which interocular distance is 0 
+
+    :type: float
+    '''
+
+    use_pole_merge: bool = None
+    '''Fade interocular distance to 0 after the given cutoff angle 
+
+    :type: bool
+    '''
+
+    use_spherical_stereo: bool = None
+    '''Render every pixel rotating the camera around the middle of the interocular distance 
+
+    :type: bool
+    '''
+
+
+class CastModifier:
+    '''Modifier to cast to other shapes '''
+
+    cast_type: typing.Union[int, str] = None
+    '''Target object shape 
+
+    :type: typing.Union[int, str]
+    '''
+
+    factor: float = None
+    '''
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Control object: if available, its location determines the center of the effect 
+
+    :type: 'Object'
+    '''
+
+    radius: float = None
+    '''Only deform vertices within this distance from the center of the effect (leave as 0 for infinite.) 
+
+    :type: float
+    '''
+
+    size: float = None
+    '''Size of projection shape (leave as 0 for auto) 
+
+    :type: float
+    '''
+
+    use_radius_as_size: bool = None
+    '''Use radius as size of projection shape (0 = auto) 
+
+    :type: bool
+    '''
+
+    use_transform: bool = None
+    '''Use object transform to control projection shape 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class ChannelDriverVariables:
+    '''Collection of channel driver Variables '''
+
+    def new(self, ) -> 'DriverVariable':
+        '''Add a new variable for the driver 
+
+        :rtype: 'DriverVariable'
+        :return:  Newly created Driver Variable 
+        '''
+        pass
+
+    def remove(self, variable: 'DriverVariable'):
+        '''Remove an existing variable from the driver 
+
+        :param variable: Variable to remove from the driver 
+        :type variable: 'DriverVariable'
+        '''
+        pass
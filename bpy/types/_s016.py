@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ChildOfConstraint:
+    '''Create constraint-based parent-child relationship '''
+
+    inverse_matrix: float = None
+    '''Transformation matrix to apply before 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_location_x: bool = None
+    '''Use X Location of Parent 
+
+    :type: bool
+    '''
+
+    use_location_y: bool = None
+    '''Use Y Location of Parent 
+
+    :type: bool
+    '''
+
+    use_location_z: bool = None
+    '''Use Z Location of Parent 
+
+    :type: bool
+    '''
+
+    use_rotation_x: bool = None
+    '''Use X Rotation of Parent 
+
+    :type: bool
+    '''
+
+    use_rotation_y: bool = None
+    '''Use Y Rotation of Parent 
+
+    :type: bool
+    '''
+
+    use_rotation_z: bool = None
+    '''Use Z Rotation of Parent 
+
+    :type: bool
+    '''
+
+    use_scale_x: bool = None
+    '''Use X Scale of Parent 
+
+    :type: bool
+    '''
+
+    use_scale_y: bool = None
+    '''Use Y Scale of Parent 
+
+    :type: bool
+    '''
+
+    use_scale_z: bool = None
+    '''Use Z Scale of Parent 
+
+    :type: bool
+    '''
+
+
+class ChildParticle:
+    '''Child particle interpolated from simulated or edited particles '''
+
+    pass
+
+
+class ClampToConstraint:
+    '''Constrain an object’s location to the nearest point along the target path '''
+
+    main_axis: typing.Union[int, str] = None
+    '''Main axis of movement 
+
+    :type: typing.Union[int, str]
+    '''
+
+    target: 'Object' = None
+    '''Target Object (Curves only) 
+
+    :type: 'Object'
+    '''
+
+    use_cyclic: bool = None
+    '''Treat curve as cyclic curve (no clamping to curve bounding box) 
+
+    :type: bool
+    '''
+
+
+class ClothCollisionSettings:
+    '''Cloth simulation settings for self collision and collision with other objects '''
+
+    collision_quality: int = None
+    '''How many collision iterations should be done. (higher is better quality but slower) 
+
+    :type: int
+    '''
+
+    damping: float = None
+    '''Amount of velocity lost on collision 
+
+    :type: float
+    '''
+
+    distance_min: float = None
+    '''Minimum distance between collision objects before collision response takes in 
+
+    :type: float
+    '''
+
+    distance_repel: float = None
+    '''Maximum distance to apply repulsion force, must be greater than minimum distance 
+
+    :type: float
+    '''
+
+    friction: float = None
+    '''Friction force if a collision happened (higher = less movement) 
+
+    :type: float
+    '''
+
+    group: 'Group' = None
+    '''Limit colliders to this Group 
+
+    :type: 'Group'
+    '''
+
+    repel_force: float = None
+    '''Repulsion force to apply on cloth when close to colliding 
+
+    :type: float
+    '''
+
+    self_collision_quality: int = None
+    '''How many self collision iterations should be done (higher is better quality but slower) 
+
+    :type: int
+    '''
+
+    self_distance_min: float = None
+    '''0.5 means no distance at all, 1.0 is maximum distance 
+
+    :type: float
+    '''
+
+    self_friction: float = None
+    '''Friction/damping with self contact 
+
+    :type: float
+    '''
+
+    use_collision: bool = None
+    '''Enable collisions with other objects 
+
+    :type: bool
+    '''
+
+    use_self_collision: bool = None
+    '''Enable self collisions 
+
+    :type: bool
+    '''
+
+    vertex_group_self_collisions: str = None
+    '''Vertex group to define vertices which are not used during self collisions 
+
+    :type: str
+    '''
+
+
+class ClothModifier:
+    '''Cloth simulation modifier '''
+
+    collision_settings: 'ClothCollisionSettings' = None
+    '''
+
+    :type: 'ClothCollisionSettings'
+    '''
+
+    hair_grid_max: float = None
+    '''
+
+    :type: float
+    '''
+
+    hair_grid_min: float = None
+    '''
+
+    :type: float
+    '''
+
+    hair_grid_resolution: int = None
+    '''
+
+    :type: int
+    '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    settings: 'ClothSettings' = None
+    '''
+
+    :type: 'ClothSettings'
+    '''
+
+    solver_result: 'ClothSolverResult' = None
+    '''
+
+    :type: 'ClothSolverResult'
+    '''
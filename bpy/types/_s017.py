@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ClothSettings:
+    '''Cloth simulation settings for an object '''
+
+    air_damping: float = None
+    '''Air has normally some thickness which slows falling things down 
+
+    :type: float
+    '''
+
+    bending_damping: float = None
+    '''Damping of bending motion 
+
+    :type: float
+    '''
+
+    bending_stiffness: float = None
+    '''Wrinkle coefficient (higher = less smaller but more big wrinkles) 
+
+    :type: float
+    '''
+
+    bending_stiffness_max: float = None
+    '''Maximum bending stiffness value 
+
+    :type: float
+    '''
+
+    collider_friction: float = None
+    '''
+
+    :type: float
+    '''
+
+    density_strength: float = None
+    '''Influence of target density on the simulation 
+
+    :type: float
+    '''
+
+    density_target: float = None
+    '''Maximum density of hair 
+
+    :type: float
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    goal_default: float = None
+    '''Default Goal (vertex target position) value, when no Vertex Group used 
+
+    :type: float
+    '''
+
+    goal_friction: float = None
+    '''Goal (vertex target position) friction 
+
+    :type: float
+    '''
+
+    goal_max: float = None
+    '''Goal maximum, vertex group weights are scaled to match this range 
+
+    :type: float
+    '''
+
+    goal_min: float = None
+    '''Goal minimum, vertex group weights are scaled to match this range 
+
+    :type: float
+    '''
+
+    goal_spring: float = None
+    '''Goal (vertex target position) spring stiffness 
+
+    :type: float
+    '''
+
+    gravity: float = None
+    '''Gravity or external force vector 
+
+    :type: float
+    '''
+
+    internal_friction: float = None
+    '''
+
+    :type: float
+    '''
+
+    mass: float = None
+    '''Mass of cloth material 
+
+    :type: float
+    '''
+
+    pin_stiffness: float = None
+    '''Pin (vertex target position) spring stiffness 
+
+    :type: float
+    '''
+
+    quality: int = None
+    '''Quality of the simulation in steps per frame (higher is better quality but slower) 
+
+    :type: int
+    '''
+
+    rest_shape_key: 'ShapeKey' = None
+    '''Shape key to use the rest spring lengths from 
+
+    :type: 'ShapeKey'
+    '''
+
+    sewing_force_max: float = None
+    '''Maximum sewing force 
+
+    :type: float
+    '''
+
+    shrink_max: float = None
+    '''Max amount to shrink cloth by 
+
+    :type: float
+    '''
+
+    shrink_min: float = None
+    '''Min amount to shrink cloth by 
+
+    :type: float
+    '''
+
+    spring_damping: float = None
+    '''Damping of cloth velocity (higher = more smooth, less jiggling) 
+
+    :type: float
+    '''
+
+    structural_stiffness: float = None
+    '''Overall stiffness of structure 
+
+    :type: float
+    '''
+
+    structural_stiffness_max: float = None
+    '''Maximum structural stiffness value 
+
+    :type: float
+    '''
+
+    time_scale: float = None
+    '''Cloth speed is multiplied by this value 
+
+    :type: float
+    '''
+
+    use_dynamic_mesh: bool = None
+    '''Make simulation respect deformations in the base mesh 
+
+    :type: bool
+    '''
+
+    use_pin_cloth: bool = None
+    '''Enable pinning of cloth vertices to other objects/positions 
+
+    :type: bool
+    '''
+
+    use_sewing_springs: bool = None
+    '''Pulls loose edges together 
+
+    :type: bool
+    '''
+
+    use_stiffness_scale: bool = None
+    '''If enabled, stiffness can be scaled along a weight painted vertex group 
+
+    :type: bool
+    '''
+
+    vel_damping: float = None
+    '''Damp velocity to help cloth reach the resting position faster (1.0 = no damping, 0.0 = fully dampened) 
+
+    :type: float
+    '''
+
+    vertex_group_bending: str = None
+    '''Vertex group for fine control over bending stiffness 
+
+    :type: str
+    '''
+
+    vertex_group_mass: str = None
+    '''Vertex Group for pinning of vertices 
+
+    :type: str
+    '''
+
+    vertex_group_shrink: str = None
+    '''Vertex Group for shrinking cloth 
+
+    :type: str
+    '''
+
+    vertex_group_structural_stiffness: str = None
+    '''Vertex group for fine control over structural stiffness 
+
+    :type: str
+    '''
+
+    voxel_cell_size: float = None
+    '''Size of the voxel grid cells for interaction effects 
+
+    :type: float
+    '''
+
+
+class ClothSolverResult:
+    '''Result of cloth solver iteration '''
+
+    avg_error: float = None
+    '''Average error during substeps 
+
+    :type: float
+    '''
+
+    avg_iterations: float = None
+    '''Average iterations during substeps 
+
+    :type: float
+    '''
+
+    max_error: float = None
+    '''Maximum error during substeps 
+
+    :type: float
+    '''
+
+    max_iterations: int = None
+    '''Maximum iterations during substeps 
+
+    :type: int
+    '''
+
+    min_error: float = None
+    '''Minimum error during substeps 
+
+    :type: float
+    '''
+
+    min_iterations: int = None
+    '''Minimum iterations during substeps 
+
+    :type: int
+    '''
+
+    status: typing.Set[typing.Union[int, str]] = None
+    '''Status of the solver iteration 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+
+class CloudsTexture:
+    '''Procedural noise texture '''
+
+    cloud_type: typing.Union[int, str] = None
+    '''Determine whether Noise returns grayscale or RGB values 
+
+    :type: typing.Union[int, str]
+    '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_depth: int = None
+    '''Depth of the cloud calculation 
+
+    :type: int
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    noise_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class CollectionProperty:
+    '''RNA collection property to define lists, arrays and mappings '''
+
+    fixed_type: 'Struct' = None
+    '''Fixed pointer type, empty if variable type 
+
+    :type: 'Struct'
+    '''
+
+
+class CollisionModifier:
+    '''Collision modifier defining modifier stack position used for collision '''
+
+    settings: 'CollisionSettings' = None
+    '''
+
+    :type: 'CollisionSettings'
+    '''
+
+
+class CollisionSensor:
+    '''Sensor to detect objects colliding with the current object, with more settings than the Touch sensor '''
+
+    material: str = None
+    '''Only look for objects with this material (blank = all objects) 
+
+    :type: str
+    '''
+
+    property: str = None
+    '''Only look for objects with this property (blank = all objects) 
+
+    :type: str
+    '''
+
+    use_material: bool = None
+    '''Toggle collision on material or property 
+
+    :type: bool
+    '''
+
+    use_pulse: bool = None
+    '''Change to the set of colliding objects generates pulse 
+
+    :type: bool
+    '''
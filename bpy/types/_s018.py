@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CollisionSettings:
+    '''Collision settings for object in physics simulation '''
+
+    absorption: float = None
+    '''How much of effector force gets lost during collision with this object (in percent) 
+
+    :type: float
+    '''
+
+    damping: float = None
+    '''Amount of damping during collision 
+
+    :type: float
+    '''
+
+    damping_factor: float = None
+    '''Amount of damping during particle collision 
+
+    :type: float
+    '''
+
+    damping_random: float = None
+    '''Random variation of damping 
+
+    :type: float
+    '''
+
+    friction_factor: float = None
+    '''Amount of friction during particle collision 
+
+    :type: float
+    '''
+
+    friction_random: float = None
+    '''Random variation of friction 
+
+    :type: float
+    '''
+
+    permeability: float = None
+    '''Chance that the particle will pass through the mesh 
+
+    :type: float
+    '''
+
+    stickiness: float = None
+    '''Amount of stickiness to surface collision 
+
+    :type: float
+    '''
+
+    thickness_inner: float = None
+    '''Inner face thickness (only used by softbodies) 
+
+    :type: float
+    '''
+
+    thickness_outer: float = None
+    '''Outer face thickness 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Enable this objects as a collider for physics systems 
+
+    :type: bool
+    '''
+
+    use_particle_kill: bool = None
+    '''Kill collided particles 
+
+    :type: bool
+    '''
+
+
+class ColorBalanceModifier:
+    '''Color balance modifier for sequence strip '''
+
+    color_balance: 'SequenceColorBalanceData' = None
+    '''
+
+    :type: 'SequenceColorBalanceData'
+    '''
+
+    color_multiply: float = None
+    '''Multiply the intensity of each pixel 
+
+    :type: float
+    '''
+
+
+class ColorManagedDisplaySettings:
+    '''Color management specific to display device '''
+
+    display_device: typing.Union[int, str] = None
+    '''Display device name 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ColorManagedInputColorspaceSettings:
+    '''Input color space settings '''
+
+    name: typing.Union[int, str] = None
+    '''Color space of the image or movie on disk 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ColorManagedSequencerColorspaceSettings:
+    '''Input color space settings '''
+
+    name: typing.Union[int, str] = None
+    '''Color space that the sequencer operates in 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ColorManagedViewSettings:
+    '''Color management settings used for displaying images on the display '''
+
+    curve_mapping: 'CurveMapping' = None
+    '''Color curve mapping applied before display transform 
+
+    :type: 'CurveMapping'
+    '''
+
+    exposure: float = None
+    '''Exposure (stops) applied before display transform 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''Amount of gamma modification applied after display transform 
+
+    :type: float
+    '''
+
+    look: typing.Union[int, str] = None
+    '''Additional transform applied before view transform for an artistic needs 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_curve_mapping: bool = None
+    '''Use RGB curved for pre-display transformation 
+
+    :type: bool
+    '''
+
+    view_transform: typing.Union[int, str] = None
+    '''View used when converting image to a display space 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ColorMapping:
+    '''Color mapping settings '''
+
+    blend_color: float = None
+    '''Blend color to mix with texture output color 
+
+    :type: float
+    '''
+
+    blend_factor: float = None
+    '''
+
+    :type: float
+    '''
+
+    blend_type: typing.Union[int, str] = None
+    '''Mode used to mix with texture output color 
+
+    :type: typing.Union[int, str]
+    '''
+
+    brightness: float = None
+    '''Adjust the brightness of the texture 
+
+    :type: float
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    contrast: float = None
+    '''Adjust the contrast of the texture 
+
+    :type: float
+    '''
+
+    saturation: float = None
+    '''Adjust the saturation of colors in the texture 
+
+    :type: float
+    '''
+
+    use_color_ramp: bool = None
+    '''Toggle color ramp operations 
+
+    :type: bool
+    '''
+
+
+class ColorRamp:
+    '''Color ramp mapping a scalar value to a color '''
+
+    color_mode: typing.Union[int, str] = None
+    '''Set color mode to use for interpolation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    elements: typing.List['ColorRampElements'] = None
+    '''
+
+    :type: typing.List['ColorRampElements']
+    '''
+
+    hue_interpolation: typing.Union[int, str] = None
+    '''Set color interpolation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Set interpolation between color stops 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def evaluate(self, position: float) -> float:
+        '''Evaluate ColorRamp 
+
+        :param position: Position, Evaluate ColorRamp at position 
+        :type position: float
+        :rtype: float
+        :return:  Color, Color at given position 
+        '''
+        pass
+
+
+class ColorRampElement:
+    '''Element defining a color at a position in the color ramp '''
+
+    alpha: float = None
+    '''Set alpha of selected color stop 
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Set color of selected color stop 
+
+    :type: float
+    '''
+
+    position: float = None
+    '''Set position of selected color stop 
+
+    :type: float
+    '''
+
+
+class ColorRampElements:
+    '''Collection of Color Ramp Elements '''
+
+    def new(self, position: float) -> 'ColorRampElement':
+        '''Add element to ColorRamp 
+
+        :param position: Position, Position to add element 
+        :type position: float
+        :rtype: 'ColorRampElement'
+        :return:  New element 
+        '''
+        pass
+
+    def remove(self, element: 'ColorRampElement'):
+        '''Delete element from ColorRamp 
+
+        :param element: Element to remove 
+        :type element: 'ColorRampElement'
+        '''
+        pass
+
+
+class ColorSequence:
+    '''Sequence strip creating an image filled with a single color '''
+
+    color: float = None
+    '''Effect Strip color 
+
+    :type: float
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class CompositorNode:
+    def tag_need_exec(self, ):
+        '''Tag the node for compositor update 
+
+        '''
+        pass
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeAlphaOver:
+    premul: float = None
+    '''Mix Factor 
+
+    :type: float
+    '''
+
+    use_premultiply: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeBilateralblur:
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    sigma_color: float = None
+    '''
+
+    :type: float
+    '''
+
+    sigma_space: float = None
+    '''
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
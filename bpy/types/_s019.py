@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeBlur:
+    aspect_correction: typing.Union[int, str] = None
+    '''Type of aspect correction to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    factor: float = None
+    '''
+
+    :type: float
+    '''
+
+    factor_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    factor_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    size_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    size_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    use_bokeh: bool = None
+    '''Use circular filter (slower) 
+
+    :type: bool
+    '''
+
+    use_extended_bounds: bool = None
+    '''Extend bounds of the input image to fully fit blurred image 
+
+    :type: bool
+    '''
+
+    use_gamma_correction: bool = None
+    '''Apply filter on gamma corrected values 
+
+    :type: bool
+    '''
+
+    use_relative: bool = None
+    '''Use relative (percent) values to define blur radius 
+
+    :type: bool
+    '''
+
+    use_variable_size: bool = None
+    '''Support variable blur per-pixel when using an image for size input 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeBokehBlur:
+    blur_max: float = None
+    '''Blur limit, maximum CoC radius 
+
+    :type: float
+    '''
+
+    use_extended_bounds: bool = None
+    '''Extend bounds of the input image to fully fit blurred image 
+
+    :type: bool
+    '''
+
+    use_variable_size: bool = None
+    '''Support variable blur per-pixel when using an image for size input 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeBokehImage:
+    angle: float = None
+    '''Angle of the bokeh 
+
+    :type: float
+    '''
+
+    catadioptric: float = None
+    '''Level of catadioptric of the bokeh 
+
+    :type: float
+    '''
+
+    flaps: int = None
+    '''Number of flaps 
+
+    :type: int
+    '''
+
+    rounding: float = None
+    '''Level of rounding of the bokeh 
+
+    :type: float
+    '''
+
+    shift: float = None
+    '''Shift of the lens components 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeBoxMask:
+    height: float = None
+    '''Height of the box 
+
+    :type: float
+    '''
+
+    mask_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    rotation: float = None
+    '''Rotation angle of the box 
+
+    :type: float
+    '''
+
+    width: float = None
+    '''Width of the box 
+
+    :type: float
+    '''
+
+    x: float = None
+    '''X position of the middle of the box 
+
+    :type: float
+    '''
+
+    y: float = None
+    '''Y position of the middle of the box 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeBrightContrast:
+    use_premultiply: bool = None
+    '''Keep output image premultiplied alpha 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeChannelMatte:
+    color_space: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_channel: typing.Union[int, str] = None
+    '''Limit by this channel’s value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_max: float = None
+    '''Values higher than this setting are 100% opaque 
+
+    :type: float
+    '''
+
+    limit_method: typing.Union[int, str] = None
+    '''Algorithm to use to limit channel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_min: float = None
+    '''Values lower than this setting are 100% keyed 
+
+    :type: float
+    '''
+
+    matte_channel: typing.Union[int, str] = None
+    '''Channel used to determine matte 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeChromaMatte:
+    gain: float = None
+    '''Alpha falloff 
+
+    :type: float
+    '''
+
+    lift: float = None
+    '''Alpha lift 
+
+    :type: float
+    '''
+
+    shadow_adjust: float = None
+    '''Adjusts the brightness of any shadows captured 
+
+    :type: float
+    '''
+
+    threshold: float = None
+    '''Tolerance below which colors will be considered as exact matches 
+
+    :type: float
+    '''
+
+    tolerance: float = None
+    '''Tolerance for a color to be considered a keying color 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeColorBalance:
+    correction_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    gain: float = None
+    '''Correction for Highlights 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''Correction for Midtones 
+
+    :type: float
+    '''
+
+    lift: float = None
+    '''Correction for Shadows 
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''Correction for Shadows 
+
+    :type: float
+    '''
+
+    offset_basis: float = None
+    '''Support negative color by using this as the RGB basis 
+
+    :type: float
+    '''
+
+    power: float = None
+    '''Correction for Midtones 
+
+    :type: float
+    '''
+
+    slope: float = None
+    '''Correction for Highlights 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeColorCorrection:
+    blue: bool = None
+    '''Blue channel active 
+
+    :type: bool
+    '''
+
+    green: bool = None
+    '''Green channel active 
+
+    :type: bool
+    '''
+
+    highlights_contrast: float = None
+    '''Highlights contrast 
+
+    :type: float
+    '''
+
+    highlights_gain: float = None
+    '''Highlights gain 
+
+    :type: float
+    '''
+
+    highlights_gamma: float = None
+    '''Highlights gamma 
+
+    :type: float
+    '''
+
+    highlights_lift: float = None
+    '''Highlights lift 
+
+    :type: float
+    '''
+
+    highlights_saturation: float = None
+    '''Highlights saturation 
+
+    :type: float
+    '''
+
+    master_contrast: float = None
+    '''Master contrast 
+
+    :type: float
+    '''
+
+    master_gain: float = None
+    '''Master gain 
+
+    :type: float
+    '''
+
+    master_gamma: float = None
+    '''Master gamma 
+
+    :type: float
+    '''
+
+    master_lift: float = None
+    '''Master lift 
+
+    :type: float
+    '''
+
+    master_saturation: float = None
+    '''Master saturation 
+
+    :type: float
+    '''
+
+    midtones_contrast: float = None
+    '''Midtones contrast 
+
+    :type: float
+    '''
+
+    midtones_end: float = None
+    '''End of midtones 
+
+    :type: float
+    '''
+
+    midtones_gain: float = None
+    '''Midtones gain 
+
+    :type: float
+    '''
+
+    midtones_gamma: float = None
+    '''Midtones gamma 
+
+    :type: float
+    '''
+
+    midtones_lift: float = None
+    '''Midtones lift 
+
+    :type: float
+    '''
+
+    midtones_saturation: float = None
+    '''Midtones saturation 
+
+    :type: float
+    '''
+
+    midtones_start: float = None
+    '''Start of midtones 
+
+    :type: float
+    '''
+
+    red: bool = None
+    '''Red channel active 
+
+    :type: bool
+    '''
+
+    shadows_contrast: float = None
+    '''Shadows contrast 
+
+    :type: float
+    '''
+
+    shadows_gain: float = None
+    '''Shadows gain 
+
+    :type: float
+    '''
+
+    shadows_gamma: float = None
+    '''Shadows gamma 
+
+    :type: float
+    '''
+
+    shadows_lift: float = None
+    '''Shadows lift 
+
+    :type: float
+    '''
+
+    shadows_saturation: float = None
+    '''Shadows saturation 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeColorMatte:
+    color_hue: float = None
+    '''Hue tolerance for colors to be considered a keying color 
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Saturation Tolerance for the color 
+
+    :type: float
+    '''
+
+    color_value: float = None
+    '''Value Tolerance for the color 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeColorSpill:
+    channel: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_channel: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    ratio: float = None
+    '''Scale limit by value 
+
+    :type: float
+    '''
+
+    unspill_blue: float = None
+    '''Blue spillmap scale 
+
+    :type: float
+    '''
+
+    unspill_green: float = None
+    '''Green spillmap scale 
+
+    :type: float
+    '''
+
+    unspill_red: float = None
+    '''Red spillmap scale 
+
+    :type: float
+    '''
+
+    use_unspill: bool = None
+    '''Compensate all channels (differently) by hand 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCombHSVA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCombRGBA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCombYCCA:
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCombYUVA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeComposite:
+    use_alpha: bool = None
+    '''Colors are treated alpha premultiplied, or colors output straight (alpha gets set to 1) 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCornerPin:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCrop:
+    max_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    max_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    min_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    min_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    rel_max_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    rel_max_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    rel_min_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    rel_min_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    relative: bool = None
+    '''Use relative values to crop image 
+
+    :type: bool
+    '''
+
+    use_crop_size: bool = None
+    '''Whether to crop the size of the input image 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCurveRGB:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeCurveVec:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
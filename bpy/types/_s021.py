@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeDBlur:
+    angle: float = None
+    '''
+
+    :type: float
+    '''
+
+    center_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    center_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    distance: float = None
+    '''
+
+    :type: float
+    '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    spin: float = None
+    '''
+
+    :type: float
+    '''
+
+    use_wrap: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    zoom: float = None
+    '''
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDefocus:
+    angle: float = None
+    '''Bokeh shape rotation offset 
+
+    :type: float
+    '''
+
+    blur_max: float = None
+    '''Blur limit, maximum CoC radius 
+
+    :type: float
+    '''
+
+    bokeh: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    f_stop: float = None
+    '''Amount of focal blur, 128=infinity=perfect focus, half the value doubles the blur radius 
+
+    :type: float
+    '''
+
+    scene: 'Scene' = None
+    '''Scene from which to select the active camera (render scene if undefined) 
+
+    :type: 'Scene'
+    '''
+
+    threshold: float = None
+    '''CoC radius threshold, prevents background bleed on in-focus midground, 0=off 
+
+    :type: float
+    '''
+
+    use_gamma_correction: bool = None
+    '''Enable gamma correction before and after main process 
+
+    :type: bool
+    '''
+
+    use_preview: bool = None
+    '''Enable low quality mode, useful for preview 
+
+    :type: bool
+    '''
+
+    use_zbuffer: bool = None
+    '''Disable when using an image as input instead of actual z-buffer (auto enabled if node not image based, eg. time node) 
+
+    :type: bool
+    '''
+
+    z_scale: float = None
+    '''Scale the Z input when not using a z-buffer, controls maximum blur designated by the color white or input value 1 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDespeckle:
+    threshold: float = None
+    '''Threshold for detecting pixels to despeckle 
+
+    :type: float
+    '''
+
+    threshold_neighbor: float = None
+    '''Threshold for the number of neighbor pixels that must match 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDiffMatte:
+    falloff: float = None
+    '''Color distances below this additional threshold are partially keyed 
+
+    :type: float
+    '''
+
+    tolerance: float = None
+    '''Color distances below this threshold are keyed 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDilateErode:
+    distance: int = None
+    '''Distance to grow/shrink (number of iterations) 
+
+    :type: int
+    '''
+
+    edge: float = None
+    '''Edge to inset 
+
+    :type: float
+    '''
+
+    falloff: typing.Union[int, str] = None
+    '''Falloff type the feather 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Growing/shrinking mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDisplace:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDistanceMatte:
+    channel: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    falloff: float = None
+    '''Color distances below this additional threshold are partially keyed 
+
+    :type: float
+    '''
+
+    tolerance: float = None
+    '''Color distances below this threshold are keyed 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeDoubleEdgeMask:
+    edge_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    inner_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeEllipseMask:
+    height: float = None
+    '''Height of the ellipse 
+
+    :type: float
+    '''
+
+    mask_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    rotation: float = None
+    '''Rotation angle of the ellipse 
+
+    :type: float
+    '''
+
+    width: float = None
+    '''Width of the ellipse 
+
+    :type: float
+    '''
+
+    x: float = None
+    '''X position of the middle of the ellipse 
+
+    :type: float
+    '''
+
+    y: float = None
+    '''Y position of the middle of the ellipse 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeFilter:
+    filter_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeFlip:
+    axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeGamma:
+    def update(self, ):
+        '''
+
+        '''
+        pass
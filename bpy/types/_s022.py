@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeGlare:
+    angle_offset: float = None
+    '''Streak angle offset 
+
+    :type: float
+    '''
+
+    color_modulation: float = None
+    '''Amount of Color Modulation, modulates colors of streaks and ghosts for a spectral dispersion effect 
+
+    :type: float
+    '''
+
+    fade: float = None
+    '''Streak fade-out factor 
+
+    :type: float
+    '''
+
+    glare_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    mix: float = None
+    '''-1 is original image only, 0 is exact 50/50 mix, 1 is processed image only 
+
+    :type: float
+    '''
+
+    quality: typing.Union[int, str] = None
+    '''If not set to high quality, the effect will be applied to a low-res copy of the source image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    size: int = None
+    '''Glow/glare size (not actual size; relative to initial size of bright area of pixels) 
+
+    :type: int
+    '''
+
+    streaks: int = None
+    '''Total number of streaks 
+
+    :type: int
+    '''
+
+    threshold: float = None
+    '''The glare filter will only be applied to pixels brighter than this value 
+
+    :type: float
+    '''
+
+    use_rotate_45: bool = None
+    '''Simple star filter: add 45 degree rotation offset 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeGroup:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''
+
+    :type: 'NodeTree'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeHueCorrect:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeHueSat:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeIDMask:
+    index: int = None
+    '''Pass index number to convert to alpha 
+
+    :type: int
+    '''
+
+    use_antialiasing: bool = None
+    '''Apply an anti-aliasing filter to the mask 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeImage:
+    frame_duration: int = None
+    '''Number of images of a movie to use 
+
+    :type: int
+    '''
+
+    frame_offset: int = None
+    '''Offset the number of the frame to use in the animation 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Global starting frame of the movie/sequence, assuming first picture has a #1 
+
+    :type: int
+    '''
+
+    has_layers: bool = None
+    '''True if this image has any named layer 
+
+    :type: bool
+    '''
+
+    has_views: bool = None
+    '''True if this image has multiple views 
+
+    :type: bool
+    '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    layer: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_auto_refresh: bool = None
+    '''Always refresh image on frame changes 
+
+    :type: bool
+    '''
+
+    use_cyclic: bool = None
+    '''Cycle the images in the movie 
+
+    :type: bool
+    '''
+
+    use_straight_alpha_output: bool = None
+    '''Put Node output buffer to straight alpha instead of premultiplied 
+
+    :type: bool
+    '''
+
+    view: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeInpaint:
+    distance: int = None
+    '''Distance to inpaint (number of iterations) 
+
+    :type: int
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeInvert:
+    invert_alpha: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    invert_rgb: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeKeying:
+    blur_post: int = None
+    '''Matte blur size which applies after clipping and dilate/eroding 
+
+    :type: int
+    '''
+
+    blur_pre: int = None
+    '''Chroma pre-blur size which applies before running keyer 
+
+    :type: int
+    '''
+
+    clip_black: float = None
+    '''Value of non-scaled matte pixel which considers as fully background pixel 
+
+    :type: float
+    '''
+
+    clip_white: float = None
+    '''Value of non-scaled matte pixel which considers as fully foreground pixel 
+
+    :type: float
+    '''
+
+    despill_balance: float = None
+    '''Balance between non-key colors used to detect amount of key color to be removed 
+
+    :type: float
+    '''
+
+    despill_factor: float = None
+    '''Factor of despilling screen color from image 
+
+    :type: float
+    '''
+
+    dilate_distance: int = None
+    '''Matte dilate/erode side 
+
+    :type: int
+    '''
+
+    edge_kernel_radius: int = None
+    '''Radius of kernel used to detect whether pixel belongs to edge 
+
+    :type: int
+    '''
+
+    edge_kernel_tolerance: float = None
+    '''Tolerance to pixels inside kernel which are treating as belonging to the same plane 
+
+    :type: float
+    '''
+
+    feather_distance: int = None
+    '''Distance to grow/shrink the feather 
+
+    :type: int
+    '''
+
+    feather_falloff: typing.Union[int, str] = None
+    '''Falloff type the feather 
+
+    :type: typing.Union[int, str]
+    '''
+
+    screen_balance: float = None
+    '''Balance between two non-primary channels primary channel is comparing against 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeKeyingScreen:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    tracking_object: str = None
+    '''
+
+    :type: str
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeLensdist:
+    use_fit: bool = None
+    '''For positive distortion factor only: scale image such that black areas are not visible 
+
+    :type: bool
+    '''
+
+    use_jitter: bool = None
+    '''Enable/disable jittering (faster, but also noisier) 
+
+    :type: bool
+    '''
+
+    use_projector: bool = None
+    '''Enable/disable projector mode (the effect is applied in horizontal direction only) 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeLevels:
+    channel: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
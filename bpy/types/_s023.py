@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeLumaMatte:
+    limit_max: float = None
+    '''Values higher than this setting are 100% opaque 
+
+    :type: float
+    '''
+
+    limit_min: float = None
+    '''Values lower than this setting are 100% keyed 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMapRange:
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMapUV:
+    alpha: int = None
+    '''
+
+    :type: int
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMapValue:
+    max: float = None
+    '''
+
+    :type: float
+    '''
+
+    min: float = None
+    '''
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''
+
+    :type: float
+    '''
+
+    size: float = None
+    '''
+
+    :type: float
+    '''
+
+    use_max: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_min: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMask:
+    mask: 'Mask' = None
+    '''
+
+    :type: 'Mask'
+    '''
+
+    motion_blur_samples: int = None
+    '''Number of motion blur samples 
+
+    :type: int
+    '''
+
+    motion_blur_shutter: float = None
+    '''Exposure for motion blur as a factor of FPS 
+
+    :type: float
+    '''
+
+    size_source: typing.Union[int, str] = None
+    '''Where to get the mask size from for aspect/size information 
+
+    :type: typing.Union[int, str]
+    '''
+
+    size_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    size_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    use_antialiasing: bool = None
+    '''Apply an anti-aliasing filter to the mask 
+
+    :type: bool
+    '''
+
+    use_feather: bool = None
+    '''Use feather information from the mask 
+
+    :type: bool
+    '''
+
+    use_motion_blur: bool = None
+    '''Use multi-sampled motion blur of the mask 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMath:
+    operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMixRGB:
+    blend_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_alpha: bool = None
+    '''Include alpha of second input in this operation 
+
+    :type: bool
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMovieClip:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeMovieDistortion:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    distortion_type: typing.Union[int, str] = None
+    '''Distortion to use to filter image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeNormal:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeNormalize:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeOutputFile:
+    active_input_index: int = None
+    '''Active input index in details view list 
+
+    :type: int
+    '''
+
+    base_path: str = None
+    '''Base output path for the image 
+
+    :type: str
+    '''
+
+    file_slots: typing.List['CompositorNodeOutputFileFileSlots'] = None
+    '''
+
+    :type: typing.List['CompositorNodeOutputFileFileSlots']
+    '''
+
+    format: 'ImageFormatSettings' = None
+    '''
+
+    :type: 'ImageFormatSettings'
+    '''
+
+    layer_slots: typing.List['CompositorNodeOutputFileLayerSlots'] = None
+    '''
+
+    :type: typing.List['CompositorNodeOutputFileLayerSlots']
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeOutputFileFileSlots:
+    '''Collection of File Output node slots '''
+
+    def new(self, name: str) -> 'NodeSocket':
+        '''Add a file slot to this node 
+
+        :param name: Name 
+        :type name: str
+        :rtype: 'NodeSocket'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocket'):
+        '''Remove a file slot from this node 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocket'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all file slots from this node 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a file slot to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class CompositorNodeOutputFileLayerSlots:
+    '''Collection of File Output node slots '''
+
+    def new(self, name: str) -> 'NodeSocket':
+        '''Add a file slot to this node 
+
+        :param name: Name 
+        :type name: str
+        :rtype: 'NodeSocket'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocket'):
+        '''Remove a file slot from this node 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocket'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all file slots from this node 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a file slot to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class CompositorNodePixelate:
+    def update(self, ):
+        '''
+
+        '''
+        pass
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodePlaneTrackDeform:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    motion_blur_samples: int = None
+    '''Number of motion blur samples 
+
+    :type: int
+    '''
+
+    motion_blur_shutter: float = None
+    '''Exposure for motion blur as a factor of FPS 
+
+    :type: float
+    '''
+
+    plane_track_name: str = None
+    '''
+
+    :type: str
+    '''
+
+    tracking_object: str = None
+    '''
+
+    :type: str
+    '''
+
+    use_motion_blur: bool = None
+    '''Use multi-sampled motion blur of the mask 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodePremulKey:
+    mapping: typing.Union[int, str] = None
+    '''Conversion between premultiplied alpha and key alpha 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeRGB:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeRGBToBW:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeRLayers:
+    layer: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    scene: 'Scene' = None
+    '''
+
+    :type: 'Scene'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeRotate:
+    filter_type: typing.Union[int, str] = None
+    '''Method to use to filter rotation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeScale:
+    frame_method: typing.Union[int, str] = None
+    '''How the image fits in the camera frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+    offset_x: float = None
+    '''Offset image horizontally (factor of image size) 
+
+    :type: float
+    '''
+
+    offset_y: float = None
+    '''Offset image vertically (factor of image size) 
+
+    :type: float
+    '''
+
+    space: typing.Union[int, str] = None
+    '''Coordinate space to scale relative to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSepHSVA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSepRGBA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSepYCCA:
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSepYUVA:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSetAlpha:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSplitViewer:
+    axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    factor: int = None
+    '''
+
+    :type: int
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeStabilize:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Method to use to filter stabilization 
+
+    :type: typing.Union[int, str]
+    '''
+
+    invert: bool = None
+    '''Invert stabilization to re-introduce motion to the frame 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSunBeams:
+    ray_length: float = None
+    '''Length of rays as a factor of the image size 
+
+    :type: float
+    '''
+
+    source: float = None
+    '''Source point of rays as a factor of the image width & height 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSwitch:
+    check: bool = None
+    '''Off: first socket, On: second socket 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeSwitchView:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTexture:
+    node_output: int = None
+    '''For node-based textures, which output node to use 
+
+    :type: int
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTime:
+    curve: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    frame_end: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''
+
+    :type: int
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTonemap:
+    adaptation: float = None
+    '''If 0, global; if 1, based on pixel intensity 
+
+    :type: float
+    '''
+
+    contrast: float = None
+    '''Set to 0 to use estimate from input image 
+
+    :type: float
+    '''
+
+    correction: float = None
+    '''If 0, same for all channels; if 1, each independent 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''If not used, set to 1 
+
+    :type: float
+    '''
+
+    intensity: float = None
+    '''If less than zero, darkens image; otherwise, makes it brighter 
+
+    :type: float
+    '''
+
+    key: float = None
+    '''The value the average luminance is mapped to 
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''Normally always 1, but can be used as an extra control to alter the brightness curve 
+
+    :type: float
+    '''
+
+    tonemap_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
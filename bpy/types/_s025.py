@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CompositorNodeTrackPos:
+    clip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    frame_relative: int = None
+    '''Frame to be used for relative position 
+
+    :type: int
+    '''
+
+    position: typing.Union[int, str] = None
+    '''Which marker position to use for output 
+
+    :type: typing.Union[int, str]
+    '''
+
+    track_name: str = None
+    '''
+
+    :type: str
+    '''
+
+    tracking_object: str = None
+    '''
+
+    :type: str
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTransform:
+    filter_type: typing.Union[int, str] = None
+    '''Method to use to filter transform 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTranslate:
+    use_relative: bool = None
+    '''Use relative (fraction of input image size) values to define translation 
+
+    :type: bool
+    '''
+
+    wrap_axis: typing.Union[int, str] = None
+    '''Wrap image on a specific axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeTree:
+    '''Node tree consisting of linked nodes used for compositing '''
+
+    chunk_size: typing.Union[int, str] = None
+    '''Max size of a tile (smaller values gives better distribution of multiple threads, but more overhead) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    edit_quality: typing.Union[int, str] = None
+    '''Quality when editing 
+
+    :type: typing.Union[int, str]
+    '''
+
+    render_quality: typing.Union[int, str] = None
+    '''Quality when rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_groupnode_buffer: bool = None
+    '''Enable buffering of group nodes 
+
+    :type: bool
+    '''
+
+    use_opencl: bool = None
+    '''Enable GPU calculations 
+
+    :type: bool
+    '''
+
+    use_two_pass: bool = None
+    '''Use two pass execution during editing: first calculate fast nodes, second pass calculate all nodes 
+
+    :type: bool
+    '''
+
+    use_viewer_border: bool = None
+    '''Use boundaries for viewer nodes and composite backdrop 
+
+    :type: bool
+    '''
+
+
+class CompositorNodeValToRGB:
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeValue:
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeVecBlur:
+    factor: float = None
+    '''Scaling factor for motion vectors (actually, ‘shutter speed’, in frames) 
+
+    :type: float
+    '''
+
+    samples: int = None
+    '''
+
+    :type: int
+    '''
+
+    speed_max: int = None
+    '''Maximum speed, or zero for none 
+
+    :type: int
+    '''
+
+    speed_min: int = None
+    '''Minimum speed for a pixel to be blurred (used to separate background from foreground) 
+
+    :type: int
+    '''
+
+    use_curved: bool = None
+    '''Interpolate between frames in a Bezier curve, rather than linearly 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeViewer:
+    center_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    center_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    tile_order: typing.Union[int, str] = None
+    '''Tile order 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_alpha: bool = None
+    '''Colors are treated alpha premultiplied, or colors output straight (alpha gets set to 1) 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class CompositorNodeZcombine:
+    use_alpha: bool = None
+    '''Take Alpha channel into account when doing the Z operation 
+
+    :type: bool
+    '''
+
+    use_antialias_z: bool = None
+    '''Anti-alias the z-buffer to try to avoid artifacts, mostly useful for Blender renders 
+
+    :type: bool
+    '''
+
+    def update(self, ):
+        '''
+
+        '''
+        pass
+
+
+class ConsoleLine:
+    '''Input line for the interactive console '''
+
+    body: str = None
+    '''Text in the line 
+
+    :type: str
+    '''
+
+    current_character: int = None
+    '''
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Console line type when used in scrollback 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class Constraint:
+    '''Constraint modifying the transformation of objects and bones '''
+
+    active: bool = None
+    '''Constraint is the one being edited 
+
+    :type: bool
+    '''
+
+    error_location: float = None
+    '''Amount of residual error in Blender space unit for constraints that work on position 
+
+    :type: float
+    '''
+
+    error_rotation: float = None
+    '''Amount of residual error in radians for constraints that work on orientation 
+
+    :type: float
+    '''
+
+    influence: float = None
+    '''Amount of influence constraint will have on the final solution 
+
+    :type: float
+    '''
+
+    is_proxy_local: bool = None
+    '''Constraint was added in this proxy instance (i.e. did not belong to source Armature) 
+
+    :type: bool
+    '''
+
+    is_valid: bool = None
+    '''Constraint has valid settings and can be evaluated 
+
+    :type: bool
+    '''
+
+    mute: bool = None
+    '''Enable/Disable Constraint 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Constraint name 
+
+    :type: str
+    '''
+
+    owner_space: typing.Union[int, str] = None
+    '''Space that owner is evaluated in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_expanded: bool = None
+    '''Constraint’s panel is expanded in UI 
+
+    :type: bool
+    '''
+
+    target_space: typing.Union[int, str] = None
+    '''Space that target is evaluated in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ConstraintActuator:
+    '''Actuator to handle Constraints '''
+
+    angle_max: float = None
+    '''Maximum angle allowed with target direction (no correction is done if angle with target direction is between min and max) 
+
+    :type: float
+    '''
+
+    angle_min: float = None
+    '''Minimum angle to maintain with target direction (no correction is done if angle with target direction is between min and max) 
+
+    :type: float
+    '''
+
+    damping: int = None
+    '''Damping factor: time constant (in frame) of low pass filter 
+
+    :type: int
+    '''
+
+    damping_rotation: int = None
+    '''Use a different damping for orientation 
+
+    :type: int
+    '''
+
+    direction: typing.Union[int, str] = None
+    '''Direction of the ray 
+
+    :type: typing.Union[int, str]
+    '''
+
+    direction_axis: typing.Union[int, str] = None
+    '''Select the axis to be aligned along the reference direction 
+
+    :type: typing.Union[int, str]
+    '''
+
+    direction_axis_pos: typing.Union[int, str] = None
+    '''Select the axis to be aligned along the reference direction 
+
+    :type: typing.Union[int, str]
+    '''
+
+    distance: float = None
+    '''Keep this distance to target 
+
+    :type: float
+    '''
+
+    fh_damping: float = None
+    '''Damping factor of the force field spring 
+
+    :type: float
+    '''
+
+    fh_force: float = None
+    '''Spring force within the force field area 
+
+    :type: float
+    '''
+
+    fh_height: float = None
+    '''Height of the force field area 
+
+    :type: float
+    '''
+
+    limit: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    limit_max: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_min: float = None
+    '''
+
+    :type: float
+    '''
+
+    material: str = None
+    '''Ray detects only Objects with this material 
+
+    :type: str
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''The type of the constraint 
+
+    :type: typing.Union[int, str]
+    '''
+
+    property: str = None
+    '''Ray detects only Objects with this property 
+
+    :type: str
+    '''
+
+    range: float = None
+    '''Maximum length of ray 
+
+    :type: float
+    '''
+
+    rotation_max: float = None
+    '''Reference Direction 
+
+    :type: float
+    '''
+
+    time: int = None
+    '''Maximum activation time in frame, 0 for unlimited 
+
+    :type: int
+    '''
+
+    use_fh_normal: bool = None
+    '''Add a horizontal spring force on slopes 
+
+    :type: bool
+    '''
+
+    use_fh_paralel_axis: bool = None
+    '''Keep object axis parallel to normal 
+
+    :type: bool
+    '''
+
+    use_force_distance: bool = None
+    '''Force distance of object to point of impact of ray 
+
+    :type: bool
+    '''
+
+    use_local: bool = None
+    '''Set ray along object’s axis or global axis 
+
+    :type: bool
+    '''
+
+    use_material_detect: bool = None
+    '''Detect material instead of property 
+
+    :type: bool
+    '''
+
+    use_normal: bool = None
+    '''Set object axis along (local axis) or parallel (global axis) to the normal at hit position 
+
+    :type: bool
+    '''
+
+    use_persistent: bool = None
+    '''Persistent actuator: stays active even if ray does not reach target 
+
+    :type: bool
+    '''
+
+
+class ConstraintTarget:
+    '''Target object for multi-target constraints '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
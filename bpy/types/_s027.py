@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Context:
+    '''Current windowmanager and data context '''
+
+    area: 'Area' = None
+    '''
+
+    :type: 'Area'
+    '''
+
+    blend_data: 'BlendData' = None
+    '''
+
+    :type: 'BlendData'
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    region: 'Region' = None
+    '''
+
+    :type: 'Region'
+    '''
+
+    region_data: 'RegionView3D' = None
+    '''
+
+    :type: 'RegionView3D'
+    '''
+
+    scene: 'Scene' = None
+    '''
+
+    :type: 'Scene'
+    '''
+
+    screen: 'Screen' = None
+    '''
+
+    :type: 'Screen'
+    '''
+
+    space_data: 'Space' = None
+    '''
+
+    :type: 'Space'
+    '''
+
+    tool_settings: 'ToolSettings' = None
+    '''
+
+    :type: 'ToolSettings'
+    '''
+
+    user_preferences: 'UserPreferences' = None
+    '''
+
+    :type: 'UserPreferences'
+    '''
+
+    window: 'Window' = None
+    '''
+
+    :type: 'Window'
+    '''
+
+    window_manager: 'WindowManager' = None
+    '''
+
+    :type: 'WindowManager'
+    '''
+
+    active_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    preferences = None
+    ''''''
+
+    visible_objects: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    selectable_objects: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    selected_objects: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    editable_objects: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    selected_editable_objects: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    objects_in_mode: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    objects_in_mode_unique_data: typing.List['Object'] = None
+    '''
+
+    :type: typing.List['Object']
+    '''
+
+    visible_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    editable_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    selected_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    selected_editable_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    visible_pose_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    selected_pose_bones: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    selected_pose_bones_from_active_object: typing.List['EditBone'] = None
+    '''
+
+    :type: typing.List['EditBone']
+    '''
+
+    active_bone: 'EditBone' = None
+    '''
+
+    :type: 'EditBone'
+    '''
+
+    active_pose_bone: 'PoseBone' = None
+    '''
+
+    :type: 'PoseBone'
+    '''
+
+    object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    edit_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    sculpt_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    vertex_paint_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    weight_paint_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    image_paint_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    particle_edit_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    pose_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    sequences: typing.List['Sequence'] = None
+    '''
+
+    :type: typing.List['Sequence']
+    '''
+
+    selected_sequences: typing.List['Sequence'] = None
+    '''
+
+    :type: typing.List['Sequence']
+    '''
+
+    selected_editable_sequences: typing.List['Sequence'] = None
+    '''
+
+    :type: typing.List['Sequence']
+    '''
+
+    gpencil_data: 'GreasePencil' = None
+    '''
+
+    :type: 'GreasePencil'
+    '''
+
+    gpencil_data_owner: 'ID' = None
+    '''
+
+    :type: 'ID'
+    '''
+
+    visible_gpencil_layers: typing.List['GPencilLayer'] = None
+    '''
+
+    :type: typing.List['GPencilLayer']
+    '''
+
+    editable_gpencil_layers: typing.List['GPencilLayer'] = None
+    '''
+
+    :type: typing.List['GPencilLayer']
+    '''
+
+    editable_gpencil_strokes: typing.List['GPencilStroke'] = None
+    '''
+
+    :type: typing.List['GPencilStroke']
+    '''
+
+    active_gpencil_layer: typing.List['GPencilLayer'] = None
+    '''
+
+    :type: typing.List['GPencilLayer']
+    '''
+
+    active_gpencil_frame: list = None
+    '''
+
+    :type: list
+    '''
+
+    active_operator: 'Operator' = None
+    '''
+
+    :type: 'Operator'
+    '''
+
+    selected_editable_fcurves: typing.List['FCurve'] = None
+    '''
+
+    :type: typing.List['FCurve']
+    '''
+
+    active_base: 'ObjectBase' = None
+    '''
+
+    :type: 'ObjectBase'
+    '''
+
+    texture_slot: 'MaterialTextureSlot' = None
+    '''
+
+    :type: 'MaterialTextureSlot'
+    '''
+
+    world: 'World' = None
+    '''
+
+    :type: 'World'
+    '''
+
+    mesh: 'Mesh' = None
+    '''
+
+    :type: 'Mesh'
+    '''
+
+    armature: 'Armature' = None
+    '''
+
+    :type: 'Armature'
+    '''
+
+    lattice: 'Lattice' = None
+    '''
+
+    :type: 'Lattice'
+    '''
+
+    curve: 'Curve' = None
+    '''
+
+    :type: 'Curve'
+    '''
+
+    meta_ball: 'MetaBall' = None
+    '''
+
+    :type: 'MetaBall'
+    '''
+
+    light = None
+    ''''''
+
+    speaker: 'Speaker' = None
+    '''
+
+    :type: 'Speaker'
+    '''
+
+    lightprobe = None
+    ''''''
+
+    camera: 'Camera' = None
+    '''
+
+    :type: 'Camera'
+    '''
+
+    material: 'Material' = None
+    '''
+
+    :type: 'Material'
+    '''
+
+    material_slot: 'MaterialSlot' = None
+    '''
+
+    :type: 'MaterialSlot'
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    texture_user: 'ID' = None
+    '''
+
+    :type: 'ID'
+    '''
+
+    texture_user_property: 'Property' = None
+    '''
+
+    :type: 'Property'
+    '''
+
+    bone: 'Bone' = None
+    '''
+
+    :type: 'Bone'
+    '''
+
+    edit_bone: 'EditBone' = None
+    '''
+
+    :type: 'EditBone'
+    '''
+
+    pose_bone: 'PoseBone' = None
+    '''
+
+    :type: 'PoseBone'
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''
+
+    :type: 'ParticleSystem'
+    '''
+
+    particle_system_editable: 'ParticleSystem' = None
+    '''
+
+    :type: 'ParticleSystem'
+    '''
+
+    particle_settings: 'ParticleSettings' = None
+    '''
+
+    :type: 'ParticleSettings'
+    '''
+
+    cloth: 'ClothModifier' = None
+    '''
+
+    :type: 'ClothModifier'
+    '''
+
+    soft_body: 'SoftBodyModifier' = None
+    '''
+
+    :type: 'SoftBodyModifier'
+    '''
+
+    fluid: 'FluidSimulationModifier' = None
+    '''
+
+    :type: 'FluidSimulationModifier'
+    '''
+
+    smoke: 'SmokeModifier' = None
+    '''
+
+    :type: 'SmokeModifier'
+    '''
+
+    collision: 'CollisionModifier' = None
+    '''
+
+    :type: 'CollisionModifier'
+    '''
+
+    brush: 'Brush' = None
+    '''
+
+    :type: 'Brush'
+    '''
+
+    dynamic_paint: 'DynamicPaintModifier' = None
+    '''
+
+    :type: 'DynamicPaintModifier'
+    '''
+
+    line_style: 'FreestyleLineStyle' = None
+    '''
+
+    :type: 'FreestyleLineStyle'
+    '''
+
+    collection = None
+    ''''''
+
+    gpencil: 'GreasePencil' = None
+    '''
+
+    :type: 'GreasePencil'
+    '''
+
+    edit_image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    edit_mask: 'Mask' = None
+    '''
+
+    :type: 'Mask'
+    '''
+
+    selected_nodes: typing.List['Node'] = None
+    '''
+
+    :type: typing.List['Node']
+    '''
+
+    active_node: 'Node' = None
+    '''
+
+    :type: 'Node'
+    '''
+
+    edit_text: 'Text' = None
+    '''
+
+    :type: 'Text'
+    '''
+
+    edit_movieclip: 'MovieClip' = None
+    '''
+
+    :type: 'MovieClip'
+    '''
+
+    def copy(self, ):
+        '''
+
+        '''
+        pass
@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ControlFluidSettings:
+    '''Fluid simulation settings for objects controlling the motion of fluid in the simulation '''
+
+    attraction_radius: float = None
+    '''Force field radius around the control object 
+
+    :type: float
+    '''
+
+    attraction_strength: float = None
+    '''Force strength for directional attraction towards the control object 
+
+    :type: float
+    '''
+
+    end_time: float = None
+    '''Time when the control particles are deactivated 
+
+    :type: float
+    '''
+
+    quality: float = None
+    '''Quality which is used for object sampling (higher = better but slower) 
+
+    :type: float
+    '''
+
+    start_time: float = None
+    '''Time when the control particles are activated 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Object contributes to the fluid simulation 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse control object movement 
+
+    :type: bool
+    '''
+
+    velocity_radius: float = None
+    '''Force field radius around the control object 
+
+    :type: float
+    '''
+
+    velocity_strength: float = None
+    '''Force strength of how much of the control object’s velocity is influencing the fluid velocity 
+
+    :type: float
+    '''
+
+
+class Controller:
+    '''Game engine logic brick to process events, connecting sensors to actuators '''
+
+    active: bool = None
+    '''Set the active state of the controller 
+
+    :type: bool
+    '''
+
+    actuators: typing.List['Actuator'] = None
+    '''The list containing the actuators connected to the controller 
+
+    :type: typing.List['Actuator']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    show_expanded: bool = None
+    '''Set controller expanded in the user interface 
+
+    :type: bool
+    '''
+
+    states: int = None
+    '''Set Controller state index (1 to 30) 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_priority: bool = None
+    '''Mark controller for execution before all non-marked controllers (good for startup scripts) 
+
+    :type: bool
+    '''
+
+    def link(self, sensor: 'Sensor' = None, actuator: 'Actuator' = None):
+        '''Link the controller with a sensor/actuator 
+
+        :param sensor: Sensor to link the controller to 
+        :type sensor: 'Sensor'
+        :param actuator: Actuator to link the controller to 
+        :type actuator: 'Actuator'
+        '''
+        pass
+
+    def unlink(self, sensor: 'Sensor' = None, actuator: 'Actuator' = None):
+        '''Unlink the controller from a sensor/actuator 
+
+        :param sensor: Sensor to unlink the controller from 
+        :type sensor: 'Sensor'
+        :param actuator: Actuator to unlink the controller from 
+        :type actuator: 'Actuator'
+        '''
+        pass
+
+
+class CopyLocationConstraint:
+    '''Copy the location of the target '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    invert_x: bool = None
+    '''Invert the X location 
+
+    :type: bool
+    '''
+
+    invert_y: bool = None
+    '''Invert the Y location 
+
+    :type: bool
+    '''
+
+    invert_z: bool = None
+    '''Invert the Z location 
+
+    :type: bool
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+    use_offset: bool = None
+    '''Add original location into copied location 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''Copy the target’s X location 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Copy the target’s Y location 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Copy the target’s Z location 
+
+    :type: bool
+    '''
+
+
+class CopyRotationConstraint:
+    '''Copy the rotation of the target '''
+
+    invert_x: bool = None
+    '''Invert the X rotation 
+
+    :type: bool
+    '''
+
+    invert_y: bool = None
+    '''Invert the Y rotation 
+
+    :type: bool
+    '''
+
+    invert_z: bool = None
+    '''Invert the Z rotation 
+
+    :type: bool
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_offset: bool = None
+    '''Add original rotation into copied rotation 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''Copy the target’s X rotation 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Copy the target’s Y rotation 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Copy the target’s Z rotation 
+
+    :type: bool
+    '''
+
+
+class CopyScaleConstraint:
+    '''Copy the scale of the target '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_offset: bool = None
+    '''Add original scale into copied scale 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''Copy the target’s X scale 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Copy the target’s Y scale 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Copy the target’s Z scale 
+
+    :type: bool
+    '''
+
+
+class CopyTransformsConstraint:
+    '''Copy all the transforms of the target '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+
+class CorrectiveSmoothModifier:
+    '''Correct distortion caused by deformation '''
+
+    factor: float = None
+    '''Smooth factor effect 
+
+    :type: float
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    is_bind: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    rest_source: typing.Union[int, str] = None
+    '''Select the source of rest positions 
+
+    :type: typing.Union[int, str]
+    '''
+
+    smooth_type: typing.Union[int, str] = None
+    '''Method used for smoothing 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_only_smooth: bool = None
+    '''Apply smoothing without reconstructing the surface 
+
+    :type: bool
+    '''
+
+    use_pin_boundary: bool = None
+    '''Excludes boundary vertices from being smoothed 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class CrossSequence:
+    '''Cross Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Curve:
+    '''Curve data-block storing curves, splines and NURBS '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    bevel_depth: float = None
+    '''Bevel depth when not using a bevel object 
+
+    :type: float
+    '''
+
+    bevel_factor_end: float = None
+    '''Factor that defines to where beveling of spline happens (0=to the very beginning, 1=to the very end) 
+
+    :type: float
+    '''
+
+    bevel_factor_mapping_end: typing.Union[int, str] = None
+    '''Determines how the end bevel factor is mapped to a spline 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bevel_factor_mapping_start: typing.Union[int, str] = None
+    '''Determines how the start bevel factor is mapped to a spline 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bevel_factor_start: float = None
+    '''Factor that defines from where beveling of spline happens (0=from the very beginning, 1=from the very end) 
+
+    :type: float
+    '''
+
+    bevel_object: 'Object' = None
+    '''Curve object name that defines the bevel shape 
+
+    :type: 'Object'
+    '''
+
+    bevel_resolution: int = None
+    '''Bevel resolution when depth is non-zero and no specific bevel object has been defined 
+
+    :type: int
+    '''
+
+    cycles: 'CyclesMeshSettings' = None
+    '''Cycles mesh settings 
+
+    :type: 'CyclesMeshSettings'
+    '''
+
+    dimensions: typing.Union[int, str] = None
+    '''Select 2D or 3D curve type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    eval_time: float = None
+    '''Parametric position along the length of the curve that Objects ‘following’ it should be at (position is evaluated by dividing by the ‘Path Length’ value) 
+
+    :type: float
+    '''
+
+    extrude: float = None
+    '''Amount of curve extrusion when not using a bevel object 
+
+    :type: float
+    '''
+
+    fill_mode: typing.Union[int, str] = None
+    '''Mode of filling curve 
+
+    :type: typing.Union[int, str]
+    '''
+
+    is_editmode: bool = None
+    '''True when used in editmode 
+
+    :type: bool
+    '''
+
+    materials: typing.List['Material'] = None
+    '''
+
+    :type: typing.List['Material']
+    '''
+
+    offset: float = None
+    '''Offset the curve to adjust the width of a text 
+
+    :type: float
+    '''
+
+    path_duration: int = None
+    '''The number of frames that are needed to traverse the path, defining the maximum value for the ‘Evaluation Time’ setting 
+
+    :type: int
+    '''
+
+    render_resolution_u: int = None
+    '''Surface resolution in U direction used while rendering (zero uses preview resolution) 
+
+    :type: int
+    '''
+
+    render_resolution_v: int = None
+    '''Surface resolution in V direction used while rendering (zero uses preview resolution) 
+
+    :type: int
+    '''
+
+    resolution_u: int = None
+    '''Surface resolution in U direction 
+
+    :type: int
+    '''
+
+    resolution_v: int = None
+    '''Surface resolution in V direction 
+
+    :type: int
+    '''
+
+    shape_keys: 'Key' = None
+    '''
+
+    :type: 'Key'
+    '''
+
+    show_handles: bool = None
+    '''Display Bezier handles in editmode 
+
+    :type: bool
+    '''
+
+    show_normal_face: bool = None
+    '''Display 3D curve normals in editmode 
+
+    :type: bool
+    '''
+
+    splines: typing.List['Spline'] = None
+    '''Collection of splines in this curve data object 
+
+    :type: typing.List['Spline']
+    '''
+
+    taper_object: 'Object' = None
+    '''Curve object name that defines the taper (width) 
+
+    :type: 'Object'
+    '''
+
+    texspace_location: float = None
+    '''Texture space location 
+
+    :type: float
+    '''
+
+    texspace_size: float = None
+    '''Texture space size 
+
+    :type: float
+    '''
+
+    twist_mode: typing.Union[int, str] = None
+    '''The type of tilt calculation for 3D Curves 
+
+    :type: typing.Union[int, str]
+    '''
+
+    twist_smooth: float = None
+    '''Smoothing iteration for tangents 
+
+    :type: float
+    '''
+
+    use_auto_texspace: bool = None
+    '''Adjust active object’s texture space automatically when transforming object 
+
+    :type: bool
+    '''
+
+    use_deform_bounds: bool = None
+    '''Option for curve-deform: Use the mesh bounds to clamp the deformation 
+
+    :type: bool
+    '''
+
+    use_fill_caps: bool = None
+    '''Fill caps for beveled curves 
+
+    :type: bool
+    '''
+
+    use_fill_deform: bool = None
+    '''Fill curve after applying shape keys and all modifiers 
+
+    :type: bool
+    '''
+
+    use_map_taper: bool = None
+    '''Map effect of taper object on actually beveled curve 
+
+    :type: bool
+    '''
+
+    use_path: bool = None
+    '''Enable the curve to become a translation path 
+
+    :type: bool
+    '''
+
+    use_path_follow: bool = None
+    '''Make curve path children to rotate along the path 
+
+    :type: bool
+    '''
+
+    use_radius: bool = None
+    '''Option for paths and curve-deform: apply the curve radius with path following it and deforming 
+
+    :type: bool
+    '''
+
+    use_stretch: bool = None
+    '''Option for curve-deform: make deformed child to stretch along entire path 
+
+    :type: bool
+    '''
+
+    use_uv_as_generated: bool = None
+    '''Uses the UV values as Generated textured coordinates 
+
+    :type: bool
+    '''
+
+    def transform(self, matrix: float, shape_keys: bool = False):
+        '''Transform curve by a matrix 
+
+        :param matrix: Matrix 
+        :type matrix: float
+        :param shape_keys: Transform Shape Keys 
+        :type shape_keys: bool
+        '''
+        pass
+
+    def validate_material_indices(self, ) -> bool:
+        '''Validate material indices of splines or letters, return True when the curve has had invalid indices corrected (to default 0) 
+
+        :rtype: bool
+        :return:  Result 
+        '''
+        pass
+
+
+class CurveMap:
+    '''Curve in a curve mapping '''
+
+    extend: typing.Union[int, str] = None
+    '''Extrapolate the curve or extend it horizontally 
+
+    :type: typing.Union[int, str]
+    '''
+
+    points: typing.List['CurveMapPoints'] = None
+    '''
+
+    :type: typing.List['CurveMapPoints']
+    '''
+
+    def evaluate(self, position: float) -> float:
+        '''Evaluate curve at given location 
+
+        :param position: Position, Position to evaluate curve at 
+        :type position: float
+        :rtype: float
+        :return:  Value, Value of curve at given location 
+        '''
+        pass
+
+
+class CurveMapPoint:
+    '''Point of a curve used for a curve mapping '''
+
+    handle_type: typing.Union[int, str] = None
+    '''Curve interpolation at this point: Bezier or vector 
+
+    :type: typing.Union[int, str]
+    '''
+
+    location: float = None
+    '''X/Y coordinates of the curve point 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Selection state of the curve point 
+
+    :type: bool
+    '''
+
+
+class CurveMapPoints:
+    '''Collection of Curve Map Points '''
+
+    def new(self, position: float, value: float) -> 'CurveMapPoint':
+        '''Add point to CurveMap 
+
+        :param position: Position, Position to add point 
+        :type position: float
+        :param value: Value, Value of point 
+        :type value: float
+        :rtype: 'CurveMapPoint'
+        :return:  New point 
+        '''
+        pass
+
+    def remove(self, point: 'CurveMapPoint'):
+        '''Delete point from CurveMap 
+
+        :param point: PointElement to remove 
+        :type point: 'CurveMapPoint'
+        '''
+        pass
+
+
+class CurveMapping:
+    '''Curve mapping to map color, vector and scalar values to other values using a user defined curve '''
+
+    black_level: float = None
+    '''For RGB curves, the color that black is mapped to 
+
+    :type: float
+    '''
+
+    clip_max_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    clip_max_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    clip_min_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    clip_min_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    curves: typing.List['CurveMap'] = None
+    '''
+
+    :type: typing.List['CurveMap']
+    '''
+
+    use_clip: bool = None
+    '''Force the curve view to fit a defined boundary 
+
+    :type: bool
+    '''
+
+    white_level: float = None
+    '''For RGB curves, the color that white is mapped to 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''Update curve mapping after making changes 
+
+        '''
+        pass
+
+    def initialize(self, ):
+        '''Initialize curve 
+
+        '''
+        pass
@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CurveModifier:
+    '''Curve deformation modifier '''
+
+    deform_axis: typing.Union[int, str] = None
+    '''The axis that the curve deforms along 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Curve object to deform with 
+
+    :type: 'Object'
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class CurvePaintSettings:
+    corner_angle: float = None
+    '''Angles above this are considered corners 
+
+    :type: float
+    '''
+
+    curve_type: typing.Union[int, str] = None
+    '''Type of curve to use for new strokes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    depth_mode: typing.Union[int, str] = None
+    '''Method of projecting depth 
+
+    :type: typing.Union[int, str]
+    '''
+
+    error_threshold: int = None
+    '''Allow deviation for a smoother, less precise line 
+
+    :type: int
+    '''
+
+    fit_method: typing.Union[int, str] = None
+    '''Curve fitting method 
+
+    :type: typing.Union[int, str]
+    '''
+
+    radius_max: float = None
+    '''Radius to use when the maximum pressure is applied (or when a tablet isn’t used) 
+
+    :type: float
+    '''
+
+    radius_min: float = None
+    '''Minimum radius when the minimum pressure is applied (also the minimum when tapering) 
+
+    :type: float
+    '''
+
+    radius_taper_end: float = None
+    '''Taper factor for the radius of each point along the curve 
+
+    :type: float
+    '''
+
+    radius_taper_start: float = None
+    '''Taper factor for the radius of each point along the curve 
+
+    :type: float
+    '''
+
+    surface_offset: float = None
+    '''Offset the stroke from the surface 
+
+    :type: float
+    '''
+
+    surface_plane: typing.Union[int, str] = None
+    '''Plane for projected stroke 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_corners_detect: bool = None
+    '''Detect corners and use non-aligned handles 
+
+    :type: bool
+    '''
+
+    use_offset_absolute: bool = None
+    '''Apply a fixed offset (don’t scale by the radius) 
+
+    :type: bool
+    '''
+
+    use_pressure_radius: bool = None
+    '''Map tablet pressure to curve radius 
+
+    :type: bool
+    '''
+
+    use_stroke_endpoints: bool = None
+    '''Use the start of the stroke for the depth 
+
+    :type: bool
+    '''
+
+
+class CurveSplines:
+    '''Collection of curve splines '''
+
+    active: 'Spline' = None
+    '''Active curve spline 
+
+    :type: 'Spline'
+    '''
+
+    def new(self, type: typing.Union[int, str]) -> 'Spline':
+        '''Add a new spline to the curve 
+
+        :param type: type for the new spline 
+        :type type: typing.Union[int, str]
+        :rtype: 'Spline'
+        :return:  The newly created spline 
+        '''
+        pass
+
+    def remove(self, spline: 'Spline'):
+        '''Remove a spline from a curve 
+
+        :param spline: The spline to remove 
+        :type spline: 'Spline'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all splines from a curve 
+
+        '''
+        pass
+
+
+class CurvesModifier:
+    '''RGB curves modifier for sequence strip '''
+
+    curve_mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+
+class CyclesCameraSettings:
+    aperture_blades: int = None
+    '''Number of blades in aperture for polygonal bokeh (at least 3) 
+
+    :type: int
+    '''
+
+    aperture_fstop: float = None
+    '''F-stop ratio (lower numbers give more defocus, higher numbers give a sharper image) 
+
+    :type: float
+    '''
+
+    aperture_ratio: float = None
+    '''Distortion to simulate anamorphic lens bokeh 
+
+    :type: float
+    '''
+
+    aperture_rotation: float = None
+    '''Rotation of blades in aperture 
+
+    :type: float
+    '''
+
+    aperture_size: float = None
+    '''Radius of the aperture for depth of field (higher values give more defocus) 
+
+    :type: float
+    '''
+
+    aperture_type: typing.Union[int, str] = None
+    '''Use f-stop number or aperture radius 
+
+    :type: typing.Union[int, str]
+    '''
+
+    fisheye_fov: float = None
+    '''Field of view for the fisheye lens 
+
+    :type: float
+    '''
+
+    fisheye_lens: float = None
+    '''Lens focal length (mm) 
+
+    :type: float
+    '''
+
+    latitude_max: float = None
+    '''Maximum latitude (vertical angle) for the equirectangular lens 
+
+    :type: float
+    '''
+
+    latitude_min: float = None
+    '''Minimum latitude (vertical angle) for the equirectangular lens 
+
+    :type: float
+    '''
+
+    longitude_max: float = None
+    '''Maximum longitude (horizontal angle) for the equirectangular lens 
+
+    :type: float
+    '''
+
+    longitude_min: float = None
+    '''Minimum longitude (horizontal angle) for the equirectangular lens 
+
+    :type: float
+    '''
+
+    panorama_type: typing.Union[int, str] = None
+    '''Distortion to use for the calculation 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class CyclesCurveRenderSettings:
+    cull_backfacing: bool = None
+    '''Do not test the back-face of each strand 
+
+    :type: bool
+    '''
+
+    maximum_width: float = None
+    '''Maximum extension that strand radius can be increased by 
+
+    :type: float
+    '''
+
+    minimum_width: float = None
+    '''Minimal pixel width for strands (0 - deactivated) 
+
+    :type: float
+    '''
+
+    primitive: typing.Union[int, str] = None
+    '''Type of primitive used for hair rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution: int = None
+    '''Resolution of generated mesh 
+
+    :type: int
+    '''
+
+    shape: typing.Union[int, str] = None
+    '''Form of hair 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subdivisions: int = None
+    '''Number of subdivisions used in Cardinal curve intersection (power of 2) 
+
+    :type: int
+    '''
+
+    use_curves: bool = None
+    '''Activate Cycles hair rendering for particle system 
+
+    :type: bool
+    '''
+
+
+class CyclesCurveSettings:
+    radius_scale: float = None
+    '''Multiplier of width properties 
+
+    :type: float
+    '''
+
+    root_width: float = None
+    '''Strand’s width at root 
+
+    :type: float
+    '''
+
+    shape: float = None
+    '''Strand shape parameter 
+
+    :type: float
+    '''
+
+    tip_width: float = None
+    '''Strand’s width at tip 
+
+    :type: float
+    '''
+
+    use_closetip: bool = None
+    '''Set tip radius to zero 
+
+    :type: bool
+    '''
+
+
+class CyclesDeviceSettings:
+    id: str = None
+    '''
+
+    :type: str
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class CyclesLampSettings:
+    cast_shadow: bool = None
+    '''Lamp casts shadows 
+
+    :type: bool
+    '''
+
+    is_portal: bool = None
+    '''Use this area lamp to guide sampling of the background, note that this will make the lamp invisible 
+
+    :type: bool
+    '''
+
+    max_bounces: int = None
+    '''Maximum number of bounces the light will contribute to the render 
+
+    :type: int
+    '''
+
+    samples: int = None
+    '''Number of light samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    use_multiple_importance_sampling: bool = None
+    '''Use multiple importance sampling for the lamp, reduces noise for area lamps and sharp glossy materials 
+
+    :type: bool
+    '''
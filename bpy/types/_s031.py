@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CyclesMaterialSettings:
+    displacement_method: typing.Union[int, str] = None
+    '''Method to use for the displacement 
+
+    :type: typing.Union[int, str]
+    '''
+
+    homogeneous_volume: bool = None
+    '''When using volume rendering, assume volume has the same density everywhere (not using any textures), for faster rendering 
+
+    :type: bool
+    '''
+
+    sample_as_light: bool = None
+    '''Use multiple importance sampling for this material, disabling may reduce overall noise for large objects that emit little light compared to other light sources 
+
+    :type: bool
+    '''
+
+    use_transparent_shadow: bool = None
+    '''Use transparent shadows for this material if it contains a Transparent BSDF, disabling will render faster but not give accurate shadows 
+
+    :type: bool
+    '''
+
+    volume_interpolation: typing.Union[int, str] = None
+    '''Interpolation method to use for smoke/fire volumes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    volume_sampling: typing.Union[int, str] = None
+    '''Sampling method to use for volumes 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class CyclesMeshSettings:
+    pass
+
+
+class CyclesObjectSettings:
+    dicing_rate: float = None
+    '''Multiplier for scene dicing rate (located in the Geometry Panel) 
+
+    :type: float
+    '''
+
+    is_shadow_catcher: bool = None
+    '''Only render shadows on this object, for compositing renders into real footage 
+
+    :type: bool
+    '''
+
+    motion_steps: int = None
+    '''Control accuracy of deformation motion blur, more steps gives more memory usage (actual number of steps is 2^(steps - 1)) 
+
+    :type: int
+    '''
+
+    use_adaptive_subdivision: bool = None
+    '''Use adaptive render time subdivision 
+
+    :type: bool
+    '''
+
+    use_camera_cull: bool = None
+    '''Allow this object and its duplicators to be culled by camera space culling 
+
+    :type: bool
+    '''
+
+    use_deform_motion: bool = None
+    '''Use deformation motion blur for this object 
+
+    :type: bool
+    '''
+
+    use_distance_cull: bool = None
+    '''Allow this object and its duplicators to be culled by distance from camera 
+
+    :type: bool
+    '''
+
+    use_motion_blur: bool = None
+    '''Use motion blur for this object 
+
+    :type: bool
+    '''
+
+
+class CyclesPreferences:
+    compute_device_type: typing.Union[int, str] = None
+    '''Device to use for computation (rendering with Cycles) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    devices: typing.List['CyclesDeviceSettings'] = None
+    '''
+
+    :type: typing.List['CyclesDeviceSettings']
+    '''
+
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def draw_impl(self, layout, context):
+        '''
+
+        '''
+        pass
+
+    def find_existing_device_entry(self, device):
+        '''
+
+        '''
+        pass
+
+    def get_device_types(self, context):
+        '''
+
+        '''
+        pass
+
+    def get_devices(self, ):
+        '''
+
+        '''
+        pass
+
+    def get_num_gpu_devices(self, ):
+        '''
+
+        '''
+        pass
+
+    def has_active_device(self, ):
+        '''
+
+        '''
+        pass
+
+    def update_device_entries(self, device_list):
+        '''
+
+        '''
+        pass
+
+
+class CyclesRenderLayerSettings:
+    denoising_diffuse_direct: bool = None
+    '''Denoise the direct diffuse lighting 
+
+    :type: bool
+    '''
+
+    denoising_diffuse_indirect: bool = None
+    '''Denoise the indirect diffuse lighting 
+
+    :type: bool
+    '''
+
+    denoising_feature_strength: float = None
+    '''Controls removal of noisy image feature passes (lower values preserve more detail, but aren’t as smooth) 
+
+    :type: float
+    '''
+
+    denoising_glossy_direct: bool = None
+    '''Denoise the direct glossy lighting 
+
+    :type: bool
+    '''
+
+    denoising_glossy_indirect: bool = None
+    '''Denoise the indirect glossy lighting 
+
+    :type: bool
+    '''
+
+    denoising_radius: int = None
+    '''Size of the image area that’s used to denoise a pixel (higher values are smoother, but might lose detail and are slower) 
+
+    :type: int
+    '''
+
+    denoising_relative_pca: bool = None
+    '''When removing pixels that don’t carry information, use a relative threshold instead of an absolute one (can help to reduce artifacts, but might cause detail loss around edges) 
+
+    :type: bool
+    '''
+
+    denoising_store_passes: bool = None
+    '''Store the denoising feature passes and the noisy image 
+
+    :type: bool
+    '''
+
+    denoising_strength: float = None
+    '''Controls neighbor pixel weighting for the denoising filter (lower values preserve more detail, but aren’t as smooth) 
+
+    :type: float
+    '''
+
+    denoising_subsurface_direct: bool = None
+    '''Denoise the direct subsurface lighting 
+
+    :type: bool
+    '''
+
+    denoising_subsurface_indirect: bool = None
+    '''Denoise the indirect subsurface lighting 
+
+    :type: bool
+    '''
+
+    denoising_transmission_direct: bool = None
+    '''Denoise the direct transmission lighting 
+
+    :type: bool
+    '''
+
+    denoising_transmission_indirect: bool = None
+    '''Denoise the indirect transmission lighting 
+
+    :type: bool
+    '''
+
+    pass_debug_bvh_intersections: bool = None
+    '''Store Debug BVH Intersections 
+
+    :type: bool
+    '''
+
+    pass_debug_bvh_traversed_instances: bool = None
+    '''Store Debug BVH Traversed Instances pass 
+
+    :type: bool
+    '''
+
+    pass_debug_bvh_traversed_nodes: bool = None
+    '''Store Debug BVH Traversed Nodes pass 
+
+    :type: bool
+    '''
+
+    pass_debug_ray_bounces: bool = None
+    '''Store Debug Ray Bounces pass 
+
+    :type: bool
+    '''
+
+    use_denoising: bool = None
+    '''Denoise the rendered image 
+
+    :type: bool
+    '''
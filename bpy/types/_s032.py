@@ -0,0 +1,526 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CyclesRenderSettings:
+    aa_samples: int = None
+    '''Number of antialiasing samples to render for each pixel 
+
+    :type: int
+    '''
+
+    ao_bounces: int = None
+    '''Approximate indirect light with background tinted ambient occlusion at the specified bounce, 0 disables this feature 
+
+    :type: int
+    '''
+
+    ao_bounces_render: int = None
+    '''Approximate indirect light with background tinted ambient occlusion at the specified bounce, 0 disables this feature 
+
+    :type: int
+    '''
+
+    ao_samples: int = None
+    '''Number of ambient occlusion samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    bake_type: typing.Union[int, str] = None
+    '''Type of pass to bake 
+
+    :type: typing.Union[int, str]
+    '''
+
+    blur_glossy: float = None
+    '''Adaptively blur glossy shaders after blurry bounces, to reduce noise at the cost of accuracy 
+
+    :type: float
+    '''
+
+    camera_cull_margin: float = None
+    '''Margin for the camera space culling 
+
+    :type: float
+    '''
+
+    caustics_reflective: bool = None
+    '''Use reflective caustics, resulting in a brighter image (more noise but added realism) 
+
+    :type: bool
+    '''
+
+    caustics_refractive: bool = None
+    '''Use refractive caustics, resulting in a brighter image (more noise but added realism) 
+
+    :type: bool
+    '''
+
+    debug_bvh_time_steps: int = None
+    '''Split BVH primitives by this number of time steps to speed up render time in cost of memory 
+
+    :type: int
+    '''
+
+    debug_bvh_type: typing.Union[int, str] = None
+    '''Choose between faster updates, or faster render 
+
+    :type: typing.Union[int, str]
+    '''
+
+    debug_cancel_timeout: float = None
+    '''
+
+    :type: float
+    '''
+
+    debug_opencl_device_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    debug_opencl_kernel_single_program: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_opencl_kernel_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    debug_opencl_mem_limit: int = None
+    '''Artificial limit on OpenCL memory usage in MB (0 to disable limit) 
+
+    :type: int
+    '''
+
+    debug_reset_timeout: float = None
+    '''
+
+    :type: float
+    '''
+
+    debug_text_timeout: float = None
+    '''
+
+    :type: float
+    '''
+
+    debug_tile_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    debug_use_cpu_avx: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cpu_avx2: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cpu_split_kernel: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cpu_sse2: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cpu_sse3: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cpu_sse41: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cuda_adaptive_compile: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_cuda_split_kernel: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_hair_bvh: bool = None
+    '''Use special type BVH optimized for hair (uses more ram but renders faster) 
+
+    :type: bool
+    '''
+
+    debug_use_opencl_debug: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_qbvh: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    debug_use_spatial_splits: bool = None
+    '''Use BVH spatial splits: longer builder time, faster render 
+
+    :type: bool
+    '''
+
+    device: typing.Union[int, str] = None
+    '''Device to use for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dicing_rate: float = None
+    '''Size of a micropolygon in pixels 
+
+    :type: float
+    '''
+
+    diffuse_bounces: int = None
+    '''Maximum number of diffuse reflection bounces, bounded by total maximum 
+
+    :type: int
+    '''
+
+    diffuse_samples: int = None
+    '''Number of diffuse bounce samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    distance_cull_margin: float = None
+    '''Cull objects which are further away from camera than this distance 
+
+    :type: float
+    '''
+
+    feature_set: typing.Union[int, str] = None
+    '''Feature set to use for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    film_exposure: float = None
+    '''Image brightness scale 
+
+    :type: float
+    '''
+
+    film_transparent: bool = None
+    '''World background is transparent with premultiplied alpha 
+
+    :type: bool
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Pixel filter type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filter_width: float = None
+    '''Pixel filter width 
+
+    :type: float
+    '''
+
+    glossy_bounces: int = None
+    '''Maximum number of glossy reflection bounces, bounded by total maximum 
+
+    :type: int
+    '''
+
+    glossy_samples: int = None
+    '''Number of glossy bounce samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    light_sampling_threshold: float = None
+    '''Probabilistically terminate light samples when the light contribution is below this threshold (more noise but faster rendering). Zero disables the test and never ignores lights 
+
+    :type: float
+    '''
+
+    max_bounces: int = None
+    '''Total maximum number of bounces 
+
+    :type: int
+    '''
+
+    max_subdivisions: int = None
+    '''Stop subdividing when this level is reached even if the dice rate would produce finer tessellation 
+
+    :type: int
+    '''
+
+    mesh_light_samples: int = None
+    '''Number of mesh emission light samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    min_bounces: int = None
+    '''Minimum number of bounces, setting this lower than the maximum enables probabilistic path termination (faster but noisier) 
+
+    :type: int
+    '''
+
+    motion_blur_position: typing.Union[int, str] = None
+    '''Offset for the shutter’s time interval, allows to change the motion blur trails 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pixel_filter_type: typing.Union[int, str] = None
+    '''Pixel filter type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    preview_aa_samples: int = None
+    '''Number of antialiasing samples to render in the viewport, unlimited if 0 
+
+    :type: int
+    '''
+
+    preview_active_layer: bool = None
+    '''Preview active render layer in viewport 
+
+    :type: bool
+    '''
+
+    preview_dicing_rate: float = None
+    '''Size of a micropolygon in pixels during preview render 
+
+    :type: float
+    '''
+
+    preview_pause: bool = None
+    '''Pause all viewport preview renders 
+
+    :type: bool
+    '''
+
+    preview_samples: int = None
+    '''Number of samples to render in the viewport, unlimited if 0 
+
+    :type: int
+    '''
+
+    preview_start_resolution: int = None
+    '''Resolution to start rendering preview at, progressively increasing it to the full viewport size 
+
+    :type: int
+    '''
+
+    progressive: typing.Union[int, str] = None
+    '''Method to sample lights and materials 
+
+    :type: typing.Union[int, str]
+    '''
+
+    rolling_shutter_duration: float = None
+    '''Scanline “exposure” time for the rolling shutter effect 
+
+    :type: float
+    '''
+
+    rolling_shutter_type: typing.Union[int, str] = None
+    '''Type of rolling shutter effect matching CMOS-based cameras 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sample_all_lights_direct: bool = None
+    '''Sample all lights (for direct samples), rather than randomly picking one 
+
+    :type: bool
+    '''
+
+    sample_all_lights_indirect: bool = None
+    '''Sample all lights (for indirect samples), rather than randomly picking one 
+
+    :type: bool
+    '''
+
+    sample_clamp_direct: float = None
+    '''If non-zero, the maximum value for a direct sample, higher values will be scaled down to avoid too much noise and slow convergence at the cost of accuracy 
+
+    :type: float
+    '''
+
+    sample_clamp_indirect: float = None
+    '''If non-zero, the maximum value for an indirect sample, higher values will be scaled down to avoid too much noise and slow convergence at the cost of accuracy 
+
+    :type: float
+    '''
+
+    samples: int = None
+    '''Number of samples to render for each pixel 
+
+    :type: int
+    '''
+
+    sampling_pattern: typing.Union[int, str] = None
+    '''Random sampling pattern used by the integrator 
+
+    :type: typing.Union[int, str]
+    '''
+
+    seed: int = None
+    '''Seed value for integrator to get different noise patterns 
+
+    :type: int
+    '''
+
+    shading_system: bool = None
+    '''Use Open Shading Language (CPU rendering only) 
+
+    :type: bool
+    '''
+
+    subsurface_samples: int = None
+    '''Number of subsurface scattering samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    texture_limit: typing.Union[int, str] = None
+    '''Limit texture size used by viewport rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_limit_render: typing.Union[int, str] = None
+    '''Limit texture size used by final rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    tile_order: typing.Union[int, str] = None
+    '''Tile order for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    transmission_bounces: int = None
+    '''Maximum number of transmission bounces, bounded by total maximum 
+
+    :type: int
+    '''
+
+    transmission_samples: int = None
+    '''Number of transmission bounce samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    transparent_max_bounces: int = None
+    '''Maximum number of transparent bounces 
+
+    :type: int
+    '''
+
+    transparent_min_bounces: int = None
+    '''Minimum number of transparent bounces, setting this lower than the maximum enables probabilistic path termination (faster but noisier) 
+
+    :type: int
+    '''
+
+    use_animated_seed: bool = None
+    '''Use different seed values (and hence noise patterns) at different frames 
+
+    :type: bool
+    '''
+
+    use_camera_cull: bool = None
+    '''Allow objects to be culled based on the camera frustum 
+
+    :type: bool
+    '''
+
+    use_distance_cull: bool = None
+    '''Allow objects to be culled based on the distance from camera 
+
+    :type: bool
+    '''
+
+    use_layer_samples: typing.Union[int, str] = None
+    '''How to use per render layer sample settings 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_progressive_refine: bool = None
+    '''Instead of rendering each tile until it is finished, refine the whole image progressively (this renders somewhat slower, but time can be saved by manually stopping the render when the noise is low enough) 
+
+    :type: bool
+    '''
+
+    use_square_samples: bool = None
+    '''Square sampling values for easier artist control 
+
+    :type: bool
+    '''
+
+    use_transparent_shadows: bool = None
+    '''Use transparency of surfaces for rendering shadows 
+
+    :type: bool
+    '''
+
+    volume_bounces: int = None
+    '''Maximum number of volumetric scattering events 
+
+    :type: int
+    '''
+
+    volume_max_steps: int = None
+    '''Maximum number of steps through the volume before giving up, to avoid extremely long render times with big objects or small step sizes 
+
+    :type: int
+    '''
+
+    volume_samples: int = None
+    '''Number of volume scattering samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    volume_step_size: float = None
+    '''Distance between volume shader samples when rendering the volume (lower values give more accurate and detailed results, but also increased render time) 
+
+    :type: float
+    '''
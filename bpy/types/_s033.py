@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CyclesVisibilitySettings:
+    camera: bool = None
+    '''Object visibility for camera rays 
+
+    :type: bool
+    '''
+
+    diffuse: bool = None
+    '''Object visibility for diffuse reflection rays 
+
+    :type: bool
+    '''
+
+    glossy: bool = None
+    '''Object visibility for glossy reflection rays 
+
+    :type: bool
+    '''
+
+    scatter: bool = None
+    '''Object visibility for volume scatter rays 
+
+    :type: bool
+    '''
+
+    shadow: bool = None
+    '''Object visibility for shadow rays 
+
+    :type: bool
+    '''
+
+    transmission: bool = None
+    '''Object visibility for transmission rays 
+
+    :type: bool
+    '''
+
+
+class CyclesWorldSettings:
+    homogeneous_volume: bool = None
+    '''When using volume rendering, assume volume has the same density everywhere(not using any textures), for faster rendering 
+
+    :type: bool
+    '''
+
+    max_bounces: int = None
+    '''Maximum number of bounces the background light will contribute to the render 
+
+    :type: int
+    '''
+
+    sample_as_light: bool = None
+    '''Use multiple importance sampling for the environment, enabling for non-solid colors is recommended 
+
+    :type: bool
+    '''
+
+    sample_map_resolution: int = None
+    '''Importance map size is resolution x resolution; higher values potentially produce less noise, at the cost of memory and speed 
+
+    :type: int
+    '''
+
+    samples: int = None
+    '''Number of light samples to render for each AA sample 
+
+    :type: int
+    '''
+
+    volume_interpolation: typing.Union[int, str] = None
+    '''Interpolation method to use for volumes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    volume_sampling: typing.Union[int, str] = None
+    '''Sampling method to use for volumes 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class DampedTrackConstraint:
+    '''Point toward target by taking the shortest rotation path '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    track_axis: typing.Union[int, str] = None
+    '''Axis that points to the target object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+
+class DataTransferModifier:
+    '''Modifier transferring some data from a source mesh '''
+
+    data_types_edges: typing.Set[typing.Union[int, str]] = None
+    '''Which edge data layers to transfer 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    data_types_loops: typing.Set[typing.Union[int, str]] = None
+    '''Which face corner data layers to transfer 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    data_types_polys: typing.Set[typing.Union[int, str]] = None
+    '''Which poly data layers to transfer 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    data_types_verts: typing.Set[typing.Union[int, str]] = None
+    '''Which vertex data layers to transfer 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    edge_mapping: typing.Union[int, str] = None
+    '''Method used to map source edges to destination ones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    islands_precision: float = None
+    '''Factor controlling precision of islands handling (typically, 0.1 should be enough, higher values can make things really slow) 
+
+    :type: float
+    '''
+
+    layers_uv_select_dst: typing.Union[int, str] = None
+    '''How to match source and destination layers 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layers_uv_select_src: typing.Union[int, str] = None
+    '''Which layers to transfer, in case of multi-layers types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layers_vcol_select_dst: typing.Union[int, str] = None
+    '''How to match source and destination layers 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layers_vcol_select_src: typing.Union[int, str] = None
+    '''Which layers to transfer, in case of multi-layers types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layers_vgroup_select_dst: typing.Union[int, str] = None
+    '''How to match source and destination layers 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layers_vgroup_select_src: typing.Union[int, str] = None
+    '''Which layers to transfer, in case of multi-layers types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    loop_mapping: typing.Union[int, str] = None
+    '''Method used to map source faces’ corners to destination ones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    max_distance: float = None
+    '''Maximum allowed distance between source and destination element, for non-topology mappings 
+
+    :type: float
+    '''
+
+    mix_factor: float = None
+    '''Factor to use when applying data to destination (exact behavior depends on mix mode) 
+
+    :type: float
+    '''
+
+    mix_mode: typing.Union[int, str] = None
+    '''How to affect destination elements with source values 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object to transfer data from 
+
+    :type: 'Object'
+    '''
+
+    poly_mapping: typing.Union[int, str] = None
+    '''Method used to map source faces to destination ones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ray_radius: float = None
+    '''‘Width’ of rays (especially useful when raycasting against vertices or edges) 
+
+    :type: float
+    '''
+
+    use_edge_data: bool = None
+    '''Enable edge data transfer 
+
+    :type: bool
+    '''
+
+    use_loop_data: bool = None
+    '''Enable face corner data transfer 
+
+    :type: bool
+    '''
+
+    use_max_distance: bool = None
+    '''Source elements must be closer than given distance from destination one 
+
+    :type: bool
+    '''
+
+    use_object_transform: bool = None
+    '''Evaluate source and destination meshes in global space 
+
+    :type: bool
+    '''
+
+    use_poly_data: bool = None
+    '''Enable face data transfer 
+
+    :type: bool
+    '''
+
+    use_vert_data: bool = None
+    '''Enable vertex data transfer 
+
+    :type: bool
+    '''
+
+    vert_mapping: typing.Union[int, str] = None
+    '''Method used to map source vertices to destination ones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name for selecting the affected areas 
+
+    :type: str
+    '''
+
+
+class DecimateModifier:
+    '''Decimation modifier '''
+
+    angle_limit: float = None
+    '''Only dissolve angles below this (planar only) 
+
+    :type: float
+    '''
+
+    decimate_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    delimit: typing.Set[typing.Union[int, str]] = None
+    '''Limit merging geometry 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    face_count: int = None
+    '''The current number of faces in the decimated mesh 
+
+    :type: int
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence (collapse only) 
+
+    :type: bool
+    '''
+
+    iterations: int = None
+    '''Number of times reduce the geometry (unsubdivide only) 
+
+    :type: int
+    '''
+
+    ratio: float = None
+    '''Ratio of triangles to reduce to (collapse only) 
+
+    :type: float
+    '''
+
+    symmetry_axis: typing.Union[int, str] = None
+    '''Axis of symmetry 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_collapse_triangulate: bool = None
+    '''Keep triangulated faces resulting from decimation (collapse only) 
+
+    :type: bool
+    '''
+
+    use_dissolve_boundaries: bool = None
+    '''Dissolve all vertices inbetween face boundaries (planar only) 
+
+    :type: bool
+    '''
+
+    use_symmetry: bool = None
+    '''Maintain symmetry on an axis 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name (collapse only) 
+
+    :type: str
+    '''
+
+    vertex_group_factor: float = None
+    '''Vertex group strength 
+
+    :type: float
+    '''
+
+
+class DelaySensor:
+    '''Sensor to send delayed events '''
+
+    delay: int = None
+    '''Delay in number of logic tics before the positive trigger (default 60 per second) 
+
+    :type: int
+    '''
+
+    duration: int = None
+    '''If >0, delay in number of logic tics before the negative trigger following the positive trigger 
+
+    :type: int
+    '''
+
+    use_repeat: bool = None
+    '''Toggle repeat option (if selected, the sensor restarts after Delay+Duration logic tics) 
+
+    :type: bool
+    '''
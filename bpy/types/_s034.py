@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Depsgraph:
+    def debug_graphviz(self, filename: str):
+        '''debug_graphviz 
+
+        :param filename: File Name, File in which to store graphviz debug output 
+        :type filename: str
+        '''
+        pass
+
+    def debug_rebuild(self, ):
+        '''debug_rebuild 
+
+        '''
+        pass
+
+    def debug_stats(self, ):
+        '''Report the number of elements in the Dependency Graph 
+
+        '''
+        pass
+
+
+class DisplaceModifier:
+    '''Displacement modifier '''
+
+    direction: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mid_level: float = None
+    '''Material value that gives no displacement 
+
+    :type: float
+    '''
+
+    space: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    strength: float = None
+    '''Amount to displace geometry 
+
+    :type: float
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_coords_object: 'Object' = None
+    '''Object to set the texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class DisplaySafeAreas:
+    '''Safe Areas used in 3D view and the VSE '''
+
+    action: float = None
+    '''Safe area for general elements 
+
+    :type: float
+    '''
+
+    action_center: float = None
+    '''Safe area for general elements in a different aspect ratio 
+
+    :type: float
+    '''
+
+    title: float = None
+    '''Safe area for text and graphics 
+
+    :type: float
+    '''
+
+    title_center: float = None
+    '''Safe area for text and graphics in a different aspect ratio 
+
+    :type: float
+    '''
+
+
+class DistortedNoiseTexture:
+    '''Procedural distorted noise texture '''
+
+    distortion: float = None
+    '''Amount of distortion 
+
+    :type: float
+    '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_distortion: typing.Union[int, str] = None
+    '''Noise basis for the distortion 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class DomainFluidSettings:
+    '''Fluid simulation settings for the domain of a fluid simulation '''
+
+    compressibility: float = None
+    '''Allowed compressibility due to gravitational force for standing fluid (directly affects simulation step size) 
+
+    :type: float
+    '''
+
+    end_time: float = None
+    '''Simulation time of the last blender frame (in seconds) 
+
+    :type: float
+    '''
+
+    filepath: str = None
+    '''Directory (and/or filename prefix) to store baked fluid simulation files in 
+
+    :type: str
+    '''
+
+    fluid_mesh_vertices: typing.List['FluidVertexVelocity'] = None
+    '''Vertices of the fluid mesh generated by simulation 
+
+    :type: typing.List['FluidVertexVelocity']
+    '''
+
+    frame_offset: int = None
+    '''Offset when reading baked cache 
+
+    :type: int
+    '''
+
+    generate_particles: float = None
+    '''Amount of particles to generate (0=off, 1=normal, >1=more) 
+
+    :type: float
+    '''
+
+    gravity: float = None
+    '''Gravity in X, Y and Z direction 
+
+    :type: float
+    '''
+
+    grid_levels: int = None
+    '''Number of coarsened grids to use (-1 for automatic) 
+
+    :type: int
+    '''
+
+    memory_estimate: str = None
+    '''Estimated amount of memory needed for baking the domain 
+
+    :type: str
+    '''
+
+    partial_slip_factor: float = None
+    '''Amount of mixing between no- and free-slip, 0 is no slip and 1 is free slip 
+
+    :type: float
+    '''
+
+    preview_resolution: int = None
+    '''Preview resolution in X,Y and Z direction 
+
+    :type: int
+    '''
+
+    render_display_mode: typing.Union[int, str] = None
+    '''How to display the mesh for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution: int = None
+    '''Domain resolution in X,Y and Z direction 
+
+    :type: int
+    '''
+
+    simulation_rate: float = None
+    '''Fluid motion rate (0 = stationary, 1 = normal speed) 
+
+    :type: float
+    '''
+
+    simulation_scale: float = None
+    '''Size of the simulation domain in meters 
+
+    :type: float
+    '''
+
+    slip_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    start_time: float = None
+    '''Simulation time of the first blender frame (in seconds) 
+
+    :type: float
+    '''
+
+    surface_smooth: float = None
+    '''Amount of surface smoothing (a value of 0 is off, 1 is normal smoothing and more than 1 is extra smoothing) 
+
+    :type: float
+    '''
+
+    surface_subdivisions: int = None
+    '''Number of isosurface subdivisions (this is necessary for the inclusion of particles into the surface generation - WARNING: can lead to longer computation times !) 
+
+    :type: int
+    '''
+
+    threads: int = None
+    '''Override number of threads for the simulation, 0 is automatic 
+
+    :type: int
+    '''
+
+    tracer_particles: int = None
+    '''Number of tracer particles to generate 
+
+    :type: int
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse fluid frames 
+
+    :type: bool
+    '''
+
+    use_speed_vectors: bool = None
+    '''Generate speed vectors for vector blur 
+
+    :type: bool
+    '''
+
+    use_surface_noobs: bool = None
+    '''Removes the air gap between fluid surface and obstacles - WARNING: Can result in a dissolving surface in other areas 
+
+    :type: bool
+    '''
+
+    use_time_override: bool = None
+    '''Use a custom start and end time (in seconds) instead of the scene’s timeline 
+
+    :type: bool
+    '''
+
+    viewport_display_mode: typing.Union[int, str] = None
+    '''How to display the mesh in the viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    viscosity_base: float = None
+    '''Viscosity setting: value that is multiplied by 10 to the power of (exponent*-1) 
+
+    :type: float
+    '''
+
+    viscosity_exponent: int = None
+    '''Negative exponent for the viscosity value (to simplify entering small values e.g. 5*10^-6) 
+
+    :type: int
+    '''
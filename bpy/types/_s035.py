@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class DopeSheet:
+    '''Settings for filtering the channels shown in animation editors '''
+
+    filter_fcurve_name: str = None
+    '''F-Curve live filtering string 
+
+    :type: str
+    '''
+
+    filter_group: 'Group' = None
+    '''Group that included object should be a member of 
+
+    :type: 'Group'
+    '''
+
+    filter_text: str = None
+    '''Live filtering string 
+
+    :type: str
+    '''
+
+    show_armatures: bool = None
+    '''Include visualization of armature related animation data 
+
+    :type: bool
+    '''
+
+    show_cameras: bool = None
+    '''Include visualization of camera related animation data 
+
+    :type: bool
+    '''
+
+    show_curves: bool = None
+    '''Include visualization of curve related animation data 
+
+    :type: bool
+    '''
+
+    show_datablock_filters: bool = None
+    '''Show options for whether channels related to certain types of data are included 
+
+    :type: bool
+    '''
+
+    show_expanded_summary: bool = None
+    '''Collapse summary when shown, so all other channels get hidden (Dope Sheet editors only) 
+
+    :type: bool
+    '''
+
+    show_gpencil: bool = None
+    '''Include visualization of Grease Pencil related animation data and frames 
+
+    :type: bool
+    '''
+
+    show_gpencil_3d_only: bool = None
+    '''Only show Grease Pencil data-blocks used as part of the active scene 
+
+    :type: bool
+    '''
+
+    show_hidden: bool = None
+    '''Include channels from objects/bone that are not visible 
+
+    :type: bool
+    '''
+
+    show_lamps: bool = None
+    '''Include visualization of lamp related animation data 
+
+    :type: bool
+    '''
+
+    show_lattices: bool = None
+    '''Include visualization of lattice related animation data 
+
+    :type: bool
+    '''
+
+    show_linestyles: bool = None
+    '''Include visualization of Line Style related Animation data 
+
+    :type: bool
+    '''
+
+    show_materials: bool = None
+    '''Include visualization of material related animation data 
+
+    :type: bool
+    '''
+
+    show_meshes: bool = None
+    '''Include visualization of mesh related animation data 
+
+    :type: bool
+    '''
+
+    show_metaballs: bool = None
+    '''Include visualization of metaball related animation data 
+
+    :type: bool
+    '''
+
+    show_missing_nla: bool = None
+    '''Include animation data-blocks with no NLA data (NLA editor only) 
+
+    :type: bool
+    '''
+
+    show_modifiers: bool = None
+    '''Include visualization of animation data related to data-blocks linked to modifiers 
+
+    :type: bool
+    '''
+
+    show_nodes: bool = None
+    '''Include visualization of node related animation data 
+
+    :type: bool
+    '''
+
+    show_only_errors: bool = None
+    '''Only include F-Curves and drivers that are disabled or have errors 
+
+    :type: bool
+    '''
+
+    show_only_group_objects: bool = None
+    '''Only include channels from objects in the specified group 
+
+    :type: bool
+    '''
+
+    show_only_matching_fcurves: bool = None
+    '''Only include F-Curves with names containing search text 
+
+    :type: bool
+    '''
+
+    show_only_selected: bool = None
+    '''Only include channels relating to selected objects and data 
+
+    :type: bool
+    '''
+
+    show_particles: bool = None
+    '''Include visualization of particle related animation data 
+
+    :type: bool
+    '''
+
+    show_scenes: bool = None
+    '''Include visualization of scene related animation data 
+
+    :type: bool
+    '''
+
+    show_shapekeys: bool = None
+    '''Include visualization of shape key related animation data 
+
+    :type: bool
+    '''
+
+    show_speakers: bool = None
+    '''Include visualization of speaker related animation data 
+
+    :type: bool
+    '''
+
+    show_summary: bool = None
+    '''Display an additional ‘summary’ line (Dope Sheet editors only) 
+
+    :type: bool
+    '''
+
+    show_textures: bool = None
+    '''Include visualization of texture related animation data 
+
+    :type: bool
+    '''
+
+    show_transforms: bool = None
+    '''Include visualization of object-level animation data (mostly transforms) 
+
+    :type: bool
+    '''
+
+    show_worlds: bool = None
+    '''Include visualization of world related animation data 
+
+    :type: bool
+    '''
+
+    source: 'ID' = None
+    '''ID-Block representing source data, usually ID_SCE (i.e. Scene) 
+
+    :type: 'ID'
+    '''
+
+    use_datablock_sort: bool = None
+    '''Alphabetically sorts data-blocks - mainly objects in the scene (disable to increase viewport speed) 
+
+    :type: bool
+    '''
+
+    use_filter_text: bool = None
+    '''Only include channels with names containing search text 
+
+    :type: bool
+    '''
+
+    use_multi_word_filter: bool = None
+    '''Perform fuzzy/multi-word matching (WARNING: May be slow) 
+
+    :type: bool
+    '''
+
+
+class Driver:
+    '''Driver for the value of a setting based on an external value '''
+
+    expression: str = None
+    '''Expression to use for Scripted Expression 
+
+    :type: str
+    '''
+
+    is_valid: bool = None
+    '''Driver could not be evaluated in past, so should be skipped 
+
+    :type: bool
+    '''
+
+    show_debug_info: bool = None
+    '''Show intermediate values for the driver calculations to allow debugging of drivers 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Driver type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_self: bool = None
+    '''Include a ‘self’ variable in the name-space, so drivers can easily reference the data being modified (object, bone, etc…) 
+
+    :type: bool
+    '''
+
+    variables: typing.List['ChannelDriverVariables'] = None
+    '''Properties acting as inputs for this driver 
+
+    :type: typing.List['ChannelDriverVariables']
+    '''
+
+
+class DriverTarget:
+    '''Source of input values for driver variables '''
+
+    bone_target: str = None
+    '''Name of PoseBone to use as target 
+
+    :type: str
+    '''
+
+    data_path: str = None
+    '''RNA Path (from ID-block) to property used 
+
+    :type: str
+    '''
+
+    id: 'ID' = None
+    '''ID-block that the specific property used can be found from (id_type property must be set first) 
+
+    :type: 'ID'
+    '''
+
+    id_type: typing.Union[int, str] = None
+    '''Type of ID-block that can be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    transform_space: typing.Union[int, str] = None
+    '''Space in which transforms are used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    transform_type: typing.Union[int, str] = None
+    '''Driver variable type 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class DriverVariable:
+    '''Variable from some source/target for driver relationship '''
+
+    is_name_valid: bool = None
+    '''Is this a valid name for a driver variable 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name to use in scripted expressions/functions (no spaces or dots are allowed, and must start with a letter) 
+
+    :type: str
+    '''
+
+    targets: typing.List['DriverTarget'] = None
+    '''Sources of input data for evaluating this variable 
+
+    :type: typing.List['DriverTarget']
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Driver variable type 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class DupliObject:
+    '''An object duplicate '''
+
+    hide: bool = None
+    '''Don’t show dupli object in viewport or render 
+
+    :type: bool
+    '''
+
+    index: int = None
+    '''Index in the lowest-level dupli list 
+
+    :type: int
+    '''
+
+    matrix: float = None
+    '''Object duplicate transformation matrix 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object being duplicated 
+
+    :type: 'Object'
+    '''
+
+    orco: float = None
+    '''Generated coordinates in parent object space 
+
+    :type: float
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''Particle system that this dupli object was instanced from 
+
+    :type: 'ParticleSystem'
+    '''
+
+    persistent_id: int = None
+    '''Persistent identifier for inter-frame matching of objects with motion blur 
+
+    :type: int
+    '''
+
+    random_id: int = None
+    '''Random id for this dupli object 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Duplicator type that generated this dupli object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    uv: float = None
+    '''UV coordinates in parent object space 
+
+    :type: float
+    '''
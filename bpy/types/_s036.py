@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class DynamicPaintBrushSettings:
+    '''Brush settings '''
+
+    invert_proximity: bool = None
+    '''Proximity falloff is applied inside the volume 
+
+    :type: bool
+    '''
+
+    material: 'Material' = None
+    '''Material to use (if not defined, material linked to the mesh is used) 
+
+    :type: 'Material'
+    '''
+
+    paint_alpha: float = None
+    '''Paint alpha 
+
+    :type: float
+    '''
+
+    paint_color: float = None
+    '''Color of the paint 
+
+    :type: float
+    '''
+
+    paint_distance: float = None
+    '''Maximum distance from brush to mesh surface to affect paint 
+
+    :type: float
+    '''
+
+    paint_ramp: 'ColorRamp' = None
+    '''Color ramp used to define proximity falloff 
+
+    :type: 'ColorRamp'
+    '''
+
+    paint_source: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    paint_wetness: float = None
+    '''Paint wetness, visible in wetmap (some effects only affect wet paint) 
+
+    :type: float
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''The particle system to paint with 
+
+    :type: 'ParticleSystem'
+    '''
+
+    proximity_falloff: typing.Union[int, str] = None
+    '''Proximity falloff type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ray_direction: typing.Union[int, str] = None
+    '''Ray direction to use for projection (if brush object is located in that direction it’s painted) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    smooth_radius: float = None
+    '''Smooth falloff added after solid radius 
+
+    :type: float
+    '''
+
+    smudge_strength: float = None
+    '''Smudge effect strength 
+
+    :type: float
+    '''
+
+    solid_radius: float = None
+    '''Radius that will be painted solid 
+
+    :type: float
+    '''
+
+    use_absolute_alpha: bool = None
+    '''Only increase alpha value if paint alpha is higher than existing 
+
+    :type: bool
+    '''
+
+    use_material: bool = None
+    '''Use object material to define color and influence 
+
+    :type: bool
+    '''
+
+    use_negative_volume: bool = None
+    '''Negate influence inside the volume 
+
+    :type: bool
+    '''
+
+    use_paint_erase: bool = None
+    '''Erase / remove paint instead of adding it 
+
+    :type: bool
+    '''
+
+    use_particle_radius: bool = None
+    '''Use radius from particle settings 
+
+    :type: bool
+    '''
+
+    use_proximity_project: bool = None
+    '''Brush is projected to canvas from defined direction within brush proximity 
+
+    :type: bool
+    '''
+
+    use_proximity_ramp_alpha: bool = None
+    '''Only read color ramp alpha 
+
+    :type: bool
+    '''
+
+    use_smudge: bool = None
+    '''Make this brush to smudge existing paint as it moves 
+
+    :type: bool
+    '''
+
+    use_velocity_alpha: bool = None
+    '''Multiply brush influence by velocity color ramp alpha 
+
+    :type: bool
+    '''
+
+    use_velocity_color: bool = None
+    '''Replace brush color by velocity color ramp 
+
+    :type: bool
+    '''
+
+    use_velocity_depth: bool = None
+    '''Multiply brush intersection depth (displace, waves) by velocity ramp alpha 
+
+    :type: bool
+    '''
+
+    velocity_max: float = None
+    '''Velocity considered as maximum influence (Blender units per frame) 
+
+    :type: float
+    '''
+
+    velocity_ramp: 'ColorRamp' = None
+    '''Color ramp used to define brush velocity effect 
+
+    :type: 'ColorRamp'
+    '''
+
+    wave_clamp: float = None
+    '''Maximum level of surface intersection used to influence waves (use 0.0 to disable) 
+
+    :type: float
+    '''
+
+    wave_factor: float = None
+    '''Multiplier for wave influence of this brush 
+
+    :type: float
+    '''
+
+    wave_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class DynamicPaintCanvasSettings:
+    '''Dynamic Paint canvas settings '''
+
+    canvas_surfaces: typing.List['DynamicPaintSurfaces'] = None
+    '''Paint surface list 
+
+    :type: typing.List['DynamicPaintSurfaces']
+    '''
+
+
+class DynamicPaintModifier:
+    '''Dynamic Paint modifier '''
+
+    brush_settings: 'DynamicPaintBrushSettings' = None
+    '''
+
+    :type: 'DynamicPaintBrushSettings'
+    '''
+
+    canvas_settings: 'DynamicPaintCanvasSettings' = None
+    '''
+
+    :type: 'DynamicPaintCanvasSettings'
+    '''
+
+    ui_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class DynamicPaintSurface:
+    '''A canvas surface layer '''
+
+    brush_group: 'Group' = None
+    '''Only use brush objects from this group 
+
+    :type: 'Group'
+    '''
+
+    brush_influence_scale: float = None
+    '''Adjust influence brush objects have on this surface 
+
+    :type: float
+    '''
+
+    brush_radius_scale: float = None
+    '''Adjust radius of proximity brushes or particles for this surface 
+
+    :type: float
+    '''
+
+    color_dry_threshold: float = None
+    '''The wetness level when colors start to shift to the background 
+
+    :type: float
+    '''
+
+    color_spread_speed: float = None
+    '''How fast colors get mixed within wet paint 
+
+    :type: float
+    '''
+
+    depth_clamp: float = None
+    '''Maximum level of depth intersection in object space (use 0.0 to disable) 
+
+    :type: float
+    '''
+
+    displace_factor: float = None
+    '''Strength of displace when applied to the mesh 
+
+    :type: float
+    '''
+
+    displace_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    dissolve_speed: int = None
+    '''Approximately in how many frames should dissolve happen 
+
+    :type: int
+    '''
+
+    drip_acceleration: float = None
+    '''How much surface acceleration affects dripping 
+
+    :type: float
+    '''
+
+    drip_velocity: float = None
+    '''How much surface velocity affects dripping 
+
+    :type: float
+    '''
+
+    dry_speed: int = None
+    '''Approximately in how many frames should drying happen 
+
+    :type: int
+    '''
+
+    effect_ui: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    frame_end: int = None
+    '''Simulation end frame 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Simulation start frame 
+
+    :type: int
+    '''
+
+    frame_substeps: int = None
+    '''Do extra frames between scene frames to ensure smooth motion 
+
+    :type: int
+    '''
+
+    image_fileformat: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    image_output_path: str = None
+    '''Directory to save the textures 
+
+    :type: str
+    '''
+
+    image_resolution: int = None
+    '''Output image resolution 
+
+    :type: int
+    '''
+
+    init_color: float = None
+    '''Initial color of the surface 
+
+    :type: float
+    '''
+
+    init_color_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    init_layername: str = None
+    '''
+
+    :type: str
+    '''
+
+    init_texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    is_active: bool = None
+    '''Toggle whether surface is processed or ignored 
+
+    :type: bool
+    '''
+
+    is_cache_user: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Surface name 
+
+    :type: str
+    '''
+
+    output_name_a: str = None
+    '''Name used to save output from this surface 
+
+    :type: str
+    '''
+
+    output_name_b: str = None
+    '''Name used to save output from this surface 
+
+    :type: str
+    '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    preview_id: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_preview: bool = None
+    '''Display surface preview in 3D-views 
+
+    :type: bool
+    '''
+
+    shrink_speed: float = None
+    '''How fast shrink effect moves on the canvas surface 
+
+    :type: float
+    '''
+
+    spread_speed: float = None
+    '''How fast spread effect moves on the canvas surface 
+
+    :type: float
+    '''
+
+    surface_format: typing.Union[int, str] = None
+    '''Surface Format 
+
+    :type: typing.Union[int, str]
+    '''
+
+    surface_type: typing.Union[int, str] = None
+    '''Surface Type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_antialiasing: bool = None
+    '''Use 5x multisampling to smooth paint edges 
+
+    :type: bool
+    '''
+
+    use_color_preview: bool = None
+    '''Whether this surface has some color preview for 3D view 
+
+    :type: bool
+    '''
+
+    use_dissolve: bool = None
+    '''Enable to make surface changes disappear over time 
+
+    :type: bool
+    '''
+
+    use_dissolve_log: bool = None
+    '''Use logarithmic dissolve (makes high values to fade faster than low values) 
+
+    :type: bool
+    '''
+
+    use_drip: bool = None
+    '''Process drip effect (drip wet paint to gravity direction) 
+
+    :type: bool
+    '''
+
+    use_dry_log: bool = None
+    '''Use logarithmic drying (makes high values to dry faster than low values) 
+
+    :type: bool
+    '''
+
+    use_drying: bool = None
+    '''Enable to make surface wetness dry over time 
+
+    :type: bool
+    '''
+
+    use_incremental_displace: bool = None
+    '''New displace is added cumulatively on top of existing 
+
+    :type: bool
+    '''
+
+    use_output_a: bool = None
+    '''Save this output layer 
+
+    :type: bool
+    '''
+
+    use_output_b: bool = None
+    '''Save this output layer 
+
+    :type: bool
+    '''
+
+    use_premultiply: bool = None
+    '''Multiply color by alpha (recommended for Blender input) 
+
+    :type: bool
+    '''
+
+    use_shrink: bool = None
+    '''Process shrink effect (shrink paint areas) 
+
+    :type: bool
+    '''
+
+    use_spread: bool = None
+    '''Process spread effect (spread wet paint around surface) 
+
+    :type: bool
+    '''
+
+    use_wave_open_border: bool = None
+    '''Pass waves through mesh edges 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    wave_damping: float = None
+    '''Wave damping factor 
+
+    :type: float
+    '''
+
+    wave_smoothness: float = None
+    '''Limit maximum steepness of wave slope between simulation points (use higher values for smoother waves at expense of reduced detail) 
+
+    :type: float
+    '''
+
+    wave_speed: float = None
+    '''Wave propagation speed 
+
+    :type: float
+    '''
+
+    wave_spring: float = None
+    '''Spring force that pulls water level back to zero 
+
+    :type: float
+    '''
+
+    wave_timescale: float = None
+    '''Wave time scaling factor 
+
+    :type: float
+    '''
+
+    def output_exists(self, object, index: int) -> bool:
+        '''Checks if surface output layer of given name exists 
+
+        :param index: Index 
+        :type index: int
+        :rtype: bool
+        '''
+        pass
+
+
+class DynamicPaintSurfaces:
+    '''Collection of Dynamic Paint Canvas surfaces '''
+
+    active: 'DynamicPaintSurface' = None
+    '''Active Dynamic Paint surface being displayed 
+
+    :type: 'DynamicPaintSurface'
+    '''
+
+    active_index: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class EdgeSplitModifier:
+    '''Edge splitting modifier to create sharp edges '''
+
+    split_angle: float = None
+    '''Angle above which to split edges 
+
+    :type: float
+    '''
+
+    use_edge_angle: bool = None
+    '''Split edges with high angle between faces 
+
+    :type: bool
+    '''
+
+    use_edge_sharp: bool = None
+    '''Split edges that are marked as sharp 
+
+    :type: bool
+    '''
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class EditObjectActuator:
+    '''Actuator used to edit objects '''
+
+    angular_velocity: float = None
+    '''Angular velocity upon creation 
+
+    :type: float
+    '''
+
+    dynamic_operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    linear_velocity: float = None
+    '''Velocity upon creation 
+
+    :type: float
+    '''
+
+    mass: float = None
+    '''The mass of the object 
+
+    :type: float
+    '''
+
+    mesh: 'Mesh' = None
+    '''Replace the existing, when left blank ‘Phys’ will remake the existing physics mesh 
+
+    :type: 'Mesh'
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''The mode of the actuator 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Add this Object and all its children (can’t be on a visible layer) 
+
+    :type: 'Object'
+    '''
+
+    time: int = None
+    '''Duration the new Object lives or the track takes 
+
+    :type: int
+    '''
+
+    track_axis: typing.Union[int, str] = None
+    '''The axis that points to the target object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    track_object: 'Object' = None
+    '''Track to this Object 
+
+    :type: 'Object'
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''The axis that points upward 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_3d_tracking: bool = None
+    '''Enable 3D tracking 
+
+    :type: bool
+    '''
+
+    use_local_angular_velocity: bool = None
+    '''Apply the rotation locally 
+
+    :type: bool
+    '''
+
+    use_local_linear_velocity: bool = None
+    '''Apply the transformation locally 
+
+    :type: bool
+    '''
+
+    use_replace_display_mesh: bool = None
+    '''Replace the display mesh 
+
+    :type: bool
+    '''
+
+    use_replace_physics_mesh: bool = None
+    '''Replace the physics mesh (triangle bounds only - compound shapes not supported) 
+
+    :type: bool
+    '''
+
+
+class EffectSequence:
+    '''Sequence strip applying an effect on the images created by other strips '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    proxy: 'SequenceProxy' = None
+    '''
+
+    :type: 'SequenceProxy'
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this strip 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+
+class EffectorWeights:
+    '''Effector weights for physics simulation '''
+
+    all: float = None
+    '''All effector’s weight 
+
+    :type: float
+    '''
+
+    apply_to_hair_growing: bool = None
+    '''Use force fields when growing hair 
+
+    :type: bool
+    '''
+
+    boid: float = None
+    '''Boid effector weight 
+
+    :type: float
+    '''
+
+    charge: float = None
+    '''Charge effector weight 
+
+    :type: float
+    '''
+
+    curve_guide: float = None
+    '''Curve guide effector weight 
+
+    :type: float
+    '''
+
+    drag: float = None
+    '''Drag effector weight 
+
+    :type: float
+    '''
+
+    force: float = None
+    '''Force effector weight 
+
+    :type: float
+    '''
+
+    gravity: float = None
+    '''Global gravity weight 
+
+    :type: float
+    '''
+
+    group: 'Group' = None
+    '''Limit effectors to this Group 
+
+    :type: 'Group'
+    '''
+
+    harmonic: float = None
+    '''Harmonic effector weight 
+
+    :type: float
+    '''
+
+    lennardjones: float = None
+    '''Lennard-Jones effector weight 
+
+    :type: float
+    '''
+
+    magnetic: float = None
+    '''Magnetic effector weight 
+
+    :type: float
+    '''
+
+    smokeflow: float = None
+    '''Smoke Flow effector weight 
+
+    :type: float
+    '''
+
+    texture: float = None
+    '''Texture effector weight 
+
+    :type: float
+    '''
+
+    turbulence: float = None
+    '''Turbulence effector weight 
+
+    :type: float
+    '''
+
+    vortex: float = None
+    '''Vortex effector weight 
+
+    :type: float
+    '''
+
+    wind: float = None
+    '''Wind effector weight 
+
+    :type: float
+    '''
+
+
+class EnumProperty:
+    '''RNA enumeration property definition, to choose from a number of predefined options '''
+
+    default: typing.Union[int, str] = None
+    '''Default value for this enum 
+
+    :type: typing.Union[int, str]
+    '''
+
+    default_flag: typing.Set[typing.Union[int, str]] = None
+    '''Default value for this enum 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    enum_items: typing.List['EnumPropertyItem'] = None
+    '''Possible values for the property 
+
+    :type: typing.List['EnumPropertyItem']
+    '''
+
+    enum_items_static: typing.List['EnumPropertyItem'] = None
+    '''Possible values for the property (never calls optional dynamic generation of those) 
+
+    :type: typing.List['EnumPropertyItem']
+    '''
+
+
+class EnumPropertyItem:
+    '''Definition of a choice in an RNA enum property '''
+
+    description: str = None
+    '''Description of the item’s purpose 
+
+    :type: str
+    '''
+
+    icon: typing.Union[int, str] = None
+    '''Icon of the item 
+
+    :type: typing.Union[int, str]
+    '''
+
+    identifier: str = None
+    '''Unique name used in the code and scripting 
+
+    :type: str
+    '''
+
+    name: str = None
+    '''Human readable name 
+
+    :type: str
+    '''
+
+    value: int = None
+    '''Value of the item 
+
+    :type: int
+    '''
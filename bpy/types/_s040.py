@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class EnvironmentMap:
+    '''Environment map created by the renderer and cached for subsequent renders '''
+
+    clip_end: float = None
+    '''Objects further than this are not visible to map 
+
+    :type: float
+    '''
+
+    clip_start: float = None
+    '''Objects nearer than this are not visible to map 
+
+    :type: float
+    '''
+
+    depth: int = None
+    '''Number of times a map will be rendered recursively (mirror effects) 
+
+    :type: int
+    '''
+
+    is_valid: bool = None
+    '''True if this map is ready for use, False if it needs rendering 
+
+    :type: bool
+    '''
+
+    layers_ignore: bool = None
+    '''Hide objects on these layers when generating the Environment Map 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution: int = None
+    '''Pixel resolution of the rendered environment map 
+
+    :type: int
+    '''
+
+    source: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    viewpoint_object: 'Object' = None
+    '''Object to use as the environment map’s viewpoint location 
+
+    :type: 'Object'
+    '''
+
+    zoom: float = None
+    '''
+
+    :type: float
+    '''
+
+    def clear(self, ):
+        '''Discard the environment map and free it from memory 
+
+        '''
+        pass
+
+    def save(self,
+             filepath: str,
+             scene: 'Scene' = None,
+             layout: float = (0.0, 0.0, 1.0, 0.0, 2.0, 0.0, 0.0, 1.0, 1.0, 1.0,
+                              2.0, 1.0)):
+        '''Save the environment map to disc using the scene render settings 
+
+        :param filepath: File path, Location of the output file 
+        :type filepath: str
+        :param scene: Overrides the scene from which image parameters are taken 
+        :type scene: 'Scene'
+        :param layout: File layout, Flat array describing the X,Y position of each cube face in the output image, where 1 is the size of a face - order is [+Z -Z +Y -X -Y +X] (use -1 to skip a face) 
+        :type layout: float
+        '''
+        pass
+
+
+class EnvironmentMapTexture:
+    '''Environment map texture '''
+
+    environment_map: 'EnvironmentMap' = None
+    '''Get the environment map associated with this texture 
+
+    :type: 'EnvironmentMap'
+    '''
+
+    filter_eccentricity: int = None
+    '''Maximum eccentricity (higher gives less blur at distant/oblique angles, but is also slower) 
+
+    :type: int
+    '''
+
+    filter_probes: int = None
+    '''Maximum number of samples (higher gives less blur at distant/oblique angles, but is also slower) 
+
+    :type: int
+    '''
+
+    filter_size: float = None
+    '''Multiply the filter size used by MIP Map and Interpolation 
+
+    :type: float
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Texture filter to use for sampling image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image: 'Image' = None
+    '''Source image file to read the environment map from 
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    use_filter_size_min: bool = None
+    '''Use Filter Size as a minimal filter value in pixels 
+
+    :type: bool
+    '''
+
+    use_mipmap: bool = None
+    '''Use auto-generated MIP maps for the image 
+
+    :type: bool
+    '''
+
+    use_mipmap_gauss: bool = None
+    '''Use Gauss filter to sample down MIP maps 
+
+    :type: bool
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class Event:
+    '''Window Manager Event '''
+
+    alt: bool = None
+    '''True when the Alt/Option key is held 
+
+    :type: bool
+    '''
+
+    ascii: str = None
+    '''Single ASCII character for this event 
+
+    :type: str
+    '''
+
+    ctrl: bool = None
+    '''True when the Ctrl key is held 
+
+    :type: bool
+    '''
+
+    is_tablet: bool = None
+    '''The pressure of the tablet or 1.0 if no tablet present 
+
+    :type: bool
+    '''
+
+    mouse_prev_x: int = None
+    '''The window relative horizontal location of the mouse 
+
+    :type: int
+    '''
+
+    mouse_prev_y: int = None
+    '''The window relative vertical location of the mouse 
+
+    :type: int
+    '''
+
+    mouse_region_x: int = None
+    '''The region relative horizontal location of the mouse 
+
+    :type: int
+    '''
+
+    mouse_region_y: int = None
+    '''The region relative vertical location of the mouse 
+
+    :type: int
+    '''
+
+    mouse_x: int = None
+    '''The window relative horizontal location of the mouse 
+
+    :type: int
+    '''
+
+    mouse_y: int = None
+    '''The window relative vertical location of the mouse 
+
+    :type: int
+    '''
+
+    oskey: bool = None
+    '''True when the Cmd key is held 
+
+    :type: bool
+    '''
+
+    pressure: float = None
+    '''The pressure of the tablet or 1.0 if no tablet present 
+
+    :type: float
+    '''
+
+    shift: bool = None
+    '''True when the Shift key is held 
+
+    :type: bool
+    '''
+
+    tilt: float = None
+    '''The pressure of the tablet or zeroes if no tablet present 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    unicode: str = None
+    '''Single unicode character for this event 
+
+    :type: str
+    '''
+
+    value: typing.Union[int, str] = None
+    '''The type of event, only applies to some 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ExplodeModifier:
+    '''Explosion effect modifier based on a particle system '''
+
+    particle_uv: str = None
+    '''UV map to change with particle age 
+
+    :type: str
+    '''
+
+    protect: float = None
+    '''Clean vertex group edges 
+
+    :type: float
+    '''
+
+    show_alive: bool = None
+    '''Show mesh when particles are alive 
+
+    :type: bool
+    '''
+
+    show_dead: bool = None
+    '''Show mesh when particles are dead 
+
+    :type: bool
+    '''
+
+    show_unborn: bool = None
+    '''Show mesh when particles are unborn 
+
+    :type: bool
+    '''
+
+    use_edge_cut: bool = None
+    '''Cut face edges for nicer shrapnel 
+
+    :type: bool
+    '''
+
+    use_size: bool = None
+    '''Use particle size for the shrapnel 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class ExpressionController:
+    '''Controller passing on events based on the evaluation of an expression '''
+
+    expression: str = None
+    '''
+
+    :type: str
+    '''
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FCurve:
+    '''F-Curve defining values of a period of time '''
+
+    array_index: int = None
+    '''Index to the specific property affected by F-Curve if applicable 
+
+    :type: int
+    '''
+
+    color: float = None
+    '''Color of the F-Curve in the Graph Editor 
+
+    :type: float
+    '''
+
+    color_mode: typing.Union[int, str] = None
+    '''Method used to determine color of F-Curve in Graph Editor 
+
+    :type: typing.Union[int, str]
+    '''
+
+    data_path: str = None
+    '''RNA Path to property affected by F-Curve 
+
+    :type: str
+    '''
+
+    driver: 'Driver' = None
+    '''Channel Driver (only set for Driver F-Curves) 
+
+    :type: 'Driver'
+    '''
+
+    extrapolation: typing.Union[int, str] = None
+    '''Method used for evaluating value of F-Curve outside first and last keyframes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    group: 'ActionGroup' = None
+    '''Action Group that this F-Curve belongs to 
+
+    :type: 'ActionGroup'
+    '''
+
+    hide: bool = None
+    '''F-Curve and its keyframes are hidden in the Graph Editor graphs 
+
+    :type: bool
+    '''
+
+    is_valid: bool = None
+    '''False when F-Curve could not be evaluated in past, so should be skipped when evaluating 
+
+    :type: bool
+    '''
+
+    keyframe_points: typing.List['Keyframe'] = None
+    '''User-editable keyframes 
+
+    :type: typing.List['Keyframe']
+    '''
+
+    lock: bool = None
+    '''F-Curve’s settings cannot be edited 
+
+    :type: bool
+    '''
+
+    modifiers: typing.List['FModifier'] = None
+    '''Modifiers affecting the shape of the F-Curve 
+
+    :type: typing.List['FModifier']
+    '''
+
+    mute: bool = None
+    '''F-Curve is not evaluated 
+
+    :type: bool
+    '''
+
+    sampled_points: typing.List['FCurveSample'] = None
+    '''Sampled animation data 
+
+    :type: typing.List['FCurveSample']
+    '''
+
+    select: bool = None
+    '''F-Curve is selected for editing 
+
+    :type: bool
+    '''
+
+    def evaluate(self, frame: float) -> float:
+        '''Evaluate F-Curve 
+
+        :param frame: Frame, Evaluate F-Curve at given frame 
+        :type frame: float
+        :rtype: float
+        :return:  Value, Value of F-Curve specific frame 
+        '''
+        pass
+
+    def update(self, ):
+        '''Ensure keyframes are sorted in chronological order and handles are set correctly 
+
+        '''
+        pass
+
+    def range(self, ) -> float:
+        '''Get the time extents for F-Curve 
+
+        :rtype: float
+        :return:  Range, Min/Max values 
+        '''
+        pass
+
+    def update_autoflags(self, data: 'AnyType'):
+        '''Update FCurve flags set automatically from affected property (currently, integer/discrete flags set when the property is not a float) 
+
+        :param data: Data, Data containing the property controlled by given FCurve 
+        :type data: 'AnyType'
+        '''
+        pass
+
+    def convert_to_samples(self, start: int, end: int):
+        '''Convert current FCurve from keyframes to sample points, if necessary 
+
+        :param start: Start Frame 
+        :type start: int
+        :param end: End Frame 
+        :type end: int
+        '''
+        pass
+
+    def convert_to_keyframes(self, start: int, end: int):
+        '''Convert current FCurve from sample points to keyframes (linear interpolation), if necessary 
+
+        :param start: Start Frame 
+        :type start: int
+        :param end: End Frame 
+        :type end: int
+        '''
+        pass
+
+
+class FCurveKeyframePoints:
+    '''Collection of keyframe points '''
+
+    def insert(
+            self,
+            frame: float,
+            value: float,
+            options: typing.Set[typing.Union[int, str]] = {},
+            keyframe_type: typing.Union[int, str] = 'KEYFRAME') -> 'Keyframe':
+        '''Add a keyframe point to a F-Curve 
+
+        :param frame: X Value of this keyframe point 
+        :type frame: float
+        :param value: Y Value of this keyframe point 
+        :type value: float
+        :param options: Keyframe optionsREPLACE Replace, Don’t add any new keyframes, but just replace existing ones.NEEDED Needed, Only adds keyframes that are needed.FAST Fast, Fast keyframe insertion to avoid recalculating the curve each time. 
+        :type options: typing.Set[typing.Union[int, str]]
+        :param keyframe_type: Type of keyframe to insertKEYFRAME Keyframe, Normal keyframe - e.g. for key poses.BREAKDOWN Breakdown, A breakdown pose - e.g. for transitions between key poses.MOVING_HOLD Moving Hold, A keyframe that is part of a moving hold.EXTREME Extreme, An ‘extreme’ pose, or some other purpose as needed.JITTER Jitter, A filler or baked keyframe for keying on ones, or some other purpose as needed. 
+        :type keyframe_type: typing.Union[int, str]
+        :rtype: 'Keyframe'
+        :return:  Newly created keyframe 
+        '''
+        pass
+
+    def add(self, count: int = 1):
+        '''Add a keyframe point to a F-Curve 
+
+        :param count: Number, Number of points to add to the spline 
+        :type count: int
+        '''
+        pass
+
+    def remove(self, keyframe: 'Keyframe', fast: bool = False):
+        '''Remove keyframe from an F-Curve 
+
+        :param keyframe: Keyframe to remove 
+        :type keyframe: 'Keyframe'
+        :param fast: Fast, Fast keyframe removal to avoid recalculating the curve each time 
+        :type fast: bool
+        '''
+        pass
+
+
+class FCurveModifiers:
+    '''Collection of F-Curve Modifiers '''
+
+    active: 'FModifier' = None
+    '''Active F-Curve Modifier 
+
+    :type: 'FModifier'
+    '''
+
+    def new(self, type: typing.Union[int, str]) -> 'FModifier':
+        '''Add a constraint to this object 
+
+        :param type: Constraint type to addNULL Invalid.GENERATOR Generator, Generate a curve using a factorized or expanded polynomial.FNGENERATOR Built-In Function, Generate a curve using standard math functions such as sin and cos.ENVELOPE Envelope, Reshape F-Curve values - e.g. change amplitude of movements.CYCLES Cycles, Cyclic extend/repeat keyframe sequence.NOISE Noise, Add pseudo-random noise on top of F-Curves.LIMITS Limits, Restrict maximum and minimum values of F-Curve.STEPPED Stepped Interpolation, Snap values to nearest grid-step - e.g. for a stop-motion look. 
+        :type type: typing.Union[int, str]
+        :rtype: 'FModifier'
+        :return:  New fmodifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'FModifier'):
+        '''Remove a modifier from this F-Curve 
+
+        :param modifier: Removed modifier 
+        :type modifier: 'FModifier'
+        '''
+        pass
+
+
+class FCurveSample:
+    '''Sample point for F-Curve '''
+
+    co: float = None
+    '''Point coordinates 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Selection status 
+
+    :type: bool
+    '''
+
+
+class FFmpegSettings:
+    '''FFmpeg related settings for the scene '''
+
+    audio_bitrate: int = None
+    '''Audio bitrate (kb/s) 
+
+    :type: int
+    '''
+
+    audio_channels: typing.Union[int, str] = None
+    '''Audio channel count 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_codec: typing.Union[int, str] = None
+    '''FFmpeg audio codec to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_mixrate: int = None
+    '''Audio samplerate(samples/s) 
+
+    :type: int
+    '''
+
+    audio_volume: float = None
+    '''Audio volume 
+
+    :type: float
+    '''
+
+    buffersize: int = None
+    '''Rate control: buffer size (kb) 
+
+    :type: int
+    '''
+
+    codec: typing.Union[int, str] = None
+    '''FFmpeg codec to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    constant_rate_factor: typing.Union[int, str] = None
+    '''Constant Rate Factor (CRF); tradeoff between video quality and file size 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ffmpeg_preset: typing.Union[int, str] = None
+    '''Tradeoff between encoding speed and compression ratio 
+
+    :type: typing.Union[int, str]
+    '''
+
+    format: typing.Union[int, str] = None
+    '''Output file container 
+
+    :type: typing.Union[int, str]
+    '''
+
+    gopsize: int = None
+    '''Distance between key frames, also known as GOP size; influences file size and seekability 
+
+    :type: int
+    '''
+
+    max_b_frames: int = None
+    '''Maximum number of B-frames between non-B-frames; influences file size and seekability 
+
+    :type: int
+    '''
+
+    maxrate: int = None
+    '''Rate control: max rate (kb/s) 
+
+    :type: int
+    '''
+
+    minrate: int = None
+    '''Rate control: min rate (kb/s) 
+
+    :type: int
+    '''
+
+    muxrate: int = None
+    '''Mux rate (bits/s(!)) 
+
+    :type: int
+    '''
+
+    packetsize: int = None
+    '''Mux packet size (byte) 
+
+    :type: int
+    '''
+
+    use_autosplit: bool = None
+    '''Autosplit output at 2GB boundary 
+
+    :type: bool
+    '''
+
+    use_lossless_output: bool = None
+    '''Use lossless output for video streams 
+
+    :type: bool
+    '''
+
+    use_max_b_frames: bool = None
+    '''Set a maximum number of B-frames 
+
+    :type: bool
+    '''
+
+    video_bitrate: int = None
+    '''Video bitrate (kb/s) 
+
+    :type: int
+    '''
+
+
+class FILEBROWSER_UL_dir:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FModifier:
+    '''Modifier for values of F-Curve '''
+
+    active: bool = None
+    '''F-Curve Modifier is the one being edited 
+
+    :type: bool
+    '''
+
+    blend_in: float = None
+    '''Number of frames from start frame for influence to take effect 
+
+    :type: float
+    '''
+
+    blend_out: float = None
+    '''Number of frames from end frame for influence to fade out 
+
+    :type: float
+    '''
+
+    frame_end: float = None
+    '''Frame that modifier’s influence ends (if Restrict Frame Range is in use) 
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''Frame that modifier’s influence starts (if Restrict Frame Range is in use) 
+
+    :type: float
+    '''
+
+    influence: float = None
+    '''Amount of influence F-Curve Modifier will have when not fading in/out 
+
+    :type: float
+    '''
+
+    is_valid: bool = None
+    '''F-Curve Modifier has invalid settings and will not be evaluated 
+
+    :type: bool
+    '''
+
+    mute: bool = None
+    '''F-Curve Modifier will not be evaluated 
+
+    :type: bool
+    '''
+
+    show_expanded: bool = None
+    '''F-Curve Modifier’s panel is expanded in UI 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''F-Curve Modifier Type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_influence: bool = None
+    '''F-Curve Modifier’s effects will be tempered by a default factor 
+
+    :type: bool
+    '''
+
+    use_restricted_range: bool = None
+    '''F-Curve Modifier is only applied for the specified frame range to help mask off effects in order to chain them 
+
+    :type: bool
+    '''
+
+
+class FModifierCycles:
+    '''Repeat the values of the modified F-Curve '''
+
+    cycles_after: int = None
+    '''Maximum number of cycles to allow after last keyframe (0 = infinite) 
+
+    :type: int
+    '''
+
+    cycles_before: int = None
+    '''Maximum number of cycles to allow before first keyframe (0 = infinite) 
+
+    :type: int
+    '''
+
+    mode_after: typing.Union[int, str] = None
+    '''Cycling mode to use after last keyframe 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mode_before: typing.Union[int, str] = None
+    '''Cycling mode to use before first keyframe 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class FModifierEnvelope:
+    '''Scale the values of the modified F-Curve '''
+
+    control_points: typing.List['FModifierEnvelopeControlPoint'] = None
+    '''Control points defining the shape of the envelope 
+
+    :type: typing.List['FModifierEnvelopeControlPoint']
+    '''
+
+    default_max: float = None
+    '''Upper distance from Reference Value for 1:1 default influence 
+
+    :type: float
+    '''
+
+    default_min: float = None
+    '''Lower distance from Reference Value for 1:1 default influence 
+
+    :type: float
+    '''
+
+    reference_value: float = None
+    '''Value that envelope’s influence is centered around / based on 
+
+    :type: float
+    '''
+
+
+class FModifierEnvelopeControlPoint:
+    '''Control point for envelope F-Modifier '''
+
+    frame: float = None
+    '''Frame this control-point occurs on 
+
+    :type: float
+    '''
+
+    max: float = None
+    '''Upper bound of envelope at this control-point 
+
+    :type: float
+    '''
+
+    min: float = None
+    '''Lower bound of envelope at this control-point 
+
+    :type: float
+    '''
+
+
+class FModifierEnvelopeControlPoints:
+    '''Control points defining the shape of the envelope '''
+
+    def add(self, frame: float) -> 'FModifierEnvelopeControlPoint':
+        '''Add a control point to a FModifierEnvelope 
+
+        :param frame: Frame to add this control-point 
+        :type frame: float
+        :rtype: 'FModifierEnvelopeControlPoint'
+        :return:  Newly created control-point 
+        '''
+        pass
+
+    def remove(self, point: 'FModifierEnvelopeControlPoint'):
+        '''Remove a control-point from an FModifierEnvelope 
+
+        :param point: Control-point to remove 
+        :type point: 'FModifierEnvelopeControlPoint'
+        '''
+        pass
+
+
+class FModifierFunctionGenerator:
+    '''Generate values using a Built-In Function '''
+
+    amplitude: float = None
+    '''Scale factor determining the maximum/minimum values 
+
+    :type: float
+    '''
+
+    function_type: typing.Union[int, str] = None
+    '''Type of built-in function to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    phase_multiplier: float = None
+    '''Scale factor determining the ‘speed’ of the function 
+
+    :type: float
+    '''
+
+    phase_offset: float = None
+    '''Constant factor to offset time by for function 
+
+    :type: float
+    '''
+
+    use_additive: bool = None
+    '''Values generated by this modifier are applied on top of the existing values instead of overwriting them 
+
+    :type: bool
+    '''
+
+    value_offset: float = None
+    '''Constant factor to offset values by 
+
+    :type: float
+    '''
+
+
+class FModifierGenerator:
+    '''Deterministically generate values for the modified F-Curve '''
+
+    coefficients: float = None
+    '''Coefficients for ‘x’ (starting from lowest power of x^0) 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Type of generator to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    poly_order: int = None
+    '''The highest power of ‘x’ for this polynomial (number of coefficients - 1) 
+
+    :type: int
+    '''
+
+    use_additive: bool = None
+    '''Values generated by this modifier are applied on top of the existing values instead of overwriting them 
+
+    :type: bool
+    '''
+
+
+class FModifierLimits:
+    '''Limit the time/value ranges of the modified F-Curve '''
+
+    max_x: float = None
+    '''Highest X value to allow 
+
+    :type: float
+    '''
+
+    max_y: float = None
+    '''Highest Y value to allow 
+
+    :type: float
+    '''
+
+    min_x: float = None
+    '''Lowest X value to allow 
+
+    :type: float
+    '''
+
+    min_y: float = None
+    '''Lowest Y value to allow 
+
+    :type: float
+    '''
+
+    use_max_x: bool = None
+    '''Use the maximum X value 
+
+    :type: bool
+    '''
+
+    use_max_y: bool = None
+    '''Use the maximum Y value 
+
+    :type: bool
+    '''
+
+    use_min_x: bool = None
+    '''Use the minimum X value 
+
+    :type: bool
+    '''
+
+    use_min_y: bool = None
+    '''Use the minimum Y value 
+
+    :type: bool
+    '''
+
+
+class FModifierNoise:
+    '''Give randomness to the modified F-Curve '''
+
+    blend_type: typing.Union[int, str] = None
+    '''Method of modifying the existing F-Curve 
+
+    :type: typing.Union[int, str]
+    '''
+
+    depth: int = None
+    '''Amount of fine level detail present in the noise 
+
+    :type: int
+    '''
+
+    offset: float = None
+    '''Time offset for the noise effect 
+
+    :type: float
+    '''
+
+    phase: float = None
+    '''A random seed for the noise effect 
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''Scaling (in time) of the noise 
+
+    :type: float
+    '''
+
+    strength: float = None
+    '''Amplitude of the noise - the amount that it modifies the underlying curve 
+
+    :type: float
+    '''
+
+
+class FModifierPython:
+    '''Perform user-defined operation on the modified F-Curve '''
+
+    pass
+
+
+class FModifierStepped:
+    '''Hold each interpolated value from the F-Curve for several frames without changing the timing '''
+
+    frame_end: float = None
+    '''Frame that modifier’s influence ends (if applicable) 
+
+    :type: float
+    '''
+
+    frame_offset: float = None
+    '''Reference number of frames before frames get held (use to get hold for ‘1-3’ vs ‘5-7’ holding patterns) 
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''Frame that modifier’s influence starts (if applicable) 
+
+    :type: float
+    '''
+
+    frame_step: float = None
+    '''Number of frames to hold each value 
+
+    :type: float
+    '''
+
+    use_frame_end: bool = None
+    '''Restrict modifier to only act before its ‘end’ frame 
+
+    :type: bool
+    '''
+
+    use_frame_start: bool = None
+    '''Restrict modifier to only act after its ‘start’ frame 
+
+    :type: bool
+    '''
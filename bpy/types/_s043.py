@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FieldSettings:
+    '''Field settings for an object in physics simulation '''
+
+    apply_to_location: bool = None
+    '''Effect particles’ location 
+
+    :type: bool
+    '''
+
+    apply_to_rotation: bool = None
+    '''Effect particles’ dynamic rotation 
+
+    :type: bool
+    '''
+
+    distance_max: float = None
+    '''Maximum distance for the field to work 
+
+    :type: float
+    '''
+
+    distance_min: float = None
+    '''Minimum distance for the field’s fall-off 
+
+    :type: float
+    '''
+
+    falloff_power: float = None
+    '''
+
+    :type: float
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    flow: float = None
+    '''Convert effector force into air flow velocity 
+
+    :type: float
+    '''
+
+    guide_clump_amount: float = None
+    '''Amount of clumping 
+
+    :type: float
+    '''
+
+    guide_clump_shape: float = None
+    '''Shape of clumping 
+
+    :type: float
+    '''
+
+    guide_free: float = None
+    '''Guide-free time from particle life’s end 
+
+    :type: float
+    '''
+
+    guide_kink_amplitude: float = None
+    '''The amplitude of the offset 
+
+    :type: float
+    '''
+
+    guide_kink_axis: typing.Union[int, str] = None
+    '''Which axis to use for offset 
+
+    :type: typing.Union[int, str]
+    '''
+
+    guide_kink_frequency: float = None
+    '''The frequency of the offset (1/total length) 
+
+    :type: float
+    '''
+
+    guide_kink_shape: float = None
+    '''Adjust the offset to the beginning/end 
+
+    :type: float
+    '''
+
+    guide_kink_type: typing.Union[int, str] = None
+    '''Type of periodic offset on the curve 
+
+    :type: typing.Union[int, str]
+    '''
+
+    guide_minimum: float = None
+    '''The distance from which particles are affected fully 
+
+    :type: float
+    '''
+
+    harmonic_damping: float = None
+    '''Damping of the harmonic force 
+
+    :type: float
+    '''
+
+    inflow: float = None
+    '''Inwards component of the vortex force 
+
+    :type: float
+    '''
+
+    linear_drag: float = None
+    '''Drag component proportional to velocity 
+
+    :type: float
+    '''
+
+    noise: float = None
+    '''Amount of noise for the force strength 
+
+    :type: float
+    '''
+
+    quadratic_drag: float = None
+    '''Drag component proportional to the square of velocity 
+
+    :type: float
+    '''
+
+    radial_falloff: float = None
+    '''Radial falloff power (real gravitational falloff = 2) 
+
+    :type: float
+    '''
+
+    radial_max: float = None
+    '''Maximum radial distance for the field to work 
+
+    :type: float
+    '''
+
+    radial_min: float = None
+    '''Minimum radial distance for the field’s fall-off 
+
+    :type: float
+    '''
+
+    rest_length: float = None
+    '''Rest length of the harmonic force 
+
+    :type: float
+    '''
+
+    seed: int = None
+    '''Seed of the noise 
+
+    :type: int
+    '''
+
+    shape: typing.Union[int, str] = None
+    '''Which direction is used to calculate the effector force 
+
+    :type: typing.Union[int, str]
+    '''
+
+    size: float = None
+    '''Size of the turbulence 
+
+    :type: float
+    '''
+
+    source_object: 'Object' = None
+    '''Select domain object of the smoke simulation 
+
+    :type: 'Object'
+    '''
+
+    strength: float = None
+    '''Strength of force field 
+
+    :type: float
+    '''
+
+    texture: 'Texture' = None
+    '''Texture to use as force 
+
+    :type: 'Texture'
+    '''
+
+    texture_mode: typing.Union[int, str] = None
+    '''How the texture effect is calculated (RGB & Curl need a RGB texture, else Gradient will be used instead) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_nabla: float = None
+    '''Defines size of derivative offset used for calculating gradient and curl 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of field 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_2d_force: bool = None
+    '''Apply force only in 2D 
+
+    :type: bool
+    '''
+
+    use_absorption: bool = None
+    '''Force gets absorbed by collision objects 
+
+    :type: bool
+    '''
+
+    use_global_coords: bool = None
+    '''Use effector/global coordinates for turbulence 
+
+    :type: bool
+    '''
+
+    use_gravity_falloff: bool = None
+    '''Multiply force by 1/distance² 
+
+    :type: bool
+    '''
+
+    use_guide_path_add: bool = None
+    '''Based on distance/falloff it adds a portion of the entire path 
+
+    :type: bool
+    '''
+
+    use_guide_path_weight: bool = None
+    '''Use curve weights to influence the particle influence along the curve 
+
+    :type: bool
+    '''
+
+    use_max_distance: bool = None
+    '''Use a maximum distance for the field to work 
+
+    :type: bool
+    '''
+
+    use_min_distance: bool = None
+    '''Use a minimum distance for the field’s fall-off 
+
+    :type: bool
+    '''
+
+    use_multiple_springs: bool = None
+    '''Every point is effected by multiple springs 
+
+    :type: bool
+    '''
+
+    use_object_coords: bool = None
+    '''Use object/global coordinates for texture 
+
+    :type: bool
+    '''
+
+    use_radial_max: bool = None
+    '''Use a maximum radial distance for the field to work 
+
+    :type: bool
+    '''
+
+    use_radial_min: bool = None
+    '''Use a minimum radial distance for the field’s fall-off 
+
+    :type: bool
+    '''
+
+    use_root_coords: bool = None
+    '''Texture coordinates from root particle locations 
+
+    :type: bool
+    '''
+
+    use_smoke_density: bool = None
+    '''Adjust force strength based on smoke density 
+
+    :type: bool
+    '''
+
+    z_direction: typing.Union[int, str] = None
+    '''Effect in full or only positive/negative Z direction 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class FileBrowserFSMenuEntry:
+    '''File Select Parameters '''
+
+    is_valid: bool = None
+    '''Whether this path is currently reachable 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    path: str = None
+    '''
+
+    :type: str
+    '''
+
+    use_save: bool = None
+    '''Whether this path is saved in bookmarks, or generated from OS 
+
+    :type: bool
+    '''
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FileSelectParams:
+    '''File Select Parameters '''
+
+    directory: str = None
+    '''Directory displayed in the file browser 
+
+    :type: str
+    '''
+
+    display_size: typing.Union[int, str] = None
+    '''Change the size of the display (width of columns or thumbnails size) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    display_type: typing.Union[int, str] = None
+    '''Display mode for the file list 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filename: str = None
+    '''Active file in the file browser 
+
+    :type: str
+    '''
+
+    filter_glob: str = None
+    '''
+
+    :type: str
+    '''
+
+    filter_id: typing.Set[typing.Union[int, str]] = None
+    '''Which ID types to show/hide, when browsing a library 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    filter_id_category: typing.Set[typing.Union[int, str]] = None
+    '''Which ID categories to show/hide, when browsing a library 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    filter_search: str = None
+    '''Filter by name, supports ‘*’ wildcard 
+
+    :type: str
+    '''
+
+    recursion_level: typing.Union[int, str] = None
+    '''Numbers of dirtree levels to show simultaneously 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_hidden: bool = None
+    '''Show hidden dot files 
+
+    :type: bool
+    '''
+
+    sort_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    title: str = None
+    '''Title for the file browser 
+
+    :type: str
+    '''
+
+    use_filter: bool = None
+    '''Enable filtering of files 
+
+    :type: bool
+    '''
+
+    use_filter_backup: bool = None
+    '''Show .blend1, .blend2, etc. files 
+
+    :type: bool
+    '''
+
+    use_filter_blender: bool = None
+    '''Show .blend files 
+
+    :type: bool
+    '''
+
+    use_filter_blendid: bool = None
+    '''Show .blend files items (objects, materials, etc.) 
+
+    :type: bool
+    '''
+
+    use_filter_folder: bool = None
+    '''Show folders 
+
+    :type: bool
+    '''
+
+    use_filter_font: bool = None
+    '''Show font files 
+
+    :type: bool
+    '''
+
+    use_filter_image: bool = None
+    '''Show image files 
+
+    :type: bool
+    '''
+
+    use_filter_movie: bool = None
+    '''Show movie files 
+
+    :type: bool
+    '''
+
+    use_filter_script: bool = None
+    '''Show script files 
+
+    :type: bool
+    '''
+
+    use_filter_sound: bool = None
+    '''Show sound files 
+
+    :type: bool
+    '''
+
+    use_filter_text: bool = None
+    '''Show text files 
+
+    :type: bool
+    '''
+
+    use_library_browsing: bool = None
+    '''Whether we may browse blender files’ content or not 
+
+    :type: bool
+    '''
+
+
+class Filter2DActuator:
+    '''Actuator to apply screen graphic effects '''
+
+    filter_pass: int = None
+    '''Set filter order 
+
+    :type: int
+    '''
+
+    glsl_shader: 'Text' = None
+    '''
+
+    :type: 'Text'
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    motion_blur_factor: float = None
+    '''Motion blur factor 
+
+    :type: float
+    '''
+
+    use_motion_blur: bool = None
+    '''Enable/Disable Motion Blur 
+
+    :type: bool
+    '''
+
+
+class FloatProperty:
+    '''RNA floating pointer number property definition '''
+
+    array_length: int = None
+    '''Maximum length of the array, 0 means unlimited 
+
+    :type: int
+    '''
+
+    default: float = None
+    '''Default value for this number 
+
+    :type: float
+    '''
+
+    default_array: float = None
+    '''Default value for this array 
+
+    :type: float
+    '''
+
+    hard_max: float = None
+    '''Maximum value used by buttons 
+
+    :type: float
+    '''
+
+    hard_min: float = None
+    '''Minimum value used by buttons 
+
+    :type: float
+    '''
+
+    is_array: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    precision: int = None
+    '''Number of digits after the dot used by buttons 
+
+    :type: int
+    '''
+
+    soft_max: float = None
+    '''Maximum value used by buttons 
+
+    :type: float
+    '''
+
+    soft_min: float = None
+    '''Minimum value used by buttons 
+
+    :type: float
+    '''
+
+    step: float = None
+    '''Step size used by number buttons, for floats 1/100th of the step size 
+
+    :type: float
+    '''
+
+
+class FloorConstraint:
+    '''Use the target object for location limitation '''
+
+    floor_location: typing.Union[int, str] = None
+    '''Location of target that object will not pass through 
+
+    :type: typing.Union[int, str]
+    '''
+
+    offset: float = None
+    '''Offset of floor from object origin 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_rotation: bool = None
+    '''Use the target’s rotation to determine floor 
+
+    :type: bool
+    '''
+
+    use_sticky: bool = None
+    '''Immobilize object while constrained 
+
+    :type: bool
+    '''
+
+
+class FluidFluidSettings:
+    '''Fluid simulation settings for the fluid in the simulation '''
+
+    initial_velocity: float = None
+    '''Initial velocity of fluid 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Object contributes to the fluid simulation 
+
+    :type: bool
+    '''
+
+    use_animated_mesh: bool = None
+    '''Export this mesh as an animated one (slower and enforces No Slip, only use if really necessary [e.g. armatures or parented objects], animated pos/rot/scale F-Curves do not require it) 
+
+    :type: bool
+    '''
+
+    volume_initialization: typing.Union[int, str] = None
+    '''Volume initialization type (WARNING: complex volumes might require too much memory and break simulation) 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class FluidSettings:
+    '''Fluid simulation settings for an object taking part in the simulation '''
+
+    type: typing.Union[int, str] = None
+    '''Type of participation in the fluid simulation 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class FluidSimulationModifier:
+    '''Fluid simulation modifier '''
+
+    settings: 'FluidSettings' = None
+    '''Settings for how this object is used in the fluid simulation 
+
+    :type: 'FluidSettings'
+    '''
+
+
+class FluidVertexVelocity:
+    '''Velocity of a simulated fluid mesh '''
+
+    velocity: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class FollowPathConstraint:
+    '''Lock motion to the target path '''
+
+    forward_axis: typing.Union[int, str] = None
+    '''Axis that points forward along the path 
+
+    :type: typing.Union[int, str]
+    '''
+
+    offset: float = None
+    '''Offset from the position corresponding to the time frame 
+
+    :type: float
+    '''
+
+    offset_factor: float = None
+    '''Percentage value defining target position along length of curve 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''Axis that points upward 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_curve_follow: bool = None
+    '''Object will follow the heading and banking of the curve 
+
+    :type: bool
+    '''
+
+    use_curve_radius: bool = None
+    '''Object is scaled by the curve radius 
+
+    :type: bool
+    '''
+
+    use_fixed_location: bool = None
+    '''Object will stay locked to a single point somewhere along the length of the curve regardless of time 
+
+    :type: bool
+    '''
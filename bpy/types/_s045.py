@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FollowTrackConstraint:
+    '''Lock motion to the target motion track '''
+
+    camera: 'Object' = None
+    '''Camera to which motion is parented (if empty active scene camera is used) 
+
+    :type: 'Object'
+    '''
+
+    clip: 'MovieClip' = None
+    '''Movie Clip to get tracking data from 
+
+    :type: 'MovieClip'
+    '''
+
+    depth_object: 'Object' = None
+    '''Object used to define depth in camera space by projecting onto surface of this object 
+
+    :type: 'Object'
+    '''
+
+    frame_method: typing.Union[int, str] = None
+    '''How the footage fits in the camera frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: str = None
+    '''Movie tracking object to follow (if empty, camera object is used) 
+
+    :type: str
+    '''
+
+    track: str = None
+    '''Movie tracking track to follow 
+
+    :type: str
+    '''
+
+    use_3d_position: bool = None
+    '''Use 3D position of track to parent to 
+
+    :type: bool
+    '''
+
+    use_active_clip: bool = None
+    '''Use active clip defined in scene 
+
+    :type: bool
+    '''
+
+    use_undistorted_position: bool = None
+    '''Parent to undistorted position of 2D track 
+
+    :type: bool
+    '''
+
+
+class FreestyleLineSet:
+    '''Line set for associating lines and style parameters '''
+
+    edge_type_combination: typing.Union[int, str] = None
+    '''Specify a logical combination of selection conditions on feature edge types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    edge_type_negation: typing.Union[int, str] = None
+    '''Specify either inclusion or exclusion of feature edges selected by edge types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    exclude_border: bool = None
+    '''Exclude border edges 
+
+    :type: bool
+    '''
+
+    exclude_contour: bool = None
+    '''Exclude contours 
+
+    :type: bool
+    '''
+
+    exclude_crease: bool = None
+    '''Exclude crease edges 
+
+    :type: bool
+    '''
+
+    exclude_edge_mark: bool = None
+    '''Exclude edge marks 
+
+    :type: bool
+    '''
+
+    exclude_external_contour: bool = None
+    '''Exclude external contours 
+
+    :type: bool
+    '''
+
+    exclude_material_boundary: bool = None
+    '''Exclude edges at material boundaries 
+
+    :type: bool
+    '''
+
+    exclude_ridge_valley: bool = None
+    '''Exclude ridges and valleys 
+
+    :type: bool
+    '''
+
+    exclude_silhouette: bool = None
+    '''Exclude silhouette edges 
+
+    :type: bool
+    '''
+
+    exclude_suggestive_contour: bool = None
+    '''Exclude suggestive contours 
+
+    :type: bool
+    '''
+
+    face_mark_condition: typing.Union[int, str] = None
+    '''Specify a feature edge selection condition based on face marks 
+
+    :type: typing.Union[int, str]
+    '''
+
+    face_mark_negation: typing.Union[int, str] = None
+    '''Specify either inclusion or exclusion of feature edges selected by face marks 
+
+    :type: typing.Union[int, str]
+    '''
+
+    group: 'Group' = None
+    '''A group of objects based on which feature edges are selected 
+
+    :type: 'Group'
+    '''
+
+    group_negation: typing.Union[int, str] = None
+    '''Specify either inclusion or exclusion of feature edges belonging to a group of objects 
+
+    :type: typing.Union[int, str]
+    '''
+
+    linestyle: 'FreestyleLineStyle' = None
+    '''Line style settings 
+
+    :type: 'FreestyleLineStyle'
+    '''
+
+    name: str = None
+    '''Line set name 
+
+    :type: str
+    '''
+
+    qi_end: int = None
+    '''Last QI value of the QI range 
+
+    :type: int
+    '''
+
+    qi_start: int = None
+    '''First QI value of the QI range 
+
+    :type: int
+    '''
+
+    select_border: bool = None
+    '''Select border edges (open mesh edges) 
+
+    :type: bool
+    '''
+
+    select_by_edge_types: bool = None
+    '''Select feature edges based on edge types 
+
+    :type: bool
+    '''
+
+    select_by_face_marks: bool = None
+    '''Select feature edges by face marks 
+
+    :type: bool
+    '''
+
+    select_by_group: bool = None
+    '''Select feature edges based on a group of objects 
+
+    :type: bool
+    '''
+
+    select_by_image_border: bool = None
+    '''Select feature edges by image border (less memory consumption) 
+
+    :type: bool
+    '''
+
+    select_by_visibility: bool = None
+    '''Select feature edges based on visibility 
+
+    :type: bool
+    '''
+
+    select_contour: bool = None
+    '''Select contours (outer silhouettes of each object) 
+
+    :type: bool
+    '''
+
+    select_crease: bool = None
+    '''Select crease edges (those between two faces making an angle smaller than the Crease Angle) 
+
+    :type: bool
+    '''
+
+    select_edge_mark: bool = None
+    '''Select edge marks (edges annotated by Freestyle edge marks) 
+
+    :type: bool
+    '''
+
+    select_external_contour: bool = None
+    '''Select external contours (outer silhouettes of occluding and occluded objects) 
+
+    :type: bool
+    '''
+
+    select_material_boundary: bool = None
+    '''Select edges at material boundaries 
+
+    :type: bool
+    '''
+
+    select_ridge_valley: bool = None
+    '''Select ridges and valleys (boundary lines between convex and concave areas of surface) 
+
+    :type: bool
+    '''
+
+    select_silhouette: bool = None
+    '''Select silhouettes (edges at the boundary of visible and hidden faces) 
+
+    :type: bool
+    '''
+
+    select_suggestive_contour: bool = None
+    '''Select suggestive contours (almost silhouette/contour edges) 
+
+    :type: bool
+    '''
+
+    show_render: bool = None
+    '''Enable or disable this line set during stroke rendering 
+
+    :type: bool
+    '''
+
+    visibility: typing.Union[int, str] = None
+    '''Determine how to use visibility for feature edge selection 
+
+    :type: typing.Union[int, str]
+    '''
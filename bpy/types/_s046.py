@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FreestyleLineStyle:
+    '''Freestyle line style, reusable by multiple line sets '''
+
+    active_texture: 'Texture' = None
+    '''Active texture slot being displayed 
+
+    :type: 'Texture'
+    '''
+
+    active_texture_index: int = None
+    '''Index of active texture slot 
+
+    :type: int
+    '''
+
+    alpha: float = None
+    '''Base alpha transparency, possibly modified by alpha transparency modifiers 
+
+    :type: float
+    '''
+
+    alpha_modifiers: typing.List['LineStyleAlphaModifier'] = None
+    '''List of alpha transparency modifiers 
+
+    :type: typing.List['LineStyleAlphaModifier']
+    '''
+
+    angle_max: float = None
+    '''Maximum 2D angle for splitting chains 
+
+    :type: float
+    '''
+
+    angle_min: float = None
+    '''Minimum 2D angle for splitting chains 
+
+    :type: float
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    caps: typing.Union[int, str] = None
+    '''Select the shape of both ends of strokes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    chain_count: int = None
+    '''Chain count for the selection of first N chains 
+
+    :type: int
+    '''
+
+    chaining: typing.Union[int, str] = None
+    '''Select the way how feature edges are jointed to form chains 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color: float = None
+    '''Base line color, possibly modified by line color modifiers 
+
+    :type: float
+    '''
+
+    color_modifiers: typing.List['LineStyleColorModifier'] = None
+    '''List of line color modifiers 
+
+    :type: typing.List['LineStyleColorModifier']
+    '''
+
+    dash1: int = None
+    '''Length of the 1st dash for dashed lines 
+
+    :type: int
+    '''
+
+    dash2: int = None
+    '''Length of the 2nd dash for dashed lines 
+
+    :type: int
+    '''
+
+    dash3: int = None
+    '''Length of the 3rd dash for dashed lines 
+
+    :type: int
+    '''
+
+    gap1: int = None
+    '''Length of the 1st gap for dashed lines 
+
+    :type: int
+    '''
+
+    gap2: int = None
+    '''Length of the 2nd gap for dashed lines 
+
+    :type: int
+    '''
+
+    gap3: int = None
+    '''Length of the 3rd gap for dashed lines 
+
+    :type: int
+    '''
+
+    geometry_modifiers: typing.List['LineStyleGeometryModifier'] = None
+    '''List of stroke geometry modifiers 
+
+    :type: typing.List['LineStyleGeometryModifier']
+    '''
+
+    integration_type: typing.Union[int, str] = None
+    '''Select the way how the sort key is computed for each chain 
+
+    :type: typing.Union[int, str]
+    '''
+
+    length_max: float = None
+    '''Maximum curvilinear 2D length for the selection of chains 
+
+    :type: float
+    '''
+
+    length_min: float = None
+    '''Minimum curvilinear 2D length for the selection of chains 
+
+    :type: float
+    '''
+
+    material_boundary: bool = None
+    '''If true, chains of feature edges are split at material boundaries 
+
+    :type: bool
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Node tree for node-based shaders 
+
+    :type: 'NodeTree'
+    '''
+
+    panel: typing.Union[int, str] = None
+    '''Select the property panel to be shown 
+
+    :type: typing.Union[int, str]
+    '''
+
+    rounds: int = None
+    '''Number of rounds in a sketchy multiple touch 
+
+    :type: int
+    '''
+
+    sort_key: typing.Union[int, str] = None
+    '''Select the sort key to determine the stacking order of chains 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sort_order: typing.Union[int, str] = None
+    '''Select the sort order 
+
+    :type: typing.Union[int, str]
+    '''
+
+    split_dash1: int = None
+    '''Length of the 1st dash for splitting 
+
+    :type: int
+    '''
+
+    split_dash2: int = None
+    '''Length of the 2nd dash for splitting 
+
+    :type: int
+    '''
+
+    split_dash3: int = None
+    '''Length of the 3rd dash for splitting 
+
+    :type: int
+    '''
+
+    split_gap1: int = None
+    '''Length of the 1st gap for splitting 
+
+    :type: int
+    '''
+
+    split_gap2: int = None
+    '''Length of the 2nd gap for splitting 
+
+    :type: int
+    '''
+
+    split_gap3: int = None
+    '''Length of the 3rd gap for splitting 
+
+    :type: int
+    '''
+
+    split_length: float = None
+    '''Curvilinear 2D length for chain splitting 
+
+    :type: float
+    '''
+
+    texture_slots: typing.List['LineStyleTextureSlot'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['LineStyleTextureSlot']
+    '''
+
+    texture_spacing: float = None
+    '''Spacing for textures along stroke length 
+
+    :type: float
+    '''
+
+    thickness: float = None
+    '''Base line thickness, possibly modified by line thickness modifiers 
+
+    :type: float
+    '''
+
+    thickness_modifiers: typing.List['LineStyleThicknessModifier'] = None
+    '''List of line thickness modifiers 
+
+    :type: typing.List['LineStyleThicknessModifier']
+    '''
+
+    thickness_position: typing.Union[int, str] = None
+    '''Thickness position of silhouettes and border edges (applicable when plain chaining is used with the Same Object option) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    thickness_ratio: float = None
+    '''A number between 0 (inside) and 1 (outside) specifying the relative position of stroke thickness 
+
+    :type: float
+    '''
+
+    use_angle_max: bool = None
+    '''Split chains at points with angles larger than the maximum 2D angle 
+
+    :type: bool
+    '''
+
+    use_angle_min: bool = None
+    '''Split chains at points with angles smaller than the minimum 2D angle 
+
+    :type: bool
+    '''
+
+    use_chain_count: bool = None
+    '''Enable the selection of first N chains 
+
+    :type: bool
+    '''
+
+    use_chaining: bool = None
+    '''Enable chaining of feature edges 
+
+    :type: bool
+    '''
+
+    use_dashed_line: bool = None
+    '''Enable or disable dashed line 
+
+    :type: bool
+    '''
+
+    use_length_max: bool = None
+    '''Enable the selection of chains by a maximum 2D length 
+
+    :type: bool
+    '''
+
+    use_length_min: bool = None
+    '''Enable the selection of chains by a minimum 2D length 
+
+    :type: bool
+    '''
+
+    use_nodes: bool = None
+    '''Use shader nodes for the line style 
+
+    :type: bool
+    '''
+
+    use_same_object: bool = None
+    '''If true, only feature edges of the same object are joined 
+
+    :type: bool
+    '''
+
+    use_sorting: bool = None
+    '''Arrange the stacking order of strokes 
+
+    :type: bool
+    '''
+
+    use_split_length: bool = None
+    '''Enable chain splitting by curvilinear 2D length 
+
+    :type: bool
+    '''
+
+    use_split_pattern: bool = None
+    '''Enable chain splitting by dashed line patterns 
+
+    :type: bool
+    '''
+
+    use_texture: bool = None
+    '''Enable or disable textured strokes 
+
+    :type: bool
+    '''
+
+
+class FreestyleModuleSettings:
+    '''Style module configuration for specifying a style module '''
+
+    script: 'Text' = None
+    '''Python script to define a style module 
+
+    :type: 'Text'
+    '''
+
+    use: bool = None
+    '''Enable or disable this style module during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class FreestyleModules:
+    '''A list of style modules (to be applied from top to bottom) '''
+
+    def new(self, ) -> 'FreestyleModuleSettings':
+        '''Add a style module to scene render layer Freestyle settings 
+
+        :rtype: 'FreestyleModuleSettings'
+        :return:  Newly created style module 
+        '''
+        pass
+
+    def remove(self, module: 'FreestyleModuleSettings'):
+        '''Remove a style module from scene render layer Freestyle settings 
+
+        :param module: Style module to remove 
+        :type module: 'FreestyleModuleSettings'
+        '''
+        pass
@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class FreestyleSettings:
+    '''Freestyle settings for a SceneRenderLayer data-block '''
+
+    crease_angle: float = None
+    '''Angular threshold for detecting crease edges 
+
+    :type: float
+    '''
+
+    kr_derivative_epsilon: float = None
+    '''Kr derivative epsilon for computing suggestive contours 
+
+    :type: float
+    '''
+
+    linesets: typing.List['Linesets'] = None
+    '''
+
+    :type: typing.List['Linesets']
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Select the Freestyle control mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    modules: typing.List['FreestyleModules'] = None
+    '''A list of style modules (to be applied from top to bottom) 
+
+    :type: typing.List['FreestyleModules']
+    '''
+
+    sphere_radius: float = None
+    '''Sphere radius for computing curvatures 
+
+    :type: float
+    '''
+
+    use_advanced_options: bool = None
+    '''Enable advanced edge detection options (sphere radius and Kr derivative epsilon) 
+
+    :type: bool
+    '''
+
+    use_culling: bool = None
+    '''If enabled, out-of-view edges are ignored 
+
+    :type: bool
+    '''
+
+    use_material_boundaries: bool = None
+    '''Enable material boundaries 
+
+    :type: bool
+    '''
+
+    use_ridges_and_valleys: bool = None
+    '''Enable ridges and valleys 
+
+    :type: bool
+    '''
+
+    use_smoothness: bool = None
+    '''Take face smoothness into account in view map calculation 
+
+    :type: bool
+    '''
+
+    use_suggestive_contours: bool = None
+    '''Enable suggestive contours 
+
+    :type: bool
+    '''
+
+    use_view_map_cache: bool = None
+    '''Keep the computed view map and avoid re-calculating it if mesh geometry is unchanged 
+
+    :type: bool
+    '''
+
+
+class Function:
+    '''RNA function definition '''
+
+    description: str = None
+    '''Description of the Function’s purpose 
+
+    :type: str
+    '''
+
+    identifier: str = None
+    '''Unique name used in the code and scripting 
+
+    :type: str
+    '''
+
+    is_registered: bool = None
+    '''Function is registered as callback as part of type registration 
+
+    :type: bool
+    '''
+
+    is_registered_optional: bool = None
+    '''Function is optionally registered as callback part of type registration 
+
+    :type: bool
+    '''
+
+    parameters: typing.List['Property'] = None
+    '''Parameters for the function 
+
+    :type: typing.List['Property']
+    '''
+
+    use_self: bool = None
+    '''Function does not pass its self as an argument (becomes a static method in python) 
+
+    :type: bool
+    '''
+
+    use_self_type: bool = None
+    '''Function passes its self type as an argument (becomes a class method in python if use_self is false) 
+
+    :type: bool
+    '''
+
+
+class GPENCIL_PIE_sculpt:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def draw_preset(self, context):
+        '''Optionally: - preset_extensions (set of strings) - preset_operator_defaults (dict of keyword args) 
+
+        '''
+        pass
+
+    def path_menu(self,
+                  searchpaths: list,
+                  operator: str,
+                  *,
+                  props_default: dict = None,
+                  prop_filepath: str = 'filepath',
+                  filter_ext: str = None,
+                  filter_path=None,
+                  display_name: str = None):
+        '''Populate a menu from a list of paths. 
+
+        :param searchpaths: Paths to scan. 
+        :type searchpaths: list
+        :param operator: The operator id to use with each file. 
+        :type operator: str
+        :param prop_filepath: Optional operator filepath property (defaults to “filepath”). 
+        :type prop_filepath: str
+        :param props_default: Properties to assign to each operator. 
+        :type props_default: dict
+        :param filter_ext: Optional callback that takes the file extensions.Returning false excludes the file from the list. 
+        :type filter_ext: str
+        :param display_name: Optional callback that takes the full path, returns the name to display. 
+        :type display_name: str
+        '''
+        pass
+
+
+class GPENCIL_PIE_settings_palette:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def draw_preset(self, context):
+        '''Optionally: - preset_extensions (set of strings) - preset_operator_defaults (dict of keyword args) 
+
+        '''
+        pass
+
+    def path_menu(self,
+                  searchpaths: list,
+                  operator: str,
+                  *,
+                  props_default: dict = None,
+                  prop_filepath: str = 'filepath',
+                  filter_ext: str = None,
+                  filter_path=None,
+                  display_name: str = None):
+        '''Populate a menu from a list of paths. 
+
+        :param searchpaths: Paths to scan. 
+        :type searchpaths: list
+        :param operator: The operator id to use with each file. 
+        :type operator: str
+        :param prop_filepath: Optional operator filepath property (defaults to “filepath”). 
+        :type prop_filepath: str
+        :param props_default: Properties to assign to each operator. 
+        :type props_default: dict
+        :param filter_ext: Optional callback that takes the file extensions.Returning false excludes the file from the list. 
+        :type filter_ext: str
+        :param display_name: Optional callback that takes the full path, returns the name to display. 
+        :type display_name: str
+        '''
+        pass
+
+
+class GPENCIL_PIE_tool_palette:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def draw_preset(self, context):
+        '''Optionally: - preset_extensions (set of strings) - preset_operator_defaults (dict of keyword args) 
+
+        '''
+        pass
+
+    def path_menu(self,
+                  searchpaths: list,
+                  operator: str,
+                  *,
+                  props_default: dict = None,
+                  prop_filepath: str = 'filepath',
+                  filter_ext: str = None,
+                  filter_path=None,
+                  display_name: str = None):
+        '''Populate a menu from a list of paths. 
+
+        :param searchpaths: Paths to scan. 
+        :type searchpaths: list
+        :param operator: The operator id to use with each file. 
+        :type operator: str
+        :param prop_filepath: Optional operator filepath property (defaults to “filepath”). 
+        :type prop_filepath: str
+        :param props_default: Properties to assign to each operator. 
+        :type props_default: dict
+        :param filter_ext: Optional callback that takes the file extensions.Returning false excludes the file from the list. 
+        :type filter_ext: str
+        :param display_name: Optional callback that takes the full path, returns the name to display. 
+        :type display_name: str
+        '''
+        pass
+
+
+class GPENCIL_PIE_tools_more:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+    def draw_preset(self, context):
+        '''Optionally: - preset_extensions (set of strings) - preset_operator_defaults (dict of keyword args) 
+
+        '''
+        pass
+
+    def path_menu(self,
+                  searchpaths: list,
+                  operator: str,
+                  *,
+                  props_default: dict = None,
+                  prop_filepath: str = 'filepath',
+                  filter_ext: str = None,
+                  filter_path=None,
+                  display_name: str = None):
+        '''Populate a menu from a list of paths. 
+
+        :param searchpaths: Paths to scan. 
+        :type searchpaths: list
+        :param operator: The operator id to use with each file. 
+        :type operator: str
+        :param prop_filepath: Optional operator filepath property (defaults to “filepath”). 
+        :type prop_filepath: str
+        :param props_default: Properties to assign to each operator. 
+        :type props_default: dict
+        :param filter_ext: Optional callback that takes the file extensions.Returning false excludes the file from the list. 
+        :type filter_ext: str
+        :param display_name: Optional callback that takes the full path, returns the name to display. 
+        :type display_name: str
+        '''
+        pass
+
+
+class GPENCIL_UL_brush:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class GPENCIL_UL_layer:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class GPENCIL_UL_palettecolor:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class GPUDOFSettings:
+    '''Settings for GPU based depth of field '''
+
+    blades: int = None
+    '''Blades for dof effect 
+
+    :type: int
+    '''
+
+    focal_length: float = None
+    '''Focal length for dof effect 
+
+    :type: float
+    '''
+
+    focus_distance: float = None
+    '''Viewport depth of field focus distance 
+
+    :type: float
+    '''
+
+    fstop: float = None
+    '''F-stop for dof effect 
+
+    :type: float
+    '''
+
+    is_hq_supported: bool = None
+    '''Use high quality depth of field 
+
+    :type: bool
+    '''
+
+    sensor: float = None
+    '''Size of sensor 
+
+    :type: float
+    '''
+
+    use_high_quality: bool = None
+    '''Use high quality depth of field 
+
+    :type: bool
+    '''
+
+
+class GPUFXSettings:
+    '''Settings for GPU based compositing '''
+
+    dof: 'GPUDOFSettings' = None
+    '''
+
+    :type: 'GPUDOFSettings'
+    '''
+
+    ssao: 'GPUSSAOSettings' = None
+    '''
+
+    :type: 'GPUSSAOSettings'
+    '''
+
+    use_dof: bool = None
+    '''Use depth of field on viewport using the values from active camera 
+
+    :type: bool
+    '''
+
+    use_ssao: bool = None
+    '''Use screen space ambient occlusion of field on viewport 
+
+    :type: bool
+    '''
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class GPUSSAOSettings:
+    '''Settings for GPU based screen space ambient occlusion '''
+
+    attenuation: float = None
+    '''Attenuation constant 
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Color for screen space ambient occlusion effect 
+
+    :type: float
+    '''
+
+    distance_max: float = None
+    '''Distance of object that contribute to the SSAO effect 
+
+    :type: float
+    '''
+
+    factor: float = None
+    '''Strength of the SSAO effect 
+
+    :type: float
+    '''
+
+    samples: int = None
+    '''Number of samples 
+
+    :type: int
+    '''
+
+
+class GPencilBrush:
+    '''Collection of brushes being used to control the line style of new strokes '''
+
+    angle: float = None
+    '''Direction of the stroke at which brush gives maximal thickness (0° for horizontal) 
+
+    :type: float
+    '''
+
+    angle_factor: float = None
+    '''Reduce brush thickness by this factor when stroke is perpendicular to ‘Angle’ direction 
+
+    :type: float
+    '''
+
+    curve_jitter: 'CurveMapping' = None
+    '''Curve used for the jitter effect 
+
+    :type: 'CurveMapping'
+    '''
+
+    curve_sensitivity: 'CurveMapping' = None
+    '''Curve used for the sensitivity 
+
+    :type: 'CurveMapping'
+    '''
+
+    curve_strength: 'CurveMapping' = None
+    '''Curve used for the strength 
+
+    :type: 'CurveMapping'
+    '''
+
+    jitter: float = None
+    '''Jitter factor for new strokes 
+
+    :type: float
+    '''
+
+    line_width: int = None
+    '''Thickness of strokes (in pixels) 
+
+    :type: int
+    '''
+
+    name: str = None
+    '''Brush name 
+
+    :type: str
+    '''
+
+    pen_sensitivity_factor: float = None
+    '''Pressure sensitivity factor for new strokes 
+
+    :type: float
+    '''
+
+    pen_smooth_factor: float = None
+    '''Amount of smoothing to apply to newly created strokes, to reduce jitter/noise 
+
+    :type: float
+    '''
+
+    pen_smooth_steps: int = None
+    '''Number of times to smooth newly created strokes 
+
+    :type: int
+    '''
+
+    pen_subdivision_steps: int = None
+    '''Number of times to subdivide newly created strokes, for less jagged strokes 
+
+    :type: int
+    '''
+
+    random_press: float = None
+    '''Randomness factor for pressure and strength in new strokes 
+
+    :type: float
+    '''
+
+    random_subdiv: float = None
+    '''Randomness factor for new strokes after subdivision 
+
+    :type: float
+    '''
+
+    strength: float = None
+    '''Color strength for new strokes (affect alpha factor of color) 
+
+    :type: float
+    '''
+
+    use_jitter_pressure: bool = None
+    '''Use tablet pressure for jitter 
+
+    :type: bool
+    '''
+
+    use_pressure: bool = None
+    '''Use tablet pressure 
+
+    :type: bool
+    '''
+
+    use_random_pressure: bool = None
+    '''Use random value for pressure 
+
+    :type: bool
+    '''
+
+    use_random_strength: bool = None
+    '''Use random value for strength 
+
+    :type: bool
+    '''
+
+    use_strength_pressure: bool = None
+    '''Use tablet pressure for color strength 
+
+    :type: bool
+    '''
+
+
+class GPencilFrame:
+    '''Collection of related sketches on a particular frame '''
+
+    frame_number: int = None
+    '''The frame on which this sketch appears 
+
+    :type: int
+    '''
+
+    is_edited: bool = None
+    '''Frame is being edited (painted on) 
+
+    :type: bool
+    '''
+
+    select: bool = None
+    '''Frame is selected for editing in the Dope Sheet 
+
+    :type: bool
+    '''
+
+    strokes: typing.List['GPencilStrokes'] = None
+    '''Freehand curves defining the sketch on this frame 
+
+    :type: typing.List['GPencilStrokes']
+    '''
+
+    def clear(self, ):
+        '''Remove all the grease pencil frame data 
+
+        '''
+        pass
+
+
+class GPencilFrames:
+    '''Collection of grease pencil frames '''
+
+    def new(self, frame_number: int) -> 'GPencilFrame':
+        '''Add a new grease pencil frame 
+
+        :param frame_number: Frame Number, The frame on which this sketch appears 
+        :type frame_number: int
+        :rtype: 'GPencilFrame'
+        :return:  The newly created frame 
+        '''
+        pass
+
+    def remove(self, frame: 'GPencilFrame'):
+        '''Remove a grease pencil frame 
+
+        :param frame: Frame, The frame to remove 
+        :type frame: 'GPencilFrame'
+        '''
+        pass
+
+    def copy(self, source: 'GPencilFrame') -> 'GPencilFrame':
+        '''Copy a grease pencil frame 
+
+        :param source: Source, The source frame 
+        :type source: 'GPencilFrame'
+        :rtype: 'GPencilFrame'
+        :return:  The newly copied frame 
+        '''
+        pass
+
+
+class GPencilInterpolateSettings:
+    '''Settings for Grease Pencil interpolation tools '''
+
+    amplitude: float = None
+    '''Amount to boost elastic bounces for ‘elastic’ easing 
+
+    :type: float
+    '''
+
+    back: float = None
+    '''Amount of overshoot for ‘back’ easing 
+
+    :type: float
+    '''
+
+    easing: typing.Union[int, str] = None
+    '''Which ends of the segment between the preceding and following grease pencil frames easing interpolation is applied to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    interpolate_all_layers: bool = None
+    '''Interpolate all layers, not only active 
+
+    :type: bool
+    '''
+
+    interpolate_selected_only: bool = None
+    '''Interpolate only selected strokes in the original frame 
+
+    :type: bool
+    '''
+
+    interpolation_curve: 'CurveMapping' = None
+    '''Custom curve to control ‘sequence’ interpolation between Grease Pencil frames 
+
+    :type: 'CurveMapping'
+    '''
+
+    period: float = None
+    '''Time between bounces for elastic easing 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Interpolation method to use the next time ‘Interpolate Sequence’ is run 
+
+    :type: typing.Union[int, str]
+    '''
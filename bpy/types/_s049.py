@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class GPencilLayer:
+    '''Collection of related sketches '''
+
+    active_frame: 'GPencilFrame' = None
+    '''Frame currently being displayed for this layer 
+
+    :type: 'GPencilFrame'
+    '''
+
+    after_color: float = None
+    '''Base color for ghosts after the active frame 
+
+    :type: float
+    '''
+
+    before_color: float = None
+    '''Base color for ghosts before the active frame 
+
+    :type: float
+    '''
+
+    frames: typing.List['GPencilFrames'] = None
+    '''Sketches for this layer on different frames 
+
+    :type: typing.List['GPencilFrames']
+    '''
+
+    ghost_after_range: int = None
+    '''Maximum number of frames to show after current frame (0 = show only the next sketch, -1 = don’t show any frames after current) 
+
+    :type: int
+    '''
+
+    ghost_before_range: int = None
+    '''Maximum number of frames to show before current frame (0 = show only the previous sketch, -1 = don’t show any frames before current) 
+
+    :type: int
+    '''
+
+    hide: bool = None
+    '''Set layer Visibility 
+
+    :type: bool
+    '''
+
+    info: str = None
+    '''Layer name 
+
+    :type: str
+    '''
+
+    is_parented: bool = None
+    '''True when the layer parent object is set 
+
+    :type: bool
+    '''
+
+    line_change: int = None
+    '''Thickness change to apply to current strokes (in pixels) 
+
+    :type: int
+    '''
+
+    lock: bool = None
+    '''Protect layer from further editing and/or frame changes 
+
+    :type: bool
+    '''
+
+    lock_frame: bool = None
+    '''Lock current frame displayed by layer 
+
+    :type: bool
+    '''
+
+    matrix_inverse: float = None
+    '''Parent inverse transformation matrix 
+
+    :type: float
+    '''
+
+    opacity: float = None
+    '''Layer Opacity 
+
+    :type: float
+    '''
+
+    parent: 'Object' = None
+    '''Parent Object 
+
+    :type: 'Object'
+    '''
+
+    parent_bone: str = None
+    '''Name of parent bone in case of a bone parenting relation 
+
+    :type: str
+    '''
+
+    parent_type: typing.Union[int, str] = None
+    '''Type of parent relation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    select: bool = None
+    '''Layer is selected for editing in the Dope Sheet 
+
+    :type: bool
+    '''
+
+    show_points: bool = None
+    '''Draw the points which make up the strokes (for debugging purposes) 
+
+    :type: bool
+    '''
+
+    show_x_ray: bool = None
+    '''Make the layer draw in front of objects 
+
+    :type: bool
+    '''
+
+    tint_color: float = None
+    '''Color for tinting stroke colors 
+
+    :type: float
+    '''
+
+    tint_factor: float = None
+    '''Factor of tinting color 
+
+    :type: float
+    '''
+
+    unlock_color: bool = None
+    '''Unprotect selected colors from further editing and/or frame changes 
+
+    :type: bool
+    '''
+
+    use_ghost_custom_colors: bool = None
+    '''Use custom colors for ghost frames 
+
+    :type: bool
+    '''
+
+    use_ghosts_always: bool = None
+    '''Ghosts are shown in renders and animation playback. Useful for special effects (e.g. motion blur) 
+
+    :type: bool
+    '''
+
+    use_onion_skinning: bool = None
+    '''Ghost frames on either side of frame 
+
+    :type: bool
+    '''
+
+    use_volumetric_strokes: bool = None
+    '''Draw strokes as a series of circular blobs, resulting in a volumetric effect 
+
+    :type: bool
+    '''
+
+    def clear(self, ):
+        '''Remove all the grease pencil layer data 
+
+        '''
+        pass
+
+
+class GPencilPalette:
+    '''Collection of related palettes '''
+
+    colors: typing.List['GPencilPaletteColors'] = None
+    '''Colors of the palette 
+
+    :type: typing.List['GPencilPaletteColors']
+    '''
+
+    name: str = None
+    '''Palette name 
+
+    :type: str
+    '''
+
+
+class GPencilPaletteColor:
+    '''Collection of related colors '''
+
+    alpha: float = None
+    '''Color Opacity 
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Color for strokes 
+
+    :type: float
+    '''
+
+    fill_alpha: float = None
+    '''Opacity for filling region bounded by each stroke 
+
+    :type: float
+    '''
+
+    fill_color: float = None
+    '''Color for filling region bounded by each stroke 
+
+    :type: float
+    '''
+
+    ghost: bool = None
+    '''Display strokes using this color when showing onion skins 
+
+    :type: bool
+    '''
+
+    hide: bool = None
+    '''Set color Visibility 
+
+    :type: bool
+    '''
+
+    is_fill_visible: bool = None
+    '''True when opacity of fill is set high enough to be visible 
+
+    :type: bool
+    '''
+
+    is_stroke_visible: bool = None
+    '''True when opacity of stroke is set high enough to be visible 
+
+    :type: bool
+    '''
+
+    lock: bool = None
+    '''Protect color from further editing and/or frame changes 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Color name 
+
+    :type: str
+    '''
+
+    use_hq_fill: bool = None
+    '''Fill strokes using high quality to avoid glitches (slower fps during animation play) 
+
+    :type: bool
+    '''
+
+    use_volumetric_strokes: bool = None
+    '''Draw strokes as a series of circular blobs, resulting in a volumetric effect 
+
+    :type: bool
+    '''
+
+
+class GPencilPaletteColors:
+    '''Collection of palette colors '''
+
+    active: 'GPencilPaletteColor' = None
+    '''Current active color 
+
+    :type: 'GPencilPaletteColor'
+    '''
+
+    active_index: int = None
+    '''Index of active palette color 
+
+    :type: int
+    '''
+
+    def new(self, ) -> 'GPencilPaletteColor':
+        '''Add a new color to the palette 
+
+        :rtype: 'GPencilPaletteColor'
+        :return:  The newly created color 
+        '''
+        pass
+
+    def remove(self, color: 'GPencilPaletteColor'):
+        '''Remove a color from the palette 
+
+        :param color: The color to remove 
+        :type color: 'GPencilPaletteColor'
+        '''
+        pass
+
+
+class GPencilSculptBrush:
+    '''Stroke editing brush '''
+
+    affect_pressure: bool = None
+    '''Affect pressure values as well when smoothing strokes 
+
+    :type: bool
+    '''
+
+    direction: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    size: int = None
+    '''Radius of the brush in pixels 
+
+    :type: int
+    '''
+
+    strength: float = None
+    '''Brush strength 
+
+    :type: float
+    '''
+
+    use_falloff: bool = None
+    '''Strength of brush decays with distance from cursor 
+
+    :type: bool
+    '''
+
+    use_pressure_strength: bool = None
+    '''Enable tablet pressure sensitivity for strength 
+
+    :type: bool
+    '''
+
+
+class GPencilSculptSettings:
+    '''Properties for Grease Pencil stroke sculpting tool '''
+
+    affect_position: bool = None
+    '''The brush affects the position of the point 
+
+    :type: bool
+    '''
+
+    affect_strength: bool = None
+    '''The brush affects the color strength of the point 
+
+    :type: bool
+    '''
+
+    affect_thickness: bool = None
+    '''The brush affects the thickness of the point 
+
+    :type: bool
+    '''
+
+    brush: 'GPencilSculptBrush' = None
+    '''
+
+    :type: 'GPencilSculptBrush'
+    '''
+
+    lockaxis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    selection_alpha: float = None
+    '''Alpha value for selected vertices 
+
+    :type: float
+    '''
+
+    tool: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_select_mask: bool = None
+    '''Only sculpt selected stroke points 
+
+    :type: bool
+    '''
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class GPencilStroke:
+    '''Freehand curve defining part of a sketch '''
+
+    color: 'GPencilPaletteColor' = None
+    '''Color from palette used in Stroke 
+
+    :type: 'GPencilPaletteColor'
+    '''
+
+    colorname: str = None
+    '''Palette color name 
+
+    :type: str
+    '''
+
+    draw_cyclic: bool = None
+    '''Enable cyclic drawing, closing the stroke 
+
+    :type: bool
+    '''
+
+    draw_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    line_width: int = None
+    '''Thickness of stroke (in pixels) 
+
+    :type: int
+    '''
+
+    points: typing.List['GPencilStrokePoint'] = None
+    '''Stroke data points 
+
+    :type: typing.List['GPencilStrokePoint']
+    '''
+
+    select: bool = None
+    '''Stroke is selected for viewport editing 
+
+    :type: bool
+    '''
+
+    triangles: typing.List['GPencilTriangle'] = None
+    '''Triangulation data for HQ fill 
+
+    :type: typing.List['GPencilTriangle']
+    '''
+
+
+class GPencilStrokePoint:
+    '''Data point for freehand stroke curve '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    pressure: float = None
+    '''Pressure of tablet at point when drawing it 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Point is selected for viewport editing 
+
+    :type: bool
+    '''
+
+    strength: float = None
+    '''Color intensity (alpha factor) 
+
+    :type: float
+    '''
+
+
+class GPencilStrokePoints:
+    '''Collection of grease pencil stroke points '''
+
+    def add(self, count: int = 1, pressure: float = 1.0,
+            strength: float = 1.0):
+        '''Add a new grease pencil stroke point 
+
+        :param count: Number, Number of points to add to the stroke 
+        :type count: int
+        :param pressure: Pressure, Pressure for newly created points 
+        :type pressure: float
+        :param strength: Strength, Color intensity (alpha factor) for newly created points 
+        :type strength: float
+        '''
+        pass
+
+    def pop(self, index: int = -1):
+        '''Remove a grease pencil stroke point 
+
+        :param index: Index, point index 
+        :type index: int
+        '''
+        pass
+
+
+class GPencilStrokes:
+    '''Collection of grease pencil stroke '''
+
+    def new(self, colorname: str = "") -> 'GPencilStroke':
+        '''Add a new grease pencil stroke 
+
+        :param colorname: Color, Name of the color 
+        :type colorname: str
+        :rtype: 'GPencilStroke'
+        :return:  The newly created stroke 
+        '''
+        pass
+
+    def remove(self, stroke: 'GPencilStroke'):
+        '''Remove a grease pencil stroke 
+
+        :param stroke: Stroke, The stroke to remove 
+        :type stroke: 'GPencilStroke'
+        '''
+        pass
+
+
+class GPencilTriangle:
+    '''Triangulation data for HQ fill '''
+
+    v1: int = None
+    '''First triangle vertex index 
+
+    :type: int
+    '''
+
+    v2: int = None
+    '''Second triangle vertex index 
+
+    :type: int
+    '''
+
+    v3: int = None
+    '''Third triangle vertex index 
+
+    :type: int
+    '''
+
+
+class GameActuator:
+    filename: str = None
+    '''The file to use, depending on the mode (e.g. the blend file to load or a destination for saving a screenshot) - use the “//” prefix for a relative path 
+
+    :type: str
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class GameBooleanProperty:
+    '''Game engine user defined Boolean property '''
+
+    value: bool = None
+    '''Property value 
+
+    :type: bool
+    '''
+
+
+class GameFloatProperty:
+    '''Game engine user defined floating point number property '''
+
+    value: float = None
+    '''Property value 
+
+    :type: float
+    '''
+
+
+class GameIntProperty:
+    '''Game engine user defined integer number property '''
+
+    value: int = None
+    '''Property value 
+
+    :type: int
+    '''
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class GameObjectSettings:
+    '''Game engine related settings for the object '''
+
+    actuators: typing.List['Actuator'] = None
+    '''Game engine actuators to act on events 
+
+    :type: typing.List['Actuator']
+    '''
+
+    angular_velocity_max: float = None
+    '''Clamp angular velocity to this maximum speed, in angle per second 
+
+    :type: float
+    '''
+
+    angular_velocity_min: float = None
+    '''Clamp angular velocity to this minimum speed (except when totally still), in angle per second 
+
+    :type: float
+    '''
+
+    collision_bounds_type: typing.Union[int, str] = None
+    '''Select the collision shape that better fits the object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    collision_group: bool = None
+    '''The collision group of the object 
+
+    :type: bool
+    '''
+
+    collision_margin: float = None
+    '''Extra margin around object for collision detection, small amount required for stability 
+
+    :type: float
+    '''
+
+    collision_mask: bool = None
+    '''The groups this object can collide with 
+
+    :type: bool
+    '''
+
+    controllers: typing.List['Controller'] = None
+    '''Game engine controllers to process events, connecting sensors to actuators 
+
+    :type: typing.List['Controller']
+    '''
+
+    damping: float = None
+    '''General movement damping 
+
+    :type: float
+    '''
+
+    fall_speed: float = None
+    '''Maximum speed at which the character will fall 
+
+    :type: float
+    '''
+
+    form_factor: float = None
+    '''Form factor scales the inertia tensor 
+
+    :type: float
+    '''
+
+    friction_coefficients: float = None
+    '''Relative friction coefficients in the in the X, Y and Z directions, when anisotropic friction is enabled 
+
+    :type: float
+    '''
+
+    jump_max: int = None
+    '''The maximum number of jumps the character can make before it hits the ground 
+
+    :type: int
+    '''
+
+    jump_speed: float = None
+    '''Upward velocity applied to the character when jumping 
+
+    :type: float
+    '''
+
+    lock_location_x: bool = None
+    '''Disable simulation of linear motion along the X axis 
+
+    :type: bool
+    '''
+
+    lock_location_y: bool = None
+    '''Disable simulation of linear motion along the Y axis 
+
+    :type: bool
+    '''
+
+    lock_location_z: bool = None
+    '''Disable simulation of linear motion along the Z axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_x: bool = None
+    '''Disable simulation of angular motion along the X axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_y: bool = None
+    '''Disable simulation of angular motion along the Y axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_z: bool = None
+    '''Disable simulation of angular motion along the Z axis 
+
+    :type: bool
+    '''
+
+    mass: float = None
+    '''Mass of the object 
+
+    :type: float
+    '''
+
+    obstacle_radius: float = None
+    '''Radius of object representation in obstacle simulation 
+
+    :type: float
+    '''
+
+    physics_type: typing.Union[int, str] = None
+    '''Select the type of physical representation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    properties: typing.List['GameProperty'] = None
+    '''Game engine properties 
+
+    :type: typing.List['GameProperty']
+    '''
+
+    radius: float = None
+    '''Radius of bounding sphere and material physics 
+
+    :type: float
+    '''
+
+    rotation_damping: float = None
+    '''General rotation damping 
+
+    :type: float
+    '''
+
+    sensors: typing.List['Sensor'] = None
+    '''Game engine sensor to detect events 
+
+    :type: typing.List['Sensor']
+    '''
+
+    show_actuators: bool = None
+    '''Shows actuators for this object in the user interface 
+
+    :type: bool
+    '''
+
+    show_controllers: bool = None
+    '''Shows controllers for this object in the user interface 
+
+    :type: bool
+    '''
+
+    show_debug_state: bool = None
+    '''Print state debug info in the game engine 
+
+    :type: bool
+    '''
+
+    show_sensors: bool = None
+    '''Shows sensors for this object in the user interface 
+
+    :type: bool
+    '''
+
+    show_state_panel: bool = None
+    '''Show state panel 
+
+    :type: bool
+    '''
+
+    soft_body: 'GameSoftBodySettings' = None
+    '''Settings for Bullet soft body simulation 
+
+    :type: 'GameSoftBodySettings'
+    '''
+
+    states_initial: bool = None
+    '''Initial state when the game starts 
+
+    :type: bool
+    '''
+
+    states_visible: bool = None
+    '''State determining which controllers are displayed 
+
+    :type: bool
+    '''
+
+    step_height: float = None
+    '''Maximum height of steps the character can run over 
+
+    :type: float
+    '''
+
+    use_activity_culling: bool = None
+    '''Disable simulation of angular motion along the Z axis 
+
+    :type: bool
+    '''
+
+    use_actor: bool = None
+    '''Object is detected by the Near and Radar sensor 
+
+    :type: bool
+    '''
+
+    use_all_states: bool = None
+    '''Set all state bits 
+
+    :type: bool
+    '''
+
+    use_anisotropic_friction: bool = None
+    '''Enable anisotropic friction 
+
+    :type: bool
+    '''
+
+    use_collision_bounds: bool = None
+    '''Specify a collision bounds type other than the default 
+
+    :type: bool
+    '''
+
+    use_collision_compound: bool = None
+    '''Add children to form a compound collision object 
+
+    :type: bool
+    '''
+
+    use_ghost: bool = None
+    '''Object does not react to collisions, like a ghost 
+
+    :type: bool
+    '''
+
+    use_material_physics_fh: bool = None
+    '''React to force field physics settings in materials 
+
+    :type: bool
+    '''
+
+    use_obstacle_create: bool = None
+    '''Create representation for obstacle simulation 
+
+    :type: bool
+    '''
+
+    use_record_animation: bool = None
+    '''Record animation objects without physics 
+
+    :type: bool
+    '''
+
+    use_rotate_from_normal: bool = None
+    '''Use face normal to rotate object, so that it points away from the surface 
+
+    :type: bool
+    '''
+
+    use_sleep: bool = None
+    '''Disable auto (de)activation in physics simulation 
+
+    :type: bool
+    '''
+
+    used_states: bool = None
+    '''States which are being used by controllers 
+
+    :type: bool
+    '''
+
+    velocity_max: float = None
+    '''Clamp velocity to this maximum speed, in distance per second 
+
+    :type: float
+    '''
+
+    velocity_min: float = None
+    '''Clamp velocity to this minimum speed (except when totally still), in distance per second 
+
+    :type: float
+    '''
+
+
+class GameProperty:
+    '''Game engine user defined object property '''
+
+    name: str = None
+    '''Available as GameObject attributes in the game engine’s python API 
+
+    :type: str
+    '''
+
+    show_debug: bool = None
+    '''Print debug information for this property 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class GameSoftBodySettings:
+    '''Soft body simulation settings for an object in the game engine '''
+
+    cluster_iterations: int = None
+    '''Number of cluster iterations 
+
+    :type: int
+    '''
+
+    collision_margin: float = None
+    '''Collision margin for soft body. Small value makes the algorithm unstable 
+
+    :type: float
+    '''
+
+    dynamic_friction: float = None
+    '''Dynamic Friction 
+
+    :type: float
+    '''
+
+    linear_stiffness: float = None
+    '''Linear stiffness of the soft body links 
+
+    :type: float
+    '''
+
+    location_iterations: int = None
+    '''Position solver iterations 
+
+    :type: int
+    '''
+
+    shape_threshold: float = None
+    '''Shape matching threshold 
+
+    :type: float
+    '''
+
+    use_bending_constraints: bool = None
+    '''Enable bending constraints 
+
+    :type: bool
+    '''
+
+    use_cluster_rigid_to_softbody: bool = None
+    '''Enable cluster collision between soft and rigid body 
+
+    :type: bool
+    '''
+
+    use_cluster_soft_to_softbody: bool = None
+    '''Enable cluster collision between soft and soft body 
+
+    :type: bool
+    '''
+
+    use_shape_match: bool = None
+    '''Enable soft body shape matching goal 
+
+    :type: bool
+    '''
+
+    weld_threshold: float = None
+    '''Welding threshold: distance between nearby vertices to be considered equal => set to 0.0 to disable welding test and speed up scene loading (ok if the mesh has no duplicates) 
+
+    :type: float
+    '''
+
+
+class GameStringProperty:
+    '''Game engine user defined text string property '''
+
+    value: str = None
+    '''Property value 
+
+    :type: str
+    '''
+
+
+class GameTimerProperty:
+    '''Game engine user defined timer property '''
+
+    value: float = None
+    '''Property value 
+
+    :type: float
+    '''
+
+
+class GammaCrossSequence:
+    '''Gamma Cross Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class GaussianBlurSequence:
+    '''Sequence strip creating a gaussian blur '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    size_x: float = None
+    '''Size of the blur along X axis 
+
+    :type: float
+    '''
+
+    size_y: float = None
+    '''Size of the blur along Y axis 
+
+    :type: float
+    '''
+
+
+class GlowSequence:
+    '''Sequence strip creating a glow effect '''
+
+    blur_radius: float = None
+    '''Radius of glow effect 
+
+    :type: float
+    '''
+
+    boost_factor: float = None
+    '''Brightness multiplier 
+
+    :type: float
+    '''
+
+    clamp: float = None
+    '''Brightness limit of intensity 
+
+    :type: float
+    '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    quality: int = None
+    '''Accuracy of the blur effect 
+
+    :type: int
+    '''
+
+    threshold: float = None
+    '''Minimum intensity to trigger a glow 
+
+    :type: float
+    '''
+
+    use_only_boost: bool = None
+    '''Show the glow buffer only 
+
+    :type: bool
+    '''
+
+
+class GreasePencil:
+    '''Freehand annotation sketchbook '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    layers: typing.List['GreasePencilLayers'] = None
+    '''
+
+    :type: typing.List['GreasePencilLayers']
+    '''
+
+    palettes: typing.List['GPencilPalette'] = None
+    '''
+
+    :type: typing.List['GPencilPalette']
+    '''
+
+    show_stroke_direction: bool = None
+    '''Show stroke drawing direction with a bigger green dot (start) and smaller red dot (end) points 
+
+    :type: bool
+    '''
+
+    use_onion_skinning: bool = None
+    '''Show ghosts of the frames before and after the current frame, toggle to enable on active layer or disable all 
+
+    :type: bool
+    '''
+
+    use_stroke_edit_mode: bool = None
+    '''Edit Grease Pencil strokes instead of viewport data 
+
+    :type: bool
+    '''
+
+    def clear(self, ):
+        '''Remove all the grease pencil data 
+
+        '''
+        pass
+
+
+class GreasePencilBrushes:
+    '''Collection of grease pencil brushes '''
+
+    active: 'GPencilBrush' = None
+    '''Current active brush 
+
+    :type: 'GPencilBrush'
+    '''
+
+    active_index: int = None
+    '''Index of active brush 
+
+    :type: int
+    '''
+
+    def new(self, name: str, set_active: bool = False) -> 'GPencilBrush':
+        '''Add a new grease pencil brush 
+
+        :param name: Name, Name of the brush 
+        :type name: str
+        :param set_active: Set Active, Set the newly created brush to the active brush 
+        :type set_active: bool
+        :rtype: 'GPencilBrush'
+        :return:  The newly created brush 
+        '''
+        pass
+
+    def remove(self, brush: 'GPencilBrush'):
+        '''Remove a grease pencil brush 
+
+        :param brush: The brush to remove 
+        :type brush: 'GPencilBrush'
+        '''
+        pass
+
+
+class GreasePencilLayers:
+    '''Collection of grease pencil layers '''
+
+    active: 'GPencilLayer' = None
+    '''Active grease pencil layer 
+
+    :type: 'GPencilLayer'
+    '''
+
+    active_index: int = None
+    '''Index of active grease pencil layer 
+
+    :type: int
+    '''
+
+    def new(self, name: str, set_active: bool = True) -> 'GPencilLayer':
+        '''Add a new grease pencil layer 
+
+        :param name: Name, Name of the layer 
+        :type name: str
+        :param set_active: Set Active, Set the newly created layer to the active layer 
+        :type set_active: bool
+        :rtype: 'GPencilLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+    def remove(self, layer: 'GPencilLayer'):
+        '''Remove a grease pencil layer 
+
+        :param layer: The layer to remove 
+        :type layer: 'GPencilLayer'
+        '''
+        pass
+
+
+class GreasePencilPalettes:
+    '''Collection of grease pencil palettes '''
+
+    active: 'GPencilPalette' = None
+    '''Current active palette 
+
+    :type: 'GPencilPalette'
+    '''
+
+    active_index: int = None
+    '''Index of active palette 
+
+    :type: int
+    '''
+
+    def new(self, name: str, set_active: bool = True) -> 'GPencilPalette':
+        '''Add a new grease pencil palette 
+
+        :param name: Name, Name of the palette 
+        :type name: str
+        :param set_active: Set Active, Activate the newly created palette 
+        :type set_active: bool
+        :rtype: 'GPencilPalette'
+        :return:  The newly created palette 
+        '''
+        pass
+
+    def remove(self, palette: 'GPencilPalette'):
+        '''Remove a grease pencil palette 
+
+        :param palette: The palette to remove 
+        :type palette: 'GPencilPalette'
+        '''
+        pass
+
+
+class Group:
+    '''Group of Object data-blocks '''
+
+    dupli_offset: float = None
+    '''Offset from the origin to use when instancing as DupliGroup 
+
+    :type: float
+    '''
+
+    layers: bool = None
+    '''Layers visible when this group is instanced as a dupli 
+
+    :type: bool
+    '''
+
+    objects: typing.List['GroupObjects'] = None
+    '''A collection of this groups objects 
+
+    :type: typing.List['GroupObjects']
+    '''
+
+    users_dupli_group = None
+    '''The dupli group this group is used in (readonly) '''
+
+
+class GroupObjects:
+    '''Collection of group objects '''
+
+    def link(self, object: 'Object'):
+        '''Add this object to a group 
+
+        :param object: Object to add 
+        :type object: 'Object'
+        '''
+        pass
+
+    def unlink(self, object: 'Object'):
+        '''Remove this object to a group 
+
+        :param object: Object to remove 
+        :type object: 'Object'
+        '''
+        pass
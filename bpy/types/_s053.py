@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import sys
+import bpy
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Header:
+    '''Editor header containing UI elements '''
+
+    bl_idname: str = None
+    '''If this is set, the header gets a custom ID, otherwise it takes the name of the class used to define the panel; for example, if the class name is “OBJECT_HT_hello”, and bl_idname is not set by the script, then bl_idname = “OBJECT_HT_hello” 
+
+    :type: str
+    '''
+
+    bl_space_type: typing.Union[int, str] = None
+    '''The space where the header is going to be used in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    layout: 'UILayout' = None
+    '''Structure of the header in the UI 
+
+    :type: 'UILayout'
+    '''
+
+    def draw(self, context):
+        '''Draw UI elements into the header UI layout 
+
+        '''
+        pass
+
+
+class HemiLamp:
+    '''180 degree constant lamp '''
+
+    pass
+
+
+class Histogram:
+    '''Statistical view of the levels of color in an image '''
+
+    mode: typing.Union[int, str] = None
+    '''Channels to display when drawing the histogram 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_line: bool = None
+    '''Display lines rather than filled shapes 
+
+    :type: bool
+    '''
+
+
+class HookModifier:
+    '''Hook modifier to modify the location of vertices '''
+
+    center: float = None
+    '''
+
+    :type: float
+    '''
+
+    falloff_curve: 'CurveMapping' = None
+    '''Custom Lamp Falloff Curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    falloff_radius: float = None
+    '''If not zero, the distance from the hook where influence ends 
+
+    :type: float
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    matrix_inverse: float = None
+    '''Reverse the transformation between this object and its target 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Parent Object for hook, also recalculates and clears offset 
+
+    :type: 'Object'
+    '''
+
+    strength: float = None
+    '''Relative force of the hook 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''Name of Parent Bone for hook (if applicable), also recalculates and clears offset 
+
+    :type: str
+    '''
+
+    use_falloff_uniform: bool = None
+    '''Compensate for non-uniform object scale 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class HueCorrectModifier:
+    '''Hue correction modifier for sequence strip '''
+
+    curve_mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+
+class ID:
+    '''Base type for data-blocks, defining a unique name, linking from other libraries and garbage collection '''
+
+    is_library_indirect: bool = None
+    '''Is this ID block linked indirectly 
+
+    :type: bool
+    '''
+
+    is_updated: bool = None
+    '''Data-block is tagged for recalculation 
+
+    :type: bool
+    '''
+
+    is_updated_data: bool = None
+    '''Data-block data is tagged for recalculation 
+
+    :type: bool
+    '''
+
+    library: 'Library' = None
+    '''Library file the data-block is linked from 
+
+    :type: 'Library'
+    '''
+
+    name: str = None
+    '''Unique data-block ID name 
+
+    :type: str
+    '''
+
+    preview: 'ImagePreview' = None
+    '''Preview image and icon of this data-block (None if not supported for this type of data) 
+
+    :type: 'ImagePreview'
+    '''
+
+    tag: bool = None
+    '''Tools can use this to tag data for their own purposes (initial state is undefined) 
+
+    :type: bool
+    '''
+
+    use_fake_user: bool = None
+    '''Save this data-block even if it has no users 
+
+    :type: bool
+    '''
+
+    users: int = None
+    '''Number of times this data-block is referenced 
+
+    :type: int
+    '''
+
+    def copy(self, ) -> 'ID':
+        '''Create a copy of this data-block (not supported for all data-blocks) 
+
+        :rtype: 'ID'
+        :return:  New copy of the ID 
+        '''
+        pass
+
+    def user_clear(self, ):
+        '''This function is for advanced use only, misuse can crash blender since the user count is used to prevent data being removed when it is used. 
+
+        '''
+        pass
+
+    def user_remap(self, new_id: 'ID'):
+        '''Replace all usage in the .blend file of this ID by new given one 
+
+        :param new_id: New ID to use 
+        :type new_id: 'ID'
+        '''
+        pass
+
+    def make_local(self, clear_proxy: bool = True) -> 'ID':
+        '''Make this datablock local, return local one (may be a copy of the original, in case it is also indirectly used) 
+
+        :param clear_proxy: Whether to clear proxies (the default behavior, note that if object has to be duplicated to be made local, proxies are always cleared) 
+        :type clear_proxy: bool
+        :rtype: 'ID'
+        :return:  This ID, or the new ID if it was copied 
+        '''
+        pass
+
+    def user_of_id(self, id: 'ID') -> int:
+        '''Count the number of times that ID uses/references given one 
+
+        :param id: ID to count usages 
+        :type id: 'ID'
+        :rtype: int
+        :return:  Number of usages/references of given id by current data-block 
+        '''
+        pass
+
+    def animation_data_create(self, ) -> 'AnimData':
+        '''Create animation data to this ID, note that not all ID types support this 
+
+        :rtype: 'AnimData'
+        :return:  New animation data or NULL 
+        '''
+        pass
+
+    def animation_data_clear(self, ):
+        '''Clear animation on this this ID 
+
+        '''
+        pass
+
+    def update_tag(self, refresh: typing.Set[typing.Union[int, str]] = {}):
+        '''Tag the ID to update its display data, e.g. when calling bpy.types.Scene.update 
+
+        :param refresh: Type of updates to perform 
+        :type refresh: typing.Set[typing.Union[int, str]]
+        '''
+        pass
+
+
+class IDMaterials:
+    '''Collection of materials '''
+
+    def append(self, material: 'Material'):
+        '''Add a new material to the data-block 
+
+        :param material: Material to add 
+        :type material: 'Material'
+        '''
+        pass
+
+    def pop(self, index: int = -1, update_data: bool = False) -> 'Material':
+        '''Remove a material from the data-block 
+
+        :param index: Index of material to remove 
+        :type index: int
+        :param update_data: Update data by re-adjusting the material slots assigned 
+        :type update_data: bool
+        :rtype: 'Material'
+        :return:  Material to remove 
+        '''
+        pass
+
+    def clear(self, update_data: bool = False):
+        '''Remove all materials from the data-block 
+
+        :param update_data: Update data by re-adjusting the material slots assigned 
+        :type update_data: bool
+        '''
+        pass
+
+
+class IKParam:
+    '''Base type for IK solver parameters '''
+
+    ik_solver: typing.Union[int, str] = None
+    '''IK solver for which these parameters are defined 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class IMAGE_UV_sculpt:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
+
+
+class IMAGE_UV_sculpt_curve:
+    def draw(self, context):
+        '''
+
+        '''
+        pass
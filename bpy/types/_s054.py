@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Image:
+    '''Image data-block referencing an external or packed image '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bindcode: int = None
+    '''OpenGL bindcode 
+
+    :type: int
+    '''
+
+    channels: int = None
+    '''Number of channels in pixels buffer 
+
+    :type: int
+    '''
+
+    colorspace_settings: 'ColorManagedInputColorspaceSettings' = None
+    '''Input color space settings 
+
+    :type: 'ColorManagedInputColorspaceSettings'
+    '''
+
+    depth: int = None
+    '''Image bit depth 
+
+    :type: int
+    '''
+
+    display_aspect: float = None
+    '''Display Aspect for this image, does not affect rendering 
+
+    :type: float
+    '''
+
+    field_order: typing.Union[int, str] = None
+    '''Order of video fields (select which lines are displayed first) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    file_format: typing.Union[int, str] = None
+    '''Format used for re-saving this file 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filepath: str = None
+    '''Image/Movie file name 
+
+    :type: str
+    '''
+
+    filepath_raw: str = None
+    '''Image/Movie file name (without data refreshing) 
+
+    :type: str
+    '''
+
+    fps: int = None
+    '''Speed of the animation in frames per second 
+
+    :type: int
+    '''
+
+    frame_duration: int = None
+    '''Duration (in frames) of the image (1 when not a video/sequence) 
+
+    :type: int
+    '''
+
+    frame_end: int = None
+    '''End frame of an animated texture 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Start frame of an animated texture 
+
+    :type: int
+    '''
+
+    generated_color: float = None
+    '''Fill color for the generated image 
+
+    :type: float
+    '''
+
+    generated_height: int = None
+    '''Generated image height 
+
+    :type: int
+    '''
+
+    generated_type: typing.Union[int, str] = None
+    '''Generated image type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    generated_width: int = None
+    '''Generated image width 
+
+    :type: int
+    '''
+
+    has_data: bool = None
+    '''True if the image data is loaded into memory 
+
+    :type: bool
+    '''
+
+    is_dirty: bool = None
+    '''Image has changed and is not saved 
+
+    :type: bool
+    '''
+
+    is_float: bool = None
+    '''True if this image is stored in float buffer 
+
+    :type: bool
+    '''
+
+    is_multiview: bool = None
+    '''Image has more than one view 
+
+    :type: bool
+    '''
+
+    is_stereo_3d: bool = None
+    '''Image has left and right views 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Mapping type to use for this image in the game engine 
+
+    :type: typing.Union[int, str]
+    '''
+
+    packed_file: 'PackedFile' = None
+    '''First packed file of the image 
+
+    :type: 'PackedFile'
+    '''
+
+    packed_files: typing.List['ImagePackedFile'] = None
+    '''Collection of packed images 
+
+    :type: typing.List['ImagePackedFile']
+    '''
+
+    pixels: float = None
+    '''Image pixels in floating point values 
+
+    :type: float
+    '''
+
+    render_slots: typing.List['RenderSlots'] = None
+    '''Render slots of the image 
+
+    :type: typing.List['RenderSlots']
+    '''
+
+    resolution: float = None
+    '''X/Y pixels per meter 
+
+    :type: float
+    '''
+
+    size: int = None
+    '''Width and height in pixels, zero when image data cant be loaded 
+
+    :type: int
+    '''
+
+    source: typing.Union[int, str] = None
+    '''Where the image comes from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    stereo_3d_format: 'Stereo3dFormat' = None
+    '''Settings for stereo 3d 
+
+    :type: 'Stereo3dFormat'
+    '''
+
+    tiles_x: int = None
+    '''Degree of repetition in the X direction 
+
+    :type: int
+    '''
+
+    tiles_y: int = None
+    '''Degree of repetition in the Y direction 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''How to generate the image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_alpha: bool = None
+    '''Use the alpha channel information from the image or make image fully opaque 
+
+    :type: bool
+    '''
+
+    use_animation: bool = None
+    '''Use as animated texture in the game engine 
+
+    :type: bool
+    '''
+
+    use_clamp_x: bool = None
+    '''Disable texture repeating horizontally 
+
+    :type: bool
+    '''
+
+    use_clamp_y: bool = None
+    '''Disable texture repeating vertically 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Deinterlace movie file on load 
+
+    :type: bool
+    '''
+
+    use_fields: bool = None
+    '''Use fields of the image 
+
+    :type: bool
+    '''
+
+    use_generated_float: bool = None
+    '''Generate floating point buffer 
+
+    :type: bool
+    '''
+
+    use_multiview: bool = None
+    '''Use Multiple Views (when available) 
+
+    :type: bool
+    '''
+
+    use_tiles: bool = None
+    '''Use of tilemode for faces (default shift-LMB to pick the tile for selected faces) 
+
+    :type: bool
+    '''
+
+    use_view_as_render: bool = None
+    '''Apply render part of display transformation when displaying this image on the screen 
+
+    :type: bool
+    '''
+
+    views_format: typing.Union[int, str] = None
+    '''Mode to load image views 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def save_render(self, filepath: str, scene: 'Scene' = None):
+        '''Save image to a specific path using a scenes render settings 
+
+        :param filepath: Save path 
+        :type filepath: str
+        :param scene: Scene to take image parameters from 
+        :type scene: 'Scene'
+        '''
+        pass
+
+    def save(self, ):
+        '''Save image to its source path 
+
+        '''
+        pass
+
+    def pack(self, as_png: bool = False, data: str = "", data_len: int = 0):
+        '''Pack an image as embedded data into the .blend file 
+
+        :param as_png: as_png, Pack the image as PNG (needed for generated/dirty images) 
+        :type as_png: bool
+        :param data: data, Raw data (bytes, exact content of the embedded file) 
+        :type data: str
+        :param data_len: data_len, length of given data (mandatory if data is provided) 
+        :type data_len: int
+        '''
+        pass
+
+    def unpack(self, method: typing.Union[int, str] = 'USE_LOCAL'):
+        '''Save an image packed in the .blend file to disk 
+
+        :param method: method, How to unpack 
+        :type method: typing.Union[int, str]
+        '''
+        pass
+
+    def reload(self, ):
+        '''Reload the image from its source path 
+
+        '''
+        pass
+
+    def update(self, ):
+        '''Update the display image from the floating point buffer 
+
+        '''
+        pass
+
+    def scale(self, width: int, height: int):
+        '''Scale the image in pixels 
+
+        :param width: Width 
+        :type width: int
+        :param height: Height 
+        :type height: int
+        '''
+        pass
+
+    def gl_touch(self, frame: int = 0, filter: int = 9985,
+                 mag: int = 9729) -> int:
+        '''Delay the image from being cleaned from the cache due inactivity 
+
+        :param frame: Frame, Frame of image sequence or movie 
+        :type frame: int
+        :param filter: Filter, The texture minifying function to use if the image wasn’t loaded 
+        :type filter: int
+        :param mag: Magnification, The texture magnification function to use if the image wasn’t loaded 
+        :type mag: int
+        :rtype: int
+        :return:  Error, OpenGL error value 
+        '''
+        pass
+
+    def gl_load(self, frame: int = 0, filter: int = 9985,
+                mag: int = 9729) -> int:
+        '''Load the image into OpenGL graphics memory 
+
+        :param frame: Frame, Frame of image sequence or movie 
+        :type frame: int
+        :param filter: Filter, The texture minifying function 
+        :type filter: int
+        :param mag: Magnification, The texture magnification function 
+        :type mag: int
+        :rtype: int
+        :return:  Error, OpenGL error value 
+        '''
+        pass
+
+    def gl_free(self, ):
+        '''Free the image from OpenGL graphics memory 
+
+        '''
+        pass
+
+    def filepath_from_user(self, image_user: 'ImageUser' = None) -> str:
+        '''Return the absolute path to the filepath of an image frame specified by the image user 
+
+        :param image_user: Image user of the image to get filepath for 
+        :type image_user: 'ImageUser'
+        :rtype: str
+        :return:  File Path, The resulting filepath from the image and it’s user 
+        '''
+        pass
+
+    def buffers_free(self, ):
+        '''Free the image buffers from memory 
+
+        '''
+        pass
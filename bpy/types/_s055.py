@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ImageFormatSettings:
+    '''Settings for image formats '''
+
+    cineon_black: int = None
+    '''Log conversion reference blackpoint 
+
+    :type: int
+    '''
+
+    cineon_gamma: float = None
+    '''Log conversion gamma 
+
+    :type: float
+    '''
+
+    cineon_white: int = None
+    '''Log conversion reference whitepoint 
+
+    :type: int
+    '''
+
+    color_depth: typing.Union[int, str] = None
+    '''Bit depth per channel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_mode: typing.Union[int, str] = None
+    '''Choose BW for saving grayscale images, RGB for saving red, green and blue channels, and RGBA for saving red, green, blue and alpha channels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    compression: int = None
+    '''Amount of time to determine best compression: 0 = no compression with fast file output, 100 = maximum lossless compression with slow file output 
+
+    :type: int
+    '''
+
+    display_settings: 'ColorManagedDisplaySettings' = None
+    '''Settings of device saved image would be displayed on 
+
+    :type: 'ColorManagedDisplaySettings'
+    '''
+
+    exr_codec: typing.Union[int, str] = None
+    '''Codec settings for OpenEXR 
+
+    :type: typing.Union[int, str]
+    '''
+
+    file_format: typing.Union[int, str] = None
+    '''File format to save the rendered images as 
+
+    :type: typing.Union[int, str]
+    '''
+
+    jpeg2k_codec: typing.Union[int, str] = None
+    '''Codec settings for Jpeg2000 
+
+    :type: typing.Union[int, str]
+    '''
+
+    quality: int = None
+    '''Quality for image formats that support lossy compression 
+
+    :type: int
+    '''
+
+    stereo_3d_format: 'Stereo3dFormat' = None
+    '''Settings for stereo 3d 
+
+    :type: 'Stereo3dFormat'
+    '''
+
+    tiff_codec: typing.Union[int, str] = None
+    '''Compression mode for TIFF 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_cineon_log: bool = None
+    '''Convert to logarithmic color space 
+
+    :type: bool
+    '''
+
+    use_jpeg2k_cinema_48: bool = None
+    '''Use Openjpeg Cinema Preset (48fps) 
+
+    :type: bool
+    '''
+
+    use_jpeg2k_cinema_preset: bool = None
+    '''Use Openjpeg Cinema Preset 
+
+    :type: bool
+    '''
+
+    use_jpeg2k_ycc: bool = None
+    '''Save luminance-chrominance-chrominance channels instead of RGB colors 
+
+    :type: bool
+    '''
+
+    use_preview: bool = None
+    '''When rendering animations, save JPG preview images in same directory 
+
+    :type: bool
+    '''
+
+    use_zbuffer: bool = None
+    '''Save the z-depth per pixel (32 bit unsigned int z-buffer) 
+
+    :type: bool
+    '''
+
+    view_settings: 'ColorManagedViewSettings' = None
+    '''Color management settings applied on image before saving 
+
+    :type: 'ColorManagedViewSettings'
+    '''
+
+    views_format: typing.Union[int, str] = None
+    '''Format of multiview media 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ImagePackedFile:
+    filepath: str = None
+    '''
+
+    :type: str
+    '''
+
+    packed_file: 'PackedFile' = None
+    '''
+
+    :type: 'PackedFile'
+    '''
+
+    def save(self, ):
+        '''Save the packed file to its filepath 
+
+        '''
+        pass
+
+
+class ImagePaint:
+    '''Properties of image and texture painting mode '''
+
+    canvas: 'Image' = None
+    '''Image used as canvas 
+
+    :type: 'Image'
+    '''
+
+    clone_image: 'Image' = None
+    '''Image used as clone source 
+
+    :type: 'Image'
+    '''
+
+    dither: float = None
+    '''Amount of dithering when painting on byte images 
+
+    :type: float
+    '''
+
+    invert_stencil: bool = None
+    '''Invert the stencil layer 
+
+    :type: bool
+    '''
+
+    missing_materials: bool = None
+    '''The mesh is missing materials 
+
+    :type: bool
+    '''
+
+    missing_stencil: bool = None
+    '''Image Painting does not have a stencil 
+
+    :type: bool
+    '''
+
+    missing_texture: bool = None
+    '''Image Painting does not have a texture to paint on 
+
+    :type: bool
+    '''
+
+    missing_uvs: bool = None
+    '''A UV layer is missing on the mesh 
+
+    :type: bool
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Mode of operation for projection painting 
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_angle: int = None
+    '''Paint most on faces pointing towards the view according to this angle 
+
+    :type: int
+    '''
+
+    screen_grab_size: int = None
+    '''Size to capture the image for re-projecting 
+
+    :type: int
+    '''
+
+    seam_bleed: int = None
+    '''Extend paint beyond the faces UVs to reduce seams (in pixels, slower) 
+
+    :type: int
+    '''
+
+    stencil_color: float = None
+    '''Stencil color in the viewport 
+
+    :type: float
+    '''
+
+    stencil_image: 'Image' = None
+    '''Image used as stencil 
+
+    :type: 'Image'
+    '''
+
+    use_backface_culling: bool = None
+    '''Ignore faces pointing away from the view (faster) 
+
+    :type: bool
+    '''
+
+    use_clone_layer: bool = None
+    '''Use another UV map as clone source, otherwise use the 3D cursor as the source 
+
+    :type: bool
+    '''
+
+    use_normal_falloff: bool = None
+    '''Paint most on faces pointing towards the view 
+
+    :type: bool
+    '''
+
+    use_occlude: bool = None
+    '''Only paint onto the faces directly under the brush (slower) 
+
+    :type: bool
+    '''
+
+    use_stencil_layer: bool = None
+    '''Set the mask layer from the UV map buttons 
+
+    :type: bool
+    '''
+
+    def detect_data(self, ) -> bool:
+        '''Check if required texpaint data exist 
+
+        :rtype: bool
+        '''
+        pass
+
+
+class ImagePreview:
+    '''Preview image and icon '''
+
+    icon_id: int = None
+    '''Unique integer identifying this preview as an icon (zero means invalid) 
+
+    :type: int
+    '''
+
+    icon_pixels: int = None
+    '''Icon pixels, as bytes (always RGBA 32bits) 
+
+    :type: int
+    '''
+
+    icon_pixels_float: float = None
+    '''Icon pixels components, as floats (RGBA concatenated values) 
+
+    :type: float
+    '''
+
+    icon_size: int = None
+    '''Width and height in pixels 
+
+    :type: int
+    '''
+
+    image_pixels: int = None
+    '''Image pixels, as bytes (always RGBA 32bits) 
+
+    :type: int
+    '''
+
+    image_pixels_float: float = None
+    '''Image pixels components, as floats (RGBA concatenated values) 
+
+    :type: float
+    '''
+
+    image_size: int = None
+    '''Width and height in pixels 
+
+    :type: int
+    '''
+
+    is_icon_custom: bool = None
+    '''True if this preview icon has been modified by py script,and is no more auto-generated by Blender 
+
+    :type: bool
+    '''
+
+    is_image_custom: bool = None
+    '''True if this preview image has been modified by py script,and is no more auto-generated by Blender 
+
+    :type: bool
+    '''
+
+    def reload(self, ):
+        '''Reload the preview from its source path 
+
+        '''
+        pass
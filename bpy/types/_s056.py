@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ImageSequence:
+    '''Sequence strip to load one or more images '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    colorspace_settings: 'ColorManagedInputColorspaceSettings' = None
+    '''Input color space settings 
+
+    :type: 'ColorManagedInputColorspaceSettings'
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    directory: str = None
+    '''
+
+    :type: str
+    '''
+
+    elements: typing.List['SequenceElement'] = None
+    '''
+
+    :type: typing.List['SequenceElement']
+    '''
+
+    proxy: 'SequenceProxy' = None
+    '''
+
+    :type: 'SequenceProxy'
+    '''
+
+    stereo_3d_format: 'Stereo3dFormat' = None
+    '''Settings for stereo 3d 
+
+    :type: 'Stereo3dFormat'
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_multiview: bool = None
+    '''Use Multiple Views (when available) 
+
+    :type: bool
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this strip 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+    views_format: typing.Union[int, str] = None
+    '''Mode to load image views 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ImageTexture:
+    checker_distance: float = None
+    '''Distance between checker tiles 
+
+    :type: float
+    '''
+
+    crop_max_x: float = None
+    '''Maximum X value to crop the image 
+
+    :type: float
+    '''
+
+    crop_max_y: float = None
+    '''Maximum Y value to crop the image 
+
+    :type: float
+    '''
+
+    crop_min_x: float = None
+    '''Minimum X value to crop the image 
+
+    :type: float
+    '''
+
+    crop_min_y: float = None
+    '''Minimum Y value to crop the image 
+
+    :type: float
+    '''
+
+    extension: typing.Union[int, str] = None
+    '''How the image is extrapolated past its original bounds 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filter_eccentricity: int = None
+    '''Maximum eccentricity (higher gives less blur at distant/oblique angles, but is also slower) 
+
+    :type: int
+    '''
+
+    filter_probes: int = None
+    '''Maximum number of samples (higher gives less blur at distant/oblique angles, but is also slower) 
+
+    :type: int
+    '''
+
+    filter_size: float = None
+    '''Multiply the filter size used by MIP Map and Interpolation 
+
+    :type: float
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Texture filter to use for sampling image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    invert_alpha: bool = None
+    '''Invert all the alpha values in the image 
+
+    :type: bool
+    '''
+
+    repeat_x: int = None
+    '''Repetition multiplier in the X direction 
+
+    :type: int
+    '''
+
+    repeat_y: int = None
+    '''Repetition multiplier in the Y direction 
+
+    :type: int
+    '''
+
+    use_alpha: bool = None
+    '''Use the alpha channel information in the image 
+
+    :type: bool
+    '''
+
+    use_calculate_alpha: bool = None
+    '''Calculate an alpha channel based on RGB values in the image 
+
+    :type: bool
+    '''
+
+    use_checker_even: bool = None
+    '''Even checker tiles 
+
+    :type: bool
+    '''
+
+    use_checker_odd: bool = None
+    '''Odd checker tiles 
+
+    :type: bool
+    '''
+
+    use_derivative_map: bool = None
+    '''Use red and green as derivative values 
+
+    :type: bool
+    '''
+
+    use_filter_size_min: bool = None
+    '''Use Filter Size as a minimal filter value in pixels 
+
+    :type: bool
+    '''
+
+    use_flip_axis: bool = None
+    '''Flip the texture’s X and Y axis 
+
+    :type: bool
+    '''
+
+    use_interpolation: bool = None
+    '''Interpolate pixels using selected filter 
+
+    :type: bool
+    '''
+
+    use_mipmap: bool = None
+    '''Use auto-generated MIP maps for the image 
+
+    :type: bool
+    '''
+
+    use_mipmap_gauss: bool = None
+    '''Use Gauss filter to sample down MIP maps 
+
+    :type: bool
+    '''
+
+    use_mirror_x: bool = None
+    '''Mirror the image repetition on the X direction 
+
+    :type: bool
+    '''
+
+    use_mirror_y: bool = None
+    '''Mirror the image repetition on the Y direction 
+
+    :type: bool
+    '''
+
+    use_normal_map: bool = None
+    '''Use image RGB values for normal mapping 
+
+    :type: bool
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class ImageUser:
+    '''Parameters defining how an Image data-block is used by another data-block '''
+
+    fields_per_frame: int = None
+    '''Number of fields per rendered frame (2 fields is 1 image) 
+
+    :type: int
+    '''
+
+    frame_current: int = None
+    '''Current frame number in image sequence or movie 
+
+    :type: int
+    '''
+
+    frame_duration: int = None
+    '''Number of images of a movie to use 
+
+    :type: int
+    '''
+
+    frame_offset: int = None
+    '''Offset the number of the frame to use in the animation 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Global starting frame of the movie/sequence, assuming first picture has a #1 
+
+    :type: int
+    '''
+
+    multilayer_layer: int = None
+    '''Layer in multilayer image 
+
+    :type: int
+    '''
+
+    multilayer_pass: int = None
+    '''Pass in multilayer image 
+
+    :type: int
+    '''
+
+    multilayer_view: int = None
+    '''View in multilayer image 
+
+    :type: int
+    '''
+
+    use_auto_refresh: bool = None
+    '''Always refresh image on frame changes 
+
+    :type: bool
+    '''
+
+    use_cyclic: bool = None
+    '''Cycle the images in the movie 
+
+    :type: bool
+    '''
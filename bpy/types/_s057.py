@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ImapaintToolCapabilities:
+    '''Read-only indications of which brush operations are supported by the current image paint brush '''
+
+    has_accumulate: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_radius: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_space_attenuation: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class InflowFluidSettings:
+    '''Fluid simulation settings for objects adding fluids in the simulation '''
+
+    inflow_velocity: float = None
+    '''Initial velocity of fluid 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Object contributes to the fluid simulation 
+
+    :type: bool
+    '''
+
+    use_animated_mesh: bool = None
+    '''Export this mesh as an animated one (slower and enforces No Slip, only use if really necessary [e.g. armatures or parented objects], animated pos/rot/scale F-Curves do not require it) 
+
+    :type: bool
+    '''
+
+    use_local_coords: bool = None
+    '''Use local coordinates for inflow (e.g. for rotating objects) 
+
+    :type: bool
+    '''
+
+    volume_initialization: typing.Union[int, str] = None
+    '''Volume initialization type (WARNING: complex volumes might require too much memory and break simulation) 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class IntProperty:
+    '''RNA integer number property definition '''
+
+    array_length: int = None
+    '''Maximum length of the array, 0 means unlimited 
+
+    :type: int
+    '''
+
+    default: int = None
+    '''Default value for this number 
+
+    :type: int
+    '''
+
+    default_array: int = None
+    '''Default value for this array 
+
+    :type: int
+    '''
+
+    hard_max: int = None
+    '''Maximum value used by buttons 
+
+    :type: int
+    '''
+
+    hard_min: int = None
+    '''Minimum value used by buttons 
+
+    :type: int
+    '''
+
+    is_array: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    soft_max: int = None
+    '''Maximum value used by buttons 
+
+    :type: int
+    '''
+
+    soft_min: int = None
+    '''Minimum value used by buttons 
+
+    :type: int
+    '''
+
+    step: int = None
+    '''Step size used by number buttons, for floats 1/100th of the step size 
+
+    :type: int
+    '''
+
+
+class Itasc:
+    '''Parameters for the iTaSC IK solver '''
+
+    damping_epsilon: float = None
+    '''Singular value under which damping is progressively applied (higher values=more stability, less reactivity - default=0.1) 
+
+    :type: float
+    '''
+
+    damping_max: float = None
+    '''Maximum damping coefficient when singular value is nearly 0 (higher values=more stability, less reactivity - default=0.5) 
+
+    :type: float
+    '''
+
+    feedback: float = None
+    '''Feedback coefficient for error correction, average response time is 1/feedback (default=20) 
+
+    :type: float
+    '''
+
+    iterations: int = None
+    '''Maximum number of iterations for convergence in case of reiteration 
+
+    :type: int
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    precision: float = None
+    '''Precision of convergence in case of reiteration 
+
+    :type: float
+    '''
+
+    reiteration_method: typing.Union[int, str] = None
+    '''Defines if the solver is allowed to reiterate (converge until precision is met) on none, first or all frames 
+
+    :type: typing.Union[int, str]
+    '''
+
+    solver: typing.Union[int, str] = None
+    '''Solving method selection: automatic damping or manual damping 
+
+    :type: typing.Union[int, str]
+    '''
+
+    step_count: int = None
+    '''Divide the frame interval into this many steps 
+
+    :type: int
+    '''
+
+    step_max: float = None
+    '''Higher bound for timestep in second in case of automatic substeps 
+
+    :type: float
+    '''
+
+    step_min: float = None
+    '''Lower bound for timestep in second in case of automatic substeps 
+
+    :type: float
+    '''
+
+    use_auto_step: bool = None
+    '''Automatically determine the optimal number of steps for best performance/accuracy trade off 
+
+    :type: bool
+    '''
+
+    velocity_max: float = None
+    '''Maximum joint velocity in rad/s (default=50) 
+
+    :type: float
+    '''
+
+
+class JoystickSensor:
+    '''Sensor to detect joystick events '''
+
+    axis_direction: typing.Union[int, str] = None
+    '''The direction of the axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    axis_number: int = None
+    '''Which axis pair to use, 1 is usually the main direction input 
+
+    :type: int
+    '''
+
+    axis_threshold: int = None
+    '''Precision of the axis 
+
+    :type: int
+    '''
+
+    button_number: int = None
+    '''Which button to use 
+
+    :type: int
+    '''
+
+    event_type: typing.Union[int, str] = None
+    '''The type of event this joystick sensor is triggered on 
+
+    :type: typing.Union[int, str]
+    '''
+
+    hat_direction: typing.Union[int, str] = None
+    '''Hat direction 
+
+    :type: typing.Union[int, str]
+    '''
+
+    hat_number: int = None
+    '''Which hat to use 
+
+    :type: int
+    '''
+
+    joystick_index: int = None
+    '''Which joystick to use 
+
+    :type: int
+    '''
+
+    single_axis_number: int = None
+    '''Single axis (vertical/horizontal/other) to detect 
+
+    :type: int
+    '''
+
+    use_all_events: bool = None
+    '''Triggered by all events on this joystick’s current type (axis/button/hat) 
+
+    :type: bool
+    '''
+
+
+class Key:
+    '''Shape keys data-block containing different shapes of geometric data-blocks '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    eval_time: float = None
+    '''Evaluation time for absolute shape keys 
+
+    :type: float
+    '''
+
+    key_blocks: typing.List['ShapeKey'] = None
+    '''Shape keys 
+
+    :type: typing.List['ShapeKey']
+    '''
+
+    reference_key: 'ShapeKey' = None
+    '''
+
+    :type: 'ShapeKey'
+    '''
+
+    use_relative: bool = None
+    '''Make shape keys relative, otherwise play through shapes as a sequence using the evaluation time 
+
+    :type: bool
+    '''
+
+    user: 'ID' = None
+    '''Data-block using these shape keys 
+
+    :type: 'ID'
+    '''
+
+
+class KeyConfig:
+    '''Input configuration, including keymaps '''
+
+    is_user_defined: bool = None
+    '''Indicates that a keyconfig was defined by the user 
+
+    :type: bool
+    '''
+
+    keymaps: typing.List['KeyMaps'] = None
+    '''Key maps configured as part of this configuration 
+
+    :type: typing.List['KeyMaps']
+    '''
+
+    name: str = None
+    '''Name of the key configuration 
+
+    :type: str
+    '''
+
+
+class KeyConfigurations:
+    '''Collection of KeyConfigs '''
+
+    active: 'KeyConfig' = None
+    '''Active key configuration (preset) 
+
+    :type: 'KeyConfig'
+    '''
+
+    addon: 'KeyConfig' = None
+    '''Key configuration that can be extended by add-ons, and is added to the active configuration when handling events 
+
+    :type: 'KeyConfig'
+    '''
+
+    default: 'KeyConfig' = None
+    '''Default builtin key configuration 
+
+    :type: 'KeyConfig'
+    '''
+
+    user: 'KeyConfig' = None
+    '''Final key configuration that combines keymaps from the active and add-on configurations, and can be edited by the user 
+
+    :type: 'KeyConfig'
+    '''
+
+    def new(self, name: str) -> 'KeyConfig':
+        '''new 
+
+        :param name: Name 
+        :type name: str
+        :rtype: 'KeyConfig'
+        :return:  Key Configuration, Added key configuration 
+        '''
+        pass
+
+    def remove(self, keyconfig: 'KeyConfig'):
+        '''remove 
+
+        :param keyconfig: Key Configuration, Removed key configuration 
+        :type keyconfig: 'KeyConfig'
+        '''
+        pass
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Keyframe:
+    '''Bezier curve point with two handles defining a Keyframe on an F-Curve '''
+
+    amplitude: float = None
+    '''Amount to boost elastic bounces for ‘elastic’ easing 
+
+    :type: float
+    '''
+
+    back: float = None
+    '''Amount of overshoot for ‘back’ easing 
+
+    :type: float
+    '''
+
+    co: float = None
+    '''Coordinates of the control point 
+
+    :type: float
+    '''
+
+    easing: typing.Union[int, str] = None
+    '''Which ends of the segment between this and the next keyframe easing interpolation is applied to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    handle_left: float = None
+    '''Coordinates of the left handle (before the control point) 
+
+    :type: float
+    '''
+
+    handle_left_type: typing.Union[int, str] = None
+    '''Handle types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    handle_right: float = None
+    '''Coordinates of the right handle (after the control point) 
+
+    :type: float
+    '''
+
+    handle_right_type: typing.Union[int, str] = None
+    '''Handle types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Interpolation method to use for segment of the F-Curve from this Keyframe until the next Keyframe 
+
+    :type: typing.Union[int, str]
+    '''
+
+    period: float = None
+    '''Time between bounces for elastic easing 
+
+    :type: float
+    '''
+
+    select_control_point: bool = None
+    '''Control point selection status 
+
+    :type: bool
+    '''
+
+    select_left_handle: bool = None
+    '''Left handle selection status 
+
+    :type: bool
+    '''
+
+    select_right_handle: bool = None
+    '''Right handle selection status 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of keyframe (for visual purposes only) 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class KeyingSet:
+    '''Settings that should be keyframed together '''
+
+    bl_description: str = None
+    '''A short description of the keying set 
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''If this is set, the Keying Set gets a custom ID, otherwise it takes the name of the class used to define the Keying Set (for example, if the class name is “BUILTIN_KSI_location”, and bl_idname is not set by the script, then bl_idname = “BUILTIN_KSI_location”) 
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''
+
+    :type: str
+    '''
+
+    is_path_absolute: bool = None
+    '''Keying Set defines specific paths/settings to be keyframed (i.e. is not reliant on context info) 
+
+    :type: bool
+    '''
+
+    paths: typing.List['KeyingSetPaths'] = None
+    '''Keying Set Paths to define settings that get keyframed together 
+
+    :type: typing.List['KeyingSetPaths']
+    '''
+
+    type_info: 'KeyingSetInfo' = None
+    '''Callback function defines for built-in Keying Sets 
+
+    :type: 'KeyingSetInfo'
+    '''
+
+    use_insertkey_needed: bool = None
+    '''Only insert keyframes where they’re needed in the relevant F-Curves 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_needed: bool = None
+    '''Override default setting to only insert keyframes where they’re needed in the relevant F-Curves 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_visual: bool = None
+    '''Override default setting to insert keyframes based on ‘visual transforms’ 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_xyz_to_rgb: bool = None
+    '''Override default setting to set color for newly added transformation F-Curves (Location, Rotation, Scale) to be based on the transform axis 
+
+    :type: bool
+    '''
+
+    use_insertkey_visual: bool = None
+    '''Insert keyframes based on ‘visual transforms’ 
+
+    :type: bool
+    '''
+
+    use_insertkey_xyz_to_rgb: bool = None
+    '''Color for newly added transformation F-Curves (Location, Rotation, Scale) is based on the transform axis 
+
+    :type: bool
+    '''
+
+    def refresh(self, ):
+        '''Refresh Keying Set to ensure that it is valid for the current context (call before each use of one) 
+
+        '''
+        pass
+
+
+class KeyingSetInfo:
+    '''Callback function defines for builtin Keying Sets '''
+
+    bl_description: str = None
+    '''A short description of the keying set 
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''If this is set, the Keying Set gets a custom ID, otherwise it takes the name of the class used to define the Keying Set (for example, if the class name is “BUILTIN_KSI_location”, and bl_idname is not set by the script, then bl_idname = “BUILTIN_KSI_location”) 
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_options: typing.Set[typing.Union[int, str]] = None
+    '''Keying Set options to use when inserting keyframes 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    def poll(self, context) -> bool:
+        '''Test if Keying Set can be used or not 
+
+        :rtype: bool
+        '''
+        pass
+
+    def iterator(self, context, ks):
+        '''Call generate() on the structs which have properties to be keyframed 
+
+        '''
+        pass
+
+    def generate(self, context, ks, data):
+        '''Add Paths to the Keying Set to keyframe the properties of the given data 
+
+        '''
+        pass
+
+
+class KeyingSetPath:
+    '''Path to a setting for use in a Keying Set '''
+
+    array_index: int = None
+    '''Index to the specific setting if applicable 
+
+    :type: int
+    '''
+
+    data_path: str = None
+    '''Path to property setting 
+
+    :type: str
+    '''
+
+    group: str = None
+    '''Name of Action Group to assign setting(s) for this path to 
+
+    :type: str
+    '''
+
+    group_method: typing.Union[int, str] = None
+    '''Method used to define which Group-name to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    id: 'ID' = None
+    '''ID-Block that keyframes for Keying Set should be added to (for Absolute Keying Sets only) 
+
+    :type: 'ID'
+    '''
+
+    id_type: typing.Union[int, str] = None
+    '''Type of ID-block that can be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_entire_array: bool = None
+    '''When an ‘array/vector’ type is chosen (Location, Rotation, Color, etc.), entire array is to be used 
+
+    :type: bool
+    '''
+
+    use_insertkey_needed: bool = None
+    '''Only insert keyframes where they’re needed in the relevant F-Curves 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_needed: bool = None
+    '''Override default setting to only insert keyframes where they’re needed in the relevant F-Curves 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_visual: bool = None
+    '''Override default setting to insert keyframes based on ‘visual transforms’ 
+
+    :type: bool
+    '''
+
+    use_insertkey_override_xyz_to_rgb: bool = None
+    '''Override default setting to set color for newly added transformation F-Curves (Location, Rotation, Scale) to be based on the transform axis 
+
+    :type: bool
+    '''
+
+    use_insertkey_visual: bool = None
+    '''Insert keyframes based on ‘visual transforms’ 
+
+    :type: bool
+    '''
+
+    use_insertkey_xyz_to_rgb: bool = None
+    '''Color for newly added transformation F-Curves (Location, Rotation, Scale) is based on the transform axis 
+
+    :type: bool
+    '''
+
+
+class KeyingSetPaths:
+    '''Collection of keying set paths '''
+
+    active: 'KeyingSetPath' = None
+    '''Active Keying Set used to insert/delete keyframes 
+
+    :type: 'KeyingSetPath'
+    '''
+
+    active_index: int = None
+    '''Current Keying Set index 
+
+    :type: int
+    '''
+
+    def add(self,
+            target_id: 'ID',
+            data_path: str,
+            index: int = -1,
+            group_method: typing.Union[int, str] = 'KEYINGSET',
+            group_name: str = "") -> 'KeyingSetPath':
+        '''Add a new path for the Keying Set 
+
+        :param target_id: Target ID, ID data-block for the destination 
+        :type target_id: 'ID'
+        :param data_path: Data-Path, RNA-Path to destination property 
+        :type data_path: str
+        :param index: Index, The index of the destination property (i.e. axis of Location/Rotation/etc.), or -1 for the entire array 
+        :type index: int
+        :param group_method: Grouping Method, Method used to define which Group-name to use 
+        :type group_method: typing.Union[int, str]
+        :param group_name: Group Name, Name of Action Group to assign destination to (only if grouping mode is to use this name) 
+        :type group_name: str
+        :rtype: 'KeyingSetPath'
+        :return:  New Path, Path created and added to the Keying Set 
+        '''
+        pass
+
+    def remove(self, path: 'KeyingSetPath'):
+        '''Remove the given path from the Keying Set 
+
+        :param path: Path 
+        :type path: 'KeyingSetPath'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all the paths from the Keying Set 
+
+        '''
+        pass
+
+
+class KeyingSets:
+    '''Scene keying sets '''
+
+    active: 'KeyingSet' = None
+    '''Active Keying Set used to insert/delete keyframes 
+
+    :type: 'KeyingSet'
+    '''
+
+    active_index: int = None
+    '''Current Keying Set index (negative for ‘builtin’ and positive for ‘absolute’) 
+
+    :type: int
+    '''
+
+    def new(self, idname: str = "KeyingSet",
+            name: str = "KeyingSet") -> 'KeyingSet':
+        '''Add a new Keying Set to Scene 
+
+        :param idname: IDName, Internal identifier of Keying Set 
+        :type idname: str
+        :param name: Name, User visible name of Keying Set 
+        :type name: str
+        :rtype: 'KeyingSet'
+        :return:  Newly created Keying Set 
+        '''
+        pass
+
+
+class KeyingSetsAll:
+    '''All available keying sets '''
+
+    active: 'KeyingSet' = None
+    '''Active Keying Set used to insert/delete keyframes 
+
+    :type: 'KeyingSet'
+    '''
+
+    active_index: int = None
+    '''Current Keying Set index (negative for ‘builtin’ and positive for ‘absolute’) 
+
+    :type: int
+    '''
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class KinematicConstraint:
+    '''Inverse Kinematics '''
+
+    chain_count: int = None
+    '''How many bones are included in the IK effect - 0 uses all bones 
+
+    :type: int
+    '''
+
+    distance: float = None
+    '''Radius of limiting sphere 
+
+    :type: float
+    '''
+
+    ik_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    iterations: int = None
+    '''Maximum number of solving iterations 
+
+    :type: int
+    '''
+
+    limit_mode: typing.Union[int, str] = None
+    '''Distances in relation to sphere of influence to allow 
+
+    :type: typing.Union[int, str]
+    '''
+
+    lock_location_x: bool = None
+    '''Constraint position along X axis 
+
+    :type: bool
+    '''
+
+    lock_location_y: bool = None
+    '''Constraint position along Y axis 
+
+    :type: bool
+    '''
+
+    lock_location_z: bool = None
+    '''Constraint position along Z axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_x: bool = None
+    '''Constraint rotation along X axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_y: bool = None
+    '''Constraint rotation along Y axis 
+
+    :type: bool
+    '''
+
+    lock_rotation_z: bool = None
+    '''Constraint rotation along Z axis 
+
+    :type: bool
+    '''
+
+    orient_weight: float = None
+    '''For Tree-IK: Weight of orientation control for this target 
+
+    :type: float
+    '''
+
+    pole_angle: float = None
+    '''Pole rotation offset 
+
+    :type: float
+    '''
+
+    pole_subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    pole_target: 'Object' = None
+    '''Object for pole rotation 
+
+    :type: 'Object'
+    '''
+
+    reference_axis: typing.Union[int, str] = None
+    '''Constraint axis Lock options relative to Bone or Target reference 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_location: bool = None
+    '''Chain follows position of target 
+
+    :type: bool
+    '''
+
+    use_rotation: bool = None
+    '''Chain follows rotation of target 
+
+    :type: bool
+    '''
+
+    use_stretch: bool = None
+    '''Enable IK Stretching 
+
+    :type: bool
+    '''
+
+    use_tail: bool = None
+    '''Include bone’s tail as last element in chain 
+
+    :type: bool
+    '''
+
+    weight: float = None
+    '''For Tree-IK: Weight of position control for this target 
+
+    :type: float
+    '''
+
+
+class Lamp:
+    '''Lamp data-block for lighting a scene '''
+
+    active_texture: 'Texture' = None
+    '''Active texture slot being displayed 
+
+    :type: 'Texture'
+    '''
+
+    active_texture_index: int = None
+    '''Index of active texture slot 
+
+    :type: int
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    color: float = None
+    '''Light color 
+
+    :type: float
+    '''
+
+    cycles: 'CyclesLampSettings' = None
+    '''Cycles lamp settings 
+
+    :type: 'CyclesLampSettings'
+    '''
+
+    distance: float = None
+    '''Falloff distance - the light is at half the original intensity at this point 
+
+    :type: float
+    '''
+
+    energy: float = None
+    '''Amount of light that the lamp emits 
+
+    :type: float
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Node tree for node based lamps 
+
+    :type: 'NodeTree'
+    '''
+
+    texture_slots: typing.List['LampTextureSlots'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['LampTextureSlots']
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of Lamp 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_diffuse: bool = None
+    '''Do diffuse shading 
+
+    :type: bool
+    '''
+
+    use_negative: bool = None
+    '''Cast negative light 
+
+    :type: bool
+    '''
+
+    use_nodes: bool = None
+    '''Use shader nodes to render the lamp 
+
+    :type: bool
+    '''
+
+    use_own_layer: bool = None
+    '''Illuminate objects only on the same layers the lamp is on 
+
+    :type: bool
+    '''
+
+    use_specular: bool = None
+    '''Create specular highlights 
+
+    :type: bool
+    '''
+
+
+class LampSkySettings:
+    '''Sky related settings for a sun lamp '''
+
+    atmosphere_distance_factor: float = None
+    '''Multiplier to convert blender units to physical distance 
+
+    :type: float
+    '''
+
+    atmosphere_extinction: float = None
+    '''Extinction scattering contribution factor 
+
+    :type: float
+    '''
+
+    atmosphere_inscattering: float = None
+    '''Scatter contribution factor 
+
+    :type: float
+    '''
+
+    atmosphere_turbidity: float = None
+    '''Sky turbidity 
+
+    :type: float
+    '''
+
+    backscattered_light: float = None
+    '''Backscattered light 
+
+    :type: float
+    '''
+
+    horizon_brightness: float = None
+    '''Horizon brightness 
+
+    :type: float
+    '''
+
+    sky_blend: float = None
+    '''Blend factor with sky 
+
+    :type: float
+    '''
+
+    sky_blend_type: typing.Union[int, str] = None
+    '''Blend mode for combining sun sky with world sky 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sky_color_space: typing.Union[int, str] = None
+    '''Color space to use for internal XYZ->RGB color conversion 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sky_exposure: float = None
+    '''Strength of sky shading exponential exposure correction 
+
+    :type: float
+    '''
+
+    spread: float = None
+    '''Horizon Spread 
+
+    :type: float
+    '''
+
+    sun_brightness: float = None
+    '''Sun brightness 
+
+    :type: float
+    '''
+
+    sun_intensity: float = None
+    '''Sun intensity 
+
+    :type: float
+    '''
+
+    sun_size: float = None
+    '''Sun size 
+
+    :type: float
+    '''
+
+    use_atmosphere: bool = None
+    '''Apply sun effect on atmosphere 
+
+    :type: bool
+    '''
+
+    use_sky: bool = None
+    '''Apply sun effect on sky 
+
+    :type: bool
+    '''
+
+
+class LampTextureSlot:
+    '''Texture slot for textures in a Lamp data-block '''
+
+    color_factor: float = None
+    '''Amount texture affects color values 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object to use for mapping with Object texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    shadow_factor: float = None
+    '''Amount texture affects shadow 
+
+    :type: float
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_map_color: bool = None
+    '''Let the texture affect the basic color of the lamp 
+
+    :type: bool
+    '''
+
+    use_map_shadow: bool = None
+    '''Let the texture affect the shadow color of the lamp 
+
+    :type: bool
+    '''
+
+
+class LampTextureSlots:
+    '''Collection of texture slots '''
+
+    pass
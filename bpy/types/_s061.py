@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LaplacianDeformModifier:
+    '''Mesh deform modifier '''
+
+    is_bind: bool = None
+    '''Whether geometry has been bound to anchors 
+
+    :type: bool
+    '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines Anchors 
+
+    :type: str
+    '''
+
+
+class LaplacianSmoothModifier:
+    '''Smoothing effect modifier '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    lambda_border: float = None
+    '''Lambda factor in border 
+
+    :type: float
+    '''
+
+    lambda_factor: float = None
+    '''Smooth factor effect 
+
+    :type: float
+    '''
+
+    use_normalized: bool = None
+    '''Improve and stabilize the enhanced shape 
+
+    :type: bool
+    '''
+
+    use_volume_preserve: bool = None
+    '''Apply volume preservation after smooth 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''Smooth object along X axis 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Smooth object along Y axis 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Smooth object along Z axis 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class Lattice:
+    '''Lattice data-block defining a grid for deforming other objects '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    interpolation_type_u: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    interpolation_type_v: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    interpolation_type_w: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    is_editmode: bool = None
+    '''True when used in editmode 
+
+    :type: bool
+    '''
+
+    points: typing.List['LatticePoint'] = None
+    '''Points of the lattice 
+
+    :type: typing.List['LatticePoint']
+    '''
+
+    points_u: int = None
+    '''Point in U direction (can’t be changed when there are shape keys) 
+
+    :type: int
+    '''
+
+    points_v: int = None
+    '''Point in V direction (can’t be changed when there are shape keys) 
+
+    :type: int
+    '''
+
+    points_w: int = None
+    '''Point in W direction (can’t be changed when there are shape keys) 
+
+    :type: int
+    '''
+
+    shape_keys: 'Key' = None
+    '''
+
+    :type: 'Key'
+    '''
+
+    use_outside: bool = None
+    '''Only draw, and take into account, the outer vertices 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group to apply the influence of the lattice 
+
+    :type: str
+    '''
+
+    def transform(self, matrix: float, shape_keys: bool = False):
+        '''Transform lattice by a matrix 
+
+        :param matrix: Matrix 
+        :type matrix: float
+        :param shape_keys: Transform Shape Keys 
+        :type shape_keys: bool
+        '''
+        pass
+
+
+class LatticeModifier:
+    '''Lattice deformation modifier '''
+
+    object: 'Object' = None
+    '''Lattice object to deform with 
+
+    :type: 'Object'
+    '''
+
+    strength: float = None
+    '''Strength of modifier effect 
+
+    :type: float
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class LatticePoint:
+    '''Point in the lattice grid '''
+
+    co: float = None
+    '''Original undeformed location used to calculate the strength of the deform effect (edit/animate the Deformed Location instead) 
+
+    :type: float
+    '''
+
+    co_deform: float = None
+    '''
+
+    :type: float
+    '''
+
+    groups: typing.List['VertexGroupElement'] = None
+    '''Weights for the vertex groups this point is member of 
+
+    :type: typing.List['VertexGroupElement']
+    '''
+
+    select: bool = None
+    '''Selection status 
+
+    :type: bool
+    '''
+
+    weight_softbody: float = None
+    '''Softbody goal weight 
+
+    :type: float
+    '''
+
+
+class Library:
+    '''External .blend file from which data is linked '''
+
+    filepath: str = None
+    '''Path to the library .blend file 
+
+    :type: str
+    '''
+
+    packed_file: 'PackedFile' = None
+    '''
+
+    :type: 'PackedFile'
+    '''
+
+    parent: 'Library' = None
+    '''
+
+    :type: 'Library'
+    '''
+
+    users_id = None
+    '''ID data blocks which use this library (readonly) '''
+
+    def reload(self, ):
+        '''Reload this library and all its linked data-blocks 
+
+        '''
+        pass
+
+
+class LimitDistanceConstraint:
+    '''Limit the distance from target object '''
+
+    distance: float = None
+    '''Radius of limiting sphere 
+
+    :type: float
+    '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    limit_mode: typing.Union[int, str] = None
+    '''Distances in relation to sphere of influence to allow 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+    use_transform_limit: bool = None
+    '''Transforms are affected by this constraint as well 
+
+    :type: bool
+    '''
+
+
+class LimitLocationConstraint:
+    '''Limit the location of the constrained object '''
+
+    max_x: float = None
+    '''Highest X value to allow 
+
+    :type: float
+    '''
+
+    max_y: float = None
+    '''Highest Y value to allow 
+
+    :type: float
+    '''
+
+    max_z: float = None
+    '''Highest Z value to allow 
+
+    :type: float
+    '''
+
+    min_x: float = None
+    '''Lowest X value to allow 
+
+    :type: float
+    '''
+
+    min_y: float = None
+    '''Lowest Y value to allow 
+
+    :type: float
+    '''
+
+    min_z: float = None
+    '''Lowest Z value to allow 
+
+    :type: float
+    '''
+
+    use_max_x: bool = None
+    '''Use the maximum X value 
+
+    :type: bool
+    '''
+
+    use_max_y: bool = None
+    '''Use the maximum Y value 
+
+    :type: bool
+    '''
+
+    use_max_z: bool = None
+    '''Use the maximum Z value 
+
+    :type: bool
+    '''
+
+    use_min_x: bool = None
+    '''Use the minimum X value 
+
+    :type: bool
+    '''
+
+    use_min_y: bool = None
+    '''Use the minimum Y value 
+
+    :type: bool
+    '''
+
+    use_min_z: bool = None
+    '''Use the minimum Z value 
+
+    :type: bool
+    '''
+
+    use_transform_limit: bool = None
+    '''Transforms are affected by this constraint as well 
+
+    :type: bool
+    '''
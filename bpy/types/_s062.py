@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LimitRotationConstraint:
+    '''Limit the rotation of the constrained object '''
+
+    max_x: float = None
+    '''Highest X value to allow 
+
+    :type: float
+    '''
+
+    max_y: float = None
+    '''Highest Y value to allow 
+
+    :type: float
+    '''
+
+    max_z: float = None
+    '''Highest Z value to allow 
+
+    :type: float
+    '''
+
+    min_x: float = None
+    '''Lowest X value to allow 
+
+    :type: float
+    '''
+
+    min_y: float = None
+    '''Lowest Y value to allow 
+
+    :type: float
+    '''
+
+    min_z: float = None
+    '''Lowest Z value to allow 
+
+    :type: float
+    '''
+
+    use_limit_x: bool = None
+    '''Use the minimum X value 
+
+    :type: bool
+    '''
+
+    use_limit_y: bool = None
+    '''Use the minimum Y value 
+
+    :type: bool
+    '''
+
+    use_limit_z: bool = None
+    '''Use the minimum Z value 
+
+    :type: bool
+    '''
+
+    use_transform_limit: bool = None
+    '''Transforms are affected by this constraint as well 
+
+    :type: bool
+    '''
+
+
+class LimitScaleConstraint:
+    '''Limit the scaling of the constrained object '''
+
+    max_x: float = None
+    '''Highest X value to allow 
+
+    :type: float
+    '''
+
+    max_y: float = None
+    '''Highest Y value to allow 
+
+    :type: float
+    '''
+
+    max_z: float = None
+    '''Highest Z value to allow 
+
+    :type: float
+    '''
+
+    min_x: float = None
+    '''Lowest X value to allow 
+
+    :type: float
+    '''
+
+    min_y: float = None
+    '''Lowest Y value to allow 
+
+    :type: float
+    '''
+
+    min_z: float = None
+    '''Lowest Z value to allow 
+
+    :type: float
+    '''
+
+    use_max_x: bool = None
+    '''Use the maximum X value 
+
+    :type: bool
+    '''
+
+    use_max_y: bool = None
+    '''Use the maximum Y value 
+
+    :type: bool
+    '''
+
+    use_max_z: bool = None
+    '''Use the maximum Z value 
+
+    :type: bool
+    '''
+
+    use_min_x: bool = None
+    '''Use the minimum X value 
+
+    :type: bool
+    '''
+
+    use_min_y: bool = None
+    '''Use the minimum Y value 
+
+    :type: bool
+    '''
+
+    use_min_z: bool = None
+    '''Use the minimum Z value 
+
+    :type: bool
+    '''
+
+    use_transform_limit: bool = None
+    '''Transforms are affected by this constraint as well 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier:
+    '''Base type to define alpha transparency modifiers '''
+
+    pass
+
+
+class LineStyleAlphaModifier_AlongStroke:
+    '''Change alpha transparency along stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_CreaseAngle:
+    '''Alpha transparency based on the angle between two adjacent faces '''
+
+    angle_max: float = None
+    '''Maximum angle to modify thickness 
+
+    :type: float
+    '''
+
+    angle_min: float = None
+    '''Minimum angle to modify thickness 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_Curvature_3D:
+    '''Alpha transparency based on the radial curvature of 3D mesh surfaces '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curvature_max: float = None
+    '''Maximum Curvature 
+
+    :type: float
+    '''
+
+    curvature_min: float = None
+    '''Minimum Curvature 
+
+    :type: float
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleAlphaModifier_DistanceFromCamera:
+    '''Change alpha transparency based on the distance from the camera '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_DistanceFromObject:
+    '''Change alpha transparency based on the distance from an object '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Target object from which the distance is measured 
+
+    :type: 'Object'
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_Material:
+    '''Change alpha transparency based on a material attribute '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    material_attribute: typing.Union[int, str] = None
+    '''Specify which material attribute is used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_Noise:
+    '''Alpha transparency based on random noise '''
+
+    amplitude: float = None
+    '''Amplitude of the noise 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    period: float = None
+    '''Period of the noise 
+
+    :type: float
+    '''
+
+    seed: int = None
+    '''Seed for the noise generation 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifier_Tangent:
+    '''Alpha transparency based on the direction of the stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleAlphaModifiers:
+    '''Alpha modifiers for changing line alphas '''
+
+    def new(self, name: str,
+            type: typing.Union[int, str]) -> 'LineStyleAlphaModifier':
+        '''Add a alpha modifier to line style 
+
+        :param name: New name for the alpha modifier (not unique) 
+        :type name: str
+        :param type: Alpha modifier type to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'LineStyleAlphaModifier'
+        :return:  Newly added alpha modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'LineStyleAlphaModifier'):
+        '''Remove a alpha modifier from line style 
+
+        :param modifier: Alpha modifier to remove 
+        :type modifier: 'LineStyleAlphaModifier'
+        '''
+        pass
+
+
+class LineStyleColorModifier:
+    '''Base type to define line color modifiers '''
+
+    pass
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleColorModifier_AlongStroke:
+    '''Change line color along stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_CreaseAngle:
+    '''Change line color based on the underlying crease angle '''
+
+    angle_max: float = None
+    '''Maximum angle to modify thickness 
+
+    :type: float
+    '''
+
+    angle_min: float = None
+    '''Minimum angle to modify thickness 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_Curvature_3D:
+    '''Change line color based on the radial curvature of 3D mesh surfaces '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    curvature_max: float = None
+    '''Maximum Curvature 
+
+    :type: float
+    '''
+
+    curvature_min: float = None
+    '''Minimum Curvature 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_DistanceFromCamera:
+    '''Change line color based on the distance from the camera '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_DistanceFromObject:
+    '''Change line color based on the distance from an object '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Target object from which the distance is measured 
+
+    :type: 'Object'
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_Material:
+    '''Change line color based on a material attribute '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    material_attribute: typing.Union[int, str] = None
+    '''Specify which material attribute is used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    use_ramp: bool = None
+    '''Use color ramp to map the BW average into an RGB color 
+
+    :type: bool
+    '''
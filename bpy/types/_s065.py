@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleColorModifier_Noise:
+    '''Change line color based on random noise '''
+
+    amplitude: float = None
+    '''Amplitude of the noise 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    period: float = None
+    '''Period of the noise 
+
+    :type: float
+    '''
+
+    seed: int = None
+    '''Seed for the noise generation 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifier_Tangent:
+    '''Change line color based on the direction of a stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''Color ramp used to change line color 
+
+    :type: 'ColorRamp'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleColorModifiers:
+    '''Color modifiers for changing line colors '''
+
+    def new(self, name: str,
+            type: typing.Union[int, str]) -> 'LineStyleColorModifier':
+        '''Add a color modifier to line style 
+
+        :param name: New name for the color modifier (not unique) 
+        :type name: str
+        :param type: Color modifier type to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'LineStyleColorModifier'
+        :return:  Newly added color modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'LineStyleColorModifier'):
+        '''Remove a color modifier from line style 
+
+        :param modifier: Color modifier to remove 
+        :type modifier: 'LineStyleColorModifier'
+        '''
+        pass
+
+
+class LineStyleGeometryModifier:
+    '''Base type to define stroke geometry modifiers '''
+
+    pass
+
+
+class LineStyleGeometryModifier_2DOffset:
+    '''Add two-dimensional offsets to stroke backbone geometry '''
+
+    end: float = None
+    '''Displacement that is applied from the end of the stroke 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    start: float = None
+    '''Displacement that is applied from the beginning of the stroke 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    x: float = None
+    '''Displacement that is applied to the X coordinates of stroke vertices 
+
+    :type: float
+    '''
+
+    y: float = None
+    '''Displacement that is applied to the Y coordinates of stroke vertices 
+
+    :type: float
+    '''
+
+
+class LineStyleGeometryModifier_2DTransform:
+    '''Apply two-dimensional scaling and rotation to stroke backbone geometry '''
+
+    angle: float = None
+    '''Rotation angle 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    pivot: typing.Union[int, str] = None
+    '''Pivot of scaling and rotation operations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pivot_u: float = None
+    '''Pivot in terms of the stroke point parameter u (0 <= u <= 1) 
+
+    :type: float
+    '''
+
+    pivot_x: float = None
+    '''2D X coordinate of the absolute pivot 
+
+    :type: float
+    '''
+
+    pivot_y: float = None
+    '''2D Y coordinate of the absolute pivot 
+
+    :type: float
+    '''
+
+    scale_x: float = None
+    '''Scaling factor that is applied along the X axis 
+
+    :type: float
+    '''
+
+    scale_y: float = None
+    '''Scaling factor that is applied along the Y axis 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_BackboneStretcher:
+    '''Stretch the beginning and the end of stroke backbone '''
+
+    backbone_length: float = None
+    '''Amount of backbone stretching 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_BezierCurve:
+    '''Replace stroke backbone geometry by a Bezier curve approximation of the original backbone geometry '''
+
+    error: float = None
+    '''Maximum distance allowed between the new Bezier curve and the original backbone geometry 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_Blueprint:
+    '''Produce a blueprint using circular, elliptic, and square contour strokes '''
+
+    backbone_length: float = None
+    '''Amount of backbone stretching 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    random_backbone: int = None
+    '''Randomness of the backbone stretching 
+
+    :type: int
+    '''
+
+    random_center: int = None
+    '''Randomness of the center 
+
+    :type: int
+    '''
+
+    random_radius: int = None
+    '''Randomness of the radius 
+
+    :type: int
+    '''
+
+    rounds: int = None
+    '''Number of rounds in contour strokes 
+
+    :type: int
+    '''
+
+    shape: typing.Union[int, str] = None
+    '''Select the shape of blueprint contour strokes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleGeometryModifier_GuidingLines:
+    '''Modify the stroke geometry so that it corresponds to its main direction line '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    offset: float = None
+    '''Displacement that is applied to the main direction line along its normal 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_PerlinNoise1D:
+    '''Add one-dimensional Perlin noise to stroke backbone geometry '''
+
+    amplitude: float = None
+    '''Amplitude of the Perlin noise 
+
+    :type: float
+    '''
+
+    angle: float = None
+    '''Displacement direction 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    frequency: float = None
+    '''Frequency of the Perlin noise 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    octaves: int = None
+    '''Number of octaves (i.e., the amount of detail of the Perlin noise) 
+
+    :type: int
+    '''
+
+    seed: int = None
+    '''Seed for random number generation (if negative, time is used as a seed instead) 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_PerlinNoise2D:
+    '''Add two-dimensional Perlin noise to stroke backbone geometry '''
+
+    amplitude: float = None
+    '''Amplitude of the Perlin noise 
+
+    :type: float
+    '''
+
+    angle: float = None
+    '''Displacement direction 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    frequency: float = None
+    '''Frequency of the Perlin noise 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    octaves: int = None
+    '''Number of octaves (i.e., the amount of detail of the Perlin noise) 
+
+    :type: int
+    '''
+
+    seed: int = None
+    '''Seed for random number generation (if negative, time is used as a seed instead) 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_Polygonalization:
+    '''Modify the stroke geometry so that it looks more ‘polygonal’ '''
+
+    error: float = None
+    '''Maximum distance between the original stroke and its polygonal approximation 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_Sampling:
+    '''Specify a new sampling value that determines the resolution of stroke polylines '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    sampling: float = None
+    '''New sampling value to be used for subsequent modifiers 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_Simplification:
+    '''Simplify the stroke set '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    tolerance: float = None
+    '''Distance below which segments will be merged 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_SinusDisplacement:
+    '''Add sinus displacement to stroke backbone geometry '''
+
+    amplitude: float = None
+    '''Amplitude of the sinus displacement 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    phase: float = None
+    '''Phase of the sinus displacement 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    wavelength: float = None
+    '''Wavelength of the sinus displacement 
+
+    :type: float
+    '''
+
+
+class LineStyleGeometryModifier_SpatialNoise:
+    '''Add spatial noise to stroke backbone geometry '''
+
+    amplitude: float = None
+    '''Amplitude of the spatial noise 
+
+    :type: float
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    octaves: int = None
+    '''Number of octaves (i.e., the amount of detail of the spatial noise) 
+
+    :type: int
+    '''
+
+    scale: float = None
+    '''Scale of the spatial noise 
+
+    :type: float
+    '''
+
+    smooth: bool = None
+    '''If true, the spatial noise is smooth 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    use_pure_random: bool = None
+    '''If true, the spatial noise does not show any coherence 
+
+    :type: bool
+    '''
+
+
+class LineStyleGeometryModifier_TipRemover:
+    '''Remove a piece of stroke at the beginning and the end of stroke backbone '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    tip_length: float = None
+    '''Length of tips to be removed 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleGeometryModifiers:
+    '''Geometry modifiers for changing line geometries '''
+
+    def new(self, name: str,
+            type: typing.Union[int, str]) -> 'LineStyleGeometryModifier':
+        '''Add a geometry modifier to line style 
+
+        :param name: New name for the geometry modifier (not unique) 
+        :type name: str
+        :param type: Geometry modifier type to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'LineStyleGeometryModifier'
+        :return:  Newly added geometry modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'LineStyleGeometryModifier'):
+        '''Remove a geometry modifier from line style 
+
+        :param modifier: Geometry modifier to remove 
+        :type modifier: 'LineStyleGeometryModifier'
+        '''
+        pass
+
+
+class LineStyleModifier:
+    '''Base type to define modifiers '''
+
+    pass
+
+
+class LineStyleTextureSlot:
+    '''Texture slot for textures in a LineStyle data-block '''
+
+    alpha_factor: float = None
+    '''Amount texture affects alpha 
+
+    :type: float
+    '''
+
+    diffuse_color_factor: float = None
+    '''Amount texture affects diffuse color 
+
+    :type: float
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_x: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_y: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_z: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''Texture coordinates used to map the texture onto the background 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_map_alpha: bool = None
+    '''The texture affects the alpha value 
+
+    :type: bool
+    '''
+
+    use_map_color_diffuse: bool = None
+    '''The texture affects basic color of the stroke 
+
+    :type: bool
+    '''
+
+    use_tips: bool = None
+    '''Lower half of the texture is for tips of the stroke 
+
+    :type: bool
+    '''
+
+
+class LineStyleTextureSlots:
+    '''Collection of texture slots '''
+
+    pass
+
+
+class LineStyleThicknessModifier:
+    '''Base type to define line thickness modifiers '''
+
+    pass
+
+
+class LineStyleThicknessModifier_AlongStroke:
+    '''Change line thickness along stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    value_max: float = None
+    '''Maximum output value of the mapping 
+
+    :type: float
+    '''
+
+    value_min: float = None
+    '''Minimum output value of the mapping 
+
+    :type: float
+    '''
+
+
+class LineStyleThicknessModifier_Calligraphy:
+    '''Change line thickness so that stroke looks like made with a calligraphic pen '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    orientation: float = None
+    '''Angle of the main direction 
+
+    :type: float
+    '''
+
+    thickness_max: float = None
+    '''Maximum thickness in the main direction 
+
+    :type: float
+    '''
+
+    thickness_min: float = None
+    '''Minimum thickness in the direction perpendicular to the main direction 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleThicknessModifier_CreaseAngle:
+    '''Line thickness based on the angle between two adjacent faces '''
+
+    angle_max: float = None
+    '''Maximum angle to modify thickness 
+
+    :type: float
+    '''
+
+    angle_min: float = None
+    '''Minimum angle to modify thickness 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    thickness_max: float = None
+    '''Maximum thickness 
+
+    :type: float
+    '''
+
+    thickness_min: float = None
+    '''Minimum thickness 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+
+class LineStyleThicknessModifier_Curvature_3D:
+    '''Line thickness based on the radial curvature of 3D mesh surfaces '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curvature_max: float = None
+    '''Maximum Curvature 
+
+    :type: float
+    '''
+
+    curvature_min: float = None
+    '''Minimum Curvature 
+
+    :type: float
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    thickness_max: float = None
+    '''Maximum thickness 
+
+    :type: float
+    '''
+
+    thickness_min: float = None
+    '''Minimum thickness 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleThicknessModifier_DistanceFromCamera:
+    '''Change line thickness based on the distance from the camera '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    value_max: float = None
+    '''Maximum output value of the mapping 
+
+    :type: float
+    '''
+
+    value_min: float = None
+    '''Minimum output value of the mapping 
+
+    :type: float
+    '''
+
+
+class LineStyleThicknessModifier_DistanceFromObject:
+    '''Change line thickness based on the distance from an object '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    range_max: float = None
+    '''Upper bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    range_min: float = None
+    '''Lower bound of the input range the mapping is applied 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Target object from which the distance is measured 
+
+    :type: 'Object'
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    value_max: float = None
+    '''Maximum output value of the mapping 
+
+    :type: float
+    '''
+
+    value_min: float = None
+    '''Minimum output value of the mapping 
+
+    :type: float
+    '''
+
+
+class LineStyleThicknessModifier_Material:
+    '''Change line thickness based on a material attribute '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    material_attribute: typing.Union[int, str] = None
+    '''Specify which material attribute is used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    value_max: float = None
+    '''Maximum output value of the mapping 
+
+    :type: float
+    '''
+
+    value_min: float = None
+    '''Minimum output value of the mapping 
+
+    :type: float
+    '''
+
+
+class LineStyleThicknessModifier_Noise:
+    '''Line thickness based on random noise '''
+
+    amplitude: float = None
+    '''Amplitude of the noise 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    period: float = None
+    '''Period of the noise 
+
+    :type: float
+    '''
+
+    seed: int = None
+    '''Seed for the noise generation 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
+
+    use_asymmetric: bool = None
+    '''Allow thickness to be assigned asymmetrically 
+
+    :type: bool
+    '''
+
+
+class LineStyleThicknessModifier_Tangent:
+    '''Thickness based on the direction of the stroke '''
+
+    blend: typing.Union[int, str] = None
+    '''Specify how the modifier value is blended into the base value 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve: 'CurveMapping' = None
+    '''Curve used for the curve mapping 
+
+    :type: 'CurveMapping'
+    '''
+
+    expanded: bool = None
+    '''True if the modifier tab is expanded 
+
+    :type: bool
+    '''
+
+    influence: float = None
+    '''Influence factor by which the modifier changes the property 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the fade-out direction of the linear mapping 
+
+    :type: bool
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''Select the mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Name of the modifier 
+
+    :type: str
+    '''
+
+    thickness_max: float = None
+    '''Maximum thickness 
+
+    :type: float
+    '''
+
+    thickness_min: float = None
+    '''Minimum thickness 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of the modifier 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Enable or disable this modifier during stroke rendering 
+
+    :type: bool
+    '''
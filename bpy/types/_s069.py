@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class LineStyleThicknessModifiers:
+    '''Thickness modifiers for changing line thickness '''
+
+    def new(self, name: str,
+            type: typing.Union[int, str]) -> 'LineStyleThicknessModifier':
+        '''Add a thickness modifier to line style 
+
+        :param name: New name for the thickness modifier (not unique) 
+        :type name: str
+        :param type: Thickness modifier type to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'LineStyleThicknessModifier'
+        :return:  Newly added thickness modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'LineStyleThicknessModifier'):
+        '''Remove a thickness modifier from line style 
+
+        :param modifier: Thickness modifier to remove 
+        :type modifier: 'LineStyleThicknessModifier'
+        '''
+        pass
+
+
+class Linesets:
+    '''Line sets for associating lines and style parameters '''
+
+    active: 'FreestyleLineSet' = None
+    '''Active line set being displayed 
+
+    :type: 'FreestyleLineSet'
+    '''
+
+    active_index: int = None
+    '''Index of active line set slot 
+
+    :type: int
+    '''
+
+    def new(self, name: str) -> 'FreestyleLineSet':
+        '''Add a line set to scene render layer Freestyle settings 
+
+        :param name: New name for the line set (not unique) 
+        :type name: str
+        :rtype: 'FreestyleLineSet'
+        :return:  Newly created line set 
+        '''
+        pass
+
+    def remove(self, lineset: 'FreestyleLineSet'):
+        '''Remove a line set from scene render layer Freestyle settings 
+
+        :param lineset: Line set to remove 
+        :type lineset: 'FreestyleLineSet'
+        '''
+        pass
+
+
+class LocRotScale:
+    def generate(self, context, ks, data):
+        '''
+
+        '''
+        pass
+
+
+class Location:
+    pass
+
+
+class LockedTrackConstraint:
+    '''Point toward the target along the track axis, while locking the other axis '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    lock_axis: typing.Union[int, str] = None
+    '''Axis that points upward 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    track_axis: typing.Union[int, str] = None
+    '''Axis that points to the target object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+
+class LodLevel:
+    distance: float = None
+    '''Distance to begin using this level of detail 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object to use for this level of detail 
+
+    :type: 'Object'
+    '''
+
+    object_hysteresis_percentage: int = None
+    '''Minimum distance change required to transition to the previous level of detail 
+
+    :type: int
+    '''
+
+    use_material: bool = None
+    '''Use the material from this object at this level of detail 
+
+    :type: bool
+    '''
+
+    use_mesh: bool = None
+    '''Use the mesh from this object at this level of detail 
+
+    :type: bool
+    '''
+
+    use_object_hysteresis: bool = None
+    '''Override LoD Hysteresis scene setting for this LoD level 
+
+    :type: bool
+    '''
+
+
+class LoopColors:
+    '''Collection of vertex colors '''
+
+    active: 'MeshLoopColorLayer' = None
+    '''Active vertex color layer 
+
+    :type: 'MeshLoopColorLayer'
+    '''
+
+    active_index: int = None
+    '''Active vertex color index 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "Col") -> 'MeshLoopColorLayer':
+        '''Add a vertex color layer to Mesh 
+
+        :param name: Vertex color name 
+        :type name: str
+        :rtype: 'MeshLoopColorLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+    def remove(self, layer: 'MeshLoopColorLayer'):
+        '''Remove a vertex color layer 
+
+        :param layer: The layer to remove 
+        :type layer: 'MeshLoopColorLayer'
+        '''
+        pass
+
+
+class MASK_UL_layers:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class MATERIAL_UL_matslots:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class MESH_UL_shape_keys:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class MESH_UL_uvmaps_vcols:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class MESH_UL_vgroups:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class Macro:
+    '''Storage of a macro operator being executed, or registered after execution '''
+
+    bl_description: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_options: typing.Set[typing.Union[int, str]] = None
+    '''Options for this operator type 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    bl_translation_context: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_undo_group: str = None
+    '''
+
+    :type: str
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    properties: 'OperatorProperties' = None
+    '''
+
+    :type: 'OperatorProperties'
+    '''
+
+    def report(self, type: typing.Set[typing.Union[int, str]], message: str):
+        '''report 
+
+        :param type: Type 
+        :type type: typing.Set[typing.Union[int, str]]
+        :param message: Report Message 
+        :type message: str
+        '''
+        pass
+
+    def draw(self, context):
+        '''Draw function for the operator 
+
+        '''
+        pass
+
+
+class MagicTexture:
+    '''Procedural noise texture '''
+
+    noise_depth: int = None
+    '''Depth of the noise 
+
+    :type: int
+    '''
+
+    turbulence: float = None
+    '''Turbulence of the noise 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class MaintainVolumeConstraint:
+    '''Maintain a constant volume along a single scaling axis '''
+
+    free_axis: typing.Union[int, str] = None
+    '''The free scaling axis of the object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    volume: float = None
+    '''Volume of the bone at rest 
+
+    :type: float
+    '''
+
+
+class MarbleTexture:
+    '''Procedural noise texture '''
+
+    marble_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_basis_2: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_depth: int = None
+    '''Depth of the cloud calculation 
+
+    :type: int
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    noise_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    turbulence: float = None
+    '''Turbulence of the bandnoise and ringnoise types 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
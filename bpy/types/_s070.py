@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Mask:
+    '''Mask data-block defining mask for compositing '''
+
+    active_layer_index: int = None
+    '''Index of active layer in list of all mask’s layers 
+
+    :type: int
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    frame_end: int = None
+    '''Final frame of the mask (used for sequencer) 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''First frame of the mask (used for sequencer) 
+
+    :type: int
+    '''
+
+    layers: typing.List['MaskLayer'] = None
+    '''Collection of layers which defines this mask 
+
+    :type: typing.List['MaskLayer']
+    '''
+
+
+class MaskLayer:
+    '''Single layer used for masking pixels '''
+
+    alpha: float = None
+    '''Render Opacity 
+
+    :type: float
+    '''
+
+    blend: typing.Union[int, str] = None
+    '''Method of blending mask layers 
+
+    :type: typing.Union[int, str]
+    '''
+
+    falloff: typing.Union[int, str] = None
+    '''Falloff type the feather 
+
+    :type: typing.Union[int, str]
+    '''
+
+    hide: bool = None
+    '''Restrict visibility in the viewport 
+
+    :type: bool
+    '''
+
+    hide_render: bool = None
+    '''Restrict renderability 
+
+    :type: bool
+    '''
+
+    hide_select: bool = None
+    '''Restrict selection in the viewport 
+
+    :type: bool
+    '''
+
+    invert: bool = None
+    '''Invert the mask black/white 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Unique name of layer 
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''Layer is selected for editing in the Dope Sheet 
+
+    :type: bool
+    '''
+
+    splines: typing.List['MaskSplines'] = None
+    '''Collection of splines which defines this layer 
+
+    :type: typing.List['MaskSplines']
+    '''
+
+    use_fill_holes: bool = None
+    '''Calculate holes when filling overlapping curves 
+
+    :type: bool
+    '''
+
+    use_fill_overlap: bool = None
+    '''Calculate self intersections and overlap before filling 
+
+    :type: bool
+    '''
+
+
+class MaskLayers:
+    '''Collection of layers used by mask '''
+
+    active: 'MaskLayer' = None
+    '''Active layer in this mask 
+
+    :type: 'MaskLayer'
+    '''
+
+    def new(self, name: str = "") -> 'MaskLayer':
+        '''Add layer to this mask 
+
+        :param name: Name, Name of new layer 
+        :type name: str
+        :rtype: 'MaskLayer'
+        :return:  New mask layer 
+        '''
+        pass
+
+    def remove(self, layer: 'MaskLayer'):
+        '''Remove layer from this mask 
+
+        :param layer: Shape to be removed 
+        :type layer: 'MaskLayer'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all mask layers 
+
+        '''
+        pass
+
+
+class MaskModifier:
+    '''Mask modifier to hide parts of the mesh '''
+
+    armature: 'Object' = None
+    '''Armature to use as source of bones to mask 
+
+    :type: 'Object'
+    '''
+
+    invert_vertex_group: bool = None
+    '''Use vertices that are not part of region defined 
+
+    :type: bool
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class MaskParent:
+    '''Parenting settings for masking element '''
+
+    id: 'ID' = None
+    '''ID-block to which masking element would be parented to or to it’s property 
+
+    :type: 'ID'
+    '''
+
+    id_type: typing.Union[int, str] = None
+    '''Type of ID-block that can be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    parent: str = None
+    '''Name of parent object in specified data-block to which parenting happens 
+
+    :type: str
+    '''
+
+    sub_parent: str = None
+    '''Name of parent sub-object in specified data-block to which parenting happens 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Parent Type 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class MaskSequence:
+    '''Sequence strip to load a video from a mask '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    mask: 'Mask' = None
+    '''Mask that this sequence uses 
+
+    :type: 'Mask'
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+
+class MaskSpline:
+    '''Single spline used for defining mask shape '''
+
+    offset_mode: typing.Union[int, str] = None
+    '''The method used for calculating the feather offset 
+
+    :type: typing.Union[int, str]
+    '''
+
+    points: typing.List['MaskSplinePoints'] = None
+    '''Collection of points 
+
+    :type: typing.List['MaskSplinePoints']
+    '''
+
+    use_cyclic: bool = None
+    '''Make this spline a closed loop 
+
+    :type: bool
+    '''
+
+    use_fill: bool = None
+    '''Make this spline filled 
+
+    :type: bool
+    '''
+
+    use_self_intersection_check: bool = None
+    '''Prevent feather from self-intersections 
+
+    :type: bool
+    '''
+
+    weight_interpolation: typing.Union[int, str] = None
+    '''The type of weight interpolation for spline 
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MaskSplinePoint:
+    '''Single point in spline used for defining mask '''
+
+    co: float = None
+    '''Coordinates of the control point 
+
+    :type: float
+    '''
+
+    feather_points: typing.List['MaskSplinePointUW'] = None
+    '''Points defining feather 
+
+    :type: typing.List['MaskSplinePointUW']
+    '''
+
+    handle_left: float = None
+    '''Coordinates of the first handle 
+
+    :type: float
+    '''
+
+    handle_left_type: typing.Union[int, str] = None
+    '''Handle type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    handle_right: float = None
+    '''Coordinates of the second handle 
+
+    :type: float
+    '''
+
+    handle_right_type: typing.Union[int, str] = None
+    '''Handle type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    handle_type: typing.Union[int, str] = None
+    '''Handle type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    parent: 'MaskParent' = None
+    '''
+
+    :type: 'MaskParent'
+    '''
+
+    select: bool = None
+    '''Selection status 
+
+    :type: bool
+    '''
+
+    weight: float = None
+    '''Weight of the point 
+
+    :type: float
+    '''
+
+
+class MaskSplinePointUW:
+    '''Single point in spline segment defining feather '''
+
+    select: bool = None
+    '''Selection status 
+
+    :type: bool
+    '''
+
+    u: float = None
+    '''U coordinate of point along spline segment 
+
+    :type: float
+    '''
+
+    weight: float = None
+    '''Weight of feather point 
+
+    :type: float
+    '''
+
+
+class MaskSplinePoints:
+    '''Collection of masking spline points '''
+
+    def add(self, count: int = 1):
+        '''Add a number of point to this spline 
+
+        :param count: Number, Number of points to add to the spline 
+        :type count: int
+        '''
+        pass
+
+    def remove(self, point: 'MaskSplinePoint'):
+        '''Remove a point from a spline 
+
+        :param point: The point to remove 
+        :type point: 'MaskSplinePoint'
+        '''
+        pass
+
+
+class MaskSplines:
+    '''Collection of masking splines '''
+
+    active: 'MaskSpline' = None
+    '''Active spline of masking layer 
+
+    :type: 'MaskSpline'
+    '''
+
+    active_point: 'MaskSplinePoint' = None
+    '''Active spline of masking layer 
+
+    :type: 'MaskSplinePoint'
+    '''
+
+    def new(self, ) -> 'MaskSpline':
+        '''Add a new spline to the layer 
+
+        :rtype: 'MaskSpline'
+        :return:  The newly created spline 
+        '''
+        pass
+
+    def remove(self, spline: 'MaskSpline'):
+        '''Remove a spline from a layer 
+
+        :param spline: The spline to remove 
+        :type spline: 'MaskSpline'
+        '''
+        pass
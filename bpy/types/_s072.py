@@ -0,0 +1,558 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Material:
+    '''Material data-block to define the appearance of geometric objects for rendering '''
+
+    active_node_material: 'Material' = None
+    '''Active node material 
+
+    :type: 'Material'
+    '''
+
+    active_texture: 'Texture' = None
+    '''Active texture slot being displayed 
+
+    :type: 'Texture'
+    '''
+
+    active_texture_index: int = None
+    '''Index of active texture slot 
+
+    :type: int
+    '''
+
+    alpha: float = None
+    '''Alpha transparency of the material 
+
+    :type: float
+    '''
+
+    ambient: float = None
+    '''Amount of global ambient color the material receives 
+
+    :type: float
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    cycles: 'CyclesMaterialSettings' = None
+    '''Cycles material settings 
+
+    :type: 'CyclesMaterialSettings'
+    '''
+
+    darkness: float = None
+    '''Minnaert darkness 
+
+    :type: float
+    '''
+
+    diffuse_color: float = None
+    '''Diffuse color of the material 
+
+    :type: float
+    '''
+
+    diffuse_fresnel: float = None
+    '''Power of Fresnel 
+
+    :type: float
+    '''
+
+    diffuse_fresnel_factor: float = None
+    '''Blending factor of Fresnel 
+
+    :type: float
+    '''
+
+    diffuse_intensity: float = None
+    '''Amount of diffuse reflection 
+
+    :type: float
+    '''
+
+    diffuse_ramp: 'ColorRamp' = None
+    '''Color ramp used to affect diffuse shading 
+
+    :type: 'ColorRamp'
+    '''
+
+    diffuse_ramp_blend: typing.Union[int, str] = None
+    '''Blending method of the ramp and the diffuse color 
+
+    :type: typing.Union[int, str]
+    '''
+
+    diffuse_ramp_factor: float = None
+    '''Blending factor (also uses alpha in Colorband) 
+
+    :type: float
+    '''
+
+    diffuse_ramp_input: typing.Union[int, str] = None
+    '''How the ramp maps on the surface 
+
+    :type: typing.Union[int, str]
+    '''
+
+    diffuse_shader: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    diffuse_toon_size: float = None
+    '''Size of diffuse toon area 
+
+    :type: float
+    '''
+
+    diffuse_toon_smooth: float = None
+    '''Smoothness of diffuse toon area 
+
+    :type: float
+    '''
+
+    emit: float = None
+    '''Amount of light to emit 
+
+    :type: float
+    '''
+
+    game_settings: 'MaterialGameSettings' = None
+    '''Game material settings 
+
+    :type: 'MaterialGameSettings'
+    '''
+
+    halo: 'MaterialHalo' = None
+    '''Halo settings for the material 
+
+    :type: 'MaterialHalo'
+    '''
+
+    invert_z: bool = None
+    '''Render material’s faces with an inverted Z buffer (scanline only) 
+
+    :type: bool
+    '''
+
+    light_group: 'Group' = None
+    '''Limit lighting to lamps in this Group 
+
+    :type: 'Group'
+    '''
+
+    line_color: float = None
+    '''Line color used for Freestyle line rendering 
+
+    :type: float
+    '''
+
+    line_priority: int = None
+    '''The line color of a higher priority is used at material boundaries 
+
+    :type: int
+    '''
+
+    mirror_color: float = None
+    '''Mirror color of the material 
+
+    :type: float
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Node tree for node based materials 
+
+    :type: 'NodeTree'
+    '''
+
+    offset_z: float = None
+    '''Give faces an artificial offset in the Z buffer for Z transparency 
+
+    :type: float
+    '''
+
+    paint_active_slot: int = None
+    '''Index of active texture paint slot 
+
+    :type: int
+    '''
+
+    paint_clone_slot: int = None
+    '''Index of clone texture paint slot 
+
+    :type: int
+    '''
+
+    pass_index: int = None
+    '''Index number for the “Material Index” render pass 
+
+    :type: int
+    '''
+
+    physics: 'MaterialPhysics' = None
+    '''Game physics settings 
+
+    :type: 'MaterialPhysics'
+    '''
+
+    preview_render_type: typing.Union[int, str] = None
+    '''Type of preview render 
+
+    :type: typing.Union[int, str]
+    '''
+
+    raytrace_mirror: 'MaterialRaytraceMirror' = None
+    '''Raytraced reflection settings for the material 
+
+    :type: 'MaterialRaytraceMirror'
+    '''
+
+    raytrace_transparency: 'MaterialRaytraceTransparency' = None
+    '''Raytraced transparency settings for the material 
+
+    :type: 'MaterialRaytraceTransparency'
+    '''
+
+    roughness: float = None
+    '''Oren-Nayar Roughness 
+
+    :type: float
+    '''
+
+    shadow_buffer_bias: float = None
+    '''Factor to multiply shadow buffer bias with (0 is ignore) 
+
+    :type: float
+    '''
+
+    shadow_cast_alpha: float = None
+    '''Shadow casting alpha, in use for Irregular and Deep shadow buffer 
+
+    :type: float
+    '''
+
+    shadow_only_type: typing.Union[int, str] = None
+    '''How to draw shadows 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_bias: float = None
+    '''Shadow raytracing bias to prevent terminator problems on shadow boundary 
+
+    :type: float
+    '''
+
+    specular_alpha: float = None
+    '''Alpha transparency for specular areas 
+
+    :type: float
+    '''
+
+    specular_color: float = None
+    '''Specular color of the material 
+
+    :type: float
+    '''
+
+    specular_hardness: int = None
+    '''How hard (sharp) the specular reflection is 
+
+    :type: int
+    '''
+
+    specular_intensity: float = None
+    '''How intense (bright) the specular reflection is 
+
+    :type: float
+    '''
+
+    specular_ior: float = None
+    '''Specular index of refraction 
+
+    :type: float
+    '''
+
+    specular_ramp: 'ColorRamp' = None
+    '''Color ramp used to affect specular shading 
+
+    :type: 'ColorRamp'
+    '''
+
+    specular_ramp_blend: typing.Union[int, str] = None
+    '''Blending method of the ramp and the specular color 
+
+    :type: typing.Union[int, str]
+    '''
+
+    specular_ramp_factor: float = None
+    '''Blending factor (also uses alpha in Colorband) 
+
+    :type: float
+    '''
+
+    specular_ramp_input: typing.Union[int, str] = None
+    '''How the ramp maps on the surface 
+
+    :type: typing.Union[int, str]
+    '''
+
+    specular_shader: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    specular_slope: float = None
+    '''The standard deviation of surface slope 
+
+    :type: float
+    '''
+
+    specular_toon_size: float = None
+    '''Size of specular toon area 
+
+    :type: float
+    '''
+
+    specular_toon_smooth: float = None
+    '''Smoothness of specular toon area 
+
+    :type: float
+    '''
+
+    strand: 'MaterialStrand' = None
+    '''Strand settings for the material 
+
+    :type: 'MaterialStrand'
+    '''
+
+    subsurface_scattering: 'MaterialSubsurfaceScattering' = None
+    '''Subsurface scattering settings for the material 
+
+    :type: 'MaterialSubsurfaceScattering'
+    '''
+
+    texture_paint_images: typing.List['Image'] = None
+    '''Texture images used for texture painting 
+
+    :type: typing.List['Image']
+    '''
+
+    texture_paint_slots: typing.List['TexPaintSlot'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['TexPaintSlot']
+    '''
+
+    texture_slots: typing.List['MaterialTextureSlot'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['MaterialTextureSlot']
+    '''
+
+    translucency: float = None
+    '''Amount of diffuse shading on the back side 
+
+    :type: float
+    '''
+
+    transparency_method: typing.Union[int, str] = None
+    '''Method to use for rendering transparency 
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Material type defining how the object is rendered 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_cast_approximate: bool = None
+    '''Allow this material to cast shadows when using approximate ambient occlusion 
+
+    :type: bool
+    '''
+
+    use_cast_buffer_shadows: bool = None
+    '''Allow this material to cast shadows from shadow buffer lamps 
+
+    :type: bool
+    '''
+
+    use_cast_shadows: bool = None
+    '''Allow this material to cast shadows 
+
+    :type: bool
+    '''
+
+    use_cast_shadows_only: bool = None
+    '''Make objects with this material appear invisible (not rendered), only casting shadows 
+
+    :type: bool
+    '''
+
+    use_cubic: bool = None
+    '''Use cubic interpolation for diffuse values, for smoother transitions 
+
+    :type: bool
+    '''
+
+    use_diffuse_ramp: bool = None
+    '''Toggle diffuse ramp operations 
+
+    :type: bool
+    '''
+
+    use_face_texture: bool = None
+    '''Replace the object’s base color with color from UV map image textures 
+
+    :type: bool
+    '''
+
+    use_face_texture_alpha: bool = None
+    '''Replace the object’s base alpha value with alpha from UV map image textures 
+
+    :type: bool
+    '''
+
+    use_full_oversampling: bool = None
+    '''Force this material to render full shading/textures for all anti-aliasing samples 
+
+    :type: bool
+    '''
+
+    use_light_group_exclusive: bool = None
+    '''Material uses the light group exclusively - these lamps are excluded from other scene lighting 
+
+    :type: bool
+    '''
+
+    use_light_group_local: bool = None
+    '''When linked in, material uses local light group with the same name 
+
+    :type: bool
+    '''
+
+    use_mist: bool = None
+    '''Use mist with this material (in world settings) 
+
+    :type: bool
+    '''
+
+    use_nodes: bool = None
+    '''Use shader nodes to render the material 
+
+    :type: bool
+    '''
+
+    use_object_color: bool = None
+    '''Modulate the result with a per-object color 
+
+    :type: bool
+    '''
+
+    use_only_shadow: bool = None
+    '''Render shadows as the material’s alpha value, making the material transparent except for shadowed areas 
+
+    :type: bool
+    '''
+
+    use_ray_shadow_bias: bool = None
+    '''Prevent raytraced shadow errors on surfaces with smooth shaded normals (terminator problem) 
+
+    :type: bool
+    '''
+
+    use_raytrace: bool = None
+    '''Include this material and geometry that uses it in raytracing calculations 
+
+    :type: bool
+    '''
+
+    use_shadeless: bool = None
+    '''Make this material insensitive to light or shadow 
+
+    :type: bool
+    '''
+
+    use_shadows: bool = None
+    '''Allow this material to receive shadows 
+
+    :type: bool
+    '''
+
+    use_sky: bool = None
+    '''Render this material with zero alpha, with sky background in place (scanline only) 
+
+    :type: bool
+    '''
+
+    use_specular_ramp: bool = None
+    '''Toggle specular ramp operations 
+
+    :type: bool
+    '''
+
+    use_tangent_shading: bool = None
+    '''Use the material’s tangent vector instead of the normal for shading - for anisotropic shading effects 
+
+    :type: bool
+    '''
+
+    use_textures: bool = None
+    '''Enable/Disable each texture 
+
+    :type: bool
+    '''
+
+    use_transparency: bool = None
+    '''Render material as transparent 
+
+    :type: bool
+    '''
+
+    use_transparent_shadows: bool = None
+    '''Allow this object to receive transparent shadows cast through other objects 
+
+    :type: bool
+    '''
+
+    use_uv_project: bool = None
+    '''Use to ensure UV interpolation is correct for camera projections (use with UV project modifier) 
+
+    :type: bool
+    '''
+
+    use_vertex_color_light: bool = None
+    '''Add vertex colors as additional lighting 
+
+    :type: bool
+    '''
+
+    use_vertex_color_paint: bool = None
+    '''Replace object base color with vertex colors (multiply with ‘texture face’ face assigned textures) 
+
+    :type: bool
+    '''
+
+    volume: 'MaterialVolume' = None
+    '''Volume settings for the material 
+
+    :type: 'MaterialVolume'
+    '''
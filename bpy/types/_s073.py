@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MaterialGameSettings:
+    '''Game Engine settings for a Material data-block '''
+
+    alpha_blend: typing.Union[int, str] = None
+    '''Blend Mode for Transparent Faces 
+
+    :type: typing.Union[int, str]
+    '''
+
+    face_orientation: typing.Union[int, str] = None
+    '''Especial face orientation options 
+
+    :type: typing.Union[int, str]
+    '''
+
+    invisible: bool = None
+    '''Make face invisible 
+
+    :type: bool
+    '''
+
+    physics: bool = None
+    '''Use physics properties of materials 
+
+    :type: bool
+    '''
+
+    text: bool = None
+    '''Use material as text in Game Engine 
+
+    :type: bool
+    '''
+
+    use_backface_culling: bool = None
+    '''Hide Back of the face in Game Engine 
+
+    :type: bool
+    '''
+
+
+class MaterialHalo:
+    '''Halo particle effect settings for a Material data-block '''
+
+    add: float = None
+    '''Strength of the add effect 
+
+    :type: float
+    '''
+
+    flare_boost: float = None
+    '''Give the flare extra strength 
+
+    :type: float
+    '''
+
+    flare_seed: int = None
+    '''Offset in the flare seed table 
+
+    :type: int
+    '''
+
+    flare_size: float = None
+    '''Factor by which the flare is larger than the halo 
+
+    :type: float
+    '''
+
+    flare_subflare_count: int = None
+    '''Number of sub-flares 
+
+    :type: int
+    '''
+
+    flare_subflare_size: float = None
+    '''Dimension of the sub-flares, dots and circles 
+
+    :type: float
+    '''
+
+    hardness: int = None
+    '''Hardness of the halo 
+
+    :type: int
+    '''
+
+    line_count: int = None
+    '''Number of star shaped lines rendered over the halo 
+
+    :type: int
+    '''
+
+    ring_count: int = None
+    '''Number of rings rendered over the halo 
+
+    :type: int
+    '''
+
+    seed: int = None
+    '''Randomize ring dimension and line location 
+
+    :type: int
+    '''
+
+    size: float = None
+    '''Dimension of the halo 
+
+    :type: float
+    '''
+
+    star_tip_count: int = None
+    '''Number of points on the star shaped halo 
+
+    :type: int
+    '''
+
+    use_extreme_alpha: bool = None
+    '''Use extreme alpha 
+
+    :type: bool
+    '''
+
+    use_flare_mode: bool = None
+    '''Render halo as a lens flare 
+
+    :type: bool
+    '''
+
+    use_lines: bool = None
+    '''Render star shaped lines over halo 
+
+    :type: bool
+    '''
+
+    use_ring: bool = None
+    '''Render rings over halo 
+
+    :type: bool
+    '''
+
+    use_shaded: bool = None
+    '''Let halo receive light and shadows from external objects 
+
+    :type: bool
+    '''
+
+    use_soft: bool = None
+    '''Soften the edges of halos at intersections with other geometry 
+
+    :type: bool
+    '''
+
+    use_star: bool = None
+    '''Render halo as a star 
+
+    :type: bool
+    '''
+
+    use_texture: bool = None
+    '''Give halo a texture 
+
+    :type: bool
+    '''
+
+    use_vertex_normal: bool = None
+    '''Use the vertex normal to specify the dimension of the halo 
+
+    :type: bool
+    '''
+
+
+class MaterialPhysics:
+    '''Physics settings for a Material data-block '''
+
+    elasticity: float = None
+    '''Elasticity of collisions 
+
+    :type: float
+    '''
+
+    fh_damping: float = None
+    '''Damping of the spring force, when inside the physics distance area 
+
+    :type: float
+    '''
+
+    fh_distance: float = None
+    '''Distance of the physics area 
+
+    :type: float
+    '''
+
+    fh_force: float = None
+    '''Upward spring force, when inside the physics distance area 
+
+    :type: float
+    '''
+
+    friction: float = None
+    '''Coulomb friction coefficient, when inside the physics distance area 
+
+    :type: float
+    '''
+
+    use_fh_normal: bool = None
+    '''Align dynamic game objects along the surface normal, when inside the physics distance area 
+
+    :type: bool
+    '''
+
+
+class MaterialRaytraceMirror:
+    '''Raytraced reflection settings for a Material data-block '''
+
+    depth: int = None
+    '''Maximum allowed number of light inter-reflections 
+
+    :type: int
+    '''
+
+    distance: float = None
+    '''Maximum distance of reflected rays (reflections further than this range fade to sky color or material color) 
+
+    :type: float
+    '''
+
+    fade_to: typing.Union[int, str] = None
+    '''The color that rays with no intersection within the Max Distance take (material color can be best for indoor scenes, sky color for outdoor) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    fresnel: float = None
+    '''Power of Fresnel for mirror reflection 
+
+    :type: float
+    '''
+
+    fresnel_factor: float = None
+    '''Blending factor for Fresnel 
+
+    :type: float
+    '''
+
+    gloss_anisotropic: float = None
+    '''The shape of the reflection, from 0.0 (circular) to 1.0 (fully stretched along the tangent 
+
+    :type: float
+    '''
+
+    gloss_factor: float = None
+    '''The shininess of the reflection (values < 1.0 give diffuse, blurry reflections) 
+
+    :type: float
+    '''
+
+    gloss_samples: int = None
+    '''Number of cone samples averaged for blurry reflections 
+
+    :type: int
+    '''
+
+    gloss_threshold: float = None
+    '''Threshold for adaptive sampling (if a sample contributes less than this amount [as a percentage], sampling is stopped) 
+
+    :type: float
+    '''
+
+    reflect_factor: float = None
+    '''Amount of mirror reflection for raytrace 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Enable raytraced reflections 
+
+    :type: bool
+    '''
+
+
+class MaterialRaytraceTransparency:
+    '''Raytraced refraction settings for a Material data-block '''
+
+    depth: int = None
+    '''Maximum allowed number of light inter-refractions 
+
+    :type: int
+    '''
+
+    depth_max: float = None
+    '''Maximum depth for light to travel through the transparent material before becoming fully filtered (0.0 is disabled) 
+
+    :type: float
+    '''
+
+    falloff: float = None
+    '''Falloff power for transmissivity filter effect (1.0 is linear) 
+
+    :type: float
+    '''
+
+    filter: float = None
+    '''Amount to blend in the material’s diffuse color in raytraced transparency (simulating absorption) 
+
+    :type: float
+    '''
+
+    fresnel: float = None
+    '''Power of Fresnel for transparency (Ray or ZTransp) 
+
+    :type: float
+    '''
+
+    fresnel_factor: float = None
+    '''Blending factor for Fresnel 
+
+    :type: float
+    '''
+
+    gloss_factor: float = None
+    '''The clarity of the refraction. Values < 1.0 give diffuse, blurry refractions 
+
+    :type: float
+    '''
+
+    gloss_samples: int = None
+    '''Number of cone samples averaged for blurry refractions 
+
+    :type: int
+    '''
+
+    gloss_threshold: float = None
+    '''Threshold for adaptive sampling. If a sample contributes less than this amount (as a percentage), sampling is stopped 
+
+    :type: float
+    '''
+
+    ior: float = None
+    '''Angular index of refraction for raytraced refraction 
+
+    :type: float
+    '''
+
+
+class MaterialSlot:
+    '''Material slot in an object '''
+
+    link: typing.Union[int, str] = None
+    '''Link material to object or the object’s data 
+
+    :type: typing.Union[int, str]
+    '''
+
+    material: 'Material' = None
+    '''Material data-block used by this material slot 
+
+    :type: 'Material'
+    '''
+
+    name: str = None
+    '''Material slot name 
+
+    :type: str
+    '''
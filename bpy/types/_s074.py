@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MaterialStrand:
+    '''Strand settings for a Material data-block '''
+
+    blend_distance: float = None
+    '''Worldspace distance over which to blend in the surface normal 
+
+    :type: float
+    '''
+
+    root_size: float = None
+    '''Start size of strands in pixels or Blender units 
+
+    :type: float
+    '''
+
+    shape: float = None
+    '''Positive values make strands rounder, negative ones make strands spiky 
+
+    :type: float
+    '''
+
+    size_min: float = None
+    '''Minimum size of strands in pixels 
+
+    :type: float
+    '''
+
+    tip_size: float = None
+    '''End size of strands in pixels or Blender units 
+
+    :type: float
+    '''
+
+    use_blender_units: bool = None
+    '''Use Blender units for widths instead of pixels 
+
+    :type: bool
+    '''
+
+    use_surface_diffuse: bool = None
+    '''Make diffuse shading more similar to shading the surface 
+
+    :type: bool
+    '''
+
+    use_tangent_shading: bool = None
+    '''Use direction of strands as normal for tangent-shading 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''Name of UV map to override 
+
+    :type: str
+    '''
+
+    width_fade: float = None
+    '''Transparency along the width of the strand 
+
+    :type: float
+    '''
+
+
+class MaterialSubsurfaceScattering:
+    '''Diffuse subsurface scattering settings for a Material data-block '''
+
+    back: float = None
+    '''Back scattering weight 
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Scattering color 
+
+    :type: float
+    '''
+
+    color_factor: float = None
+    '''Blend factor for SSS colors 
+
+    :type: float
+    '''
+
+    error_threshold: float = None
+    '''Error tolerance (low values are slower and higher quality) 
+
+    :type: float
+    '''
+
+    front: float = None
+    '''Front scattering weight 
+
+    :type: float
+    '''
+
+    ior: float = None
+    '''Index of refraction (higher values are denser) 
+
+    :type: float
+    '''
+
+    radius: float = None
+    '''Mean red/green/blue scattering path length 
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''Object scale factor 
+
+    :type: float
+    '''
+
+    texture_factor: float = None
+    '''Texture scattering blend factor 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Enable diffuse subsurface scattering effects in a material 
+
+    :type: bool
+    '''
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MaterialTextureSlot:
+    '''Texture slot for textures in a Material data-block '''
+
+    alpha_factor: float = None
+    '''Amount texture affects alpha 
+
+    :type: float
+    '''
+
+    ambient_factor: float = None
+    '''Amount texture affects ambient 
+
+    :type: float
+    '''
+
+    bump_method: typing.Union[int, str] = None
+    '''Method to use for bump mapping 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bump_objectspace: typing.Union[int, str] = None
+    '''Space to apply bump mapping in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    density_factor: float = None
+    '''Amount texture affects density 
+
+    :type: float
+    '''
+
+    diffuse_color_factor: float = None
+    '''Amount texture affects diffuse color 
+
+    :type: float
+    '''
+
+    diffuse_factor: float = None
+    '''Amount texture affects diffuse reflectivity 
+
+    :type: float
+    '''
+
+    displacement_factor: float = None
+    '''Amount texture displaces the surface 
+
+    :type: float
+    '''
+
+    emission_color_factor: float = None
+    '''Amount texture affects emission color 
+
+    :type: float
+    '''
+
+    emission_factor: float = None
+    '''Amount texture affects emission 
+
+    :type: float
+    '''
+
+    emit_factor: float = None
+    '''Amount texture affects emission 
+
+    :type: float
+    '''
+
+    hardness_factor: float = None
+    '''Amount texture affects hardness 
+
+    :type: float
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_x: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_y: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_z: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mirror_factor: float = None
+    '''Amount texture affects mirror color 
+
+    :type: float
+    '''
+
+    normal_factor: float = None
+    '''Amount texture affects normal values 
+
+    :type: float
+    '''
+
+    normal_map_space: typing.Union[int, str] = None
+    '''Set space of normal map image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object to use for mapping with Object texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    raymir_factor: float = None
+    '''Amount texture affects ray mirror 
+
+    :type: float
+    '''
+
+    reflection_color_factor: float = None
+    '''Amount texture affects color of out-scattered light 
+
+    :type: float
+    '''
+
+    reflection_factor: float = None
+    '''Amount texture affects brightness of out-scattered light 
+
+    :type: float
+    '''
+
+    scattering_factor: float = None
+    '''Amount texture affects scattering 
+
+    :type: float
+    '''
+
+    specular_color_factor: float = None
+    '''Amount texture affects specular color 
+
+    :type: float
+    '''
+
+    specular_factor: float = None
+    '''Amount texture affects specular reflectivity 
+
+    :type: float
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    translucency_factor: float = None
+    '''Amount texture affects translucency 
+
+    :type: float
+    '''
+
+    transmission_color_factor: float = None
+    '''Amount texture affects result color after light has been scattered/absorbed 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Enable this material texture slot 
+
+    :type: bool
+    '''
+
+    use_from_dupli: bool = None
+    '''Dupli’s instanced from verts, faces or particles, inherit texture coordinate from their parent 
+
+    :type: bool
+    '''
+
+    use_from_original: bool = None
+    '''Dupli’s derive their object coordinates from the original object’s transformation 
+
+    :type: bool
+    '''
+
+    use_map_alpha: bool = None
+    '''The texture affects the alpha value 
+
+    :type: bool
+    '''
+
+    use_map_ambient: bool = None
+    '''The texture affects the value of ambient 
+
+    :type: bool
+    '''
+
+    use_map_color_diffuse: bool = None
+    '''The texture affects basic color of the material 
+
+    :type: bool
+    '''
+
+    use_map_color_emission: bool = None
+    '''The texture affects the color of emission 
+
+    :type: bool
+    '''
+
+    use_map_color_reflection: bool = None
+    '''The texture affects the color of scattered light 
+
+    :type: bool
+    '''
+
+    use_map_color_spec: bool = None
+    '''The texture affects the specularity color 
+
+    :type: bool
+    '''
+
+    use_map_color_transmission: bool = None
+    '''The texture affects the result color after other light has been scattered/absorbed 
+
+    :type: bool
+    '''
+
+    use_map_density: bool = None
+    '''The texture affects the volume’s density 
+
+    :type: bool
+    '''
+
+    use_map_diffuse: bool = None
+    '''The texture affects the value of diffuse reflectivity 
+
+    :type: bool
+    '''
+
+    use_map_displacement: bool = None
+    '''Let the texture displace the surface 
+
+    :type: bool
+    '''
+
+    use_map_emission: bool = None
+    '''The texture affects the volume’s emission 
+
+    :type: bool
+    '''
+
+    use_map_emit: bool = None
+    '''The texture affects the emit value 
+
+    :type: bool
+    '''
+
+    use_map_hardness: bool = None
+    '''The texture affects the hardness value 
+
+    :type: bool
+    '''
+
+    use_map_mirror: bool = None
+    '''The texture affects the mirror color 
+
+    :type: bool
+    '''
+
+    use_map_normal: bool = None
+    '''The texture affects the rendered normal 
+
+    :type: bool
+    '''
+
+    use_map_raymir: bool = None
+    '''The texture affects the ray-mirror value 
+
+    :type: bool
+    '''
+
+    use_map_reflect: bool = None
+    '''The texture affects the reflected light’s brightness 
+
+    :type: bool
+    '''
+
+    use_map_scatter: bool = None
+    '''The texture affects the volume’s scattering 
+
+    :type: bool
+    '''
+
+    use_map_specular: bool = None
+    '''The texture affects the value of specular reflectivity 
+
+    :type: bool
+    '''
+
+    use_map_to_bounds: bool = None
+    '''Map coordinates in object bounds 
+
+    :type: bool
+    '''
+
+    use_map_translucency: bool = None
+    '''The texture affects the translucency value 
+
+    :type: bool
+    '''
+
+    use_map_warp: bool = None
+    '''Let the texture warp texture coordinates of next channels 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map to use for mapping with UV texture coordinates 
+
+    :type: str
+    '''
+
+    warp_factor: float = None
+    '''Amount texture affects texture coordinates of next channels 
+
+    :type: float
+    '''
+
+
+class MaterialTextureSlots:
+    '''Collection of texture slots '''
+
+    pass
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MaterialVolume:
+    '''Volume rendering settings for a Material data-block '''
+
+    asymmetry: float = None
+    '''Back scattering (-1.0) to Forward scattering (1.0) and the range in between 
+
+    :type: float
+    '''
+
+    cache_resolution: int = None
+    '''Resolution of the voxel grid, low resolutions are faster, high resolutions use more memory 
+
+    :type: int
+    '''
+
+    density: float = None
+    '''The base density of the volume 
+
+    :type: float
+    '''
+
+    density_scale: float = None
+    '''Multiplier for the material’s density 
+
+    :type: float
+    '''
+
+    depth_threshold: float = None
+    '''Stop ray marching early if transmission drops below this luminance - higher values give speedups in dense volumes at the expense of accuracy 
+
+    :type: float
+    '''
+
+    emission: float = None
+    '''Amount of light that gets emitted by the volume 
+
+    :type: float
+    '''
+
+    emission_color: float = None
+    '''Color of emitted light 
+
+    :type: float
+    '''
+
+    light_method: typing.Union[int, str] = None
+    '''Method of shading, attenuating, and scattering light through the volume 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ms_diffusion: float = None
+    '''Diffusion factor, the strength of the blurring effect 
+
+    :type: float
+    '''
+
+    ms_intensity: float = None
+    '''Multiplier for multiple scattered light energy 
+
+    :type: float
+    '''
+
+    ms_spread: float = None
+    '''Proportional distance over which the light is diffused 
+
+    :type: float
+    '''
+
+    reflection: float = None
+    '''Multiplier to make out-scattered light brighter or darker (non-physically correct) 
+
+    :type: float
+    '''
+
+    reflection_color: float = None
+    '''Color of light scattered out of the volume (does not affect transmission) 
+
+    :type: float
+    '''
+
+    scattering: float = None
+    '''Amount of light that gets scattered out by the volume - the more out-scattering, the shallower the light will penetrate 
+
+    :type: float
+    '''
+
+    step_method: typing.Union[int, str] = None
+    '''Method of calculating the steps through the volume 
+
+    :type: typing.Union[int, str]
+    '''
+
+    step_size: float = None
+    '''Distance between subsequent volume depth samples 
+
+    :type: float
+    '''
+
+    transmission_color: float = None
+    '''Result color of the volume, after other light has been scattered/absorbed 
+
+    :type: float
+    '''
+
+    use_external_shadows: bool = None
+    '''Receive shadows from sources outside the volume (temporary) 
+
+    :type: bool
+    '''
+
+    use_light_cache: bool = None
+    '''Pre-calculate the shading information into a voxel grid, speeds up shading at slightly less accuracy 
+
+    :type: bool
+    '''
+
+
+class Menu:
+    '''Editor menu containing buttons '''
+
+    bl_description: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''If this is set, the menu gets a custom ID, otherwise it takes the name of the class used to define the menu (for example, if the class name is “OBJECT_MT_hello”, and bl_idname is not set by the script, then bl_idname = “OBJECT_MT_hello”) 
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''The menu label 
+
+    :type: str
+    '''
+
+    bl_translation_context: str = None
+    '''
+
+    :type: str
+    '''
+
+    layout: 'UILayout' = None
+    '''Defines the structure of the menu in the UI 
+
+    :type: 'UILayout'
+    '''
+
+    def draw(self, context):
+        '''Draw UI elements into the menu UI layout 
+
+        '''
+        pass
+
+    def draw_preset(self, context):
+        '''Optionally: - preset_extensions (set of strings) - preset_operator_defaults (dict of keyword args) 
+
+        '''
+        pass
+
+    def path_menu(self,
+                  searchpaths: list,
+                  operator: str,
+                  *,
+                  props_default: dict = None,
+                  prop_filepath: str = 'filepath',
+                  filter_ext: str = None,
+                  filter_path=None,
+                  display_name: str = None):
+        '''Populate a menu from a list of paths. 
+
+        :param searchpaths: Paths to scan. 
+        :type searchpaths: list
+        :param operator: The operator id to use with each file. 
+        :type operator: str
+        :param prop_filepath: Optional operator filepath property (defaults to “filepath”). 
+        :type prop_filepath: str
+        :param props_default: Properties to assign to each operator. 
+        :type props_default: dict
+        :param filter_ext: Optional callback that takes the file extensions.Returning false excludes the file from the list. 
+        :type filter_ext: str
+        :param display_name: Optional callback that takes the full path, returns the name to display. 
+        :type display_name: str
+        '''
+        pass
@@ -0,0 +1,578 @@
+from __future__ import annotations
+
+import sys
+import bpy
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Mesh:
+    '''Mesh data-block defining geometric surfaces '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    auto_smooth_angle: float = None
+    '''Maximum angle between face normals that will be considered as smooth (unused if custom split normals data are available) 
+
+    :type: float
+    '''
+
+    auto_texspace: bool = None
+    '''Adjust active object’s texture space automatically when transforming object 
+
+    :type: bool
+    '''
+
+    cycles: 'CyclesMeshSettings' = None
+    '''Cycles mesh settings 
+
+    :type: 'CyclesMeshSettings'
+    '''
+
+    edges: typing.List['MeshEdge'] = None
+    '''Edges of the mesh 
+
+    :type: typing.List['MeshEdge']
+    '''
+
+    has_custom_normals: bool = None
+    '''True if there are custom split normals data in this mesh 
+
+    :type: bool
+    '''
+
+    is_editmode: bool = None
+    '''True when used in editmode 
+
+    :type: bool
+    '''
+
+    loops: typing.List['MeshLoops'] = None
+    '''Loops of the mesh (polygon corners) 
+
+    :type: typing.List['MeshLoops']
+    '''
+
+    materials: typing.List['Material'] = None
+    '''
+
+    :type: typing.List['Material']
+    '''
+
+    polygon_layers_float: typing.List['MeshPolygonFloatPropertyLayer'] = None
+    '''
+
+    :type: typing.List['MeshPolygonFloatPropertyLayer']
+    '''
+
+    polygon_layers_int: typing.List['MeshPolygonIntPropertyLayer'] = None
+    '''
+
+    :type: typing.List['MeshPolygonIntPropertyLayer']
+    '''
+
+    polygon_layers_string: typing.List['MeshPolygonStringPropertyLayer'] = None
+    '''
+
+    :type: typing.List['MeshPolygonStringPropertyLayer']
+    '''
+
+    polygons: typing.List['MeshPolygons'] = None
+    '''Polygons of the mesh 
+
+    :type: typing.List['MeshPolygons']
+    '''
+
+    shape_keys: 'Key' = None
+    '''
+
+    :type: 'Key'
+    '''
+
+    show_double_sided: bool = None
+    '''Display the mesh with double or single sided lighting (OpenGL only) 
+
+    :type: bool
+    '''
+
+    show_edge_bevel_weight: bool = None
+    '''Display weights created for the Bevel modifier 
+
+    :type: bool
+    '''
+
+    show_edge_crease: bool = None
+    '''Display creases created for Subdivision Surface modifier 
+
+    :type: bool
+    '''
+
+    show_edge_seams: bool = None
+    '''Display UV unwrapping seams 
+
+    :type: bool
+    '''
+
+    show_edge_sharp: bool = None
+    '''Display sharp edges, used with the Edge Split modifier 
+
+    :type: bool
+    '''
+
+    show_edges: bool = None
+    '''Display selected edges using highlights in the 3D view and UV editor 
+
+    :type: bool
+    '''
+
+    show_extra_edge_angle: bool = None
+    '''Display selected edge angle, using global values when set in the transform panel 
+
+    :type: bool
+    '''
+
+    show_extra_edge_length: bool = None
+    '''Display selected edge lengths, using global values when set in the transform panel 
+
+    :type: bool
+    '''
+
+    show_extra_face_angle: bool = None
+    '''Display the angles in the selected edges, using global values when set in the transform panel 
+
+    :type: bool
+    '''
+
+    show_extra_face_area: bool = None
+    '''Display the area of selected faces, using global values when set in the transform panel 
+
+    :type: bool
+    '''
+
+    show_extra_indices: bool = None
+    '''Display the index numbers of selected vertices, edges, and faces 
+
+    :type: bool
+    '''
+
+    show_faces: bool = None
+    '''Display all faces as shades in the 3D view and UV editor 
+
+    :type: bool
+    '''
+
+    show_freestyle_edge_marks: bool = None
+    '''Display Freestyle edge marks, used with the Freestyle renderer 
+
+    :type: bool
+    '''
+
+    show_freestyle_face_marks: bool = None
+    '''Display Freestyle face marks, used with the Freestyle renderer 
+
+    :type: bool
+    '''
+
+    show_normal_face: bool = None
+    '''Display face normals as lines 
+
+    :type: bool
+    '''
+
+    show_normal_loop: bool = None
+    '''Display vertex-per-face normals as lines 
+
+    :type: bool
+    '''
+
+    show_normal_vertex: bool = None
+    '''Display vertex normals as lines 
+
+    :type: bool
+    '''
+
+    show_statvis: bool = None
+    '''Display statistical information about the mesh 
+
+    :type: bool
+    '''
+
+    show_weight: bool = None
+    '''Draw weights in editmode 
+
+    :type: bool
+    '''
+
+    skin_vertices: typing.List['MeshSkinVertexLayer'] = None
+    '''All skin vertices 
+
+    :type: typing.List['MeshSkinVertexLayer']
+    '''
+
+    tessface_uv_textures: typing.List['TessfaceUVTextures'] = None
+    '''All UV maps for tessellated faces (read-only, for use by renderers) 
+
+    :type: typing.List['TessfaceUVTextures']
+    '''
+
+    tessface_vertex_colors: typing.List['VertexColors'] = None
+    '''All tessellated face colors (read-only, for use by renderers) 
+
+    :type: typing.List['VertexColors']
+    '''
+
+    tessfaces: typing.List['MeshTessFaces'] = None
+    '''Tessellated faces of the mesh (derived from polygons) 
+
+    :type: typing.List['MeshTessFaces']
+    '''
+
+    texco_mesh: 'Mesh' = None
+    '''Derive texture coordinates from another mesh 
+
+    :type: 'Mesh'
+    '''
+
+    texspace_location: float = None
+    '''Texture space location 
+
+    :type: float
+    '''
+
+    texspace_size: float = None
+    '''Texture space size 
+
+    :type: float
+    '''
+
+    texture_mesh: 'Mesh' = None
+    '''Use another mesh for texture indices (vertex indices must be aligned) 
+
+    :type: 'Mesh'
+    '''
+
+    total_edge_sel: int = None
+    '''Selected edge count in editmode 
+
+    :type: int
+    '''
+
+    total_face_sel: int = None
+    '''Selected face count in editmode 
+
+    :type: int
+    '''
+
+    total_vert_sel: int = None
+    '''Selected vertex count in editmode 
+
+    :type: int
+    '''
+
+    use_auto_smooth: bool = None
+    '''Auto smooth (based on smooth/sharp faces/edges and angle between faces), or use custom split normals data if available 
+
+    :type: bool
+    '''
+
+    use_auto_texspace: bool = None
+    '''Adjust active object’s texture space automatically when transforming object 
+
+    :type: bool
+    '''
+
+    use_customdata_edge_bevel: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_customdata_edge_crease: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_customdata_vertex_bevel: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_mirror_topology: bool = None
+    '''Use topology based mirroring (for when both sides of mesh have matching, unique topology) 
+
+    :type: bool
+    '''
+
+    use_mirror_x: bool = None
+    '''X Axis mirror editing 
+
+    :type: bool
+    '''
+
+    use_paint_mask: bool = None
+    '''Face selection masking for painting 
+
+    :type: bool
+    '''
+
+    use_paint_mask_vertex: bool = None
+    '''Vertex selection masking for painting (weight paint only) 
+
+    :type: bool
+    '''
+
+    uv_layer_clone: 'MeshUVLoopLayer' = None
+    '''UV loop layer to be used as cloning source 
+
+    :type: 'MeshUVLoopLayer'
+    '''
+
+    uv_layer_clone_index: int = None
+    '''Clone UV loop layer index 
+
+    :type: int
+    '''
+
+    uv_layer_stencil: 'MeshUVLoopLayer' = None
+    '''UV loop layer to mask the painted area 
+
+    :type: 'MeshUVLoopLayer'
+    '''
+
+    uv_layer_stencil_index: int = None
+    '''Mask UV loop layer index 
+
+    :type: int
+    '''
+
+    uv_layers: typing.List['MeshUVLoopLayer'] = None
+    '''All UV loop layers 
+
+    :type: typing.List['MeshUVLoopLayer']
+    '''
+
+    uv_texture_clone: 'MeshTexturePolyLayer' = None
+    '''UV map to be used as cloning source 
+
+    :type: 'MeshTexturePolyLayer'
+    '''
+
+    uv_texture_clone_index: int = None
+    '''Clone UV map index 
+
+    :type: int
+    '''
+
+    uv_texture_stencil: 'MeshTexturePolyLayer' = None
+    '''UV map to mask the painted area 
+
+    :type: 'MeshTexturePolyLayer'
+    '''
+
+    uv_texture_stencil_index: int = None
+    '''Mask UV map index 
+
+    :type: int
+    '''
+
+    uv_textures: typing.List['MeshTexturePolyLayer'] = None
+    '''All UV maps 
+
+    :type: typing.List['MeshTexturePolyLayer']
+    '''
+
+    vertex_colors: typing.List['MeshLoopColorLayer'] = None
+    '''All vertex colors 
+
+    :type: typing.List['MeshLoopColorLayer']
+    '''
+
+    vertex_layers_float: typing.List['MeshVertexFloatPropertyLayer'] = None
+    '''
+
+    :type: typing.List['MeshVertexFloatPropertyLayer']
+    '''
+
+    vertex_layers_int: typing.List['VertexIntProperties'] = None
+    '''
+
+    :type: typing.List['VertexIntProperties']
+    '''
+
+    vertex_layers_string: typing.List['MeshVertexStringPropertyLayer'] = None
+    '''
+
+    :type: typing.List['MeshVertexStringPropertyLayer']
+    '''
+
+    vertex_paint_masks: typing.List['MeshPaintMaskLayer'] = None
+    '''Vertex paint mask 
+
+    :type: typing.List['MeshPaintMaskLayer']
+    '''
+
+    vertices: typing.List['MeshVertex'] = None
+    '''Vertices of the mesh 
+
+    :type: typing.List['MeshVertex']
+    '''
+
+    edge_keys = None
+    '''(readonly) '''
+
+    def transform(self, matrix: float, shape_keys: bool = False):
+        '''Transform mesh vertices by a matrix (Warning: inverts normals if matrix is negative) 
+
+        :param matrix: Matrix 
+        :type matrix: float
+        :param shape_keys: Transform Shape Keys 
+        :type shape_keys: bool
+        '''
+        pass
+
+    def flip_normals(self, ):
+        '''Invert winding of all polygons (clears tessellation, does not handle custom normals) 
+
+        '''
+        pass
+
+    def calc_normals(self, ):
+        '''Calculate vertex normals 
+
+        '''
+        pass
+
+    def create_normals_split(self, ):
+        '''Empty split vertex normals 
+
+        '''
+        pass
+
+    def calc_normals_split(self, ):
+        '''Calculate split vertex normals, which preserve sharp edges 
+
+        '''
+        pass
+
+    def free_normals_split(self, ):
+        '''Free split vertex normals 
+
+        '''
+        pass
+
+    def split_faces(self, free_loop_normals: bool = True):
+        '''Split faces based on the edge angle 
+
+        :param free_loop_normals: Free Loop Notmals, Free loop normals custom data layer 
+        :type free_loop_normals: bool
+        '''
+        pass
+
+    def calc_tangents(self, uvmap: str = ""):
+        '''Compute tangents and bitangent signs, to be used together with the split normals to get a complete tangent space for normal mapping (split normals are also computed if not yet present) 
+
+        :param uvmap: Name of the UV map to use for tangent space computation 
+        :type uvmap: str
+        '''
+        pass
+
+    def free_tangents(self, ):
+        '''Free tangents 
+
+        '''
+        pass
+
+    def calc_tessface(self, free_mpoly: bool = False):
+        '''Calculate face tessellation (supports editmode too) 
+
+        :param free_mpoly: Free MPoly, Free data used by polygons and loops. WARNING: This destructive operation removes regular faces, only used on temporary mesh data-blocks to reduce memory footprint of render engines and export scripts 
+        :type free_mpoly: bool
+        '''
+        pass
+
+    def calc_smooth_groups(self, use_bitflags: bool = False):
+        '''Calculate smooth groups from sharp edges 
+
+        :param use_bitflags: Produce bitflags groups instead of simple numeric values 
+        :type use_bitflags: bool
+        '''
+        pass
+
+    def normals_split_custom_set(self, normals: float):
+        '''Define custom split normals of this mesh (use zero-vectors to keep auto ones) 
+
+        :param normals: Normals 
+        :type normals: float
+        '''
+        pass
+
+    def normals_split_custom_set_from_vertices(self, normals: float):
+        '''Define custom split normals of this mesh, from vertices’ normals (use zero-vectors to keep auto ones) 
+
+        :param normals: Normals 
+        :type normals: float
+        '''
+        pass
+
+    def update(self, calc_edges: bool = False, calc_tessface: bool = False):
+        '''update 
+
+        :param calc_edges: Calculate Edges, Force recalculation of edges 
+        :type calc_edges: bool
+        :param calc_tessface: Calculate Tessellation, Force recalculation of tessellation faces 
+        :type calc_tessface: bool
+        '''
+        pass
+
+    def unit_test_compare(self, mesh: 'Mesh' = None) -> str:
+        '''unit_test_compare 
+
+        :param mesh: Mesh to compare to 
+        :type mesh: 'Mesh'
+        :rtype: str
+        :return:  Return value, String description of result of comparison 
+        '''
+        pass
+
+    def validate(self, verbose: bool = False,
+                 clean_customdata: bool = True) -> bool:
+        '''Validate geometry, return True when the mesh has had invalid geometry corrected/removed 
+
+        :param verbose: Verbose, Output information about the errors found 
+        :type verbose: bool
+        :param clean_customdata: Clean Custom Data, Remove temp/cached custom-data layers, like e.g. normals… 
+        :type clean_customdata: bool
+        :rtype: bool
+        :return:  Result 
+        '''
+        pass
+
+    def validate_material_indices(self, ) -> bool:
+        '''Validate material indices of polygons, return True when the mesh has had invalid indices corrected (to default 0) 
+
+        :rtype: bool
+        :return:  Result 
+        '''
+        pass
+
+    def from_pydata(self, vertices: 'bpy.context.object',
+                    edges: 'bpy.context.object', faces: 'bpy.context.object'):
+        '''Make a mesh from a list of vertices/edges/faces Until we have a nicer way to make geometry, use this. 
+
+        :param vertices: float triplets each representing (X, Y, Z) eg: [(0.0, 1.0, 0.5), …]. 
+        :type vertices: 'bpy.context.object'
+        :param edges: int pairs, each pair contains two indices to the vertices argument. eg: [(1, 2), …] 
+        :type edges: 'bpy.context.object'
+        :param faces: iterator of faces, each faces contains three or more indices to the vertices argument. eg: [(5, 6, 8, 9), (1, 2, 3), …] 
+        :type faces: 'bpy.context.object'
+        '''
+        pass
@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MeshCacheModifier:
+    '''Cache Mesh '''
+
+    cache_format: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    deform_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    eval_factor: float = None
+    '''Evaluation time in seconds 
+
+    :type: float
+    '''
+
+    eval_frame: float = None
+    '''The frame to evaluate (starting at 0) 
+
+    :type: float
+    '''
+
+    eval_time: float = None
+    '''Evaluation time in seconds 
+
+    :type: float
+    '''
+
+    factor: float = None
+    '''Influence of the deformation 
+
+    :type: float
+    '''
+
+    filepath: str = None
+    '''Path to external displacements file 
+
+    :type: str
+    '''
+
+    flip_axis: typing.Set[typing.Union[int, str]] = None
+    '''
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    forward_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    frame_scale: float = None
+    '''Evaluation time in seconds 
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''Add this to the start frame 
+
+    :type: float
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    play_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    time_mode: typing.Union[int, str] = None
+    '''Method to control playback time 
+
+    :type: typing.Union[int, str]
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class MeshColor:
+    '''Vertex colors for a face in a Mesh '''
+
+    color1: float = None
+    '''
+
+    :type: float
+    '''
+
+    color2: float = None
+    '''
+
+    :type: float
+    '''
+
+    color3: float = None
+    '''
+
+    :type: float
+    '''
+
+    color4: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class MeshColorLayer:
+    '''Layer of vertex colors in a Mesh data-block '''
+
+    active: bool = None
+    '''Sets the layer as active for display and editing 
+
+    :type: bool
+    '''
+
+    active_render: bool = None
+    '''Sets the layer as active for rendering 
+
+    :type: bool
+    '''
+
+    data: typing.List['MeshColor'] = None
+    '''
+
+    :type: typing.List['MeshColor']
+    '''
+
+    name: str = None
+    '''Name of Vertex color layer 
+
+    :type: str
+    '''
+
+
+class MeshDeformModifier:
+    '''Mesh deformation modifier to deform with other meshes '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    is_bound: bool = None
+    '''Whether geometry has been bound to control cage 
+
+    :type: bool
+    '''
+
+    object: 'Object' = None
+    '''Mesh object to deform with 
+
+    :type: 'Object'
+    '''
+
+    precision: int = None
+    '''The grid size for binding 
+
+    :type: int
+    '''
+
+    use_dynamic_bind: bool = None
+    '''Recompute binding dynamically on top of other deformers (slower and more memory consuming) 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class MeshEdge:
+    '''Edge in a Mesh data-block '''
+
+    bevel_weight: float = None
+    '''Weight used by the Bevel modifier 
+
+    :type: float
+    '''
+
+    crease: float = None
+    '''Weight used by the Subdivision Surface modifier for creasing 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    index: int = None
+    '''Index of this edge 
+
+    :type: int
+    '''
+
+    is_loose: bool = None
+    '''Loose edge 
+
+    :type: bool
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_edge_sharp: bool = None
+    '''Sharp edge for the Edge Split modifier 
+
+    :type: bool
+    '''
+
+    use_freestyle_mark: bool = None
+    '''Edge mark for Freestyle line rendering 
+
+    :type: bool
+    '''
+
+    use_seam: bool = None
+    '''Seam edge for UV unwrapping 
+
+    :type: bool
+    '''
+
+    vertices: int = None
+    '''Vertex indices 
+
+    :type: int
+    '''
+
+    key = None
+    '''(readonly) '''
+
+
+class MeshEdges:
+    '''Collection of mesh edges '''
+
+    def add(self, count: int = 0):
+        '''add 
+
+        :param count: Count, Number of edges to add 
+        :type count: int
+        '''
+        pass
+
+
+class MeshLoop:
+    '''Loop in a Mesh data-block '''
+
+    bitangent: float = None
+    '''Bitangent vector of this vertex for this polygon (must be computed beforehand using calc_tangents, use it only if really needed, slower access than bitangent_sign) 
+
+    :type: float
+    '''
+
+    bitangent_sign: float = None
+    '''Sign of the bitangent vector of this vertex for this polygon (must be computed beforehand using calc_tangents, bitangent = bitangent_sign * cross(normal, tangent)) 
+
+    :type: float
+    '''
+
+    edge_index: int = None
+    '''Edge index 
+
+    :type: int
+    '''
+
+    index: int = None
+    '''Index of this loop 
+
+    :type: int
+    '''
+
+    normal: float = None
+    '''Local space unit length split normal vector of this vertex for this polygon (must be computed beforehand using calc_normals_split or calc_tangents) 
+
+    :type: float
+    '''
+
+    tangent: float = None
+    '''Local space unit length tangent vector of this vertex for this polygon (must be computed beforehand using calc_tangents) 
+
+    :type: float
+    '''
+
+    vertex_index: int = None
+    '''Vertex index 
+
+    :type: int
+    '''
+
+
+class MeshLoopColor:
+    '''Vertex loop colors in a Mesh '''
+
+    color: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class MeshLoopColorLayer:
+    '''Layer of vertex colors in a Mesh data-block '''
+
+    active: bool = None
+    '''Sets the layer as active for display and editing 
+
+    :type: bool
+    '''
+
+    active_render: bool = None
+    '''Sets the layer as active for rendering 
+
+    :type: bool
+    '''
+
+    data: typing.List['MeshLoopColor'] = None
+    '''
+
+    :type: typing.List['MeshLoopColor']
+    '''
+
+    name: str = None
+    '''Name of Vertex color layer 
+
+    :type: str
+    '''
+
+
+class MeshLoops:
+    '''Collection of mesh loops '''
+
+    def add(self, count: int = 0):
+        '''add 
+
+        :param count: Count, Number of loops to add 
+        :type count: int
+        '''
+        pass
+
+
+class MeshPaintMaskLayer:
+    '''Per-vertex paint mask data '''
+
+    data: typing.List['MeshPaintMaskProperty'] = None
+    '''
+
+    :type: typing.List['MeshPaintMaskProperty']
+    '''
+
+
+class MeshPaintMaskProperty:
+    '''Floating point paint mask value '''
+
+    value: float = None
+    '''
+
+    :type: float
+    '''
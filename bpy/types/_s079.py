@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MeshPolygon:
+    '''Polygon in a Mesh data-block '''
+
+    area: float = None
+    '''Read only area of this polygon 
+
+    :type: float
+    '''
+
+    center: float = None
+    '''Center of this polygon 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    index: int = None
+    '''Index of this polygon 
+
+    :type: int
+    '''
+
+    loop_start: int = None
+    '''Index of the first loop of this polygon 
+
+    :type: int
+    '''
+
+    loop_total: int = None
+    '''Number of loops used by this polygon 
+
+    :type: int
+    '''
+
+    material_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    normal: float = None
+    '''Local space unit length normal vector for this polygon 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_freestyle_mark: bool = None
+    '''Face mark for Freestyle line rendering 
+
+    :type: bool
+    '''
+
+    use_smooth: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    vertices: int = None
+    '''Vertex indices 
+
+    :type: int
+    '''
+
+    edge_keys = None
+    '''(readonly) '''
+
+    loop_indices = None
+    '''(readonly) '''
+
+    def flip(self, ):
+        '''Invert winding of this polygon (flip its normal) 
+
+        '''
+        pass
+
+
+class MeshPolygonFloatProperty:
+    '''User defined floating point number value in a float properties layer '''
+
+    value: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class MeshPolygonFloatPropertyLayer:
+    '''User defined layer of floating point number values '''
+
+    data: typing.List['MeshPolygonFloatProperty'] = None
+    '''
+
+    :type: typing.List['MeshPolygonFloatProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshPolygonIntProperty:
+    '''User defined integer number value in an integer properties layer '''
+
+    value: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class MeshPolygonIntPropertyLayer:
+    '''User defined layer of integer number values '''
+
+    data: typing.List['MeshPolygonIntProperty'] = None
+    '''
+
+    :type: typing.List['MeshPolygonIntProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshPolygonStringProperty:
+    '''User defined string text value in a string properties layer '''
+
+    value: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshPolygonStringPropertyLayer:
+    '''User defined layer of string text values '''
+
+    data: typing.List['MeshPolygonStringProperty'] = None
+    '''
+
+    :type: typing.List['MeshPolygonStringProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshPolygons:
+    '''Collection of mesh polygons '''
+
+    active: int = None
+    '''The active polygon for this mesh 
+
+    :type: int
+    '''
+
+    def add(self, count: int = 0):
+        '''add 
+
+        :param count: Count, Number of polygons to add 
+        :type count: int
+        '''
+        pass
+
+
+class MeshSequenceCacheModifier:
+    '''Cache Mesh '''
+
+    cache_file: 'CacheFile' = None
+    '''
+
+    :type: 'CacheFile'
+    '''
+
+    object_path: str = None
+    '''Path to the object in the Alembic archive used to lookup geometric data 
+
+    :type: str
+    '''
+
+    read_data: typing.Set[typing.Union[int, str]] = None
+    '''
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+
+class MeshSkinVertex:
+    '''Per-vertex skin data for use with the Skin modifier '''
+
+    radius: float = None
+    '''Radius of the skin 
+
+    :type: float
+    '''
+
+    use_loose: bool = None
+    '''If vertex has multiple adjacent edges, it is hulled to them directly 
+
+    :type: bool
+    '''
+
+    use_root: bool = None
+    '''Vertex is a root for rotation calculations and armature generation 
+
+    :type: bool
+    '''
+
+
+class MeshSkinVertexLayer:
+    '''Per-vertex skin data for use with the Skin modifier '''
+
+    data: typing.List['MeshSkinVertex'] = None
+    '''
+
+    :type: typing.List['MeshSkinVertex']
+    '''
+
+    name: str = None
+    '''Name of skin layer 
+
+    :type: str
+    '''
+
+
+class MeshStatVis:
+    distort_max: float = None
+    '''Maximum angle to display 
+
+    :type: float
+    '''
+
+    distort_min: float = None
+    '''Minimum angle to display 
+
+    :type: float
+    '''
+
+    overhang_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    overhang_max: float = None
+    '''Maximum angle to display 
+
+    :type: float
+    '''
+
+    overhang_min: float = None
+    '''Minimum angle to display 
+
+    :type: float
+    '''
+
+    sharp_max: float = None
+    '''Maximum angle to display 
+
+    :type: float
+    '''
+
+    sharp_min: float = None
+    '''Minimum angle to display 
+
+    :type: float
+    '''
+
+    thickness_max: float = None
+    '''Maximum for measuring thickness 
+
+    :type: float
+    '''
+
+    thickness_min: float = None
+    '''Minimum for measuring thickness 
+
+    :type: float
+    '''
+
+    thickness_samples: int = None
+    '''Number of samples to test per face 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of data to visualize/check 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class MeshTessFace:
+    '''TessFace in a Mesh data-block '''
+
+    area: float = None
+    '''Read only area of this face 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    index: int = None
+    '''Index of this face 
+
+    :type: int
+    '''
+
+    material_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    normal: float = None
+    '''Local space unit length normal vector for this face 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    split_normals: float = None
+    '''Local space unit length split normals vectors of the vertices of this face (must be computed beforehand using calc_normals_split or calc_tangents, and then calc_tessface) 
+
+    :type: float
+    '''
+
+    use_smooth: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    vertices: int = None
+    '''Vertex indices 
+
+    :type: int
+    '''
+
+    vertices_raw: int = None
+    '''Fixed size vertex indices array 
+
+    :type: int
+    '''
+
+    center = None
+    '''The midpoint of the face. (readonly) '''
+
+    edge_keys = None
+    '''(readonly) '''
+
+
+class MeshTessFaces:
+    '''Collection of mesh faces '''
+
+    active: int = None
+    '''The active face for this mesh 
+
+    :type: int
+    '''
+
+    def add(self, count: int = 0):
+        '''add 
+
+        :param count: Count, Number of faces to add 
+        :type count: int
+        '''
+        pass
@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MeshTextureFace:
+    '''UV map and image texture for a face '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    uv: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv1: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv2: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv3: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv4: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv_raw: float = None
+    '''Fixed size UV coordinates array 
+
+    :type: float
+    '''
+
+
+class MeshTextureFaceLayer:
+    '''UV map with assigned image textures in a Mesh data-block '''
+
+    active: bool = None
+    '''Set the map as active for display and editing 
+
+    :type: bool
+    '''
+
+    active_clone: bool = None
+    '''Set the map as active for cloning 
+
+    :type: bool
+    '''
+
+    active_render: bool = None
+    '''Set the map as active for rendering 
+
+    :type: bool
+    '''
+
+    data: typing.List['MeshTextureFace'] = None
+    '''
+
+    :type: typing.List['MeshTextureFace']
+    '''
+
+    name: str = None
+    '''Name of UV map 
+
+    :type: str
+    '''
+
+
+class MeshTexturePoly:
+    '''UV map and image texture for a face '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+
+class MeshTexturePolyLayer:
+    '''UV map with assigned image textures in a Mesh data-block '''
+
+    active: bool = None
+    '''Set the map as active for display and editing 
+
+    :type: bool
+    '''
+
+    active_clone: bool = None
+    '''Set the map as active for cloning 
+
+    :type: bool
+    '''
+
+    active_render: bool = None
+    '''Set the map as active for rendering 
+
+    :type: bool
+    '''
+
+    data: typing.List['MeshTexturePoly'] = None
+    '''
+
+    :type: typing.List['MeshTexturePoly']
+    '''
+
+    name: str = None
+    '''Name of UV map 
+
+    :type: str
+    '''
+
+
+class MeshUVLoop:
+    pin_uv: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select_edge: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    uv: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class MeshUVLoopLayer:
+    data: typing.List['MeshUVLoop'] = None
+    '''
+
+    :type: typing.List['MeshUVLoop']
+    '''
+
+    name: str = None
+    '''Name of UV map 
+
+    :type: str
+    '''
+
+
+class MeshVertex:
+    '''Vertex in a Mesh data-block '''
+
+    bevel_weight: float = None
+    '''Weight used by the Bevel modifier ‘Only Vertices’ option 
+
+    :type: float
+    '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    groups: typing.List['VertexGroupElement'] = None
+    '''Weights for the vertex groups this vertex is member of 
+
+    :type: typing.List['VertexGroupElement']
+    '''
+
+    hide: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    index: int = None
+    '''Index of this vertex 
+
+    :type: int
+    '''
+
+    normal: float = None
+    '''Vertex Normal 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    undeformed_co: float = None
+    '''For meshes with modifiers applied, the coordinate of the vertex with no deforming modifiers applied, as used for generated texture coordinates 
+
+    :type: float
+    '''
+
+
+class MeshVertexFloatProperty:
+    '''User defined floating point number value in a float properties layer '''
+
+    value: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class MeshVertexFloatPropertyLayer:
+    '''User defined layer of floating point number values '''
+
+    data: typing.List['MeshVertexFloatProperty'] = None
+    '''
+
+    :type: typing.List['MeshVertexFloatProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshVertexIntProperty:
+    '''User defined integer number value in an integer properties layer '''
+
+    value: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class MeshVertexIntPropertyLayer:
+    '''User defined layer of integer number values '''
+
+    data: typing.List['MeshVertexIntProperty'] = None
+    '''
+
+    :type: typing.List['MeshVertexIntProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshVertexStringProperty:
+    '''User defined string text value in a string properties layer '''
+
+    value: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshVertexStringPropertyLayer:
+    '''User defined layer of string text values '''
+
+    data: typing.List['MeshVertexStringProperty'] = None
+    '''
+
+    :type: typing.List['MeshVertexStringProperty']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class MeshVertices:
+    '''Collection of mesh vertices '''
+
+    def add(self, count: int = 0):
+        '''add 
+
+        :param count: Count, Number of vertices to add 
+        :type count: int
+        '''
+        pass
+
+
+class MessageActuator:
+    body_message: str = None
+    '''Optional, message body Text 
+
+    :type: str
+    '''
+
+    body_property: str = None
+    '''The message body will be set by the Property Value 
+
+    :type: str
+    '''
+
+    body_type: typing.Union[int, str] = None
+    '''Toggle message type: either Text or a PropertyName 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subject: str = None
+    '''Optional, message subject (this is what can be filtered on) 
+
+    :type: str
+    '''
+
+    to_property: str = None
+    '''Optional, send message to objects with this name only, or empty to broadcast 
+
+    :type: str
+    '''
+
+
+class MessageSensor:
+    '''Sensor to detect incoming messages '''
+
+    subject: str = None
+    '''Optional subject filter: only accept messages with this subject, or empty to accept all 
+
+    :type: str
+    '''
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MetaBall:
+    '''Metaball data-block to defined blobby surfaces '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    cycles: 'CyclesMeshSettings' = None
+    '''Cycles mesh settings 
+
+    :type: 'CyclesMeshSettings'
+    '''
+
+    elements: typing.List['MetaElement'] = None
+    '''Meta elements 
+
+    :type: typing.List['MetaElement']
+    '''
+
+    is_editmode: bool = None
+    '''True when used in editmode 
+
+    :type: bool
+    '''
+
+    materials: typing.List['Material'] = None
+    '''
+
+    :type: typing.List['Material']
+    '''
+
+    render_resolution: float = None
+    '''Polygonization resolution in rendering 
+
+    :type: float
+    '''
+
+    resolution: float = None
+    '''Polygonization resolution in the 3D viewport 
+
+    :type: float
+    '''
+
+    texspace_location: float = None
+    '''Texture space location 
+
+    :type: float
+    '''
+
+    texspace_size: float = None
+    '''Texture space size 
+
+    :type: float
+    '''
+
+    threshold: float = None
+    '''Influence of meta elements 
+
+    :type: float
+    '''
+
+    update_method: typing.Union[int, str] = None
+    '''Metaball edit update behavior 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_auto_texspace: bool = None
+    '''Adjust active object’s texture space automatically when transforming object 
+
+    :type: bool
+    '''
+
+    def transform(self, matrix: float):
+        '''Transform meta elements by a matrix 
+
+        :param matrix: Matrix 
+        :type matrix: float
+        '''
+        pass
+
+
+class MetaBallElements:
+    '''Collection of metaball elements '''
+
+    active: 'MetaElement' = None
+    '''Last selected element 
+
+    :type: 'MetaElement'
+    '''
+
+    def new(self, type: typing.Union[int, str] = 'BALL') -> 'MetaElement':
+        '''Add a new element to the metaball 
+
+        :param type: type for the new meta-element 
+        :type type: typing.Union[int, str]
+        :rtype: 'MetaElement'
+        :return:  The newly created meta-element 
+        '''
+        pass
+
+    def remove(self, element: 'MetaElement'):
+        '''Remove an element from the metaball 
+
+        :param element: The element to remove 
+        :type element: 'MetaElement'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all elements from the metaball 
+
+        '''
+        pass
+
+
+class MetaElement:
+    '''Blobby element in a Metaball data-block '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''Hide element 
+
+    :type: bool
+    '''
+
+    radius: float = None
+    '''
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''Normalized quaternion rotation 
+
+    :type: float
+    '''
+
+    size_x: float = None
+    '''Size of element, use of components depends on element type 
+
+    :type: float
+    '''
+
+    size_y: float = None
+    '''Size of element, use of components depends on element type 
+
+    :type: float
+    '''
+
+    size_z: float = None
+    '''Size of element, use of components depends on element type 
+
+    :type: float
+    '''
+
+    stiffness: float = None
+    '''Stiffness defines how much of the element to fill 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Metaball types 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_negative: bool = None
+    '''Set metaball as negative one 
+
+    :type: bool
+    '''
+
+
+class MetaSequence:
+    '''Sequence strip to group other strips as a single sequence strip '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    proxy: 'SequenceProxy' = None
+    '''
+
+    :type: 'SequenceProxy'
+    '''
+
+    sequences: typing.List['Sequence'] = None
+    '''
+
+    :type: typing.List['Sequence']
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this strip 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+
+class MirrorModifier:
+    '''Mirroring modifier '''
+
+    merge_threshold: float = None
+    '''Distance within which mirrored vertices are merged 
+
+    :type: float
+    '''
+
+    mirror_object: 'Object' = None
+    '''Object to use as mirror 
+
+    :type: 'Object'
+    '''
+
+    mirror_offset_u: float = None
+    '''Amount to offset mirrored UVs from the 0.5 point on the U axis 
+
+    :type: float
+    '''
+
+    mirror_offset_v: float = None
+    '''Amount to offset mirrored UVs from the 0.5 point on the V axis 
+
+    :type: float
+    '''
+
+    use_clip: bool = None
+    '''Prevent vertices from going through the mirror during transform 
+
+    :type: bool
+    '''
+
+    use_mirror_merge: bool = None
+    '''Merge vertices within the merge threshold 
+
+    :type: bool
+    '''
+
+    use_mirror_u: bool = None
+    '''Mirror the U texture coordinate around the 0.5 point 
+
+    :type: bool
+    '''
+
+    use_mirror_v: bool = None
+    '''Mirror the V texture coordinate around the 0.5 point 
+
+    :type: bool
+    '''
+
+    use_mirror_vertex_groups: bool = None
+    '''Mirror vertex groups (e.g. .R->.L) 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''Enable X axis mirror 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Enable Y axis mirror 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Enable Z axis mirror 
+
+    :type: bool
+    '''
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Modifier:
+    '''Modifier affecting the geometry data of an object '''
+
+    name: str = None
+    '''Modifier name 
+
+    :type: str
+    '''
+
+    show_expanded: bool = None
+    '''Set modifier expanded in the user interface 
+
+    :type: bool
+    '''
+
+    show_in_editmode: bool = None
+    '''Display modifier in Edit mode 
+
+    :type: bool
+    '''
+
+    show_on_cage: bool = None
+    '''Adjust edit cage to modifier result 
+
+    :type: bool
+    '''
+
+    show_render: bool = None
+    '''Use modifier during render 
+
+    :type: bool
+    '''
+
+    show_viewport: bool = None
+    '''Display modifier in viewport 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_apply_on_spline: bool = None
+    '''Apply this and all preceding deformation modifiers on splines’ points rather than on filled curve/surface 
+
+    :type: bool
+    '''
+
+
+class MotionPath:
+    '''Cache of the worldspace positions of an element over a frame range '''
+
+    color: float = None
+    '''Custom color for motion path 
+
+    :type: float
+    '''
+
+    frame_end: int = None
+    '''End frame of the stored range 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Starting frame of the stored range 
+
+    :type: int
+    '''
+
+    is_modified: bool = None
+    '''Path is being edited 
+
+    :type: bool
+    '''
+
+    length: int = None
+    '''Number of frames cached 
+
+    :type: int
+    '''
+
+    line_thickness: int = None
+    '''Line thickness for drawing path 
+
+    :type: int
+    '''
+
+    lines: bool = None
+    '''Draw straight lines between keyframe points 
+
+    :type: bool
+    '''
+
+    points: typing.List['MotionPathVert'] = None
+    '''Cached positions per frame 
+
+    :type: typing.List['MotionPathVert']
+    '''
+
+    use_bone_head: bool = None
+    '''For PoseBone paths, use the bone head location when calculating this path 
+
+    :type: bool
+    '''
+
+    use_custom_color: bool = None
+    '''Use custom color for this motion path 
+
+    :type: bool
+    '''
+
+
+class MotionPathVert:
+    '''Cached location on path '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Path point is selected for editing 
+
+    :type: bool
+    '''
+
+
+class MouseActuator:
+    local_x: bool = None
+    '''Apply rotation locally 
+
+    :type: bool
+    '''
+
+    local_y: bool = None
+    '''Apply rotation locally 
+
+    :type: bool
+    '''
+
+    max_x: float = None
+    '''Maximum positive rotation allowed by X mouse movement (0 for infinite) 
+
+    :type: float
+    '''
+
+    max_y: float = None
+    '''Maximum positive rotation allowed by Y mouse movement (0 for infinite) 
+
+    :type: float
+    '''
+
+    min_x: float = None
+    '''Maximum negative rotation allowed by X mouse movement (0 for infinite) 
+
+    :type: float
+    '''
+
+    min_y: float = None
+    '''Maximum negative rotation allowed by Y mouse movement (0 for infinite) 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    object_axis_x: typing.Union[int, str] = None
+    '''Local object axis mouse movement in the X direction will apply to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object_axis_y: typing.Union[int, str] = None
+    '''Local object axis mouse movement in the Y direction will apply to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    reset_x: bool = None
+    '''Reset the cursor’s X position to the center of the screen space after calculating 
+
+    :type: bool
+    '''
+
+    reset_y: bool = None
+    '''Reset the cursor’s Y position to the center of the screen space after calculating 
+
+    :type: bool
+    '''
+
+    sensitivity_x: float = None
+    '''Sensitivity of the X axis 
+
+    :type: float
+    '''
+
+    sensitivity_y: float = None
+    '''Sensitivity of the Y axis 
+
+    :type: float
+    '''
+
+    threshold_x: float = None
+    '''Amount of X motion before mouse movement will register 
+
+    :type: float
+    '''
+
+    threshold_y: float = None
+    '''Amount of Y motion before mouse movement will register 
+
+    :type: float
+    '''
+
+    use_axis_x: bool = None
+    '''Calculate mouse movement on the X axis 
+
+    :type: bool
+    '''
+
+    use_axis_y: bool = None
+    '''Calculate mouse movement on the Y axis 
+
+    :type: bool
+    '''
+
+    visible: bool = None
+    '''Make mouse cursor visible 
+
+    :type: bool
+    '''
+
+
+class MouseSensor:
+    '''Sensor to detect mouse events '''
+
+    material: str = None
+    '''Only look for objects with this material (blank = all objects) 
+
+    :type: str
+    '''
+
+    mouse_event: typing.Union[int, str] = None
+    '''Type of event this mouse sensor should trigger on 
+
+    :type: typing.Union[int, str]
+    '''
+
+    property: str = None
+    '''Only look for objects with this property (blank = all objects) 
+
+    :type: str
+    '''
+
+    use_material: typing.Union[int, str] = None
+    '''Toggle collision on material or property 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_pulse: bool = None
+    '''Moving the mouse over a different object generates a pulse 
+
+    :type: bool
+    '''
+
+    use_x_ray: bool = None
+    '''Toggle X-Ray option (see through objects that don’t have the property) 
+
+    :type: bool
+    '''
+
+
+class MovieClip:
+    '''MovieClip data-block referencing an external movie file '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    colorspace_settings: 'ColorManagedInputColorspaceSettings' = None
+    '''Input color space settings 
+
+    :type: 'ColorManagedInputColorspaceSettings'
+    '''
+
+    display_aspect: float = None
+    '''Display Aspect for this clip, does not affect rendering 
+
+    :type: float
+    '''
+
+    filepath: str = None
+    '''Filename of the movie or sequence file 
+
+    :type: str
+    '''
+
+    frame_duration: int = None
+    '''Detected duration of movie clip in frames 
+
+    :type: int
+    '''
+
+    frame_offset: int = None
+    '''Offset of footage first frame relative to it’s file name (affects only how footage is loading, does not change data associated with a clip) 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Global scene frame number at which this movie starts playing (affects all data associated with a clip) 
+
+    :type: int
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease pencil data for this movie clip 
+
+    :type: 'GreasePencil'
+    '''
+
+    proxy: 'MovieClipProxy' = None
+    '''
+
+    :type: 'MovieClipProxy'
+    '''
+
+    size: int = None
+    '''Width and height in pixels, zero when image data cant be loaded 
+
+    :type: int
+    '''
+
+    source: typing.Union[int, str] = None
+    '''Where the clip comes from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    tracking: 'MovieTracking' = None
+    '''
+
+    :type: 'MovieTracking'
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this clip 
+
+    :type: bool
+    '''
+
+    use_proxy_custom_directory: bool = None
+    '''Create proxy images in a custom directory (default is movie location) 
+
+    :type: bool
+    '''
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MovieClipProxy:
+    '''Proxy parameters for a movie clip '''
+
+    build_100: bool = None
+    '''Build proxy resolution 100% of the original footage dimension 
+
+    :type: bool
+    '''
+
+    build_25: bool = None
+    '''Build proxy resolution 25% of the original footage dimension 
+
+    :type: bool
+    '''
+
+    build_50: bool = None
+    '''Build proxy resolution 50% of the original footage dimension 
+
+    :type: bool
+    '''
+
+    build_75: bool = None
+    '''Build proxy resolution 75% of the original footage dimension 
+
+    :type: bool
+    '''
+
+    build_free_run: bool = None
+    '''Build free run time code index 
+
+    :type: bool
+    '''
+
+    build_free_run_rec_date: bool = None
+    '''Build free run time code index using Record Date/Time 
+
+    :type: bool
+    '''
+
+    build_record_run: bool = None
+    '''Build record run time code index 
+
+    :type: bool
+    '''
+
+    build_undistorted_100: bool = None
+    '''Build proxy resolution 100% of the original undistorted footage dimension 
+
+    :type: bool
+    '''
+
+    build_undistorted_25: bool = None
+    '''Build proxy resolution 25% of the original undistorted footage dimension 
+
+    :type: bool
+    '''
+
+    build_undistorted_50: bool = None
+    '''Build proxy resolution 50% of the original undistorted footage dimension 
+
+    :type: bool
+    '''
+
+    build_undistorted_75: bool = None
+    '''Build proxy resolution 75% of the original undistorted footage dimension 
+
+    :type: bool
+    '''
+
+    directory: str = None
+    '''Location to store the proxy files 
+
+    :type: str
+    '''
+
+    quality: int = None
+    '''JPEG quality of proxy images 
+
+    :type: int
+    '''
+
+    timecode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class MovieClipScopes:
+    '''Scopes for statistical view of a movie clip '''
+
+    pass
+
+
+class MovieClipSequence:
+    '''Sequence strip to load a video from the clip editor '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    stabilize2d: bool = None
+    '''Use the 2D stabilized version of the clip 
+
+    :type: bool
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    undistort: bool = None
+    '''Use the undistorted version of the clip 
+
+    :type: bool
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+
+class MovieClipUser:
+    '''Parameters defining how a MovieClip data-block is used by another data-block '''
+
+    frame_current: int = None
+    '''Current frame number in movie or image sequence 
+
+    :type: int
+    '''
+
+    proxy_render_size: typing.Union[int, str] = None
+    '''Draw preview using full resolution or different proxy resolutions 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_render_undistorted: bool = None
+    '''Render preview using undistorted proxy 
+
+    :type: bool
+    '''
+
+
+class MovieReconstructedCamera:
+    '''Match-moving reconstructed camera data from tracker '''
+
+    average_error: float = None
+    '''Average error of reconstruction 
+
+    :type: float
+    '''
+
+    frame: int = None
+    '''Frame number marker is keyframed on 
+
+    :type: int
+    '''
+
+    matrix: float = None
+    '''Worldspace transformation matrix 
+
+    :type: float
+    '''
+
+
+class MovieSequence:
+    '''Sequence strip to load a video '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    colorspace_settings: 'ColorManagedInputColorspaceSettings' = None
+    '''Input color space settings 
+
+    :type: 'ColorManagedInputColorspaceSettings'
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    elements: typing.List['SequenceElement'] = None
+    '''
+
+    :type: typing.List['SequenceElement']
+    '''
+
+    filepath: str = None
+    '''
+
+    :type: str
+    '''
+
+    mpeg_preseek: int = None
+    '''For MPEG movies, preseek this many frames 
+
+    :type: int
+    '''
+
+    proxy: 'SequenceProxy' = None
+    '''
+
+    :type: 'SequenceProxy'
+    '''
+
+    stereo_3d_format: 'Stereo3dFormat' = None
+    '''Settings for stereo 3d 
+
+    :type: 'Stereo3dFormat'
+    '''
+
+    stream_index: int = None
+    '''For files with several movie streams, use the stream with the given index 
+
+    :type: int
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_multiview: bool = None
+    '''Use Multiple Views (when available) 
+
+    :type: bool
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this strip 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+    views_format: typing.Union[int, str] = None
+    '''Mode to load movie views 
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MovieTracking:
+    '''Match-moving data for tracking '''
+
+    active_object_index: int = None
+    '''Index of active object 
+
+    :type: int
+    '''
+
+    camera: 'MovieTrackingCamera' = None
+    '''
+
+    :type: 'MovieTrackingCamera'
+    '''
+
+    dopesheet: 'MovieTrackingDopesheet' = None
+    '''
+
+    :type: 'MovieTrackingDopesheet'
+    '''
+
+    objects: typing.List['MovieTrackingObjects'] = None
+    '''Collection of objects in this tracking data object 
+
+    :type: typing.List['MovieTrackingObjects']
+    '''
+
+    plane_tracks: typing.List['MovieTrackingPlaneTrack'] = None
+    '''Collection of plane tracks in this tracking data object 
+
+    :type: typing.List['MovieTrackingPlaneTrack']
+    '''
+
+    reconstruction: 'MovieTrackingReconstruction' = None
+    '''
+
+    :type: 'MovieTrackingReconstruction'
+    '''
+
+    settings: 'MovieTrackingSettings' = None
+    '''
+
+    :type: 'MovieTrackingSettings'
+    '''
+
+    stabilization: 'MovieTrackingStabilization' = None
+    '''
+
+    :type: 'MovieTrackingStabilization'
+    '''
+
+    tracks: typing.List['MovieTrackingTracks'] = None
+    '''Collection of tracks in this tracking data object 
+
+    :type: typing.List['MovieTrackingTracks']
+    '''
+
+
+class MovieTrackingCamera:
+    '''Match-moving camera data for tracking '''
+
+    distortion_model: typing.Union[int, str] = None
+    '''Distortion model used for camera lenses 
+
+    :type: typing.Union[int, str]
+    '''
+
+    division_k1: float = None
+    '''First coefficient of second order division distortion 
+
+    :type: float
+    '''
+
+    division_k2: float = None
+    '''First coefficient of second order division distortion 
+
+    :type: float
+    '''
+
+    focal_length: float = None
+    '''Camera’s focal length 
+
+    :type: float
+    '''
+
+    focal_length_pixels: float = None
+    '''Camera’s focal length 
+
+    :type: float
+    '''
+
+    k1: float = None
+    '''First coefficient of third order polynomial radial distortion 
+
+    :type: float
+    '''
+
+    k2: float = None
+    '''Second coefficient of third order polynomial radial distortion 
+
+    :type: float
+    '''
+
+    k3: float = None
+    '''Third coefficient of third order polynomial radial distortion 
+
+    :type: float
+    '''
+
+    pixel_aspect: float = None
+    '''Pixel aspect ratio 
+
+    :type: float
+    '''
+
+    principal: float = None
+    '''Optical center of lens 
+
+    :type: float
+    '''
+
+    sensor_width: float = None
+    '''Width of CCD sensor in millimeters 
+
+    :type: float
+    '''
+
+    units: typing.Union[int, str] = None
+    '''Units used for camera focal length 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class MovieTrackingDopesheet:
+    '''Match-moving dopesheet data '''
+
+    show_hidden: bool = None
+    '''Include channels from objects/bone that aren’t visible 
+
+    :type: bool
+    '''
+
+    show_only_selected: bool = None
+    '''Only include channels relating to selected objects and data 
+
+    :type: bool
+    '''
+
+    sort_method: typing.Union[int, str] = None
+    '''Method to be used to sort channels in dopesheet view 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_invert_sort: bool = None
+    '''Invert sort order of dopesheet channels 
+
+    :type: bool
+    '''
+
+
+class MovieTrackingMarker:
+    '''Match-moving marker data for tracking '''
+
+    co: float = None
+    '''Marker position at frame in normalized coordinates 
+
+    :type: float
+    '''
+
+    frame: int = None
+    '''Frame number marker is keyframed on 
+
+    :type: int
+    '''
+
+    is_keyed: bool = None
+    '''Whether the position of the marker is keyframed or tracked 
+
+    :type: bool
+    '''
+
+    mute: bool = None
+    '''Is marker muted for current frame 
+
+    :type: bool
+    '''
+
+    pattern_bound_box: float = None
+    '''Pattern area bounding box in normalized coordinates 
+
+    :type: float
+    '''
+
+    pattern_corners: float = None
+    '''Array of coordinates which represents pattern’s corners in normalized coordinates relative to marker position 
+
+    :type: float
+    '''
+
+    search_max: float = None
+    '''Right-bottom corner of search area in normalized coordinates relative to marker position 
+
+    :type: float
+    '''
+
+    search_min: float = None
+    '''Left-bottom corner of search area in normalized coordinates relative to marker position 
+
+    :type: float
+    '''
+
+
+class MovieTrackingMarkers:
+    '''Collection of markers for movie tracking track '''
+
+    def find_frame(self, frame: int,
+                   exact: bool = True) -> 'MovieTrackingMarker':
+        '''Get marker for specified frame 
+
+        :param frame: Frame, Frame number to find marker for 
+        :type frame: int
+        :param exact: Exact, Get marker at exact frame number rather than get estimated marker 
+        :type exact: bool
+        :rtype: 'MovieTrackingMarker'
+        :return:  Marker for specified frame 
+        '''
+        pass
+
+    def insert_frame(self, frame: int,
+                     co: float = (0.0, 0.0)) -> 'MovieTrackingMarker':
+        '''Insert a new marker at the specified frame 
+
+        :param frame: Frame, Frame number to insert marker to 
+        :type frame: int
+        :param co: Coordinate, Place new marker at the given frame using specified in normalized space coordinates 
+        :type co: float
+        :rtype: 'MovieTrackingMarker'
+        :return:  Newly created marker 
+        '''
+        pass
+
+    def delete_frame(self, frame: int):
+        '''Delete marker at specified frame 
+
+        :param frame: Frame, Frame number to delete marker from 
+        :type frame: int
+        '''
+        pass
+
+
+class MovieTrackingObject:
+    '''Match-moving object tracking and reconstruction data '''
+
+    is_camera: bool = None
+    '''Object is used for camera tracking 
+
+    :type: bool
+    '''
+
+    keyframe_a: int = None
+    '''First keyframe used for reconstruction initialization 
+
+    :type: int
+    '''
+
+    keyframe_b: int = None
+    '''Second keyframe used for reconstruction initialization 
+
+    :type: int
+    '''
+
+    name: str = None
+    '''Unique name of object 
+
+    :type: str
+    '''
+
+    plane_tracks: typing.List['MovieTrackingPlaneTrack'] = None
+    '''Collection of plane tracks in this tracking data object 
+
+    :type: typing.List['MovieTrackingPlaneTrack']
+    '''
+
+    reconstruction: 'MovieTrackingReconstruction' = None
+    '''
+
+    :type: 'MovieTrackingReconstruction'
+    '''
+
+    scale: float = None
+    '''Scale of object solution in camera space 
+
+    :type: float
+    '''
+
+    tracks: typing.List['MovieTrackingTrack'] = None
+    '''Collection of tracks in this tracking data object 
+
+    :type: typing.List['MovieTrackingTrack']
+    '''
+
+
+class MovieTrackingObjectPlaneTracks:
+    '''Collection of tracking plane tracks '''
+
+    active: 'MovieTrackingTrack' = None
+    '''Active track in this tracking data object 
+
+    :type: 'MovieTrackingTrack'
+    '''
+
+
+class MovieTrackingObjectTracks:
+    '''Collection of movie tracking tracks '''
+
+    active: 'MovieTrackingTrack' = None
+    '''Active track in this tracking data object 
+
+    :type: 'MovieTrackingTrack'
+    '''
+
+    def new(self, name: str = "", frame: int = 1) -> 'MovieTrackingTrack':
+        '''create new motion track in this movie clip 
+
+        :param name: Name of new track 
+        :type name: str
+        :param frame: Frame, Frame number to add tracks on 
+        :type frame: int
+        :rtype: 'MovieTrackingTrack'
+        :return:  Newly created track 
+        '''
+        pass
+
+
+class MovieTrackingObjects:
+    '''Collection of movie tracking objects '''
+
+    active: 'MovieTrackingObject' = None
+    '''Active object in this tracking data object 
+
+    :type: 'MovieTrackingObject'
+    '''
+
+    def new(self, name: str) -> 'MovieTrackingObject':
+        '''Add tracking object to this movie clip 
+
+        :param name: Name of new object 
+        :type name: str
+        :rtype: 'MovieTrackingObject'
+        :return:  New motion tracking object 
+        '''
+        pass
+
+    def remove(self, object: 'MovieTrackingObject'):
+        '''Remove tracking object from this movie clip 
+
+        :param object: Motion tracking object to be removed 
+        :type object: 'MovieTrackingObject'
+        '''
+        pass
+
+
+class MovieTrackingPlaneMarker:
+    '''Match-moving plane marker data for tracking '''
+
+    corners: float = None
+    '''Array of coordinates which represents UI rectangle corners in frame normalized coordinates 
+
+    :type: float
+    '''
+
+    frame: int = None
+    '''Frame number marker is keyframed on 
+
+    :type: int
+    '''
+
+    mute: bool = None
+    '''Is marker muted for current frame 
+
+    :type: bool
+    '''
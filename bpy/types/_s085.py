@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MovieTrackingPlaneMarkers:
+    '''Collection of markers for movie tracking plane track '''
+
+    def find_frame(self, frame: int,
+                   exact: bool = True) -> 'MovieTrackingPlaneMarker':
+        '''Get plane marker for specified frame 
+
+        :param frame: Frame, Frame number to find marker for 
+        :type frame: int
+        :param exact: Exact, Get plane marker at exact frame number rather than get estimated marker 
+        :type exact: bool
+        :rtype: 'MovieTrackingPlaneMarker'
+        :return:  Plane marker for specified frame 
+        '''
+        pass
+
+    def insert_frame(self, frame: int) -> 'MovieTrackingPlaneMarker':
+        '''Insert a new plane marker at the specified frame 
+
+        :param frame: Frame, Frame number to insert marker to 
+        :type frame: int
+        :rtype: 'MovieTrackingPlaneMarker'
+        :return:  Newly created plane marker 
+        '''
+        pass
+
+    def delete_frame(self, frame: int):
+        '''Delete plane marker at specified frame 
+
+        :param frame: Frame, Frame number to delete plane marker from 
+        :type frame: int
+        '''
+        pass
+
+
+class MovieTrackingPlaneTrack:
+    '''Match-moving plane track data for tracking '''
+
+    image: 'Image' = None
+    '''Image displayed in the track during editing in clip editor 
+
+    :type: 'Image'
+    '''
+
+    image_opacity: float = None
+    '''Opacity of the image 
+
+    :type: float
+    '''
+
+    markers: typing.List['MovieTrackingPlaneMarker'] = None
+    '''Collection of markers in track 
+
+    :type: typing.List['MovieTrackingPlaneMarker']
+    '''
+
+    name: str = None
+    '''Unique name of track 
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''Plane track is selected 
+
+    :type: bool
+    '''
+
+    use_auto_keying: bool = None
+    '''Automatic keyframe insertion when moving plane corners 
+
+    :type: bool
+    '''
+
+
+class MovieTrackingPlaneTracks:
+    '''Collection of movie tracking plane tracks '''
+
+    active: 'MovieTrackingPlaneTrack' = None
+    '''Active plane track in this tracking data object 
+
+    :type: 'MovieTrackingPlaneTrack'
+    '''
+
+
+class MovieTrackingReconstructedCameras:
+    '''Collection of solved cameras '''
+
+    def find_frame(self, frame: int = 1) -> 'MovieReconstructedCamera':
+        '''Find a reconstructed camera for a give frame number 
+
+        :param frame: Frame, Frame number to find camera for 
+        :type frame: int
+        :rtype: 'MovieReconstructedCamera'
+        :return:  Camera for a given frame 
+        '''
+        pass
+
+    def matrix_from_frame(self, frame: int = 1) -> float:
+        '''Return interpolated camera matrix for a given frame 
+
+        :param frame: Frame, Frame number to find camera for 
+        :type frame: int
+        :rtype: float
+        :return:  Matrix, Interpolated camera matrix for a given frame 
+        '''
+        pass
+
+
+class MovieTrackingReconstruction:
+    '''Match-moving reconstruction data from tracker '''
+
+    average_error: float = None
+    '''Average error of reconstruction 
+
+    :type: float
+    '''
+
+    cameras: typing.List['MovieTrackingReconstructedCameras'] = None
+    '''Collection of solved cameras 
+
+    :type: typing.List['MovieTrackingReconstructedCameras']
+    '''
+
+    is_valid: bool = None
+    '''Is tracking data contains valid reconstruction information 
+
+    :type: bool
+    '''
+
+
+class MovieTrackingSettings:
+    '''Match moving settings '''
+
+    clean_action: typing.Union[int, str] = None
+    '''Cleanup action to execute 
+
+    :type: typing.Union[int, str]
+    '''
+
+    clean_error: float = None
+    '''Effect on tracks which have a larger re-projection error 
+
+    :type: float
+    '''
+
+    clean_frames: int = None
+    '''Effect on tracks which are tracked less than the specified amount of frames 
+
+    :type: int
+    '''
+
+    default_correlation_min: float = None
+    '''Default minimum value of correlation between matched pattern and reference that is still treated as successful tracking 
+
+    :type: float
+    '''
+
+    default_frames_limit: int = None
+    '''Every tracking cycle, this number of frames are tracked 
+
+    :type: int
+    '''
+
+    default_margin: int = None
+    '''Default distance from image boundary at which marker stops tracking 
+
+    :type: int
+    '''
+
+    default_motion_model: typing.Union[int, str] = None
+    '''Default motion model to use for tracking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    default_pattern_match: typing.Union[int, str] = None
+    '''Track pattern from given frame when tracking marker to next frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+    default_pattern_size: int = None
+    '''Size of pattern area for newly created tracks 
+
+    :type: int
+    '''
+
+    default_search_size: int = None
+    '''Size of search area for newly created tracks 
+
+    :type: int
+    '''
+
+    default_weight: float = None
+    '''Influence of newly created track on a final solution 
+
+    :type: float
+    '''
+
+    distance: float = None
+    '''Distance between two bundles used for scene scaling 
+
+    :type: float
+    '''
+
+    object_distance: float = None
+    '''Distance between two bundles used for object scaling 
+
+    :type: float
+    '''
+
+    refine_intrinsics: typing.Union[int, str] = None
+    '''Refine intrinsics during camera solving 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_default_expanded: bool = None
+    '''Show default options expanded in the user interface 
+
+    :type: bool
+    '''
+
+    show_extra_expanded: bool = None
+    '''Show extra options expanded in the user interface 
+
+    :type: bool
+    '''
+
+    speed: typing.Union[int, str] = None
+    '''Limit speed of tracking to make visual feedback easier (this does not affect the tracking quality) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_default_blue_channel: bool = None
+    '''Use blue channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    use_default_brute: bool = None
+    '''Use a brute-force translation-only initialization when tracking 
+
+    :type: bool
+    '''
+
+    use_default_green_channel: bool = None
+    '''Use green channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    use_default_mask: bool = None
+    '''Use a grease pencil data-block as a mask to use only specified areas of pattern when tracking 
+
+    :type: bool
+    '''
+
+    use_default_normalization: bool = None
+    '''Normalize light intensities while tracking (slower) 
+
+    :type: bool
+    '''
+
+    use_default_red_channel: bool = None
+    '''Use red channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    use_keyframe_selection: bool = None
+    '''Automatically select keyframes when solving camera/object motion 
+
+    :type: bool
+    '''
+
+    use_tripod_solver: bool = None
+    '''Use special solver to track a stable camera position, such as a tripod 
+
+    :type: bool
+    '''
+
+
+class MovieTrackingStabilization:
+    '''2D stabilization based on tracking markers '''
+
+    active_rotation_track_index: int = None
+    '''Index of active track in rotation stabilization tracks list 
+
+    :type: int
+    '''
+
+    active_track_index: int = None
+    '''Index of active track in translation stabilization tracks list 
+
+    :type: int
+    '''
+
+    anchor_frame: int = None
+    '''Reference point to anchor stabilization (other frames will be adjusted relative to this frame’s position) 
+
+    :type: int
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Interpolation to use for sub-pixel shifts and rotations due to stabilization 
+
+    :type: typing.Union[int, str]
+    '''
+
+    influence_location: float = None
+    '''Influence of stabilization algorithm on footage location 
+
+    :type: float
+    '''
+
+    influence_rotation: float = None
+    '''Influence of stabilization algorithm on footage rotation 
+
+    :type: float
+    '''
+
+    influence_scale: float = None
+    '''Influence of stabilization algorithm on footage scale 
+
+    :type: float
+    '''
+
+    rotation_tracks: typing.List['MovieTrackingTrack'] = None
+    '''Collection of tracks used for 2D stabilization (translation) 
+
+    :type: typing.List['MovieTrackingTrack']
+    '''
+
+    scale_max: float = None
+    '''Limit the amount of automatic scaling 
+
+    :type: float
+    '''
+
+    show_tracks_expanded: bool = None
+    '''Show UI list of tracks participating in stabilization 
+
+    :type: bool
+    '''
+
+    target_position: float = None
+    '''Known relative offset of original shot, will be subtracted (e.g. for panning shot, can be animated) 
+
+    :type: float
+    '''
+
+    target_rotation: float = None
+    '''Rotation present on original shot, will be compensated (e.g. for deliberate tilting) 
+
+    :type: float
+    '''
+
+    target_scale: float = None
+    '''Explicitly scale resulting frame to compensate zoom of original shot 
+
+    :type: float
+    '''
+
+    tracks: typing.List['MovieTrackingTrack'] = None
+    '''Collection of tracks used for 2D stabilization (translation) 
+
+    :type: typing.List['MovieTrackingTrack']
+    '''
+
+    use_2d_stabilization: bool = None
+    '''Use 2D stabilization for footage 
+
+    :type: bool
+    '''
+
+    use_autoscale: bool = None
+    '''Automatically scale footage to cover unfilled areas when stabilizing 
+
+    :type: bool
+    '''
+
+    use_stabilize_rotation: bool = None
+    '''Stabilize detected rotation around center of frame 
+
+    :type: bool
+    '''
+
+    use_stabilize_scale: bool = None
+    '''Compensate any scale changes relative to center of rotation 
+
+    :type: bool
+    '''
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class MovieTrackingTrack:
+    '''Match-moving track data for tracking '''
+
+    average_error: float = None
+    '''Average error of re-projection 
+
+    :type: float
+    '''
+
+    bundle: float = None
+    '''Position of bundle reconstructed from this track 
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Color of the track in the Movie Clip Editor and the 3D viewport after a solve 
+
+    :type: float
+    '''
+
+    correlation_min: float = None
+    '''Minimal value of correlation between matched pattern and reference that is still treated as successful tracking 
+
+    :type: float
+    '''
+
+    frames_limit: int = None
+    '''Every tracking cycle, this number of frames are tracked 
+
+    :type: int
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease pencil data for this track 
+
+    :type: 'GreasePencil'
+    '''
+
+    has_bundle: bool = None
+    '''True if track has a valid bundle 
+
+    :type: bool
+    '''
+
+    hide: bool = None
+    '''Track is hidden 
+
+    :type: bool
+    '''
+
+    lock: bool = None
+    '''Track is locked and all changes to it are disabled 
+
+    :type: bool
+    '''
+
+    margin: int = None
+    '''Distance from image boundary at which marker stops tracking 
+
+    :type: int
+    '''
+
+    markers: typing.List['MovieTrackingMarker'] = None
+    '''Collection of markers in track 
+
+    :type: typing.List['MovieTrackingMarker']
+    '''
+
+    motion_model: typing.Union[int, str] = None
+    '''Default motion model to use for tracking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    name: str = None
+    '''Unique name of track 
+
+    :type: str
+    '''
+
+    offset: float = None
+    '''Offset of track from the parenting point 
+
+    :type: float
+    '''
+
+    pattern_match: typing.Union[int, str] = None
+    '''Track pattern from given frame when tracking marker to next frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+    select: bool = None
+    '''Track is selected 
+
+    :type: bool
+    '''
+
+    select_anchor: bool = None
+    '''Track’s anchor point is selected 
+
+    :type: bool
+    '''
+
+    select_pattern: bool = None
+    '''Track’s pattern area is selected 
+
+    :type: bool
+    '''
+
+    select_search: bool = None
+    '''Track’s search area is selected 
+
+    :type: bool
+    '''
+
+    use_alpha_preview: bool = None
+    '''Apply track’s mask on displaying preview 
+
+    :type: bool
+    '''
+
+    use_blue_channel: bool = None
+    '''Use blue channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    use_brute: bool = None
+    '''Use a brute-force translation only pre-track before refinement 
+
+    :type: bool
+    '''
+
+    use_custom_color: bool = None
+    '''Use custom color instead of theme-defined 
+
+    :type: bool
+    '''
+
+    use_grayscale_preview: bool = None
+    '''Display what the tracking algorithm sees in the preview 
+
+    :type: bool
+    '''
+
+    use_green_channel: bool = None
+    '''Use green channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    use_mask: bool = None
+    '''Use a grease pencil data-block as a mask to use only specified areas of pattern when tracking 
+
+    :type: bool
+    '''
+
+    use_normalization: bool = None
+    '''Normalize light intensities while tracking. Slower 
+
+    :type: bool
+    '''
+
+    use_red_channel: bool = None
+    '''Use red channel from footage for tracking 
+
+    :type: bool
+    '''
+
+    weight: float = None
+    '''Influence of this track on a final solution 
+
+    :type: float
+    '''
+
+    weight_stab: float = None
+    '''Influence of this track on 2D stabilization 
+
+    :type: float
+    '''
+
+
+class MovieTrackingTracks:
+    '''Collection of movie tracking tracks '''
+
+    active: 'MovieTrackingTrack' = None
+    '''Active track in this tracking data object 
+
+    :type: 'MovieTrackingTrack'
+    '''
+
+    def new(self, name: str = "", frame: int = 1) -> 'MovieTrackingTrack':
+        '''Create new motion track in this movie clip 
+
+        :param name: Name of new track 
+        :type name: str
+        :param frame: Frame, Frame number to add track on 
+        :type frame: int
+        :rtype: 'MovieTrackingTrack'
+        :return:  Newly created track 
+        '''
+        pass
+
+
+class MulticamSequence:
+    '''Sequence strip to perform multicam editing '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    multicam_source: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class MultiplySequence:
+    '''Multiply Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class MultiresModifier:
+    '''Multiresolution mesh modifier '''
+
+    filepath: str = None
+    '''Path to external displacements file 
+
+    :type: str
+    '''
+
+    is_external: bool = None
+    '''Store multires displacements outside the .blend file, to save memory 
+
+    :type: bool
+    '''
+
+    levels: int = None
+    '''Number of subdivisions to use in the viewport 
+
+    :type: int
+    '''
+
+    render_levels: int = None
+    '''The subdivision level visible at render time 
+
+    :type: int
+    '''
+
+    sculpt_levels: int = None
+    '''Number of subdivisions to use in sculpt mode 
+
+    :type: int
+    '''
+
+    show_only_control_edges: bool = None
+    '''Skip drawing/rendering of interior subdivided edges 
+
+    :type: bool
+    '''
+
+    subdivision_type: typing.Union[int, str] = None
+    '''Select type of subdivision algorithm 
+
+    :type: typing.Union[int, str]
+    '''
+
+    total_levels: int = None
+    '''Number of subdivisions for which displacements are stored 
+
+    :type: int
+    '''
+
+    use_subsurf_uv: bool = None
+    '''Use subsurf to subdivide UVs 
+
+    :type: bool
+    '''
+
+
+class MusgraveTexture:
+    '''Procedural musgrave texture '''
+
+    dimension_max: float = None
+    '''Highest fractal dimension 
+
+    :type: float
+    '''
+
+    gain: float = None
+    '''The gain multiplier 
+
+    :type: float
+    '''
+
+    lacunarity: float = None
+    '''Gap between successive frequencies 
+
+    :type: float
+    '''
+
+    musgrave_type: typing.Union[int, str] = None
+    '''Fractal noise algorithm 
+
+    :type: typing.Union[int, str]
+    '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_intensity: float = None
+    '''Intensity of the noise 
+
+    :type: float
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    octaves: float = None
+    '''Number of frequencies used 
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''The fractal offset 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class NODE_MT_add:
+    pass
+
+
+class NODE_PT_quality:
+    pass
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class NODE_UL_interface_sockets:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class NandController:
+    '''Controller passing on events based on a logical NAND operation '''
+
+    pass
+
+
+class NearSensor:
+    '''Sensor to detect nearby objects '''
+
+    distance: float = None
+    '''Trigger distance 
+
+    :type: float
+    '''
+
+    property: str = None
+    '''Only look for objects with this property (blank = all objects) 
+
+    :type: str
+    '''
+
+    reset_distance: float = None
+    '''The distance where the sensor forgets the actor 
+
+    :type: float
+    '''
+
+
+class NlaStrip:
+    '''A container referencing an existing Action '''
+
+    action: 'Action' = None
+    '''Action referenced by this strip 
+
+    :type: 'Action'
+    '''
+
+    action_frame_end: float = None
+    '''Last frame from action to use 
+
+    :type: float
+    '''
+
+    action_frame_start: float = None
+    '''First frame from action to use 
+
+    :type: float
+    '''
+
+    active: bool = None
+    '''NLA Strip is active 
+
+    :type: bool
+    '''
+
+    blend_in: float = None
+    '''Number of frames at start of strip to fade in influence 
+
+    :type: float
+    '''
+
+    blend_out: float = None
+    '''
+
+    :type: float
+    '''
+
+    blend_type: typing.Union[int, str] = None
+    '''Method used for combining strip’s result with accumulated result 
+
+    :type: typing.Union[int, str]
+    '''
+
+    extrapolation: typing.Union[int, str] = None
+    '''Action to take for gaps past the strip extents 
+
+    :type: typing.Union[int, str]
+    '''
+
+    fcurves: typing.List['NlaStripFCurves'] = None
+    '''F-Curves for controlling the strip’s influence and timing 
+
+    :type: typing.List['NlaStripFCurves']
+    '''
+
+    frame_end: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''
+
+    :type: float
+    '''
+
+    influence: float = None
+    '''Amount the strip contributes to the current result 
+
+    :type: float
+    '''
+
+    modifiers: typing.List['FModifier'] = None
+    '''Modifiers affecting all the F-Curves in the referenced Action 
+
+    :type: typing.List['FModifier']
+    '''
+
+    mute: bool = None
+    '''NLA Strip is not evaluated 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    repeat: float = None
+    '''Number of times to repeat the action range 
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''Scaling factor for action 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''NLA Strip is selected 
+
+    :type: bool
+    '''
+
+    strip_time: float = None
+    '''Frame of referenced Action to evaluate 
+
+    :type: float
+    '''
+
+    strips: typing.List['NlaStrip'] = None
+    '''NLA Strips that this strip acts as a container for (if it is of type Meta) 
+
+    :type: typing.List['NlaStrip']
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of NLA Strip 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_animated_influence: bool = None
+    '''Influence setting is controlled by an F-Curve rather than automatically determined 
+
+    :type: bool
+    '''
+
+    use_animated_time: bool = None
+    '''Strip time is controlled by an F-Curve rather than automatically determined 
+
+    :type: bool
+    '''
+
+    use_animated_time_cyclic: bool = None
+    '''Cycle the animated time within the action start & end 
+
+    :type: bool
+    '''
+
+    use_auto_blend: bool = None
+    '''Number of frames for Blending In/Out is automatically determined from overlapping strips 
+
+    :type: bool
+    '''
+
+    use_reverse: bool = None
+    '''NLA Strip is played back in reverse order (only when timing is automatically determined) 
+
+    :type: bool
+    '''
+
+    use_sync_length: bool = None
+    '''Update range of frames referenced from action after tweaking strip and its keyframes 
+
+    :type: bool
+    '''
+
+
+class NlaStripFCurves:
+    '''Collection of NLA strip F-Curves '''
+
+    def find(self, data_path: str, index: int = 0) -> 'FCurve':
+        '''Find an F-Curve. Note that this function performs a linear scan of all F-Curves in the NLA strip. 
+
+        :param data_path: Data Path, F-Curve data path 
+        :type data_path: str
+        :param index: Index, Array index 
+        :type index: int
+        :rtype: 'FCurve'
+        :return:  The found F-Curve, or None if it doesn’t exist 
+        '''
+        pass
+
+
+class NlaStrips:
+    '''Collection of Nla Strips '''
+
+    def new(self, name: str, start: int, action: 'Action') -> 'NlaStrip':
+        '''Add a new Action-Clip strip to the track 
+
+        :param name: Name for the NLA Strips 
+        :type name: str
+        :param start: Start Frame, Start frame for this strip 
+        :type start: int
+        :param action: Action to assign to this strip 
+        :type action: 'Action'
+        :rtype: 'NlaStrip'
+        :return:  New NLA Strip 
+        '''
+        pass
+
+    def remove(self, strip: 'NlaStrip'):
+        '''Remove a NLA Strip 
+
+        :param strip: NLA Strip to remove 
+        :type strip: 'NlaStrip'
+        '''
+        pass
+
+
+class NlaTrack:
+    '''A animation layer containing Actions referenced as NLA strips '''
+
+    active: bool = None
+    '''NLA Track is active 
+
+    :type: bool
+    '''
+
+    is_solo: bool = None
+    '''NLA Track is evaluated itself (i.e. active Action and all other NLA Tracks in the same AnimData block are disabled) 
+
+    :type: bool
+    '''
+
+    lock: bool = None
+    '''NLA Track is locked 
+
+    :type: bool
+    '''
+
+    mute: bool = None
+    '''NLA Track is not evaluated 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''NLA Track is selected 
+
+    :type: bool
+    '''
+
+    strips: typing.List['NlaStrips'] = None
+    '''NLA Strips on this NLA-track 
+
+    :type: typing.List['NlaStrips']
+    '''
+
+
+class NlaTracks:
+    '''Collection of NLA Tracks '''
+
+    active: 'NlaTrack' = None
+    '''Active Object constraint 
+
+    :type: 'NlaTrack'
+    '''
+
+    def new(self, prev: 'NlaTrack' = None) -> 'NlaTrack':
+        '''Add a new NLA Track 
+
+        :param prev: NLA Track to add the new one after 
+        :type prev: 'NlaTrack'
+        :rtype: 'NlaTrack'
+        :return:  New NLA Track 
+        '''
+        pass
+
+    def remove(self, track: 'NlaTrack'):
+        '''Remove a NLA Track 
+
+        :param track: NLA Track to remove 
+        :type track: 'NlaTrack'
+        '''
+        pass
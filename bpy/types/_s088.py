@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Node:
+    '''Node in a node tree '''
+
+    bl_description: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_height_default: float = None
+    '''
+
+    :type: float
+    '''
+
+    bl_height_max: float = None
+    '''
+
+    :type: float
+    '''
+
+    bl_height_min: float = None
+    '''
+
+    :type: float
+    '''
+
+    bl_icon: typing.Union[int, str] = None
+    '''The node icon 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''The node label 
+
+    :type: str
+    '''
+
+    bl_static_type: typing.Union[int, str] = None
+    '''Node type (deprecated, use with care) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bl_width_default: float = None
+    '''
+
+    :type: float
+    '''
+
+    bl_width_max: float = None
+    '''
+
+    :type: float
+    '''
+
+    bl_width_min: float = None
+    '''
+
+    :type: float
+    '''
+
+    color: float = None
+    '''Custom color of the node body 
+
+    :type: float
+    '''
+
+    dimensions: float = None
+    '''Absolute bounding box dimensions of the node 
+
+    :type: float
+    '''
+
+    height: float = None
+    '''Height of the node 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    inputs: typing.List['NodeInputs'] = None
+    '''
+
+    :type: typing.List['NodeInputs']
+    '''
+
+    internal_links: typing.List['NodeLink'] = None
+    '''Internal input-to-output connections for muting 
+
+    :type: typing.List['NodeLink']
+    '''
+
+    label: str = None
+    '''Optional custom node label 
+
+    :type: str
+    '''
+
+    location: float = None
+    '''
+
+    :type: float
+    '''
+
+    mute: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Unique node identifier 
+
+    :type: str
+    '''
+
+    outputs: typing.List['NodeSocket'] = None
+    '''
+
+    :type: typing.List['NodeSocket']
+    '''
+
+    parent: 'Node' = None
+    '''Parent this node is attached to 
+
+    :type: 'Node'
+    '''
+
+    select: bool = None
+    '''Node selection state 
+
+    :type: bool
+    '''
+
+    shading_compatibility: typing.Set[typing.Union[int, str]] = None
+    '''
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    show_options: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_preview: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_texture: bool = None
+    '''Draw node in viewport textured draw mode 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Node type (deprecated, use bl_static_type or bl_idname for the actual identifier string) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_custom_color: bool = None
+    '''Use custom color for the node 
+
+    :type: bool
+    '''
+
+    width: float = None
+    '''Width of the node 
+
+    :type: float
+    '''
+
+    width_hidden: float = None
+    '''Width of the node in hidden state 
+
+    :type: float
+    '''
+
+    def socket_value_update(self, context):
+        '''Update after property changes 
+
+        '''
+        pass
+
+    def poll_instance(self, node_tree: 'NodeTree') -> bool:
+        '''If non-null output is returned, the node can be added to the tree 
+
+        :param node_tree: Node Tree 
+        :type node_tree: 'NodeTree'
+        :rtype: bool
+        '''
+        pass
+
+    def update(self, ):
+        '''Update on editor changes 
+
+        '''
+        pass
+
+    def insert_link(self, link: 'NodeLink'):
+        '''Handle creation of a link to or from the node 
+
+        :param link: Link, Node link that will be inserted 
+        :type link: 'NodeLink'
+        '''
+        pass
+
+    def init(self, context):
+        '''Initialize a new instance of this node 
+
+        '''
+        pass
+
+    def copy(self, node: 'Node'):
+        '''Initialize a new instance of this node from an existing node 
+
+        :param node: Node, Existing node to copy 
+        :type node: 'Node'
+        '''
+        pass
+
+    def free(self, ):
+        '''Clean up node on removal 
+
+        '''
+        pass
+
+    def draw_buttons(self, context, layout: 'UILayout'):
+        '''Draw node buttons 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def draw_buttons_ext(self, context, layout: 'UILayout'):
+        '''Draw node buttons in the sidebar 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def draw_label(self, ) -> str:
+        '''Returns a dynamic label string 
+
+        :rtype: str
+        :return:  Label 
+        '''
+        pass
+
+
+class NodeCustomGroup:
+    '''Base node type for custom registered node group types '''
+
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''
+
+    :type: 'NodeTree'
+    '''
+
+
+class NodeFrame:
+    label_size: int = None
+    '''Font size to use for displaying the label 
+
+    :type: int
+    '''
+
+    shrink: bool = None
+    '''Shrink the frame to minimal bounding box 
+
+    :type: bool
+    '''
+
+    text: 'Text' = None
+    '''
+
+    :type: 'Text'
+    '''
+
+
+class NodeGroup:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''
+
+    :type: 'NodeTree'
+    '''
+
+
+class NodeGroupInput:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+
+class NodeGroupOutput:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    is_active_output: bool = None
+    '''True if this node is used as the active group output 
+
+    :type: bool
+    '''
+
+
+class NodeInputs:
+    '''Collection of Node Sockets '''
+
+    def new(self, type: str, name: str, identifier: str = "") -> 'NodeSocket':
+        '''Add a socket to this node 
+
+        :param type: Type, Data type 
+        :type type: str
+        :param name: Name 
+        :type name: str
+        :param identifier: Identifier, Unique socket identifier 
+        :type identifier: str
+        :rtype: 'NodeSocket'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocket'):
+        '''Remove a socket from this node 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocket'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all sockets from this node 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a socket to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class NodeInstanceHash:
+    '''Hash table containing node instance data '''
+
+    pass
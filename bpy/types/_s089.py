@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class NodeInternal:
+    def poll_instance(self, node_tree: 'NodeTree') -> bool:
+        '''If non-null output is returned, the node can be added to the tree 
+
+        :param node_tree: Node Tree 
+        :type node_tree: 'NodeTree'
+        :rtype: bool
+        '''
+        pass
+
+    def update(self, ):
+        '''Update on editor changes 
+
+        '''
+        pass
+
+    def draw_buttons(self, context, layout: 'UILayout'):
+        '''Draw node buttons 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def draw_buttons_ext(self, context, layout: 'UILayout'):
+        '''Draw node buttons in the sidebar 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+
+class NodeInternalSocketTemplate:
+    '''Type and default value of a node socket '''
+
+    identifier: str = None
+    '''Identifier of the socket 
+
+    :type: str
+    '''
+
+    name: str = None
+    '''Name of the socket 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Data type of the socket 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class NodeLink:
+    '''Link is valid '''
+
+    from_node: 'Node' = None
+    '''
+
+    :type: 'Node'
+    '''
+
+    from_socket: 'NodeSocket' = None
+    '''
+
+    :type: 'NodeSocket'
+    '''
+
+    is_hidden: bool = None
+    '''Link is hidden due to invisible sockets 
+
+    :type: bool
+    '''
+
+    is_valid: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    to_node: 'Node' = None
+    '''
+
+    :type: 'Node'
+    '''
+
+    to_socket: 'NodeSocket' = None
+    '''
+
+    :type: 'NodeSocket'
+    '''
+
+
+class NodeLinks:
+    '''Collection of Node Links '''
+
+    def new(self,
+            input: 'NodeSocket',
+            output: 'NodeSocket',
+            verify_limits: bool = True) -> 'NodeLink':
+        '''Add a node link to this node tree 
+
+        :param input: The input socket 
+        :type input: 'NodeSocket'
+        :param output: The output socket 
+        :type output: 'NodeSocket'
+        :param verify_limits: Verify Limits, Remove existing links if connection limit is exceeded 
+        :type verify_limits: bool
+        :rtype: 'NodeLink'
+        :return:  New node link 
+        '''
+        pass
+
+    def remove(self, link: 'NodeLink'):
+        '''remove a node link from the node tree 
+
+        :param link: The node link to remove 
+        :type link: 'NodeLink'
+        '''
+        pass
+
+    def clear(self, ):
+        '''remove all node links from the node tree 
+
+        '''
+        pass
+
+
+class NodeOutputFileSlotFile:
+    '''Single layer file slot of the file output node '''
+
+    format: 'ImageFormatSettings' = None
+    '''
+
+    :type: 'ImageFormatSettings'
+    '''
+
+    path: str = None
+    '''Subpath used for this slot 
+
+    :type: str
+    '''
+
+    use_node_format: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class NodeOutputFileSlotLayer:
+    '''Multilayer slot of the file output node '''
+
+    name: str = None
+    '''OpenEXR layer name used for this slot 
+
+    :type: str
+    '''
+
+
+class NodeOutputs:
+    '''Collection of Node Sockets '''
+
+    def new(self, type: str, name: str, identifier: str = "") -> 'NodeSocket':
+        '''Add a socket to this node 
+
+        :param type: Type, Data type 
+        :type type: str
+        :param name: Name 
+        :type name: str
+        :param identifier: Identifier, Unique socket identifier 
+        :type identifier: str
+        :rtype: 'NodeSocket'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocket'):
+        '''Remove a socket from this node 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocket'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all sockets from this node 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a socket to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class NodeReroute:
+    pass
+
+
+class NodeSetting:
+    value: str = None
+    '''Python expression to be evaluated as the initial node setting 
+
+    :type: str
+    '''
+
+
+class NodeSocket:
+    '''Input or output socket of a node '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    enabled: bool = None
+    '''Enable the socket 
+
+    :type: bool
+    '''
+
+    hide: bool = None
+    '''Hide the socket 
+
+    :type: bool
+    '''
+
+    hide_value: bool = None
+    '''Hide the socket input value 
+
+    :type: bool
+    '''
+
+    identifier: str = None
+    '''Unique identifier for mapping sockets 
+
+    :type: str
+    '''
+
+    is_linked: bool = None
+    '''True if the socket is connected 
+
+    :type: bool
+    '''
+
+    is_output: bool = None
+    '''True if the socket is an output, otherwise input 
+
+    :type: bool
+    '''
+
+    link_limit: int = None
+    '''Max number of links allowed for this socket 
+
+    :type: int
+    '''
+
+    name: str = None
+    '''Socket name 
+
+    :type: str
+    '''
+
+    node: 'Node' = None
+    '''Node owning this socket 
+
+    :type: 'Node'
+    '''
+
+    show_expanded: bool = None
+    '''Socket links are expanded in the user interface 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Data type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+    def draw(self, context, layout: 'UILayout', node: 'Node', text: str):
+        '''Draw socket 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        :param node: Node, Node the socket belongs to 
+        :type node: 'Node'
+        :param text: Text, Text label to draw alongside properties 
+        :type text: str
+        '''
+        pass
+
+    def draw_color(self, context, node: 'Node') -> float:
+        '''Color of the socket icon 
+
+        :param node: Node, Node the socket belongs to 
+        :type node: 'Node'
+        :rtype: float
+        :return:  Color 
+        '''
+        pass
+
+
+class NodeSocketBool:
+    '''Boolean value socket of a node '''
+
+    default_value: bool = None
+    '''Input value used for unconnected socket 
+
+    :type: bool
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketColor:
+    '''RGBA color socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketFloat:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketFloatAngle:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketFloatFactor:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketFloatPercentage:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class NodeSocketFloatTime:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketFloatUnsigned:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketInt:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketIntFactor:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketIntPercentage:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketIntUnsigned:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketInterface:
+    '''Parameters to define node sockets '''
+
+    bl_socket_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    identifier: str = None
+    '''Unique identifier for mapping sockets 
+
+    :type: str
+    '''
+
+    is_output: bool = None
+    '''True if the socket is an output, otherwise input 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Socket name 
+
+    :type: str
+    '''
+
+    def draw(self, context, layout: 'UILayout'):
+        '''Draw template settings 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def draw_color(self, context) -> float:
+        '''Color of the socket icon 
+
+        :rtype: float
+        :return:  Color 
+        '''
+        pass
+
+    def register_properties(self, data_rna_type: 'Struct'):
+        '''Define RNA properties of a socket 
+
+        :param data_rna_type: Data RNA Type, RNA type for special socket properties 
+        :type data_rna_type: 'Struct'
+        '''
+        pass
+
+    def init_socket(self, node: 'Node', socket: 'NodeSocket', data_path: str):
+        '''Initialize a node socket instance 
+
+        :param node: Node, Node of the socket to initialize 
+        :type node: 'Node'
+        :param socket: Socket, Socket to initialize 
+        :type socket: 'NodeSocket'
+        :param data_path: Data Path, Path to specialized socket data 
+        :type data_path: str
+        '''
+        pass
+
+    def from_socket(self, node: 'Node', socket: 'NodeSocket'):
+        '''Setup template parameters from an existing socket 
+
+        :param node: Node, Node of the original socket 
+        :type node: 'Node'
+        :param socket: Socket, Original socket 
+        :type socket: 'NodeSocket'
+        '''
+        pass
+
+
+class NodeSocketInterfaceBool:
+    '''Boolean value socket of a node '''
+
+    default_value: bool = None
+    '''Input value used for unconnected socket 
+
+    :type: bool
+    '''
+
+
+class NodeSocketInterfaceColor:
+    '''RGBA color socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloat:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloatAngle:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloatFactor:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloatPercentage:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloatTime:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceFloatUnsigned:
+    '''Floating point number socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceInt:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    max_value: int = None
+    '''Maximum value 
+
+    :type: int
+    '''
+
+    min_value: int = None
+    '''Minimum value 
+
+    :type: int
+    '''
+
+
+class NodeSocketInterfaceIntFactor:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    max_value: int = None
+    '''Maximum value 
+
+    :type: int
+    '''
+
+    min_value: int = None
+    '''Minimum value 
+
+    :type: int
+    '''
+
+
+class NodeSocketInterfaceIntPercentage:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    max_value: int = None
+    '''Maximum value 
+
+    :type: int
+    '''
+
+    min_value: int = None
+    '''Minimum value 
+
+    :type: int
+    '''
+
+
+class NodeSocketInterfaceIntUnsigned:
+    '''Integer number socket of a node '''
+
+    default_value: int = None
+    '''Input value used for unconnected socket 
+
+    :type: int
+    '''
+
+    max_value: int = None
+    '''Maximum value 
+
+    :type: int
+    '''
+
+    min_value: int = None
+    '''Minimum value 
+
+    :type: int
+    '''
+
+
+class NodeSocketInterfaceShader:
+    '''Shader socket of a node '''
+
+    pass
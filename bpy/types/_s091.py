@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class NodeSocketInterfaceStandard:
+    type: typing.Union[int, str] = None
+    '''Data type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw(self, context, layout: 'UILayout'):
+        '''Draw template settings 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def draw_color(self, context) -> float:
+        '''Color of the socket icon 
+
+        :rtype: float
+        :return:  Color 
+        '''
+        pass
+
+
+class NodeSocketInterfaceString:
+    '''String socket of a node '''
+
+    default_value: str = None
+    '''Input value used for unconnected socket 
+
+    :type: str
+    '''
+
+
+class NodeSocketInterfaceVector:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorAcceleration:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorDirection:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorEuler:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorTranslation:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorVelocity:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketInterfaceVectorXYZ:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    max_value: float = None
+    '''Maximum value 
+
+    :type: float
+    '''
+
+    min_value: float = None
+    '''Minimum value 
+
+    :type: float
+    '''
+
+
+class NodeSocketShader:
+    '''Shader socket of a node '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketStandard:
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+    def draw(self, context, layout: 'UILayout', node: 'Node', text: str):
+        '''Draw socket 
+
+        :param layout: Layout, Layout in the UI 
+        :type layout: 'UILayout'
+        :param node: Node, Node the socket belongs to 
+        :type node: 'Node'
+        :param text: Text, Text label to draw alongside properties 
+        :type text: str
+        '''
+        pass
+
+    def draw_color(self, context, node: 'Node') -> float:
+        '''Color of the socket icon 
+
+        :param node: Node, Node the socket belongs to 
+        :type node: 'Node'
+        :rtype: float
+        :return:  Color 
+        '''
+        pass
+
+
+class NodeSocketString:
+    '''String socket of a node '''
+
+    default_value: str = None
+    '''Input value used for unconnected socket 
+
+    :type: str
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVector:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorAcceleration:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorDirection:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorEuler:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorTranslation:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorVelocity:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVectorXYZ:
+    '''3D vector socket of a node '''
+
+    default_value: float = None
+    '''Input value used for unconnected socket 
+
+    :type: float
+    '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
+
+
+class NodeSocketVirtual:
+    '''Virtual socket of a node '''
+
+    links = None
+    '''List of node links from or to this socket (readonly) '''
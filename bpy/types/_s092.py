@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class NodeTree:
+    '''Node tree consisting of linked nodes used for shading, textures and compositing '''
+
+    active_input: int = None
+    '''Index of the active input 
+
+    :type: int
+    '''
+
+    active_output: int = None
+    '''Index of the active output 
+
+    :type: int
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    bl_description: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_icon: typing.Union[int, str] = None
+    '''The node tree icon 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''The node tree label 
+
+    :type: str
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease Pencil data-block 
+
+    :type: 'GreasePencil'
+    '''
+
+    inputs: typing.List['NodeTreeInputs'] = None
+    '''Node tree inputs 
+
+    :type: typing.List['NodeTreeInputs']
+    '''
+
+    links: typing.List['NodeLinks'] = None
+    '''
+
+    :type: typing.List['NodeLinks']
+    '''
+
+    nodes: typing.List['Nodes'] = None
+    '''
+
+    :type: typing.List['Nodes']
+    '''
+
+    outputs: typing.List['NodeSocketInterface'] = None
+    '''Node tree outputs 
+
+    :type: typing.List['NodeSocketInterface']
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Node Tree type (deprecated, bl_idname is the actual node tree type identifier) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    view_center: float = None
+    '''
+
+    :type: float
+    '''
+
+    def interface_update(self, context):
+        '''Updated node group interface 
+
+        '''
+        pass
+
+    def update(self, ):
+        '''Update on editor changes 
+
+        '''
+        pass
+
+
+class NodeTreeInputs:
+    '''Collection of Node Tree Sockets '''
+
+    def new(self, type: str, name: str) -> 'NodeSocketInterface':
+        '''Add a socket to this node tree 
+
+        :param type: Type, Data type 
+        :type type: str
+        :param name: Name 
+        :type name: str
+        :rtype: 'NodeSocketInterface'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocketInterface'):
+        '''Remove a socket from this node tree 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocketInterface'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all sockets from this node tree 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a socket to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class NodeTreeOutputs:
+    '''Collection of Node Tree Sockets '''
+
+    def new(self, type: str, name: str) -> 'NodeSocketInterface':
+        '''Add a socket to this node tree 
+
+        :param type: Type, Data type 
+        :type type: str
+        :param name: Name 
+        :type name: str
+        :rtype: 'NodeSocketInterface'
+        :return:  New socket 
+        '''
+        pass
+
+    def remove(self, socket: 'NodeSocketInterface'):
+        '''Remove a socket from this node tree 
+
+        :param socket: The socket to remove 
+        :type socket: 'NodeSocketInterface'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all sockets from this node tree 
+
+        '''
+        pass
+
+    def move(self, from_index: int, to_index: int):
+        '''Move a socket to another position 
+
+        :param from_index: From Index, Index of the socket to move 
+        :type from_index: int
+        :param to_index: To Index, Target index for the socket 
+        :type to_index: int
+        '''
+        pass
+
+
+class NodeTreePath:
+    '''Element of the node space tree path '''
+
+    node_tree: 'NodeTree' = None
+    '''Base node tree from context 
+
+    :type: 'NodeTree'
+    '''
+
+
+class Nodes:
+    '''Collection of Nodes '''
+
+    active: 'Node' = None
+    '''Active node in this tree 
+
+    :type: 'Node'
+    '''
+
+    def new(self, type: str) -> 'Node':
+        '''Add a node to this node tree 
+
+        :param type: Type, Type of node to add (Warning: should be same as node.bl_idname, not node.type!) 
+        :type type: str
+        :rtype: 'Node'
+        :return:  New node 
+        '''
+        pass
+
+    def remove(self, node: 'Node'):
+        '''Remove a node from this node tree 
+
+        :param node: The node to remove 
+        :type node: 'Node'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all nodes from this node tree 
+
+        '''
+        pass
+
+
+class NoiseTexture:
+    '''Procedural noise texture '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class NorController:
+    '''Controller passing on events based on a logical NOR operation '''
+
+    pass
+
+
+class NormalEditModifier:
+    '''Modifier affecting/generating custom normals '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    mix_factor: float = None
+    '''How much of generated normals to mix with exiting ones 
+
+    :type: float
+    '''
+
+    mix_limit: float = None
+    '''Maximum angle between old and new normals 
+
+    :type: float
+    '''
+
+    mix_mode: typing.Union[int, str] = None
+    '''How to mix generated normals with existing ones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''How to affect (generate) normals 
+
+    :type: typing.Union[int, str]
+    '''
+
+    offset: float = None
+    '''Offset from object’s center 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Target object used to affect normals 
+
+    :type: 'Object'
+    '''
+
+    use_direction_parallel: bool = None
+    '''Use same direction for all normals, from origin to target’s center (Directional mode only) 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name for selecting/weighting the affected areas 
+
+    :type: str
+    '''
@@ -0,0 +1,783 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Object:
+    '''Object data-block defining an object in a scene '''
+
+    active_material: 'Material' = None
+    '''Active material being displayed 
+
+    :type: 'Material'
+    '''
+
+    active_material_index: int = None
+    '''Index of active material slot 
+
+    :type: int
+    '''
+
+    active_shape_key: 'ShapeKey' = None
+    '''Current shape key 
+
+    :type: 'ShapeKey'
+    '''
+
+    active_shape_key_index: int = None
+    '''Current shape key index 
+
+    :type: int
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    animation_visualization: 'AnimViz' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimViz'
+    '''
+
+    bound_box: float = None
+    '''Object’s bounding box in object-space coordinates, all values are -1.0 when not available 
+
+    :type: float
+    '''
+
+    collision: 'CollisionSettings' = None
+    '''Settings for using the object as a collider in physics simulation 
+
+    :type: 'CollisionSettings'
+    '''
+
+    color: float = None
+    '''Object color and alpha, used when faces have the ObColor mode enabled 
+
+    :type: float
+    '''
+
+    constraints: typing.List['ObjectConstraints'] = None
+    '''Constraints affecting the transformation of the object 
+
+    :type: typing.List['ObjectConstraints']
+    '''
+
+    cycles: 'CyclesObjectSettings' = None
+    '''Cycles object settings 
+
+    :type: 'CyclesObjectSettings'
+    '''
+
+    cycles_visibility: 'CyclesVisibilitySettings' = None
+    '''Cycles visibility settings 
+
+    :type: 'CyclesVisibilitySettings'
+    '''
+
+    data: 'ID' = None
+    '''Object data 
+
+    :type: 'ID'
+    '''
+
+    delta_location: float = None
+    '''Extra translation added to the location of the object 
+
+    :type: float
+    '''
+
+    delta_rotation_euler: float = None
+    '''Extra rotation added to the rotation of the object (when using Euler rotations) 
+
+    :type: float
+    '''
+
+    delta_rotation_quaternion: float = None
+    '''Extra rotation added to the rotation of the object (when using Quaternion rotations) 
+
+    :type: float
+    '''
+
+    delta_scale: float = None
+    '''Extra scaling added to the scale of the object 
+
+    :type: float
+    '''
+
+    dimensions: float = None
+    '''Absolute bounding box dimensions of the object 
+
+    :type: float
+    '''
+
+    draw_bounds_type: typing.Union[int, str] = None
+    '''Object boundary display type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    draw_type: typing.Union[int, str] = None
+    '''Maximum draw type to display object with in viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dupli_faces_scale: float = None
+    '''Scale the DupliFace objects 
+
+    :type: float
+    '''
+
+    dupli_frames_end: int = None
+    '''End frame for DupliFrames 
+
+    :type: int
+    '''
+
+    dupli_frames_off: int = None
+    '''Recurring frames to exclude from the Dupliframes 
+
+    :type: int
+    '''
+
+    dupli_frames_on: int = None
+    '''Number of frames to use between DupOff frames 
+
+    :type: int
+    '''
+
+    dupli_frames_start: int = None
+    '''Start frame for DupliFrames 
+
+    :type: int
+    '''
+
+    dupli_group: 'Group' = None
+    '''Instance an existing group 
+
+    :type: 'Group'
+    '''
+
+    dupli_list: typing.List['DupliObject'] = None
+    '''Object duplis 
+
+    :type: typing.List['DupliObject']
+    '''
+
+    dupli_type: typing.Union[int, str] = None
+    '''If not None, object duplication method to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    empty_draw_size: float = None
+    '''Size of display for empties in the viewport 
+
+    :type: float
+    '''
+
+    empty_draw_type: typing.Union[int, str] = None
+    '''Viewport display style for empties 
+
+    :type: typing.Union[int, str]
+    '''
+
+    empty_image_offset: float = None
+    '''Origin offset distance 
+
+    :type: float
+    '''
+
+    field: 'FieldSettings' = None
+    '''Settings for using the object as a field in physics simulation 
+
+    :type: 'FieldSettings'
+    '''
+
+    game: 'GameObjectSettings' = None
+    '''Game engine related settings for the object 
+
+    :type: 'GameObjectSettings'
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease Pencil data-block 
+
+    :type: 'GreasePencil'
+    '''
+
+    hide: bool = None
+    '''Restrict visibility in the viewport 
+
+    :type: bool
+    '''
+
+    hide_render: bool = None
+    '''Restrict renderability 
+
+    :type: bool
+    '''
+
+    hide_select: bool = None
+    '''Restrict selection in the viewport 
+
+    :type: bool
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    is_duplicator: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    layers: bool = None
+    '''Layers the object is on 
+
+    :type: bool
+    '''
+
+    layers_local_view: bool = None
+    '''3D local view layers the object is on 
+
+    :type: bool
+    '''
+
+    location: float = None
+    '''Location of the object 
+
+    :type: float
+    '''
+
+    lock_location: bool = None
+    '''Lock editing of location in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotation: bool = None
+    '''Lock editing of rotation in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotation_w: bool = None
+    '''Lock editing of ‘angle’ component of four-component rotations in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotations_4d: bool = None
+    '''Lock editing of four component rotations by components (instead of as Eulers) 
+
+    :type: bool
+    '''
+
+    lock_scale: bool = None
+    '''Lock editing of scale in the interface 
+
+    :type: bool
+    '''
+
+    lod_levels: typing.List['LodLevel'] = None
+    '''A collection of detail levels to automatically switch between 
+
+    :type: typing.List['LodLevel']
+    '''
+
+    material_slots: typing.List['MaterialSlot'] = None
+    '''Material slots in the object 
+
+    :type: typing.List['MaterialSlot']
+    '''
+
+    matrix_basis: float = None
+    '''Matrix access to location, rotation and scale (including deltas), before constraints and parenting are applied 
+
+    :type: float
+    '''
+
+    matrix_local: float = None
+    '''Parent relative transformation matrix - WARNING: Only takes into account ‘Object’ parenting, so e.g. in case of bone parenting you get a matrix relative to the Armature object, not to the actual parent bone 
+
+    :type: float
+    '''
+
+    matrix_parent_inverse: float = None
+    '''Inverse of object’s parent matrix at time of parenting 
+
+    :type: float
+    '''
+
+    matrix_world: float = None
+    '''Worldspace transformation matrix 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Object interaction mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    modifiers: typing.List['ObjectModifiers'] = None
+    '''Modifiers affecting the geometric data of the object 
+
+    :type: typing.List['ObjectModifiers']
+    '''
+
+    motion_path: 'MotionPath' = None
+    '''Motion Path for this element 
+
+    :type: 'MotionPath'
+    '''
+
+    parent: 'Object' = None
+    '''Parent Object 
+
+    :type: 'Object'
+    '''
+
+    parent_bone: str = None
+    '''Name of parent bone in case of a bone parenting relation 
+
+    :type: str
+    '''
+
+    parent_type: typing.Union[int, str] = None
+    '''Type of parent relation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    parent_vertices: int = None
+    '''Indices of vertices in case of a vertex parenting relation 
+
+    :type: int
+    '''
+
+    particle_systems: typing.List['ParticleSystem'] = None
+    '''Particle systems emitted from the object 
+
+    :type: typing.List['ParticleSystem']
+    '''
+
+    pass_index: int = None
+    '''Index number for the “Object Index” render pass 
+
+    :type: int
+    '''
+
+    pose: 'Pose' = None
+    '''Current pose for armatures 
+
+    :type: 'Pose'
+    '''
+
+    pose_library: 'Action' = None
+    '''Action used as a pose library for armatures 
+
+    :type: 'Action'
+    '''
+
+    proxy: 'Object' = None
+    '''Library object this proxy object controls 
+
+    :type: 'Object'
+    '''
+
+    proxy_group: 'Object' = None
+    '''Library group duplicator object this proxy object controls 
+
+    :type: 'Object'
+    '''
+
+    rigid_body: 'RigidBodyObject' = None
+    '''Settings for rigid body simulation 
+
+    :type: 'RigidBodyObject'
+    '''
+
+    rigid_body_constraint: 'RigidBodyConstraint' = None
+    '''Constraint constraining rigid bodies 
+
+    :type: 'RigidBodyConstraint'
+    '''
+
+    rotation_axis_angle: float = None
+    '''Angle of Rotation for Axis-Angle rotation representation 
+
+    :type: float
+    '''
+
+    rotation_euler: float = None
+    '''Rotation in Eulers 
+
+    :type: float
+    '''
+
+    rotation_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    rotation_quaternion: float = None
+    '''Rotation in Quaternions 
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''Scaling of the object 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Object selection state 
+
+    :type: bool
+    '''
+
+    show_all_edges: bool = None
+    '''Display all edges for mesh objects 
+
+    :type: bool
+    '''
+
+    show_axis: bool = None
+    '''Display the object’s origin and axes 
+
+    :type: bool
+    '''
+
+    show_bounds: bool = None
+    '''Display the object’s bounds 
+
+    :type: bool
+    '''
+
+    show_name: bool = None
+    '''Display the object’s name 
+
+    :type: bool
+    '''
+
+    show_only_shape_key: bool = None
+    '''Always show the current Shape for this Object 
+
+    :type: bool
+    '''
+
+    show_texture_space: bool = None
+    '''Display the object’s texture space 
+
+    :type: bool
+    '''
+
+    show_transparent: bool = None
+    '''Display material transparency in the object (unsupported for duplicator drawing) 
+
+    :type: bool
+    '''
+
+    show_wire: bool = None
+    '''Add the object’s wireframe over solid drawing 
+
+    :type: bool
+    '''
+
+    show_x_ray: bool = None
+    '''Make the object draw in front of others (unsupported for duplicator drawing) 
+
+    :type: bool
+    '''
+
+    slow_parent_offset: float = None
+    '''Delay in the parent relationship 
+
+    :type: float
+    '''
+
+    soft_body: 'SoftBodySettings' = None
+    '''Settings for soft body simulation 
+
+    :type: 'SoftBodySettings'
+    '''
+
+    track_axis: typing.Union[int, str] = None
+    '''Axis that points in ‘forward’ direction (applies to DupliFrame when parent ‘Follow’ is enabled) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of Object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''Axis that points in the upward direction (applies to DupliFrame when parent ‘Follow’ is enabled) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_dupli_faces_scale: bool = None
+    '''Scale dupli based on face size 
+
+    :type: bool
+    '''
+
+    use_dupli_frames_speed: bool = None
+    '''Set dupliframes to use the current frame instead of parent curve’s evaluation time 
+
+    :type: bool
+    '''
+
+    use_dupli_vertices_rotation: bool = None
+    '''Rotate dupli according to vertex normal 
+
+    :type: bool
+    '''
+
+    use_dynamic_topology_sculpting: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_extra_recalc_data: bool = None
+    '''Refresh this object’s data again on frame changes, dependency graph hack 
+
+    :type: bool
+    '''
+
+    use_extra_recalc_object: bool = None
+    '''Refresh this object again on frame changes, dependency graph hack 
+
+    :type: bool
+    '''
+
+    use_shape_key_edit_mode: bool = None
+    '''Apply shape keys in edit mode (for Meshes only) 
+
+    :type: bool
+    '''
+
+    use_slow_parent: bool = None
+    '''Create a delay in the parent relationship (beware: this isn’t renderfarm safe and may be invalid after jumping around the timeline) 
+
+    :type: bool
+    '''
+
+    vertex_groups: typing.List['VertexGroups'] = None
+    '''Vertex groups of the object 
+
+    :type: typing.List['VertexGroups']
+    '''
+
+    children = None
+    '''All the children of this object (readonly) '''
+
+    users_group = None
+    '''The groups this object is in (readonly) '''
+
+    users_scene = None
+    '''The scenes this object is in (readonly) '''
+
+    def convert_space(self,
+                      pose_bone: 'PoseBone' = None,
+                      matrix: float = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+                                       0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+                      from_space: typing.Union[int, str] = 'WORLD',
+                      to_space: typing.Union[int, str] = 'WORLD') -> float:
+        '''Convert (transform) the given matrix from one space to another 
+
+        :param pose_bone: Bone to use to define spaces (may be None, in which case only the two ‘WORLD’ and ‘LOCAL’ spaces are usable) 
+        :type pose_bone: 'PoseBone'
+        :param matrix: The matrix to transform 
+        :type matrix: float
+        :param from_space: The space in which ‘matrix’ is currentlyWORLD World Space, The most gobal space in Blender.POSE Pose Space, The pose space of a bone (its armature’s object space).LOCAL_WITH_PARENT Local With Parent, The local space of a bone’s parent bone.LOCAL Local Space, The local space of an object/bone. 
+        :type from_space: typing.Union[int, str]
+        :param to_space: The space to which you want to transform ‘matrix’WORLD World Space, The most gobal space in Blender.POSE Pose Space, The pose space of a bone (its armature’s object space).LOCAL_WITH_PARENT Local With Parent, The local space of a bone’s parent bone.LOCAL Local Space, The local space of an object/bone. 
+        :type to_space: typing.Union[int, str]
+        :rtype: float
+        :return:  The transformed matrix 
+        '''
+        pass
+
+    def calc_matrix_camera(self,
+                           x: int = 1,
+                           y: int = 1,
+                           scale_x: float = 1.0,
+                           scale_y: float = 1.0) -> float:
+        '''Generate the camera projection matrix of this object (mostly useful for Camera and Lamp types) 
+
+        :param x: Width of the render area 
+        :type x: int
+        :param y: Height of the render area 
+        :type y: int
+        :param scale_x: Width scaling factor 
+        :type scale_x: float
+        :param scale_y: height scaling factor 
+        :type scale_y: float
+        :rtype: float
+        :return:  The camera projection matrix 
+        '''
+        pass
+
+    def camera_fit_coords(self, scene: 'Scene', coordinates: float):
+        '''Compute the coordinate (and scale for ortho cameras) given object should be to ‘see’ all given coordinates 
+
+        :param scene: Scene to get render size information from, if available 
+        :type scene: 'Scene'
+        :param coordinates: Coordinates to fit in 
+        :type coordinates: float
+        '''
+        pass
+
+    def to_mesh(self,
+                scene: 'Scene',
+                apply_modifiers: bool,
+                settings: typing.Union[int, str],
+                calc_tessface: bool = True,
+                calc_undeformed: bool = False) -> 'Mesh':
+        '''Create a Mesh data-block with modifiers applied 
+
+        :param scene: Scene within which to evaluate modifiers 
+        :type scene: 'Scene'
+        :param apply_modifiers: Apply modifiers 
+        :type apply_modifiers: bool
+        :param settings: Modifier settings to applyPREVIEW Preview, Apply modifier preview settings.RENDER Render, Apply modifier render settings. 
+        :type settings: typing.Union[int, str]
+        :param calc_tessface: Calculate Tessellation, Calculate tessellation faces 
+        :type calc_tessface: bool
+        :param calc_undeformed: Calculate Undeformed, Calculate undeformed vertex coordinates 
+        :type calc_undeformed: bool
+        :rtype: 'Mesh'
+        :return:  Mesh created from object, remove it if it is only used for export 
+        '''
+        pass
+
+    def dupli_list_create(self,
+                          scene: 'Scene',
+                          settings: typing.Union[int, str] = 'VIEWPORT'):
+        '''Create a list of dupli objects for this object, needs to be freed manually with free_dupli_list to restore the objects real matrix and layers 
+
+        :param scene: Scene within which to evaluate duplis 
+        :type scene: 'Scene'
+        :param settings: Generate texture coordinates for renderingVIEWPORT Viewport, Generate duplis using viewport settings.PREVIEW Preview, Generate duplis using preview settings.RENDER Render, Generate duplis using render settings. 
+        :type settings: typing.Union[int, str]
+        '''
+        pass
+
+    def dupli_list_clear(self, ):
+        '''Free the list of dupli objects 
+
+        '''
+        pass
+
+    def find_armature(self, ) -> 'Object':
+        '''Find armature influencing this object as a parent or via a modifier 
+
+        :rtype: 'Object'
+        :return:  Armature object influencing this object or NULL 
+        '''
+        pass
+
+    def shape_key_add(self, name: str = "Key",
+                      from_mix: bool = True) -> 'ShapeKey':
+        '''Add shape key to this object 
+
+        :param name: Unique name for the new keyblock 
+        :type name: str
+        :param from_mix: Create new shape from existing mix of shapes 
+        :type from_mix: bool
+        :rtype: 'ShapeKey'
+        :return:  New shape keyblock 
+        '''
+        pass
+
+    def shape_key_remove(self, key: 'ShapeKey'):
+        '''Remove a Shape Key from this object 
+
+        :param key: Keyblock to be removed 
+        :type key: 'ShapeKey'
+        '''
+        pass
+
+    def ray_cast(self, origin, direction, distance: float = 1.70141e+38):
+        '''Cast a ray onto in object space 
+
+        :param distance: Maximum distance 
+        :type distance: float
+        '''
+        pass
+
+    def closest_point_on_mesh(self, origin, distance: float = 1.84467e+19):
+        '''Find the nearest point in object space 
+
+        :param distance: Maximum distance 
+        :type distance: float
+        '''
+        pass
+
+    def is_visible(self, scene) -> bool:
+        '''Determine if object is visible in a given scene 
+
+        :rtype: bool
+        :return:  Object visibility 
+        '''
+        pass
+
+    def is_modified(self, scene, settings: typing.Union[int, str]) -> bool:
+        '''Determine if this object is modified from the base mesh data 
+
+        :param settings: Modifier settings to applyPREVIEW Preview, Apply modifier preview settings.RENDER Render, Apply modifier render settings. 
+        :type settings: typing.Union[int, str]
+        :rtype: bool
+        :return:  Object visibility 
+        '''
+        pass
+
+    def is_deform_modified(self, scene,
+                           settings: typing.Union[int, str]) -> bool:
+        '''Determine if this object is modified by a deformation from the base mesh data 
+
+        :param settings: Modifier settings to applyPREVIEW Preview, Apply modifier preview settings.RENDER Render, Apply modifier render settings. 
+        :type settings: typing.Union[int, str]
+        :rtype: bool
+        :return:  Object visibility 
+        '''
+        pass
+
+    def update_from_editmode(self, ) -> bool:
+        '''Load the objects edit-mode data into the object data 
+
+        :rtype: bool
+        :return:  Success 
+        '''
+        pass
+
+    def cache_release(self, ):
+        '''Release memory used by caches associated with this object. Intended to be used by render engines only 
+
+        '''
+        pass
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ObjectActuator:
+    '''Actuator to control the object movement '''
+
+    angular_velocity: float = None
+    '''Angular velocity 
+
+    :type: float
+    '''
+
+    damping: int = None
+    '''Number of frames to reach the target velocity 
+
+    :type: int
+    '''
+
+    derivate_coefficient: float = None
+    '''Not required, high values can cause instability 
+
+    :type: float
+    '''
+
+    force: float = None
+    '''Force 
+
+    :type: float
+    '''
+
+    force_max_x: float = None
+    '''Upper limit for X force 
+
+    :type: float
+    '''
+
+    force_max_y: float = None
+    '''Upper limit for Y force 
+
+    :type: float
+    '''
+
+    force_max_z: float = None
+    '''Upper limit for Z force 
+
+    :type: float
+    '''
+
+    force_min_x: float = None
+    '''Lower limit for X force 
+
+    :type: float
+    '''
+
+    force_min_y: float = None
+    '''Lower limit for Y force 
+
+    :type: float
+    '''
+
+    force_min_z: float = None
+    '''Lower limit for Z force 
+
+    :type: float
+    '''
+
+    integral_coefficient: float = None
+    '''Low value (0.01) for slow response, high value (0.5) for fast response 
+
+    :type: float
+    '''
+
+    linear_velocity: float = None
+    '''Linear velocity (in Servo mode it sets the target relative linear velocity, it will be achieved by automatic application of force - Null velocity is a valid target) 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Specify the motion system 
+
+    :type: typing.Union[int, str]
+    '''
+
+    offset_location: float = None
+    '''Location 
+
+    :type: float
+    '''
+
+    offset_rotation: float = None
+    '''Rotation 
+
+    :type: float
+    '''
+
+    proportional_coefficient: float = None
+    '''Typical value is 60x integral coefficient 
+
+    :type: float
+    '''
+
+    reference_object: 'Object' = None
+    '''Reference object for velocity calculation, leave empty for world reference 
+
+    :type: 'Object'
+    '''
+
+    torque: float = None
+    '''Torque 
+
+    :type: float
+    '''
+
+    use_add_character_location: bool = None
+    '''Toggle between ADD and SET character location 
+
+    :type: bool
+    '''
+
+    use_add_linear_velocity: bool = None
+    '''Toggles between ADD and SET linV 
+
+    :type: bool
+    '''
+
+    use_character_jump: bool = None
+    '''Make the character jump using the settings in the physics properties 
+
+    :type: bool
+    '''
+
+    use_local_angular_velocity: bool = None
+    '''Angular velocity is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_local_force: bool = None
+    '''Force is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_local_linear_velocity: bool = None
+    '''Velocity is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_local_location: bool = None
+    '''Location is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_local_rotation: bool = None
+    '''Rotation is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_local_torque: bool = None
+    '''Torque is defined in local coordinates 
+
+    :type: bool
+    '''
+
+    use_servo_limit_x: bool = None
+    '''Set limit to force along the X axis 
+
+    :type: bool
+    '''
+
+    use_servo_limit_y: bool = None
+    '''Set limit to force along the Y axis 
+
+    :type: bool
+    '''
+
+    use_servo_limit_z: bool = None
+    '''Set limit to force along the Z axis 
+
+    :type: bool
+    '''
+
+
+class ObjectBase:
+    '''An object instance in a scene '''
+
+    layers: bool = None
+    '''Layers the object base is on 
+
+    :type: bool
+    '''
+
+    layers_local_view: bool = None
+    '''3D local view layers the object base is on 
+
+    :type: bool
+    '''
+
+    object: 'Object' = None
+    '''Object this base links to 
+
+    :type: 'Object'
+    '''
+
+    select: bool = None
+    '''Object base selection state 
+
+    :type: bool
+    '''
+
+    def layers_from_view(self, view):
+        '''Sets the object layers from a 3D View (use when adding an object in local view) 
+
+        '''
+        pass
+
+
+class ObjectConstraints:
+    '''Collection of object constraints '''
+
+    active: 'Constraint' = None
+    '''Active Object constraint 
+
+    :type: 'Constraint'
+    '''
+
+    def new(self, type: typing.Union[int, str]) -> 'Constraint':
+        '''Add a new constraint to this object 
+
+        :param type: Constraint type to addCAMERA_SOLVER Camera Solver.FOLLOW_TRACK Follow Track.OBJECT_SOLVER Object Solver.COPY_LOCATION Copy Location, Copy the location of a target (with an optional offset), so that they move together.COPY_ROTATION Copy Rotation, Copy the rotation of a target (with an optional offset), so that they rotate together.COPY_SCALE Copy Scale, Copy the scale factors of a target (with an optional offset), so that they are scaled by the same amount.COPY_TRANSFORMS Copy Transforms, Copy all the transformations of a target, so that they move together.LIMIT_DISTANCE Limit Distance, Restrict movements to within a certain distance of a target (at the time of constraint evaluation only).LIMIT_LOCATION Limit Location, Restrict movement along each axis within given ranges.LIMIT_ROTATION Limit Rotation, Restrict rotation along each axis within given ranges.LIMIT_SCALE Limit Scale, Restrict scaling along each axis with given ranges.MAINTAIN_VOLUME Maintain Volume, Compensate for scaling one axis by applying suitable scaling to the other two axes.TRANSFORM Transformation, Use one transform property from target to control another (or same) property on owner.TRANSFORM_CACHE Transform Cache, Look up the transformation matrix from an external file.CLAMP_TO Clamp To, Restrict movements to lie along a curve by remapping location along curve’s longest axis.DAMPED_TRACK Damped Track, Point towards a target by performing the smallest rotation necessary.IK Inverse Kinematics, Control a chain of bones by specifying the endpoint target (Bones only).LOCKED_TRACK Locked Track, Rotate around the specified (‘locked’) axis to point towards a target.SPLINE_IK Spline IK, Align chain of bones along a curve (Bones only).STRETCH_TO Stretch To, Stretch along Y-Axis to point towards a target.TRACK_TO Track To, Legacy tracking constraint prone to twisting artifacts.ACTION Action, Use transform property of target to look up pose for owner from an Action.CHILD_OF Child Of, Make target the ‘detachable’ parent of owner.FLOOR Floor, Use position (and optionally rotation) of target to define a ‘wall’ or ‘floor’ that the owner can not cross.FOLLOW_PATH Follow Path, Use to animate an object/bone following a path.PIVOT Pivot, Change pivot point for transforms (buggy).RIGID_BODY_JOINT Rigid Body Joint, Use to define a Rigid Body Constraint (for Game Engine use only).SHRINKWRAP Shrinkwrap, Restrict movements to surface of target mesh. 
+        :type type: typing.Union[int, str]
+        :rtype: 'Constraint'
+        :return:  New constraint 
+        '''
+        pass
+
+    def remove(self, constraint: 'Constraint'):
+        '''Remove a constraint from this object 
+
+        :param constraint: Removed constraint 
+        :type constraint: 'Constraint'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all constraint from this object 
+
+        '''
+        pass
+
+
+class ObjectModifiers:
+    '''Collection of object modifiers '''
+
+    def new(self, name: str, type: typing.Union[int, str]) -> 'Modifier':
+        '''Add a new modifier 
+
+        :param name: New name for the modifier 
+        :type name: str
+        :param type: Modifier type to addDATA_TRANSFER Data Transfer.MESH_CACHE Mesh Cache.MESH_SEQUENCE_CACHE Mesh Sequence Cache.NORMAL_EDIT Normal Edit.UV_PROJECT UV Project.UV_WARP UV Warp.VERTEX_WEIGHT_EDIT Vertex Weight Edit.VERTEX_WEIGHT_MIX Vertex Weight Mix.VERTEX_WEIGHT_PROXIMITY Vertex Weight Proximity.ARRAY Array.BEVEL Bevel.BOOLEAN Boolean.BUILD Build.DECIMATE Decimate.EDGE_SPLIT Edge Split.MASK Mask.MIRROR Mirror.MULTIRES Multiresolution.REMESH Remesh.SCREW Screw.SKIN Skin.SOLIDIFY Solidify.SUBSURF Subdivision Surface.TRIANGULATE Triangulate.WIREFRAME Wireframe, Generate a wireframe on the edges of a mesh.ARMATURE Armature.CAST Cast.CORRECTIVE_SMOOTH Corrective Smooth.CURVE Curve.DISPLACE Displace.HOOK Hook.LAPLACIANSMOOTH Laplacian Smooth.LAPLACIANDEFORM Laplacian Deform.LATTICE Lattice.MESH_DEFORM Mesh Deform.SHRINKWRAP Shrinkwrap.SIMPLE_DEFORM Simple Deform.SMOOTH Smooth.SURFACE_DEFORM Surface Deform.WARP Warp.WAVE Wave.CLOTH Cloth.COLLISION Collision.DYNAMIC_PAINT Dynamic Paint.EXPLODE Explode.FLUID_SIMULATION Fluid Simulation.OCEAN Ocean.PARTICLE_INSTANCE Particle Instance.PARTICLE_SYSTEM Particle System.SMOKE Smoke.SOFT_BODY Soft Body.SURFACE Surface. 
+        :type type: typing.Union[int, str]
+        :rtype: 'Modifier'
+        :return:  Newly created modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'Modifier'):
+        '''Remove an existing modifier from the object 
+
+        :param modifier: Modifier to remove 
+        :type modifier: 'Modifier'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all modifiers from the object 
+
+        '''
+        pass
+
+
+class ObjectSolverConstraint:
+    '''Lock motion to the reconstructed object movement '''
+
+    camera: 'Object' = None
+    '''Camera to which motion is parented (if empty active scene camera is used) 
+
+    :type: 'Object'
+    '''
+
+    clip: 'MovieClip' = None
+    '''Movie Clip to get tracking data from 
+
+    :type: 'MovieClip'
+    '''
+
+    object: str = None
+    '''Movie tracking object to follow 
+
+    :type: str
+    '''
+
+    use_active_clip: bool = None
+    '''Use active clip defined in scene 
+
+    :type: bool
+    '''
+
+
+class ObstacleFluidSettings:
+    '''Fluid simulation settings for obstacles in the simulation '''
+
+    impact_factor: float = None
+    '''This is an unphysical value for moving objects - it controls the impact an obstacle has on the fluid, =0 behaves a bit like outflow (deleting fluid), =1 is default, while >1 results in high forces (can be used to tweak total mass) 
+
+    :type: float
+    '''
+
+    partial_slip_factor: float = None
+    '''Amount of mixing between no- and free-slip, 0 is no slip and 1 is free slip 
+
+    :type: float
+    '''
+
+    slip_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use: bool = None
+    '''Object contributes to the fluid simulation 
+
+    :type: bool
+    '''
+
+    use_animated_mesh: bool = None
+    '''Export this mesh as an animated one (slower and enforces No Slip, only use if really necessary [e.g. armatures or parented objects], animated pos/rot/scale F-Curves do not require it) 
+
+    :type: bool
+    '''
+
+    volume_initialization: typing.Union[int, str] = None
+    '''Volume initialization type (WARNING: complex volumes might require too much memory and break simulation) 
+
+    :type: typing.Union[int, str]
+    '''
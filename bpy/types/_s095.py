@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class OceanModifier:
+    '''Simulate an ocean surface '''
+
+    bake_foam_fade: float = None
+    '''How much foam accumulates over time (baked ocean only) 
+
+    :type: float
+    '''
+
+    choppiness: float = None
+    '''Choppiness of the wave’s crest (adds some horizontal component to the displacement) 
+
+    :type: float
+    '''
+
+    damping: float = None
+    '''Damp reflected waves going in opposite direction to the wind 
+
+    :type: float
+    '''
+
+    depth: float = None
+    '''Depth of the solid ground below the water surface 
+
+    :type: float
+    '''
+
+    filepath: str = None
+    '''Path to a folder to store external baked images 
+
+    :type: str
+    '''
+
+    foam_coverage: float = None
+    '''Amount of generated foam 
+
+    :type: float
+    '''
+
+    foam_layer_name: str = None
+    '''Name of the vertex color layer used for foam 
+
+    :type: str
+    '''
+
+    frame_end: int = None
+    '''End frame of the ocean baking 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Start frame of the ocean baking 
+
+    :type: int
+    '''
+
+    geometry_mode: typing.Union[int, str] = None
+    '''Method of modifying geometry 
+
+    :type: typing.Union[int, str]
+    '''
+
+    is_cached: bool = None
+    '''Whether the ocean is using cached data or simulating 
+
+    :type: bool
+    '''
+
+    random_seed: int = None
+    '''Seed of the random generator 
+
+    :type: int
+    '''
+
+    repeat_x: int = None
+    '''Repetitions of the generated surface in X 
+
+    :type: int
+    '''
+
+    repeat_y: int = None
+    '''Repetitions of the generated surface in Y 
+
+    :type: int
+    '''
+
+    resolution: int = None
+    '''Resolution of the generated surface 
+
+    :type: int
+    '''
+
+    size: float = None
+    '''Surface scale factor (does not affect the height of the waves) 
+
+    :type: float
+    '''
+
+    spatial_size: int = None
+    '''Size of the simulation domain (in meters), and of the generated geometry (in BU) 
+
+    :type: int
+    '''
+
+    time: float = None
+    '''Current time of the simulation 
+
+    :type: float
+    '''
+
+    use_foam: bool = None
+    '''Generate foam mask as a vertex color channel 
+
+    :type: bool
+    '''
+
+    use_normals: bool = None
+    '''Output normals for bump mapping - disabling can speed up performance if its not needed 
+
+    :type: bool
+    '''
+
+    wave_alignment: float = None
+    '''How much the waves are aligned to each other 
+
+    :type: float
+    '''
+
+    wave_direction: float = None
+    '''Main direction of the waves when they are (partially) aligned 
+
+    :type: float
+    '''
+
+    wave_scale: float = None
+    '''Scale of the displacement effect 
+
+    :type: float
+    '''
+
+    wave_scale_min: float = None
+    '''Shortest allowed wavelength 
+
+    :type: float
+    '''
+
+    wind_velocity: float = None
+    '''Wind speed 
+
+    :type: float
+    '''
+
+
+class OceanTexData:
+    '''Ocean Texture settings '''
+
+    ocean_object: 'Object' = None
+    '''Object containing the ocean modifier 
+
+    :type: 'Object'
+    '''
+
+    output: typing.Union[int, str] = None
+    '''The data that is output by the texture 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class OceanTexture:
+    '''Settings for the Ocean texture '''
+
+    ocean: 'OceanTexData' = None
+    '''The ocean data associated with this texture 
+
+    :type: 'OceanTexData'
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class Operator:
+    '''Storage of an operator being executed, or registered after execution '''
+
+    bl_description: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_options: typing.Set[typing.Union[int, str]] = None
+    '''Options for this operator type 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    bl_translation_context: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_undo_group: str = None
+    '''
+
+    :type: str
+    '''
+
+    has_reports: bool = None
+    '''Operator has a set of reports (warnings and errors) from last execution 
+
+    :type: bool
+    '''
+
+    layout: 'UILayout' = None
+    '''
+
+    :type: 'UILayout'
+    '''
+
+    macros: typing.List['Macro'] = None
+    '''
+
+    :type: typing.List['Macro']
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    options: 'OperatorOptions' = None
+    '''Runtime options 
+
+    :type: 'OperatorOptions'
+    '''
+
+    properties: 'OperatorProperties' = None
+    '''
+
+    :type: 'OperatorProperties'
+    '''
+
+    bl_property = None
+    '''The name of a property to use as this operators primary property. Currently this is only used to select the default property when expanding an operator into a menu. :type: string '''
+
+    def report(self, type: typing.Set[typing.Union[int, str]], message: str):
+        '''report 
+
+        :param type: Type 
+        :type type: typing.Set[typing.Union[int, str]]
+        :param message: Report Message 
+        :type message: str
+        '''
+        pass
+
+    def is_repeat(self, ) -> bool:
+        '''is_repeat 
+
+        :rtype: bool
+        :return:  result 
+        '''
+        pass
+
+    def execute(self, context) -> typing.Set[typing.Union[int, str]]:
+        '''Execute the operator 
+
+        :rtype: typing.Set[typing.Union[int, str]]
+        :return:  resultRUNNING_MODAL Running Modal, Keep the operator running with blender.CANCELLED Cancelled, When no action has been taken, operator exits.FINISHED Finished, When the operator is complete, operator exits.PASS_THROUGH Pass Through, Do nothing and pass the event on.INTERFACE Interface, Handled but not executed (popup menus). 
+        '''
+        pass
+
+    def check(self, context) -> bool:
+        '''Check the operator settings, return True to signal a change to redraw 
+
+        :rtype: bool
+        :return:  result 
+        '''
+        pass
+
+    def invoke(self, context, event) -> typing.Set[typing.Union[int, str]]:
+        '''Invoke the operator 
+
+        :rtype: typing.Set[typing.Union[int, str]]
+        :return:  resultRUNNING_MODAL Running Modal, Keep the operator running with blender.CANCELLED Cancelled, When no action has been taken, operator exits.FINISHED Finished, When the operator is complete, operator exits.PASS_THROUGH Pass Through, Do nothing and pass the event on.INTERFACE Interface, Handled but not executed (popup menus). 
+        '''
+        pass
+
+    def modal(self, context, event) -> typing.Set[typing.Union[int, str]]:
+        '''Modal operator function 
+
+        :rtype: typing.Set[typing.Union[int, str]]
+        :return:  resultRUNNING_MODAL Running Modal, Keep the operator running with blender.CANCELLED Cancelled, When no action has been taken, operator exits.FINISHED Finished, When the operator is complete, operator exits.PASS_THROUGH Pass Through, Do nothing and pass the event on.INTERFACE Interface, Handled but not executed (popup menus). 
+        '''
+        pass
+
+    def draw(self, context):
+        '''Draw function for the operator 
+
+        '''
+        pass
+
+    def cancel(self, context):
+        '''Called when the operator is canceled 
+
+        '''
+        pass
+
+    def as_keywords(self, ignore=()):
+        '''Return a copy of the properties as a dictionary 
+
+        '''
+        pass
+
+
+class OperatorFileListElement:
+    name: str = None
+    '''Name of a file or directory within a file list 
+
+    :type: str
+    '''
+
+
+class OperatorMacro:
+    '''Storage of a sub operator in a macro after it has been added '''
+
+    properties: 'OperatorProperties' = None
+    '''
+
+    :type: 'OperatorProperties'
+    '''
+
+
+class OperatorMousePath:
+    '''Mouse path values for operators that record such paths '''
+
+    loc: float = None
+    '''Mouse location 
+
+    :type: float
+    '''
+
+    time: float = None
+    '''Time of mouse location 
+
+    :type: float
+    '''
+
+
+class OperatorOptions:
+    '''Runtime options '''
+
+    is_grab_cursor: bool = None
+    '''True when the cursor is grabbed 
+
+    :type: bool
+    '''
+
+    is_invoke: bool = None
+    '''True when invoked (even if only the execute callbacks available) 
+
+    :type: bool
+    '''
+
+    use_cursor_region: bool = None
+    '''Enable to use the region under the cursor for modal execution 
+
+    :type: bool
+    '''
+
+
+class OperatorProperties:
+    '''Input properties of an Operator '''
+
+    pass
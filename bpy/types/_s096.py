@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class OperatorStrokeElement:
+    is_start: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    location: float = None
+    '''
+
+    :type: float
+    '''
+
+    mouse: float = None
+    '''
+
+    :type: float
+    '''
+
+    pen_flip: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    pressure: float = None
+    '''Tablet pressure 
+
+    :type: float
+    '''
+
+    size: float = None
+    '''Brush Size in screen space 
+
+    :type: float
+    '''
+
+    time: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class OrController:
+    '''Controller passing on events based on a logical OR operation '''
+
+    pass
+
+
+class OutflowFluidSettings:
+    '''Fluid simulation settings for objects removing fluids from the simulation '''
+
+    use: bool = None
+    '''Object contributes to the fluid simulation 
+
+    :type: bool
+    '''
+
+    use_animated_mesh: bool = None
+    '''Export this mesh as an animated one (slower and enforces No Slip, only use if really necessary [e.g. armatures or parented objects], animated pos/rot/scale F-Curves do not require it) 
+
+    :type: bool
+    '''
+
+    volume_initialization: typing.Union[int, str] = None
+    '''Volume initialization type (WARNING: complex volumes might require too much memory and break simulation) 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class OverDropSequence:
+    '''Over Drop Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class PARTICLE_UL_particle_systems:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index, flt_flag):
+        '''
+
+        '''
+        pass
+
+
+class PHYSICS_UL_dynapaint_surfaces:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class PackedFile:
+    '''External file packed into the .blend file '''
+
+    data: str = None
+    '''Raw data (bytes, exact content of the embedded file) 
+
+    :type: str
+    '''
+
+    size: int = None
+    '''Size of packed file in bytes 
+
+    :type: int
+    '''
+
+
+class Paint:
+    brush: 'Brush' = None
+    '''Active Brush 
+
+    :type: 'Brush'
+    '''
+
+    cavity_curve: 'CurveMapping' = None
+    '''Editable cavity curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    input_samples: int = None
+    '''Average multiple input samples together to smooth the brush stroke 
+
+    :type: int
+    '''
+
+    palette: 'Palette' = None
+    '''Active Palette 
+
+    :type: 'Palette'
+    '''
+
+    show_brush: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_brush_on_surface: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_low_resolution: bool = None
+    '''For multires, show low resolution while navigating the view 
+
+    :type: bool
+    '''
+
+    tile_offset: float = None
+    '''Stride at which tiled strokes are copied 
+
+    :type: float
+    '''
+
+    tile_x: bool = None
+    '''Tile along X axis 
+
+    :type: bool
+    '''
+
+    tile_y: bool = None
+    '''Tile along Y axis 
+
+    :type: bool
+    '''
+
+    tile_z: bool = None
+    '''Tile along Z axis 
+
+    :type: bool
+    '''
+
+    use_cavity: bool = None
+    '''Mask painting according to mesh geometry cavity 
+
+    :type: bool
+    '''
+
+    use_symmetry_feather: bool = None
+    '''Reduce the strength of the brush where it overlaps symmetrical daubs 
+
+    :type: bool
+    '''
+
+    use_symmetry_x: bool = None
+    '''Mirror brush across the X axis 
+
+    :type: bool
+    '''
+
+    use_symmetry_y: bool = None
+    '''Mirror brush across the Y axis 
+
+    :type: bool
+    '''
+
+    use_symmetry_z: bool = None
+    '''Mirror brush across the Z axis 
+
+    :type: bool
+    '''
+
+
+class PaintCurve:
+    pass
+
+
+class Palette:
+    colors: typing.List['PaletteColors'] = None
+    '''
+
+    :type: typing.List['PaletteColors']
+    '''
+
+
+class PaletteColor:
+    color: float = None
+    '''
+
+    :type: float
+    '''
+
+    strength: float = None
+    '''
+
+    :type: float
+    '''
+
+    weight: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class PaletteColors:
+    '''Collection of palette colors '''
+
+    active: 'PaletteColor' = None
+    '''
+
+    :type: 'PaletteColor'
+    '''
+
+    def new(self, ) -> 'PaletteColor':
+        '''Add a new color to the palette 
+
+        :rtype: 'PaletteColor'
+        :return:  The newly created color 
+        '''
+        pass
+
+    def remove(self, color: 'PaletteColor'):
+        '''Remove a color from the palette 
+
+        :param color: The color to remove 
+        :type color: 'PaletteColor'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all colors from the palette 
+
+        '''
+        pass
+
+
+class Panel:
+    '''Panel containing UI elements '''
+
+    bl_category: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_context: str = None
+    '''The context in which the panel belongs to. (TODO: explain the possible combinations bl_context/bl_region_type/bl_space_type) 
+
+    :type: str
+    '''
+
+    bl_idname: str = None
+    '''If this is set, the panel gets a custom ID, otherwise it takes the name of the class used to define the panel. For example, if the class name is “OBJECT_PT_hello”, and bl_idname is not set by the script, then bl_idname = “OBJECT_PT_hello” 
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''The panel label, shows up in the panel header at the right of the triangle used to collapse the panel 
+
+    :type: str
+    '''
+
+    bl_options: typing.Set[typing.Union[int, str]] = None
+    '''Options for this panel type 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    bl_region_type: typing.Union[int, str] = None
+    '''The region where the panel is going to be used in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bl_space_type: typing.Union[int, str] = None
+    '''The space where the panel is going to be used in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bl_translation_context: str = None
+    '''
+
+    :type: str
+    '''
+
+    layout: 'UILayout' = None
+    '''Defines the structure of the panel in the UI 
+
+    :type: 'UILayout'
+    '''
+
+    text: str = None
+    '''XXX todo 
+
+    :type: str
+    '''
+
+    use_pin: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def draw(self, context):
+        '''Draw UI elements into the panel UI layout 
+
+        '''
+        pass
+
+    def draw_header(self, context):
+        '''Draw UI elements into the panel’s header UI layout 
+
+        '''
+        pass
+
+
+class ParentActuator:
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Set this object as parent 
+
+    :type: 'Object'
+    '''
+
+    use_compound: bool = None
+    '''Add this object shape to the parent shape (only if the parent shape is already compound) 
+
+    :type: bool
+    '''
+
+    use_ghost: bool = None
+    '''Make this object ghost while parented 
+
+    :type: bool
+    '''
@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Particle:
+    '''Particle in a particle system '''
+
+    alive_state: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    angular_velocity: float = None
+    '''
+
+    :type: float
+    '''
+
+    birth_time: float = None
+    '''
+
+    :type: float
+    '''
+
+    die_time: float = None
+    '''
+
+    :type: float
+    '''
+
+    hair_keys: typing.List['ParticleHairKey'] = None
+    '''
+
+    :type: typing.List['ParticleHairKey']
+    '''
+
+    is_exist: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    is_visible: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    lifetime: float = None
+    '''
+
+    :type: float
+    '''
+
+    location: float = None
+    '''
+
+    :type: float
+    '''
+
+    particle_keys: typing.List['ParticleKey'] = None
+    '''
+
+    :type: typing.List['ParticleKey']
+    '''
+
+    prev_angular_velocity: float = None
+    '''
+
+    :type: float
+    '''
+
+    prev_location: float = None
+    '''
+
+    :type: float
+    '''
+
+    prev_rotation: float = None
+    '''
+
+    :type: float
+    '''
+
+    prev_velocity: float = None
+    '''
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''
+
+    :type: float
+    '''
+
+    size: float = None
+    '''
+
+    :type: float
+    '''
+
+    velocity: float = None
+    '''
+
+    :type: float
+    '''
+
+    def uv_on_emitter(self, modifier: 'ParticleSystemModifier') -> float:
+        '''Obtain uv for particle on derived mesh 
+
+        :param modifier: Particle modifier 
+        :type modifier: 'ParticleSystemModifier'
+        :rtype: float
+        :return:  uv 
+        '''
+        pass
+
+
+class ParticleBrush:
+    '''Particle editing brush '''
+
+    count: int = None
+    '''Particle count 
+
+    :type: int
+    '''
+
+    curve: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    length_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    puff_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    size: int = None
+    '''Radius of the brush in pixels 
+
+    :type: int
+    '''
+
+    steps: int = None
+    '''Brush steps 
+
+    :type: int
+    '''
+
+    strength: float = None
+    '''Brush strength 
+
+    :type: float
+    '''
+
+    use_puff_volume: bool = None
+    '''Apply puff to unselected end-points (helps maintain hair volume when puffing root) 
+
+    :type: bool
+    '''
+
+
+class ParticleDupliWeight:
+    '''Weight of a particle dupliobject in a group '''
+
+    count: int = None
+    '''The number of times this object is repeated with respect to other objects 
+
+    :type: int
+    '''
+
+    name: str = None
+    '''Particle dupliobject name 
+
+    :type: str
+    '''
+
+
+class ParticleEdit:
+    '''Properties of particle editing mode '''
+
+    brush: 'ParticleBrush' = None
+    '''
+
+    :type: 'ParticleBrush'
+    '''
+
+    default_key_count: int = None
+    '''How many keys to make new particles with 
+
+    :type: int
+    '''
+
+    draw_step: int = None
+    '''How many steps to draw the path with 
+
+    :type: int
+    '''
+
+    emitter_distance: float = None
+    '''Distance to keep particles away from the emitter 
+
+    :type: float
+    '''
+
+    fade_frames: int = None
+    '''How many frames to fade 
+
+    :type: int
+    '''
+
+    is_editable: bool = None
+    '''A valid edit mode exists 
+
+    :type: bool
+    '''
+
+    is_hair: bool = None
+    '''Editing hair 
+
+    :type: bool
+    '''
+
+    object: 'Object' = None
+    '''The edited object 
+
+    :type: 'Object'
+    '''
+
+    select_mode: typing.Union[int, str] = None
+    '''Particle select and display mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shape_object: 'Object' = None
+    '''Outer shape to use for tools 
+
+    :type: 'Object'
+    '''
+
+    show_particles: bool = None
+    '''Draw actual particles 
+
+    :type: bool
+    '''
+
+    tool: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_auto_velocity: bool = None
+    '''Calculate point velocities automatically 
+
+    :type: bool
+    '''
+
+    use_default_interpolate: bool = None
+    '''Interpolate new particles from the existing ones 
+
+    :type: bool
+    '''
+
+    use_emitter_deflect: bool = None
+    '''Keep paths from intersecting the emitter 
+
+    :type: bool
+    '''
+
+    use_fade_time: bool = None
+    '''Fade paths and keys further away from current frame 
+
+    :type: bool
+    '''
+
+    use_preserve_length: bool = None
+    '''Keep path lengths constant 
+
+    :type: bool
+    '''
+
+    use_preserve_root: bool = None
+    '''Keep root keys unmodified 
+
+    :type: bool
+    '''
+
+
+class ParticleFluidSettings:
+    '''Fluid simulation settings for objects storing fluid particles generated by the simulation '''
+
+    alpha_influence: float = None
+    '''Amount of particle alpha change, inverse of size influence: 0=off (all same alpha), 1=full (larger particles get lower alphas, smaller ones higher values) 
+
+    :type: float
+    '''
+
+    filepath: str = None
+    '''Directory (and/or filename prefix) to store and load particles from 
+
+    :type: str
+    '''
+
+    particle_influence: float = None
+    '''Amount of particle size scaling: 0=off (all same size), 1=full (range 0.2-2.0), >1=stronger 
+
+    :type: float
+    '''
+
+    show_tracer: bool = None
+    '''Show tracer particles 
+
+    :type: bool
+    '''
+
+    use_drops: bool = None
+    '''Show drop particles 
+
+    :type: bool
+    '''
+
+    use_floats: bool = None
+    '''Show floating foam particles 
+
+    :type: bool
+    '''
+
+
+class ParticleHairKey:
+    '''Particle key for hair particle system '''
+
+    co: float = None
+    '''Location of the hair key in object space 
+
+    :type: float
+    '''
+
+    co_local: float = None
+    '''Location of the hair key in its local coordinate system, relative to the emitting face 
+
+    :type: float
+    '''
+
+    time: float = None
+    '''Relative time of key over hair length 
+
+    :type: float
+    '''
+
+    weight: float = None
+    '''Weight for cloth simulation 
+
+    :type: float
+    '''
+
+    def co_object(self, object: 'Object', modifier: 'ParticleSystemModifier',
+                  particle: 'Particle') -> float:
+        '''Obtain hairkey location with particle and modifier data 
+
+        :param object: Object 
+        :type object: 'Object'
+        :param modifier: Particle modifier 
+        :type modifier: 'ParticleSystemModifier'
+        :param particle: hair particle 
+        :type particle: 'Particle'
+        :rtype: float
+        :return:  Co, Exported hairkey location 
+        '''
+        pass
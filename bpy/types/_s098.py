@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ParticleInstanceModifier:
+    '''Particle system instancing modifier '''
+
+    axis: typing.Union[int, str] = None
+    '''Pole axis for rotation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object that has the particle system 
+
+    :type: 'Object'
+    '''
+
+    particle_system_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    position: float = None
+    '''Position along path 
+
+    :type: float
+    '''
+
+    random_position: float = None
+    '''Randomize position along path 
+
+    :type: float
+    '''
+
+    show_alive: bool = None
+    '''Show instances when particles are alive 
+
+    :type: bool
+    '''
+
+    show_dead: bool = None
+    '''Show instances when particles are dead 
+
+    :type: bool
+    '''
+
+    show_unborn: bool = None
+    '''Show instances when particles are unborn 
+
+    :type: bool
+    '''
+
+    use_children: bool = None
+    '''Create instances from child particles 
+
+    :type: bool
+    '''
+
+    use_normal: bool = None
+    '''Create instances from normal particles 
+
+    :type: bool
+    '''
+
+    use_path: bool = None
+    '''Create instances along particle paths 
+
+    :type: bool
+    '''
+
+    use_preserve_shape: bool = None
+    '''Don’t stretch the object 
+
+    :type: bool
+    '''
+
+    use_size: bool = None
+    '''Use particle size to scale the instances 
+
+    :type: bool
+    '''
+
+
+class ParticleKey:
+    '''Key location for a particle over time '''
+
+    angular_velocity: float = None
+    '''Key angular velocity 
+
+    :type: float
+    '''
+
+    location: float = None
+    '''Key location 
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''Key rotation quaternion 
+
+    :type: float
+    '''
+
+    time: float = None
+    '''Time of key over the simulation 
+
+    :type: float
+    '''
+
+    velocity: float = None
+    '''Key velocity 
+
+    :type: float
+    '''
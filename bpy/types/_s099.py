@@ -0,0 +1,1086 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ParticleSettings:
+    '''Particle settings, reusable by multiple particle systems '''
+
+    active_dupliweight: 'ParticleDupliWeight' = None
+    '''
+
+    :type: 'ParticleDupliWeight'
+    '''
+
+    active_dupliweight_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    active_texture: 'Texture' = None
+    '''Active texture slot being displayed 
+
+    :type: 'Texture'
+    '''
+
+    active_texture_index: int = None
+    '''Index of active texture slot 
+
+    :type: int
+    '''
+
+    adaptive_angle: int = None
+    '''How many degrees path has to curve to make another render segment 
+
+    :type: int
+    '''
+
+    adaptive_pixel: int = None
+    '''How many pixels path has to cover to make another render segment 
+
+    :type: int
+    '''
+
+    angular_velocity_factor: float = None
+    '''Angular velocity amount (in radians per second) 
+
+    :type: float
+    '''
+
+    angular_velocity_mode: typing.Union[int, str] = None
+    '''What axis is used to change particle rotation with time 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    apply_effector_to_children: bool = None
+    '''Apply effectors to children 
+
+    :type: bool
+    '''
+
+    apply_guide_to_children: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bending_random: float = None
+    '''Random stiffness of hairs 
+
+    :type: float
+    '''
+
+    billboard_align: typing.Union[int, str] = None
+    '''In respect to what the billboards are aligned 
+
+    :type: typing.Union[int, str]
+    '''
+
+    billboard_animation: typing.Union[int, str] = None
+    '''How to animate billboard textures 
+
+    :type: typing.Union[int, str]
+    '''
+
+    billboard_object: 'Object' = None
+    '''Billboards face this object (default is active camera) 
+
+    :type: 'Object'
+    '''
+
+    billboard_offset: float = None
+    '''
+
+    :type: float
+    '''
+
+    billboard_offset_split: typing.Union[int, str] = None
+    '''How to offset billboard textures 
+
+    :type: typing.Union[int, str]
+    '''
+
+    billboard_size: float = None
+    '''Scale billboards relative to particle size 
+
+    :type: float
+    '''
+
+    billboard_tilt: float = None
+    '''Tilt of the billboards 
+
+    :type: float
+    '''
+
+    billboard_tilt_random: float = None
+    '''Random tilt of the billboards 
+
+    :type: float
+    '''
+
+    billboard_uv_split: int = None
+    '''Number of rows/columns to split UV coordinates for billboards 
+
+    :type: int
+    '''
+
+    billboard_velocity_head: float = None
+    '''Scale billboards by velocity 
+
+    :type: float
+    '''
+
+    billboard_velocity_tail: float = None
+    '''Scale billboards by velocity 
+
+    :type: float
+    '''
+
+    boids: 'BoidSettings' = None
+    '''
+
+    :type: 'BoidSettings'
+    '''
+
+    branch_threshold: float = None
+    '''Threshold of branching 
+
+    :type: float
+    '''
+
+    brownian_factor: float = None
+    '''Amount of random, erratic particle movement 
+
+    :type: float
+    '''
+
+    child_length: float = None
+    '''Length of child paths 
+
+    :type: float
+    '''
+
+    child_length_threshold: float = None
+    '''Amount of particles left untouched by child path length 
+
+    :type: float
+    '''
+
+    child_nbr: int = None
+    '''Number of children/parent 
+
+    :type: int
+    '''
+
+    child_parting_factor: float = None
+    '''Create parting in the children based on parent strands 
+
+    :type: float
+    '''
+
+    child_parting_max: float = None
+    '''Maximum root to tip angle (tip distance/root distance for long hair) 
+
+    :type: float
+    '''
+
+    child_parting_min: float = None
+    '''Minimum root to tip angle (tip distance/root distance for long hair) 
+
+    :type: float
+    '''
+
+    child_radius: float = None
+    '''Radius of children around parent 
+
+    :type: float
+    '''
+
+    child_roundness: float = None
+    '''Roundness of children around parent 
+
+    :type: float
+    '''
+
+    child_size: float = None
+    '''A multiplier for the child particle size 
+
+    :type: float
+    '''
+
+    child_size_random: float = None
+    '''Random variation to the size of the child particles 
+
+    :type: float
+    '''
+
+    child_type: typing.Union[int, str] = None
+    '''Create child particles 
+
+    :type: typing.Union[int, str]
+    '''
+
+    clump_curve: 'CurveMapping' = None
+    '''Curve defining clump tapering 
+
+    :type: 'CurveMapping'
+    '''
+
+    clump_factor: float = None
+    '''Amount of clumping 
+
+    :type: float
+    '''
+
+    clump_noise_size: float = None
+    '''Size of clump noise 
+
+    :type: float
+    '''
+
+    clump_shape: float = None
+    '''Shape of clumping 
+
+    :type: float
+    '''
+
+    collision_group: 'Group' = None
+    '''Limit colliders to this Group 
+
+    :type: 'Group'
+    '''
+
+    color_maximum: float = None
+    '''Maximum length of the particle color vector 
+
+    :type: float
+    '''
+
+    count: int = None
+    '''Total number of particles 
+
+    :type: int
+    '''
+
+    courant_target: float = None
+    '''The relative distance a particle can move before requiring more subframes (target Courant number); 0.01-0.3 is the recommended range 
+
+    :type: float
+    '''
+
+    create_long_hair_children: bool = None
+    '''Calculate children that suit long hair well 
+
+    :type: bool
+    '''
+
+    cycles: 'CyclesCurveSettings' = None
+    '''Cycles hair settings 
+
+    :type: 'CyclesCurveSettings'
+    '''
+
+    damping: float = None
+    '''Amount of damping 
+
+    :type: float
+    '''
+
+    distribution: typing.Union[int, str] = None
+    '''How to distribute particles on selected element 
+
+    :type: typing.Union[int, str]
+    '''
+
+    drag_factor: float = None
+    '''Amount of air-drag 
+
+    :type: float
+    '''
+
+    draw_color: typing.Union[int, str] = None
+    '''Draw additional particle data as a color 
+
+    :type: typing.Union[int, str]
+    '''
+
+    draw_method: typing.Union[int, str] = None
+    '''How particles are drawn in viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    draw_percentage: int = None
+    '''Percentage of particles to display in 3D view 
+
+    :type: int
+    '''
+
+    draw_size: int = None
+    '''Size of particles on viewport in pixels (0=default) 
+
+    :type: int
+    '''
+
+    draw_step: int = None
+    '''How many steps paths are drawn with (power of 2) 
+
+    :type: int
+    '''
+
+    dupli_group: 'Group' = None
+    '''Show Objects in this Group in place of particles 
+
+    :type: 'Group'
+    '''
+
+    dupli_object: 'Object' = None
+    '''Show this Object in place of particles 
+
+    :type: 'Object'
+    '''
+
+    dupli_weights: typing.List['ParticleDupliWeight'] = None
+    '''Weights for all of the objects in the dupli group 
+
+    :type: typing.List['ParticleDupliWeight']
+    '''
+
+    effect_hair: float = None
+    '''Hair stiffness for effectors 
+
+    :type: float
+    '''
+
+    effector_amount: int = None
+    '''How many particles are effectors (0 is all particles) 
+
+    :type: int
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    emit_from: typing.Union[int, str] = None
+    '''Where to emit particles from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    factor_random: float = None
+    '''Give the starting velocity a random variation 
+
+    :type: float
+    '''
+
+    fluid: 'SPHFluidSettings' = None
+    '''
+
+    :type: 'SPHFluidSettings'
+    '''
+
+    force_field_1: 'FieldSettings' = None
+    '''
+
+    :type: 'FieldSettings'
+    '''
+
+    force_field_2: 'FieldSettings' = None
+    '''
+
+    :type: 'FieldSettings'
+    '''
+
+    frame_end: float = None
+    '''Frame number to stop emitting particles 
+
+    :type: float
+    '''
+
+    frame_start: float = None
+    '''Frame number to start emitting particles 
+
+    :type: float
+    '''
+
+    grid_random: float = None
+    '''Add random offset to the grid locations 
+
+    :type: float
+    '''
+
+    grid_resolution: int = None
+    '''The resolution of the particle grid 
+
+    :type: int
+    '''
+
+    hair_length: float = None
+    '''Length of the hair 
+
+    :type: float
+    '''
+
+    hair_step: int = None
+    '''Number of hair segments 
+
+    :type: int
+    '''
+
+    hexagonal_grid: bool = None
+    '''Create the grid in a hexagonal pattern 
+
+    :type: bool
+    '''
+
+    integrator: typing.Union[int, str] = None
+    '''Algorithm used to calculate physics, from the fastest to the most stable/accurate: Midpoint, Euler, Verlet, RK4 (Old) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    invert_grid: bool = None
+    '''Invert what is considered object and what is not 
+
+    :type: bool
+    '''
+
+    is_fluid: bool = None
+    '''Particles were created by a fluid simulation 
+
+    :type: bool
+    '''
+
+    jitter_factor: float = None
+    '''Amount of jitter applied to the sampling 
+
+    :type: float
+    '''
+
+    keyed_loops: int = None
+    '''Number of times the keys are looped 
+
+    :type: int
+    '''
+
+    keys_step: int = None
+    '''
+
+    :type: int
+    '''
+
+    kink: typing.Union[int, str] = None
+    '''Type of periodic offset on the path 
+
+    :type: typing.Union[int, str]
+    '''
+
+    kink_amplitude: float = None
+    '''The amplitude of the offset 
+
+    :type: float
+    '''
+
+    kink_amplitude_clump: float = None
+    '''How much clump affects kink amplitude 
+
+    :type: float
+    '''
+
+    kink_amplitude_random: float = None
+    '''Random variation of the amplitude 
+
+    :type: float
+    '''
+
+    kink_axis: typing.Union[int, str] = None
+    '''Which axis to use for offset 
+
+    :type: typing.Union[int, str]
+    '''
+
+    kink_axis_random: float = None
+    '''Random variation of the orientation 
+
+    :type: float
+    '''
+
+    kink_extra_steps: int = None
+    '''Extra steps for resolution of special kink features 
+
+    :type: int
+    '''
+
+    kink_flat: float = None
+    '''How flat the hairs are 
+
+    :type: float
+    '''
+
+    kink_frequency: float = None
+    '''The frequency of the offset (1/total length) 
+
+    :type: float
+    '''
+
+    kink_shape: float = None
+    '''Adjust the offset to the beginning/end 
+
+    :type: float
+    '''
+
+    length_random: float = None
+    '''Give path length a random variation 
+
+    :type: float
+    '''
+
+    lifetime: float = None
+    '''Life span of the particles 
+
+    :type: float
+    '''
+
+    lifetime_random: float = None
+    '''Give the particle life a random variation 
+
+    :type: float
+    '''
+
+    line_length_head: float = None
+    '''Length of the line’s head 
+
+    :type: float
+    '''
+
+    line_length_tail: float = None
+    '''Length of the line’s tail 
+
+    :type: float
+    '''
+
+    lock_billboard: bool = None
+    '''Lock the billboards align axis 
+
+    :type: bool
+    '''
+
+    lock_boids_to_surface: bool = None
+    '''Constrain boids to a surface 
+
+    :type: bool
+    '''
+
+    mass: float = None
+    '''Mass of the particles 
+
+    :type: float
+    '''
+
+    material: int = None
+    '''Index of material slot used for rendering particles 
+
+    :type: int
+    '''
+
+    material_slot: typing.Union[int, str] = None
+    '''Material slot used for rendering particles 
+
+    :type: typing.Union[int, str]
+    '''
+
+    normal_factor: float = None
+    '''Let the surface normal give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    object_align_factor: float = None
+    '''Let the emitter object orientation give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    object_factor: float = None
+    '''Let the object give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    particle_factor: float = None
+    '''Let the target particle give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    particle_size: float = None
+    '''The size of the particles 
+
+    :type: float
+    '''
+
+    path_end: float = None
+    '''End time of drawn path 
+
+    :type: float
+    '''
+
+    path_start: float = None
+    '''Starting time of drawn path 
+
+    :type: float
+    '''
+
+    phase_factor: float = None
+    '''Rotation around the chosen orientation axis 
+
+    :type: float
+    '''
+
+    phase_factor_random: float = None
+    '''Randomize rotation around the chosen orientation axis 
+
+    :type: float
+    '''
+
+    physics_type: typing.Union[int, str] = None
+    '''Particle physics type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    react_event: typing.Union[int, str] = None
+    '''The event of target particles to react on 
+
+    :type: typing.Union[int, str]
+    '''
+
+    reactor_factor: float = None
+    '''Let the vector away from the target particle’s location give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    regrow_hair: bool = None
+    '''Regrow hair for each frame 
+
+    :type: bool
+    '''
+
+    render_step: int = None
+    '''How many steps paths are rendered with (power of 2) 
+
+    :type: int
+    '''
+
+    render_type: typing.Union[int, str] = None
+    '''How particles are rendered 
+
+    :type: typing.Union[int, str]
+    '''
+
+    rendered_child_count: int = None
+    '''Number of children/parent for rendering 
+
+    :type: int
+    '''
+
+    rotation_factor_random: float = None
+    '''Randomize particle orientation 
+
+    :type: float
+    '''
+
+    rotation_mode: typing.Union[int, str] = None
+    '''Particle orientation axis (does not affect Explode modifier’s results) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    roughness_1: float = None
+    '''Amount of location dependent rough 
+
+    :type: float
+    '''
+
+    roughness_1_size: float = None
+    '''Size of location dependent rough 
+
+    :type: float
+    '''
+
+    roughness_2: float = None
+    '''Amount of random rough 
+
+    :type: float
+    '''
+
+    roughness_2_size: float = None
+    '''Size of random rough 
+
+    :type: float
+    '''
+
+    roughness_2_threshold: float = None
+    '''Amount of particles left untouched by random rough 
+
+    :type: float
+    '''
+
+    roughness_curve: 'CurveMapping' = None
+    '''Curve defining roughness 
+
+    :type: 'CurveMapping'
+    '''
+
+    roughness_end_shape: float = None
+    '''Shape of end point rough 
+
+    :type: float
+    '''
+
+    roughness_endpoint: float = None
+    '''Amount of end point rough 
+
+    :type: float
+    '''
+
+    show_guide_hairs: bool = None
+    '''Show guide hairs 
+
+    :type: bool
+    '''
+
+    show_hair_grid: bool = None
+    '''Show hair simulation grid 
+
+    :type: bool
+    '''
+
+    show_health: bool = None
+    '''Draw boid health 
+
+    :type: bool
+    '''
+
+    show_number: bool = None
+    '''Show particle number 
+
+    :type: bool
+    '''
+
+    show_size: bool = None
+    '''Show particle size 
+
+    :type: bool
+    '''
+
+    show_unborn: bool = None
+    '''Show particles before they are emitted 
+
+    :type: bool
+    '''
+
+    show_velocity: bool = None
+    '''Show particle velocity 
+
+    :type: bool
+    '''
+
+    simplify_rate: float = None
+    '''Speed of simplification 
+
+    :type: float
+    '''
+
+    simplify_refsize: int = None
+    '''Reference size in pixels, after which simplification begins 
+
+    :type: int
+    '''
+
+    simplify_transition: float = None
+    '''Transition period for fading out strands 
+
+    :type: float
+    '''
+
+    simplify_viewport: float = None
+    '''Speed of Simplification 
+
+    :type: float
+    '''
+
+    size_random: float = None
+    '''Give the particle size a random variation 
+
+    :type: float
+    '''
+
+    subframes: int = None
+    '''Subframes to simulate for improved stability and finer granularity simulations (dt = timestep / (subframes + 1)) 
+
+    :type: int
+    '''
+
+    tangent_factor: float = None
+    '''Let the surface tangent give the particle a starting velocity 
+
+    :type: float
+    '''
+
+    tangent_phase: float = None
+    '''Rotate the surface tangent 
+
+    :type: float
+    '''
+
+    texture_slots: typing.List['ParticleSettingsTextureSlot'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['ParticleSettingsTextureSlot']
+    '''
+
+    time_tweak: float = None
+    '''A multiplier for physics timestep (1.0 means one frame = 1/25 seconds) 
+
+    :type: float
+    '''
+
+    timestep: float = None
+    '''The simulation timestep per frame (seconds per frame) 
+
+    :type: float
+    '''
+
+    trail_count: int = None
+    '''Number of trail particles 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Particle Type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_absolute_path_time: bool = None
+    '''Path timing is in absolute frames 
+
+    :type: bool
+    '''
+
+    use_adaptive_subframes: bool = None
+    '''Automatically set the number of subframes 
+
+    :type: bool
+    '''
+
+    use_advanced_hair: bool = None
+    '''Use full physics calculations for growing hair 
+
+    :type: bool
+    '''
+
+    use_clump_curve: bool = None
+    '''Use a curve to define clump tapering 
+
+    :type: bool
+    '''
+
+    use_clump_noise: bool = None
+    '''Create random clumps around the parent 
+
+    :type: bool
+    '''
+
+    use_dead: bool = None
+    '''Show particles after they have died 
+
+    :type: bool
+    '''
+
+    use_die_on_collision: bool = None
+    '''Particles die when they collide with a deflector object 
+
+    :type: bool
+    '''
+
+    use_dynamic_rotation: bool = None
+    '''Particle rotations are affected by collisions and effectors 
+
+    :type: bool
+    '''
+
+    use_emit_random: bool = None
+    '''Emit in random order of elements 
+
+    :type: bool
+    '''
+
+    use_even_distribution: bool = None
+    '''Use even distribution from faces based on face areas or edge lengths 
+
+    :type: bool
+    '''
+
+    use_global_dupli: bool = None
+    '''Use object’s global coordinates for duplication 
+
+    :type: bool
+    '''
+
+    use_group_count: bool = None
+    '''Use object multiple times in the same group 
+
+    :type: bool
+    '''
+
+    use_group_pick_random: bool = None
+    '''Pick objects from group randomly 
+
+    :type: bool
+    '''
+
+    use_hair_bspline: bool = None
+    '''Interpolate hair using B-Splines 
+
+    :type: bool
+    '''
+
+    use_modifier_stack: bool = None
+    '''Emit particles from mesh with modifiers applied (must use same subsurf level for viewport and render for correct results) 
+
+    :type: bool
+    '''
+
+    use_multiply_size_mass: bool = None
+    '''Multiply mass by particle size 
+
+    :type: bool
+    '''
+
+    use_parent_particles: bool = None
+    '''Render parent particles 
+
+    :type: bool
+    '''
+
+    use_react_multiple: bool = None
+    '''React multiple times 
+
+    :type: bool
+    '''
+
+    use_react_start_end: bool = None
+    '''Give birth to unreacted particles eventually 
+
+    :type: bool
+    '''
+
+    use_render_adaptive: bool = None
+    '''Draw steps of the particle path 
+
+    :type: bool
+    '''
+
+    use_render_emitter: bool = None
+    '''Render emitter Object also 
+
+    :type: bool
+    '''
+
+    use_rotation_dupli: bool = None
+    '''Use object’s rotation for duplication (global x-axis is aligned particle rotation axis) 
+
+    :type: bool
+    '''
+
+    use_rotations: bool = None
+    '''Calculate particle rotations 
+
+    :type: bool
+    '''
+
+    use_roughness_curve: bool = None
+    '''Use a curve to define roughness 
+
+    :type: bool
+    '''
+
+    use_scale_dupli: bool = None
+    '''Use object’s scale for duplication 
+
+    :type: bool
+    '''
+
+    use_self_effect: bool = None
+    '''Particle effectors affect themselves 
+
+    :type: bool
+    '''
+
+    use_simplify: bool = None
+    '''Remove child strands as the object becomes smaller on the screen 
+
+    :type: bool
+    '''
+
+    use_simplify_viewport: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_size_deflect: bool = None
+    '''Use particle’s size in deflection 
+
+    :type: bool
+    '''
+
+    use_strand_primitive: bool = None
+    '''Use the strand primitive for rendering 
+
+    :type: bool
+    '''
+
+    use_velocity_length: bool = None
+    '''Multiply line length by particle speed 
+
+    :type: bool
+    '''
+
+    use_whole_group: bool = None
+    '''Use whole group at once 
+
+    :type: bool
+    '''
+
+    userjit: int = None
+    '''Emission locations / face (0 = automatic) 
+
+    :type: int
+    '''
+
+    virtual_parents: float = None
+    '''Relative amount of virtual parents 
+
+    :type: float
+    '''
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ParticleSettingsTextureSlot:
+    '''Texture slot for textures in a Particle Settings data-block '''
+
+    clump_factor: float = None
+    '''Amount texture affects child clump 
+
+    :type: float
+    '''
+
+    damp_factor: float = None
+    '''Amount texture affects particle damping 
+
+    :type: float
+    '''
+
+    density_factor: float = None
+    '''Amount texture affects particle density 
+
+    :type: float
+    '''
+
+    field_factor: float = None
+    '''Amount texture affects particle force fields 
+
+    :type: float
+    '''
+
+    gravity_factor: float = None
+    '''Amount texture affects particle gravity 
+
+    :type: float
+    '''
+
+    kink_amp_factor: float = None
+    '''Amount texture affects child kink amplitude 
+
+    :type: float
+    '''
+
+    kink_freq_factor: float = None
+    '''Amount texture affects child kink frequency 
+
+    :type: float
+    '''
+
+    length_factor: float = None
+    '''Amount texture affects child hair length 
+
+    :type: float
+    '''
+
+    life_factor: float = None
+    '''Amount texture affects particle life time 
+
+    :type: float
+    '''
+
+    mapping: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_x: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_y: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_z: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object to use for mapping with Object texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    rough_factor: float = None
+    '''Amount texture affects child roughness 
+
+    :type: float
+    '''
+
+    size_factor: float = None
+    '''Amount texture affects physical particle size 
+
+    :type: float
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''Texture coordinates used to map the texture onto the background 
+
+    :type: typing.Union[int, str]
+    '''
+
+    time_factor: float = None
+    '''Amount texture affects particle emission time 
+
+    :type: float
+    '''
+
+    use_map_clump: bool = None
+    '''Affect the child clumping 
+
+    :type: bool
+    '''
+
+    use_map_damp: bool = None
+    '''Affect the particle velocity damping 
+
+    :type: bool
+    '''
+
+    use_map_density: bool = None
+    '''Affect the density of the particles 
+
+    :type: bool
+    '''
+
+    use_map_field: bool = None
+    '''Affect the particle force fields 
+
+    :type: bool
+    '''
+
+    use_map_gravity: bool = None
+    '''Affect the particle gravity 
+
+    :type: bool
+    '''
+
+    use_map_kink_amp: bool = None
+    '''Affect the child kink amplitude 
+
+    :type: bool
+    '''
+
+    use_map_kink_freq: bool = None
+    '''Affect the child kink frequency 
+
+    :type: bool
+    '''
+
+    use_map_length: bool = None
+    '''Affect the child hair length 
+
+    :type: bool
+    '''
+
+    use_map_life: bool = None
+    '''Affect the life time of the particles 
+
+    :type: bool
+    '''
+
+    use_map_rough: bool = None
+    '''Affect the child rough 
+
+    :type: bool
+    '''
+
+    use_map_size: bool = None
+    '''Affect the particle size 
+
+    :type: bool
+    '''
+
+    use_map_time: bool = None
+    '''Affect the emission time of the particles 
+
+    :type: bool
+    '''
+
+    use_map_velocity: bool = None
+    '''Affect the particle initial velocity 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map to use for mapping with UV texture coordinates 
+
+    :type: str
+    '''
+
+    velocity_factor: float = None
+    '''Amount texture affects particle initial velocity 
+
+    :type: float
+    '''
+
+
+class ParticleSettingsTextureSlots:
+    '''Collection of texture slots '''
+
+    pass
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ParticleSystem:
+    '''Particle system in an object '''
+
+    active_particle_target: 'ParticleTarget' = None
+    '''
+
+    :type: 'ParticleTarget'
+    '''
+
+    active_particle_target_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    billboard_normal_uv: str = None
+    '''UV map to control billboard normals 
+
+    :type: str
+    '''
+
+    billboard_split_uv: str = None
+    '''UV map to control billboard splitting 
+
+    :type: str
+    '''
+
+    billboard_time_index_uv: str = None
+    '''UV map to control billboard time index (X-Y) 
+
+    :type: str
+    '''
+
+    child_particles: typing.List['ChildParticle'] = None
+    '''Child particles generated by the particle system 
+
+    :type: typing.List['ChildParticle']
+    '''
+
+    child_seed: int = None
+    '''Offset in the random number table for child particles, to get a different randomized result 
+
+    :type: int
+    '''
+
+    cloth: 'ClothModifier' = None
+    '''Cloth dynamics for hair 
+
+    :type: 'ClothModifier'
+    '''
+
+    dt_frac: float = None
+    '''The current simulation time step size, as a fraction of a frame 
+
+    :type: float
+    '''
+
+    has_multiple_caches: bool = None
+    '''Particle system has multiple point caches 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_clump: bool = None
+    '''Negate the effect of the clump vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_density: bool = None
+    '''Negate the effect of the density vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_field: bool = None
+    '''Negate the effect of the field vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_kink: bool = None
+    '''Negate the effect of the kink vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_length: bool = None
+    '''Negate the effect of the length vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_rotation: bool = None
+    '''Negate the effect of the rotation vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_roughness_1: bool = None
+    '''Negate the effect of the roughness 1 vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_roughness_2: bool = None
+    '''Negate the effect of the roughness 2 vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_roughness_end: bool = None
+    '''Negate the effect of the roughness end vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_size: bool = None
+    '''Negate the effect of the size vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_tangent: bool = None
+    '''Negate the effect of the tangent vertex group 
+
+    :type: bool
+    '''
+
+    invert_vertex_group_velocity: bool = None
+    '''Negate the effect of the velocity vertex group 
+
+    :type: bool
+    '''
+
+    is_editable: bool = None
+    '''Particle system can be edited in particle mode 
+
+    :type: bool
+    '''
+
+    is_edited: bool = None
+    '''Particle system has been edited in particle mode 
+
+    :type: bool
+    '''
+
+    is_global_hair: bool = None
+    '''Hair keys are in global coordinate space 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Particle system name 
+
+    :type: str
+    '''
+
+    parent: 'Object' = None
+    '''Use this object’s coordinate system instead of global coordinate system 
+
+    :type: 'Object'
+    '''
+
+    particles: typing.List['Particle'] = None
+    '''Particles generated by the particle system 
+
+    :type: typing.List['Particle']
+    '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    reactor_target_object: 'Object' = None
+    '''For reactor systems, the object that has the target particle system (empty if same object) 
+
+    :type: 'Object'
+    '''
+
+    reactor_target_particle_system: int = None
+    '''For reactor systems, index of particle system on the target object 
+
+    :type: int
+    '''
+
+    seed: int = None
+    '''Offset in the random number table, to get a different randomized result 
+
+    :type: int
+    '''
+
+    settings: 'ParticleSettings' = None
+    '''Particle system settings 
+
+    :type: 'ParticleSettings'
+    '''
+
+    targets: typing.List['ParticleTarget'] = None
+    '''Target particle systems 
+
+    :type: typing.List['ParticleTarget']
+    '''
+
+    use_hair_dynamics: bool = None
+    '''Enable hair dynamics using cloth simulation 
+
+    :type: bool
+    '''
+
+    use_keyed_timing: bool = None
+    '''Use key times 
+
+    :type: bool
+    '''
+
+    vertex_group_clump: str = None
+    '''Vertex group to control clump 
+
+    :type: str
+    '''
+
+    vertex_group_density: str = None
+    '''Vertex group to control density 
+
+    :type: str
+    '''
+
+    vertex_group_field: str = None
+    '''Vertex group to control field 
+
+    :type: str
+    '''
+
+    vertex_group_kink: str = None
+    '''Vertex group to control kink 
+
+    :type: str
+    '''
+
+    vertex_group_length: str = None
+    '''Vertex group to control length 
+
+    :type: str
+    '''
+
+    vertex_group_rotation: str = None
+    '''Vertex group to control rotation 
+
+    :type: str
+    '''
+
+    vertex_group_roughness_1: str = None
+    '''Vertex group to control roughness 1 
+
+    :type: str
+    '''
+
+    vertex_group_roughness_2: str = None
+    '''Vertex group to control roughness 2 
+
+    :type: str
+    '''
+
+    vertex_group_roughness_end: str = None
+    '''Vertex group to control roughness end 
+
+    :type: str
+    '''
+
+    vertex_group_size: str = None
+    '''Vertex group to control size 
+
+    :type: str
+    '''
+
+    vertex_group_tangent: str = None
+    '''Vertex group to control tangent 
+
+    :type: str
+    '''
+
+    vertex_group_velocity: str = None
+    '''Vertex group to control velocity 
+
+    :type: str
+    '''
+
+    def set_resolution(self,
+                       scene: 'Scene' = None,
+                       object: 'Object' = None,
+                       resolution: typing.Union[int, str] = 'PREVIEW'):
+        '''Set the resolution to use for the number of particles 
+
+        :param scene: Scene 
+        :type scene: 'Scene'
+        :param object: Object 
+        :type object: 'Object'
+        :param resolution: Resolution settings to applyPREVIEW Preview, Apply modifier preview settings.RENDER Render, Apply modifier render settings. 
+        :type resolution: typing.Union[int, str]
+        '''
+        pass
+
+    def co_hair(self, object: 'Object', particle_no: int = 0,
+                step: int = 0) -> float:
+        '''Obtain cache hair data 
+
+        :param object: Object 
+        :type object: 'Object'
+        :param particle_no: Particle no 
+        :type particle_no: int
+        :param step: step no 
+        :type step: int
+        :rtype: float
+        :return:  Co, Exported hairkey location 
+        '''
+        pass
+
+    def uv_on_emitter(self,
+                      modifier: 'ParticleSystemModifier',
+                      particle: 'Particle' = None,
+                      particle_no: int = 0,
+                      uv_no: int = 0) -> float:
+        '''Obtain uv for all particles 
+
+        :param modifier: Particle modifier 
+        :type modifier: 'ParticleSystemModifier'
+        :param particle: Particle 
+        :type particle: 'Particle'
+        :param particle_no: Particle no 
+        :type particle_no: int
+        :param uv_no: UV no 
+        :type uv_no: int
+        :rtype: float
+        :return:  uv 
+        '''
+        pass
+
+    def mcol_on_emitter(self,
+                        modifier: 'ParticleSystemModifier',
+                        particle: 'Particle',
+                        particle_no: int = 0,
+                        vcol_no: int = 0) -> float:
+        '''Obtain mcol for all particles 
+
+        :param modifier: Particle modifier 
+        :type modifier: 'ParticleSystemModifier'
+        :param particle: Particle 
+        :type particle: 'Particle'
+        :param particle_no: Particle no 
+        :type particle_no: int
+        :param vcol_no: vcol no 
+        :type vcol_no: int
+        :rtype: float
+        :return:  mcol 
+        '''
+        pass
+
+
+class ParticleSystemModifier:
+    '''Particle system simulation modifier '''
+
+    particle_system: 'ParticleSystem' = None
+    '''Particle System that this modifier controls 
+
+    :type: 'ParticleSystem'
+    '''
+
+
+class ParticleSystems:
+    '''Collection of particle systems '''
+
+    active: 'ParticleSystem' = None
+    '''Active particle system being displayed 
+
+    :type: 'ParticleSystem'
+    '''
+
+    active_index: int = None
+    '''Index of active particle system slot 
+
+    :type: int
+    '''
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ParticleTarget:
+    '''Target particle system '''
+
+    alliance: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    duration: float = None
+    '''
+
+    :type: float
+    '''
+
+    is_valid: bool = None
+    '''Keyed particles target is valid 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Particle target name 
+
+    :type: str
+    '''
+
+    object: 'Object' = None
+    '''The object that has the target particle system (empty if same object) 
+
+    :type: 'Object'
+    '''
+
+    system: int = None
+    '''The index of particle system on the target object 
+
+    :type: int
+    '''
+
+    time: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class PathCompare:
+    '''Match paths against this value '''
+
+    path: str = None
+    '''
+
+    :type: str
+    '''
+
+    use_glob: bool = None
+    '''Enable wildcard globbing 
+
+    :type: bool
+    '''
+
+
+class PathCompareCollection:
+    '''Collection of paths '''
+
+    pass
+
+
+class PivotConstraint:
+    '''Rotate around a different point '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''Offset of pivot from target (when set), or from owner’s location (when Fixed Position is off), or the absolute pivot point 
+
+    :type: float
+    '''
+
+    rotation_range: typing.Union[int, str] = None
+    '''Rotation range on which pivoting should occur 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object, defining the position of the pivot when defined 
+
+    :type: 'Object'
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+    use_relative_location: bool = None
+    '''Offset will be an absolute point in space instead of relative to the target 
+
+    :type: bool
+    '''
+
+
+class PointCache:
+    '''Point cache for physics simulations '''
+
+    compression: typing.Union[int, str] = None
+    '''Compression method to be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filepath: str = None
+    '''Cache file path 
+
+    :type: str
+    '''
+
+    frame_end: int = None
+    '''Frame on which the simulation stops 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''Frame on which the simulation starts 
+
+    :type: int
+    '''
+
+    frame_step: int = None
+    '''Number of frames between cached frames 
+
+    :type: int
+    '''
+
+    index: int = None
+    '''Index number of cache files 
+
+    :type: int
+    '''
+
+    info: str = None
+    '''Info on current cache status 
+
+    :type: str
+    '''
+
+    is_baked: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    is_baking: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    is_frame_skip: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    is_outdated: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Cache name 
+
+    :type: str
+    '''
+
+    point_caches: typing.List['PointCache'] = None
+    '''Point cache list 
+
+    :type: typing.List['PointCache']
+    '''
+
+    use_disk_cache: bool = None
+    '''Save cache files to disk (.blend file must be saved first) 
+
+    :type: bool
+    '''
+
+    use_external: bool = None
+    '''Read cache from an external location 
+
+    :type: bool
+    '''
+
+    use_library_path: bool = None
+    '''Use this file’s path for the disk cache when library linked into another file (for local bakes per scene file, disable this option) 
+
+    :type: bool
+    '''
+
+
+class PointCaches:
+    '''Collection of point caches '''
+
+    active_index: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class PointDensity:
+    '''Point density settings '''
+
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    falloff: typing.Union[int, str] = None
+    '''Method of attenuating density by distance from the point 
+
+    :type: typing.Union[int, str]
+    '''
+
+    falloff_curve: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    falloff_soft: float = None
+    '''Softness of the ‘soft’ falloff option 
+
+    :type: float
+    '''
+
+    falloff_speed_scale: float = None
+    '''Multiplier to bring particle speed within an acceptable range 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise formula used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object to take point data from 
+
+    :type: 'Object'
+    '''
+
+    particle_cache_space: typing.Union[int, str] = None
+    '''Coordinate system to cache particles in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    particle_color_source: typing.Union[int, str] = None
+    '''Data to derive color results from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''Particle System to render as points 
+
+    :type: 'ParticleSystem'
+    '''
+
+    point_source: typing.Union[int, str] = None
+    '''Point data to use as renderable point density 
+
+    :type: typing.Union[int, str]
+    '''
+
+    radius: float = None
+    '''Radius from the shaded sample to look for points within 
+
+    :type: float
+    '''
+
+    speed_scale: float = None
+    '''Multiplier to bring particle speed within an acceptable range 
+
+    :type: float
+    '''
+
+    turbulence_depth: int = None
+    '''Level of detail in the added turbulent noise 
+
+    :type: int
+    '''
+
+    turbulence_influence: typing.Union[int, str] = None
+    '''Method for driving added turbulent noise 
+
+    :type: typing.Union[int, str]
+    '''
+
+    turbulence_scale: float = None
+    '''Scale of the added turbulent noise 
+
+    :type: float
+    '''
+
+    turbulence_strength: float = None
+    '''Strength of the added turbulent noise 
+
+    :type: float
+    '''
+
+    use_falloff_curve: bool = None
+    '''Use a custom falloff curve 
+
+    :type: bool
+    '''
+
+    use_turbulence: bool = None
+    '''Add directed noise to the density at render-time 
+
+    :type: bool
+    '''
+
+    vertex_attribute_name: str = None
+    '''Vertex attribute to use for color 
+
+    :type: str
+    '''
+
+    vertex_cache_space: typing.Union[int, str] = None
+    '''Coordinate system to cache vertices in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_color_source: typing.Union[int, str] = None
+    '''Data to derive color results from 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class PointDensityTexture:
+    '''Settings for the Point Density texture '''
+
+    point_density: 'PointDensity' = None
+    '''The point density settings associated with this texture 
+
+    :type: 'PointDensity'
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
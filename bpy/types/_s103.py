@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class PointLamp:
+    '''Omnidirectional point lamp '''
+
+    compression_threshold: float = None
+    '''Deep shadow map compression threshold 
+
+    :type: float
+    '''
+
+    constant_coefficient: float = None
+    '''Constant distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    falloff_curve: 'CurveMapping' = None
+    '''Custom Lamp Falloff Curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''Intensity Decay with distance 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ge_shadow_buffer_type: typing.Union[int, str] = None
+    '''The shadow mapping algorithm used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    linear_attenuation: float = None
+    '''Linear distance attenuation 
+
+    :type: float
+    '''
+
+    linear_coefficient: float = None
+    '''Linear distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    quadratic_attenuation: float = None
+    '''Quadratic distance attenuation 
+
+    :type: float
+    '''
+
+    quadratic_coefficient: float = None
+    '''Quadratic distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    shadow_adaptive_threshold: float = None
+    '''Threshold for Adaptive Sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    shadow_buffer_bias: float = None
+    '''Shadow buffer sampling bias 
+
+    :type: float
+    '''
+
+    shadow_buffer_bleed_bias: float = None
+    '''Bias for reducing light-bleed on variance shadow maps 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_end: float = None
+    '''Shadow map clip end, beyond which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_start: float = None
+    '''Shadow map clip start, below which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_samples: int = None
+    '''Number of shadow buffer samples 
+
+    :type: int
+    '''
+
+    shadow_buffer_size: int = None
+    '''Resolution of the shadow buffer, higher values give crisper shadows but use more memory 
+
+    :type: int
+    '''
+
+    shadow_buffer_soft: float = None
+    '''Size of shadow buffer sampling area 
+
+    :type: float
+    '''
+
+    shadow_buffer_type: typing.Union[int, str] = None
+    '''Type of shadow buffer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_color: float = None
+    '''Color of shadows cast by the lamp 
+
+    :type: float
+    '''
+
+    shadow_filter_type: typing.Union[int, str] = None
+    '''Type of shadow filter (Buffer Shadows) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_sample_method: typing.Union[int, str] = None
+    '''Method for generating shadow samples: Adaptive QMC is fastest, Constant QMC is less noisy but slower 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_samples: int = None
+    '''Number of samples taken extra (samples x samples) 
+
+    :type: int
+    '''
+
+    shadow_sample_buffers: typing.Union[int, str] = None
+    '''Number of shadow buffers to render for better AA, this increases memory usage 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_soft_size: float = None
+    '''Light size for ray shadow sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    use_auto_clip_end: bool = None
+    '''Automatic calculation of clipping-end, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_auto_clip_start: bool = None
+    '''Automatic calculation of clipping-start, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_only_shadow: bool = None
+    '''Cast shadows only, without illuminating objects 
+
+    :type: bool
+    '''
+
+    use_shadow: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_shadow_layer: bool = None
+    '''Objects on the same layers only cast shadows 
+
+    :type: bool
+    '''
+
+    use_sphere: bool = None
+    '''Set light intensity to zero beyond lamp distance 
+
+    :type: bool
+    '''
+
+
+class PointerProperty:
+    '''RNA pointer property to point to another RNA struct '''
+
+    fixed_type: 'Struct' = None
+    '''Fixed pointer type, empty if variable type 
+
+    :type: 'Struct'
+    '''
+
+
+class PolygonFloatProperties:
+    '''Collection of float properties '''
+
+    def new(self, name: str = "FloatProp") -> 'MeshPolygonFloatPropertyLayer':
+        '''Add a float property layer to Mesh 
+
+        :param name: Float property name 
+        :type name: str
+        :rtype: 'MeshPolygonFloatPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class PolygonIntProperties:
+    '''Collection of int properties '''
+
+    def new(self, name: str = "IntProp") -> 'MeshPolygonIntPropertyLayer':
+        '''Add a integer property layer to Mesh 
+
+        :param name: Int property name 
+        :type name: str
+        :rtype: 'MeshPolygonIntPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class PolygonStringProperties:
+    '''Collection of string properties '''
+
+    def new(self,
+            name: str = "StringProp") -> 'MeshPolygonStringPropertyLayer':
+        '''Add a string property layer to Mesh 
+
+        :param name: String property name 
+        :type name: str
+        :rtype: 'MeshPolygonStringPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class Pose:
+    '''A collection of pose channels, including settings for animating bones '''
+
+    animation_visualization: 'AnimViz' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimViz'
+    '''
+
+    bone_groups: typing.List['BoneGroups'] = None
+    '''Groups of the bones 
+
+    :type: typing.List['BoneGroups']
+    '''
+
+    bones: typing.List['PoseBone'] = None
+    '''Individual pose bones for the armature 
+
+    :type: typing.List['PoseBone']
+    '''
+
+    ik_param: 'IKParam' = None
+    '''Parameters for IK solver 
+
+    :type: 'IKParam'
+    '''
+
+    ik_solver: typing.Union[int, str] = None
+    '''Selection of IK solver for IK chain 
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,439 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class PoseBone:
+    '''Channel defining pose data for a bone in a Pose '''
+
+    bbone_curveinx: float = None
+    '''X-axis handle offset for start of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveiny: float = None
+    '''Y-axis handle offset for start of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveoutx: float = None
+    '''X-axis handle offset for end of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_curveouty: float = None
+    '''Y-axis handle offset for end of the B-Bone’s curve, adjusts curvature 
+
+    :type: float
+    '''
+
+    bbone_custom_handle_end: 'PoseBone' = None
+    '''Bone that serves as the end handle for the B-Bone curve 
+
+    :type: 'PoseBone'
+    '''
+
+    bbone_custom_handle_start: 'PoseBone' = None
+    '''Bone that serves as the start handle for the B-Bone curve 
+
+    :type: 'PoseBone'
+    '''
+
+    bbone_rollin: float = None
+    '''Roll offset for the start of the B-Bone, adjusts twist 
+
+    :type: float
+    '''
+
+    bbone_rollout: float = None
+    '''Roll offset for the end of the B-Bone, adjusts twist 
+
+    :type: float
+    '''
+
+    bbone_scalein: float = None
+    '''Scale factor for start of the B-Bone, adjusts thickness (for tapering effects) 
+
+    :type: float
+    '''
+
+    bbone_scaleout: float = None
+    '''Scale factor for end of the B-Bone, adjusts thickness (for tapering effects) 
+
+    :type: float
+    '''
+
+    bone: 'Bone' = None
+    '''Bone associated with this PoseBone 
+
+    :type: 'Bone'
+    '''
+
+    bone_group: 'BoneGroup' = None
+    '''Bone Group this pose channel belongs to 
+
+    :type: 'BoneGroup'
+    '''
+
+    bone_group_index: int = None
+    '''Bone Group this pose channel belongs to (0=no group) 
+
+    :type: int
+    '''
+
+    child: 'PoseBone' = None
+    '''Child of this pose bone 
+
+    :type: 'PoseBone'
+    '''
+
+    constraints: typing.List['PoseBoneConstraints'] = None
+    '''Constraints that act on this PoseChannel 
+
+    :type: typing.List['PoseBoneConstraints']
+    '''
+
+    custom_shape: 'Object' = None
+    '''Object that defines custom draw type for this bone 
+
+    :type: 'Object'
+    '''
+
+    custom_shape_scale: float = None
+    '''Adjust the size of the custom shape 
+
+    :type: float
+    '''
+
+    custom_shape_transform: 'PoseBone' = None
+    '''Bone that defines the display transform of this custom shape 
+
+    :type: 'PoseBone'
+    '''
+
+    head: float = None
+    '''Location of head of the channel’s bone 
+
+    :type: float
+    '''
+
+    ik_linear_weight: float = None
+    '''Weight of scale constraint for IK 
+
+    :type: float
+    '''
+
+    ik_max_x: float = None
+    '''Maximum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_max_y: float = None
+    '''Maximum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_max_z: float = None
+    '''Maximum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_min_x: float = None
+    '''Minimum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_min_y: float = None
+    '''Minimum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_min_z: float = None
+    '''Minimum angles for IK Limit 
+
+    :type: float
+    '''
+
+    ik_rotation_weight: float = None
+    '''Weight of rotation constraint for IK 
+
+    :type: float
+    '''
+
+    ik_stiffness_x: float = None
+    '''IK stiffness around the X axis 
+
+    :type: float
+    '''
+
+    ik_stiffness_y: float = None
+    '''IK stiffness around the Y axis 
+
+    :type: float
+    '''
+
+    ik_stiffness_z: float = None
+    '''IK stiffness around the Z axis 
+
+    :type: float
+    '''
+
+    ik_stretch: float = None
+    '''Allow scaling of the bone for IK 
+
+    :type: float
+    '''
+
+    is_in_ik_chain: bool = None
+    '''Is part of an IK chain 
+
+    :type: bool
+    '''
+
+    location: float = None
+    '''
+
+    :type: float
+    '''
+
+    lock_ik_x: bool = None
+    '''Disallow movement around the X axis 
+
+    :type: bool
+    '''
+
+    lock_ik_y: bool = None
+    '''Disallow movement around the Y axis 
+
+    :type: bool
+    '''
+
+    lock_ik_z: bool = None
+    '''Disallow movement around the Z axis 
+
+    :type: bool
+    '''
+
+    lock_location: bool = None
+    '''Lock editing of location in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotation: bool = None
+    '''Lock editing of rotation in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotation_w: bool = None
+    '''Lock editing of ‘angle’ component of four-component rotations in the interface 
+
+    :type: bool
+    '''
+
+    lock_rotations_4d: bool = None
+    '''Lock editing of four component rotations by components (instead of as Eulers) 
+
+    :type: bool
+    '''
+
+    lock_scale: bool = None
+    '''Lock editing of scale in the interface 
+
+    :type: bool
+    '''
+
+    matrix: float = None
+    '''Final 4x4 matrix after constraints and drivers are applied (object space) 
+
+    :type: float
+    '''
+
+    matrix_basis: float = None
+    '''Alternative access to location/scale/rotation relative to the parent and own rest bone 
+
+    :type: float
+    '''
+
+    matrix_channel: float = None
+    '''4x4 matrix, before constraints 
+
+    :type: float
+    '''
+
+    motion_path: 'MotionPath' = None
+    '''Motion Path for this element 
+
+    :type: 'MotionPath'
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    parent: 'PoseBone' = None
+    '''Parent of this pose bone 
+
+    :type: 'PoseBone'
+    '''
+
+    rotation_axis_angle: float = None
+    '''Angle of Rotation for Axis-Angle rotation representation 
+
+    :type: float
+    '''
+
+    rotation_euler: float = None
+    '''Rotation in Eulers 
+
+    :type: float
+    '''
+
+    rotation_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    rotation_quaternion: float = None
+    '''Rotation in Quaternions 
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''
+
+    :type: float
+    '''
+
+    tail: float = None
+    '''Location of tail of the channel’s bone 
+
+    :type: float
+    '''
+
+    use_bbone_custom_handles: bool = None
+    '''Use custom reference bones as handles for B-Bones instead of next/previous bones, leave these blank to use only B-Bone offset properties to control the shape 
+
+    :type: bool
+    '''
+
+    use_bbone_relative_end_handle: bool = None
+    '''Treat custom end handle position as a relative value 
+
+    :type: bool
+    '''
+
+    use_bbone_relative_start_handle: bool = None
+    '''Treat custom start handle position as a relative value 
+
+    :type: bool
+    '''
+
+    use_custom_shape_bone_size: bool = None
+    '''Scale the custom object by the bone length 
+
+    :type: bool
+    '''
+
+    use_ik_limit_x: bool = None
+    '''Limit movement around the X axis 
+
+    :type: bool
+    '''
+
+    use_ik_limit_y: bool = None
+    '''Limit movement around the Y axis 
+
+    :type: bool
+    '''
+
+    use_ik_limit_z: bool = None
+    '''Limit movement around the Z axis 
+
+    :type: bool
+    '''
+
+    use_ik_linear_control: bool = None
+    '''Apply channel size as IK constraint if stretching is enabled 
+
+    :type: bool
+    '''
+
+    use_ik_rotation_control: bool = None
+    '''Apply channel rotation as IK constraint 
+
+    :type: bool
+    '''
+
+    basename = None
+    '''The name of this bone before any ‘.’ character (readonly) '''
+
+    center = None
+    '''The midpoint between the head and the tail. (readonly) '''
+
+    children = None
+    '''(readonly) '''
+
+    children_recursive = None
+    '''A list of all children from this bone. (readonly) '''
+
+    children_recursive_basename = None
+    '''Returns a chain of children with the same base name as this bone. Only direct chains are supported, forks caused by multiple children with matching base names will terminate the function and not be returned. (readonly) '''
+
+    length = None
+    '''The distance from head to tail, when set the head is moved to fit the length. '''
+
+    parent_recursive = None
+    '''A list of parents, starting with the immediate parent (readonly) '''
+
+    vector = None
+    '''The direction this bone is pointing. Utility function for (tail - head) (readonly) '''
+
+    x_axis = None
+    '''Vector pointing down the x-axis of the bone. (readonly) '''
+
+    y_axis = None
+    '''Vector pointing down the y-axis of the bone. (readonly) '''
+
+    z_axis = None
+    '''Vector pointing down the z-axis of the bone. (readonly) '''
+
+    def evaluate_envelope(self, point: float) -> float:
+        '''Calculate bone envelope at given point 
+
+        :param point: Point, Position in 3d space to evaluate 
+        :type point: float
+        :rtype: float
+        :return:  Factor, Envelope factor 
+        '''
+        pass
+
+    def parent_index(self, parent_test):
+        '''The same as ‘bone in other_bone.parent_recursive’ but saved generating a list. 
+
+        '''
+        pass
+
+    def translate(self, vec):
+        '''Utility function to add vec to the head and tail of this bone 
+
+        '''
+        pass
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class PoseBoneConstraints:
+    '''Collection of pose bone constraints '''
+
+    active: 'Constraint' = None
+    '''Active PoseChannel constraint 
+
+    :type: 'Constraint'
+    '''
+
+    def new(self, type: typing.Union[int, str]) -> 'Constraint':
+        '''Add a constraint to this object 
+
+        :param type: Constraint type to addCAMERA_SOLVER Camera Solver.FOLLOW_TRACK Follow Track.OBJECT_SOLVER Object Solver.COPY_LOCATION Copy Location, Copy the location of a target (with an optional offset), so that they move together.COPY_ROTATION Copy Rotation, Copy the rotation of a target (with an optional offset), so that they rotate together.COPY_SCALE Copy Scale, Copy the scale factors of a target (with an optional offset), so that they are scaled by the same amount.COPY_TRANSFORMS Copy Transforms, Copy all the transformations of a target, so that they move together.LIMIT_DISTANCE Limit Distance, Restrict movements to within a certain distance of a target (at the time of constraint evaluation only).LIMIT_LOCATION Limit Location, Restrict movement along each axis within given ranges.LIMIT_ROTATION Limit Rotation, Restrict rotation along each axis within given ranges.LIMIT_SCALE Limit Scale, Restrict scaling along each axis with given ranges.MAINTAIN_VOLUME Maintain Volume, Compensate for scaling one axis by applying suitable scaling to the other two axes.TRANSFORM Transformation, Use one transform property from target to control another (or same) property on owner.TRANSFORM_CACHE Transform Cache, Look up the transformation matrix from an external file.CLAMP_TO Clamp To, Restrict movements to lie along a curve by remapping location along curve’s longest axis.DAMPED_TRACK Damped Track, Point towards a target by performing the smallest rotation necessary.IK Inverse Kinematics, Control a chain of bones by specifying the endpoint target (Bones only).LOCKED_TRACK Locked Track, Rotate around the specified (‘locked’) axis to point towards a target.SPLINE_IK Spline IK, Align chain of bones along a curve (Bones only).STRETCH_TO Stretch To, Stretch along Y-Axis to point towards a target.TRACK_TO Track To, Legacy tracking constraint prone to twisting artifacts.ACTION Action, Use transform property of target to look up pose for owner from an Action.CHILD_OF Child Of, Make target the ‘detachable’ parent of owner.FLOOR Floor, Use position (and optionally rotation) of target to define a ‘wall’ or ‘floor’ that the owner can not cross.FOLLOW_PATH Follow Path, Use to animate an object/bone following a path.PIVOT Pivot, Change pivot point for transforms (buggy).RIGID_BODY_JOINT Rigid Body Joint, Use to define a Rigid Body Constraint (for Game Engine use only).SHRINKWRAP Shrinkwrap, Restrict movements to surface of target mesh. 
+        :type type: typing.Union[int, str]
+        :rtype: 'Constraint'
+        :return:  New constraint 
+        '''
+        pass
+
+    def remove(self, constraint: 'Constraint'):
+        '''Remove a constraint from this object 
+
+        :param constraint: Removed constraint 
+        :type constraint: 'Constraint'
+        '''
+        pass
+
+
+class Property:
+    '''RNA property definition '''
+
+    description: str = None
+    '''Description of the property for tooltips 
+
+    :type: str
+    '''
+
+    icon: typing.Union[int, str] = None
+    '''Icon of the item 
+
+    :type: typing.Union[int, str]
+    '''
+
+    identifier: str = None
+    '''Unique name used in the code and scripting 
+
+    :type: str
+    '''
+
+    is_animatable: bool = None
+    '''Property is animatable through RNA 
+
+    :type: bool
+    '''
+
+    is_argument_optional: bool = None
+    '''True when the property is optional in a Python function implementing an RNA function 
+
+    :type: bool
+    '''
+
+    is_enum_flag: bool = None
+    '''True when multiple enums 
+
+    :type: bool
+    '''
+
+    is_hidden: bool = None
+    '''True when the property is hidden 
+
+    :type: bool
+    '''
+
+    is_library_editable: bool = None
+    '''Property is editable from linked instances (changes not saved) 
+
+    :type: bool
+    '''
+
+    is_never_none: bool = None
+    '''True when this value can’t be set to None 
+
+    :type: bool
+    '''
+
+    is_output: bool = None
+    '''True when this property is an output value from an RNA function 
+
+    :type: bool
+    '''
+
+    is_readonly: bool = None
+    '''Property is editable through RNA 
+
+    :type: bool
+    '''
+
+    is_registered: bool = None
+    '''Property is registered as part of type registration 
+
+    :type: bool
+    '''
+
+    is_registered_optional: bool = None
+    '''Property is optionally registered as part of type registration 
+
+    :type: bool
+    '''
+
+    is_required: bool = None
+    '''False when this property is an optional argument in an RNA function 
+
+    :type: bool
+    '''
+
+    is_runtime: bool = None
+    '''Property has been dynamically created at runtime 
+
+    :type: bool
+    '''
+
+    is_skip_save: bool = None
+    '''True when the property is not saved in presets 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Human readable name 
+
+    :type: str
+    '''
+
+    srna: 'Struct' = None
+    '''Struct definition used for properties assigned to this item 
+
+    :type: 'Struct'
+    '''
+
+    subtype: typing.Union[int, str] = None
+    '''Semantic interpretation of the property 
+
+    :type: typing.Union[int, str]
+    '''
+
+    translation_context: str = None
+    '''Translation context of the property’s name 
+
+    :type: str
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Data type of the property 
+
+    :type: typing.Union[int, str]
+    '''
+
+    unit: typing.Union[int, str] = None
+    '''Type of units for this property 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class PropertyActuator:
+    '''Actuator to handle properties '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Copy from this Object 
+
+    :type: 'Object'
+    '''
+
+    object_property: str = None
+    '''Copy this property 
+
+    :type: str
+    '''
+
+    property: str = None
+    '''The name of the property 
+
+    :type: str
+    '''
+
+    value: str = None
+    '''The name of the property or the value to use (use “” around strings) 
+
+    :type: str
+    '''
+
+
+class PropertyGroup:
+    '''Group of ID properties '''
+
+    name: str = None
+    '''Unique name used in the code and scripting 
+
+    :type: str
+    '''
+
+
+class PropertyGroupItem:
+    '''Property that stores arbitrary, user defined properties '''
+
+    collection: typing.List['PropertyGroup'] = None
+    '''
+
+    :type: typing.List['PropertyGroup']
+    '''
+
+    double: float = None
+    '''
+
+    :type: float
+    '''
+
+    double_array: float = None
+    '''
+
+    :type: float
+    '''
+
+    float: float = None
+    '''
+
+    :type: float
+    '''
+
+    float_array: float = None
+    '''
+
+    :type: float
+    '''
+
+    group: 'PropertyGroup' = None
+    '''
+
+    :type: 'PropertyGroup'
+    '''
+
+    id: 'ID' = None
+    '''
+
+    :type: 'ID'
+    '''
+
+    idp_array: typing.List['PropertyGroup'] = None
+    '''
+
+    :type: typing.List['PropertyGroup']
+    '''
+
+    int: int = None
+    '''
+
+    :type: int
+    '''
+
+    int_array: int = None
+    '''
+
+    :type: int
+    '''
+
+    string: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class PropertySensor:
+    '''Sensor to detect values and changes in values of properties '''
+
+    evaluation_type: typing.Union[int, str] = None
+    '''Type of property evaluation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    property: str = None
+    '''
+
+    :type: str
+    '''
+
+    value: str = None
+    '''Check for this value in types in Equal, Not Equal, Less Than and Greater Than types 
+
+    :type: str
+    '''
+
+    value_max: str = None
+    '''Maximum value in Interval type 
+
+    :type: str
+    '''
+
+    value_min: str = None
+    '''Minimum value in Interval type 
+
+    :type: str
+    '''
+
+
+class PythonConstraint:
+    '''Use Python script for constraint evaluation '''
+
+    has_script_error: bool = None
+    '''The linked Python script has thrown an error 
+
+    :type: bool
+    '''
+
+    target_count: int = None
+    '''Usually only 1-3 are needed 
+
+    :type: int
+    '''
+
+    targets: typing.List['ConstraintTarget'] = None
+    '''Target Objects 
+
+    :type: typing.List['ConstraintTarget']
+    '''
+
+    text: 'Text' = None
+    '''The text object that contains the Python script 
+
+    :type: 'Text'
+    '''
+
+    use_targets: bool = None
+    '''Use the targets indicated in the constraint panel 
+
+    :type: bool
+    '''
+
+
+class PythonController:
+    '''Controller executing a python script '''
+
+    mode: typing.Union[int, str] = None
+    '''Python script type (textblock or module - faster) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    module: str = None
+    '''Module name and function to run, e.g. “someModule.main” (internal texts and external python files can be used) 
+
+    :type: str
+    '''
+
+    text: 'Text' = None
+    '''Text data-block with the python script 
+
+    :type: 'Text'
+    '''
+
+    use_debug: bool = None
+    '''Continuously reload the module from disk for editing external modules without restarting 
+
+    :type: bool
+    '''
+
+
+class RENDERLAYER_UL_linesets:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class RENDERLAYER_UL_renderlayers:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
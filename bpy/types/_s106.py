@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RENDERLAYER_UL_renderviews:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class RadarSensor:
+    '''Sensor to detect objects in a cone shaped radar emanating from the current object '''
+
+    angle: float = None
+    '''Opening angle of the radar cone 
+
+    :type: float
+    '''
+
+    axis: typing.Union[int, str] = None
+    '''Along which axis the radar cone is cast 
+
+    :type: typing.Union[int, str]
+    '''
+
+    distance: float = None
+    '''Depth of the radar cone 
+
+    :type: float
+    '''
+
+    property: str = None
+    '''Only look for objects with this property (blank = all objects) 
+
+    :type: str
+    '''
+
+
+class RandomActuator:
+    chance: float = None
+    '''Pick a number between 0 and 1, success if it’s below this value 
+
+    :type: float
+    '''
+
+    distribution: typing.Union[int, str] = None
+    '''Choose the type of distribution 
+
+    :type: typing.Union[int, str]
+    '''
+
+    float_max: float = None
+    '''Choose a number from a range: upper boundary of the range 
+
+    :type: float
+    '''
+
+    float_mean: float = None
+    '''A normal distribution: mean of the distribution 
+
+    :type: float
+    '''
+
+    float_min: float = None
+    '''Choose a number from a range: lower boundary of the range 
+
+    :type: float
+    '''
+
+    float_value: float = None
+    '''Always return this number 
+
+    :type: float
+    '''
+
+    half_life_time: float = None
+    '''Negative exponential dropoff 
+
+    :type: float
+    '''
+
+    int_max: int = None
+    '''Choose a number from a range: upper boundary of the range 
+
+    :type: int
+    '''
+
+    int_mean: float = None
+    '''Expected mean value of the distribution 
+
+    :type: float
+    '''
+
+    int_min: int = None
+    '''Choose a number from a range: lower boundary of the range 
+
+    :type: int
+    '''
+
+    int_value: int = None
+    '''Always return this number 
+
+    :type: int
+    '''
+
+    property: str = None
+    '''Assign the random value to this property 
+
+    :type: str
+    '''
+
+    seed: int = None
+    '''Initial seed of the random generator, use Python for more freedom (choose 0 for not random) 
+
+    :type: int
+    '''
+
+    standard_derivation: float = None
+    '''A normal distribution: standard deviation of the distribution 
+
+    :type: float
+    '''
+
+    use_always_true: bool = None
+    '''Always false or always true 
+
+    :type: bool
+    '''
+
+
+class RandomSensor:
+    '''Sensor to send random events '''
+
+    seed: int = None
+    '''Initial seed of the generator (choose 0 for not random) 
+
+    :type: int
+    '''
+
+
+class RaySensor:
+    '''Sensor to detect intersections with a ray emanating from the current object '''
+
+    axis: typing.Union[int, str] = None
+    '''Along which axis the ray is cast 
+
+    :type: typing.Union[int, str]
+    '''
+
+    material: str = None
+    '''Only look for objects with this material (blank = all objects) 
+
+    :type: str
+    '''
+
+    property: str = None
+    '''Only look for objects with this property (blank = all objects) 
+
+    :type: str
+    '''
+
+    range: float = None
+    '''Sense objects no farther than this distance 
+
+    :type: float
+    '''
+
+    ray_type: typing.Union[int, str] = None
+    '''Toggle collision on material or property 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_x_ray: bool = None
+    '''Toggle X-Ray option (see through objects that don’t have the property) 
+
+    :type: bool
+    '''
+
+
+class Region:
+    '''Region in a subdivided screen area '''
+
+    height: int = None
+    '''Region height 
+
+    :type: int
+    '''
+
+    id: int = None
+    '''Unique ID for this region 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of this region 
+
+    :type: typing.Union[int, str]
+    '''
+
+    view2d: 'View2D' = None
+    '''2D view of the region 
+
+    :type: 'View2D'
+    '''
+
+    width: int = None
+    '''Region width 
+
+    :type: int
+    '''
+
+    x: int = None
+    '''The window relative vertical location of the region 
+
+    :type: int
+    '''
+
+    y: int = None
+    '''The window relative horizontal location of the region 
+
+    :type: int
+    '''
+
+    def tag_redraw(self, ):
+        '''tag_redraw 
+
+        '''
+        pass
+
+
+class RegionView3D:
+    '''3D View region data '''
+
+    is_perspective: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    lock_rotation: bool = None
+    '''Lock view rotation in side views 
+
+    :type: bool
+    '''
+
+    perspective_matrix: float = None
+    '''Current perspective matrix (window_matrix * view_matrix) 
+
+    :type: float
+    '''
+
+    show_sync_view: bool = None
+    '''Sync view position between side views 
+
+    :type: bool
+    '''
+
+    use_box_clip: bool = None
+    '''Clip objects based on what’s visible in other side views 
+
+    :type: bool
+    '''
+
+    view_camera_offset: float = None
+    '''View shift in camera view 
+
+    :type: float
+    '''
+
+    view_camera_zoom: float = None
+    '''Zoom factor in camera view 
+
+    :type: float
+    '''
+
+    view_distance: float = None
+    '''Distance to the view location 
+
+    :type: float
+    '''
+
+    view_location: float = None
+    '''View pivot location 
+
+    :type: float
+    '''
+
+    view_matrix: float = None
+    '''Current view matrix 
+
+    :type: float
+    '''
+
+    view_perspective: typing.Union[int, str] = None
+    '''View Perspective 
+
+    :type: typing.Union[int, str]
+    '''
+
+    view_rotation: float = None
+    '''Rotation in quaternions (keep normalized) 
+
+    :type: float
+    '''
+
+    window_matrix: float = None
+    '''Current window matrix 
+
+    :type: float
+    '''
+
+    def update(self, ):
+        '''Recalculate the view matrices 
+
+        '''
+        pass
+
+
+class RemeshModifier:
+    '''Generate a new surface with regular topology that follows the shape of the input mesh '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    octree_depth: int = None
+    '''Resolution of the octree; higher values give finer details 
+
+    :type: int
+    '''
+
+    scale: float = None
+    '''The ratio of the largest dimension of the model over the size of the grid 
+
+    :type: float
+    '''
+
+    sharpness: float = None
+    '''Tolerance for outliers; lower values filter noise while higher values will reproduce edges closer to the input 
+
+    :type: float
+    '''
+
+    threshold: float = None
+    '''If removing disconnected pieces, minimum size of components to preserve as a ratio of the number of polygons in the largest component 
+
+    :type: float
+    '''
+
+    use_remove_disconnected: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_smooth_shade: bool = None
+    '''Output faces with smooth shading rather than flat shaded 
+
+    :type: bool
+    '''
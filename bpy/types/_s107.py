@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RenderEngine:
+    '''Render engine '''
+
+    bl_idname: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_label: str = None
+    '''
+
+    :type: str
+    '''
+
+    bl_use_exclude_layers: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_postprocess: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_preview: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_save_buffers: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_shading_nodes: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_shading_nodes_custom: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_spherical_stereo: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    bl_use_texture_preview: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    camera_override: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+    is_animation: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    is_preview: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    layer_override: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    render: 'RenderSettings' = None
+    '''
+
+    :type: 'RenderSettings'
+    '''
+
+    resolution_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    resolution_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    tile_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    tile_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    use_highlight_tiles: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def update(self, data=None, scene=None):
+        '''Export scene data for render 
+
+        '''
+        pass
+
+    def render(self, scene=None):
+        '''Render scene into an image 
+
+        '''
+        pass
+
+    def bake(self, scene, object, pass_type: typing.Union[int, str],
+             pass_filter: int, object_id: int, pixel_array, num_pixels: int,
+             depth: int, result):
+        '''Bake passes 
+
+        :param pass_type: Pass, Pass to bake 
+        :type pass_type: typing.Union[int, str]
+        :param pass_filter: Pass Filter, Filter to combined, diffuse, glossy, transmission and subsurface passes 
+        :type pass_filter: int
+        :param object_id: Object Id, Id of the current object being baked in relation to the others 
+        :type object_id: int
+        :param num_pixels: Number of Pixels, Size of the baking batch 
+        :type num_pixels: int
+        :param depth: Pixels depth, Number of channels 
+        :type depth: int
+        '''
+        pass
+
+    def view_update(self, context=None):
+        '''Update on data changes for viewport render 
+
+        '''
+        pass
+
+    def view_draw(self, context=None):
+        '''Draw viewport render 
+
+        '''
+        pass
+
+    def update_script_node(self, node=None):
+        '''Compile shader script node 
+
+        '''
+        pass
+
+    def tag_redraw(self, ):
+        '''Request redraw for viewport rendering 
+
+        '''
+        pass
+
+    def tag_update(self, ):
+        '''Request update call for viewport rendering 
+
+        '''
+        pass
+
+    def update_render_passes(self, scene=None, renderlayer=None):
+        '''Update the render passes that will be generated 
+
+        '''
+        pass
+
+    def begin_result(self,
+                     x: int,
+                     y: int,
+                     w: int,
+                     h: int,
+                     layer: str = "",
+                     view: str = "") -> 'RenderResult':
+        '''Create render result to write linear floating point render layers and passes 
+
+        :param x: X 
+        :type x: int
+        :param y: Y 
+        :type y: int
+        :param w: Width 
+        :type w: int
+        :param h: Height 
+        :type h: int
+        :param layer: Layer, Single layer to get render result for 
+        :type layer: str
+        :param view: View, Single view to get render result for 
+        :type view: str
+        :rtype: 'RenderResult'
+        :return:  Result 
+        '''
+        pass
+
+    def update_result(self, result: 'RenderResult'):
+        '''Signal that pixels have been updated and can be redrawn in the user interface 
+
+        :param result: Result 
+        :type result: 'RenderResult'
+        '''
+        pass
+
+    def end_result(self,
+                   result: 'RenderResult',
+                   cancel: bool = False,
+                   highlight: bool = False,
+                   do_merge_results: bool = False):
+        '''All pixels in the render result have been set and are final 
+
+        :param result: Result 
+        :type result: 'RenderResult'
+        :param cancel: Cancel, Don’t mark tile as done, don’t merge results unless forced 
+        :type cancel: bool
+        :param highlight: Highlight, Don’t mark tile as done yet 
+        :type highlight: bool
+        :param do_merge_results: Merge Results, Merge results even if cancel=true 
+        :type do_merge_results: bool
+        '''
+        pass
+
+    def add_pass(self, name: str, channels: int, chan_id: str,
+                 layer: str = ""):
+        '''Add a pass to the render layer 
+
+        :param name: Name, Name of the Pass, without view or channel tag 
+        :type name: str
+        :param channels: Channels 
+        :type channels: int
+        :param chan_id: Channel IDs, Channel names, one character per channel 
+        :type chan_id: str
+        :param layer: Layer, Single layer to add render pass to 
+        :type layer: str
+        '''
+        pass
+
+    def test_break(self, ) -> bool:
+        '''Test if the render operation should been canceled, this is a fast call that should be used regularly for responsiveness 
+
+        :rtype: bool
+        :return:  Break 
+        '''
+        pass
+
+    def active_view_get(self, ) -> str:
+        '''active_view_get 
+
+        :rtype: str
+        :return:  View, Single view active 
+        '''
+        pass
+
+    def active_view_set(self, view: str):
+        '''active_view_set 
+
+        :param view: View, Single view to set as active 
+        :type view: str
+        '''
+        pass
+
+    def camera_shift_x(self, camera,
+                       use_spherical_stereo: bool = False) -> float:
+        '''camera_shift_x 
+
+        :param use_spherical_stereo: Spherical Stereo 
+        :type use_spherical_stereo: bool
+        :rtype: float
+        :return:  Shift X 
+        '''
+        pass
+
+    def camera_model_matrix(self,
+                            camera,
+                            use_spherical_stereo: bool = False,
+                            r_model_matrix: float = 0.0):
+        '''camera_model_matrix 
+
+        :param use_spherical_stereo: Spherical Stereo 
+        :type use_spherical_stereo: bool
+        :param r_model_matrix: Model Matrix, Normalized camera model matrix 
+        :type r_model_matrix: float
+        '''
+        pass
+
+    def use_spherical_stereo(self, camera) -> bool:
+        '''use_spherical_stereo 
+
+        :rtype: bool
+        :return:  Spherical Stereo 
+        '''
+        pass
+
+    def update_stats(self, stats: str, info: str):
+        '''Update and signal to redraw render status text 
+
+        :param stats: Stats 
+        :type stats: str
+        :param info: Info 
+        :type info: str
+        '''
+        pass
+
+    def frame_set(self, frame: int, subframe: float):
+        '''Evaluate scene at a different frame (for motion blur) 
+
+        :param frame: Frame 
+        :type frame: int
+        :param subframe: Subframe 
+        :type subframe: float
+        '''
+        pass
+
+    def update_progress(self, progress: float):
+        '''Update progress percentage of render 
+
+        :param progress: Percentage of render that’s done 
+        :type progress: float
+        '''
+        pass
+
+    def update_memory_stats(self,
+                            memory_used: float = 0.0,
+                            memory_peak: float = 0.0):
+        '''Update memory usage statistics 
+
+        :param memory_used: Current memory usage in megabytes 
+        :type memory_used: float
+        :param memory_peak: Peak memory usage in megabytes 
+        :type memory_peak: float
+        '''
+        pass
+
+    def report(self, type: typing.Set[typing.Union[int, str]], message: str):
+        '''Report info, warning or error messages 
+
+        :param type: Type 
+        :type type: typing.Set[typing.Union[int, str]]
+        :param message: Report Message 
+        :type message: str
+        '''
+        pass
+
+    def error_set(self, message: str):
+        '''Set error message displaying after the render is finished 
+
+        :param message: Report Message 
+        :type message: str
+        '''
+        pass
+
+    def bind_display_space_shader(self, scene):
+        '''Bind GLSL fragment shader that converts linear colors to display space colors using scene color management settings 
+
+        '''
+        pass
+
+    def unbind_display_space_shader(self, ):
+        '''Unbind GLSL display space shader, must always be called after binding the shader 
+
+        '''
+        pass
+
+    def support_display_space_shader(self, scene) -> bool:
+        '''Test if GLSL display space shader is supported for the combination of graphics card and scene settings 
+
+        :rtype: bool
+        :return:  Supported 
+        '''
+        pass
+
+    def register_pass(self,
+                      scene=None,
+                      srl=None,
+                      name: str = "",
+                      channels: int = 1,
+                      chanid: str = "",
+                      type: typing.Union[int, str] = 'VALUE'):
+        '''Register a render pass that will be part of the render with the current settings 
+
+        :param name: Name 
+        :type name: str
+        :param channels: Channels 
+        :type channels: int
+        :param chanid: Channel IDs 
+        :type chanid: str
+        :param type: Type 
+        :type type: typing.Union[int, str]
+        '''
+        pass
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RenderPass:
+    channel_id: str = None
+    '''
+
+    :type: str
+    '''
+
+    channels: int = None
+    '''
+
+    :type: int
+    '''
+
+    fullname: str = None
+    '''
+
+    :type: str
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    rect: float = None
+    '''
+
+    :type: float
+    '''
+
+    view_id: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class RenderPasses:
+    '''Collection of render passes '''
+
+    def find_by_type(self, pass_type: typing.Union[int, str],
+                     view: str) -> 'RenderPass':
+        '''Get the render pass for a given type and view 
+
+        :param pass_type: Pass 
+        :type pass_type: typing.Union[int, str]
+        :param view: View, Render view to get pass from 
+        :type view: str
+        :rtype: 'RenderPass'
+        :return:  The matching render pass 
+        '''
+        pass
+
+    def find_by_name(self, name: str, view: str) -> 'RenderPass':
+        '''Get the render pass for a given name and view 
+
+        :param name: Pass 
+        :type name: str
+        :param view: View, Render view to get pass from 
+        :type view: str
+        :rtype: 'RenderPass'
+        :return:  The matching render pass 
+        '''
+        pass
+
+
+class RenderResult:
+    '''Result of rendering, including all layers and passes '''
+
+    layers: typing.List['RenderLayer'] = None
+    '''
+
+    :type: typing.List['RenderLayer']
+    '''
+
+    resolution_x: int = None
+    '''
+
+    :type: int
+    '''
+
+    resolution_y: int = None
+    '''
+
+    :type: int
+    '''
+
+    views: typing.List['RenderView'] = None
+    '''
+
+    :type: typing.List['RenderView']
+    '''
+
+    def load_from_file(self, filename: str):
+        '''Copies the pixels of this render result from an image file 
+
+        :param filename: File Name, Filename to load into this render tile, must be no smaller than the render result 
+        :type filename: str
+        '''
+        pass
@@ -0,0 +1,773 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RenderSettings:
+    '''Rendering settings for a Scene data-block '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    antialiasing_samples: typing.Union[int, str] = None
+    '''Amount of anti-aliasing samples per pixel 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bake: 'BakeSettings' = None
+    '''
+
+    :type: 'BakeSettings'
+    '''
+
+    bake_aa_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    bake_bias: float = None
+    '''Bias towards faces further away from the object (in blender units) 
+
+    :type: float
+    '''
+
+    bake_distance: float = None
+    '''Maximum distance from active object to other object (in blender units) 
+
+    :type: float
+    '''
+
+    bake_margin: int = None
+    '''Extends the baked result as a post process filter 
+
+    :type: int
+    '''
+
+    bake_normal_space: typing.Union[int, str] = None
+    '''Choose normal space for baking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bake_quad_split: typing.Union[int, str] = None
+    '''Choose the method used to split a quad into 2 triangles for baking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bake_samples: int = None
+    '''Number of samples used for ambient occlusion baking from multires 
+
+    :type: int
+    '''
+
+    bake_type: typing.Union[int, str] = None
+    '''Choose shading information to bake into the image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bake_user_scale: float = None
+    '''Instead of automatically normalizing to 0..1, apply a user scale to the derivative map 
+
+    :type: float
+    '''
+
+    border_max_x: float = None
+    '''Maximum X value for the render border 
+
+    :type: float
+    '''
+
+    border_max_y: float = None
+    '''Maximum Y value for the render border 
+
+    :type: float
+    '''
+
+    border_min_x: float = None
+    '''Minimum X value for the render border 
+
+    :type: float
+    '''
+
+    border_min_y: float = None
+    '''Minimum Y value for the render border 
+
+    :type: float
+    '''
+
+    display_mode: typing.Union[int, str] = None
+    '''Select where rendered images will be displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dither_intensity: float = None
+    '''Amount of dithering noise added to the rendered image to break up banding 
+
+    :type: float
+    '''
+
+    edge_color: float = None
+    '''Edge color 
+
+    :type: float
+    '''
+
+    edge_threshold: int = None
+    '''Threshold for drawing outlines on geometry edges 
+
+    :type: int
+    '''
+
+    engine: typing.Union[int, str] = None
+    '''Engine to use for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ffmpeg: 'FFmpegSettings' = None
+    '''FFmpeg related settings for the scene 
+
+    :type: 'FFmpegSettings'
+    '''
+
+    field_order: typing.Union[int, str] = None
+    '''Order of video fields (select which lines get rendered first, to create smooth motion for TV output) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    file_extension: str = None
+    '''The file extension used for saving renders 
+
+    :type: str
+    '''
+
+    filepath: str = None
+    '''Directory/name to save animations, # characters defines the position and length of frame numbers 
+
+    :type: str
+    '''
+
+    filter_size: float = None
+    '''Width over which the reconstruction filter combines samples 
+
+    :type: float
+    '''
+
+    fps: int = None
+    '''Framerate, expressed in frames per second 
+
+    :type: int
+    '''
+
+    fps_base: float = None
+    '''Framerate base 
+
+    :type: float
+    '''
+
+    frame_map_new: int = None
+    '''How many frames the Map Old will last 
+
+    :type: int
+    '''
+
+    frame_map_old: int = None
+    '''Old mapping value in frames 
+
+    :type: int
+    '''
+
+    has_multiple_engines: bool = None
+    '''More than one rendering engine is available 
+
+    :type: bool
+    '''
+
+    image_settings: 'ImageFormatSettings' = None
+    '''
+
+    :type: 'ImageFormatSettings'
+    '''
+
+    is_movie_format: bool = None
+    '''When true the format is a movie 
+
+    :type: bool
+    '''
+
+    layers: typing.List['RenderLayers'] = None
+    '''
+
+    :type: typing.List['RenderLayers']
+    '''
+
+    line_thickness: float = None
+    '''Line thickness in pixels 
+
+    :type: float
+    '''
+
+    line_thickness_mode: typing.Union[int, str] = None
+    '''Line thickness mode for Freestyle line drawing 
+
+    :type: typing.Union[int, str]
+    '''
+
+    motion_blur_samples: int = None
+    '''Number of scene samples to take with motion blur 
+
+    :type: int
+    '''
+
+    motion_blur_shutter: float = None
+    '''Time taken in frames between shutter open and close 
+
+    :type: float
+    '''
+
+    motion_blur_shutter_curve: 'CurveMapping' = None
+    '''Curve defining the shutter’s openness over time 
+
+    :type: 'CurveMapping'
+    '''
+
+    octree_resolution: typing.Union[int, str] = None
+    '''Resolution of raytrace accelerator, use higher resolutions for larger scenes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pixel_aspect_x: float = None
+    '''Horizontal aspect ratio - for anamorphic or non-square pixel output 
+
+    :type: float
+    '''
+
+    pixel_aspect_y: float = None
+    '''Vertical aspect ratio - for anamorphic or non-square pixel output 
+
+    :type: float
+    '''
+
+    pixel_filter_type: typing.Union[int, str] = None
+    '''Reconstruction filter used for combining anti-aliasing samples 
+
+    :type: typing.Union[int, str]
+    '''
+
+    preview_start_resolution: int = None
+    '''Resolution to start rendering preview at, progressively increasing it to the full viewport size 
+
+    :type: int
+    '''
+
+    raytrace_method: typing.Union[int, str] = None
+    '''Type of raytrace accelerator structure 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution_percentage: int = None
+    '''Percentage scale for render resolution 
+
+    :type: int
+    '''
+
+    resolution_x: int = None
+    '''Number of horizontal pixels in the rendered image 
+
+    :type: int
+    '''
+
+    resolution_y: int = None
+    '''Number of vertical pixels in the rendered image 
+
+    :type: int
+    '''
+
+    sequencer_gl_preview: typing.Union[int, str] = None
+    '''Method to draw in the sequencer view 
+
+    :type: typing.Union[int, str]
+    '''
+
+    simplify_ao_sss: float = None
+    '''Global approximate AO and SSS quality factor 
+
+    :type: float
+    '''
+
+    simplify_child_particles: float = None
+    '''Global child particles percentage 
+
+    :type: float
+    '''
+
+    simplify_child_particles_render: float = None
+    '''Global child particles percentage during rendering 
+
+    :type: float
+    '''
+
+    simplify_shadow_samples: int = None
+    '''Global maximum shadow samples 
+
+    :type: int
+    '''
+
+    simplify_subdivision: int = None
+    '''Global maximum subdivision level 
+
+    :type: int
+    '''
+
+    simplify_subdivision_render: int = None
+    '''Global maximum subdivision level during rendering 
+
+    :type: int
+    '''
+
+    stamp_background: float = None
+    '''Color to use behind stamp text 
+
+    :type: float
+    '''
+
+    stamp_font_size: int = None
+    '''Size of the font used when rendering stamp text 
+
+    :type: int
+    '''
+
+    stamp_foreground: float = None
+    '''Color to use for stamp text 
+
+    :type: float
+    '''
+
+    stamp_note_text: str = None
+    '''Custom text to appear in the stamp note 
+
+    :type: str
+    '''
+
+    stereo_views: typing.List['SceneRenderView'] = None
+    '''
+
+    :type: typing.List['SceneRenderView']
+    '''
+
+    threads: int = None
+    '''Number of CPU threads to use simultaneously while rendering (for multi-core/CPU systems) 
+
+    :type: int
+    '''
+
+    threads_mode: typing.Union[int, str] = None
+    '''Determine the amount of render threads used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    tile_x: int = None
+    '''Horizontal tile size to use while rendering 
+
+    :type: int
+    '''
+
+    tile_y: int = None
+    '''Vertical tile size to use while rendering 
+
+    :type: int
+    '''
+
+    use_antialiasing: bool = None
+    '''Render and combine multiple samples per pixel to prevent jagged edges 
+
+    :type: bool
+    '''
+
+    use_bake_antialiasing: bool = None
+    '''Enables Anti-aliasing 
+
+    :type: bool
+    '''
+
+    use_bake_clear: bool = None
+    '''Clear Images before baking 
+
+    :type: bool
+    '''
+
+    use_bake_lores_mesh: bool = None
+    '''Calculate heights against unsubdivided low resolution mesh 
+
+    :type: bool
+    '''
+
+    use_bake_multires: bool = None
+    '''Bake directly from multires object 
+
+    :type: bool
+    '''
+
+    use_bake_normalize: bool = None
+    '''With displacement normalize to the distance, with ambient occlusion normalize without using material settings 
+
+    :type: bool
+    '''
+
+    use_bake_selected_to_active: bool = None
+    '''Bake shading on the surface of selected objects to the active object 
+
+    :type: bool
+    '''
+
+    use_bake_to_vertex_color: bool = None
+    '''Bake to vertex colors instead of to a UV-mapped image 
+
+    :type: bool
+    '''
+
+    use_bake_user_scale: bool = None
+    '''Use a user scale for the derivative map 
+
+    :type: bool
+    '''
+
+    use_border: bool = None
+    '''Render a user-defined border region, within the frame size (note that this disables save_buffers and full_sample) 
+
+    :type: bool
+    '''
+
+    use_compositing: bool = None
+    '''Process the render result through the compositing pipeline, if compositing nodes are enabled 
+
+    :type: bool
+    '''
+
+    use_crop_to_border: bool = None
+    '''Crop the rendered frame to the defined border size 
+
+    :type: bool
+    '''
+
+    use_edge_enhance: bool = None
+    '''Create a toon outline around the edges of geometry 
+
+    :type: bool
+    '''
+
+    use_envmaps: bool = None
+    '''Calculate environment maps while rendering 
+
+    :type: bool
+    '''
+
+    use_fields: bool = None
+    '''Render image to two fields per frame, for interlaced TV output 
+
+    :type: bool
+    '''
+
+    use_fields_still: bool = None
+    '''Disable the time difference between fields 
+
+    :type: bool
+    '''
+
+    use_file_extension: bool = None
+    '''Add the file format extensions to the rendered file name (eg: filename + .jpg) 
+
+    :type: bool
+    '''
+
+    use_free_image_textures: bool = None
+    '''Free all image textures from memory after render, to save memory before compositing 
+
+    :type: bool
+    '''
+
+    use_freestyle: bool = None
+    '''Draw stylized strokes using Freestyle 
+
+    :type: bool
+    '''
+
+    use_full_sample: bool = None
+    '''Save for every anti-aliasing sample the entire RenderLayer results (this solves anti-aliasing issues with compositing) 
+
+    :type: bool
+    '''
+
+    use_game_engine: bool = None
+    '''Current rendering engine is a game engine 
+
+    :type: bool
+    '''
+
+    use_instances: bool = None
+    '''Instance support leads to effective memory reduction when using duplicates 
+
+    :type: bool
+    '''
+
+    use_local_coords: bool = None
+    '''Vertex coordinates are stored locally on each primitive (increases memory usage, but may have impact on speed) 
+
+    :type: bool
+    '''
+
+    use_lock_interface: bool = None
+    '''Lock interface during rendering in favor of giving more memory to the renderer 
+
+    :type: bool
+    '''
+
+    use_motion_blur: bool = None
+    '''Use multi-sampled 3D scene motion blur 
+
+    :type: bool
+    '''
+
+    use_multiview: bool = None
+    '''Use multiple views in the scene 
+
+    :type: bool
+    '''
+
+    use_overwrite: bool = None
+    '''Overwrite existing files while rendering 
+
+    :type: bool
+    '''
+
+    use_persistent_data: bool = None
+    '''Keep render data around for faster re-renders 
+
+    :type: bool
+    '''
+
+    use_placeholder: bool = None
+    '''Create empty placeholder files while rendering frames (similar to Unix ‘touch’) 
+
+    :type: bool
+    '''
+
+    use_raytrace: bool = None
+    '''Pre-calculate the raytrace accelerator and render raytracing effects 
+
+    :type: bool
+    '''
+
+    use_render_cache: bool = None
+    '''Save render cache to EXR files (useful for heavy compositing, Note: affects indirectly rendered scenes) 
+
+    :type: bool
+    '''
+
+    use_save_buffers: bool = None
+    '''Save tiles for all RenderLayers and SceneNodes to files in the temp directory (saves memory, required for Full Sample) 
+
+    :type: bool
+    '''
+
+    use_sequencer: bool = None
+    '''Process the render (and composited) result through the video sequence editor pipeline, if sequencer strips exist 
+
+    :type: bool
+    '''
+
+    use_sequencer_gl_textured_solid: bool = None
+    '''Draw face-assigned textures in solid draw method 
+
+    :type: bool
+    '''
+
+    use_shading_nodes: bool = None
+    '''Active render engine uses new shading nodes system 
+
+    :type: bool
+    '''
+
+    use_shadows: bool = None
+    '''Calculate shadows while rendering 
+
+    :type: bool
+    '''
+
+    use_simplify: bool = None
+    '''Enable simplification of scene for quicker preview renders 
+
+    :type: bool
+    '''
+
+    use_simplify_triangulate: bool = None
+    '''Disable non-planar quads being triangulated 
+
+    :type: bool
+    '''
+
+    use_single_layer: bool = None
+    '''Only render the active layer 
+
+    :type: bool
+    '''
+
+    use_spherical_stereo: bool = None
+    '''Active render engine supports spherical stereo rendering 
+
+    :type: bool
+    '''
+
+    use_sss: bool = None
+    '''Calculate sub-surface scattering in materials rendering 
+
+    :type: bool
+    '''
+
+    use_stamp: bool = None
+    '''Render the stamp info text in the rendered image 
+
+    :type: bool
+    '''
+
+    use_stamp_camera: bool = None
+    '''Include the name of the active camera in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_date: bool = None
+    '''Include the current date in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_filename: bool = None
+    '''Include the .blend filename in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_frame: bool = None
+    '''Include the frame number in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_labels: bool = None
+    '''Draw stamp labels (“Camera” in front of camera name, etc.) 
+
+    :type: bool
+    '''
+
+    use_stamp_lens: bool = None
+    '''Include the active camera’s lens in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_marker: bool = None
+    '''Include the name of the last marker in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_memory: bool = None
+    '''Include the peak memory usage in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_note: bool = None
+    '''Include a custom note in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_render_time: bool = None
+    '''Include the render time in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_scene: bool = None
+    '''Include the name of the active scene in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_sequencer_strip: bool = None
+    '''Include the name of the foreground sequence strip in image metadata 
+
+    :type: bool
+    '''
+
+    use_stamp_strip_meta: bool = None
+    '''Use metadata from the strips in the sequencer 
+
+    :type: bool
+    '''
+
+    use_stamp_time: bool = None
+    '''Include the rendered frame timecode as HH:MM:SS.FF in image metadata 
+
+    :type: bool
+    '''
+
+    use_textures: bool = None
+    '''Use textures to affect material properties 
+
+    :type: bool
+    '''
+
+    use_world_space_shading: bool = None
+    '''Use world space interpretation of lighting data for node materials 
+
+    :type: bool
+    '''
+
+    views: typing.List['RenderViews'] = None
+    '''
+
+    :type: typing.List['RenderViews']
+    '''
+
+    views_format: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    def frame_path(self,
+                   frame: int = -2147483648,
+                   preview: bool = False,
+                   view: str = "") -> str:
+        '''Return the absolute path to the filename to be written for a given frame 
+
+        :param frame: Frame number to use, if unset the current frame will be used 
+        :type frame: int
+        :param preview: Preview, Use preview range 
+        :type preview: bool
+        :param view: View, The name of the view to use to replace the “%” chars 
+        :type view: str
+        :rtype: str
+        :return:  File Path, The resulting filepath from the scenes render settings 
+        '''
+        pass
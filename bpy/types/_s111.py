@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RenderSlot:
+    '''Parameters defining the render slot '''
+
+    name: str = None
+    '''Render slot name 
+
+    :type: str
+    '''
+
+
+class RenderSlots:
+    '''Collection of the render slots '''
+
+    active: 'RenderSlot' = None
+    '''Active render slot of the image 
+
+    :type: 'RenderSlot'
+    '''
+
+    active_index: int = None
+    '''Index of an active render slot of the image 
+
+    :type: int
+    '''
+
+
+class RenderView:
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class RenderViews:
+    '''Collection of render views '''
+
+    active: 'SceneRenderView' = None
+    '''Active Render View 
+
+    :type: 'SceneRenderView'
+    '''
+
+    active_index: int = None
+    '''Active index in render view array 
+
+    :type: int
+    '''
+
+    def new(self, name: str) -> 'SceneRenderView':
+        '''Add a render view to scene 
+
+        :param name: New name for the marker (not unique) 
+        :type name: str
+        :rtype: 'SceneRenderView'
+        :return:  Newly created render view 
+        '''
+        pass
+
+    def remove(self, view: 'SceneRenderView'):
+        '''Remove a render view 
+
+        :param view: Render view to remove 
+        :type view: 'SceneRenderView'
+        '''
+        pass
+
+
+class RigidBodyConstraint:
+    '''Constraint influencing Objects inside Rigid Body Simulation '''
+
+    breaking_threshold: float = None
+    '''Impulse threshold that must be reached for the constraint to break 
+
+    :type: float
+    '''
+
+    disable_collisions: bool = None
+    '''Disable collisions between constrained rigid bodies 
+
+    :type: bool
+    '''
+
+    enabled: bool = None
+    '''Enable this constraint 
+
+    :type: bool
+    '''
+
+    limit_ang_x_lower: float = None
+    '''Lower limit of X axis rotation 
+
+    :type: float
+    '''
+
+    limit_ang_x_upper: float = None
+    '''Upper limit of X axis rotation 
+
+    :type: float
+    '''
+
+    limit_ang_y_lower: float = None
+    '''Lower limit of Y axis rotation 
+
+    :type: float
+    '''
+
+    limit_ang_y_upper: float = None
+    '''Upper limit of Y axis rotation 
+
+    :type: float
+    '''
+
+    limit_ang_z_lower: float = None
+    '''Lower limit of Z axis rotation 
+
+    :type: float
+    '''
+
+    limit_ang_z_upper: float = None
+    '''Upper limit of Z axis rotation 
+
+    :type: float
+    '''
+
+    limit_lin_x_lower: float = None
+    '''Lower limit of X axis translation 
+
+    :type: float
+    '''
+
+    limit_lin_x_upper: float = None
+    '''Upper limit of X axis translation 
+
+    :type: float
+    '''
+
+    limit_lin_y_lower: float = None
+    '''Lower limit of Y axis translation 
+
+    :type: float
+    '''
+
+    limit_lin_y_upper: float = None
+    '''Upper limit of Y axis translation 
+
+    :type: float
+    '''
+
+    limit_lin_z_lower: float = None
+    '''Lower limit of Z axis translation 
+
+    :type: float
+    '''
+
+    limit_lin_z_upper: float = None
+    '''Upper limit of Z axis translation 
+
+    :type: float
+    '''
+
+    motor_ang_max_impulse: float = None
+    '''Maximum angular motor impulse 
+
+    :type: float
+    '''
+
+    motor_ang_target_velocity: float = None
+    '''Target angular motor velocity 
+
+    :type: float
+    '''
+
+    motor_lin_max_impulse: float = None
+    '''Maximum linear motor impulse 
+
+    :type: float
+    '''
+
+    motor_lin_target_velocity: float = None
+    '''Target linear motor velocity 
+
+    :type: float
+    '''
+
+    object1: 'Object' = None
+    '''First Rigid Body Object to be constrained 
+
+    :type: 'Object'
+    '''
+
+    object2: 'Object' = None
+    '''Second Rigid Body Object to be constrained 
+
+    :type: 'Object'
+    '''
+
+    solver_iterations: int = None
+    '''Number of constraint solver iterations made per simulation step (higher values are more accurate but slower) 
+
+    :type: int
+    '''
+
+    spring_damping_ang_x: float = None
+    '''Damping on the X rotational axis 
+
+    :type: float
+    '''
+
+    spring_damping_ang_y: float = None
+    '''Damping on the Y rotational axis 
+
+    :type: float
+    '''
+
+    spring_damping_ang_z: float = None
+    '''Damping on the Z rotational axis 
+
+    :type: float
+    '''
+
+    spring_damping_x: float = None
+    '''Damping on the X axis 
+
+    :type: float
+    '''
+
+    spring_damping_y: float = None
+    '''Damping on the Y axis 
+
+    :type: float
+    '''
+
+    spring_damping_z: float = None
+    '''Damping on the Z axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_ang_x: float = None
+    '''Stiffness on the X rotational axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_ang_y: float = None
+    '''Stiffness on the Y rotational axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_ang_z: float = None
+    '''Stiffness on the Z rotational axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_x: float = None
+    '''Stiffness on the X axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_y: float = None
+    '''Stiffness on the Y axis 
+
+    :type: float
+    '''
+
+    spring_stiffness_z: float = None
+    '''Stiffness on the Z axis 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Type of Rigid Body Constraint 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_breaking: bool = None
+    '''Constraint can be broken if it receives an impulse above the threshold 
+
+    :type: bool
+    '''
+
+    use_limit_ang_x: bool = None
+    '''Limit rotation around X axis 
+
+    :type: bool
+    '''
+
+    use_limit_ang_y: bool = None
+    '''Limit rotation around Y axis 
+
+    :type: bool
+    '''
+
+    use_limit_ang_z: bool = None
+    '''Limit rotation around Z axis 
+
+    :type: bool
+    '''
+
+    use_limit_lin_x: bool = None
+    '''Limit translation on X axis 
+
+    :type: bool
+    '''
+
+    use_limit_lin_y: bool = None
+    '''Limit translation on Y axis 
+
+    :type: bool
+    '''
+
+    use_limit_lin_z: bool = None
+    '''Limit translation on Z axis 
+
+    :type: bool
+    '''
+
+    use_motor_ang: bool = None
+    '''Enable angular motor 
+
+    :type: bool
+    '''
+
+    use_motor_lin: bool = None
+    '''Enable linear motor 
+
+    :type: bool
+    '''
+
+    use_override_solver_iterations: bool = None
+    '''Override the number of solver iterations for this constraint 
+
+    :type: bool
+    '''
+
+    use_spring_ang_x: bool = None
+    '''Enable spring on X rotational axis 
+
+    :type: bool
+    '''
+
+    use_spring_ang_y: bool = None
+    '''Enable spring on Y rotational axis 
+
+    :type: bool
+    '''
+
+    use_spring_ang_z: bool = None
+    '''Enable spring on Z rotational axis 
+
+    :type: bool
+    '''
+
+    use_spring_x: bool = None
+    '''Enable spring on X axis 
+
+    :type: bool
+    '''
+
+    use_spring_y: bool = None
+    '''Enable spring on Y axis 
+
+    :type: bool
+    '''
+
+    use_spring_z: bool = None
+    '''Enable spring on Z axis 
+
+    :type: bool
+    '''
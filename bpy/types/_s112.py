@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RigidBodyJointConstraint:
+    '''For use with the Game Engine '''
+
+    axis_x: float = None
+    '''Rotate pivot on X axis 
+
+    :type: float
+    '''
+
+    axis_y: float = None
+    '''Rotate pivot on Y axis 
+
+    :type: float
+    '''
+
+    axis_z: float = None
+    '''Rotate pivot on Z axis 
+
+    :type: float
+    '''
+
+    child: 'Object' = None
+    '''Child object 
+
+    :type: 'Object'
+    '''
+
+    limit_angle_max_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_angle_max_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_angle_max_z: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_angle_min_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_angle_min_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_angle_min_z: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_max_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_max_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_max_z: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_min_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_min_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    limit_min_z: float = None
+    '''
+
+    :type: float
+    '''
+
+    pivot_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    pivot_x: float = None
+    '''Offset pivot on X 
+
+    :type: float
+    '''
+
+    pivot_y: float = None
+    '''Offset pivot on Y 
+
+    :type: float
+    '''
+
+    pivot_z: float = None
+    '''Offset pivot on Z 
+
+    :type: float
+    '''
+
+    show_pivot: bool = None
+    '''Display the pivot point and rotation in 3D view 
+
+    :type: bool
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_angular_limit_x: bool = None
+    '''Use minimum/maximum X angular limit 
+
+    :type: bool
+    '''
+
+    use_angular_limit_y: bool = None
+    '''Use minimum/maximum Y angular limit 
+
+    :type: bool
+    '''
+
+    use_angular_limit_z: bool = None
+    '''Use minimum/maximum Z angular limit 
+
+    :type: bool
+    '''
+
+    use_limit_x: bool = None
+    '''Use minimum/maximum X limit 
+
+    :type: bool
+    '''
+
+    use_limit_y: bool = None
+    '''Use minimum/maximum y limit 
+
+    :type: bool
+    '''
+
+    use_limit_z: bool = None
+    '''Use minimum/maximum z limit 
+
+    :type: bool
+    '''
+
+    use_linked_collision: bool = None
+    '''Disable collision between linked bodies 
+
+    :type: bool
+    '''
+
+
+class RigidBodyObject:
+    '''Settings for object participating in Rigid Body Simulation '''
+
+    angular_damping: float = None
+    '''Amount of angular velocity that is lost over time 
+
+    :type: float
+    '''
+
+    collision_groups: bool = None
+    '''Collision Groups Rigid Body belongs to 
+
+    :type: bool
+    '''
+
+    collision_margin: float = None
+    '''Threshold of distance near surface where collisions are still considered (best results when non-zero) 
+
+    :type: float
+    '''
+
+    collision_shape: typing.Union[int, str] = None
+    '''Collision Shape of object in Rigid Body Simulations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    deactivate_angular_velocity: float = None
+    '''Angular Velocity below which simulation stops simulating object 
+
+    :type: float
+    '''
+
+    deactivate_linear_velocity: float = None
+    '''Linear Velocity below which simulation stops simulating object 
+
+    :type: float
+    '''
+
+    enabled: bool = None
+    '''Rigid Body actively participates to the simulation 
+
+    :type: bool
+    '''
+
+    friction: float = None
+    '''Resistance of object to movement 
+
+    :type: float
+    '''
+
+    kinematic: bool = None
+    '''Allow rigid body to be controlled by the animation system 
+
+    :type: bool
+    '''
+
+    linear_damping: float = None
+    '''Amount of linear velocity that is lost over time 
+
+    :type: float
+    '''
+
+    mass: float = None
+    '''How much the object ‘weighs’ irrespective of gravity 
+
+    :type: float
+    '''
+
+    mesh_source: typing.Union[int, str] = None
+    '''Source of the mesh used to create collision shape 
+
+    :type: typing.Union[int, str]
+    '''
+
+    restitution: float = None
+    '''Tendency of object to bounce after colliding with another (0 = stays still, 1 = perfectly elastic) 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Role of object in Rigid Body Simulations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_deactivation: bool = None
+    '''Enable deactivation of resting rigid bodies (increases performance and stability but can cause glitches) 
+
+    :type: bool
+    '''
+
+    use_deform: bool = None
+    '''Rigid body deforms during simulation 
+
+    :type: bool
+    '''
+
+    use_margin: bool = None
+    '''Use custom collision margin (some shapes will have a visible gap around them) 
+
+    :type: bool
+    '''
+
+    use_start_deactivated: bool = None
+    '''Deactivate rigid body at the start of the simulation 
+
+    :type: bool
+    '''
+
+
+class RigidBodyWorld:
+    '''Self-contained rigid body simulation environment and settings '''
+
+    constraints: 'Group' = None
+    '''Group containing rigid body constraint objects 
+
+    :type: 'Group'
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    enabled: bool = None
+    '''Simulation will be evaluated 
+
+    :type: bool
+    '''
+
+    group: 'Group' = None
+    '''Group containing objects participating in this simulation 
+
+    :type: 'Group'
+    '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    solver_iterations: int = None
+    '''Number of constraint solver iterations made per simulation step (higher values are more accurate but slower) 
+
+    :type: int
+    '''
+
+    steps_per_second: int = None
+    '''Number of simulation steps taken per second (higher values are more accurate but slower) 
+
+    :type: int
+    '''
+
+    time_scale: float = None
+    '''Change the speed of the simulation 
+
+    :type: float
+    '''
+
+    use_split_impulse: bool = None
+    '''Reduce extra velocity that can build up when objects collide (lowers simulation stability a little so use only when necessary) 
+
+    :type: bool
+    '''
+
+    def convex_sweep_test(self, object: 'Object', start, end):
+        '''Sweep test convex rigidbody against the current rigidbody world 
+
+        :param object: Rigidbody object with a convex collision shape 
+        :type object: 'Object'
+        '''
+        pass
+
+
+class Rotation:
+    pass
+
+
+class SCENE_UL_keying_set_paths:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
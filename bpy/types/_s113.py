@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SPHFluidSettings:
+    '''Settings for particle fluids physics '''
+
+    buoyancy: float = None
+    '''Artificial buoyancy force in negative gravity direction based on pressure differences inside the fluid 
+
+    :type: float
+    '''
+
+    factor_radius: bool = None
+    '''Interaction radius is a factor of 4 * particle size 
+
+    :type: bool
+    '''
+
+    factor_repulsion: bool = None
+    '''Repulsion is a factor of stiffness 
+
+    :type: bool
+    '''
+
+    factor_rest_length: bool = None
+    '''Spring rest length is a factor of 2 * particle size 
+
+    :type: bool
+    '''
+
+    factor_stiff_viscosity: bool = None
+    '''Stiff viscosity is a factor of normal viscosity 
+
+    :type: bool
+    '''
+
+    fluid_radius: float = None
+    '''Fluid interaction radius 
+
+    :type: float
+    '''
+
+    linear_viscosity: float = None
+    '''Linear viscosity 
+
+    :type: float
+    '''
+
+    plasticity: float = None
+    '''How much the spring rest length can change after the elastic limit is crossed 
+
+    :type: float
+    '''
+
+    repulsion: float = None
+    '''How strongly the fluid tries to keep from clustering (factor of stiffness) 
+
+    :type: float
+    '''
+
+    rest_density: float = None
+    '''Fluid rest density 
+
+    :type: float
+    '''
+
+    rest_length: float = None
+    '''Spring rest length (factor of particle radius) 
+
+    :type: float
+    '''
+
+    solver: typing.Union[int, str] = None
+    '''The code used to calculate internal forces on particles 
+
+    :type: typing.Union[int, str]
+    '''
+
+    spring_force: float = None
+    '''Spring force 
+
+    :type: float
+    '''
+
+    spring_frames: int = None
+    '''Create springs for this number of frames since particles birth (0 is always) 
+
+    :type: int
+    '''
+
+    stiff_viscosity: float = None
+    '''Creates viscosity for expanding fluid 
+
+    :type: float
+    '''
+
+    stiffness: float = None
+    '''How incompressible the fluid is (speed of sound) 
+
+    :type: float
+    '''
+
+    use_factor_density: bool = None
+    '''Density is calculated as a factor of default density (depends on particle size) 
+
+    :type: bool
+    '''
+
+    use_initial_rest_length: bool = None
+    '''Use the initial length as spring rest length instead of 2 * particle size 
+
+    :type: bool
+    '''
+
+    use_viscoelastic_springs: bool = None
+    '''Use viscoelastic springs instead of Hooke’s springs 
+
+    :type: bool
+    '''
+
+    yield_ratio: float = None
+    '''How much the spring has to be stretched/compressed in order to change it’s rest length 
+
+    :type: float
+    '''
+
+
+class Scaling:
+    pass
@@ -0,0 +1,548 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Scene:
+    '''Scene data-block, consisting in objects and defining time and render related settings '''
+
+    active_clip: 'MovieClip' = None
+    '''Active movie clip used for constraints and viewport drawing 
+
+    :type: 'MovieClip'
+    '''
+
+    active_layer: int = None
+    '''Active scene layer index 
+
+    :type: int
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    audio_distance_model: typing.Union[int, str] = None
+    '''Distance model for distance attenuation calculation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_doppler_factor: float = None
+    '''Pitch factor for Doppler effect calculation 
+
+    :type: float
+    '''
+
+    audio_doppler_speed: float = None
+    '''Speed of sound for Doppler effect calculation 
+
+    :type: float
+    '''
+
+    audio_volume: float = None
+    '''Audio volume 
+
+    :type: float
+    '''
+
+    background_set: 'Scene' = None
+    '''Background set scene 
+
+    :type: 'Scene'
+    '''
+
+    camera: 'Object' = None
+    '''Active camera, used for rendering the scene 
+
+    :type: 'Object'
+    '''
+
+    cursor_location: float = None
+    '''3D cursor location 
+
+    :type: float
+    '''
+
+    cycles: 'CyclesRenderSettings' = None
+    '''Cycles render settings 
+
+    :type: 'CyclesRenderSettings'
+    '''
+
+    cycles_curves: 'CyclesCurveRenderSettings' = None
+    '''Cycles hair rendering settings 
+
+    :type: 'CyclesCurveRenderSettings'
+    '''
+
+    depsgraph: 'Depsgraph' = None
+    '''Dependencies in the scene data 
+
+    :type: 'Depsgraph'
+    '''
+
+    display_settings: 'ColorManagedDisplaySettings' = None
+    '''Settings of device saved image would be displayed on 
+
+    :type: 'ColorManagedDisplaySettings'
+    '''
+
+    frame_current: int = None
+    '''Current Frame, to update animation data from python frame_set() instead 
+
+    :type: int
+    '''
+
+    frame_current_final: float = None
+    '''Current frame with subframe and time remapping applied 
+
+    :type: float
+    '''
+
+    frame_end: int = None
+    '''Final frame of the playback/rendering range 
+
+    :type: int
+    '''
+
+    frame_float: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_preview_end: int = None
+    '''Alternative end frame for UI playback 
+
+    :type: int
+    '''
+
+    frame_preview_start: int = None
+    '''Alternative start frame for UI playback 
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''First frame of the playback/rendering range 
+
+    :type: int
+    '''
+
+    frame_step: int = None
+    '''Number of frames to skip forward while rendering/playing back each frame 
+
+    :type: int
+    '''
+
+    frame_subframe: float = None
+    '''
+
+    :type: float
+    '''
+
+    game_settings: 'SceneGameData' = None
+    '''
+
+    :type: 'SceneGameData'
+    '''
+
+    gravity: float = None
+    '''Constant acceleration in a given direction 
+
+    :type: float
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease Pencil data-block 
+
+    :type: 'GreasePencil'
+    '''
+
+    is_nla_tweakmode: bool = None
+    '''Whether there is any action referenced by NLA being edited (strictly read-only) 
+
+    :type: bool
+    '''
+
+    keying_sets: typing.List['KeyingSet'] = None
+    '''Absolute Keying Sets for this Scene 
+
+    :type: typing.List['KeyingSet']
+    '''
+
+    keying_sets_all: typing.List['KeyingSet'] = None
+    '''All Keying Sets available for use (Builtins and Absolute Keying Sets for this Scene) 
+
+    :type: typing.List['KeyingSet']
+    '''
+
+    layers: bool = None
+    '''Visible layers - Shift-Click/Drag to select multiple layers 
+
+    :type: bool
+    '''
+
+    lock_frame_selection_to_range: bool = None
+    '''Don’t allow frame to be selected with mouse outside of frame range 
+
+    :type: bool
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Compositing node tree 
+
+    :type: 'NodeTree'
+    '''
+
+    object_bases: typing.List['ObjectBase'] = None
+    '''
+
+    :type: typing.List['ObjectBase']
+    '''
+
+    objects: typing.List['SceneObjects'] = None
+    '''
+
+    :type: typing.List['SceneObjects']
+    '''
+
+    orientations: typing.List['TransformOrientation'] = None
+    '''
+
+    :type: typing.List['TransformOrientation']
+    '''
+
+    render: 'RenderSettings' = None
+    '''
+
+    :type: 'RenderSettings'
+    '''
+
+    rigidbody_world: 'RigidBodyWorld' = None
+    '''
+
+    :type: 'RigidBodyWorld'
+    '''
+
+    safe_areas: 'DisplaySafeAreas' = None
+    '''
+
+    :type: 'DisplaySafeAreas'
+    '''
+
+    sequence_editor: 'SequenceEditor' = None
+    '''
+
+    :type: 'SequenceEditor'
+    '''
+
+    sequencer_colorspace_settings: 'ColorManagedSequencerColorspaceSettings' = None
+    '''Settings of color space sequencer is working in 
+
+    :type: 'ColorManagedSequencerColorspaceSettings'
+    '''
+
+    show_keys_from_selected_only: bool = None
+    '''Consider keyframes for active Object and/or its selected bones only (in timeline and when jumping between keyframes) 
+
+    :type: bool
+    '''
+
+    show_subframe: bool = None
+    '''Show current scene subframe and allow set it using interface tools 
+
+    :type: bool
+    '''
+
+    sync_mode: typing.Union[int, str] = None
+    '''How to sync playback 
+
+    :type: typing.Union[int, str]
+    '''
+
+    timeline_markers: typing.List['TimelineMarker'] = None
+    '''Markers used in all timelines for the current scene 
+
+    :type: typing.List['TimelineMarker']
+    '''
+
+    tool_settings: 'ToolSettings' = None
+    '''
+
+    :type: 'ToolSettings'
+    '''
+
+    unit_settings: 'UnitSettings' = None
+    '''Unit editing settings 
+
+    :type: 'UnitSettings'
+    '''
+
+    use_audio: bool = None
+    '''Play back of audio from Sequence Editor will be muted 
+
+    :type: bool
+    '''
+
+    use_audio_scrub: bool = None
+    '''Play audio from Sequence Editor while scrubbing 
+
+    :type: bool
+    '''
+
+    use_audio_sync: bool = None
+    '''Play back and sync with audio clock, dropping frames if frame display is too slow 
+
+    :type: bool
+    '''
+
+    use_frame_drop: bool = None
+    '''Play back dropping frames if frame display is too slow 
+
+    :type: bool
+    '''
+
+    use_gravity: bool = None
+    '''Use global gravity for all dynamics 
+
+    :type: bool
+    '''
+
+    use_nodes: bool = None
+    '''Enable the compositing node tree 
+
+    :type: bool
+    '''
+
+    use_preview_range: bool = None
+    '''Use an alternative start/end frame range for animation playback and OpenGL renders instead of the Render properties start/end frame range 
+
+    :type: bool
+    '''
+
+    use_stamp_note: str = None
+    '''User defined note for the render stamping 
+
+    :type: str
+    '''
+
+    view_settings: 'ColorManagedViewSettings' = None
+    '''Color management settings applied on image before saving 
+
+    :type: 'ColorManagedViewSettings'
+    '''
+
+    world: 'World' = None
+    '''World used for rendering the scene 
+
+    :type: 'World'
+    '''
+
+    def sequence_editor_create(self, ) -> 'SequenceEditor':
+        '''Ensure sequence editor is valid in this scene 
+
+        :rtype: 'SequenceEditor'
+        :return:  New sequence editor data or NULL 
+        '''
+        pass
+
+    def sequence_editor_clear(self, ):
+        '''Clear sequence editor in this scene 
+
+        '''
+        pass
+
+    def statistics(self, ) -> str:
+        '''statistics 
+
+        :rtype: str
+        :return:  Statistics 
+        '''
+        pass
+
+    def frame_set(self, frame: int, subframe: float = 0.0):
+        '''Set scene frame updating all objects immediately 
+
+        :param frame: Frame number to set 
+        :type frame: int
+        :param subframe: Sub-frame time, between 0.0 and 1.0 
+        :type subframe: float
+        '''
+        pass
+
+    def update(self, ):
+        '''Update data tagged to be updated from previous access to data or operators 
+
+        '''
+        pass
+
+    def uvedit_aspect(self, object: 'Object') -> float:
+        '''Get uv aspect for current object 
+
+        :param object: Object 
+        :type object: 'Object'
+        :rtype: float
+        :return:  aspect 
+        '''
+        pass
+
+    def ray_cast(self, origin, direction, distance: float = 1.70141e+38):
+        '''Cast a ray onto in object space 
+
+        :param distance: Maximum distance 
+        :type distance: float
+        '''
+        pass
+
+    def collada_export(self,
+                       filepath: str,
+                       apply_modifiers: bool = False,
+                       export_mesh_type: int = 0,
+                       selected: bool = False,
+                       include_children: bool = False,
+                       include_armatures: bool = False,
+                       include_shapekeys: bool = True,
+                       deform_bones_only: bool = False,
+                       active_uv_only: bool = False,
+                       export_texture_type: int = 0,
+                       use_texture_copies: bool = True,
+                       triangulate: bool = True,
+                       use_object_instantiation: bool = True,
+                       use_blender_profile: bool = True,
+                       sort_by_name: bool = False,
+                       export_transformation_type: int = 0,
+                       open_sim: bool = False,
+                       limit_precision: bool = False,
+                       keep_bind_info: bool = False):
+        '''collada_export 
+
+        :param filepath: File Path, File path to write Collada file 
+        :type filepath: str
+        :param apply_modifiers: Apply Modifiers, Apply modifiers to exported mesh (non destructive)) 
+        :type apply_modifiers: bool
+        :param export_mesh_type: Resolution, Modifier resolution for export 
+        :type export_mesh_type: int
+        :param selected: Selection Only, Export only selected elements 
+        :type selected: bool
+        :param include_children: Include Children, Export all children of selected objects (even if not selected) 
+        :type include_children: bool
+        :param include_armatures: Include Armatures, Export related armatures (even if not selected) 
+        :type include_armatures: bool
+        :param include_shapekeys: Include Shape Keys, Export all Shape Keys from Mesh Objects 
+        :type include_shapekeys: bool
+        :param deform_bones_only: Deform Bones only, Only export deforming bones with armatures 
+        :type deform_bones_only: bool
+        :param active_uv_only: Only Selected UV Map, Export only the selected UV Map 
+        :type active_uv_only: bool
+        :param export_texture_type: Texture Type, Type for exported Textures (UV or MAT) 
+        :type export_texture_type: int
+        :param use_texture_copies: Copy, Copy textures to same folder where the .dae file is exported 
+        :type use_texture_copies: bool
+        :param triangulate: Triangulate, Export Polygons (Quads & NGons) as Triangles 
+        :type triangulate: bool
+        :param use_object_instantiation: Use Object Instances, Instantiate multiple Objects from same Data 
+        :type use_object_instantiation: bool
+        :param use_blender_profile: Use Blender Profile, Export additional Blender specific information (for material, shaders, bones, etc.) 
+        :type use_blender_profile: bool
+        :param sort_by_name: Sort by Object name, Sort exported data by Object name 
+        :type sort_by_name: bool
+        :param export_transformation_type: Transform, Transformation type for translation, scale and rotation 
+        :type export_transformation_type: int
+        :param open_sim: Export to SL/OpenSim, Compatibility mode for SL, OpenSim and other compatible online worlds 
+        :type open_sim: bool
+        :param limit_precision: Limit Precision, Reduce the precision of the exported data to 6 digits 
+        :type limit_precision: bool
+        :param keep_bind_info: Keep Bind Info, Store bind pose information in custom bone properties for later use during Collada export 
+        :type keep_bind_info: bool
+        '''
+        pass
+
+    def alembic_export(self,
+                       filepath: str,
+                       frame_start: int = 1,
+                       frame_end: int = 1,
+                       xform_samples: int = 1,
+                       geom_samples: int = 1,
+                       shutter_open: float = 0.0,
+                       shutter_close: float = 1.0,
+                       selected_only: bool = False,
+                       uvs: bool = True,
+                       normals: bool = True,
+                       vcolors: bool = False,
+                       apply_subdiv: bool = True,
+                       flatten: bool = False,
+                       visible_layers_only: bool = False,
+                       renderable_only: bool = False,
+                       face_sets: bool = False,
+                       subdiv_schema: bool = False,
+                       export_hair: bool = True,
+                       export_particles: bool = True,
+                       compression_type: typing.Union[int, str] = 'OGAWA',
+                       packuv: bool = False,
+                       scale: float = 1.0,
+                       triangulate: bool = False,
+                       quad_method: typing.Union[int, str] = 'BEAUTY',
+                       ngon_method: typing.Union[int, str] = 'BEAUTY'):
+        '''Export to Alembic file (deprecated, use the Alembic export operator) 
+
+        :param filepath: File Path, File path to write Alembic file 
+        :type filepath: str
+        :param frame_start: Start, Start Frame 
+        :type frame_start: int
+        :param frame_end: End, End Frame 
+        :type frame_end: int
+        :param xform_samples: Xform samples, Transform samples per frame 
+        :type xform_samples: int
+        :param geom_samples: Geom samples, Geometry samples per frame 
+        :type geom_samples: int
+        :param shutter_open: Shutter open 
+        :type shutter_open: float
+        :param shutter_close: Shutter close 
+        :type shutter_close: float
+        :param selected_only: Selected only, Export only selected objects 
+        :type selected_only: bool
+        :param uvs: UVs, Export UVs 
+        :type uvs: bool
+        :param normals: Normals, Export cormals 
+        :type normals: bool
+        :param vcolors: Vertex colors, Export vertex colors 
+        :type vcolors: bool
+        :param apply_subdiv: Subsurfs as meshes, Export subdivision surfaces as meshes 
+        :type apply_subdiv: bool
+        :param flatten: Flatten hierarchy, Flatten hierarchy 
+        :type flatten: bool
+        :param visible_layers_only: Visible layers only, Export only objects in visible layers 
+        :type visible_layers_only: bool
+        :param renderable_only: Renderable objects only, Export only objects marked renderable in the outliner 
+        :type renderable_only: bool
+        :param face_sets: Facesets, Export face sets 
+        :type face_sets: bool
+        :param subdiv_schema: Use Alembic subdivision Schema, Use Alembic subdivision Schema 
+        :type subdiv_schema: bool
+        :param export_hair: Export Hair, Exports hair particle systems as animated curves 
+        :type export_hair: bool
+        :param export_particles: Export Particles, Exports non-hair particle systems 
+        :type export_particles: bool
+        :param compression_type: Compression 
+        :type compression_type: typing.Union[int, str]
+        :param packuv: Export with packed UV islands, Export with packed UV islands 
+        :type packuv: bool
+        :param scale: Scale, Value by which to enlarge or shrink the objects with respect to the world’s origin 
+        :type scale: float
+        :param triangulate: Triangulate, Export Polygons (Quads & NGons) as Triangles 
+        :type triangulate: bool
+        :param quad_method: Quad Method, Method for splitting the quads into trianglesBEAUTY Beauty , Split the quads in nice triangles, slower method.FIXED Fixed, Split the quads on the first and third vertices.FIXED_ALTERNATE Fixed Alternate, Split the quads on the 2nd and 4th vertices.SHORTEST_DIAGONAL Shortest Diagonal, Split the quads based on the distance between the vertices. 
+        :type quad_method: typing.Union[int, str]
+        :param ngon_method: Polygon Method, Method for splitting the polygons into trianglesBEAUTY Beauty , Split the quads in nice triangles, slower method.FIXED Fixed, Split the quads on the first and third vertices.FIXED_ALTERNATE Fixed Alternate, Split the quads on the 2nd and 4th vertices.SHORTEST_DIAGONAL Shortest Diagonal, Split the quads based on the distance between the vertices. 
+        :type ngon_method: typing.Union[int, str]
+        '''
+        pass
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SceneActuator:
+    camera: 'Object' = None
+    '''Set this Camera (leave empty to refer to self object) 
+
+    :type: 'Object'
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    scene: 'Scene' = None
+    '''Scene to be added/removed/paused/resumed 
+
+    :type: 'Scene'
+    '''
+
+
+class SceneBases:
+    '''Collection of scene bases '''
+
+    active: 'ObjectBase' = None
+    '''Active object base in the scene 
+
+    :type: 'ObjectBase'
+    '''
+
+
+class SceneGameData:
+    '''Game data for a Scene data-block '''
+
+    activity_culling_box_radius: float = None
+    '''Radius of the activity bubble, in Manhattan length (objects outside the box are activity-culled) 
+
+    :type: float
+    '''
+
+    deactivation_angular_threshold: float = None
+    '''Angular velocity that an object must be below before the deactivation timer can start 
+
+    :type: float
+    '''
+
+    deactivation_linear_threshold: float = None
+    '''Linear velocity that an object must be below before the deactivation timer can start 
+
+    :type: float
+    '''
+
+    deactivation_time: float = None
+    '''Amount of time (in seconds) after which objects with a velocity less than the given threshold will deactivate (0.0 means no deactivation) 
+
+    :type: float
+    '''
+
+    depth: int = None
+    '''Display bit depth of full screen display 
+
+    :type: int
+    '''
+
+    dome_angle: int = None
+    '''Field of View of the Dome - it only works in mode Fisheye and Truncated 
+
+    :type: int
+    '''
+
+    dome_buffer_resolution: float = None
+    '''Buffer Resolution - decrease it to increase speed 
+
+    :type: float
+    '''
+
+    dome_mode: typing.Union[int, str] = None
+    '''Dome physical configurations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dome_tessellation: int = None
+    '''Tessellation level - check the generated mesh in wireframe mode 
+
+    :type: int
+    '''
+
+    dome_text: 'Text' = None
+    '''Custom Warp Mesh data file 
+
+    :type: 'Text'
+    '''
+
+    dome_tilt: int = None
+    '''Camera rotation in horizontal axis 
+
+    :type: int
+    '''
+
+    exit_key: typing.Union[int, str] = None
+    '''The key that exits the Game Engine 
+
+    :type: typing.Union[int, str]
+    '''
+
+    fps: int = None
+    '''Nominal number of game frames per second (physics fixed timestep = 1/fps, independently of actual frame rate) 
+
+    :type: int
+    '''
+
+    frame_color: float = None
+    '''Set color of the bars 
+
+    :type: float
+    '''
+
+    frame_type: typing.Union[int, str] = None
+    '''Select the type of Framing you want 
+
+    :type: typing.Union[int, str]
+    '''
+
+    frequency: int = None
+    '''Display clock frequency of fullscreen display 
+
+    :type: int
+    '''
+
+    level_height: float = None
+    '''Max difference in heights of obstacles to enable their interaction 
+
+    :type: float
+    '''
+
+    logic_step_max: int = None
+    '''Maximum number of logic frame per game frame if graphics slows down the game, higher value allows better synchronization with physics 
+
+    :type: int
+    '''
+
+    material_mode: typing.Union[int, str] = None
+    '''Material mode to use for rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    obstacle_simulation: typing.Union[int, str] = None
+    '''Simulation used for obstacle avoidance in the game engine 
+
+    :type: typing.Union[int, str]
+    '''
+
+    occlusion_culling_resolution: int = None
+    '''Size of the occlusion buffer, use higher value for better precision (slower) 
+
+    :type: int
+    '''
+
+    physics_engine: typing.Union[int, str] = None
+    '''Physics engine used for physics simulation in the game engine 
+
+    :type: typing.Union[int, str]
+    '''
+
+    physics_gravity: float = None
+    '''Gravitational constant used for physics simulation in the game engine 
+
+    :type: float
+    '''
+
+    physics_step_max: int = None
+    '''Maximum number of physics step per game frame if graphics slows down the game, higher value allows physics to keep up with realtime 
+
+    :type: int
+    '''
+
+    physics_step_sub: int = None
+    '''Number of simulation substep per physic timestep, higher value give better physics precision 
+
+    :type: int
+    '''
+
+    raster_storage: typing.Union[int, str] = None
+    '''Set the storage mode used by the rasterizer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    recast_data: 'SceneGameRecastData' = None
+    '''
+
+    :type: 'SceneGameRecastData'
+    '''
+
+    resolution_x: int = None
+    '''Number of horizontal pixels in the screen 
+
+    :type: int
+    '''
+
+    resolution_y: int = None
+    '''Number of vertical pixels in the screen 
+
+    :type: int
+    '''
+
+    samples: typing.Union[int, str] = None
+    '''The number of AA Samples to use for MSAA 
+
+    :type: typing.Union[int, str]
+    '''
+
+    scene_hysteresis_percentage: int = None
+    '''Minimum distance change required to transition to the previous level of detail 
+
+    :type: int
+    '''
+
+    show_debug_properties: bool = None
+    '''Show properties marked for debugging while the game runs 
+
+    :type: bool
+    '''
+
+    show_framerate_profile: bool = None
+    '''Show framerate and profiling information while the game runs 
+
+    :type: bool
+    '''
+
+    show_fullscreen: bool = None
+    '''Start player in a new fullscreen display 
+
+    :type: bool
+    '''
+
+    show_mouse: bool = None
+    '''Start player with a visible mouse cursor 
+
+    :type: bool
+    '''
+
+    show_obstacle_simulation: bool = None
+    '''Enable debug visualization for obstacle simulation 
+
+    :type: bool
+    '''
+
+    show_physics_visualization: bool = None
+    '''Show a visualization of physics bounds and interactions 
+
+    :type: bool
+    '''
+
+    stereo: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    stereo_eye_separation: float = None
+    '''Set the distance between the eyes - the camera focal distance/30 should be fine 
+
+    :type: float
+    '''
+
+    stereo_mode: typing.Union[int, str] = None
+    '''Stereographic techniques 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_activity_culling: bool = None
+    '''Activity culling is enabled 
+
+    :type: bool
+    '''
+
+    use_animation_record: bool = None
+    '''Record animation to F-Curves 
+
+    :type: bool
+    '''
+
+    use_auto_start: bool = None
+    '''Automatically start game at load time 
+
+    :type: bool
+    '''
+
+    use_deprecation_warnings: bool = None
+    '''Print warnings when using deprecated features in the python API 
+
+    :type: bool
+    '''
+
+    use_desktop: bool = None
+    '''Use the current desktop resolution in fullscreen mode 
+
+    :type: bool
+    '''
+
+    use_display_lists: bool = None
+    '''Use display lists to speed up rendering by keeping geometry on the GPU 
+
+    :type: bool
+    '''
+
+    use_frame_rate: bool = None
+    '''Respect the frame rate from the Physics panel in the world properties rather than rendering as many frames as possible 
+
+    :type: bool
+    '''
+
+    use_glsl_color_management: bool = None
+    '''Use color management for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_environment_lighting: bool = None
+    '''Use environment lighting for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_extra_textures: bool = None
+    '''Use extra textures like normal or specular maps for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_lights: bool = None
+    '''Use lights for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_nodes: bool = None
+    '''Use nodes for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_ramps: bool = None
+    '''Use ramps for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_shaders: bool = None
+    '''Use shaders for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_glsl_shadows: bool = None
+    '''Use shadows for GLSL rendering 
+
+    :type: bool
+    '''
+
+    use_material_caching: bool = None
+    '''Cache materials in the converter (this is faster, but can cause problems with older Singletexture and Multitexture games) 
+
+    :type: bool
+    '''
+
+    use_occlusion_culling: bool = None
+    '''Use optimized Bullet DBVT tree for view frustum and occlusion culling (more efficient, but it can waste unnecessary CPU if the scene doesn’t have occluder objects) 
+
+    :type: bool
+    '''
+
+    use_restrict_animation_updates: bool = None
+    '''Restrict the number of animation updates to the animation FPS (this is better for performance, but can cause issues with smooth playback) 
+
+    :type: bool
+    '''
+
+    use_scene_hysteresis: bool = None
+    '''Use LoD Hysteresis setting for the scene 
+
+    :type: bool
+    '''
+
+    vsync: typing.Union[int, str] = None
+    '''Change vsync settings 
+
+    :type: typing.Union[int, str]
+    '''
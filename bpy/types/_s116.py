@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SceneGameRecastData:
+    '''Recast data for a Game data-block '''
+
+    agent_height: float = None
+    '''Minimum height where the agent can still walk 
+
+    :type: float
+    '''
+
+    agent_radius: float = None
+    '''Radius of the agent 
+
+    :type: float
+    '''
+
+    cell_height: float = None
+    '''Rasterized cell height 
+
+    :type: float
+    '''
+
+    cell_size: float = None
+    '''Rasterized cell size 
+
+    :type: float
+    '''
+
+    climb_max: float = None
+    '''Maximum height between grid cells the agent can climb 
+
+    :type: float
+    '''
+
+    edge_max_error: float = None
+    '''Maximum distance error from contour to cells 
+
+    :type: float
+    '''
+
+    edge_max_len: float = None
+    '''Maximum contour edge length 
+
+    :type: float
+    '''
+
+    partitioning: typing.Union[int, str] = None
+    '''Choose partitioning method 
+
+    :type: typing.Union[int, str]
+    '''
+
+    region_merge_size: float = None
+    '''Minimum regions size (smaller regions will be merged) 
+
+    :type: float
+    '''
+
+    region_min_size: float = None
+    '''Minimum regions size (smaller regions will be deleted) 
+
+    :type: float
+    '''
+
+    sample_dist: float = None
+    '''Detail mesh sample spacing 
+
+    :type: float
+    '''
+
+    sample_max_error: float = None
+    '''Detail mesh simplification max sample error 
+
+    :type: float
+    '''
+
+    slope_max: float = None
+    '''Maximum walkable slope angle 
+
+    :type: float
+    '''
+
+    verts_per_poly: int = None
+    '''Max number of vertices per polygon 
+
+    :type: int
+    '''
+
+
+class SceneObjects:
+    '''Collection of scene objects '''
+
+    active: 'Object' = None
+    '''Active object for this scene 
+
+    :type: 'Object'
+    '''
+
+    def link(self, object: 'Object') -> 'ObjectBase':
+        '''Link object to scene, run scene.update() after 
+
+        :param object: Object to add to scene 
+        :type object: 'Object'
+        :rtype: 'ObjectBase'
+        :return:  The newly created base 
+        '''
+        pass
+
+    def unlink(self, object: 'Object'):
+        '''Unlink object from scene 
+
+        :param object: Object to remove from scene 
+        :type object: 'Object'
+        '''
+        pass
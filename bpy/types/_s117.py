@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SceneRenderLayer:
+    '''Render layer '''
+
+    cycles: 'CyclesRenderLayerSettings' = None
+    '''Cycles SceneRenderLayer Settings 
+
+    :type: 'CyclesRenderLayerSettings'
+    '''
+
+    exclude_ambient_occlusion: bool = None
+    '''Exclude AO pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_emit: bool = None
+    '''Exclude emission pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_environment: bool = None
+    '''Exclude environment pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_indirect: bool = None
+    '''Exclude indirect pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_reflection: bool = None
+    '''Exclude raytraced reflection pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_refraction: bool = None
+    '''Exclude raytraced refraction pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_shadow: bool = None
+    '''Exclude shadow pass from combined 
+
+    :type: bool
+    '''
+
+    exclude_specular: bool = None
+    '''Exclude specular pass from combined 
+
+    :type: bool
+    '''
+
+    freestyle_settings: 'FreestyleSettings' = None
+    '''
+
+    :type: 'FreestyleSettings'
+    '''
+
+    invert_zmask: bool = None
+    '''For Zmask, only render what is behind solid z values instead of in front 
+
+    :type: bool
+    '''
+
+    layers: bool = None
+    '''Scene layers included in this render layer 
+
+    :type: bool
+    '''
+
+    layers_exclude: bool = None
+    '''Exclude scene layers from having any influence 
+
+    :type: bool
+    '''
+
+    layers_zmask: bool = None
+    '''Zmask scene layers for solid faces 
+
+    :type: bool
+    '''
+
+    light_override: 'Group' = None
+    '''Group to override all other lights in this render layer 
+
+    :type: 'Group'
+    '''
+
+    material_override: 'Material' = None
+    '''Material to override all other materials in this render layer 
+
+    :type: 'Material'
+    '''
+
+    name: str = None
+    '''Render layer name 
+
+    :type: str
+    '''
+
+    pass_alpha_threshold: float = None
+    '''Z, Index, normal, UV and vector passes are only affected by surfaces with alpha transparency equal to or higher than this threshold 
+
+    :type: float
+    '''
+
+    samples: int = None
+    '''Override number of render samples for this render layer, 0 will use the scene setting 
+
+    :type: int
+    '''
+
+    use: bool = None
+    '''Disable or enable the render layer 
+
+    :type: bool
+    '''
+
+    use_all_z: bool = None
+    '''Fill in Z values for solid faces in invisible layers, for masking 
+
+    :type: bool
+    '''
+
+    use_ao: bool = None
+    '''Render AO in this Layer 
+
+    :type: bool
+    '''
+
+    use_edge_enhance: bool = None
+    '''Render Edge-enhance in this Layer (only works for Solid faces) 
+
+    :type: bool
+    '''
+
+    use_freestyle: bool = None
+    '''Render stylized strokes in this Layer 
+
+    :type: bool
+    '''
+
+    use_halo: bool = None
+    '''Render Halos in this Layer (on top of Solid) 
+
+    :type: bool
+    '''
+
+    use_pass_ambient_occlusion: bool = None
+    '''Deliver AO pass 
+
+    :type: bool
+    '''
+
+    use_pass_color: bool = None
+    '''Deliver shade-less color pass 
+
+    :type: bool
+    '''
+
+    use_pass_combined: bool = None
+    '''Deliver full combined RGBA buffer 
+
+    :type: bool
+    '''
+
+    use_pass_diffuse: bool = None
+    '''Deliver diffuse pass 
+
+    :type: bool
+    '''
+
+    use_pass_diffuse_color: bool = None
+    '''Deliver diffuse color pass 
+
+    :type: bool
+    '''
+
+    use_pass_diffuse_direct: bool = None
+    '''Deliver diffuse direct pass 
+
+    :type: bool
+    '''
+
+    use_pass_diffuse_indirect: bool = None
+    '''Deliver diffuse indirect pass 
+
+    :type: bool
+    '''
+
+    use_pass_emit: bool = None
+    '''Deliver emission pass 
+
+    :type: bool
+    '''
+
+    use_pass_environment: bool = None
+    '''Deliver environment lighting pass 
+
+    :type: bool
+    '''
+
+    use_pass_glossy_color: bool = None
+    '''Deliver glossy color pass 
+
+    :type: bool
+    '''
+
+    use_pass_glossy_direct: bool = None
+    '''Deliver glossy direct pass 
+
+    :type: bool
+    '''
+
+    use_pass_glossy_indirect: bool = None
+    '''Deliver glossy indirect pass 
+
+    :type: bool
+    '''
+
+    use_pass_indirect: bool = None
+    '''Deliver indirect lighting pass 
+
+    :type: bool
+    '''
+
+    use_pass_material_index: bool = None
+    '''Deliver material index pass 
+
+    :type: bool
+    '''
+
+    use_pass_mist: bool = None
+    '''Deliver mist factor pass (0.0-1.0) 
+
+    :type: bool
+    '''
+
+    use_pass_normal: bool = None
+    '''Deliver normal pass 
+
+    :type: bool
+    '''
+
+    use_pass_object_index: bool = None
+    '''Deliver object index pass 
+
+    :type: bool
+    '''
+
+    use_pass_reflection: bool = None
+    '''Deliver raytraced reflection pass 
+
+    :type: bool
+    '''
+
+    use_pass_refraction: bool = None
+    '''Deliver raytraced refraction pass 
+
+    :type: bool
+    '''
+
+    use_pass_shadow: bool = None
+    '''Deliver shadow pass 
+
+    :type: bool
+    '''
+
+    use_pass_specular: bool = None
+    '''Deliver specular pass 
+
+    :type: bool
+    '''
+
+    use_pass_subsurface_color: bool = None
+    '''Deliver subsurface color pass 
+
+    :type: bool
+    '''
+
+    use_pass_subsurface_direct: bool = None
+    '''Deliver subsurface direct pass 
+
+    :type: bool
+    '''
+
+    use_pass_subsurface_indirect: bool = None
+    '''Deliver subsurface indirect pass 
+
+    :type: bool
+    '''
+
+    use_pass_transmission_color: bool = None
+    '''Deliver transmission color pass 
+
+    :type: bool
+    '''
+
+    use_pass_transmission_direct: bool = None
+    '''Deliver transmission direct pass 
+
+    :type: bool
+    '''
+
+    use_pass_transmission_indirect: bool = None
+    '''Deliver transmission indirect pass 
+
+    :type: bool
+    '''
+
+    use_pass_uv: bool = None
+    '''Deliver texture UV pass 
+
+    :type: bool
+    '''
+
+    use_pass_vector: bool = None
+    '''Deliver speed vector pass 
+
+    :type: bool
+    '''
+
+    use_pass_z: bool = None
+    '''Deliver Z values pass 
+
+    :type: bool
+    '''
+
+    use_sky: bool = None
+    '''Render Sky in this Layer 
+
+    :type: bool
+    '''
+
+    use_solid: bool = None
+    '''Render Solid faces in this Layer 
+
+    :type: bool
+    '''
+
+    use_strand: bool = None
+    '''Render Strands in this Layer 
+
+    :type: bool
+    '''
+
+    use_zmask: bool = None
+    '''Only render what’s in front of the solid z values 
+
+    :type: bool
+    '''
+
+    use_ztransp: bool = None
+    '''Render Z-Transparent faces in this Layer (on top of Solid and Halos) 
+
+    :type: bool
+    '''
+
+
+class SceneRenderView:
+    '''Render viewpoint for 3D stereo and multiview rendering '''
+
+    camera_suffix: str = None
+    '''Suffix to identify the cameras to use, and added to the render images for this view 
+
+    :type: str
+    '''
+
+    file_suffix: str = None
+    '''Suffix added to the render images for this view 
+
+    :type: str
+    '''
+
+    name: str = None
+    '''Render view name 
+
+    :type: str
+    '''
+
+    use: bool = None
+    '''Disable or enable the render view 
+
+    :type: bool
+    '''
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SceneSequence:
+    '''Sequence strip to used the rendered image of a scene '''
+
+    alpha_mode: typing.Union[int, str] = None
+    '''Representation of alpha information in the RGBA pixels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    color_multiply: float = None
+    '''
+
+    :type: float
+    '''
+
+    color_saturation: float = None
+    '''Adjust the intensity of the input’s color 
+
+    :type: float
+    '''
+
+    crop: 'SequenceCrop' = None
+    '''
+
+    :type: 'SequenceCrop'
+    '''
+
+    proxy: 'SequenceProxy' = None
+    '''
+
+    :type: 'SequenceProxy'
+    '''
+
+    scene: 'Scene' = None
+    '''Scene that this sequence uses 
+
+    :type: 'Scene'
+    '''
+
+    scene_camera: 'Object' = None
+    '''Override the scenes active camera 
+
+    :type: 'Object'
+    '''
+
+    strobe: float = None
+    '''Only display every nth frame 
+
+    :type: float
+    '''
+
+    transform: 'SequenceTransform' = None
+    '''
+
+    :type: 'SequenceTransform'
+    '''
+
+    use_crop: bool = None
+    '''Crop image before processing 
+
+    :type: bool
+    '''
+
+    use_deinterlace: bool = None
+    '''Remove fields from video movies 
+
+    :type: bool
+    '''
+
+    use_flip_x: bool = None
+    '''Flip on the X axis 
+
+    :type: bool
+    '''
+
+    use_flip_y: bool = None
+    '''Flip on the Y axis 
+
+    :type: bool
+    '''
+
+    use_float: bool = None
+    '''Convert input to float data 
+
+    :type: bool
+    '''
+
+    use_grease_pencil: bool = None
+    '''Show Grease Pencil strokes in OpenGL previews 
+
+    :type: bool
+    '''
+
+    use_proxy: bool = None
+    '''Use a preview proxy and/or timecode index for this strip 
+
+    :type: bool
+    '''
+
+    use_reverse_frames: bool = None
+    '''Reverse frame order 
+
+    :type: bool
+    '''
+
+    use_sequence: bool = None
+    '''Use scenes sequence strips directly, instead of rendering 
+
+    :type: bool
+    '''
+
+    use_translation: bool = None
+    '''Translate image before processing 
+
+    :type: bool
+    '''
+
+
+class Scopes:
+    '''Scopes for statistical view of an image '''
+
+    accuracy: float = None
+    '''Proportion of original image source pixel lines to sample 
+
+    :type: float
+    '''
+
+    histogram: 'Histogram' = None
+    '''Histogram for viewing image statistics 
+
+    :type: 'Histogram'
+    '''
+
+    use_full_resolution: bool = None
+    '''Sample every pixel of the image 
+
+    :type: bool
+    '''
+
+    vectorscope_alpha: float = None
+    '''Opacity of the points 
+
+    :type: float
+    '''
+
+    waveform_alpha: float = None
+    '''Opacity of the points 
+
+    :type: float
+    '''
+
+    waveform_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class Screen:
+    '''Screen data-block, defining the layout of areas in a window '''
+
+    areas: typing.List['Area'] = None
+    '''Areas the screen is subdivided into 
+
+    :type: typing.List['Area']
+    '''
+
+    is_animation_playing: bool = None
+    '''Animation playback is active 
+
+    :type: bool
+    '''
+
+    scene: 'Scene' = None
+    '''Active scene to be edited in the screen 
+
+    :type: 'Scene'
+    '''
+
+    show_fullscreen: bool = None
+    '''An area is maximized, filling this screen 
+
+    :type: bool
+    '''
+
+    use_follow: bool = None
+    '''Follow current frame in editors 
+
+    :type: bool
+    '''
+
+    use_play_3d_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_animation_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_clip_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_image_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_node_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_properties_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_sequence_editors: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_play_top_left_3d_editor: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class ScrewModifier:
+    '''Revolve edges '''
+
+    angle: float = None
+    '''Angle of revolution 
+
+    :type: float
+    '''
+
+    axis: typing.Union[int, str] = None
+    '''Screw axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    iterations: int = None
+    '''Number of times to apply the screw operation 
+
+    :type: int
+    '''
+
+    merge_threshold: float = None
+    '''Limit below which to merge vertices 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object to define the screw axis 
+
+    :type: 'Object'
+    '''
+
+    render_steps: int = None
+    '''Number of steps in the revolution 
+
+    :type: int
+    '''
+
+    screw_offset: float = None
+    '''Offset the revolution along its axis 
+
+    :type: float
+    '''
+
+    steps: int = None
+    '''Number of steps in the revolution 
+
+    :type: int
+    '''
+
+    use_merge_vertices: bool = None
+    '''Merge adjacent vertices (screw offset must be zero) 
+
+    :type: bool
+    '''
+
+    use_normal_calculate: bool = None
+    '''Calculate the order of edges (needed for meshes, but not curves) 
+
+    :type: bool
+    '''
+
+    use_normal_flip: bool = None
+    '''Flip normals of lathed faces 
+
+    :type: bool
+    '''
+
+    use_object_screw_offset: bool = None
+    '''Use the distance between the objects to make a screw 
+
+    :type: bool
+    '''
+
+    use_smooth_shade: bool = None
+    '''Output faces with smooth shading rather than flat shaded 
+
+    :type: bool
+    '''
+
+    use_stretch_u: bool = None
+    '''Stretch the U coordinates between 0-1 when UV’s are present 
+
+    :type: bool
+    '''
+
+    use_stretch_v: bool = None
+    '''Stretch the V coordinates between 0-1 when UV’s are present 
+
+    :type: bool
+    '''
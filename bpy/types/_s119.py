@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Sculpt:
+    constant_detail_resolution: float = None
+    '''Maximum edge length for dynamic topology sculpting (as divisor of blender unit - higher value means smaller edge length) 
+
+    :type: float
+    '''
+
+    detail_percent: float = None
+    '''Maximum edge length for dynamic topology sculpting (in brush percenage) 
+
+    :type: float
+    '''
+
+    detail_refine_method: typing.Union[int, str] = None
+    '''In dynamic-topology mode, how to add or remove mesh detail 
+
+    :type: typing.Union[int, str]
+    '''
+
+    detail_size: float = None
+    '''Maximum edge length for dynamic topology sculpting (in pixels) 
+
+    :type: float
+    '''
+
+    detail_type_method: typing.Union[int, str] = None
+    '''In dynamic-topology mode, how mesh detail size is calculated 
+
+    :type: typing.Union[int, str]
+    '''
+
+    gravity: float = None
+    '''Amount of gravity after each dab 
+
+    :type: float
+    '''
+
+    gravity_object: 'Object' = None
+    '''Object whose Z axis defines orientation of gravity 
+
+    :type: 'Object'
+    '''
+
+    lock_x: bool = None
+    '''Disallow changes to the X axis of vertices 
+
+    :type: bool
+    '''
+
+    lock_y: bool = None
+    '''Disallow changes to the Y axis of vertices 
+
+    :type: bool
+    '''
+
+    lock_z: bool = None
+    '''Disallow changes to the Z axis of vertices 
+
+    :type: bool
+    '''
+
+    radial_symmetry: int = None
+    '''Number of times to copy strokes across the surface 
+
+    :type: int
+    '''
+
+    show_diffuse_color: bool = None
+    '''Show diffuse color of object and overlay sculpt mask on top of it 
+
+    :type: bool
+    '''
+
+    symmetrize_direction: typing.Union[int, str] = None
+    '''Source and destination for symmetrize operator 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_deform_only: bool = None
+    '''Use only deformation modifiers (temporary disable all constructive modifiers except multi-resolution) 
+
+    :type: bool
+    '''
+
+    use_smooth_shading: bool = None
+    '''Show faces in dynamic-topology mode with smooth shading rather than flat shaded 
+
+    :type: bool
+    '''
+
+    use_threaded: bool = None
+    '''Take advantage of multiple CPU cores to improve sculpting performance 
+
+    :type: bool
+    '''
+
+
+class SculptToolCapabilities:
+    '''Read-only indications of which brush operations are supported by the current sculpt tool '''
+
+    has_accumulate: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_auto_smooth: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_gravity: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_height: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_jitter: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_normal_weight: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_persistence: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_pinch_factor: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_plane_offset: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_rake_factor: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_random_texture_angle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_sculpt_plane: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_secondary_color: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_smooth_stroke: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_space_attenuation: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    has_strength_pressure: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class SelectedUvElement:
+    element_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    face_index: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class Sensor:
+    '''Game engine logic brick to detect events '''
+
+    active: bool = None
+    '''Set active state of the sensor 
+
+    :type: bool
+    '''
+
+    controllers: typing.List['Controller'] = None
+    '''The list containing the controllers connected to the sensor 
+
+    :type: typing.List['Controller']
+    '''
+
+    invert: bool = None
+    '''Invert the level(output) of this sensor 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Sensor name 
+
+    :type: str
+    '''
+
+    pin: bool = None
+    '''Display when not linked to a visible states controller 
+
+    :type: bool
+    '''
+
+    show_expanded: bool = None
+    '''Set sensor expanded in the user interface 
+
+    :type: bool
+    '''
+
+    tick_skip: int = None
+    '''Number of logic ticks skipped between 2 active pulses (0 = pulse every logic tick, 1 = skip 1 logic tick between pulses, etc.) 
+
+    :type: int
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_level: bool = None
+    '''Level detector, trigger controllers of new states (only applicable upon logic state transition) 
+
+    :type: bool
+    '''
+
+    use_pulse_false_level: bool = None
+    '''Activate FALSE level triggering (pulse mode) 
+
+    :type: bool
+    '''
+
+    use_pulse_true_level: bool = None
+    '''Activate TRUE level triggering (pulse mode) 
+
+    :type: bool
+    '''
+
+    use_tap: bool = None
+    '''Trigger controllers only for an instant, even while the sensor remains true 
+
+    :type: bool
+    '''
+
+    def link(self, controller: 'Controller'):
+        '''Link the sensor to a controller 
+
+        :param controller: Controller to link to 
+        :type controller: 'Controller'
+        '''
+        pass
+
+    def unlink(self, controller: 'Controller'):
+        '''Unlink the sensor from a controller 
+
+        :param controller: Controller to unlink from 
+        :type controller: 'Controller'
+        '''
+        pass
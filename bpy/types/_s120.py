@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Sequence:
+    '''Sequence strip in the sequence editor '''
+
+    blend_alpha: float = None
+    '''Percentage of how much the strip’s colors affect other strips 
+
+    :type: float
+    '''
+
+    blend_type: typing.Union[int, str] = None
+    '''Method for controlling how the strip combines with other strips 
+
+    :type: typing.Union[int, str]
+    '''
+
+    channel: int = None
+    '''Y position of the sequence strip 
+
+    :type: int
+    '''
+
+    effect_fader: float = None
+    '''Custom fade value 
+
+    :type: float
+    '''
+
+    frame_duration: int = None
+    '''The length of the contents of this strip before the handles are applied 
+
+    :type: int
+    '''
+
+    frame_final_duration: int = None
+    '''The length of the contents of this strip after the handles are applied 
+
+    :type: int
+    '''
+
+    frame_final_end: int = None
+    '''End frame displayed in the sequence editor after offsets are applied 
+
+    :type: int
+    '''
+
+    frame_final_start: int = None
+    '''Start frame displayed in the sequence editor after offsets are applied, setting this is equivalent to moving the handle, not the actual start frame 
+
+    :type: int
+    '''
+
+    frame_offset_end: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_offset_start: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''X position where the strip begins 
+
+    :type: int
+    '''
+
+    frame_still_end: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_still_start: int = None
+    '''
+
+    :type: int
+    '''
+
+    lock: bool = None
+    '''Lock strip so that it cannot be transformed 
+
+    :type: bool
+    '''
+
+    modifiers: typing.List['SequenceModifier'] = None
+    '''Modifiers affecting this strip 
+
+    :type: typing.List['SequenceModifier']
+    '''
+
+    mute: bool = None
+    '''Disable strip so that it cannot be viewed in the output 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select_left_handle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    select_right_handle: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    speed_factor: float = None
+    '''Multiply the current speed of the sequence with this number or remap current frame to this frame 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_default_fade: bool = None
+    '''Fade effect using the built-in default (usually make transition as long as effect strip) 
+
+    :type: bool
+    '''
+
+    use_linear_modifiers: bool = None
+    '''Calculate modifiers in linear space instead of sequencer’s space 
+
+    :type: bool
+    '''
+
+    def update(self, data: bool = False):
+        '''Update the strip dimensions 
+
+        :param data: Data, Update strip data 
+        :type data: bool
+        '''
+        pass
+
+    def strip_elem_from_frame(self, frame: int) -> 'SequenceElement':
+        '''Return the strip element from a given frame or None 
+
+        :param frame: Frame, The frame to get the strip element from 
+        :type frame: int
+        :rtype: 'SequenceElement'
+        :return:  strip element of the current frame 
+        '''
+        pass
+
+    def swap(self, other: 'Sequence'):
+        '''swap 
+
+        :param other: Other 
+        :type other: 'Sequence'
+        '''
+        pass
+
+
+class SequenceColorBalance:
+    '''Color balance parameters for a sequence strip '''
+
+    pass
+
+
+class SequenceColorBalanceData:
+    '''Color balance parameters for a sequence strip and it’s modifiers '''
+
+    gain: float = None
+    '''Color balance gain (highlights) 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''Color balance gamma (midtones) 
+
+    :type: float
+    '''
+
+    invert_gain: bool = None
+    '''Invert the gain color` 
+
+    :type: bool
+    '''
+
+    invert_gamma: bool = None
+    '''Invert the gamma color 
+
+    :type: bool
+    '''
+
+    invert_lift: bool = None
+    '''Invert the lift color 
+
+    :type: bool
+    '''
+
+    lift: float = None
+    '''Color balance lift (shadows) 
+
+    :type: float
+    '''
+
+
+class SequenceCrop:
+    '''Cropping parameters for a sequence strip '''
+
+    max_x: int = None
+    '''Number of pixels to crop from the right side 
+
+    :type: int
+    '''
+
+    max_y: int = None
+    '''Number of pixels to crop from the top 
+
+    :type: int
+    '''
+
+    min_x: int = None
+    '''Number of pixels to crop from the left side 
+
+    :type: int
+    '''
+
+    min_y: int = None
+    '''Number of pixels to crop from the bottom 
+
+    :type: int
+    '''
+
+
+class SequenceEditor:
+    '''Sequence editing data for a Scene data-block '''
+
+    active_strip: 'Sequence' = None
+    '''Sequencer’s active strip 
+
+    :type: 'Sequence'
+    '''
+
+    meta_stack: typing.List['Sequence'] = None
+    '''Meta strip stack, last is currently edited meta strip 
+
+    :type: typing.List['Sequence']
+    '''
+
+    overlay_frame: int = None
+    '''
+
+    :type: int
+    '''
+
+    proxy_dir: str = None
+    '''
+
+    :type: str
+    '''
+
+    proxy_storage: typing.Union[int, str] = None
+    '''How to store proxies for this project 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sequences: typing.List['Sequence'] = None
+    '''Top-level strips only 
+
+    :type: typing.List['Sequence']
+    '''
+
+    sequences_all: typing.List['Sequence'] = None
+    '''All strips, recursively including those inside metastrips 
+
+    :type: typing.List['Sequence']
+    '''
+
+    show_overlay: bool = None
+    '''Partial overlay on top of the sequencer 
+
+    :type: bool
+    '''
+
+    use_overlay_lock: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class SequenceElement:
+    '''Sequence strip data for a single frame '''
+
+    filename: str = None
+    '''Name of the source file 
+
+    :type: str
+    '''
+
+    orig_height: int = None
+    '''Original image height 
+
+    :type: int
+    '''
+
+    orig_width: int = None
+    '''Original image width 
+
+    :type: int
+    '''
+
+
+class SequenceElements:
+    '''Collection of SequenceElement '''
+
+    def append(self, filename: str) -> 'SequenceElement':
+        '''Push an image from ImageSequence.directory 
+
+        :param filename: Filepath to image 
+        :type filename: str
+        :rtype: 'SequenceElement'
+        :return:  New SequenceElement 
+        '''
+        pass
+
+    def pop(self, index: int):
+        '''Pop an image off the collection 
+
+        :param index: Index of image to remove 
+        :type index: int
+        '''
+        pass
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SequenceModifier:
+    '''Modifier for sequence strip '''
+
+    input_mask_id: 'Mask' = None
+    '''Mask ID used as mask input for the modifier 
+
+    :type: 'Mask'
+    '''
+
+    input_mask_strip: 'Sequence' = None
+    '''Strip used as mask input for the modifier 
+
+    :type: 'Sequence'
+    '''
+
+    input_mask_type: typing.Union[int, str] = None
+    '''Type of input data used for mask 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_time: typing.Union[int, str] = None
+    '''Time to use for the Mask animation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mute: bool = None
+    '''Mute this modifier 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    show_expanded: bool = None
+    '''Mute expanded settings for the modifier 
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class SequenceModifiers:
+    '''Collection of strip modifiers '''
+
+    def new(self, name: str,
+            type: typing.Union[int, str]) -> 'SequenceModifier':
+        '''Add a new modifier 
+
+        :param name: New name for the modifier 
+        :type name: str
+        :param type: Modifier type to add 
+        :type type: typing.Union[int, str]
+        :rtype: 'SequenceModifier'
+        :return:  Newly created modifier 
+        '''
+        pass
+
+    def remove(self, modifier: 'SequenceModifier'):
+        '''Remove an existing modifier from the sequence 
+
+        :param modifier: Modifier to remove 
+        :type modifier: 'SequenceModifier'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all modifiers from the sequence 
+
+        '''
+        pass
+
+
+class SequenceProxy:
+    '''Proxy parameters for a sequence strip '''
+
+    build_100: bool = None
+    '''Build 100% proxy resolution 
+
+    :type: bool
+    '''
+
+    build_25: bool = None
+    '''Build 25% proxy resolution 
+
+    :type: bool
+    '''
+
+    build_50: bool = None
+    '''Build 50% proxy resolution 
+
+    :type: bool
+    '''
+
+    build_75: bool = None
+    '''Build 75% proxy resolution 
+
+    :type: bool
+    '''
+
+    build_free_run: bool = None
+    '''Build free run time code index 
+
+    :type: bool
+    '''
+
+    build_free_run_rec_date: bool = None
+    '''Build free run time code index using Record Date/Time 
+
+    :type: bool
+    '''
+
+    build_record_run: bool = None
+    '''Build record run time code index 
+
+    :type: bool
+    '''
+
+    directory: str = None
+    '''Location to store the proxy files 
+
+    :type: str
+    '''
+
+    filepath: str = None
+    '''Location of custom proxy file 
+
+    :type: str
+    '''
+
+    quality: int = None
+    '''JPEG Quality of proxies to build 
+
+    :type: int
+    '''
+
+    timecode: typing.Union[int, str] = None
+    '''Method for reading the inputs timecode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_overwrite: bool = None
+    '''Overwrite existing proxy files when building 
+
+    :type: bool
+    '''
+
+    use_proxy_custom_directory: bool = None
+    '''Use a custom directory to store data 
+
+    :type: bool
+    '''
+
+    use_proxy_custom_file: bool = None
+    '''Use a custom file to read proxy data from 
+
+    :type: bool
+    '''
+
+
+class SequenceTransform:
+    '''Transform parameters for a sequence strip '''
+
+    offset_x: int = None
+    '''Amount to move the input on the X axis within its boundaries 
+
+    :type: int
+    '''
+
+    offset_y: int = None
+    '''Amount to move the input on the Y axis within its boundaries 
+
+    :type: int
+    '''
+
+
+class SequencerTonemapModifierData:
+    '''Tone mapping modifier '''
+
+    adaptation: float = None
+    '''If 0, global; if 1, based on pixel intensity 
+
+    :type: float
+    '''
+
+    contrast: float = None
+    '''Set to 0 to use estimate from input image 
+
+    :type: float
+    '''
+
+    correction: float = None
+    '''If 0, same for all channels; if 1, each independent 
+
+    :type: float
+    '''
+
+    gamma: float = None
+    '''If not used, set to 1 
+
+    :type: float
+    '''
+
+    intensity: float = None
+    '''If less than zero, darkens image; otherwise, makes it brighter 
+
+    :type: float
+    '''
+
+    key: float = None
+    '''The value the average luminance is mapped to 
+
+    :type: float
+    '''
+
+    offset: float = None
+    '''Normally always 1, but can be used as an extra control to alter the brightness curve 
+
+    :type: float
+    '''
+
+    tonemap_type: typing.Union[int, str] = None
+    '''Tone mapping algorithm 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class Sequences:
+    '''Collection of Sequences '''
+
+    def new_clip(self, name: str, clip: 'MovieClip', channel: int,
+                 frame_start: int) -> 'Sequence':
+        '''Add a new movie clip sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param clip: Movie clip to add 
+        :type clip: 'MovieClip'
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_mask(self, name: str, mask: 'Mask', channel: int,
+                 frame_start: int) -> 'Sequence':
+        '''Add a new mask sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param mask: Mask to add 
+        :type mask: 'Mask'
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_scene(self, name: str, scene: 'Scene', channel: int,
+                  frame_start: int) -> 'Sequence':
+        '''Add a new scene sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param scene: Scene to add 
+        :type scene: 'Scene'
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_image(self, name: str, filepath: str, channel: int,
+                  frame_start: int) -> 'Sequence':
+        '''Add a new image sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param filepath: Filepath to image 
+        :type filepath: str
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_movie(self, name: str, filepath: str, channel: int,
+                  frame_start: int) -> 'Sequence':
+        '''Add a new movie sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param filepath: Filepath to movie 
+        :type filepath: str
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_sound(self, name: str, filepath: str, channel: int,
+                  frame_start: int) -> 'Sequence':
+        '''Add a new sound sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param filepath: Filepath to movie 
+        :type filepath: str
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def new_effect(self,
+                   name: str,
+                   type: typing.Union[int, str],
+                   channel: int,
+                   frame_start: int,
+                   frame_end: int = 0,
+                   seq1: 'Sequence' = None,
+                   seq2: 'Sequence' = None,
+                   seq3: 'Sequence' = None) -> 'Sequence':
+        '''Add a new effect sequence 
+
+        :param name: Name for the new sequence 
+        :type name: str
+        :param type: Type, type for the new sequence 
+        :type type: typing.Union[int, str]
+        :param channel: Channel, The channel for the new sequence 
+        :type channel: int
+        :param frame_start: The start frame for the new sequence 
+        :type frame_start: int
+        :param frame_end: The end frame for the new sequence 
+        :type frame_end: int
+        :param seq1: Sequence 1 for effect 
+        :type seq1: 'Sequence'
+        :param seq2: Sequence 2 for effect 
+        :type seq2: 'Sequence'
+        :param seq3: Sequence 3 for effect 
+        :type seq3: 'Sequence'
+        :rtype: 'Sequence'
+        :return:  New Sequence 
+        '''
+        pass
+
+    def remove(self, sequence: 'Sequence'):
+        '''Remove a Sequence 
+
+        :param sequence: Sequence to remove 
+        :type sequence: 'Sequence'
+        '''
+        pass
+
+
+class ShaderNode:
+    '''Material shader node '''
+
+    pass
+
+
+class ShaderNodeAddShader:
+    pass
+
+
+class ShaderNodeAmbientOcclusion:
+    pass
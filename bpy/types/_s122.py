@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ShaderNodeAttribute:
+    attribute_name: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class ShaderNodeBackground:
+    pass
+
+
+class ShaderNodeBlackbody:
+    pass
+
+
+class ShaderNodeBrightContrast:
+    pass
+
+
+class ShaderNodeBsdfAnisotropic:
+    distribution: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfDiffuse:
+    pass
+
+
+class ShaderNodeBsdfGlass:
+    distribution: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfGlossy:
+    distribution: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfHair:
+    component: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfPrincipled:
+    distribution: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfRefraction:
+    distribution: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfToon:
+    component: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeBsdfTranslucent:
+    pass
+
+
+class ShaderNodeBsdfTransparent:
+    pass
+
+
+class ShaderNodeBsdfVelvet:
+    pass
+
+
+class ShaderNodeBump:
+    invert: bool = None
+    '''Invert the bump mapping direction to push into the surface instead of out 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeCameraData:
+    pass
+
+
+class ShaderNodeCombineHSV:
+    pass
+
+
+class ShaderNodeCombineRGB:
+    pass
+
+
+class ShaderNodeCombineXYZ:
+    pass
+
+
+class ShaderNodeEmission:
+    pass
+
+
+class ShaderNodeExtendedMaterial:
+    invert_normal: bool = None
+    '''Material Node uses inverted normal 
+
+    :type: bool
+    '''
+
+    material: 'Material' = None
+    '''
+
+    :type: 'Material'
+    '''
+
+    use_diffuse: bool = None
+    '''Material Node outputs Diffuse 
+
+    :type: bool
+    '''
+
+    use_specular: bool = None
+    '''Material Node outputs Specular 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeFresnel:
+    pass
+
+
+class ShaderNodeGamma:
+    pass
+
+
+class ShaderNodeGeometry:
+    color_layer: str = None
+    '''
+
+    :type: str
+    '''
+
+    uv_layer: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class ShaderNodeGroup:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''
+
+    :type: 'NodeTree'
+    '''
+
+
+class ShaderNodeHairInfo:
+    pass
+
+
+class ShaderNodeHoldout:
+    pass
+
+
+class ShaderNodeHueSaturation:
+    pass
+
+
+class ShaderNodeInvert:
+    pass
+
+
+class ShaderNodeLampData:
+    lamp_object: 'Object' = None
+    '''
+
+    :type: 'Object'
+    '''
+
+
+class ShaderNodeLayerWeight:
+    pass
+
+
+class ShaderNodeLightFalloff:
+    pass
+
+
+class ShaderNodeLightPath:
+    pass
+
+
+class ShaderNodeMapping:
+    max: float = None
+    '''Maximum value for clipping 
+
+    :type: float
+    '''
+
+    min: float = None
+    '''Minimum value for clipping 
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''
+
+    :type: float
+    '''
+
+    translation: float = None
+    '''
+
+    :type: float
+    '''
+
+    use_max: bool = None
+    '''Whether to use maximum clipping value 
+
+    :type: bool
+    '''
+
+    use_min: bool = None
+    '''Whether to use minimum clipping value 
+
+    :type: bool
+    '''
+
+    vector_type: typing.Union[int, str] = None
+    '''Type of vector that the mapping transforms 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeMaterial:
+    invert_normal: bool = None
+    '''Material Node uses inverted normal 
+
+    :type: bool
+    '''
+
+    material: 'Material' = None
+    '''
+
+    :type: 'Material'
+    '''
+
+    use_diffuse: bool = None
+    '''Material Node outputs Diffuse 
+
+    :type: bool
+    '''
+
+    use_specular: bool = None
+    '''Material Node outputs Specular 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeMath:
+    operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeMixRGB:
+    blend_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_alpha: bool = None
+    '''Include alpha of second input in this operation 
+
+    :type: bool
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeMixShader:
+    pass
+
+
+class ShaderNodeNewGeometry:
+    pass
+
+
+class ShaderNodeNormal:
+    pass
+
+
+class ShaderNodeNormalMap:
+    space: typing.Union[int, str] = None
+    '''Space of the input normal 
+
+    :type: typing.Union[int, str]
+    '''
+
+    uv_map: str = None
+    '''UV Map for tangent space maps 
+
+    :type: str
+    '''
+
+
+class ShaderNodeObjectInfo:
+    pass
+
+
+class ShaderNodeOutput:
+    is_active_output: bool = None
+    '''True if this node is used as the active output 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeOutputLamp:
+    is_active_output: bool = None
+    '''True if this node is used as the active output 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeOutputLineStyle:
+    blend_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    is_active_output: bool = None
+    '''True if this node is used as the active output 
+
+    :type: bool
+    '''
+
+    use_alpha: bool = None
+    '''Include alpha of second input in this operation 
+
+    :type: bool
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
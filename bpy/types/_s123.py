@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ShaderNodeOutputMaterial:
+    is_active_output: bool = None
+    '''True if this node is used as the active output 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeOutputWorld:
+    is_active_output: bool = None
+    '''True if this node is used as the active output 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeParticleInfo:
+    pass
+
+
+class ShaderNodeRGB:
+    pass
+
+
+class ShaderNodeRGBCurve:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+
+class ShaderNodeRGBToBW:
+    pass
+
+
+class ShaderNodeScript:
+    bytecode: str = None
+    '''Compile bytecode for shader script node 
+
+    :type: str
+    '''
+
+    bytecode_hash: str = None
+    '''Hash of compile bytecode, for quick equality checking 
+
+    :type: str
+    '''
+
+    filepath: str = None
+    '''Shader script path 
+
+    :type: str
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    script: 'Text' = None
+    '''Internal shader script to define the shader 
+
+    :type: 'Text'
+    '''
+
+    use_auto_update: bool = None
+    '''Automatically update the shader when the .osl file changes (external scripts only) 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeSeparateHSV:
+    pass
+
+
+class ShaderNodeSeparateRGB:
+    pass
+
+
+class ShaderNodeSeparateXYZ:
+    pass
+
+
+class ShaderNodeSqueeze:
+    pass
+
+
+class ShaderNodeSubsurfaceScattering:
+    falloff: typing.Union[int, str] = None
+    '''Function to determine how much light nearby points contribute based on their distance to the shading point 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeTangent:
+    axis: typing.Union[int, str] = None
+    '''Axis for radial tangents 
+
+    :type: typing.Union[int, str]
+    '''
+
+    direction_type: typing.Union[int, str] = None
+    '''Method to use for the tangent 
+
+    :type: typing.Union[int, str]
+    '''
+
+    uv_map: str = None
+    '''UV Map for tangent generated from UV 
+
+    :type: str
+    '''
+
+
+class ShaderNodeTexBrick:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    offset: float = None
+    '''
+
+    :type: float
+    '''
+
+    offset_frequency: int = None
+    '''
+
+    :type: int
+    '''
+
+    squash: float = None
+    '''
+
+    :type: float
+    '''
+
+    squash_frequency: int = None
+    '''
+
+    :type: int
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexChecker:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexCoord:
+    from_dupli: bool = None
+    '''Use the parent of the dupli object if possible 
+
+    :type: bool
+    '''
+
+    object: 'Object' = None
+    '''Use coordinates from this object (for object texture coordinates output) 
+
+    :type: 'Object'
+    '''
+
+
+class ShaderNodeTexEnvironment:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    color_space: typing.Union[int, str] = None
+    '''Image file color space 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Texture interpolation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    projection: typing.Union[int, str] = None
+    '''Projection of the input image 
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexGradient:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    gradient_type: typing.Union[int, str] = None
+    '''Style of the color blending 
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexImage:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    color_space: typing.Union[int, str] = None
+    '''Image file color space 
+
+    :type: typing.Union[int, str]
+    '''
+
+    extension: typing.Union[int, str] = None
+    '''How the image is extrapolated past its original bounds 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Texture interpolation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    projection: typing.Union[int, str] = None
+    '''Method to project 2D image on object with a 3D texture vector 
+
+    :type: typing.Union[int, str]
+    '''
+
+    projection_blend: float = None
+    '''For box projection, amount of blend to use between sides 
+
+    :type: float
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexMagic:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+    turbulence_depth: int = None
+    '''Level of detail in the added turbulent noise 
+
+    :type: int
+    '''
+
+
+class ShaderNodeTexMusgrave:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    musgrave_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexNoise:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ShaderNodeTexPointDensity:
+    interpolation: typing.Union[int, str] = None
+    '''Texture interpolation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    object: 'Object' = None
+    '''Object to take point data from 
+
+    :type: 'Object'
+    '''
+
+    particle_color_source: typing.Union[int, str] = None
+    '''Data to derive color results from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''Particle System to render as points 
+
+    :type: 'ParticleSystem'
+    '''
+
+    point_source: typing.Union[int, str] = None
+    '''Point data to use as renderable point density 
+
+    :type: typing.Union[int, str]
+    '''
+
+    radius: float = None
+    '''Radius from the shaded sample to look for points within 
+
+    :type: float
+    '''
+
+    resolution: int = None
+    '''Resolution used by the texture holding the point density 
+
+    :type: int
+    '''
+
+    space: typing.Union[int, str] = None
+    '''Coordinate system to calculate voxels in 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_attribute_name: str = None
+    '''Vertex attribute to use for color 
+
+    :type: str
+    '''
+
+    vertex_color_source: typing.Union[int, str] = None
+    '''Data to derive color results from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def cache_point_density(self,
+                            scene=None,
+                            settings: typing.Union[int, str] = 'RENDER'):
+        '''Cache point density data for later calculation 
+
+        :param settings: Calculate density for renderingVIEWPORT Viewport, Canculate density using viewport settings.RENDER Render, Canculate duplis using render settings. 
+        :type settings: typing.Union[int, str]
+        '''
+        pass
+
+    def calc_point_density(self,
+                           scene=None,
+                           settings: typing.Union[int, str] = 'RENDER'
+                           ) -> float:
+        '''Calculate point density 
+
+        :param settings: Calculate density for renderingVIEWPORT Viewport, Canculate density using viewport settings.RENDER Render, Canculate duplis using render settings. 
+        :type settings: typing.Union[int, str]
+        :rtype: float
+        :return:  RGBA Values 
+        '''
+        pass
+
+    def calc_point_density_minmax(self,
+                                  scene=None,
+                                  settings: typing.Union[int, str] = 'RENDER'):
+        '''Calculate point density 
+
+        :param settings: Calculate density for renderingVIEWPORT Viewport, Canculate density using viewport settings.RENDER Render, Canculate duplis using render settings. 
+        :type settings: typing.Union[int, str]
+        '''
+        pass
+
+
+class ShaderNodeTexSky:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    ground_albedo: float = None
+    '''Ground color that is subtly reflected in the sky 
+
+    :type: float
+    '''
+
+    sky_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    sun_direction: float = None
+    '''Direction from where the sun is shining 
+
+    :type: float
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+    turbidity: float = None
+    '''Atmospheric turbidity 
+
+    :type: float
+    '''
+
+
+class ShaderNodeTexVoronoi:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    coloring: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+
+class ShaderNodeTexWave:
+    color_mapping: 'ColorMapping' = None
+    '''Color mapping settings 
+
+    :type: 'ColorMapping'
+    '''
+
+    texture_mapping: 'TexMapping' = None
+    '''Texture coordinate mapping settings 
+
+    :type: 'TexMapping'
+    '''
+
+    wave_profile: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    wave_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeTexture:
+    node_output: int = None
+    '''For node-based textures, which output node to use 
+
+    :type: int
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+
+class ShaderNodeTree:
+    '''Node tree consisting of linked nodes used for materials (and other shading data-blocks) '''
+
+    pass
+
+
+class ShaderNodeUVAlongStroke:
+    use_tips: bool = None
+    '''Lower half of the texture is for tips of the stroke 
+
+    :type: bool
+    '''
+
+
+class ShaderNodeUVMap:
+    from_dupli: bool = None
+    '''Use the parent of the dupli object if possible 
+
+    :type: bool
+    '''
+
+    uv_map: str = None
+    '''UV coordinates to be used for mapping 
+
+    :type: str
+    '''
+
+
+class ShaderNodeValToRGB:
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+
+class ShaderNodeValue:
+    pass
+
+
+class ShaderNodeVectorCurve:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+
+class ShaderNodeVectorMath:
+    operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeVectorTransform:
+    convert_from: typing.Union[int, str] = None
+    '''Space to convert from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    convert_to: typing.Union[int, str] = None
+    '''Space to convert to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vector_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class ShaderNodeVolumeAbsorption:
+    pass
+
+
+class ShaderNodeVolumeScatter:
+    pass
+
+
+class ShaderNodeWavelength:
+    pass
+
+
+class ShaderNodeWireframe:
+    use_pixel_size: bool = None
+    '''Use screen pixel size instead of world units 
+
+    :type: bool
+    '''
+
+
+class ShapeKey:
+    '''Shape key in a shape keys data-block '''
+
+    data: typing.List['UnknownType'] = None
+    '''
+
+    :type: typing.List['UnknownType']
+    '''
+
+    frame: float = None
+    '''Frame for absolute keys 
+
+    :type: float
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Interpolation type for absolute shape keys 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mute: bool = None
+    '''Mute this shape key 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Name of Shape Key 
+
+    :type: str
+    '''
+
+    relative_key: 'ShapeKey' = None
+    '''Shape used as a relative key 
+
+    :type: 'ShapeKey'
+    '''
+
+    slider_max: float = None
+    '''Maximum for slider 
+
+    :type: float
+    '''
+
+    slider_min: float = None
+    '''Minimum for slider 
+
+    :type: float
+    '''
+
+    value: float = None
+    '''Value of shape key at the current frame 
+
+    :type: float
+    '''
+
+    vertex_group: str = None
+    '''Vertex weight group, to blend with basis shape 
+
+    :type: str
+    '''
+
+    def normals_vertex_get(self, ) -> float:
+        '''Compute local space vertices’ normals for this shape key 
+
+        :rtype: float
+        :return:  normals 
+        '''
+        pass
+
+    def normals_polygon_get(self, ) -> float:
+        '''Compute local space faces’ normals for this shape key 
+
+        :rtype: float
+        :return:  normals 
+        '''
+        pass
+
+    def normals_split_get(self, ) -> float:
+        '''Compute local space face corners’ normals for this shape key 
+
+        :rtype: float
+        :return:  normals 
+        '''
+        pass
+
+
+class ShapeKeyBezierPoint:
+    '''Point in a shape key for Bezier curves '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_left: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_right: float = None
+    '''
+
+    :type: float
+    '''
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ShapeKeyCurvePoint:
+    '''Point in a shape key for curves '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+    tilt: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ShapeKeyPoint:
+    '''Point in a shape key '''
+
+    co: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ShrinkwrapConstraint:
+    '''Create constraint-based shrinkwrap relationship '''
+
+    distance: float = None
+    '''Distance to Target 
+
+    :type: float
+    '''
+
+    project_axis: typing.Union[int, str] = None
+    '''Axis constrain to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    project_axis_space: typing.Union[int, str] = None
+    '''Space for the projection axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    project_limit: float = None
+    '''Limit the distance used for projection (zero disables) 
+
+    :type: float
+    '''
+
+    shrinkwrap_type: typing.Union[int, str] = None
+    '''Select type of shrinkwrap algorithm for target position 
+
+    :type: typing.Union[int, str]
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+
+class ShrinkwrapModifier:
+    '''Shrink wrapping modifier to shrink wrap and object to a target '''
+
+    auxiliary_target: 'Object' = None
+    '''Additional mesh target to shrink to 
+
+    :type: 'Object'
+    '''
+
+    cull_face: typing.Union[int, str] = None
+    '''Stop vertices from projecting to a face on the target when facing towards/away 
+
+    :type: typing.Union[int, str]
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    offset: float = None
+    '''Distance to keep from the target 
+
+    :type: float
+    '''
+
+    project_limit: float = None
+    '''Limit the distance used for projection (zero disables) 
+
+    :type: float
+    '''
+
+    subsurf_levels: int = None
+    '''Number of subdivisions that must be performed before extracting vertices’ positions and normals 
+
+    :type: int
+    '''
+
+    target: 'Object' = None
+    '''Mesh target to shrink to 
+
+    :type: 'Object'
+    '''
+
+    use_keep_above_surface: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_negative_direction: bool = None
+    '''Allow vertices to move in the negative direction of axis 
+
+    :type: bool
+    '''
+
+    use_positive_direction: bool = None
+    '''Allow vertices to move in the positive direction of axis 
+
+    :type: bool
+    '''
+
+    use_project_x: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_project_y: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_project_z: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+    wrap_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class SimpleDeformModifier:
+    '''Simple deformation modifier to apply effects such as twisting and bending '''
+
+    angle: float = None
+    '''Angle of deformation 
+
+    :type: float
+    '''
+
+    deform_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    factor: float = None
+    '''Amount to deform object 
+
+    :type: float
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    limits: float = None
+    '''Lower/Upper limits for deform 
+
+    :type: float
+    '''
+
+    lock_x: bool = None
+    '''Do not allow deformation along the X axis 
+
+    :type: bool
+    '''
+
+    lock_y: bool = None
+    '''Do not allow deformation along the Y axis 
+
+    :type: bool
+    '''
+
+    origin: 'Object' = None
+    '''Offset the origin and orientation of the deformation 
+
+    :type: 'Object'
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class SkinModifier:
+    '''Generate Skin '''
+
+    branch_smoothing: float = None
+    '''Smooth complex geometry around branches 
+
+    :type: float
+    '''
+
+    use_smooth_shade: bool = None
+    '''Output faces with smooth shading rather than flat shaded 
+
+    :type: bool
+    '''
+
+    use_x_symmetry: bool = None
+    '''Avoid making unsymmetrical quads across the X axis 
+
+    :type: bool
+    '''
+
+    use_y_symmetry: bool = None
+    '''Avoid making unsymmetrical quads across the Y axis 
+
+    :type: bool
+    '''
+
+    use_z_symmetry: bool = None
+    '''Avoid making unsymmetrical quads across the Z axis 
+
+    :type: bool
+    '''
+
+
+class SmokeCollSettings:
+    '''Smoke collision settings '''
+
+    collision_type: typing.Union[int, str] = None
+    '''Collision type 
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SmokeDomainSettings:
+    '''Smoke domain settings '''
+
+    adapt_margin: int = None
+    '''Margin added around fluid to minimize boundary interference 
+
+    :type: int
+    '''
+
+    adapt_threshold: float = None
+    '''Maximum amount of fluid cell can contain before it is considered empty 
+
+    :type: float
+    '''
+
+    additional_res: int = None
+    '''Maximum number of additional cells 
+
+    :type: int
+    '''
+
+    alpha: float = None
+    '''How much density affects smoke motion (higher value results in faster rising smoke) 
+
+    :type: float
+    '''
+
+    amplify: int = None
+    '''Enhance the resolution of smoke by this factor using noise 
+
+    :type: int
+    '''
+
+    axis_slice_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    beta: float = None
+    '''How much heat affects smoke motion (higher value results in faster rising smoke) 
+
+    :type: float
+    '''
+
+    burning_rate: float = None
+    '''Speed of the burning reaction (use larger values for smaller flame) 
+
+    :type: float
+    '''
+
+    cache_file_format: typing.Union[int, str] = None
+    '''Select the file format to be used for caching 
+
+    :type: typing.Union[int, str]
+    '''
+
+    cell_size: float = None
+    '''Cell Size 
+
+    :type: float
+    '''
+
+    coba_field: typing.Union[int, str] = None
+    '''Simulation field to color map 
+
+    :type: typing.Union[int, str]
+    '''
+
+    collision_extents: typing.Union[int, str] = None
+    '''Select which domain border will be treated as collision object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    collision_group: 'Group' = None
+    '''Limit collisions to this group 
+
+    :type: 'Group'
+    '''
+
+    color_grid: float = None
+    '''Smoke color grid 
+
+    :type: float
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    data_depth: typing.Union[int, str] = None
+    '''Bit depth for writing all scalar (including vector) lower values reduce file size 
+
+    :type: typing.Union[int, str]
+    '''
+
+    density_grid: float = None
+    '''Smoke density grid 
+
+    :type: float
+    '''
+
+    display_thickness: float = None
+    '''Thickness of smoke drawing in the viewport 
+
+    :type: float
+    '''
+
+    dissolve_speed: int = None
+    '''Dissolve Speed 
+
+    :type: int
+    '''
+
+    domain_resolution: int = None
+    '''Smoke Grid Resolution 
+
+    :type: int
+    '''
+
+    draw_velocity: bool = None
+    '''Toggle visualization of the velocity field as needles 
+
+    :type: bool
+    '''
+
+    effector_group: 'Group' = None
+    '''Limit effectors to this group 
+
+    :type: 'Group'
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    flame_grid: float = None
+    '''Smoke flame grid 
+
+    :type: float
+    '''
+
+    flame_ignition: float = None
+    '''Minimum temperature of flames 
+
+    :type: float
+    '''
+
+    flame_max_temp: float = None
+    '''Maximum temperature of flames 
+
+    :type: float
+    '''
+
+    flame_smoke: float = None
+    '''Amount of smoke created by burning fuel 
+
+    :type: float
+    '''
+
+    flame_smoke_color: float = None
+    '''Color of smoke emitted from burning fuel 
+
+    :type: float
+    '''
+
+    flame_vorticity: float = None
+    '''Additional vorticity for the flames 
+
+    :type: float
+    '''
+
+    fluid_group: 'Group' = None
+    '''Limit fluid objects to this group 
+
+    :type: 'Group'
+    '''
+
+    heat_grid: float = None
+    '''Smoke heat grid 
+
+    :type: float
+    '''
+
+    highres_sampling: typing.Union[int, str] = None
+    '''Method for sampling the high resolution flow 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_type: typing.Union[int, str] = None
+    '''Noise method which is used for creating the high resolution 
+
+    :type: typing.Union[int, str]
+    '''
+
+    openvdb_cache_compress_type: typing.Union[int, str] = None
+    '''Compression method to be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    point_cache_compress_type: typing.Union[int, str] = None
+    '''Compression method to be used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution_max: int = None
+    '''Maximal resolution used in the fluid domain 
+
+    :type: int
+    '''
+
+    show_high_resolution: bool = None
+    '''Show high resolution (using amplification) 
+
+    :type: bool
+    '''
+
+    slice_axis: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    slice_depth: float = None
+    '''Position of the slice 
+
+    :type: float
+    '''
+
+    slice_method: typing.Union[int, str] = None
+    '''How to slice the volume for viewport rendering 
+
+    :type: typing.Union[int, str]
+    '''
+
+    slice_per_voxel: float = None
+    '''How many slices per voxel should be generated 
+
+    :type: float
+    '''
+
+    start_point: float = None
+    '''Start point 
+
+    :type: float
+    '''
+
+    strength: float = None
+    '''Strength of noise 
+
+    :type: float
+    '''
+
+    time_scale: float = None
+    '''Adjust simulation speed 
+
+    :type: float
+    '''
+
+    use_adaptive_domain: bool = None
+    '''Adapt simulation resolution and size to fluid 
+
+    :type: bool
+    '''
+
+    use_color_ramp: bool = None
+    '''Render a simulation field while mapping its voxels values to the colors of a ramp 
+
+    :type: bool
+    '''
+
+    use_dissolve_smoke: bool = None
+    '''Enable smoke to disappear over time 
+
+    :type: bool
+    '''
+
+    use_dissolve_smoke_log: bool = None
+    '''Using 1/x 
+
+    :type: bool
+    '''
+
+    use_high_resolution: bool = None
+    '''Enable high resolution (using amplification) 
+
+    :type: bool
+    '''
+
+    vector_draw_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    vector_scale: float = None
+    '''Multiplier for scaling the vectors 
+
+    :type: float
+    '''
+
+    velocity_grid: float = None
+    '''Smoke velocity grid 
+
+    :type: float
+    '''
+
+    vorticity: float = None
+    '''Amount of turbulence/rotation in fluid 
+
+    :type: float
+    '''
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SmokeFlowSettings:
+    '''Smoke flow settings '''
+
+    density: float = None
+    '''
+
+    :type: float
+    '''
+
+    density_vertex_group: str = None
+    '''Name of vertex group which determines surface emission rate 
+
+    :type: str
+    '''
+
+    fuel_amount: float = None
+    '''
+
+    :type: float
+    '''
+
+    noise_texture: 'Texture' = None
+    '''Texture that controls emission strength 
+
+    :type: 'Texture'
+    '''
+
+    particle_size: float = None
+    '''Particle size in simulation cells 
+
+    :type: float
+    '''
+
+    particle_system: 'ParticleSystem' = None
+    '''Particle systems emitted from the object 
+
+    :type: 'ParticleSystem'
+    '''
+
+    smoke_color: float = None
+    '''Color of smoke 
+
+    :type: float
+    '''
+
+    smoke_flow_source: typing.Union[int, str] = None
+    '''Change how smoke is emitted 
+
+    :type: typing.Union[int, str]
+    '''
+
+    smoke_flow_type: typing.Union[int, str] = None
+    '''Change how flow affects the simulation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subframes: int = None
+    '''Number of additional samples to take between frames to improve quality of fast moving flows 
+
+    :type: int
+    '''
+
+    surface_distance: float = None
+    '''Maximum distance from mesh surface to emit smoke 
+
+    :type: float
+    '''
+
+    temperature: float = None
+    '''Temperature difference to ambient temperature 
+
+    :type: float
+    '''
+
+    texture_map_type: typing.Union[int, str] = None
+    '''Texture mapping type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_offset: float = None
+    '''Z-offset of texture mapping 
+
+    :type: float
+    '''
+
+    texture_size: float = None
+    '''Size of texture mapping 
+
+    :type: float
+    '''
+
+    use_absolute: bool = None
+    '''Only allow given density value in emitter area 
+
+    :type: bool
+    '''
+
+    use_initial_velocity: bool = None
+    '''Smoke has some initial velocity when it is emitted 
+
+    :type: bool
+    '''
+
+    use_particle_size: bool = None
+    '''Set particle size in simulation cells or use nearest cell 
+
+    :type: bool
+    '''
+
+    use_texture: bool = None
+    '''Use a texture to control emission strength 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    velocity_factor: float = None
+    '''Multiplier of source velocity passed to smoke 
+
+    :type: float
+    '''
+
+    velocity_normal: float = None
+    '''Amount of normal directional velocity 
+
+    :type: float
+    '''
+
+    velocity_random: float = None
+    '''Amount of random velocity 
+
+    :type: float
+    '''
+
+    volume_density: float = None
+    '''Factor for smoke emitted from inside the mesh volume 
+
+    :type: float
+    '''
+
+
+class SmokeModifier:
+    '''Smoke simulation modifier '''
+
+    coll_settings: 'SmokeCollSettings' = None
+    '''
+
+    :type: 'SmokeCollSettings'
+    '''
+
+    domain_settings: 'SmokeDomainSettings' = None
+    '''
+
+    :type: 'SmokeDomainSettings'
+    '''
+
+    flow_settings: 'SmokeFlowSettings' = None
+    '''
+
+    :type: 'SmokeFlowSettings'
+    '''
+
+    smoke_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class SmoothModifier:
+    '''Smoothing effect modifier '''
+
+    factor: float = None
+    '''Strength of modifier effect 
+
+    :type: float
+    '''
+
+    iterations: int = None
+    '''
+
+    :type: int
+    '''
+
+    use_x: bool = None
+    '''Smooth object along X axis 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Smooth object along Y axis 
+
+    :type: bool
+    '''
+
+    use_z: bool = None
+    '''Smooth object along Z axis 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Name of Vertex Group which determines influence of modifier per point 
+
+    :type: str
+    '''
+
+
+class SoftBodyModifier:
+    '''Soft body simulation modifier '''
+
+    point_cache: 'PointCache' = None
+    '''
+
+    :type: 'PointCache'
+    '''
+
+    settings: 'SoftBodySettings' = None
+    '''
+
+    :type: 'SoftBodySettings'
+    '''
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SoftBodySettings:
+    '''Soft body simulation settings for an object '''
+
+    aero: int = None
+    '''Make edges ‘sail’ 
+
+    :type: int
+    '''
+
+    aerodynamics_type: typing.Union[int, str] = None
+    '''Method of calculating aerodynamic interaction 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ball_damp: float = None
+    '''Blending to inelastic collision 
+
+    :type: float
+    '''
+
+    ball_size: float = None
+    '''Absolute ball size or factor if not manually adjusted 
+
+    :type: float
+    '''
+
+    ball_stiff: float = None
+    '''Ball inflating pressure 
+
+    :type: float
+    '''
+
+    bend: float = None
+    '''Bending Stiffness 
+
+    :type: float
+    '''
+
+    choke: int = None
+    '''‘Viscosity’ inside collision target 
+
+    :type: int
+    '''
+
+    collision_group: 'Group' = None
+    '''Limit colliders to this Group 
+
+    :type: 'Group'
+    '''
+
+    collision_type: typing.Union[int, str] = None
+    '''Choose Collision Type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    damping: float = None
+    '''Edge spring friction 
+
+    :type: float
+    '''
+
+    effector_weights: 'EffectorWeights' = None
+    '''
+
+    :type: 'EffectorWeights'
+    '''
+
+    error_threshold: float = None
+    '''The Runge-Kutta ODE solver error limit, low value gives more precision, high values speed 
+
+    :type: float
+    '''
+
+    friction: float = None
+    '''General media friction for point movements 
+
+    :type: float
+    '''
+
+    fuzzy: int = None
+    '''Fuzziness while on collision, high values make collision handling faster but less stable 
+
+    :type: int
+    '''
+
+    goal_default: float = None
+    '''Default Goal (vertex target position) value 
+
+    :type: float
+    '''
+
+    goal_friction: float = None
+    '''Goal (vertex target position) friction 
+
+    :type: float
+    '''
+
+    goal_max: float = None
+    '''Goal maximum, vertex weights are scaled to match this range 
+
+    :type: float
+    '''
+
+    goal_min: float = None
+    '''Goal minimum, vertex weights are scaled to match this range 
+
+    :type: float
+    '''
+
+    goal_spring: float = None
+    '''Goal (vertex target position) spring stiffness 
+
+    :type: float
+    '''
+
+    gravity: float = None
+    '''Apply gravitation to point movement 
+
+    :type: float
+    '''
+
+    location_mass_center: float = None
+    '''Location of Center of mass 
+
+    :type: float
+    '''
+
+    mass: float = None
+    '''General Mass value 
+
+    :type: float
+    '''
+
+    plastic: int = None
+    '''Permanent deform 
+
+    :type: int
+    '''
+
+    pull: float = None
+    '''Edge spring stiffness when longer than rest length 
+
+    :type: float
+    '''
+
+    push: float = None
+    '''Edge spring stiffness when shorter than rest length 
+
+    :type: float
+    '''
+
+    rotation_estimate: float = None
+    '''Estimated rotation matrix 
+
+    :type: float
+    '''
+
+    scale_estimate: float = None
+    '''Estimated scale matrix 
+
+    :type: float
+    '''
+
+    shear: float = None
+    '''Shear Stiffness 
+
+    :type: float
+    '''
+
+    speed: float = None
+    '''Tweak timing for physics to control frequency and speed 
+
+    :type: float
+    '''
+
+    spring_length: int = None
+    '''Alter spring length to shrink/blow up (unit %) 0 to disable 
+
+    :type: int
+    '''
+
+    step_max: int = None
+    '''Maximal # solver steps/frame 
+
+    :type: int
+    '''
+
+    step_min: int = None
+    '''Minimal # solver steps/frame 
+
+    :type: int
+    '''
+
+    use_auto_step: bool = None
+    '''Use velocities for automagic step sizes 
+
+    :type: bool
+    '''
+
+    use_diagnose: bool = None
+    '''Turn on SB diagnose console prints 
+
+    :type: bool
+    '''
+
+    use_edge_collision: bool = None
+    '''Edges collide too 
+
+    :type: bool
+    '''
+
+    use_edges: bool = None
+    '''Use Edges as springs 
+
+    :type: bool
+    '''
+
+    use_estimate_matrix: bool = None
+    '''Estimate matrix… split to COM, ROT, SCALE 
+
+    :type: bool
+    '''
+
+    use_face_collision: bool = None
+    '''Faces collide too, can be very slow 
+
+    :type: bool
+    '''
+
+    use_goal: bool = None
+    '''Define forces for vertices to stick to animated position 
+
+    :type: bool
+    '''
+
+    use_self_collision: bool = None
+    '''Enable naive vertex ball self collision 
+
+    :type: bool
+    '''
+
+    use_stiff_quads: bool = None
+    '''Add diagonal springs on 4-gons 
+
+    :type: bool
+    '''
+
+    vertex_group_goal: str = None
+    '''Control point weight values 
+
+    :type: str
+    '''
+
+    vertex_group_mass: str = None
+    '''Control point mass values 
+
+    :type: str
+    '''
+
+    vertex_group_spring: str = None
+    '''Control point spring strength values 
+
+    :type: str
+    '''
+
+
+class SolidifyModifier:
+    '''Create a solid skin by extruding, compensating for sharp angles '''
+
+    edge_crease_inner: float = None
+    '''Assign a crease to inner edges 
+
+    :type: float
+    '''
+
+    edge_crease_outer: float = None
+    '''Assign a crease to outer edges 
+
+    :type: float
+    '''
+
+    edge_crease_rim: float = None
+    '''Assign a crease to the edges making up the rim 
+
+    :type: float
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert the vertex group influence 
+
+    :type: bool
+    '''
+
+    material_offset: int = None
+    '''Offset material index of generated faces 
+
+    :type: int
+    '''
+
+    material_offset_rim: int = None
+    '''Offset material index of generated rim faces 
+
+    :type: int
+    '''
+
+    offset: float = None
+    '''Offset the thickness from the center 
+
+    :type: float
+    '''
+
+    thickness: float = None
+    '''Thickness of the shell 
+
+    :type: float
+    '''
+
+    thickness_clamp: float = None
+    '''Offset clamp based on geometry scale 
+
+    :type: float
+    '''
+
+    thickness_vertex_group: float = None
+    '''Thickness factor to use for zero vertex group influence 
+
+    :type: float
+    '''
+
+    use_even_offset: bool = None
+    '''Maintain thickness by adjusting for sharp corners (slow, disable when not needed) 
+
+    :type: bool
+    '''
+
+    use_flip_normals: bool = None
+    '''Invert the face direction 
+
+    :type: bool
+    '''
+
+    use_quality_normals: bool = None
+    '''Calculate normals which result in more even thickness (slow, disable when not needed) 
+
+    :type: bool
+    '''
+
+    use_rim: bool = None
+    '''Create edge loops between the inner and outer surfaces on face edges (slow, disable when not needed) 
+
+    :type: bool
+    '''
+
+    use_rim_only: bool = None
+    '''Only add the rim to the original data 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
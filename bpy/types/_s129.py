@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Sound:
+    '''Sound data-block referencing an external or packed sound file '''
+
+    filepath: str = None
+    '''Sound sample file used by this Sound data-block 
+
+    :type: str
+    '''
+
+    packed_file: 'PackedFile' = None
+    '''
+
+    :type: 'PackedFile'
+    '''
+
+    use_memory_cache: bool = None
+    '''The sound file is decoded and loaded into RAM 
+
+    :type: bool
+    '''
+
+    use_mono: bool = None
+    '''If the file contains multiple audio channels they are rendered to a single one 
+
+    :type: bool
+    '''
+
+    factory = None
+    '''The aud.Factory object of the sound. (readonly) '''
+
+    def pack(self, ):
+        '''Pack the sound into the current blend file 
+
+        '''
+        pass
+
+    def unpack(self, method: typing.Union[int, str] = 'USE_LOCAL'):
+        '''Unpack the sound to the samples filename 
+
+        :param method: method, How to unpack 
+        :type method: typing.Union[int, str]
+        '''
+        pass
+
+
+class SoundActuator:
+    '''Sound file '''
+
+    cone_inner_angle_3d: float = None
+    '''The angle of the inner cone 
+
+    :type: float
+    '''
+
+    cone_outer_angle_3d: float = None
+    '''The angle of the outer cone 
+
+    :type: float
+    '''
+
+    cone_outer_gain_3d: float = None
+    '''The gain outside the outer cone (the gain in the outer cone will be interpolated between this value and the normal gain in the inner cone) 
+
+    :type: float
+    '''
+
+    distance_3d_max: float = None
+    '''The maximum distance at which you can hear the sound 
+
+    :type: float
+    '''
+
+    distance_3d_reference: float = None
+    '''The distance where the sound has a gain of 1.0 
+
+    :type: float
+    '''
+
+    gain_3d_max: float = None
+    '''The maximum gain of the sound, no matter how near it is 
+
+    :type: float
+    '''
+
+    gain_3d_min: float = None
+    '''The minimum gain of the sound, no matter how far it is away 
+
+    :type: float
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    pitch: float = None
+    '''Pitch of the sound 
+
+    :type: float
+    '''
+
+    rolloff_factor_3d: float = None
+    '''The influence factor on volume depending on distance 
+
+    :type: float
+    '''
+
+    sound: 'Sound' = None
+    '''
+
+    :type: 'Sound'
+    '''
+
+    use_sound_3d: bool = None
+    '''Enable/Disable 3D Sound 
+
+    :type: bool
+    '''
+
+    volume: float = None
+    '''Initial volume of the sound 
+
+    :type: float
+    '''
+
+
+class SoundSequence:
+    '''Sequence strip defining a sound to be played over a period of time '''
+
+    animation_offset_end: int = None
+    '''Animation end offset (trim end) 
+
+    :type: int
+    '''
+
+    animation_offset_start: int = None
+    '''Animation start offset (trim start) 
+
+    :type: int
+    '''
+
+    pan: float = None
+    '''Playback panning of the sound (only for Mono sources) 
+
+    :type: float
+    '''
+
+    pitch: float = None
+    '''Playback pitch of the sound 
+
+    :type: float
+    '''
+
+    show_waveform: bool = None
+    '''Whether to draw the sound’s waveform 
+
+    :type: bool
+    '''
+
+    sound: 'Sound' = None
+    '''Sound data-block used by this sequence 
+
+    :type: 'Sound'
+    '''
+
+    volume: float = None
+    '''Playback volume of the sound 
+
+    :type: float
+    '''
+
+
+class Space:
+    '''Space data for a screen area '''
+
+    show_locked_time: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    type: typing.Union[int, str] = None
+    '''Space data type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
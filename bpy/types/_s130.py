@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceClipEditor:
+    '''Clip editor space data '''
+
+    clip: 'MovieClip' = None
+    '''Movie clip displayed and edited in this space 
+
+    :type: 'MovieClip'
+    '''
+
+    clip_user: 'MovieClipUser' = None
+    '''Parameters defining which frame of the movie clip is displayed 
+
+    :type: 'MovieClipUser'
+    '''
+
+    grease_pencil_source: typing.Union[int, str] = None
+    '''Where the grease pencil comes from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    lock_selection: bool = None
+    '''Lock viewport to selected markers during playback 
+
+    :type: bool
+    '''
+
+    lock_time_cursor: bool = None
+    '''Lock curves view to time cursor during playback and tracking 
+
+    :type: bool
+    '''
+
+    mask: 'Mask' = None
+    '''Mask displayed and edited in this space 
+
+    :type: 'Mask'
+    '''
+
+    mask_draw_type: typing.Union[int, str] = None
+    '''Draw type for mask splines 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_overlay_mode: typing.Union[int, str] = None
+    '''Overlay mode of rasterized mask 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Editing context being displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    path_length: int = None
+    '''Length of displaying path, in frames 
+
+    :type: int
+    '''
+
+    pivot_point: typing.Union[int, str] = None
+    '''Pivot center for rotation/scaling 
+
+    :type: typing.Union[int, str]
+    '''
+
+    scopes: 'MovieClipScopes' = None
+    '''Scopes to visualize movie clip statistics 
+
+    :type: 'MovieClipScopes'
+    '''
+
+    show_blue_channel: bool = None
+    '''Show blue channel in the frame 
+
+    :type: bool
+    '''
+
+    show_bundles: bool = None
+    '''Show projection of 3D markers into footage 
+
+    :type: bool
+    '''
+
+    show_disabled: bool = None
+    '''Show disabled tracks from the footage 
+
+    :type: bool
+    '''
+
+    show_filters: bool = None
+    '''Show filters for graph editor 
+
+    :type: bool
+    '''
+
+    show_graph_frames: bool = None
+    '''Show curve for per-frame average error (camera motion should be solved first) 
+
+    :type: bool
+    '''
+
+    show_graph_hidden: bool = None
+    '''Include channels from objects/bone that aren’t visible 
+
+    :type: bool
+    '''
+
+    show_graph_only_selected: bool = None
+    '''Only include channels relating to selected objects and data 
+
+    :type: bool
+    '''
+
+    show_graph_tracks_error: bool = None
+    '''Display the reprojection error curve for selected tracks 
+
+    :type: bool
+    '''
+
+    show_graph_tracks_motion: bool = None
+    '''Display the speed curves (in “x” direction red, in “y” direction green) for the selected tracks 
+
+    :type: bool
+    '''
+
+    show_grease_pencil: bool = None
+    '''Show grease pencil for this view 
+
+    :type: bool
+    '''
+
+    show_green_channel: bool = None
+    '''Show green channel in the frame 
+
+    :type: bool
+    '''
+
+    show_grid: bool = None
+    '''Show grid showing lens distortion 
+
+    :type: bool
+    '''
+
+    show_marker_pattern: bool = None
+    '''Show pattern boundbox for markers 
+
+    :type: bool
+    '''
+
+    show_marker_search: bool = None
+    '''Show search boundbox for markers 
+
+    :type: bool
+    '''
+
+    show_mask_overlay: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_mask_smooth: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_metadata: bool = None
+    '''Show metadata of clip 
+
+    :type: bool
+    '''
+
+    show_names: bool = None
+    '''Show track names and status 
+
+    :type: bool
+    '''
+
+    show_red_channel: bool = None
+    '''Show red channel in the frame 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    show_stable: bool = None
+    '''Show stable footage in editor (if stabilization is enabled) 
+
+    :type: bool
+    '''
+
+    show_tiny_markers: bool = None
+    '''Show markers in a more compact manner 
+
+    :type: bool
+    '''
+
+    show_track_path: bool = None
+    '''Show path of how track moves 
+
+    :type: bool
+    '''
+
+    use_grayscale_preview: bool = None
+    '''Display frame in grayscale mode 
+
+    :type: bool
+    '''
+
+    use_manual_calibration: bool = None
+    '''Use manual calibration helpers 
+
+    :type: bool
+    '''
+
+    use_mute_footage: bool = None
+    '''Mute footage and show black background instead 
+
+    :type: bool
+    '''
+
+    view: typing.Union[int, str] = None
+    '''Type of the clip editor view 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceConsole:
+    '''Interactive python console '''
+
+    font_size: int = None
+    '''Font size to use for displaying the text 
+
+    :type: int
+    '''
+
+    history: typing.List['ConsoleLine'] = None
+    '''Command history 
+
+    :type: typing.List['ConsoleLine']
+    '''
+
+    language: str = None
+    '''Command line prompt language 
+
+    :type: str
+    '''
+
+    prompt: str = None
+    '''Command line prompt 
+
+    :type: str
+    '''
+
+    scrollback: typing.List['ConsoleLine'] = None
+    '''Command output 
+
+    :type: typing.List['ConsoleLine']
+    '''
+
+    select_end: int = None
+    '''
+
+    :type: int
+    '''
+
+    select_start: int = None
+    '''
+
+    :type: int
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceDopeSheetEditor:
+    '''Dope Sheet space data '''
+
+    action: 'Action' = None
+    '''Action displayed and edited in this space 
+
+    :type: 'Action'
+    '''
+
+    auto_snap: typing.Union[int, str] = None
+    '''Automatic time snapping settings for transformations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dopesheet: 'DopeSheet' = None
+    '''Settings for filtering animation data 
+
+    :type: 'DopeSheet'
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Editing context being displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_frame_indicator: bool = None
+    '''Show frame number beside the current frame indicator line 
+
+    :type: bool
+    '''
+
+    show_group_colors: bool = None
+    '''Draw groups and channels with colors matching their corresponding groups (pose bones only currently) 
+
+    :type: bool
+    '''
+
+    show_pose_markers: bool = None
+    '''Show markers belonging to the active action instead of Scene markers (Action and Shape Key Editors only) 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    show_sliders: bool = None
+    '''Show sliders beside F-Curve channels 
+
+    :type: bool
+    '''
+
+    use_auto_merge_keyframes: bool = None
+    '''Automatically merge nearby keyframes 
+
+    :type: bool
+    '''
+
+    use_marker_sync: bool = None
+    '''Sync Markers with keyframe edits 
+
+    :type: bool
+    '''
+
+    use_realtime_update: bool = None
+    '''When transforming keyframes, changes to the animation data are flushed to other views 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceFileBrowser:
+    '''File browser space data '''
+
+    active_operator: 'Operator' = None
+    '''
+
+    :type: 'Operator'
+    '''
+
+    bookmarks: typing.List['FileBrowserFSMenuEntry'] = None
+    '''User’s bookmarks 
+
+    :type: typing.List['FileBrowserFSMenuEntry']
+    '''
+
+    bookmarks_active: int = None
+    '''Index of active bookmark (-1 if none) 
+
+    :type: int
+    '''
+
+    operator: 'Operator' = None
+    '''
+
+    :type: 'Operator'
+    '''
+
+    params: 'FileSelectParams' = None
+    '''Parameters and Settings for the Filebrowser 
+
+    :type: 'FileSelectParams'
+    '''
+
+    recent_folders: typing.List['FileBrowserFSMenuEntry'] = None
+    '''
+
+    :type: typing.List['FileBrowserFSMenuEntry']
+    '''
+
+    recent_folders_active: int = None
+    '''Index of active recent folder (-1 if none) 
+
+    :type: int
+    '''
+
+    system_bookmarks: typing.List['FileBrowserFSMenuEntry'] = None
+    '''System’s bookmarks 
+
+    :type: typing.List['FileBrowserFSMenuEntry']
+    '''
+
+    system_bookmarks_active: int = None
+    '''Index of active system bookmark (-1 if none) 
+
+    :type: int
+    '''
+
+    system_folders: typing.List['FileBrowserFSMenuEntry'] = None
+    '''System’s folders (usually root, available hard drives, etc) 
+
+    :type: typing.List['FileBrowserFSMenuEntry']
+    '''
+
+    system_folders_active: int = None
+    '''Index of active system folder (-1 if none) 
+
+    :type: int
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceGraphEditor:
+    '''Graph Editor space data '''
+
+    auto_snap: typing.Union[int, str] = None
+    '''Automatic time snapping settings for transformations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    cursor_position_x: float = None
+    '''Graph Editor 2D-Value cursor - X-Value component 
+
+    :type: float
+    '''
+
+    cursor_position_y: float = None
+    '''Graph Editor 2D-Value cursor - Y-Value component 
+
+    :type: float
+    '''
+
+    dopesheet: 'DopeSheet' = None
+    '''Settings for filtering animation data 
+
+    :type: 'DopeSheet'
+    '''
+
+    has_ghost_curves: bool = None
+    '''Graph Editor instance has some ghost curves stored 
+
+    :type: bool
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Editing context being displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pivot_point: typing.Union[int, str] = None
+    '''Pivot center for rotation/scaling 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_cursor: bool = None
+    '''Show 2D cursor 
+
+    :type: bool
+    '''
+
+    show_frame_indicator: bool = None
+    '''Show frame number beside the current frame indicator line 
+
+    :type: bool
+    '''
+
+    show_group_colors: bool = None
+    '''Draw groups and channels with colors matching their corresponding groups 
+
+    :type: bool
+    '''
+
+    show_handles: bool = None
+    '''Show handles of Bezier control points 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    show_sliders: bool = None
+    '''Show sliders beside F-Curve channels 
+
+    :type: bool
+    '''
+
+    use_auto_merge_keyframes: bool = None
+    '''Automatically merge nearby keyframes 
+
+    :type: bool
+    '''
+
+    use_auto_normalization: bool = None
+    '''Automatically recalculate curve normalization on every curve edit 
+
+    :type: bool
+    '''
+
+    use_beauty_drawing: bool = None
+    '''Draw F-Curves using Anti-Aliasing and other fancy effects (disable for better performance) 
+
+    :type: bool
+    '''
+
+    use_normalization: bool = None
+    '''Display curves in normalized to -1..1 range, for easier editing of multiple curves with different ranges 
+
+    :type: bool
+    '''
+
+    use_only_selected_curves_handles: bool = None
+    '''Only keyframes of selected F-Curves are visible and editable 
+
+    :type: bool
+    '''
+
+    use_only_selected_keyframe_handles: bool = None
+    '''Only show and edit handles of selected keyframes 
+
+    :type: bool
+    '''
+
+    use_realtime_update: bool = None
+    '''When transforming keyframes, changes to the animation data are flushed to other views 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceImageEditor:
+    '''Image and UV editor space data '''
+
+    cursor_location: float = None
+    '''2D cursor location for this view 
+
+    :type: float
+    '''
+
+    draw_channels: typing.Union[int, str] = None
+    '''Channels of the image to draw 
+
+    :type: typing.Union[int, str]
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease pencil data for this space 
+
+    :type: 'GreasePencil'
+    '''
+
+    image: 'Image' = None
+    '''Image displayed and edited in this space 
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    mask: 'Mask' = None
+    '''Mask displayed and edited in this space 
+
+    :type: 'Mask'
+    '''
+
+    mask_draw_type: typing.Union[int, str] = None
+    '''Draw type for mask splines 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_overlay_mode: typing.Union[int, str] = None
+    '''Overlay mode of rasterized mask 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''Editing context being displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pivot_point: typing.Union[int, str] = None
+    '''Rotation/Scaling Pivot 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sample_histogram: 'Histogram' = None
+    '''Sampled colors along line 
+
+    :type: 'Histogram'
+    '''
+
+    scopes: 'Scopes' = None
+    '''Scopes to visualize image statistics 
+
+    :type: 'Scopes'
+    '''
+
+    show_grease_pencil: bool = None
+    '''Show grease pencil for this view 
+
+    :type: bool
+    '''
+
+    show_mask_overlay: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_mask_smooth: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_maskedit: bool = None
+    '''Show Mask editing related properties 
+
+    :type: bool
+    '''
+
+    show_paint: bool = None
+    '''Show paint related properties 
+
+    :type: bool
+    '''
+
+    show_render: bool = None
+    '''Show render related properties 
+
+    :type: bool
+    '''
+
+    show_repeat: bool = None
+    '''Draw the image repeated outside of the main view 
+
+    :type: bool
+    '''
+
+    show_stereo_3d: bool = None
+    '''Display the image in Stereo 3D 
+
+    :type: bool
+    '''
+
+    show_uvedit: bool = None
+    '''Show UV editing related properties 
+
+    :type: bool
+    '''
+
+    use_image_pin: bool = None
+    '''Display current image regardless of object selection 
+
+    :type: bool
+    '''
+
+    use_realtime_update: bool = None
+    '''Update other affected window spaces automatically to reflect changes during interactive operations such as transform 
+
+    :type: bool
+    '''
+
+    uv_editor: 'SpaceUVEditor' = None
+    '''UV editor settings 
+
+    :type: 'SpaceUVEditor'
+    '''
+
+    zoom: float = None
+    '''Zoom factor 
+
+    :type: float
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceInfo:
+    '''Info space data '''
+
+    show_report_debug: bool = None
+    '''Display debug reporting info 
+
+    :type: bool
+    '''
+
+    show_report_error: bool = None
+    '''Display error text 
+
+    :type: bool
+    '''
+
+    show_report_info: bool = None
+    '''Display general information 
+
+    :type: bool
+    '''
+
+    show_report_operator: bool = None
+    '''Display the operator log 
+
+    :type: bool
+    '''
+
+    show_report_warning: bool = None
+    '''Display warnings 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceLogicEditor:
+    '''Logic editor space data '''
+
+    show_actuators_active_object: bool = None
+    '''Show actuators of active object 
+
+    :type: bool
+    '''
+
+    show_actuators_active_states: bool = None
+    '''Show only actuators connected to active states 
+
+    :type: bool
+    '''
+
+    show_actuators_linked_controller: bool = None
+    '''Show linked objects to the actuator 
+
+    :type: bool
+    '''
+
+    show_actuators_selected_objects: bool = None
+    '''Show actuators of all selected objects 
+
+    :type: bool
+    '''
+
+    show_controllers_active_object: bool = None
+    '''Show controllers of active object 
+
+    :type: bool
+    '''
+
+    show_controllers_linked_controller: bool = None
+    '''Show linked objects to sensor/actuator 
+
+    :type: bool
+    '''
+
+    show_controllers_selected_objects: bool = None
+    '''Show controllers of all selected objects 
+
+    :type: bool
+    '''
+
+    show_sensors_active_object: bool = None
+    '''Show sensors of active object 
+
+    :type: bool
+    '''
+
+    show_sensors_active_states: bool = None
+    '''Show only sensors connected to active states 
+
+    :type: bool
+    '''
+
+    show_sensors_linked_controller: bool = None
+    '''Show linked objects to the controller 
+
+    :type: bool
+    '''
+
+    show_sensors_selected_objects: bool = None
+    '''Show sensors of all selected objects 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceNLA:
+    '''NLA editor space data '''
+
+    auto_snap: typing.Union[int, str] = None
+    '''Automatic time snapping settings for transformations 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dopesheet: 'DopeSheet' = None
+    '''Settings for filtering animation data 
+
+    :type: 'DopeSheet'
+    '''
+
+    show_frame_indicator: bool = None
+    '''Show frame number beside the current frame indicator line 
+
+    :type: bool
+    '''
+
+    show_local_markers: bool = None
+    '''Show action-local markers on the strips, useful when synchronizing timing across strips 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    show_strip_curves: bool = None
+    '''Show influence F-Curves on strips 
+
+    :type: bool
+    '''
+
+    use_realtime_update: bool = None
+    '''When transforming strips, changes to the animation data are flushed to other views 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceNodeEditor:
+    '''Node editor space data '''
+
+    backdrop_channels: typing.Union[int, str] = None
+    '''Channels of the image to draw 
+
+    :type: typing.Union[int, str]
+    '''
+
+    backdrop_x: float = None
+    '''Backdrop X offset 
+
+    :type: float
+    '''
+
+    backdrop_y: float = None
+    '''Backdrop Y offset 
+
+    :type: float
+    '''
+
+    backdrop_zoom: float = None
+    '''Backdrop zoom factor 
+
+    :type: float
+    '''
+
+    cursor_location: float = None
+    '''Location for adding new nodes 
+
+    :type: float
+    '''
+
+    edit_tree: 'NodeTree' = None
+    '''Node tree being displayed and edited 
+
+    :type: 'NodeTree'
+    '''
+
+    id: 'ID' = None
+    '''Data-block whose nodes are being edited 
+
+    :type: 'ID'
+    '''
+
+    id_from: 'ID' = None
+    '''Data-block from which the edited data-block is linked 
+
+    :type: 'ID'
+    '''
+
+    insert_offset_direction: typing.Union[int, str] = None
+    '''Direction to offset nodes on insertion 
+
+    :type: typing.Union[int, str]
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Base node tree from context 
+
+    :type: 'NodeTree'
+    '''
+
+    path: typing.List['NodeTreePath'] = None
+    '''Path from the data-block to the currently edited node tree 
+
+    :type: typing.List['NodeTreePath']
+    '''
+
+    pin: bool = None
+    '''Use the pinned node tree 
+
+    :type: bool
+    '''
+
+    shader_type: typing.Union[int, str] = None
+    '''Type of data to take shader from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_backdrop: bool = None
+    '''Use active Viewer Node output as backdrop for compositing nodes 
+
+    :type: bool
+    '''
+
+    show_grease_pencil: bool = None
+    '''Show grease pencil for this view 
+
+    :type: bool
+    '''
+
+    texture_type: typing.Union[int, str] = None
+    '''Type of data to take texture from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    tree_type: typing.Union[int, str] = None
+    '''Node tree type to display and edit 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_auto_render: bool = None
+    '''Re-render and composite changed layers on 3D edits 
+
+    :type: bool
+    '''
+
+    use_insert_offset: bool = None
+    '''Automatically offset the following or previous nodes in a chain when inserting a new node 
+
+    :type: bool
+    '''
+
+    def cursor_location_from_region(self, x: int, y: int):
+        '''Set the cursor location using region coordinates 
+
+        :param x: x, Region x coordinate 
+        :type x: int
+        :param y: y, Region y coordinate 
+        :type y: int
+        '''
+        pass
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceNodeEditorPath:
+    '''Get the node tree path as a string '''
+
+    to_string: str = None
+    '''
+
+    :type: str
+    '''
+
+    def clear(self, ):
+        '''Reset the node tree path 
+
+        '''
+        pass
+
+    def start(self, node_tree: 'NodeTree'):
+        '''Set the root node tree 
+
+        :param node_tree: Node Tree 
+        :type node_tree: 'NodeTree'
+        '''
+        pass
+
+    def append(self, node_tree: 'NodeTree', node: 'Node' = None):
+        '''Append a node group tree to the path 
+
+        :param node_tree: Node Tree, Node tree to append to the node editor path 
+        :type node_tree: 'NodeTree'
+        :param node: Node, Group node linking to this node tree 
+        :type node: 'Node'
+        '''
+        pass
+
+    def pop(self, ):
+        '''Remove the last node tree from the path 
+
+        '''
+        pass
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceOutliner:
+    '''Outliner space data '''
+
+    display_mode: typing.Union[int, str] = None
+    '''Type of information to display 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filter_text: str = None
+    '''Live search filtering string 
+
+    :type: str
+    '''
+
+    show_restrict_columns: bool = None
+    '''Show column 
+
+    :type: bool
+    '''
+
+    use_filter_case_sensitive: bool = None
+    '''Only use case sensitive matches of search string 
+
+    :type: bool
+    '''
+
+    use_filter_complete: bool = None
+    '''Only use complete matches of search string 
+
+    :type: bool
+    '''
+
+    use_sort_alpha: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceProperties:
+    '''Properties space data '''
+
+    align: typing.Union[int, str] = None
+    '''Arrangement of the panels 
+
+    :type: typing.Union[int, str]
+    '''
+
+    context: typing.Union[int, str] = None
+    '''Type of active data to display and edit 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pin_id: 'ID' = None
+    '''
+
+    :type: 'ID'
+    '''
+
+    texture_context: typing.Union[int, str] = None
+    '''Type of texture data to display and edit 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_limited_texture_context: bool = None
+    '''Use the limited version of texture user (for ‘old shading’ mode) 
+
+    :type: bool
+    '''
+
+    use_pin_id: bool = None
+    '''Use the pinned context 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceSequenceEditor:
+    '''Sequence editor space data '''
+
+    display_channel: int = None
+    '''The channel number shown in the image preview. 0 is the result of all strips combined 
+
+    :type: int
+    '''
+
+    display_mode: typing.Union[int, str] = None
+    '''View mode to use for displaying sequencer output 
+
+    :type: typing.Union[int, str]
+    '''
+
+    draw_overexposed: int = None
+    '''Show overexposed areas with zebra stripes 
+
+    :type: int
+    '''
+
+    grease_pencil: 'GreasePencil' = None
+    '''Grease pencil data for this space 
+
+    :type: 'GreasePencil'
+    '''
+
+    overlay_type: typing.Union[int, str] = None
+    '''Overlay draw type 
+
+    :type: typing.Union[int, str]
+    '''
+
+    preview_channels: typing.Union[int, str] = None
+    '''Channels of the preview to draw 
+
+    :type: typing.Union[int, str]
+    '''
+
+    proxy_render_size: typing.Union[int, str] = None
+    '''Draw preview using full resolution or different proxy resolutions 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_backdrop: bool = None
+    '''Display result under strips 
+
+    :type: bool
+    '''
+
+    show_frame_indicator: bool = None
+    '''Show frame number beside the current frame indicator line 
+
+    :type: bool
+    '''
+
+    show_frames: bool = None
+    '''Draw frames rather than seconds 
+
+    :type: bool
+    '''
+
+    show_grease_pencil: bool = None
+    '''Show grease pencil for this view 
+
+    :type: bool
+    '''
+
+    show_metadata: bool = None
+    '''Show metadata of first visible strip 
+
+    :type: bool
+    '''
+
+    show_safe_areas: bool = None
+    '''Show TV title safe and action safe areas in preview 
+
+    :type: bool
+    '''
+
+    show_safe_center: bool = None
+    '''Show safe areas to fit content in a different aspect ratio 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    show_separate_color: bool = None
+    '''Separate color channels in preview 
+
+    :type: bool
+    '''
+
+    show_strip_offset: bool = None
+    '''Display strip in/out offsets 
+
+    :type: bool
+    '''
+
+    use_marker_sync: bool = None
+    '''Transform markers as well as strips 
+
+    :type: bool
+    '''
+
+    view_type: typing.Union[int, str] = None
+    '''Type of the Sequencer view (sequencer, preview or both) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    waveform_draw_type: typing.Union[int, str] = None
+    '''How Waveforms are drawn 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceTextEditor:
+    '''Text editor space data '''
+
+    find_text: str = None
+    '''Text to search for with the find tool 
+
+    :type: str
+    '''
+
+    font_size: int = None
+    '''Font size to use for displaying the text 
+
+    :type: int
+    '''
+
+    margin_column: int = None
+    '''Column number to show right margin at 
+
+    :type: int
+    '''
+
+    replace_text: str = None
+    '''Text to replace selected text with using the replace tool 
+
+    :type: str
+    '''
+
+    show_line_highlight: bool = None
+    '''Highlight the current line 
+
+    :type: bool
+    '''
+
+    show_line_numbers: bool = None
+    '''Show line numbers next to the text 
+
+    :type: bool
+    '''
+
+    show_margin: bool = None
+    '''Show right margin 
+
+    :type: bool
+    '''
+
+    show_syntax_highlight: bool = None
+    '''Syntax highlight for scripting 
+
+    :type: bool
+    '''
+
+    show_word_wrap: bool = None
+    '''Wrap words if there is not enough horizontal space 
+
+    :type: bool
+    '''
+
+    tab_width: int = None
+    '''Number of spaces to display tabs with 
+
+    :type: int
+    '''
+
+    text: 'Text' = None
+    '''Text displayed and edited in this space 
+
+    :type: 'Text'
+    '''
+
+    top: int = None
+    '''Top line visible 
+
+    :type: int
+    '''
+
+    use_find_all: bool = None
+    '''Search in all text data-blocks, instead of only the active one 
+
+    :type: bool
+    '''
+
+    use_find_wrap: bool = None
+    '''Search again from the start of the file when reaching the end 
+
+    :type: bool
+    '''
+
+    use_live_edit: bool = None
+    '''Run python while editing 
+
+    :type: bool
+    '''
+
+    use_match_case: bool = None
+    '''Search string is sensitive to uppercase and lowercase letters 
+
+    :type: bool
+    '''
+
+    use_overwrite: bool = None
+    '''Overwrite characters when typing rather than inserting them 
+
+    :type: bool
+    '''
+
+    visible_lines: int = None
+    '''Amount of lines that can be visible in current editor 
+
+    :type: int
+    '''
+
+    def region_location_from_cursor(self, line: int, column: int) -> int:
+        '''Retrieve the region position from the given line and character position 
+
+        :param line: Line, Line index 
+        :type line: int
+        :param column: Column, Column index 
+        :type column: int
+        :rtype: int
+        :return:  Region coordinates 
+        '''
+        pass
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceTimeline:
+    '''Timeline editor space data '''
+
+    cache_cloth: bool = None
+    '''Show the active object’s cloth point cache 
+
+    :type: bool
+    '''
+
+    cache_dynamicpaint: bool = None
+    '''Show the active object’s Dynamic Paint cache 
+
+    :type: bool
+    '''
+
+    cache_particles: bool = None
+    '''Show the active object’s particle point cache 
+
+    :type: bool
+    '''
+
+    cache_rigidbody: bool = None
+    '''Show the active object’s Rigid Body cache 
+
+    :type: bool
+    '''
+
+    cache_smoke: bool = None
+    '''Show the active object’s smoke cache 
+
+    :type: bool
+    '''
+
+    cache_softbody: bool = None
+    '''Show the active object’s softbody point cache 
+
+    :type: bool
+    '''
+
+    show_cache: bool = None
+    '''Show the status of cached frames in the timeline 
+
+    :type: bool
+    '''
+
+    show_frame_indicator: bool = None
+    '''Show frame number beside the current frame indicator line 
+
+    :type: bool
+    '''
+
+    show_seconds: bool = None
+    '''Show timing in seconds not frames 
+
+    :type: bool
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+
+class SpaceUVEditor:
+    '''UV editor data for the image editor space '''
+
+    draw_stretch_type: typing.Union[int, str] = None
+    '''Type of stretch to draw 
+
+    :type: typing.Union[int, str]
+    '''
+
+    edge_draw_type: typing.Union[int, str] = None
+    '''Draw type for drawing UV edges 
+
+    :type: typing.Union[int, str]
+    '''
+
+    lock_bounds: bool = None
+    '''Constraint to stay within the image bounds while editing 
+
+    :type: bool
+    '''
+
+    other_uv_filter: typing.Union[int, str] = None
+    '''Filter applied on the other object’s UV to limit displayed 
+
+    :type: typing.Union[int, str]
+    '''
+
+    show_faces: bool = None
+    '''Draw faces over the image 
+
+    :type: bool
+    '''
+
+    show_metadata: bool = None
+    '''Draw metadata properties of the image 
+
+    :type: bool
+    '''
+
+    show_modified_edges: bool = None
+    '''Draw edges after modifiers are applied 
+
+    :type: bool
+    '''
+
+    show_normalized_coords: bool = None
+    '''Display UV coordinates from 0.0 to 1.0 rather than in pixels 
+
+    :type: bool
+    '''
+
+    show_other_objects: bool = None
+    '''Draw other selected objects that share the same image 
+
+    :type: bool
+    '''
+
+    show_smooth_edges: bool = None
+    '''Draw UV edges anti-aliased 
+
+    :type: bool
+    '''
+
+    show_stretch: bool = None
+    '''Draw faces colored according to the difference in shape between UVs and their 3D coordinates (blue for low distortion, red for high distortion) 
+
+    :type: bool
+    '''
+
+    show_texpaint: bool = None
+    '''Draw overlay of texture paint uv layer 
+
+    :type: bool
+    '''
+
+    sticky_select_mode: typing.Union[int, str] = None
+    '''Automatically select also UVs sharing the same vertex as the ones being selected 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_live_unwrap: bool = None
+    '''Continuously unwrap the selected UV island while transforming pinned vertices 
+
+    :type: bool
+    '''
+
+    use_snap_to_pixels: bool = None
+    '''Snap UVs to pixel locations while editing 
+
+    :type: bool
+    '''
+
+
+class SpaceUserPreferences:
+    '''User preferences space data '''
+
+    filter_text: str = None
+    '''Search term for filtering in the UI 
+
+    :type: str
+    '''
+
+    filter_type: typing.Union[int, str] = None
+    '''Filter method 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SpaceView3D:
+    '''3D View space data '''
+
+    active_layer: int = None
+    '''Active 3D view layer index 
+
+    :type: int
+    '''
+
+    background_images: typing.List['BackgroundImage'] = None
+    '''List of background images 
+
+    :type: typing.List['BackgroundImage']
+    '''
+
+    camera: 'Object' = None
+    '''Active camera used in this view (when unlocked from the scene’s active camera) 
+
+    :type: 'Object'
+    '''
+
+    clip_end: float = None
+    '''3D View far clipping distance 
+
+    :type: float
+    '''
+
+    clip_start: float = None
+    '''3D View near clipping distance (perspective view only) 
+
+    :type: float
+    '''
+
+    current_orientation: 'TransformOrientation' = None
+    '''Current transformation orientation 
+
+    :type: 'TransformOrientation'
+    '''
+
+    cursor_location: float = None
+    '''3D cursor location for this view (dependent on local view setting) 
+
+    :type: float
+    '''
+
+    fx_settings: 'GPUFXSettings' = None
+    '''Options used for real time compositing 
+
+    :type: 'GPUFXSettings'
+    '''
+
+    grid_lines: int = None
+    '''Number of grid lines to display in perspective view 
+
+    :type: int
+    '''
+
+    grid_scale: float = None
+    '''Distance between 3D View grid lines 
+
+    :type: float
+    '''
+
+    grid_scale_unit: float = None
+    '''Grid cell size scaled by scene unit system settings 
+
+    :type: float
+    '''
+
+    grid_subdivisions: int = None
+    '''Number of subdivisions between grid lines 
+
+    :type: int
+    '''
+
+    layers: bool = None
+    '''Layers visible in this 3D View 
+
+    :type: bool
+    '''
+
+    layers_local_view: bool = None
+    '''Local view layers visible in this 3D View 
+
+    :type: bool
+    '''
+
+    layers_used: bool = None
+    '''Layers that contain something 
+
+    :type: bool
+    '''
+
+    lens: float = None
+    '''Viewport lens angle 
+
+    :type: float
+    '''
+
+    local_view: 'SpaceView3D' = None
+    '''Display an isolated sub-set of objects, apart from the scene visibility 
+
+    :type: 'SpaceView3D'
+    '''
+
+    lock_bone: str = None
+    '''3D View center is locked to this bone’s position 
+
+    :type: str
+    '''
+
+    lock_camera: bool = None
+    '''Enable view navigation within the camera view 
+
+    :type: bool
+    '''
+
+    lock_camera_and_layers: bool = None
+    '''Use the scene’s active camera and layers in this view, rather than local layers 
+
+    :type: bool
+    '''
+
+    lock_cursor: bool = None
+    '''3D View center is locked to the cursor’s position 
+
+    :type: bool
+    '''
+
+    lock_object: 'Object' = None
+    '''3D View center is locked to this object’s position 
+
+    :type: 'Object'
+    '''
+
+    matcap_icon: typing.Union[int, str] = None
+    '''Image to use for Material Capture, active objects only 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pivot_point: typing.Union[int, str] = None
+    '''Pivot center for rotation/scaling 
+
+    :type: typing.Union[int, str]
+    '''
+
+    region_3d: 'RegionView3D' = None
+    '''3D region in this space, in case of quad view the camera region 
+
+    :type: 'RegionView3D'
+    '''
+
+    region_quadviews: typing.List['RegionView3D'] = None
+    '''3D regions (the third one defines quad view settings, the fourth one is same as ‘region_3d’) 
+
+    :type: typing.List['RegionView3D']
+    '''
+
+    render_border_max_x: float = None
+    '''Maximum X value for the render border 
+
+    :type: float
+    '''
+
+    render_border_max_y: float = None
+    '''Maximum Y value for the render border 
+
+    :type: float
+    '''
+
+    render_border_min_x: float = None
+    '''Minimum X value for the render border 
+
+    :type: float
+    '''
+
+    render_border_min_y: float = None
+    '''Minimum Y value for the render border 
+
+    :type: float
+    '''
+
+    show_all_objects_origin: bool = None
+    '''Show the object origin center dot for all (selected and unselected) objects 
+
+    :type: bool
+    '''
+
+    show_axis_x: bool = None
+    '''Show the X axis line in perspective view 
+
+    :type: bool
+    '''
+
+    show_axis_y: bool = None
+    '''Show the Y axis line in perspective view 
+
+    :type: bool
+    '''
+
+    show_axis_z: bool = None
+    '''Show the Z axis line in perspective view 
+
+    :type: bool
+    '''
+
+    show_backface_culling: bool = None
+    '''Use back face culling to hide the back side of faces 
+
+    :type: bool
+    '''
+
+    show_background_images: bool = None
+    '''Display reference images behind objects in the 3D View 
+
+    :type: bool
+    '''
+
+    show_bundle_names: bool = None
+    '''Show names for reconstructed tracks objects 
+
+    :type: bool
+    '''
+
+    show_camera_path: bool = None
+    '''Show reconstructed camera path 
+
+    :type: bool
+    '''
+
+    show_floor: bool = None
+    '''Show the ground plane grid in perspective view 
+
+    :type: bool
+    '''
+
+    show_grease_pencil: bool = None
+    '''Show grease pencil for this view 
+
+    :type: bool
+    '''
+
+    show_manipulator: bool = None
+    '''Use a 3D manipulator widget for controlling transforms 
+
+    :type: bool
+    '''
+
+    show_occlude_wire: bool = None
+    '''Use hidden wireframe display 
+
+    :type: bool
+    '''
+
+    show_only_render: bool = None
+    '''Display only objects which will be rendered 
+
+    :type: bool
+    '''
+
+    show_outline_selected: bool = None
+    '''Show an outline highlight around selected objects in non-wireframe views 
+
+    :type: bool
+    '''
+
+    show_reconstruction: bool = None
+    '''Display reconstruction data from active movie clip 
+
+    :type: bool
+    '''
+
+    show_relationship_lines: bool = None
+    '''Show dashed lines indicating parent or constraint relationships 
+
+    :type: bool
+    '''
+
+    show_stereo_3d_cameras: bool = None
+    '''Show the left and right cameras 
+
+    :type: bool
+    '''
+
+    show_stereo_3d_convergence_plane: bool = None
+    '''Show the stereo 3d convergence plane 
+
+    :type: bool
+    '''
+
+    show_stereo_3d_volume: bool = None
+    '''Show the stereo 3d frustum volume 
+
+    :type: bool
+    '''
+
+    show_textured_shadeless: bool = None
+    '''Show shadeless texture without lighting in textured draw mode 
+
+    :type: bool
+    '''
+
+    show_textured_solid: bool = None
+    '''Display face-assigned textures in solid view 
+
+    :type: bool
+    '''
+
+    show_world: bool = None
+    '''Display world colors in the background 
+
+    :type: bool
+    '''
+
+    stereo_3d_camera: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    stereo_3d_convergence_plane_alpha: float = None
+    '''Opacity (alpha) of the convergence plane 
+
+    :type: float
+    '''
+
+    stereo_3d_eye: typing.Union[int, str] = None
+    '''Current stereo eye being drawn 
+
+    :type: typing.Union[int, str]
+    '''
+
+    stereo_3d_volume_alpha: float = None
+    '''Opacity (alpha) of the cameras’ frustum volume 
+
+    :type: float
+    '''
+
+    tracks_draw_size: float = None
+    '''Display size of tracks from reconstructed data 
+
+    :type: float
+    '''
+
+    tracks_draw_type: typing.Union[int, str] = None
+    '''Viewport display style for tracks 
+
+    :type: typing.Union[int, str]
+    '''
+
+    transform_manipulators: typing.Set[typing.Union[int, str]] = None
+    '''Transformation manipulators 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    transform_orientation: typing.Union[int, str] = None
+    '''Transformation orientation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_matcap: bool = None
+    '''Active Objects draw images mapped on normals, enhancing Solid Draw Mode 
+
+    :type: bool
+    '''
+
+    use_occlude_geometry: bool = None
+    '''Limit selection to visible (clipped with depth buffer) 
+
+    :type: bool
+    '''
+
+    use_pivot_point_align: bool = None
+    '''Manipulate center points (object, pose and weight paint mode only) 
+
+    :type: bool
+    '''
+
+    use_render_border: bool = None
+    '''Use a region within the frame size for rendered viewport (when not viewing through the camera) 
+
+    :type: bool
+    '''
+
+    viewport_shade: typing.Union[int, str] = None
+    '''Method to display/shade objects in the 3D View 
+
+    :type: typing.Union[int, str]
+    '''
+
+    def draw_handler_add(self, ):
+        '''Undocumented 
+
+        '''
+        pass
+
+    def draw_handler_remove(self, ):
+        '''Undocumented 
+
+        '''
+        pass
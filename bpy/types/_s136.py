@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Speaker:
+    '''Speaker data-block for 3D audio speaker objects '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    attenuation: float = None
+    '''How strong the distance affects volume, depending on distance model 
+
+    :type: float
+    '''
+
+    cone_angle_inner: float = None
+    '''Angle of the inner cone, in degrees, inside the cone the volume is 100 % 
+
+    :type: float
+    '''
+
+    cone_angle_outer: float = None
+    '''Angle of the outer cone, in degrees, outside this cone the volume is the outer cone volume, between inner and outer cone the volume is interpolated 
+
+    :type: float
+    '''
+
+    cone_volume_outer: float = None
+    '''Volume outside the outer cone 
+
+    :type: float
+    '''
+
+    distance_max: float = None
+    '''Maximum distance for volume calculation, no matter how far away the object is 
+
+    :type: float
+    '''
+
+    distance_reference: float = None
+    '''Reference distance at which volume is 100 % 
+
+    :type: float
+    '''
+
+    muted: bool = None
+    '''Mute the speaker 
+
+    :type: bool
+    '''
+
+    pitch: float = None
+    '''Playback pitch of the sound 
+
+    :type: float
+    '''
+
+    relative: bool = None
+    '''Whether the source is relative to the camera or not 
+
+    :type: bool
+    '''
+
+    sound: 'Sound' = None
+    '''Sound data-block used by this speaker 
+
+    :type: 'Sound'
+    '''
+
+    volume: float = None
+    '''How loud the sound is 
+
+    :type: float
+    '''
+
+    volume_max: float = None
+    '''Maximum volume, no matter how near the object is 
+
+    :type: float
+    '''
+
+    volume_min: float = None
+    '''Minimum volume, no matter how far away the object is 
+
+    :type: float
+    '''
+
+
+class SpeedControlSequence:
+    '''Sequence strip to control the speed of other strips '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    multiply_speed: float = None
+    '''Multiply the resulting speed after the speed factor 
+
+    :type: float
+    '''
+
+    scale_to_length: bool = None
+    '''Scale values from 0.0 to 1.0 to target sequence length 
+
+    :type: bool
+    '''
+
+    use_as_speed: bool = None
+    '''Interpret the value as speed instead of a frame number 
+
+    :type: bool
+    '''
+
+
+class Spline:
+    '''Element of a curve, either NURBS, Bezier or Polyline or a character with text objects '''
+
+    bezier_points: typing.List['BezierSplinePoint'] = None
+    '''Collection of points for Bezier curves only 
+
+    :type: typing.List['BezierSplinePoint']
+    '''
+
+    character_index: int = None
+    '''Location of this character in the text data (only for text curves) 
+
+    :type: int
+    '''
+
+    hide: bool = None
+    '''Hide this curve in Edit mode 
+
+    :type: bool
+    '''
+
+    material_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    order_u: int = None
+    '''NURBS order in the U direction (for splines and surfaces, higher values let points influence a greater area) 
+
+    :type: int
+    '''
+
+    order_v: int = None
+    '''NURBS order in the V direction (for surfaces only, higher values let points influence a greater area) 
+
+    :type: int
+    '''
+
+    point_count_u: int = None
+    '''Total number points for the curve or surface in the U direction 
+
+    :type: int
+    '''
+
+    point_count_v: int = None
+    '''Total number points for the surface on the V direction 
+
+    :type: int
+    '''
+
+    points: typing.List['SplinePoints'] = None
+    '''Collection of points that make up this poly or nurbs spline 
+
+    :type: typing.List['SplinePoints']
+    '''
+
+    radius_interpolation: typing.Union[int, str] = None
+    '''The type of radius interpolation for Bezier curves 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution_u: int = None
+    '''Curve or Surface subdivisions per segment 
+
+    :type: int
+    '''
+
+    resolution_v: int = None
+    '''Surface subdivisions per segment 
+
+    :type: int
+    '''
+
+    tilt_interpolation: typing.Union[int, str] = None
+    '''The type of tilt interpolation for 3D, Bezier curves 
+
+    :type: typing.Union[int, str]
+    '''
+
+    type: typing.Union[int, str] = None
+    '''The interpolation type for this curve element 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_bezier_u: bool = None
+    '''Make this nurbs curve or surface act like a Bezier spline in the U direction (Order U must be 3 or 4, Cyclic U must be disabled) 
+
+    :type: bool
+    '''
+
+    use_bezier_v: bool = None
+    '''Make this nurbs surface act like a Bezier spline in the V direction (Order V must be 3 or 4, Cyclic V must be disabled) 
+
+    :type: bool
+    '''
+
+    use_cyclic_u: bool = None
+    '''Make this curve or surface a closed loop in the U direction 
+
+    :type: bool
+    '''
+
+    use_cyclic_v: bool = None
+    '''Make this surface a closed loop in the V direction 
+
+    :type: bool
+    '''
+
+    use_endpoint_u: bool = None
+    '''Make this nurbs curve or surface meet the endpoints in the U direction (Cyclic U must be disabled) 
+
+    :type: bool
+    '''
+
+    use_endpoint_v: bool = None
+    '''Make this nurbs surface meet the endpoints in the V direction (Cyclic V must be disabled) 
+
+    :type: bool
+    '''
+
+    use_smooth: bool = None
+    '''Smooth the normals of the surface or beveled curve 
+
+    :type: bool
+    '''
+
+
+class SplineBezierPoints:
+    '''Collection of spline Bezier points '''
+
+    def add(self, count: int = 1):
+        '''Add a number of points to this spline 
+
+        :param count: Number, Number of points to add to the spline 
+        :type count: int
+        '''
+        pass
+
+
+class SplineIKConstraint:
+    '''Align ‘n’ bones along a curve '''
+
+    bulge: float = None
+    '''Factor between volume variation and stretching 
+
+    :type: float
+    '''
+
+    bulge_max: float = None
+    '''Maximum volume stretching factor 
+
+    :type: float
+    '''
+
+    bulge_min: float = None
+    '''Minimum volume stretching factor 
+
+    :type: float
+    '''
+
+    bulge_smooth: float = None
+    '''Strength of volume stretching clamping 
+
+    :type: float
+    '''
+
+    chain_count: int = None
+    '''How many bones are included in the chain 
+
+    :type: int
+    '''
+
+    joint_bindings: float = None
+    '''(EXPERIENCED USERS ONLY) The relative positions of the joints along the chain, as percentages 
+
+    :type: float
+    '''
+
+    target: 'Object' = None
+    '''Curve that controls this relationship 
+
+    :type: 'Object'
+    '''
+
+    use_bulge_max: bool = None
+    '''Use upper limit for volume variation 
+
+    :type: bool
+    '''
+
+    use_bulge_min: bool = None
+    '''Use lower limit for volume variation 
+
+    :type: bool
+    '''
+
+    use_chain_offset: bool = None
+    '''Offset the entire chain relative to the root joint 
+
+    :type: bool
+    '''
+
+    use_curve_radius: bool = None
+    '''Average radius of the endpoints is used to tweak the X and Z Scaling of the bones, on top of XZ Scale mode 
+
+    :type: bool
+    '''
+
+    use_even_divisions: bool = None
+    '''Ignore the relative lengths of the bones when fitting to the curve 
+
+    :type: bool
+    '''
+
+    use_y_stretch: bool = None
+    '''Stretch the Y axis of the bones to fit the curve 
+
+    :type: bool
+    '''
+
+    xz_scale_mode: typing.Union[int, str] = None
+    '''Method used for determining the scaling of the X and Z axes of the bones 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class SplinePoint:
+    '''Spline point without handles '''
+
+    co: float = None
+    '''Point coordinates 
+
+    :type: float
+    '''
+
+    hide: bool = None
+    '''Visibility status 
+
+    :type: bool
+    '''
+
+    radius: float = None
+    '''Radius for beveling 
+
+    :type: float
+    '''
+
+    select: bool = None
+    '''Selection status 
+
+    :type: bool
+    '''
+
+    tilt: float = None
+    '''Tilt in 3D View 
+
+    :type: float
+    '''
+
+    weight: float = None
+    '''NURBS weight 
+
+    :type: float
+    '''
+
+    weight_softbody: float = None
+    '''Softbody goal weight 
+
+    :type: float
+    '''
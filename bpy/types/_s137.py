@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SplinePoints:
+    '''Collection of spline points '''
+
+    def add(self, count: int = 1):
+        '''Add a number of points to this spline 
+
+        :param count: Number, Number of points to add to the spline 
+        :type count: int
+        '''
+        pass
+
+
+class SpotLamp:
+    '''Directional cone lamp '''
+
+    compression_threshold: float = None
+    '''Deep shadow map compression threshold 
+
+    :type: float
+    '''
+
+    constant_coefficient: float = None
+    '''Constant distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    falloff_curve: 'CurveMapping' = None
+    '''Custom Lamp Falloff Curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''Intensity Decay with distance 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ge_shadow_buffer_type: typing.Union[int, str] = None
+    '''The shadow mapping algorithm used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    halo_intensity: float = None
+    '''Brightness of the spotlight’s halo cone 
+
+    :type: float
+    '''
+
+    halo_step: int = None
+    '''Volumetric halo sampling frequency 
+
+    :type: int
+    '''
+
+    linear_attenuation: float = None
+    '''Linear distance attenuation 
+
+    :type: float
+    '''
+
+    linear_coefficient: float = None
+    '''Linear distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    quadratic_attenuation: float = None
+    '''Quadratic distance attenuation 
+
+    :type: float
+    '''
+
+    quadratic_coefficient: float = None
+    '''Quadratic distance attenuation coefficient 
+
+    :type: float
+    '''
+
+    shadow_adaptive_threshold: float = None
+    '''Threshold for Adaptive Sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    shadow_buffer_bias: float = None
+    '''Shadow buffer sampling bias 
+
+    :type: float
+    '''
+
+    shadow_buffer_bleed_bias: float = None
+    '''Bias for reducing light-bleed on variance shadow maps 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_end: float = None
+    '''Shadow map clip end, beyond which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_start: float = None
+    '''Shadow map clip start, below which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_samples: int = None
+    '''Number of shadow buffer samples 
+
+    :type: int
+    '''
+
+    shadow_buffer_size: int = None
+    '''Resolution of the shadow buffer, higher values give crisper shadows but use more memory 
+
+    :type: int
+    '''
+
+    shadow_buffer_soft: float = None
+    '''Size of shadow buffer sampling area 
+
+    :type: float
+    '''
+
+    shadow_buffer_type: typing.Union[int, str] = None
+    '''Type of shadow buffer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_color: float = None
+    '''Color of shadows cast by the lamp 
+
+    :type: float
+    '''
+
+    shadow_filter_type: typing.Union[int, str] = None
+    '''Type of shadow filter (Buffer Shadows) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_sample_method: typing.Union[int, str] = None
+    '''Method for generating shadow samples: Adaptive QMC is fastest, Constant QMC is less noisy but slower 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_samples: int = None
+    '''Number of samples taken extra (samples x samples) 
+
+    :type: int
+    '''
+
+    shadow_sample_buffers: typing.Union[int, str] = None
+    '''Number of shadow buffers to render for better AA, this increases memory usage 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_soft_size: float = None
+    '''Light size for ray shadow sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    show_cone: bool = None
+    '''Draw transparent cone in 3D view to visualize which objects are contained in it 
+
+    :type: bool
+    '''
+
+    spot_blend: float = None
+    '''The softness of the spotlight edge 
+
+    :type: float
+    '''
+
+    spot_size: float = None
+    '''Angle of the spotlight beam 
+
+    :type: float
+    '''
+
+    use_auto_clip_end: bool = None
+    '''Automatic calculation of clipping-end, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_auto_clip_start: bool = None
+    '''Automatic calculation of clipping-start, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_halo: bool = None
+    '''Render spotlight with a volumetric halo 
+
+    :type: bool
+    '''
+
+    use_only_shadow: bool = None
+    '''Cast shadows only, without illuminating objects 
+
+    :type: bool
+    '''
+
+    use_shadow: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_shadow_layer: bool = None
+    '''Objects on the same layers only cast shadows 
+
+    :type: bool
+    '''
+
+    use_sphere: bool = None
+    '''Set light intensity to zero beyond lamp distance 
+
+    :type: bool
+    '''
+
+    use_square: bool = None
+    '''Cast a square spot light shape 
+
+    :type: bool
+    '''
+
+
+class StateActuator:
+    '''Actuator to handle states '''
+
+    operation: typing.Union[int, str] = None
+    '''Select the bit operation on object state mask 
+
+    :type: typing.Union[int, str]
+    '''
+
+    states: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class SteeringActuator:
+    acceleration: float = None
+    '''Max acceleration 
+
+    :type: float
+    '''
+
+    distance: float = None
+    '''Relax distance 
+
+    :type: float
+    '''
+
+    facing: bool = None
+    '''Enable automatic facing 
+
+    :type: bool
+    '''
+
+    facing_axis: typing.Union[int, str] = None
+    '''Axis for automatic facing 
+
+    :type: typing.Union[int, str]
+    '''
+
+    lock_z_velocity: bool = None
+    '''Disable simulation of linear motion along Z axis 
+
+    :type: bool
+    '''
+
+    mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    navmesh: 'Object' = None
+    '''Navigation mesh 
+
+    :type: 'Object'
+    '''
+
+    normal_up: bool = None
+    '''Use normal of the navmesh to set “UP” vector 
+
+    :type: bool
+    '''
+
+    self_terminated: bool = None
+    '''Terminate when target is reached 
+
+    :type: bool
+    '''
+
+    show_visualization: bool = None
+    '''Enable debug visualization for ‘Path following’ 
+
+    :type: bool
+    '''
+
+    target: 'Object' = None
+    '''Target object 
+
+    :type: 'Object'
+    '''
+
+    turn_speed: float = None
+    '''Max turn speed 
+
+    :type: float
+    '''
+
+    update_period: int = None
+    '''Path update period 
+
+    :type: int
+    '''
+
+    velocity: float = None
+    '''Velocity magnitude 
+
+    :type: float
+    '''
+
+
+class Stereo3dDisplay:
+    '''Settings for stereo 3D display '''
+
+    anaglyph_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    display_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    interlace_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_interlace_swap: bool = None
+    '''Swap left and right stereo channels 
+
+    :type: bool
+    '''
+
+    use_sidebyside_crosseyed: bool = None
+    '''Right eye should see left image and vice-versa 
+
+    :type: bool
+    '''
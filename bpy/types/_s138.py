@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Stereo3dFormat:
+    '''Settings for stereo output '''
+
+    anaglyph_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    display_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    interlace_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_interlace_swap: bool = None
+    '''Swap left and right stereo channels 
+
+    :type: bool
+    '''
+
+    use_sidebyside_crosseyed: bool = None
+    '''Right eye should see left image and vice-versa 
+
+    :type: bool
+    '''
+
+    use_squeezed_frame: bool = None
+    '''Combine both views in a squeezed image 
+
+    :type: bool
+    '''
+
+
+class StretchToConstraint:
+    '''Stretch to meet the target object '''
+
+    bulge: float = None
+    '''Factor between volume variation and stretching 
+
+    :type: float
+    '''
+
+    bulge_max: float = None
+    '''Maximum volume stretching factor 
+
+    :type: float
+    '''
+
+    bulge_min: float = None
+    '''Minimum volume stretching factor 
+
+    :type: float
+    '''
+
+    bulge_smooth: float = None
+    '''Strength of volume stretching clamping 
+
+    :type: float
+    '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    keep_axis: typing.Union[int, str] = None
+    '''Axis to maintain during stretch 
+
+    :type: typing.Union[int, str]
+    '''
+
+    rest_length: float = None
+    '''Length at rest position 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+    use_bulge_max: bool = None
+    '''Use upper limit for volume variation 
+
+    :type: bool
+    '''
+
+    use_bulge_min: bool = None
+    '''Use lower limit for volume variation 
+
+    :type: bool
+    '''
+
+    volume: typing.Union[int, str] = None
+    '''Maintain the object’s volume as it stretches 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class StringProperty:
+    '''RNA text string property definition '''
+
+    default: str = None
+    '''string default value 
+
+    :type: str
+    '''
+
+    length_max: int = None
+    '''Maximum length of the string, 0 means unlimited 
+
+    :type: int
+    '''
+
+
+class Struct:
+    '''RNA structure definition '''
+
+    base: 'Struct' = None
+    '''Struct definition this is derived from 
+
+    :type: 'Struct'
+    '''
+
+    description: str = None
+    '''Description of the Struct’s purpose 
+
+    :type: str
+    '''
+
+    functions: typing.List['Function'] = None
+    '''
+
+    :type: typing.List['Function']
+    '''
+
+    identifier: str = None
+    '''Unique name used in the code and scripting 
+
+    :type: str
+    '''
+
+    name: str = None
+    '''Human readable name 
+
+    :type: str
+    '''
+
+    name_property: 'StringProperty' = None
+    '''Property that gives the name of the struct 
+
+    :type: 'StringProperty'
+    '''
+
+    nested: 'Struct' = None
+    '''Struct in which this struct is always nested, and to which it logically belongs 
+
+    :type: 'Struct'
+    '''
+
+    properties: typing.List['Property'] = None
+    '''Properties in the struct 
+
+    :type: typing.List['Property']
+    '''
+
+    translation_context: str = None
+    '''Translation context of the struct’s name 
+
+    :type: str
+    '''
+
+
+class StucciTexture:
+    '''Procedural noise texture '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    noise_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    stucci_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    turbulence: float = None
+    '''Turbulence of the noise 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class SubsurfModifier:
+    '''Subdivision surface modifier '''
+
+    levels: int = None
+    '''Number of subdivisions to perform 
+
+    :type: int
+    '''
+
+    render_levels: int = None
+    '''Number of subdivisions to perform when rendering 
+
+    :type: int
+    '''
+
+    show_only_control_edges: bool = None
+    '''Skip drawing/rendering of interior subdivided edges 
+
+    :type: bool
+    '''
+
+    subdivision_type: typing.Union[int, str] = None
+    '''Select type of subdivision algorithm 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_opensubdiv: bool = None
+    '''Use OpenSubdiv for the subdivisions (viewport only) 
+
+    :type: bool
+    '''
+
+    use_subsurf_uv: bool = None
+    '''Use subsurf to subdivide UVs 
+
+    :type: bool
+    '''
+
+
+class SubtractSequence:
+    '''Subtract Sequence '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class SunLamp:
+    '''Constant direction parallel ray lamp '''
+
+    compression_threshold: float = None
+    '''Deep shadow map compression threshold 
+
+    :type: float
+    '''
+
+    ge_shadow_buffer_type: typing.Union[int, str] = None
+    '''The shadow mapping algorithm used 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_adaptive_threshold: float = None
+    '''Threshold for Adaptive Sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    shadow_buffer_bias: float = None
+    '''Shadow buffer sampling bias 
+
+    :type: float
+    '''
+
+    shadow_buffer_bleed_bias: float = None
+    '''Bias for reducing light-bleed on variance shadow maps 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_end: float = None
+    '''Shadow map clip end, beyond which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_clip_start: float = None
+    '''Shadow map clip start, below which objects will not generate shadows 
+
+    :type: float
+    '''
+
+    shadow_buffer_samples: int = None
+    '''Number of shadow buffer samples 
+
+    :type: int
+    '''
+
+    shadow_buffer_size: int = None
+    '''Resolution of the shadow buffer, higher values give crisper shadows but use more memory 
+
+    :type: int
+    '''
+
+    shadow_buffer_soft: float = None
+    '''Size of shadow buffer sampling area 
+
+    :type: float
+    '''
+
+    shadow_buffer_type: typing.Union[int, str] = None
+    '''Type of shadow buffer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_color: float = None
+    '''Color of shadows cast by the lamp 
+
+    :type: float
+    '''
+
+    shadow_filter_type: typing.Union[int, str] = None
+    '''Type of shadow filter (Buffer Shadows) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_frustum_size: float = None
+    '''Size of the frustum used for creating the shadow map 
+
+    :type: float
+    '''
+
+    shadow_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_sample_method: typing.Union[int, str] = None
+    '''Method for generating shadow samples: Adaptive QMC is fastest, Constant QMC is less noisy but slower 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_ray_samples: int = None
+    '''Number of samples taken extra (samples x samples) 
+
+    :type: int
+    '''
+
+    shadow_sample_buffers: typing.Union[int, str] = None
+    '''Number of shadow buffers to render for better AA, this increases memory usage 
+
+    :type: typing.Union[int, str]
+    '''
+
+    shadow_soft_size: float = None
+    '''Light size for ray shadow sampling (Raytraced shadows) 
+
+    :type: float
+    '''
+
+    show_shadow_box: bool = None
+    '''Draw a box in 3D view to visualize which objects are contained in it 
+
+    :type: bool
+    '''
+
+    sky: 'LampSkySettings' = None
+    '''Sky related settings for sun lamps 
+
+    :type: 'LampSkySettings'
+    '''
+
+    use_auto_clip_end: bool = None
+    '''Automatic calculation of clipping-end, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_auto_clip_start: bool = None
+    '''Automatic calculation of clipping-start, based on visible vertices 
+
+    :type: bool
+    '''
+
+    use_only_shadow: bool = None
+    '''Cast shadows only, without illuminating objects 
+
+    :type: bool
+    '''
+
+    use_shadow: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_shadow_layer: bool = None
+    '''Objects on the same layers only cast shadows 
+
+    :type: bool
+    '''
+
+
+class SurfaceCurve:
+    '''Curve data-block used for storing surfaces '''
+
+    use_uv_as_generated: bool = None
+    '''Uses the UV values as Generated textured coordinates 
+
+    :type: bool
+    '''
+
+
+class SurfaceDeformModifier:
+    falloff: float = None
+    '''Controls how much nearby polygons influence deformation 
+
+    :type: float
+    '''
+
+    is_bound: bool = None
+    '''Whether geometry has been bound to target mesh 
+
+    :type: bool
+    '''
+
+    target: 'Object' = None
+    '''Mesh object to deform with 
+
+    :type: 'Object'
+    '''
+
+
+class SurfaceModifier:
+    '''Surface modifier defining modifier stack position used for surface fields '''
+
+    pass
+
+
+class TEXTURE_UL_texpaintslots:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class TEXTURE_UL_texslots:
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        '''
+
+        '''
+        pass
+
+
+class TessfaceUVTextures:
+    '''Collection of UV maps for tessellated faces '''
+
+    active: 'MeshTextureFaceLayer' = None
+    '''Active UV Map 
+
+    :type: 'MeshTextureFaceLayer'
+    '''
+
+    active_index: int = None
+    '''Active UV Map index 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "UVMap") -> 'MeshTextureFaceLayer':
+        '''Add a UV tessface-texture layer to Mesh (only for meshes with no polygons) 
+
+        :param name: UV map name 
+        :type name: str
+        :rtype: 'MeshTextureFaceLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class TexMapping:
+    '''Texture coordinate mapping settings '''
+
+    mapping: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_x: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_y: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    mapping_z: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    max: float = None
+    '''Maximum value for clipping 
+
+    :type: float
+    '''
+
+    min: float = None
+    '''Minimum value for clipping 
+
+    :type: float
+    '''
+
+    rotation: float = None
+    '''
+
+    :type: float
+    '''
+
+    scale: float = None
+    '''
+
+    :type: float
+    '''
+
+    translation: float = None
+    '''
+
+    :type: float
+    '''
+
+    use_max: bool = None
+    '''Whether to use maximum clipping value 
+
+    :type: bool
+    '''
+
+    use_min: bool = None
+    '''Whether to use minimum clipping value 
+
+    :type: bool
+    '''
+
+    vector_type: typing.Union[int, str] = None
+    '''Type of vector that the mapping transforms 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class TexPaintSlot:
+    '''Slot that contains information about texture painting '''
+
+    index: int = None
+    '''Index of MTex slot in the material 
+
+    :type: int
+    '''
+
+    uv_layer: str = None
+    '''Name of UV map 
+
+    :type: str
+    '''
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Text:
+    '''Text data-block referencing an external or packed text file '''
+
+    current_character: int = None
+    '''Index of current character in current line, and also start index of character in selection if one exists 
+
+    :type: int
+    '''
+
+    current_line: 'TextLine' = None
+    '''Current line, and start line of selection if one exists 
+
+    :type: 'TextLine'
+    '''
+
+    current_line_index: int = None
+    '''Index of current TextLine in TextLine collection 
+
+    :type: int
+    '''
+
+    filepath: str = None
+    '''Filename of the text file 
+
+    :type: str
+    '''
+
+    is_dirty: bool = None
+    '''Text file has been edited since last save 
+
+    :type: bool
+    '''
+
+    is_in_memory: bool = None
+    '''Text file is in memory, without a corresponding file on disk 
+
+    :type: bool
+    '''
+
+    is_modified: bool = None
+    '''Text file on disk is different than the one in memory 
+
+    :type: bool
+    '''
+
+    lines: typing.List['TextLine'] = None
+    '''Lines of text 
+
+    :type: typing.List['TextLine']
+    '''
+
+    select_end_character: int = None
+    '''Index of character after end of selection in the selection end line 
+
+    :type: int
+    '''
+
+    select_end_line: 'TextLine' = None
+    '''End line of selection 
+
+    :type: 'TextLine'
+    '''
+
+    use_module: bool = None
+    '''Register this text as a module on loading, Text name must end with “.py” 
+
+    :type: bool
+    '''
+
+    use_tabs_as_spaces: bool = None
+    '''Automatically converts all new tabs into spaces 
+
+    :type: bool
+    '''
+
+    users_logic = None
+    '''Logic bricks that use this text (readonly) '''
+
+    def clear(self, ):
+        '''clear the text block 
+
+        '''
+        pass
+
+    def write(self, text: str):
+        '''write text at the cursor location and advance to the end of the text block 
+
+        :param text: New text for this data-block 
+        :type text: str
+        '''
+        pass
+
+    def as_string(self, ):
+        '''Return the text as a string. 
+
+        '''
+        pass
+
+    def from_string(self, string):
+        '''Replace text with this string. 
+
+        '''
+        pass
+
+
+class TextBox:
+    '''Text bounding box for layout '''
+
+    height: float = None
+    '''
+
+    :type: float
+    '''
+
+    width: float = None
+    '''
+
+    :type: float
+    '''
+
+    x: float = None
+    '''
+
+    :type: float
+    '''
+
+    y: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class TextCharacterFormat:
+    '''Text character formatting settings '''
+
+    material_index: int = None
+    '''
+
+    :type: int
+    '''
+
+    use_bold: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_italic: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_small_caps: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_underline: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class TextCurve:
+    '''Curve data-block used for storing text '''
+
+    active_textbox: int = None
+    '''
+
+    :type: int
+    '''
+
+    align_x: typing.Union[int, str] = None
+    '''Text horizontal align from the object center 
+
+    :type: typing.Union[int, str]
+    '''
+
+    align_y: typing.Union[int, str] = None
+    '''Text vertical align from the object center 
+
+    :type: typing.Union[int, str]
+    '''
+
+    body: str = None
+    '''Content of this text object 
+
+    :type: str
+    '''
+
+    body_format: typing.List['TextCharacterFormat'] = None
+    '''Stores the style of each character 
+
+    :type: typing.List['TextCharacterFormat']
+    '''
+
+    edit_format: 'TextCharacterFormat' = None
+    '''Editing settings character formatting 
+
+    :type: 'TextCharacterFormat'
+    '''
+
+    family: str = None
+    '''Use Objects as font characters (give font objects a common name followed by the character they represent, eg. ‘family-a’, ‘family-b’, etc, set this setting to ‘family-‘, and turn on Vertex Duplication) 
+
+    :type: str
+    '''
+
+    follow_curve: 'Object' = None
+    '''Curve deforming text object 
+
+    :type: 'Object'
+    '''
+
+    font: 'VectorFont' = None
+    '''
+
+    :type: 'VectorFont'
+    '''
+
+    font_bold: 'VectorFont' = None
+    '''
+
+    :type: 'VectorFont'
+    '''
+
+    font_bold_italic: 'VectorFont' = None
+    '''
+
+    :type: 'VectorFont'
+    '''
+
+    font_italic: 'VectorFont' = None
+    '''
+
+    :type: 'VectorFont'
+    '''
+
+    offset_x: float = None
+    '''Horizontal offset from the object origin 
+
+    :type: float
+    '''
+
+    offset_y: float = None
+    '''Vertical offset from the object origin 
+
+    :type: float
+    '''
+
+    shear: float = None
+    '''Italic angle of the characters 
+
+    :type: float
+    '''
+
+    size: float = None
+    '''
+
+    :type: float
+    '''
+
+    small_caps_scale: float = None
+    '''Scale of small capitals 
+
+    :type: float
+    '''
+
+    space_character: float = None
+    '''
+
+    :type: float
+    '''
+
+    space_line: float = None
+    '''
+
+    :type: float
+    '''
+
+    space_word: float = None
+    '''
+
+    :type: float
+    '''
+
+    text_boxes: typing.List['TextBox'] = None
+    '''
+
+    :type: typing.List['TextBox']
+    '''
+
+    underline_height: float = None
+    '''
+
+    :type: float
+    '''
+
+    underline_position: float = None
+    '''Vertical position of underline 
+
+    :type: float
+    '''
+
+    use_fast_edit: bool = None
+    '''Don’t fill polygons while editing 
+
+    :type: bool
+    '''
+
+    use_uv_as_generated: bool = None
+    '''Uses the UV values as Generated textured coordinates 
+
+    :type: bool
+    '''
+
+
+class TextLine:
+    '''Line of text in a Text data-block '''
+
+    body: str = None
+    '''Text in the line 
+
+    :type: str
+    '''
+
+
+class TextSequence:
+    '''Sequence strip creating text '''
+
+    align_x: typing.Union[int, str] = None
+    '''Align the text along the X axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    align_y: typing.Union[int, str] = None
+    '''Align the image along the Y axis 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color: float = None
+    '''Text color 
+
+    :type: float
+    '''
+
+    font_size: int = None
+    '''Size of the text 
+
+    :type: int
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    location: float = None
+    '''Location of the text 
+
+    :type: float
+    '''
+
+    shadow_color: float = None
+    '''
+
+    :type: float
+    '''
+
+    text: str = None
+    '''Text that will be displayed 
+
+    :type: str
+    '''
+
+    use_shadow: bool = None
+    '''Draw text with shadow 
+
+    :type: bool
+    '''
+
+    wrap_width: float = None
+    '''Word wrap width as factor, zero disables 
+
+    :type: float
+    '''
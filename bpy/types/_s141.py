@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class Texture:
+    '''Texture data-block used by materials, lamps, worlds and brushes '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+    contrast: float = None
+    '''Adjust the contrast of the texture 
+
+    :type: float
+    '''
+
+    factor_blue: float = None
+    '''
+
+    :type: float
+    '''
+
+    factor_green: float = None
+    '''
+
+    :type: float
+    '''
+
+    factor_red: float = None
+    '''
+
+    :type: float
+    '''
+
+    intensity: float = None
+    '''Adjust the brightness of the texture 
+
+    :type: float
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Node tree for node-based textures 
+
+    :type: 'NodeTree'
+    '''
+
+    saturation: float = None
+    '''Adjust the saturation of colors in the texture 
+
+    :type: float
+    '''
+
+    type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_clamp: bool = None
+    '''Set negative texture RGB and intensity values to zero, for some uses like displacement this option can be disabled to get the full range 
+
+    :type: bool
+    '''
+
+    use_color_ramp: bool = None
+    '''Toggle color ramp operations 
+
+    :type: bool
+    '''
+
+    use_nodes: bool = None
+    '''Make this a node-based texture 
+
+    :type: bool
+    '''
+
+    use_preview_alpha: bool = None
+    '''Show Alpha in Preview Render 
+
+    :type: bool
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+    def evaluate(self, value) -> float:
+        '''Evaluate the texture at the coordinates given 
+
+        :rtype: float
+        :return:  Result 
+        '''
+        pass
+
+
+class TextureNode:
+    pass
+
+
+class TextureNodeAt:
+    pass
+
+
+class TextureNodeBricks:
+    offset: float = None
+    '''
+
+    :type: float
+    '''
+
+    offset_frequency: int = None
+    '''Offset every N rows 
+
+    :type: int
+    '''
+
+    squash: float = None
+    '''
+
+    :type: float
+    '''
+
+    squash_frequency: int = None
+    '''Squash every N rows 
+
+    :type: int
+    '''
+
+
+class TextureNodeChecker:
+    pass
+
+
+class TextureNodeCompose:
+    pass
+
+
+class TextureNodeCoordinates:
+    pass
+
+
+class TextureNodeCurveRGB:
+    mapping: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+
+class TextureNodeCurveTime:
+    curve: 'CurveMapping' = None
+    '''
+
+    :type: 'CurveMapping'
+    '''
+
+    frame_end: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_start: int = None
+    '''
+
+    :type: int
+    '''
+
+
+class TextureNodeDecompose:
+    pass
+
+
+class TextureNodeDistance:
+    pass
+
+
+class TextureNodeGroup:
+    interface: 'PropertyGroup' = None
+    '''Interface socket data 
+
+    :type: 'PropertyGroup'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''
+
+    :type: 'NodeTree'
+    '''
+
+
+class TextureNodeHueSaturation:
+    pass
+
+
+class TextureNodeImage:
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining the image duration, offset and related settings 
+
+    :type: 'ImageUser'
+    '''
+
+
+class TextureNodeInvert:
+    pass
+
+
+class TextureNodeMath:
+    operation: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+
+class TextureNodeMixRGB:
+    blend_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_alpha: bool = None
+    '''Include alpha of second input in this operation 
+
+    :type: bool
+    '''
+
+    use_clamp: bool = None
+    '''Clamp result of the node to 0..1 range 
+
+    :type: bool
+    '''
+
+
+class TextureNodeOutput:
+    filepath: str = None
+    '''
+
+    :type: str
+    '''
+
+
+class TextureNodeRGBToBW:
+    pass
+
+
+class TextureNodeRotate:
+    pass
+
+
+class TextureNodeScale:
+    pass
+
+
+class TextureNodeTexBlend:
+    pass
+
+
+class TextureNodeTexClouds:
+    pass
+
+
+class TextureNodeTexDistNoise:
+    pass
+
+
+class TextureNodeTexMagic:
+    pass
+
+
+class TextureNodeTexMarble:
+    pass
+
+
+class TextureNodeTexMusgrave:
+    pass
+
+
+class TextureNodeTexNoise:
+    pass
+
+
+class TextureNodeTexStucci:
+    pass
+
+
+class TextureNodeTexVoronoi:
+    pass
+
+
+class TextureNodeTexWood:
+    pass
+
+
+class TextureNodeTexture:
+    node_output: int = None
+    '''For node-based textures, which output node to use 
+
+    :type: int
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+
+class TextureNodeTranslate:
+    pass
+
+
+class TextureNodeTree:
+    '''Node tree consisting of linked nodes used for textures '''
+
+    pass
+
+
+class TextureNodeValToNor:
+    pass
+
+
+class TextureNodeValToRGB:
+    color_ramp: 'ColorRamp' = None
+    '''
+
+    :type: 'ColorRamp'
+    '''
+
+
+class TextureNodeViewer:
+    pass
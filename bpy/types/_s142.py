@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class TextureSlot:
+    '''Texture slot defining the mapping and influence of a texture '''
+
+    blend_type: typing.Union[int, str] = None
+    '''Mode used to apply the texture 
+
+    :type: typing.Union[int, str]
+    '''
+
+    color: float = None
+    '''Default color for textures that don’t return RGB or when RGB to intensity is enabled 
+
+    :type: float
+    '''
+
+    default_value: float = None
+    '''Value to use for Ref, Spec, Amb, Emit, Alpha, RayMir, TransLu and Hard 
+
+    :type: float
+    '''
+
+    invert: bool = None
+    '''Invert the values of the texture to reverse its effect 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Texture slot name 
+
+    :type: str
+    '''
+
+    offset: float = None
+    '''Fine tune of the texture mapping X, Y and Z locations 
+
+    :type: float
+    '''
+
+    output_node: typing.Union[int, str] = None
+    '''Which output node to use, for node-based textures 
+
+    :type: typing.Union[int, str]
+    '''
+
+    scale: float = None
+    '''Set scaling for the texture’s X, Y and Z sizes 
+
+    :type: float
+    '''
+
+    texture: 'Texture' = None
+    '''Texture data-block used by this texture slot 
+
+    :type: 'Texture'
+    '''
+
+    use_rgb_to_intensity: bool = None
+    '''Convert texture RGB values to intensity (gray) values 
+
+    :type: bool
+    '''
+
+    use_stencil: bool = None
+    '''Use this texture as a blending value on the next texture 
+
+    :type: bool
+    '''
+
+
+class Theme:
+    '''Theme settings defining draw style and colors in the user interface '''
+
+    bone_color_sets: typing.List['ThemeBoneColorSet'] = None
+    '''
+
+    :type: typing.List['ThemeBoneColorSet']
+    '''
+
+    clip_editor: 'ThemeClipEditor' = None
+    '''
+
+    :type: 'ThemeClipEditor'
+    '''
+
+    console: 'ThemeConsole' = None
+    '''
+
+    :type: 'ThemeConsole'
+    '''
+
+    dopesheet_editor: 'ThemeDopeSheet' = None
+    '''
+
+    :type: 'ThemeDopeSheet'
+    '''
+
+    file_browser: 'ThemeFileBrowser' = None
+    '''
+
+    :type: 'ThemeFileBrowser'
+    '''
+
+    graph_editor: 'ThemeGraphEditor' = None
+    '''
+
+    :type: 'ThemeGraphEditor'
+    '''
+
+    image_editor: 'ThemeImageEditor' = None
+    '''
+
+    :type: 'ThemeImageEditor'
+    '''
+
+    info: 'ThemeInfo' = None
+    '''
+
+    :type: 'ThemeInfo'
+    '''
+
+    logic_editor: 'ThemeLogicEditor' = None
+    '''
+
+    :type: 'ThemeLogicEditor'
+    '''
+
+    name: str = None
+    '''Name of the theme 
+
+    :type: str
+    '''
+
+    nla_editor: 'ThemeNLAEditor' = None
+    '''
+
+    :type: 'ThemeNLAEditor'
+    '''
+
+    node_editor: 'ThemeNodeEditor' = None
+    '''
+
+    :type: 'ThemeNodeEditor'
+    '''
+
+    outliner: 'ThemeOutliner' = None
+    '''
+
+    :type: 'ThemeOutliner'
+    '''
+
+    properties: 'ThemeProperties' = None
+    '''
+
+    :type: 'ThemeProperties'
+    '''
+
+    sequence_editor: 'ThemeSequenceEditor' = None
+    '''
+
+    :type: 'ThemeSequenceEditor'
+    '''
+
+    text_editor: 'ThemeTextEditor' = None
+    '''
+
+    :type: 'ThemeTextEditor'
+    '''
+
+    theme_area: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    timeline: 'ThemeTimeline' = None
+    '''
+
+    :type: 'ThemeTimeline'
+    '''
+
+    user_interface: 'ThemeUserInterface' = None
+    '''
+
+    :type: 'ThemeUserInterface'
+    '''
+
+    user_preferences: 'ThemeUserPreferences' = None
+    '''
+
+    :type: 'ThemeUserPreferences'
+    '''
+
+    view_3d: 'ThemeView3D' = None
+    '''
+
+    :type: 'ThemeView3D'
+    '''
+
+
+class ThemeBoneColorSet:
+    '''Theme settings for bone color sets '''
+
+    active: float = None
+    '''Color used for active bones 
+
+    :type: float
+    '''
+
+    normal: float = None
+    '''Color used for the surface of bones 
+
+    :type: float
+    '''
+
+    select: float = None
+    '''Color used for selected bones 
+
+    :type: float
+    '''
+
+    show_colored_constraints: bool = None
+    '''Allow the use of colors indicating constraints/keyed status 
+
+    :type: bool
+    '''
+
+
+class ThemeClipEditor:
+    '''Theme settings for the Movie Clip Editor '''
+
+    active_marker: float = None
+    '''Color of active marker 
+
+    :type: float
+    '''
+
+    disabled_marker: float = None
+    '''Color of disabled marker 
+
+    :type: float
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    handle_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    locked_marker: float = None
+    '''Color of locked marker 
+
+    :type: float
+    '''
+
+    marker: float = None
+    '''Color of marker 
+
+    :type: float
+    '''
+
+    marker_outline: float = None
+    '''Color of marker’s outline 
+
+    :type: float
+    '''
+
+    path_after: float = None
+    '''Color of path after current frame 
+
+    :type: float
+    '''
+
+    path_before: float = None
+    '''Color of path before current frame 
+
+    :type: float
+    '''
+
+    selected_marker: float = None
+    '''Color of selected marker 
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    space_list: 'ThemeSpaceListGeneric' = None
+    '''Settings for space list 
+
+    :type: 'ThemeSpaceListGeneric'
+    '''
+
+    strips: float = None
+    '''
+
+    :type: float
+    '''
+
+    strips_selected: float = None
+    '''
+
+    :type: float
+    '''
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeConsole:
+    '''Theme settings for the Console '''
+
+    cursor: float = None
+    '''
+
+    :type: float
+    '''
+
+    line_error: float = None
+    '''
+
+    :type: float
+    '''
+
+    line_info: float = None
+    '''
+
+    :type: float
+    '''
+
+    line_input: float = None
+    '''
+
+    :type: float
+    '''
+
+    line_output: float = None
+    '''
+
+    :type: float
+    '''
+
+    select: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+
+class ThemeDopeSheet:
+    '''Theme settings for the Dope Sheet '''
+
+    active_channels_group: float = None
+    '''
+
+    :type: float
+    '''
+
+    channel_group: float = None
+    '''
+
+    :type: float
+    '''
+
+    channels: float = None
+    '''
+
+    :type: float
+    '''
+
+    channels_selected: float = None
+    '''
+
+    :type: float
+    '''
+
+    dopesheet_channel: float = None
+    '''
+
+    :type: float
+    '''
+
+    dopesheet_subchannel: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    keyframe: float = None
+    '''Color of Keyframe 
+
+    :type: float
+    '''
+
+    keyframe_border: float = None
+    '''Color of keyframe border 
+
+    :type: float
+    '''
+
+    keyframe_border_selected: float = None
+    '''Color of selected keyframe border 
+
+    :type: float
+    '''
+
+    keyframe_breakdown: float = None
+    '''Color of breakdown keyframe 
+
+    :type: float
+    '''
+
+    keyframe_breakdown_selected: float = None
+    '''Color of selected breakdown keyframe 
+
+    :type: float
+    '''
+
+    keyframe_extreme: float = None
+    '''Color of extreme keyframe 
+
+    :type: float
+    '''
+
+    keyframe_extreme_selected: float = None
+    '''Color of selected extreme keyframe 
+
+    :type: float
+    '''
+
+    keyframe_jitter: float = None
+    '''Color of jitter keyframe 
+
+    :type: float
+    '''
+
+    keyframe_jitter_selected: float = None
+    '''Color of selected jitter keyframe 
+
+    :type: float
+    '''
+
+    keyframe_scale_factor: float = None
+    '''Scale factor for adjusting the height of keyframes 
+
+    :type: float
+    '''
+
+    keyframe_selected: float = None
+    '''Color of selected keyframe 
+
+    :type: float
+    '''
+
+    long_key: float = None
+    '''
+
+    :type: float
+    '''
+
+    long_key_selected: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    space_list: 'ThemeSpaceListGeneric' = None
+    '''Settings for space list 
+
+    :type: 'ThemeSpaceListGeneric'
+    '''
+
+    summary: float = None
+    '''Color of summary channel 
+
+    :type: float
+    '''
+
+    value_sliders: float = None
+    '''
+
+    :type: float
+    '''
+
+    view_sliders: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeFileBrowser:
+    '''Theme settings for the File Browser '''
+
+    selected_file: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+
+class ThemeFontStyle:
+    '''Theme settings for Font '''
+
+    font_kerning_style: typing.Union[int, str] = None
+    '''Which style to use for font kerning 
+
+    :type: typing.Union[int, str]
+    '''
+
+    points: int = None
+    '''
+
+    :type: int
+    '''
+
+    shadow: int = None
+    '''Shadow size (0, 3 and 5 supported) 
+
+    :type: int
+    '''
+
+    shadow_alpha: float = None
+    '''
+
+    :type: float
+    '''
+
+    shadow_offset_x: int = None
+    '''Shadow offset in pixels 
+
+    :type: int
+    '''
+
+    shadow_offset_y: int = None
+    '''Shadow offset in pixels 
+
+    :type: int
+    '''
+
+    shadow_value: float = None
+    '''Shadow color in gray value 
+
+    :type: float
+    '''
+
+
+class ThemeGradientColors:
+    '''Theme settings for background colors and gradient '''
+
+    gradient: float = None
+    '''
+
+    :type: float
+    '''
+
+    high_gradient: float = None
+    '''
+
+    :type: float
+    '''
+
+    show_grad: bool = None
+    '''Do a gradient for the background of the viewport working area 
+
+    :type: bool
+    '''
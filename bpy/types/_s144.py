@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeGraphEditor:
+    '''Theme settings for the graph editor '''
+
+    active_channels_group: float = None
+    '''
+
+    :type: float
+    '''
+
+    channel_group: float = None
+    '''
+
+    :type: float
+    '''
+
+    channels_region: float = None
+    '''
+
+    :type: float
+    '''
+
+    dopesheet_channel: float = None
+    '''
+
+    :type: float
+    '''
+
+    dopesheet_subchannel: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_vect: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vect: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    lastsel_point: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    space_list: 'ThemeSpaceListGeneric' = None
+    '''Settings for space list 
+
+    :type: 'ThemeSpaceListGeneric'
+    '''
+
+    vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_bevel: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    vertex_unreferenced: float = None
+    '''
+
+    :type: float
+    '''
+
+    window_sliders: float = None
+    '''
+
+    :type: float
+    '''
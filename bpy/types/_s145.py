@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeImageEditor:
+    '''Theme settings for the Image Editor '''
+
+    edge_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    editmesh_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    face: float = None
+    '''
+
+    :type: float
+    '''
+
+    face_dot: float = None
+    '''
+
+    :type: float
+    '''
+
+    face_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    facedot_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    freestyle_face_mark: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    handle_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto_clamped: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    metadatabg: float = None
+    '''
+
+    :type: float
+    '''
+
+    metadatatext: float = None
+    '''
+
+    :type: float
+    '''
+
+    paint_curve_handle: float = None
+    '''
+
+    :type: float
+    '''
+
+    paint_curve_pivot: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_edge: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_face: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_stitchable: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_unstitchable: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_stitch_vert: float = None
+    '''
+
+    :type: float
+    '''
+
+    scope_back: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    uv_others: float = None
+    '''
+
+    :type: float
+    '''
+
+    uv_shadow: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_bevel: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    vertex_unreferenced: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire_edit: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeInfo:
+    '''Theme settings for Info '''
+
+    info_debug: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_debug_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_error: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_error_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_info: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_info_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_selected: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_selected_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_warning: float = None
+    '''
+
+    :type: float
+    '''
+
+    info_warning_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+
+class ThemeLogicEditor:
+    '''Theme settings for the Logic Editor '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
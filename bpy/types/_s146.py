@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeNLAEditor:
+    '''Theme settings for the NLA Editor '''
+
+    active_action: float = None
+    '''Animation data-block has active action 
+
+    :type: float
+    '''
+
+    active_action_unset: float = None
+    '''Animation data-block doesn’t have active action 
+
+    :type: float
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    keyframe_border: float = None
+    '''Color of keyframe border 
+
+    :type: float
+    '''
+
+    keyframe_border_selected: float = None
+    '''Color of selected keyframe border 
+
+    :type: float
+    '''
+
+    meta_strips: float = None
+    '''Meta Strip - Unselected (for grouping related strips) 
+
+    :type: float
+    '''
+
+    meta_strips_selected: float = None
+    '''Meta Strip - Selected (for grouping related strips) 
+
+    :type: float
+    '''
+
+    sound_strips: float = None
+    '''Sound Strip - Unselected (for timing speaker sounds) 
+
+    :type: float
+    '''
+
+    sound_strips_selected: float = None
+    '''Sound Strip - Selected (for timing speaker sounds) 
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    space_list: 'ThemeSpaceListGeneric' = None
+    '''Settings for space list 
+
+    :type: 'ThemeSpaceListGeneric'
+    '''
+
+    strips: float = None
+    '''Action-Clip Strip - Unselected 
+
+    :type: float
+    '''
+
+    strips_selected: float = None
+    '''Action-Clip Strip - Selected 
+
+    :type: float
+    '''
+
+    transition_strips: float = None
+    '''Transition Strip - Unselected 
+
+    :type: float
+    '''
+
+    transition_strips_selected: float = None
+    '''Transition Strip - Selected 
+
+    :type: float
+    '''
+
+    tweak: float = None
+    '''Color for strip/action being ‘tweaked’ or edited 
+
+    :type: float
+    '''
+
+    tweak_duplicate: float = None
+    '''Warning/error indicator color for strips referencing the strip being tweaked 
+
+    :type: float
+    '''
+
+    view_sliders: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeNodeEditor:
+    '''Theme settings for the Node Editor '''
+
+    color_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    converter_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    distor_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    filter_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    group_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    group_socket_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    input_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    layout_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    matte_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    node_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    node_backdrop: float = None
+    '''
+
+    :type: float
+    '''
+
+    node_selected: float = None
+    '''
+
+    :type: float
+    '''
+
+    noodle_curving: int = None
+    '''Curving of the noodle 
+
+    :type: int
+    '''
+
+    output_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    pattern_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    script_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    selected_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    shader_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    space_list: 'ThemeSpaceListGeneric' = None
+    '''Settings for space list 
+
+    :type: 'ThemeSpaceListGeneric'
+    '''
+
+    texture_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    vector_node: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire_inner: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire_select: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeOutliner:
+    '''Theme settings for the Outliner '''
+
+    match: float = None
+    '''
+
+    :type: float
+    '''
+
+    selected_highlight: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+
+class ThemePanelColors:
+    '''Theme settings for panel colors '''
+
+    back: float = None
+    '''
+
+    :type: float
+    '''
+
+    header: float = None
+    '''
+
+    :type: float
+    '''
+
+    show_back: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    show_header: bool = None
+    '''
+
+    :type: bool
+    '''
+
+
+class ThemeProperties:
+    '''Theme settings for the Properties '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeSequenceEditor:
+    '''Theme settings for the Sequence Editor '''
+
+    audio_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    draw_action: float = None
+    '''
+
+    :type: float
+    '''
+
+    effect_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    image_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    keyframe: float = None
+    '''
+
+    :type: float
+    '''
+
+    meta_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    metadatabg: float = None
+    '''
+
+    :type: float
+    '''
+
+    metadatatext: float = None
+    '''
+
+    :type: float
+    '''
+
+    movie_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    movieclip_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    preview_back: float = None
+    '''
+
+    :type: float
+    '''
+
+    scene_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    text_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    transition_strip: float = None
+    '''
+
+    :type: float
+    '''
+
+    window_sliders: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeSpaceGeneric:
+    back: float = None
+    '''
+
+    :type: float
+    '''
+
+    button: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_title: float = None
+    '''
+
+    :type: float
+    '''
+
+    header: float = None
+    '''
+
+    :type: float
+    '''
+
+    header_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    header_text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    panelcolors: 'ThemePanelColors' = None
+    '''
+
+    :type: 'ThemePanelColors'
+    '''
+
+    tab_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_back: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_inactive: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_outline: float = None
+    '''
+
+    :type: float
+    '''
+
+    text: float = None
+    '''
+
+    :type: float
+    '''
+
+    text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    title: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeSpaceGradient:
+    button: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    button_title: float = None
+    '''
+
+    :type: float
+    '''
+
+    gradients: 'ThemeGradientColors' = None
+    '''
+
+    :type: 'ThemeGradientColors'
+    '''
+
+    header: float = None
+    '''
+
+    :type: float
+    '''
+
+    header_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    header_text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    panelcolors: 'ThemePanelColors' = None
+    '''
+
+    :type: 'ThemePanelColors'
+    '''
+
+    tab_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_back: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_inactive: float = None
+    '''
+
+    :type: float
+    '''
+
+    tab_outline: float = None
+    '''
+
+    :type: float
+    '''
+
+    text: float = None
+    '''
+
+    :type: float
+    '''
+
+    text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    title: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeSpaceListGeneric:
+    list: float = None
+    '''
+
+    :type: float
+    '''
+
+    list_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    list_text_hi: float = None
+    '''
+
+    :type: float
+    '''
+
+    list_title: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeStyle:
+    '''Theme settings for style sets '''
+
+    panel_title: 'ThemeFontStyle' = None
+    '''
+
+    :type: 'ThemeFontStyle'
+    '''
+
+    widget: 'ThemeFontStyle' = None
+    '''
+
+    :type: 'ThemeFontStyle'
+    '''
+
+    widget_label: 'ThemeFontStyle' = None
+    '''
+
+    :type: 'ThemeFontStyle'
+    '''
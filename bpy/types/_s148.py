@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeTextEditor:
+    '''Theme settings for the Text Editor '''
+
+    cursor: float = None
+    '''
+
+    :type: float
+    '''
+
+    line_numbers_background: float = None
+    '''
+
+    :type: float
+    '''
+
+    selected_text: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    syntax_builtin: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_comment: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_numbers: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_preprocessor: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_reserved: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_special: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_string: float = None
+    '''
+
+    :type: float
+    '''
+
+    syntax_symbols: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeTimeline:
+    '''Theme settings for the Timeline '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
+
+    time_grease_pencil: float = None
+    '''Color of Grease Pencil keyframes 
+
+    :type: float
+    '''
+
+    time_keyframe: float = None
+    '''Base color for keyframe indicator lines 
+
+    :type: float
+    '''
+
+
+class ThemeUserInterface:
+    '''Theme settings for user interface elements '''
+
+    axis_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    axis_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    axis_z: float = None
+    '''
+
+    :type: float
+    '''
+
+    icon_alpha: float = None
+    '''Transparency of icons in the interface, to reduce contrast 
+
+    :type: float
+    '''
+
+    icon_file: str = None
+    '''
+
+    :type: str
+    '''
+
+    menu_shadow_fac: float = None
+    '''Blending factor for menu shadows 
+
+    :type: float
+    '''
+
+    menu_shadow_width: int = None
+    '''Width of menu shadows, set to zero to disable 
+
+    :type: int
+    '''
+
+    wcol_box: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_list_item: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_menu: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_menu_back: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_menu_item: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_num: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_numslider: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_option: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_pie_menu: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_progress: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_pulldown: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_radio: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_regular: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_scroll: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_state: 'ThemeWidgetStateColors' = None
+    '''
+
+    :type: 'ThemeWidgetStateColors'
+    '''
+
+    wcol_text: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_toggle: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_tool: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    wcol_tooltip: 'ThemeWidgetColors' = None
+    '''
+
+    :type: 'ThemeWidgetColors'
+    '''
+
+    widget_emboss: float = None
+    '''Color of the 1px shadow line underlying widgets 
+
+    :type: float
+    '''
+
+
+class ThemeUserPreferences:
+    '''Theme settings for the User Preferences '''
+
+    space: 'ThemeSpaceGeneric' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGeneric'
+    '''
@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeView3D:
+    '''Theme settings for the 3D View '''
+
+    act_spline: float = None
+    '''
+
+    :type: float
+    '''
+
+    bone_pose: float = None
+    '''
+
+    :type: float
+    '''
+
+    bone_pose_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    bone_solid: float = None
+    '''
+
+    :type: float
+    '''
+
+    bundle_solid: float = None
+    '''
+
+    :type: float
+    '''
+
+    camera: float = None
+    '''
+
+    :type: float
+    '''
+
+    camera_path: float = None
+    '''
+
+    :type: float
+    '''
+
+    clipping_border_3d: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_bevel: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_crease: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_facesel: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_seam: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    edge_sharp: float = None
+    '''
+
+    :type: float
+    '''
+
+    editmesh_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    empty: float = None
+    '''
+
+    :type: float
+    '''
+
+    extra_edge_angle: float = None
+    '''
+
+    :type: float
+    '''
+
+    extra_edge_len: float = None
+    '''
+
+    :type: float
+    '''
+
+    extra_face_angle: float = None
+    '''
+
+    :type: float
+    '''
+
+    extra_face_area: float = None
+    '''
+
+    :type: float
+    '''
+
+    face: float = None
+    '''
+
+    :type: float
+    '''
+
+    face_dot: float = None
+    '''
+
+    :type: float
+    '''
+
+    face_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    facedot_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    frame_current: float = None
+    '''
+
+    :type: float
+    '''
+
+    freestyle_edge_mark: float = None
+    '''
+
+    :type: float
+    '''
+
+    freestyle_face_mark: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    gp_vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    grid: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_align: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_auto: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_free: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_sel_vect: float = None
+    '''
+
+    :type: float
+    '''
+
+    handle_vect: float = None
+    '''
+
+    :type: float
+    '''
+
+    lamp: float = None
+    '''
+
+    :type: float
+    '''
+
+    lastsel_point: float = None
+    '''
+
+    :type: float
+    '''
+
+    normal: float = None
+    '''
+
+    :type: float
+    '''
+
+    nurb_sel_uline: float = None
+    '''
+
+    :type: float
+    '''
+
+    nurb_sel_vline: float = None
+    '''
+
+    :type: float
+    '''
+
+    nurb_uline: float = None
+    '''
+
+    :type: float
+    '''
+
+    nurb_vline: float = None
+    '''
+
+    :type: float
+    '''
+
+    object_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    object_grouped: float = None
+    '''
+
+    :type: float
+    '''
+
+    object_grouped_active: float = None
+    '''
+
+    :type: float
+    '''
+
+    object_selected: float = None
+    '''
+
+    :type: float
+    '''
+
+    outline_width: int = None
+    '''
+
+    :type: int
+    '''
+
+    paint_curve_handle: float = None
+    '''
+
+    :type: float
+    '''
+
+    paint_curve_pivot: float = None
+    '''
+
+    :type: float
+    '''
+
+    skin_root: float = None
+    '''
+
+    :type: float
+    '''
+
+    space: 'ThemeSpaceGradient' = None
+    '''Settings for space 
+
+    :type: 'ThemeSpaceGradient'
+    '''
+
+    speaker: float = None
+    '''
+
+    :type: float
+    '''
+
+    split_normal: float = None
+    '''
+
+    :type: float
+    '''
+
+    text_grease_pencil: float = None
+    '''Color for indicating Grease Pencil keyframes 
+
+    :type: float
+    '''
+
+    text_keyframe: float = None
+    '''Color for indicating Object keyframes 
+
+    :type: float
+    '''
+
+    transform: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_bevel: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_normal: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_select: float = None
+    '''
+
+    :type: float
+    '''
+
+    vertex_size: int = None
+    '''
+
+    :type: int
+    '''
+
+    vertex_unreferenced: float = None
+    '''
+
+    :type: float
+    '''
+
+    view_overlay: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire: float = None
+    '''
+
+    :type: float
+    '''
+
+    wire_edit: float = None
+    '''
+
+    :type: float
+    '''
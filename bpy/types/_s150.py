@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ThemeWidgetColors:
+    '''Theme settings for widget color sets '''
+
+    inner: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_sel: float = None
+    '''
+
+    :type: float
+    '''
+
+    item: float = None
+    '''
+
+    :type: float
+    '''
+
+    outline: float = None
+    '''
+
+    :type: float
+    '''
+
+    shadedown: int = None
+    '''
+
+    :type: int
+    '''
+
+    shadetop: int = None
+    '''
+
+    :type: int
+    '''
+
+    show_shaded: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    text: float = None
+    '''
+
+    :type: float
+    '''
+
+    text_sel: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class ThemeWidgetStateColors:
+    '''Theme settings for widget state colors '''
+
+    blend: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_anim: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_anim_sel: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_driven: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_driven_sel: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_key: float = None
+    '''
+
+    :type: float
+    '''
+
+    inner_key_sel: float = None
+    '''
+
+    :type: float
+    '''
+
+
+class TimelineMarker:
+    '''Marker for noting points in the timeline '''
+
+    camera: 'Object' = None
+    '''Camera this timeline sets to active 
+
+    :type: 'Object'
+    '''
+
+    frame: int = None
+    '''The frame on which the timeline marker appears 
+
+    :type: int
+    '''
+
+    name: str = None
+    '''
+
+    :type: str
+    '''
+
+    select: bool = None
+    '''Marker selection state 
+
+    :type: bool
+    '''
+
+
+class TimelineMarkers:
+    '''Collection of timeline markers '''
+
+    def new(self, name: str, frame: int = 1) -> 'TimelineMarker':
+        '''Add a keyframe to the curve 
+
+        :param name: New name for the marker (not unique) 
+        :type name: str
+        :param frame: The frame for the new marker 
+        :type frame: int
+        :rtype: 'TimelineMarker'
+        :return:  Newly created timeline marker 
+        '''
+        pass
+
+    def remove(self, marker: 'TimelineMarker'):
+        '''Remove a timeline marker 
+
+        :param marker: Timeline marker to remove 
+        :type marker: 'TimelineMarker'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Remove all timeline markers 
+
+        '''
+        pass
+
+
+class Timer:
+    '''Window event timer '''
+
+    time_delta: float = None
+    '''Time since last step in seconds 
+
+    :type: float
+    '''
+
+    time_duration: float = None
+    '''Time since last step in seconds 
+
+    :type: float
+    '''
+
+    time_step: float = None
+    '''
+
+    :type: float
+    '''
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class ToolSettings:
+    auto_keying_mode: typing.Union[int, str] = None
+    '''Mode of automatic keyframe insertion for Objects and Bones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    curve_paint_settings: 'CurvePaintSettings' = None
+    '''
+
+    :type: 'CurvePaintSettings'
+    '''
+
+    double_threshold: float = None
+    '''Limit for removing duplicates and ‘Auto Merge’ 
+
+    :type: float
+    '''
+
+    edge_path_live_unwrap: bool = None
+    '''Changing edges seam re-calculates UV unwrap 
+
+    :type: bool
+    '''
+
+    edge_path_mode: typing.Union[int, str] = None
+    '''The edge flag to tag when selecting the shortest path 
+
+    :type: typing.Union[int, str]
+    '''
+
+    etch_adaptive_limit: float = None
+    '''Correlation threshold for number of bones in the subdivided stroke 
+
+    :type: float
+    '''
+
+    etch_convert_mode: typing.Union[int, str] = None
+    '''Method used to convert stroke to bones 
+
+    :type: typing.Union[int, str]
+    '''
+
+    etch_length_limit: float = None
+    '''Maximum length of the subdivided bones 
+
+    :type: float
+    '''
+
+    etch_number: str = None
+    '''Text to replace &N with (e.g. ‘Finger.&N’ -> ‘Finger.1’ or ‘Finger.One’) 
+
+    :type: str
+    '''
+
+    etch_roll_mode: typing.Union[int, str] = None
+    '''Method used to adjust the roll of bones when retargeting 
+
+    :type: typing.Union[int, str]
+    '''
+
+    etch_side: str = None
+    '''Text to replace &S with (e.g. ‘Arm.&S’ -> ‘Arm.R’ or ‘Arm.Right’) 
+
+    :type: str
+    '''
+
+    etch_subdivision_number: int = None
+    '''Number of bones in the subdivided stroke 
+
+    :type: int
+    '''
+
+    etch_template: 'Object' = None
+    '''Template armature that will be retargeted to the stroke 
+
+    :type: 'Object'
+    '''
+
+    gpencil_brushes: typing.List['GPencilBrush'] = None
+    '''Grease Pencil drawing brushes 
+
+    :type: typing.List['GPencilBrush']
+    '''
+
+    gpencil_interpolate: 'GPencilInterpolateSettings' = None
+    '''Settings for Grease Pencil Interpolation tools 
+
+    :type: 'GPencilInterpolateSettings'
+    '''
+
+    gpencil_sculpt: 'GPencilSculptSettings' = None
+    '''Settings for stroke sculpting tools and brushes 
+
+    :type: 'GPencilSculptSettings'
+    '''
+
+    gpencil_stroke_placement_image_editor: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    gpencil_stroke_placement_sequencer_preview: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    gpencil_stroke_placement_view2d: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    gpencil_stroke_placement_view3d: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    grease_pencil_source: typing.Union[int, str] = None
+    '''Data-block where active Grease Pencil data is found from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image_paint: 'ImagePaint' = None
+    '''
+
+    :type: 'ImagePaint'
+    '''
+
+    keyframe_type: typing.Union[int, str] = None
+    '''Type of keyframes to create when inserting keyframes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    lock_markers: bool = None
+    '''Prevent marker editing 
+
+    :type: bool
+    '''
+
+    mesh_select_mode: bool = None
+    '''Which mesh elements selection works on 
+
+    :type: bool
+    '''
+
+    normal_size: float = None
+    '''Display size for normals in the 3D view 
+
+    :type: float
+    '''
+
+    particle_edit: 'ParticleEdit' = None
+    '''
+
+    :type: 'ParticleEdit'
+    '''
+
+    proportional_edit: typing.Union[int, str] = None
+    '''Proportional Editing mode, allows transforms with distance fall-off 
+
+    :type: typing.Union[int, str]
+    '''
+
+    proportional_edit_falloff: typing.Union[int, str] = None
+    '''Falloff type for proportional editing mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    proportional_size: float = None
+    '''Display size for proportional editing circle 
+
+    :type: float
+    '''
+
+    sculpt: 'Sculpt' = None
+    '''
+
+    :type: 'Sculpt'
+    '''
+
+    show_uv_local_view: bool = None
+    '''Draw only faces with the currently displayed image assigned 
+
+    :type: bool
+    '''
+
+    snap_element: typing.Union[int, str] = None
+    '''Type of element to snap to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    snap_node_element: typing.Union[int, str] = None
+    '''Type of element to snap to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    snap_target: typing.Union[int, str] = None
+    '''Which part to snap onto the target 
+
+    :type: typing.Union[int, str]
+    '''
+
+    snap_uv_element: typing.Union[int, str] = None
+    '''Type of element to snap to 
+
+    :type: typing.Union[int, str]
+    '''
+
+    statvis: 'MeshStatVis' = None
+    '''
+
+    :type: 'MeshStatVis'
+    '''
+
+    unified_paint_settings: 'UnifiedPaintSettings' = None
+    '''
+
+    :type: 'UnifiedPaintSettings'
+    '''
+
+    use_auto_normalize: bool = None
+    '''Ensure all bone-deforming vertex groups add up to 1.0 while weight painting 
+
+    :type: bool
+    '''
+
+    use_bone_sketching: bool = None
+    '''Use sketching to create and edit bones 
+
+    :type: bool
+    '''
+
+    use_etch_autoname: bool = None
+    '''Automatically generate values to replace &N and &S suffix placeholders in template names 
+
+    :type: bool
+    '''
+
+    use_etch_overdraw: bool = None
+    '''Adjust strokes by drawing near them 
+
+    :type: bool
+    '''
+
+    use_etch_quick: bool = None
+    '''Automatically convert and delete on stroke end 
+
+    :type: bool
+    '''
+
+    use_gpencil_additive_drawing: bool = None
+    '''When creating new frames, the strokes from the previous/active frame are included as the basis for the new one 
+
+    :type: bool
+    '''
+
+    use_gpencil_continuous_drawing: bool = None
+    '''Allow drawing multiple strokes at a time with Grease Pencil 
+
+    :type: bool
+    '''
+
+    use_gpencil_draw_onback: bool = None
+    '''When draw new strokes, the new stroke is drawn below of all strokes in the layer 
+
+    :type: bool
+    '''
+
+    use_gpencil_stroke_endpoints: bool = None
+    '''Only use the first and last parts of the stroke for snapping 
+
+    :type: bool
+    '''
+
+    use_keyframe_insert_auto: bool = None
+    '''Automatic keyframe insertion for Objects and Bones 
+
+    :type: bool
+    '''
+
+    use_keyframe_insert_keyingset: bool = None
+    '''Automatic keyframe insertion using active Keying Set only 
+
+    :type: bool
+    '''
+
+    use_mesh_automerge: bool = None
+    '''Automatically merge vertices moved to the same location 
+
+    :type: bool
+    '''
+
+    use_multipaint: bool = None
+    '''Paint across the weights of all selected bones, maintaining their relative influence 
+
+    :type: bool
+    '''
+
+    use_proportional_action: bool = None
+    '''Proportional editing in action editor 
+
+    :type: bool
+    '''
+
+    use_proportional_edit_mask: bool = None
+    '''Proportional editing mask mode 
+
+    :type: bool
+    '''
+
+    use_proportional_edit_objects: bool = None
+    '''Proportional editing object mode 
+
+    :type: bool
+    '''
+
+    use_proportional_fcurve: bool = None
+    '''Proportional editing in FCurve editor 
+
+    :type: bool
+    '''
+
+    use_record_with_nla: bool = None
+    '''Add a new NLA Track + Strip for every loop/pass made over the animation to allow non-destructive tweaking 
+
+    :type: bool
+    '''
+
+    use_snap: bool = None
+    '''Snap during transform 
+
+    :type: bool
+    '''
+
+    use_snap_align_rotation: bool = None
+    '''Align rotation with the snapping target 
+
+    :type: bool
+    '''
+
+    use_snap_grid_absolute: bool = None
+    '''Absolute grid alignment while translating (based on the pivot center) 
+
+    :type: bool
+    '''
+
+    use_snap_peel_object: bool = None
+    '''Consider objects as whole when finding volume center 
+
+    :type: bool
+    '''
+
+    use_snap_project: bool = None
+    '''Project individual elements on the surface of other objects 
+
+    :type: bool
+    '''
+
+    use_snap_self: bool = None
+    '''Snap onto itself (editmode) 
+
+    :type: bool
+    '''
+
+    use_uv_sculpt: bool = None
+    '''Enable brush for UV sculpting 
+
+    :type: bool
+    '''
+
+    use_uv_select_sync: bool = None
+    '''Keep UV and edit mode mesh selection in sync 
+
+    :type: bool
+    '''
+
+    uv_relax_method: typing.Union[int, str] = None
+    '''Algorithm used for UV relaxation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    uv_sculpt: 'UvSculpt' = None
+    '''
+
+    :type: 'UvSculpt'
+    '''
+
+    uv_sculpt_all_islands: bool = None
+    '''Brush operates on all islands 
+
+    :type: bool
+    '''
+
+    uv_sculpt_lock_borders: bool = None
+    '''Disable editing of boundary edges 
+
+    :type: bool
+    '''
+
+    uv_sculpt_tool: typing.Union[int, str] = None
+    '''Select Tools for the UV sculpt brushes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    uv_select_mode: typing.Union[int, str] = None
+    '''UV selection and display mode 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group_subset: typing.Union[int, str] = None
+    '''Filter Vertex groups for Display 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group_user: typing.Union[int, str] = None
+    '''Display unweighted vertices 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group_weight: float = None
+    '''Weight to assign in vertex groups 
+
+    :type: float
+    '''
+
+    vertex_paint: 'VertexPaint' = None
+    '''
+
+    :type: 'VertexPaint'
+    '''
+
+    weight_paint: 'VertexPaint' = None
+    '''
+
+    :type: 'VertexPaint'
+    '''
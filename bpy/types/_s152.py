@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class TrackToConstraint:
+    '''Aim the constrained object toward the target '''
+
+    head_tail: float = None
+    '''Target along length of bone: Head=0, Tail=1 
+
+    :type: float
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    track_axis: typing.Union[int, str] = None
+    '''Axis that points to the target object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    up_axis: typing.Union[int, str] = None
+    '''Axis that points upward 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_bbone_shape: bool = None
+    '''Follow shape of B-Bone segments when calculating Head/Tail position 
+
+    :type: bool
+    '''
+
+    use_target_z: bool = None
+    '''Target’s Z axis, not World Z axis, will constraint the Up direction 
+
+    :type: bool
+    '''
+
+
+class TransformCacheConstraint:
+    '''Look up transformation from an external file '''
+
+    cache_file: 'CacheFile' = None
+    '''
+
+    :type: 'CacheFile'
+    '''
+
+    object_path: str = None
+    '''Path to the object in the Alembic archive used to lookup the transform matrix 
+
+    :type: str
+    '''
+
+
+class TransformConstraint:
+    '''Map transformations of the target to the object '''
+
+    from_max_x: float = None
+    '''Top range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_max_x_rot: float = None
+    '''Top range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_max_x_scale: float = None
+    '''Top range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_max_y: float = None
+    '''Top range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_max_y_rot: float = None
+    '''Top range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_max_y_scale: float = None
+    '''Top range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_max_z: float = None
+    '''Top range of Z axis source motion 
+
+    :type: float
+    '''
+
+    from_max_z_rot: float = None
+    '''Top range of Z axis source motion 
+
+    :type: float
+    '''
+
+    from_max_z_scale: float = None
+    '''Top range of Z axis source motion 
+
+    :type: float
+    '''
+
+    from_min_x: float = None
+    '''Bottom range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_min_x_rot: float = None
+    '''Bottom range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_min_x_scale: float = None
+    '''Bottom range of X axis source motion 
+
+    :type: float
+    '''
+
+    from_min_y: float = None
+    '''Bottom range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_min_y_rot: float = None
+    '''Bottom range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_min_y_scale: float = None
+    '''Bottom range of Y axis source motion 
+
+    :type: float
+    '''
+
+    from_min_z: float = None
+    '''Bottom range of Z axis source motion 
+
+    :type: float
+    '''
+
+    from_min_z_rot: float = None
+    '''Bottom range of Z axis source motion 
+
+    :type: float
+    '''
+
+    from_min_z_scale: float = None
+    '''Bottom range of Z axis source motion 
+
+    :type: float
+    '''
+
+    map_from: typing.Union[int, str] = None
+    '''The transformation type to use from the target 
+
+    :type: typing.Union[int, str]
+    '''
+
+    map_to: typing.Union[int, str] = None
+    '''The transformation type to affect of the constrained object 
+
+    :type: typing.Union[int, str]
+    '''
+
+    map_to_x_from: typing.Union[int, str] = None
+    '''The source axis constrained object’s X axis uses 
+
+    :type: typing.Union[int, str]
+    '''
+
+    map_to_y_from: typing.Union[int, str] = None
+    '''The source axis constrained object’s Y axis uses 
+
+    :type: typing.Union[int, str]
+    '''
+
+    map_to_z_from: typing.Union[int, str] = None
+    '''The source axis constrained object’s Z axis uses 
+
+    :type: typing.Union[int, str]
+    '''
+
+    subtarget: str = None
+    '''
+
+    :type: str
+    '''
+
+    target: 'Object' = None
+    '''Target Object 
+
+    :type: 'Object'
+    '''
+
+    to_max_x: float = None
+    '''Top range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_x_rot: float = None
+    '''Top range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_x_scale: float = None
+    '''Top range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_y: float = None
+    '''Top range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_y_rot: float = None
+    '''Top range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_y_scale: float = None
+    '''Top range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_z: float = None
+    '''Top range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_z_rot: float = None
+    '''Top range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    to_max_z_scale: float = None
+    '''Top range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_x: float = None
+    '''Bottom range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_x_rot: float = None
+    '''Bottom range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_x_scale: float = None
+    '''Bottom range of X axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_y: float = None
+    '''Bottom range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_y_rot: float = None
+    '''Bottom range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_y_scale: float = None
+    '''Bottom range of Y axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_z: float = None
+    '''Bottom range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_z_rot: float = None
+    '''Bottom range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    to_min_z_scale: float = None
+    '''Bottom range of Z axis destination motion 
+
+    :type: float
+    '''
+
+    use_motion_extrapolate: bool = None
+    '''Extrapolate ranges 
+
+    :type: bool
+    '''
+
+
+class TransformOrientation:
+    matrix: float = None
+    '''
+
+    :type: float
+    '''
+
+    name: str = None
+    '''Name of the custom transform orientation 
+
+    :type: str
+    '''
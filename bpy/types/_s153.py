@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class TransformSequence:
+    '''Sequence strip applying affine transformations to other strips '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Method to determine how missing pixels are created 
+
+    :type: typing.Union[int, str]
+    '''
+
+    rotation_start: float = None
+    '''Degrees to rotate the input 
+
+    :type: float
+    '''
+
+    scale_start_x: float = None
+    '''Amount to scale the input in the X axis 
+
+    :type: float
+    '''
+
+    scale_start_y: float = None
+    '''Amount to scale the input in the Y axis 
+
+    :type: float
+    '''
+
+    translate_start_x: float = None
+    '''Amount to move the input on the X axis 
+
+    :type: float
+    '''
+
+    translate_start_y: float = None
+    '''Amount to move the input on the Y axis 
+
+    :type: float
+    '''
+
+    translation_unit: typing.Union[int, str] = None
+    '''Unit of measure to translate the input 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_uniform_scale: bool = None
+    '''Scale uniformly, preserving aspect ratio 
+
+    :type: bool
+    '''
+
+
+class TriangulateModifier:
+    '''Triangulate Mesh '''
+
+    ngon_method: typing.Union[int, str] = None
+    '''Method for splitting the polygons into triangles 
+
+    :type: typing.Union[int, str]
+    '''
+
+    quad_method: typing.Union[int, str] = None
+    '''Method for splitting the quads into triangles 
+
+    :type: typing.Union[int, str]
+    '''
@@ -0,0 +1,918 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UILayout:
+    '''User interface layout in a panel or header '''
+
+    active: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    alert: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    alignment: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    enabled: bool = None
+    '''When false, this (sub)layout is grayed out 
+
+    :type: bool
+    '''
+
+    operator_context: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    scale_x: float = None
+    '''Scale factor along the X for items in this (sub)layout 
+
+    :type: float
+    '''
+
+    scale_y: float = None
+    '''Scale factor along the Y for items in this (sub)layout 
+
+    :type: float
+    '''
+
+    def row(self, align: bool = False) -> 'UILayout':
+        '''Sub-layout. Items placed in this sublayout are placed next to each other in a row 
+
+        :param align: Align buttons to each other 
+        :type align: bool
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def column(self, align: bool = False) -> 'UILayout':
+        '''Sub-layout. Items placed in this sublayout are placed under each other in a column 
+
+        :param align: Align buttons to each other 
+        :type align: bool
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def column_flow(self, columns: int = 0, align: bool = False) -> 'UILayout':
+        '''column_flow 
+
+        :param columns: Number of columns, 0 is automatic 
+        :type columns: int
+        :param align: Align buttons to each other 
+        :type align: bool
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def box(self, ) -> 'UILayout':
+        '''Sublayout (items placed in this sublayout are placed under each other in a column and are surrounded by a box) 
+
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def split(self, percentage: float = 0.0,
+              align: bool = False) -> 'UILayout':
+        '''split 
+
+        :param percentage: Percentage, Percentage of width to split at 
+        :type percentage: float
+        :param align: Align buttons to each other 
+        :type align: bool
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def menu_pie(self, ) -> 'UILayout':
+        '''Sublayout. Items placed in this sublayout are placed in a radial fashion around the menu center) 
+
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def prop(self,
+             data: 'AnyType',
+             property: str,
+             text: str = "",
+             text_ctxt: str = "",
+             translate: bool = True,
+             icon: typing.Union[int, str] = 'NONE',
+             expand: bool = False,
+             slider: bool = False,
+             toggle: bool = False,
+             icon_only: bool = False,
+             event: bool = False,
+             full_event: bool = False,
+             emboss: bool = True,
+             index: int = -1,
+             icon_value: int = 0):
+        '''Item. Exposes an RNA item and places it into the layout 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        :param expand: Expand button to show more detail 
+        :type expand: bool
+        :param slider: Use slider widget for numeric values 
+        :type slider: bool
+        :param toggle: Use toggle widget for boolean values 
+        :type toggle: bool
+        :param icon_only: Draw only icons in buttons, no text 
+        :type icon_only: bool
+        :param event: Use button to input key events 
+        :type event: bool
+        :param full_event: Use button to input full events including modifiers 
+        :type full_event: bool
+        :param emboss: Draw the button itself, just the icon/text 
+        :type emboss: bool
+        :param index: The index of this button, when set a single member of an array can be accessed, when set to -1 all array members are used 
+        :type index: int
+        :param icon_value: Icon Value, Override automatic icon of the item 
+        :type icon_value: int
+        '''
+        pass
+
+    def props_enum(self, data: 'AnyType', property: str):
+        '''props_enum 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def prop_menu_enum(self,
+                       data: 'AnyType',
+                       property: str,
+                       text: str = "",
+                       text_ctxt: str = "",
+                       translate: bool = True,
+                       icon: typing.Union[int, str] = 'NONE'):
+        '''prop_menu_enum 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        '''
+        pass
+
+    def prop_enum(self,
+                  data: 'AnyType',
+                  property: str,
+                  value: str,
+                  text: str = "",
+                  text_ctxt: str = "",
+                  translate: bool = True,
+                  icon: typing.Union[int, str] = 'NONE'):
+        '''prop_enum 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param value: Enum property value 
+        :type value: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        '''
+        pass
+
+    def prop_search(self,
+                    data: 'AnyType',
+                    property: str,
+                    search_data: 'AnyType',
+                    search_property: str,
+                    text: str = "",
+                    text_ctxt: str = "",
+                    translate: bool = True,
+                    icon: typing.Union[int, str] = 'NONE'):
+        '''prop_search 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param search_data: Data from which to take collection to search in 
+        :type search_data: 'AnyType'
+        :param search_property: Identifier of search collection property 
+        :type search_property: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        '''
+        pass
+
+    def operator(self,
+                 operator: str,
+                 text: str = "",
+                 text_ctxt: str = "",
+                 translate: bool = True,
+                 icon: typing.Union[int, str] = 'NONE',
+                 emboss: bool = True,
+                 icon_value: int = 0) -> 'OperatorProperties':
+        '''Item. Places a button into the layout to call an Operator 
+
+        :param operator: Identifier of the operator 
+        :type operator: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        :param emboss: Draw the button itself, just the icon/text 
+        :type emboss: bool
+        :param icon_value: Icon Value, Override automatic icon of the item 
+        :type icon_value: int
+        :rtype: 'OperatorProperties'
+        :return:  Operator properties to fill in 
+        '''
+        pass
+
+    def operator_enum(self, operator: str, property: str):
+        '''operator_enum 
+
+        :param operator: Identifier of the operator 
+        :type operator: str
+        :param property: Identifier of property in operator 
+        :type property: str
+        '''
+        pass
+
+    def operator_menu_enum(self,
+                           operator: str,
+                           property: str,
+                           text: str = "",
+                           text_ctxt: str = "",
+                           translate: bool = True,
+                           icon: typing.Union[int, str] = 'NONE'):
+        '''operator_menu_enum 
+
+        :param operator: Identifier of the operator 
+        :type operator: str
+        :param property: Identifier of property in operator 
+        :type property: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        '''
+        pass
+
+    def label(self,
+              text: str = "",
+              text_ctxt: str = "",
+              translate: bool = True,
+              icon: typing.Union[int, str] = 'NONE',
+              icon_value: int = 0):
+        '''Item. Displays text and/or icon in the layout 
+
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        :param icon_value: Icon Value, Override automatic icon of the item 
+        :type icon_value: int
+        '''
+        pass
+
+    def menu(self,
+             menu: str,
+             text: str = "",
+             text_ctxt: str = "",
+             translate: bool = True,
+             icon: typing.Union[int, str] = 'NONE',
+             icon_value: int = 0):
+        '''menu 
+
+        :param menu: Identifier of the menu 
+        :type menu: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        :param icon: Icon, Override automatic icon of the item 
+        :type icon: typing.Union[int, str]
+        :param icon_value: Icon Value, Override automatic icon of the item 
+        :type icon_value: int
+        '''
+        pass
+
+    def separator(self, ):
+        '''Item. Inserts empty space into the layout between items 
+
+        '''
+        pass
+
+    def context_pointer_set(self, name: str, data: 'AnyType'):
+        '''context_pointer_set 
+
+        :param name: Name, Name of entry in the context 
+        :type name: str
+        :param data: Pointer to put in context 
+        :type data: 'AnyType'
+        '''
+        pass
+
+    def template_header(self, ):
+        '''Inserts common Space header UI (editor type selector) 
+
+        '''
+        pass
+
+    def template_ID(self,
+                    data: 'AnyType',
+                    property: str,
+                    new: str = "",
+                    open: str = "",
+                    unlink: str = ""):
+        '''template_ID 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param new: Operator identifier to create a new ID block 
+        :type new: str
+        :param open: Operator identifier to open a file for creating a new ID block 
+        :type open: str
+        :param unlink: Operator identifier to unlink the ID block 
+        :type unlink: str
+        '''
+        pass
+
+    def template_ID_preview(self,
+                            data: 'AnyType',
+                            property: str,
+                            new: str = "",
+                            open: str = "",
+                            unlink: str = "",
+                            rows: int = 0,
+                            cols: int = 0):
+        '''template_ID_preview 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param new: Operator identifier to create a new ID block 
+        :type new: str
+        :param open: Operator identifier to open a file for creating a new ID block 
+        :type open: str
+        :param unlink: Operator identifier to unlink the ID block 
+        :type unlink: str
+        :param rows: Number of thumbnail preview rows to display 
+        :type rows: int
+        :param cols: Number of thumbnail preview columns to display 
+        :type cols: int
+        '''
+        pass
+
+    def template_any_ID(self,
+                        data: 'AnyType',
+                        property: str,
+                        type_property: str,
+                        text: str = "",
+                        text_ctxt: str = "",
+                        translate: bool = True):
+        '''template_any_ID 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param type_property: Identifier of property in data giving the type of the ID-blocks to use 
+        :type type_property: str
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        '''
+        pass
+
+    def template_path_builder(self,
+                              data: 'AnyType',
+                              property: str,
+                              root: 'ID',
+                              text: str = "",
+                              text_ctxt: str = "",
+                              translate: bool = True):
+        '''template_path_builder 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param root: ID-block from which path is evaluated from 
+        :type root: 'ID'
+        :param text: Override automatic text of the item 
+        :type text: str
+        :param text_ctxt: Override automatic translation context of the given text 
+        :type text_ctxt: str
+        :param translate: Translate the given text, when UI translation is enabled 
+        :type translate: bool
+        '''
+        pass
+
+    def template_modifier(self, data: 'Modifier') -> 'UILayout':
+        '''Generates the UI layout for modifiers 
+
+        :param data: Modifier data 
+        :type data: 'Modifier'
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def template_constraint(self, data: 'Constraint') -> 'UILayout':
+        '''Generates the UI layout for constraints 
+
+        :param data: Constraint data 
+        :type data: 'Constraint'
+        :rtype: 'UILayout'
+        :return:  Sub-layout to put items in 
+        '''
+        pass
+
+    def template_preview(self,
+                         id: 'ID',
+                         show_buttons: bool = True,
+                         parent: 'ID' = None,
+                         slot: 'TextureSlot' = None,
+                         preview_id: str = ""):
+        '''Item. A preview window for materials, textures, lamps or worlds 
+
+        :param id: ID data-block 
+        :type id: 'ID'
+        :param show_buttons: Show preview buttons? 
+        :type show_buttons: bool
+        :param parent: ID data-block 
+        :type parent: 'ID'
+        :param slot: Texture slot 
+        :type slot: 'TextureSlot'
+        :param preview_id: Identifier of this preview widget, if not set the ID type will be used (i.e. all previews of materials without explicit ID will have the same size…) 
+        :type preview_id: str
+        '''
+        pass
+
+    def template_curve_mapping(self,
+                               data: 'AnyType',
+                               property: str,
+                               type: typing.Union[int, str] = 'NONE',
+                               levels: bool = False,
+                               brush: bool = False,
+                               use_negative_slope: bool = False):
+        '''Item. A curve mapping widget used for e.g falloff curves for lamps 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param type: Type, Type of curves to display 
+        :type type: typing.Union[int, str]
+        :param levels: Show black/white levels 
+        :type levels: bool
+        :param brush: Show brush options 
+        :type brush: bool
+        :param use_negative_slope: Use a negative slope by default 
+        :type use_negative_slope: bool
+        '''
+        pass
+
+    def template_color_ramp(self,
+                            data: 'AnyType',
+                            property: str,
+                            expand: bool = False):
+        '''Item. A color ramp widget 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param expand: Expand button to show more detail 
+        :type expand: bool
+        '''
+        pass
+
+    def template_icon_view(self,
+                           data: 'AnyType',
+                           property: str,
+                           show_labels: bool = False,
+                           scale: float = 5.0):
+        '''Enum. Large widget showing Icon previews 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param show_labels: Show enum label in preview buttons 
+        :type show_labels: bool
+        :param scale: Scale, Scale the icon size (by the button size) 
+        :type scale: float
+        '''
+        pass
+
+    def template_histogram(self, data: 'AnyType', property: str):
+        '''Item. A histogramm widget to analyze imaga data 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_waveform(self, data: 'AnyType', property: str):
+        '''Item. A waveform widget to analyze imaga data 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_vectorscope(self, data: 'AnyType', property: str):
+        '''Item. A vectorscope widget to analyze imaga data 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_layers(self, data: 'AnyType', property: str,
+                        used_layers_data: 'AnyType', used_layers_property: str,
+                        active_layer: int):
+        '''template_layers 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param used_layers_data: Data from which to take property 
+        :type used_layers_data: 'AnyType'
+        :param used_layers_property: Identifier of property in data 
+        :type used_layers_property: str
+        :param active_layer: Active Layer 
+        :type active_layer: int
+        '''
+        pass
+
+    def template_color_picker(self,
+                              data: 'AnyType',
+                              property: str,
+                              value_slider: bool = False,
+                              lock: bool = False,
+                              lock_luminosity: bool = False,
+                              cubic: bool = False):
+        '''Item. A color wheel widget to pick colors 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param value_slider: Display the value slider to the right of the color wheel 
+        :type value_slider: bool
+        :param lock: Lock the color wheel display to value 1.0 regardless of actual color 
+        :type lock: bool
+        :param lock_luminosity: Keep the color at its original vector length 
+        :type lock_luminosity: bool
+        :param cubic: Cubic saturation for picking values close to white 
+        :type cubic: bool
+        '''
+        pass
+
+    def template_palette(self,
+                         data: 'AnyType',
+                         property: str,
+                         color: bool = False):
+        '''Item. A palette used to pick colors 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param color: Display the colors as colors or values 
+        :type color: bool
+        '''
+        pass
+
+    def template_image_layers(self, image, image_user):
+        '''template_image_layers 
+
+        '''
+        pass
+
+    def template_image(self,
+                       data: 'AnyType',
+                       property: str,
+                       image_user,
+                       compact: bool = False,
+                       multiview: bool = False):
+        '''Item(s). User interface for selecting images and their source paths 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param compact: Use more compact layout 
+        :type compact: bool
+        :param multiview: Expose Multi-View options 
+        :type multiview: bool
+        '''
+        pass
+
+    def template_image_settings(self,
+                                image_settings,
+                                color_management: bool = False):
+        '''User interface for setting image format options 
+
+        :param color_management: Show color management settings 
+        :type color_management: bool
+        '''
+        pass
+
+    def template_image_stereo_3d(self, stereo_3d_format):
+        '''User interface for setting image stereo 3d options 
+
+        '''
+        pass
+
+    def template_image_views(self, image_settings):
+        '''User interface for setting image views output options 
+
+        '''
+        pass
+
+    def template_movieclip(self,
+                           data: 'AnyType',
+                           property: str,
+                           compact: bool = False):
+        '''Item(s). User interface for selecting movie clips and their source paths 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param compact: Use more compact layout 
+        :type compact: bool
+        '''
+        pass
+
+    def template_track(self, data: 'AnyType', property: str):
+        '''Item. A movie-track widget to preview tracking image. 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_marker(self,
+                        data: 'AnyType',
+                        property: str,
+                        clip_user,
+                        track,
+                        compact: bool = False):
+        '''Item. A widget to control single marker settings. 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        :param compact: Use more compact layout 
+        :type compact: bool
+        '''
+        pass
+
+    def template_movieclip_information(self, data: 'AnyType', property: str,
+                                       clip_user):
+        '''Item. Movie clip information data. 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_list(self,
+                      listtype_name: str,
+                      list_id: str = "",
+                      dataptr: 'AnyType' = "",
+                      propname: str = "",
+                      active_dataptr: 'AnyType' = "",
+                      active_propname: str = 0,
+                      item_dyntip_propname: str = "",
+                      rows: int = 5,
+                      maxrows: int = 5,
+                      type: typing.Union[int, str] = 'DEFAULT',
+                      columns: int = 9):
+        '''Item. A list widget to display data, e.g. vertexgroups. 
+
+        :param listtype_name: Identifier of the list type to use 
+        :type listtype_name: str
+        :param list_id: Identifier of this list widget (mandatory when using default “UI_UL_list” class). If this is set, the uilist gets a custom ID, otherwise it takes the name of the class used to define the uilist (for example, if the class name is “OBJECT_UL_vgroups”, and list_id is not set by the script, then bl_idname = “OBJECT_UL_vgroups”) 
+        :type list_id: str
+        :param dataptr: Data from which to take the Collection property 
+        :type dataptr: 'AnyType'
+        :param propname: Identifier of the Collection property in data 
+        :type propname: str
+        :param active_dataptr: Data from which to take the integer property, index of the active item 
+        :type active_dataptr: 'AnyType'
+        :param active_propname: Identifier of the integer property in active_data, index of the active item 
+        :type active_propname: str
+        :param item_dyntip_propname: Identifier of a string property in items, to use as tooltip content 
+        :type item_dyntip_propname: str
+        :param rows: Default and minimum number of rows to display 
+        :type rows: int
+        :param maxrows: Default maximum number of rows to display 
+        :type maxrows: int
+        :param type: Type, Type of layout to useDEFAULT Default Layout, Use the default, multi-rows layout.COMPACT Compact Layout, Use the compact, single-row layout.GRID Grid Layout, Use the grid-based layout. 
+        :type type: typing.Union[int, str]
+        :param columns: Number of items to display per row, for GRID layout 
+        :type columns: int
+        '''
+        pass
+
+    def template_running_jobs(self, ):
+        '''template_running_jobs 
+
+        '''
+        pass
+
+    def template_operator_search(self, ):
+        '''template_operator_search 
+
+        '''
+        pass
+
+    def template_header_3D(self, ):
+        '''Inserts common 3DView header UI (selectors for context mode, shading, etc.) 
+
+        '''
+        pass
+
+    def template_edit_mode_selection(self, ):
+        '''Inserts common 3DView Edit modes header UI (selector for selection mode) 
+
+        '''
+        pass
+
+    def template_reports_banner(self, ):
+        '''template_reports_banner 
+
+        '''
+        pass
+
+    def template_node_link(self, ntree, node, socket):
+        '''template_node_link 
+
+        '''
+        pass
+
+    def template_node_view(self, ntree, node, socket):
+        '''template_node_view 
+
+        '''
+        pass
+
+    def template_texture_user(self, ):
+        '''template_texture_user 
+
+        '''
+        pass
+
+    def template_keymap_item_properties(self, item):
+        '''template_keymap_item_properties 
+
+        '''
+        pass
+
+    def template_component_menu(self, data: 'AnyType', property: str, name=""):
+        '''Item. Display expanded property in a popup menu 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def introspect(self, ) -> str:
+        '''introspect 
+
+        :rtype: str
+        :return:  Descr, DESCR 
+        '''
+        pass
+
+    def template_colorspace_settings(self, data: 'AnyType', property: str):
+        '''Item. A widget to control input color space settings. 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_colormanaged_view_settings(self, data: 'AnyType',
+                                            property: str):
+        '''Item. A widget to control color managed view settings settings. 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
+
+    def template_node_socket(self, color: float = (0.0, 0.0, 0.0, 1.0)):
+        '''Node Socket Icon 
+
+        :param color: Color 
+        :type color: float
+        '''
+        pass
+
+    def template_cache_file(self, data: 'AnyType', property: str):
+        '''Item(s). User interface for selecting cache files and their source paths 
+
+        :param data: Data from which to take property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data 
+        :type property: str
+        '''
+        pass
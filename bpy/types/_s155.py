@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UIList:
+    '''UI list containing the elements of a collection '''
+
+    bitflag_filter_item: int = None
+    '''The value of the reserved bitflag ‘FILTER_ITEM’ (in filter_flags values) 
+
+    :type: int
+    '''
+
+    bl_idname: str = None
+    '''If this is set, the uilist gets a custom ID, otherwise it takes the name of the class used to define the uilist (for example, if the class name is “OBJECT_UL_vgroups”, and bl_idname is not set by the script, then bl_idname = “OBJECT_UL_vgroups”) 
+
+    :type: str
+    '''
+
+    filter_name: str = None
+    '''Only show items matching this name (use ‘*’ as wildcard) 
+
+    :type: str
+    '''
+
+    layout_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_filter_invert: bool = None
+    '''Invert filtering (show hidden items, and vice-versa) 
+
+    :type: bool
+    '''
+
+    use_filter_show: bool = None
+    '''Show filtering options 
+
+    :type: bool
+    '''
+
+    use_filter_sort_alpha: bool = None
+    '''Sort items by their name 
+
+    :type: bool
+    '''
+
+    use_filter_sort_reverse: bool = None
+    '''Invert the order of shown items 
+
+    :type: bool
+    '''
+
+    def draw_item(self,
+                  context,
+                  layout: 'UILayout',
+                  data: 'AnyType',
+                  item: 'AnyType',
+                  icon: int,
+                  active_data: 'AnyType',
+                  active_property: str,
+                  index: int = 0,
+                  flt_flag: int = 0):
+        '''Draw an item in the list (NOTE: when you define your own draw_item function, you may want to check given ‘item’ is of the right type…) 
+
+        :param layout: Layout to draw the item 
+        :type layout: 'UILayout'
+        :param data: Data from which to take Collection property 
+        :type data: 'AnyType'
+        :param item: Item of the collection property 
+        :type item: 'AnyType'
+        :param icon: Icon of the item in the collection 
+        :type icon: int
+        :param active_data: Data from which to take property for the active element 
+        :type active_data: 'AnyType'
+        :param active_property: Identifier of property in active_data, for the active element 
+        :type active_property: str
+        :param index: Index of the item in the collection 
+        :type index: int
+        :param flt_flag: The filter-flag result for this item 
+        :type flt_flag: int
+        '''
+        pass
+
+    def draw_filter(self, context, layout: 'UILayout'):
+        '''Draw filtering options 
+
+        :param layout: Layout to draw the item 
+        :type layout: 'UILayout'
+        '''
+        pass
+
+    def filter_items(self, context, data: 'AnyType', property: str):
+        '''Filter and/or re-order items of the collection (output filter results in filter_flags, and reorder results in filter_neworder arrays) 
+
+        :param data: Data from which to take Collection property 
+        :type data: 'AnyType'
+        :param property: Identifier of property in data, for the collection 
+        :type property: str
+        '''
+        pass
+
+
+class UIPieMenu:
+    layout: 'UILayout' = None
+    '''
+
+    :type: 'UILayout'
+    '''
+
+
+class UIPopupMenu:
+    layout: 'UILayout' = None
+    '''
+
+    :type: 'UILayout'
+    '''
+
+
+class UI_UL_list:
+    pass
+
+
+class UVLoopLayers:
+    '''Collection of uv loop layers '''
+
+    active: 'MeshUVLoopLayer' = None
+    '''Active UV loop layer 
+
+    :type: 'MeshUVLoopLayer'
+    '''
+
+    active_index: int = None
+    '''Active UV loop layer index 
+
+    :type: int
+    '''
+
+
+class UVProjectModifier:
+    '''UV projection modifier to set UVs from a projector '''
+
+    aspect_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    aspect_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    projector_count: int = None
+    '''Number of projectors to use 
+
+    :type: int
+    '''
+
+    projectors: typing.List['UVProjector'] = None
+    '''
+
+    :type: typing.List['UVProjector']
+    '''
+
+    scale_x: float = None
+    '''
+
+    :type: float
+    '''
+
+    scale_y: float = None
+    '''
+
+    :type: float
+    '''
+
+    use_image_override: bool = None
+    '''Override faces’ current images with the given image 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+
+class UVProjector:
+    '''UV projector used by the UV project modifier '''
+
+    object: 'Object' = None
+    '''Object to use as projector transform 
+
+    :type: 'Object'
+    '''
+
+
+class UVTextures:
+    '''Collection of UV maps '''
+
+    active: 'MeshTexturePolyLayer' = None
+    '''Active UV Map 
+
+    :type: 'MeshTexturePolyLayer'
+    '''
+
+    active_index: int = None
+    '''Active UV Map index 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "UVMap") -> 'MeshTexturePolyLayer':
+        '''Add a UV map layer to Mesh 
+
+        :param name: UV map name 
+        :type name: str
+        :rtype: 'MeshTexturePolyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+    def remove(self, layer: 'MeshTexturePolyLayer'):
+        '''Remove a vertex color layer 
+
+        :param layer: The layer to remove 
+        :type layer: 'MeshTexturePolyLayer'
+        '''
+        pass
+
+
+class UVWarpModifier:
+    '''Add target position to uv coordinates '''
+
+    axis_u: typing.Union[int, str] = None
+    '''Pole axis for rotation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    axis_v: typing.Union[int, str] = None
+    '''Pole axis for rotation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    bone_from: str = None
+    '''Bone defining offset 
+
+    :type: str
+    '''
+
+    bone_to: str = None
+    '''Bone defining offset 
+
+    :type: str
+    '''
+
+    center: float = None
+    '''Center point for rotate/scale 
+
+    :type: float
+    '''
+
+    object_from: 'Object' = None
+    '''Object defining offset 
+
+    :type: 'Object'
+    '''
+
+    object_to: 'Object' = None
+    '''Object defining offset 
+
+    :type: 'Object'
+    '''
+
+    uv_layer: str = None
+    '''UV Layer name 
+
+    :type: str
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class UnifiedPaintSettings:
+    '''Overrides for some of the active brush’s settings '''
+
+    color: float = None
+    '''
+
+    :type: float
+    '''
+
+    secondary_color: float = None
+    '''
+
+    :type: float
+    '''
+
+    size: int = None
+    '''Radius of the brush 
+
+    :type: int
+    '''
+
+    strength: float = None
+    '''How powerful the effect of the brush is when applied 
+
+    :type: float
+    '''
+
+    unprojected_radius: float = None
+    '''Radius of brush in Blender units 
+
+    :type: float
+    '''
+
+    use_locked_size: bool = None
+    '''When locked brush stays same size relative to object; when unlocked brush size is given in pixels 
+
+    :type: bool
+    '''
+
+    use_pressure_size: bool = None
+    '''Enable tablet pressure sensitivity for size 
+
+    :type: bool
+    '''
+
+    use_pressure_strength: bool = None
+    '''Enable tablet pressure sensitivity for strength 
+
+    :type: bool
+    '''
+
+    use_unified_color: bool = None
+    '''Instead of per-brush color, the color is shared across brushes 
+
+    :type: bool
+    '''
+
+    use_unified_size: bool = None
+    '''Instead of per-brush radius, the radius is shared across brushes 
+
+    :type: bool
+    '''
+
+    use_unified_strength: bool = None
+    '''Instead of per-brush strength, the strength is shared across brushes 
+
+    :type: bool
+    '''
+
+    use_unified_weight: bool = None
+    '''Instead of per-brush weight, the weight is shared across brushes 
+
+    :type: bool
+    '''
+
+    weight: float = None
+    '''Weight to assign in vertex groups 
+
+    :type: float
+    '''
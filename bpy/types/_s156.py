@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UnitSettings:
+    scale_length: float = None
+    '''Scale to use when converting between blender units and dimensions 
+
+    :type: float
+    '''
+
+    system: typing.Union[int, str] = None
+    '''The unit system to use for button display 
+
+    :type: typing.Union[int, str]
+    '''
+
+    system_rotation: typing.Union[int, str] = None
+    '''Unit to use for displaying/editing rotation values 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_separate: bool = None
+    '''Display units in pairs (e.g. 1m 0cm) 
+
+    :type: bool
+    '''
+
+
+class UnknownType:
+    '''Stub RNA type used for pointers to unknown or internal data '''
+
+    pass
+
+
+class UserPreferences:
+    '''Global user preferences '''
+
+    active_section: typing.Union[int, str] = None
+    '''Active section of the user preferences shown in the user interface 
+
+    :type: typing.Union[int, str]
+    '''
+
+    addons: typing.List['Addon'] = None
+    '''
+
+    :type: typing.List['Addon']
+    '''
+
+    app_template: str = None
+    '''
+
+    :type: str
+    '''
+
+    autoexec_paths: typing.List['PathCompare'] = None
+    '''
+
+    :type: typing.List['PathCompare']
+    '''
+
+    edit: 'UserPreferencesEdit' = None
+    '''Settings for interacting with Blender data 
+
+    :type: 'UserPreferencesEdit'
+    '''
+
+    filepaths: 'UserPreferencesFilePaths' = None
+    '''Default paths for external files 
+
+    :type: 'UserPreferencesFilePaths'
+    '''
+
+    inputs: 'UserPreferencesInput' = None
+    '''Settings for input devices 
+
+    :type: 'UserPreferencesInput'
+    '''
+
+    system: 'UserPreferencesSystem' = None
+    '''Graphics driver and operating system settings 
+
+    :type: 'UserPreferencesSystem'
+    '''
+
+    themes: typing.List['Theme'] = None
+    '''
+
+    :type: typing.List['Theme']
+    '''
+
+    ui_styles: typing.List['ThemeStyle'] = None
+    '''
+
+    :type: typing.List['ThemeStyle']
+    '''
+
+    version: int = None
+    '''Version of Blender the userpref.blend was saved with 
+
+    :type: int
+    '''
+
+    view: 'UserPreferencesView' = None
+    '''Preferences related to viewing data 
+
+    :type: 'UserPreferencesView'
+    '''
+
+
+class UserPreferencesEdit:
+    '''Settings for interacting with Blender data '''
+
+    auto_keying_mode: typing.Union[int, str] = None
+    '''Mode of automatic keyframe insertion for Objects and Bones (default setting used for new Scenes) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    fcurve_unselected_alpha: float = None
+    '''Amount that unselected F-Curves stand out from the background (Graph Editor) 
+
+    :type: float
+    '''
+
+    grease_pencil_default_color: float = None
+    '''Color of new Grease Pencil layers 
+
+    :type: float
+    '''
+
+    grease_pencil_eraser_radius: int = None
+    '''Radius of eraser ‘brush’ 
+
+    :type: int
+    '''
+
+    grease_pencil_euclidean_distance: int = None
+    '''Distance moved by mouse when drawing stroke to include 
+
+    :type: int
+    '''
+
+    grease_pencil_manhattan_distance: int = None
+    '''Pixels moved by mouse per axis when drawing stroke 
+
+    :type: int
+    '''
+
+    keyframe_new_handle_type: typing.Union[int, str] = None
+    '''Handle type for handles of new keyframes 
+
+    :type: typing.Union[int, str]
+    '''
+
+    keyframe_new_interpolation_type: typing.Union[int, str] = None
+    '''Interpolation mode used for first keyframe on newly added F-Curves (subsequent keyframes take interpolation from preceding keyframe) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    material_link: typing.Union[int, str] = None
+    '''Toggle whether the material is linked to object data or the object block 
+
+    :type: typing.Union[int, str]
+    '''
+
+    node_margin: int = None
+    '''Minimum distance between nodes for Auto-offsetting nodes 
+
+    :type: int
+    '''
+
+    object_align: typing.Union[int, str] = None
+    '''When adding objects from a 3D View menu, either align them with that view or with the world 
+
+    :type: typing.Union[int, str]
+    '''
+
+    sculpt_paint_overlay_color: float = None
+    '''Color of texture overlay 
+
+    :type: float
+    '''
+
+    undo_memory_limit: int = None
+    '''Maximum memory usage in megabytes (0 means unlimited) 
+
+    :type: int
+    '''
+
+    undo_steps: int = None
+    '''Number of undo steps available (smaller values conserve memory) 
+
+    :type: int
+    '''
+
+    use_auto_keying: bool = None
+    '''Automatic keyframe insertion for Objects and Bones (default setting used for new Scenes) 
+
+    :type: bool
+    '''
+
+    use_auto_keying_warning: bool = None
+    '''Show warning indicators when transforming objects and bones if auto keying is enabled 
+
+    :type: bool
+    '''
+
+    use_drag_immediately: bool = None
+    '''Moving things with a mouse drag confirms when releasing the button 
+
+    :type: bool
+    '''
+
+    use_duplicate_action: bool = None
+    '''Causes actions to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_armature: bool = None
+    '''Causes armature data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_curve: bool = None
+    '''Causes curve data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_fcurve: bool = None
+    '''Causes F-curve data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_lamp: bool = None
+    '''Causes lamp data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_material: bool = None
+    '''Causes material data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_mesh: bool = None
+    '''Causes mesh data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_metaball: bool = None
+    '''Causes metaball data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_particle: bool = None
+    '''Causes particle systems to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_surface: bool = None
+    '''Causes surface data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_text: bool = None
+    '''Causes text data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_duplicate_texture: bool = None
+    '''Causes texture data to be duplicated with the object 
+
+    :type: bool
+    '''
+
+    use_enter_edit_mode: bool = None
+    '''Enter Edit Mode automatically after adding a new object 
+
+    :type: bool
+    '''
+
+    use_global_undo: bool = None
+    '''Global undo works by keeping a full copy of the file itself in memory, so takes extra memory 
+
+    :type: bool
+    '''
+
+    use_grease_pencil_simplify_stroke: bool = None
+    '''Simplify the final stroke 
+
+    :type: bool
+    '''
+
+    use_insertkey_xyz_to_rgb: bool = None
+    '''Color for newly added transformation F-Curves (Location, Rotation, Scale) and also Color is based on the transform axis 
+
+    :type: bool
+    '''
+
+    use_keyframe_insert_available: bool = None
+    '''Automatic keyframe insertion in available F-Curves 
+
+    :type: bool
+    '''
+
+    use_keyframe_insert_needed: bool = None
+    '''Keyframe insertion only when keyframe needed 
+
+    :type: bool
+    '''
+
+    use_negative_frames: bool = None
+    '''Current frame number can be manually set to a negative value 
+
+    :type: bool
+    '''
+
+    use_visual_keying: bool = None
+    '''Use Visual keying automatically for constrained objects 
+
+    :type: bool
+    '''
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UserPreferencesFilePaths:
+    '''Default paths for external files '''
+
+    animation_player: str = None
+    '''Path to a custom animation/frame sequence player 
+
+    :type: str
+    '''
+
+    animation_player_preset: typing.Union[int, str] = None
+    '''Preset configs for external animation players 
+
+    :type: typing.Union[int, str]
+    '''
+
+    auto_save_time: int = None
+    '''The time (in minutes) to wait between automatic temporary saves 
+
+    :type: int
+    '''
+
+    font_directory: str = None
+    '''The default directory to search for loading fonts 
+
+    :type: str
+    '''
+
+    hide_recent_locations: bool = None
+    '''Hide recent locations in the file selector 
+
+    :type: bool
+    '''
+
+    hide_system_bookmarks: bool = None
+    '''Hide system bookmarks in the file selector 
+
+    :type: bool
+    '''
+
+    i18n_branches_directory: str = None
+    '''The path to the ‘/branches’ directory of your local svn-translation copy, to allow translating from the UI 
+
+    :type: str
+    '''
+
+    image_editor: str = None
+    '''Path to an image editor 
+
+    :type: str
+    '''
+
+    recent_files: int = None
+    '''Maximum number of recently opened files to remember 
+
+    :type: int
+    '''
+
+    render_cache_directory: str = None
+    '''Where to cache raw render results 
+
+    :type: str
+    '''
+
+    render_output_directory: str = None
+    '''The default directory for rendering output, for new scenes 
+
+    :type: str
+    '''
+
+    save_version: int = None
+    '''The number of old versions to maintain in the current directory, when manually saving 
+
+    :type: int
+    '''
+
+    script_directory: str = None
+    '''Alternate script path, matching the default layout with subdirs: startup, add-ons & modules (requires restart) 
+
+    :type: str
+    '''
+
+    show_hidden_files_datablocks: bool = None
+    '''Hide files/data-blocks that start with a dot (.*) 
+
+    :type: bool
+    '''
+
+    show_thumbnails: bool = None
+    '''Open in thumbnail view for images and movies 
+
+    :type: bool
+    '''
+
+    sound_directory: str = None
+    '''The default directory to search for sounds 
+
+    :type: str
+    '''
+
+    temporary_directory: str = None
+    '''The directory for storing temporary save files 
+
+    :type: str
+    '''
+
+    texture_directory: str = None
+    '''The default directory to search for textures 
+
+    :type: str
+    '''
+
+    use_auto_save_temporary_files: bool = None
+    '''Automatic saving of temporary files in temp directory, uses process ID (Sculpt or edit mode data won’t be saved!’) 
+
+    :type: bool
+    '''
+
+    use_file_compression: bool = None
+    '''Enable file compression when saving .blend files 
+
+    :type: bool
+    '''
+
+    use_filter_files: bool = None
+    '''Display only files with extensions in the image select window 
+
+    :type: bool
+    '''
+
+    use_keep_session: bool = None
+    '''Always load session recovery and save it after quitting Blender 
+
+    :type: bool
+    '''
+
+    use_load_ui: bool = None
+    '''Load user interface setup when loading .blend files 
+
+    :type: bool
+    '''
+
+    use_relative_paths: bool = None
+    '''Default relative path option for the file selector 
+
+    :type: bool
+    '''
+
+    use_save_preview_images: bool = None
+    '''Enables automatic saving of preview images in the .blend file 
+
+    :type: bool
+    '''
+
+
+class UserPreferencesInput:
+    '''Settings for input devices '''
+
+    active_keyconfig: str = None
+    '''The name of the active key configuration 
+
+    :type: str
+    '''
+
+    drag_threshold: int = None
+    '''Amount of pixels you have to drag before dragging UI items happens 
+
+    :type: int
+    '''
+
+    invert_mouse_zoom: bool = None
+    '''Invert the axis of mouse movement for zooming 
+
+    :type: bool
+    '''
+
+    invert_zoom_wheel: bool = None
+    '''Swap the Mouse Wheel zoom direction 
+
+    :type: bool
+    '''
+
+    mouse_double_click_time: int = None
+    '''Time/delay (in ms) for a double click 
+
+    :type: int
+    '''
+
+    navigation_mode: typing.Union[int, str] = None
+    '''Which method to use for viewport navigation 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ndof_deadzone: float = None
+    '''Threshold of initial movement needed from the device’s rest position 
+
+    :type: float
+    '''
+
+    ndof_fly_helicopter: bool = None
+    '''Device up/down directly controls your Z position 
+
+    :type: bool
+    '''
+
+    ndof_lock_horizon: bool = None
+    '''Keep horizon level while flying with 3D Mouse 
+
+    :type: bool
+    '''
+
+    ndof_orbit_sensitivity: float = None
+    '''Overall sensitivity of the 3D Mouse for orbiting 
+
+    :type: float
+    '''
+
+    ndof_pan_yz_swap_axis: bool = None
+    '''Pan using up/down on the device (otherwise forward/backward) 
+
+    :type: bool
+    '''
+
+    ndof_panx_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_pany_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_panz_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_rotx_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_roty_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_rotz_invert_axis: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    ndof_sensitivity: float = None
+    '''Overall sensitivity of the 3D Mouse for panning 
+
+    :type: float
+    '''
+
+    ndof_show_guide: bool = None
+    '''Display the center and axis during rotation 
+
+    :type: bool
+    '''
+
+    ndof_view_navigate_method: typing.Union[int, str] = None
+    '''Navigation style in the viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ndof_view_rotate_method: typing.Union[int, str] = None
+    '''Rotation style in the viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ndof_zoom_invert: bool = None
+    '''Zoom using opposite direction 
+
+    :type: bool
+    '''
+
+    select_mouse: typing.Union[int, str] = None
+    '''Mouse button used for selection 
+
+    :type: typing.Union[int, str]
+    '''
+
+    tweak_threshold: int = None
+    '''Number of pixels you have to drag before tweak event is triggered 
+
+    :type: int
+    '''
+
+    use_emulate_numpad: bool = None
+    '''Main 1 to 0 keys act as the numpad ones (useful for laptops) 
+
+    :type: bool
+    '''
+
+    use_mouse_continuous: bool = None
+    '''Allow moving the mouse outside the view on some manipulations (transform, ui control drag) 
+
+    :type: bool
+    '''
+
+    use_mouse_emulate_3_button: bool = None
+    '''Emulate Middle Mouse with Alt+Left Mouse (doesn’t work with Left Mouse Select option) 
+
+    :type: bool
+    '''
+
+    use_mouse_mmb_paste: bool = None
+    '''In text window, paste with middle mouse button instead of panning 
+
+    :type: bool
+    '''
+
+    use_ndof: bool = None
+    '''
+
+    :type: bool
+    '''
+
+    use_trackpad_natural: bool = None
+    '''If your system uses ‘natural’ scrolling, this option keeps consistent trackpad usage throughout the UI 
+
+    :type: bool
+    '''
+
+    view_rotate_method: typing.Union[int, str] = None
+    '''Rotation style in the viewport 
+
+    :type: typing.Union[int, str]
+    '''
+
+    view_zoom_axis: typing.Union[int, str] = None
+    '''Axis of mouse movement to zoom in or out on 
+
+    :type: typing.Union[int, str]
+    '''
+
+    view_zoom_method: typing.Union[int, str] = None
+    '''Which style to use for viewport scaling 
+
+    :type: typing.Union[int, str]
+    '''
+
+    walk_navigation: 'WalkNavigation' = None
+    '''Settings for walk navigation mode 
+
+    :type: 'WalkNavigation'
+    '''
+
+    wheel_scroll_lines: int = None
+    '''Number of lines scrolled at a time with the mouse wheel 
+
+    :type: int
+    '''
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UserPreferencesSystem:
+    '''Graphics driver and operating system settings '''
+
+    anisotropic_filter: typing.Union[int, str] = None
+    '''Quality of the anisotropic filtering (values greater than 1.0 enable anisotropic filtering) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_channels: typing.Union[int, str] = None
+    '''Audio channel count 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_device: typing.Union[int, str] = None
+    '''Audio output device 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_mixing_buffer: typing.Union[int, str] = None
+    '''Number of samples used by the audio mixing buffer 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_sample_format: typing.Union[int, str] = None
+    '''Audio sample format 
+
+    :type: typing.Union[int, str]
+    '''
+
+    audio_sample_rate: typing.Union[int, str] = None
+    '''Audio sample rate 
+
+    :type: typing.Union[int, str]
+    '''
+
+    author: str = None
+    '''Name that will be used in exported files when format supports such feature 
+
+    :type: str
+    '''
+
+    color_picker_type: typing.Union[int, str] = None
+    '''Different styles of displaying the color picker widget 
+
+    :type: typing.Union[int, str]
+    '''
+
+    dpi: int = None
+    '''DPI for add-ons to use when drawing custom user interface elements, controlled by operating system settings and Blender UI scale, with a reference value of 72 DPI (note that since this value includes a user defined scale, it is not always the actual monitor DPI) 
+
+    :type: int
+    '''
+
+    font_path_ui: str = None
+    '''Path to interface font 
+
+    :type: str
+    '''
+
+    font_path_ui_mono: str = None
+    '''Path to interface mono-space Font 
+
+    :type: str
+    '''
+
+    frame_server_port: int = None
+    '''Frameserver Port for Frameserver Rendering 
+
+    :type: int
+    '''
+
+    gl_clip_alpha: float = None
+    '''Clip alpha below this threshold in the 3D textured view 
+
+    :type: float
+    '''
+
+    gl_texture_limit: typing.Union[int, str] = None
+    '''Limit the texture size to save graphics memory 
+
+    :type: typing.Union[int, str]
+    '''
+
+    image_draw_method: typing.Union[int, str] = None
+    '''Method used for displaying images on the screen 
+
+    :type: typing.Union[int, str]
+    '''
+
+    legacy_compute_device_type: int = None
+    '''For backwards compatibility only 
+
+    :type: int
+    '''
+
+    memory_cache_limit: int = None
+    '''Memory cache limit (in megabytes) 
+
+    :type: int
+    '''
+
+    multi_sample: typing.Union[int, str] = None
+    '''Enable OpenGL multi-sampling, only for systems that support it, requires restart 
+
+    :type: typing.Union[int, str]
+    '''
+
+    opensubdiv_compute_type: typing.Union[int, str] = None
+    '''Type of computer back-end used with OpenSubdiv 
+
+    :type: typing.Union[int, str]
+    '''
+
+    pixel_size: float = None
+    '''Suggested line thickness and point size in pixels, for add-ons drawing custom user interface elements, controlled by operating system settings and Blender UI scale 
+
+    :type: float
+    '''
+
+    prefetch_frames: int = None
+    '''Number of frames to render ahead during playback (sequencer only) 
+
+    :type: int
+    '''
+
+    screencast_fps: int = None
+    '''Frame rate for the screencast to be played back 
+
+    :type: int
+    '''
+
+    screencast_wait_time: int = None
+    '''Time in milliseconds between each frame recorded for screencast 
+
+    :type: int
+    '''
+
+    scrollback: int = None
+    '''Maximum number of lines to store for the console buffer 
+
+    :type: int
+    '''
+
+    select_method: typing.Union[int, str] = None
+    '''Use OpenGL occlusion queries or selection render mode to accelerate selection 
+
+    :type: typing.Union[int, str]
+    '''
+
+    solid_lights: typing.List['UserSolidLight'] = None
+    '''Lights user to display objects in solid draw mode 
+
+    :type: typing.List['UserSolidLight']
+    '''
+
+    texture_collection_rate: int = None
+    '''Number of seconds between each run of the GL texture garbage collector 
+
+    :type: int
+    '''
+
+    texture_time_out: int = None
+    '''Time since last access of a GL texture in seconds after which it is freed (set to 0 to keep textures allocated) 
+
+    :type: int
+    '''
+
+    use_16bit_textures: bool = None
+    '''Use 16 bit per component texture for float images 
+
+    :type: bool
+    '''
+
+    use_gpu_mipmap: bool = None
+    '''Generate Image Mipmaps on the GPU 
+
+    :type: bool
+    '''
+
+    use_international_fonts: bool = None
+    '''Use international fonts 
+
+    :type: bool
+    '''
+
+    use_mipmaps: bool = None
+    '''Scale textures for the 3D View (looks nicer but uses more memory and slows image reloading) 
+
+    :type: bool
+    '''
+
+    use_preview_images: bool = None
+    '''Allow user to choose any codec (Windows only, might generate instability) 
+
+    :type: bool
+    '''
+
+    use_region_overlap: bool = None
+    '''Draw tool/property regions over the main region, when using Triple Buffer 
+
+    :type: bool
+    '''
+
+    use_scripts_auto_execute: bool = None
+    '''Allow any .blend file to run scripts automatically (unsafe with blend files from an untrusted source) 
+
+    :type: bool
+    '''
+
+    use_select_pick_depth: bool = None
+    '''Use the depth buffer for picking 3D View selection 
+
+    :type: bool
+    '''
+
+    use_tabs_as_spaces: bool = None
+    '''Automatically convert all new tabs into spaces for new and loaded text files 
+
+    :type: bool
+    '''
+
+    use_text_antialiasing: bool = None
+    '''Draw user interface text anti-aliased 
+
+    :type: bool
+    '''
+
+    use_translate_interface: bool = None
+    '''Translate interface 
+
+    :type: bool
+    '''
+
+    use_translate_new_dataname: bool = None
+    '''Translate new data names (when adding/creating some) 
+
+    :type: bool
+    '''
+
+    use_translate_tooltips: bool = None
+    '''Translate tooltips 
+
+    :type: bool
+    '''
+
+    use_weight_color_range: bool = None
+    '''Enable color range used for weight visualization in weight painting mode 
+
+    :type: bool
+    '''
+
+    weight_color_range: 'ColorRamp' = None
+    '''Color range used for weight visualization in weight painting mode 
+
+    :type: 'ColorRamp'
+    '''
+
+    window_draw_method: typing.Union[int, str] = None
+    '''Drawing method used by the window manager 
+
+    :type: typing.Union[int, str]
+    '''
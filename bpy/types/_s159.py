@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class UserPreferencesView:
+    '''Preferences related to viewing data '''
+
+    manipulator_handle_size: int = None
+    '''Size of manipulator handles as percentage of the radius 
+
+    :type: int
+    '''
+
+    manipulator_hotspot: int = None
+    '''Distance around the handles to accept mouse clicks 
+
+    :type: int
+    '''
+
+    manipulator_size: int = None
+    '''Diameter of the manipulator 
+
+    :type: int
+    '''
+
+    mini_axis_brightness: int = None
+    '''Brightness of the icon 
+
+    :type: int
+    '''
+
+    mini_axis_size: int = None
+    '''The axes icon’s size 
+
+    :type: int
+    '''
+
+    object_origin_size: int = None
+    '''Diameter in Pixels for Object/Lamp origin display 
+
+    :type: int
+    '''
+
+    open_left_mouse_delay: int = None
+    '''Time in 1/10 seconds to hold the Left Mouse Button before opening the toolbox 
+
+    :type: int
+    '''
+
+    open_right_mouse_delay: int = None
+    '''Time in 1/10 seconds to hold the Right Mouse Button before opening the toolbox 
+
+    :type: int
+    '''
+
+    open_sublevel_delay: int = None
+    '''Time delay in 1/10 seconds before automatically opening sub level menus 
+
+    :type: int
+    '''
+
+    open_toplevel_delay: int = None
+    '''Time delay in 1/10 seconds before automatically opening top level menus 
+
+    :type: int
+    '''
+
+    pie_animation_timeout: int = None
+    '''Time needed to fully animate the pie to unfolded state (in 1/100ths of sec) 
+
+    :type: int
+    '''
+
+    pie_initial_timeout: int = None
+    '''Pie menus will use the initial mouse position as center for this amount of time (in 1/100ths of sec) 
+
+    :type: int
+    '''
+
+    pie_menu_confirm: int = None
+    '''Distance threshold after which selection is made (zero to disable) 
+
+    :type: int
+    '''
+
+    pie_menu_radius: int = None
+    '''Pie menu size in pixels 
+
+    :type: int
+    '''
+
+    pie_menu_threshold: int = None
+    '''Distance from center needed before a selection can be made 
+
+    :type: int
+    '''
+
+    rotation_angle: float = None
+    '''Rotation step for numerical pad keys (2 4 6 8) 
+
+    :type: float
+    '''
+
+    show_column_layout: bool = None
+    '''Use a column layout for toolbox 
+
+    :type: bool
+    '''
+
+    show_large_cursors: bool = None
+    '''Use large mouse cursors when available 
+
+    :type: bool
+    '''
+
+    show_manipulator: bool = None
+    '''Use 3D transform manipulator 
+
+    :type: bool
+    '''
+
+    show_mini_axis: bool = None
+    '''Show a small rotating 3D axes in the bottom left corner of the 3D View 
+
+    :type: bool
+    '''
+
+    show_object_info: bool = None
+    '''Display objects name and frame number in 3D view 
+
+    :type: bool
+    '''
+
+    show_playback_fps: bool = None
+    '''Show the frames per second screen refresh rate, while animation is played back 
+
+    :type: bool
+    '''
+
+    show_splash: bool = None
+    '''Display splash screen on startup 
+
+    :type: bool
+    '''
+
+    show_tooltips: bool = None
+    '''Display tooltips (when off hold Alt to force display) 
+
+    :type: bool
+    '''
+
+    show_tooltips_python: bool = None
+    '''Show Python references in tooltips 
+
+    :type: bool
+    '''
+
+    show_view_name: bool = None
+    '''Show the name of the view’s direction in each 3D View 
+
+    :type: bool
+    '''
+
+    smooth_view: int = None
+    '''Time to animate the view in milliseconds, zero to disable 
+
+    :type: int
+    '''
+
+    timecode_style: typing.Union[int, str] = None
+    '''Format of Time Codes displayed when not displaying timing in terms of frames 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ui_line_width: typing.Union[int, str] = None
+    '''Changes the thickness of lines and points in the interface 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ui_scale: float = None
+    '''Changes the size of the fonts and buttons in the interface 
+
+    :type: float
+    '''
+
+    use_auto_perspective: bool = None
+    '''Automatically switch between orthographic and perspective when changing from top/front/side views 
+
+    :type: bool
+    '''
+
+    use_camera_lock_parent: bool = None
+    '''When the camera is locked to the view and in fly mode, transform the parent rather than the camera 
+
+    :type: bool
+    '''
+
+    use_cursor_lock_adjust: bool = None
+    '''Place the cursor without ‘jumping’ to the new location (when lock-to-cursor is used) 
+
+    :type: bool
+    '''
+
+    use_directional_menus: bool = None
+    '''Otherwise menus, etc will always be top to bottom, left to right, no matter opening direction 
+
+    :type: bool
+    '''
+
+    use_global_pivot: bool = None
+    '''Lock the same rotation/scaling pivot in all 3D Views 
+
+    :type: bool
+    '''
+
+    use_global_scene: bool = None
+    '''Force the current Scene to be displayed in all Screens 
+
+    :type: bool
+    '''
+
+    use_mouse_depth_cursor: bool = None
+    '''Use the depth under the mouse when placing the cursor 
+
+    :type: bool
+    '''
+
+    use_mouse_depth_navigate: bool = None
+    '''Use the depth under the mouse to improve view pan/rotate/zoom functionality 
+
+    :type: bool
+    '''
+
+    use_mouse_over_open: bool = None
+    '''Open menu buttons and pulldowns automatically when the mouse is hovering 
+
+    :type: bool
+    '''
+
+    use_quit_dialog: bool = None
+    '''Ask for confirmation when quitting through the window close button 
+
+    :type: bool
+    '''
+
+    use_rotate_around_active: bool = None
+    '''Use selection as the pivot point 
+
+    :type: bool
+    '''
+
+    use_zoom_to_mouse: bool = None
+    '''Zoom in towards the mouse pointer’s position in the 3D view, rather than the 2D window center 
+
+    :type: bool
+    '''
+
+    view2d_grid_spacing_min: int = None
+    '''Minimum number of pixels between each gridline in 2D Viewports 
+
+    :type: int
+    '''
+
+    view_frame_keyframes: int = None
+    '''Keyframes around cursor that we zoom around 
+
+    :type: int
+    '''
+
+    view_frame_seconds: float = None
+    '''Seconds around cursor that we zoom around 
+
+    :type: float
+    '''
+
+    view_frame_type: typing.Union[int, str] = None
+    '''How zooming to frame focuses around current frame 
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class UserSolidLight:
+    '''Light used for OpenGL lighting in solid draw mode '''
+
+    diffuse_color: float = None
+    '''Diffuse color of the OpenGL light 
+
+    :type: float
+    '''
+
+    direction: float = None
+    '''Direction that the OpenGL light is shining 
+
+    :type: float
+    '''
+
+    specular_color: float = None
+    '''Color of the light’s specular highlight 
+
+    :type: float
+    '''
+
+    use: bool = None
+    '''Enable this OpenGL light in solid draw mode 
+
+    :type: bool
+    '''
+
+
+class UvSculpt:
+    pass
+
+
+class VIEW3D_MT_transform:
+    pass
+
+
+class VIEW3D_MT_transform_armature:
+    pass
+
+
+class VIEW3D_MT_transform_object:
+    pass
+
+
+class VectorFont:
+    '''Vector font for Text objects '''
+
+    filepath: str = None
+    '''
+
+    :type: str
+    '''
+
+    packed_file: 'PackedFile' = None
+    '''
+
+    :type: 'PackedFile'
+    '''
+
+    def pack(self, ):
+        '''Pack the font into the current blend file 
+
+        '''
+        pass
+
+    def unpack(self, method: typing.Union[int, str] = 'USE_LOCAL'):
+        '''Unpack the font to the samples filename 
+
+        :param method: method, How to unpack 
+        :type method: typing.Union[int, str]
+        '''
+        pass
+
+
+class VertexColors:
+    '''Collection of vertex colors '''
+
+    active: 'MeshColorLayer' = None
+    '''Active vertex color layer 
+
+    :type: 'MeshColorLayer'
+    '''
+
+    active_index: int = None
+    '''Active vertex color index 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "Col") -> 'MeshColorLayer':
+        '''Add a vertex color layer to Mesh 
+
+        :param name: Vertex color name 
+        :type name: str
+        :rtype: 'MeshColorLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class VertexFloatProperties:
+    '''Collection of float properties '''
+
+    def new(self, name: str = "FloatProp") -> 'MeshVertexFloatPropertyLayer':
+        '''Add a float property layer to Mesh 
+
+        :param name: Float property name 
+        :type name: str
+        :rtype: 'MeshVertexFloatPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class VertexGroup:
+    '''Group of vertices, used for armature deform and other purposes '''
+
+    index: int = None
+    '''Index number of the vertex group 
+
+    :type: int
+    '''
+
+    lock_weight: bool = None
+    '''Maintain the relative weights for the group 
+
+    :type: bool
+    '''
+
+    name: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+    def add(self, index: int, weight: float, type: typing.Union[int, str]):
+        '''Add vertices to the group 
+
+        :param index: Index List 
+        :type index: int
+        :param weight: Vertex weight 
+        :type weight: float
+        :param type: Vertex assign modeREPLACE Replace, Replace.ADD Add, Add.SUBTRACT Subtract, Subtract. 
+        :type type: typing.Union[int, str]
+        '''
+        pass
+
+    def remove(self, index: int):
+        '''Remove a vertex from the group 
+
+        :param index: Index List 
+        :type index: int
+        '''
+        pass
+
+    def weight(self, index: int) -> float:
+        '''Get a vertex weight from the group 
+
+        :param index: Index, The index of the vertex 
+        :type index: int
+        :rtype: float
+        :return:  Vertex weight 
+        '''
+        pass
+
+
+class VertexGroupElement:
+    '''Weight value of a vertex in a vertex group '''
+
+    group: int = None
+    '''
+
+    :type: int
+    '''
+
+    weight: float = None
+    '''Vertex Weight 
+
+    :type: float
+    '''
+
+
+class VertexGroups:
+    '''Collection of vertex groups '''
+
+    active: 'VertexGroup' = None
+    '''Vertex groups of the object 
+
+    :type: 'VertexGroup'
+    '''
+
+    active_index: int = None
+    '''Active index in vertex group array 
+
+    :type: int
+    '''
+
+    def new(self, name: str = "Group") -> 'VertexGroup':
+        '''Add vertex group to object 
+
+        :param name: Vertex group name 
+        :type name: str
+        :rtype: 'VertexGroup'
+        :return:  New vertex group 
+        '''
+        pass
+
+    def remove(self, group: 'VertexGroup'):
+        '''Delete vertex group from object 
+
+        :param group: Vertex group to remove 
+        :type group: 'VertexGroup'
+        '''
+        pass
+
+    def clear(self, ):
+        '''Delete all vertex groups from object 
+
+        '''
+        pass
+
+
+class VertexIntProperties:
+    '''Collection of int properties '''
+
+    def new(self, name: str = "IntProp") -> 'MeshVertexIntPropertyLayer':
+        '''Add a integer property layer to Mesh 
+
+        :param name: Int property name 
+        :type name: str
+        :rtype: 'MeshVertexIntPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class VertexPaint:
+    '''Properties of vertex and weight paint mode '''
+
+    use_group_restrict: bool = None
+    '''Restrict painting to vertices in the group 
+
+    :type: bool
+    '''
+
+    use_normal: bool = None
+    '''Apply the vertex normal before painting 
+
+    :type: bool
+    '''
+
+    use_spray: bool = None
+    '''Keep applying paint effect while holding mouse 
+
+    :type: bool
+    '''
+
+
+class VertexStringProperties:
+    '''Collection of string properties '''
+
+    def new(self, name: str = "StringProp") -> 'MeshVertexStringPropertyLayer':
+        '''Add a string property layer to Mesh 
+
+        :param name: String property name 
+        :type name: str
+        :rtype: 'MeshVertexStringPropertyLayer'
+        :return:  The newly created layer 
+        '''
+        pass
+
+
+class VertexWeightEditModifier:
+    '''Edit the weights of vertices in a group '''
+
+    add_threshold: float = None
+    '''Lower bound for a vertex’s weight to be added to the vgroup 
+
+    :type: float
+    '''
+
+    default_weight: float = None
+    '''Default weight a vertex will have if it is not in the vgroup 
+
+    :type: float
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''How weights are mapped to their new values 
+
+    :type: typing.Union[int, str]
+    '''
+
+    map_curve: 'CurveMapping' = None
+    '''Custom mapping curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    mask_constant: float = None
+    '''Global influence of current modifications on vgroup 
+
+    :type: float
+    '''
+
+    mask_tex_map_object: 'Object' = None
+    '''Which object to take texture coordinates from 
+
+    :type: 'Object'
+    '''
+
+    mask_tex_mapping: typing.Union[int, str] = None
+    '''Which texture coordinates to use for mapping 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_use_channel: typing.Union[int, str] = None
+    '''Which texture channel to use for masking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    mask_texture: 'Texture' = None
+    '''Masking texture 
+
+    :type: 'Texture'
+    '''
+
+    mask_vertex_group: str = None
+    '''Masking vertex group name 
+
+    :type: str
+    '''
+
+    remove_threshold: float = None
+    '''Upper bound for a vertex’s weight to be removed from the vgroup 
+
+    :type: float
+    '''
+
+    use_add: bool = None
+    '''Add vertices with weight over threshold to vgroup 
+
+    :type: bool
+    '''
+
+    use_remove: bool = None
+    '''Remove vertices with weight below threshold from vgroup 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class VertexWeightMixModifier:
+    '''Mix the weights of two vertex groups '''
+
+    default_weight_a: float = None
+    '''Default weight a vertex will have if it is not in the first A vgroup 
+
+    :type: float
+    '''
+
+    default_weight_b: float = None
+    '''Default weight a vertex will have if it is not in the second B vgroup 
+
+    :type: float
+    '''
+
+    mask_constant: float = None
+    '''Global influence of current modifications on vgroup 
+
+    :type: float
+    '''
+
+    mask_tex_map_object: 'Object' = None
+    '''Which object to take texture coordinates from 
+
+    :type: 'Object'
+    '''
+
+    mask_tex_mapping: typing.Union[int, str] = None
+    '''Which texture coordinates to use for mapping 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_use_channel: typing.Union[int, str] = None
+    '''Which texture channel to use for masking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    mask_texture: 'Texture' = None
+    '''Masking texture 
+
+    :type: 'Texture'
+    '''
+
+    mask_vertex_group: str = None
+    '''Masking vertex group name 
+
+    :type: str
+    '''
+
+    mix_mode: typing.Union[int, str] = None
+    '''How weights from vgroup B affect weights of vgroup A 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mix_set: typing.Union[int, str] = None
+    '''Which vertices should be affected 
+
+    :type: typing.Union[int, str]
+    '''
+
+    vertex_group_a: str = None
+    '''First vertex group name 
+
+    :type: str
+    '''
+
+    vertex_group_b: str = None
+    '''Second vertex group name 
+
+    :type: str
+    '''
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class VertexWeightProximityModifier:
+    '''Set the weights of vertices in a group from a target object’s distance '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''How weights are mapped to their new values 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_constant: float = None
+    '''Global influence of current modifications on vgroup 
+
+    :type: float
+    '''
+
+    mask_tex_map_object: 'Object' = None
+    '''Which object to take texture coordinates from 
+
+    :type: 'Object'
+    '''
+
+    mask_tex_mapping: typing.Union[int, str] = None
+    '''Which texture coordinates to use for mapping 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_use_channel: typing.Union[int, str] = None
+    '''Which texture channel to use for masking 
+
+    :type: typing.Union[int, str]
+    '''
+
+    mask_tex_uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    mask_texture: 'Texture' = None
+    '''Masking texture 
+
+    :type: 'Texture'
+    '''
+
+    mask_vertex_group: str = None
+    '''Masking vertex group name 
+
+    :type: str
+    '''
+
+    max_dist: float = None
+    '''Distance mapping to weight 1.0 
+
+    :type: float
+    '''
+
+    min_dist: float = None
+    '''Distance mapping to weight 0.0 
+
+    :type: float
+    '''
+
+    proximity_geometry: typing.Set[typing.Union[int, str]] = None
+    '''Use the shortest computed distance to target object’s geometry as weight 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    proximity_mode: typing.Union[int, str] = None
+    '''Which distances to target object to use 
+
+    :type: typing.Union[int, str]
+    '''
+
+    target: 'Object' = None
+    '''Object to calculate vertices distances from 
+
+    :type: 'Object'
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name 
+
+    :type: str
+    '''
+
+
+class View2D:
+    '''Scroll and zoom for a 2D region '''
+
+    def region_to_view(self, x: int, y: int) -> float:
+        '''Transform region coordinates to 2D view 
+
+        :param x: x, Region x coordinate 
+        :type x: int
+        :param y: y, Region y coordinate 
+        :type y: int
+        :rtype: float
+        :return:  Result, View coordinates 
+        '''
+        pass
+
+    def view_to_region(self, x: float, y: float, clip: bool = True) -> int:
+        '''Transform 2D view coordinates to region 
+
+        :param x: x, 2D View x coordinate 
+        :type x: float
+        :param y: y, 2D View y coordinate 
+        :type y: float
+        :param clip: Clip, Clip coordinates to the visible region 
+        :type clip: bool
+        :rtype: int
+        :return:  Result, Region coordinates 
+        '''
+        pass
+
+
+class VisibilityActuator:
+    '''Actuator to set visibility and occlusion of the object '''
+
+    apply_to_children: bool = None
+    '''Set all the children of this object to the same visibility/occlusion recursively 
+
+    :type: bool
+    '''
+
+    use_occlusion: bool = None
+    '''Set the object to occlude objects behind it (initialized from the object type in physics button) 
+
+    :type: bool
+    '''
+
+    use_visible: bool = None
+    '''Set the objects visible (initialized from the object render restriction toggle in physics button) 
+
+    :type: bool
+    '''
+
+
+class VoronoiTexture:
+    '''Procedural voronoi texture '''
+
+    color_mode: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    distance_metric: typing.Union[int, str] = None
+    '''Algorithm used to calculate distance of sample points to feature points 
+
+    :type: typing.Union[int, str]
+    '''
+
+    minkovsky_exponent: float = None
+    '''Minkowski exponent 
+
+    :type: float
+    '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_intensity: float = None
+    '''Scales the intensity of the noise 
+
+    :type: float
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    weight_1: float = None
+    '''Voronoi feature weight 1 
+
+    :type: float
+    '''
+
+    weight_2: float = None
+    '''Voronoi feature weight 2 
+
+    :type: float
+    '''
+
+    weight_3: float = None
+    '''Voronoi feature weight 3 
+
+    :type: float
+    '''
+
+    weight_4: float = None
+    '''Voronoi feature weight 4 
+
+    :type: float
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class VoxelData:
+    '''Voxel data settings '''
+
+    domain_object: 'Object' = None
+    '''Object used as the smoke simulation domain 
+
+    :type: 'Object'
+    '''
+
+    extension: typing.Union[int, str] = None
+    '''How the texture is extrapolated past its original bounds 
+
+    :type: typing.Union[int, str]
+    '''
+
+    file_format: typing.Union[int, str] = None
+    '''Format of the source data set to render 
+
+    :type: typing.Union[int, str]
+    '''
+
+    filepath: str = None
+    '''The external source data file to use 
+
+    :type: str
+    '''
+
+    hair_data_type: typing.Union[int, str] = None
+    '''Simulation value to be used as a texture 
+
+    :type: typing.Union[int, str]
+    '''
+
+    intensity: float = None
+    '''Multiplier for intensity values 
+
+    :type: float
+    '''
+
+    interpolation: typing.Union[int, str] = None
+    '''Method to interpolate/smooth values between voxel cells 
+
+    :type: typing.Union[int, str]
+    '''
+
+    resolution: int = None
+    '''Resolution of the voxel grid 
+
+    :type: int
+    '''
+
+    smoke_data_type: typing.Union[int, str] = None
+    '''Simulation value to be used as a texture 
+
+    :type: typing.Union[int, str]
+    '''
+
+    still_frame: int = None
+    '''The frame number to always use 
+
+    :type: int
+    '''
+
+    use_still_frame: bool = None
+    '''Always render a still frame from the voxel data sequence 
+
+    :type: bool
+    '''
+
+
+class VoxelDataTexture:
+    '''Settings for the Voxel Data texture '''
+
+    image: 'Image' = None
+    '''
+
+    :type: 'Image'
+    '''
+
+    image_user: 'ImageUser' = None
+    '''Parameters defining which layer, pass and frame of the image is displayed 
+
+    :type: 'ImageUser'
+    '''
+
+    voxel_data: 'VoxelData' = None
+    '''The voxel data associated with this texture 
+
+    :type: 'VoxelData'
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class WalkNavigation:
+    '''Walk navigation settings '''
+
+    jump_height: float = None
+    '''Maximum height of a jump 
+
+    :type: float
+    '''
+
+    mouse_speed: float = None
+    '''Speed factor for when looking around, high values mean faster mouse movement 
+
+    :type: float
+    '''
+
+    teleport_time: float = None
+    '''Interval of time warp when teleporting in navigation mode 
+
+    :type: float
+    '''
+
+    use_gravity: bool = None
+    '''Walk with gravity, or free navigate 
+
+    :type: bool
+    '''
+
+    use_mouse_reverse: bool = None
+    '''Reverse the vertical movement of the mouse 
+
+    :type: bool
+    '''
+
+    view_height: float = None
+    '''View distance from the floor when walking 
+
+    :type: float
+    '''
+
+    walk_speed: float = None
+    '''Base speed for walking and flying 
+
+    :type: float
+    '''
+
+    walk_speed_factor: float = None
+    '''Multiplication factor when using the fast or slow modifiers 
+
+    :type: float
+    '''
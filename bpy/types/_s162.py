@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class WarpModifier:
+    '''Warp modifier '''
+
+    falloff_curve: 'CurveMapping' = None
+    '''Custom Lamp Falloff Curve 
+
+    :type: 'CurveMapping'
+    '''
+
+    falloff_radius: float = None
+    '''Radius to apply 
+
+    :type: float
+    '''
+
+    falloff_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    object_from: 'Object' = None
+    '''Object to transform from 
+
+    :type: 'Object'
+    '''
+
+    object_to: 'Object' = None
+    '''Object to transform to 
+
+    :type: 'Object'
+    '''
+
+    strength: float = None
+    '''
+
+    :type: float
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_coords_object: 'Object' = None
+    '''Object to set the texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    use_volume_preserve: bool = None
+    '''Preserve volume when rotations are used 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name for modulating the deform 
+
+    :type: str
+    '''
+
+
+class WaveModifier:
+    '''Wave effect modifier '''
+
+    damping_time: float = None
+    '''Number of frames in which the wave damps out after it dies 
+
+    :type: float
+    '''
+
+    falloff_radius: float = None
+    '''Distance after which it fades out 
+
+    :type: float
+    '''
+
+    height: float = None
+    '''Height of the wave 
+
+    :type: float
+    '''
+
+    lifetime: float = None
+    '''Lifetime of the wave in frames, zero means infinite 
+
+    :type: float
+    '''
+
+    narrowness: float = None
+    '''Distance between the top and the base of a wave, the higher the value, the more narrow the wave 
+
+    :type: float
+    '''
+
+    speed: float = None
+    '''Speed of the wave, towards the starting point when negative 
+
+    :type: float
+    '''
+
+    start_position_object: 'Object' = None
+    '''Object which defines the wave center 
+
+    :type: 'Object'
+    '''
+
+    start_position_x: float = None
+    '''X coordinate of the start position 
+
+    :type: float
+    '''
+
+    start_position_y: float = None
+    '''Y coordinate of the start position 
+
+    :type: float
+    '''
+
+    texture: 'Texture' = None
+    '''
+
+    :type: 'Texture'
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    texture_coords_object: 'Object' = None
+    '''Object to set the texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    time_offset: float = None
+    '''Either the starting frame (for positive speed) or ending frame (for negative speed.) 
+
+    :type: float
+    '''
+
+    use_cyclic: bool = None
+    '''Cyclic wave effect 
+
+    :type: bool
+    '''
+
+    use_normal: bool = None
+    '''Displace along normals 
+
+    :type: bool
+    '''
+
+    use_normal_x: bool = None
+    '''Enable displacement along the X normal 
+
+    :type: bool
+    '''
+
+    use_normal_y: bool = None
+    '''Enable displacement along the Y normal 
+
+    :type: bool
+    '''
+
+    use_normal_z: bool = None
+    '''Enable displacement along the Z normal 
+
+    :type: bool
+    '''
+
+    use_x: bool = None
+    '''X axis motion 
+
+    :type: bool
+    '''
+
+    use_y: bool = None
+    '''Y axis motion 
+
+    :type: bool
+    '''
+
+    uv_layer: str = None
+    '''UV map name 
+
+    :type: str
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name for modulating the wave 
+
+    :type: str
+    '''
+
+    width: float = None
+    '''Distance between the waves 
+
+    :type: float
+    '''
+
+
+class WhiteBalanceModifier:
+    '''White balance modifier for sequence strip '''
+
+    white_value: float = None
+    '''This color defines white in the strip 
+
+    :type: float
+    '''
+
+
+class WholeCharacter:
+    pass
+
+
+class WholeCharacterSelected:
+    pass
+
+
+class Window:
+    '''Open window '''
+
+    height: int = None
+    '''Window height 
+
+    :type: int
+    '''
+
+    screen: 'Screen' = None
+    '''Active screen showing in the window 
+
+    :type: 'Screen'
+    '''
+
+    stereo_3d_display: 'Stereo3dDisplay' = None
+    '''Settings for stereo 3d display 
+
+    :type: 'Stereo3dDisplay'
+    '''
+
+    width: int = None
+    '''Window width 
+
+    :type: int
+    '''
+
+    x: int = None
+    '''Horizontal location of the window 
+
+    :type: int
+    '''
+
+    y: int = None
+    '''Vertical location of the window 
+
+    :type: int
+    '''
+
+    def cursor_warp(self, x, y):
+        '''Set the cursor position 
+
+        '''
+        pass
+
+    def cursor_set(self, cursor: typing.Union[int, str]):
+        '''Set the cursor 
+
+        :param cursor: cursor 
+        :type cursor: typing.Union[int, str]
+        '''
+        pass
+
+    def cursor_modal_set(self, cursor: typing.Union[int, str]):
+        '''Restore the previous cursor after calling cursor_modal_set 
+
+        :param cursor: cursor 
+        :type cursor: typing.Union[int, str]
+        '''
+        pass
+
+    def cursor_modal_restore(self, ):
+        '''cursor_modal_restore 
+
+        '''
+        pass
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class WindowManager:
+    '''Window manager data-block defining open windows and other user interface data '''
+
+    addon_filter: typing.Union[int, str] = None
+    '''Filter add-ons by category 
+
+    :type: typing.Union[int, str]
+    '''
+
+    addon_search: str = None
+    '''Search within the selected filter 
+
+    :type: str
+    '''
+
+    addon_support: typing.Set[typing.Union[int, str]] = None
+    '''Display support level 
+
+    :type: typing.Set[typing.Union[int, str]]
+    '''
+
+    clipboard: str = None
+    '''
+
+    :type: str
+    '''
+
+    keyconfigs: typing.List['KeyConfigurations'] = None
+    '''Registered key configurations 
+
+    :type: typing.List['KeyConfigurations']
+    '''
+
+    operators: typing.List['Operator'] = None
+    '''Operator registry 
+
+    :type: typing.List['Operator']
+    '''
+
+    windows: typing.List['Window'] = None
+    '''Open windows 
+
+    :type: typing.List['Window']
+    '''
+
+    def event_timer_add(self, time_step: float,
+                        window: 'Window' = None) -> 'Timer':
+        '''Add a timer to the given window, to generate periodic ‘TIMER’ events 
+
+        :param time_step: Time Step, Interval in seconds between timer events 
+        :type time_step: float
+        :param window: Window to attach the timer to, or None 
+        :type window: 'Window'
+        :rtype: 'Timer'
+        '''
+        pass
+
+    def event_timer_remove(self, timer):
+        '''event_timer_remove 
+
+        '''
+        pass
+
+    def progress_begin(self, min: float, max: float):
+        '''Start progress report 
+
+        :param min: min, any value in range [0,9999] 
+        :type min: float
+        :param max: max, any value in range [min+1,9998] 
+        :type max: float
+        '''
+        pass
+
+    def progress_update(self, value: float):
+        '''Update the progress feedback 
+
+        :param value: value, Any value between min and max as set in progress_begin() 
+        :type value: float
+        '''
+        pass
+
+    def progress_end(self, ):
+        '''Terminate progress report 
+
+        '''
+        pass
+
+    def popup_menu(self, draw_func, title='', icon='NONE'):
+        '''Note that they will not block the scripts execution, so the caller can’t wait for user input. 
+
+        '''
+        pass
+
+    def popup_menu_pie(self, event, draw_func, title='', icon='NONE'):
+        '''
+
+        '''
+        pass
+
+
+class WipeSequence:
+    '''Sequence strip creating a wipe transition '''
+
+    angle: float = None
+    '''Edge angle 
+
+    :type: float
+    '''
+
+    blur_width: float = None
+    '''Width of the blur edge, in percentage relative to the image size 
+
+    :type: float
+    '''
+
+    direction: typing.Union[int, str] = None
+    '''Wipe direction 
+
+    :type: typing.Union[int, str]
+    '''
+
+    input_1: 'Sequence' = None
+    '''First input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_2: 'Sequence' = None
+    '''Second input for the effect strip 
+
+    :type: 'Sequence'
+    '''
+
+    input_count: int = None
+    '''
+
+    :type: int
+    '''
+
+    transition_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+
+class WireframeModifier:
+    '''Wireframe effect modifier '''
+
+    crease_weight: float = None
+    '''Crease weight (if active) 
+
+    :type: float
+    '''
+
+    invert_vertex_group: bool = None
+    '''Invert vertex group influence 
+
+    :type: bool
+    '''
+
+    material_offset: int = None
+    '''Offset material index of generated faces 
+
+    :type: int
+    '''
+
+    offset: float = None
+    '''Offset the thickness from the center 
+
+    :type: float
+    '''
+
+    thickness: float = None
+    '''Thickness factor 
+
+    :type: float
+    '''
+
+    thickness_vertex_group: float = None
+    '''Thickness factor to use for zero vertex group influence 
+
+    :type: float
+    '''
+
+    use_boundary: bool = None
+    '''Support face boundaries 
+
+    :type: bool
+    '''
+
+    use_crease: bool = None
+    '''Crease hub edges for improved subsurf 
+
+    :type: bool
+    '''
+
+    use_even_offset: bool = None
+    '''Scale the offset to give more even thickness 
+
+    :type: bool
+    '''
+
+    use_relative_offset: bool = None
+    '''Scale the offset by surrounding geometry 
+
+    :type: bool
+    '''
+
+    use_replace: bool = None
+    '''Remove original geometry 
+
+    :type: bool
+    '''
+
+    vertex_group: str = None
+    '''Vertex group name for selecting the affected areas 
+
+    :type: str
+    '''
+
+
+class WoodTexture:
+    '''Procedural noise texture '''
+
+    nabla: float = None
+    '''Size of derivative offset used for calculating normal 
+
+    :type: float
+    '''
+
+    noise_basis: typing.Union[int, str] = None
+    '''Noise basis used for turbulence 
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_basis_2: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    noise_scale: float = None
+    '''Scaling for noise input 
+
+    :type: float
+    '''
+
+    noise_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    turbulence: float = None
+    '''Turbulence of the bandnoise and ringnoise types 
+
+    :type: float
+    '''
+
+    wood_type: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    users_material = None
+    '''Materials that use this texture (readonly) '''
+
+    users_object_modifier = None
+    '''Object modifiers that use this texture (readonly) '''
+
+
+class World:
+    '''World data-block describing the environment and ambient lighting of a scene '''
+
+    active_texture: 'Texture' = None
+    '''Active texture slot being displayed 
+
+    :type: 'Texture'
+    '''
+
+    active_texture_index: int = None
+    '''Index of active texture slot 
+
+    :type: int
+    '''
+
+    ambient_color: float = None
+    '''Ambient color of the world 
+
+    :type: float
+    '''
+
+    animation_data: 'AnimData' = None
+    '''Animation data for this data-block 
+
+    :type: 'AnimData'
+    '''
+
+    color_range: float = None
+    '''The color range that will be mapped to 0-1 
+
+    :type: float
+    '''
+
+    cycles: 'CyclesWorldSettings' = None
+    '''Cycles world settings 
+
+    :type: 'CyclesWorldSettings'
+    '''
+
+    cycles_visibility: 'CyclesVisibilitySettings' = None
+    '''Cycles visibility settings 
+
+    :type: 'CyclesVisibilitySettings'
+    '''
+
+    exposure: float = None
+    '''Amount of exponential color correction for light 
+
+    :type: float
+    '''
+
+    horizon_color: float = None
+    '''Color at the horizon 
+
+    :type: float
+    '''
+
+    light_settings: 'WorldLighting' = None
+    '''World lighting settings 
+
+    :type: 'WorldLighting'
+    '''
+
+    mist_settings: 'WorldMistSettings' = None
+    '''World mist settings 
+
+    :type: 'WorldMistSettings'
+    '''
+
+    node_tree: 'NodeTree' = None
+    '''Node tree for node based worlds 
+
+    :type: 'NodeTree'
+    '''
+
+    texture_slots: typing.List['WorldTextureSlots'] = None
+    '''Texture slots defining the mapping and influence of textures 
+
+    :type: typing.List['WorldTextureSlots']
+    '''
+
+    use_nodes: bool = None
+    '''Use shader nodes to render the world 
+
+    :type: bool
+    '''
+
+    use_sky_blend: bool = None
+    '''Render background with natural progression from horizon to zenith 
+
+    :type: bool
+    '''
+
+    use_sky_paper: bool = None
+    '''Flatten blend or texture coordinates 
+
+    :type: bool
+    '''
+
+    use_sky_real: bool = None
+    '''Render background with a real horizon, relative to the camera angle 
+
+    :type: bool
+    '''
+
+    zenith_color: float = None
+    '''Color at the zenith 
+
+    :type: float
+    '''
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import sys
+import bpy
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class WorldLighting:
+    '''Lighting for a World data-block '''
+
+    adapt_to_speed: float = None
+    '''Use the speed vector pass to reduce AO samples in fast moving pixels - higher values result in more aggressive sample reduction (requires Vec pass enabled, for Raytrace Adaptive QMC) 
+
+    :type: float
+    '''
+
+    ao_blend_type: typing.Union[int, str] = None
+    '''Defines how AO mixes with material shading 
+
+    :type: typing.Union[int, str]
+    '''
+
+    ao_factor: float = None
+    '''Factor for ambient occlusion blending 
+
+    :type: float
+    '''
+
+    bias: float = None
+    '''Bias (in radians) to prevent smoothed faces from showing banding (for Raytrace Constant Jittered) 
+
+    :type: float
+    '''
+
+    correction: float = None
+    '''Ad-hoc correction for over-occlusion due to the approximation 
+
+    :type: float
+    '''
+
+    distance: float = None
+    '''Length of rays, defines how far away other faces give occlusion effect 
+
+    :type: float
+    '''
+
+    environment_color: typing.Union[int, str] = None
+    '''Defines where the color of the environment light comes from 
+
+    :type: typing.Union[int, str]
+    '''
+
+    environment_energy: float = None
+    '''Defines the strength of environment light 
+
+    :type: float
+    '''
+
+    error_threshold: float = None
+    '''Low values are slower and higher quality 
+
+    :type: float
+    '''
+
+    falloff_strength: float = None
+    '''Attenuation falloff strength, the higher, the less influence distant objects have 
+
+    :type: float
+    '''
+
+    gather_method: typing.Union[int, str] = None
+    '''
+
+    :type: typing.Union[int, str]
+    '''
+
+    indirect_bounces: int = None
+    '''Number of indirect diffuse light bounces 
+
+    :type: int
+    '''
+
+    indirect_factor: float = None
+    '''Factor for how much surrounding objects contribute to light 
+
+    :type: float
+    '''
+
+    passes: int = None
+    '''Number of preprocessing passes to reduce over-occlusion 
+
+    :type: int
+    '''
+
+    sample_method: typing.Union[int, str] = None
+    '''Method for generating shadow samples (for Raytrace) 
+
+    :type: typing.Union[int, str]
+    '''
+
+    samples: int = None
+    '''Amount of ray samples. Higher values give smoother results and longer rendering times 
+
+    :type: int
+    '''
+
+    threshold: float = None
+    '''Samples below this threshold will be considered fully shadowed/unshadowed and skipped (for Raytrace Adaptive QMC) 
+
+    :type: float
+    '''
+
+    use_ambient_occlusion: bool = None
+    '''Use Ambient Occlusion to add shadowing based on distance between objects 
+
+    :type: bool
+    '''
+
+    use_cache: bool = None
+    '''Cache AO results in pixels and interpolate over neighboring pixels for speedup 
+
+    :type: bool
+    '''
+
+    use_environment_light: bool = None
+    '''Add light coming from the environment 
+
+    :type: bool
+    '''
+
+    use_falloff: bool = None
+    '''Distance will be used to attenuate shadows 
+
+    :type: bool
+    '''
+
+    use_indirect_light: bool = None
+    '''Add indirect light bouncing of surrounding objects 
+
+    :type: bool
+    '''
+
+
+class WorldMistSettings:
+    '''Mist settings for a World data-block '''
+
+    depth: float = None
+    '''Distance over which the mist effect fades in 
+
+    :type: float
+    '''
+
+    falloff: typing.Union[int, str] = None
+    '''Type of transition used to fade mist 
+
+    :type: typing.Union[int, str]
+    '''
+
+    height: float = None
+    '''Control how much mist density decreases with height 
+
+    :type: float
+    '''
+
+    intensity: float = None
+    '''Overall minimum intensity of the mist effect 
+
+    :type: float
+    '''
+
+    start: float = None
+    '''Starting distance of the mist, measured from the camera 
+
+    :type: float
+    '''
+
+    use_mist: bool = None
+    '''Occlude objects with the environment color as they are further away 
+
+    :type: bool
+    '''
+
+
+class WorldTextureSlot:
+    '''Texture slot for textures in a World data-block '''
+
+    blend_factor: float = None
+    '''Amount texture affects color progression of the background 
+
+    :type: float
+    '''
+
+    horizon_factor: float = None
+    '''Amount texture affects color of the horizon 
+
+    :type: float
+    '''
+
+    object: 'Object' = None
+    '''Object to use for mapping with Object texture coordinates 
+
+    :type: 'Object'
+    '''
+
+    texture_coords: typing.Union[int, str] = None
+    '''Texture coordinates used to map the texture onto the background 
+
+    :type: typing.Union[int, str]
+    '''
+
+    use_map_blend: bool = None
+    '''Affect the color progression of the background 
+
+    :type: bool
+    '''
+
+    use_map_horizon: bool = None
+    '''Affect the color of the horizon 
+
+    :type: bool
+    '''
+
+    use_map_zenith_down: bool = None
+    '''Affect the color of the zenith below 
+
+    :type: bool
+    '''
+
+    use_map_zenith_up: bool = None
+    '''Affect the color of the zenith above 
+
+    :type: bool
+    '''
+
+    zenith_down_factor: float = None
+    '''Amount texture affects color of the zenith below 
+
+    :type: float
+    '''
+
+    zenith_up_factor: float = None
+    '''Amount texture affects color of the zenith above 
+
+    :type: float
+    '''
+
+
+class WorldTextureSlots:
+    '''Collection of texture slots '''
+
+    pass
+
+
+class XnorController:
+    '''Controller passing on events based on a logical XNOR operation '''
+
+    pass
+
+
+class XorController:
+    '''Controller passing on events based on a logical XOR operation '''
+
+    pass
+
+
+class bpy_prop_collection:
+    '''built-in class used for all collections. '''
+
+    def find(self, key: str) -> int:
+        '''Returns the index of a key in a collection or -1 when not found (matches pythons string find function of the same name). 
+
+        :param key: The identifier for the collection member. 
+        :type key: str
+        :rtype: int
+        :return:  index of the key. 
+        '''
+        pass
+
+    def foreach_get(self, attr, seq):
+        '''Only works for ‘basic type’ properties (bool, int and float)! Multi-dimensional arrays (like array of vectors) will be flattened into seq. 
+
+        '''
+        pass
+
+    def foreach_set(self, attr, seq):
+        '''Only works for ‘basic type’ properties (bool, int and float)! seq must be uni-dimensional, multi-dimensional arrays (like array of vectors) will be re-created from it. 
+
+        '''
+        pass
+
+    def get(self, key: str, default=None):
+        '''Returns the value of the item assigned to key or default when not found (matches pythons dictionary function of the same name). 
+
+        :param key: The identifier for the collection member. 
+        :type key: str
+        :param default: Optional argument for the value to return if key is not found. 
+        :type default: 
+        '''
+        pass
+
+    def items(self, ) -> list:
+        '''Return the identifiers of collection members (matching pythons dict.items() functionality). 
+
+        :rtype: list
+        :return:  (key, value) pairs for each member of this collection. 
+        '''
+        pass
+
+    def keys(self, ) -> list:
+        '''Return the identifiers of collection members (matching pythons dict.keys() functionality). 
+
+        :rtype: list
+        :return:  the identifiers for each member of this collection. 
+        '''
+        pass
+
+    def values(self, ) -> list:
+        '''Return the values of collection (matching pythons dict.values() functionality). 
+
+        :rtype: list
+        :return:  the members of this collection. 
+        '''
+        pass
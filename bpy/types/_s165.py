@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import sys
+import bpy
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class bpy_struct:
+    '''built-in base class for all classes in bpy.types. '''
+
+    id_data = None
+    '''The bpy.types.ID object this datablock is from or None, (not available for all data types) '''
+
+    def as_pointer(self, ) -> int:
+        '''Returns the memory address which holds a pointer to blenders internal data 
+
+        :rtype: int
+        :return:  int (memory address). 
+        '''
+        pass
+
+    def driver_add(self, path: str, index: int = -1) -> typing.List['FCurve']:
+        '''Adds driver(s) to the given property 
+
+        :param path: path to the property to drive, analogous to the fcurve’s data path. 
+        :type path: str
+        :param index: array index of the property drive. Defaults to -1 for all indices or a single channel if the property is not an array. 
+        :type index: int
+        :rtype: typing.List['FCurve']
+        :return:  The driver(s) added. 
+        '''
+        pass
+
+    def driver_remove(self, path: str, index: int = -1) -> bool:
+        '''Remove driver(s) from the given property 
+
+        :param path: path to the property to drive, analogous to the fcurve’s data path. 
+        :type path: str
+        :param index: array index of the property drive. Defaults to -1 for all indices or a single channel if the property is not an array. 
+        :type index: int
+        :rtype: bool
+        :return:  Success of driver removal. 
+        '''
+        pass
+
+    def get(self, key: str, default=None):
+        '''Returns the value of the custom property assigned to key or default when not found (matches pythons dictionary function of the same name). 
+
+        :param key: The key associated with the custom property. 
+        :type key: str
+        :param default: Optional argument for the value to return if key is not found. 
+        :type default: 
+        '''
+        pass
+
+    def is_property_hidden(self, property) -> bool:
+        '''Check if a property is hidden. 
+
+        :rtype: bool
+        :return:  True when the property is hidden. 
+        '''
+        pass
+
+    def is_property_readonly(self, property) -> bool:
+        '''Check if a property is readonly. 
+
+        :rtype: bool
+        :return:  True when the property is readonly (not writable). 
+        '''
+        pass
+
+    def is_property_set(self, property) -> bool:
+        '''Check if a property is set, use for testing operator properties. 
+
+        :rtype: bool
+        :return:  True when the property has been set. 
+        '''
+        pass
+
+    def items(self, ) -> list:
+        '''Returns the items of this objects custom properties (matches pythons dictionary function of the same name). 
+
+        :rtype: list
+        :return:  custom property key, value pairs. 
+        '''
+        pass
+
+    def keyframe_delete(self,
+                        data_path: str,
+                        index: int = -1,
+                        frame: float = None,
+                        group: str = "") -> bool:
+        '''Remove a keyframe from this properties fcurve. 
+
+        :param data_path: path to the property to remove a key, analogous to the fcurve’s data path. 
+        :type data_path: str
+        :param index: array index of the property to remove a key. Defaults to -1 removing all indices or a single channel if the property is not an array. 
+        :type index: int
+        :param frame: The frame on which the keyframe is deleted, defaulting to the current frame. 
+        :type frame: float
+        :param group: The name of the group the F-Curve should be added to if it doesn’t exist yet. 
+        :type group: str
+        :rtype: bool
+        :return:  Success of keyframe deleation. 
+        '''
+        pass
+
+    def keyframe_insert(self,
+                        data_path: str,
+                        index: int = -1,
+                        frame: float = None,
+                        group: str = "") -> bool:
+        '''Note that when keying data paths which contain nested properties this must be done from the ID subclass, in this case the Armature rather than the bone. 
+
+        :param data_path: path to the property to key, analogous to the fcurve’s data path. 
+        :type data_path: str
+        :param index: array index of the property to key. Defaults to -1 which will key all indices or a single channel if the property is not an array. 
+        :type index: int
+        :param frame: The frame on which the keyframe is inserted, defaulting to the current frame. 
+        :type frame: float
+        :param group: The name of the group the F-Curve should be added to if it doesn’t exist yet. 
+        :type group: str
+        :param options: Optional flags:INSERTKEY_NEEDED Only insert keyframes where they’re needed in the relevant F-Curves.INSERTKEY_VISUAL Insert keyframes based on ‘visual transforms’.INSERTKEY_XYZ_TO_RGB Color for newly added transformation F-Curves (Location, Rotation, Scale)and also Color is based on the transform axis. 
+        :type options: 
+        :rtype: bool
+        :return:  Success of keyframe insertion. 
+        '''
+        pass
+
+    def keys(self, ) -> list:
+        '''Returns the keys of this objects custom properties (matches pythons dictionary function of the same name). 
+
+        :rtype: list
+        :return:  custom property keys. 
+        '''
+        pass
+
+    def path_from_id(self, property: str = "") -> str:
+        '''Returns the data path from the ID to this object (string). 
+
+        :param property: Optional property name which can be used if the path is to a property of this object. 
+        :type property: str
+        :rtype: str
+        :return:  The path from bpy.types.bpy_struct.id_data to this struct and property (when given). 
+        '''
+        pass
+
+    def path_resolve(self, path: str, coerce: bool = True):
+        '''Returns the property from the path, raise an exception when not found. 
+
+        :param path: path which this property resolves. 
+        :type path: str
+        :param coerce: optional argument, when True, the property will be converted into its python representation. 
+        :type coerce: bool
+        '''
+        pass
+
+    def property_unset(self, property):
+        '''Unset a property, will use default value afterward. 
+
+        '''
+        pass
+
+    def type_recast(self, ) -> 'bpy_struct':
+        '''Return a new instance, this is needed because types such as textures can be changed at runtime. 
+
+        :rtype: 'bpy_struct'
+        :return:  a new instance of this object with the type initialized again. 
+        '''
+        pass
+
+    def values(self, ) -> list:
+        '''Returns the values of this objects custom properties (matches pythons dictionary function of the same name). 
+
+        :rtype: list
+        :return:  custom property values. 
+        '''
+        pass
+
+
+class BONE_PT_constraints(Panel):
+    pass
+
+
+class BONE_PT_context_bone(Panel):
+    pass
+
+
+class BONE_PT_curved(Panel):
+    pass
+
+
+class BONE_PT_custom_props(Panel):
+    pass
+
+
+class BONE_PT_deform(Panel):
+    pass
+
+
+class BONE_PT_display(Panel):
+    pass
+
+
+class BONE_PT_inverse_kinematics(Panel):
+    pass
+
+
+class BONE_PT_relations(Panel):
+    pass
+
+
+class BONE_PT_transform(Panel):
+    pass
+
+
+class CAMERA_PT_presets(Panel):
+    pass
+
+
+class CLIP_HT_header(Header):
+    pass
+
+
+class CLIP_MT_clip(Menu):
+    pass
+
+
+class CLIP_MT_marker_pie(Menu):
+    pass
+
+
+class CLIP_MT_mask_handle_type_menu(Menu):
+    pass
+
+
+class CLIP_MT_masking_editor_menus(Menu):
+    pass
+
+
+class CLIP_MT_pivot_pie(Menu):
+    pass
+
+
+class CLIP_MT_proxy(Menu):
+    pass
+
+
+class CLIP_MT_reconstruction(Menu):
+    pass
+
+
+class CLIP_MT_reconstruction_pie(Menu):
+    pass
+
+
+class CLIP_MT_select(Menu):
+    pass
+
+
+class CLIP_MT_select_grouped(Menu):
+    pass
+
+
+class CLIP_MT_solving_pie(Menu):
+    pass
+
+
+class CLIP_MT_stabilize_2d_context_menu(Menu):
+    pass
+
+
+class CLIP_MT_stabilize_2d_rotation_context_menu(Menu):
+    pass
+
+
+class CLIP_MT_track(Menu):
+    pass
+
+
+class CLIP_MT_track_transform(Menu):
+    pass
+
+
+class CLIP_MT_track_visibility(Menu):
+    pass
+
+
+class CLIP_MT_tracking_context_menu(Menu):
+    pass
+
+
+class CLIP_MT_tracking_editor_menus(Menu):
+    pass
+
+
+class CLIP_MT_tracking_pie(Menu):
+    pass
+
+
+class CLIP_MT_view(Menu):
+    pass
+
+
+class CLIP_PT_active_mask_point(Panel):
+    pass
+
+
+class CLIP_PT_active_mask_spline(Panel):
+    pass
+
+
+class CLIP_PT_camera_presets(Panel):
+    pass
+
+
+class CLIP_PT_clip_display(Panel):
+    pass
+
+
+class CLIP_PT_display(Panel):
+    pass
+
+
+class CLIP_PT_footage(Panel):
+    pass
+
+
+class CLIP_PT_grease_pencil(Panel):
+    pass
+
+
+class CLIP_PT_marker(Panel):
+    pass
+
+
+class CLIP_PT_marker_display(Panel):
+    pass
+
+
+class CLIP_PT_mask(Panel):
+    pass
+
+
+class CLIP_PT_mask_display(Panel):
+    pass
+
+
+class CLIP_PT_mask_layers(Panel):
+    pass
+
+
+class CLIP_PT_objects(Panel):
+    pass
+
+
+class CLIP_PT_plane_track(Panel):
+    pass
+
+
+class CLIP_PT_proxy(Panel):
+    pass
+
+
+class CLIP_PT_stabilization(Panel):
+    pass
+
+
+class CLIP_PT_tools_cleanup(Panel):
+    pass
+
+
+class CLIP_PT_tools_clip(Panel):
+    pass
+
+
+class CLIP_PT_tools_geometry(Panel):
+    pass
+
+
+class CLIP_PT_tools_grease_pencil_draw(Panel):
+    pass
+
+
+class CLIP_PT_tools_marker(Panel):
+    pass
+
+
+class CLIP_PT_tools_mask_tools(Panel):
+    pass
+
+
+class CLIP_PT_tools_mask_transforms(Panel):
+    pass
+
+
+class CLIP_PT_tools_object(Panel):
+    pass
+
+
+class CLIP_PT_tools_orientation(Panel):
+    pass
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class CLIP_PT_tools_plane_tracking(Panel):
+    pass
+
+
+class CLIP_PT_tools_scenesetup(Panel):
+    pass
+
+
+class CLIP_PT_tools_solve(Panel):
+    pass
+
+
+class CLIP_PT_tools_tracking(Panel):
+    pass
+
+
+class CLIP_PT_track(Panel):
+    pass
+
+
+class CLIP_PT_track_color_presets(Panel):
+    pass
+
+
+class CLIP_PT_track_settings(Panel):
+    pass
+
+
+class CLIP_PT_track_settings_extras(Panel):
+    pass
+
+
+class CLIP_PT_tracking_camera(Panel):
+    pass
+
+
+class CLIP_PT_tracking_lens(Panel):
+    pass
+
+
+class CLIP_PT_tracking_settings(Panel):
+    pass
+
+
+class CLIP_PT_tracking_settings_extras(Panel):
+    pass
+
+
+class CLIP_PT_tracking_settings_presets(Panel):
+    pass
+
+
+class CLOTH_PT_presets(Panel):
+    pass
+
+
+class COLLECTION_MT_context_menu(Menu):
+    pass
+
+
+class CONSOLE_HT_header(Header):
+    pass
+
+
+class CONSOLE_MT_console(Menu):
+    pass
+
+
+class CONSOLE_MT_editor_menus(Menu):
+    pass
+
+
+class CONSOLE_MT_language(Menu):
+    pass
+
+
+class DATA_MT_bone_group_context_menu(Menu):
+    pass
+
+
+class DATA_PT_EEVEE_light(Panel):
+    pass
+
+
+class DATA_PT_EEVEE_light_distance(Panel):
+    pass
+
+
+class DATA_PT_EEVEE_shadow(Panel):
+    pass
+
+
+class DATA_PT_EEVEE_shadow_cascaded_shadow_map(Panel):
+    pass
+
+
+class DATA_PT_EEVEE_shadow_contact(Panel):
+    pass
+
+
+class DATA_PT_active_spline(Panel):
+    pass
+
+
+class DATA_PT_area(Panel):
+    pass
+
+
+class DATA_PT_bone_groups(Panel):
+    pass
+
+
+class DATA_PT_camera(Panel):
+    pass
+
+
+class DATA_PT_camera_background_image(Panel):
+    pass
+
+
+class DATA_PT_camera_display(Panel):
+    pass
+
+
+class DATA_PT_camera_display_composition_guides(Panel):
+    pass
+
+
+class DATA_PT_camera_display_passepartout(Panel):
+    pass
+
+
+class DATA_PT_camera_dof(Panel):
+    pass
+
+
+class DATA_PT_camera_dof_aperture(Panel):
+    pass
+
+
+class DATA_PT_camera_safe_areas(Panel):
+    pass
+
+
+class DATA_PT_camera_safe_areas_center_cut(Panel):
+    pass
+
+
+class DATA_PT_camera_stereoscopy(Panel):
+    pass
+
+
+class DATA_PT_cone(Panel):
+    pass
+
+
+class DATA_PT_context_arm(Panel):
+    pass
+
+
+class DATA_PT_context_camera(Panel):
+    pass
+
+
+class DATA_PT_context_curve(Panel):
+    pass
+
+
+class DATA_PT_context_gpencil(Panel):
+    pass
+
+
+class DATA_PT_context_lattice(Panel):
+    pass
+
+
+class DATA_PT_context_light(Panel):
+    pass
+
+
+class DATA_PT_context_lightprobe(Panel):
+    pass
+
+
+class DATA_PT_context_mesh(Panel):
+    pass
+
+
+class DATA_PT_context_metaball(Panel):
+    pass
+
+
+class DATA_PT_context_speaker(Panel):
+    pass
+
+
+class DATA_PT_curve_texture_space(Panel):
+    pass
+
+
+class DATA_PT_custom_props_arm(Panel):
+    pass
+
+
+class DATA_PT_custom_props_camera(Panel):
+    pass
+
+
+class DATA_PT_custom_props_curve(Panel):
+    pass
+
+
+class DATA_PT_custom_props_gpencil(Panel):
+    pass
+
+
+class DATA_PT_custom_props_lattice(Panel):
+    pass
+
+
+class DATA_PT_custom_props_light(Panel):
+    pass
+
+
+class DATA_PT_custom_props_mesh(Panel):
+    pass
+
+
+class DATA_PT_custom_props_metaball(Panel):
+    pass
+
+
+class DATA_PT_custom_props_speaker(Panel):
+    pass
+
+
+class DATA_PT_customdata(Panel):
+    pass
+
+
+class DATA_PT_display(Panel):
+    pass
+
+
+class DATA_PT_distance(Panel):
+    pass
+
+
+class DATA_PT_empty(Panel):
+    pass
+
+
+class DATA_PT_empty_image(Panel):
+    pass
+
+
+class DATA_PT_face_maps(Panel):
+    pass
+
+
+class DATA_PT_falloff_curve(Panel):
+    pass
+
+
+class DATA_PT_font(Panel):
+    pass
+
+
+class DATA_PT_font_transform(Panel):
+    pass
+
+
+class DATA_PT_geometry_curve(Panel):
+    pass
+
+
+class DATA_PT_geometry_curve_bevel(Panel):
+    pass
+
+
+class DATA_PT_gpencil_canvas(Panel):
+    pass
+
+
+class DATA_PT_gpencil_display(Panel):
+    pass
+
+
+class DATA_PT_gpencil_layer_adjustments(Panel):
+    pass
+
+
+class DATA_PT_gpencil_layer_display(Panel):
+    pass
+
+
+class DATA_PT_gpencil_layer_relations(Panel):
+    pass
+
+
+class DATA_PT_gpencil_layers(Panel):
+    pass
+
+
+class DATA_PT_gpencil_modifiers(Panel):
+    pass
+
+
+class DATA_PT_gpencil_onion_skinning(Panel):
+    pass
+
+
+class DATA_PT_gpencil_onion_skinning_custom_colors(Panel):
+    pass
+
+
+class DATA_PT_gpencil_onion_skinning_display(Panel):
+    pass
+
+
+class DATA_PT_gpencil_strokes(Panel):
+    pass
+
+
+class DATA_PT_gpencil_vertex_groups(Panel):
+    pass
+
+
+class DATA_PT_iksolver_itasc(Panel):
+    pass
+
+
+class DATA_PT_lattice(Panel):
+    pass
+
+
+class DATA_PT_lens(Panel):
+    pass
+
+
+class DATA_PT_light(Panel):
+    pass
+
+
+class DATA_PT_lightprobe(Panel):
+    pass
+
+
+class DATA_PT_lightprobe_display(Panel):
+    pass
+
+
+class DATA_PT_lightprobe_parallax(Panel):
+    pass
+
+
+class DATA_PT_lightprobe_visibility(Panel):
+    pass
+
+
+class DATA_PT_mball_texture_space(Panel):
+    pass
+
+
+class DATA_PT_metaball(Panel):
+    pass
+
+
+class DATA_PT_metaball_element(Panel):
+    pass
+
+
+class DATA_PT_modifiers(Panel):
+    pass
+
+
+class DATA_PT_motion_paths(Panel):
+    pass
+
+
+class DATA_PT_motion_paths_display(Panel):
+    pass
+
+
+class DATA_PT_normals(Panel):
+    pass
+
+
+class DATA_PT_normals_auto_smooth(Panel):
+    pass
+
+
+class DATA_PT_paragraph(Panel):
+    pass
+
+
+class DATA_PT_paragraph_alignment(Panel):
+    pass
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel, UIList
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class DATA_PT_paragraph_spacing(Panel):
+    pass
+
+
+class DATA_PT_pathanim(Panel):
+    pass
+
+
+class DATA_PT_pose_library(Panel):
+    pass
+
+
+class DATA_PT_preview(Panel):
+    pass
+
+
+class DATA_PT_shader_fx(Panel):
+    pass
+
+
+class DATA_PT_shape_curve(Panel):
+    pass
+
+
+class DATA_PT_shape_keys(Panel):
+    pass
+
+
+class DATA_PT_skeleton(Panel):
+    pass
+
+
+class DATA_PT_speaker(Panel):
+    pass
+
+
+class DATA_PT_spot(Panel):
+    pass
+
+
+class DATA_PT_text_boxes(Panel):
+    pass
+
+
+class DATA_PT_texture_space(Panel):
+    pass
+
+
+class DATA_PT_uv_texture(Panel):
+    pass
+
+
+class DATA_PT_vertex_colors(Panel):
+    pass
+
+
+class DATA_PT_vertex_groups(Panel):
+    pass
+
+
+class DOPESHEET_HT_editor_buttons(Header):
+    pass
+
+
+class DOPESHEET_HT_header(Header):
+    pass
+
+
+class DOPESHEET_MT_channel(Menu):
+    pass
+
+
+class DOPESHEET_MT_channel_context_menu(Menu):
+    pass
+
+
+class DOPESHEET_MT_context_menu(Menu):
+    pass
+
+
+class DOPESHEET_MT_delete(Menu):
+    pass
+
+
+class DOPESHEET_MT_editor_menus(Menu):
+    pass
+
+
+class DOPESHEET_MT_gpencil_channel(Menu):
+    pass
+
+
+class DOPESHEET_MT_gpencil_frame(Menu):
+    pass
+
+
+class DOPESHEET_MT_key(Menu):
+    pass
+
+
+class DOPESHEET_MT_key_transform(Menu):
+    pass
+
+
+class DOPESHEET_MT_marker(Menu):
+    pass
+
+
+class DOPESHEET_MT_select(Menu):
+    pass
+
+
+class DOPESHEET_MT_snap_pie(Menu):
+    pass
+
+
+class DOPESHEET_MT_view(Menu):
+    pass
+
+
+class DOPESHEET_PT_filters(Panel):
+    pass
+
+
+class EEVEE_MATERIAL_PT_context_material(Panel):
+    pass
+
+
+class EEVEE_MATERIAL_PT_settings(Panel):
+    pass
+
+
+class EEVEE_MATERIAL_PT_surface(Panel):
+    pass
+
+
+class EEVEE_MATERIAL_PT_volume(Panel):
+    pass
+
+
+class EEVEE_WORLD_PT_mist(Panel):
+    pass
+
+
+class EEVEE_WORLD_PT_surface(Panel):
+    pass
+
+
+class EEVEE_WORLD_PT_volume(Panel):
+    pass
+
+
+class FILEBROWSER_HT_header(Header):
+    pass
+
+
+class FILEBROWSER_MT_bookmarks_context_menu(Menu):
+    pass
+
+
+class FILEBROWSER_MT_view(Menu):
+    pass
+
+
+class FILEBROWSER_PT_advanced_filter(Panel):
+    pass
+
+
+class FILEBROWSER_PT_bookmarks_favorites(Panel):
+    pass
+
+
+class FILEBROWSER_PT_bookmarks_recents(Panel):
+    pass
+
+
+class FILEBROWSER_PT_bookmarks_system(Panel):
+    pass
+
+
+class FILEBROWSER_PT_bookmarks_volumes(Panel):
+    pass
+
+
+class FLUID_PT_presets(Panel):
+    pass
+
+
+class GPENCIL_MT_cleanup(Menu):
+    pass
+
+
+class GPENCIL_MT_color_context_menu(Menu):
+    pass
+
+
+class GPENCIL_MT_gpencil_draw_delete(Menu):
+    pass
+
+
+class GPENCIL_MT_gpencil_vertex_group(Menu):
+    pass
+
+
+class GPENCIL_MT_layer_context_menu(Menu):
+    pass
+
+
+class GPENCIL_MT_pie_sculpt(Menu):
+    pass
+
+
+class GPENCIL_MT_pie_settings_palette(Menu):
+    pass
+
+
+class GPENCIL_MT_pie_tool_palette(Menu):
+    pass
+
+
+class GPENCIL_MT_pie_tools_more(Menu):
+    pass
+
+
+class GPENCIL_MT_separate(Menu):
+    pass
+
+
+class GPENCIL_MT_snap(Menu):
+    pass
+
+
+class GPENCIL_UL_annotation_layer(UIList):
+    pass
+
+
+class GPENCIL_UL_matslots(UIList):
+    pass
+
+
+class GPENCIL_UL_vgroups(UIList):
+    pass
+
+
+class GRAPH_HT_header(Header):
+    pass
+
+
+class GRAPH_MT_channel(Menu):
+    pass
+
+
+class GRAPH_MT_channel_context_menu(Menu):
+    pass
+
+
+class GRAPH_MT_context_menu(Menu):
+    pass
+
+
+class GRAPH_MT_delete(Menu):
+    pass
+
+
+class GRAPH_MT_editor_menus(Menu):
+    pass
+
+
+class GRAPH_MT_key(Menu):
+    pass
+
+
+class GRAPH_MT_key_transform(Menu):
+    pass
+
+
+class GRAPH_MT_marker(Menu):
+    pass
+
+
+class GRAPH_MT_pivot_pie(Menu):
+    pass
+
+
+class GRAPH_MT_select(Menu):
+    pass
+
+
+class GRAPH_MT_snap_pie(Menu):
+    pass
+
+
+class GRAPH_MT_view(Menu):
+    pass
+
+
+class GRAPH_PT_filters(Panel):
+    pass
+
+
+class IMAGE_HT_header(Header):
+    pass
+
+
+class IMAGE_HT_tool_header(Header):
+    pass
+
+
+class IMAGE_MT_brush(Menu):
+    pass
+
+
+class IMAGE_MT_image(Menu):
+    pass
+
+
+class IMAGE_MT_image_invert(Menu):
+    pass
+
+
+class IMAGE_MT_mask_context_menu(Menu):
+    pass
+
+
+class IMAGE_MT_pivot_pie(Menu):
+    pass
+
+
+class IMAGE_MT_select(Menu):
+    pass
+
+
+class IMAGE_MT_uvs(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_context_menu(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_mirror(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_select_mode(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_showhide(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_snap(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_snap_pie(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_transform(Menu):
+    pass
+
+
+class IMAGE_MT_uvs_weldalign(Menu):
+    pass
+
+
+class IMAGE_MT_view(Menu):
+    pass
+
+
+class IMAGE_MT_view_zoom(Menu):
+    pass
+
+
+class IMAGE_PT_active_mask_point(Panel):
+    pass
+
+
+class IMAGE_PT_active_mask_spline(Panel):
+    pass
+
+
+class IMAGE_PT_active_tool(Panel):
+    pass
+
+
+class IMAGE_PT_grease_pencil(Panel):
+    pass
+
+
+class IMAGE_PT_image_properties(Panel):
+    pass
+
+
+class IMAGE_PT_mask(Panel):
+    pass
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel, UIList
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class IMAGE_PT_mask_layers(Panel):
+    pass
+
+
+class IMAGE_PT_paint(Panel):
+    pass
+
+
+class IMAGE_PT_paint_clone(Panel):
+    pass
+
+
+class IMAGE_PT_paint_color(Panel):
+    pass
+
+
+class IMAGE_PT_paint_curve(Panel):
+    pass
+
+
+class IMAGE_PT_paint_gradient(Panel):
+    pass
+
+
+class IMAGE_PT_paint_options(Panel):
+    pass
+
+
+class IMAGE_PT_paint_stroke(Panel):
+    pass
+
+
+class IMAGE_PT_paint_stroke_smooth_stroke(Panel):
+    pass
+
+
+class IMAGE_PT_paint_swatches(Panel):
+    pass
+
+
+class IMAGE_PT_render_slots(Panel):
+    pass
+
+
+class IMAGE_PT_sample_line(Panel):
+    pass
+
+
+class IMAGE_PT_scope_sample(Panel):
+    pass
+
+
+class IMAGE_PT_snapping(Panel):
+    pass
+
+
+class IMAGE_PT_tools_active(Panel):
+    pass
+
+
+class IMAGE_PT_tools_brush_display(Panel):
+    pass
+
+
+class IMAGE_PT_tools_brush_display_custom_icon(Panel):
+    pass
+
+
+class IMAGE_PT_tools_brush_display_show_brush(Panel):
+    pass
+
+
+class IMAGE_PT_tools_brush_texture(Panel):
+    pass
+
+
+class IMAGE_PT_tools_imagepaint_symmetry(Panel):
+    pass
+
+
+class IMAGE_PT_tools_mask_texture(Panel):
+    pass
+
+
+class IMAGE_PT_uv_cursor(Panel):
+    pass
+
+
+class IMAGE_PT_uv_sculpt_brush(Panel):
+    pass
+
+
+class IMAGE_PT_uv_sculpt_curve(Panel):
+    pass
+
+
+class IMAGE_PT_view_display(Panel):
+    pass
+
+
+class IMAGE_PT_view_display_uv_edit_overlays(Panel):
+    pass
+
+
+class IMAGE_PT_view_display_uv_edit_overlays_stretch(Panel):
+    pass
+
+
+class IMAGE_PT_view_histogram(Panel):
+    pass
+
+
+class IMAGE_PT_view_vectorscope(Panel):
+    pass
+
+
+class IMAGE_PT_view_waveform(Panel):
+    pass
+
+
+class IMAGE_UL_render_slots(UIList):
+    pass
+
+
+class INFO_HT_header(Header):
+    pass
+
+
+class INFO_MT_area(Menu):
+    pass
+
+
+class MASK_MT_animation(Menu):
+    pass
+
+
+class MASK_MT_editor_menus(Menu):
+    pass
+
+
+class MASK_MT_mask(Menu):
+    pass
+
+
+class MASK_MT_select(Menu):
+    pass
+
+
+class MASK_MT_transform(Menu):
+    pass
+
+
+class MASK_MT_visibility(Menu):
+    pass
+
+
+class MATERIAL_MT_context_menu(Menu):
+    pass
+
+
+class MATERIAL_PT_custom_props(Panel):
+    pass
+
+
+class MATERIAL_PT_freestyle_line(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_custom_props(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_fillcolor(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_material_presets(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_options(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_preview(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_slots(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_strokecolor(Panel):
+    pass
+
+
+class MATERIAL_PT_gpencil_surface(Panel):
+    pass
+
+
+class MATERIAL_PT_preview(Panel):
+    pass
+
+
+class MATERIAL_PT_viewport(Panel):
+    pass
+
+
+class MESH_MT_shape_key_context_menu(Menu):
+    pass
+
+
+class MESH_MT_vertex_group_context_menu(Menu):
+    pass
+
+
+class MESH_UL_fmaps(UIList):
+    pass
+
+
+class MESH_UL_uvmaps(UIList):
+    pass
+
+
+class MESH_UL_vcols(UIList):
+    pass
+
+
+class NLA_HT_header(Header):
+    pass
+
+
+class NLA_MT_add(Menu):
+    pass
+
+
+class NLA_MT_channel_context_menu(Menu):
+    pass
+
+
+class NLA_MT_context_menu(Menu):
+    pass
+
+
+class NLA_MT_edit(Menu):
+    pass
+
+
+class NLA_MT_edit_transform(Menu):
+    pass
+
+
+class NLA_MT_editor_menus(Menu):
+    pass
+
+
+class NLA_MT_marker(Menu):
+    pass
+
+
+class NLA_MT_select(Menu):
+    pass
+
+
+class NLA_MT_snap_pie(Menu):
+    pass
+
+
+class NLA_MT_view(Menu):
+    pass
+
+
+class NLA_PT_filters(Panel):
+    pass
+
+
+class NODE_HT_header(Header):
+    pass
+
+
+class NODE_MT_context_menu(Menu):
+    pass
+
+
+class NODE_MT_editor_menus(Menu):
+    pass
+
+
+class NODE_MT_node(Menu):
+    pass
+
+
+class NODE_MT_node_color_context_menu(Menu):
+    pass
+
+
+class NODE_MT_select(Menu):
+    pass
+
+
+class NODE_MT_view(Menu):
+    pass
+
+
+class NODE_PT_active_node_color(Panel):
+    pass
+
+
+class NODE_PT_active_node_generic(Panel):
+    pass
+
+
+class NODE_PT_active_node_properties(Panel):
+    pass
+
+
+class NODE_PT_active_tool(Panel):
+    pass
+
+
+class NODE_PT_backdrop(Panel):
+    pass
+
+
+class NODE_PT_grease_pencil(Panel):
+    pass
+
+
+class NODE_PT_grease_pencil_tools(Panel):
+    pass
+
+
+class NODE_PT_material_slots(Panel):
+    pass
+
+
+class NODE_PT_node_color_presets(Panel):
+    pass
+
+
+class NODE_PT_texture_mapping(Panel):
+    pass
+
+
+class NODE_PT_tools_active(Panel):
+    pass
+
+
+class OBJECT_PT_collections(Panel):
+    pass
+
+
+class OBJECT_PT_constraints(Panel):
+    pass
+
+
+class OBJECT_PT_context_object(Panel):
+    pass
+
+
+class OBJECT_PT_custom_props(Panel):
+    pass
+
+
+class OBJECT_PT_delta_transform(Panel):
+    pass
+
+
+class OBJECT_PT_display(Panel):
+    pass
+
+
+class OBJECT_PT_display_bounds(Panel):
+    pass
+
+
+class OBJECT_PT_instancing(Panel):
+    pass
+
+
+class OBJECT_PT_instancing_size(Panel):
+    pass
+
+
+class OBJECT_PT_motion_paths(Panel):
+    pass
+
+
+class OBJECT_PT_motion_paths_display(Panel):
+    pass
+
+
+class OBJECT_PT_relations(Panel):
+    pass
+
+
+class OBJECT_PT_transform(Panel):
+    pass
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class OBJECT_PT_visibility(Panel):
+    pass
+
+
+class OUTLINER_HT_header(Header):
+    pass
+
+
+class OUTLINER_MT_collection(Menu):
+    pass
+
+
+class OUTLINER_MT_collection_new(Menu):
+    pass
+
+
+class OUTLINER_MT_collection_view_layer(Menu):
+    pass
+
+
+class OUTLINER_MT_collection_visibility(Menu):
+    pass
+
+
+class OUTLINER_MT_context(Menu):
+    pass
+
+
+class OUTLINER_MT_context_view(Menu):
+    pass
+
+
+class OUTLINER_MT_edit_datablocks(Menu):
+    pass
+
+
+class OUTLINER_MT_editor_menus(Menu):
+    pass
+
+
+class OUTLINER_MT_object(Menu):
+    pass
+
+
+class OUTLINER_PT_filter(Panel):
+    pass
+
+
+class PARTICLE_MT_context_menu(Menu):
+    pass
+
+
+class PARTICLE_PT_boidbrain(Panel):
+    pass
+
+
+class PARTICLE_PT_cache(Panel):
+    pass
+
+
+class PARTICLE_PT_children(Panel):
+    pass
+
+
+class PARTICLE_PT_children_clumping(Panel):
+    pass
+
+
+class PARTICLE_PT_children_clumping_noise(Panel):
+    pass
+
+
+class PARTICLE_PT_children_kink(Panel):
+    pass
+
+
+class PARTICLE_PT_children_parting(Panel):
+    pass
+
+
+class PARTICLE_PT_children_roughness(Panel):
+    pass
+
+
+class PARTICLE_PT_context_particles(Panel):
+    pass
+
+
+class PARTICLE_PT_custom_props(Panel):
+    pass
+
+
+class PARTICLE_PT_draw(Panel):
+    pass
+
+
+class PARTICLE_PT_emission(Panel):
+    pass
+
+
+class PARTICLE_PT_emission_source(Panel):
+    pass
+
+
+class PARTICLE_PT_field_weights(Panel):
+    pass
+
+
+class PARTICLE_PT_force_fields(Panel):
+    pass
+
+
+class PARTICLE_PT_force_fields_type1(Panel):
+    pass
+
+
+class PARTICLE_PT_force_fields_type1_falloff(Panel):
+    pass
+
+
+class PARTICLE_PT_force_fields_type2(Panel):
+    pass
+
+
+class PARTICLE_PT_force_fields_type2_falloff(Panel):
+    pass
+
+
+class PARTICLE_PT_hair_dynamics(Panel):
+    pass
+
+
+class PARTICLE_PT_hair_dynamics_presets(Panel):
+    pass
+
+
+class PARTICLE_PT_hair_dynamics_structure(Panel):
+    pass
+
+
+class PARTICLE_PT_hair_dynamics_volume(Panel):
+    pass
+
+
+class PARTICLE_PT_hair_shape(Panel):
+    pass
+
+
+class PARTICLE_PT_physics(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_boids_battle(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_boids_misc(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_boids_movement(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_deflection(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_fluid_advanced(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_fluid_interaction(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_fluid_springs(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_fluid_springs_advanced(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_fluid_springs_viscoelastic(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_forces(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_integration(Panel):
+    pass
+
+
+class PARTICLE_PT_physics_relations(Panel):
+    pass
+
+
+class PARTICLE_PT_render(Panel):
+    pass
+
+
+class PARTICLE_PT_render_collection(Panel):
+    pass
+
+
+class PARTICLE_PT_render_collection_use_count(Panel):
+    pass
+
+
+class PARTICLE_PT_render_extra(Panel):
+    pass
+
+
+class PARTICLE_PT_render_object(Panel):
+    pass
+
+
+class PARTICLE_PT_render_path(Panel):
+    pass
+
+
+class PARTICLE_PT_render_path_timing(Panel):
+    pass
+
+
+class PARTICLE_PT_rotation(Panel):
+    pass
+
+
+class PARTICLE_PT_rotation_angular_velocity(Panel):
+    pass
+
+
+class PARTICLE_PT_textures(Panel):
+    pass
+
+
+class PARTICLE_PT_velocity(Panel):
+    pass
+
+
+class PARTICLE_PT_vertexgroups(Panel):
+    pass
+
+
+class PHYSICS_PT_add(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_cache(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_collision(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_damping(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_field_weights(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_object_collision(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_physical_properties(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_property_weights(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_self_collision(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_shape(Panel):
+    pass
+
+
+class PHYSICS_PT_cloth_stiffness(Panel):
+    pass
+
+
+class PHYSICS_PT_collision(Panel):
+    pass
+
+
+class PHYSICS_PT_collision_particle(Panel):
+    pass
+
+
+class PHYSICS_PT_collision_softbody(Panel):
+    pass
+
+
+class PHYSICS_PT_domain_bake(Panel):
+    pass
+
+
+class PHYSICS_PT_domain_boundary(Panel):
+    pass
+
+
+class PHYSICS_PT_domain_gravity(Panel):
+    pass
+
+
+class PHYSICS_PT_domain_particles(Panel):
+    pass
+
+
+class PHYSICS_PT_domain_viscosity(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_source(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_source_color_ramp(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_velocity(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_velocity_color_ramp(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_velocity_smudge(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_brush_wave(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_cache(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_canvas_initial_color(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_canvas_output(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_canvas_output_paintmaps(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_canvas_output_wetmaps(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_effects(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_effects_drip(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_effects_drip_weights(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_effects_shrink(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_effects_spread(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_surface_canvas(Panel):
+    pass
+
+
+class PHYSICS_PT_dp_surface_canvas_paint_dissolve(Panel):
+    pass
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class PHYSICS_PT_dp_surface_canvas_paint_dry(Panel):
+    pass
+
+
+class PHYSICS_PT_dynamic_paint(Panel):
+    pass
+
+
+class PHYSICS_PT_dynamic_paint_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_field(Panel):
+    pass
+
+
+class PHYSICS_PT_field_falloff(Panel):
+    pass
+
+
+class PHYSICS_PT_field_falloff_angular(Panel):
+    pass
+
+
+class PHYSICS_PT_field_falloff_radial(Panel):
+    pass
+
+
+class PHYSICS_PT_field_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_field_settings_kink(Panel):
+    pass
+
+
+class PHYSICS_PT_field_settings_texture_select(Panel):
+    pass
+
+
+class PHYSICS_PT_fluid(Panel):
+    pass
+
+
+class PHYSICS_PT_fluid_flow(Panel):
+    pass
+
+
+class PHYSICS_PT_fluid_particle_cache(Panel):
+    pass
+
+
+class PHYSICS_PT_fluid_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_collisions(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_collisions_collections(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_collisions_sensitivity(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_collisions_surface(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_limits(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_limits_angular(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_limits_linear(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_motor(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_motor_angular(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_motor_linear(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_objects(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_override_iterations(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_springs(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_springs_angular(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_constraint_springs_linear(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_dynamics(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_dynamics_deactivation(Panel):
+    pass
+
+
+class PHYSICS_PT_rigid_body_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_adaptive_domain(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_behavior(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_behavior_dissolve(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_cache(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_collections(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_field_weights(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_fire(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_flow_texture(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_highres(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_settings_initial_velocity(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_settings_particle_size(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_viewport_display(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_viewport_display_color(Panel):
+    pass
+
+
+class PHYSICS_PT_smoke_viewport_display_debug(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_cache(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_collision(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_edge(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_edge_aerodynamics(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_edge_stiffness(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_field_weights(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_goal(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_goal_settings(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_goal_strengths(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_object(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_simulation(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_solver(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_solver_diagnostics(Panel):
+    pass
+
+
+class PHYSICS_PT_softbody_solver_helpers(Panel):
+    pass
+
+
+class PROPERTIES_HT_header(Header):
+    pass
+
+
+class PROPERTIES_PT_navigation_bar(Panel):
+    pass
+
+
+class RENDER_MT_framerate_presets(Menu):
+    pass
+
+
+class RENDER_MT_lineset_context_menu(Menu):
+    pass
+
+
+class RENDER_PT_color_management(Panel):
+    pass
+
+
+class RENDER_PT_color_management_curves(Panel):
+    pass
+
+
+class RENDER_PT_context(Panel):
+    pass
+
+
+class RENDER_PT_dimensions(Panel):
+    pass
+
+
+class RENDER_PT_eevee_ambient_occlusion(Panel):
+    pass
+
+
+class RENDER_PT_eevee_bloom(Panel):
+    pass
+
+
+class RENDER_PT_eevee_depth_of_field(Panel):
+    pass
+
+
+class RENDER_PT_eevee_film(Panel):
+    pass
+
+
+class RENDER_PT_eevee_film_overscan(Panel):
+    pass
+
+
+class RENDER_PT_eevee_hair(Panel):
+    pass
+
+
+class RENDER_PT_eevee_indirect_lighting(Panel):
+    pass
+
+
+class RENDER_PT_eevee_indirect_lighting_display(Panel):
+    pass
+
+
+class RENDER_PT_eevee_motion_blur(Panel):
+    pass
+
+
+class RENDER_PT_eevee_sampling(Panel):
+    pass
+
+
+class RENDER_PT_eevee_screen_space_reflections(Panel):
+    pass
+
+
+class RENDER_PT_eevee_shadows(Panel):
+    pass
+
+
+class RENDER_PT_eevee_subsurface_scattering(Panel):
+    pass
+
+
+class RENDER_PT_eevee_volumetric(Panel):
+    pass
+
+
+class RENDER_PT_eevee_volumetric_lighting(Panel):
+    pass
+
+
+class RENDER_PT_eevee_volumetric_shadows(Panel):
+    pass
+
+
+class RENDER_PT_encoding(Panel):
+    pass
+
+
+class RENDER_PT_encoding_audio(Panel):
+    pass
+
+
+class RENDER_PT_encoding_video(Panel):
+    pass
+
+
+class RENDER_PT_ffmpeg_presets(Panel):
+    pass
+
+
+class RENDER_PT_frame_remapping(Panel):
+    pass
+
+
+class RENDER_PT_freestyle(Panel):
+    pass
+
+
+class RENDER_PT_opengl_color(Panel):
+    pass
+
+
+class RENDER_PT_opengl_film(Panel):
+    pass
+
+
+class RENDER_PT_opengl_lighting(Panel):
+    pass
+
+
+class RENDER_PT_opengl_options(Panel):
+    pass
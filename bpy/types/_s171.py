@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel, UIList
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class RENDER_PT_opengl_sampling(Panel):
+    pass
+
+
+class RENDER_PT_output(Panel):
+    pass
+
+
+class RENDER_PT_output_views(Panel):
+    pass
+
+
+class RENDER_PT_post_processing(Panel):
+    pass
+
+
+class RENDER_PT_presets(Panel):
+    pass
+
+
+class RENDER_PT_simplify(Panel):
+    pass
+
+
+class RENDER_PT_simplify_greasepencil(Panel):
+    pass
+
+
+class RENDER_PT_simplify_render(Panel):
+    pass
+
+
+class RENDER_PT_simplify_viewport(Panel):
+    pass
+
+
+class RENDER_PT_stamp(Panel):
+    pass
+
+
+class RENDER_PT_stamp_burn(Panel):
+    pass
+
+
+class RENDER_PT_stamp_note(Panel):
+    pass
+
+
+class RENDER_PT_stereoscopy(Panel):
+    pass
+
+
+class RENDER_UL_renderviews(UIList):
+    pass
+
+
+class SAFE_AREAS_PT_presets(Panel):
+    pass
+
+
+class SCENE_PT_audio(Panel):
+    pass
+
+
+class SCENE_PT_custom_props(Panel):
+    pass
+
+
+class SCENE_PT_keyframing_settings(Panel):
+    pass
+
+
+class SCENE_PT_keying_set_paths(Panel):
+    pass
+
+
+class SCENE_PT_keying_sets(Panel):
+    pass
+
+
+class SCENE_PT_physics(Panel):
+    pass
+
+
+class SCENE_PT_rigid_body_cache(Panel):
+    pass
+
+
+class SCENE_PT_rigid_body_field_weights(Panel):
+    pass
+
+
+class SCENE_PT_rigid_body_world(Panel):
+    pass
+
+
+class SCENE_PT_rigid_body_world_settings(Panel):
+    pass
+
+
+class SCENE_PT_scene(Panel):
+    pass
+
+
+class SCENE_PT_unit(Panel):
+    pass
+
+
+class SEQUENCER_HT_header(Header):
+    pass
+
+
+class SEQUENCER_MT_add(Menu):
+    pass
+
+
+class SEQUENCER_MT_add_effect(Menu):
+    pass
+
+
+class SEQUENCER_MT_add_empty(Menu):
+    pass
+
+
+class SEQUENCER_MT_add_transitions(Menu):
+    pass
+
+
+class SEQUENCER_MT_change(Menu):
+    pass
+
+
+class SEQUENCER_MT_context_menu(Menu):
+    pass
+
+
+class SEQUENCER_MT_editor_menus(Menu):
+    pass
+
+
+class SEQUENCER_MT_marker(Menu):
+    pass
+
+
+class SEQUENCER_MT_navigation(Menu):
+    pass
+
+
+class SEQUENCER_MT_range(Menu):
+    pass
+
+
+class SEQUENCER_MT_select(Menu):
+    pass
+
+
+class SEQUENCER_MT_select_channel(Menu):
+    pass
+
+
+class SEQUENCER_MT_select_handle(Menu):
+    pass
+
+
+class SEQUENCER_MT_select_linked(Menu):
+    pass
+
+
+class SEQUENCER_MT_select_playhead(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip_effect(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip_input(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip_lock_mute(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip_movie(Menu):
+    pass
+
+
+class SEQUENCER_MT_strip_transform(Menu):
+    pass
+
+
+class SEQUENCER_MT_view(Menu):
+    pass
+
+
+class SEQUENCER_MT_view_cache(Menu):
+    pass
+
+
+class SEQUENCER_MT_view_toggle(Menu):
+    pass
+
+
+class SEQUENCER_PT_adjust(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_color(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_comp(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_sound(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_transform(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_transform_crop(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_transform_offset(Panel):
+    pass
+
+
+class SEQUENCER_PT_adjust_video(Panel):
+    pass
+
+
+class SEQUENCER_PT_cache_settings(Panel):
+    pass
+
+
+class SEQUENCER_PT_custom_props(Panel):
+    pass
+
+
+class SEQUENCER_PT_effect(Panel):
+    pass
+
+
+class SEQUENCER_PT_frame_overlay(Panel):
+    pass
+
+
+class SEQUENCER_PT_grease_pencil(Panel):
+    pass
+
+
+class SEQUENCER_PT_grease_pencil_tools(Panel):
+    pass
+
+
+class SEQUENCER_PT_mask(Panel):
+    pass
+
+
+class SEQUENCER_PT_modifiers(Panel):
+    pass
+
+
+class SEQUENCER_PT_preview(Panel):
+    pass
+
+
+class SEQUENCER_PT_proxy_settings(Panel):
+    pass
+
+
+class SEQUENCER_PT_scene(Panel):
+    pass
+
+
+class SEQUENCER_PT_source(Panel):
+    pass
+
+
+class SEQUENCER_PT_strip(Panel):
+    pass
+
+
+class SEQUENCER_PT_strip_cache(Panel):
+    pass
+
+
+class SEQUENCER_PT_strip_proxy(Panel):
+    pass
+
+
+class SEQUENCER_PT_time(Panel):
+    pass
+
+
+class SEQUENCER_PT_view(Panel):
+    pass
+
+
+class SEQUENCER_PT_view_safe_areas(Panel):
+    pass
+
+
+class SEQUENCER_PT_view_safe_areas_center_cut(Panel):
+    pass
+
+
+class STATUSBAR_HT_header(Header):
+    pass
+
+
+class TEXTURE_MT_context_menu(Menu):
+    pass
+
+
+class TEXTURE_PT_blend(Panel):
+    pass
+
+
+class TEXTURE_PT_clouds(Panel):
+    pass
+
+
+class TEXTURE_PT_colors(Panel):
+    pass
+
+
+class TEXTURE_PT_colors_ramp(Panel):
+    pass
+
+
+class TEXTURE_PT_context(Panel):
+    pass
+
+
+class TEXTURE_PT_custom_props(Panel):
+    pass
+
+
+class TEXTURE_PT_distortednoise(Panel):
+    pass
+
+
+class TEXTURE_PT_image(Panel):
+    pass
+
+
+class TEXTURE_PT_image_alpha(Panel):
+    pass
+
+
+class TEXTURE_PT_image_mapping(Panel):
+    pass
+
+
+class TEXTURE_PT_image_mapping_crop(Panel):
+    pass
+
+
+class TEXTURE_PT_image_sampling(Panel):
+    pass
+
+
+class TEXTURE_PT_image_settings(Panel):
+    pass
+
+
+class TEXTURE_PT_influence(Panel):
+    pass
+
+
+class TEXTURE_PT_magic(Panel):
+    pass
+
+
+class TEXTURE_PT_mapping(Panel):
+    pass
+
+
+class TEXTURE_PT_marble(Panel):
+    pass
+
+
+class TEXTURE_PT_musgrave(Panel):
+    pass
+
+
+class TEXTURE_PT_node(Panel):
+    pass
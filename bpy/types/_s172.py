@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class TEXTURE_PT_preview(Panel):
+    pass
+
+
+class TEXTURE_PT_stucci(Panel):
+    pass
+
+
+class TEXTURE_PT_voronoi(Panel):
+    pass
+
+
+class TEXTURE_PT_voronoi_feature_weights(Panel):
+    pass
+
+
+class TEXTURE_PT_wood(Panel):
+    pass
+
+
+class TEXT_HT_footer(Header):
+    pass
+
+
+class TEXT_HT_header(Header):
+    pass
+
+
+class TEXT_MT_edit(Menu):
+    pass
+
+
+class TEXT_MT_edit_select(Menu):
+    pass
+
+
+class TEXT_MT_edit_to3d(Menu):
+    pass
+
+
+class TEXT_MT_editor_menus(Menu):
+    pass
+
+
+class TEXT_MT_format(Menu):
+    pass
+
+
+class TEXT_MT_templates(Menu):
+    pass
+
+
+class TEXT_MT_templates_osl(Menu):
+    pass
+
+
+class TEXT_MT_templates_py(Menu):
+    pass
+
+
+class TEXT_MT_text(Menu):
+    pass
+
+
+class TEXT_MT_toolbox(Menu):
+    pass
+
+
+class TEXT_MT_view(Menu):
+    pass
+
+
+class TEXT_PT_find(Panel):
+    pass
+
+
+class TEXT_PT_properties(Panel):
+    pass
+
+
+class TIME_HT_editor_buttons(Header):
+    pass
+
+
+class TIME_MT_cache(Menu):
+    pass
+
+
+class TIME_MT_editor_menus(Menu):
+    pass
+
+
+class TIME_MT_marker(Menu):
+    pass
+
+
+class TIME_MT_view(Menu):
+    pass
+
+
+class TIME_PT_keyframing_settings(Panel):
+    pass
+
+
+class TIME_PT_playback(Panel):
+    pass
+
+
+class TOPBAR_HT_upper_bar(Header):
+    pass
+
+
+class TOPBAR_MT_app(Menu):
+    pass
+
+
+class TOPBAR_MT_app_about(Menu):
+    pass
+
+
+class TOPBAR_MT_app_support(Menu):
+    pass
+
+
+class TOPBAR_MT_edit(Menu):
+    pass
+
+
+class TOPBAR_MT_edit_armature_add(Menu):
+    pass
+
+
+class TOPBAR_MT_edit_curve_add(Menu):
+    pass
+
+
+class TOPBAR_MT_editor_menus(Menu):
+    pass
+
+
+class TOPBAR_MT_file(Menu):
+    pass
+
+
+class TOPBAR_MT_file_context_menu(Menu):
+    pass
+
+
+class TOPBAR_MT_file_defaults(Menu):
+    pass
+
+
+class TOPBAR_MT_file_export(Menu):
+    pass
+
+
+class TOPBAR_MT_file_external_data(Menu):
+    pass
+
+
+class TOPBAR_MT_file_import(Menu):
+    pass
+
+
+class TOPBAR_MT_file_new(Menu):
+    pass
+
+
+class TOPBAR_MT_file_previews(Menu):
+    pass
+
+
+class TOPBAR_MT_file_recover(Menu):
+    pass
+
+
+class TOPBAR_MT_help(Menu):
+    pass
+
+
+class TOPBAR_MT_render(Menu):
+    pass
+
+
+class TOPBAR_MT_templates_more(Menu):
+    pass
+
+
+class TOPBAR_MT_window(Menu):
+    pass
+
+
+class TOPBAR_MT_workspace_menu(Menu):
+    pass
+
+
+class TOPBAR_PT_annotation_layers(Panel):
+    pass
+
+
+class TOPBAR_PT_gpencil_fill(Panel):
+    pass
+
+
+class TOPBAR_PT_gpencil_layers(Panel):
+    pass
+
+
+class TOPBAR_PT_gpencil_materials(Panel):
+    pass
+
+
+class TOPBAR_PT_gpencil_primitive(Panel):
+    pass
+
+
+class TOPBAR_PT_name(Panel):
+    pass
+
+
+class USERPREF_HT_header(Header):
+    pass
+
+
+class USERPREF_MT_interface_theme_presets(Menu):
+    pass
+
+
+class USERPREF_MT_keyconfigs(Menu):
+    pass
+
+
+class USERPREF_MT_ndof_settings(Menu):
+    pass
+
+
+class USERPREF_MT_save_load(Menu):
+    pass
+
+
+class USERPREF_PT_addons(Panel):
+    pass
+
+
+class USERPREF_PT_animation_autokey(Panel):
+    pass
+
+
+class USERPREF_PT_animation_fcurves(Panel):
+    pass
+
+
+class USERPREF_PT_animation_keyframes(Panel):
+    pass
+
+
+class USERPREF_PT_animation_timeline(Panel):
+    pass
+
+
+class USERPREF_PT_edit_annotations(Panel):
+    pass
+
+
+class USERPREF_PT_edit_cursor(Panel):
+    pass
+
+
+class USERPREF_PT_edit_gpencil(Panel):
+    pass
+
+
+class USERPREF_PT_edit_misc(Panel):
+    pass
+
+
+class USERPREF_PT_edit_objects(Panel):
+    pass
+
+
+class USERPREF_PT_edit_objects_duplicate_data(Panel):
+    pass
+
+
+class USERPREF_PT_edit_objects_new(Panel):
+    pass
+
+
+class USERPREF_PT_edit_weight_paint(Panel):
+    pass
+
+
+class USERPREF_PT_file_paths_applications(Panel):
+    pass
+
+
+class USERPREF_PT_file_paths_data(Panel):
+    pass
+
+
+class USERPREF_PT_file_paths_development(Panel):
+    pass
+
+
+class USERPREF_PT_file_paths_render(Panel):
+    pass
+
+
+class USERPREF_PT_input_keyboard(Panel):
+    pass
+
+
+class USERPREF_PT_input_mouse(Panel):
+    pass
+
+
+class USERPREF_PT_input_ndof(Panel):
+    pass
+
+
+class USERPREF_PT_input_tablet(Panel):
+    pass
+
+
+class USERPREF_PT_interface_display(Panel):
+    pass
+
+
+class USERPREF_PT_interface_editors(Panel):
+    pass
+
+
+class USERPREF_PT_interface_menus(Panel):
+    pass
+
+
+class USERPREF_PT_interface_menus_mouse_over(Panel):
+    pass
+
+
+class USERPREF_PT_interface_menus_pie(Panel):
+    pass
+
+
+class USERPREF_PT_interface_text(Panel):
+    pass
+
+
+class USERPREF_PT_interface_translation(Panel):
+    pass
+
+
+class USERPREF_PT_keymap(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_bar(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_fly_walk(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_fly_walk_gravity(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_fly_walk_navigation(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_orbit(Panel):
+    pass
+
+
+class USERPREF_PT_navigation_zoom(Panel):
+    pass
+
+
+class USERPREF_PT_save_preferences(Panel):
+    pass
+
+
+class USERPREF_PT_saveload_autorun(Panel):
+    pass
+
+
+class USERPREF_PT_saveload_blend(Panel):
+    pass
+
+
+class USERPREF_PT_saveload_blend_autosave(Panel):
+    pass
+
+
+class USERPREF_PT_saveload_file_browser(Panel):
+    pass
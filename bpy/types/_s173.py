@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Header, Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class USERPREF_PT_studiolight_light_editor(Panel):
+    pass
+
+
+class USERPREF_PT_studiolight_lights(Panel):
+    pass
+
+
+class USERPREF_PT_studiolight_matcaps(Panel):
+    pass
+
+
+class USERPREF_PT_studiolight_world(Panel):
+    pass
+
+
+class USERPREF_PT_system_cycles_devices(Panel):
+    pass
+
+
+class USERPREF_PT_system_memory(Panel):
+    pass
+
+
+class USERPREF_PT_system_sound(Panel):
+    pass
+
+
+class USERPREF_PT_theme(Panel):
+    pass
+
+
+class USERPREF_PT_theme_bone_color_sets(Panel):
+    pass
+
+
+class USERPREF_PT_theme_interface_gizmos(Panel):
+    pass
+
+
+class USERPREF_PT_theme_interface_icons(Panel):
+    pass
+
+
+class USERPREF_PT_theme_interface_state(Panel):
+    pass
+
+
+class USERPREF_PT_theme_interface_styles(Panel):
+    pass
+
+
+class USERPREF_PT_theme_text_style(Panel):
+    pass
+
+
+class USERPREF_PT_theme_user_interface(Panel):
+    pass
+
+
+class USERPREF_PT_viewport_display(Panel):
+    pass
+
+
+class USERPREF_PT_viewport_quality(Panel):
+    pass
+
+
+class USERPREF_PT_viewport_selection(Panel):
+    pass
+
+
+class USERPREF_PT_viewport_textures(Panel):
+    pass
+
+
+class VIEW3D_HT_header(Header):
+    pass
+
+
+class VIEW3D_HT_tool_header(Header):
+    pass
+
+
+class VIEW3D_MT_add(Menu):
+    pass
+
+
+class VIEW3D_MT_angle_control(Menu):
+    pass
+
+
+class VIEW3D_MT_armature_add(Menu):
+    pass
+
+
+class VIEW3D_MT_armature_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_assign_material(Menu):
+    pass
+
+
+class VIEW3D_MT_bone_options_disable(Menu):
+    pass
+
+
+class VIEW3D_MT_bone_options_enable(Menu):
+    pass
+
+
+class VIEW3D_MT_bone_options_toggle(Menu):
+    pass
+
+
+class VIEW3D_MT_brush(Menu):
+    pass
+
+
+class VIEW3D_MT_brush_paint_modes(Menu):
+    pass
+
+
+class VIEW3D_MT_camera_add(Menu):
+    pass
+
+
+class VIEW3D_MT_curve_add(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_armature(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_armature_delete(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_armature_names(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_armature_parent(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_armature_roll(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_clean(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_ctrlpoints(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_delete(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_segments(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_curve_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_font(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_gpencil(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_gpencil_delete(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_gpencil_interpolate(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_gpencil_transform(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_lattice(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_lattice_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_clean(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_delete(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_edges(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_edges_data(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_extrude(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_faces(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_faces_data(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_merge(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_normals(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_normals_average(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_normals_select_strength(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_normals_set_strength(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_by_trait(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_linked(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_loops(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_mode(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_more_less(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_select_similar(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_shading(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_vertices(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_mesh_weights(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_meta(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_meta_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_metaball_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_surface(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_text_chars(Menu):
+    pass
+
+
+class VIEW3D_MT_edit_text_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_editor_menus(Menu):
+    pass
+
+
+class VIEW3D_MT_gpencil_animation(Menu):
+    pass
+
+
+class VIEW3D_MT_gpencil_autoweights(Menu):
+    pass
+
+
+class VIEW3D_MT_gpencil_copy_layer(Menu):
+    pass
+
+
+class VIEW3D_MT_gpencil_edit_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_gpencil_simplify(Menu):
+    pass
+
+
+class VIEW3D_MT_hide_mask(Menu):
+    pass
+
+
+class VIEW3D_MT_hook(Menu):
+    pass
+
+
+class VIEW3D_MT_image_add(Menu):
+    pass
+
+
+class VIEW3D_MT_light_add(Menu):
+    pass
+
+
+class VIEW3D_MT_lightprobe_add(Menu):
+    pass
+
+
+class VIEW3D_MT_make_links(Menu):
+    pass
+
+
+class VIEW3D_MT_make_single_user(Menu):
+    pass
+
+
+class VIEW3D_MT_mesh_add(Menu):
+    pass
+
+
+class VIEW3D_MT_metaball_add(Menu):
+    pass
+
+
+class VIEW3D_MT_mirror(Menu):
+    pass
+
+
+class VIEW3D_MT_object(Menu):
+    pass
+
+
+class VIEW3D_MT_object_animation(Menu):
+    pass
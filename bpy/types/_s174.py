@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import sys
+from . import Menu, Panel
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class VIEW3D_MT_object_apply(Menu):
+    pass
+
+
+class VIEW3D_MT_object_clear(Menu):
+    pass
+
+
+class VIEW3D_MT_object_collection(Menu):
+    pass
+
+
+class VIEW3D_MT_object_constraints(Menu):
+    pass
+
+
+class VIEW3D_MT_object_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_object_mode_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_object_parent(Menu):
+    pass
+
+
+class VIEW3D_MT_object_quick_effects(Menu):
+    pass
+
+
+class VIEW3D_MT_object_relations(Menu):
+    pass
+
+
+class VIEW3D_MT_object_rigid_body(Menu):
+    pass
+
+
+class VIEW3D_MT_object_shading(Menu):
+    pass
+
+
+class VIEW3D_MT_object_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_object_track(Menu):
+    pass
+
+
+class VIEW3D_MT_orientations_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_paint_gpencil(Menu):
+    pass
+
+
+class VIEW3D_MT_paint_vertex(Menu):
+    pass
+
+
+class VIEW3D_MT_paint_weight(Menu):
+    pass
+
+
+class VIEW3D_MT_particle(Menu):
+    pass
+
+
+class VIEW3D_MT_particle_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_particle_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_pivot_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_pose(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_apply(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_constraints(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_context_menu(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_group(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_ik(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_library(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_motion(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_propagate(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_showhide(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_slide(Menu):
+    pass
+
+
+class VIEW3D_MT_pose_transform(Menu):
+    pass
+
+
+class VIEW3D_MT_proportional_editing_falloff_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_sculpt(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_armature(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_curve(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_lattice(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_mesh(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_metaball(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_surface(Menu):
+    pass
+
+
+class VIEW3D_MT_select_edit_text(Menu):
+    pass
+
+
+class VIEW3D_MT_select_gpencil(Menu):
+    pass
+
+
+class VIEW3D_MT_select_object(Menu):
+    pass
+
+
+class VIEW3D_MT_select_object_more_less(Menu):
+    pass
+
+
+class VIEW3D_MT_select_paint_mask(Menu):
+    pass
+
+
+class VIEW3D_MT_select_paint_mask_vertex(Menu):
+    pass
+
+
+class VIEW3D_MT_select_particle(Menu):
+    pass
+
+
+class VIEW3D_MT_select_pose(Menu):
+    pass
+
+
+class VIEW3D_MT_select_pose_more_less(Menu):
+    pass
+
+
+class VIEW3D_MT_shading_ex_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_shading_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_snap(Menu):
+    pass
+
+
+class VIEW3D_MT_snap_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_surface_add(Menu):
+    pass
+
+
+class VIEW3D_MT_tools_projectpaint_clone(Menu):
+    pass
+
+
+class VIEW3D_MT_tools_projectpaint_stencil(Menu):
+    pass
+
+
+class VIEW3D_MT_tools_projectpaint_uvlayer(Menu):
+    pass
+
+
+class VIEW3D_MT_transform_base(Menu):
+    pass
+
+
+class VIEW3D_MT_transform_gizmo_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_uv_map(Menu):
+    pass
+
+
+class VIEW3D_MT_vertex_group(Menu):
+    pass
+
+
+class VIEW3D_MT_view(Menu):
+    pass
+
+
+class VIEW3D_MT_view_align(Menu):
+    pass
+
+
+class VIEW3D_MT_view_align_selected(Menu):
+    pass
+
+
+class VIEW3D_MT_view_cameras(Menu):
+    pass
+
+
+class VIEW3D_MT_view_local(Menu):
+    pass
+
+
+class VIEW3D_MT_view_navigation(Menu):
+    pass
+
+
+class VIEW3D_MT_view_pie(Menu):
+    pass
+
+
+class VIEW3D_MT_view_regions(Menu):
+    pass
+
+
+class VIEW3D_MT_view_viewpoint(Menu):
+    pass
+
+
+class VIEW3D_MT_weight_gpencil(Menu):
+    pass
+
+
+class VIEW3D_PT_active_tool(Panel):
+    pass
+
+
+class VIEW3D_PT_active_tool_duplicate(Panel):
+    pass
+
+
+class VIEW3D_PT_annotation_onion(Panel):
+    pass
+
+
+class VIEW3D_PT_collections(Panel):
+    pass
+
+
+class VIEW3D_PT_context_properties(Panel):
+    pass
+
+
+class VIEW3D_PT_gizmo_display(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_brush_presets(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_draw_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_guide(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_lock(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_multi_frame(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_origin(Panel):
+    pass
+
+
+class VIEW3D_PT_gpencil_sculpt_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_grease_pencil(Panel):
+    pass
+
+
+class VIEW3D_PT_object_type_visibility(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_curve(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_mesh(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_mesh_freestyle(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_mesh_measurement(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_mesh_normals(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_edit_mesh_shading(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_geometry(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_gpencil_options(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_guides(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_motion_tracking(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_object(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_paint(Panel):
+    pass
@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import sys
+from . import Menu, Panel, UIList
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+class VIEW3D_PT_overlay_pose(Panel):
+    pass
+
+
+class VIEW3D_PT_overlay_sculpt(Panel):
+    pass
+
+
+class VIEW3D_PT_paint_texture_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_paint_vertex_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_paint_weight_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_pivot_point(Panel):
+    pass
+
+
+class VIEW3D_PT_proportional_edit(Panel):
+    pass
+
+
+class VIEW3D_PT_quad_view(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_context_menu(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_dyntopo(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_dyntopo_remesh(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_options(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_options_gravity(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_options_unified(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_symmetry(Panel):
+    pass
+
+
+class VIEW3D_PT_sculpt_symmetry_for_topbar(Panel):
+    pass
+
+
+class VIEW3D_PT_shading(Panel):
+    pass
+
+
+class VIEW3D_PT_shading_color(Panel):
+    pass
+
+
+class VIEW3D_PT_shading_lighting(Panel):
+    pass
+
+
+class VIEW3D_PT_shading_options(Panel):
+    pass
+
+
+class VIEW3D_PT_shading_options_shadow(Panel):
+    pass
+
+
+class VIEW3D_PT_shading_options_ssao(Panel):
+    pass
+
+
+class VIEW3D_PT_slots_projectpaint(Panel):
+    pass
+
+
+class VIEW3D_PT_snapping(Panel):
+    pass
+
+
+class VIEW3D_PT_stencil_projectpaint(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_active(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_armatureedit_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_clone(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_color(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_display(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_display_custom_icon(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_display_show_brush(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_falloff(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_falloff_frontface(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_falloff_normal(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_gradient(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_stroke(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_stroke_smooth_stroke(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_swatches(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_brush_texture(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_curveedit_options_stroke(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brush(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brush_option(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brush_random(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brush_settings(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brush_stabilizer(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brushcurves(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brushcurves_jitter(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brushcurves_sensitivity(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_brushcurves_strength(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_interpolate(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_paint_appearance(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_sculpt(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_sculpt_appearance(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_sculpt_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_weight_appearance(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_grease_pencil_weight_paint(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_imagepaint_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_imagepaint_options_cavity(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_imagepaint_options_external(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_imagepaint_options_unified(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_imagepaint_symmetry(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_mask_texture(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_meshedit_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_meshedit_options_automerge(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_particlemode(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_particlemode_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_particlemode_options_display(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_particlemode_options_shapecut(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_posemode_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_vertexpaint_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_vertexpaint_symmetry(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_vertexpaint_symmetry_for_topbar(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_weightpaint_options(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_weightpaint_options_unified(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_weightpaint_symmetry(Panel):
+    pass
+
+
+class VIEW3D_PT_tools_weightpaint_symmetry_for_topbar(Panel):
+    pass
+
+
+class VIEW3D_PT_transform_orientations(Panel):
+    pass
+
+
+class VIEW3D_PT_view3d_cursor(Panel):
+    pass
+
+
+class VIEW3D_PT_view3d_lock(Panel):
+    pass
+
+
+class VIEW3D_PT_view3d_properties(Panel):
+    pass
+
+
+class VIEW3D_PT_view3d_stereo(Panel):
+    pass
+
+
+class VIEWLAYER_PT_eevee_layer_passes(Panel):
+    pass
+
+
+class VIEWLAYER_PT_freestyle(Panel):
+    pass
+
+
+class VIEWLAYER_PT_freestyle_lineset(Panel):
+    pass
+
+
+class VIEWLAYER_PT_freestyle_linestyle(Panel):
+    pass
+
+
+class VIEWLAYER_PT_layer(Panel):
+    pass
+
+
+class VIEWLAYER_UL_linesets(UIList):
+    pass
+
+
+class WM_MT_toolsystem_submenu(Menu):
+    pass
+
+
+class WORKSPACE_PT_addons(Panel):
+    pass
+
+
+class WORKSPACE_PT_custom_props(Panel):
+    pass
+
+
+class WORKSPACE_PT_main(Panel):
+    pass
+
+
+class WORLD_PT_context_world(Panel):
+    pass
+
+
+class WORLD_PT_custom_props(Panel):
+    pass
+
+
+class WORLD_PT_viewport_display(Panel):
+    pass
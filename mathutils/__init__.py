@@ -4,6 +4,10 @@ This module provides access to math operations.
 
 Note:
     - Classes, methods and attributes that accept vectors also accept other numeric sequences, such as tuples, lists.
+    - Values are stored in fixed __slots__ (no per-instance __dict__), swizzles and derived attributes such as
+      Vector.length or Color.hsv are computed when accessed.
+    - Multiplication follows Blender 2.7x: Matrix * Matrix, Matrix * Vector and Quaternion * Vector are
+      transformations and Vector * Vector is the dot product. The @ operator is supported with the same meaning.
 
 Submodules:
 
@@ -18,16 +22,514 @@ The mathutils module provides the following classes:
 - Color
 - Euler
 - Matrix
+- MatrixArray
 - Quaternion
-- Vector"""
+- Vector
+- VectorArray"""
 
-from . import bvhtree, geometry, interpolate, kdtree, noise
 from typing import Sequence as __Sequence, Union as __Union, Any as __Any
+from array import array as _array
+from itertools import repeat as _repeat
+from operator import add as _add, mul as _mul, neg as _neg, sub as _sub
+from colorsys import rgb_to_hsv as _rgb_to_hsv, hsv_to_rgb as _hsv_to_rgb
+from math import sqrt as _sqrt, sin as _sin, cos as _cos, acos as _acos, atan2 as _atan2, floor as _floor, \
+    pi as _pi, hypot as _hypot
+
+from ._buffer import as_coords as _as_coords, components as _components, interleave as _interleave
+
+_new = object.__new__
+_EPSILON = 1.1920928955078125e-07
+"""Single precision machine epsilon, Blender's tolerance for most degenerate cases."""
+
+_EULER_ORDERS = {
+    "XYZ": (0, 1, 2, False),
+    "XZY": (0, 2, 1, True),
+    "YXZ": (1, 0, 2, True),
+    "YZX": (1, 2, 0, False),
+    "ZXY": (2, 0, 1, False),
+    "ZYX": (2, 1, 0, True),
+}
+"""Euler order -> (first axis, second axis, third axis, parity), as in Blender's rotation order table."""
+
+
+def _check_mutable(obj):
+    # type: (__Any) -> None
+    if obj._frozen:
+        raise TypeError("%s is frozen, cannot modify" % type(obj).__name__)
+
+
+def _floats(seq, name):
+    # type: (__Any, str) -> list
+    """Return seq as a new list of floats, raising the same kind of errors Blender does for non numeric sequences."""
+
+    try:
+        return [float(value) for value in seq]
+
+    except TypeError:
+        raise TypeError("%s: expected a sequence of numbers, not %s" % (name, type(seq).__name__)) from None
+
+
+def _vector(data):
+    # type: (list) -> Vector
+    """Wrap a list of floats in a new Vector without copying or validating it."""
+
+    vec = _new(Vector)
+    vec._data = data
+    vec._owner = None
+    vec._frozen = False
+    return vec
+
+
+def _matrix(rows):
+    # type: (list) -> Matrix
+    """Wrap a list of row lists in a new Matrix without copying or validating it."""
+
+    mat = _new(Matrix)
+    mat._rows = rows
+    mat._frozen = False
+    return mat
+
+
+def _quaternion(data):
+    # type: (list) -> Quaternion
+    quat = _new(Quaternion)
+    quat._data = data
+    quat._frozen = False
+    return quat
+
+
+def _euler(data, order):
+    # type: (list, str) -> Euler
+    eul = _new(Euler)
+    eul._data = data
+    eul._order = order
+    eul._frozen = False
+    return eul
+
+
+def _color(data):
+    # type: (list) -> Color
+    col = _new(Color)
+    col._data = data
+    col._frozen = False
+    return col
+
+
+def _identity_rows(size):
+    # type: (int) -> list
+    return [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+
+
+def _mul_rows(a, b):
+    # type: (list, list) -> list
+    """Matrix product of two row lists."""
+
+    cols = list(zip(*b))
+    return [[sum([x * y for x, y in zip(row, col)]) for col in cols] for row in a]
+
+
+def _minor(rows, i, j):
+    # type: (list, int, int) -> list
+    return [row[:j] + row[j + 1:] for k, row in enumerate(rows) if k != i]
+
+
+def _determinant(rows):
+    # type: (list) -> float
+    size = len(rows)
+
+    if size == 2:
+        return rows[0][0] * rows[1][1] - rows[0][1] * rows[1][0]
+
+    if size == 3:
+        (a, b, c), (d, e, f), (g, h, i) = rows
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+    return sum([(-1.0 if j & 1 else 1.0) * rows[0][j] * _determinant(_minor(rows, 0, j)) for j in range(size)])
+
+
+def _adjugate_rows(rows):
+    # type: (list) -> list
+    size = len(rows)
+
+    if size == 2:
+        return [[rows[1][1], -rows[0][1]], [-rows[1][0], rows[0][0]]]
+
+    return [[(-1.0 if (i + j) & 1 else 1.0) * _determinant(_minor(rows, j, i)) for j in range(size)]
+            for i in range(size)]
+
+
+def _inverted_rows(rows):
+    # type: (list) -> list
+    """Return the inverse of a square row list, or None when it is singular."""
+
+    det = _determinant(rows)
+
+    if det == 0.0:
+        return None
+
+    inv = 1.0 / det
+    return [[value * inv for value in row] for row in _adjugate_rows(rows)]
+
+
+def _normalized_3x3(rows):
+    # type: (list) -> list
+    """Return the upper 3x3 block of rows with each column normalized."""
+
+    cols = [[rows[r][c] for r in range(3)] for c in range(3)]
+
+    for col in cols:
+        length = _sqrt(col[0] * col[0] + col[1] * col[1] + col[2] * col[2])
+
+        if length:
+            col[0] /= length
+            col[1] /= length
+            col[2] /= length
+
+    return [[cols[c][r] for c in range(3)] for r in range(3)]
+
+
+def _quat_to_rows(q):
+    # type: (list) -> list
+    """3x3 rotation rows of a (not necessarily unit) quaternion, as Blender's quat_to_mat3."""
+
+    w, x, y, z = q
+    q0 = 1.4142135623730951 * w
+    q1 = 1.4142135623730951 * x
+    q2 = 1.4142135623730951 * y
+    q3 = 1.4142135623730951 * z
+    qda = q0 * q1
+    qdb = q0 * q2
+    qdc = q0 * q3
+    qaa = q1 * q1
+    qab = q1 * q2
+    qac = q1 * q3
+    qbb = q2 * q2
+    qbc = q2 * q3
+    qcc = q3 * q3
+    return [[1.0 - qbb - qcc, -qdc + qab, qdb + qac],
+            [qdc + qab, 1.0 - qaa - qcc, -qda + qbc],
+            [-qdb + qac, qda + qbc, 1.0 - qaa - qbb]]
+
+
+def _rows_to_quat(rows):
+    # type: (list) -> list
+    """Unit quaternion of the rotation in the upper 3x3 block of rows (columns are normalized first)."""
+
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _normalized_3x3(rows)
+    trace = m00 + m11 + m22
+
+    if trace > 0.0:
+        s = _sqrt(trace + 1.0) * 2.0
+        q = [0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s]
+
+    elif m00 > m11 and m00 > m22:
+        s = _sqrt(max(1.0 + m00 - m11 - m22, 0.0)) * 2.0 or 1.0
+        q = [(m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s]
+
+    elif m11 > m22:
+        s = _sqrt(max(1.0 + m11 - m00 - m22, 0.0)) * 2.0 or 1.0
+        q = [(m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s]
+
+    else:
+        s = _sqrt(max(1.0 + m22 - m00 - m11, 0.0)) * 2.0 or 1.0
+        q = [(m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s]
+
+    if q[0] < 0.0:
+        q = [-q[0], -q[1], -q[2], -q[3]]
+
+    length = _sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+    return [value / length for value in q] if length else [1.0, 0.0, 0.0, 0.0]
+
+
+def _mul_quat(a, b):
+    # type: (list, list) -> list
+    """Hamilton product a * b."""
+
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    return [aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by + ay * bw + az * bx - ax * bz,
+            aw * bz + az * bw + ax * by - ay * bx]
+
+
+def _axis_angle_to_quat(axis, angle):
+    # type: (list, float) -> list
+    length = _sqrt(axis[0] * axis[0] + axis[1] * axis[1] + axis[2] * axis[2])
+
+    if not length:
+        return [1.0, 0.0, 0.0, 0.0]
+
+    si = _sin(angle * 0.5) / length
+    return [_cos(angle * 0.5), axis[0] * si, axis[1] * si, axis[2] * si]
+
+
+def _quat_to_axis_angle(q):
+    # type: (list) -> tuple[list, float]
+    """Axis and angle of a quaternion, sanitized to ((1, 0, 0), 0) for the identity like Blender."""
+
+    length = _sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+
+    if not length:
+        return [1.0, 0.0, 0.0], 0.0
+
+    w = max(-1.0, min(1.0, q[0] / length))
+    angle = 2.0 * _acos(w)
+    si = _sqrt(max(1.0 - w * w, 0.0))
+
+    if si < 0.0005:
+        si = 1.0
+
+    axis = [q[1] / length / si, q[2] / length / si, q[3] / length / si]
+
+    if not (axis[0] or axis[1] or axis[2]):
+        return [1.0, 0.0, 0.0], 0.0
+
+    return axis, angle
+
+
+def _euler_to_rows(eul, order):
+    # type: (list, str) -> list
+    """3x3 rotation rows of an euler rotation in any order, as Blender's eulO_to_mat3."""
+
+    i, j, k, parity = _EULER_ORDERS[order]
+
+    if parity:
+        ti, tj, th = -eul[i], -eul[j], -eul[k]
+
+    else:
+        ti, tj, th = eul[i], eul[j], eul[k]
+
+    ci = _cos(ti)
+    cj = _cos(tj)
+    ch = _cos(th)
+    si = _sin(ti)
+    sj = _sin(tj)
+    sh = _sin(th)
+    cc = ci * ch
+    cs = ci * sh
+    sc = si * ch
+    ss = si * sh
+    rows = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    rows[i][i] = cj * ch
+    rows[i][j] = sj * sc - cs
+    rows[i][k] = sj * cc + ss
+    rows[j][i] = cj * sh
+    rows[j][j] = sj * ss + cc
+    rows[j][k] = sj * cs - sc
+    rows[k][i] = -sj
+    rows[k][j] = cj * si
+    rows[k][k] = cj * ci
+    return rows
+
+
+def _compatible_euler(eul, old):
+    # type: (list, __Sequence[float]) -> list
+    """Shift the angles of eul by multiples of 2 pi so they are as close as possible to old, in place."""
+
+    pi_thresh = 5.1
+    pi_x2 = 2.0 * _pi
+    deul = [0.0, 0.0, 0.0]
+
+    for i in range(3):
+        deul[i] = eul[i] - old[i]
+
+        if deul[i] > pi_thresh:
+            eul[i] -= _floor((deul[i] / pi_x2) + 0.5) * pi_x2
+            deul[i] = eul[i] - old[i]
+
+        elif deul[i] < -pi_thresh:
+            eul[i] += _floor((-deul[i] / pi_x2) + 0.5) * pi_x2
+            deul[i] = eul[i] - old[i]
+
+    for i in range(3):
+        j = (i + 1) % 3
+        k = (i + 2) % 3
+
+        if abs(deul[i]) > 3.2 and abs(deul[j]) < 1.6 and abs(deul[k]) < 1.6:
+            eul[i] += -pi_x2 if deul[i] > 0.0 else pi_x2
+
+    return eul
+
+
+def _rows_to_euler(rows, order, compat=None):
+    # type: (list, str, __Sequence[float]) -> list
+    """Euler angles of the rotation in the upper 3x3 block of rows, as Blender's mat3_normalized_to_eulO."""
+
+    mat = _normalized_3x3(rows)
+    i, j, k, parity = _EULER_ORDERS[order]
+    cy = _hypot(mat[i][i], mat[j][i])
+    eul1 = [0.0, 0.0, 0.0]
+    eul2 = [0.0, 0.0, 0.0]
+
+    if cy > 16.0 * _EPSILON:
+        eul1[i] = _atan2(mat[k][j], mat[k][k])
+        eul1[j] = _atan2(-mat[k][i], cy)
+        eul1[k] = _atan2(mat[j][i], mat[i][i])
+        eul2[i] = _atan2(-mat[k][j], -mat[k][k])
+        eul2[j] = _atan2(-mat[k][i], -cy)
+        eul2[k] = _atan2(-mat[j][i], -mat[i][i])
+
+    else:
+        eul1[i] = _atan2(-mat[j][k], mat[j][j])
+        eul1[j] = _atan2(-mat[k][i], cy)
+        eul2 = list(eul1)
+
+    if parity:
+        eul1 = [-value for value in eul1]
+        eul2 = [-value for value in eul2]
+
+    if compat is not None:
+        _compatible_euler(eul1, compat)
+        _compatible_euler(eul2, compat)
+        d1 = sum([abs(a - b) for a, b in zip(eul1, compat)])
+        d2 = sum([abs(a - b) for a, b in zip(eul2, compat)])
+
+    else:
+        d1 = abs(eul1[0]) + abs(eul1[1]) + abs(eul1[2])
+        d2 = abs(eul2[0]) + abs(eul2[1]) + abs(eul2[2])
+
+    return eul1 if d1 <= d2 else eul2
+
+
+def _rotation_rows(value, name):
+    # type: (__Any, str) -> list
+    """3x3 rotation rows of an Euler, Quaternion or (3x3 or 4x4) Matrix."""
+
+    if isinstance(value, Euler):
+        return _euler_to_rows(value._data, value._order)
+
+    if isinstance(value, Quaternion):
+        length = _sqrt(sum([v * v for v in value._data]))
+        return _quat_to_rows([v / length for v in value._data] if length else [1.0, 0.0, 0.0, 0.0])
+
+    if isinstance(value, Matrix) and len(value._rows) >= 3 and len(value._rows[0]) >= 3:
+        return _normalized_3x3(value._rows)
+
+    raise TypeError("%s: expected an Euler, Quaternion or 3x3/4x4 Matrix, not %s" % (name, type(value).__name__))
+
+
+def _parse_order(order):
+    # type: (str) -> str
+    if order not in _EULER_ORDERS:
+        raise ValueError("order: expected a string in 'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX', not %r" % (order,))
+
+    return order
+
+
+def _repr_float(value):
+    # type: (float) -> str
+    return repr(float(value))
+
+
+def _column(value, count):
+    # type: (__Any, int) -> __Any
+    """Iterable over one component of count items, a float is broadcast to every item."""
+
+    return _repeat(value, count) if isinstance(value, float) else value
+
+
+def _column_mul(a, b, count):
+    # type: (__Any, __Any, int) -> list
+    return list(map(_mul, _column(a, count), _column(b, count)))
+
+
+def _column_sum(columns, count):
+    # type: (list, int) -> list
+    """Element-wise sum of columns, each a float (broadcast) or a sequence of count floats."""
+
+    total = [0.0] * count
+
+    for column in columns:
+        total = list(map(_add, total, _column(column, count)))
+
+    return total
+
+
+def _matrix_columns(rows):
+    # type: (list) -> list
+    """Coefficients of a single Matrix as floats, the broadcast form of MatrixArray._components()."""
+
+    return [[float(value) for value in row] for row in rows]
+
+
+def _transform_columns(mat, vec, count):
+    # type: (list, list, int) -> list
+    """Matrix * column vector over whole arrays.
+
+    Args:
+        mat (list): Matrix rows of coefficients, each a float (shared by all items) or a sequence of count floats.
+        vec (list): Vector components, each a sequence of count floats.
+        count (int): Number of items.
+
+    Returns:
+        list: Components of the transformed vectors, a 3D vector times a 4x4 matrix uses w=1 and stays 3D."""
+
+    size = len(vec)
+    columns = len(mat[0])
+
+    if size == 3 and columns == 4:
+        return [_column_sum([_column_mul(mat[r][c], vec[c], count) for c in range(3) if mat[r][c] != 0.0]
+                            + [mat[r][3]], count) for r in range(3)]
+
+    if size != columns:
+        raise ValueError("matrix * vector: len(matrix.col) and len(vector) must be the same, "
+                         "except for 4x4 matrix * 3D vector.")
+
+    return [_column_sum([_column_mul(mat[r][c], vec[c], count) for c in range(size) if mat[r][c] != 0.0], count)
+            for r in range(len(mat))]
+
+
+def _product_columns(a, b, count):
+    # type: (list, list, int) -> list
+    """Matrix * Matrix over whole arrays, coefficients given as in _transform_columns()."""
+
+    if len(a[0]) != len(b):
+        raise ValueError("Matrix multiplication: len(matrix1.col) and len(matrix2.row) must be the same")
+
+    return [[_column_sum([_column_mul(a[r][k], b[k][c], count) for k in range(len(b))], count)
+             for c in range(len(b[0]))] for r in range(len(a))]
+
+def _swizzle(name):
+    # type: (str) -> property
+    """Build the property for a swizzle attribute such as Vector.xzy, writable when no axis is repeated."""
+
+    axes = tuple("xyzw".index(char) for char in name)
+    top = max(axes)
+
+    def fget(self):
+        data = self._data
+
+        if top >= len(data):
+            raise AttributeError("Vector swizzle: component %s is out of range for a %dD vector" % (name, len(data)))
+
+        return _vector([data[i] for i in axes])
+
+    def fset(self, value):
+        data = self._data
+
+        if top >= len(data):
+            raise AttributeError("Vector swizzle: component %s is out of range for a %dD vector" % (name, len(data)))
+
+        _check_mutable(self)
+        values = _floats(value, "Vector swizzle")
+
+        if len(values) != len(axes):
+            raise TypeError("Vector swizzle: expected %d values, got %d" % (len(axes), len(values)))
+
+        for i, v in zip(axes, values):
+            data[i] = v
+
+        self._changed()
+
+    return property(fget, fset if len(set(axes)) == len(axes) else None, doc="Vector swizzle (%s)." % name)
 
 
 class Color:
     """This object gives access to Colors in Blender."""
 
+    __slots__ = ("_data", "_frozen")
+
     def __init__(self, rgb=None):
         # type: (__Sequence[__Union[float, int]]) -> None
         """This object gives access to Colors in Blender.
@@ -35,59 +537,280 @@ class Color:
         Args:
             rgb (__Sequence[float, float, float]): (r, g, b) color values"""
 
-        self.r = 1.0  # type: float
+        data = _floats(rgb, "Color()") if rgb is not None else [0.0, 0.0, 0.0]
+
+        if len(data) != 3:
+            raise ValueError("Color(): expected a sequence of 3 floats, not %d" % len(data))
+
+        self._data = data
+        self._frozen = False
+
+    @property
+    def r(self):
+        # type: () -> float
         """Red color channel."""
 
-        self.g = 1.0  # type: float
+        return self._data[0]
+
+    @r.setter
+    def r(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[0] = float(value)
+
+    @property
+    def g(self):
+        # type: () -> float
         """Green color channel."""
 
-        self.b = 1.0  # type: float
+        return self._data[1]
+
+    @g.setter
+    def g(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[1] = float(value)
+
+    @property
+    def b(self):
+        # type: () -> float
         """Blue color channel."""
 
-        self.h = 1.0  # type: float
+        return self._data[2]
+
+    @b.setter
+    def b(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[2] = float(value)
+
+    @property
+    def h(self):
+        # type: () -> float
         """HSV Hue component in [0, 1]."""
 
-        self.s = 1.0  # type: float
+        return _rgb_to_hsv(*self._data)[0]
+
+    @h.setter
+    def h(self, value):
+        # type: (float) -> None
+        h, s, v = _rgb_to_hsv(*self._data)
+        self.hsv = (value, s, v)
+
+    @property
+    def s(self):
+        # type: () -> float
         """HSV Saturation component in [0, 1]."""
 
-        self.v = 1.0  # type: float
+        return _rgb_to_hsv(*self._data)[1]
+
+    @s.setter
+    def s(self, value):
+        # type: (float) -> None
+        h, s, v = _rgb_to_hsv(*self._data)
+        self.hsv = (h, value, v)
+
+    @property
+    def v(self):
+        # type: () -> float
         """HSV Value component in [0, 1]."""
 
-        self.hsv = [1.0, 1.0, 1.0]  # type: list[float, float, float]
+        return _rgb_to_hsv(*self._data)[2]
+
+    @v.setter
+    def v(self, value):
+        # type: (float) -> None
+        h, s, v = _rgb_to_hsv(*self._data)
+        self.hsv = (h, s, value)
+
+    @property
+    def hsv(self):
+        # type: () -> tuple[float, float, float]
         """HSV Values in [0, 1]."""
 
-        self.is_frozen = False  # type: bool
+        return _rgb_to_hsv(*self._data)
+
+    @hsv.setter
+    def hsv(self, value):
+        # type: (__Sequence[float]) -> None
+        _check_mutable(self)
+        h, s, v = _floats(value, "Color.hsv")
+        self._data[:] = _hsv_to_rgb(min(max(h, 0.0), 1.0), min(max(s, 0.0), 1.0), v)
+
+    @property
+    def is_frozen(self):
+        # type: () -> bool
         """True when this object has been frozen (read-only)."""
 
-        self.is_wrapped = False  # type: bool
+        return self._frozen
+
+    @property
+    def is_wrapped(self):
+        # type: () -> bool
         """True when this object wraps external data (read-only)."""
 
-        self.owner = self  # type: Color
+        return False
+
+    @property
+    def owner(self):
+        # type: () -> None
         """The item this is wrapping or None (read-only)."""
 
+        return None
+
+    def __len__(self):
+        # type: () -> int
+        return 3
+
+    def __iter__(self):
+        return iter(self._data)
+
     def __getitem__(self, item):
         # type: (int) -> float
-        pass
+        if isinstance(item, slice):
+            return tuple(self._data[item])
+
+        return self._data[item]
 
     def __setitem__(self, key, value):
         # type: (int, float) -> None
-        pass
+        _check_mutable(self)
+
+        if isinstance(key, slice):
+            values = _floats(value, "Color[:]")
+
+            if len(values) != len(self._data[key]):
+                raise ValueError("Color[begin:end] = []: size mismatch in slice assignment")
+
+            self._data[key] = values
+
+        else:
+            self._data[key] = float(value)
+
+    def __repr__(self):
+        # type: () -> str
+        return "Color((%s))" % ", ".join(map(_repr_float, self._data))
+
+    def __str__(self):
+        # type: () -> str
+        return "<Color (r=%.4f, g=%.4f, b=%.4f)>" % tuple(self._data)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        return self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        return self._data != other._data
+
+    def __hash__(self):
+        # type: () -> int
+        if not self._frozen:
+            raise TypeError("Color must be frozen to be hashable")
+
+        return hash(tuple(self._data))
+
+    def __neg__(self):
+        # type: () -> Color
+        return _color([-c for c in self._data])
 
     def __sub__(self, other):
         # type: (Color) -> Color
-        pass
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        a = self._data
+        b = other._data
+        return _color([a[0] - b[0], a[1] - b[1], a[2] - b[2]])
 
     def __add__(self, other):
         # type: (Color) -> Color
-        pass
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        a = self._data
+        b = other._data
+        return _color([a[0] + b[0], a[1] + b[1], a[2] + b[2]])
+
+    def __iadd__(self, other):
+        # type: (Color) -> Color
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        _check_mutable(self)
+        a = self._data
+        b = other._data
+        a[0] += b[0]
+        a[1] += b[1]
+        a[2] += b[2]
+        return self
+
+    def __isub__(self, other):
+        # type: (Color) -> Color
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        _check_mutable(self)
+        a = self._data
+        b = other._data
+        a[0] -= b[0]
+        a[1] -= b[1]
+        a[2] -= b[2]
+        return self
 
     def __mul__(self, other):
-        # type: (__Union[Color, int, float]) -> Color
-        pass
+        # type: (__Union[int, float]) -> Color
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        return _color([c * other for c in self._data])
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        # type: (__Union[int, float]) -> Color
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        _check_mutable(self)
+        self._data[:] = [c * other for c in self._data]
+        return self
 
     def __truediv__(self, other):
         # type: (__Union[int, float]) -> Color
-        pass
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if not other:
+            raise ZeroDivisionError("Color division: divide by zero error")
+
+        return _color([c / other for c in self._data])
+
+    def __itruediv__(self, other):
+        # type: (__Union[int, float]) -> Color
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if not other:
+            raise ZeroDivisionError("Color division: divide by zero error")
+
+        _check_mutable(self)
+        self._data[:] = [c / other for c in self._data]
+        return self
+
+    def __copy__(self):
+        # type: () -> Color
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Color
+        return self.copy()
 
     def copy(self):
         # type: () -> Color
@@ -96,7 +819,7 @@ class Color:
         Returns:
             Color: A copy of the color."""
 
-        pass
+        return _color(list(self._data))
 
     def freeze(self):
         # type: () -> Color
@@ -105,12 +828,15 @@ class Color:
         Returns:
             Color: An instance of this object."""
 
-        pass
+        self._frozen = True
+        return self
 
 
 class Euler:
     """This object gives access to Eulers in Blender."""
 
+    __slots__ = ("_data", "_order", "_frozen")
+
     def __init__(self, angles=None, order="XYZ"):
         # type: (__Sequence[float], str) -> None
         """This object gives access to Eulers in Blender.
@@ -119,34 +845,154 @@ class Euler:
             angles (__Sequence[float]): Three angles, in radians.
             order (str): Optional order of the angles, a permutation of XYZ."""
 
-        self.is_frozen = False  # type: bool
+        data = _floats(angles, "Euler()") if angles is not None else [0.0, 0.0, 0.0]
+
+        if len(data) != 3:
+            raise ValueError("Euler(): expected a sequence of 3 floats, not %d" % len(data))
+
+        self._data = data
+        self._order = _parse_order(order)
+        self._frozen = False
+
+    @property
+    def is_frozen(self):
+        # type: () -> bool
         """True when this object has been frozen (read-only)."""
 
-        self.is_wrapped = False  # type: bool
+        return self._frozen
+
+    @property
+    def is_wrapped(self):
+        # type: () -> bool
         """True when this object wraps external data (read-only)."""
 
-        self.order = "XYZ"  # type: str
+        return False
+
+    @property
+    def order(self):
+        # type: () -> str
         """Euler rotation order."""
 
-        self.owner = self  # type: Euler
+        return self._order
+
+    @order.setter
+    def order(self, value):
+        # type: (str) -> None
+        _check_mutable(self)
+        self._order = _parse_order(value)
+
+    @property
+    def owner(self):
+        # type: () -> None
         """The item this is wrapping or None (read-only)."""
 
-        self.x = 1.0  # type: float
+        return None
+
+    @property
+    def x(self):
+        # type: () -> float
         """Euler axis angle in radians."""
 
-        self.y = 1.0  # type: float
+        return self._data[0]
+
+    @x.setter
+    def x(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[0] = float(value)
+
+    @property
+    def y(self):
+        # type: () -> float
         """Euler axis angle in radians."""
 
-        self.z = 1.0  # type: float
+        return self._data[1]
+
+    @y.setter
+    def y(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[1] = float(value)
+
+    @property
+    def z(self):
+        # type: () -> float
         """Euler axis angle in radians."""
 
+        return self._data[2]
+
+    @z.setter
+    def z(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[2] = float(value)
+
+    def __len__(self):
+        # type: () -> int
+        return 3
+
+    def __iter__(self):
+        return iter(self._data)
+
     def __getitem__(self, item):
         # type: (int) -> float
-        pass
+        if isinstance(item, slice):
+            return tuple(self._data[item])
+
+        return self._data[item]
 
     def __setitem__(self, key, value):
         # type: (int, float) -> None
-        pass
+        _check_mutable(self)
+
+        if isinstance(key, slice):
+            values = _floats(value, "Euler[:]")
+
+            if len(values) != len(self._data[key]):
+                raise ValueError("Euler[begin:end] = []: size mismatch in slice assignment")
+
+            self._data[key] = values
+
+        else:
+            self._data[key] = float(value)
+
+    def __repr__(self):
+        # type: () -> str
+        return "Euler((%s), '%s')" % (", ".join(map(_repr_float, self._data)), self._order)
+
+    def __str__(self):
+        # type: () -> str
+        return "<Euler (x=%.4f, y=%.4f, z=%.4f), order='%s'>" % (self._data[0], self._data[1], self._data[2],
+                                                                 self._order)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Euler):
+            return NotImplemented
+
+        return self._order == other._order and self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Euler):
+            return NotImplemented
+
+        return not self == other
+
+    def __hash__(self):
+        # type: () -> int
+        if not self._frozen:
+            raise TypeError("Euler must be frozen to be hashable")
+
+        return hash((tuple(self._data), self._order))
+
+    def __copy__(self):
+        # type: () -> Euler
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Euler
+        return self.copy()
 
     def copy(self):
         # type: () -> Euler
@@ -158,7 +1004,7 @@ class Euler:
         Note:
             - Use this to get a copy of a wrapped euler with no reference to the original data."""
 
-        pass
+        return _euler(list(self._data), self._order)
 
     def freeze(self):
         # type: () -> Euler
@@ -167,7 +1013,8 @@ class Euler:
         Returns:
             An instance of this object."""
 
-        pass
+        self._frozen = True
+        return self
 
     def make_compatible(self, other):
         # type: (Euler) -> None
@@ -179,7 +1026,13 @@ class Euler:
         Note:
             - The rotation order is not taken into account for this function."""
 
-        pass
+        _check_mutable(self)
+        old = _floats(other, "Euler.make_compatible(other)")
+
+        if len(old) != 3:
+            raise ValueError("Euler.make_compatible(other): expected a sequence of 3 floats")
+
+        _compatible_euler(self._data, old)
 
     def rotate(self, other):
         # type: (__Union[Euler, Quaternion, Matrix]) -> None
@@ -188,7 +1041,9 @@ class Euler:
         Args:
             other (__Union[Euler, Quaternion, Matrix]): rotation component of mathutils value"""
 
-        pass
+        _check_mutable(self)
+        rows = _mul_rows(_rotation_rows(other, "Euler.rotate(value)"), _euler_to_rows(self._data, self._order))
+        self._data[:] = _rows_to_euler(rows, self._order, self._data)
 
     def rotate_axis(self, axis, angle):
         # type: (str, float) -> None
@@ -198,80 +1053,498 @@ class Euler:
             axis (str): single character in ['X, 'Y', 'Z'].
             angle (float): angle in radians."""
 
-        pass
+        if axis not in ("X", "Y", "Z"):
+            raise ValueError("Euler.rotate_axis(): expected axis to be 'X', 'Y' or 'Z'")
+
+        _check_mutable(self)
+        delta = [0.0, 0.0, 0.0]
+        delta["XYZ".index(axis)] = float(angle)
+        rows = _mul_rows(_euler_to_rows(self._data, self._order), _euler_to_rows(delta, self._order))
+        self._data[:] = _rows_to_euler(rows, self._order)
+
+    def to_matrix(self):
+        # type: () -> Matrix
+        """Return a matrix representation of the euler.
+
+        Returns:
+            Matrix: A 3x3 roation matrix representation of the euler."""
+
+        return _matrix(_euler_to_rows(self._data, self._order))
+
+    def to_quaternion(self):
+        # type: () -> Quaternion
+        """Return a quaternion representation of the euler.
+
+        Returns:
+            Quaternion: Quaternion representation of the euler."""
+
+        return _quaternion(_rows_to_quat(_euler_to_rows(self._data, self._order)))
+
+    def zero(self):
+        # type: () -> None
+        """Set all values to zero."""
+
+        _check_mutable(self)
+        self._data[:] = [0.0, 0.0, 0.0]
+
+
+class _MatrixCells:
+    """List-like view of the cells of a column of a Matrix, the data of the vectors of Matrix.col and
+    Matrix.translation: they read and write the matrix like the row vectors."""
+
+    __slots__ = ("_matrix", "_column", "_size")
+
+    def __init__(self, matrix, column, size):
+        # type: (Matrix, int, int) -> None
+        self._matrix = matrix
+        self._column = column
+        self._size = size
+
+    def __len__(self):
+        # type: () -> int
+        return self._size
+
+    def __iter__(self):
+        column = self._column
+        return iter([row[column] for row in self._matrix._rows[:self._size]])
+
+    def __getitem__(self, item):
+        # type: (int | slice) -> float | list
+        if isinstance(item, slice):
+            return list(self)[item]
+
+        return self._matrix._rows[range(self._size)[item]][self._column]
+
+    def __setitem__(self, key, value):
+        # type: (int | slice, float | __Sequence[float]) -> None
+        rows, column = self._matrix._rows, self._column
+
+        if isinstance(key, slice):
+            indices = range(self._size)[key]
+            values = list(value)
+
+            if len(values) != len(indices):
+                raise ValueError("slice assignment: size mismatch")
+
+            for index, v in zip(indices, values):
+                rows[index][column] = v
+
+        else:
+            rows[range(self._size)[key]][column] = value
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        return not self == other
+
+    def __repr__(self):
+        # type: () -> str
+        return repr(list(self))
+
+
+class _MatrixColumns:
+    """Column access of a Matrix (Matrix.col), the column vectors and assignments write into the matrix."""
+
+    __slots__ = ("_matrix",)
+
+    def __init__(self, matrix):
+        # type: (Matrix) -> None
+        self._matrix = matrix
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._matrix._rows[0])
+
+    def __getitem__(self, item):
+        # type: (int) -> Vector
+        matrix = self._matrix
+        columns = range(len(matrix._rows[0]))
+
+        if isinstance(item, slice):
+            return tuple(matrix._column_vector(c, len(matrix._rows)) for c in columns[item])
+
+        return matrix._column_vector(columns[item], len(matrix._rows))
+
+    def __setitem__(self, key, value):
+        # type: (int, __Sequence[float]) -> None
+        matrix = self._matrix
+        _check_mutable(matrix)
+        rows = matrix._rows
+        values = _floats(value, "Matrix.col[i] = value")
+
+        if len(values) != len(rows):
+            raise ValueError("Matrix.col[i] = value: expected a sequence of %d floats" % len(rows))
+
+        for row, v in zip(rows, values):
+            row[key] = v
+
+    def __iter__(self):
+        matrix = self._matrix
+        return iter([matrix._column_vector(c, len(matrix._rows)) for c in range(len(matrix._rows[0]))])
+
+
+class Matrix:
+    """This object gives access to Matrices in Blender, supporting square and rectangular matrices from 2x2 up to 4x4."""
+
+    __slots__ = ("_rows", "_frozen")
+
+    def __init__(self, rows=None):
+        # type: (__Sequence[__Sequence[float]]) -> None
+        """This object gives access to Matrices in Blender, supporting square and rectangular matrices from 2x2 up to 4x4.
+
+        Args:
+            rows (__Sequence[__Sequence[float]]): Sequence of rows. When ommitted, a 4x4 identity matrix is constructed."""
+
+        if rows is None:
+            self._rows = _identity_rows(4)
+
+        else:
+            data = [_floats(row, "Matrix()") for row in rows]
+
+            if not 2 <= len(data) <= 4 or not 2 <= len(data[0]) <= 4:
+                raise ValueError("Matrix(): expects rows and columns of size 2 to 4")
+
+            if any(len(row) != len(data[0]) for row in data):
+                raise ValueError("Matrix(): all rows must have the same number of columns")
+
+            self._rows = data
+
+        self._frozen = False
+
+    def _square(self, name):
+        # type: (str) -> int
+        size = len(self._rows)
+
+        if size != len(self._rows[0]):
+            raise ValueError("%s: only square matrices are supported" % name)
+
+        return size
+
+    @property
+    def col(self):
+        # type: () -> _MatrixColumns
+        """Access the matix by colums, 3x3 and 4x4 only, (read-only)."""
+
+        return _MatrixColumns(self)
+
+    @property
+    def is_frozen(self):
+        # type: () -> bool
+        """True when this object has been frozen (read-only)."""
+
+        return self._frozen
+
+    @property
+    def is_negative(self):
+        # type: () -> bool
+        """True if this matrix results in a negative scale, 3x3 and 4x4 only, (read-only)."""
+
+        if len(self._rows) < 3 or len(self._rows[0]) < 3:
+            raise AttributeError("Matrix.is_negative: inappropriate matrix size")
+
+        return _determinant([row[:3] for row in self._rows[:3]]) < 0.0
+
+    @property
+    def is_orthogonal(self):
+        # type: () -> bool
+        """True if this matrix is orthogonal, 3x3 and 4x4 only, (read-only)."""
+
+        return self._orthogonal(True)
+
+    @property
+    def is_orthogonal_axis_vectors(self):
+        # type: () -> bool
+        """True if this matrix has got orthogonal axis vectors, 3x3 and 4x4 only, (read-only)."""
+
+        return self._orthogonal(False)
+
+    def _orthogonal(self, unit):
+        # type: (bool) -> bool
+        rows = self._rows
+
+        if len(rows) < 3 or len(rows[0]) < 3:
+            raise AttributeError("Matrix.is_orthogonal: inappropriate matrix size")
+
+        cols = [[rows[r][c] for r in range(3)] for c in range(3)]
+        eps = 1e-5
+
+        for i in range(3):
+            for j in range(i + 1, 3):
+                if abs(sum([a * b for a, b in zip(cols[i], cols[j])])) > eps:
+                    return False
+
+            if unit and abs(sum([a * a for a in cols[i]]) - 1.0) > 1.5 * eps:
+                return False
+
+        return True
+
+    @property
+    def is_wrapped(self):
+        # type: () -> bool
+        """True when this object wraps external data (read-only)."""
+
+        return False
+
+    @property
+    def median_scale(self):
+        # type: () -> float
+        """The average scale applied to each axis (read-only)."""
+
+        rows = self._rows
+
+        if len(rows) < 3 or len(rows[0]) < 3:
+            raise AttributeError("Matrix.median_scale: inappropriate matrix size")
+
+        unit = 0.5773502691896258
+        vec = [(rows[r][0] + rows[r][1] + rows[r][2]) * unit for r in range(3)]
+        return _sqrt(vec[0] * vec[0] + vec[1] * vec[1] + vec[2] * vec[2])
+
+    @property
+    def owner(self):
+        # type: () -> None
+        """The item this is wrapping or None (read-only)."""
+
+        return None
+
+    @property
+    def row(self):
+        # type: () -> tuple[Vector]
+        """Access the matix by rows (default), (read-only)."""
+
+        return tuple(self)
+
+    @property
+    def translation(self):
+        # type: () -> Vector
+        """The translation component of the matrix."""
+
+        rows = self._rows
+
+        if len(rows) != 4 or len(rows[0]) != 4:
+            raise AttributeError("Matrix.translation: inappropriate matrix size, must be 4x4")
+
+        return self._column_vector(3, 3)
+
+    @translation.setter
+    def translation(self, value):
+        # type: (__Sequence[float]) -> None
+        _check_mutable(self)
+        rows = self._rows
+
+        if len(rows) != 4 or len(rows[0]) != 4:
+            raise AttributeError("Matrix.translation: inappropriate matrix size, must be 4x4")
+
+        values = _floats(value, "Matrix.translation")
+
+        if len(values) != 3:
+            raise ValueError("Matrix.translation: expected a sequence of 3 floats")
+
+        rows[0][3], rows[1][3], rows[2][3] = values
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._rows)
+
+    def __iter__(self):
+        for row in self._rows:
+            yield self._row_vector(row)
+
+    def _row_vector(self, row):
+        # type: (list) -> Vector
+        """Vector wrapping a row list, writes through it modify the matrix."""
+
+        vec = _new(Vector)
+        vec._data = row
+        vec._owner = self
+        vec._frozen = self._frozen
+        return vec
+
+    def _column_vector(self, column, size):
+        # type: (int, int) -> Vector
+        """Vector wrapping the first cells of a column, writes through it modify the matrix."""
+
+        vec = _new(Vector)
+        vec._data = _MatrixCells(self, column, size)
+        vec._owner = self
+        vec._frozen = self._frozen
+        return vec
+
+    def __getitem__(self, item):
+        # type: (int) -> Vector
+        if isinstance(item, slice):
+            return tuple(self._row_vector(row) for row in self._rows[item])
+
+        return self._row_vector(self._rows[item])
+
+    def __setitem__(self, key, value):
+        # type: (int, float) -> None
+        _check_mutable(self)
+        columns = len(self._rows[0])
+
+        if isinstance(key, slice):
+            rows = self._rows[key]
+            values = list(value)
+
+            if len(values) != len(rows):
+                raise ValueError("matrix[begin:end] = []: size mismatch in slice assignment")
+
+            for row, new in zip(rows, values):
+                new = _floats(new, "matrix[begin:end] = []")
+
+                if len(new) != columns:
+                    raise ValueError("matrix[begin:end] = []: expected rows of %d floats" % columns)
+
+                row[:] = new
+
+        else:
+            new = _floats(value, "matrix[attribute] = x")
+
+            if len(new) != columns:
+                raise ValueError("matrix[attribute] = x: expected a sequence of %d floats" % columns)
+
+            self._rows[key][:] = new
+
+    def __repr__(self):
+        # type: () -> str
+        rows = ["(%s)" % ", ".join(map(_repr_float, row)) for row in self._rows]
+        return "Matrix((%s))" % ",\n        ".join(rows)
+
+    def __str__(self):
+        # type: () -> str
+        rows = ["(%s)" % ", ".join("%.4f" % value for value in row) for row in self._rows]
+        return "<Matrix %dx%d %s>" % (len(self._rows), len(self._rows[0]), "\n            ".join(rows))
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        return self._rows == other._rows
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        return self._rows != other._rows
+
+    def __hash__(self):
+        # type: () -> int
+        if not self._frozen:
+            raise TypeError("Matrix must be frozen to be hashable")
+
+        return hash(tuple(tuple(row) for row in self._rows))
+
+    def __neg__(self):
+        # type: () -> Matrix
+        return _matrix([[-value for value in row] for row in self._rows])
+
+    def __invert__(self):
+        # type: () -> Matrix
+        return self.inverted()
+
+    def _same_shape(self, other, name):
+        # type: (Matrix, str) -> None
+        if len(self._rows) != len(other._rows) or len(self._rows[0]) != len(other._rows[0]):
+            raise ValueError("Matrix %s: matrices must have the same dimensions for this operation" % name)
+
+    def __add__(self, other):
+        # type: (Matrix) -> Matrix
+        if not isinstance(other, Matrix):
+            return NotImplemented
 
-    def to_matrix(self):
-        # type: () -> Matrix
-        """Return a matrix representation of the euler.
+        self._same_shape(other, "addition")
+        return _matrix([[a + b for a, b in zip(ra, rb)] for ra, rb in zip(self._rows, other._rows)])
 
-        Returns:
-            Matrix: A 3x3 roation matrix representation of the euler."""
+    def __sub__(self, other):
+        # type: (Matrix) -> Matrix
+        if not isinstance(other, Matrix):
+            return NotImplemented
 
-        pass
+        self._same_shape(other, "subtraction")
+        return _matrix([[a - b for a, b in zip(ra, rb)] for ra, rb in zip(self._rows, other._rows)])
 
-    def to_quaternion(self):
-        # type: () -> Quaternion
-        """Return a quaternion representation of the euler.
+    def _transform(self, vec):
+        # type: (list) -> list
+        """Matrix * column vector, a 3D vector times a 4x4 matrix is extended with w=1 and returns a 3D vector."""
 
-        Returns:
-            Quaternion: Quaternion representation of the euler."""
+        rows = self._rows
+        size = len(vec)
+        columns = len(rows[0])
 
-        pass
+        if size == 3 and columns == 4:
+            x, y, z = vec
+            return [r[0] * x + r[1] * y + r[2] * z + r[3] for r in rows[:3]]
 
-    def zero(self):
-        # type: () -> None
-        """Set all values to zero."""
+        if size != columns:
+            raise ValueError("matrix * vector: len(matrix.col) and len(vector) must be the same, "
+                             "except for 4x4 matrix * 3D vector.")
 
-        pass
+        if size == 3:
+            x, y, z = vec
+            return [r[0] * x + r[1] * y + r[2] * z for r in rows]
 
+        return [sum([a * b for a, b in zip(r, vec)]) for r in rows]
 
-class Matrix:
-    """This object gives access to Matrices in Blender, supporting square and rectangular matrices from 2x2 up to 4x4."""
+    def _product(self, other, name):
+        # type: (__Any, str) -> __Any
+        if isinstance(other, Matrix):
+            if len(self._rows[0]) != len(other._rows):
+                raise ValueError("Matrix %s: len(matrix1.col) and len(matrix2.row) must be the same" % name)
 
-    def __init__(self, rows=None):
-        # type: (__Sequence[__Sequence[float]]) -> None
-        """This object gives access to Matrices in Blender, supporting square and rectangular matrices from 2x2 up to 4x4.
+            return _matrix(_mul_rows(self._rows, other._rows))
 
-        Args:
-            rows (__Sequence[__Sequence[float]]): Sequence of rows. When ommitted, a 4x4 identity matrix is constructed."""
+        if isinstance(other, Vector):
+            return _vector(self._transform(other._data))
 
-        self.col = self  # type: Matrix
-        """Access the matix by colums, 3x3 and 4x4 only, (read-only)."""
+        return NotImplemented
 
-        self.is_frozen = False  # type: bool
-        """True when this object has been frozen (read-only)."""
+    def __mul__(self, other):
+        # type: (__Union[Matrix, Vector, float]) -> __Union[Matrix, Vector]
+        if isinstance(other, (int, float)):
+            return _matrix([[value * other for value in row] for row in self._rows])
 
-        self.is_negative = False  # type: bool
-        """True if this matrix results in a negative scale, 3x3 and 4x4 only, (read-only)."""
+        return self._product(other, "multiplication")
 
-        self.is_orthogonal = False  # type: bool
-        """True if this matrix is orthogonal, 3x3 and 4x4 only, (read-only)."""
+    def __rmul__(self, other):
+        # type: (float) -> Matrix
+        if isinstance(other, (int, float)):
+            return _matrix([[value * other for value in row] for row in self._rows])
 
-        self.is_orthogonal_axis_vectors = False  # type: bool
-        """True if this matrix has got orthogonal axis vectors, 3x3 and 4x4 only, (read-only)."""
+        return NotImplemented
 
-        self.is_wrapped = False  # type: bool
-        """True when this object wraps external data (read-only)."""
+    def __imul__(self, other):
+        # type: (__Union[Matrix, float]) -> Matrix
+        if not isinstance(other, (int, float, Matrix)):
+            return NotImplemented
 
-        self.median_scale = 1.0  # type: float
-        """The average scale applied to each axis (read-only)."""
+        _check_mutable(self)
+        self._rows = (self * other)._rows
+        return self
 
-        self.owner = self  # type: Matrix
-        """The item this is wrapping or None (read-only)."""
+    def __matmul__(self, other):
+        # type: (__Union[Matrix, Vector]) -> __Union[Matrix, Vector]
+        return self._product(other, "matrix multiplication")
 
-        self.row = []  # type: __Sequence[Vector]
-        """Access the matix by rows (default), (read-only)."""
+    def __imatmul__(self, other):
+        # type: (Matrix) -> Matrix
+        if not isinstance(other, Matrix):
+            return NotImplemented
 
-        self.translation = Vector()  # type: Vector
-        """The translation component of the matrix."""
+        _check_mutable(self)
+        self._rows = self._product(other, "matrix multiplication")._rows
+        return self
 
-    def __getitem__(self, item):
-        # type: (int) -> Vector
-        return self.row[item]
+    def __copy__(self):
+        # type: () -> Matrix
+        return self.copy()
 
-    def __setitem__(self, key, value):
-        # type: (int, float) -> None
-        pass
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Matrix
+        return self.copy()
 
     @classmethod
     def Identity(cls, size):
@@ -284,7 +1557,10 @@ class Matrix:
         Returns:
             Matrix: A new identity matrix."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("Matrix.Identity(): size must be between 2 and 4")
+
+        return _matrix(_identity_rows(size))
 
     @classmethod
     def OrthoProjection(cls, axis, size):
@@ -298,7 +1574,38 @@ class Matrix:
         Returns:
             Matrix: A new projection matrix."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("Matrix.OrthoProjection(): size must be between 2 and 4")
+
+        rows = _identity_rows(size)
+
+        if isinstance(axis, str):
+            planes = {2: {"X": (1,), "Y": (0,)}, 3: {"XY": (2,), "XZ": (1,), "YZ": (0,)}}
+            dropped = planes[min(size, 3)].get(axis)
+
+            if dropped is None:
+                raise ValueError("Matrix.OrthoProjection(): unknown plane %r for a %dx%d matrix" % (axis, size, size))
+
+            for i in dropped:
+                rows[i][i] = 0.0
+
+        else:
+            normal = _floats(axis, "Matrix.OrthoProjection(axis)")
+            dim = min(size, 3)
+
+            if len(normal) != dim:
+                raise ValueError("Matrix.OrthoProjection(): axis must be a %dD vector" % dim)
+
+            length = _sqrt(sum([v * v for v in normal]))
+
+            if length:
+                normal = [v / length for v in normal]
+
+            for i in range(dim):
+                for j in range(dim):
+                    rows[i][j] = (1.0 if i == j else 0.0) - normal[i] * normal[j]
+
+        return _matrix(rows)
 
     @classmethod
     def Rotation(cls, angle, size, axis=None):
@@ -313,7 +1620,35 @@ class Matrix:
         Returns:
             Matrix: A new rotation matrix."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("Matrix.Rotation(): size must be between 2 and 4")
+
+        c = _cos(angle)
+        s = _sin(angle)
+
+        if size == 2:
+            return _matrix([[c, -s], [s, c]])
+
+        if axis == "X":
+            rot = [[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]]
+
+        elif axis == "Y":
+            rot = [[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]
+
+        elif axis == "Z":
+            rot = [[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]
+
+        elif axis is None or isinstance(axis, str):
+            raise ValueError("Matrix.Rotation(): axis must be 'X', 'Y', 'Z' or a 3D vector for a %dx%d matrix"
+                             % (size, size))
+
+        else:
+            rot = _quat_to_rows(_axis_angle_to_quat(_floats(axis, "Matrix.Rotation(axis)"), angle))
+
+        if size == 4:
+            rot = [rot[0] + [0.0], rot[1] + [0.0], rot[2] + [0.0], [0.0, 0.0, 0.0, 1.0]]
+
+        return _matrix(rot)
 
     @classmethod
     def Scale(cls, factor, size, axis=None):
@@ -328,7 +1663,32 @@ class Matrix:
         Returns:
             Matrix: A new scale matrix."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("Matrix.Scale(): size must be between 2 and 4")
+
+        rows = _identity_rows(size)
+        dim = min(size, 3)
+
+        if axis is None:
+            for i in range(dim):
+                rows[i][i] = float(factor)
+
+        else:
+            direction = _floats(axis, "Matrix.Scale(axis)")
+
+            if len(direction) != dim:
+                raise ValueError("Matrix.Scale(): axis must be a %dD vector" % dim)
+
+            length = _sqrt(sum([v * v for v in direction]))
+
+            if length:
+                direction = [v / length for v in direction]
+
+            for i in range(dim):
+                for j in range(dim):
+                    rows[i][j] += (factor - 1.0) * direction[i] * direction[j]
+
+        return _matrix(rows)
 
     @classmethod
     def Shear(cls, plane, size, factor):
@@ -343,7 +1703,41 @@ class Matrix:
         Returns:
             Matrix: A new shear matrix."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("Matrix.Shear(): size must be between 2 and 4")
+
+        rows = _identity_rows(size)
+
+        if size == 2:
+            if plane == "X":
+                rows[0][1] = float(factor)
+
+            elif plane == "Y":
+                rows[1][0] = float(factor)
+
+            else:
+                raise ValueError("Matrix.Shear(): expected 'X' or 'Y' for a 2x2 matrix")
+
+            return _matrix(rows)
+
+        f0, f1 = _floats(factor, "Matrix.Shear(factor)")
+
+        if plane == "XY":
+            rows[0][2] = f0
+            rows[1][2] = f1
+
+        elif plane == "XZ":
+            rows[0][1] = f0
+            rows[2][1] = f1
+
+        elif plane == "YZ":
+            rows[1][0] = f0
+            rows[2][0] = f1
+
+        else:
+            raise ValueError("Matrix.Shear(): expected 'XY', 'XZ' or 'YZ' for a %dx%d matrix" % (size, size))
+
+        return _matrix(rows)
 
     @classmethod
     def Translation(cls, vector):
@@ -356,7 +1750,28 @@ class Matrix:
         Returns:
             Matrix: An identity matrix with a translation."""
 
-        pass
+        values = _floats(vector, "Matrix.Translation(vector)")
+
+        if not 2 <= len(values) <= 3:
+            raise ValueError("Matrix.Translation(): expected a 2D or 3D vector")
+
+        rows = _identity_rows(4)
+
+        for i, value in enumerate(values):
+            rows[i][3] = value
+
+        return _matrix(rows)
+
+    def _set_rows(self, rows):
+        # type: (list) -> None
+        """Replace the values in place so row vectors handed out earlier keep wrapping this matrix."""
+
+        if len(rows) == len(self._rows) and len(rows[0]) == len(self._rows[0]):
+            for row, new in zip(self._rows, rows):
+                row[:] = new
+
+        else:
+            self._rows = rows
 
     def adjugate(self):
         # type: () -> None
@@ -365,7 +1780,9 @@ class Matrix:
         Note:
             - When the matrix cannot be adjugated a ValueError exception is raised."""
 
-        pass
+        _check_mutable(self)
+        self._square("Matrix.adjugate(d)")
+        self._set_rows(_adjugate_rows(self._rows))
 
     def adjugated(self):
         # type: () -> Matrix
@@ -377,7 +1794,8 @@ class Matrix:
         Note:
             - When the matrix cant be adjugated a ValueError exception is raised."""
 
-        pass
+        self._square("Matrix.adjugate(d)")
+        return _matrix(_adjugate_rows(self._rows))
 
     def copy(self):
         # type: () -> Matrix
@@ -386,7 +1804,7 @@ class Matrix:
         Returns:
             Matrix: An instance of itself"""
 
-        pass
+        return _matrix([list(row) for row in self._rows])
 
     def decompose(self):
         # type: () -> tuple[Vector, Quaternion, Vector]
@@ -395,7 +1813,19 @@ class Matrix:
         Returns:
             tuple[Vector, Quaternion, Vector]: trans, rot, scale triple."""
 
-        pass
+        rows = self._rows
+
+        if len(rows) != 4 or len(rows[0]) != 4:
+            raise ValueError("Matrix.decompose(): inappropriate matrix size - expects 4x4 matrix")
+
+        scale = self.to_scale()._data
+        rot = [row[:3] for row in rows[:3]]
+
+        if _determinant(rot) < 0.0:
+            scale = [-s for s in scale]
+            rot = [[-v for v in row] for row in rot]
+
+        return self.to_translation(), _quaternion(_rows_to_quat(rot)), _vector(scale)
 
     def determinant(self):
         # type: () -> float
@@ -404,7 +1834,8 @@ class Matrix:
         Returns:
             float: Return the determinant of a matrix."""
 
-        pass
+        self._square("Matrix.determinant()")
+        return _determinant(self._rows)
 
     def freeze(self):
         # type: () -> Matrix
@@ -415,7 +1846,8 @@ class Matrix:
         Returns:
             Matrix: An instance of this object."""
 
-        pass
+        self._frozen = True
+        return self
 
     def identity(self):
         # type: () -> None
@@ -424,7 +1856,8 @@ class Matrix:
         Note:
             - An object with a location and rotation of zero, and a scale of one will have an identity matrix."""
 
-        pass
+        _check_mutable(self)
+        self._set_rows(_identity_rows(self._square("Matrix.identity()")))
 
     def invert(self, fallback=None):
         # type: (Matrix) -> None
@@ -433,13 +1866,15 @@ class Matrix:
         Args:
             fallback (Matrix): Set the matrix to this value when the inverse cannot be calculated (instead of raising a ValueError exception)."""
 
-        pass
+        _check_mutable(self)
+        self._set_rows(self.inverted(fallback)._rows)
 
     def invert_safe(self):
         # type: () -> None
         """Set the matrix to its inverse, will never error. If degenerated (e.g. zero scale on an axis), add some epsilon to its diagonal, to get an invertible one. If tweaked matrix is still degenerated, set to the identity matrix instead."""
 
-        pass
+        _check_mutable(self)
+        self._set_rows(self.inverted_safe()._rows)
 
     def inverted(self, fallback=None):
         # type: (Matrix) -> Matrix
@@ -451,7 +1886,19 @@ class Matrix:
         Returns:
             Matrix: The inverted matrix or fallback when given."""
 
-        pass
+        self._square("Matrix.invert(ed)")
+        rows = _inverted_rows(self._rows)
+
+        if rows is None:
+            if fallback is None:
+                raise ValueError("Matrix.invert(ed): matrix does not have an inverse")
+
+            if not isinstance(fallback, Matrix) or len(fallback) != len(self._rows):
+                raise TypeError("Matrix.invert(ed): fallback must be a matrix of the same size")
+
+            return fallback.copy()
+
+        return _matrix(rows)
 
     def inverted_safe(self):
         # type: () -> Matrix
@@ -460,7 +1907,18 @@ class Matrix:
         Returns:
             Matrix: The inverted matrix."""
 
-        pass
+        size = self._square("Matrix.invert(ed)_safe")
+        rows = _inverted_rows(self._rows)
+
+        if rows is None:
+            tweaked = [list(row) for row in self._rows]
+
+            for i in range(size):
+                tweaked[i][i] += 1e-8
+
+            rows = _inverted_rows(tweaked) or _identity_rows(size)
+
+        return _matrix(rows)
 
     def lerp(self, other, factor):
         # type: (Matrix, float) -> Matrix
@@ -473,13 +1931,33 @@ class Matrix:
         Returns:
             Matrix: The interpolated matrix."""
 
-        pass
+        size = self._square("Matrix.lerp()")
+        self._same_shape(other, "lerp")
+
+        if size not in (3, 4):
+            raise ValueError("Matrix.lerp(): only 3x3 and 4x4 matrices supported")
+
+        # Rotation is slerped and the remaining stretch lerped, like Blender's polar decomposition interpolation.
+        rot_a = _rows_to_quat(self._rows)
+        rot_b = _rows_to_quat(other._rows)
+        stretch_a = _mul_rows(list(map(list, zip(*_quat_to_rows(rot_a)))), [row[:3] for row in self._rows[:3]])
+        stretch_b = _mul_rows(list(map(list, zip(*_quat_to_rows(rot_b)))), [row[:3] for row in other._rows[:3]])
+        rot = _quat_to_rows(_quaternion(rot_a).slerp(rot_b, factor)._data)
+        stretch = [[a + (b - a) * factor for a, b in zip(ra, rb)] for ra, rb in zip(stretch_a, stretch_b)]
+        rows = _mul_rows(rot, stretch)
+
+        if size == 4:
+            rows = [row + [a[3] + (b[3] - a[3]) * factor] for row, a, b in zip(rows, self._rows, other._rows)]
+            rows.append([a + (b - a) * factor for a, b in zip(self._rows[3], other._rows[3])])
+
+        return _matrix(rows)
 
     def normalize(self):
         # type: () -> None
         """Normalize each of the matrix columns."""
 
-        pass
+        _check_mutable(self)
+        self._set_rows(self.normalized()._rows)
 
     def normalized(self):
         # type: () -> Matrix
@@ -488,13 +1966,25 @@ class Matrix:
         Returns:
             Matrix: a column normalized matrix"""
 
-        pass
+        size = self._square("Matrix.normalize(d)")
+
+        if size not in (3, 4):
+            raise ValueError("Matrix.normalize(d): only 3x3 and 4x4 matrices supported")
+
+        rows = [list(row) for row in self._rows]
+        normal = _normalized_3x3(rows)
+
+        for r in range(3):
+            rows[r][:3] = normal[r]
+
+        return _matrix(rows)
 
     def resize_4x4(self):
         # type: () -> None
         """Resize the matrix to 4x4."""
 
-        pass
+        _check_mutable(self)
+        self._rows = self.to_4x4()._rows
 
     def rotate(self, other):
         # type: (__Union[Euler, Quaternion, Matrix]) -> None
@@ -506,7 +1996,12 @@ class Matrix:
         Note:
             - If any of the columns are not unit length this may not have desired results."""
 
-        pass
+        _check_mutable(self)
+
+        if len(self._rows) != 3 or len(self._rows[0]) != 3:
+            raise ValueError("Matrix.rotate(): must have 3x3 dimensions")
+
+        self._set_rows(_mul_rows(_rotation_rows(other, "Matrix.rotate(value)"), self._rows))
 
     def to_3x3(self):
         # type: () -> Matrix
@@ -515,87 +2010,467 @@ class Matrix:
         Returns:
             Matrix: A new matrix."""
 
-        pass
+        rows = _identity_rows(3)
+
+        for r, row in enumerate(self._rows[:3]):
+            rows[r][:len(row[:3])] = row[:3]
+
+        return _matrix(rows)
 
     def to_4x4(self):
         # type: () -> Matrix
         """Return a 4x4 copy of this matrix.
 
         Returns:
-            Matrix: A new matrix."""
+            Matrix: A new matrix."""
+
+        rows = _identity_rows(4)
+
+        for r, row in enumerate(self._rows):
+            rows[r][:len(row)] = row
+
+        return _matrix(rows)
+
+    def to_euler(self, order="", euler_compat=None):
+        # type: (str, Euler) -> Euler
+        """Return an Euler representation of the rotation matrix (3x3 or 4x4 matrix only).
+
+        Args:
+            order (str): Optional rotation order argument in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'].
+            euler_compat (Euler): Optional euler argument the new euler will be made compatible with (no axis flipping between them). Useful for converting a series of matrices to animation curves.
+
+        Returns:
+            Euler: Euler representation of the matrix."""
+
+        if len(self._rows) < 3 or len(self._rows[0]) < 3:
+            raise ValueError("Matrix.to_euler(): inappropriate matrix size - expects 3x3 or 4x4 matrix")
+
+        order = _parse_order(order or "XYZ")
+        compat = _floats(euler_compat, "Matrix.to_euler(euler_compat)") if euler_compat is not None else None
+        return _euler(_rows_to_euler(self._rows, order, compat), order)
+
+    def to_quaternion(self):
+        # type: () -> Quaternion
+        """Return a quaternion representation of the rotation matrix.
+
+        Returns:
+            Quaternion: Quaternion representation of the rotation matrix."""
+
+        if len(self._rows) < 3 or len(self._rows[0]) < 3:
+            raise ValueError("Matrix.to_quaternion(): inappropriate matrix size - expects 3x3 or 4x4 matrix")
+
+        return _quaternion(_rows_to_quat(self._rows))
+
+    def to_scale(self):
+        # type: () -> Vector
+        """Return the scale part of a 3x3 or 4x4 matrix.
+
+        Returns:
+            Vector: Return the scale of a matrix.
+
+        Note:
+            - This method does not return a negative scale on any axis because it is not possible to obtain this data from the matrix alone."""
+
+        rows = self._rows
+
+        if len(rows) < 3 or len(rows[0]) < 3:
+            raise ValueError("Matrix.to_scale(): inappropriate matrix size - expects 3x3 or 4x4 matrix")
+
+        return _vector([_sqrt(rows[0][c] * rows[0][c] + rows[1][c] * rows[1][c] + rows[2][c] * rows[2][c])
+                        for c in range(3)])
+
+    def to_translation(self):
+        # type: () -> Vector
+        """Return the translation part of a 4 row matrix.
+
+        Returns:
+            Vector: The translation of a matrix."""
+
+        rows = self._rows
+
+        if len(rows) < 3 or len(rows[0]) != 4:
+            raise ValueError("Matrix.to_translation(): inappropriate matrix size")
+
+        return _vector([rows[0][3], rows[1][3], rows[2][3]])
+
+    def transpose(self):
+        # type: () -> None
+        """Set the matrix to its transpose."""
+
+        _check_mutable(self)
+        self._square("Matrix.transpose(d)")
+        self._set_rows([list(col) for col in zip(*self._rows)])
+
+    def transposed(self):
+        # type: () -> Matrix
+        """Return a new, transposed matrix.
+
+        Returns:
+            Matrix: A transposed matrix"""
+
+        return _matrix([list(col) for col in zip(*self._rows)])
+
+    def zero(self):
+        # type: () -> None
+        """Set all the matrix values to zero."""
+
+        _check_mutable(self)
+
+        for row in self._rows:
+            row[:] = [0.0] * len(row)
+
+
+class MatrixArray:
+    """Contiguous array of matrices sharing the same dimensions, operations apply to all of them at once."""
+
+    __slots__ = ("_data", "_rows", "_cols")
+
+    def __init__(self, matrices=None, rows=4, cols=4):
+        # type: (__Sequence[__Union[Matrix, __Sequence[__Sequence[float]]]], int, int) -> None
+        """Contiguous array of matrices sharing the same dimensions, operations apply to all of them at once.
+
+        Args:
+            matrices (__Sequence[__Union[Matrix, __Sequence[__Sequence[float]]]]): Sequence of matrices, or a flat float buffer (array, memoryview) holding rows * cols values per matrix in row major order.
+            rows (int): Number of rows of each matrix [2, 4], ignored when matrices are given as Matrix objects.
+            cols (int): Number of columns of each matrix [2, 4], ignored when matrices are given as Matrix objects."""
+
+        if isinstance(matrices, MatrixArray):
+            rows = matrices._rows
+            cols = matrices._cols
+            data = _array("d", matrices._data)
+
+        elif matrices is None or isinstance(matrices, (_array, memoryview)):
+            data = _array("d") if matrices is None else _array("d", matrices)
+
+            if len(data) % (rows * cols):
+                raise ValueError("MatrixArray(): flat buffers must hold a multiple of %d values" % (rows * cols))
+
+        else:
+            data = _array("d")
+            matrices = list(matrices)
+
+            if matrices:
+                rows = len(matrices[0])
+                cols = len(matrices[0][0])
+
+            for mat in matrices:
+                values = mat._rows if isinstance(mat, Matrix) else mat
+
+                if len(values) != rows or any(len(row) != cols for row in values):
+                    raise ValueError("MatrixArray(): all matrices must be %dx%d" % (rows, cols))
+
+                for row in values:
+                    data.extend(row)
+
+        if not 2 <= rows <= 4 or not 2 <= cols <= 4:
+            raise ValueError("MatrixArray(): expects rows and columns of size 2 to 4")
+
+        self._data = data
+        self._rows = rows
+        self._cols = cols
+
+    @staticmethod
+    def _wrap(data, rows, cols):
+        # type: (_array, int, int) -> MatrixArray
+        arr = _new(MatrixArray)
+        arr._data = data
+        arr._rows = rows
+        arr._cols = cols
+        return arr
+
+    def _components(self):
+        # type: () -> list
+        """Matrix rows of coefficient arrays, [r][c] holding that coefficient for every matrix."""
+
+        cols = self._cols
+        stride = self._rows * cols
+        data = self._data
+        return [[data[r * cols + c::stride] for c in range(cols)] for r in range(self._rows)]
+
+    @classmethod
+    def _from_components(cls, rows):
+        # type: (list) -> MatrixArray
+        return MatrixArray._wrap(_interleave([column for row in rows for column in row]), len(rows), len(rows[0]))
+
+    @property
+    def buffer(self):
+        # type: () -> memoryview
+        """Memoryview of the matrix data with shape (len, rows, cols), shared with this array (read-only)."""
+
+        return memoryview(self._data).cast("B").cast("d", [len(self), self._rows, self._cols])
+
+    def __buffer__(self, flags):
+        # type: (int) -> memoryview
+        return self.buffer
+
+    @property
+    def cols(self):
+        # type: () -> int
+        """Number of columns of each matrix (read-only)."""
+
+        return self._cols
+
+    @property
+    def rows(self):
+        # type: () -> int
+        """Number of rows of each matrix (read-only)."""
+
+        return self._rows
+
+    @property
+    def translation(self):
+        # type: () -> VectorArray
+        """The translation component of every matrix, 4x4 only."""
+
+        if self._rows != 4 or self._cols != 4:
+            raise AttributeError("MatrixArray.translation: inappropriate matrix size, must be 4x4")
+
+        data = self._data
+        return VectorArray._wrap(_interleave([data[3::16], data[7::16], data[11::16]]), 3)
+
+    @translation.setter
+    def translation(self, value):
+        # type: (__Union[VectorArray, __Sequence[float]]) -> None
+        if self._rows != 4 or self._cols != 4:
+            raise AttributeError("MatrixArray.translation: inappropriate matrix size, must be 4x4")
+
+        count = len(self)
+
+        for offset, column in zip((3, 7, 11), VectorArray._operand(value, 3, count, "MatrixArray.translation")):
+            self._data[offset::16] = _array("d", _column(column, count))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._data) // (self._rows * self._cols)
+
+    def _matrix_at(self, index):
+        # type: (int) -> Matrix
+        cols = self._cols
+        start = index * self._rows * cols
+        data = self._data
+        return _matrix([data[start + r * cols:start + (r + 1) * cols].tolist() for r in range(self._rows)])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._matrix_at(index)
+
+    def __getitem__(self, item):
+        # type: (int) -> Matrix
+        stride = self._rows * self._cols
+
+        if isinstance(item, slice):
+            data = _array("d")
+
+            for index in range(len(self))[item]:
+                data.extend(self._data[index * stride:(index + 1) * stride])
+
+            return MatrixArray._wrap(data, self._rows, self._cols)
+
+        return self._matrix_at(range(len(self))[item])
+
+    def __setitem__(self, key, value):
+        # type: (int, Matrix) -> None
+        stride = self._rows * self._cols
+        values = value._rows if isinstance(value, Matrix) else value
+        flat = [float(v) for row in values for v in row]
+
+        if len(values) != self._rows or len(flat) != stride:
+            raise ValueError("MatrixArray[index] = value: expected a %dx%d matrix" % (self._rows, self._cols))
+
+        index = range(len(self))[key]
+        self._data[index * stride:(index + 1) * stride] = _array("d", flat)
+
+    def __repr__(self):
+        # type: () -> str
+        return "MatrixArray(%r)" % ([tuple(tuple(row) for row in mat._rows) for mat in self],)
+
+    def __str__(self):
+        # type: () -> str
+        return "<MatrixArray %d matrices of %dx%d>" % (len(self), self._rows, self._cols)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, MatrixArray):
+            return NotImplemented
+
+        return (self._rows, self._cols) == (other._rows, other._cols) and self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, MatrixArray):
+            return NotImplemented
+
+        return not self == other
+
+    __hash__ = None
+
+    def _operand(self, other):
+        # type: (__Any) -> list
+        """Coefficients of a Matrix or a same sized MatrixArray operand, None for anything else."""
+
+        if isinstance(other, Matrix):
+            return _matrix_columns(other._rows)
+
+        if isinstance(other, MatrixArray):
+            if len(other) != len(self):
+                raise ValueError("MatrixArray: arrays must have the same length for this operation")
+
+            return other._components()
+
+        return None
+
+    def _product(self, other, reverse=False):
+        # type: (__Any, bool) -> __Any
+        count = len(self)
+
+        if isinstance(other, (Vector, VectorArray)) and not reverse:
+            vec = VectorArray._operand(other, len(other) if isinstance(other, Vector) else other._size, count,
+                                       "matrix * vector")
+            result = _transform_columns(self._components(), [list(_column(c, count)) for c in vec], count)
+            return VectorArray._wrap(_interleave(result), len(result))
+
+        mat = self._operand(other)
+
+        if mat is None:
+            return NotImplemented
+
+        a, b = (mat, self._components()) if reverse else (self._components(), mat)
+        return MatrixArray._from_components(_product_columns(a, b, count))
+
+    def __mul__(self, other):
+        # type: (__Union[MatrixArray, Matrix, VectorArray, Vector, float]) -> __Union[MatrixArray, VectorArray]
+        if isinstance(other, (int, float)):
+            return MatrixArray._wrap(_array("d", map(_mul, self._data, _repeat(float(other)))), self._rows,
+                                     self._cols)
+
+        return self._product(other)
+
+    def __rmul__(self, other):
+        # type: (__Union[Matrix, float]) -> MatrixArray
+        if isinstance(other, (int, float)):
+            return self * other
+
+        return self._product(other, True)
+
+    def __matmul__(self, other):
+        # type: (__Union[MatrixArray, Matrix, VectorArray, Vector]) -> __Union[MatrixArray, VectorArray]
+        return self._product(other)
+
+    def __rmatmul__(self, other):
+        # type: (Matrix) -> MatrixArray
+        return self._product(other, True)
+
+    def __copy__(self):
+        # type: () -> MatrixArray
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> MatrixArray
+        return self.copy()
+
+    @classmethod
+    def Identity(cls, count, size=4):
+        # type: (int, int) -> MatrixArray
+        """Create an array of identity matrices.
+
+        Args:
+            count (int): Number of matrices.
+            size (int): The size of the identity matrices to construct [2, 4].
+
+        Returns:
+            MatrixArray: A new array of identity matrices."""
 
-        pass
+        if not 2 <= size <= 4:
+            raise ValueError("MatrixArray.Identity(): size must be between 2 and 4")
 
-    def to_euler(self, order="", euler_compat=None):
-        # type: (str, Euler) -> Euler
-        """Return an Euler representation of the rotation matrix (3x3 or 4x4 matrix only).
+        return MatrixArray._wrap(_array("d", [v for row in _identity_rows(size) for v in row] * count), size, size)
+
+    @classmethod
+    def Translation(cls, vectors):
+        # type: (VectorArray) -> MatrixArray
+        """Create an array of translation matrices.
 
         Args:
-            order (str): Optional rotation order argument in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'].
-            euler_compat (Euler): Optional euler argument the new euler will be made compatible with (no axis flipping between them). Useful for converting a series of matrices to animation curves.
+            vectors (VectorArray): The translation vectors, 2D or 3D.
 
         Returns:
-            Euler: Euler representation of the matrix."""
+            MatrixArray: One 4x4 identity matrix with a translation per vector."""
 
-        pass
+        if not isinstance(vectors, VectorArray):
+            vectors = VectorArray(vectors)
 
-    def to_quaternion(self):
-        # type: () -> Quaternion
-        """Return a quaternion representation of the rotation matrix.
+        arr = MatrixArray.Identity(len(vectors), 4)
+
+        for offset, column in zip((3, 7, 11), vectors._components()):
+            arr._data[offset::16] = column
+
+        return arr
+
+    def copy(self):
+        # type: () -> MatrixArray
+        """Returns a copy of this array.
 
         Returns:
-            Quaternion: Quaternion representation of the rotation matrix."""
+            MatrixArray: A copy with its own buffer."""
 
-        pass
+        return MatrixArray._wrap(_array("d", self._data), self._rows, self._cols)
 
-    def to_scale(self):
-        # type: () -> Vector
-        """Return the scale part of a 3x3 or 4x4 matrix.
+    def determinant(self):
+        # type: () -> _array
+        """Return the determinant of every matrix.
 
         Returns:
-            Vector: Return the scale of a matrix.
+            array: One double per matrix."""
 
-        Note:
-            - This method does not return a negative scale on any axis because it is not possible to obtain this data from the matrix alone."""
+        if self._rows != self._cols:
+            raise ValueError("MatrixArray.determinant(): only square matrices are supported")
 
-        pass
+        return _array("d", [_determinant(mat._rows) for mat in self])
 
-    def to_translation(self):
-        # type: () -> Vector
-        """Return the translation part of a 4 row matrix.
+    def inverted(self, fallback=None):
+        # type: (Matrix) -> MatrixArray
+        """Return an array with every matrix inverted.
+
+        Args:
+            fallback (Matrix): used in place of the matrices which can't be inverted (instead of raising a ValueError).
 
         Returns:
-            Vector: The translation of a matrix."""
+            MatrixArray: The inverted matrices."""
 
-        pass
+        if self._rows != self._cols:
+            raise ValueError("MatrixArray.inverted(): only square matrices are supported")
 
-    def transpose(self):
-        # type: () -> None
-        """Set the matrix to its transpose."""
+        data = _array("d")
 
-        pass
+        for mat in self:
+            rows = _inverted_rows(mat._rows)
 
-    def transposed(self):
-        # type: () -> Matrix
-        """Return a new, transposed matrix.
+            if rows is None:
+                if fallback is None:
+                    raise ValueError("MatrixArray.inverted(): matrix does not have an inverse")
 
-        Returns:
-            Matrix: A transposed matrix"""
+                rows = fallback._rows
 
-        pass
+            for row in rows:
+                data.extend(row)
 
-    def zero(self):
-        # type: () -> None
-        """Set all the matrix values to zero."""
+        return MatrixArray._wrap(data, self._rows, self._cols)
+
+    def transposed(self):
+        # type: () -> MatrixArray
+        """Return an array with every matrix transposed.
 
-        pass
+        Returns:
+            MatrixArray: The transposed matrices."""
 
-    pass
+        return MatrixArray._from_components([list(column) for column in zip(*self._components())])
 
 
 class Quaternion:
     """This object gives access to Quaternions in Blender."""
 
+    __slots__ = ("_data", "_frozen")
+
     def __init__(self, seq=None, angle=None):
         # type: (Vector, float) -> None
         """This object gives access to Quaternions in Blender. The constructor takes arguments in various forms:
@@ -609,48 +2484,296 @@ class Quaternion:
             seq (Vector): size 3 or 4
             angle (float): rotation angle, in radians"""
 
-        self.angle = 1.0  # type: float
+        self._frozen = False
+
+        if seq is None:
+            self._data = [1.0, 0.0, 0.0, 0.0]
+            return
+
+        values = _floats(seq, "Quaternion()")
+
+        if angle is not None:
+            if len(values) != 3:
+                raise ValueError("Quaternion(): axis must be a 3D vector")
+
+            self._data = _axis_angle_to_quat(values, float(angle))
+
+        elif len(values) == 4:
+            self._data = values
+
+        elif len(values) == 3:
+            self._data = _axis_angle_to_quat(values, _sqrt(sum([v * v for v in values])))
+
+        else:
+            raise ValueError("Quaternion(): expected a sequence of 3 or 4 floats")
+
+    @property
+    def angle(self):
+        # type: () -> float
         """Angle of the quaternion."""
 
-        self.axis = Vector()  # type: Vector
+        return _quat_to_axis_angle(self._data)[1]
+
+    @angle.setter
+    def angle(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        length = self.magnitude
+        axis = _quat_to_axis_angle(self._data)[0]
+        self._data[:] = [v * length for v in _axis_angle_to_quat(axis, float(value))]
+
+    @property
+    def axis(self):
+        # type: () -> Vector
         """Quaternion axis as a vector."""
 
-        self.is_frozen = False  # type: bool
+        return _vector(_quat_to_axis_angle(self._data)[0])
+
+    @axis.setter
+    def axis(self, value):
+        # type: (__Sequence[float]) -> None
+        _check_mutable(self)
+        axis = _floats(value, "Quaternion.axis")
+
+        if len(axis) != 3:
+            raise ValueError("Quaternion.axis: expected a 3D vector")
+
+        length = self.magnitude
+        angle = _quat_to_axis_angle(self._data)[1]
+        self._data[:] = [v * length for v in _axis_angle_to_quat(axis, angle)]
+
+    @property
+    def is_frozen(self):
+        # type: () -> bool
         """True when this object has been frozen (read-only)."""
 
-        self.is_wrapped = False  # type: bool
+        return self._frozen
+
+    @property
+    def is_wrapped(self):
+        # type: () -> bool
         """True when this object wraps external data (read-only)."""
 
-        self.magnitude = 1.0  # type: float
+        return False
+
+    @property
+    def magnitude(self):
+        # type: () -> float
         """Size of the quaternion (read-only)."""
 
-        self.owner = self  # type: Quaternion
+        w, x, y, z = self._data
+        return _sqrt(w * w + x * x + y * y + z * z)
+
+    @property
+    def owner(self):
+        # type: () -> None
         """The item this is wrapping or None (read-only)."""
 
-        self.w = 1.0  # type: float
+        return None
+
+    @property
+    def w(self):
+        # type: () -> float
         """Quaternion axis value."""
 
-        self.x = 1.0  # type: float
+        return self._data[0]
+
+    @w.setter
+    def w(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[0] = float(value)
+
+    @property
+    def x(self):
+        # type: () -> float
         """Quaternion axis value."""
 
-        self.y = 1.0  # type: float
+        return self._data[1]
+
+    @x.setter
+    def x(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[1] = float(value)
+
+    @property
+    def y(self):
+        # type: () -> float
         """Quaternion axis value."""
 
-        self.z = 1.0  # type: float
+        return self._data[2]
+
+    @y.setter
+    def y(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[2] = float(value)
+
+    @property
+    def z(self):
+        # type: () -> float
         """Quaternion axis value."""
 
+        return self._data[3]
+
+    @z.setter
+    def z(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[3] = float(value)
+
+    def __len__(self):
+        # type: () -> int
+        return 4
+
+    def __iter__(self):
+        return iter(self._data)
+
     def __getitem__(self, item):
         # type: (int) -> float
-        pass
+        if isinstance(item, slice):
+            return tuple(self._data[item])
+
+        return self._data[item]
 
     def __setitem__(self, key, value):
         # type: (int, float) -> None
-        pass
+        _check_mutable(self)
+
+        if isinstance(key, slice):
+            values = _floats(value, "Quaternion[:]")
+
+            if len(values) != len(self._data[key]):
+                raise ValueError("Quaternion[begin:end] = []: size mismatch in slice assignment")
+
+            self._data[key] = values
+
+        else:
+            self._data[key] = float(value)
+
+    def __repr__(self):
+        # type: () -> str
+        return "Quaternion((%s))" % ", ".join(map(_repr_float, self._data))
+
+    def __str__(self):
+        # type: () -> str
+        return "<Quaternion (w=%.4f, x=%.4f, y=%.4f, z=%.4f)>" % tuple(self._data)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+
+        return self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+
+        return self._data != other._data
+
+    def __hash__(self):
+        # type: () -> int
+        if not self._frozen:
+            raise TypeError("Quaternion must be frozen to be hashable")
+
+        return hash(tuple(self._data))
+
+    def __neg__(self):
+        # type: () -> Quaternion
+        return _quaternion([-v for v in self._data])
+
+    def __add__(self, other):
+        # type: (Quaternion) -> Quaternion
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+
+        return _quaternion([a + b for a, b in zip(self._data, other._data)])
+
+    def __sub__(self, other):
+        # type: (Quaternion) -> Quaternion
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+
+        return _quaternion([a - b for a, b in zip(self._data, other._data)])
+
+    def _product(self, other):
+        # type: (__Any) -> __Any
+        if isinstance(other, Quaternion):
+            return _quaternion(_mul_quat(self._data, other._data))
+
+        if isinstance(other, Vector):
+            if len(other._data) != 3:
+                raise ValueError("quat * vector: only 3D vector rotations (with quats) currently supported")
+
+            x, y, z = other._data
+            r = _quat_to_rows(self._data)
+            return _vector([r[0][0] * x + r[0][1] * y + r[0][2] * z,
+                            r[1][0] * x + r[1][1] * y + r[1][2] * z,
+                            r[2][0] * x + r[2][1] * y + r[2][2] * z])
+
+        return NotImplemented
+
+    def __mul__(self, other):
+        # type: (__Union[Quaternion, Vector, float]) -> __Union[Quaternion, Vector]
+        if isinstance(other, (int, float)):
+            return _quaternion([v * other for v in self._data])
+
+        return self._product(other)
+
+    def __rmul__(self, other):
+        # type: (float) -> Quaternion
+        if isinstance(other, (int, float)):
+            return _quaternion([v * other for v in self._data])
+
+        return NotImplemented
+
+    def __imul__(self, other):
+        # type: (__Union[Quaternion, float]) -> Quaternion
+        if isinstance(other, (int, float)):
+            _check_mutable(self)
+            self._data[:] = [v * other for v in self._data]
+            return self
+
+        if isinstance(other, Quaternion):
+            _check_mutable(self)
+            self._data[:] = _mul_quat(self._data, other._data)
+            return self
+
+        return NotImplemented
+
+    def __matmul__(self, other):
+        # type: (__Union[Quaternion, Vector]) -> __Union[Quaternion, Vector]
+        return self._product(other)
+
+    def __imatmul__(self, other):
+        # type: (Quaternion) -> Quaternion
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+
+        _check_mutable(self)
+        self._data[:] = _mul_quat(self._data, other._data)
+        return self
+
+    def __copy__(self):
+        # type: () -> Quaternion
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Quaternion
+        return self.copy()
 
     def conjugate(self):
         # type: () -> None
         """Set the quaternion to its conjugate (negate x, y, z)."""
-        pass
+
+        _check_mutable(self)
+        d = self._data
+        d[1] = -d[1]
+        d[2] = -d[2]
+        d[3] = -d[3]
 
     def conjugated(self):
         # type: () -> Quaternion
@@ -659,7 +2782,8 @@ class Quaternion:
         Returns:
             Quaternion: A new quaternion."""
 
-        pass
+        w, x, y, z = self._data
+        return _quaternion([w, -x, -y, -z])
 
     def copy(self):
         # type: () -> Quaternion
@@ -671,7 +2795,7 @@ class Quaternion:
         Note:
             Use this to get a copy of a wrapped quaternion with no reference to the original data."""
 
-        pass
+        return _quaternion(list(self._data))
 
     def cross(self, other):
         # type: (Quaternion) -> Quaternion
@@ -683,19 +2807,19 @@ class Quaternion:
         Returns:
             Quaternion: The cross product."""
 
-        pass
+        return _quaternion(_mul_quat(self._data, _floats(other, "Quaternion.cross(other)")))
 
     def dot(self, other):
-        # type: (Quaternion) -> Quaternion
+        # type: (Quaternion) -> float
         """Return the dot product of this quaternion and another.
 
         Args:
             other (Quaternion): The other quaternion to perform the dot product with.
 
         Returns:
-            Quaternion: The dot product."""
+            float: The dot product."""
 
-        pass
+        return sum([a * b for a, b in zip(self._data, _floats(other, "Quaternion.dot(other)"))])
 
     def freeze(self):
         # type: () -> Quaternion
@@ -706,7 +2830,8 @@ class Quaternion:
         Returns:
             Quaternion: An instance of this object."""
 
-        pass
+        self._frozen = True
+        return self
 
     def identity(self):
         # type: () -> Quaternion
@@ -715,16 +2840,16 @@ class Quaternion:
         Returns:
             Quaternion: Quaternion as an identity quaternion."""
 
-        pass
+        _check_mutable(self)
+        self._data[:] = [1.0, 0.0, 0.0, 0.0]
+        return self
 
     def invert(self):
-        # type: () -> Quaternion
-        """Return a new, inverted quaternion.
-
-        Returns:
-            Quaternion: the inverted value."""
+        # type: () -> None
+        """Set the quaternion to its inverse."""
 
-        pass
+        _check_mutable(self)
+        self._data[:] = self.inverted()._data
 
     def inverted(self):
         # type: () -> Quaternion
@@ -733,7 +2858,14 @@ class Quaternion:
         Returns:
             Quaternion: The inverted value."""
 
-        pass
+        w, x, y, z = self._data
+        dot = w * w + x * x + y * y + z * z
+
+        if not dot:
+            return _quaternion([w, -x, -y, -z])
+
+        inv = 1.0 / dot
+        return _quaternion([w * inv, -x * inv, -y * inv, -z * inv])
 
     def negate(self):
         # type: () -> Quaternion
@@ -742,13 +2874,16 @@ class Quaternion:
         Returns:
             Quaternion: Negative quaternion."""
 
-        pass
+        _check_mutable(self)
+        self._data[:] = [-v for v in self._data]
+        return self
 
     def normalize(self):
         # type: () -> None
         """Normalize the quaternion."""
 
-        pass
+        _check_mutable(self)
+        self._data[:] = self.normalized()._data
 
     def normalized(self):
         # type: () -> Quaternion
@@ -757,7 +2892,12 @@ class Quaternion:
         Returns:
             Quaternion: A normalized copy."""
 
-        pass
+        length = self.magnitude
+
+        if not length:
+            return _quaternion([1.0, 0.0, 0.0, 0.0])
+
+        return _quaternion([v / length for v in self._data])
 
     def rotate(self, other):
         # type: (__Union[Euler, Quaternion, Matrix]) -> None
@@ -766,7 +2906,10 @@ class Quaternion:
         Args:
             other (__Union[Euler, Quaternion, Matrix]): rotation component of mathutils value"""
 
-        pass
+        _check_mutable(self)
+        length = self.magnitude
+        rows = _mul_rows(_rotation_rows(other, "Quaternion.rotate(value)"), _quat_to_rows(self.normalized()._data))
+        self._data[:] = [v * length for v in _rows_to_quat(rows)]
 
     def rotation_difference(self, other):
         # type: (Quaternion) -> Quaternion
@@ -778,7 +2921,7 @@ class Quaternion:
         Returns:
             Quaternion: The rotational difference between the two quat rotations."""
 
-        pass
+        return _quaternion(_mul_quat(self.inverted()._data, _floats(other, "Quaternion.rotation_difference(other)")))
 
     def slerp(self, other, factor):
         # type: (Quaternion, float) -> Quaternion
@@ -791,7 +2934,26 @@ class Quaternion:
         Returns:
             Quaternion: The interpolated rotation."""
 
-        pass
+        a = self._data
+        b = _floats(other, "Quaternion.slerp(other)")
+        cosom = a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+
+        # Rotate around the shortest angle.
+        if cosom < 0.0:
+            cosom = -cosom
+            a = [-v for v in a]
+
+        if cosom < 1.0 - 1e-4:
+            omega = _acos(cosom)
+            sinom = _sin(omega)
+            w0 = _sin((1.0 - factor) * omega) / sinom
+            w1 = _sin(factor * omega) / sinom
+
+        else:
+            w0 = 1.0 - factor
+            w1 = factor
+
+        return _quaternion([w0 * va + w1 * vb for va, vb in zip(a, b)])
 
     def to_axis_angle(self):
         # type: () -> tuple[Vector, float]
@@ -800,7 +2962,8 @@ class Quaternion:
         Returns:
             tuple[Vector, float]: axis, angle."""
 
-        pass
+        axis, angle = _quat_to_axis_angle(self._data)
+        return _vector(axis), angle
 
     def to_euler(self, order="", euler_compat=None):
         # type: (str, Euler) -> Euler
@@ -813,7 +2976,9 @@ class Quaternion:
         Returns:
             Euler: Euler representation of the quaternion."""
 
-        pass
+        order = _parse_order(order or "XYZ")
+        compat = _floats(euler_compat, "Quaternion.to_euler(euler_compat)") if euler_compat is not None else None
+        return _euler(_rows_to_euler(_quat_to_rows(self.normalized()._data), order, compat), order)
 
     def to_exponential_map(self):
         # type: () -> Vector
@@ -826,7 +2991,8 @@ class Quaternion:
         Note:
             To convert back to a quaternion, pass it to the Quaternion constructor."""
 
-        pass
+        axis, angle = _quat_to_axis_angle(self._data)
+        return _vector([v * angle for v in axis])
 
     def to_matrix(self):
         # type: () -> Matrix
@@ -835,12 +3001,14 @@ class Quaternion:
         Returns:
             Matrix: A 3x3 rotation matrix representation of the quaternion."""
 
-        pass
+        return _matrix(_quat_to_rows(self._data))
 
 
 class Vector:
     """This object gives access to Vectors in Blender."""
 
+    __slots__ = ("_data", "_owner", "_frozen")
+
     def __init__(self, seq=None):
         # type: (__Sequence[float]) -> None
         """This object gives access to Vectors in Blender.
@@ -848,380 +3016,748 @@ class Vector:
         Args:
             seq (__Sequence[float]): Components of the vector, must be a sequence of at least two"""
 
-        self.is_frozen = False  # type: bool
+        if seq is None:
+            data = [0.0, 0.0, 0.0]
+
+        else:
+            data = _floats(seq, "Vector()")
+
+            if len(data) < 2:
+                raise ValueError("Vector(): more than a single arg given")
+
+        self._data = data
+        self._owner = None
+        self._frozen = False
+
+    def _changed(self):
+        # type: () -> None
+        """Called after the values were changed in place, the vectors tracking their values override it."""
+
+    @property
+    def is_frozen(self):
+        # type: () -> bool
         """True when this object has been frozen (read-only)."""
 
-        self.is_wrapped = False  # type: bool
+        return self._frozen
+
+    @property
+    def is_wrapped(self):
+        # type: () -> bool
         """True when this object wraps external data (read-only)."""
 
-        self.length = 1.0  # type: float
+        return self._owner is not None
+
+    @property
+    def length(self):
+        # type: () -> float
         """Vector Length."""
 
-        self.length_squared = 1.0  # type: float
+        return _sqrt(sum([v * v for v in self._data]))
+
+    @length.setter
+    def length(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+
+        if value < 0.0:
+            raise ValueError("Vector.length = value: can't set length to a negative value")
+
+        current = self.length
+
+        if not value or not current:
+            self._data[:] = [0.0] * len(self._data)
+
+        else:
+            scale = value / current
+            self._data[:] = [v * scale for v in self._data]
+
+        self._changed()
+
+    @property
+    def length_squared(self):
+        # type: () -> float
         """Vector length squared (v.dot(v))."""
 
-        self.magnitude = 1.0  # type: float
+        return sum([v * v for v in self._data])
+
+    @property
+    def magnitude(self):
+        # type: () -> float
         """Vector Length."""
 
-        self.owner = self  # type: Vector
+        return _sqrt(sum([v * v for v in self._data]))
+
+    @magnitude.setter
+    def magnitude(self, value):
+        # type: (float) -> None
+        self.length = value
+
+    @property
+    def owner(self):
+        # type: () -> __Any
         """The item this is wrapping or None (read-only)."""
 
-        self.w = 1.0  # type: float
+        return self._owner
+
+    @property
+    def w(self):
+        # type: () -> float
         """Vector W axis (4D Vectors only)."""
 
-        self.x = 1.0  # type: float
+        if len(self._data) < 4:
+            raise AttributeError("Vector.w: error, vector does not have a 'w' component")
+
+        return self._data[3]
+
+    @w.setter
+    def w(self, value):
+        # type: (float) -> None
+        if len(self._data) < 4:
+            raise AttributeError("Vector.w: error, vector does not have a 'w' component")
+
+        _check_mutable(self)
+        self._data[3] = float(value)
+        self._changed()
+
+    @property
+    def x(self):
+        # type: () -> float
         """Vector X axis."""
 
-        self.y = 1.0  # type: float
+        return self._data[0]
+
+    @x.setter
+    def x(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[0] = float(value)
+        self._changed()
+
+    @property
+    def y(self):
+        # type: () -> float
         """Vector Y axis."""
 
-        self.z = 1.0  # type: float
+        return self._data[1]
+
+    @y.setter
+    def y(self, value):
+        # type: (float) -> None
+        _check_mutable(self)
+        self._data[1] = float(value)
+        self._changed()
+
+    @property
+    def z(self):
+        # type: () -> float
         """Vector Z axis (3D Vectors only)."""
 
-        self.ww = self  # type: Vector
-        self.www = self  # type: Vector
-        self.wwww = self  # type: Vector
-        self.wwwx = self  # type: Vector
-        self.wwwy = self  # type: Vector
-        self.wwwz = self  # type: Vector
-        self.wwx = self  # type: Vector
-        self.wwxw = self  # type: Vector
-        self.wwxx = self  # type: Vector
-        self.wwxy = self  # type: Vector
-        self.wwxz = self  # type: Vector
-        self.wwy = self  # type: Vector
-        self.wwyw = self  # type: Vector
-        self.wwyx = self  # type: Vector
-        self.wwyy = self  # type: Vector
-        self.wwyz = self  # type: Vector
-        self.wwz = self  # type: Vector
-        self.wwzw = self  # type: Vector
-        self.wwzx = self  # type: Vector
-        self.wwzy = self  # type: Vector
-        self.wwzz = self  # type: Vector
-        self.wx = self  # type: Vector
-        self.wxw = self  # type: Vector
-        self.wxww = self  # type: Vector
-        self.wxwx = self  # type: Vector
-        self.wxwy = self  # type: Vector
-        self.wxwz = self  # type: Vector
-        self.wxx = self  # type: Vector
-        self.wxxw = self  # type: Vector
-        self.wxxx = self  # type: Vector
-        self.wxxy = self  # type: Vector
-        self.wxxz = self  # type: Vector
-        self.wxy = self  # type: Vector
-        self.wxyw = self  # type: Vector
-        self.wxyx = self  # type: Vector
-        self.wxyy = self  # type: Vector
-        self.wxyz = self  # type: Vector
-        self.wxz = self  # type: Vector
-        self.wxzw = self  # type: Vector
-        self.wxzx = self  # type: Vector
-        self.wxzy = self  # type: Vector
-        self.wxzz = self  # type: Vector
-        self.wy = self  # type: Vector
-        self.wyw = self  # type: Vector
-        self.wyww = self  # type: Vector
-        self.wywx = self  # type: Vector
-        self.wywy = self  # type: Vector
-        self.wywz = self  # type: Vector
-        self.wyx = self  # type: Vector
-        self.wyxw = self  # type: Vector
-        self.wyxx = self  # type: Vector
-        self.wyxy = self  # type: Vector
-        self.wyxz = self  # type: Vector
-        self.wyy = self  # type: Vector
-        self.wyyw = self  # type: Vector
-        self.wyyx = self  # type: Vector
-        self.wyyy = self  # type: Vector
-        self.wyyz = self  # type: Vector
-        self.wyz = self  # type: Vector
-        self.wyzw = self  # type: Vector
-        self.wyzx = self  # type: Vector
-        self.wyzy = self  # type: Vector
-        self.wyzz = self  # type: Vector
-        self.wz = self  # type: Vector
-        self.wzw = self  # type: Vector
-        self.wzww = self  # type: Vector
-        self.wzwx = self  # type: Vector
-        self.wzwy = self  # type: Vector
-        self.wzwz = self  # type: Vector
-        self.wzx = self  # type: Vector
-        self.wzxw = self  # type: Vector
-        self.wzxx = self  # type: Vector
-        self.wzxy = self  # type: Vector
-        self.wzxz = self  # type: Vector
-        self.wzy = self  # type: Vector
-        self.wzyw = self  # type: Vector
-        self.wzyx = self  # type: Vector
-        self.wzyy = self  # type: Vector
-        self.wzyz = self  # type: Vector
-        self.wzz = self  # type: Vector
-        self.wzzw = self  # type: Vector
-        self.wzzx = self  # type: Vector
-        self.wzzy = self  # type: Vector
-        self.wzzz = self  # type: Vector
-        self.xw = self  # type: Vector
-        self.xww = self  # type: Vector
-        self.xwww = self  # type: Vector
-        self.xwwx = self  # type: Vector
-        self.xwwy = self  # type: Vector
-        self.xwwz = self  # type: Vector
-        self.xwx = self  # type: Vector
-        self.xwxw = self  # type: Vector
-        self.xwxx = self  # type: Vector
-        self.xwxy = self  # type: Vector
-        self.xwxz = self  # type: Vector
-        self.xwy = self  # type: Vector
-        self.xwyw = self  # type: Vector
-        self.xwyx = self  # type: Vector
-        self.xwyy = self  # type: Vector
-        self.xwyz = self  # type: Vector
-        self.xwz = self  # type: Vector
-        self.xwzw = self  # type: Vector
-        self.xwzx = self  # type: Vector
-        self.xwzy = self  # type: Vector
-        self.xwzz = self  # type: Vector
-        self.xx = self  # type: Vector
-        self.xxw = self  # type: Vector
-        self.xxww = self  # type: Vector
-        self.xxwx = self  # type: Vector
-        self.xxwy = self  # type: Vector
-        self.xxwz = self  # type: Vector
-        self.xxx = self  # type: Vector
-        self.xxxw = self  # type: Vector
-        self.xxxx = self  # type: Vector
-        self.xxxy = self  # type: Vector
-        self.xxxz = self  # type: Vector
-        self.xxy = self  # type: Vector
-        self.xxyw = self  # type: Vector
-        self.xxyx = self  # type: Vector
-        self.xxyy = self  # type: Vector
-        self.xxyz = self  # type: Vector
-        self.xxz = self  # type: Vector
-        self.xxzw = self  # type: Vector
-        self.xxzx = self  # type: Vector
-        self.xxzy = self  # type: Vector
-        self.xxzz = self  # type: Vector
-        self.xy = self  # type: Vector
-        self.xyw = self  # type: Vector
-        self.xyww = self  # type: Vector
-        self.xywx = self  # type: Vector
-        self.xywy = self  # type: Vector
-        self.xywz = self  # type: Vector
-        self.xyx = self  # type: Vector
-        self.xyxw = self  # type: Vector
-        self.xyxx = self  # type: Vector
-        self.xyxy = self  # type: Vector
-        self.xyxz = self  # type: Vector
-        self.xyy = self  # type: Vector
-        self.xyyw = self  # type: Vector
-        self.xyyx = self  # type: Vector
-        self.xyyy = self  # type: Vector
-        self.xyyz = self  # type: Vector
-        self.xyz = self  # type: Vector
-        self.xyzw = self  # type: Vector
-        self.xyzx = self  # type: Vector
-        self.xyzy = self  # type: Vector
-        self.xyzz = self  # type: Vector
-        self.xz = self  # type: Vector
-        self.xzw = self  # type: Vector
-        self.xzww = self  # type: Vector
-        self.xzwx = self  # type: Vector
-        self.xzwy = self  # type: Vector
-        self.xzwz = self  # type: Vector
-        self.xzx = self  # type: Vector
-        self.xzxw = self  # type: Vector
-        self.xzxx = self  # type: Vector
-        self.xzxy = self  # type: Vector
-        self.xzxz = self  # type: Vector
-        self.xzy = self  # type: Vector
-        self.xzyw = self  # type: Vector
-        self.xzyx = self  # type: Vector
-        self.xzyy = self  # type: Vector
-        self.xzyz = self  # type: Vector
-        self.xzz = self  # type: Vector
-        self.xzzw = self  # type: Vector
-        self.xzzx = self  # type: Vector
-        self.xzzy = self  # type: Vector
-        self.xzzz = self  # type: Vector
-        self.yw = self  # type: Vector
-        self.yww = self  # type: Vector
-        self.ywww = self  # type: Vector
-        self.ywwx = self  # type: Vector
-        self.ywwy = self  # type: Vector
-        self.ywwz = self  # type: Vector
-        self.ywx = self  # type: Vector
-        self.ywxw = self  # type: Vector
-        self.ywxx = self  # type: Vector
-        self.ywxy = self  # type: Vector
-        self.ywxz = self  # type: Vector
-        self.ywy = self  # type: Vector
-        self.ywyw = self  # type: Vector
-        self.ywyx = self  # type: Vector
-        self.ywyy = self  # type: Vector
-        self.ywyz = self  # type: Vector
-        self.ywz = self  # type: Vector
-        self.ywzw = self  # type: Vector
-        self.ywzx = self  # type: Vector
-        self.ywzy = self  # type: Vector
-        self.ywzz = self  # type: Vector
-        self.yx = self  # type: Vector
-        self.yxw = self  # type: Vector
-        self.yxww = self  # type: Vector
-        self.yxwx = self  # type: Vector
-        self.yxwy = self  # type: Vector
-        self.yxwz = self  # type: Vector
-        self.yxx = self  # type: Vector
-        self.yxxw = self  # type: Vector
-        self.yxxx = self  # type: Vector
-        self.yxxy = self  # type: Vector
-        self.yxxz = self  # type: Vector
-        self.yxy = self  # type: Vector
-        self.yxyw = self  # type: Vector
-        self.yxyx = self  # type: Vector
-        self.yxyy = self  # type: Vector
-        self.yxyz = self  # type: Vector
-        self.yxz = self  # type: Vector
-        self.yxzw = self  # type: Vector
-        self.yxzx = self  # type: Vector
-        self.yxzy = self  # type: Vector
-        self.yxzz = self  # type: Vector
-        self.yy = self  # type: Vector
-        self.yyw = self  # type: Vector
-        self.yyww = self  # type: Vector
-        self.yywx = self  # type: Vector
-        self.yywy = self  # type: Vector
-        self.yywz = self  # type: Vector
-        self.yyx = self  # type: Vector
-        self.yyxw = self  # type: Vector
-        self.yyxx = self  # type: Vector
-        self.yyxy = self  # type: Vector
-        self.yyxz = self  # type: Vector
-        self.yyy = self  # type: Vector
-        self.yyyw = self  # type: Vector
-        self.yyyx = self  # type: Vector
-        self.yyyy = self  # type: Vector
-        self.yyyz = self  # type: Vector
-        self.yyz = self  # type: Vector
-        self.yyzw = self  # type: Vector
-        self.yyzx = self  # type: Vector
-        self.yyzy = self  # type: Vector
-        self.yyzz = self  # type: Vector
-        self.yz = self  # type: Vector
-        self.yzw = self  # type: Vector
-        self.yzww = self  # type: Vector
-        self.yzwx = self  # type: Vector
-        self.yzwy = self  # type: Vector
-        self.yzwz = self  # type: Vector
-        self.yzx = self  # type: Vector
-        self.yzxw = self  # type: Vector
-        self.yzxx = self  # type: Vector
-        self.yzxy = self  # type: Vector
-        self.yzxz = self  # type: Vector
-        self.yzy = self  # type: Vector
-        self.yzyw = self  # type: Vector
-        self.yzyx = self  # type: Vector
-        self.yzyy = self  # type: Vector
-        self.yzyz = self  # type: Vector
-        self.yzz = self  # type: Vector
-        self.yzzw = self  # type: Vector
-        self.yzzx = self  # type: Vector
-        self.yzzy = self  # type: Vector
-        self.yzzz = self  # type: Vector
-        self.zw = self  # type: Vector
-        self.zww = self  # type: Vector
-        self.zwww = self  # type: Vector
-        self.zwwx = self  # type: Vector
-        self.zwwy = self  # type: Vector
-        self.zwwz = self  # type: Vector
-        self.zwx = self  # type: Vector
-        self.zwxw = self  # type: Vector
-        self.zwxx = self  # type: Vector
-        self.zwxy = self  # type: Vector
-        self.zwxz = self  # type: Vector
-        self.zwy = self  # type: Vector
-        self.zwyw = self  # type: Vector
-        self.zwyx = self  # type: Vector
-        self.zwyy = self  # type: Vector
-        self.zwyz = self  # type: Vector
-        self.zwz = self  # type: Vector
-        self.zwzw = self  # type: Vector
-        self.zwzx = self  # type: Vector
-        self.zwzy = self  # type: Vector
-        self.zwzz = self  # type: Vector
-        self.zx = self  # type: Vector
-        self.zxw = self  # type: Vector
-        self.zxww = self  # type: Vector
-        self.zxwx = self  # type: Vector
-        self.zxwy = self  # type: Vector
-        self.zxwz = self  # type: Vector
-        self.zxx = self  # type: Vector
-        self.zxxw = self  # type: Vector
-        self.zxxx = self  # type: Vector
-        self.zxxy = self  # type: Vector
-        self.zxxz = self  # type: Vector
-        self.zxy = self  # type: Vector
-        self.zxyw = self  # type: Vector
-        self.zxyx = self  # type: Vector
-        self.zxyy = self  # type: Vector
-        self.zxyz = self  # type: Vector
-        self.zxz = self  # type: Vector
-        self.zxzw = self  # type: Vector
-        self.zxzx = self  # type: Vector
-        self.zxzy = self  # type: Vector
-        self.zxzz = self  # type: Vector
-        self.zy = self  # type: Vector
-        self.zyw = self  # type: Vector
-        self.zyww = self  # type: Vector
-        self.zywx = self  # type: Vector
-        self.zywy = self  # type: Vector
-        self.zywz = self  # type: Vector
-        self.zyx = self  # type: Vector
-        self.zyxw = self  # type: Vector
-        self.zyxx = self  # type: Vector
-        self.zyxy = self  # type: Vector
-        self.zyxz = self  # type: Vector
-        self.zyy = self  # type: Vector
-        self.zyyw = self  # type: Vector
-        self.zyyx = self  # type: Vector
-        self.zyyy = self  # type: Vector
-        self.zyyz = self  # type: Vector
-        self.zyz = self  # type: Vector
-        self.zyzw = self  # type: Vector
-        self.zyzx = self  # type: Vector
-        self.zyzy = self  # type: Vector
-        self.zyzz = self  # type: Vector
-        self.zz = self  # type: Vector
-        self.zzw = self  # type: Vector
-        self.zzww = self  # type: Vector
-        self.zzwx = self  # type: Vector
-        self.zzwy = self  # type: Vector
-        self.zzwz = self  # type: Vector
-        self.zzx = self  # type: Vector
-        self.zzxw = self  # type: Vector
-        self.zzxx = self  # type: Vector
-        self.zzxy = self  # type: Vector
-        self.zzxz = self  # type: Vector
-        self.zzy = self  # type: Vector
-        self.zzyw = self  # type: Vector
-        self.zzyx = self  # type: Vector
-        self.zzyy = self  # type: Vector
-        self.zzyz = self  # type: Vector
-        self.zzz = self  # type: Vector
-        self.zzzw = self  # type: Vector
-        self.zzzx = self  # type: Vector
-        self.zzzy = self  # type: Vector
-        self.zzzz = self  # type: Vector
+        if len(self._data) < 3:
+            raise AttributeError("Vector.z: error, vector does not have a 'z' component")
+
+        return self._data[2]
+
+    @z.setter
+    def z(self, value):
+        # type: (float) -> None
+        if len(self._data) < 3:
+            raise AttributeError("Vector.z: error, vector does not have a 'z' component")
+
+        _check_mutable(self)
+        self._data[2] = float(value)
+        self._changed()
+
+    ww = _swizzle("ww")  # type: Vector
+    www = _swizzle("www")  # type: Vector
+    wwww = _swizzle("wwww")  # type: Vector
+    wwwx = _swizzle("wwwx")  # type: Vector
+    wwwy = _swizzle("wwwy")  # type: Vector
+    wwwz = _swizzle("wwwz")  # type: Vector
+    wwx = _swizzle("wwx")  # type: Vector
+    wwxw = _swizzle("wwxw")  # type: Vector
+    wwxx = _swizzle("wwxx")  # type: Vector
+    wwxy = _swizzle("wwxy")  # type: Vector
+    wwxz = _swizzle("wwxz")  # type: Vector
+    wwy = _swizzle("wwy")  # type: Vector
+    wwyw = _swizzle("wwyw")  # type: Vector
+    wwyx = _swizzle("wwyx")  # type: Vector
+    wwyy = _swizzle("wwyy")  # type: Vector
+    wwyz = _swizzle("wwyz")  # type: Vector
+    wwz = _swizzle("wwz")  # type: Vector
+    wwzw = _swizzle("wwzw")  # type: Vector
+    wwzx = _swizzle("wwzx")  # type: Vector
+    wwzy = _swizzle("wwzy")  # type: Vector
+    wwzz = _swizzle("wwzz")  # type: Vector
+    wx = _swizzle("wx")  # type: Vector
+    wxw = _swizzle("wxw")  # type: Vector
+    wxww = _swizzle("wxww")  # type: Vector
+    wxwx = _swizzle("wxwx")  # type: Vector
+    wxwy = _swizzle("wxwy")  # type: Vector
+    wxwz = _swizzle("wxwz")  # type: Vector
+    wxx = _swizzle("wxx")  # type: Vector
+    wxxw = _swizzle("wxxw")  # type: Vector
+    wxxx = _swizzle("wxxx")  # type: Vector
+    wxxy = _swizzle("wxxy")  # type: Vector
+    wxxz = _swizzle("wxxz")  # type: Vector
+    wxy = _swizzle("wxy")  # type: Vector
+    wxyw = _swizzle("wxyw")  # type: Vector
+    wxyx = _swizzle("wxyx")  # type: Vector
+    wxyy = _swizzle("wxyy")  # type: Vector
+    wxyz = _swizzle("wxyz")  # type: Vector
+    wxz = _swizzle("wxz")  # type: Vector
+    wxzw = _swizzle("wxzw")  # type: Vector
+    wxzx = _swizzle("wxzx")  # type: Vector
+    wxzy = _swizzle("wxzy")  # type: Vector
+    wxzz = _swizzle("wxzz")  # type: Vector
+    wy = _swizzle("wy")  # type: Vector
+    wyw = _swizzle("wyw")  # type: Vector
+    wyww = _swizzle("wyww")  # type: Vector
+    wywx = _swizzle("wywx")  # type: Vector
+    wywy = _swizzle("wywy")  # type: Vector
+    wywz = _swizzle("wywz")  # type: Vector
+    wyx = _swizzle("wyx")  # type: Vector
+    wyxw = _swizzle("wyxw")  # type: Vector
+    wyxx = _swizzle("wyxx")  # type: Vector
+    wyxy = _swizzle("wyxy")  # type: Vector
+    wyxz = _swizzle("wyxz")  # type: Vector
+    wyy = _swizzle("wyy")  # type: Vector
+    wyyw = _swizzle("wyyw")  # type: Vector
+    wyyx = _swizzle("wyyx")  # type: Vector
+    wyyy = _swizzle("wyyy")  # type: Vector
+    wyyz = _swizzle("wyyz")  # type: Vector
+    wyz = _swizzle("wyz")  # type: Vector
+    wyzw = _swizzle("wyzw")  # type: Vector
+    wyzx = _swizzle("wyzx")  # type: Vector
+    wyzy = _swizzle("wyzy")  # type: Vector
+    wyzz = _swizzle("wyzz")  # type: Vector
+    wz = _swizzle("wz")  # type: Vector
+    wzw = _swizzle("wzw")  # type: Vector
+    wzww = _swizzle("wzww")  # type: Vector
+    wzwx = _swizzle("wzwx")  # type: Vector
+    wzwy = _swizzle("wzwy")  # type: Vector
+    wzwz = _swizzle("wzwz")  # type: Vector
+    wzx = _swizzle("wzx")  # type: Vector
+    wzxw = _swizzle("wzxw")  # type: Vector
+    wzxx = _swizzle("wzxx")  # type: Vector
+    wzxy = _swizzle("wzxy")  # type: Vector
+    wzxz = _swizzle("wzxz")  # type: Vector
+    wzy = _swizzle("wzy")  # type: Vector
+    wzyw = _swizzle("wzyw")  # type: Vector
+    wzyx = _swizzle("wzyx")  # type: Vector
+    wzyy = _swizzle("wzyy")  # type: Vector
+    wzyz = _swizzle("wzyz")  # type: Vector
+    wzz = _swizzle("wzz")  # type: Vector
+    wzzw = _swizzle("wzzw")  # type: Vector
+    wzzx = _swizzle("wzzx")  # type: Vector
+    wzzy = _swizzle("wzzy")  # type: Vector
+    wzzz = _swizzle("wzzz")  # type: Vector
+    xw = _swizzle("xw")  # type: Vector
+    xww = _swizzle("xww")  # type: Vector
+    xwww = _swizzle("xwww")  # type: Vector
+    xwwx = _swizzle("xwwx")  # type: Vector
+    xwwy = _swizzle("xwwy")  # type: Vector
+    xwwz = _swizzle("xwwz")  # type: Vector
+    xwx = _swizzle("xwx")  # type: Vector
+    xwxw = _swizzle("xwxw")  # type: Vector
+    xwxx = _swizzle("xwxx")  # type: Vector
+    xwxy = _swizzle("xwxy")  # type: Vector
+    xwxz = _swizzle("xwxz")  # type: Vector
+    xwy = _swizzle("xwy")  # type: Vector
+    xwyw = _swizzle("xwyw")  # type: Vector
+    xwyx = _swizzle("xwyx")  # type: Vector
+    xwyy = _swizzle("xwyy")  # type: Vector
+    xwyz = _swizzle("xwyz")  # type: Vector
+    xwz = _swizzle("xwz")  # type: Vector
+    xwzw = _swizzle("xwzw")  # type: Vector
+    xwzx = _swizzle("xwzx")  # type: Vector
+    xwzy = _swizzle("xwzy")  # type: Vector
+    xwzz = _swizzle("xwzz")  # type: Vector
+    xx = _swizzle("xx")  # type: Vector
+    xxw = _swizzle("xxw")  # type: Vector
+    xxww = _swizzle("xxww")  # type: Vector
+    xxwx = _swizzle("xxwx")  # type: Vector
+    xxwy = _swizzle("xxwy")  # type: Vector
+    xxwz = _swizzle("xxwz")  # type: Vector
+    xxx = _swizzle("xxx")  # type: Vector
+    xxxw = _swizzle("xxxw")  # type: Vector
+    xxxx = _swizzle("xxxx")  # type: Vector
+    xxxy = _swizzle("xxxy")  # type: Vector
+    xxxz = _swizzle("xxxz")  # type: Vector
+    xxy = _swizzle("xxy")  # type: Vector
+    xxyw = _swizzle("xxyw")  # type: Vector
+    xxyx = _swizzle("xxyx")  # type: Vector
+    xxyy = _swizzle("xxyy")  # type: Vector
+    xxyz = _swizzle("xxyz")  # type: Vector
+    xxz = _swizzle("xxz")  # type: Vector
+    xxzw = _swizzle("xxzw")  # type: Vector
+    xxzx = _swizzle("xxzx")  # type: Vector
+    xxzy = _swizzle("xxzy")  # type: Vector
+    xxzz = _swizzle("xxzz")  # type: Vector
+    xy = _swizzle("xy")  # type: Vector
+    xyw = _swizzle("xyw")  # type: Vector
+    xyww = _swizzle("xyww")  # type: Vector
+    xywx = _swizzle("xywx")  # type: Vector
+    xywy = _swizzle("xywy")  # type: Vector
+    xywz = _swizzle("xywz")  # type: Vector
+    xyx = _swizzle("xyx")  # type: Vector
+    xyxw = _swizzle("xyxw")  # type: Vector
+    xyxx = _swizzle("xyxx")  # type: Vector
+    xyxy = _swizzle("xyxy")  # type: Vector
+    xyxz = _swizzle("xyxz")  # type: Vector
+    xyy = _swizzle("xyy")  # type: Vector
+    xyyw = _swizzle("xyyw")  # type: Vector
+    xyyx = _swizzle("xyyx")  # type: Vector
+    xyyy = _swizzle("xyyy")  # type: Vector
+    xyyz = _swizzle("xyyz")  # type: Vector
+    xyz = _swizzle("xyz")  # type: Vector
+    xyzw = _swizzle("xyzw")  # type: Vector
+    xyzx = _swizzle("xyzx")  # type: Vector
+    xyzy = _swizzle("xyzy")  # type: Vector
+    xyzz = _swizzle("xyzz")  # type: Vector
+    xz = _swizzle("xz")  # type: Vector
+    xzw = _swizzle("xzw")  # type: Vector
+    xzww = _swizzle("xzww")  # type: Vector
+    xzwx = _swizzle("xzwx")  # type: Vector
+    xzwy = _swizzle("xzwy")  # type: Vector
+    xzwz = _swizzle("xzwz")  # type: Vector
+    xzx = _swizzle("xzx")  # type: Vector
+    xzxw = _swizzle("xzxw")  # type: Vector
+    xzxx = _swizzle("xzxx")  # type: Vector
+    xzxy = _swizzle("xzxy")  # type: Vector
+    xzxz = _swizzle("xzxz")  # type: Vector
+    xzy = _swizzle("xzy")  # type: Vector
+    xzyw = _swizzle("xzyw")  # type: Vector
+    xzyx = _swizzle("xzyx")  # type: Vector
+    xzyy = _swizzle("xzyy")  # type: Vector
+    xzyz = _swizzle("xzyz")  # type: Vector
+    xzz = _swizzle("xzz")  # type: Vector
+    xzzw = _swizzle("xzzw")  # type: Vector
+    xzzx = _swizzle("xzzx")  # type: Vector
+    xzzy = _swizzle("xzzy")  # type: Vector
+    xzzz = _swizzle("xzzz")  # type: Vector
+    yw = _swizzle("yw")  # type: Vector
+    yww = _swizzle("yww")  # type: Vector
+    ywww = _swizzle("ywww")  # type: Vector
+    ywwx = _swizzle("ywwx")  # type: Vector
+    ywwy = _swizzle("ywwy")  # type: Vector
+    ywwz = _swizzle("ywwz")  # type: Vector
+    ywx = _swizzle("ywx")  # type: Vector
+    ywxw = _swizzle("ywxw")  # type: Vector
+    ywxx = _swizzle("ywxx")  # type: Vector
+    ywxy = _swizzle("ywxy")  # type: Vector
+    ywxz = _swizzle("ywxz")  # type: Vector
+    ywy = _swizzle("ywy")  # type: Vector
+    ywyw = _swizzle("ywyw")  # type: Vector
+    ywyx = _swizzle("ywyx")  # type: Vector
+    ywyy = _swizzle("ywyy")  # type: Vector
+    ywyz = _swizzle("ywyz")  # type: Vector
+    ywz = _swizzle("ywz")  # type: Vector
+    ywzw = _swizzle("ywzw")  # type: Vector
+    ywzx = _swizzle("ywzx")  # type: Vector
+    ywzy = _swizzle("ywzy")  # type: Vector
+    ywzz = _swizzle("ywzz")  # type: Vector
+    yx = _swizzle("yx")  # type: Vector
+    yxw = _swizzle("yxw")  # type: Vector
+    yxww = _swizzle("yxww")  # type: Vector
+    yxwx = _swizzle("yxwx")  # type: Vector
+    yxwy = _swizzle("yxwy")  # type: Vector
+    yxwz = _swizzle("yxwz")  # type: Vector
+    yxx = _swizzle("yxx")  # type: Vector
+    yxxw = _swizzle("yxxw")  # type: Vector
+    yxxx = _swizzle("yxxx")  # type: Vector
+    yxxy = _swizzle("yxxy")  # type: Vector
+    yxxz = _swizzle("yxxz")  # type: Vector
+    yxy = _swizzle("yxy")  # type: Vector
+    yxyw = _swizzle("yxyw")  # type: Vector
+    yxyx = _swizzle("yxyx")  # type: Vector
+    yxyy = _swizzle("yxyy")  # type: Vector
+    yxyz = _swizzle("yxyz")  # type: Vector
+    yxz = _swizzle("yxz")  # type: Vector
+    yxzw = _swizzle("yxzw")  # type: Vector
+    yxzx = _swizzle("yxzx")  # type: Vector
+    yxzy = _swizzle("yxzy")  # type: Vector
+    yxzz = _swizzle("yxzz")  # type: Vector
+    yy = _swizzle("yy")  # type: Vector
+    yyw = _swizzle("yyw")  # type: Vector
+    yyww = _swizzle("yyww")  # type: Vector
+    yywx = _swizzle("yywx")  # type: Vector
+    yywy = _swizzle("yywy")  # type: Vector
+    yywz = _swizzle("yywz")  # type: Vector
+    yyx = _swizzle("yyx")  # type: Vector
+    yyxw = _swizzle("yyxw")  # type: Vector
+    yyxx = _swizzle("yyxx")  # type: Vector
+    yyxy = _swizzle("yyxy")  # type: Vector
+    yyxz = _swizzle("yyxz")  # type: Vector
+    yyy = _swizzle("yyy")  # type: Vector
+    yyyw = _swizzle("yyyw")  # type: Vector
+    yyyx = _swizzle("yyyx")  # type: Vector
+    yyyy = _swizzle("yyyy")  # type: Vector
+    yyyz = _swizzle("yyyz")  # type: Vector
+    yyz = _swizzle("yyz")  # type: Vector
+    yyzw = _swizzle("yyzw")  # type: Vector
+    yyzx = _swizzle("yyzx")  # type: Vector
+    yyzy = _swizzle("yyzy")  # type: Vector
+    yyzz = _swizzle("yyzz")  # type: Vector
+    yz = _swizzle("yz")  # type: Vector
+    yzw = _swizzle("yzw")  # type: Vector
+    yzww = _swizzle("yzww")  # type: Vector
+    yzwx = _swizzle("yzwx")  # type: Vector
+    yzwy = _swizzle("yzwy")  # type: Vector
+    yzwz = _swizzle("yzwz")  # type: Vector
+    yzx = _swizzle("yzx")  # type: Vector
+    yzxw = _swizzle("yzxw")  # type: Vector
+    yzxx = _swizzle("yzxx")  # type: Vector
+    yzxy = _swizzle("yzxy")  # type: Vector
+    yzxz = _swizzle("yzxz")  # type: Vector
+    yzy = _swizzle("yzy")  # type: Vector
+    yzyw = _swizzle("yzyw")  # type: Vector
+    yzyx = _swizzle("yzyx")  # type: Vector
+    yzyy = _swizzle("yzyy")  # type: Vector
+    yzyz = _swizzle("yzyz")  # type: Vector
+    yzz = _swizzle("yzz")  # type: Vector
+    yzzw = _swizzle("yzzw")  # type: Vector
+    yzzx = _swizzle("yzzx")  # type: Vector
+    yzzy = _swizzle("yzzy")  # type: Vector
+    yzzz = _swizzle("yzzz")  # type: Vector
+    zw = _swizzle("zw")  # type: Vector
+    zww = _swizzle("zww")  # type: Vector
+    zwww = _swizzle("zwww")  # type: Vector
+    zwwx = _swizzle("zwwx")  # type: Vector
+    zwwy = _swizzle("zwwy")  # type: Vector
+    zwwz = _swizzle("zwwz")  # type: Vector
+    zwx = _swizzle("zwx")  # type: Vector
+    zwxw = _swizzle("zwxw")  # type: Vector
+    zwxx = _swizzle("zwxx")  # type: Vector
+    zwxy = _swizzle("zwxy")  # type: Vector
+    zwxz = _swizzle("zwxz")  # type: Vector
+    zwy = _swizzle("zwy")  # type: Vector
+    zwyw = _swizzle("zwyw")  # type: Vector
+    zwyx = _swizzle("zwyx")  # type: Vector
+    zwyy = _swizzle("zwyy")  # type: Vector
+    zwyz = _swizzle("zwyz")  # type: Vector
+    zwz = _swizzle("zwz")  # type: Vector
+    zwzw = _swizzle("zwzw")  # type: Vector
+    zwzx = _swizzle("zwzx")  # type: Vector
+    zwzy = _swizzle("zwzy")  # type: Vector
+    zwzz = _swizzle("zwzz")  # type: Vector
+    zx = _swizzle("zx")  # type: Vector
+    zxw = _swizzle("zxw")  # type: Vector
+    zxww = _swizzle("zxww")  # type: Vector
+    zxwx = _swizzle("zxwx")  # type: Vector
+    zxwy = _swizzle("zxwy")  # type: Vector
+    zxwz = _swizzle("zxwz")  # type: Vector
+    zxx = _swizzle("zxx")  # type: Vector
+    zxxw = _swizzle("zxxw")  # type: Vector
+    zxxx = _swizzle("zxxx")  # type: Vector
+    zxxy = _swizzle("zxxy")  # type: Vector
+    zxxz = _swizzle("zxxz")  # type: Vector
+    zxy = _swizzle("zxy")  # type: Vector
+    zxyw = _swizzle("zxyw")  # type: Vector
+    zxyx = _swizzle("zxyx")  # type: Vector
+    zxyy = _swizzle("zxyy")  # type: Vector
+    zxyz = _swizzle("zxyz")  # type: Vector
+    zxz = _swizzle("zxz")  # type: Vector
+    zxzw = _swizzle("zxzw")  # type: Vector
+    zxzx = _swizzle("zxzx")  # type: Vector
+    zxzy = _swizzle("zxzy")  # type: Vector
+    zxzz = _swizzle("zxzz")  # type: Vector
+    zy = _swizzle("zy")  # type: Vector
+    zyw = _swizzle("zyw")  # type: Vector
+    zyww = _swizzle("zyww")  # type: Vector
+    zywx = _swizzle("zywx")  # type: Vector
+    zywy = _swizzle("zywy")  # type: Vector
+    zywz = _swizzle("zywz")  # type: Vector
+    zyx = _swizzle("zyx")  # type: Vector
+    zyxw = _swizzle("zyxw")  # type: Vector
+    zyxx = _swizzle("zyxx")  # type: Vector
+    zyxy = _swizzle("zyxy")  # type: Vector
+    zyxz = _swizzle("zyxz")  # type: Vector
+    zyy = _swizzle("zyy")  # type: Vector
+    zyyw = _swizzle("zyyw")  # type: Vector
+    zyyx = _swizzle("zyyx")  # type: Vector
+    zyyy = _swizzle("zyyy")  # type: Vector
+    zyyz = _swizzle("zyyz")  # type: Vector
+    zyz = _swizzle("zyz")  # type: Vector
+    zyzw = _swizzle("zyzw")  # type: Vector
+    zyzx = _swizzle("zyzx")  # type: Vector
+    zyzy = _swizzle("zyzy")  # type: Vector
+    zyzz = _swizzle("zyzz")  # type: Vector
+    zz = _swizzle("zz")  # type: Vector
+    zzw = _swizzle("zzw")  # type: Vector
+    zzww = _swizzle("zzww")  # type: Vector
+    zzwx = _swizzle("zzwx")  # type: Vector
+    zzwy = _swizzle("zzwy")  # type: Vector
+    zzwz = _swizzle("zzwz")  # type: Vector
+    zzx = _swizzle("zzx")  # type: Vector
+    zzxw = _swizzle("zzxw")  # type: Vector
+    zzxx = _swizzle("zzxx")  # type: Vector
+    zzxy = _swizzle("zzxy")  # type: Vector
+    zzxz = _swizzle("zzxz")  # type: Vector
+    zzy = _swizzle("zzy")  # type: Vector
+    zzyw = _swizzle("zzyw")  # type: Vector
+    zzyx = _swizzle("zzyx")  # type: Vector
+    zzyy = _swizzle("zzyy")  # type: Vector
+    zzyz = _swizzle("zzyz")  # type: Vector
+    zzz = _swizzle("zzz")  # type: Vector
+    zzzw = _swizzle("zzzw")  # type: Vector
+    zzzx = _swizzle("zzzx")  # type: Vector
+    zzzy = _swizzle("zzzy")  # type: Vector
+    zzzz = _swizzle("zzzz")  # type: Vector
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
 
     def __getitem__(self, item):
         # type: (int) -> float
-        pass
+        if isinstance(item, slice):
+            return tuple(self._data[item])
+
+        return self._data[item]
+
+    def __setitem__(self, key, value):
+        # type: (int, float) -> None
+        _check_mutable(self)
+
+        if isinstance(key, slice):
+            values = _floats(value, "Vector[:]")
+
+            if len(values) != len(self._data[key]):
+                raise ValueError("Vector[begin:end] = []: size mismatch in slice assignment")
+
+            self._data[key] = values
+
+        else:
+            self._data[key] = float(value)
+
+        self._changed()
+
+    def __repr__(self):
+        # type: () -> str
+        return "Vector((%s))" % ", ".join(map(_repr_float, self._data))
+
+    def __str__(self):
+        # type: () -> str
+        return "<Vector (%s)>" % ", ".join("%.4f" % value for value in self._data)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self._data != other._data
+
+    def __lt__(self, other):
+        # type: (Vector) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.length_squared < other.length_squared
+
+    def __le__(self, other):
+        # type: (Vector) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.length_squared <= other.length_squared
+
+    def __gt__(self, other):
+        # type: (Vector) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.length_squared > other.length_squared
+
+    def __ge__(self, other):
+        # type: (Vector) -> bool
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.length_squared >= other.length_squared
+
+    def __hash__(self):
+        # type: () -> int
+        if not self._frozen:
+            raise TypeError("Vector must be frozen to be hashable")
+
+        return hash(tuple(self._data))
+
+    def __neg__(self):
+        # type: () -> Vector
+        return _vector([-v for v in self._data])
+
+    def __pos__(self):
+        # type: () -> Vector
+        return _vector(list(self._data))
+
+    def __add__(self, other):
+        # type: (Vector) -> Vector
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        a = self._data
+        b = other._data
+
+        if len(a) != len(b):
+            raise ValueError("Vector addition: vectors must have the same dimensions for this operation")
+
+        if len(a) == 3:
+            return _vector([a[0] + b[0], a[1] + b[1], a[2] + b[2]])
+
+        return _vector([x + y for x, y in zip(a, b)])
+
+    def __sub__(self, other):
+        # type: (Vector) -> Vector
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        a = self._data
+        b = other._data
+
+        if len(a) != len(b):
+            raise ValueError("Vector subtraction: vectors must have the same dimensions for this operation")
+
+        if len(a) == 3:
+            return _vector([a[0] - b[0], a[1] - b[1], a[2] - b[2]])
+
+        return _vector([x - y for x, y in zip(a, b)])
+
+    def __iadd__(self, other):
+        # type: (Vector) -> Vector
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        _check_mutable(self)
+        a = self._data
+        b = other._data
+
+        if len(a) != len(b):
+            raise ValueError("Vector addition: vectors must have the same dimensions for this operation")
+
+        a[:] = [x + y for x, y in zip(a, b)]
+        self._changed()
+        return self
+
+    def __isub__(self, other):
+        # type: (Vector) -> Vector
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        _check_mutable(self)
+        a = self._data
+        b = other._data
+
+        if len(a) != len(b):
+            raise ValueError("Vector subtraction: vectors must have the same dimensions for this operation")
+
+        a[:] = [x - y for x, y in zip(a, b)]
+        self._changed()
+        return self
+
+    def _row_product(self, other):
+        # type: (__Any) -> __Any
+        """Vector * Vector is the dot product, Vector * Matrix treats the vector as a row vector."""
+
+        if isinstance(other, Vector):
+            a = self._data
+            b = other._data
+
+            if len(a) != len(b):
+                raise ValueError("Vector multiplication: vectors must have the same dimensions for this operation")
+
+            return sum([x * y for x, y in zip(a, b)])
+
+        if isinstance(other, Matrix):
+            rows = other._rows
+            vec = self._data
+
+            if len(vec) == 3 and len(rows) == 4:
+                vec = vec + [1.0]
+                return _vector([sum([v * row[c] for v, row in zip(vec, rows)]) for c in range(3)])
+
+            if len(vec) != len(rows):
+                raise ValueError("vector * matrix: len(matrix.row) and len(vector) must be the same, "
+                                 "except for 3D vector * 4x4 matrix.")
+
+            return _vector([sum([v * row[c] for v, row in zip(vec, rows)]) for c in range(len(rows[0]))])
+
+        return NotImplemented
+
+    def __mul__(self, other):
+        # type: (__Union[Vector, Matrix, float]) -> __Union[Vector, float]
+        if isinstance(other, (int, float)):
+            return _vector([v * other for v in self._data])
+
+        return self._row_product(other)
+
+    def __rmul__(self, other):
+        # type: (float) -> Vector
+        if isinstance(other, (int, float)):
+            return _vector([v * other for v in self._data])
+
+        return NotImplemented
+
+    def __imul__(self, other):
+        # type: (__Union[float, Matrix, Quaternion]) -> Vector
+        if isinstance(other, (int, float)):
+            _check_mutable(self)
+            self._data[:] = [v * other for v in self._data]
+            self._changed()
+            return self
+
+        if isinstance(other, (Matrix, Quaternion)):
+            _check_mutable(self)
+            result = other * self if isinstance(other, Quaternion) else self._row_product(other)
+            self._data[:] = result._data
+            self._changed()
+            return self
+
+        return NotImplemented
+
+    def __matmul__(self, other):
+        # type: (__Union[Vector, Matrix]) -> __Union[Vector, float]
+        return self._row_product(other)
+
+    def __truediv__(self, other):
+        # type: (float) -> Vector
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if not other:
+            raise ZeroDivisionError("Vector division: divide by zero error")
+
+        return _vector([v / other for v in self._data])
+
+    def __itruediv__(self, other):
+        # type: (float) -> Vector
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if not other:
+            raise ZeroDivisionError("Vector division: divide by zero error")
+
+        _check_mutable(self)
+        self._data[:] = [v / other for v in self._data]
+        self._changed()
+        return self
 
-    def __setitem__(self, key, value):
-        # type: (int, float) -> None
-        pass
+    def __copy__(self):
+        # type: () -> Vector
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Vector
+        return self.copy()
 
     @classmethod
     def Fill(cls, size, fill=0.0):
@@ -1232,7 +3768,10 @@ class Vector:
             size (int): The length of the vector to be created.
             fill (float): The value used to fill the vector."""
 
-        pass
+        if size < 2:
+            raise RuntimeError("Vector(): invalid size")
+
+        return _vector([float(fill)] * size)
 
     @classmethod
     def Linspace(cls, start, stop, size):
@@ -1244,7 +3783,11 @@ class Vector:
             stop (int): The end of the range used to fill the vector.
             size (int): The size of the vector to be created."""
 
-        pass
+        if size < 2:
+            raise RuntimeError("Vector.Linspace(): invalid size")
+
+        step = (stop - start) / (size - 1)
+        return _vector([start + step * i for i in range(size)])
 
     @classmethod
     def Range(cls, start, stop, step=1):
@@ -1256,7 +3799,12 @@ class Vector:
             stop (int): The end of the range used to fill the vector.
             step (int): The step between successive values in the vector."""
 
-        pass
+        values = [float(v) for v in range(start, stop, step)]
+
+        if len(values) < 2:
+            raise RuntimeError("Vector.Range(): invalid size")
+
+        return _vector(values)
 
     @classmethod
     def Repeat(cls, vector, size):
@@ -1270,7 +3818,23 @@ class Vector:
         Returns:
             Vector: Created vector"""
 
-        pass
+        values = _floats(vector, "Vector.Repeat(vector)")
+
+        if size < 2 or not values:
+            raise RuntimeError("Vector.Repeat(): invalid size")
+
+        return _vector([values[i % len(values)] for i in range(size)])
+
+    def _other(self, other, name):
+        # type: (__Any, str) -> list
+        """The components of other as a list of floats, checked to match the size of this vector."""
+
+        values = other._data if isinstance(other, Vector) else _floats(other, name)
+
+        if len(values) != len(self._data):
+            raise ValueError("%s: expected a %dD vector" % (name, len(self._data)))
+
+        return values
 
     def angle(self, other, fallback=None):
         # type: (Vector, __Any) -> float
@@ -1283,7 +3847,19 @@ class Vector:
         Returns:
             float: Angle in radians or fallback when given"""
 
-        pass
+        a = self._data
+        b = self._other(other, "Vector.angle(other)")
+        la = sum([v * v for v in a])
+        lb = sum([v * v for v in b])
+
+        if not la or not lb:
+            if fallback is not None:
+                return fallback
+
+            raise ValueError("Vector.angle(other): zero length vectors have no valid angle")
+
+        dot = sum([x * y for x, y in zip(a, b)]) / _sqrt(la * lb)
+        return _acos(max(-1.0, min(1.0, dot)))
 
     def angle_signed(self, other, fallback=None):
         # type: (Vector, __Any) -> float
@@ -1296,7 +3872,19 @@ class Vector:
         Returns:
             float: Angle in radians or fallback when given"""
 
-        pass
+        if len(self._data) != 2:
+            raise ValueError("Vector.angle_signed(other): only 2D vectors are supported")
+
+        a = self._data
+        b = self._other(other, "Vector.angle_signed(other)")
+
+        if not (a[0] or a[1]) or not (b[0] or b[1]):
+            if fallback is not None:
+                return fallback
+
+            raise ValueError("Vector.angle_signed(other): zero length vectors have no valid angle")
+
+        return _atan2(a[1] * b[0] - a[0] * b[1], a[0] * b[0] + a[1] * b[1])
 
     def copy(self):
         # type: () -> Vector
@@ -1308,10 +3896,10 @@ class Vector:
         Note:
             Use this to get a copy of a wrapped vector with no reference to the original data."""
 
-        pass
+        return _vector(list(self._data))
 
     def cross(self, other):
-        # type: (Vector) -> Vector
+        # type: (Vector) -> __Union[Vector, float]
         """Return the cross product of this vector and another.
 
         Args:
@@ -1323,19 +3911,28 @@ class Vector:
         Note:
             Both vectors must be 2D or 3D"""
 
-        pass
+        a = self._data
+        b = self._other(other, "Vector.cross(other)")
+
+        if len(a) == 3:
+            return _vector([a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]])
+
+        if len(a) == 2:
+            return a[0] * b[1] - a[1] * b[0]
+
+        raise ValueError("Vector.cross(other): only 2D or 3D vectors are supported")
 
     def dot(self, other):
-        # type: (Vector) -> Vector
+        # type: (Vector) -> float
         """Return the dot product of this vector and another.
 
         Args:
             other (Vector): The other vector to perform the dot product with.
 
         Returns:
-            Vector: The dot product."""
+            float: The dot product."""
 
-        pass
+        return sum([x * y for x, y in zip(self._data, self._other(other, "Vector.dot(other)"))])
 
     def freeze(self):
         # type: () -> Vector
@@ -1346,7 +3943,11 @@ class Vector:
         Returns:
             Vector: An instance of this object."""
 
-        pass
+        if self._owner is not None:
+            raise TypeError("Vector.freeze(): cannot freeze wrapped data")
+
+        self._frozen = True
+        return self
 
     def lerp(self, other, factor):
         # type: (Vector, float) -> Vector
@@ -1359,13 +3960,16 @@ class Vector:
         Returns:
             Vector: The interpolated vector."""
 
-        pass
+        ifac = 1.0 - factor
+        return _vector([a * ifac + b * factor for a, b in zip(self._data, self._other(other, "Vector.lerp(other)"))])
 
     def negate(self):
         # type: () -> None
         """Set all values to their negative."""
 
-        pass
+        _check_mutable(self)
+        self._data[:] = [-v for v in self._data]
+        self._changed()
 
     def normalize(self):
         # type: () -> None
@@ -1375,7 +3979,12 @@ class Vector:
             - Normalize works for vectors of all sizes, however 4D Vectors w axis is left untouched.
             - Normalizing a vector where all values are zero has no effect."""
 
-        pass
+        _check_mutable(self)
+        length = _sqrt(sum([v * v for v in self._data]))
+
+        if length:
+            self._data[:] = [v / length for v in self._data]
+            self._changed()
 
     def normalized(self):
         # type: () -> Vector
@@ -1384,7 +3993,12 @@ class Vector:
         Returns:
             Vector: A normalized copy of the vector"""
 
-        pass
+        length = _sqrt(sum([v * v for v in self._data]))
+
+        if not length:
+            return _vector(list(self._data))
+
+        return _vector([v / length for v in self._data])
 
     def orthogonal(self):
         # type: () -> Vector
@@ -1396,7 +4010,24 @@ class Vector:
         Note:
             - The axis is undefined, only use when any orthogonal vector is acceptable."""
 
-        pass
+        v = self._data
+
+        if len(v) == 2:
+            return _vector([-v[1], v[0]])
+
+        if len(v) != 3:
+            raise ValueError("Vector.orthogonal(): Vector must be 3D or 2D")
+
+        x, y, z = abs(v[0]), abs(v[1]), abs(v[2])
+        axis = (0 if x > z else 2) if x > y else (1 if y > z else 2)
+
+        if axis == 0:
+            return _vector([-v[1] - v[2], v[0], v[0]])
+
+        if axis == 1:
+            return _vector([v[1], -v[0] - v[2], v[1]])
+
+        return _vector([v[2], v[2], -v[0] - v[1]])
 
     def project(self, other):
         # type: (Vector) -> Vector
@@ -1408,7 +4039,14 @@ class Vector:
         Returns:
             Vector: The parallel projection vector"""
 
-        pass
+        b = self._other(other, "Vector.project(other)")
+        length = sum([v * v for v in b])
+
+        if not length:
+            return _vector([0.0] * len(b))
+
+        scale = sum([x * y for x, y in zip(self._data, b)]) / length
+        return _vector([v * scale for v in b])
 
     def reflect(self, mirror):
         # type: (Vector) -> Vector
@@ -1420,7 +4058,35 @@ class Vector:
         Returns:
             Vector: The reflected vector matching the size of this vector."""
 
-        pass
+        normal = _floats(mirror, "Vector.reflect(mirror)")
+
+        if not 2 <= len(normal) <= 4:
+            raise ValueError("Vector.reflect(mirror): expected a 2D, 3D or 4D vector")
+
+        normal = (normal + [0.0])[:3]
+        vec = (list(self._data) + [0.0])[:3]
+        length = _sqrt(sum([v * v for v in normal]))
+
+        if length:
+            normal = [v / length for v in normal]
+
+        dot2 = 2.0 * sum([a * b for a, b in zip(vec, normal)])
+        result = [v - dot2 * n for v, n in zip(vec, normal)]
+        return _vector(result[:len(self._data)])
+
+    def _resize(self, size):
+        # type: (int) -> None
+        if self._owner is not None:
+            raise TypeError("Vector.resize(): cannot resize wrapped data - only python vectors")
+
+        _check_mutable(self)
+
+        if size < 2:
+            raise ValueError("Vector.resize(): can only resize to 2 or more dimensions")
+
+        data = self._data
+        data[:] = data[:size] + [0.0] * (size - len(data))
+        self._changed()
 
     def resize(self, size=3):
         # type: (int) -> None
@@ -1429,25 +4095,29 @@ class Vector:
         Args:
             size (int): New vector size (optional)"""
 
-        pass
+        self._resize(size)
 
     def resize_2d(self):
         # type: () -> None
         """Resize the vector to 2D (x, y)."""
 
-        pass
+        self._resize(2)
 
     def resize_3d(self):
         # type: () -> None
         """Resize the vector to 3D (x, y, z)."""
 
-        pass
+        self._resize(3)
 
     def resize_4d(self):
         # type: () -> None
         """Resize the vector to 4D (x, y, z, w)."""
 
-        pass
+        extend = len(self._data) < 4
+        self._resize(4)
+
+        if extend:
+            self._data[3] = 1.0
 
     def resized(self, size=3):
         # type: (int) -> Vector
@@ -1459,7 +4129,10 @@ class Vector:
         Returns:
             Vector: A new vector"""
 
-        pass
+        if size < 2:
+            raise ValueError("Vector.resized(): can only resize to 2 or more dimensions")
+
+        return _vector(self._data[:size] + [0.0] * (size - len(self._data)))
 
     def rotate(self, other):
         # type: (__Union[Euler, Quaternion, Matrix]) -> None
@@ -1468,7 +4141,20 @@ class Vector:
         Args:
             other (__Union[Euler, Quaternion, Matrix]): rotation component of mathutils value"""
 
-        pass
+        _check_mutable(self)
+
+        if len(self._data) != 3:
+            raise ValueError("Vector.rotate(): must be a 3D vector")
+
+        if isinstance(other, Matrix) and len(other._rows) >= 3 and len(other._rows[0]) >= 3:
+            rows = other._rows
+
+        else:
+            rows = _rotation_rows(other, "Vector.rotate(value)")
+
+        x, y, z = self._data
+        self._data[:] = [rows[r][0] * x + rows[r][1] * y + rows[r][2] * z for r in range(3)]
+        self._changed()
 
     def rotation_difference(self, other):
         # type: (Vector) -> Quaternion
@@ -1483,7 +4169,22 @@ class Vector:
         Note:
             - 2D vectors raise an AttributeError."""
 
-        pass
+        if len(self._data) != 3:
+            raise ValueError("Vector.rotation_difference(): expects both vectors to be size 3")
+
+        a = self.normalized()._data
+        b = _vector(self._other(other, "Vector.rotation_difference(other)")).normalized()._data
+        axis = [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
+        dot = max(-1.0, min(1.0, a[0] * b[0] + a[1] * b[1] + a[2] * b[2]))
+
+        if _sqrt(sum([v * v for v in axis])) > _EPSILON:
+            return _quaternion(_axis_angle_to_quat(axis, _acos(dot)))
+
+        if dot > 0.0:
+            return _quaternion([1.0, 0.0, 0.0, 0.0])
+
+        # Opposite vectors, any perpendicular axis gives a valid half turn.
+        return _quaternion(_axis_angle_to_quat(_vector(a).orthogonal()._data, _pi))
 
     def slerp(self, other, factor, fallback=None):
         # type: (Vector, float, __Any) -> Vector
@@ -1497,7 +4198,35 @@ class Vector:
         Returns:
             Vector: The interpolated vector."""
 
-        pass
+        a = self._data
+        b = self._other(other, "Vector.slerp(other)")
+        la = _sqrt(sum([v * v for v in a]))
+        lb = _sqrt(sum([v * v for v in b]))
+
+        if la < _EPSILON or lb < _EPSILON:
+            if fallback is not None:
+                return fallback
+
+            raise ValueError("Vector.slerp(): zero length vectors unsupported")
+
+        a = [v / la for v in a]
+        b = [v / lb for v in b]
+        cosom = sum([x * y for x, y in zip(a, b)])
+
+        if cosom < -1.0 + _EPSILON:
+            if fallback is not None:
+                return fallback
+
+            raise ValueError("Vector.slerp(): opposite vectors unsupported")
+
+        if cosom > 1.0 - 1e-9:
+            return _vector([x + (y - x) * factor for x, y in zip(a, b)])
+
+        omega = _acos(cosom)
+        sinom = _sin(omega)
+        w0 = _sin((1.0 - factor) * omega) / sinom
+        w1 = _sin(factor * omega) / sinom
+        return _vector([w0 * x + w1 * y for x, y in zip(a, b)])
 
     def to_2d(self):
         # type: () -> Vector
@@ -1506,7 +4235,7 @@ class Vector:
         Returns:
             Vector: A new vector"""
 
-        pass
+        return self.resized(2)
 
     def to_3d(self):
         # type: () -> Vector
@@ -1515,7 +4244,7 @@ class Vector:
         Returns:
             Vector: A new vector"""
 
-        pass
+        return self.resized(3)
 
     def to_4d(self):
         # type: () -> Vector
@@ -1524,9 +4253,14 @@ class Vector:
         Returns:
             Vector: A new vector"""
 
-        pass
+        vec = self.resized(4)
 
-    def to_track_quat(self, track, up):
+        if len(self._data) < 4:
+            vec._data[3] = 1.0
+
+        return vec
+
+    def to_track_quat(self, track="Z", up="Y"):
         # type: (str, str) -> Quaternion
         """Return a quaternion rotation from the vector and the track and up axis.
 
@@ -1537,7 +4271,73 @@ class Vector:
         Returns:
             Quaternion: Rotation from the vector and the track and up axis."""
 
-        pass
+        tracks = ("X", "Y", "Z", "-X", "-Y", "-Z")
+
+        if track not in tracks or up not in tracks[:3]:
+            raise ValueError("Vector.to_track_quat(): invalid track or up axis")
+
+        axis = tracks.index(track)
+        upflag = tracks.index(up)
+
+        if axis % 3 == upflag:
+            raise ValueError("Vector.to_track_quat(): can't have the same axis for track and up")
+
+        if len(self._data) != 3:
+            raise ValueError("Vector.to_track_quat(): only for 3D vectors")
+
+        # Same as Blender negating the vector before vec_to_quat, which negates it again for positive axes.
+        tvec = [-v for v in self._data] if axis > 2 else list(self._data)
+        axis %= 3
+        length = _sqrt(sum([v * v for v in tvec]))
+
+        if not length:
+            return _quaternion([1.0, 0.0, 0.0, 0.0])
+
+        eps = 1e-4
+
+        if axis == 0:
+            nor = [0.0, -tvec[2], tvec[1]]
+
+            if abs(tvec[1]) + abs(tvec[2]) < eps:
+                nor[1] = 1.0
+
+            co = tvec[0]
+
+        elif axis == 1:
+            nor = [tvec[2], 0.0, -tvec[0]]
+
+            if abs(tvec[0]) + abs(tvec[2]) < eps:
+                nor[2] = 1.0
+
+            co = tvec[1]
+
+        else:
+            nor = [-tvec[1], tvec[0], 0.0]
+
+            if abs(tvec[0]) + abs(tvec[1]) < eps:
+                nor[0] = 1.0
+
+            co = tvec[2]
+
+        quat = _axis_angle_to_quat(nor, _acos(max(-1.0, min(1.0, co / length))))
+
+        if axis != upflag:
+            rows = _quat_to_rows(quat)
+            fp = [rows[0][2], rows[1][2], rows[2][2]]
+
+            if axis == 0:
+                angle = 0.5 * _atan2(fp[2], fp[1]) if upflag == 1 else -0.5 * _atan2(fp[1], fp[2])
+
+            elif axis == 1:
+                angle = -0.5 * _atan2(fp[2], fp[0]) if upflag == 0 else 0.5 * _atan2(fp[0], fp[2])
+
+            else:
+                angle = 0.5 * _atan2(-fp[1], -fp[0]) if upflag == 0 else -0.5 * _atan2(-fp[0], -fp[1])
+
+            si = _sin(angle) / length
+            quat = _mul_quat([_cos(angle), tvec[0] * si, tvec[1] * si, tvec[2] * si], quat)
+
+        return _quaternion(quat)
 
     def to_tuple(self, precision=-1):
         # type: (int) -> tuple[float]
@@ -1549,10 +4349,455 @@ class Vector:
         Returns:
             tuple[float]: the values of the vector rounded by precision"""
 
-        pass
+        if not -1 <= precision <= 21:
+            raise ValueError("Vector.to_tuple(precision): precision must be between -1 and 21")
+
+        if precision == -1:
+            return tuple(self._data)
+
+        return tuple([round(v, precision) for v in self._data])
+
+    def zero(self):
+        # type: () -> None
+        """Set all values to zero."""
+
+        _check_mutable(self)
+        self._data[:] = [0.0] * len(self._data)
+        self._changed()
+
+
+class VectorArray:
+    """Contiguous array of vectors sharing the same size, operations apply to all of them at once."""
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, seq=None, size=3):
+        # type: (__Sequence[__Sequence[float]], int) -> None
+        """Contiguous array of vectors sharing the same size, operations apply to all of them at once.
+
+        Args:
+            seq (__Sequence[__Sequence[float]]): Sequence of vectors, or a flat float buffer (array, memoryview) holding size components per vector.
+            size (int): Number of components of each vector [2, 4]."""
+
+        if isinstance(seq, VectorArray):
+            size = seq._size
+            data = _array("d", seq._data)
+
+        elif seq is None:
+            data = _array("d")
+
+        else:
+            if not isinstance(seq, (_array, memoryview)):
+                seq = list(seq)
+
+                if seq:
+                    size = len(seq[0])
+
+            data = _as_coords(seq, size)
+
+        if not 2 <= size <= 4:
+            raise ValueError("VectorArray(): size must be between 2 and 4")
+
+        self._data = data
+        self._size = size
+
+    @staticmethod
+    def _wrap(data, size):
+        # type: (_array, int) -> VectorArray
+        arr = _new(VectorArray)
+        arr._data = data
+        arr._size = size
+        return arr
+
+    def _components(self):
+        # type: () -> list
+        return _components(self._data, self._size)
+
+    @staticmethod
+    def _operand(other, size, count, name):
+        # type: (__Any, int, int, str) -> list
+        """Components of a same sized VectorArray, or of a single vector broadcast as floats."""
+
+        if isinstance(other, VectorArray):
+            if other._size != size or len(other) != count:
+                raise ValueError("%s: arrays must have the same length and vector size" % name)
+
+            return other._components()
+
+        values = other._data if isinstance(other, Vector) else _floats(other, name)
+
+        if len(values) != size:
+            raise ValueError("%s: expected a %dD vector" % (name, size))
+
+        return [float(value) for value in values]
+
+    @property
+    def buffer(self):
+        # type: () -> memoryview
+        """Memoryview of the vector data with shape (len, size), shared with this array (read-only)."""
+
+        return memoryview(self._data).cast("B").cast("d", [len(self), self._size])
+
+    def __buffer__(self, flags):
+        # type: (int) -> memoryview
+        return self.buffer
+
+    @property
+    def length(self):
+        # type: () -> _array
+        """Length of every vector (read-only)."""
+
+        return _array("d", map(_sqrt, self.length_squared))
+
+    @property
+    def length_squared(self):
+        # type: () -> _array
+        """Length squared of every vector (read-only)."""
+
+        return _array("d", _column_sum([list(map(_mul, c, c)) for c in self._components()], len(self)))
+
+    @property
+    def size(self):
+        # type: () -> int
+        """Number of components of each vector (read-only)."""
+
+        return self._size
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._data) // self._size
+
+    def __iter__(self):
+        data = self._data
+        size = self._size
+
+        for start in range(0, len(data), size):
+            yield _vector(data[start:start + size].tolist())
+
+    def __getitem__(self, item):
+        # type: (int) -> Vector
+        size = self._size
+
+        if isinstance(item, slice):
+            indices = range(len(self))[item]
+
+            if indices.step == 1:
+                return VectorArray._wrap(self._data[indices.start * size:indices.stop * size], size)
+
+            data = _array("d")
+
+            for index in indices:
+                data.extend(self._data[index * size:(index + 1) * size])
+
+            return VectorArray._wrap(data, size)
+
+        start = range(len(self))[item] * size
+        return _vector(self._data[start:start + size].tolist())
+
+    def __setitem__(self, key, value):
+        # type: (int, __Sequence[float]) -> None
+        values = _floats(value, "VectorArray[index] = value")
+
+        if len(values) != self._size:
+            raise ValueError("VectorArray[index] = value: expected a %dD vector" % self._size)
+
+        start = range(len(self))[key] * self._size
+        self._data[start:start + self._size] = _array("d", values)
+
+    def __repr__(self):
+        # type: () -> str
+        return "VectorArray(%r)" % ([tuple(vec._data) for vec in self],)
+
+    def __str__(self):
+        # type: () -> str
+        return "<VectorArray %d vectors of size %d>" % (len(self), self._size)
+
+    def __eq__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+
+        return self._size == other._size and self._data == other._data
+
+    def __ne__(self, other):
+        # type: (__Any) -> bool
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+
+        return not self == other
+
+    __hash__ = None
+
+    def _elementwise(self, op, other, name):
+        # type: (__Any, __Any, str) -> VectorArray
+        count = len(self)
+        b = VectorArray._operand(other, self._size, count, name)
+        return VectorArray._wrap(_interleave([list(map(op, a, _column(c, count)))
+                                              for a, c in zip(self._components(), b)]), self._size)
+
+    def __neg__(self):
+        # type: () -> VectorArray
+        return VectorArray._wrap(_array("d", map(_neg, self._data)), self._size)
+
+    def __add__(self, other):
+        # type: (__Union[VectorArray, Vector]) -> VectorArray
+        if not isinstance(other, (VectorArray, Vector)):
+            return NotImplemented
+
+        return self._elementwise(_add, other, "VectorArray addition")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # type: (__Union[VectorArray, Vector]) -> VectorArray
+        if not isinstance(other, (VectorArray, Vector)):
+            return NotImplemented
+
+        return self._elementwise(_sub, other, "VectorArray subtraction")
+
+    def __rsub__(self, other):
+        # type: (Vector) -> VectorArray
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return -self._elementwise(_sub, other, "VectorArray subtraction")
+
+    def __mul__(self, other):
+        # type: (__Union[VectorArray, Vector, float]) -> __Union[VectorArray, _array]
+        if isinstance(other, (int, float)):
+            return VectorArray._wrap(_array("d", map(_mul, self._data, _repeat(float(other)))), self._size)
+
+        if isinstance(other, (VectorArray, Vector)):
+            return self.dot(other)
+
+        return NotImplemented
+
+    def __rmul__(self, other):
+        # type: (__Union[Matrix, Quaternion, float]) -> VectorArray
+        if isinstance(other, (int, float)):
+            return self * other
+
+        if isinstance(other, Vector):
+            return self.dot(other)
+
+        return self._transformed(other)
+
+    def __matmul__(self, other):
+        # type: (__Union[VectorArray, Vector]) -> _array
+        if isinstance(other, (VectorArray, Vector)):
+            return self.dot(other)
+
+        return NotImplemented
+
+    def __rmatmul__(self, other):
+        # type: (__Union[Matrix, Quaternion]) -> VectorArray
+        return self._transformed(other)
+
+    def __truediv__(self, other):
+        # type: (float) -> VectorArray
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if not other:
+            raise ZeroDivisionError("VectorArray division: divide by zero error")
+
+        return self * (1.0 / other)
+
+    def _transformed(self, other):
+        # type: (__Any) -> __Any
+        if isinstance(other, Quaternion):
+            if self._size != 3:
+                raise ValueError("quat * vector: only 3D vector rotations (with quats) currently supported")
+
+            rows = _quat_to_rows(other._data)
+
+        elif isinstance(other, Matrix):
+            rows = _matrix_columns(other._rows)
+
+        else:
+            return NotImplemented
+
+        result = _transform_columns(rows, self._components(), len(self))
+        return VectorArray._wrap(_interleave(result), len(result))
+
+    def __copy__(self):
+        # type: () -> VectorArray
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> VectorArray
+        return self.copy()
+
+    @classmethod
+    def Fill(cls, count, size=3, fill=0.0):
+        # type: (int, int, float) -> VectorArray
+        """Create an array of count vectors with all values set to fill.
+
+        Args:
+            count (int): Number of vectors.
+            size (int): The size of each vector [2, 4].
+            fill (float): The value used to fill the vectors.
+
+        Returns:
+            VectorArray: The new array."""
+
+        if not 2 <= size <= 4:
+            raise ValueError("VectorArray.Fill(): size must be between 2 and 4")
+
+        return VectorArray._wrap(_array("d", [float(fill)]) * (count * size), size)
+
+    def copy(self):
+        # type: () -> VectorArray
+        """Returns a copy of this array.
+
+        Returns:
+            VectorArray: A copy with its own buffer."""
+
+        return VectorArray._wrap(_array("d", self._data), self._size)
+
+    def cross(self, other):
+        # type: (__Union[VectorArray, Vector]) -> __Union[VectorArray, _array]
+        """Return the cross product of every vector with the matching vector of other.
+
+        Args:
+            other (__Union[VectorArray, Vector]): Array of the same length, or a single vector used for all of them.
+
+        Returns:
+            __Union[VectorArray, array]: The cross products, an array of floats when 2D vectors are used."""
+
+        count = len(self)
+        a = self._components()
+        b = [_column(c, count) for c in VectorArray._operand(other, self._size, count, "VectorArray.cross(other)")]
+
+        if self._size == 2:
+            return _array("d", map(_sub, map(_mul, a[0], b[1]), map(_mul, a[1], b[0])))
+
+        if self._size != 3:
+            raise ValueError("VectorArray.cross(other): only 2D or 3D vectors are supported")
+
+        ax, ay, az = a
+        bx, by, bz = [list(c) for c in b]
+        return VectorArray._wrap(_interleave([list(map(_sub, map(_mul, ay, bz), map(_mul, az, by))),
+                                              list(map(_sub, map(_mul, az, bx), map(_mul, ax, bz))),
+                                              list(map(_sub, map(_mul, ax, by), map(_mul, ay, bx)))]), 3)
+
+    def dot(self, other):
+        # type: (__Union[VectorArray, Vector]) -> _array
+        """Return the dot product of every vector with the matching vector of other.
+
+        Args:
+            other (__Union[VectorArray, Vector]): Array of the same length, or a single vector used for all of them.
+
+        Returns:
+            array: One double per vector."""
+
+        count = len(self)
+        b = VectorArray._operand(other, self._size, count, "VectorArray.dot(other)")
+        return _array("d", _column_sum([_column_mul(a, c, count) for a, c in zip(self._components(), b)], count))
+
+    def lerp(self, other, factor):
+        # type: (__Union[VectorArray, Vector], __Union[float, __Sequence[float]]) -> VectorArray
+        """Returns the interpolation of every vector with the matching vector of other.
+
+        Args:
+            other (__Union[VectorArray, Vector]): Array of the same length, or a single vector used for all of them.
+            factor (__Union[float, __Sequence[float]]): The interpolation value in [0.0, 1.0], or one value per vector.
+
+        Returns:
+            VectorArray: The interpolated vectors."""
+
+        count = len(self)
+        b = VectorArray._operand(other, self._size, count, "VectorArray.lerp(other)")
+        t = float(factor) if isinstance(factor, (int, float)) else _floats(factor, "VectorArray.lerp(factor)")
+        return VectorArray._wrap(_interleave([
+            list(map(_add, a, _column_mul(list(map(_sub, _column(c, count), a)), t, count)))
+            for a, c in zip(self._components(), b)]), self._size)
+
+    def negate(self):
+        # type: () -> None
+        """Set all values to their negative."""
+
+        self._data[:] = _array("d", map(_neg, self._data))
+
+    def normalize(self):
+        # type: () -> None
+        """Normalize every vector in place, vectors of zero length are left untouched."""
+
+        self._data[:] = self.normalized()._data
+
+    def normalized(self):
+        # type: () -> VectorArray
+        """Return a new array with every vector normalized.
+
+        Returns:
+            VectorArray: Normalized copies, vectors of zero length stay zero."""
+
+        scale = [1.0 / length if length else 0.0 for length in self.length]
+        return VectorArray._wrap(_interleave([list(map(_mul, c, scale)) for c in self._components()]), self._size)
+
+    def slerp(self, other, factor):
+        # type: (__Union[VectorArray, Vector], __Union[float, __Sequence[float]]) -> VectorArray
+        """Returns the spherical interpolation of every vector with the matching vector of other.
+
+        Args:
+            other (__Union[VectorArray, Vector]): Array of the same length, or a single vector used for all of them.
+            factor (__Union[float, __Sequence[float]]): The interpolation value in [0.0, 1.0], or one value per vector.
+
+        Returns:
+            VectorArray: The interpolated unit vectors.
+
+        Note:
+            - Unlike Vector.slerp, pairs with a zero length vector or pointing in opposite directions don't raise an
+              error, their normalized vectors are interpolated linearly instead."""
+
+        count = len(self)
+        a = self.normalized()
+
+        if isinstance(other, VectorArray):
+            b = other.normalized()
+
+        else:
+            b = _vector(VectorArray._operand(other, self._size, count, "VectorArray.slerp(other)")).normalized()
+
+        factors = _column(float(factor) if isinstance(factor, (int, float)) else
+                          _floats(factor, "VectorArray.slerp(factor)"), count)
+        w0 = []
+        w1 = []
+
+        for cosom, t in zip(a.dot(b), factors):
+            if -1.0 + _EPSILON < cosom < 1.0 - 1e-9:
+                omega = _acos(cosom)
+                sinom = _sin(omega)
+                w0.append(_sin((1.0 - t) * omega) / sinom)
+                w1.append(_sin(t * omega) / sinom)
+
+            else:
+                w0.append(1.0 - t)
+                w1.append(t)
+
+        b = b._components() if isinstance(b, VectorArray) else b._data
+        return VectorArray._wrap(_interleave([list(map(_add, map(_mul, ca, w0), _column_mul(cb, w1, count)))
+                                              for ca, cb in zip(a._components(), b)]), self._size)
+
+    def transform(self, matrix):
+        # type: (__Union[Matrix, MatrixArray, Quaternion]) -> None
+        """Transform every vector in place, same as assigning matrix * self.
+
+        Args:
+            matrix (__Union[Matrix, MatrixArray, Quaternion]): A single transformation for all the vectors, or one matrix per vector."""
+
+        result = matrix * self
+
+        if result._size != self._size:
+            raise ValueError("VectorArray.transform(): the result must keep the vector size")
+
+        self._data[:] = result._data
 
     def zero(self):
         # type: () -> None
         """Set all values to zero."""
 
-        pass
+        self._data[:] = _array("d", bytes(len(self._data) * 8))
+
+
+from . import bvhtree, geometry, interpolate, kdtree, noise
@@ -0,0 +1,77 @@
+"""Helpers shared by the mathutils submodules to move coordinate data around as contiguous double arrays."""
+
+from array import array as _array
+from typing import Sequence as _Sequence
+
+
+def as_coords(seq, size=3):
+    # type: (_Sequence, int) -> _array
+    """Flatten a sequence of float tuples (or an already flat float buffer) into a contiguous double array.
+
+    Args:
+        seq (_Sequence): Sequence of size-long float sequences, a float array/memoryview or a VectorArray.
+        size (int): Number of components per item.
+
+    Returns:
+        array: Flat array of doubles, size components per item."""
+
+    if isinstance(getattr(seq, "buffer", None), memoryview):
+        # VectorArray and other array types exporting their data
+        seq = seq.buffer
+
+    if isinstance(seq, (_array, memoryview)):
+        if isinstance(seq, memoryview) and seq.ndim > 1:
+            seq = seq.cast("B").cast(seq.format)
+
+        flat = _array("d", seq)
+
+    else:
+        flat = _array("d")
+
+        for co in seq:
+            if len(co) != size:
+                raise ValueError("Expected a sequence of %d-component coordinates" % size)
+
+            flat.extend(co)
+
+    if len(flat) % size:
+        raise ValueError("Flat coordinate buffers must have a length multiple of %d" % size)
+
+    return flat
+
+
+def components(data, size):
+    # type: (_array, int) -> list
+    """Split a flat interleaved buffer into one array per component (x values, y values, ...).
+
+    Args:
+        data (array): Flat array of doubles, size components per item.
+        size (int): Number of components per item.
+
+    Returns:
+        list[array]: size arrays holding len(data) // size doubles each."""
+
+    return [data[i::size] for i in range(size)]
+
+
+def interleave(columns, out=None):
+    # type: (list, _array) -> _array
+    """Inverse of components(), interleave per component sequences back into one flat buffer.
+
+    Args:
+        columns (list): Sequences of floats, all of the same length.
+        out (array): Flat array of doubles to write into in place, a new one is created when None.
+
+    Returns:
+        array: The flat array of doubles."""
+
+    size = len(columns)
+    count = len(columns[0])
+
+    if out is None:
+        out = _array("d", bytes(8 * size * count))
+
+    for i, column in enumerate(columns):
+        out[i::size] = column if isinstance(column, _array) else _array("d", column)
+
+    return out
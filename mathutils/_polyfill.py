@@ -0,0 +1,569 @@
+"""Polygon triangulation used by mathutils.geometry.tessellate_polygon().
+
+Ear clipping over a doubly linked vertex ring. Holes are bridged into the outer ring first, ear tests are accelerated by
+a z-order curve index of the vertices so that large polygons stay close to O(n log n), and self intersecting or
+degenerate input falls back to local intersection curing and polygon splitting instead of failing."""
+
+from typing import List as _List, Sequence as _Sequence, Tuple as _Tuple
+
+_HASH_THRESHOLD = 80
+"""Vertex count above which ear tests use the z-order index."""
+
+
+class _Node:
+    """Polygon vertex in a doubly linked ring, also linked in z-order."""
+
+    __slots__ = ("i", "x", "y", "prev", "next", "z", "prev_z", "next_z", "steiner")
+
+    def __init__(self, i, x, y):
+        # type: (int, float, float) -> None
+        self.i = i
+        self.x = x
+        self.y = y
+        self.prev = None  # type: _Node
+        self.next = None  # type: _Node
+        self.z = 0
+        self.prev_z = None  # type: _Node
+        self.next_z = None  # type: _Node
+        self.steiner = False
+
+
+def _area(p, q, r):
+    # type: (_Node, _Node, _Node) -> float
+    """Twice the signed area of the triangle, negative when p, q, r turn counter-clockwise."""
+
+    return (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+
+
+def _equals(p, q):
+    # type: (_Node, _Node) -> bool
+    return p.x == q.x and p.y == q.y
+
+
+def _point_in_triangle(ax, ay, bx, by, cx, cy, px, py):
+    # type: (float, float, float, float, float, float, float, float) -> bool
+    return ((cx - px) * (ay - py) >= (ax - px) * (cy - py) and
+            (ax - px) * (by - py) >= (bx - px) * (ay - py) and
+            (bx - px) * (cy - py) >= (cx - px) * (by - py))
+
+
+def _sign(value):
+    # type: (float) -> int
+    return (value > 0.0) - (value < 0.0)
+
+
+def _on_segment(p, q, r):
+    # type: (_Node, _Node, _Node) -> bool
+    """Whether q, collinear with p and r, lies on the p-r segment."""
+
+    return min(p.x, r.x) <= q.x <= max(p.x, r.x) and min(p.y, r.y) <= q.y <= max(p.y, r.y)
+
+
+def _intersects(p1, q1, p2, q2):
+    # type: (_Node, _Node, _Node, _Node) -> bool
+    """Whether the p1-q1 and p2-q2 segments intersect."""
+
+    o1 = _sign(_area(p1, q1, p2))
+    o2 = _sign(_area(p1, q1, q2))
+    o3 = _sign(_area(p2, q2, p1))
+    o4 = _sign(_area(p2, q2, q1))
+
+    if o1 != o2 and o3 != o4:
+        return True
+
+    return ((not o1 and _on_segment(p1, p2, q1)) or (not o2 and _on_segment(p1, q2, q1)) or
+            (not o3 and _on_segment(p2, p1, q2)) or (not o4 and _on_segment(p2, q1, q2)))
+
+
+def _insert_node(i, x, y, last):
+    # type: (int, float, float, _Node) -> _Node
+    p = _Node(i, x, y)
+
+    if last is None:
+        p.prev = p
+        p.next = p
+
+    else:
+        p.next = last.next
+        p.prev = last
+        last.next.prev = p
+        last.next = p
+
+    return p
+
+
+def _remove_node(p):
+    # type: (_Node) -> None
+    p.next.prev = p.prev
+    p.prev.next = p.next
+
+    if p.prev_z is not None:
+        p.prev_z.next_z = p.next_z
+
+    if p.next_z is not None:
+        p.next_z.prev_z = p.prev_z
+
+
+def _linked_list(ring, clockwise):
+    # type: (_Sequence, bool) -> _Node
+    """Build a vertex ring from (x, y, index) items, in the requested winding."""
+
+    area = 0.0
+    jx, jy = ring[-1][0], ring[-1][1]
+
+    for x, y, _ in ring:
+        area += (jx - x) * (y + jy)
+        jx, jy = x, y
+
+    last = None
+
+    for x, y, i in (ring if clockwise == (area > 0.0) else reversed(ring)):
+        last = _insert_node(i, x, y, last)
+
+    if last is not None and _equals(last, last.next):
+        _remove_node(last)
+        last = last.next
+
+    return last
+
+
+def _filter_points(start, end=None):
+    # type: (_Node, _Node) -> _Node
+    """Remove duplicate and collinear vertices."""
+
+    if start is None:
+        return start
+
+    if end is None:
+        end = start
+
+    p = start
+
+    while True:
+        again = False
+
+        if not p.steiner and (_equals(p, p.next) or not _area(p.prev, p, p.next)):
+            _remove_node(p)
+            p = end = p.prev
+
+            if p is p.next:
+                break
+
+            again = True
+
+        else:
+            p = p.next
+
+        if not again and p is end:
+            break
+
+    return end
+
+
+def _z_order(x, y, min_x, min_y, inv_size):
+    # type: (float, float, float, float, float) -> int
+    """Interleaved bits of the 15 bit quantized coordinates (Morton code)."""
+
+    x = int((x - min_x) * inv_size)
+    y = int((y - min_y) * inv_size)
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    y = (y | (y << 8)) & 0x00FF00FF
+    y = (y | (y << 4)) & 0x0F0F0F0F
+    y = (y | (y << 2)) & 0x33333333
+    y = (y | (y << 1)) & 0x55555555
+    return x | (y << 1)
+
+
+def _index_curve(start, min_x, min_y, inv_size):
+    # type: (_Node, float, float, float) -> None
+    """Link the ring vertices in z-order."""
+
+    nodes = []
+    p = start
+
+    while True:
+        if not p.z:
+            p.z = _z_order(p.x, p.y, min_x, min_y, inv_size)
+
+        nodes.append(p)
+        p = p.next
+
+        if p is start:
+            break
+
+    nodes.sort(key=lambda node: node.z)
+    previous = None
+
+    for node in nodes:
+        node.prev_z = previous
+
+        if previous is not None:
+            previous.next_z = node
+
+        previous = node
+
+    previous.next_z = None
+
+
+def _is_ear(ear):
+    # type: (_Node) -> bool
+    a = ear.prev
+    c = ear.next
+
+    if _area(a, ear, c) >= 0.0:
+        # Reflex vertex
+        return False
+
+    ax, ay, bx, by, cx, cy = a.x, a.y, ear.x, ear.y, c.x, c.y
+    x0, x1 = min(ax, bx, cx), max(ax, bx, cx)
+    y0, y1 = min(ay, by, cy), max(ay, by, cy)
+    p = c.next
+
+    while p is not a:
+        if (x0 <= p.x <= x1 and y0 <= p.y <= y1 and _point_in_triangle(ax, ay, bx, by, cx, cy, p.x, p.y) and
+                _area(p.prev, p, p.next) >= 0.0):
+            return False
+
+        p = p.next
+
+    return True
+
+
+def _is_ear_hashed(ear, min_x, min_y, inv_size):
+    # type: (_Node, float, float, float) -> bool
+    """As _is_ear(), only visiting the vertices whose z-order is within the triangle bounds."""
+
+    a = ear.prev
+    c = ear.next
+
+    if _area(a, ear, c) >= 0.0:
+        return False
+
+    ax, ay, bx, by, cx, cy = a.x, a.y, ear.x, ear.y, c.x, c.y
+    x0, x1 = min(ax, bx, cx), max(ax, bx, cx)
+    y0, y1 = min(ay, by, cy), max(ay, by, cy)
+    min_z = _z_order(x0, y0, min_x, min_y, inv_size)
+    max_z = _z_order(x1, y1, min_x, min_y, inv_size)
+
+    def inside(p):
+        return (p is not a and p is not c and x0 <= p.x <= x1 and y0 <= p.y <= y1 and
+                _point_in_triangle(ax, ay, bx, by, cx, cy, p.x, p.y) and _area(p.prev, p, p.next) >= 0.0)
+
+    p = ear.prev_z
+    n = ear.next_z
+
+    while p is not None and p.z >= min_z and n is not None and n.z <= max_z:
+        if inside(p) or inside(n):
+            return False
+
+        p = p.prev_z
+        n = n.next_z
+
+    while p is not None and p.z >= min_z:
+        if inside(p):
+            return False
+
+        p = p.prev_z
+
+    while n is not None and n.z <= max_z:
+        if inside(n):
+            return False
+
+        n = n.next_z
+
+    return True
+
+
+def _locally_inside(a, b):
+    # type: (_Node, _Node) -> bool
+    """Whether the a-b diagonal starts inside the polygon at a."""
+
+    if _area(a.prev, a, a.next) < 0.0:
+        return _area(a, b, a.next) >= 0.0 and _area(a, a.prev, b) >= 0.0
+
+    return _area(a, b, a.prev) < 0.0 or _area(a, a.next, b) < 0.0
+
+
+def _middle_inside(a, b):
+    # type: (_Node, _Node) -> bool
+    """Whether the middle of the a-b diagonal is inside the polygon."""
+
+    p = a
+    inside = False
+    px = (a.x + b.x) / 2.0
+    py = (a.y + b.y) / 2.0
+
+    while True:
+        if ((p.y > py) != (p.next.y > py) and p.next.y != p.y and
+                px < (p.next.x - p.x) * (py - p.y) / (p.next.y - p.y) + p.x):
+            inside = not inside
+
+        p = p.next
+
+        if p is a:
+            return inside
+
+
+def _intersects_polygon(a, b):
+    # type: (_Node, _Node) -> bool
+    p = a
+
+    while True:
+        if (p.i != a.i and p.next.i != a.i and p.i != b.i and p.next.i != b.i and
+                _intersects(p, p.next, a, b)):
+            return True
+
+        p = p.next
+
+        if p is a:
+            return False
+
+
+def _is_valid_diagonal(a, b):
+    # type: (_Node, _Node) -> bool
+    if a.next.i == b.i or a.prev.i == b.i or _intersects_polygon(a, b):
+        return False
+
+    if _locally_inside(a, b) and _locally_inside(b, a) and _middle_inside(a, b):
+        # Does not create opposite facing sectors
+        return bool(_area(a.prev, a, b.prev) or _area(a, b.prev, b))
+
+    # Zero length diagonal between coincident vertices
+    return _equals(a, b) and _area(a.prev, a, a.next) > 0.0 and _area(b.prev, b, b.next) > 0.0
+
+
+def _split_polygon(a, b):
+    # type: (_Node, _Node) -> _Node
+    """Link a and b with a diagonal, splitting the ring in two; returns the copy of b starting the second ring."""
+
+    a2 = _Node(a.i, a.x, a.y)
+    b2 = _Node(b.i, b.x, b.y)
+    an = a.next
+    bp = b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
+
+
+def _cure_local_intersections(start, triangles):
+    # type: (_Node, list) -> _Node
+    p = start
+
+    while True:
+        a = p.prev
+        b = p.next.next
+
+        if (not _equals(a, b) and _intersects(a, p, p.next, b) and _locally_inside(a, b) and
+                _locally_inside(b, a)):
+            triangles.append((a.i, p.i, b.i))
+            _remove_node(p)
+            _remove_node(p.next)
+            p = start = b
+
+        p = p.next
+
+        if p is start:
+            break
+
+    return _filter_points(p)
+
+
+def _split_earcut(start, triangles, min_x, min_y, inv_size):
+    # type: (_Node, list, float, float, float) -> None
+    """Split the remaining polygon along a valid diagonal and triangulate both halves."""
+
+    a = start
+
+    while True:
+        b = a.next.next
+
+        while b is not a.prev:
+            if a.i != b.i and _is_valid_diagonal(a, b):
+                c = _split_polygon(a, b)
+                a = _filter_points(a, a.next)
+                c = _filter_points(c, c.next)
+                _earcut_linked(a, triangles, min_x, min_y, inv_size, 0)
+                _earcut_linked(c, triangles, min_x, min_y, inv_size, 0)
+                return
+
+            b = b.next
+
+        a = a.next
+
+        if a is start:
+            return
+
+
+def _earcut_linked(ear, triangles, min_x, min_y, inv_size, attempt):
+    # type: (_Node, list, float, float, float, int) -> None
+    """Clip the ears of a ring, retrying with filtering, curing then splitting when no ear is left."""
+
+    if ear is None:
+        return
+
+    if not attempt and inv_size:
+        _index_curve(ear, min_x, min_y, inv_size)
+
+    stop = ear
+
+    while ear.prev is not ear.next:
+        prev = ear.prev
+        next = ear.next
+
+        if _is_ear_hashed(ear, min_x, min_y, inv_size) if inv_size else _is_ear(ear):
+            triangles.append((prev.i, ear.i, next.i))
+            _remove_node(ear)
+            ear = stop = next.next
+            continue
+
+        ear = next
+
+        if ear is stop:
+            if not attempt:
+                _earcut_linked(_filter_points(ear), triangles, min_x, min_y, inv_size, 1)
+
+            elif attempt == 1:
+                ear = _cure_local_intersections(_filter_points(ear), triangles)
+                _earcut_linked(ear, triangles, min_x, min_y, inv_size, 2)
+
+            else:
+                _split_earcut(ear, triangles, min_x, min_y, inv_size)
+
+            break
+
+
+def _find_hole_bridge(hole, outer):
+    # type: (_Node, _Node) -> _Node
+    """Outer ring vertex visible from the leftmost vertex of a hole, found with a ray cast to the left."""
+
+    p = outer
+    hx = hole.x
+    hy = hole.y
+    qx = -float("inf")
+    m = None
+
+    while True:
+        if p.next.y <= hy <= p.y and p.next.y != p.y:
+            x = p.x + (hy - p.y) * (p.next.x - p.x) / (p.next.y - p.y)
+
+            if qx < x <= hx:
+                qx = x
+                m = p if p.x < p.next.x else p.next
+
+                if x == hx:
+                    # The hole touches the outer segment
+                    return m
+
+        p = p.next
+
+        if p is outer:
+            break
+
+    if m is None:
+        return None
+
+    # Among the vertices inside the triangle of the hole point, the segment intersection and the segment endpoint,
+    # pick the one with the smallest angle to the ray
+    stop = m
+    mx = m.x
+    my = m.y
+    tan_min = float("inf")
+    p = m
+
+    while True:
+        if (hx >= p.x >= mx and hx != p.x and
+                _point_in_triangle(hx if hy < my else qx, hy, mx, my, qx if hy < my else hx, hy, p.x, p.y)):
+            tan = abs(hy - p.y) / (hx - p.x)
+
+            if _locally_inside(p, hole) and (tan < tan_min or (tan == tan_min and (
+                    p.x > m.x or (p.x == m.x and _area(m.prev, m, p.prev) < 0.0 and
+                                  _area(p.next, m, m.next) < 0.0)))):
+                m = p
+                tan_min = tan
+
+        p = p.next
+
+        if p is stop:
+            return m
+
+
+def _eliminate_holes(holes, outer):
+    # type: (list, _Node) -> _Node
+    """Bridge every hole into the outer ring, from left to right."""
+
+    queue = []
+
+    for ring in holes:
+        start = _linked_list(ring, False)
+
+        if start is None:
+            continue
+
+        if start is start.next:
+            start.steiner = True
+
+        leftmost = p = start
+
+        while True:
+            if p.x < leftmost.x or (p.x == leftmost.x and p.y < leftmost.y):
+                leftmost = p
+
+            p = p.next
+
+            if p is start:
+                break
+
+        queue.append(leftmost)
+
+    queue.sort(key=lambda node: node.x)
+
+    for hole in queue:
+        bridge = _find_hole_bridge(hole, outer)
+
+        if bridge is not None:
+            reverse = _split_polygon(bridge, hole)
+            _filter_points(reverse, reverse.next)
+            outer = _filter_points(bridge, bridge.next)
+
+    return outer
+
+
+def triangulate(outer, holes=()):
+    # type: (_Sequence[_Tuple[float, float, int]], _Sequence) -> _List[_Tuple[int, int, int]]
+    """Triangulate a 2D polygon with holes.
+
+    Args:
+        outer (_Sequence): (x, y, index) items of the outer ring, in any winding.
+        holes (_Sequence): Rings of (x, y, index) items of the holes, in any winding.
+
+    Returns:
+        list: Triangles as index triplets, in no particular winding."""
+
+    triangles = []
+    start = _linked_list(outer, True)
+
+    if start is None or start.next is start.prev:
+        return triangles
+
+    if holes:
+        start = _eliminate_holes(holes, start)
+
+    min_x = min_y = inv_size = 0.0
+
+    if len(outer) + sum(len(ring) for ring in holes) > _HASH_THRESHOLD:
+        min_x = min(x for x, _, _ in outer)
+        min_y = min(y for _, y, _ in outer)
+        size = max(max(x for x, _, _ in outer) - min_x, max(y for _, y, _ in outer) - min_y)
+        inv_size = 32767.0 / size if size else 0.0
+
+    _earcut_linked(start, triangles, min_x, min_y, inv_size, 0)
+    return triangles
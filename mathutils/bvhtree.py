@@ -3,27 +3,229 @@
 BVH tree structures for proximity searches and ray casts on geometry."""
 
 
-from ..bmesh.types import BMesh as _BMesh
-from ..bpy.types import Object as _Object, Scene as _Scene
-from ..mathutils import Vector as _Vector
+from . import Vector as _Vector
+from ._buffer import as_coords as _as_coords
+from array import array as _array
+from sys import float_info as _float_info
+from typing import Sequence as _Sequence, TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    import bmesh as _bmesh
+    import bpy as _bpy
+
+_INF = float("inf")
+_FLT_MAX = _float_info.max
+
+_LEAF_SIZE = 4
+"""Triangle count at or below which a node always becomes a leaf."""
+
+_MAX_LEAF_SIZE = 16
+"""Triangle count above which a node is always split, even when the SAH prefers a leaf."""
+
+_SAH_BINS = 16
+"""Number of centroid bins evaluated per split by the surface area heuristic."""
+
+_TRAVERSAL_COST = 1.0
+"""SAH cost of visiting an inner node, relative to one ray/triangle test."""
+
+
+def _box_area(x0, y0, z0, x1, y1, z1):
+    # type: (float, float, float, float, float, float) -> float
+    dx = x1 - x0
+    dy = y1 - y0
+    dz = z1 - z0
+    return dx * dy + dy * dz + dz * dx
+
+
+def _prefix_areas(boxes):
+    # type: (list) -> list[float]
+    """Surface area of the union of boxes[:i + 1] for every i."""
+
+    x0 = y0 = z0 = _INF
+    x1 = y1 = z1 = -_INF
+    areas = []
+
+    for bx0, by0, bz0, bx1, by1, bz1 in boxes:
+        if bx0 < x0:
+            x0 = bx0
+        if by0 < y0:
+            y0 = by0
+        if bz0 < z0:
+            z0 = bz0
+        if bx1 > x1:
+            x1 = bx1
+        if by1 > y1:
+            y1 = by1
+        if bz1 > z1:
+            z1 = bz1
+
+        dx = x1 - x0
+        dy = y1 - y0
+        dz = z1 - z0
+        areas.append(dx * dy + dy * dz + dz * dx)
+
+    return areas
+
+
+def _closest_on_tri(px, py, pz, ax, ay, az, e1x, e1y, e1z, e2x, e2y, e2z):
+    # type: (...) -> tuple[float, float, float]
+    """Closest point to p on the triangle (a, a + e1, a + e2), by Voronoi region of the triangle features."""
+
+    apx = px - ax
+    apy = py - ay
+    apz = pz - az
+    d1 = e1x * apx + e1y * apy + e1z * apz
+    d2 = e2x * apx + e2y * apy + e2z * apz
+
+    if d1 <= 0.0 and d2 <= 0.0:
+        return ax, ay, az
+
+    bx = ax + e1x
+    by = ay + e1y
+    bz = az + e1z
+    bpx = px - bx
+    bpy = py - by
+    bpz = pz - bz
+    d3 = e1x * bpx + e1y * bpy + e1z * bpz
+    d4 = e2x * bpx + e2y * bpy + e2z * bpz
+
+    if d3 >= 0.0 and d4 <= d3:
+        return bx, by, bz
+
+    vc = d1 * d4 - d3 * d2
+
+    if vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+        t = d1 / (d1 - d3)
+        return ax + t * e1x, ay + t * e1y, az + t * e1z
+
+    cx = ax + e2x
+    cy = ay + e2y
+    cz = az + e2z
+    cpx = px - cx
+    cpy = py - cy
+    cpz = pz - cz
+    d5 = e1x * cpx + e1y * cpy + e1z * cpz
+    d6 = e2x * cpx + e2y * cpy + e2z * cpz
+
+    if d6 >= 0.0 and d5 <= d6:
+        return cx, cy, cz
+
+    vb = d5 * d2 - d1 * d6
+
+    if vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+        t = d2 / (d2 - d6)
+        return ax + t * e2x, ay + t * e2y, az + t * e2z
+
+    va = d3 * d6 - d5 * d4
+
+    if va <= 0.0 and d4 - d3 >= 0.0 and d5 - d6 >= 0.0:
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        return bx + t * (cx - bx), by + t * (cy - by), bz + t * (cz - bz)
+
+    denom = 1.0 / (va + vb + vc)
+    v = vb * denom
+    w = vc * denom
+    return ax + e1x * v + e2x * w, ay + e1y * v + e2y * w, az + e1z * v + e2z * w
+
+
+def _segment_hits_tri(s, o, tris, t, epsilon):
+    # type: (_array, int, _array, int, float) -> bool
+    """Test the segment s[o:o + 3] -> s[o + 3:o + 6] against the triangle stored at tris[t:t + 9]."""
+
+    ox = s[o]
+    oy = s[o + 1]
+    oz = s[o + 2]
+    dx = s[o + 3] - ox
+    dy = s[o + 4] - oy
+    dz = s[o + 5] - oz
+    e1x = tris[t + 3]
+    e1y = tris[t + 4]
+    e1z = tris[t + 5]
+    e2x = tris[t + 6]
+    e2y = tris[t + 7]
+    e2z = tris[t + 8]
+    px = dy * e2z - dz * e2y
+    py = dz * e2x - dx * e2z
+    pz = dx * e2y - dy * e2x
+    det = e1x * px + e1y * py + e1z * pz
+
+    if -1e-12 < det < 1e-12:
+        return False
+
+    inv = 1.0 / det
+    tx = ox - tris[t]
+    ty = oy - tris[t + 1]
+    tz = oz - tris[t + 2]
+    u = (tx * px + ty * py + tz * pz) * inv
+
+    if u < -epsilon or u > 1.0 + epsilon:
+        return False
+
+    qx = ty * e1z - tz * e1y
+    qy = tz * e1x - tx * e1z
+    qz = tx * e1y - ty * e1x
+    v = (dx * qx + dy * qy + dz * qz) * inv
+
+    if v < -epsilon or u + v > 1.0 + epsilon:
+        return False
+
+    dist = (e2x * qx + e2y * qy + e2z * qz) * inv
+    return 0.0 <= dist <= 1.0
+
+
+def _tri_edges(tris, t):
+    # type: (_array, int) -> _array
+    """Return the three edges of the triangle at tris[t:t + 9] as a flat array of segment end points."""
+
+    ax = tris[t]
+    ay = tris[t + 1]
+    az = tris[t + 2]
+    bx = ax + tris[t + 3]
+    by = ay + tris[t + 4]
+    bz = az + tris[t + 5]
+    cx = ax + tris[t + 6]
+    cy = ay + tris[t + 7]
+    cz = az + tris[t + 8]
+    return _array("d", (ax, ay, az, bx, by, bz, bx, by, bz, cx, cy, cz, cx, cy, cz, ax, ay, az))
 
 
 class BVHTree:
+    """Bounding volume hierarchy over triangles, built with a binned surface area heuristic.
+
+    Triangles are stored as flat double arrays (first vertex and the two edges leaving it, 9 values per triangle) in
+    leaf order, nodes as flat bounds/child/count arrays, so queries never touch per-triangle Python objects."""
+
+    __slots__ = ("_tris", "_tri_index", "_bounds", "_child", "_count", "_epsilon")
+
+    def __init__(self, tris=None, tri_index=None, epsilon=0.0):
+        # type: (_array, _array, float) -> None
+        """Build the tree over already flattened triangles, use the From* class methods instead.
+
+        Args:
+            tris (array): 9 doubles per triangle, the three vertex coordinates.
+            tri_index (array): The polygon index each triangle reports.
+            epsilon (float): Increase the threshold for detecting overlap and raycast hits."""
+
+        self._epsilon = epsilon
+        self._build(tris if tris is not None else _array("d"), tri_index if tri_index is not None else _array("l"))
 
     @classmethod
     def FromBMesh(cls, bmesh, epsilon=0.0):
-        # type: (_BMesh, float) -> BVHTree
+        # type: (_bmesh.types.BMesh, float) -> BVHTree
         """BVH tree based on BMesh data.
 
         Args:
             bmesh (BMesh): BMesh data.
             epsilon (float): Increase the threshold for detecting overlap and raycast hits."""
 
-        pass
+        verts = list(bmesh.verts)
+        lookup = {id(v): i for i, v in enumerate(verts)}
+        polygons = [[lookup[id(v)] for v in face.verts] for face in bmesh.faces]
+        return cls.FromPolygons([v.co for v in verts], polygons, epsilon=epsilon)
 
     @classmethod
     def FromObject(cls, object, scene, deform=True, render=False, cage=False, epsilon=0.0):
-        # type: (_Object, _Scene, bool, bool, bool, float) -> BVHTree
+        # type: (_bpy.types.Object, _bpy.types.Scene, bool, bool, bool, float) -> BVHTree
         """BVH tree based on Object data.
 
         Args:
@@ -34,7 +236,10 @@ class BVHTree:
             cage (bool): Use render settings.
             epsilon (float): Increase the threshold for detecting overlap and raycast hits."""
 
-        pass
+        mesh = object.to_mesh(scene, deform, "RENDER" if render else "PREVIEW")
+        vertices = [v.co for v in mesh.vertices]
+        polygons = [tuple(p.vertices) for p in mesh.polygons]
+        return cls.FromPolygons(vertices, polygons, epsilon=epsilon)
 
     @classmethod
     def FromPolygons(cls, vertices, polygons, all_triangles=False, epsilon=0.0):
@@ -47,22 +252,380 @@ class BVHTree:
             all_triangles (bool): Use when all polygons are triangles for more efficient conversion.
             epsilon (float): Increase the threshold for detecting overlap and raycast hits."""
 
-        pass
+        co = _as_coords(vertices)
+        tris = _array("d")
+        tri_index = _array("l")
 
-    def find_nearest(origin, distance=1.84467):
-        # type: (_Vector, float) -> list[tuple[_Vector, _Vector, int, float]]
-        """Find the nearest elements to a point in the distance range.
+        for p, poly in enumerate(polygons):
+            if all_triangles:
+                fan = (poly,)
+
+            else:
+                if len(poly) < 3:
+                    continue
+
+                first = poly[0]
+                fan = [(first, poly[i], poly[i + 1]) for i in range(1, len(poly) - 1)]
+
+            for a, b, c in fan:
+                a *= 3
+                b *= 3
+                c *= 3
+                tris.extend(co[a:a + 3])
+                tris.extend(co[b:b + 3])
+                tris.extend(co[c:c + 3])
+                tri_index.append(p)
+
+        return cls(tris, tri_index, epsilon)
+
+    def _build(self, tris, tri_index):
+        # type: (_array, _array) -> None
+        count = len(tri_index)
+        epsilon = self._epsilon
+        lo_x = _array("d", bytes(8 * count))
+        lo_y = _array("d", lo_x)
+        lo_z = _array("d", lo_x)
+        hi_x = _array("d", lo_x)
+        hi_y = _array("d", lo_x)
+        hi_z = _array("d", lo_x)
+        cen = _array("d", bytes(24 * count))
+
+        for i in range(count):
+            o = i * 9
+            ax, ay, az, bx, by, bz, cx, cy, cz = tris[o:o + 9]
+            lo_x[i] = min(ax, bx, cx) - epsilon
+            lo_y[i] = min(ay, by, cy) - epsilon
+            lo_z[i] = min(az, bz, cz) - epsilon
+            hi_x[i] = max(ax, bx, cx) + epsilon
+            hi_y[i] = max(ay, by, cy) + epsilon
+            hi_z[i] = max(az, bz, cz) + epsilon
+            cen[i * 3] = (ax + bx + cx) / 3.0
+            cen[i * 3 + 1] = (ay + by + cy) / 3.0
+            cen[i * 3 + 2] = (az + bz + cz) / 3.0
+
+        bounds = _array("d")
+        child = _array("l")
+        counts = _array("l")
+        out_tris = _array("d")
+        out_index = _array("l")
+
+        def new_node():
+            bounds.extend((0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+            child.append(0)
+            counts.append(0)
+            return len(child) - 1
+
+        stack = [(new_node(), list(range(count)))] if count else []
+
+        while stack:
+            node, items = stack.pop()
+            n = len(items)
+            b = node * 6
+            bounds[b] = min([lo_x[i] for i in items])
+            bounds[b + 1] = min([lo_y[i] for i in items])
+            bounds[b + 2] = min([lo_z[i] for i in items])
+            bounds[b + 3] = max([hi_x[i] for i in items])
+            bounds[b + 4] = max([hi_y[i] for i in items])
+            bounds[b + 5] = max([hi_z[i] for i in items])
+
+            split = None if n <= _LEAF_SIZE else self._sah_split(items, n, bounds, b, cen, lo_x, lo_y, lo_z, hi_x, hi_y, hi_z)
+
+            if split is None:
+                child[node] = len(out_index)
+                counts[node] = n
+
+                for i in items:
+                    o = i * 9
+                    ax, ay, az = tris[o:o + 3]
+                    out_tris.extend((ax, ay, az, tris[o + 3] - ax, tris[o + 4] - ay, tris[o + 5] - az,
+                                     tris[o + 6] - ax, tris[o + 7] - ay, tris[o + 8] - az))
+                    out_index.append(tri_index[i])
+
+                continue
+
+            left = new_node()
+            right = new_node()
+            child[node] = left
+            stack.append((right, split[1]))
+            stack.append((left, split[0]))
+
+        self._tris = out_tris
+        self._tri_index = out_index
+        self._bounds = bounds
+        self._child = child
+        self._count = counts
+
+    def _sah_split(self, items, n, bounds, b, cen, lo_x, lo_y, lo_z, hi_x, hi_y, hi_z):
+        # type: (...) -> tuple[list, list]
+        """Return the (left, right) item lists of the cheapest binned SAH split, or None to make a leaf."""
+
+        parent_area = _box_area(*bounds[b:b + 6])
+        best_cost = _INF
+        best = None
+
+        for axis in range(3):
+            cmin = min([cen[i * 3 + axis] for i in items])
+            cmax = max([cen[i * 3 + axis] for i in items])
+
+            if cmax - cmin <= 1e-12:
+                continue
+
+            # Slightly under _SAH_BINS so the largest centroid still lands in the last bin.
+            scale = (_SAH_BINS - 1e-6) / (cmax - cmin)
+            bins = [int((cen[i * 3 + axis] - cmin) * scale) for i in items]
+            members = [[] for _ in range(_SAH_BINS)]
+
+            for k, i in zip(bins, items):
+                members[k].append(i)
+
+            # Only non-empty bins can bound a split plane, the last one never does.
+            used = [k for k in range(_SAH_BINS) if members[k]]
+            boxes = [(min([lo_x[i] for i in members[k]]), min([lo_y[i] for i in members[k]]),
+                      min([lo_z[i] for i in members[k]]), max([hi_x[i] for i in members[k]]),
+                      max([hi_y[i] for i in members[k]]), max([hi_z[i] for i in members[k]])) for k in used]
+            left_areas = _prefix_areas(boxes)
+            right_areas = _prefix_areas(boxes[::-1])[::-1]
+            total = 0
+
+            for j in range(len(used) - 1):
+                total += len(members[used[j]])
+                cost = left_areas[j] * total + right_areas[j + 1] * (n - total)
+
+                if cost < best_cost:
+                    best_cost = cost
+                    best = (axis, used[j], bins)
+
+        if best is None:
+            # Every centroid coincides, split the list in half so oversized leaves can't happen.
+            if n <= _MAX_LEAF_SIZE:
+                return None
+
+            half = n >> 1
+            return items[:half], items[half:]
+
+        leaf_cost = n * parent_area
+
+        if n <= _MAX_LEAF_SIZE and _TRAVERSAL_COST * parent_area + best_cost >= leaf_cost:
+            return None
+
+        axis, k, bins = best
+        left = [i for i, bk in zip(items, bins) if bk <= k]
+        right = [i for i, bk in zip(items, bins) if bk > k]
+        return left, right
+
+    def _ray(self, ox, oy, oz, dx, dy, dz, max_dist):
+        # type: (float, float, float, float, float, float, float) -> tuple[int, float]
+        """Return (triangle slot, distance) of the closest hit along a normalized ray, slot is -1 on a miss."""
+
+        bounds = self._bounds
+        child = self._child
+        counts = self._count
+        tris = self._tris
+        epsilon = self._epsilon
+
+        if not len(counts):
+            return -1, _INF
+
+        ix = 1.0 / dx if dx else _INF
+        iy = 1.0 / dy if dy else _INF
+        iz = 1.0 / dz if dz else _INF
+        best = -1
+        best_t = max_dist
+        stack = [0]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node = pop()
+            b = node * 6
+
+            # Slab test, written so a zero direction component with an origin inside the slab never produces NaN.
+            if ix == _INF:
+                if ox < bounds[b] or ox > bounds[b + 3]:
+                    continue
+                tmin = -_INF
+                tmax = _INF
+            else:
+                t0 = (bounds[b] - ox) * ix
+                t1 = (bounds[b + 3] - ox) * ix
+                tmin, tmax = (t0, t1) if t0 < t1 else (t1, t0)
+
+            if iy == _INF:
+                if oy < bounds[b + 1] or oy > bounds[b + 4]:
+                    continue
+            else:
+                t0 = (bounds[b + 1] - oy) * iy
+                t1 = (bounds[b + 4] - oy) * iy
+                if t0 > t1:
+                    t0, t1 = t1, t0
+                if t0 > tmin:
+                    tmin = t0
+                if t1 < tmax:
+                    tmax = t1
+
+            if iz == _INF:
+                if oz < bounds[b + 2] or oz > bounds[b + 5]:
+                    continue
+            else:
+                t0 = (bounds[b + 2] - oz) * iz
+                t1 = (bounds[b + 5] - oz) * iz
+                if t0 > t1:
+                    t0, t1 = t1, t0
+                if t0 > tmin:
+                    tmin = t0
+                if t1 < tmax:
+                    tmax = t1
+
+            if tmin > tmax or tmax < 0.0 or tmin > best_t:
+                continue
+
+            count = counts[node]
+
+            if not count:
+                first = child[node]
+                push(first + 1)
+                push(first)
+                continue
+
+            start = child[node]
+
+            for slot in range(start, start + count):
+                t = slot * 9
+                e1x = tris[t + 3]
+                e1y = tris[t + 4]
+                e1z = tris[t + 5]
+                e2x = tris[t + 6]
+                e2y = tris[t + 7]
+                e2z = tris[t + 8]
+                px = dy * e2z - dz * e2y
+                py = dz * e2x - dx * e2z
+                pz = dx * e2y - dy * e2x
+                det = e1x * px + e1y * py + e1z * pz
+
+                if -1e-12 < det < 1e-12:
+                    continue
+
+                inv = 1.0 / det
+                tx = ox - tris[t]
+                ty = oy - tris[t + 1]
+                tz = oz - tris[t + 2]
+                u = (tx * px + ty * py + tz * pz) * inv
+
+                if u < -epsilon or u > 1.0 + epsilon:
+                    continue
+
+                qx = ty * e1z - tz * e1y
+                qy = tz * e1x - tx * e1z
+                qz = tx * e1y - ty * e1x
+                v = (dx * qx + dy * qy + dz * qz) * inv
+
+                if v < -epsilon or u + v > 1.0 + epsilon:
+                    continue
+
+                dist = (e2x * qx + e2y * qy + e2z * qz) * inv
+
+                if 0.0 <= dist < best_t:
+                    best = slot
+                    best_t = dist
+
+        return best, best_t
+
+    def _nearest(self, px, py, pz, max_dist_sq, collect=None):
+        # type: (float, float, float, float, list) -> tuple[int, float, tuple]
+        """Return (triangle slot, squared distance, closest point) of the nearest triangle within max_dist_sq.
+
+        When collect is a list every triangle within range is appended to it as (squared distance, slot, point)
+        instead of only tracking the nearest one."""
+
+        bounds = self._bounds
+        child = self._child
+        counts = self._count
+        tris = self._tris
+        best = -1
+        best_d = max_dist_sq
+        best_co = None
+
+        if not len(counts):
+            return best, _INF, best_co
+
+        stack = [0]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node = pop()
+            b = node * 6
+            dx = bounds[b] - px if px < bounds[b] else px - bounds[b + 3] if px > bounds[b + 3] else 0.0
+            dy = bounds[b + 1] - py if py < bounds[b + 1] else py - bounds[b + 4] if py > bounds[b + 4] else 0.0
+            dz = bounds[b + 2] - pz if pz < bounds[b + 2] else pz - bounds[b + 5] if pz > bounds[b + 5] else 0.0
+
+            if dx * dx + dy * dy + dz * dz > best_d:
+                continue
+
+            count = counts[node]
+
+            if not count:
+                first = child[node]
+                push(first + 1)
+                push(first)
+                continue
+
+            start = child[node]
+
+            for slot in range(start, start + count):
+                co = _closest_on_tri(px, py, pz, *tris[slot * 9:slot * 9 + 9])
+                cx = co[0] - px
+                cy = co[1] - py
+                cz = co[2] - pz
+                d = cx * cx + cy * cy + cz * cz
+
+                if d <= best_d:
+                    if collect is not None:
+                        collect.append((d, slot, co))
+
+                    else:
+                        best = slot
+                        best_d = d
+                        best_co = co
+
+        return best, best_d, best_co
+
+    def _normal(self, slot):
+        # type: (int) -> _Vector
+        t = slot * 9
+        e1x, e1y, e1z, e2x, e2y, e2z = self._tris[t + 3:t + 9]
+        nx = e1y * e2z - e1z * e2y
+        ny = e1z * e2x - e1x * e2z
+        nz = e1x * e2y - e1y * e2x
+        length = (nx * nx + ny * ny + nz * nz) ** 0.5
+
+        if length:
+            nx /= length
+            ny /= length
+            nz /= length
+
+        return _Vector((nx, ny, nz))
+
+    def find_nearest(self, origin, distance=_FLT_MAX):
+        # type: (_Vector, float) -> tuple[_Vector, _Vector, int, float]
+        """Find the nearest element to a point.
 
         Args:
-            co (Vector): Find nearest elements to this point.
+            origin (Vector): Find nearest element to this point.
             distance (float): Maximum distance threshold.
 
         Returns:
-            list: Returns a list of tuples (Vector location, Vector normal, int index, float distance)"""
+            tuple: Returns a tuple (Vector location, Vector normal, int index, float distance), Values will all be None if no hit is found."""
+
+        x, y, z = origin
+        slot, dist_sq, co = self._nearest(x, y, z, distance * distance if distance < _FLT_MAX else _INF)
+
+        if slot < 0:
+            return None, None, None, None
 
-        pass
+        return _Vector(co), self._normal(slot), self._tri_index[slot], dist_sq ** 0.5
 
-    def find_nearest_range(origin, distance=1.84467):
+    def find_nearest_range(self, origin, distance=_FLT_MAX):
         # type: (_Vector, float) -> list[tuple[_Vector, _Vector, int, float]]
         """Find the nearest elements to a point in the distance range.
 
@@ -73,30 +636,202 @@ class BVHTree:
         Returns:
             list: Returns a list of tuples (Vector location, Vector normal, int index, float distance)"""
 
-        pass
+        x, y, z = origin
+        found = []
+        self._nearest(x, y, z, distance * distance if distance < _FLT_MAX else _INF, found)
+        found.sort()
+        tri_index = self._tri_index
+        seen = set()
+        result = []
+
+        # Polygons split into several triangles are only reported once, at their nearest triangle.
+        for dist_sq, slot, co in found:
+            index = tri_index[slot]
+
+            if index not in seen:
+                seen.add(index)
+                result.append((_Vector(co), self._normal(slot), index, dist_sq ** 0.5))
 
-    def overlap(other_tree):
-        # type: (BVHTree) -> list[int, int]
+        return result
+
+    def overlap(self, other_tree):
+        # type: (BVHTree) -> list[tuple[int, int]]
         """Find overlapping indices between 2 trees.
 
         Args:
             other_tree (BVHTree): Other tree to preform overlap test on.
 
         Returns:
-            list: Returns a list of unique index pairs, the first index referencing this tree, the second referencing the other_tree."""
+            list: Returns a list of unique index pairs, the first index referencing this tree, the second referencing the other_tree.
+
+        Note:
+            Coplanar triangles are only reported when an edge of one crosses the other within the epsilon."""
+
+        a_bounds = self._bounds
+        a_child = self._child
+        a_counts = self._count
+        a_tris = self._tris
+        b_bounds = other_tree._bounds
+        b_child = other_tree._child
+        b_counts = other_tree._count
+        b_tris = other_tree._tris
+        epsilon = max(self._epsilon, other_tree._epsilon)
+        pairs = set()
+
+        if not len(a_counts) or not len(b_counts):
+            return []
+
+        stack = [(0, 0)]
+        edges_cache = {}
+
+        while stack:
+            na, nb = stack.pop()
+            a = na * 6
+            b = nb * 6
+
+            if (a_bounds[a] > b_bounds[b + 3] or b_bounds[b] > a_bounds[a + 3] or
+                    a_bounds[a + 1] > b_bounds[b + 4] or b_bounds[b + 1] > a_bounds[a + 4] or
+                    a_bounds[a + 2] > b_bounds[b + 5] or b_bounds[b + 2] > a_bounds[a + 5]):
+                continue
+
+            count_a = a_counts[na]
+            count_b = b_counts[nb]
+
+            if not count_a and (count_b or _box_area(*a_bounds[a:a + 6]) >= _box_area(*b_bounds[b:b + 6])):
+                first = a_child[na]
+                stack.append((first, nb))
+                stack.append((first + 1, nb))
+                continue
+
+            if not count_b:
+                first = b_child[nb]
+                stack.append((na, first))
+                stack.append((na, first + 1))
+                continue
+
+            for sa in range(a_child[na], a_child[na] + count_a):
+                ta = sa * 9
+                ia = self._tri_index[sa]
+                edges_a = _tri_edges(a_tris, ta)
+
+                for sb in range(b_child[nb], b_child[nb] + count_b):
+                    ib = other_tree._tri_index[sb]
+
+                    if (ia, ib) in pairs:
+                        continue
+
+                    tb = sb * 9
+                    edges_b = edges_cache.get(sb)
+
+                    if edges_b is None:
+                        edges_b = edges_cache[sb] = _tri_edges(b_tris, tb)
 
-        pass
+                    if (_segment_hits_tri(edges_a, 0, b_tris, tb, epsilon) or
+                            _segment_hits_tri(edges_a, 6, b_tris, tb, epsilon) or
+                            _segment_hits_tri(edges_a, 12, b_tris, tb, epsilon) or
+                            _segment_hits_tri(edges_b, 0, a_tris, ta, epsilon) or
+                            _segment_hits_tri(edges_b, 6, a_tris, ta, epsilon) or
+                            _segment_hits_tri(edges_b, 12, a_tris, ta, epsilon)):
+                        pairs.add((ia, ib))
 
-    def ray_cast(origin, direction, distance):
+        return sorted(pairs)
+
+    def ray_cast(self, origin, direction, distance=_FLT_MAX):
         # type: (_Vector, _Vector, float) -> tuple[_Vector, _Vector, int, float]
         """Cast a ray onto the mesh.
 
         Args:
-            co (Vector): Start location of the ray in object space.
+            origin (Vector): Start location of the ray in object space.
             direction (Vector): Direction of the ray in object space.
             distance (float): Maximum distance threshold.
 
         Returns:
             tuple: Returns a tuple (Vector location, Vector normal, int index, float distance), Values will all be None if no hit is found."""
 
-        pass
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        length = (dx * dx + dy * dy + dz * dz) ** 0.5
+
+        if not length:
+            return None, None, None, None
+
+        dx /= length
+        dy /= length
+        dz /= length
+        slot, dist = self._ray(ox, oy, oz, dx, dy, dz, distance)
+
+        if slot < 0:
+            return None, None, None, None
+
+        location = _Vector((ox + dx * dist, oy + dy * dist, oz + dz * dist))
+        return location, self._normal(slot), self._tri_index[slot], dist
+
+    def ray_cast_many(self, origins, directions, distance=_FLT_MAX):
+        # type: (_Sequence, _Sequence, float) -> tuple[_array, _array, _array, _array]
+        """Cast a ray onto the mesh for each of many origins and directions.
+
+        Args:
+            origins (float triplet sequence): Start locations of the rays, a sequence of triplets or a flat float buffer.
+            directions (float triplet sequence): Directions of the rays, same layout and length as origins.
+            distance (float): Maximum distance threshold, shared by all rays.
+
+        Returns:
+            tuple: (locations, normals, indices, distances) arrays, locations and normals hold 3 floats per ray.
+            Rays that miss get index -1, distance inf and zeroed location and normal.
+
+        Note:
+            A convenience wrapper: the rays are cast one after the other like ray_cast(), only the Vectors and the tuple
+            of each result aren't built."""
+
+        o_flat = _as_coords(origins)
+        d_flat = _as_coords(directions)
+
+        if len(o_flat) != len(d_flat):
+            raise ValueError("origins and directions must have the same length")
+
+        count = len(o_flat) // 3
+        locations = _array("d", bytes(24 * count))
+        normals = _array("d", bytes(24 * count))
+        indices = _array("l", [-1]) * count
+        distances = _array("d", [_INF]) * count
+        tri_index = self._tri_index
+        tris = self._tris
+        ray = self._ray
+
+        for r in range(count):
+            o = r * 3
+            ox = o_flat[o]
+            oy = o_flat[o + 1]
+            oz = o_flat[o + 2]
+            dx = d_flat[o]
+            dy = d_flat[o + 1]
+            dz = d_flat[o + 2]
+            length = (dx * dx + dy * dy + dz * dz) ** 0.5
+
+            if not length:
+                continue
+
+            dx /= length
+            dy /= length
+            dz /= length
+            slot, dist = ray(ox, oy, oz, dx, dy, dz, distance)
+
+            if slot < 0:
+                continue
+
+            indices[r] = tri_index[slot]
+            distances[r] = dist
+            locations[o] = ox + dx * dist
+            locations[o + 1] = oy + dy * dist
+            locations[o + 2] = oz + dz * dist
+            t = slot * 9
+            e1x, e1y, e1z, e2x, e2y, e2z = tris[t + 3:t + 9]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            n_len = (nx * nx + ny * ny + nz * nz) ** 0.5 or 1.0
+            normals[o] = nx / n_len
+            normals[o + 1] = ny / n_len
+            normals[o + 2] = nz / n_len
+
+        return locations, normals, indices, distances
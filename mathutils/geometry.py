@@ -2,6 +2,282 @@
 
 The Blender geometry module"""
 
+from . import Vector as _Vector
+from ._buffer import as_coords as _as_coords
+from ._polyfill import triangulate as _triangulate
+from array import array as _array
+from itertools import chain as _chain, repeat as _repeat
+from math import atan2 as _atan2, hypot as _hypot, sqrt as _sqrt
+
+_RAY_EPSILON = 0.000001
+"""Determinant below which a ray is considered parallel to a triangle."""
+
+_PLANE_EPSILON = 1.1920928955078125e-07
+"""Dot product below which a line is considered parallel to a plane (single precision FLT_EPSILON)."""
+
+_MISS = (0.0, 0.0, 0.0)
+
+def _xyz(value, name):
+	"""Three floats of a 2D or 3D vector, 2D vectors get a zero z."""
+	
+	values = [float(v) for v in value]
+	
+	if len(values) == 2:
+		values.append(0.0)
+	
+	elif len(values) != 3:
+		raise ValueError("%s: expected a 2D or 3D vector" % name)
+	
+	return values
+	
+def _is_vector(value):
+	"""Whether an argument of a batch function is a single vector rather than an (N, 3) array of them."""
+	
+	if isinstance(value, _Vector):
+		return True
+	
+	if isinstance(value, (_array, memoryview)) or hasattr(value, "buffer"):
+		return False
+	
+	return len(value) in (2, 3) and isinstance(value[0], (int, float))
+	
+def _batch_columns(name, *values):
+	"""Count and x, y, z columns of each argument of a batch function.
+	
+	Arguments are (N, 3) arrays (sequences of triplets, flat float buffers or VectorArray's) sharing the same N, or
+	single vectors used for every item."""
+	
+	flats = [None if _is_vector(value) else _as_coords(value) for value in values]
+	counts = set(len(flat) // 3 for flat in flats if flat is not None)
+	
+	if len(counts) > 1:
+		raise ValueError("%s: arrays must have the same length" % name)
+	
+	count = counts.pop() if counts else 1
+	columns = []
+	
+	for value, flat in zip(values, flats):
+		if flat is None:
+			columns.extend(_repeat(v, count) for v in _xyz(value, name))
+		
+		else:
+			columns.extend((flat[0::3], flat[1::3], flat[2::3]))
+	
+	return count, columns
+	
+def _scalar_column(value, count):
+	"""Column of a per item float argument, a single float is used for every item."""
+	
+	if isinstance(value, (int, float)):
+		return _repeat(float(value), count)
+	
+	column = _array("d", value)
+	
+	if len(column) != count:
+		raise ValueError("Expected %d values, one per item" % count)
+	
+	return column
+	
+def _gather(results):
+	"""Flat locations and hit flags of per item kernel results, misses (None) get a zeroed location."""
+	
+	results = list(results)
+	locations = _array("d", _chain.from_iterable([co or _MISS for co in results]))
+	hits = _array("b", [co is not None for co in results])
+	return locations, hits
+	
+def _convex_hull(points):
+	"""Indices of the convex hull of (x, y) points, counter-clockwise from the lowest x, without collinear points."""
+	
+	order = sorted(range(len(points)), key=points.__getitem__)
+	
+	if len(order) < 3:
+		return order if len(order) < 2 or points[order[0]] != points[order[1]] else order[:1]
+	
+	def chain(indices):
+		hull = []
+		
+		for i in indices:
+			px, py = points[i]
+			
+			while len(hull) > 1:
+				ax, ay = points[hull[-2]]
+				bx, by = points[hull[-1]]
+				
+				if (bx - ax) * (py - ay) - (by - ay) * (px - ax) > 0.0:
+					break
+				
+				hull.pop()
+			
+			hull.append(i)
+		
+		return hull
+	
+	lower = chain(order)
+	upper = chain(reversed(order))
+	return lower[:-1] + upper[:-1]
+	
+def _point_in_ring(x, y, ring):
+	"""Even-odd test of a point against a ring of (x, y, index) items."""
+	
+	inside = False
+	jx, jy = ring[-1][0], ring[-1][1]
+	
+	for ix, iy, _ in ring:
+		if (iy > y) != (jy > y) and x < (jx - ix) * (y - iy) / (jy - iy) + ix:
+			inside = not inside
+		
+		jx, jy = ix, iy
+	
+	return inside
+	
+def _ring_area(ring):
+	area = 0.0
+	jx, jy = ring[-1][0], ring[-1][1]
+	
+	for ix, iy, _ in ring:
+		area += (jx - ix) * (jy + iy)
+		jx, jy = ix, iy
+	
+	return abs(area) * 0.5
+	
+def _area_tri(ax, ay, az, bx, by, bz, cx, cy, cz):
+	e1x = bx - ax
+	e1y = by - ay
+	e1z = bz - az
+	e2x = cx - ax
+	e2y = cy - ay
+	e2z = cz - az
+	nx = e1y * e2z - e1z * e2y
+	ny = e1z * e2x - e1x * e2z
+	nz = e1x * e2y - e1y * e2x
+	return 0.5 * _sqrt(nx * nx + ny * ny + nz * nz)
+	
+def _distance_point_to_plane(px, py, pz, cx, cy, cz, nx, ny, nz):
+	length = _sqrt(nx * nx + ny * ny + nz * nz)
+	
+	if not length:
+		return 0.0
+	
+	return ((px - cx) * nx + (py - cy) * ny + (pz - cz) * nz) / length
+	
+def _intersect_line_plane(ax, ay, az, bx, by, bz, cx, cy, cz, nx, ny, nz):
+	ux = bx - ax
+	uy = by - ay
+	uz = bz - az
+	dot = nx * ux + ny * uy + nz * uz
+	
+	if abs(dot) <= _PLANE_EPSILON:
+		return None
+	
+	fac = -(nx * (ax - cx) + ny * (ay - cy) + nz * (az - cz)) / dot
+	return ax + ux * fac, ay + uy * fac, az + uz * fac
+	
+def _intersect_line_sphere(ax, ay, az, bx, by, bz, cx, cy, cz, radius, clip):
+	dx = bx - ax
+	dy = by - ay
+	dz = bz - az
+	a = dx * dx + dy * dy + dz * dz
+	
+	if not a:
+		return None, None
+	
+	ox = ax - cx
+	oy = ay - cy
+	oz = az - cz
+	b = 2.0 * (dx * ox + dy * oy + dz * oz)
+	c = ox * ox + oy * oy + oz * oz - radius * radius
+	discriminant = b * b - 4.0 * a * c
+	
+	if discriminant < 0.0:
+		return None, None
+	
+	if not discriminant:
+		factors = (-b / (2.0 * a), None)
+	
+	else:
+		root = _sqrt(discriminant)
+		factors = ((-b + root) / (2.0 * a), (-b - root) / (2.0 * a))
+	
+	return tuple(None if mu is None or (clip and not 0.0 <= mu <= 1.0) else (ax + dx * mu, ay + dy * mu, az + dz * mu)
+		for mu in factors)
+	
+def _intersect_point_tri(px, py, pz, ax, ay, az, bx, by, bz, cx, cy, cz):
+	e1x = bx - ax
+	e1y = by - ay
+	e1z = bz - az
+	e2x = cx - ax
+	e2y = cy - ay
+	e2z = cz - az
+	nx = e1y * e2z - e1z * e2y
+	ny = e1z * e2x - e1x * e2z
+	nz = e1x * e2y - e1y * e2x
+	n_sq = nx * nx + ny * ny + nz * nz
+	
+	if not n_sq:
+		return None
+	
+	# The point must be on the inner side of the three planes through the edges, perpendicular to the triangle
+	for sx, sy, sz, ex, ey, ez in ((ax, ay, az, e1x, e1y, e1z), (bx, by, bz, cx - bx, cy - by, cz - bz),
+			(cx, cy, cz, -e2x, -e2y, -e2z)):
+		wx = px - sx
+		wy = py - sy
+		wz = pz - sz
+		
+		if (ey * wz - ez * wy) * nx + (ez * wx - ex * wz) * ny + (ex * wy - ey * wx) * nz < 0.0:
+			return None
+	
+	fac = ((px - ax) * nx + (py - ay) * ny + (pz - az) * nz) / n_sq
+	return px - nx * fac, py - ny * fac, pz - nz * fac
+	
+def _intersect_ray_tri(ax, ay, az, bx, by, bz, cx, cy, cz, dx, dy, dz, ox, oy, oz, clip):
+	length = _sqrt(dx * dx + dy * dy + dz * dz)
+	
+	if not length:
+		return None
+	
+	dx /= length
+	dy /= length
+	dz /= length
+	e1x = bx - ax
+	e1y = by - ay
+	e1z = bz - az
+	e2x = cx - ax
+	e2y = cy - ay
+	e2z = cz - az
+	px = dy * e2z - dz * e2y
+	py = dz * e2x - dx * e2z
+	pz = dx * e2y - dy * e2x
+	det = e1x * px + e1y * py + e1z * pz
+	
+	if -_RAY_EPSILON < det < _RAY_EPSILON:
+		return None
+	
+	inv_det = 1.0 / det
+	tx = ox - ax
+	ty = oy - ay
+	tz = oz - az
+	u = (tx * px + ty * py + tz * pz) * inv_det
+	
+	if clip and (u < 0.0 or u > 1.0):
+		return None
+	
+	qx = ty * e1z - tz * e1y
+	qy = tz * e1x - tx * e1z
+	qz = tx * e1y - ty * e1x
+	v = (dx * qx + dy * qy + dz * qz) * inv_det
+	
+	if clip and (v < 0.0 or u + v > 1.0):
+		return None
+	
+	t = (e2x * qx + e2y * qy + e2z * qz) * inv_det
+	
+	# Like isect_ray_tri_v3 the triangles behind the origin are missed, clipped or not
+	if t < 0.0:
+		return None
+	
+	return ox + dx * t, oy + dy * t, oz + dz * t
+	
 def area_tri(v1, v2, v3):
 	"""Returns the area size of the 2D or 3D triangle defined.
 
@@ -12,7 +288,34 @@ def area_tri(v1, v2, v3):
 	
 	Return type: float"""
 	
-	return 1.0
+	a = [float(v) for v in v1]
+	b = [float(v) for v in v2]
+	c = [float(v) for v in v3]
+	
+	if not len(a) == len(b) == len(c) or len(a) not in (2, 3):
+		raise ValueError("area_tri: vectors must be of the same size, 2D or 3D")
+	
+	if len(a) == 2:
+		return 0.5 * abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1]))
+	
+	return _area_tri(*a, *b, *c)
+	
+def area_tri_many(v1, v2, v3):
+	"""Returns the area size of many 3D triangles in a single call.
+
+	Parameters:
+	v1 (float triplet sequence) - First points of the triangles, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	v2 (float triplet sequence) - Second points of the triangles, same layout and length as v1
+	v3 (float triplet sequence) - Third points of the triangles, same layout and length as v1
+	
+	Single vectors are accepted for any argument and used for every triangle.
+	
+	Returns: one area per triangle
+	
+	Return type: array of floats"""
+	
+	count, columns = _batch_columns("area_tri_many", v1, v2, v3)
+	return _array("d", map(_area_tri, *columns))
 	
 def barycentric_transform(point, tri_a1, tri_a2, tri_a3, tri_b1, tri_b2, tri_b3):
 	"""Return a transformed point, the transformation is defined by 2 triangles.
@@ -43,10 +346,64 @@ def box_fit_2d(points):
 	
 	Return type: float"""
 	
-	return 1.0
+	xy = [(float(p[0]), float(p[1])) for p in points]
+	hull = [xy[i] for i in _convex_hull(xy)]
+	best_area = float("inf")
+	best = None
+	count = len(hull)
+	
+	if count < 3:
+		# Degenerate hull, align its only edge if any
+		if count == 2:
+			best = (hull[1][0] - hull[0][0], hull[1][1] - hull[0][1])
+		
+		return _atan2(best[0], best[1]) if best is not None else 0.0
+	
+	# Rotating calipers: the extreme points along and across each edge only move forward around the hull
+	right = top = left = 0
+	
+	for i in range(count):
+		ax, ay = hull[i]
+		bx, by = hull[(i + 1) % count]
+		ux = bx - ax
+		uy = by - ay
+		length = _hypot(ux, uy)
+		
+		if not length:
+			continue
+		
+		ux /= length
+		uy /= length
+		
+		if not i:
+			right = max(range(count), key=lambda j: hull[j][0] * ux + hull[j][1] * uy)
+			top = max(range(count), key=lambda j: hull[j][1] * ux - hull[j][0] * uy)
+			left = min(range(count), key=lambda j: hull[j][0] * ux + hull[j][1] * uy)
+		
+		else:
+			while (hull[(right + 1) % count][0] * ux + hull[(right + 1) % count][1] * uy >
+					hull[right][0] * ux + hull[right][1] * uy):
+				right = (right + 1) % count
+			
+			while (hull[(top + 1) % count][1] * ux - hull[(top + 1) % count][0] * uy >
+					hull[top][1] * ux - hull[top][0] * uy):
+				top = (top + 1) % count
+			
+			while (hull[(left + 1) % count][0] * ux + hull[(left + 1) % count][1] * uy <
+					hull[left][0] * ux + hull[left][1] * uy):
+				left = (left + 1) % count
+		
+		width = (hull[right][0] - hull[left][0]) * ux + (hull[right][1] - hull[left][1]) * uy
+		height = (hull[top][1] - ay) * ux - (hull[top][0] - ax) * uy
+		
+		if width * height < best_area:
+			best_area = width * height
+			best = (ux, uy)
+	
+	return _atan2(best[0], best[1]) if best is not None else 0.0
 	
 def box_pack_2d(boxes):
-	"""Returns the normal of the 3D tri or quad.
+	"""Packs boxes without overlap, writing their new location into their first two items (skyline bottom-left packing).
 
 	Parameters:
 	boxes (list) - list of boxes, each box is a list where the first 4 items are [x, y, width, height, …] other items are ignored.
@@ -55,7 +412,69 @@ def box_pack_2d(boxes):
 	
 	Return type: tuple, pair of floats"""
 	
-	return (1.0, 1.0)
+	if not boxes:
+		return (0.0, 0.0)
+	
+	sizes = [(float(box[2]), float(box[3])) for box in boxes]
+	area = sum(w * h for w, h in sizes)
+	bin_width = max(max(w for w, _ in sizes), _sqrt(area) * 1.05)
+	
+	# Skyline as [x, y, width] segments covering [0, bin_width], tallest boxes first
+	skyline = [[0.0, 0.0, bin_width]]
+	packed_width = packed_height = 0.0
+	
+	for index in sorted(range(len(boxes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+		w, h = sizes[index]
+		best_y = best_x = float("inf")
+		best = 0
+		
+		for s in range(len(skyline)):
+			x = skyline[s][0]
+			
+			if x + w > bin_width:
+				break
+			
+			# Rest on the highest segment under the box span
+			y = 0.0
+			end = x + w
+			t = s
+			
+			while t < len(skyline) and (skyline[t][0] < end or t == s):
+				y = max(y, skyline[t][1])
+				t += 1
+			
+			if y < best_y or (y == best_y and x < best_x):
+				best_y, best_x, best = y, x, s
+		
+		boxes[index][0] = best_x
+		boxes[index][1] = best_y
+		packed_width = max(packed_width, best_x + w)
+		packed_height = max(packed_height, best_y + h)
+		
+		if not w:
+			continue
+		
+		# Replace the covered part of the skyline with the top of the box
+		end = best_x + w
+		t = best
+		
+		while t < len(skyline) and skyline[t][0] < end:
+			t += 1
+		
+		last = skyline[t - 1]
+		tail = [[end, last[1], last[0] + last[2] - end]] if last[0] + last[2] > end else []
+		skyline[best:t] = [[best_x, best_y + h, w]] + tail
+		s = max(best - 1, 0)
+		
+		while s < min(best + 1, len(skyline) - 1):
+			if skyline[s][1] == skyline[s + 1][1]:
+				skyline[s][2] += skyline[s + 1][2]
+				del skyline[s + 1]
+			
+			else:
+				s += 1
+	
+	return (packed_width, packed_height)
 	
 def convex_hull_2d(points):
 	"""Returns a list of indices into the list given
@@ -67,7 +486,7 @@ def convex_hull_2d(points):
 	
 	Return type: list of ints"""
 	
-	return [1, 1]
+	return _convex_hull([(float(p[0]), float(p[1])) for p in points])
 	
 def distance_point_to_plane(pt, plane_co, plane_no):
 	"""Returns the signed distance between a point and a plane (negative when below the normal).
@@ -79,7 +498,22 @@ def distance_point_to_plane(pt, plane_co, plane_no):
 	
 	Return type: float"""
 	
-	return 1.0
+	return _distance_point_to_plane(*_xyz(pt, "pt"), *_xyz(plane_co, "plane_co"), *_xyz(plane_no, "plane_no"))
+	
+def distance_point_to_plane_many(pts, plane_co, plane_no):
+	"""Returns the signed distances between many points and planes in a single call.
+
+	Parameters:
+	pts (float triplet sequence) - Points, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	plane_co (float triplet sequence) - A point on each plane, or a single mathutils.Vector shared by all points
+	plane_no (float triplet sequence) - The direction each plane is facing, or a single mathutils.Vector shared by all points
+	
+	Returns: one signed distance per point
+	
+	Return type: array of floats"""
+	
+	count, columns = _batch_columns("distance_point_to_plane_many", pts, plane_co, plane_no)
+	return _array("d", map(_distance_point_to_plane, *columns))
 	
 def interpolate_bezier(knot1, handle1, handle2, knot2, resolution):
 	"""Interpolate a bezier spline segment.
@@ -129,8 +563,25 @@ def intersect_line_plane(line_a, line_b, plane_co, plane_no, no_flip=False):
 
 	Return type: mathutils.Vector or None"""
 	
-	from . import Vector
-	return Vector
+	co = _intersect_line_plane(*_xyz(line_a, "line_a"), *_xyz(line_b, "line_b"), *_xyz(plane_co, "plane_co"),
+		*_xyz(plane_no, "plane_no"))
+	return None if co is None else _Vector(co)
+	
+def intersect_line_plane_many(line_a, line_b, plane_co, plane_no):
+	"""Calculate the intersections between many lines and planes in a single call.
+
+	Parameters:
+	line_a (float triplet sequence) - First points of the lines, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	line_b (float triplet sequence) - Second points of the lines, same layout and length as line_a
+	plane_co (float triplet sequence) - A point on each plane, or a single mathutils.Vector shared by all lines
+	plane_no (float triplet sequence) - The direction each plane is facing, or a single mathutils.Vector shared by all lines
+	
+	Returns: (locations, hits), 3 floats per line and 1 when the line intersects its plane, 0 (and a zeroed location) otherwise
+	
+	Return type: tuple pair of arrays"""
+	
+	count, columns = _batch_columns("intersect_line_plane_many", line_a, line_b, plane_co, plane_no)
+	return _gather(map(_intersect_line_plane, *columns))
 	
 def intersect_line_sphere(line_a, line_b, sphere_co, sphere_radius, clip=True):
 	"""Takes a line (as 2 points) and a sphere (as a point and a radius) and returns the intersection
@@ -145,8 +596,27 @@ def intersect_line_sphere(line_a, line_b, sphere_co, sphere_radius, clip=True):
 
 	Return type: A tuple pair containing mathutils.Vector or None"""
 	
-	from . import Vector
-	return (Vector, Vector)
+	points = _intersect_line_sphere(*_xyz(line_a, "line_a"), *_xyz(line_b, "line_b"), *_xyz(sphere_co, "sphere_co"),
+		float(sphere_radius), clip)
+	return tuple(None if co is None else _Vector(co) for co in points)
+	
+def intersect_line_sphere_many(line_a, line_b, sphere_co, sphere_radius, clip=True):
+	"""Intersect many lines with spheres in a single call.
+
+	Parameters:
+	line_a (float triplet sequence) - First points of the lines, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	line_b (float triplet sequence) - Second points of the lines, same layout and length as line_a
+	sphere_co (float triplet sequence) - The center of each sphere, or a single mathutils.Vector shared by all lines
+	sphere_radius (float or float sequence) - Radius of each sphere, or a single radius shared by all lines
+	clip (boolean) - Only return the intersections between the line points
+	
+	Returns: (first_locations, first_hits, second_locations, second_hits), the two intersections of each line as returned by intersect_line_sphere, with hit flags of 0 and zeroed locations in place of None
+	
+	Return type: tuple of 4 arrays"""
+	
+	count, columns = _batch_columns("intersect_line_sphere_many", line_a, line_b, sphere_co)
+	points = list(map(_intersect_line_sphere, *columns, _scalar_column(sphere_radius, count), _repeat(clip, count)))
+	return _gather([pair[0] for pair in points]) + _gather([pair[1] for pair in points])
 	
 def intersect_line_sphere_2d(line_a, line_b, sphere_co, sphere_radius, clip=True):
 	"""Takes a line (as 2 points) and a sphere (as a point and a radius) and returns the intersection
@@ -220,8 +690,24 @@ def intersect_point_tri(pt, tri_p1, tri_p2, tri_p3):
 
 	Return type: mathutils.Vector or None"""
 	
-	from . import Vector
-	return Vector
+	co = _intersect_point_tri(*_xyz(pt, "pt"), *_xyz(tri_p1, "tri_p1"), *_xyz(tri_p2, "tri_p2"), *_xyz(tri_p3, "tri_p3"))
+	return None if co is None else _Vector(co)
+	
+def intersect_point_tri_many(pts, tri_p1, tri_p2, tri_p3):
+	"""Project many points onto triangles in a single call.
+
+	Parameters:
+	pts (float triplet sequence) - Points, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	tri_p1 (float triplet sequence) - First points of the triangles, or a single mathutils.Vector shared by all points
+	tri_p2 (float triplet sequence) - Second points of the triangles, or a single mathutils.Vector shared by all points
+	tri_p3 (float triplet sequence) - Third points of the triangles, or a single mathutils.Vector shared by all points
+	
+	Returns: (locations, hits), the point on each triangle's plane and 1 when it is inside the triangle, 0 (and a zeroed location) otherwise
+	
+	Return type: tuple pair of arrays"""
+	
+	count, columns = _batch_columns("intersect_point_tri_many", pts, tri_p1, tri_p2, tri_p3)
+	return _gather(map(_intersect_point_tri, *columns))
 	
 def intersect_point_tri_2d(pt, tri_p1, tri_p2, tri_p3):
 	"""Takes 4 vectors (using only the x and y coordinates): one is the point and the next 3 define the triangle. Returns 1 if the point is within the triangle, otherwise 0.
@@ -251,8 +737,29 @@ def intersect_ray_tri(v1, v2, v3, ray, orig, clip=True):
 
 	Return type: mathutils.Vector or None"""
 	
-	from . import Vector
-	return Vector
+	co = _intersect_ray_tri(*_xyz(v1, "v1"), *_xyz(v2, "v2"), *_xyz(v3, "v3"), *_xyz(ray, "ray"), *_xyz(orig, "orig"),
+		clip)
+	return None if co is None else _Vector(co)
+	
+def intersect_ray_tri_many(v1, v2, v3, ray, orig, clip=True):
+	"""Intersect many rays with triangles in a single call.
+
+	Parameters:
+	v1 (float triplet sequence) - First points of the triangles, a sequence of triplets, a flat float buffer or a mathutils.VectorArray
+	v2 (float triplet sequence) - Second points of the triangles, same layout and length as v1
+	v3 (float triplet sequence) - Third points of the triangles, same layout and length as v1
+	ray (float triplet sequence) - Direction of each projection, same layout and length as v1
+	orig (float triplet sequence) - Origin of each projection, same layout and length as v1
+	clip (boolean) - When False, don't restrict the intersections to the area of the triangles, use their infinite planes.
+	
+	Single vectors are accepted for any argument, e.g. to cast many rays against one triangle or one ray against many triangles.
+	
+	Returns: (locations, hits), 3 floats per ray and 1 when an intersection is found, 0 (and a zeroed location) otherwise
+
+	Return type: tuple pair of arrays"""
+	
+	count, columns = _batch_columns("intersect_ray_tri_many", v1, v2, v3, ray, orig)
+	return _gather(map(_intersect_ray_tri, *columns, _repeat(clip, count)))
 	
 def intersect_sphere_sphere_2d(p_a, radius_a, p_b, radius_b):
 	"""Returns 2 points on between intersecting circles.
@@ -299,7 +806,80 @@ def tessellate_polygon(veclist_list):
 	
 	Return type: list"""
 	
-	return []
+	rings = []
+	offset = 0
+	
+	for polyline in veclist_list:
+		ring = [_xyz(co, "tessellate_polygon") for co in polyline]
+		
+		if len(ring) >= 3:
+			rings.append((offset, ring))
+		
+		offset += len(ring)
+	
+	# Newell normal of all polylines, the points are projected on its dominant plane keeping the winding
+	nx = ny = nz = 0.0
+	
+	for _, ring in rings:
+		jx, jy, jz = ring[-1]
+		
+		for ix, iy, iz in ring:
+			nx += (jy - iy) * (jz + iz)
+			ny += (jz - iz) * (jx + ix)
+			nz += (jx - ix) * (jy + iy)
+			jx, jy, jz = ix, iy, iz
+	
+	ax, ay, az = abs(nx), abs(ny), abs(nz)
+	
+	if not (ax or ay or az):
+		return []
+	
+	if az >= ax and az >= ay:
+		u, v, flip = 0, 1, nz < 0.0
+	
+	elif ax >= ay:
+		u, v, flip = 1, 2, nx < 0.0
+	
+	else:
+		u, v, flip = 2, 0, ny < 0.0
+	
+	if flip:
+		u, v = v, u
+	
+	rings = [[(co[u], co[v], offset + i) for i, co in enumerate(ring)] for offset, ring in rings]
+	
+	# Even-odd nesting: rings inside an even number of others are outlines, the others holes of the smallest
+	# outline around them
+	depths = []
+	
+	for i, ring in enumerate(rings):
+		x, y, _ = ring[0]
+		depths.append(sum(1 for j, other in enumerate(rings) if j != i and _point_in_ring(x, y, other)))
+	
+	holes = dict((i, []) for i in range(len(rings)) if not depths[i] % 2)
+	
+	for i, ring in enumerate(rings):
+		if depths[i] % 2:
+			x, y, _ = ring[0]
+			parents = [j for j in holes if depths[j] == depths[i] - 1 and _point_in_ring(x, y, rings[j])]
+			
+			if parents:
+				holes[min(parents, key=lambda j: _ring_area(rings[j]))].append(ring)
+	
+	coords = dict((i, (x, y)) for ring in rings for x, y, i in ring)
+	triangles = []
+	
+	for i, ring_holes in holes.items():
+		for a, b, c in _triangulate(rings[i], ring_holes):
+			(x1, y1), (x2, y2), (x3, y3) = coords[a], coords[b], coords[c]
+			
+			# Counter-clockwise in the projection, facing along the normal
+			if (x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1) < 0.0:
+				b, c = c, b
+			
+			triangles.append((a, b, c))
+	
+	return triangles
 	
 def volume_tetrahedron(v1, v2, v3, v4):
 	"""Return the volume formed by a tetrahedron (points can be in any order).
@@ -3,15 +3,46 @@
 Generic 3-dimentional kd-tree to perform spatial searches."""
 
 from . import Vector as _Vector
-from typing import Callable as _Callable
+from ._buffer import as_coords as _as_coords
+from array import array as _array
+from heapq import heappush as _heappush, heapreplace as _heapreplace
+from typing import Callable as _Callable, Sequence as _Sequence
+
+_INF = float("inf")
 
 
 class KDTree:
     """KdTree(size) -> new kd-tree initialized to hold size items.
 
+    Points are stored in contiguous double arrays, the balanced tree is laid out implicitly in those arrays (the median
+    of each range is its node) so no per-node Python objects are allocated.
+
     Note:
         KDTree.balance must have been called before using any of the find methods."""
 
+    __slots__ = ("_size", "_count", "_co", "_index", "_axis", "_balanced")
+
+    def __init__(self, size):
+        # type: (int) -> None
+        """KdTree(size) -> new kd-tree initialized to hold size items.
+
+        Args:
+            size (int): Number of points the tree will hold."""
+
+        if size < 0:
+            raise ValueError("negative size given")
+
+        self._size = size
+        self._count = 0
+        self._co = _array("d", bytes(24 * size))
+        self._index = _array("l", [0]) * size
+        self._axis = bytearray(size)
+        self._balanced = True
+
+    def __len__(self):
+        # type: () -> int
+        return self._count
+
     def balance(self):
         # type: () -> None
         """Balance the tree.
@@ -19,7 +50,235 @@ class KDTree:
         Note:
             This builds the entire tree, avoid calling after each insertion."""
 
-        pass
+        count = self._count
+        co = self._co
+        index = self._index
+
+        # Points are sorted once per axis, each split then partitions the three orders in linear time, which keeps the
+        # whole build at O(n log n) while the median of every range lands in its middle slot.
+        orders = [sorted(range(count), key=lambda i, a=a: co[i * 3 + a]) for a in range(3)]
+        new_co = _array("d", bytes(24 * self._size))
+        new_index = _array("l", [0]) * self._size
+        axes = self._axis
+        left = bytearray(count)
+
+        stack = [(0, count, orders)]
+
+        while stack:
+            lo, hi, orders = stack.pop()
+
+            if lo >= hi:
+                continue
+
+            axis = self._split_axis(orders)
+            mid = (lo + hi) >> 1
+            half = mid - lo
+            pivot = orders[axis][half]
+
+            dst = mid * 3
+            src = pivot * 3
+            new_co[dst:dst + 3] = co[src:src + 3]
+            new_index[mid] = index[pivot]
+            axes[mid] = axis
+
+            lower = orders[axis][:half]
+
+            for i in lower:
+                left[i] = 1
+
+            left_orders = [None, None, None]
+            right_orders = [None, None, None]
+
+            for a in range(3):
+                if a == axis:
+                    left_orders[a] = lower
+                    right_orders[a] = orders[a][half + 1:]
+
+                else:
+                    left_orders[a] = [i for i in orders[a] if left[i]]
+                    right_orders[a] = [i for i in orders[a] if not left[i] and i != pivot]
+
+            for i in lower:
+                left[i] = 0
+
+            stack.append((lo, mid, left_orders))
+            stack.append((mid + 1, hi, right_orders))
+
+        # Unused capacity keeps the original (unordered) tail so further inserts stay valid.
+        new_co[count * 3:] = co[count * 3:]
+        new_index[count:] = index[count:]
+        self._co = new_co
+        self._index = new_index
+        self._balanced = True
+
+    def _split_axis(self, orders):
+        # type: (list) -> int
+        """Pick the axis with the largest spread for the points in the given per-axis orders."""
+
+        co = self._co
+
+        if len(orders[0]) < 2:
+            return 0
+
+        best_axis = 0
+        best_spread = -1.0
+
+        for a in range(3):
+            order = orders[a]
+            spread = co[order[-1] * 3 + a] - co[order[0] * 3 + a]
+
+            if spread > best_spread:
+                best_axis = a
+                best_spread = spread
+
+        return best_axis
+
+    def _check_balanced(self):
+        # type: () -> None
+        if not self._balanced:
+            raise RuntimeError("KDTree must be balanced before calling find()")
+
+    def _nearest(self, x, y, z, filter=None):
+        # type: (float, float, float, _Callable) -> tuple[int, float]
+        """Return (slot, squared distance) of the nearest point, slot is -1 when nothing matched."""
+
+        co = self._co
+        axes = self._axis
+        index = self._index
+        best = -1
+        best_d = _INF
+        stack = [(0, self._count, 0.0)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            lo, hi, split_d = pop()
+
+            if split_d >= best_d:
+                continue
+
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                o = mid * 3
+                dx = co[o] - x
+                dy = co[o + 1] - y
+                dz = co[o + 2] - z
+                d = dx * dx + dy * dy + dz * dz
+
+                if d < best_d and (filter is None or filter(index[mid])):
+                    best = mid
+                    best_d = d
+
+                axis = axes[mid]
+                diff = -dx if axis == 0 else -dy if axis == 1 else -dz
+
+                if diff < 0.0:
+                    push((mid + 1, hi, diff * diff))
+                    hi = mid
+
+                else:
+                    push((lo, mid, diff * diff))
+                    lo = mid + 1
+
+        return best, best_d
+
+    def _nearest_n(self, x, y, z, n):
+        # type: (float, float, float, int) -> list[tuple[float, int]]
+        """Return up to n (negated squared distance, slot) pairs as a max-heap."""
+
+        co = self._co
+        axes = self._axis
+        heap = []
+        worst = _INF
+        stack = [(0, self._count, 0.0)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            lo, hi, split_d = pop()
+
+            if split_d >= worst:
+                continue
+
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                o = mid * 3
+                dx = co[o] - x
+                dy = co[o + 1] - y
+                dz = co[o + 2] - z
+                d = dx * dx + dy * dy + dz * dz
+
+                if len(heap) < n:
+                    _heappush(heap, (-d, mid))
+
+                    if len(heap) == n:
+                        worst = -heap[0][0]
+
+                elif d < worst:
+                    _heapreplace(heap, (-d, mid))
+                    worst = -heap[0][0]
+
+                axis = axes[mid]
+                diff = -dx if axis == 0 else -dy if axis == 1 else -dz
+
+                if diff < 0.0:
+                    push((mid + 1, hi, diff * diff))
+                    hi = mid
+
+                else:
+                    push((lo, mid, diff * diff))
+                    lo = mid + 1
+
+        return heap
+
+    def _in_range(self, x, y, z, radius):
+        # type: (float, float, float, float) -> list[tuple[float, int]]
+        """Return (squared distance, slot) pairs for all points within radius."""
+
+        co = self._co
+        axes = self._axis
+        radius_sq = radius * radius
+        found = []
+        stack = [(0, self._count)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            lo, hi = pop()
+
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                o = mid * 3
+                dx = co[o] - x
+                dy = co[o + 1] - y
+                dz = co[o + 2] - z
+                d = dx * dx + dy * dy + dz * dz
+
+                if d <= radius_sq:
+                    found.append((d, mid))
+
+                axis = axes[mid]
+                diff = -dx if axis == 0 else -dy if axis == 1 else -dz
+
+                if diff < 0.0:
+                    if diff * diff <= radius_sq:
+                        push((mid + 1, hi))
+
+                    hi = mid
+
+                else:
+                    if diff * diff <= radius_sq:
+                        push((lo, mid))
+
+                    lo = mid + 1
+
+        found.sort()
+        return found
+
+    def _result(self, slot, dist_sq):
+        # type: (int, float) -> tuple[_Vector, int, float]
+        o = slot * 3
+        return _Vector(self._co[o:o + 3]), self._index[slot], dist_sq ** 0.5
 
     def find(self, co, filter=None):
         # type: (list, _Callable) -> tuple[_Vector, int, float]
@@ -32,10 +291,17 @@ class KDTree:
         Returns:
             tuple: (Vector, index, distance)."""
 
-        pass
+        self._check_balanced()
+        x, y, z = co
+        slot, dist_sq = self._nearest(x, y, z, filter)
+
+        if slot < 0:
+            return None, None, None
+
+        return self._result(slot, dist_sq)
 
     def find_n(self, co, n):
-        # type: (list, int) -> tuple[_Vector, int, float]
+        # type: (list, int) -> list[tuple[_Vector, int, float]]
         """Find nearest n points to co.
 
         Args:
@@ -45,7 +311,18 @@ class KDTree:
         Returns:
             list: Returns a list of tuples (Vector, index, distance)."""
 
-        pass
+        self._check_balanced()
+
+        if n < 0:
+            raise RuntimeError("negative 'n' given")
+
+        if n == 0:
+            return []
+
+        x, y, z = co
+        heap = self._nearest_n(x, y, z, n)
+        heap.sort(reverse=True)
+        return [self._result(slot, -neg_d) for neg_d, slot in heap]
 
     def find_range(self, co, radius):
         # type: (list, float) -> list[tuple[_Vector, int, float]]
@@ -58,7 +335,124 @@ class KDTree:
         Returns:
             list: Returns a list of tuples (Vector, index, distance)."""
 
-        pass
+        self._check_balanced()
+
+        if radius < 0.0:
+            raise RuntimeError("negative radius given")
+
+        x, y, z = co
+        return [self._result(slot, d) for d, slot in self._in_range(x, y, z, radius)]
+
+    def find_many(self, cos):
+        # type: (_Sequence) -> tuple[_array, _array]
+        """Find the nearest point to each of many coordinates.
+
+        Args:
+            cos (float triplet sequence): 3d coordinates, either a sequence of triplets or a flat float buffer.
+
+        Returns:
+            tuple: (indices, distances) arrays with one entry per query, index is -1 and distance inf for an empty tree.
+
+        Note:
+            A convenience wrapper: the queries are searched one after the other like find(), only the Vector and the
+            tuple of each result aren't built."""
+
+        self._check_balanced()
+        flat = _as_coords(cos)
+        count = len(flat) // 3
+        indices = _array("l", [-1]) * count
+        distances = _array("d", [_INF]) * count
+        index = self._index
+        nearest = self._nearest
+
+        for q in range(count):
+            o = q * 3
+            slot, dist_sq = nearest(flat[o], flat[o + 1], flat[o + 2])
+
+            if slot >= 0:
+                indices[q] = index[slot]
+                distances[q] = dist_sq ** 0.5
+
+        return indices, distances
+
+    def find_n_many(self, cos, n):
+        # type: (_Sequence, int) -> tuple[_array, _array]
+        """Find the nearest n points to each of many coordinates.
+
+        Args:
+            cos (float triplet sequence): 3d coordinates, either a sequence of triplets or a flat float buffer.
+            n (int): Number of points to find per query.
+
+        Returns:
+            tuple: (indices, distances) flat arrays of n entries per query sorted by distance, padded with -1 and inf
+            when the tree holds less than n points.
+
+        Note:
+            A convenience wrapper: the queries are searched one after the other like find_n()."""
+
+        self._check_balanced()
+
+        if n < 0:
+            raise RuntimeError("negative 'n' given")
+
+        flat = _as_coords(cos)
+        count = len(flat) // 3
+        indices = _array("l", [-1]) * (count * n)
+        distances = _array("d", [_INF]) * (count * n)
+        index = self._index
+        nearest_n = self._nearest_n
+
+        for q in range(count if n else 0):
+            o = q * 3
+            heap = nearest_n(flat[o], flat[o + 1], flat[o + 2], n)
+            heap.sort(reverse=True)
+            out = q * n
+
+            for neg_d, slot in heap:
+                indices[out] = index[slot]
+                distances[out] = (-neg_d) ** 0.5
+                out += 1
+
+        return indices, distances
+
+    def find_range_many(self, cos, radius):
+        # type: (_Sequence, float) -> tuple[_array, _array, _array]
+        """Find all points within radius of each of many coordinates.
+
+        Args:
+            cos (float triplet sequence): 3d coordinates, either a sequence of triplets or a flat float buffer.
+            radius (float): Distance to search for points.
+
+        Returns:
+            tuple: (offsets, indices, distances) arrays, the hits of query i are indices[offsets[i]:offsets[i + 1]]
+            sorted by distance.
+
+        Note:
+            A convenience wrapper: the queries are searched one after the other like find_range()."""
+
+        self._check_balanced()
+
+        if radius < 0.0:
+            raise RuntimeError("negative radius given")
+
+        flat = _as_coords(cos)
+        count = len(flat) // 3
+        offsets = _array("l", [0]) * (count + 1)
+        indices = _array("l")
+        distances = _array("d")
+        index = self._index
+        in_range = self._in_range
+
+        for q in range(count):
+            o = q * 3
+
+            for d, slot in in_range(flat[o], flat[o + 1], flat[o + 2], radius):
+                indices.append(index[slot])
+                distances.append(d ** 0.5)
+
+            offsets[q + 1] = len(indices)
+
+        return offsets, indices, distances
 
     def insert(self, co, index):
         # type: (list, int) -> None
@@ -68,4 +462,17 @@ class KDTree:
             co (float triplet): Point 3d position.
             index (int): The index of the point."""
 
-        pass
+        if index < 0:
+            raise ValueError("negative index given")
+
+        if self._count >= self._size:
+            raise RuntimeError("Size exceeded")
+
+        x, y, z = co
+        o = self._count * 3
+        self._co[o] = x
+        self._co[o + 1] = y
+        self._co[o + 2] = z
+        self._index[self._count] = index
+        self._count += 1
+        self._balanced = False
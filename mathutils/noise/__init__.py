@@ -1,5 +1,707 @@
+"""Noise Utilities (mathutils.noise)
+
+The functions evaluate one position, or every position of an (N, 3) array (VectorArray, memoryview, flat float array
+or sequence of positions) returning an array of results. The module functions share one default NoiseGenerator,
+create more of them to get independent, reproducible noise and random sequences (e.g. one per worker)."""
+
+from array import array as _array
+from math import floor as _floor, sqrt as _sqrt, inf as _inf
+from random import Random as _Random
+from time import time as _time
+
 from . import types
-from .. import Vector as _Vector
+from .. import Vector as _Vector, VectorArray as _VectorArray
+from .._buffer import as_coords as _as_coords
+
+_GRADIENTS = ((1.0, 1.0, 0.0), (-1.0, 1.0, 0.0), (1.0, -1.0, 0.0), (-1.0, -1.0, 0.0),
+              (1.0, 0.0, 1.0), (-1.0, 0.0, 1.0), (1.0, 0.0, -1.0), (-1.0, 0.0, -1.0),
+              (0.0, 1.0, 1.0), (0.0, -1.0, 1.0), (0.0, 1.0, -1.0), (0.0, -1.0, -1.0),
+              (1.0, 1.0, 0.0), (0.0, -1.0, 1.0), (-1.0, 1.0, 0.0), (0.0, -1.0, -1.0))
+"""Gradient set of the improved Perlin noise, indexed by the low four bits of the lattice hash."""
+
+_VECTOR_OFFSETS = ((9.321, 1.337, -4.217), (-2.491, 7.773, 5.331))
+"""Offsets where the first and last components of noise vectors are evaluated."""
+
+_NOISE_BASES = frozenset((types.BLENDER, types.STDPERLIN, types.NEWPERLIN, types.VORONOI_F1, types.VORONOI_F2,
+                          types.VORONOI_F3, types.VORONOI_F4, types.VORONOI_F2F1, types.VORONOI_CRACKLE,
+                          types.CELLNOISE))
+
+
+def _batch(position):
+    # type: (object) -> _array
+    """Flat xyz array when position holds many positions, None when it is a single position."""
+
+    if isinstance(position, _Vector):
+        return None
+
+    if isinstance(position, (_VectorArray, _array, memoryview)):
+        if isinstance(position, _VectorArray) and position.size != 3:
+            raise ValueError("mathutils.noise: expected an array of 3D positions")
+
+        return _as_coords(position)
+
+    if len(position) and isinstance(position[0], (int, float)):
+        return None
+
+    return _as_coords(position)
+
+
+def _xyz(position):
+    # type: (object) -> list
+    values = [float(value) for value in position]
+
+    if len(values) != 3:
+        raise ValueError("mathutils.noise: expected a 3D position")
+
+    return values
+
+
+def _evaluate(position, sample):
+    # type: (object, object) -> object
+    """Run sample(x, y, z) for one position, or for every position of an array returning an array of doubles."""
+
+    flat = _batch(position)
+
+    if flat is None:
+        return sample(*_xyz(position))
+
+    return _array("d", map(sample, flat[0::3], flat[1::3], flat[2::3]))
+
+
+def _evaluate_vector(position, sample):
+    # type: (object, object) -> object
+    """As _evaluate(), for samples returning 3 values, giving a Vector or a VectorArray."""
+
+    flat = _batch(position)
+
+    if flat is None:
+        return _Vector(sample(*_xyz(position)))
+
+    out = _array("d")
+
+    for values in map(sample, flat[0::3], flat[1::3], flat[2::3]):
+        out.extend(values)
+
+    return _VectorArray(out)
+
+
+def _gradient_noise(perm, gx, gy, gz, quintic, scale):
+    # type: (list, list, list, list, bool, float) -> object
+    """Build a lattice gradient noise function, signed in about [-1, 1].
+
+    Args:
+        perm (list): Permutation of 0-255 repeated twice, hashes the lattice corners.
+        gx (list): Gradient x component for each hash value, same for gy and gz.
+        quintic (bool): Use the improved 6t^5 - 15t^4 + 10t^3 interpolant instead of 3t^2 - 2t^3.
+        scale (float): Factor applied to the result.
+
+    Returns:
+        function: noise(x, y, z) -> float."""
+
+    def noise(x, y, z):
+        fx = _floor(x)
+        fy = _floor(y)
+        fz = _floor(z)
+        ix = int(fx) & 255
+        iy = int(fy) & 255
+        iz = int(fz) & 255
+        x -= fx
+        y -= fy
+        z -= fz
+        x1 = x - 1.0
+        y1 = y - 1.0
+        z1 = z - 1.0
+
+        if quintic:
+            u = x * x * x * (x * (x * 6.0 - 15.0) + 10.0)
+            v = y * y * y * (y * (y * 6.0 - 15.0) + 10.0)
+            w = z * z * z * (z * (z * 6.0 - 15.0) + 10.0)
+
+        else:
+            u = x * x * (3.0 - 2.0 * x)
+            v = y * y * (3.0 - 2.0 * y)
+            w = z * z * (3.0 - 2.0 * z)
+
+        a = perm[ix] + iy
+        b = perm[ix + 1] + iy
+        aa = perm[a] + iz
+        ab = perm[a + 1] + iz
+        ba = perm[b] + iz
+        bb = perm[b + 1] + iz
+        h = perm[aa]
+        n000 = gx[h] * x + gy[h] * y + gz[h] * z
+        h = perm[ba]
+        n100 = gx[h] * x1 + gy[h] * y + gz[h] * z
+        h = perm[ab]
+        n010 = gx[h] * x + gy[h] * y1 + gz[h] * z
+        h = perm[bb]
+        n110 = gx[h] * x1 + gy[h] * y1 + gz[h] * z
+        h = perm[aa + 1]
+        n001 = gx[h] * x + gy[h] * y + gz[h] * z1
+        h = perm[ba + 1]
+        n101 = gx[h] * x1 + gy[h] * y + gz[h] * z1
+        h = perm[ab + 1]
+        n011 = gx[h] * x + gy[h] * y1 + gz[h] * z1
+        h = perm[bb + 1]
+        n111 = gx[h] * x1 + gy[h] * y1 + gz[h] * z1
+        n00 = n000 + u * (n100 - n000)
+        n10 = n010 + u * (n110 - n010)
+        n01 = n001 + u * (n101 - n001)
+        n11 = n011 + u * (n111 - n011)
+        n0 = n00 + v * (n10 - n00)
+        n1 = n01 + v * (n11 - n01)
+        return scale * (n0 + w * (n1 - n0))
+
+    return noise
+
+
+def _distance_metric(distance_metric, exponent):
+    # type: (int, float) -> object
+    """Distance function of one of the mathutils.noise.types distance metrics."""
+
+    if distance_metric == types.DISTANCE:
+        return lambda dx, dy, dz: _sqrt(dx * dx + dy * dy + dz * dz)
+
+    if distance_metric == types.DISTANCE_SQUARED:
+        return lambda dx, dy, dz: dx * dx + dy * dy + dz * dz
+
+    if distance_metric == types.MANHATTAN:
+        return lambda dx, dy, dz: abs(dx) + abs(dy) + abs(dz)
+
+    if distance_metric == types.CHEBYCHEV:
+        return lambda dx, dy, dz: max(abs(dx), abs(dy), abs(dz))
+
+    if distance_metric == types.MINKOVSKY_HALF:
+        return lambda dx, dy, dz: (_sqrt(abs(dx)) + _sqrt(abs(dy)) + _sqrt(abs(dz))) ** 2
+
+    if distance_metric == types.MINKOVSKY_FOUR:
+        return lambda dx, dy, dz: _sqrt(_sqrt(dx * dx * dx * dx + dy * dy * dy * dy + dz * dz * dz * dz))
+
+    if distance_metric == types.MINKOVSKY:
+        inverse = 1.0 / exponent
+        return lambda dx, dy, dz: (abs(dx) ** exponent + abs(dy) ** exponent + abs(dz) ** exponent) ** inverse
+
+    raise ValueError("distance_metric: invalid distance metric %r" % (distance_metric,))
+
+
+class NoiseGenerator:
+    """Noise and random number source with its own seed, lattice tables and random state.
+
+    Generators built from the same seed return the same values whatever the global state, so parallel workers can
+    each own one and stay deterministic. Its methods match the mathutils.noise functions."""
+
+    __slots__ = ("_seed", "_random", "_perm", "_points", "_cell_salt", "_perlin", "_improved", "_blender", "_bases")
+
+    def __init__(self, seed=0):
+        # type: (int) -> None
+        """Noise and random number source with its own seed, lattice tables and random state.
+
+        Args:
+            seed (int): Seed of the noise tables and of the random functions."""
+
+        tables = _Random(seed)
+        perm = list(range(256))
+        tables.shuffle(perm)
+        self._perm = perm + perm
+        self._points = [tables.random() for _ in range(768)]
+        self._cell_salt = (seed * 2654435761) & 0xFFFFFFFF
+        self._perlin = _gradient_noise(self._perm, *self._unit_gradients(tables), quintic=False, scale=1.5)
+        self._blender = _gradient_noise(self._perm, *self._unit_gradients(tables), quintic=False, scale=1.0)
+        gx, gy, gz = zip(*[_GRADIENTS[h & 15] for h in range(256)])
+        self._improved = _gradient_noise(self._perm, gx, gy, gz, quintic=True, scale=1.0)
+        self._bases = {}
+        self._seed = seed
+        self._random = _Random(seed)
+
+    @staticmethod
+    def _unit_gradients(tables):
+        # type: (_Random) -> tuple
+        gradients = []
+
+        while len(gradients) < 256:
+            x, y, z = tables.uniform(-1.0, 1.0), tables.uniform(-1.0, 1.0), tables.uniform(-1.0, 1.0)
+            length = _sqrt(x * x + y * y + z * z)
+
+            if 0.0 < length <= 1.0:
+                gradients.append((x / length, y / length, z / length))
+
+        return tuple(zip(*gradients))
+
+    @property
+    def seed(self):
+        # type: () -> int
+        """Seed the noise tables were built from (read-only)."""
+
+        return self._seed
+
+    def _basis(self, noise_basis, signed):
+        # type: (int, bool) -> object
+        """noise(x, y, z) function of a noise basis, signed in [-1, 1] as used by the fractals or unsigned in [0, 1]."""
+
+        key = (noise_basis, signed)
+        func = self._bases.get(key)
+
+        if func is None:
+            func = self._bases[key] = self._build_basis(noise_basis, signed)
+
+        return func
+
+    def _build_basis(self, noise_basis, signed):
+        # type: (int, bool) -> object
+        if noise_basis not in _NOISE_BASES:
+            raise ValueError("noise_basis: invalid noise basis %r" % (noise_basis,))
+
+        if noise_basis in (types.STDPERLIN, types.NEWPERLIN):
+            perlin = self._perlin if noise_basis == types.STDPERLIN else self._improved
+            return perlin if signed else lambda x, y, z: 0.5 + 0.5 * perlin(x, y, z)
+
+        if noise_basis == types.BLENDER:
+            blender = self._blender
+
+            if signed:
+                return lambda x, y, z: 2.0 * min(max(0.5 + 0.5 * blender(x, y, z), 0.0), 1.0) - 1.0
+
+            # Blender shifts its original noise by one unit when it is used directly
+            return lambda x, y, z: min(max(0.5 + 0.5 * blender(x + 1.0, y + 1.0, z + 1.0), 0.0), 1.0)
+
+        if noise_basis == types.CELLNOISE:
+            unsigned = self._cell
+
+        else:
+            features = self._features
+            metric = _distance_metric(types.DISTANCE, 2.5)
+
+            if noise_basis == types.VORONOI_F2F1:
+                def unsigned(x, y, z):
+                    distances = features(x, y, z, metric)[0]
+                    return distances[1] - distances[0]
+
+            elif noise_basis == types.VORONOI_CRACKLE:
+                def unsigned(x, y, z):
+                    distances = features(x, y, z, metric)[0]
+                    return min(10.0 * (distances[1] - distances[0]), 1.0)
+
+            else:
+                index = noise_basis - types.VORONOI_F1
+
+                def unsigned(x, y, z):
+                    return features(x, y, z, metric)[0][index]
+
+        if signed:
+            return lambda x, y, z: 2.0 * unsigned(x, y, z) - 1.0
+
+        return unsigned
+
+    def _cell(self, x, y, z):
+        # type: (float, float, float) -> float
+        """Integer lattice hash of Blender's cell noise, in [0, 1)."""
+
+        n = (int(_floor(x)) + int(_floor(y)) * 1301 + int(_floor(z)) * 314159 + self._cell_salt) & 0xFFFFFFFF
+        n ^= (n << 13) & 0xFFFFFFFF
+        return ((n * (n * n * 15731 + 789221) + 1376312589) & 0xFFFFFFFF) / 4294967296.0
+
+    def _features(self, x, y, z, metric):
+        # type: (float, float, float, object) -> tuple
+        """Distances and positions of the four closest feature points, one random point per unit cell."""
+
+        perm = self._perm
+        points = self._points
+        xi = int(_floor(x))
+        yi = int(_floor(y))
+        zi = int(_floor(z))
+        distances = [_inf, _inf, _inf, _inf]
+        positions = [None, None, None, None]
+
+        for xx in range(xi - 1, xi + 2):
+            hx = perm[xx & 255]
+
+            for yy in range(yi - 1, yi + 2):
+                hy = perm[hx + (yy & 255)]
+
+                for zz in range(zi - 1, zi + 2):
+                    h = 3 * perm[hy + (zz & 255)]
+                    px = xx + points[h]
+                    py = yy + points[h + 1]
+                    pz = zz + points[h + 2]
+                    d = metric(x - px, y - py, z - pz)
+
+                    if d < distances[3]:
+                        i = 3
+
+                        while i and d < distances[i - 1]:
+                            i -= 1
+
+                        distances.insert(i, d)
+                        distances.pop()
+                        positions.insert(i, (px, py, pz))
+                        positions.pop()
+
+        return distances, positions
+
+    def _noise_vector(self, noise_basis):
+        # type: (int) -> object
+        unsigned = self._basis(noise_basis, False)
+        (ax, ay, az), (bx, by, bz) = _VECTOR_OFFSETS
+
+        def sample(x, y, z):
+            return (2.0 * unsigned(x + ax, y + ay, z + az) - 1.0,
+                    2.0 * unsigned(x, y, z) - 1.0,
+                    2.0 * unsigned(x + bx, y + by, z + bz) - 1.0)
+
+        return sample
+
+    def cell(self, position):
+        # type: (_Vector) -> float
+        """Same as mathutils.noise.cell() using this generator."""
+
+        return _evaluate(position, self._cell)
+
+    def cell_vector(self, position):
+        # type: (_Vector) -> _Vector
+        """Same as mathutils.noise.cell_vector() using this generator."""
+
+        perm = self._perm
+        points = self._points
+
+        def sample(x, y, z):
+            h = 3 * perm[perm[perm[int(_floor(x)) & 255] + (int(_floor(y)) & 255)] + (int(_floor(z)) & 255)]
+            return points[h], points[h + 1], points[h + 2]
+
+        return _evaluate_vector(position, sample)
+
+    def fractal(self, position, H, lacunarity, octaves, noise_basis=types.STDPERLIN):
+        # type: (_Vector, float, float, int, int) -> float
+        """Same as mathutils.noise.fractal() using this generator."""
+
+        noise = self._basis(noise_basis, True)
+        pw_hl = lacunarity ** -H
+        whole = int(octaves)
+        rmd = octaves - _floor(octaves)
+
+        def sample(x, y, z):
+            value = 0.0
+            pwr = 1.0
+
+            for _ in range(whole):
+                value += noise(x, y, z) * pwr
+                pwr *= pw_hl
+                x *= lacunarity
+                y *= lacunarity
+                z *= lacunarity
+
+            if rmd:
+                value += rmd * noise(x, y, z) * pwr
+
+            return value
+
+        return _evaluate(position, sample)
+
+    def hetero_terrain(self, position, H, lacunarity, octaves, offset, noise_basis=types.STDPERLIN):
+        # type: (_Vector, float, float, int, float, int) -> float
+        """Same as mathutils.noise.hetero_terrain() using this generator."""
+
+        noise = self._basis(noise_basis, True)
+        pw_hl = lacunarity ** -H
+        whole = int(octaves)
+        rmd = octaves - _floor(octaves)
+
+        def sample(x, y, z):
+            # First octave unscaled, the later ones scaled by the current height
+            value = offset + noise(x, y, z)
+            pwr = pw_hl
+            x *= lacunarity
+            y *= lacunarity
+            z *= lacunarity
+
+            for _ in range(1, whole):
+                value += (noise(x, y, z) + offset) * pwr * value
+                pwr *= pw_hl
+                x *= lacunarity
+                y *= lacunarity
+                z *= lacunarity
+
+            if rmd:
+                value += rmd * (noise(x, y, z) + offset) * pwr * value
+
+            return value
+
+        return _evaluate(position, sample)
+
+    def hybrid_multi_fractal(self, position, H, lacunarity, octaves, offset, gain, noise_basis=types.STDPERLIN):
+        # type: (_Vector, float, float, int, float, float, int) -> float
+        """Same as mathutils.noise.hybrid_multi_fractal() using this generator."""
+
+        noise = self._basis(noise_basis, True)
+        pw_hl = lacunarity ** -H
+        whole = int(octaves)
+        rmd = octaves - _floor(octaves)
+
+        def sample(x, y, z):
+            result = noise(x, y, z) + offset
+            weight = gain * result
+            pwr = pw_hl
+            x *= lacunarity
+            y *= lacunarity
+            z *= lacunarity
+            i = 1
+
+            while weight > 0.001 and i < whole:
+                if weight > 1.0:
+                    weight = 1.0
+
+                signal = (noise(x, y, z) + offset) * pwr
+                pwr *= pw_hl
+                result += weight * signal
+                weight *= gain * signal
+                x *= lacunarity
+                y *= lacunarity
+                z *= lacunarity
+                i += 1
+
+            if rmd:
+                result += rmd * (noise(x, y, z) + offset) * pwr
+
+            return result
+
+        return _evaluate(position, sample)
+
+    def multi_fractal(self, position, H, lacunarity, octaves, noise_basis=types.STDPERLIN):
+        # type: (_Vector, float, float, int, int) -> float
+        """Same as mathutils.noise.multi_fractal() using this generator."""
+
+        noise = self._basis(noise_basis, True)
+        pw_hl = lacunarity ** -H
+        whole = int(octaves)
+        rmd = octaves - _floor(octaves)
+
+        def sample(x, y, z):
+            value = 1.0
+            pwr = 1.0
+
+            for _ in range(whole):
+                value *= pwr * noise(x, y, z) + 1.0
+                pwr *= pw_hl
+                x *= lacunarity
+                y *= lacunarity
+                z *= lacunarity
+
+            if rmd:
+                value *= rmd * noise(x, y, z) * pwr + 1.0
+
+            return value
+
+        return _evaluate(position, sample)
+
+    def noise(self, position, noise_basis=types.STDPERLIN):
+        # type: (_Vector, int) -> float
+        """Same as mathutils.noise.noise() using this generator."""
+
+        unsigned = self._basis(noise_basis, False)
+        return _evaluate(position, lambda x, y, z: 2.0 * unsigned(x, y, z) - 1.0)
+
+    def noise_vector(self, position, noise_basis=types.STDPERLIN):
+        # type: (_Vector, int) -> _Vector
+        """Same as mathutils.noise.noise_vector() using this generator."""
+
+        return _evaluate_vector(position, self._noise_vector(noise_basis))
+
+    def random(self):
+        # type: () -> float
+        """Same as mathutils.noise.random() using this generator."""
+
+        return self._random.random()
+
+    def random_unit_vector(self, size=3):
+        # type: (int) -> _Vector
+        """Same as mathutils.noise.random_unit_vector() using this generator."""
+
+        vec = self.random_vector(size)
+
+        while not vec.length:
+            vec = self.random_vector(size)
+
+        vec.normalize()
+        return vec
+
+    def random_vector(self, size=3):
+        # type: (int) -> _Vector
+        """Same as mathutils.noise.random_vector() using this generator."""
+
+        if not 2 <= size <= 4:
+            raise ValueError("size: must be between 2 and 4")
+
+        uniform = self._random.uniform
+
+        while True:
+            values = [uniform(-1.0, 1.0) for _ in range(size)]
+
+            if sum([v * v for v in values]) <= 1.0:
+                return _Vector(values)
+
+    def ridged_multi_fractal(self, position, H, lacunarity, octaves, offset, gain, noise_basis=types.STDPERLIN):
+        # type: (_Vector, float, float, int, float, float, int) -> float
+        """Same as mathutils.noise.ridged_multi_fractal() using this generator."""
+
+        noise = self._basis(noise_basis, True)
+        pw_hl = lacunarity ** -H
+        whole = int(octaves)
+
+        def sample(x, y, z):
+            signal = offset - abs(noise(x, y, z))
+            signal *= signal
+            result = signal
+            pwr = pw_hl
+
+            for _ in range(1, whole):
+                x *= lacunarity
+                y *= lacunarity
+                z *= lacunarity
+                weight = min(max(signal * gain, 0.0), 1.0)
+                signal = offset - abs(noise(x, y, z))
+                signal *= signal * weight
+                result += signal * pwr
+                pwr *= pw_hl
+
+            return result
+
+        return _evaluate(position, sample)
+
+    def seed_set(self, seed):
+        # type: (int) -> None
+        """Same as mathutils.noise.seed_set(), only affecting the random functions of this generator."""
+
+        self._random.seed(seed if seed else _time())
+
+    def turbulence(self, position, octaves, hard, noise_basis=types.STDPERLIN, amplitude_scale=0.5,
+                   frequency_scale=2.0):
+        # type: (_Vector, int, bool, int, float, float) -> float
+        """Same as mathutils.noise.turbulence() using this generator."""
+
+        unsigned = self._basis(noise_basis, False)
+
+        def sample(x, y, z):
+            out = 2.0 * unsigned(x, y, z) - 1.0
+
+            if hard:
+                out = abs(out)
+
+            amp = 1.0
+
+            for _ in range(1, octaves):
+                amp *= amplitude_scale
+                x *= frequency_scale
+                y *= frequency_scale
+                z *= frequency_scale
+                t = amp * (2.0 * unsigned(x, y, z) - 1.0)
+                out += abs(t) if hard else t
+
+            return out
+
+        return _evaluate(position, sample)
+
+    def turbulence_vector(self, position, octaves, hard, noise_basis=types.STDPERLIN, amplitude_scale=0.5,
+                          frequency_scale=2.0):
+        # type: (_Vector, int, bool, int, float, float) -> _Vector
+        """Same as mathutils.noise.turbulence_vector() using this generator."""
+
+        noise_vector = self._noise_vector(noise_basis)
+
+        def sample(x, y, z):
+            vx, vy, vz = noise_vector(x, y, z)
+
+            if hard:
+                vx, vy, vz = abs(vx), abs(vy), abs(vz)
+
+            amp = 1.0
+
+            for _ in range(1, octaves):
+                amp *= amplitude_scale
+                x *= frequency_scale
+                y *= frequency_scale
+                z *= frequency_scale
+                tx, ty, tz = noise_vector(x, y, z)
+
+                if hard:
+                    tx, ty, tz = abs(tx), abs(ty), abs(tz)
+
+                vx += amp * tx
+                vy += amp * ty
+                vz += amp * tz
+
+            return vx, vy, vz
+
+        return _evaluate_vector(position, sample)
+
+    def variable_lacunarity(self, position, distortion, noise_type1=types.STDPERLIN, noise_type2=types.STDPERLIN):
+        # type: (_Vector, float, int, int) -> float
+        """Same as mathutils.noise.variable_lacunarity() using this generator."""
+
+        distorted = self._basis(noise_type1, True)
+        distort = self._basis(noise_type2, True)
+
+        def sample(x, y, z):
+            dx = distort(x + 13.5, y + 13.5, z + 13.5) * distortion
+            dy = distort(x, y, z) * distortion
+            dz = distort(x - 13.5, y - 13.5, z - 13.5) * distortion
+            return distorted(x + dx, y + dy, z + dz)
+
+        return _evaluate(position, sample)
+
+    def voronoi(self, position, distance_metric, exponent=2.5):
+        # type: (_Vector, int, float) -> list
+        """Same as mathutils.noise.voronoi() using this generator."""
+
+        metric = _distance_metric(distance_metric, exponent)
+        features = self._features
+        flat = _batch(position)
+
+        if flat is None:
+            distances, positions = features(*_xyz(position), metric)
+            return [distances, [_Vector(co) for co in positions]]
+
+        all_distances = _array("d")
+        all_positions = _array("d")
+
+        for x, y, z in zip(flat[0::3], flat[1::3], flat[2::3]):
+            distances, positions = features(x, y, z, metric)
+            all_distances.extend(distances)
+
+            for co in positions:
+                all_positions.extend(co)
+
+        return all_distances, _VectorArray(all_positions)
+
+
+_generator = NoiseGenerator()
+"""Generator behind the module level functions."""
+
+
+def bake_field(func, bounds, resolution, workers = None, args = (), seed = 0, tile_size = 256, filepath = None, typecode = "d"):
+    # type: (object, tuple, tuple, int, tuple, int, int, str, str) -> memoryview
+    """Evaluates a noise function over a regular 2D or 3D grid, splitting it into tiles baked by a process pool.
+
+    The tiles are written straight into one shared buffer, an anonymous memory mapping or the memory mapped file at
+    filepath. mathutils.noise functions are evaluated with a NoiseGenerator built from seed in every worker, so the
+    result only depends on the arguments, not on the number of workers or on the tiling.
+
+    Args:
+        func (function): A mathutils.noise function (or its name), or any picklable callable taking an (N, 3) flat
+            array of positions followed by args and returning an array with the same number of values per position.
+        bounds (tuple): Minimum and maximum corners of the grid, 2D or 3D; 2D grids are sampled at z = 0.
+        resolution (tuple): Number of samples along each axis, the bounds are included.
+        workers (int): Number of worker processes, defaults to the CPU count; 1 bakes in the calling process.
+        args (tuple): Extra arguments passed to func after the positions, e.g. (H, lacunarity, octaves) for fractal.
+        seed (int): Seed of the noise generator used by mathutils.noise functions.
+        tile_size (int): Number of samples along each side of a tile.
+        filepath (str): File to memory map the result into, an anonymous mapping is used when None.
+        typecode (str): Output precision, 'f' for 32 bit or 'd' for 64 bit floats.
+
+    Returns:
+        memoryview: The samples, shaped (y, x) or (z, y, x) with a trailing axis when func returns several values per
+            position (e.g. the four voronoi distances)."""
+
+    from . import _bake
+    return _bake.bake(func, bounds, resolution, workers, args, seed, tile_size, filepath, typecode)
 
 
 def cell(position):
@@ -7,12 +709,12 @@ def cell(position):
     """Returns cell noise value at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
 
     Returns:
-        float: The cell noise value."""
+        float: The cell noise value, an array of values for an array of positions."""
 
-    pass
+    return _generator.cell(position)
 
 
 def cell_vector(position):
@@ -20,12 +722,12 @@ def cell_vector(position):
     """Returns cell noise vector at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
 
     Returns:
-        Vector: The cell noise vector."""
+        Vector: The cell noise vector, a VectorArray for an array of positions."""
 
-    pass
+    return _generator.cell_vector(position)
 
 
 def fractal(position, H, lacunarity, octaves, noise_basis = types.STDPERLIN):
@@ -33,16 +735,16 @@ def fractal(position, H, lacunarity, octaves, noise_basis = types.STDPERLIN):
     """Returns the fractal Brownian motion (fBm) noise value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         H (float): The fractal increment factor.
         lacunarity (float): The gap between successive frequencies.
         octaves (int): The number of different noise frequencies used.
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The fractal Brownian motion noise value."""
+        float: The fractal Brownian motion noise value, an array of values for an array of positions."""
 
-    pass
+    return _generator.fractal(position, H, lacunarity, octaves, noise_basis)
 
 
 def hetero_terrain(position, H, lacunarity, octaves, offset, noise_basis = types.STDPERLIN):
@@ -50,7 +752,7 @@ def hetero_terrain(position, H, lacunarity, octaves, offset, noise_basis = types
     """Returns the heterogeneous terrain value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         H (float): The fractal dimension of the roughest areas.
         lacunarity (float): The gap between successive frequencies.
         octaves (int): The number of different noise frequencies used.
@@ -58,9 +760,9 @@ def hetero_terrain(position, H, lacunarity, octaves, offset, noise_basis = types
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The heterogeneous terrain value."""
+        float: The heterogeneous terrain value, an array of values for an array of positions."""
 
-    pass
+    return _generator.hetero_terrain(position, H, lacunarity, octaves, offset, noise_basis)
 
 
 def hybrid_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_basis = types.STDPERLIN):
@@ -68,7 +770,7 @@ def hybrid_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_b
     """Returns hybrid multifractal value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         H (float): The fractal dimension of the roughest areas.
         lacunarity (float): The gap between successive frequencies.
         octaves (int): The number of different noise frequencies used.
@@ -77,9 +779,9 @@ def hybrid_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_b
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The hybrid multifractal value."""
+        float: The hybrid multifractal value, an array of values for an array of positions."""
 
-    pass
+    return _generator.hybrid_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_basis)
 
 
 def multi_fractal(position, H, lacunarity, octaves, noise_basis = types.STDPERLIN):
@@ -87,16 +789,16 @@ def multi_fractal(position, H, lacunarity, octaves, noise_basis = types.STDPERLI
     """Returns multifractal noise value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         H (float): The fractal increment factor.
         lacunarity (float): The gap between successive frequencies.
         octaves (int): The number of different noise frequencies used.
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The multifractal noise value."""
+        float: The multifractal noise value, an array of values for an array of positions."""
 
-    pass
+    return _generator.multi_fractal(position, H, lacunarity, octaves, noise_basis)
 
 
 def noise(position, noise_basis = types.STDPERLIN):
@@ -104,13 +806,13 @@ def noise(position, noise_basis = types.STDPERLIN):
     """Returns noise value from the noise basis at the position specified.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The noise value."""
+        float: The noise value, an array of values for an array of positions."""
 
-    pass
+    return _generator.noise(position, noise_basis)
 
 
 def noise_vector(position, noise_basis = types.STDPERLIN):
@@ -118,13 +820,13 @@ def noise_vector(position, noise_basis = types.STDPERLIN):
     """Returns the noise vector from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        Vector: The noise vector."""
+        Vector: The noise vector, a VectorArray for an array of positions."""
 
-    pass
+    return _generator.noise_vector(position, noise_basis)
 
 
 def random() -> float:
@@ -134,7 +836,7 @@ def random() -> float:
     Returns:
         float: The random number."""
 
-    pass
+    return _generator.random()
 
 
 def random_unit_vector(size = 3):
@@ -147,7 +849,20 @@ def random_unit_vector(size = 3):
     Returns:
         Vector: The random unit vector."""
 
-    pass
+    return _generator.random_unit_vector(size)
+
+
+def random_vector(size = 3):
+    # type: (int) -> _Vector
+    """Returns a vector with random values inside the unit sphere.
+
+    Args:
+        size (int): The size of the vector to be produced.
+
+    Returns:
+        Vector: The random vector."""
+
+    return _generator.random_vector(size)
 
 
 def ridged_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_basis = types.STDPERLIN):
@@ -155,7 +870,7 @@ def ridged_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_b
     """Returns ridged multifractal value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         H (float): The fractal dimension of the roughest areas.
         lacunarity (float): The gap between successive frequencies.
         octaves (int): The number of different noise frequencies used.
@@ -164,9 +879,9 @@ def ridged_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_b
         noise_basis (int): The type of noise to be evaluated.
 
     Returns:
-        float: The ridged multifractal value."""
+        float: The ridged multifractal value, an array of values for an array of positions."""
 
-    pass
+    return _generator.ridged_multi_fractal(position, H, lacunarity, octaves, offset, gain, noise_basis)
 
 
 def seed_set(seed):
@@ -176,7 +891,7 @@ def seed_set(seed):
     Args:
         seed (int): Seed used for the random generator. When seed is zero, the current time will be used instead."""
 
-    pass
+    _generator.seed_set(seed)
 
 
 def turbulence(position, octaves, hard, noise_basis = types.STDPERLIN, amplitude_scale = 0.5, frequency_scale = 2.0):
@@ -184,7 +899,7 @@ def turbulence(position, octaves, hard, noise_basis = types.STDPERLIN, amplitude
     """Returns the turbulence value from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         octaves (int): The number of different noise frequencies used.
         hard (bool): Specifies whether returned turbulence is hard (sharp transitions) or soft (smooth transitions).
         noise_basis (int): The type of noise to be evaluated.
@@ -192,9 +907,9 @@ def turbulence(position, octaves, hard, noise_basis = types.STDPERLIN, amplitude
         frequency_scale (float): The frequency scaling factor
 
     Returns:
-        float: The turbulence value."""
+        float: The turbulence value, an array of values for an array of positions."""
 
-    pass
+    return _generator.turbulence(position, octaves, hard, noise_basis, amplitude_scale, frequency_scale)
 
 
 def turbulence_vector(position, octaves, hard, noise_basis = types.STDPERLIN, amplitude_scale = 0.5, frequency_scale = 2.0):
@@ -202,7 +917,7 @@ def turbulence_vector(position, octaves, hard, noise_basis = types.STDPERLIN, am
     """Returns the turbulence vector from the noise basis at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         octaves (int): The number of different noise frequencies used.
         hard (bool): Specifies whether returned turbulence is hard (sharp transitions) or soft (smooth transitions).
         noise_basis (int): The type of noise to be evaluated.
@@ -210,9 +925,9 @@ def turbulence_vector(position, octaves, hard, noise_basis = types.STDPERLIN, am
         frequency_scale (float): The frequency scaling factor
 
     Returns:
-        Vector: The turbulence vector."""
+        Vector: The turbulence vector, a VectorArray for an array of positions."""
 
-    pass
+    return _generator.turbulence_vector(position, octaves, hard, noise_basis, amplitude_scale, frequency_scale)
 
 
 def variable_lacunarity(position, distortion, noise_type1 = types.STDPERLIN, noise_type2 = types.STDPERLIN):
@@ -220,15 +935,15 @@ def variable_lacunarity(position, distortion, noise_type1 = types.STDPERLIN, noi
     """Returns variable lacunarity noise value, a distorted variety of noise, from noise type 1 distorted by noise type 2 at the specified position.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         distortion (float): The amount of distortion.
         noise_type1 (int): The type of noise to be distorted.
         noise_type2 (int): The type of noise used to distort noise_type1.
 
     Returns:
-        float: The variable lacunarity noise value."""
+        float: The variable lacunarity noise value, an array of values for an array of positions."""
 
-    pass
+    return _generator.variable_lacunarity(position, distortion, noise_type1, noise_type2)
 
 
 def voronoi(position, distance_metric, exponent = 2.5):
@@ -236,11 +951,13 @@ def voronoi(position, distance_metric, exponent = 2.5):
     """Returns a list of distances to the four closest features and their locations.
 
     Args:
-        position (Vector): The position to evaluate the selected noise function at.
+        position (Vector): The position to evaluate the selected noise function at, or an (N, 3) array of positions.
         distance_metric (int): Method of measuring distance.
         exponent (float): The exponent for Minkowski distance metric.
 
     Returns:
-        list: A list of distances to the four closest features and their locations."""
+        list: A list of distances to the four closest features and their locations. For an array of positions, a
+            (distances, locations) tuple holding 4 distances per position in an array and 4 locations per position in
+            a VectorArray."""
 
-    pass
+    return _generator.voronoi(position, distance_metric, exponent)
@@ -0,0 +1,213 @@
+"""Tiled, multi-process evaluation of noise functions over regular grids, see mathutils.noise.bake_field()."""
+
+import mmap as _mmap
+import multiprocessing as _multiprocessing
+import os as _os
+from array import array as _array
+
+from .._buffer import as_coords as _as_coords
+
+_targets = {}
+"""Output buffers of the bakes running in this process, by bake id. Forked workers inherit the anonymous ones."""
+
+_generators = {}
+"""NoiseGenerator per seed, created once per worker process."""
+
+
+def _grid_axis(low, high, count):
+    # type: (float, float, int) -> list
+    """Sample coordinates of one grid axis, both bounds included."""
+
+    if count == 1:
+        return [float(low)]
+
+    step = (high - low) / (count - 1)
+    return [low + step * i for i in range(count)]
+
+
+def _tiles(shape, tile_size):
+    # type: (tuple, int) -> list
+    """Split a (z, y, x) grid shape into (z0, z1, y0, y1, x0, x1) blocks of at most tile_size samples a side."""
+
+    nz, ny, nx = shape
+    tz = 1 if nz == 1 else tile_size
+    return [(z0, min(z0 + tz, nz), y0, min(y0 + tile_size, ny), x0, min(x0 + tile_size, nx))
+            for z0 in range(0, nz, tz)
+            for y0 in range(0, ny, tile_size)
+            for x0 in range(0, nx, tile_size)]
+
+
+def _resolve(func, seed):
+    # type: (object, int) -> object
+    """Callable evaluating positions, mathutils.noise functions (or their names) are bound to a seeded generator."""
+
+    if isinstance(func, str):
+        name = func
+
+    elif getattr(func, "__module__", None) == "mathutils.noise":
+        name = func.__name__
+
+    else:
+        return func
+
+    generator = _generators.get(seed)
+
+    if generator is None:
+        from . import NoiseGenerator
+        generator = _generators[seed] = NoiseGenerator(seed)
+
+    return getattr(generator, name)
+
+
+def _samples(func, positions, count, args):
+    # type: (object, _array, int, tuple) -> _array
+    """Evaluate func on a flat position array, flattening the result to count * channels doubles."""
+
+    result = func(positions, *args)
+
+    if isinstance(result, tuple):
+        # voronoi() gives (distances, locations), the distances are baked
+        result = result[0]
+
+    if not isinstance(result, _array):
+        result = _as_coords(result, 1)
+
+    if not count or len(result) % count:
+        raise ValueError("bake_field: func returned %d values for %d positions" % (len(result), count))
+
+    return result
+
+
+def _evaluate_tile(job):
+    # type: (tuple) -> int
+    """Worker entry point, evaluate one tile and write it into the bake's output buffer."""
+
+    key, path, func, args, seed, axes, shape, channels, typecode, tile = job
+    view = _targets.get(key)
+
+    if view is None:
+        # Spawned workers map the output file themselves
+        with open(path, "r+b") as file:
+            view = _targets[key] = memoryview(_mmap.mmap(file.fileno(), 0)).cast(typecode)
+
+    xs, ys, zs = axes
+    nz, ny, nx = shape
+    z0, z1, y0, y1, x0, x1 = tile
+    width = x1 - x0
+    row = _array("d", [0.0, 0.0, 0.0]) * width
+    row[0::3] = _array("d", xs[x0:x1])
+    positions = _array("d")
+
+    for z in zs[z0:z1]:
+        row[2::3] = _array("d", [z]) * width
+
+        for y in ys[y0:y1]:
+            row[1::3] = _array("d", [y]) * width
+            positions.extend(row)
+
+    count = len(positions) // 3
+    values = _samples(_resolve(func, seed), positions, count, args)
+
+    if len(values) != count * channels:
+        raise ValueError("bake_field: func returned a varying number of values per position")
+
+    if typecode != "d":
+        values = _array(typecode, values)
+
+    run = width * channels
+    start = 0
+
+    for z in range(z0, z1):
+        for y in range(y0, y1):
+            offset = ((z * ny + y) * nx + x0) * channels
+            view[offset:offset + run] = values[start:start + run]
+            start += run
+
+    return count
+
+
+def _release(key):
+    # type: (object) -> None
+    view = _targets.pop(key, None)
+
+    if view is not None:
+        view.release()
+
+
+def bake(func, bounds, resolution, workers, args, seed, tile_size, filepath, typecode):
+    # type: (object, tuple, tuple, int, tuple, int, int, str, str) -> memoryview
+    """Implementation of mathutils.noise.bake_field()."""
+
+    dimensions = len(resolution)
+
+    if dimensions not in (2, 3):
+        raise ValueError("bake_field: resolution must have 2 or 3 items")
+
+    low, high = bounds
+
+    if len(low) != dimensions or len(high) != dimensions:
+        raise ValueError("bake_field: bounds must be two %dD corners" % dimensions)
+
+    if min(resolution) < 1 or tile_size < 1:
+        raise ValueError("bake_field: resolution and tile_size must be positive")
+
+    if typecode not in ("f", "d"):
+        raise ValueError("bake_field: typecode must be 'f' or 'd'")
+
+    axes = [_grid_axis(low[i], high[i], int(resolution[i])) for i in range(dimensions)]
+
+    if dimensions == 2:
+        axes.append([0.0])
+
+    shape = (len(axes[2]), len(axes[1]), len(axes[0]))
+    samples = shape[0] * shape[1] * shape[2]
+
+    # Probe one position for the number of values per sample before allocating the output
+    channels = len(_samples(_resolve(func, seed), _array("d", [axes[0][0], axes[1][0], axes[2][0]]), 1, args))
+    size = samples * channels * _array(typecode).itemsize
+
+    if workers is None:
+        workers = _os.cpu_count() or 1
+
+    context = None
+
+    if workers > 1:
+        methods = _multiprocessing.get_all_start_methods()
+
+        if filepath is not None or "fork" in methods:
+            context = _multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    if filepath is not None:
+        with open(filepath, "w+b") as file:
+            file.truncate(size)
+            buffer = _mmap.mmap(file.fileno(), size)
+
+    else:
+        # Anonymous shared mapping, seen by forked workers
+        buffer = _mmap.mmap(-1, size)
+
+    key = (_os.getpid(), id(buffer))
+    _targets[key] = memoryview(buffer).cast(typecode)
+    tiles = _tiles(shape, tile_size)
+    jobs = [(key, filepath, func, tuple(args), seed, axes, shape, channels, typecode, tile) for tile in tiles]
+
+    try:
+        if context is None or len(tiles) == 1:
+            for job in jobs:
+                _evaluate_tile(job)
+
+        else:
+            with context.Pool(min(workers, len(tiles))) as pool:
+                for _ in pool.imap_unordered(_evaluate_tile, jobs):
+                    pass
+
+    finally:
+        _release(key)
+
+    if dimensions == 2:
+        shape = shape[1:]
+
+    if channels > 1:
+        shape += (channels,)
+
+    return memoryview(buffer).cast(typecode, shape)
@@ -1,3 +1,52 @@
 """mathutils.noise.types"""
 
+BLENDER = 0  # type: int
+"""Blender's original gradient noise."""
+
 STDPERLIN = 1  # type: int
+"""Ken Perlin's original gradient noise."""
+
+NEWPERLIN = 2  # type: int
+"""Ken Perlin's improved noise, with a quintic interpolant and fixed gradient set."""
+
+VORONOI_F1 = 3  # type: int
+"""Distance to the closest Voronoi feature point."""
+
+VORONOI_F2 = 4  # type: int
+"""Distance to the second closest Voronoi feature point."""
+
+VORONOI_F3 = 5  # type: int
+"""Distance to the third closest Voronoi feature point."""
+
+VORONOI_F4 = 6  # type: int
+"""Distance to the fourth closest Voronoi feature point."""
+
+VORONOI_F2F1 = 7  # type: int
+"""Difference between the second and first closest Voronoi feature point distances."""
+
+VORONOI_CRACKLE = 8  # type: int
+"""Voronoi F2 - F1 scaled and clamped to give sharp cracks."""
+
+CELLNOISE = 14  # type: int
+"""Constant random value inside each unit cell."""
+
+DISTANCE = 0  # type: int
+"""Euclidean distance metric."""
+
+DISTANCE_SQUARED = 1  # type: int
+"""Squared euclidean distance metric."""
+
+MANHATTAN = 2  # type: int
+"""Sum of the absolute coordinate differences."""
+
+CHEBYCHEV = 3  # type: int
+"""Largest absolute coordinate difference."""
+
+MINKOVSKY_HALF = 4  # type: int
+"""Minkowski distance metric with an exponent of 0.5."""
+
+MINKOVSKY_FOUR = 5  # type: int
+"""Minkowski distance metric with an exponent of 4."""
+
+MINKOVSKY = 6  # type: int
+"""Minkowski distance metric using the given exponent."""
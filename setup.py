@@ -26,6 +26,7 @@ setup(
 		"bpy",
 		"bpy/app",
 		"bpy/ops",
+		"bpy/types",
 		"bpy/utils",
 
 		"bpy_extras",
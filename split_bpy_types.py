@@ -0,0 +1,176 @@
+"""Generates the bpy.types package: its classes split into small shard modules loaded on first access.
+
+Usage: python split_bpy_types.py [source]
+
+The source is a monolithic types module (e.g. the output of the API dump). Without it, the classes of the current shards
+are read back and split again, so changing SHARD_LINES only needs a rerun. bpy/types/__init__.py is regenerated with
+the name to shard index, the lazy loader and the static imports used by completion engines."""
+
+import ast
+import os
+import sys
+import textwrap
+
+PACKAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bpy", "types")
+
+SHARD_LINES = 400
+"""Line count above which a shard is closed, a single larger class gets a shard of its own."""
+
+INIT_TEMPLATE = """'''Blender data types (bpy.types)
+
+Generated by split_bpy_types.py, do not edit. The classes are defined in the {shards} _sNNN shard modules, a shard is
+only imported when one of its classes is first accessed. '''
+
+import sys
+from importlib import import_module as _import_module
+
+TYPE_CHECKING = False
+'''True only for static analysers, typing is not imported at runtime just for its flag '''
+
+if TYPE_CHECKING:
+{imports}
+
+_SHARDS = {{
+{index}
+}}
+'''Shard module defining each class '''
+
+
+def __getattr__(name):
+    '''Import the shard defining a class on first access and bind all of its classes on the package
+
+    '''
+
+    shard = _SHARDS.get(name)
+
+    if shard is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    module = _import_module("." + shard, __name__)
+    namespace = globals()
+
+    for key, value in vars(module).items():
+        if _SHARDS.get(key) == shard:
+            value.__module__ = __name__
+            namespace[key] = value
+
+    return namespace[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SHARDS))
+"""
+
+def readClasses(source):
+	"""Return (name, base names, source text) for each top level class of a module source."""
+
+	lines = source.splitlines()
+	classes = []
+
+	for node in ast.parse(source).body:
+		if isinstance(node, ast.ClassDef):
+			text = "\n".join(lines[node.lineno - 1:node.end_lineno])
+			classes.append((node.name, [base.id for base in node.bases], text))
+
+		elif not isinstance(node, (ast.Import, ast.ImportFrom)):
+			raise ValueError("Unexpected top level statement at line %d" % node.lineno)
+
+	return classes
+
+def readShards():
+	"""Read the classes back from the current shards, in shard order."""
+
+	classes = []
+
+	for fileName in sorted(os.listdir(PACKAGE)):
+		if fileName.startswith("_s") and fileName.endswith(".py"):
+			with open(os.path.join(PACKAGE, fileName)) as openedFile:
+				classes += readClasses(openedFile.read())
+
+	return classes
+
+def splitClasses(classes):
+	"""Group consecutive classes into shards of about SHARD_LINES lines."""
+
+	shards = [[]]
+	count = 0
+
+	for item in classes:
+		size = item[2].count("\n") + 3
+
+		if shards[-1] and count + size > SHARD_LINES:
+			shards.append([])
+			count = 0
+
+		shards[-1].append(item)
+		count += size
+
+	return shards
+
+def shardSource(shard, defined):
+	"""Source of a shard module, bases defined in other shards are imported from the package."""
+
+	body = "\n\n\n".join(text for _, _, text in shard)
+	header = ["from __future__ import annotations", "", "import sys"]
+
+	if "mathutils" in body:
+		header.append("import mathutils")
+
+	if "bpy" in body:
+		header.append("import bpy")
+
+	local = set(name for name, _, _ in shard)
+	bases = sorted(set(base for _, names, _ in shard for base in names if base not in local))
+
+	for base in bases:
+		if base not in defined:
+			raise ValueError("Base class %s must be defined before its subclasses" % base)
+
+	if bases:
+		header.append("from . import " + ", ".join(bases))
+
+	# The annotations are never evaluated at runtime, typing is only imported by static analysers
+	header += ["", "TYPE_CHECKING = False", "", "if TYPE_CHECKING:", "    import typing"]
+
+	return "\n".join(header) + "\n\n\n" + body + "\n"
+
+def main():
+	if len(sys.argv) > 1:
+		with open(sys.argv[1]) as openedFile:
+			classes = readClasses(openedFile.read())
+
+	else:
+		classes = readShards()
+
+	shards = splitClasses(classes)
+	names = ["_s%03d" % i for i in range(len(shards))]
+	os.makedirs(PACKAGE, exist_ok=True)
+
+	for fileName in os.listdir(PACKAGE):
+		if fileName.startswith("_s") and fileName.endswith(".py"):
+			os.remove(os.path.join(PACKAGE, fileName))
+
+	defined = set()
+
+	for name, shard in zip(names, shards):
+		with open(os.path.join(PACKAGE, name + ".py"), "w") as openedFile:
+			openedFile.write(shardSource(shard, defined))
+
+		defined.update(className for className, _, _ in shard)
+
+	imports = []
+	index = []
+
+	for name, shard in zip(names, shards):
+		classNames = textwrap.fill(", ".join(className for className, _, _ in shard), 112, initial_indent=" " * 8,
+			subsequent_indent=" " * 8, break_on_hyphens=False)
+		imports.append("    from .%s import (\n%s)" % (name, classNames))
+		index += ['    "%s": "%s",' % (className, name) for className, _, _ in shard]
+
+	with open(os.path.join(PACKAGE, "__init__.py"), "w") as openedFile:
+		openedFile.write(INIT_TEMPLATE.format(shards=len(shards), imports="\n".join(imports), index="\n".join(index)))
+
+	print("Wrote %d classes into %d shards" % (len(classes), len(shards)))
+
+if __name__ == "__main__":
+	main()
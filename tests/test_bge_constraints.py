@@ -0,0 +1,311 @@
+import array
+import math
+import unittest
+
+from bge import constraints, logic, types
+from bge.types._character import GRAVITY
+from mathutils import Matrix, Vector
+
+
+def body(name, position, radius, mass=1.0):
+    object = types.KX_GameObject(name)
+    object.worldPosition = position
+    object._radius = radius
+    object.mass = mass
+    object.restoreDynamics()
+    object.enableRigidBody()
+    return object
+
+
+def box(name, lo, hi, position=(0.0, 0.0, 0.0), tilt=0.0):
+    object = types.KX_GameObject(name)
+    mesh = types.KX_MeshProxy(name)
+    index = mesh._addVertexArray("M", 2)
+    mesh._arrays[index].positions[:] = array.array("f", list(lo) + list(hi))
+    object.meshes.append(mesh)
+    object.worldPosition = position
+
+    if tilt:
+        object.worldOrientation = Matrix.Rotation(math.radians(tilt), 3, "X")
+
+    return object
+
+
+class PhysicsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = logic._engine
+        self.engine.reset()
+        self.engine.fastForward = True
+        self.scene = types.KX_Scene("Main")
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.fastForward = False
+
+    def start(self, *objects):
+        for object in objects:
+            self.scene.objects.append(object)
+
+        logic.addScene(self.scene)
+        logic.step(1)
+
+
+class PendulumTest(PhysicsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.bob = body("Bob", (1.0, 0.0, 5.0), 0.1)
+        self.start(self.bob)
+        # Pivot 1 unit left of the bob, fixed to the world
+        self.constraint = constraints.createConstraint(self.bob.getPhysicsId(), 0,
+                                                       constraints.POINTTOPOINT_CONSTRAINT, -1.0, 0.0, 0.0)
+        self.pivot = Vector((0.0, 0.0, 5.0))
+
+    def energy(self):
+        # Per unit of mass, zero at the height of the pivot
+        return 0.5 * self.bob.getLinearVelocity().length_squared + 9.8 * (self.bob.worldPosition.z - self.pivot.z)
+
+    def test_swing(self):
+        self.assertIsNotNone(self.constraint)
+        self.assertIs(constraints.getVehicleConstraint(self.constraint.getConstraintId()), None)
+        energy = self.energy()
+        xs = []
+        zs = []
+
+        for _ in range(240):
+            logic.step(1)
+            self.assertAlmostEqual((self.bob.worldPosition - self.pivot).length, 1.0, delta=0.03)
+            # The solver may lengthen the rope by its tolerance, never add more energy than that
+            self.assertLess(self.energy(), energy + 9.8 * 0.03)
+            xs.append(self.bob.worldPosition.x)
+            zs.append(self.bob.worldPosition.z)
+
+        # Down through the bottom to the other side and back
+        self.assertLess(min(xs), -0.9)
+        self.assertGreater(max(xs[60:]), 0.5)
+        self.assertAlmostEqual(min(zs), 4.0, delta=0.03)
+
+    def test_remove(self):
+        logic.step(30)
+        constraints.removeConstraint(self.constraint.getConstraintId())
+        logic.step(60)
+        self.assertLess(self.bob.worldPosition.z, self.pivot.z - 1.5)
+
+
+class SnapshotTest(PhysicsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.balls = [body("Ball%d" % index, (index * 0.3, index * 0.1, 2.0 + index), 0.5) for index in range(4)]
+        self.start(box("Ground", (-10.0, -10.0, -1.0), (10.0, 10.0, 0.0)), *self.balls)
+        constraints.createConstraint(self.balls[3].getPhysicsId(), self.balls[2].getPhysicsId(),
+                                     constraints.POINTTOPOINT_CONSTRAINT, 0.0, 0.0, -1.0)
+
+    def state(self):
+        return [(tuple(ball.worldPosition), tuple(tuple(row) for row in ball.worldOrientation),
+                 tuple(ball.getLinearVelocity()), tuple(ball.getAngularVelocity())) for ball in self.balls]
+
+    def play(self, frames):
+        states = []
+
+        for _ in range(frames):
+            logic.step(1)
+            states.append(self.state())
+
+        return states
+
+    def test_replay(self):
+        logic.step(20)
+        snapshot = self.scene.snapshotPhysics()
+        before = self.state()
+        # Through the landings on the ground, the swings of the linked pair and the first ball going to sleep
+        states = self.play(180)
+        self.assertNotEqual(states[-1], before)
+
+        self.scene.restorePhysics(snapshot)
+        self.assertEqual(self.state(), before)
+        self.assertEqual(self.play(180), states)
+
+    def test_older_snapshot(self):
+        snapshots = []
+        states = []
+
+        for _ in range(5):
+            snapshots.append(self.scene.snapshotPhysics())
+            states.append(self.play(10))
+
+        # The later snapshots only copied the objects that moved, restoring an older one still restores them all
+        self.scene.restorePhysics(snapshots[1])
+        self.assertEqual(self.play(10), states[1])
+        self.scene.restorePhysics(snapshots[3])
+        self.assertEqual(self.play(10), states[3])
+
+    def test_dropped_snapshot(self):
+        with self.assertRaises(ValueError):
+            self.scene.restorePhysics(0)
+
+        first = self.scene.snapshotPhysics()
+
+        for _ in range(64):
+            logic.step(1)
+            last = self.scene.snapshotPhysics()
+
+        with self.assertRaises(ValueError):
+            self.scene.restorePhysics(first)
+
+        self.scene.restorePhysics(last)
+
+
+class VehicleTest(PhysicsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chassis = body("Chassis", (0.0, 0.0, 2.0), 1.3, 1000.0)
+        self.wheels = [box("Wheel%d" % index, (-0.3, -0.3, -0.3), (0.3, 0.3, 0.3)) for index in range(4)]
+        self.start(box("Ground", (-50.0, -50.0, -1.0), (50.0, 50.0, 0.0)), self.chassis, *self.wheels)
+        self.vehicle = constraints.createVehicle(self.chassis.getPhysicsId())
+
+        for index, (x, y) in enumerate(((-1.0, 1.5), (1.0, 1.5), (-1.0, -1.5), (1.0, -1.5))):
+            self.vehicle.addWheel(self.wheels[index], (x, y, -0.8), (0.0, 0.0, -1.0), (-1.0, 0.0, 0.0), 0.4, 0.35, y > 0.0)
+            self.vehicle.setSuspensionStiffness(20.0, index)
+            self.vehicle.setSuspensionDamping(2.3, index)
+            self.vehicle.setSuspensionCompression(4.4, index)
+            self.vehicle.setRollInfluence(0.1, index)
+
+        logic.step(120)
+
+    def test_settle(self):
+        # Resting on the compressed suspension: attachment, spring length and wheel radius above the ground
+        self.assertAlmostEqual(self.chassis.worldPosition.z, 0.8 + 0.278 + 0.35, delta=0.01)
+        self.assertLess(self.chassis.getLinearVelocity().length, 0.01)
+        self.assertEqual(self.vehicle.getNumWheels(), 4)
+        self.assertAlmostEqual(self.vehicle.getWheelPosition(0).z, 0.35, delta=0.01)
+        self.assertAlmostEqual(self.wheels[0].worldPosition.z, 0.35, delta=0.01)
+        self.assertIs(constraints.getVehicleConstraint(self.vehicle.getConstraintId())._vehicle, self.vehicle._vehicle)
+
+    def test_drive(self):
+        self.vehicle.applyEngineForce(800.0, 2)
+        self.vehicle.applyEngineForce(800.0, 3)
+        logic.step(120)
+        position = self.chassis.worldPosition.copy()
+        self.assertLess(position.y, -2.0)
+        self.assertAlmostEqual(position.x, 0.0, delta=0.01)
+        self.assertAlmostEqual(position.z, 1.428, delta=0.01)
+        self.assertGreater(self.chassis.getLinearVelocity().length, 2.0)
+        self.assertNotEqual(self.vehicle.getWheelRotation(2), 0.0)
+        self.assertAlmostEqual(self.wheels[2].worldPosition.y, position.y - 1.5, delta=0.05)
+
+        self.vehicle.applyEngineForce(0.0, 2)
+        self.vehicle.applyEngineForce(0.0, 3)
+        self.vehicle.setSteeringValue(0.3, 0)
+        self.vehicle.setSteeringValue(0.3, 1)
+        logic.step(60)
+        self.assertNotAlmostEqual(self.chassis.getAngularVelocity().z, 0.0, delta=0.1)
+        self.assertNotAlmostEqual(self.chassis.worldPosition.x, 0.0, delta=0.05)
+
+        for index in range(4):
+            self.vehicle.applyBraking(100.0, index)
+
+        logic.step(120)
+        self.assertLess(self.chassis.getLinearVelocity().length, 0.01)
+
+    def test_remove(self):
+        with self.assertRaises(ValueError):
+            self.vehicle.applyBraking(1.0, 7)
+
+        constraints.removeConstraint(self.vehicle.getConstraintId())
+        self.assertIsNone(constraints.getVehicleConstraint(self.vehicle.getConstraintId()))
+        # Without its wheels the chassis drops until its own radius rests on the ground
+        logic.step(120)
+        self.assertAlmostEqual(self.chassis.worldPosition.z, 1.3, delta=0.01)
+
+
+class CharacterTest(PhysicsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.object = box("Character", (-0.5, -0.5, -1.0), (0.5, 0.5, 1.0), (0.0, 0.0, 3.0))
+        self.object._radius = 0.5
+        self.start(box("Ground", (-50.0, -50.0, -1.0), (50.0, 50.0, 0.0)),
+                   box("Step", (-1.0, 4.0, 0.0), (1.0, 6.0, 0.1)),
+                   box("Wall", (9.0, -5.0, 0.0), (10.0, 5.0, 3.0)),
+                   box("Ramp", (-2.0, -5.0, -0.5), (2.0, 5.0, 0.5), (-20.0, 0.0, 0.0), 20.0),
+                   box("Steep", (-2.0, -5.0, -0.5), (2.0, 5.0, 0.5), (-30.0, 0.0, 0.0), 60.0),
+                   self.object)
+        self.character = constraints.getCharacter(self.object)
+        logic.step(60)
+
+    def test_land(self):
+        # Half the capsule height and the margin kept above the ground
+        self.assertTrue(self.character.onGround)
+        self.assertAlmostEqual(self.object.worldPosition.z, 1.01, delta=0.005)
+        self.assertEqual(self.character.jumpCount, 0)
+        self.assertEqual(self.character.gravity, GRAVITY)
+        self.assertIsNone(constraints.getCharacter(body("Body", (0.0, 0.0, 0.0), 1.0)))
+
+    def test_walk(self):
+        self.character.walkDirection = (0.0, -2.0, 0.0)
+        logic.step(60)
+        self.assertAlmostEqual(self.object.worldPosition.y, -2.0, delta=0.05)
+        self.assertAlmostEqual(self.object.worldPosition.z, 1.01, delta=0.005)
+        self.assertTrue(self.character.onGround)
+
+        # Stopped by the wall, the radius and the margin away from it
+        self.character.walkDirection = (5.0, 0.0, 0.0)
+        logic.step(180)
+        self.assertAlmostEqual(self.object.worldPosition.x, 8.49, delta=0.005)
+
+        # Up the low step
+        self.object.worldPosition = (0.0, 0.0, 1.02)
+        self.character.walkDirection = (0.0, 3.0, 0.0)
+        logic.step(120)
+        self.assertAlmostEqual(self.object.worldPosition.z, 1.11, delta=0.005)
+        self.assertTrue(self.character.onGround)
+
+    def test_slopes(self):
+        self.object.worldPosition = (-20.0, -12.0, 1.02)
+        self.character.walkDirection = (0.0, 4.0, 0.0)
+        logic.step(240)
+        self.assertGreater(self.object.worldPosition.z, 2.5)
+        self.assertTrue(self.character.onGround)
+
+        # Too steep to walk up, or to stand on
+        self.object.worldPosition = (-30.0, -12.0, 1.02)
+        logic.step(240)
+        self.assertLess(self.object.worldPosition.y, -0.5)
+        self.assertAlmostEqual(self.object.worldPosition.z, 1.01, delta=0.005)
+
+        self.object.worldPosition = (-30.0, 0.0, 3.5)
+        self.character.walkDirection = (0.0, 0.0, 0.0)
+        logic.step(120)
+        self.assertAlmostEqual(self.object.worldPosition.z, 1.01, delta=0.005)
+
+    def test_jump(self):
+        self.character.jump()
+        self.assertEqual(self.character.jumpCount, 1)
+        top = 0.0
+
+        for _ in range(60):
+            logic.step(1)
+            top = max(top, self.object.worldPosition.z)
+
+        # Stepped at 60 Hz, the top of the jump is half a frame of travel below its exact height
+        speed = self.character.jumpSpeed
+        self.assertAlmostEqual(top, 1.01 + speed ** 2 / (2.0 * GRAVITY) - speed / 120.0, delta=0.01)
+        self.assertTrue(self.character.onGround)
+        self.assertEqual(self.character.jumpCount, 0)
+
+        # A second jump in the air only with maxJumps
+        self.character.jump()
+        logic.step(5)
+        self.character.jump()
+        self.assertEqual(self.character.jumpCount, 1)
+        self.character.maxJumps = 2
+        self.character.jump()
+        self.character.jump()
+        self.assertEqual(self.character.jumpCount, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
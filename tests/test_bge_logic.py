@@ -0,0 +1,377 @@
+import os
+import random
+import tempfile
+import unittest
+
+from bge import logic, types
+from bge.logic._instances import InstanceError
+from bge.logic._persist import MAGIC, GlobalDict, Store, _decode
+from bge.logic._runtime import registerObject, removeObjects, updateCulled
+from bge.types._action import FRAME_RATE, updateActions
+
+
+class Counter(types.KX_PythonComponent):
+
+    def update(self):
+        self.object["updates"] += 1
+        # Components run before the logic bricks of the frame
+        self.object["seen"].append(self.object["runs"])
+
+
+class RuntimeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = logic._engine
+        self.engine.reset()
+        self.engine.fastForward = True
+        self.scene = types.KX_Scene("Main")
+        self.object = types.KX_GameObject("Object")
+        self.object["updates"] = self.object["runs"] = 0
+        self.object["seen"] = []
+        sensor = types.SCA_AlwaysSensor()
+        sensor.usePosPulseMode = True
+        controller = types.SCA_PythonController()
+        controller.script = "import bge\nbge.logic.getCurrentController().owner['runs'] += 1"
+        controller.sensors.append(sensor)
+        self.object.sensors.append(sensor)
+        self.object.controllers.append(controller)
+        Counter(self.object)
+        self.scene.objects.append(self.object)
+        self.draws = []
+        self.scene.pre_draw.append(lambda: self.draws.append(self.engine.frame))
+        self.engine.addScene(self.scene)
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.fastForward = False
+        self.engine.useExternalClock = False
+
+    def test_fast_forward(self):
+        for frame in range(1, 4):
+            logic.NextFrame()
+            self.assertEqual(self.engine.frame, frame)
+
+        self.assertEqual((self.object["updates"], self.object["runs"]), (3, 3))
+        self.assertEqual(self.object["seen"], [0, 1, 2])
+        self.assertEqual(self.draws, [1, 2, 3])
+        self.assertAlmostEqual(logic.getFrameTime(), 3.0 / 60.0)
+
+    def test_step(self):
+        self.assertEqual(logic.step(10), 10)
+        self.assertEqual(self.object["runs"], 10)
+        # Drawn once per batch
+        self.assertEqual(self.draws, [10])
+        self.assertAlmostEqual(logic.getClockTime(), 10.0 / 60.0)
+
+    def test_external_clock(self):
+        self.engine.fastForward = False
+        logic.setUseExternalClock(True)
+        logic.setClockTime(0.05)
+        self.assertEqual(self.engine.nextFrame(), 3)
+        # The frames the logic can't catch up with are dropped
+        logic.setClockTime(1.05)
+        self.assertEqual(self.engine.nextFrame(), logic.getMaxLogicFrame())
+        self.assertAlmostEqual(logic.getFrameTime(), 1.05)
+        self.assertEqual(self.object["runs"], 3 + logic.getMaxLogicFrame())
+
+    def test_end_object_and_game(self):
+        logic.step()
+        self.object.endObject()
+        self.assertFalse(self.object.invalid)
+        logic.step()
+        self.assertTrue(self.object.invalid)
+        self.assertEqual(len(self.scene.objects), 0)
+        logic.endGame()
+        self.assertEqual(logic.step(5), 1)
+        self.assertEqual(len(logic.getSceneList()), 0)
+        self.assertEqual(logic.getFrameTime(), 0.0)
+
+
+class Walker(types.KX_PythonComponent):
+
+    def update(self):
+        self.object.worldPosition.x += logic.getRandomFloat()
+
+
+def setupWalker(index):
+    # Module level functions, the instances are spawned and import this module
+    scene = types.KX_Scene("Main")
+    walker = types.KX_GameObject("Walker")
+    walker.worldPosition = (0.0, 0.0, 0.0)
+    Walker(walker)
+    scene.objects.append(walker)
+    logic.addScene(scene)
+
+
+def walkerPosition(index):
+    return logic.getSceneList()[0].objects["Walker"].worldPosition.x
+
+
+def failSecondInstance(index):
+    if index == 1:
+        raise ValueError("bad input")
+
+
+class InstancePoolTest(unittest.TestCase):
+
+    def test_deterministic_instances(self):
+        with logic.startInstances(setupWalker, 2, seed=3) as pool:
+            positions = pool.step(10, walkerPosition)
+
+        # Instance i gets the same seed whatever the number of instances
+        with logic.startInstances(setupWalker, 3, seed=3) as pool:
+            self.assertEqual(pool.step(10, walkerPosition)[:2], positions)
+
+        self.assertNotEqual(positions[0], positions[1])
+
+    def test_orders(self):
+        pool = logic.startInstances(setupWalker, 2)
+
+        with pool:
+            self.assertEqual(pool.step(5), [5, 5])
+            self.assertEqual(pool.call(walkerPosition), pool.step(0, walkerPosition))
+
+            with self.assertRaises(InstanceError) as context:
+                pool.call(failSecondInstance)
+
+            self.assertTrue(str(context.exception).startswith("instance 1 failed"))
+            self.assertIn("ValueError: bad input", str(context.exception))
+            self.assertEqual(len(pool.step(1)), 2)
+
+        with self.assertRaises(RuntimeError):
+            pool.step()
+
+
+class SensorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = logic._engine
+        self.engine.reset()
+        self.engine.fastForward = True
+        self.scene = types.KX_Scene("Main")
+        self.engine.addScene(self.scene)
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.fastForward = False
+
+    def attach(self, sensor):
+        object = types.KX_GameObject("Object")
+        object["log"] = []
+        controller = types.SCA_PythonController()
+        controller.script = ("import bge\n"
+                             "controller = bge.logic.getCurrentController()\n"
+                             "controller.owner['log'].append((bge.logic._engine.frame, controller.sensors[0].positive))")
+        controller.sensors.append(sensor)
+        object.sensors.append(sensor)
+        object.controllers.append(controller)
+        self.scene.objects.append(object)
+        return object
+
+    def evaluated(self, frames, changes=None):
+        counts = []
+
+        for frame in range(1, frames + 1):
+            if changes and frame in changes:
+                changes[frame]()
+
+            logic.step()
+            counts.append(self.scene._logicInfo["sensors"])
+
+        return counts
+
+    def test_property_wakes(self):
+        sensor = types.SCA_PropertySensor()
+        sensor.mode = 1
+        sensor.propName = "health"
+        sensor.value = "3"
+        object = self.attach(sensor)
+        object["health"] = 0
+        counts = self.evaluated(8, {3: lambda: object.__setitem__("health", 3),
+                                    5: lambda: object.__setitem__("health", 4)})
+        self.assertEqual(object["log"], [(3, True), (5, False)])
+        self.assertNotIn(sensor, self.scene._polledSensors)
+        # Evaluated when added, when woken and once more after a trigger; idle otherwise
+        self.assertEqual(counts, [1, 0, 1, 1, 1, 1, 0, 0])
+
+    def test_delay_timer(self):
+        sensor = types.SCA_DelaySensor()
+        sensor.delay = 3
+        sensor.duration = 2
+        object = self.attach(sensor)
+        counts = self.evaluated(10)
+        self.assertEqual(object["log"], [(4, True), (6, False)])
+        self.assertEqual(counts, [1, 0, 0, 1, 1, 1, 1, 0, 0, 0])
+
+    def test_always_pulse(self):
+        once = self.attach(types.SCA_AlwaysSensor())
+        sensor = types.SCA_AlwaysSensor()
+        sensor.usePosPulseMode = True
+        pulsed = self.attach(sensor)
+        self.evaluated(4)
+        self.assertEqual(once["log"], [(1, True)])
+        self.assertEqual(pulsed["log"], [(frame, True) for frame in range(1, 5)])
+        self.assertIn(sensor, self.scene._polledSensors)
+
+    def test_removed_owner(self):
+        sensor = types.SCA_DelaySensor()
+        sensor.delay = 2
+        object = self.attach(sensor)
+        logic.step()
+        object.endObject()
+        logic.step()
+        self.assertEqual(self.evaluated(3), [0, 0, 0])
+        self.assertEqual(object["log"], [])
+
+
+class ActivityCullingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.random = random.Random(4)
+        self.scene = types.KX_Scene("Main")
+        self.scene.activity_culling = True
+        self.scene.activity_culling_radius = 10.0
+        self.camera = types.KX_Camera()
+        self.add(self.camera)
+        self.scene.active_camera = self.camera
+
+        for index in range(200):
+            self.add(types.KX_GameObject("Object%d" % index))
+
+    def add(self, object):
+        object.worldPosition = [self.random.uniform(-40.0, 40.0) for _ in range(3)]
+        self.scene.objects.append(object)
+        registerObject(self.scene, object)
+
+    def expected(self):
+        camera = self.camera.worldPosition
+        return {object for object in self.scene.objects if object is not self.camera
+                and max(abs(a - b) for a, b in zip(object.worldPosition, camera)) > 10.0}
+
+    def test_moving_objects_and_camera(self):
+        for frame in range(30):
+            for object in self.random.sample(list(self.scene.objects), 20):
+                object.worldPosition.x += self.random.uniform(-15.0, 15.0)
+
+            if frame == 10:
+                self.add(types.KX_GameObject("Added"))
+
+            if frame == 20:
+                removeObjects(self.scene, list(self.scene.objects)[1:4])
+
+            self.assertEqual(updateCulled(self.scene, list(self.scene.objects)), self.expected())
+
+    def test_added_object(self):
+        updateCulled(self.scene, list(self.scene.objects))
+        template = types.KX_GameObject("Template")
+        template.worldPosition = (100.0, 0.0, 0.0)
+        replica = self.scene.addObject(template, template)
+        self.assertIn(replica, updateCulled(self.scene, list(self.scene.objects)))
+
+    def test_culling_turned_off(self):
+        updateCulled(self.scene, list(self.scene.objects))
+        self.scene.activity_culling = False
+        self.assertEqual(updateCulled(self.scene, list(self.scene.objects)), set())
+        self.assertIsNone(self.scene._active)
+
+
+class ActionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scene = types.KX_Scene("Main")
+        self.object = types.KX_GameObject("Object")
+        registerObject(self.scene, self.object)
+
+    def advance(self, frames):
+        for _ in range(frames):
+            updateActions(self.scene, 1.0 / FRAME_RATE)
+
+    def test_play(self):
+        self.object.playAction("Walk", 0.0, 4.0, speed=0.5)
+        self.advance(3)
+        self.assertEqual(self.object.getActionFrame(), 1.5)
+        self.advance(5)
+        self.assertFalse(self.object.isPlayingAction())
+        self.assertNotIn(self.object, self.scene._animated)
+
+    def test_loop_and_ping_pong(self):
+        self.object.playAction("Loop", 10.0, 13.0, play_mode=logic.KX_ACTION_MODE_LOOP)
+        self.object.playAction("Swing", 0.0, 2.0, layer=1, play_mode=logic.KX_ACTION_MODE_PING_PONG)
+        self.advance(4)
+        self.assertEqual(self.object.getActionFrame(), 11.0)
+        self.assertEqual(self.object.getActionFrame(1), 0.0)
+        self.assertEqual(self.object.getActionName(1), "Swing")
+
+    def test_priority(self):
+        self.object.playAction("First", 0.0, 10.0, priority=1)
+        self.object.playAction("Second", 0.0, 10.0, priority=2)
+        self.assertEqual(self.object.getActionName(), "First")
+
+        with self.assertRaises(ValueError):
+            self.object.playAction("Out", 0.0, 10.0, layer=8)
+
+
+class PersistTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = Store()
+        self.dictionary = GlobalDict(("key%d" % index, ("level", index)) for index in range(100))
+        self.dictionary["inventory"] = [1]
+        self.dictionary["player"] = {"x": 1}
+        self.store.encode(self.dictionary)
+
+    def reload(self, records):
+        return _decode(MAGIC + b"".join(records), Store())
+
+    def test_one_changed_key(self):
+        self.dictionary["key5"] = ("changed",)
+        records = self.store.encode(self.dictionary)
+        # The changed key and the two containers
+        self.assertEqual(self.store.encoded, 3)
+        self.assertEqual(self.reload(records), self.dictionary)
+
+    def test_changed_in_place(self):
+        self.dictionary["inventory"].append(2)
+        self.dictionary["player"]["x"] = 99
+        self.assertEqual(self.reload(self.store.encode(self.dictionary)),
+                         dict(self.dictionary, inventory=[1, 2], player={"x": 99}))
+        self.dictionary["player"]["x"] = 100
+        self.assertEqual(self.reload(self.store.encode(self.dictionary))["player"], {"x": 100})
+
+    def test_replaced_container(self):
+        self.dictionary["inventory"] = ("sword",)
+        self.store.encode(self.dictionary)
+        self.store.encode(self.dictionary)
+        self.assertEqual(self.store.encoded, 1)
+
+    def test_deleted_keys(self):
+        del self.dictionary["key1"]
+        self.dictionary.pop("inventory")
+        records = self.store.encode(self.dictionary)
+        self.assertEqual(self.store.encoded, 1)
+        self.assertEqual(len(records), 100)
+
+    def test_plain_dictionary(self):
+        records = self.store.encode(dict(self.dictionary))
+        # The records of the same immutable values are reused
+        self.assertEqual(self.store.encoded, 2)
+        self.assertEqual(len(records), 102)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.bgeconf")
+            logic.globalDict.clear()
+            logic.globalDict.update(inventory=[1], hp=3)
+            logic.saveGlobalDict(path)
+            logic.globalDict["inventory"].append(2)
+            logic.globalDict["player"] = {"x": 1}
+            logic.saveGlobalDict(path)
+            logic.globalDict["player"]["x"] = 99
+            logic.saveGlobalDict(path)
+            logic.loadGlobalDict(path)
+            self.assertEqual(logic.globalDict, {"inventory": [1, 2], "hp": 3, "player": {"x": 99}})
+            logic.globalDict.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import math
+import unittest
+
+from bge import types
+from bge.logic._runtime import registerObject
+from mathutils import Euler, Matrix, Vector
+
+
+class ReplicateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.template = types.KX_GameObject("Template")
+        sensor = types.SCA_AlwaysSensor()
+        sensor.owner = self.template
+        sensor["count"] = 1
+        self.template.sensors.append(sensor)
+
+    def assertTemplateUntouched(self, replica):
+        replica.sensors[0]["count"] = 2
+        replica.sensors[0]["extra"] = True
+        self.assertEqual(self.template.sensors[0]["count"], 1)
+        self.assertNotIn("extra", self.template.sensors[0])
+        self.assertIsNot(replica.sensors[0]._watchers, self.template.sensors[0]._watchers)
+
+    def test_fresh_replica_bricks(self):
+        self.assertTemplateUntouched(self.template._replicate())
+
+    def test_recycled_replica_bricks(self):
+        ended = self.template._replicate()
+        replica = self.template._replicate(ended)
+        self.assertIs(replica, ended)
+        self.assertTemplateUntouched(replica)
+
+
+class CListValueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.objects = [types.KX_GameObject(name) for name in ("Cube", "Lamp", "Cube", "Camera")]
+        self.list = types.CListValue(self.objects)
+
+    def assertIndexed(self):
+        # The indexes agree with a scan of the list
+        for item in self.list:
+            self.assertIs(self.list[item.name], next(other for other in self.list if other.name == item.name))
+            self.assertIs(self.list.from_id(id(item)), item)
+
+        self.assertEqual(set(self.list._named()), {item.name for item in self.list})
+
+    def test_lookups(self):
+        self.assertIs(self.list["Cube"], self.objects[0])
+        self.assertIn("Camera", self.list)
+        self.assertIn(self.objects[1], self.list)
+        self.assertIsNone(self.list.get("Empty"))
+        self.assertEqual(self.list.index(self.objects[2]), 2)
+
+        with self.assertRaises(KeyError):
+            self.list["Empty"]
+
+    def test_append_and_remove(self):
+        self.list._remove(self.objects[0])
+        self.assertIs(self.list["Cube"], self.objects[2])
+        self.list.append(self.objects[0])
+        self.assertIs(self.list["Cube"], self.objects[2])
+        self.list._removeAll(self.objects[1:3])
+        self.assertNotIn("Lamp", self.list)
+        self.assertNotIn(self.objects[2], self.list)
+
+        with self.assertRaises(IndexError):
+            self.list.from_id(id(self.objects[2]))
+
+        self.assertIndexed()
+
+    def test_rename(self):
+        self.objects[0].name = "Box"
+        self.assertIs(self.list["Box"], self.objects[0])
+        self.assertIs(self.list["Cube"], self.objects[2])
+        self.objects[2].name = "Box"
+        self.assertNotIn("Cube", self.list)
+        self.assertIs(self.list["Box"], self.objects[0])
+        self.list._remove(self.objects[0])
+        self.assertIs(self.list["Box"], self.objects[2])
+        self.assertIndexed()
+
+    def test_rename_outside(self):
+        self.list._remove(self.objects[1])
+        self.objects[1].name = "Light"
+        self.list.append(self.objects[1])
+        self.assertIs(self.list["Light"], self.objects[1])
+        self.assertNotIn("Lamp", self.list)
+        self.assertIndexed()
+
+    def test_replace_and_reverse(self):
+        self.list[0] = types.KX_GameObject("Empty")
+        self.assertIs(self.list["Cube"], self.objects[2])
+        self.list.reverse()
+        self.list[0] = self.objects[0]
+        self.assertIs(self.list["Cube"], self.objects[0])
+        self.assertEqual([item.name for item in self.list], ["Cube", "Cube", "Lamp", "Empty"])
+        self.assertIndexed()
+
+
+class TrackedPositionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scene = types.KX_Scene("Main")
+        self.object = types.KX_GameObject("Object")
+        registerObject(self.scene, self.object)
+        self.scene._spatial.dirty.clear()
+
+    def test_reads_do_not_move(self):
+        position = self.object.worldPosition
+        position.x, position.is_frozen, position.xy
+        self.assertNotIn(self.object, self.scene._spatial.dirty)
+
+    def test_changes_move(self):
+        position = self.object.worldPosition
+
+        for change in (lambda: setattr(position, "x", 1.0), lambda: setattr(position, "yz", (2.0, 3.0)),
+                       position.negate, position.zero):
+            change()
+            self.assertIn(self.object, self.scene._spatial.dirty)
+            self.scene._spatial.dirty.clear()
+
+    def test_default_scale_changes_move(self):
+        self.object.worldScale.x = 2.0
+        self.assertIn(self.object, self.scene._spatial.dirty)
+        self.assertEqual(self.object.localScale, Vector((2.0, 1.0, 1.0)))
+
+    def test_orientation_write_moves(self):
+        orientation = self.object.worldOrientation
+        orientation[0][0] = -1.0
+        self.assertNotIn(self.object, self.scene._spatial.dirty)
+        self.object.worldOrientation = orientation
+        self.assertIn(self.object, self.scene._spatial.dirty)
+
+    def test_freeze(self):
+        position = self.object.worldPosition.freeze()
+        self.assertTrue(position.is_frozen)
+
+        with self.assertRaises(TypeError):
+            position.x = 1.0
+
+        self.assertNotIn(self.object, self.scene._spatial.dirty)
+
+
+class VertexArraysTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = types.KX_MeshProxy("Mesh")
+
+    def test_single_material(self):
+        self.mesh._addVertexArray("First", 3)
+        self.mesh._addVertexArray("Second", 4)
+        self.assertEqual(len(self.mesh.getVertexArrays(1)["positions"]), 4)
+
+    def test_all_materials_rejected(self):
+        self.mesh._addVertexArray("First", 3)
+
+        with self.assertRaises(ValueError):
+            self.mesh.getVertexArrays(-1)
+
+    def test_empty_mesh(self):
+        with self.assertRaises(ValueError):
+            self.mesh.getVertexArrays(0)
+
+
+class TransformTest(unittest.TestCase):
+
+    def setUp(self):
+        self.object = types.KX_GameObject("Object")
+
+    def test_derived_attributes(self):
+        self.object.worldPosition = (1.0, 2.0, 3.0)
+        self.object.localOrientation = Euler((0.0, 0.0, math.pi / 2.0))
+        self.object.localScale = (2.0, 2.0, 2.0)
+
+        for orientation in (self.object.worldOrientation, self.object.orientation):
+            self.assertAlmostEqual(orientation[1][0], 1.0)
+
+        self.assertEqual(self.object.scaling, Vector((2.0, 2.0, 2.0)))
+        transform = self.object.worldTransform
+        self.assertEqual(transform.to_translation(), Vector((1.0, 2.0, 3.0)))
+        self.assertAlmostEqual(transform[1][0], 2.0)
+        self.assertEqual(self.object.localTransform, transform)
+
+    def test_write_transform(self):
+        self.object.worldTransform = Matrix.Translation((4.0, 5.0, 6.0)) * Matrix.Scale(3.0, 4)
+        self.assertEqual(self.object.worldPosition, Vector((4.0, 5.0, 6.0)))
+        self.assertEqual(self.object.worldScale, Vector((3.0, 3.0, 3.0)))
+        self.assertEqual(self.object.worldOrientation, Matrix.Identity(3))
+
+    def test_default_transform(self):
+        for orientation in (self.object.worldOrientation, self.object.localOrientation, self.object.orientation):
+            self.assertEqual(orientation, Matrix.Identity(3))
+
+        for scale in (self.object.worldScale, self.object.localScale, self.object.scaling):
+            self.assertEqual(scale, Vector((1.0, 1.0, 1.0)))
+
+    def test_orientation_copy(self):
+        self.object.worldOrientation[0][0] = 0.0
+        self.assertEqual(self.object.worldOrientation, Matrix.Identity(3))
+        orientation = self.object.worldOrientation
+        orientation[0][0] = 0.0
+        self.object.worldOrientation = orientation
+        self.assertEqual(self.object.localOrientation[0][0], 0.0)
+
+    def test_replica_transform(self):
+        self.object.worldOrientation = Matrix.Identity(3)
+        self.object.worldScale = (1.0, 2.0, 3.0)
+        replica = self.object._replicate()
+        replica.worldScale.x = 5.0
+        replica.worldOrientation[0][0] = 0.0
+        self.assertEqual(self.object.worldScale.x, 1.0)
+        self.assertEqual(self.object.worldOrientation[0][0], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded(script):
+    # Fresh interpreter, so that the modules imported by the other tests don't count
+    output = subprocess.check_output([sys.executable, "-c", "import json, sys\n" + script], cwd=ROOT)
+    return json.loads(output)
+
+
+class LazySubmodulesTest(unittest.TestCase):
+
+    def test_import_loads_nothing(self):
+        modules = loaded("import bpy\n"
+                         "print(json.dumps(sorted(name for name in sys.modules if name.startswith('bpy.'))))")
+        self.assertEqual(modules, [])
+
+    def test_operator_category(self):
+        modules = loaded("import bpy\n"
+                         "bpy.ops.mesh.primitive_cube_add\n"
+                         "print(json.dumps(sorted(name for name in sys.modules if name.startswith('bpy.'))))")
+        self.assertEqual(modules, ["bpy.ops", "bpy.ops.mesh"])
+
+    def test_attributes(self):
+        import bpy
+        import bpy.ops
+
+        self.assertIs(bpy.ops, sys.modules["bpy.ops"])
+        self.assertIn("types", dir(bpy))
+        self.assertIn("mesh", dir(bpy.ops))
+        self.assertIsNone(bpy.context)
+
+        with self.assertRaises(AttributeError):
+            bpy.unknown
+
+        with self.assertRaises(AttributeError):
+            bpy.ops.unknown
+
+
+class TypeShardsTest(unittest.TestCase):
+
+    def test_single_shard(self):
+        shards = loaded("import bpy\n"
+                        "bpy.types.Object\n"
+                        "print(json.dumps(sorted(name for name in sys.modules if name.startswith('bpy.types.'))))")
+        self.assertEqual(len(shards), 1)
+
+    def test_class_identity(self):
+        import pickle
+        import bpy.types
+        from bpy.types import Object, Panel
+
+        self.assertIs(Object, bpy.types.Object)
+        self.assertEqual(Object.__module__, "bpy.types")
+        self.assertEqual(repr(Object), "<class 'bpy.types.Object'>")
+        self.assertIs(pickle.loads(pickle.dumps(Object)), Object)
+        self.assertIs(bpy.types.BONE_PT_constraints.__mro__[1], Panel)
+
+    def test_names(self):
+        import bpy.types
+
+        self.assertIn("Mesh", dir(bpy.types))
+
+        with self.assertRaises(AttributeError):
+            bpy.types.Unknown
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,464 @@
+import random
+import unittest
+
+from mathutils import Euler, Matrix, MatrixArray, Vector, VectorArray, geometry, noise
+from mathutils.bvhtree import BVHTree
+from mathutils.kdtree import KDTree
+
+
+class MatrixWriteThroughTest(unittest.TestCase):
+
+    def test_translation_component(self):
+        matrix = Matrix()
+        matrix.translation.x = 5.0
+        self.assertEqual(matrix[0][3], 5.0)
+
+    def test_translation_in_place(self):
+        matrix = Matrix()
+        translation = matrix.translation
+        translation += Vector((1.0, 2.0, 3.0))
+        self.assertEqual([row[3] for row in matrix], [1.0, 2.0, 3.0, 1.0])
+        self.assertIs(translation.owner, matrix)
+
+    def test_column_component(self):
+        matrix = Matrix()
+        matrix.col[0][1] = 3.0
+        self.assertEqual(matrix[1][0], 3.0)
+
+    def test_column_swizzle_and_reads(self):
+        matrix = Matrix()
+        column = matrix.col[2]
+        column.xy = (4.0, 5.0)
+        self.assertEqual((matrix[0][2], matrix[1][2]), (4.0, 5.0))
+        matrix[2][2] = 7.0
+        self.assertEqual(column.z, 7.0)
+
+    def test_frozen_matrix(self):
+        matrix = Matrix().freeze()
+
+        with self.assertRaises(TypeError):
+            matrix.translation.x = 1.0
+
+        with self.assertRaises(TypeError):
+            matrix.col[0][0] = 1.0
+
+
+class ArrayTestCase(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(3)
+        self.vectors = [Vector([generator.uniform(-5.0, 5.0) for axis in range(3)]) for index in range(8)]
+        self.others = [Vector([generator.uniform(-5.0, 5.0) for axis in range(3)]) for index in range(8)]
+        self.matrices = [Matrix.Translation(vector) * Euler(other / 5.0).to_matrix().to_4x4()
+                         for vector, other in zip(self.vectors, self.others)]
+
+    def assertValuesAlmostEqual(self, first, second):
+        self.assertEqual(len(first), len(second))
+
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b)
+
+
+class VectorArrayTest(ArrayTestCase):
+
+    def test_arithmetic(self):
+        array = VectorArray(self.vectors)
+        other = VectorArray(self.others)
+
+        for result, expected in ((array + other, [a + b for a, b in zip(self.vectors, self.others)]),
+                                 (array - other, [a - b for a, b in zip(self.vectors, self.others)]),
+                                 (array * 2.0, [a * 2.0 for a in self.vectors]),
+                                 (-array, [-a for a in self.vectors]),
+                                 (array.cross(other), [a.cross(b) for a, b in zip(self.vectors, self.others)]),
+                                 (array.normalized(), [a.normalized() for a in self.vectors]),
+                                 (array.lerp(other, 0.25), [a.lerp(b, 0.25) for a, b in zip(self.vectors, self.others)])):
+            self.assertEqual(len(result), len(expected))
+
+            for vector, value in zip(result, expected):
+                self.assertValuesAlmostEqual(vector, value)
+
+        self.assertValuesAlmostEqual(array.dot(other), [a.dot(b) for a, b in zip(self.vectors, self.others)])
+        self.assertValuesAlmostEqual(array.length, [a.length for a in self.vectors])
+
+    def test_broadcast_vector(self):
+        offset = Vector((1.0, 2.0, 3.0))
+
+        for vector, value in zip(VectorArray(self.vectors) + offset, self.vectors):
+            self.assertValuesAlmostEqual(vector, value + offset)
+
+    def test_in_place(self):
+        array = VectorArray(self.vectors)
+        array.normalize()
+        array.negate()
+
+        for vector, value in zip(array, self.vectors):
+            self.assertValuesAlmostEqual(vector, -value.normalized())
+
+        array[0] = (1.0, 2.0, 3.0)
+        self.assertEqual(array[0], Vector((1.0, 2.0, 3.0)))
+
+    def test_transform(self):
+        array = VectorArray(self.vectors)
+
+        for vector, value, matrix in zip(MatrixArray(self.matrices) * array, self.vectors, self.matrices):
+            self.assertValuesAlmostEqual(vector, matrix * value)
+
+        array.transform(self.matrices[0])
+
+        for vector, value in zip(array, self.vectors):
+            self.assertValuesAlmostEqual(vector, self.matrices[0] * value)
+
+    def test_flat_buffer(self):
+        array = VectorArray(self.vectors)
+        self.assertEqual(VectorArray(array.buffer.cast("B").cast("d")), array)
+        self.assertEqual(len(VectorArray.Fill(5)), 5)
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            VectorArray(self.vectors) + VectorArray(self.others[:3])
+
+
+class MatrixArrayTest(ArrayTestCase):
+
+    def assertMatricesAlmostEqual(self, array, matrices):
+        self.assertEqual(len(array), len(matrices))
+
+        for matrix, value in zip(array, matrices):
+            for row, expected in zip(matrix, value):
+                self.assertValuesAlmostEqual(row, expected)
+
+    def test_products(self):
+        array = MatrixArray(self.matrices)
+        rotation = Matrix.Rotation(0.5, 4, "Z")
+        self.assertMatricesAlmostEqual(array * array, [a * a for a in self.matrices])
+        self.assertMatricesAlmostEqual(array * rotation, [a * rotation for a in self.matrices])
+        self.assertMatricesAlmostEqual(rotation * array, [rotation * a for a in self.matrices])
+
+    def test_inverted_transposed(self):
+        array = MatrixArray(self.matrices)
+        self.assertMatricesAlmostEqual(array.inverted(), [a.inverted() for a in self.matrices])
+        self.assertMatricesAlmostEqual(array.transposed(), [a.transposed() for a in self.matrices])
+        self.assertValuesAlmostEqual(array.determinant(), [a.determinant() for a in self.matrices])
+
+    def test_singular_fallback(self):
+        array = MatrixArray([Matrix.Scale(0.0, 4), self.matrices[0]])
+
+        with self.assertRaises(ValueError):
+            array.inverted()
+
+        self.assertEqual(array.inverted(Matrix.Identity(4))[0], Matrix.Identity(4))
+
+    def test_translation(self):
+        array = MatrixArray.Translation(VectorArray(self.vectors))
+        self.assertMatricesAlmostEqual(array, [Matrix.Translation(vector) for vector in self.vectors])
+
+        for translation, vector in zip(MatrixArray(self.matrices).translation, self.vectors):
+            self.assertValuesAlmostEqual(translation, vector)
+
+
+class NoiseTest(unittest.TestCase):
+
+    positions = [(0.1 * index, 0.37 * index - 2.0, 1.3 - 0.21 * index) for index in range(16)]
+
+    def samples(self, generator):
+        return (generator.noise(self.positions[3]), generator.noise(self.positions[5], noise.types.VORONOI_F1),
+                generator.fractal(self.positions[7], 1.0, 2.0, 4), generator.cell(self.positions[9]),
+                generator.random(), tuple(generator.random_vector()))
+
+    def test_seeded_generators(self):
+        self.assertEqual(self.samples(noise.NoiseGenerator(7)), self.samples(noise.NoiseGenerator(7)))
+        self.assertNotEqual(self.samples(noise.NoiseGenerator(7)), self.samples(noise.NoiseGenerator(8)))
+
+    def test_generators_are_independent(self):
+        expected = self.samples(noise.NoiseGenerator(7))
+        noise.seed_set(1)
+        noise.random()
+        self.assertEqual(self.samples(noise.NoiseGenerator(7)), expected)
+
+    def test_array_positions(self):
+        generator = noise.NoiseGenerator(4)
+        array = VectorArray(self.positions)
+
+        for basis in (noise.types.BLENDER, noise.types.STDPERLIN, noise.types.NEWPERLIN, noise.types.VORONOI_F2F1,
+                      noise.types.CELLNOISE):
+            self.assertEqual(list(generator.noise(array, basis)),
+                             [generator.noise(position, basis) for position in self.positions])
+
+        self.assertEqual(list(generator.turbulence_vector(self.positions, 3, False)),
+                         [generator.turbulence_vector(position, 3, False) for position in self.positions])
+
+    def test_signed_range(self):
+        generator = noise.NoiseGenerator(2)
+
+        for basis in (noise.types.BLENDER, noise.types.STDPERLIN, noise.types.VORONOI_F1, noise.types.CELLNOISE):
+            for value in generator.noise(self.positions, basis):
+                self.assertTrue(-1.0 <= value <= 1.0)
+
+
+class BakeFieldTest(unittest.TestCase):
+
+    def test_workers_and_tiles(self):
+        single = noise.bake_field(noise.noise, ((0.0, 0.0), (3.0, 2.0)), (7, 5), workers=1, seed=5)
+        tiled = noise.bake_field("noise", ((0.0, 0.0), (3.0, 2.0)), (7, 5), workers=3, seed=5, tile_size=3)
+        self.assertEqual(single.shape, (5, 7))
+        self.assertEqual(tiled.tolist(), single.tolist())
+        self.assertEqual(single[1, 2], noise.NoiseGenerator(5).noise((1.0, 0.5, 0.0)))
+
+    def test_channels(self):
+        field = noise.bake_field(noise.voronoi, ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0)), (3, 3, 2), workers=2, args=(0,),
+                                 seed=1, tile_size=2)
+        self.assertEqual(field.shape, (2, 3, 3, 4))
+        self.assertEqual(field.tolist()[1][2][0], noise.NoiseGenerator(1).voronoi((0.0, 1.0, 1.0), 0)[0])
+
+
+class GeometryTest(unittest.TestCase):
+
+    triangle = (Vector((0.0, 0.0, 0.0)), Vector((1.0, 0.0, 0.0)), Vector((0.0, 1.0, 0.0)))
+
+    def setUp(self):
+        generator = random.Random(5)
+        self.points = [Vector([generator.uniform(-2.0, 2.0) for axis in range(3)]) for index in range(40)]
+
+    def assertGathered(self, gathered, expected):
+        locations, hits = gathered
+        self.assertEqual(list(hits), [int(value is not None) for value in expected])
+
+        for index, value in enumerate(expected):
+            for a, b in zip(locations[index * 3:index * 3 + 3], (0.0, 0.0, 0.0) if value is None else value):
+                self.assertAlmostEqual(a, b)
+
+    def test_known_values(self):
+        self.assertAlmostEqual(geometry.area_tri(*self.triangle), 0.5)
+        up = Vector((0.0, 0.0, 1.0))
+        self.assertAlmostEqual(geometry.distance_point_to_plane((0.0, 0.0, -2.0), self.triangle[0], up), -2.0)
+        self.assertEqual(geometry.intersect_line_plane((1.0, 1.0, 1.0), (1.0, 1.0, 2.0), self.triangle[0], up),
+                         Vector((1.0, 1.0, 0.0)))
+        self.assertEqual(geometry.intersect_line_sphere((-2.0, 0.0, 0.0), (2.0, 0.0, 0.0), self.triangle[0], 1.0),
+                         (Vector((1.0, 0.0, 0.0)), Vector((-1.0, 0.0, 0.0))))
+        self.assertIsNone(geometry.intersect_point_tri((1.0, 1.0, 0.0), *self.triangle))
+
+    def test_many_kernels(self):
+        shifted = [point + Vector((0.5, -0.25, 1.0)) for point in self.points]
+        normal = Vector((0.3, 0.4, 1.0))
+        areas = geometry.area_tri_many(self.points, shifted, self.triangle[1])
+        self.assertEqual(list(areas), [geometry.area_tri(a, b, self.triangle[1]) for a, b in zip(self.points, shifted)])
+        self.assertEqual(list(geometry.distance_point_to_plane_many(self.points, self.triangle[1], normal)),
+                         [geometry.distance_point_to_plane(point, self.triangle[1], normal) for point in self.points])
+        self.assertGathered(geometry.intersect_line_plane_many(self.points, shifted, self.triangle[0], normal),
+                            [geometry.intersect_line_plane(a, b, self.triangle[0], normal)
+                             for a, b in zip(self.points, shifted)])
+        self.assertGathered(geometry.intersect_point_tri_many(self.points, *self.triangle),
+                            [geometry.intersect_point_tri(point, *self.triangle) for point in self.points])
+        self.assertGathered(geometry.intersect_ray_tri_many(*self.triangle, shifted, self.points, False),
+                            [geometry.intersect_ray_tri(*self.triangle, ray, point, False)
+                             for ray, point in zip(shifted, self.points)])
+
+    def test_many_spheres(self):
+        radii = [0.5 + index * 0.05 for index in range(len(self.points))]
+        first, first_hits, second, second_hits = geometry.intersect_line_sphere_many(self.points, self.triangle[1],
+                                                                                      self.triangle[2], radii)
+        expected = [geometry.intersect_line_sphere(point, self.triangle[1], self.triangle[2], radius)
+                    for point, radius in zip(self.points, radii)]
+        self.assertGathered((first, first_hits), [pair[0] for pair in expected])
+        self.assertGathered((second, second_hits), [pair[1] for pair in expected])
+        self.assertIn(1, first_hits)
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            geometry.area_tri_many(self.points, self.points[:3], self.triangle[0])
+
+    def test_ray_tri_behind_origin(self):
+        origin = Vector((0.2, 0.2, 1.0))
+        self.assertIsNone(geometry.intersect_ray_tri(*self.triangle, Vector((0.0, 0.0, 1.0)), origin))
+        self.assertIsNone(geometry.intersect_ray_tri(*self.triangle, Vector((0.0, 0.0, 1.0)), origin, False))
+        self.assertEqual(geometry.intersect_ray_tri(*self.triangle, Vector((0.0, 0.0, -1.0)), origin),
+                         Vector((0.2, 0.2, 0.0)))
+
+    def test_ray_tri_many_behind_origin(self):
+        rays = [(0.0, 0.0, 1.0), (0.0, 0.0, -1.0)]
+        locations, hits = geometry.intersect_ray_tri_many(*self.triangle, rays, Vector((0.2, 0.2, 1.0)))
+        self.assertEqual(list(hits), [0, 1])
+        self.assertEqual(list(locations[3:]), [0.2, 0.2, 0.0])
+
+
+class KDTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(1)
+        self.points = [tuple(generator.uniform(-10.0, 10.0) for axis in range(3)) for index in range(200)]
+        self.queries = [tuple(generator.uniform(-12.0, 12.0) for axis in range(3)) for index in range(20)]
+        self.tree = KDTree(len(self.points))
+
+        for index, point in enumerate(self.points):
+            self.tree.insert(point, index)
+
+        self.tree.balance()
+
+    def nearest(self, co):
+        return sorted(((Vector(point) - Vector(co)).length, index) for index, point in enumerate(self.points))
+
+    def test_find(self):
+        for co in self.queries:
+            distance, index = self.nearest(co)[0]
+            location, found, found_distance = self.tree.find(co)
+            self.assertEqual(found, index)
+            self.assertEqual(location, Vector(self.points[index]))
+            self.assertAlmostEqual(found_distance, distance)
+
+    def test_find_filter(self):
+        co = self.queries[0]
+        expected = [index for distance, index in self.nearest(co) if index % 2][0]
+        self.assertEqual(self.tree.find(co, lambda index: index % 2)[1], expected)
+
+    def test_find_n(self):
+        for co in self.queries:
+            expected = [index for distance, index in self.nearest(co)[:5]]
+            self.assertEqual([index for location, index, distance in self.tree.find_n(co, 5)], expected)
+
+    def test_find_range(self):
+        for co in self.queries:
+            expected = [index for distance, index in self.nearest(co) if distance <= 4.0]
+            self.assertEqual([index for location, index, distance in self.tree.find_range(co, 4.0)], expected)
+
+    def test_many_queries(self):
+        indices, distances = self.tree.find_many(self.queries)
+        self.assertEqual(list(indices), [self.tree.find(co)[1] for co in self.queries])
+        indices, distances = self.tree.find_n_many(self.queries, 3)
+        self.assertEqual(list(indices), [result[1] for co in self.queries for result in self.tree.find_n(co, 3)])
+        offsets, indices, distances = self.tree.find_range_many(self.queries, 4.0)
+
+        for query, co in enumerate(self.queries):
+            self.assertEqual(list(indices[offsets[query]:offsets[query + 1]]),
+                             [result[1] for result in self.tree.find_range(co, 4.0)])
+
+    def test_empty_tree(self):
+        tree = KDTree(0)
+        tree.balance()
+        self.assertEqual(tree.find((0.0, 0.0, 0.0)), (None, None, None))
+        self.assertEqual(list(tree.find_many([(0.0, 0.0, 0.0)])[0]), [-1])
+
+
+class BVHTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(2)
+        self.vertices = []
+
+        for index in range(60):
+            center = Vector([generator.uniform(-5.0, 5.0) for axis in range(3)])
+            self.vertices.extend(center + Vector([generator.uniform(-1.0, 1.0) for axis in range(3)]) for corner in range(3))
+
+        self.polygons = [(index, index + 1, index + 2) for index in range(0, len(self.vertices), 3)]
+        self.tree = BVHTree.FromPolygons(self.vertices, self.polygons)
+        self.rays = []
+
+        for index in range(100):
+            origin = Vector([generator.uniform(-8.0, 8.0) for axis in range(3)])
+            # Half of the rays are aimed at a triangle so that most of them hit
+            target = sum(self.vertices[index * 3 % 180:index * 3 % 180 + 3], Vector()) / 3.0
+            direction = target - origin if index % 2 else Vector([generator.gauss(0.0, 1.0) for axis in range(3)])
+            self.rays.append((origin, direction.normalized()))
+
+    def nearestHit(self, origin, direction):
+        hits = []
+
+        for index, polygon in enumerate(self.polygons):
+            location = geometry.intersect_ray_tri(*[self.vertices[vertex] for vertex in polygon], direction, origin)
+
+            if location is not None:
+                hits.append(((location - origin).length, index))
+
+        return min(hits) if hits else (None, None)
+
+    def test_ray_cast(self):
+        for origin, direction in self.rays:
+            distance, index = self.nearestHit(origin, direction)
+            location, normal, found, found_distance = self.tree.ray_cast(origin, direction)
+            self.assertEqual(found, index)
+
+            if index is not None:
+                self.assertAlmostEqual(found_distance, distance)
+                self.assertAlmostEqual((location - (origin + direction * distance)).length, 0.0)
+
+    def test_ray_cast_many(self):
+        locations, normals, indices, distances = self.tree.ray_cast_many([origin for origin, direction in self.rays],
+                                                                         [direction for origin, direction in self.rays])
+
+        for ray, (origin, direction) in enumerate(self.rays):
+            index = self.tree.ray_cast(origin, direction)[2]
+            self.assertEqual(indices[ray], -1 if index is None else index)
+
+    def test_overlap(self):
+        # 3x3 grid of unit quads on the ground, crossed by upright quads
+        vertices = [(x, y, 0.0) for y in range(4) for x in range(4)]
+        polygons = [(y * 4 + x, y * 4 + x + 1, y * 4 + x + 5, y * 4 + x + 4) for y in range(3) for x in range(3)]
+        ground = BVHTree.FromPolygons(vertices, polygons)
+        wall = BVHTree.FromPolygons([(0.25, 0.5, -1.0), (2.75, 0.5, -1.0), (2.75, 0.5, 1.0), (0.25, 0.5, 1.0),
+                                     (1.5, 2.25, -1.0), (1.5, 2.75, -1.0), (1.5, 2.75, 1.0), (1.5, 2.25, 1.0)],
+                                    [(0, 1, 2, 3), (4, 5, 6, 7)])
+        self.assertEqual(ground.overlap(wall), [(0, 0), (1, 0), (2, 0), (7, 1)])
+        self.assertEqual(wall.overlap(ground), [(0, 0), (0, 1), (0, 2), (1, 7)])
+
+
+class PolygonTest(unittest.TestCase):
+
+    def triangleArea(self, points, triangle):
+        return geometry.area_tri(*[points[index] for index in triangle])
+
+    def test_tessellate_concave(self):
+        outline = [Vector(co) for co in ((0, 0, 0), (3, 0, 0), (3, 1, 0), (1, 1, 0), (1, 3, 0), (0, 3, 0))]
+        triangles = geometry.tessellate_polygon([outline])
+        self.assertEqual(len(triangles), len(outline) - 2)
+        self.assertAlmostEqual(sum(self.triangleArea(outline, triangle) for triangle in triangles), 5.0)
+
+        for triangle in triangles:
+            a, b, c = [outline[index] for index in triangle]
+            self.assertGreater((b - a).cross(c - a).z, 0.0)
+
+    def test_tessellate_hole(self):
+        outline = [Vector(co) for co in ((0, 0, 0), (4, 0, 0), (4, 4, 0), (0, 4, 0))]
+        hole = [Vector(co) for co in ((1, 1, 0), (1, 3, 0), (3, 3, 0), (3, 1, 0))]
+        points = outline + hole
+        triangles = geometry.tessellate_polygon([outline, hole])
+        self.assertEqual(len(triangles), 8)
+        self.assertAlmostEqual(sum(self.triangleArea(points, triangle) for triangle in triangles), 12.0)
+
+        for triangle in triangles:
+            center = sum((points[index] for index in triangle), Vector()) / 3.0
+            self.assertFalse(1.0 < center.x < 3.0 and 1.0 < center.y < 3.0)
+
+    def test_convex_hull(self):
+        generator = random.Random(6)
+        points = [(generator.uniform(-1.0, 1.0), generator.uniform(-1.0, 1.0)) for index in range(100)]
+        hull = geometry.convex_hull_2d(points)
+        self.assertEqual(len(set(hull)), len(hull))
+
+        # Every point is on the inner side of every hull edge
+        for start, end in zip(hull, hull[1:] + hull[:1]):
+            (ax, ay), (bx, by) = points[start], points[end]
+
+            for x, y in points:
+                self.assertGreaterEqual((bx - ax) * (y - ay) - (by - ay) * (x - ax), -1e-12)
+
+    def test_box_fit(self):
+        points = [Matrix.Rotation(0.3, 2) * Vector(co) for co in ((0, 0), (4, 0), (4, 1), (0, 1), (2, 0.5))]
+        rotated = [Matrix.Rotation(geometry.box_fit_2d(points), 2) * point for point in points]
+        width = max(point.x for point in rotated) - min(point.x for point in rotated)
+        height = max(point.y for point in rotated) - min(point.y for point in rotated)
+        self.assertAlmostEqual(width * height, 4.0)
+
+    def test_box_pack(self):
+        generator = random.Random(7)
+        boxes = [[0.0, 0.0, generator.uniform(0.5, 3.0), generator.uniform(0.5, 3.0)] for index in range(30)]
+        width, height = geometry.box_pack_2d(boxes)
+        self.assertGreaterEqual(width * height, sum(box[2] * box[3] for box in boxes))
+
+        for index, (x, y, w, h) in enumerate(boxes):
+            self.assertTrue(x >= 0.0 and y >= 0.0 and x + w <= width and y + h <= height)
+
+            for ox, oy, ow, oh in boxes[index + 1:]:
+                self.assertTrue(x + w <= ox or ox + ow <= x or y + h <= oy or oy + oh <= y)
+
+
+if __name__ == "__main__":
+    unittest.main()